@@ -0,0 +1,51 @@
+import asyncio
+import time
+
+from bygram.core.serializer import deserialize_object, serialize_object
+from bygram.executor import Executor
+from bygram.types import raw
+
+# A burst of updates from a few chats, each handler asks for its chat
+BURST = 1000
+CHATS = 5
+ROUNDS = 50
+# Round-trip of TDLib for a request
+LATENCY = 0.001
+
+
+def create_executor(coalesce: bool) -> tuple[Executor, list]:
+    loop = asyncio.get_running_loop()
+    sent = []
+
+    def send(client_id: int, function, extra):
+        # Each request is serialized and its response decoded
+        sent.append(serialize_object(function, extra))
+        response = serialize_object(raw.Chat(id=function.chat_id), extra)
+        chat = deserialize_object(response).obj
+        loop.call_later(LATENCY, executor.resolve_response, chat, extra)
+
+    executor = Executor(send, loop, coalesce=coalesce)
+    return executor, sent
+
+
+async def burst(executor: Executor):
+    await asyncio.gather(
+        *(executor.execute(1, raw.GetChat(i % CHATS), timeout=30) for i in range(BURST))
+    )
+
+
+async def main():
+    for coalesce in (False, True):
+        executor, sent = create_executor(coalesce)
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            await burst(executor)
+        elapsed = (time.perf_counter() - start) / ROUNDS
+        print(
+            f"coalesce={coalesce!s:<5} {BURST} calls in {elapsed * 1000:6.2f} ms, "
+            f"{len(sent) // ROUNDS} requests sent"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,30 @@
+import time
+
+from benchmarks import payloads
+from bygram.core.serializer import available_codecs
+
+DURATION = 2
+
+
+def bench(name: str, payload: bytes):
+    objects = payloads.count_objects(payload)
+    for codec in available_codecs():
+        codec.deserialize(payload)  # warm up
+        iterations = 0
+        start = time.perf_counter()
+        while (elapsed := time.perf_counter() - start) < DURATION:
+            codec.deserialize(payload)
+            iterations += 1
+        print(
+            f"{name:<20} {codec.name:<8} "
+            f"{iterations * objects / elapsed:>12,.0f} objects/sec"
+        )
+
+
+def main():
+    bench("updateNewMessage", payloads.update_new_message())
+    bench("messages (100)", payloads.messages(100))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+import time
+
+from benchmarks import payloads
+from bygram.core.serializer import deserialize_object
+
+DURATION = 2
+
+
+def bench(name: str, payload: bytes):
+    objects = payloads.count_objects(payload)
+    deserialize_object(payload)  # warm up
+
+    iterations = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < DURATION:
+        deserialize_object(payload)
+        iterations += 1
+
+    print(
+        f"{name:<20} {len(payload):>8} bytes {objects:>6} objects "
+        f"{iterations * objects / elapsed:>12,.0f} objects/sec"
+    )
+
+
+def main():
+    bench("updateNewMessage", payloads.update_new_message())
+    bench("messages (100)", payloads.messages(100))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+import asyncio
+import time
+
+from bygram.routing.dispatcher import Dispatcher
+from bygram.types import raw
+
+HANDLERS = 50
+UPDATES = 20_000
+
+
+def create_dispatcher() -> Dispatcher:
+    dp = Dispatcher()
+    dp["db"] = object()
+
+    async def is_private(update: raw.UpdateNewMessage, client_id: int):
+        return True
+
+    for _ in range(HANDLERS):
+
+        async def handler(update: raw.UpdateNewMessage, client_id: int, db: object):
+            pass
+
+        dp.add_handler(raw.UpdateNewMessage, handler, [is_private])  # type: ignore
+    return dp
+
+
+async def main():
+    dp = create_dispatcher()
+    update = raw.UpdateNewMessage(raw.Message(id=1, chat_id=1))
+    start = time.perf_counter()
+    for _ in range(UPDATES):
+        await dp.feed_update(update, 1)
+    elapsed = time.perf_counter() - start
+    print(f"{HANDLERS} handlers: {UPDATES / elapsed:,.0f} updates/sec")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
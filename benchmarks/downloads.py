@@ -0,0 +1,72 @@
+import asyncio
+import time
+
+from bygram.downloads import DownloadManager
+from bygram.types import raw
+
+FILES = 100
+FILE_SIZE = 1_000_000
+# Each download gets its own bandwidth, the consumer copies files to a slower disk
+DOWNLOAD_RATE = 500_000_000
+DISK_RATE = 200_000_000
+
+
+class FakeFiles:
+    def __init__(self) -> None:
+        # Downloaded files which the consumer didn't process yet
+        self.unprocessed = 0
+        self.peak_unprocessed = 0
+
+    async def execute(self, function, timeout: float = 30):
+        if isinstance(function, raw.DownloadFile):
+            await asyncio.sleep(FILE_SIZE / DOWNLOAD_RATE)
+            self.unprocessed += FILE_SIZE
+            self.peak_unprocessed = max(self.peak_unprocessed, self.unprocessed)
+        return raw.File(id=function.file_id, size=FILE_SIZE)
+
+    async def process(self):
+        await asyncio.sleep(FILE_SIZE / DISK_RATE)
+        self.unprocessed -= FILE_SIZE
+
+
+async def all_at_once(files: FakeFiles):
+    # DownloadFile for every file, results are processed as they complete
+    downloads = [
+        files.execute(raw.DownloadFile(i, 1, 0, 0, True)) for i in range(FILES)
+    ]
+    for download in asyncio.as_completed(downloads):
+        await download
+        await files.process()
+
+
+async def with_manager(files: FakeFiles, max_pending_bytes: int | None):
+    manager = DownloadManager(
+        files.execute, max_concurrent=4, max_pending_bytes=max_pending_bytes
+    )
+    futures = [manager.download(i) for i in range(FILES)]
+    for file_id, future in enumerate(futures):
+        await future
+        await files.process()
+        manager.release(file_id)
+
+
+async def main():
+    benches = [
+        ("all at once", all_at_once),
+        ("manager", lambda f: with_manager(f, None)),
+        ("manager 8 MB", lambda f: with_manager(f, 8 * FILE_SIZE)),
+        ("manager 16 MB", lambda f: with_manager(f, 16 * FILE_SIZE)),
+    ]
+    for name, bench in benches:
+        files = FakeFiles()
+        start = time.perf_counter()
+        await bench(files)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{name:<13} {elapsed * 1000:6.1f} ms, "
+            f"peak unprocessed {files.peak_unprocessed / 1e6:5.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
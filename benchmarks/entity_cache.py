@@ -0,0 +1,77 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+from benchmarks.payloads import create_message
+from bygram.cache import EntityCache
+from bygram.core.serializer import deserialize_object, serialize_object
+from bygram.executor import Executor
+from bygram.routing.dispatcher import Dispatcher
+from bygram.routing.middlewares import EntityCacheMiddleware, MiddlewareBase
+from bygram.types import raw
+
+UPDATES = 2000
+CHATS = 20
+# Round-trip of TDLib for a request
+LATENCY = 0.001
+
+
+class ClientMiddleware(MiddlewareBase):
+    def __init__(self, client) -> None:
+        self.client = client
+
+    async def __call__(self, update, data, next_handler):
+        data["client"] = self.client
+        return await next_handler(update, data)
+
+
+def create_client() -> SimpleNamespace:
+    loop = asyncio.get_running_loop()
+
+    def send(client_id: int, function, extra):
+        serialize_object(function, extra)
+        chat = raw.Chat(id=function.chat_id, title="Chat", positions=[], chat_lists=[])
+        response = deserialize_object(serialize_object(chat, extra)).obj
+        loop.call_later(LATENCY, executor.resolve_response, response, extra)
+
+    executor = Executor(send, loop)
+    return SimpleNamespace(executor=executor, cache=EntityCache())
+
+
+async def run(use_cache: bool) -> float:
+    client = create_client()
+    dp = Dispatcher()
+    if use_cache:
+        dp.add_middleware(EntityCacheMiddleware())
+    dp.add_middleware(ClientMiddleware(client))
+
+    async def handler(update: raw.UpdateNewMessage, client):
+        assert update.message
+        chat_id = update.message.chat_id
+        if use_cache:
+            chat = client.cache.chat(chat_id)
+        else:
+            chat = await client.executor.execute(1, raw.GetChat(chat_id), timeout=30)
+        assert chat.title
+
+    dp.add_handler(raw.UpdateNewMessage, handler, [])
+    for chat_id in range(CHATS):
+        chat = raw.Chat(id=chat_id, title="Chat", positions=[], chat_lists=[])
+        await dp.feed_update(raw.UpdateNewChat(chat), 1)
+
+    updates = [raw.UpdateNewMessage(create_message(i, i % CHATS)) for i in range(UPDATES)]
+    start = time.perf_counter()
+    await asyncio.gather(*(dp.feed_update(u, 1) for u in updates))
+    return time.perf_counter() - start
+
+
+async def main():
+    for use_cache in (False, True):
+        elapsed = await run(use_cache)
+        print(
+            f"{'cache' if use_cache else 'GetChat':<8} {UPDATES / elapsed:10.0f} updates/sec"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
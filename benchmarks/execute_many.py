@@ -0,0 +1,47 @@
+import asyncio
+import time
+
+from bygram.executor import Executor
+from bygram.types import raw
+
+REQUESTS = 1000
+ROUNDS = 50
+
+
+def create_executor(**kwargs) -> Executor:
+    # Answers every request on the next loop iteration
+    loop = asyncio.get_running_loop()
+
+    def send(client_id: int, function, extra):
+        loop.call_soon(executor.resolve_response, raw.Ok(), extra)
+
+    executor = Executor(send, loop, **kwargs)
+    return executor
+
+
+async def gather(executor: Executor, functions: list):
+    await asyncio.gather(*(executor.execute(1, f, timeout=30) for f in functions))
+
+
+async def execute_many(executor: Executor, functions: list):
+    await executor.execute_many(1, functions, timeout=30)
+
+
+async def as_completed(executor: Executor, functions: list):
+    async for _ in executor.execute_as_completed(1, functions, timeout=30):
+        pass
+
+
+async def main():
+    executor = create_executor()
+    functions = [raw.GetUser(i) for i in range(REQUESTS)]
+    for bench in (gather, execute_many, as_completed):
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            await bench(executor, functions)
+        elapsed = (time.perf_counter() - start) / ROUNDS
+        print(f"{bench.__name__:<14} {REQUESTS} requests in {elapsed * 1000:6.2f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,43 @@
+import json
+import queue
+import threading
+
+from benchmarks.payloads import to_tdlib_json
+from bygram.types import raw
+
+
+class FakeTdLib:
+    # Mimics TdLibWrapper. Emits an endless stream of updates and answers every
+    # request with `ok`, which is received after `backlog` more updates
+    def __init__(self, update: bytes, backlog: int = 100) -> None:
+        self._update = update
+        self._backlog = backlog
+        self._lock = threading.Lock()
+        self._responses: queue.SimpleQueue[tuple[int, bytes]] = queue.SimpleQueue()
+        self._received = 0
+        self._next_response: tuple[int, bytes] | None = None
+        self._clients = 0
+
+    def create_client(self) -> int:
+        self._clients += 1
+        return self._clients
+
+    def send(self, client_id: int, request: bytes) -> None:
+        extra = json.loads(request).get("@extra")
+        response = to_tdlib_json(raw.Ok(), client_id=client_id, extra=extra)
+        with self._lock:
+            self._responses.put((self._received + self._backlog, response))
+
+    def receive(self, timeout: float) -> bytes | None:
+        with self._lock:
+            self._received += 1
+            if self._next_response is None and not self._responses.empty():
+                self._next_response = self._responses.get()
+            if self._next_response and self._next_response[0] <= self._received:
+                response = self._next_response[1]
+                self._next_response = None
+                return response
+        return self._update
+
+    def execute(self, request: bytes) -> bytes:
+        return to_tdlib_json(raw.Ok(), client_id=0)
@@ -0,0 +1,68 @@
+import asyncio
+import base64
+import time
+
+from bygram.files import open_tdlib_file
+from bygram.types import raw
+
+FILE_SIZE = 32 * 1024 * 1024
+CHUNK_SIZE = 512 * 1024
+# Round trip of ReadFilePart to TDLib
+LATENCY = 0.005
+DATA = base64.b64encode(b"\0" * CHUNK_SIZE).decode()
+
+
+class FakeFiles:
+    def __init__(self) -> None:
+        # Chunks which were read but not consumed yet
+        self.buffered = 0
+        self.peak_buffered = 0
+
+    async def execute(self, function: raw.ReadFilePart):
+        await asyncio.sleep(LATENCY)
+        self.buffered += function.count
+        self.peak_buffered = max(self.peak_buffered, self.buffered)
+        return raw.Data(DATA)  # type: ignore
+
+    def consume(self, data: bytes):
+        self.buffered -= len(data)
+
+
+async def sequential(files: FakeFiles):
+    # ReadFilePart for every chunk, one after another
+    for offset in range(0, FILE_SIZE, CHUNK_SIZE):
+        part = await files.execute(raw.ReadFilePart(1, offset, CHUNK_SIZE))
+        files.consume(base64.b64decode(part.data))
+
+
+async def reader(files: FakeFiles, read_ahead: int):
+    local = raw.LocalFile(downloaded_prefix_size=FILE_SIZE)
+    file = raw.File(id=1, size=FILE_SIZE, local=local)
+    async with open_tdlib_file(
+        files.execute, file, chunk_size=CHUNK_SIZE, read_ahead=read_ahead
+    ) as f:
+        async for chunk in f:
+            files.consume(chunk)
+
+
+async def main():
+    benches = [
+        ("sequential", sequential),
+        ("read_ahead=0", lambda f: reader(f, 0)),
+        ("read_ahead=2", lambda f: reader(f, 2)),
+        ("read_ahead=8", lambda f: reader(f, 8)),
+    ]
+    for name, bench in benches:
+        files = FakeFiles()
+        start = time.perf_counter()
+        await bench(files)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{name:<12} {elapsed * 1000:6.1f} ms, "
+            f"{FILE_SIZE / elapsed / 1e6:6.1f} MB/s, "
+            f"peak buffered {files.peak_buffered / 1e6:4.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
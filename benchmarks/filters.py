@@ -0,0 +1,50 @@
+import asyncio
+import time
+
+from bygram.routing import ChatIdFilter, Dispatcher, FilterBase
+from bygram.types import raw
+
+HANDLERS = 200
+UPDATES = 10_000
+
+
+class OpaqueChatIdFilter(FilterBase):
+    def __init__(self, chat_id: int) -> None:
+        self.chat_id = chat_id
+
+    async def __call__(self, event: raw.UpdateNewMessage) -> bool:  # type: ignore
+        assert event.message
+        return event.message.chat_id == self.chat_id
+
+
+async def handler(update: raw.UpdateNewMessage):
+    pass
+
+
+def create_dispatcher(filter_type: type) -> Dispatcher:
+    dp = Dispatcher()
+    for chat_id in range(HANDLERS):
+        dp.add_handler(raw.UpdateNewMessage, handler, [filter_type(chat_id)])
+    return dp
+
+
+async def bench(filter_type: type) -> float:
+    dp = create_dispatcher(filter_type)
+    update = raw.UpdateNewMessage(raw.Message(id=1, chat_id=HANDLERS // 2))
+    start = time.perf_counter()
+    for _ in range(UPDATES):
+        await dp.feed_update(update, 1)
+    return UPDATES / (time.perf_counter() - start)
+
+
+async def main():
+    for filter_type in (OpaqueChatIdFilter, ChatIdFilter):
+        updates_per_second = await bench(filter_type)
+        print(
+            f"{HANDLERS} handlers, {filter_type.__name__:<18} "
+            f"{updates_per_second:>10,.0f} updates/sec"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,50 @@
+import asyncio
+import time
+import tracemalloc
+
+from benchmarks.execute_many import create_executor
+from bygram.executor import Executor
+from bygram.types import raw
+
+TIMED_OUT = 10000
+REQUESTS = 1000
+ROUNDS = 50
+
+
+async def leaked_after_timeouts() -> tuple[int, int]:
+    # Requests which are never answered
+    executor = Executor(lambda *args: None, asyncio.get_running_loop())
+    tracemalloc.start()
+    await asyncio.gather(
+        *(executor.execute(1, raw.GetMe(), timeout=0.01) for _ in range(TIMED_OUT)),
+        return_exceptions=True,
+    )
+    await asyncio.sleep(0)
+    memory, _ = tracemalloc.get_traced_memory()
+    # Cancelled timers of asyncio.timeout stay scheduled until they are due, so
+    # memory is only comparable between versions of the executor
+    tracemalloc.stop()
+    return len(executor._waiting_response), memory
+
+
+async def throughput(executor: Executor) -> float:
+    functions = [raw.GetUser(i) for i in range(REQUESTS)]
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        await asyncio.gather(*(executor.execute(1, f, timeout=30) for f in functions))
+    return (time.perf_counter() - start) / ROUNDS
+
+
+async def main():
+    leaked, memory = await leaked_after_timeouts()
+    print(f"after {TIMED_OUT} timeouts: {leaked} waiters left, {memory} bytes")
+
+    elapsed = await throughput(create_executor())
+    print(f"unbounded      {REQUESTS} requests in {elapsed * 1000:6.2f} ms")
+
+    elapsed = await throughput(create_executor(max_in_flight_per_client=100))
+    print(f"max 100        {REQUESTS} requests in {elapsed * 1000:6.2f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,62 @@
+import asyncio
+import statistics
+import time
+
+from benchmarks.fake_tdlib import FakeTdLib
+from benchmarks.payloads import update_new_message
+from bygram.core.listener import EventListener
+from bygram.core.serializer import SerializedWrapper
+from bygram.executor import Executor
+from bygram.routing.dispatcher import Dispatcher
+from bygram.strategy import EventsLoop
+from bygram.types import raw
+
+REQUESTS = 300
+BACKLOG = 200
+
+
+async def handle_message(update: raw.UpdateNewMessage):
+    await asyncio.sleep(0)
+
+
+async def bench(fast_path: bool) -> list[float]:
+    loop = asyncio.get_running_loop()
+    wrapper = SerializedWrapper(FakeTdLib(update_new_message(), backlog=BACKLOG))  # type: ignore
+    executor = Executor(wrapper.send, loop)
+    listener = EventListener(
+        loop,
+        wrapper.receive_raw,
+        timeout=0.1,
+        decode=wrapper.decode,
+        on_response=executor.resolve_response if fast_path else None,
+    )
+    dp = Dispatcher()
+    dp.register(raw.UpdateNewMessage)(handle_message)
+    events_loop = EventsLoop(listener, executor, dp)
+    events_loop.start_listening()
+
+    latencies = []
+    for _ in range(REQUESTS):
+        start = time.perf_counter()
+        await executor.execute(1, raw.TestCallEmpty(), timeout=60)
+        latencies.append(time.perf_counter() - start)
+
+    await events_loop.shutdown()
+    return latencies
+
+
+async def main():
+    print(f"Each response is received after {BACKLOG} updates")
+    for fast_path in (False, True):
+        latencies = await bench(fast_path)
+        p50, p90, p99 = (
+            statistics.quantiles(latencies, n=100)[i] * 1000 for i in (49, 89, 98)
+        )
+        print(
+            f"fast_path={fast_path!s:<5} p50 {p50:8.2f} ms  p90 {p90:8.2f} ms"
+            f"  p99 {p99:8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,43 @@
+import time
+
+from benchmarks import payloads
+from bygram.core.serializer import deserialize_object, deserialize_object_lazy
+
+DURATION = 2
+
+# The _lazy slot of ObjectBase costs 8 bytes per object even when lazy decoding
+# is off: 4,698 -> 5,042 bytes per message in benchmarks/memory.py
+
+
+def read_chat_and_content(obj):
+    for message in obj.messages:
+        _ = message.chat_id, message.content
+
+
+def bench(name: str, payload: bytes, deserialize, access=None):
+    iterations = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < DURATION:
+        obj = deserialize(payload).obj
+        if access:
+            access(obj)
+        iterations += 1
+    print(f"{name:<36} {elapsed / iterations * 1000:>8.2f} ms")
+
+
+def main():
+    payload = payloads.messages(100)
+    print(f"messages (100), {len(payload)} bytes")
+    bench("eager", payload, deserialize_object)
+    bench("lazy, no access", payload, deserialize_object_lazy)
+    bench("lazy, chat_id and content", payload, deserialize_object_lazy, read_chat_and_content)
+    bench(
+        "lazy, full access",
+        payload,
+        deserialize_object_lazy,
+        lambda obj: obj._to_json_dict(),
+    )
+
+
+if __name__ == "__main__":
+    main()
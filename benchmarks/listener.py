@@ -0,0 +1,45 @@
+import asyncio
+import time
+
+from bygram.core.listener import EventListener
+from bygram.core.types import DeserializedObject
+from bygram.types.base import ObjectBase
+
+EVENTS = 200_000
+
+
+def fake_receive(count: int):
+    event = DeserializedObject(ObjectBase(), 1)
+    left = count
+
+    def receive(timeout: float) -> DeserializedObject | None:
+        nonlocal left
+        if left:
+            left -= 1
+            return event
+        time.sleep(timeout)
+
+    return receive
+
+
+async def bench(batch_size: int) -> float:
+    loop = asyncio.get_running_loop()
+    listener = EventListener(
+        loop, fake_receive(EVENTS), timeout=0.1, batch_size=batch_size
+    )
+    start = time.perf_counter()
+    for _ in range(EVENTS):
+        await listener.wait_for_event()
+    elapsed = time.perf_counter() - start
+    listener.shutdown()
+    return EVENTS / elapsed
+
+
+async def main():
+    for batch_size in (1, 16, 256, 4096):
+        events_per_second = await bench(batch_size)
+        print(f"batch_size={batch_size:<6} {events_per_second:>12,.0f} events/sec")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,27 @@
+import gc
+import tracemalloc
+
+from benchmarks import payloads
+from bygram.core.serializer import deserialize_object
+
+COUNT = 100_000
+
+
+def main():
+    payload = payloads.to_tdlib_json(payloads.create_message(1))
+    objects_per_message = payloads.count_objects(payload)
+
+    gc.collect()
+    tracemalloc.start()
+    messages = [deserialize_object(payload).obj for _ in range(COUNT)]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{COUNT:,} messages ({objects_per_message} objects each)")
+    print(f"{size / 2**20:,.1f} MiB total, {size / COUNT:,.0f} bytes per message")
+    del messages
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import asyncio
+import time
+
+from bygram.pagination import iter_history
+from bygram.types import raw
+
+MESSAGES = 2000
+PAGE_SIZE = 100
+# Round-trip of TDLib for a page and time to process a page by the consumer
+LATENCY = 0.005
+PROCESSING = 0.005
+
+
+async def execute(function: raw.GetChatHistory) -> raw.Messages:
+    await asyncio.sleep(LATENCY)
+    start = function.from_message_id or MESSAGES
+    ids = range(start, max(start - function.limit, 0), -1)
+    return raw.Messages(MESSAGES, [raw.Message(id=i) for i in ids])
+
+
+async def manual_loop():
+    # Sequential paging by hand
+    from_message_id = 0
+    while True:
+        result = await execute(raw.GetChatHistory(1, from_message_id, 0, PAGE_SIZE))
+        assert result.messages is not None
+        messages = [m for m in result.messages if m.id != from_message_id]
+        if not messages:
+            break
+        await asyncio.sleep(PROCESSING)
+        from_message_id = messages[-1].id
+
+
+async def iterator(read_ahead: int):
+    processed = 0
+    async for _ in iter_history(execute, 1, read_ahead=read_ahead):
+        processed += 1
+        if processed % PAGE_SIZE == 0:
+            await asyncio.sleep(PROCESSING)
+
+
+async def main():
+    benches = [
+        ("manual loop", manual_loop),
+        ("read_ahead=0", lambda: iterator(0)),
+        ("read_ahead=1", lambda: iterator(1)),
+        ("read_ahead=2", lambda: iterator(2)),
+    ]
+    for name, bench in benches:
+        start = time.perf_counter()
+        await bench()
+        elapsed = time.perf_counter() - start
+        print(f"{name:<13} {MESSAGES} messages in {elapsed * 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
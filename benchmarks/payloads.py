@@ -0,0 +1,116 @@
+import json
+
+from bygram.types import raw
+from bygram.types.base import ObjectBase
+
+
+def _text(i: int) -> raw.FormattedText:
+    entities = [
+        raw.TextEntity(offset=j * 12, length=5, type=raw.TextEntityTypeBold())
+        for j in range(4)
+    ]
+    entities.append(
+        raw.TextEntity(offset=60, length=20, type=raw.TextEntityTypeTextUrl("https://t.me"))
+    )
+    return raw.FormattedText(text=f"Message number {i} " * 8, entities=entities)
+
+
+def _reactions() -> raw.MessageInteractionInfo:
+    reactions = [
+        raw.MessageReaction(
+            type=raw.ReactionTypeEmoji(emoji),
+            total_count=count,
+            recent_sender_ids=[raw.MessageSenderUser(100 + j) for j in range(3)],
+        )
+        for emoji, count in (("👍", 12), ("🔥", 5), ("❤", 2))
+    ]
+    return raw.MessageInteractionInfo(
+        view_count=1500,
+        forward_count=3,
+        reply_info=raw.MessageReplyInfo(reply_count=7, recent_replier_ids=[]),
+        reactions=raw.MessageReactions(reactions=reactions, paid_reactors=[]),
+    )
+
+
+def _keyboard() -> raw.ReplyMarkupInlineKeyboard:
+    rows = [
+        [
+            raw.InlineKeyboardButton(
+                text=f"Button {r}.{c}",
+                type=raw.InlineKeyboardButtonTypeUrl(f"https://example.com/{r}/{c}"),
+            )
+            for c in range(2)
+        ]
+        for r in range(2)
+    ]
+    return raw.ReplyMarkupInlineKeyboard(rows=rows)
+
+
+def create_message(i: int, chat_id: int = -1001234567890) -> raw.Message:
+    return raw.Message(
+        id=i << 20,
+        sender_id=raw.MessageSenderUser(user_id=5000 + i % 50),
+        chat_id=chat_id,
+        is_channel_post=False,
+        can_be_saved=True,
+        date=1700000000 + i,
+        interaction_info=_reactions(),
+        unread_reactions=[],
+        reply_to=raw.MessageReplyToMessage(chat_id=chat_id, message_id=(i - 1) << 20),
+        content=raw.MessageText(
+            text=_text(i),
+            link_preview_options=raw.LinkPreviewOptions(is_disabled=True),
+        ),
+        reply_markup=_keyboard(),
+    )
+
+
+def to_tdlib_json(obj: ObjectBase, client_id: int = 1, extra: int | None = None) -> bytes:
+    data = obj._to_json_dict()
+    if extra is not None:
+        data["@extra"] = extra
+    data["@client_id"] = client_id
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def update_new_message() -> bytes:
+    return to_tdlib_json(raw.UpdateNewMessage(create_message(1)))
+
+
+def background_updates() -> list[bytes]:
+    # Typical traffic which bots usually don't handle
+    return [
+        to_tdlib_json(raw.UpdateUserStatus(5000, raw.UserStatusOnline(1700000000))),
+        to_tdlib_json(
+            raw.UpdateChatAction(
+                chat_id=-1001234567890,
+                sender_id=raw.MessageSenderUser(5000),
+                action=raw.ChatActionTyping(),
+            )
+        ),
+        to_tdlib_json(raw.UpdateOption("unix_time", raw.OptionValueInteger(1700000000))),
+        to_tdlib_json(
+            raw.UpdateChatReadInbox(
+                chat_id=-1001234567890, last_read_inbox_message_id=1 << 20, unread_count=3
+            )
+        ),
+    ]
+
+
+def messages(count: int = 100) -> bytes:
+    return to_tdlib_json(
+        raw.Messages(total_count=count, messages=[create_message(i) for i in range(count)]),
+        extra=1,
+    )
+
+
+def count_objects(payload: bytes) -> int:
+    count = 0
+
+    def hook(d: dict):
+        nonlocal count
+        count += 1
+        return d
+
+    json.loads(payload, object_hook=hook)
+    return count
@@ -0,0 +1,62 @@
+import asyncio
+import random
+import time
+
+from bygram.cache import ResponseCache
+from bygram.client_manager import Client
+from bygram.core.serializer import deserialize_object, serialize_object
+from bygram.executor import Executor
+from bygram.types import raw
+
+CALLS = 5000
+CHATS = 50
+MEMBERS = 200
+# Round-trip of TDLib for a request
+LATENCY = 0.001
+
+
+def create_client(response_cache: ResponseCache | None) -> Client:
+    loop = asyncio.get_running_loop()
+
+    def send(client_id: int, function, extra):
+        serialize_object(function, extra)
+        member = raw.ChatMember(
+            member_id=function.member_id, status=raw.ChatMemberStatusMember()
+        )
+        response = deserialize_object(serialize_object(member, extra)).obj
+        loop.call_later(LATENCY, executor.resolve_response, response, extra)
+
+    executor = Executor(send, loop)
+    return Client(1, executor, response_cache)
+
+
+async def run(client: Client) -> float:
+    # Handlers check rights of senders of messages, a few of them are active
+    rng = random.Random(1)
+    functions = []
+    for _ in range(CALLS):
+        user_id = int(rng.paretovariate(1.2)) % MEMBERS
+        functions.append(
+            raw.GetChatMember(rng.randrange(CHATS), raw.MessageSenderUser(user_id))
+        )
+    start = time.perf_counter()
+    for i in range(0, CALLS, 100):
+        await asyncio.gather(*(client.execute(f) for f in functions[i : i + 100]))
+    return time.perf_counter() - start
+
+
+async def main():
+    elapsed = await run(create_client(None))
+    print(f"no cache {CALLS / elapsed:10.0f} calls/sec")
+
+    cache = ResponseCache()
+    elapsed = await run(create_client(cache))
+    stats = cache.stats()
+    print(
+        f"cache    {CALLS / elapsed:10.0f} calls/sec, "
+        f"{stats.hits} hits, {stats.misses} misses"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,54 @@
+import asyncio
+import time
+
+from bygram.routing.dispatcher import Dispatcher, Router
+from bygram.routing.middlewares import MiddlewareBase
+from bygram.types import raw
+from bygram.types.base import Update
+
+ROUTERS = 20
+UPDATES = 50_000
+
+
+class PassMiddleware(MiddlewareBase):
+    async def __call__(self, update, data, next_handler):
+        return await next_handler(update, data)
+
+
+async def handler(update: Update):
+    pass
+
+
+def create_dispatcher() -> Dispatcher:
+    # Only the dispatcher handles user statuses, feature routers handle messages
+    dp = Dispatcher()
+    dp.add_handler(raw.UpdateNewMessage, handler, [])
+    dp.add_handler(raw.UpdateUserStatus, handler, [])
+    for _ in range(ROUTERS):
+        router = Router()
+        router.add_middleware(PassMiddleware())
+        router.add_middleware(PassMiddleware())
+        router.add_handler(raw.UpdateNewMessage, handler, [])
+        dp.include_router(router)
+    return dp
+
+
+async def bench(dp: Dispatcher, update: Update) -> float:
+    start = time.perf_counter()
+    for _ in range(UPDATES):
+        await dp.feed_update(update, 1)
+    return UPDATES / (time.perf_counter() - start)
+
+
+async def main():
+    dp = create_dispatcher()
+    updates = {
+        "UpdateUserStatus": raw.UpdateUserStatus(1, raw.UserStatusOnline(0)),
+        "UpdateNewMessage": raw.UpdateNewMessage(raw.Message(id=1, chat_id=1)),
+    }
+    for name, update in updates.items():
+        print(f"{name:<18} {await bench(dp, update):>10,.0f} updates/sec")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
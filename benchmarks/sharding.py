@@ -0,0 +1,110 @@
+import asyncio
+import json
+import os
+import queue
+import time
+from unittest import mock
+
+from benchmarks.payloads import update_new_message
+from bygram import manager
+from bygram.routing import Dispatcher
+from bygram.sharding import ShardedLibraryManager
+from bygram.types import raw
+
+# Updates received by every shard
+UPDATES = 20_000
+
+_handled = 0
+
+
+class FloodLibrary:
+    # Receives UPDATES updates of the created client as fast as possible,
+    # getOption tells how many of them are handled
+    def __init__(self) -> None:
+        self._update = update_new_message()
+        self._responses: queue.Queue[bytes] = queue.Queue()
+        self._left = 0
+
+    def create_client(self) -> int:
+        self._left = UPDATES
+        return 1
+
+    def send(self, client_id: int, request: bytes):
+        data = json.loads(request)
+        if data["@type"] == "getOption":
+            response = {"@type": "optionValueInteger", "value": _handled}
+        else:
+            response = {"@type": "ok"}
+            if data["@type"] == "close":
+                state = {"@type": "authorizationStateClosed"}
+                update = {"@type": "updateAuthorizationState"}
+                update |= {"authorization_state": state, "@client_id": 1}
+                self._responses.put(json.dumps(update).encode())
+        response |= {"@extra": data["@extra"], "@client_id": 1}
+        self._responses.put(json.dumps(response).encode())
+
+    def receive(self, timeout: float) -> bytes | None:
+        if not self._responses.empty() or not self._left:
+            try:
+                return self._responses.get(timeout=timeout)
+            except queue.Empty:
+                return None
+        self._left -= 1
+        return self._update
+
+    def execute(self, request: bytes) -> bytes:
+        return b'{"@type":"ok"}'
+
+    def close(self):
+        pass
+
+
+def create_flood_manager(path: str, loop=None, **options):
+    with mock.patch.object(manager, "load_library", lambda *_, **__: FloodLibrary()):
+        return manager.create_library_manager(path, loop=loop, **options)
+
+
+def setup_dispatcher() -> Dispatcher:
+    dp = Dispatcher()
+
+    @dp.register(raw.UpdateNewMessage)
+    async def on_message(update: raw.UpdateNewMessage):
+        global _handled
+        _handled += 1
+
+    return dp
+
+
+async def get_handled(client) -> int:
+    handled = await client.execute(raw.GetOption("handled"))
+    assert isinstance(handled, raw.OptionValueInteger)
+    return handled.value
+
+
+async def bench(shards: int):
+    sharded = ShardedLibraryManager(
+        "",
+        shards,
+        setup=setup_dispatcher,
+        create_manager=create_flood_manager,
+        receive_batch_size=100,
+    )
+    async with sharded:
+        start = time.perf_counter()
+        clients = [await sharded.create_client() for _ in range(shards)]
+        for client in clients:
+            while await get_handled(client) < UPDATES:
+                await asyncio.sleep(0.01)
+        elapsed = time.perf_counter() - start
+
+    print(f"shards={shards}  {shards * UPDATES / elapsed:>10,.0f} updates/sec")
+
+
+async def main():
+    print(f"{os.cpu_count()} CPUs")
+    for shards in (1, 2, 4):
+        await bench(shards)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
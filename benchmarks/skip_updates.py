@@ -0,0 +1,28 @@
+import time
+
+from benchmarks import payloads
+from bygram.core.serializer import SerializedWrapper
+
+UPDATES = 100_000
+
+
+def bench(wrapper: SerializedWrapper, traffic: list[bytes]) -> float:
+    start = time.perf_counter()
+    for i in range(UPDATES):
+        wrapper.decode(traffic[i % len(traffic)])
+    return UPDATES / (time.perf_counter() - start)
+
+
+def main():
+    # 9 of 10 updates have no handlers
+    traffic = payloads.background_updates() * 9
+    traffic[::10] = [payloads.update_new_message()] * len(traffic[::10])
+
+    wrapper = SerializedWrapper(None)  # type: ignore
+    print(f"decode all        {bench(wrapper, traffic):>10,.0f} updates/sec")
+    wrapper.set_handled_update_types(lambda: frozenset({"updateNewMessage"}))
+    print(f"skip unhandled    {bench(wrapper, traffic):>10,.0f} updates/sec")
+
+
+if __name__ == "__main__":
+    main()
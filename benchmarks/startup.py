@@ -0,0 +1,37 @@
+import statistics
+import subprocess
+import sys
+
+RUNS = 5
+TOP = 5
+
+
+def import_times() -> dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import bygram"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main():
+    import_times()  # warm up bytecode cache
+    runs = [import_times() for _ in range(RUNS)]
+    total = statistics.median(run["bygram"] for run in runs)
+    print(f"import bygram: {total / 1000:,.1f} ms (median of {RUNS} runs)")
+
+    slowest = sorted(runs[-1].items(), key=lambda i: i[1], reverse=True)
+    for name, cumulative in slowest[1 : TOP + 1]:
+        print(f"  {name:<40} {cumulative / 1000:>8,.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import ctypes
+import time
+
+from benchmarks import payloads
+from bygram.core.serializer import available_codecs
+from bygram.core.wrapper import _memoryview_at
+
+ITERATIONS = 200
+
+
+def receive_copy(address: int) -> bytes:
+    # What ctypes does for restype = c_char_p
+    value = ctypes.cast(address, ctypes.c_char_p).value
+    assert value is not None
+    return value
+
+
+def receive_view(address: int) -> memoryview:
+    view = _memoryview_at(address)
+    assert view is not None
+    return view
+
+
+def bench(name: str, address: int, receive, decode=None):
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        raw = receive(address)
+        if decode:
+            decode(raw)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<28} {elapsed / ITERATIONS * 1e6:>10.1f} us")
+
+
+def main():
+    payload = payloads.messages(100)
+    buffer = ctypes.create_string_buffer(payload)
+    address = ctypes.addressof(buffer)
+    print(f"messages (100), {len(payload)} bytes")
+
+    bench("receive, c_char_p", address, receive_copy)
+    bench("receive, memoryview", address, receive_view)
+    for codec in available_codecs():
+        bench(f"+ {codec.name}, c_char_p", address, receive_copy, codec.loads)
+        bench(f"+ {codec.name}, memoryview", address, receive_view, codec.loads)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,10 @@
-import sys
+import argparse
 from io import StringIO
 from typing import TextIO
 
 import requests
 
+from compiler.formatting import GenerationOptions
 from compiler.logic import process_file
 
 TL_URL = "https://raw.githubusercontent.com/tdlib/td/refs/heads/master/td/generate/scheme/td_api.tl"
@@ -21,15 +22,32 @@ def get_reader(file_link: str) -> TextIO:
 
 
 def main():
-    args = sys.argv
-    if len(args) < 3:
-        print(f"Usage: {args[0]} input_file output_file")
-        print("Exports telegram tl file to python objects")
-        return
-
-    input_file = get_reader(args[1])
-    with open(sys.argv[2], "w") as output_file:
-        count = process_file(input_file, output_file)
+    parser = argparse.ArgumentParser(
+        description="Exports telegram tl file to python objects"
+    )
+    parser.add_argument("input_file")
+    parser.add_argument("output_dir")
+    parser.add_argument(
+        "--slots", action="store_true", help="Generate dataclasses with __slots__"
+    )
+    parser.add_argument(
+        "--weakref-slot",
+        action="store_true",
+        help="Add __weakref__ slot to generated dataclasses (implies --slots)",
+    )
+    parser.add_argument(
+        "--group-size",
+        type=int,
+        default=GenerationOptions.group_size,
+        help="Approximate number of definitions per generated submodule",
+    )
+    args = parser.parse_args()
+
+    options = GenerationOptions(
+        slots=args.slots, weakref_slot=args.weakref_slot, group_size=args.group_size
+    )
+    input_file = get_reader(args.input_file)
+    count = process_file(input_file, args.output_dir, options)
 
     print(f"Processed {count} definitions")
 
@@ -1,4 +1,5 @@
 import textwrap
+from dataclasses import dataclass
 from typing import Iterable
 
 from compiler.parser import TlObjectDefinition
@@ -12,14 +13,43 @@ from compiler.utils import class_to_python_name
 INDENT = "    "
 CLASS_PARENT_NAME = "ObjectBase"
 
+JSON_PRIMITIVE_TYPES = {"int", "str", "bool", "float"}
+
 CLASS_TEMPLATE = """
-@dataclass
+{decorator}
 class {name}({parent}):
 {docs}
 
 {args}
+
+{methods}
 """
 
+TO_JSON_TEMPLATE = """
+def _to_json_dict(self) -> dict:
+    return {{
+{items}
+    }}
+"""
+
+
+@dataclass(frozen=True)
+class GenerationOptions:
+    slots: bool = False
+    weakref_slot: bool = False
+    group_size: int = 64
+
+
+def dataclass_decorator(options: GenerationOptions) -> str:
+    params = []
+    if options.slots or options.weakref_slot:
+        params.append("slots=True")
+    if options.weakref_slot:
+        params.append("weakref_slot=True")
+    if not params:
+        return "@dataclass"
+    return f"@dataclass({', '.join(params)})"
+
 
 def generate_class_docs(main_doc: str, args: Iterable[ProcessedTlArgument]):
     assert main_doc
@@ -65,6 +95,28 @@ def args_to_class_string(args: Iterable[ProcessedTlArgument]):
     return result
 
 
+def json_value_expr(type_: PythonType, value: str) -> str:
+    if type_.name in JSON_PRIMITIVE_TYPES:
+        return value
+    if type_.name == "list":
+        assert type_.subtype
+        if type_.subtype.name in JSON_PRIMITIVE_TYPES:
+            return value
+        return f"_list_to_json({value})"
+    if type_.name == "bytes":
+        return f"_bytes_to_json({value})"
+    return f"{value}._to_json_dict() if {value} is not None else None"
+
+
+def generate_to_json_method(args: Iterable[ProcessedTlArgument]) -> str:
+    items = []
+    for arg in args:
+        value = json_value_expr(arg.python_type, f"self.{arg.name}")
+        items.append(f'"{arg.json_name}": {value},')
+    items = textwrap.indent("\n".join(items), INDENT * 2)
+    return TO_JSON_TEMPLATE.format(items=items).strip()
+
+
 def get_class_parent(name: str, related_obj: str | None):
     if related_obj is None or name.lower() == related_obj.lower():
         return CLASS_PARENT_NAME
@@ -77,11 +129,16 @@ def insert_type_arg(real_name: str, args: list[ProcessedTlArgument]):
         "",
         PythonType("str"),
         f'field(default="{real_name}", init=False, repr=False)',
+        "@type",
     )
     args.insert(0, arg)
 
 
-def create_class_text(obj: TlObjectDefinition, imports: set[str]):
+def create_class_text(
+    obj: TlObjectDefinition,
+    imports: set[str],
+    options: GenerationOptions = GenerationOptions(),
+):
     assert obj.type == "class"
 
     # Preprocessing
@@ -89,17 +146,30 @@ def create_class_text(obj: TlObjectDefinition, imports: set[str]):
     insert_type_arg(obj.name, args)
 
     docs = generate_class_docs(obj.doc, args)
+    methods = generate_to_json_method(args)
 
     name = class_to_python_name(obj.name)
     parent = get_class_parent(obj.name, obj.related_obj)
     args = "\n".join(args_to_class_string(args))
     args = textwrap.indent(args, INDENT)
     docs = textwrap.indent("\n".join(docs), INDENT)
-
-    return CLASS_TEMPLATE.format(name=name, parent=parent, docs=docs, args=args).strip()
-
-
-def create_function_text(obj: TlObjectDefinition, imports: set[str]):
+    methods = textwrap.indent(methods, INDENT)
+
+    return CLASS_TEMPLATE.format(
+        decorator=dataclass_decorator(options),
+        name=name,
+        parent=parent,
+        docs=docs,
+        args=args,
+        methods=methods,
+    ).strip()
+
+
+def create_function_text(
+    obj: TlObjectDefinition,
+    imports: set[str],
+    options: GenerationOptions = GenerationOptions(),
+):
     assert obj.type == "function"
 
     args = preprocess_arguments(obj.args, imports)
@@ -110,12 +180,21 @@ def create_function_text(obj: TlObjectDefinition, imports: set[str]):
     return_type = class_to_python_name(return_type)
 
     docs = generate_func_docs(obj.doc, args, return_type)
+    methods = generate_to_json_method(args)
 
     name = class_to_python_name(obj.name)
     args = "\n".join(args_to_class_string(args))
     args = textwrap.indent(args, INDENT)
     docs = textwrap.indent("\n".join(docs), INDENT)
+    methods = textwrap.indent(methods, INDENT)
 
-    parent = f"Function[{return_type}]"
+    parent = f'Function["{return_type}"]'
 
-    return CLASS_TEMPLATE.format(name=name, parent=parent, docs=docs, args=args)
+    return CLASS_TEMPLATE.format(
+        decorator=dataclass_decorator(options),
+        name=name,
+        parent=parent,
+        docs=docs,
+        args=args,
+        methods=methods,
+    )
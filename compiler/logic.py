@@ -1,27 +1,193 @@
-from typing import TextIO
+import os
+from dataclasses import dataclass, field
+from typing import Iterable, TextIO
+
+from compiler.formatting import (
+    GenerationOptions,
+    create_class_text,
+    create_function_text,
+    get_class_parent,
+)
+from compiler.parser import TdLibTlParser, TlObjectDefinition
+from compiler.utils import class_to_python_name
 
-from compiler.formatting import create_class_text, create_function_text
-from compiler.parser import TdLibTlParser
+BASE_NAMES = {"ObjectBase", "Function", "Update"}
 
 BASE_TEXT = """
 from dataclasses import dataclass, field
-from .base import ObjectBase, Function, Update
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
 """.strip()
 
+INDEX_TEMPLATE = '''
+"""
+Generated TDLib types.
+
+Types are split into submodules which are imported on first access to any of their classes
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+{imports}
+
+_MODULES = {{
+{modules}
+}}
+
+__all__ = [
+{names}
+]
+
+
+def __getattr__(name: str):
+    module_name = _MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+
+    module = importlib.import_module(f".{{module_name}}", __name__)
+    value = globals()[name] = getattr(module, name)
+    return value
+
+
+def __dir__():
+    return __all__
+'''
+
+
+@dataclass
+class DefinitionsGroup:
+    module: str
+    definitions: list[TlObjectDefinition] = field(default_factory=list)
+
+
+def get_family(definition: TlObjectDefinition) -> str:
+    if definition.type == "function":
+        return class_to_python_name(definition.name)
+    return class_to_python_name(definition.related_obj or definition.name)
+
+
+def get_dependencies(definition: TlObjectDefinition) -> set[str]:
+    if definition.type == "function":
+        # Return types are referenced by name
+        return set()
+    dependency = get_class_parent(definition.name, definition.related_obj)
+    if dependency in BASE_NAMES:
+        return set()
+    return {dependency}
 
-def process_file(reader: TextIO, writer: TextIO):
-    writer.write(BASE_TEXT + "\n\n")
-    parser = TdLibTlParser(reader)
 
-    count = 0
+def read_definitions(reader: TextIO) -> Iterable[TlObjectDefinition]:
+    parser = TdLibTlParser(reader)
     while definition := parser.parse_definition():
         if definition.name == "Update":
             continue
+        yield definition
+
+
+def split_into_groups(
+    definitions: Iterable[TlObjectDefinition], group_size: int
+) -> list[DefinitionsGroup]:
+    # Definitions are grouped in the order of the scheme, where related types are
+    # close to each other. Constructors of one type are never split between groups
+    groups: list[DefinitionsGroup] = []
+    counters = {"class": 0, "function": 0}
+    previous: TlObjectDefinition | None = None
+    for definition in definitions:
+        if (
+            not groups
+            or previous is None
+            or previous.type != definition.type
+            or (
+                len(groups[-1].definitions) >= group_size
+                and get_family(previous) != get_family(definition)
+            )
+        ):
+            index = counters[definition.type]
+            counters[definition.type] += 1
+            prefix = "classes" if definition.type == "class" else "functions"
+            groups.append(DefinitionsGroup(f"{prefix}_{index:02d}"))
+
+        groups[-1].definitions.append(definition)
+        previous = definition
+
+    return groups
+
+
+def create_group_text(
+    group: DefinitionsGroup, locations: dict[str, str], options: GenerationOptions
+) -> str:
+    texts = []
+    imports: dict[str, set[str]] = {}
+    # Types of fields and return types of functions are string annotations, their
+    # classes are imported only for type checkers to keep submodules lazy
+    annotations: set[str] = set()
+    for definition in group.definitions:
+        for dependency in get_dependencies(definition):
+            module = locations[dependency]
+            if module != group.module:
+                imports.setdefault(module, set()).add(dependency)
+
         if definition.type == "class":
-            text = create_class_text(definition, set())
+            texts.append(create_class_text(definition, annotations, options))
         else:
-            text = create_function_text(definition, set())
-        writer.write(text + "\n\n")
-        count += 1
+            texts.append(create_function_text(definition, annotations, options))
+            assert definition.related_obj
+            annotations.add(class_to_python_name(definition.related_obj))
+
+    type_checking_imports: dict[str, set[str]] = {}
+    for name in annotations - BASE_NAMES:
+        module = locations[name]
+        if module != group.module and name not in imports.get(module, ()):
+            type_checking_imports.setdefault(module, set()).add(name)
+
+    header = [BASE_TEXT]
+    for module, names in sorted(imports.items()):
+        header.append(f"from .{module} import {', '.join(sorted(names))}")
+    if type_checking_imports:
+        header.append("\nif TYPE_CHECKING:")
+        for module, names in sorted(type_checking_imports.items()):
+            header.append(f"    from .{module} import {', '.join(sorted(names))}")
+
+    return "\n".join(header) + "\n\n" + "\n\n".join(texts) + "\n\n"
+
+
+def create_index_text(locations: dict[str, str]) -> str:
+    modules = [f'    "{name}": "{module}",' for name, module in locations.items()]
+    # Type checkers see the names of __all__ through these imports
+    module_names: dict[str, list[str]] = {}
+    for name, module in locations.items():
+        module_names.setdefault(module, []).append(name)
+    imports = [
+        f"    from .{module} import {', '.join(sorted(names))}"
+        for module, names in sorted(module_names.items())
+    ]
+    names = [f'    "{name}",' for name in locations]
+    return INDEX_TEMPLATE.format(
+        imports="\n".join(imports),
+        modules="\n".join(modules),
+        names="\n".join(names),
+    ).lstrip()
+
+
+def process_file(
+    reader: TextIO,
+    output_dir: str,
+    options: GenerationOptions = GenerationOptions(),
+):
+    groups = split_into_groups(read_definitions(reader), options.group_size)
+    locations = {
+        class_to_python_name(definition.name): group.module
+        for group in groups
+        for definition in group.definitions
+    }
+
+    os.makedirs(output_dir, exist_ok=True)
+    for group in groups:
+        with open(os.path.join(output_dir, f"{group.module}.py"), "w") as writer:
+            writer.write(create_group_text(group, locations, options))
+
+    with open(os.path.join(output_dir, "__init__.py"), "w") as writer:
+        writer.write(create_index_text(locations))
 
-    return count
+    return len(locations)
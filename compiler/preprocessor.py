@@ -19,6 +19,7 @@ class ProcessedTlArgument:
     doc: str
     python_type: PythonType
     default: str
+    json_name: str = ""
 
 
 def is_valid_name(name: str) -> bool:
@@ -81,7 +82,11 @@ def preprocess_arguments(
         name = fix_unavailable_name_if_needed(arg.name)
         result.append(
             ProcessedTlArgument(
-                name=name, doc=arg.doc, python_type=type_, default=default
+                name=name,
+                doc=arg.doc,
+                python_type=type_,
+                default=default,
+                json_name=arg.name,
             )
         )
 
@@ -0,0 +1,61 @@
+import dataclasses
+from _typeshed import Incomplete
+from bygram.core.serializer import serialize_object as serialize_object
+from bygram.core.types import T as T
+from bygram.types import raw as raw
+from bygram.types.base import Function as Function, ObjectBase as ObjectBase, Update as Update
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Mapping
+
+class EntityCache:
+    def __init__(self) -> None: ...
+    def user(self, user_id: int) -> raw.User | None: ...
+    def chat(self, chat_id: int) -> raw.Chat | None: ...
+    def basic_group(self, basic_group_id: int) -> raw.BasicGroup | None: ...
+    def supergroup(self, supergroup_id: int) -> raw.Supergroup | None: ...
+    def secret_chat(self, secret_chat_id: int) -> raw.SecretChat | None: ...
+    def user_full_info(self, user_id: int) -> raw.UserFullInfo | None: ...
+    def basic_group_full_info(self, basic_group_id: int) -> raw.BasicGroupFullInfo | None: ...
+    def supergroup_full_info(self, supergroup_id: int) -> raw.SupergroupFullInfo | None: ...
+    def apply(self, update: Update) -> bool: ...
+
+def get_cached_update_types() -> tuple[type[Update], ...]: ...
+
+@dataclasses.dataclass(frozen=True)
+class CachePolicy:
+    ttl: float | None = ...
+    max_entries: int | None = ...
+    max_bytes: int | None = ...
+
+def get_response_cache_policies() -> Mapping[type[Function], CachePolicy]: ...
+
+@dataclasses.dataclass
+class CacheStats:
+    hits: int = ...
+    misses: int = ...
+    evictions: int = ...
+    expirations: int = ...
+    invalidations: int = ...
+    def add(self, other: CacheStats): ...
+
+def get_response_key(function: Function) -> Hashable: ...
+
+class _ResponseStore:
+    policy: Incomplete
+    entries: OrderedDict[Hashable, tuple[Any, float, int]]
+    size: int
+    stats: Incomplete
+    generation: int
+    def __init__(self, policy: CachePolicy) -> None: ...
+    def get(self, key: Hashable, now: float) -> Any | None: ...
+    def put(self, key: Hashable, response: Any, now: float): ...
+    def invalidate(self, key: Hashable): ...
+
+class ResponseCache:
+    def __init__(self, policies: Mapping[type[Function], CachePolicy] | None = None, clock: Callable[[], float] = ...) -> None: ...
+    async def fetch(self, function: Function[T], execute: Callable[[Function[T]], Awaitable[T]]) -> T: ...
+    def invalidate(self, update: Update) -> bool: ...
+    def clear(self) -> None: ...
+    def stats(self, function_type: type[Function] | None = None) -> CacheStats: ...
+
+def get_invalidating_update_types() -> tuple[type[Update], ...]: ...
@@ -1,20 +1,37 @@
 from _typeshed import Incomplete
+from bygram.cache import CachePolicy as CachePolicy, EntityCache as EntityCache, ResponseCache as ResponseCache
 from bygram.core.serializer import SerializedWrapper as SerializedWrapper
 from bygram.core.types import T as T
+from bygram.downloads import DownloadManager as DownloadManager
 from bygram.executor import Executor as Executor
+from bygram.files import DEFAULT_CHUNK_SIZE as DEFAULT_CHUNK_SIZE, FileReader as FileReader, open_file as open_file
+from bygram.pagination import MAX_PAGE_SIZE as MAX_PAGE_SIZE, iter_chats as iter_chats, iter_history as iter_history, iter_search_chat_messages as iter_search_chat_messages, iter_search_messages as iter_search_messages
 from bygram.types.base import Function as Function
-from bygram.types.raw import AuthorizationStateClosed as AuthorizationStateClosed, Close as Close, UpdateAuthorizationState as UpdateAuthorizationState
+from bygram.types.raw import AuthorizationStateClosed as AuthorizationStateClosed, ChatList as ChatList, Close as Close, Message as Message, SearchChatMessages as SearchChatMessages, SearchMessages as SearchMessages, UpdateAuthorizationState as UpdateAuthorizationState
+from typing import Any, AsyncGenerator, AsyncIterator, Iterable, Mapping
 
 logger: Incomplete
 SHUTDOWN_TIMEOUT: int
 
 class Client:
     id: Incomplete
-    def __init__(self, client_id: int, executor: Executor) -> None: ...
+    cache: Incomplete
+    response_cache: Incomplete
+    downloads: Incomplete
+    def __init__(self, client_id: int, executor: Executor, response_cache: ResponseCache | None = None) -> None: ...
+    @property
+    def in_flight(self) -> int: ...
     async def execute(self, function: Function[T], timeout: float = 30) -> T: ...
+    async def execute_many(self, functions: Iterable[Function], timeout: float = 30) -> list[Any]: ...
+    def execute_as_completed(self, functions: Iterable[Function], timeout: float = 30) -> AsyncIterator[tuple[int, Any]]: ...
+    async def open_file(self, file_id: int, chunk_size: int = ..., read_ahead: int = 2, use_local_path: bool = True) -> FileReader: ...
+    def iter_history(self, chat_id: int, limit: int | None = None, from_message_id: int = 0, only_local: bool = False, page_size: int = ..., read_ahead: int = 1) -> AsyncGenerator[Message, None]: ...
+    def iter_search_chat_messages(self, function: SearchChatMessages, limit: int | None = None, read_ahead: int = 1) -> AsyncGenerator[Message, None]: ...
+    def iter_search_messages(self, function: SearchMessages, limit: int | None = None, read_ahead: int = 1) -> AsyncGenerator[Message, None]: ...
+    def iter_chats(self, chat_list: ChatList | None = None, limit: int | None = None, page_size: int = ..., read_ahead: int = 1) -> AsyncGenerator[int, None]: ...
 
 class ClientManager:
-    def __init__(self, executor: Executor, wrapper: SerializedWrapper) -> None: ...
+    def __init__(self, executor: Executor, wrapper: SerializedWrapper, response_cache_policies: Mapping[type[Function], CachePolicy] | None = None) -> None: ...
     def create_client(self) -> Client: ...
     def get_client_by_id(self, client_id: int): ...
     async def handle_authorization_state_update(self, update: UpdateAuthorizationState, client_id: int): ...
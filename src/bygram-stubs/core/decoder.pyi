@@ -0,0 +1,33 @@
+import queue
+from _typeshed import Incomplete
+from bygram.core.types import DeserializedObject as DeserializedObject
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable
+
+logger: Incomplete
+Decode = Callable[[bytes], DeserializedObject | None]
+Handover = Callable[[deque[DeserializedObject]], None]
+PeekClientId = Callable[[bytes], int | None]
+
+@dataclass
+class DecodeStats:
+    decoded: int = ...
+    total_time: float = ...
+    max_time: float = ...
+    @property
+    def average_time(self) -> float: ...
+    def add(self, other: DecodeStats): ...
+
+class _DecodeWorker:
+    queue: queue.Queue[bytes | None]
+    stats: Incomplete
+    def __init__(self, name: str, decode: Decode, handover: Handover, queue_size: int, batch_size: int) -> None: ...
+    def start(self) -> None: ...
+
+class DecodePool:
+    def __init__(self, decode: Decode, handover: Handover, peek_client_id: PeekClientId, workers: int, queue_size: int = 20, batch_size: int = 1) -> None: ...
+    def start(self) -> None: ...
+    def submit(self, raw: bytes): ...
+    def stats(self) -> DecodeStats: ...
+    def shutdown(self) -> None: ...
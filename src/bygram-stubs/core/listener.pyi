@@ -1,11 +1,14 @@
 import asyncio
 from _typeshed import Incomplete
+from bygram.core.decoder import Decode as Decode, DecodePool as DecodePool, DecodeStats as DecodeStats, PeekClientId as PeekClientId
 from bygram.core.types import DeserializedObject as DeserializedObject
-from typing import Callable
+from bygram.types.base import ObjectBase as ObjectBase
+from typing import Any, Callable
 
 logger: Incomplete
 
 class EventListener:
-    def __init__(self, loop: asyncio.AbstractEventLoop, receive: Callable[[float], DeserializedObject | None], timeout: float = 60, queue_size: int = 20) -> None: ...
+    def __init__(self, loop: asyncio.AbstractEventLoop, receive: Callable[[float], Any], timeout: float = 60, queue_size: int = 20, batch_size: int = 1, decode: Decode | None = None, decode_workers: int = 0, peek_client_id: PeekClientId | None = None, on_response: Callable[[ObjectBase, Any], None] | None = None) -> None: ...
     async def wait_for_event(self) -> DeserializedObject: ...
+    def decode_stats(self) -> DecodeStats | None: ...
     def shutdown(self) -> None: ...
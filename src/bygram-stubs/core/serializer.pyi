@@ -1,20 +1,63 @@
+import abc
 import json
+from _typeshed import Incomplete
 from bygram.core.types import DeserializedObject
 from bygram.core.wrapper import TdLibWrapper
 from bygram.types.base import Function, ObjectBase, T
-from typing import Any
+from typing import Any, Callable
 
-__all__ = ['serialize_object', 'deserialize_object']
+__all__ = ['serialize_object', 'deserialize_object', 'deserialize_object_lazy', 'peek_client_id', 'peek_type', 'Codec', 'StdlibCodec', 'OrjsonCodec', 'available_codecs', 'default_codec']
+
+Buffer = bytes | memoryview
 
 class CustomJSONEncoder(json.JSONEncoder):
     def default(self, o: Any) -> Any: ...
 
 def serialize_object(obj: ObjectBase, extra: Any | None = None) -> bytes: ...
+
+class _TypesRegistry(dict[str, type[ObjectBase]]):
+    def __missing__(self, type_: str) -> type[ObjectBase]: ...
+
 def deserialize_object(obj: bytes) -> DeserializedObject: ...
 
+class _LazyFields:
+    data: Incomplete
+    def __init__(self, data: dict) -> None: ...
+    def load(self, obj: ObjectBase): ...
+
+def deserialize_object_lazy(obj: Buffer, loads: Callable[[Buffer], Any] = ...) -> DeserializedObject: ...
+def peek_client_id(obj: Buffer) -> int | None: ...
+def peek_type(obj: Buffer) -> str | None: ...
+
+class Codec(abc.ABC, metaclass=abc.ABCMeta):
+    name: str
+    @abc.abstractmethod
+    def loads(self, obj: Buffer) -> Any: ...
+    @abc.abstractmethod
+    def deserialize(self, obj: Buffer) -> DeserializedObject: ...
+    def serialize(self, obj: ObjectBase, extra: Any | None = None) -> bytes: ...
+
+class StdlibCodec(Codec):
+    name: str
+    def loads(self, obj: Buffer) -> Any: ...
+    def deserialize(self, obj: Buffer) -> DeserializedObject: ...
+
+class OrjsonCodec(Codec):
+    name: str
+    def __init__(self) -> None: ...
+    def loads(self, obj: Buffer) -> Any: ...
+    def deserialize(self, obj: Buffer) -> DeserializedObject: ...
+
+def available_codecs() -> list[Codec]: ...
+def default_codec() -> Codec: ...
+
 class SerializedWrapper:
-    def __init__(self, wrapper: TdLibWrapper) -> None: ...
+    def __init__(self, wrapper: TdLibWrapper, lazy: bool = False, codec: Codec | None = None) -> None: ...
+    def set_handled_update_types(self, get_types: Callable[[], frozenset[str] | None] | None): ...
     def create_client(self) -> int: ...
     def send(self, client_id: int, func: Function, extra: Any | None = None): ...
+    def receive_raw(self, timeout: float) -> Buffer | None: ...
+    def decode(self, raw: Buffer) -> DeserializedObject | None: ...
     def receive(self, timeout: float) -> DeserializedObject | None: ...
+    def close(self) -> None: ...
     def execute(self, func: Function[T]) -> T: ...
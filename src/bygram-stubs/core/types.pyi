@@ -1,11 +1,14 @@
 from bygram.types.base import ObjectBase as ObjectBase
 from dataclasses import dataclass
-from typing import Any, Generic, TypeVar
+from typing import Any, Callable, Generic, TypeVar
 
 T = TypeVar('T', bound=ObjectBase)
+R = TypeVar('R')
 
 @dataclass
 class DeserializedObject(Generic[T]):
     obj: T
     client_id: int | None = ...
     extra: Any | None = ...
+
+def raw_table(build: Callable[[], R]) -> Callable[[], R]: ...
@@ -1,12 +1,16 @@
 import ctypes
 from _typeshed import Incomplete
 
+def _memoryview_at(address: int | None) -> memoryview | None: ...
+
 class TdLibWrapper:
     cdll: Incomplete
-    def __init__(self, cdll: ctypes.CDLL) -> None: ...
+    zero_copy: Incomplete
+    def __init__(self, cdll: ctypes.CDLL, zero_copy: bool = False) -> None: ...
     def create_client(self) -> int: ...
     def send(self, client_id: int, request: bytes) -> None: ...
-    def receive(self, timeout: float) -> bytes | None: ...
-    def execute(self, request: bytes) -> bytes: ...
+    def receive(self, timeout: float) -> bytes | memoryview | None: ...
+    def execute(self, request: bytes) -> bytes | memoryview: ...
+    def close(self) -> None: ...
 
-def load_library(path: str) -> TdLibWrapper: ...
+def load_library(path: str, zero_copy: bool = False) -> TdLibWrapper: ...
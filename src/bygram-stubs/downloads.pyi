@@ -0,0 +1,33 @@
+import asyncio
+import contextlib
+from _typeshed import Incomplete
+from bygram.types import raw as raw
+from bygram.types.base import Update as Update
+from typing import Any, Awaitable, Callable
+
+logger: Incomplete
+MIN_PRIORITY: int
+MAX_PRIORITY: int
+Execute = Callable[..., Awaitable[Any]]
+
+class _Download:
+    file_id: Incomplete
+    priority: Incomplete
+    future: Incomplete
+    refs: int
+    size: int
+    task: asyncio.Task | None
+    deadline: asyncio.Timeout | None
+    def __init__(self, file_id: int, priority: int, future: asyncio.Future) -> None: ...
+
+class DownloadManager:
+    def __init__(self, execute: Execute, max_concurrent: int = 4, max_pending_bytes: int | None = None, timeout: float = 3600) -> None: ...
+    @property
+    def active(self) -> int: ...
+    @property
+    def pending_bytes(self) -> int: ...
+    def download(self, file_id: int, priority: int = 1) -> asyncio.Future[raw.File]: ...
+    def downloaded(self, file_id: int, priority: int = 1) -> contextlib.AbstractAsyncContextManager[raw.File]: ...
+    def release(self, file_id: int): ...
+    def progress(self, file_id: int) -> raw.File | None: ...
+    def apply(self, update: Update) -> bool: ...
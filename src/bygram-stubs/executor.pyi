@@ -2,13 +2,30 @@ import asyncio
 from _typeshed import Incomplete
 from bygram.core.types import T as T
 from bygram.exceptions import TdlibException as TdlibException
+from bygram.types import raw as raw
 from bygram.types.base import Function as Function, ObjectBase as ObjectBase
 from bygram.types.raw import Error as Error
-from typing import Any, Callable
+from typing import Any, AsyncIterator, Callable, Hashable, Iterable
 
 logger: Incomplete
 
+def get_coalesced_functions() -> frozenset[type[Function]]: ...
+
+def get_coalescing_key(client_id: int, function: Function) -> Hashable | None: ...
+
+class _SharedRequest:
+    request_id: Incomplete
+    future: Incomplete
+    waiters: int
+    def __init__(self, request_id: int, future: asyncio.Future) -> None: ...
+
 class Executor:
-    def __init__(self, send: Callable[[int, Function, Any | None], None], loop: asyncio.AbstractEventLoop) -> None: ...
+    _waiting_response: dict[Any, tuple[asyncio.Future, int]]
+    _shared_requests: dict[Hashable, _SharedRequest]
+    def __init__(self, send: Callable[[int, Function, Any | None], None], loop: asyncio.AbstractEventLoop, max_in_flight_per_client: int | None = None, coalesce: bool = False) -> None: ...
     async def process_response(self, response: ObjectBase, extra: Any): ...
+    def resolve_response(self, response: ObjectBase, extra: Any): ...
+    def in_flight(self, client_id: int | None = None) -> int: ...
     async def execute(self, client_id: int, function: Function[T], timeout: float) -> T: ...
+    async def execute_many(self, client_id: int, functions: Iterable[Function], timeout: float) -> list[Any]: ...
+    def execute_as_completed(self, client_id: int, functions: Iterable[Function], timeout: float) -> AsyncIterator[tuple[int, Any]]: ...
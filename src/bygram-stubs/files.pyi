@@ -0,0 +1,24 @@
+import asyncio
+from _typeshed import Incomplete
+from bygram.types import raw as raw
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+Execute = Callable[..., Awaitable[Any]]
+ReadAt = Callable[[int, int], Awaitable[bytes]]
+DEFAULT_CHUNK_SIZE: Incomplete
+
+class FileReader:
+    size: Incomplete
+    _chunks: dict[int, asyncio.Task[bytes]]
+    def __init__(self, read_at: ReadAt, size: int, chunk_size: int = ..., read_ahead: int = 2, on_close: Callable[[], Any] | None = None) -> None: ...
+    async def __aenter__(self) -> FileReader: ...
+    async def __aexit__(self, *args) -> None: ...
+    def __aiter__(self) -> AsyncIterator[bytes]: ...
+    def tell(self) -> int: ...
+    def seek(self, offset: int, whence: int = ...) -> int: ...
+    async def read(self, size: int = -1) -> bytes: ...
+    async def close(self) -> None: ...
+
+def open_local_file(file: raw.File, chunk_size: int = ..., read_ahead: int = 2) -> FileReader: ...
+def open_tdlib_file(execute: Execute, file: raw.File, chunk_size: int = ..., read_ahead: int = 2) -> FileReader: ...
+async def open_file(execute: Execute, file_id: int, chunk_size: int = ..., read_ahead: int = 2, use_local_path: bool = True) -> FileReader: ...
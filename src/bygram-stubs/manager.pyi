@@ -1,16 +1,19 @@
 import asyncio
 from _typeshed import Incomplete
+from bygram.cache import CachePolicy as CachePolicy
 from bygram.client_manager import Client as Client, ClientManager as ClientManager
+from bygram.core.decoder import DecodeStats as DecodeStats
 from bygram.core.listener import EventListener as EventListener
-from bygram.core.serializer import SerializedWrapper as SerializedWrapper
+from bygram.core.serializer import Codec as Codec, SerializedWrapper as SerializedWrapper, peek_client_id as peek_client_id
 from bygram.core.types import T as T
 from bygram.core.wrapper import load_library as load_library
 from bygram.executor import Executor as Executor
 from bygram.routing.dispatcher import Dispatcher as Dispatcher
-from bygram.routing.middlewares import ClientManagerMiddleware as ClientManagerMiddleware
+from bygram.routing.middlewares import ClientManagerMiddleware as ClientManagerMiddleware, DownloadProgressMiddleware as DownloadProgressMiddleware, EntityCacheMiddleware as EntityCacheMiddleware, ResponseCacheMiddleware as ResponseCacheMiddleware
 from bygram.strategy import EventsLoop as EventsLoop
 from bygram.types.base import Function as Function
 from enum import Enum
+from typing import Mapping
 
 logger: Incomplete
 
@@ -20,15 +23,16 @@ class LibraryState(Enum):
     shutting_down = ...
     shutdowned = ...
 
-def create_library_manager(path: str, loop: asyncio.AbstractEventLoop | None = None, receive_timeout: float = 60): ...
+def create_library_manager(path: str, loop: asyncio.AbstractEventLoop | None = None, receive_timeout: float = 60, receive_batch_size: int = 1, decode_workers: int = 0, max_concurrent_updates: int | None = None, lazy_decode: bool = False, codec: Codec | None = None, zero_copy_receive: bool = False, max_in_flight_per_client: int | None = None, coalesce_requests: bool = False, entity_cache: bool = False, response_cache_policies: Mapping[type[Function], CachePolicy] | None = None, download_progress: bool = False, fast_responses: bool = False): ...
 
 class LibraryManager:
-    def __init__(self, client_manager: ClientManager, event_loop: EventsLoop, serialized_wrapper: SerializedWrapper) -> None: ...
+    def __init__(self, client_manager: ClientManager, event_loop: EventsLoop, serialized_wrapper: SerializedWrapper, entity_cache: bool = False, response_cache: bool = False, download_progress: bool = False) -> None: ...
     async def __aenter__(self): ...
     async def __aexit__(self, *args) -> None: ...
     def create_client(self) -> Client: ...
     def execute(self, function: Function[T]) -> T: ...
     def attach_dispatcher(self, dp: Dispatcher): ...
+    def decode_stats(self) -> DecodeStats | None: ...
     def init(self) -> None: ...
     async def join(self) -> None: ...
     async def shutdown(self) -> None: ...
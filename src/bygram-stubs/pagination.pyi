@@ -0,0 +1,14 @@
+from bygram.types import raw as raw
+from typing import Any, AsyncGenerator, Awaitable, Callable, TypeVar
+
+Cursor = TypeVar('Cursor')
+Item = TypeVar('Item')
+Execute = Callable[..., Awaitable[Any]]
+FetchPage = Callable[[Cursor, int], Awaitable[tuple[list[Item], Cursor | None]]]
+MAX_PAGE_SIZE: int
+
+def paginate(fetch_page: FetchPage[Cursor, Item], cursor: Cursor, limit: int | None = None, page_size: int = ..., read_ahead: int = 1) -> AsyncGenerator[Item, None]: ...
+def iter_history(execute: Execute, chat_id: int, limit: int | None = None, from_message_id: int = 0, only_local: bool = False, page_size: int = ..., read_ahead: int = 1) -> AsyncGenerator[raw.Message, None]: ...
+def iter_search_chat_messages(execute: Execute, function: raw.SearchChatMessages, limit: int | None = None, read_ahead: int = 1) -> AsyncGenerator[raw.Message, None]: ...
+def iter_search_messages(execute: Execute, function: raw.SearchMessages, limit: int | None = None, read_ahead: int = 1) -> AsyncGenerator[raw.Message, None]: ...
+def iter_chats(execute: Execute, chat_list: raw.ChatList | None = None, limit: int | None = None, page_size: int = ..., read_ahead: int = 1) -> AsyncGenerator[int, None]: ...
@@ -1,2 +1,2 @@
 from .dispatcher import Dispatcher as Dispatcher
-from .filters import FilterBase as FilterBase
+from .filters import ChatIdFilter as ChatIdFilter, ContentTypeFilter as ContentTypeFilter, FieldFilter as FieldFilter, FilterBase as FilterBase, IndexedFilter as IndexedFilter, SenderFilter as SenderFilter, TextFilter as TextFilter
@@ -1,4 +1,4 @@
-from .filters import FilterBase as FilterBase
+from .filters import FieldFilter as FieldFilter, FilterBase as FilterBase, IndexedFilter as IndexedFilter
 from _typeshed import Incomplete
 from bygram.routing.middlewares import MiddlewareBase as MiddlewareBase
 from bygram.types.base import Update as Update
@@ -8,16 +8,34 @@ T = TypeVar('T', bound=Update)
 Callback = Callable[..., Awaitable[Any]]
 logger: Incomplete
 
+class Injector:
+    callback: Incomplete
+    pass_all: bool
+    names: Incomplete
+    def __init__(self, callback: Callback) -> None: ...
+    def build_kwargs(self, data: dict) -> dict: ...
+    def __call__(self, update: Update, data: dict): ...
+
 def inject_dependencies(callback: Callback, update: Update, data: dict): ...
 
 class Handler:
     callback: Incomplete
     callback_signature: Incomplete
     filters: Incomplete
+    indexed_filter: IndexedFilter | None
+    field_filters: list[FieldFilter]
+    fallback_filters: list[tuple[FilterBase, Injector]]
     def __init__(self, callback: Callback, filters: Iterable[FilterBase]) -> None: ...
-    async def is_pass_filters(self, update: Update, data: dict) -> bool: ...
+    async def is_pass_filters(self, update: Update, data: dict, check_indexed: bool = True) -> bool: ...
     async def __call__(self, update: Update, data: dict) -> Any: ...
 
+class HandlersIndex:
+    handlers: Incomplete
+    def __init__(self, handlers: list[Handler]) -> None: ...
+    def find(self, update: Update) -> list[Handler]: ...
+
+Routes: Incomplete
+
 class Router:
     callbacks: dict[type[Update], list[Handler]]
     routers: list[Router]
@@ -29,9 +47,13 @@ class Router:
     def add_handler(self, type: type[Update], callback: Callback, filters: Iterable[FilterBase]): ...
     def register(self, type: type[Update], *filters: FilterBase): ...
 
+def get_tl_type_name(type: type[Update]) -> str | None: ...
+
 class Dispatcher(Router):
     di: dict[str, Any]
+    handled_update_types: frozenset[str] | None
     def __init__(self) -> None: ...
+    def add_middleware(self, middleware: MiddlewareBase): ...
     async def feed_update(self, update: Update, client_id: int): ...
     def __setitem__(self, key: str, value: Any): ...
     def __getitem__(self, key: str): ...
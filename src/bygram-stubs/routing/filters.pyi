@@ -1,9 +1,49 @@
 import abc
-from bygram.types.base import Update as Update
-from typing import Generic, TypeVar
+import re
+from _typeshed import Incomplete
+from bygram.types.base import ObjectBase as ObjectBase, Update as Update
+from typing import Any, Generic, Hashable, TypeVar
 
 T = TypeVar('T', bound=Update)
 
+def get_update_message(update: Update) -> Any: ...
+def get_update_chat_id(update: Update) -> int | None: ...
+
 class FilterBase(abc.ABC, Generic[T], metaclass=abc.ABCMeta):
     @abc.abstractmethod
     async def __call__(self, event: Update, data: dict) -> bool | dict: ...
+
+class FieldFilter(FilterBase[T], metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    def check(self, event: Update) -> bool: ...
+    async def __call__(self, event: Update, data: dict) -> bool | dict: ...
+
+class IndexedFilter(FieldFilter[T], metaclass=abc.ABCMeta):
+    key: Hashable
+    values: Incomplete
+    def __init__(self, *values: Hashable) -> None: ...
+    @staticmethod
+    @abc.abstractmethod
+    def get_value(event: Update) -> Hashable: ...
+    def check(self, event: Update) -> bool: ...
+
+class ChatIdFilter(IndexedFilter[T]):
+    key: Hashable
+    @staticmethod
+    def get_value(event: Update) -> Hashable: ...
+
+class SenderFilter(IndexedFilter[T]):
+    key: Hashable
+    @staticmethod
+    def get_value(event: Update) -> Hashable: ...
+
+class ContentTypeFilter(IndexedFilter[T]):
+    key: Hashable
+    def __init__(self, *types: type[ObjectBase]) -> None: ...
+    @staticmethod
+    def get_value(event: Update) -> Hashable: ...
+
+class TextFilter(FieldFilter[T]):
+    pattern: Incomplete
+    def __init__(self, pattern: str | re.Pattern) -> None: ...
+    def check(self, event: Update) -> bool: ...
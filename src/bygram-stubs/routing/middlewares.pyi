@@ -1,10 +1,13 @@
 import abc
+from _typeshed import Incomplete
+from bygram.cache import get_cached_update_types as get_cached_update_types, get_invalidating_update_types as get_invalidating_update_types
 from bygram.client_manager import ClientManager as ClientManager
 from bygram.types.base import Update as Update
-from bygram.types.raw import UpdateAuthorizationState as UpdateAuthorizationState
+from bygram.types.raw import UpdateAuthorizationState as UpdateAuthorizationState, UpdateFile as UpdateFile
 from typing import Any, Awaitable, Callable
 
 class MiddlewareBase(abc.ABC, metaclass=abc.ABCMeta):
+    update_types: tuple[type[Update], ...]
     @abc.abstractmethod
     async def __call__(self, update: Update, data: dict, next_handler: Callable[[Update, dict], Awaitable[Any]]) -> Any: ...
 
@@ -13,5 +16,20 @@ class FindClientMiddleware(MiddlewareBase):
     async def __call__(self, update: Update, data: dict, next_handler: Callable[[Update, dict], Awaitable[Any]]) -> Any: ...
 
 class ClientManagerMiddleware(MiddlewareBase):
+    update_types: Incomplete
     def __init__(self, client_manager: ClientManager) -> None: ...
     async def __call__(self, update: Update, data: dict, next_handler: Callable[[Update, dict], Awaitable[Any]]) -> Any: ...
+
+class EntityCacheMiddleware(MiddlewareBase):
+    update_types: tuple[type[Update], ...]
+    def __init__(self) -> None: ...
+    async def __call__(self, update: Update, data: dict, next_handler: Callable[[Update, dict], Awaitable[Any]]) -> Any: ...
+
+class ResponseCacheMiddleware(MiddlewareBase):
+    update_types: tuple[type[Update], ...]
+    def __init__(self) -> None: ...
+    async def __call__(self, update: Update, data: dict, next_handler: Callable[[Update, dict], Awaitable[Any]]) -> Any: ...
+
+class DownloadProgressMiddleware(MiddlewareBase):
+    update_types: Incomplete
+    async def __call__(self, update: Update, data: dict, next_handler: Callable[[Update, dict], Awaitable[Any]]) -> Any: ...
@@ -0,0 +1,58 @@
+import asyncio
+from _typeshed import Incomplete
+from bygram.core.types import T as T
+from bygram.manager import LibraryManager as LibraryManager, create_library_manager as create_library_manager
+from bygram.routing.dispatcher import Dispatcher as Dispatcher
+from bygram.routing.middlewares import MiddlewareBase as MiddlewareBase
+from bygram.types.base import Function as Function, Update as Update
+from bygram.types.raw import AuthorizationStateClosed as AuthorizationStateClosed, UpdateAuthorizationState as UpdateAuthorizationState
+from multiprocessing.connection import Connection
+from typing import Any, Awaitable, Callable, Iterable
+
+logger: Incomplete
+Setup = Callable[[], Dispatcher]
+CreateManager = Callable[..., LibraryManager]
+
+def to_global_client_id(client_id: int, shard: int, shards: int) -> int: ...
+def to_local_client_id(client_id: int, shards: int) -> tuple[int, int]: ...
+
+class _ClosedClientsMiddleware(MiddlewareBase):
+    update_types: Incomplete
+    def __init__(self, on_closed: Callable[[int], Any]) -> None: ...
+    async def __call__(self, update: Update, data: dict, next_handler: Callable[[Update, dict], Awaitable[Any]]) -> Any: ...
+
+class _ShardWorker:
+    stopped: Incomplete
+    def __init__(self, connection: Connection, manager: LibraryManager) -> None: ...
+    def on_client_closed(self, client_id: int): ...
+    def on_error(self, exc: Exception): ...
+    def on_message(self, message: tuple): ...
+
+class _Shard:
+    index: Incomplete
+    process: Incomplete
+    connection: Incomplete
+    clients: int
+    def __init__(self, index: int, process: Any, connection: Connection, on_client_closed: Callable[[int, int], Any]) -> None: ...
+    def start_reading(self, loop: asyncio.AbstractEventLoop): ...
+    def call(self, op: int, client_id: int = 0, args: tuple = ()) -> asyncio.Future: ...
+    def stop(self) -> None: ...
+
+class ShardClient:
+    id: Incomplete
+    shard: Incomplete
+    closed: bool
+    def __init__(self, client_id: int, shard: _Shard, local_id: int) -> None: ...
+    async def execute(self, function: Function[T], timeout: float = 30) -> T: ...
+    async def execute_many(self, functions: Iterable[Function], timeout: float = 30) -> list[Any]: ...
+
+class ShardedLibraryManager:
+    def __init__(self, path: str, shards: int, setup: Setup | None = None, create_manager: CreateManager = ..., **options: Any) -> None: ...
+    @property
+    def shards(self) -> int: ...
+    async def __aenter__(self): ...
+    async def __aexit__(self, *args) -> None: ...
+    def start(self) -> None: ...
+    async def create_client(self) -> ShardClient: ...
+    def get_client_by_id(self, client_id: int) -> ShardClient: ...
+    async def shutdown(self) -> None: ...
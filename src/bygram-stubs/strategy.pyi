@@ -3,12 +3,32 @@ from bygram.core.listener import EventListener as EventListener
 from bygram.core.types import DeserializedObject as DeserializedObject
 from bygram.executor import Executor as Executor
 from bygram.routing.dispatcher import Dispatcher as Dispatcher
+from bygram.routing.filters import get_update_chat_id as get_update_chat_id
+from bygram.types.base import Update as Update
+from typing import Any, Awaitable, Callable
+
+logger: Incomplete
+PENDING_UPDATES_FACTOR: int
+
+class SequentialUpdates:
+    def __init__(self, feed_update: Callable[[Update, int], Awaitable[Any]]) -> None: ...
+    @property
+    def pending(self) -> int: ...
+    def schedule(self, update: Update, client_id: int): ...
+    async def shutdown(self) -> None: ...
+
+class UpdatesScheduler:
+    def __init__(self, feed_update: Callable[[Update, int], Awaitable[Any]], max_concurrent: int, max_pending: int | None = None) -> None: ...
+    @property
+    def pending(self) -> int: ...
+    def schedule(self, update: Update, client_id: int): ...
+    async def shutdown(self) -> None: ...
 
 class EventsLoop:
     listener: Incomplete
     executor: Incomplete
     dispatcher: Incomplete
-    def __init__(self, listener: EventListener, executor: Executor, dispatcher: Dispatcher | None = None) -> None: ...
+    def __init__(self, listener: EventListener, executor: Executor, dispatcher: Dispatcher | None = None, max_concurrent_updates: int | None = None) -> None: ...
     def attach_dispatcher(self, dp: Dispatcher): ...
     def start_listening(self) -> None: ...
     async def join(self) -> None: ...
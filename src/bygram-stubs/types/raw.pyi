@@ -1,185 +1,185 @@
 from .base import Function as Function, ObjectBase as ObjectBase, Update as Update
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class Error(ObjectBase):
     code: int = ...
     message: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class Ok(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class AuthenticationCodeType(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class AuthenticationCodeTypeTelegramMessage(AuthenticationCodeType):
     length: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AuthenticationCodeTypeSms(AuthenticationCodeType):
     length: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AuthenticationCodeTypeSmsWord(AuthenticationCodeType):
     first_letter: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class AuthenticationCodeTypeSmsPhrase(AuthenticationCodeType):
     first_word: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class AuthenticationCodeTypeCall(AuthenticationCodeType):
     length: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AuthenticationCodeTypeFlashCall(AuthenticationCodeType):
     pattern: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class AuthenticationCodeTypeMissedCall(AuthenticationCodeType):
     phone_number_prefix: str = ...
     length: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AuthenticationCodeTypeFragment(AuthenticationCodeType):
     url: str = ...
     length: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AuthenticationCodeTypeFirebaseAndroid(AuthenticationCodeType):
     device_verification_parameters: FirebaseDeviceVerificationParameters | None = ...
     length: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AuthenticationCodeTypeFirebaseIos(AuthenticationCodeType):
     receipt: str = ...
     push_timeout: int = ...
     length: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AuthenticationCodeInfo(ObjectBase):
     phone_number: str = ...
     type: AuthenticationCodeType | None = ...
     next_type: AuthenticationCodeType | None = ...
     timeout: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class EmailAddressAuthenticationCodeInfo(ObjectBase):
     email_address_pattern: str = ...
     length: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class EmailAddressAuthentication(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class EmailAddressAuthenticationCode(EmailAddressAuthentication):
     code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class EmailAddressAuthenticationAppleId(EmailAddressAuthentication):
     token: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class EmailAddressAuthenticationGoogleId(EmailAddressAuthentication):
     token: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class EmailAddressResetState(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class EmailAddressResetStateAvailable(EmailAddressResetState):
     wait_period: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class EmailAddressResetStatePending(EmailAddressResetState):
     reset_in: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class TextEntity(ObjectBase):
     offset: int = ...
     length: int = ...
     type: TextEntityType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class TextEntities(ObjectBase):
     entities: list[TextEntity] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class FormattedText(ObjectBase):
     text: str = ...
     entities: list[TextEntity] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class TermsOfService(ObjectBase):
     text: FormattedText | None = ...
     min_user_age: int = ...
     show_popup: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class AuthorizationState(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class AuthorizationStateWaitTdlibParameters(AuthorizationState): ...
-@dataclass
+@dataclass(slots=True)
 class AuthorizationStateWaitPhoneNumber(AuthorizationState): ...
 
-@dataclass
+@dataclass(slots=True)
 class AuthorizationStateWaitPremiumPurchase(AuthorizationState):
     store_product_id: str = ...
     support_email_address: str = ...
     support_email_subject: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class AuthorizationStateWaitEmailAddress(AuthorizationState):
     allow_apple_id: bool = ...
     allow_google_id: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class AuthorizationStateWaitEmailCode(AuthorizationState):
     allow_apple_id: bool = ...
     allow_google_id: bool = ...
     code_info: EmailAddressAuthenticationCodeInfo | None = ...
     email_address_reset_state: EmailAddressResetState | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class AuthorizationStateWaitCode(AuthorizationState):
     code_info: AuthenticationCodeInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class AuthorizationStateWaitOtherDeviceConfirmation(AuthorizationState):
     link: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class AuthorizationStateWaitRegistration(AuthorizationState):
     terms_of_service: TermsOfService | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class AuthorizationStateWaitPassword(AuthorizationState):
     password_hint: str = ...
     has_recovery_email_address: bool = ...
     has_passport_data: bool = ...
     recovery_email_address_pattern: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class AuthorizationStateReady(AuthorizationState): ...
-@dataclass
+@dataclass(slots=True)
 class AuthorizationStateLoggingOut(AuthorizationState): ...
-@dataclass
+@dataclass(slots=True)
 class AuthorizationStateClosing(AuthorizationState): ...
-@dataclass
+@dataclass(slots=True)
 class AuthorizationStateClosed(AuthorizationState): ...
-@dataclass
+@dataclass(slots=True)
 class FirebaseDeviceVerificationParameters(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class FirebaseDeviceVerificationParametersSafetyNet(FirebaseDeviceVerificationParameters):
     nonce: bytes = ...
 
-@dataclass
+@dataclass(slots=True)
 class FirebaseDeviceVerificationParametersPlayIntegrity(FirebaseDeviceVerificationParameters):
     nonce: str = ...
     cloud_project_number: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PasswordState(ObjectBase):
     has_password: bool = ...
     password_hint: str = ...
@@ -189,16 +189,16 @@ class PasswordState(ObjectBase):
     login_email_address_pattern: str = ...
     pending_reset_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class RecoveryEmailAddress(ObjectBase):
     recovery_email_address: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class TemporaryPasswordState(ObjectBase):
     has_password: bool = ...
     valid_for: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class LocalFile(ObjectBase):
     path: str = ...
     can_be_downloaded: bool = ...
@@ -209,7 +209,7 @@ class LocalFile(ObjectBase):
     downloaded_prefix_size: int = ...
     downloaded_size: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class RemoteFile(ObjectBase):
     id: str = ...
     unique_id: str = ...
@@ -217,7 +217,7 @@ class RemoteFile(ObjectBase):
     is_uploading_completed: bool = ...
     uploaded_size: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class File(ObjectBase):
     id: int = ...
     size: int = ...
@@ -225,28 +225,28 @@ class File(ObjectBase):
     local: LocalFile | None = ...
     remote: RemoteFile | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputFile(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class InputFileId(InputFile):
     id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputFileRemote(InputFile):
     id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputFileLocal(InputFile):
     path: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputFileGenerated(InputFile):
     original_path: str = ...
     conversion: str = ...
     expected_size: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PhotoSize(ObjectBase):
     type: str = ...
     photo: File | None = ...
@@ -254,95 +254,95 @@ class PhotoSize(ObjectBase):
     height: int = ...
     progressive_sizes: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Minithumbnail(ObjectBase):
     width: int = ...
     height: int = ...
     data: bytes = ...
 
-@dataclass
+@dataclass(slots=True)
 class ThumbnailFormat(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class ThumbnailFormatJpeg(ThumbnailFormat): ...
-@dataclass
+@dataclass(slots=True)
 class ThumbnailFormatGif(ThumbnailFormat): ...
-@dataclass
+@dataclass(slots=True)
 class ThumbnailFormatMpeg4(ThumbnailFormat): ...
-@dataclass
+@dataclass(slots=True)
 class ThumbnailFormatPng(ThumbnailFormat): ...
-@dataclass
+@dataclass(slots=True)
 class ThumbnailFormatTgs(ThumbnailFormat): ...
-@dataclass
+@dataclass(slots=True)
 class ThumbnailFormatWebm(ThumbnailFormat): ...
-@dataclass
+@dataclass(slots=True)
 class ThumbnailFormatWebp(ThumbnailFormat): ...
 
-@dataclass
+@dataclass(slots=True)
 class Thumbnail(ObjectBase):
     format: ThumbnailFormat | None = ...
     width: int = ...
     height: int = ...
     file: File | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MaskPoint(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class MaskPointForehead(MaskPoint): ...
-@dataclass
+@dataclass(slots=True)
 class MaskPointEyes(MaskPoint): ...
-@dataclass
+@dataclass(slots=True)
 class MaskPointMouth(MaskPoint): ...
-@dataclass
+@dataclass(slots=True)
 class MaskPointChin(MaskPoint): ...
 
-@dataclass
+@dataclass(slots=True)
 class MaskPosition(ObjectBase):
     point: MaskPoint | None = ...
     x_shift: float = ...
     y_shift: float = ...
     scale: float = ...
 
-@dataclass
+@dataclass(slots=True)
 class StickerFormat(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class StickerFormatWebp(StickerFormat): ...
-@dataclass
+@dataclass(slots=True)
 class StickerFormatTgs(StickerFormat): ...
-@dataclass
+@dataclass(slots=True)
 class StickerFormatWebm(StickerFormat): ...
-@dataclass
+@dataclass(slots=True)
 class StickerType(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class StickerTypeRegular(StickerType): ...
-@dataclass
+@dataclass(slots=True)
 class StickerTypeMask(StickerType): ...
-@dataclass
+@dataclass(slots=True)
 class StickerTypeCustomEmoji(StickerType): ...
-@dataclass
+@dataclass(slots=True)
 class StickerFullType(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class StickerFullTypeRegular(StickerFullType):
     premium_animation: File | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StickerFullTypeMask(StickerFullType):
     mask_position: MaskPosition | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StickerFullTypeCustomEmoji(StickerFullType):
     custom_emoji_id: int = ...
     needs_repainting: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ClosedVectorPath(ObjectBase):
     commands: list[VectorPathCommand] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Outline(ObjectBase):
     paths: list[ClosedVectorPath] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PollOption(ObjectBase):
     text: FormattedText | None = ...
     voter_count: int = ...
@@ -350,31 +350,31 @@ class PollOption(ObjectBase):
     is_chosen: bool = ...
     is_being_chosen: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PollType(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class PollTypeRegular(PollType):
     allow_multiple_answers: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PollTypeQuiz(PollType):
     correct_option_id: int = ...
     explanation: FormattedText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChecklistTask(ObjectBase):
     id: int = ...
     text: FormattedText | None = ...
     completed_by: MessageSender | None = ...
     completion_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputChecklistTask(ObjectBase):
     id: int = ...
     text: FormattedText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Checklist(ObjectBase):
     title: FormattedText | None = ...
     tasks: list[ChecklistTask] | None = ...
@@ -383,14 +383,14 @@ class Checklist(ObjectBase):
     others_can_mark_tasks_as_done: bool = ...
     can_mark_tasks_as_done: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputChecklist(ObjectBase):
     title: FormattedText | None = ...
     tasks: list[InputChecklistTask] | None = ...
     others_can_add_tasks: bool = ...
     others_can_mark_tasks_as_done: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class Animation(ObjectBase):
     duration: int = ...
     width: int = ...
@@ -402,7 +402,7 @@ class Animation(ObjectBase):
     thumbnail: Thumbnail | None = ...
     animation: File | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Audio(ObjectBase):
     duration: int = ...
     title: str = ...
@@ -414,12 +414,12 @@ class Audio(ObjectBase):
     external_album_covers: list[Thumbnail] | None = ...
     audio: File | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Audios(ObjectBase):
     total_count: int = ...
     audios: list[Audio] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Document(ObjectBase):
     file_name: str = ...
     mime_type: str = ...
@@ -427,13 +427,13 @@ class Document(ObjectBase):
     thumbnail: Thumbnail | None = ...
     document: File | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Photo(ObjectBase):
     has_stickers: bool = ...
     minithumbnail: Minithumbnail | None = ...
     sizes: list[PhotoSize] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Sticker(ObjectBase):
     id: int = ...
     set_id: int = ...
@@ -445,7 +445,7 @@ class Sticker(ObjectBase):
     thumbnail: Thumbnail | None = ...
     sticker: File | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Video(ObjectBase):
     duration: int = ...
     width: int = ...
@@ -458,7 +458,7 @@ class Video(ObjectBase):
     thumbnail: Thumbnail | None = ...
     video: File | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class VideoNote(ObjectBase):
     duration: int = ...
     waveform: bytes = ...
@@ -468,7 +468,7 @@ class VideoNote(ObjectBase):
     speech_recognition_result: SpeechRecognitionResult | None = ...
     video: File | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class VoiceNote(ObjectBase):
     duration: int = ...
     waveform: bytes = ...
@@ -476,7 +476,7 @@ class VoiceNote(ObjectBase):
     speech_recognition_result: SpeechRecognitionResult | None = ...
     voice: File | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class AnimatedEmoji(ObjectBase):
     sticker: Sticker | None = ...
     sticker_width: int = ...
@@ -484,7 +484,7 @@ class AnimatedEmoji(ObjectBase):
     fitzpatrick_type: int = ...
     sound: File | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Contact(ObjectBase):
     phone_number: str = ...
     first_name: str = ...
@@ -492,13 +492,13 @@ class Contact(ObjectBase):
     vcard: str = ...
     user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class Location(ObjectBase):
     latitude: float = ...
     longitude: float = ...
     horizontal_accuracy: float = ...
 
-@dataclass
+@dataclass(slots=True)
 class Venue(ObjectBase):
     location: Location | None = ...
     title: str = ...
@@ -507,7 +507,7 @@ class Venue(ObjectBase):
     id: str = ...
     type: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class Game(ObjectBase):
     id: int = ...
     short_name: str = ...
@@ -517,7 +517,7 @@ class Game(ObjectBase):
     photo: Photo | None = ...
     animation: Animation | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class WebApp(ObjectBase):
     short_name: str = ...
     title: str = ...
@@ -525,7 +525,7 @@ class WebApp(ObjectBase):
     photo: Photo | None = ...
     animation: Animation | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Poll(ObjectBase):
     id: int = ...
     question: FormattedText | None = ...
@@ -538,7 +538,7 @@ class Poll(ObjectBase):
     close_date: int = ...
     is_closed: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class AlternativeVideo(ObjectBase):
     id: int = ...
     width: int = ...
@@ -547,14 +547,14 @@ class AlternativeVideo(ObjectBase):
     hls_file: File | None = ...
     video: File | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class VideoStoryboard(ObjectBase):
     storyboard_file: File | None = ...
     width: int = ...
     height: int = ...
     map_file: File | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Background(ObjectBase):
     id: int = ...
     is_default: bool = ...
@@ -563,16 +563,16 @@ class Background(ObjectBase):
     document: Document | None = ...
     type: BackgroundType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Backgrounds(ObjectBase):
     backgrounds: list[Background] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatBackground(ObjectBase):
     background: Background | None = ...
     dark_theme_dimming: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ProfilePhoto(ObjectBase):
     id: int = ...
     small: File | None = ...
@@ -581,7 +581,7 @@ class ProfilePhoto(ObjectBase):
     has_animation: bool = ...
     is_personal: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatPhotoInfo(ObjectBase):
     small: File | None = ...
     big: File | None = ...
@@ -589,32 +589,32 @@ class ChatPhotoInfo(ObjectBase):
     has_animation: bool = ...
     is_personal: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ProfileTab(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class ProfileTabPosts(ProfileTab): ...
-@dataclass
+@dataclass(slots=True)
 class ProfileTabGifts(ProfileTab): ...
-@dataclass
+@dataclass(slots=True)
 class ProfileTabMedia(ProfileTab): ...
-@dataclass
+@dataclass(slots=True)
 class ProfileTabFiles(ProfileTab): ...
-@dataclass
+@dataclass(slots=True)
 class ProfileTabLinks(ProfileTab): ...
-@dataclass
+@dataclass(slots=True)
 class ProfileTabMusic(ProfileTab): ...
-@dataclass
+@dataclass(slots=True)
 class ProfileTabVoice(ProfileTab): ...
-@dataclass
+@dataclass(slots=True)
 class ProfileTabGifs(ProfileTab): ...
-@dataclass
+@dataclass(slots=True)
 class UserType(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class UserTypeRegular(UserType): ...
-@dataclass
+@dataclass(slots=True)
 class UserTypeDeleted(UserType): ...
 
-@dataclass
+@dataclass(slots=True)
 class UserTypeBot(UserType):
     can_be_edited: bool = ...
     can_join_groups: bool = ...
@@ -628,78 +628,78 @@ class UserTypeBot(UserType):
     can_be_added_to_attachment_menu: bool = ...
     active_user_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UserTypeUnknown(UserType): ...
 
-@dataclass
+@dataclass(slots=True)
 class BotCommand(ObjectBase):
     command: str = ...
     description: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class BotCommands(ObjectBase):
     bot_user_id: int = ...
     commands: list[BotCommand] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class BotMenuButton(ObjectBase):
     text: str = ...
     url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class BotVerificationParameters(ObjectBase):
     icon_custom_emoji_id: int = ...
     organization_name: str = ...
     default_custom_description: FormattedText | None = ...
     can_set_custom_description: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class BotVerification(ObjectBase):
     bot_user_id: int = ...
     icon_custom_emoji_id: int = ...
     custom_description: FormattedText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class VerificationStatus(ObjectBase):
     is_verified: bool = ...
     is_scam: bool = ...
     is_fake: bool = ...
     bot_verification_icon_custom_emoji_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatLocation(ObjectBase):
     location: Location | None = ...
     address: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class Birthdate(ObjectBase):
     day: int = ...
     month: int = ...
     year: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CloseBirthdayUser(ObjectBase):
     user_id: int = ...
     birthdate: Birthdate | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class BusinessAwayMessageSchedule(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class BusinessAwayMessageScheduleAlways(BusinessAwayMessageSchedule): ...
-@dataclass
+@dataclass(slots=True)
 class BusinessAwayMessageScheduleOutsideOfOpeningHours(BusinessAwayMessageSchedule): ...
 
-@dataclass
+@dataclass(slots=True)
 class BusinessAwayMessageScheduleCustom(BusinessAwayMessageSchedule):
     start_date: int = ...
     end_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class BusinessLocation(ObjectBase):
     location: Location | None = ...
     address: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class BusinessRecipients(ObjectBase):
     chat_ids: list[int] | None = ...
     excluded_chat_ids: list[int] | None = ...
@@ -709,20 +709,20 @@ class BusinessRecipients(ObjectBase):
     select_non_contacts: bool = ...
     exclude_selected: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class BusinessAwayMessageSettings(ObjectBase):
     shortcut_id: int = ...
     recipients: BusinessRecipients | None = ...
     schedule: BusinessAwayMessageSchedule | None = ...
     offline_only: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class BusinessGreetingMessageSettings(ObjectBase):
     shortcut_id: int = ...
     recipients: BusinessRecipients | None = ...
     inactivity_days: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class BusinessBotRights(ObjectBase):
     can_reply: bool = ...
     can_read_messages: bool = ...
@@ -739,35 +739,35 @@ class BusinessBotRights(ObjectBase):
     can_transfer_stars: bool = ...
     can_manage_stories: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class BusinessConnectedBot(ObjectBase):
     bot_user_id: int = ...
     recipients: BusinessRecipients | None = ...
     rights: BusinessBotRights | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class BusinessStartPage(ObjectBase):
     title: str = ...
     message: str = ...
     sticker: Sticker | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputBusinessStartPage(ObjectBase):
     title: str = ...
     message: str = ...
     sticker: InputFile | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class BusinessOpeningHoursInterval(ObjectBase):
     start_minute: int = ...
     end_minute: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class BusinessOpeningHours(ObjectBase):
     time_zone_id: str = ...
     opening_hours: list[BusinessOpeningHoursInterval] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class BusinessInfo(ObjectBase):
     location: BusinessLocation | None = ...
     opening_hours: BusinessOpeningHours | None = ...
@@ -778,51 +778,51 @@ class BusinessInfo(ObjectBase):
     away_message_settings: BusinessAwayMessageSettings | None = ...
     start_page: BusinessStartPage | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class BusinessChatLink(ObjectBase):
     link: str = ...
     text: FormattedText | None = ...
     title: str = ...
     view_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class BusinessChatLinks(ObjectBase):
     links: list[BusinessChatLink] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputBusinessChatLink(ObjectBase):
     text: FormattedText | None = ...
     title: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class BusinessChatLinkInfo(ObjectBase):
     chat_id: int = ...
     text: FormattedText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatPhotoStickerType(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatPhotoStickerTypeRegularOrMask(ChatPhotoStickerType):
     sticker_set_id: int = ...
     sticker_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatPhotoStickerTypeCustomEmoji(ChatPhotoStickerType):
     custom_emoji_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatPhotoSticker(ObjectBase):
     type: ChatPhotoStickerType | None = ...
     background_fill: BackgroundFill | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class AnimatedChatPhoto(ObjectBase):
     length: int = ...
     file: File | None = ...
     main_frame_timestamp: float = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatPhoto(ObjectBase):
     id: int = ...
     added_date: int = ...
@@ -832,32 +832,32 @@ class ChatPhoto(ObjectBase):
     small_animation: AnimatedChatPhoto | None = ...
     sticker: ChatPhotoSticker | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatPhotos(ObjectBase):
     total_count: int = ...
     photos: list[ChatPhoto] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputChatPhoto(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class InputChatPhotoPrevious(InputChatPhoto):
     chat_photo_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputChatPhotoStatic(InputChatPhoto):
     photo: InputFile | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputChatPhotoAnimation(InputChatPhoto):
     animation: InputFile | None = ...
     main_frame_timestamp: float = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputChatPhotoSticker(InputChatPhoto):
     sticker: ChatPhotoSticker | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatPermissions(ObjectBase):
     can_send_basic_messages: bool = ...
     can_send_audios: bool = ...
@@ -874,7 +874,7 @@ class ChatPermissions(ObjectBase):
     can_pin_messages: bool = ...
     can_create_topics: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatAdministratorRights(ObjectBase):
     can_manage_chat: bool = ...
     can_change_info: bool = ...
@@ -893,38 +893,38 @@ class ChatAdministratorRights(ObjectBase):
     can_manage_direct_messages: bool = ...
     is_anonymous: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GiftResalePrice(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class GiftResalePriceStar(GiftResalePrice):
     star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GiftResalePriceTon(GiftResalePrice):
     toncoin_cent_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SuggestedPostPrice(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class SuggestedPostPriceStar(SuggestedPostPrice):
     star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SuggestedPostPriceTon(SuggestedPostPrice):
     toncoin_cent_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SuggestedPostState(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class SuggestedPostStatePending(SuggestedPostState): ...
-@dataclass
+@dataclass(slots=True)
 class SuggestedPostStateApproved(SuggestedPostState): ...
-@dataclass
+@dataclass(slots=True)
 class SuggestedPostStateDeclined(SuggestedPostState): ...
 
-@dataclass
+@dataclass(slots=True)
 class SuggestedPostInfo(ObjectBase):
     price: SuggestedPostPrice | None = ...
     send_date: int = ...
@@ -932,44 +932,44 @@ class SuggestedPostInfo(ObjectBase):
     can_be_approved: bool = ...
     can_be_declined: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputSuggestedPostInfo(ObjectBase):
     price: SuggestedPostPrice | None = ...
     send_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SuggestedPostRefundReason(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class SuggestedPostRefundReasonPostDeleted(SuggestedPostRefundReason): ...
-@dataclass
+@dataclass(slots=True)
 class SuggestedPostRefundReasonPaymentRefunded(SuggestedPostRefundReason): ...
 
-@dataclass
+@dataclass(slots=True)
 class StarAmount(ObjectBase):
     star_count: int = ...
     nanostar_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarSubscriptionType(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class StarSubscriptionTypeChannel(StarSubscriptionType):
     can_reuse: bool = ...
     invite_link: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarSubscriptionTypeBot(StarSubscriptionType):
     is_canceled_by_bot: bool = ...
     title: str = ...
     photo: Photo | None = ...
     invoice_link: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarSubscriptionPricing(ObjectBase):
     period: int = ...
     star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarSubscription(ObjectBase):
     id: str = ...
     chat_id: int = ...
@@ -979,64 +979,64 @@ class StarSubscription(ObjectBase):
     pricing: StarSubscriptionPricing | None = ...
     type: StarSubscriptionType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarSubscriptions(ObjectBase):
     star_amount: StarAmount | None = ...
     subscriptions: list[StarSubscription] | None = ...
     required_star_count: int = ...
     next_offset: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class AffiliateType(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class AffiliateTypeCurrentUser(AffiliateType): ...
 
-@dataclass
+@dataclass(slots=True)
 class AffiliateTypeBot(AffiliateType):
     user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AffiliateTypeChannel(AffiliateType):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AffiliateProgramSortOrder(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class AffiliateProgramSortOrderProfitability(AffiliateProgramSortOrder): ...
-@dataclass
+@dataclass(slots=True)
 class AffiliateProgramSortOrderCreationDate(AffiliateProgramSortOrder): ...
-@dataclass
+@dataclass(slots=True)
 class AffiliateProgramSortOrderRevenue(AffiliateProgramSortOrder): ...
 
-@dataclass
+@dataclass(slots=True)
 class AffiliateProgramParameters(ObjectBase):
     commission_per_mille: int = ...
     month_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AffiliateProgramInfo(ObjectBase):
     parameters: AffiliateProgramParameters | None = ...
     end_date: int = ...
     daily_revenue_per_user_amount: StarAmount | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class AffiliateInfo(ObjectBase):
     commission_per_mille: int = ...
     affiliate_chat_id: int = ...
     star_amount: StarAmount | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class FoundAffiliateProgram(ObjectBase):
     bot_user_id: int = ...
     info: AffiliateProgramInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class FoundAffiliatePrograms(ObjectBase):
     total_count: int = ...
     programs: list[FoundAffiliateProgram] | None = ...
     next_offset: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ConnectedAffiliateProgram(ObjectBase):
     url: str = ...
     bot_user_id: int = ...
@@ -1046,19 +1046,19 @@ class ConnectedAffiliateProgram(ObjectBase):
     user_count: int = ...
     revenue_star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ConnectedAffiliatePrograms(ObjectBase):
     total_count: int = ...
     programs: list[ConnectedAffiliateProgram] | None = ...
     next_offset: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ProductInfo(ObjectBase):
     title: str = ...
     description: FormattedText | None = ...
     photo: Photo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PremiumPaymentOption(ObjectBase):
     currency: str = ...
     amount: int = ...
@@ -1067,14 +1067,14 @@ class PremiumPaymentOption(ObjectBase):
     store_product_id: str = ...
     payment_link: InternalLinkType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PremiumStatePaymentOption(ObjectBase):
     payment_option: PremiumPaymentOption | None = ...
     is_current: bool = ...
     is_upgrade: bool = ...
     last_transaction_id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class PremiumGiftPaymentOption(ObjectBase):
     currency: str = ...
     amount: int = ...
@@ -1084,11 +1084,11 @@ class PremiumGiftPaymentOption(ObjectBase):
     store_product_id: str = ...
     sticker: Sticker | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PremiumGiftPaymentOptions(ObjectBase):
     options: list[PremiumGiftPaymentOption] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PremiumGiveawayPaymentOption(ObjectBase):
     currency: str = ...
     amount: int = ...
@@ -1097,11 +1097,11 @@ class PremiumGiveawayPaymentOption(ObjectBase):
     store_product_id: str = ...
     store_product_quantity: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PremiumGiveawayPaymentOptions(ObjectBase):
     options: list[PremiumGiveawayPaymentOption] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PremiumGiftCodeInfo(ObjectBase):
     creator_id: MessageSender | None = ...
     creation_date: int = ...
@@ -1112,7 +1112,7 @@ class PremiumGiftCodeInfo(ObjectBase):
     user_id: int = ...
     use_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarPaymentOption(ObjectBase):
     currency: str = ...
     amount: int = ...
@@ -1120,17 +1120,17 @@ class StarPaymentOption(ObjectBase):
     store_product_id: str = ...
     is_additional: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarPaymentOptions(ObjectBase):
     options: list[StarPaymentOption] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarGiveawayWinnerOption(ObjectBase):
     winner_count: int = ...
     won_star_count: int = ...
     is_default: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarGiveawayPaymentOption(ObjectBase):
     currency: str = ...
     amount: int = ...
@@ -1141,11 +1141,11 @@ class StarGiveawayPaymentOption(ObjectBase):
     is_default: bool = ...
     is_additional: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarGiveawayPaymentOptions(ObjectBase):
     options: list[StarGiveawayPaymentOption] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class AcceptedGiftTypes(ObjectBase):
     unlimited_gifts: bool = ...
     limited_gifts: bool = ...
@@ -1153,106 +1153,106 @@ class AcceptedGiftTypes(ObjectBase):
     gifts_from_channels: bool = ...
     premium_subscription: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GiftSettings(ObjectBase):
     show_gift_button: bool = ...
     accepted_gift_types: AcceptedGiftTypes | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GiftAuction(ObjectBase):
     id: str = ...
     gifts_per_round: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GiftBackground(ObjectBase):
     center_color: int = ...
     edge_color: int = ...
     text_color: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GiftPurchaseLimits(ObjectBase):
     total_count: int = ...
     remaining_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GiftResaleParameters(ObjectBase):
     star_count: int = ...
     toncoin_cent_count: int = ...
     toncoin_only: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GiftCollection(ObjectBase):
     id: int = ...
     name: str = ...
     icon: Sticker | None = ...
     gift_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GiftCollections(ObjectBase):
     collections: list[GiftCollection] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class CanSendGiftResult(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class CanSendGiftResultOk(CanSendGiftResult): ...
 
-@dataclass
+@dataclass(slots=True)
 class CanSendGiftResultFail(CanSendGiftResult):
     reason: FormattedText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpgradedGiftOrigin(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class UpgradedGiftOriginUpgrade(UpgradedGiftOrigin):
     gift_message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpgradedGiftOriginTransfer(UpgradedGiftOrigin): ...
 
-@dataclass
+@dataclass(slots=True)
 class UpgradedGiftOriginResale(UpgradedGiftOrigin):
     price: GiftResalePrice | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpgradedGiftOriginBlockchain(UpgradedGiftOrigin): ...
-@dataclass
+@dataclass(slots=True)
 class UpgradedGiftOriginPrepaidUpgrade(UpgradedGiftOrigin): ...
 
-@dataclass
+@dataclass(slots=True)
 class UpgradedGiftModel(ObjectBase):
     name: str = ...
     sticker: Sticker | None = ...
     rarity_per_mille: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpgradedGiftSymbol(ObjectBase):
     name: str = ...
     sticker: Sticker | None = ...
     rarity_per_mille: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpgradedGiftBackdropColors(ObjectBase):
     center_color: int = ...
     edge_color: int = ...
     symbol_color: int = ...
     text_color: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpgradedGiftBackdrop(ObjectBase):
     id: int = ...
     name: str = ...
     colors: UpgradedGiftBackdropColors | None = ...
     rarity_per_mille: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpgradedGiftOriginalDetails(ObjectBase):
     sender_id: MessageSender | None = ...
     receiver_id: MessageSender | None = ...
     text: FormattedText | None = ...
     date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpgradedGiftColors(ObjectBase):
     id: int = ...
     model_custom_emoji_id: int = ...
@@ -1262,7 +1262,7 @@ class UpgradedGiftColors(ObjectBase):
     dark_theme_accent_color: int = ...
     dark_theme_colors: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Gift(ObjectBase):
     id: int = ...
     publisher_chat_id: int = ...
@@ -1280,7 +1280,7 @@ class Gift(ObjectBase):
     first_send_date: int = ...
     last_send_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpgradedGift(ObjectBase):
     id: int = ...
     regular_gift_id: int = ...
@@ -1307,7 +1307,7 @@ class UpgradedGift(ObjectBase):
     value_currency: str = ...
     value_amount: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpgradedGiftValueInfo(ObjectBase):
     currency: str = ...
     value: int = ...
@@ -1324,7 +1324,7 @@ class UpgradedGiftValueInfo(ObjectBase):
     fragment_listed_gift_count: int = ...
     fragment_url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpgradeGiftResult(ObjectBase):
     gift: UpgradedGift | None = ...
     received_gift_id: str = ...
@@ -1336,67 +1336,67 @@ class UpgradeGiftResult(ObjectBase):
     next_resale_date: int = ...
     export_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AvailableGift(ObjectBase):
     gift: Gift | None = ...
     resale_count: int = ...
     min_resale_star_count: int = ...
     title: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class AvailableGifts(ObjectBase):
     gifts: list[AvailableGift] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GiftUpgradePrice(ObjectBase):
     date: int = ...
     star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpgradedGiftAttributeId(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class UpgradedGiftAttributeIdModel(UpgradedGiftAttributeId):
     sticker_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpgradedGiftAttributeIdSymbol(UpgradedGiftAttributeId):
     sticker_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpgradedGiftAttributeIdBackdrop(UpgradedGiftAttributeId):
     backdrop_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpgradedGiftModelCount(ObjectBase):
     model: UpgradedGiftModel | None = ...
     total_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpgradedGiftSymbolCount(ObjectBase):
     symbol: UpgradedGiftSymbol | None = ...
     total_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpgradedGiftBackdropCount(ObjectBase):
     backdrop: UpgradedGiftBackdrop | None = ...
     total_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GiftForResaleOrder(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class GiftForResaleOrderPrice(GiftForResaleOrder): ...
-@dataclass
+@dataclass(slots=True)
 class GiftForResaleOrderPriceChangeDate(GiftForResaleOrder): ...
-@dataclass
+@dataclass(slots=True)
 class GiftForResaleOrderNumber(GiftForResaleOrder): ...
 
-@dataclass
+@dataclass(slots=True)
 class GiftForResale(ObjectBase):
     gift: UpgradedGift | None = ...
     received_gift_id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GiftsForResale(ObjectBase):
     total_count: int = ...
     gifts: list[GiftForResale] | None = ...
@@ -1405,27 +1405,27 @@ class GiftsForResale(ObjectBase):
     backdrops: list[UpgradedGiftBackdropCount] | None = ...
     next_offset: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GiftResaleResult(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class GiftResaleResultOk(GiftResaleResult): ...
 
-@dataclass
+@dataclass(slots=True)
 class GiftResaleResultPriceIncreased(GiftResaleResult):
     price: GiftResalePrice | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SentGift(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class SentGiftRegular(SentGift):
     gift: Gift | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SentGiftUpgraded(SentGift):
     gift: UpgradedGift | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReceivedGift(ObjectBase):
     received_gift_id: str = ...
     sender_id: MessageSender | None = ...
@@ -1449,14 +1449,14 @@ class ReceivedGift(ObjectBase):
     export_date: int = ...
     prepaid_upgrade_hash: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReceivedGifts(ObjectBase):
     total_count: int = ...
     gifts: list[ReceivedGift] | None = ...
     are_notifications_enabled: bool = ...
     next_offset: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GiftUpgradePreview(ObjectBase):
     models: list[UpgradedGiftModel] | None = ...
     symbols: list[UpgradedGiftSymbol] | None = ...
@@ -1464,13 +1464,13 @@ class GiftUpgradePreview(ObjectBase):
     prices: list[GiftUpgradePrice] | None = ...
     next_prices: list[GiftUpgradePrice] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class AuctionBid(ObjectBase):
     star_count: int = ...
     bid_date: int = ...
     position: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UserAuctionBid(ObjectBase):
     star_count: int = ...
     bid_date: int = ...
@@ -1478,10 +1478,10 @@ class UserAuctionBid(ObjectBase):
     owner_id: MessageSender | None = ...
     was_returned: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class AuctionState(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class AuctionStateActive(AuctionState):
     start_date: int = ...
     end_date: int = ...
@@ -1495,19 +1495,19 @@ class AuctionStateActive(AuctionState):
     acquired_item_count: int = ...
     user_bid: UserAuctionBid | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class AuctionStateFinished(AuctionState):
     start_date: int = ...
     end_date: int = ...
     average_price: int = ...
     acquired_item_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GiftAuctionState(ObjectBase):
     gift: Gift | None = ...
     state: AuctionState | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GiftAuctionAcquiredGift(ObjectBase):
     receiver_id: MessageSender | None = ...
     date: int = ...
@@ -1517,91 +1517,91 @@ class GiftAuctionAcquiredGift(ObjectBase):
     text: FormattedText | None = ...
     is_private: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GiftAuctionAcquiredGifts(ObjectBase):
     gifts: list[GiftAuctionAcquiredGift] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class TransactionDirection(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class TransactionDirectionIncoming(TransactionDirection): ...
-@dataclass
+@dataclass(slots=True)
 class TransactionDirectionOutgoing(TransactionDirection): ...
-@dataclass
+@dataclass(slots=True)
 class StarTransactionType(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypePremiumBotDeposit(StarTransactionType): ...
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeAppStoreDeposit(StarTransactionType): ...
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeGooglePlayDeposit(StarTransactionType): ...
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeFragmentDeposit(StarTransactionType): ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeUserDeposit(StarTransactionType):
     user_id: int = ...
     sticker: Sticker | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeGiveawayDeposit(StarTransactionType):
     chat_id: int = ...
     giveaway_message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeFragmentWithdrawal(StarTransactionType):
     withdrawal_state: RevenueWithdrawalState | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeTelegramAdsWithdrawal(StarTransactionType): ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeTelegramApiUsage(StarTransactionType):
     request_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeBotPaidMediaPurchase(StarTransactionType):
     user_id: int = ...
     media: list[PaidMedia] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeBotPaidMediaSale(StarTransactionType):
     user_id: int = ...
     media: list[PaidMedia] | None = ...
     payload: str = ...
     affiliate: AffiliateInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeChannelPaidMediaPurchase(StarTransactionType):
     chat_id: int = ...
     message_id: int = ...
     media: list[PaidMedia] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeChannelPaidMediaSale(StarTransactionType):
     user_id: int = ...
     message_id: int = ...
     media: list[PaidMedia] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeBotInvoicePurchase(StarTransactionType):
     user_id: int = ...
     product_info: ProductInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeBotInvoiceSale(StarTransactionType):
     user_id: int = ...
     product_info: ProductInfo | None = ...
     invoice_payload: bytes = ...
     affiliate: AffiliateInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeBotSubscriptionPurchase(StarTransactionType):
     user_id: int = ...
     subscription_period: int = ...
     product_info: ProductInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeBotSubscriptionSale(StarTransactionType):
     user_id: int = ...
     subscription_period: int = ...
@@ -1609,138 +1609,138 @@ class StarTransactionTypeBotSubscriptionSale(StarTransactionType):
     invoice_payload: bytes = ...
     affiliate: AffiliateInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeChannelSubscriptionPurchase(StarTransactionType):
     chat_id: int = ...
     subscription_period: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeChannelSubscriptionSale(StarTransactionType):
     user_id: int = ...
     subscription_period: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeGiftAuctionBid(StarTransactionType):
     owner_id: MessageSender | None = ...
     gift: Gift | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeGiftPurchase(StarTransactionType):
     owner_id: MessageSender | None = ...
     gift: Gift | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeGiftTransfer(StarTransactionType):
     owner_id: MessageSender | None = ...
     gift: UpgradedGift | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeGiftOriginalDetailsDrop(StarTransactionType):
     owner_id: MessageSender | None = ...
     gift: UpgradedGift | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeGiftSale(StarTransactionType):
     user_id: int = ...
     gift: Gift | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeGiftUpgrade(StarTransactionType):
     user_id: int = ...
     gift: UpgradedGift | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeGiftUpgradePurchase(StarTransactionType):
     owner_id: MessageSender | None = ...
     gift: Gift | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeUpgradedGiftPurchase(StarTransactionType):
     user_id: int = ...
     gift: UpgradedGift | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeUpgradedGiftSale(StarTransactionType):
     user_id: int = ...
     gift: UpgradedGift | None = ...
     commission_per_mille: int = ...
     commission_star_amount: StarAmount | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeChannelPaidReactionSend(StarTransactionType):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeChannelPaidReactionReceive(StarTransactionType):
     user_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeAffiliateProgramCommission(StarTransactionType):
     chat_id: int = ...
     commission_per_mille: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypePaidMessageSend(StarTransactionType):
     chat_id: int = ...
     message_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypePaidMessageReceive(StarTransactionType):
     sender_id: MessageSender | None = ...
     message_count: int = ...
     commission_per_mille: int = ...
     commission_star_amount: StarAmount | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypePaidGroupCallMessageSend(StarTransactionType):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypePaidGroupCallMessageReceive(StarTransactionType):
     sender_id: MessageSender | None = ...
     commission_per_mille: int = ...
     commission_star_amount: StarAmount | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypePaidGroupCallReactionSend(StarTransactionType):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypePaidGroupCallReactionReceive(StarTransactionType):
     sender_id: MessageSender | None = ...
     commission_per_mille: int = ...
     commission_star_amount: StarAmount | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeSuggestedPostPaymentSend(StarTransactionType):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeSuggestedPostPaymentReceive(StarTransactionType):
     user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypePremiumPurchase(StarTransactionType):
     user_id: int = ...
     month_count: int = ...
     sticker: Sticker | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeBusinessBotTransferSend(StarTransactionType):
     user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeBusinessBotTransferReceive(StarTransactionType):
     user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypePublicPostSearch(StarTransactionType): ...
-@dataclass
+@dataclass(slots=True)
 class StarTransactionTypeUnsupported(StarTransactionType): ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransaction(ObjectBase):
     id: str = ...
     star_amount: StarAmount | None = ...
@@ -1748,40 +1748,40 @@ class StarTransaction(ObjectBase):
     date: int = ...
     type: StarTransactionType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarTransactions(ObjectBase):
     star_amount: StarAmount | None = ...
     transactions: list[StarTransaction] | None = ...
     next_offset: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class TonTransactionType(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class TonTransactionTypeFragmentDeposit(TonTransactionType):
     is_gift: bool = ...
     sticker: Sticker | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class TonTransactionTypeSuggestedPostPayment(TonTransactionType):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class TonTransactionTypeUpgradedGiftPurchase(TonTransactionType):
     user_id: int = ...
     gift: UpgradedGift | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class TonTransactionTypeUpgradedGiftSale(TonTransactionType):
     user_id: int = ...
     gift: UpgradedGift | None = ...
     commission_per_mille: int = ...
     commission_toncoin_amount: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class TonTransactionTypeUnsupported(TonTransactionType): ...
 
-@dataclass
+@dataclass(slots=True)
 class TonTransaction(ObjectBase):
     id: str = ...
     ton_amount: int = ...
@@ -1789,52 +1789,52 @@ class TonTransaction(ObjectBase):
     date: int = ...
     type: TonTransactionType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class TonTransactions(ObjectBase):
     ton_amount: int = ...
     transactions: list[TonTransaction] | None = ...
     next_offset: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ActiveStoryState(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class ActiveStoryStateLive(ActiveStoryState):
     story_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ActiveStoryStateUnread(ActiveStoryState): ...
-@dataclass
+@dataclass(slots=True)
 class ActiveStoryStateRead(ActiveStoryState): ...
-@dataclass
+@dataclass(slots=True)
 class GiveawayParticipantStatus(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class GiveawayParticipantStatusEligible(GiveawayParticipantStatus): ...
-@dataclass
+@dataclass(slots=True)
 class GiveawayParticipantStatusParticipating(GiveawayParticipantStatus): ...
 
-@dataclass
+@dataclass(slots=True)
 class GiveawayParticipantStatusAlreadyWasMember(GiveawayParticipantStatus):
     joined_chat_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GiveawayParticipantStatusAdministrator(GiveawayParticipantStatus):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GiveawayParticipantStatusDisallowedCountry(GiveawayParticipantStatus):
     user_country_code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GiveawayInfo(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class GiveawayInfoOngoing(GiveawayInfo):
     creation_date: int = ...
     status: GiveawayParticipantStatus | None = ...
     is_ended: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GiveawayInfoCompleted(GiveawayInfo):
     creation_date: int = ...
     actual_winners_selection_date: int = ...
@@ -1845,18 +1845,18 @@ class GiveawayInfoCompleted(GiveawayInfo):
     gift_code: str = ...
     won_star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GiveawayPrize(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class GiveawayPrizePremium(GiveawayPrize):
     month_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GiveawayPrizeStars(GiveawayPrize):
     star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AccentColor(ObjectBase):
     id: int = ...
     built_in_accent_color_id: int = ...
@@ -1864,13 +1864,13 @@ class AccentColor(ObjectBase):
     dark_theme_colors: list[int] | None = ...
     min_channel_chat_boost_level: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ProfileAccentColors(ObjectBase):
     palette_colors: list[int] | None = ...
     background_colors: list[int] | None = ...
     story_colors: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ProfileAccentColor(ObjectBase):
     id: int = ...
     light_theme_colors: ProfileAccentColors | None = ...
@@ -1878,7 +1878,7 @@ class ProfileAccentColor(ObjectBase):
     min_supergroup_chat_boost_level: int = ...
     min_channel_chat_boost_level: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UserRating(ObjectBase):
     level: int = ...
     is_maximum_level_reached: bool = ...
@@ -1886,19 +1886,19 @@ class UserRating(ObjectBase):
     current_level_rating: int = ...
     next_level_rating: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class RestrictionInfo(ObjectBase):
     restriction_reason: str = ...
     has_sensitive_content: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class EmojiStatusType(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class EmojiStatusTypeCustomEmoji(EmojiStatusType):
     custom_emoji_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class EmojiStatusTypeUpgradedGift(EmojiStatusType):
     upgraded_gift_id: int = ...
     gift_title: str = ...
@@ -1907,27 +1907,27 @@ class EmojiStatusTypeUpgradedGift(EmojiStatusType):
     symbol_custom_emoji_id: int = ...
     backdrop_colors: UpgradedGiftBackdropColors | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EmojiStatus(ObjectBase):
     type: EmojiStatusType | None = ...
     expiration_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class EmojiStatuses(ObjectBase):
     emoji_statuses: list[EmojiStatus] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EmojiStatusCustomEmojis(ObjectBase):
     custom_emoji_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Usernames(ObjectBase):
     active_usernames: list[str] | None = ...
     disabled_usernames: list[str] | None = ...
     editable_username: str = ...
     collectible_usernames: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class User(ObjectBase):
     id: int = ...
     first_name: str = ...
@@ -1957,7 +1957,7 @@ class User(ObjectBase):
     language_code: str = ...
     added_to_attachment_menu: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class BotInfo(ObjectBase):
     short_description: str = ...
     description: str = ...
@@ -1982,7 +1982,7 @@ class BotInfo(ObjectBase):
     edit_description_media_link: InternalLinkType | None = ...
     edit_settings_link: InternalLinkType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UserFullInfo(ObjectBase):
     personal_photo: ChatPhoto | None = ...
     photo: ChatPhoto | None = ...
@@ -2015,122 +2015,122 @@ class UserFullInfo(ObjectBase):
     business_info: BusinessInfo | None = ...
     bot_info: BotInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Users(ObjectBase):
     total_count: int = ...
     user_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class FoundUsers(ObjectBase):
     user_ids: list[int] | None = ...
     next_offset: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatAdministrator(ObjectBase):
     user_id: int = ...
     custom_title: str = ...
     is_owner: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatAdministrators(ObjectBase):
     administrators: list[ChatAdministrator] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatMemberStatus(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatMemberStatusCreator(ChatMemberStatus):
     custom_title: str = ...
     is_anonymous: bool = ...
     is_member: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatMemberStatusAdministrator(ChatMemberStatus):
     custom_title: str = ...
     can_be_edited: bool = ...
     rights: ChatAdministratorRights | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatMemberStatusMember(ChatMemberStatus):
     member_until_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatMemberStatusRestricted(ChatMemberStatus):
     is_member: bool = ...
     restricted_until_date: int = ...
     permissions: ChatPermissions | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatMemberStatusLeft(ChatMemberStatus): ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatMemberStatusBanned(ChatMemberStatus):
     banned_until_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatMember(ObjectBase):
     member_id: MessageSender | None = ...
     inviter_user_id: int = ...
     joined_chat_date: int = ...
     status: ChatMemberStatus | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatMembers(ObjectBase):
     total_count: int = ...
     members: list[ChatMember] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatMembersFilter(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class ChatMembersFilterContacts(ChatMembersFilter): ...
-@dataclass
+@dataclass(slots=True)
 class ChatMembersFilterAdministrators(ChatMembersFilter): ...
-@dataclass
+@dataclass(slots=True)
 class ChatMembersFilterMembers(ChatMembersFilter): ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatMembersFilterMention(ChatMembersFilter):
     topic_id: MessageTopic | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatMembersFilterRestricted(ChatMembersFilter): ...
-@dataclass
+@dataclass(slots=True)
 class ChatMembersFilterBanned(ChatMembersFilter): ...
-@dataclass
+@dataclass(slots=True)
 class ChatMembersFilterBots(ChatMembersFilter): ...
-@dataclass
+@dataclass(slots=True)
 class SupergroupMembersFilter(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class SupergroupMembersFilterRecent(SupergroupMembersFilter): ...
 
-@dataclass
+@dataclass(slots=True)
 class SupergroupMembersFilterContacts(SupergroupMembersFilter):
     query: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SupergroupMembersFilterAdministrators(SupergroupMembersFilter): ...
 
-@dataclass
+@dataclass(slots=True)
 class SupergroupMembersFilterSearch(SupergroupMembersFilter):
     query: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SupergroupMembersFilterRestricted(SupergroupMembersFilter):
     query: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SupergroupMembersFilterBanned(SupergroupMembersFilter):
     query: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SupergroupMembersFilterMention(SupergroupMembersFilter):
     query: str = ...
     topic_id: MessageTopic | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SupergroupMembersFilterBots(SupergroupMembersFilter): ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatInviteLink(ObjectBase):
     invite_link: str = ...
     name: str = ...
@@ -2147,49 +2147,49 @@ class ChatInviteLink(ObjectBase):
     is_primary: bool = ...
     is_revoked: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatInviteLinks(ObjectBase):
     total_count: int = ...
     invite_links: list[ChatInviteLink] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatInviteLinkCount(ObjectBase):
     user_id: int = ...
     invite_link_count: int = ...
     revoked_invite_link_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatInviteLinkCounts(ObjectBase):
     invite_link_counts: list[ChatInviteLinkCount] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatInviteLinkMember(ObjectBase):
     user_id: int = ...
     joined_chat_date: int = ...
     via_chat_folder_invite_link: bool = ...
     approver_user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatInviteLinkMembers(ObjectBase):
     total_count: int = ...
     members: list[ChatInviteLinkMember] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InviteLinkChatType(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class InviteLinkChatTypeBasicGroup(InviteLinkChatType): ...
-@dataclass
+@dataclass(slots=True)
 class InviteLinkChatTypeSupergroup(InviteLinkChatType): ...
-@dataclass
+@dataclass(slots=True)
 class InviteLinkChatTypeChannel(InviteLinkChatType): ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatInviteLinkSubscriptionInfo(ObjectBase):
     pricing: StarSubscriptionPricing | None = ...
     can_reuse: bool = ...
     form_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatInviteLinkInfo(ObjectBase):
     chat_id: int = ...
     accessible_for: int = ...
@@ -2205,23 +2205,23 @@ class ChatInviteLinkInfo(ObjectBase):
     is_public: bool = ...
     verification_status: VerificationStatus | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatJoinRequest(ObjectBase):
     user_id: int = ...
     date: int = ...
     bio: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatJoinRequests(ObjectBase):
     total_count: int = ...
     requests: list[ChatJoinRequest] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatJoinRequestsInfo(ObjectBase):
     total_count: int = ...
     user_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class BasicGroup(ObjectBase):
     id: int = ...
     member_count: int = ...
@@ -2229,7 +2229,7 @@ class BasicGroup(ObjectBase):
     is_active: bool = ...
     upgraded_to_supergroup_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class BasicGroupFullInfo(ObjectBase):
     photo: ChatPhoto | None = ...
     description: str = ...
@@ -2240,7 +2240,7 @@ class BasicGroupFullInfo(ObjectBase):
     invite_link: ChatInviteLink | None = ...
     bot_commands: list[BotCommands] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Supergroup(ObjectBase):
     id: int = ...
     usernames: Usernames | None = ...
@@ -2268,7 +2268,7 @@ class Supergroup(ObjectBase):
     paid_message_star_count: int = ...
     active_story_state: ActiveStoryState | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SupergroupFullInfo(ObjectBase):
     photo: ChatPhoto | None = ...
     description: str = ...
@@ -2311,16 +2311,16 @@ class SupergroupFullInfo(ObjectBase):
     upgraded_from_basic_group_id: int = ...
     upgraded_from_max_message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SecretChatState(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class SecretChatStatePending(SecretChatState): ...
-@dataclass
+@dataclass(slots=True)
 class SecretChatStateReady(SecretChatState): ...
-@dataclass
+@dataclass(slots=True)
 class SecretChatStateClosed(SecretChatState): ...
 
-@dataclass
+@dataclass(slots=True)
 class SecretChat(ObjectBase):
     id: int = ...
     user_id: int = ...
@@ -2329,7 +2329,7 @@ class SecretChat(ObjectBase):
     key_hash: bytes = ...
     layer: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PublicPostSearchLimits(ObjectBase):
     daily_free_query_count: int = ...
     remaining_free_query_count: int = ...
@@ -2337,79 +2337,79 @@ class PublicPostSearchLimits(ObjectBase):
     star_count: int = ...
     is_current_query_free: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageSender(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageSenderUser(MessageSender):
     user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageSenderChat(MessageSender):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageSenders(ObjectBase):
     total_count: int = ...
     senders: list[MessageSender] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessageSender(ObjectBase):
     sender: MessageSender | None = ...
     needs_premium: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessageSenders(ObjectBase):
     senders: list[ChatMessageSender] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageReadDate(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageReadDateRead(MessageReadDate):
     read_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageReadDateUnread(MessageReadDate): ...
-@dataclass
+@dataclass(slots=True)
 class MessageReadDateTooOld(MessageReadDate): ...
-@dataclass
+@dataclass(slots=True)
 class MessageReadDateUserPrivacyRestricted(MessageReadDate): ...
-@dataclass
+@dataclass(slots=True)
 class MessageReadDateMyPrivacyRestricted(MessageReadDate): ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageViewer(ObjectBase):
     user_id: int = ...
     view_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageViewers(ObjectBase):
     viewers: list[MessageViewer] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageOrigin(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageOriginUser(MessageOrigin):
     sender_user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageOriginHiddenUser(MessageOrigin):
     sender_name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageOriginChat(MessageOrigin):
     sender_chat_id: int = ...
     author_signature: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageOriginChannel(MessageOrigin):
     chat_id: int = ...
     message_id: int = ...
     author_signature: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ForwardSource(ObjectBase):
     chat_id: int = ...
     message_id: int = ...
@@ -2418,31 +2418,31 @@ class ForwardSource(ObjectBase):
     date: int = ...
     is_outgoing: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReactionType(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class ReactionTypeEmoji(ReactionType):
     emoji: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReactionTypeCustomEmoji(ReactionType):
     custom_emoji_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReactionTypePaid(ReactionType): ...
-@dataclass
+@dataclass(slots=True)
 class PaidReactionType(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class PaidReactionTypeRegular(PaidReactionType): ...
-@dataclass
+@dataclass(slots=True)
 class PaidReactionTypeAnonymous(PaidReactionType): ...
 
-@dataclass
+@dataclass(slots=True)
 class PaidReactionTypeChat(PaidReactionType):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PaidReactor(ObjectBase):
     sender_id: MessageSender | None = ...
     star_count: int = ...
@@ -2450,24 +2450,24 @@ class PaidReactor(ObjectBase):
     is_me: bool = ...
     is_anonymous: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class LiveStoryDonors(ObjectBase):
     total_star_count: int = ...
     top_donors: list[PaidReactor] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageForwardInfo(ObjectBase):
     origin: MessageOrigin | None = ...
     date: int = ...
     source: ForwardSource | None = ...
     public_service_announcement_type: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageImportInfo(ObjectBase):
     sender_name: str = ...
     date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageReplyInfo(ObjectBase):
     reply_count: int = ...
     recent_replier_ids: list[MessageSender] | None = ...
@@ -2475,7 +2475,7 @@ class MessageReplyInfo(ObjectBase):
     last_read_outbox_message_id: int = ...
     last_message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageReaction(ObjectBase):
     type: ReactionType | None = ...
     total_count: int = ...
@@ -2483,58 +2483,58 @@ class MessageReaction(ObjectBase):
     used_sender_id: MessageSender | None = ...
     recent_sender_ids: list[MessageSender] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageReactions(ObjectBase):
     reactions: list[MessageReaction] | None = ...
     are_tags: bool = ...
     paid_reactors: list[PaidReactor] | None = ...
     can_get_added_reactions: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageInteractionInfo(ObjectBase):
     view_count: int = ...
     forward_count: int = ...
     reply_info: MessageReplyInfo | None = ...
     reactions: MessageReactions | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UnreadReaction(ObjectBase):
     type: ReactionType | None = ...
     sender_id: MessageSender | None = ...
     is_big: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageTopic(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageTopicThread(MessageTopic):
     message_thread_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageTopicForum(MessageTopic):
     forum_topic_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageTopicDirectMessages(MessageTopic):
     direct_messages_chat_topic_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageTopicSavedMessages(MessageTopic):
     saved_messages_topic_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageEffectType(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageEffectTypeEmojiReaction(MessageEffectType):
     select_animation: Sticker | None = ...
     effect_animation: Sticker | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageEffectTypePremiumSticker(MessageEffectType):
     sticker: Sticker | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageEffect(ObjectBase):
     id: int = ...
     static_icon: Sticker | None = ...
@@ -2542,14 +2542,14 @@ class MessageEffect(ObjectBase):
     is_premium: bool = ...
     type: MessageEffectType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageSendingState(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageSendingStatePending(MessageSendingState):
     sending_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageSendingStateFailed(MessageSendingState):
     error: Error | None = ...
     can_retry: bool = ...
@@ -2559,21 +2559,21 @@ class MessageSendingStateFailed(MessageSendingState):
     required_paid_message_star_count: int = ...
     retry_after: float = ...
 
-@dataclass
+@dataclass(slots=True)
 class TextQuote(ObjectBase):
     text: FormattedText | None = ...
     position: int = ...
     is_manual: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputTextQuote(ObjectBase):
     text: FormattedText | None = ...
     position: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageReplyTo(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageReplyToMessage(MessageReplyTo):
     chat_id: int = ...
     message_id: int = ...
@@ -2583,38 +2583,38 @@ class MessageReplyToMessage(MessageReplyTo):
     origin_send_date: int = ...
     content: MessageContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageReplyToStory(MessageReplyTo):
     story_poster_chat_id: int = ...
     story_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputMessageReplyTo(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class InputMessageReplyToMessage(InputMessageReplyTo):
     message_id: int = ...
     quote: InputTextQuote | None = ...
     checklist_task_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputMessageReplyToExternalMessage(InputMessageReplyTo):
     chat_id: int = ...
     message_id: int = ...
     quote: InputTextQuote | None = ...
     checklist_task_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputMessageReplyToStory(InputMessageReplyTo):
     story_poster_chat_id: int = ...
     story_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class FactCheck(ObjectBase):
     text: FormattedText | None = ...
     country_code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class Message(ObjectBase):
     id: int = ...
     sender_id: MessageSender | None = ...
@@ -2654,92 +2654,92 @@ class Message(ObjectBase):
     content: MessageContent | None = ...
     reply_markup: ReplyMarkup | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Messages(ObjectBase):
     total_count: int = ...
     messages: list[Message] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class FoundMessages(ObjectBase):
     total_count: int = ...
     messages: list[Message] | None = ...
     next_offset: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class FoundChatMessages(ObjectBase):
     total_count: int = ...
     messages: list[Message] | None = ...
     next_from_message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class FoundPublicPosts(ObjectBase):
     messages: list[Message] | None = ...
     next_offset: str = ...
     search_limits: PublicPostSearchLimits | None = ...
     are_limits_exceeded: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessagePosition(ObjectBase):
     position: int = ...
     message_id: int = ...
     date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessagePositions(ObjectBase):
     total_count: int = ...
     positions: list[MessagePosition] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageCalendarDay(ObjectBase):
     total_count: int = ...
     message: Message | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageCalendar(ObjectBase):
     total_count: int = ...
     days: list[MessageCalendarDay] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class BusinessMessage(ObjectBase):
     message: Message | None = ...
     reply_to_message: Message | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class BusinessMessages(ObjectBase):
     messages: list[BusinessMessage] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageSource(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class MessageSourceChatHistory(MessageSource): ...
-@dataclass
+@dataclass(slots=True)
 class MessageSourceMessageThreadHistory(MessageSource): ...
-@dataclass
+@dataclass(slots=True)
 class MessageSourceForumTopicHistory(MessageSource): ...
-@dataclass
+@dataclass(slots=True)
 class MessageSourceDirectMessagesChatTopicHistory(MessageSource): ...
-@dataclass
+@dataclass(slots=True)
 class MessageSourceHistoryPreview(MessageSource): ...
-@dataclass
+@dataclass(slots=True)
 class MessageSourceChatList(MessageSource): ...
-@dataclass
+@dataclass(slots=True)
 class MessageSourceSearch(MessageSource): ...
-@dataclass
+@dataclass(slots=True)
 class MessageSourceChatEventLog(MessageSource): ...
-@dataclass
+@dataclass(slots=True)
 class MessageSourceNotification(MessageSource): ...
-@dataclass
+@dataclass(slots=True)
 class MessageSourceScreenshot(MessageSource): ...
-@dataclass
+@dataclass(slots=True)
 class MessageSourceOther(MessageSource): ...
 
-@dataclass
+@dataclass(slots=True)
 class AdvertisementSponsor(ObjectBase):
     url: str = ...
     photo: Photo | None = ...
     info: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SponsoredMessage(ObjectBase):
     message_id: int = ...
     is_recommended: bool = ...
@@ -2752,23 +2752,23 @@ class SponsoredMessage(ObjectBase):
     background_custom_emoji_id: int = ...
     additional_info: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SponsoredMessages(ObjectBase):
     messages: list[SponsoredMessage] | None = ...
     messages_between: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SponsoredChat(ObjectBase):
     unique_id: int = ...
     chat_id: int = ...
     sponsor_info: str = ...
     additional_info: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SponsoredChats(ObjectBase):
     chats: list[SponsoredChat] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class VideoMessageAdvertisement(ObjectBase):
     unique_id: int = ...
     text: str = ...
@@ -2779,35 +2779,35 @@ class VideoMessageAdvertisement(ObjectBase):
     title: str = ...
     additional_info: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class VideoMessageAdvertisements(ObjectBase):
     advertisements: list[VideoMessageAdvertisement] | None = ...
     start_delay: int = ...
     between_delay: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReportOption(ObjectBase):
     id: bytes = ...
     text: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReportSponsoredResult(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class ReportSponsoredResultOk(ReportSponsoredResult): ...
-@dataclass
+@dataclass(slots=True)
 class ReportSponsoredResultFailed(ReportSponsoredResult): ...
 
-@dataclass
+@dataclass(slots=True)
 class ReportSponsoredResultOptionRequired(ReportSponsoredResult):
     title: str = ...
     options: list[ReportOption] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReportSponsoredResultAdsHidden(ReportSponsoredResult): ...
-@dataclass
+@dataclass(slots=True)
 class ReportSponsoredResultPremiumRequired(ReportSponsoredResult): ...
 
-@dataclass
+@dataclass(slots=True)
 class FileDownload(ObjectBase):
     file_id: int = ...
     message: Message | None = ...
@@ -2815,28 +2815,28 @@ class FileDownload(ObjectBase):
     complete_date: int = ...
     is_paused: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class DownloadedFileCounts(ObjectBase):
     active_count: int = ...
     paused_count: int = ...
     completed_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class FoundFileDownloads(ObjectBase):
     total_counts: DownloadedFileCounts | None = ...
     files: list[FileDownload] | None = ...
     next_offset: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class NotificationSettingsScope(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class NotificationSettingsScopePrivateChats(NotificationSettingsScope): ...
-@dataclass
+@dataclass(slots=True)
 class NotificationSettingsScopeGroupChats(NotificationSettingsScope): ...
-@dataclass
+@dataclass(slots=True)
 class NotificationSettingsScopeChannelChats(NotificationSettingsScope): ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatNotificationSettings(ObjectBase):
     use_default_mute_for: bool = ...
     mute_for: int = ...
@@ -2855,7 +2855,7 @@ class ChatNotificationSettings(ObjectBase):
     use_default_disable_mention_notifications: bool = ...
     disable_mention_notifications: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ScopeNotificationSettings(ObjectBase):
     mute_for: int = ...
     sound_id: int = ...
@@ -2867,23 +2867,23 @@ class ScopeNotificationSettings(ObjectBase):
     disable_pinned_message_notifications: bool = ...
     disable_mention_notifications: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReactionNotificationSource(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class ReactionNotificationSourceNone(ReactionNotificationSource): ...
-@dataclass
+@dataclass(slots=True)
 class ReactionNotificationSourceContacts(ReactionNotificationSource): ...
-@dataclass
+@dataclass(slots=True)
 class ReactionNotificationSourceAll(ReactionNotificationSource): ...
 
-@dataclass
+@dataclass(slots=True)
 class ReactionNotificationSettings(ObjectBase):
     message_reaction_source: ReactionNotificationSource | None = ...
     story_reaction_source: ReactionNotificationSource | None = ...
     sound_id: int = ...
     show_preview: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class DraftMessage(ObjectBase):
     reply_to: InputMessageReplyTo | None = ...
     date: int = ...
@@ -2891,37 +2891,37 @@ class DraftMessage(ObjectBase):
     effect_id: int = ...
     suggested_post_info: InputSuggestedPostInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatType(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatTypePrivate(ChatType):
     user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatTypeBasicGroup(ChatType):
     basic_group_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatTypeSupergroup(ChatType):
     supergroup_id: int = ...
     is_channel: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatTypeSecret(ChatType):
     secret_chat_id: int = ...
     user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatFolderIcon(ObjectBase):
     name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatFolderName(ObjectBase):
     text: FormattedText | None = ...
     animate_custom_emoji: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatFolder(ObjectBase):
     name: ChatFolderName | None = ...
     icon: ChatFolderIcon | None = ...
@@ -2939,7 +2939,7 @@ class ChatFolder(ObjectBase):
     include_groups: bool = ...
     include_channels: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatFolderInfo(ObjectBase):
     id: int = ...
     name: ChatFolderName | None = ...
@@ -2948,105 +2948,105 @@ class ChatFolderInfo(ObjectBase):
     is_shareable: bool = ...
     has_my_invite_links: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatFolderInviteLink(ObjectBase):
     invite_link: str = ...
     name: str = ...
     chat_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatFolderInviteLinks(ObjectBase):
     invite_links: list[ChatFolderInviteLink] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatFolderInviteLinkInfo(ObjectBase):
     chat_folder_info: ChatFolderInfo | None = ...
     missing_chat_ids: list[int] | None = ...
     added_chat_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class RecommendedChatFolder(ObjectBase):
     folder: ChatFolder | None = ...
     description: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class RecommendedChatFolders(ObjectBase):
     chat_folders: list[RecommendedChatFolder] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ArchiveChatListSettings(ObjectBase):
     archive_and_mute_new_chats_from_unknown_users: bool = ...
     keep_unmuted_chats_archived: bool = ...
     keep_chats_from_folders_archived: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatList(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class ChatListMain(ChatList): ...
-@dataclass
+@dataclass(slots=True)
 class ChatListArchive(ChatList): ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatListFolder(ChatList):
     chat_folder_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatLists(ObjectBase):
     chat_lists: list[ChatList] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatSource(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class ChatSourceMtprotoProxy(ChatSource): ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatSourcePublicServiceAnnouncement(ChatSource):
     type: str = ...
     text: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatPosition(ObjectBase):
     list_: ChatList | None = ...
     order: int = ...
     is_pinned: bool = ...
     source: ChatSource | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatAvailableReactions(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatAvailableReactionsAll(ChatAvailableReactions):
     max_reaction_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatAvailableReactionsSome(ChatAvailableReactions):
     reactions: list[ReactionType] | None = ...
     max_reaction_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SavedMessagesTag(ObjectBase):
     tag: ReactionType | None = ...
     label: str = ...
     count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SavedMessagesTags(ObjectBase):
     tags: list[SavedMessagesTag] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class BusinessBotManageBar(ObjectBase):
     bot_user_id: int = ...
     manage_url: str = ...
     is_bot_paused: bool = ...
     can_bot_reply: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class VideoChat(ObjectBase):
     group_call_id: int = ...
     has_participants: bool = ...
     default_participant_id: MessageSender | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Chat(ObjectBase):
     id: int = ...
     type: ChatType | None = ...
@@ -3091,34 +3091,34 @@ class Chat(ObjectBase):
     draft_message: DraftMessage | None = ...
     client_data: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class Chats(ObjectBase):
     total_count: int = ...
     chat_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class FailedToAddMember(ObjectBase):
     user_id: int = ...
     premium_would_allow_invite: bool = ...
     premium_required_to_send_messages: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class FailedToAddMembers(ObjectBase):
     failed_to_add_members: list[FailedToAddMember] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class CreatedBasicGroupChat(ObjectBase):
     chat_id: int = ...
     failed_to_add_members: FailedToAddMembers | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PublicChatType(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class PublicChatTypeHasUsername(PublicChatType): ...
-@dataclass
+@dataclass(slots=True)
 class PublicChatTypeIsLocationBased(PublicChatType): ...
 
-@dataclass
+@dataclass(slots=True)
 class AccountInfo(ObjectBase):
     registration_month: int = ...
     registration_year: int = ...
@@ -3126,47 +3126,47 @@ class AccountInfo(ObjectBase):
     last_name_change_date: int = ...
     last_photo_change_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatActionBar(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatActionBarReportSpam(ChatActionBar):
     can_unarchive: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatActionBarInviteMembers(ChatActionBar): ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatActionBarReportAddBlock(ChatActionBar):
     can_unarchive: bool = ...
     account_info: AccountInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatActionBarAddContact(ChatActionBar): ...
-@dataclass
+@dataclass(slots=True)
 class ChatActionBarSharePhoneNumber(ChatActionBar): ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatActionBarJoinRequest(ChatActionBar):
     title: str = ...
     is_channel: bool = ...
     request_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class KeyboardButtonType(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class KeyboardButtonTypeText(KeyboardButtonType): ...
-@dataclass
+@dataclass(slots=True)
 class KeyboardButtonTypeRequestPhoneNumber(KeyboardButtonType): ...
-@dataclass
+@dataclass(slots=True)
 class KeyboardButtonTypeRequestLocation(KeyboardButtonType): ...
 
-@dataclass
+@dataclass(slots=True)
 class KeyboardButtonTypeRequestPoll(KeyboardButtonType):
     force_regular: bool = ...
     force_quiz: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class KeyboardButtonTypeRequestUsers(KeyboardButtonType):
     id: int = ...
     restrict_user_is_bot: bool = ...
@@ -3178,7 +3178,7 @@ class KeyboardButtonTypeRequestUsers(KeyboardButtonType):
     request_username: bool = ...
     request_photo: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class KeyboardButtonTypeRequestChat(KeyboardButtonType):
     id: int = ...
     chat_is_channel: bool = ...
@@ -3194,77 +3194,77 @@ class KeyboardButtonTypeRequestChat(KeyboardButtonType):
     request_username: bool = ...
     request_photo: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class KeyboardButtonTypeWebApp(KeyboardButtonType):
     url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class KeyboardButton(ObjectBase):
     text: str = ...
     type: KeyboardButtonType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineKeyboardButtonType(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineKeyboardButtonTypeUrl(InlineKeyboardButtonType):
     url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineKeyboardButtonTypeLoginUrl(InlineKeyboardButtonType):
     url: str = ...
     id: int = ...
     forward_text: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineKeyboardButtonTypeWebApp(InlineKeyboardButtonType):
     url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineKeyboardButtonTypeCallback(InlineKeyboardButtonType):
     data: bytes = ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineKeyboardButtonTypeCallbackWithPassword(InlineKeyboardButtonType):
     data: bytes = ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineKeyboardButtonTypeCallbackGame(InlineKeyboardButtonType): ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineKeyboardButtonTypeSwitchInline(InlineKeyboardButtonType):
     query: str = ...
     target_chat: TargetChat | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineKeyboardButtonTypeBuy(InlineKeyboardButtonType): ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineKeyboardButtonTypeUser(InlineKeyboardButtonType):
     user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineKeyboardButtonTypeCopyText(InlineKeyboardButtonType):
     text: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineKeyboardButton(ObjectBase):
     text: str = ...
     type: InlineKeyboardButtonType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReplyMarkup(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class ReplyMarkupRemoveKeyboard(ReplyMarkup):
     is_personal: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReplyMarkupForceReply(ReplyMarkup):
     is_personal: bool = ...
     input_field_placeholder: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReplyMarkupShowKeyboard(ReplyMarkup):
     rows: list[list[KeyboardButton]] | None = ...
     is_persistent: bool = ...
@@ -3273,26 +3273,26 @@ class ReplyMarkupShowKeyboard(ReplyMarkup):
     is_personal: bool = ...
     input_field_placeholder: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReplyMarkupInlineKeyboard(ReplyMarkup):
     rows: list[list[InlineKeyboardButton]] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LoginUrlInfo(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class LoginUrlInfoOpen(LoginUrlInfo):
     url: str = ...
     skip_confirmation: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class LoginUrlInfoRequestConfirmation(LoginUrlInfo):
     url: str = ...
     domain: str = ...
     bot_user_id: int = ...
     request_write_access: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ThemeParameters(ObjectBase):
     background_color: int = ...
     secondary_background_color: int = ...
@@ -3310,38 +3310,38 @@ class ThemeParameters(ObjectBase):
     button_color: int = ...
     button_text_color: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class WebAppOpenMode(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class WebAppOpenModeCompact(WebAppOpenMode): ...
-@dataclass
+@dataclass(slots=True)
 class WebAppOpenModeFullSize(WebAppOpenMode): ...
-@dataclass
+@dataclass(slots=True)
 class WebAppOpenModeFullScreen(WebAppOpenMode): ...
 
-@dataclass
+@dataclass(slots=True)
 class FoundWebApp(ObjectBase):
     web_app: WebApp | None = ...
     request_write_access: bool = ...
     skip_confirmation: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class WebAppInfo(ObjectBase):
     launch_id: int = ...
     url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class MainWebApp(ObjectBase):
     url: str = ...
     mode: WebAppOpenMode | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class WebAppOpenParameters(ObjectBase):
     theme: ThemeParameters | None = ...
     application_name: str = ...
     mode: WebAppOpenMode | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageThreadInfo(ObjectBase):
     chat_id: int = ...
     message_thread_id: int = ...
@@ -3350,18 +3350,18 @@ class MessageThreadInfo(ObjectBase):
     messages: list[Message] | None = ...
     draft_message: DraftMessage | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SavedMessagesTopicType(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class SavedMessagesTopicTypeMyNotes(SavedMessagesTopicType): ...
-@dataclass
+@dataclass(slots=True)
 class SavedMessagesTopicTypeAuthorHidden(SavedMessagesTopicType): ...
 
-@dataclass
+@dataclass(slots=True)
 class SavedMessagesTopicTypeSavedFromChat(SavedMessagesTopicType):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SavedMessagesTopic(ObjectBase):
     id: int = ...
     type: SavedMessagesTopicType | None = ...
@@ -3370,7 +3370,7 @@ class SavedMessagesTopic(ObjectBase):
     last_message: Message | None = ...
     draft_message: DraftMessage | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class DirectMessagesChatTopic(ObjectBase):
     chat_id: int = ...
     id: int = ...
@@ -3385,12 +3385,12 @@ class DirectMessagesChatTopic(ObjectBase):
     last_message: Message | None = ...
     draft_message: DraftMessage | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ForumTopicIcon(ObjectBase):
     color: int = ...
     custom_emoji_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ForumTopicInfo(ObjectBase):
     chat_id: int = ...
     forum_topic_id: int = ...
@@ -3404,7 +3404,7 @@ class ForumTopicInfo(ObjectBase):
     is_hidden: bool = ...
     is_name_implicit: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ForumTopic(ObjectBase):
     info: ForumTopicInfo | None = ...
     last_message: Message | None = ...
@@ -3418,7 +3418,7 @@ class ForumTopic(ObjectBase):
     notification_settings: ChatNotificationSettings | None = ...
     draft_message: DraftMessage | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ForumTopics(ObjectBase):
     total_count: int = ...
     topics: list[ForumTopic] | None = ...
@@ -3426,7 +3426,7 @@ class ForumTopics(ObjectBase):
     next_offset_message_id: int = ...
     next_offset_forum_topic_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewOptions(ObjectBase):
     is_disabled: bool = ...
     url: str = ...
@@ -3434,7 +3434,7 @@ class LinkPreviewOptions(ObjectBase):
     force_large_media: bool = ...
     show_above_text: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class SharedUser(ObjectBase):
     user_id: int = ...
     first_name: str = ...
@@ -3442,27 +3442,27 @@ class SharedUser(ObjectBase):
     username: str = ...
     photo: Photo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SharedChat(ObjectBase):
     chat_id: int = ...
     title: str = ...
     username: str = ...
     photo: Photo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class BuiltInTheme(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class BuiltInThemeClassic(BuiltInTheme): ...
-@dataclass
+@dataclass(slots=True)
 class BuiltInThemeDay(BuiltInTheme): ...
-@dataclass
+@dataclass(slots=True)
 class BuiltInThemeNight(BuiltInTheme): ...
-@dataclass
+@dataclass(slots=True)
 class BuiltInThemeTinted(BuiltInTheme): ...
-@dataclass
+@dataclass(slots=True)
 class BuiltInThemeArctic(BuiltInTheme): ...
 
-@dataclass
+@dataclass(slots=True)
 class ThemeSettings(ObjectBase):
     base_theme: BuiltInTheme | None = ...
     accent_color: int = ...
@@ -3471,115 +3471,115 @@ class ThemeSettings(ObjectBase):
     animate_outgoing_message_fill: bool = ...
     outgoing_message_accent_color: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class RichText(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class RichTextPlain(RichText):
     text: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class RichTextBold(RichText):
     text: RichText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class RichTextItalic(RichText):
     text: RichText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class RichTextUnderline(RichText):
     text: RichText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class RichTextStrikethrough(RichText):
     text: RichText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class RichTextFixed(RichText):
     text: RichText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class RichTextUrl(RichText):
     text: RichText | None = ...
     url: str = ...
     is_cached: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class RichTextEmailAddress(RichText):
     text: RichText | None = ...
     email_address: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class RichTextSubscript(RichText):
     text: RichText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class RichTextSuperscript(RichText):
     text: RichText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class RichTextMarked(RichText):
     text: RichText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class RichTextPhoneNumber(RichText):
     text: RichText | None = ...
     phone_number: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class RichTextIcon(RichText):
     document: Document | None = ...
     width: int = ...
     height: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class RichTextReference(RichText):
     text: RichText | None = ...
     anchor_name: str = ...
     url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class RichTextAnchor(RichText):
     name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class RichTextAnchorLink(RichText):
     text: RichText | None = ...
     anchor_name: str = ...
     url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class RichTexts(RichText):
     texts: list[RichText] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockCaption(ObjectBase):
     text: RichText | None = ...
     credit: RichText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockListItem(ObjectBase):
     label: str = ...
     page_blocks: list[PageBlock] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockHorizontalAlignment(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class PageBlockHorizontalAlignmentLeft(PageBlockHorizontalAlignment): ...
-@dataclass
+@dataclass(slots=True)
 class PageBlockHorizontalAlignmentCenter(PageBlockHorizontalAlignment): ...
-@dataclass
+@dataclass(slots=True)
 class PageBlockHorizontalAlignmentRight(PageBlockHorizontalAlignment): ...
-@dataclass
+@dataclass(slots=True)
 class PageBlockVerticalAlignment(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class PageBlockVerticalAlignmentTop(PageBlockVerticalAlignment): ...
-@dataclass
+@dataclass(slots=True)
 class PageBlockVerticalAlignmentMiddle(PageBlockVerticalAlignment): ...
-@dataclass
+@dataclass(slots=True)
 class PageBlockVerticalAlignmentBottom(PageBlockVerticalAlignment): ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockTableCell(ObjectBase):
     text: RichText | None = ...
     is_header: bool = ...
@@ -3588,7 +3588,7 @@ class PageBlockTableCell(ObjectBase):
     align: PageBlockHorizontalAlignment | None = ...
     valign: PageBlockVerticalAlignment | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockRelatedArticle(ObjectBase):
     url: str = ...
     title: str = ...
@@ -3597,102 +3597,102 @@ class PageBlockRelatedArticle(ObjectBase):
     author: str = ...
     publish_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlock(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockTitle(PageBlock):
     title: RichText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockSubtitle(PageBlock):
     subtitle: RichText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockAuthorDate(PageBlock):
     author: RichText | None = ...
     publish_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockHeader(PageBlock):
     header: RichText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockSubheader(PageBlock):
     subheader: RichText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockKicker(PageBlock):
     kicker: RichText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockParagraph(PageBlock):
     text: RichText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockPreformatted(PageBlock):
     text: RichText | None = ...
     language: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockFooter(PageBlock):
     footer: RichText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockDivider(PageBlock): ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockAnchor(PageBlock):
     name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockList(PageBlock):
     items: list[PageBlockListItem] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockBlockQuote(PageBlock):
     text: RichText | None = ...
     credit: RichText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockPullQuote(PageBlock):
     text: RichText | None = ...
     credit: RichText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockAnimation(PageBlock):
     animation: Animation | None = ...
     caption: PageBlockCaption | None = ...
     need_autoplay: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockAudio(PageBlock):
     audio: Audio | None = ...
     caption: PageBlockCaption | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockPhoto(PageBlock):
     photo: Photo | None = ...
     caption: PageBlockCaption | None = ...
     url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockVideo(PageBlock):
     video: Video | None = ...
     caption: PageBlockCaption | None = ...
     need_autoplay: bool = ...
     is_looped: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockVoiceNote(PageBlock):
     voice_note: VoiceNote | None = ...
     caption: PageBlockCaption | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockCover(PageBlock):
     cover: PageBlock | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockEmbedded(PageBlock):
     url: str = ...
     html: str = ...
@@ -3703,7 +3703,7 @@ class PageBlockEmbedded(PageBlock):
     is_full_width: bool = ...
     allow_scrolling: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockEmbeddedPost(PageBlock):
     url: str = ...
     author: str = ...
@@ -3712,42 +3712,42 @@ class PageBlockEmbeddedPost(PageBlock):
     page_blocks: list[PageBlock] | None = ...
     caption: PageBlockCaption | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockCollage(PageBlock):
     page_blocks: list[PageBlock] | None = ...
     caption: PageBlockCaption | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockSlideshow(PageBlock):
     page_blocks: list[PageBlock] | None = ...
     caption: PageBlockCaption | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockChatLink(PageBlock):
     title: str = ...
     photo: ChatPhotoInfo | None = ...
     accent_color_id: int = ...
     username: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockTable(PageBlock):
     caption: RichText | None = ...
     cells: list[list[PageBlockTableCell]] | None = ...
     is_bordered: bool = ...
     is_striped: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockDetails(PageBlock):
     header: RichText | None = ...
     page_blocks: list[PageBlock] | None = ...
     is_open: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockRelatedArticles(PageBlock):
     header: RichText | None = ...
     articles: list[PageBlockRelatedArticle] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PageBlockMap(PageBlock):
     location: Location | None = ...
     zoom: int = ...
@@ -3755,7 +3755,7 @@ class PageBlockMap(PageBlock):
     height: int = ...
     caption: PageBlockCaption | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class WebPageInstantView(ObjectBase):
     page_blocks: list[PageBlock] | None = ...
     view_count: int = ...
@@ -3764,65 +3764,65 @@ class WebPageInstantView(ObjectBase):
     is_full: bool = ...
     feedback_link: InternalLinkType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewAlbumMedia(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewAlbumMediaPhoto(LinkPreviewAlbumMedia):
     photo: Photo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewAlbumMediaVideo(LinkPreviewAlbumMedia):
     video: Video | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewType(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeAlbum(LinkPreviewType):
     media: list[LinkPreviewAlbumMedia] | None = ...
     caption: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeAnimation(LinkPreviewType):
     animation: Animation | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeApp(LinkPreviewType):
     photo: Photo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeArticle(LinkPreviewType):
     photo: Photo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeAudio(LinkPreviewType):
     audio: Audio | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeBackground(LinkPreviewType):
     document: Document | None = ...
     background_type: BackgroundType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeChannelBoost(LinkPreviewType):
     photo: ChatPhoto | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeChat(LinkPreviewType):
     type: InviteLinkChatType | None = ...
     photo: ChatPhoto | None = ...
     creates_join_request: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeDirectMessagesChat(LinkPreviewType):
     photo: ChatPhoto | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeDocument(LinkPreviewType):
     document: Document | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeEmbeddedAnimationPlayer(LinkPreviewType):
     url: str = ...
     thumbnail: Photo | None = ...
@@ -3830,7 +3830,7 @@ class LinkPreviewTypeEmbeddedAnimationPlayer(LinkPreviewType):
     width: int = ...
     height: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeEmbeddedAudioPlayer(LinkPreviewType):
     url: str = ...
     thumbnail: Photo | None = ...
@@ -3838,7 +3838,7 @@ class LinkPreviewTypeEmbeddedAudioPlayer(LinkPreviewType):
     width: int = ...
     height: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeEmbeddedVideoPlayer(LinkPreviewType):
     url: str = ...
     thumbnail: Photo | None = ...
@@ -3846,13 +3846,13 @@ class LinkPreviewTypeEmbeddedVideoPlayer(LinkPreviewType):
     width: int = ...
     height: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeExternalAudio(LinkPreviewType):
     url: str = ...
     mime_type: str = ...
     duration: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeExternalVideo(LinkPreviewType):
     url: str = ...
     mime_type: str = ...
@@ -3860,102 +3860,102 @@ class LinkPreviewTypeExternalVideo(LinkPreviewType):
     height: int = ...
     duration: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeGiftAuction(LinkPreviewType):
     gift: Gift | None = ...
     gift_background: GiftBackground | None = ...
     auction_end_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeGiftCollection(LinkPreviewType):
     icons: list[Sticker] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeGroupCall(LinkPreviewType): ...
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeInvoice(LinkPreviewType): ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeLiveStory(LinkPreviewType):
     story_poster_chat_id: int = ...
     story_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeMessage(LinkPreviewType): ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypePhoto(LinkPreviewType):
     photo: Photo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypePremiumGiftCode(LinkPreviewType): ...
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeShareableChatFolder(LinkPreviewType): ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeSticker(LinkPreviewType):
     sticker: Sticker | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeStickerSet(LinkPreviewType):
     stickers: list[Sticker] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeStory(LinkPreviewType):
     story_poster_chat_id: int = ...
     story_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeStoryAlbum(LinkPreviewType):
     photo_icon: Photo | None = ...
     video_icon: Video | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeSupergroupBoost(LinkPreviewType):
     photo: ChatPhoto | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeTheme(LinkPreviewType):
     documents: list[Document] | None = ...
     settings: ThemeSettings | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeUnsupported(LinkPreviewType): ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeUpgradedGift(LinkPreviewType):
     gift: UpgradedGift | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeUser(LinkPreviewType):
     photo: ChatPhoto | None = ...
     is_bot: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeVideo(LinkPreviewType):
     video: Video | None = ...
     cover: Photo | None = ...
     start_timestamp: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeVideoChat(LinkPreviewType):
     photo: ChatPhoto | None = ...
     is_live_stream: bool = ...
     joins_as_speaker: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeVideoNote(LinkPreviewType):
     video_note: VideoNote | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeVoiceNote(LinkPreviewType):
     voice_note: VoiceNote | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreviewTypeWebApp(LinkPreviewType):
     photo: Photo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LinkPreview(ObjectBase):
     url: str = ...
     display_url: str = ...
@@ -3971,7 +3971,7 @@ class LinkPreview(ObjectBase):
     show_above_text: bool = ...
     instant_view_version: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CountryInfo(ObjectBase):
     country_code: str = ...
     name: str = ...
@@ -3979,29 +3979,29 @@ class CountryInfo(ObjectBase):
     is_hidden: bool = ...
     calling_codes: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Countries(ObjectBase):
     countries: list[CountryInfo] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PhoneNumberInfo(ObjectBase):
     country: CountryInfo | None = ...
     country_calling_code: str = ...
     formatted_phone_number: str = ...
     is_anonymous: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class CollectibleItemType(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class CollectibleItemTypeUsername(CollectibleItemType):
     username: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class CollectibleItemTypePhoneNumber(CollectibleItemType):
     phone_number: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class CollectibleItemInfo(ObjectBase):
     purchase_date: int = ...
     currency: str = ...
@@ -4010,17 +4010,17 @@ class CollectibleItemInfo(ObjectBase):
     cryptocurrency_amount: int = ...
     url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class BankCardActionOpenUrl(ObjectBase):
     text: str = ...
     url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class BankCardInfo(ObjectBase):
     title: str = ...
     actions: list[BankCardActionOpenUrl] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Address(ObjectBase):
     country_code: str = ...
     state: str = ...
@@ -4029,19 +4029,19 @@ class Address(ObjectBase):
     street_line2: str = ...
     postal_code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class LocationAddress(ObjectBase):
     country_code: str = ...
     state: str = ...
     city: str = ...
     street: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class LabeledPricePart(ObjectBase):
     label: str = ...
     amount: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class Invoice(ObjectBase):
     currency: str = ...
     price_parts: list[LabeledPricePart] | None = ...
@@ -4059,72 +4059,72 @@ class Invoice(ObjectBase):
     send_email_address_to_provider: bool = ...
     is_flexible: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class OrderInfo(ObjectBase):
     name: str = ...
     phone_number: str = ...
     email_address: str = ...
     shipping_address: Address | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ShippingOption(ObjectBase):
     id: str = ...
     title: str = ...
     price_parts: list[LabeledPricePart] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SavedCredentials(ObjectBase):
     id: str = ...
     title: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputCredentials(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class InputCredentialsSaved(InputCredentials):
     saved_credentials_id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputCredentialsNew(InputCredentials):
     data: str = ...
     allow_save: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputCredentialsApplePay(InputCredentials):
     data: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputCredentialsGooglePay(InputCredentials):
     data: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class PaymentProvider(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class PaymentProviderSmartGlocal(PaymentProvider):
     public_token: str = ...
     tokenize_url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class PaymentProviderStripe(PaymentProvider):
     publishable_key: str = ...
     need_country: bool = ...
     need_postal_code: bool = ...
     need_cardholder_name: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PaymentProviderOther(PaymentProvider):
     url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class PaymentOption(ObjectBase):
     title: str = ...
     url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class PaymentFormType(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class PaymentFormTypeRegular(PaymentFormType):
     invoice: Invoice | None = ...
     payment_provider_user_id: int = ...
@@ -4135,35 +4135,35 @@ class PaymentFormTypeRegular(PaymentFormType):
     can_save_credentials: bool = ...
     need_password: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PaymentFormTypeStars(PaymentFormType):
     star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PaymentFormTypeStarSubscription(PaymentFormType):
     pricing: StarSubscriptionPricing | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PaymentForm(ObjectBase):
     id: int = ...
     type: PaymentFormType | None = ...
     seller_bot_user_id: int = ...
     product_info: ProductInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ValidatedOrderInfo(ObjectBase):
     order_info_id: str = ...
     shipping_options: list[ShippingOption] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PaymentResult(ObjectBase):
     success: bool = ...
     verification_url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class PaymentReceiptType(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class PaymentReceiptTypeRegular(PaymentReceiptType):
     payment_provider_user_id: int = ...
     invoice: Invoice | None = ...
@@ -4172,58 +4172,58 @@ class PaymentReceiptTypeRegular(PaymentReceiptType):
     credentials_title: str = ...
     tip_amount: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PaymentReceiptTypeStars(PaymentReceiptType):
     star_count: int = ...
     transaction_id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class PaymentReceipt(ObjectBase):
     product_info: ProductInfo | None = ...
     date: int = ...
     seller_bot_user_id: int = ...
     type: PaymentReceiptType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputInvoice(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class InputInvoiceMessage(InputInvoice):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputInvoiceName(InputInvoice):
     name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputInvoiceTelegram(InputInvoice):
     purpose: TelegramPaymentPurpose | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PaidMedia(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class PaidMediaPreview(PaidMedia):
     width: int = ...
     height: int = ...
     duration: int = ...
     minithumbnail: Minithumbnail | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PaidMediaPhoto(PaidMedia):
     photo: Photo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PaidMediaVideo(PaidMedia):
     video: Video | None = ...
     cover: Photo | None = ...
     start_timestamp: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PaidMediaUnsupported(PaidMedia): ...
 
-@dataclass
+@dataclass(slots=True)
 class GiveawayParameters(ObjectBase):
     boosted_chat_id: int = ...
     additional_chat_ids: list[int] | None = ...
@@ -4233,47 +4233,47 @@ class GiveawayParameters(ObjectBase):
     country_codes: list[str] | None = ...
     prize_description: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class DatedFile(ObjectBase):
     file: File | None = ...
     date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportElementType(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class PassportElementTypePersonalDetails(PassportElementType): ...
-@dataclass
+@dataclass(slots=True)
 class PassportElementTypePassport(PassportElementType): ...
-@dataclass
+@dataclass(slots=True)
 class PassportElementTypeDriverLicense(PassportElementType): ...
-@dataclass
+@dataclass(slots=True)
 class PassportElementTypeIdentityCard(PassportElementType): ...
-@dataclass
+@dataclass(slots=True)
 class PassportElementTypeInternalPassport(PassportElementType): ...
-@dataclass
+@dataclass(slots=True)
 class PassportElementTypeAddress(PassportElementType): ...
-@dataclass
+@dataclass(slots=True)
 class PassportElementTypeUtilityBill(PassportElementType): ...
-@dataclass
+@dataclass(slots=True)
 class PassportElementTypeBankStatement(PassportElementType): ...
-@dataclass
+@dataclass(slots=True)
 class PassportElementTypeRentalAgreement(PassportElementType): ...
-@dataclass
+@dataclass(slots=True)
 class PassportElementTypePassportRegistration(PassportElementType): ...
-@dataclass
+@dataclass(slots=True)
 class PassportElementTypeTemporaryRegistration(PassportElementType): ...
-@dataclass
+@dataclass(slots=True)
 class PassportElementTypePhoneNumber(PassportElementType): ...
-@dataclass
+@dataclass(slots=True)
 class PassportElementTypeEmailAddress(PassportElementType): ...
 
-@dataclass
+@dataclass(slots=True)
 class Date(ObjectBase):
     day: int = ...
     month: int = ...
     year: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PersonalDetails(ObjectBase):
     first_name: str = ...
     middle_name: str = ...
@@ -4286,7 +4286,7 @@ class PersonalDetails(ObjectBase):
     country_code: str = ...
     residence_country_code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class IdentityDocument(ObjectBase):
     number: str = ...
     expiration_date: Date | None = ...
@@ -4295,7 +4295,7 @@ class IdentityDocument(ObjectBase):
     selfie: DatedFile | None = ...
     translation: list[DatedFile] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputIdentityDocument(ObjectBase):
     number: str = ...
     expiration_date: Date | None = ...
@@ -4304,195 +4304,195 @@ class InputIdentityDocument(ObjectBase):
     selfie: InputFile | None = ...
     translation: list[InputFile] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PersonalDocument(ObjectBase):
     files: list[DatedFile] | None = ...
     translation: list[DatedFile] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPersonalDocument(ObjectBase):
     files: list[InputFile] | None = ...
     translation: list[InputFile] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportElement(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportElementPersonalDetails(PassportElement):
     personal_details: PersonalDetails | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportElementPassport(PassportElement):
     passport: IdentityDocument | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportElementDriverLicense(PassportElement):
     driver_license: IdentityDocument | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportElementIdentityCard(PassportElement):
     identity_card: IdentityDocument | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportElementInternalPassport(PassportElement):
     internal_passport: IdentityDocument | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportElementAddress(PassportElement):
     address: Address | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportElementUtilityBill(PassportElement):
     utility_bill: PersonalDocument | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportElementBankStatement(PassportElement):
     bank_statement: PersonalDocument | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportElementRentalAgreement(PassportElement):
     rental_agreement: PersonalDocument | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportElementPassportRegistration(PassportElement):
     passport_registration: PersonalDocument | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportElementTemporaryRegistration(PassportElement):
     temporary_registration: PersonalDocument | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportElementPhoneNumber(PassportElement):
     phone_number: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportElementEmailAddress(PassportElement):
     email_address: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPassportElement(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPassportElementPersonalDetails(InputPassportElement):
     personal_details: PersonalDetails | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPassportElementPassport(InputPassportElement):
     passport: InputIdentityDocument | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPassportElementDriverLicense(InputPassportElement):
     driver_license: InputIdentityDocument | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPassportElementIdentityCard(InputPassportElement):
     identity_card: InputIdentityDocument | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPassportElementInternalPassport(InputPassportElement):
     internal_passport: InputIdentityDocument | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPassportElementAddress(InputPassportElement):
     address: Address | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPassportElementUtilityBill(InputPassportElement):
     utility_bill: InputPersonalDocument | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPassportElementBankStatement(InputPassportElement):
     bank_statement: InputPersonalDocument | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPassportElementRentalAgreement(InputPassportElement):
     rental_agreement: InputPersonalDocument | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPassportElementPassportRegistration(InputPassportElement):
     passport_registration: InputPersonalDocument | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPassportElementTemporaryRegistration(InputPassportElement):
     temporary_registration: InputPersonalDocument | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPassportElementPhoneNumber(InputPassportElement):
     phone_number: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPassportElementEmailAddress(InputPassportElement):
     email_address: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportElements(ObjectBase):
     elements: list[PassportElement] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportElementErrorSource(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class PassportElementErrorSourceUnspecified(PassportElementErrorSource): ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportElementErrorSourceDataField(PassportElementErrorSource):
     field_name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportElementErrorSourceFrontSide(PassportElementErrorSource): ...
-@dataclass
+@dataclass(slots=True)
 class PassportElementErrorSourceReverseSide(PassportElementErrorSource): ...
-@dataclass
+@dataclass(slots=True)
 class PassportElementErrorSourceSelfie(PassportElementErrorSource): ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportElementErrorSourceTranslationFile(PassportElementErrorSource):
     file_index: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportElementErrorSourceTranslationFiles(PassportElementErrorSource): ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportElementErrorSourceFile(PassportElementErrorSource):
     file_index: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportElementErrorSourceFiles(PassportElementErrorSource): ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportElementError(ObjectBase):
     type: PassportElementType | None = ...
     message: str = ...
     source: PassportElementErrorSource | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportSuitableElement(ObjectBase):
     type: PassportElementType | None = ...
     is_selfie_required: bool = ...
     is_translation_required: bool = ...
     is_native_name_required: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportRequiredElement(ObjectBase):
     suitable_elements: list[PassportSuitableElement] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportAuthorizationForm(ObjectBase):
     id: int = ...
     required_elements: list[PassportRequiredElement] | None = ...
     privacy_policy_url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class PassportElementsWithErrors(ObjectBase):
     elements: list[PassportElement] | None = ...
     errors: list[PassportElementError] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EncryptedCredentials(ObjectBase):
     data: bytes = ...
     hash: bytes = ...
     secret: bytes = ...
 
-@dataclass
+@dataclass(slots=True)
 class EncryptedPassportElement(ObjectBase):
     type: PassportElementType | None = ...
     data: bytes = ...
@@ -4504,62 +4504,62 @@ class EncryptedPassportElement(ObjectBase):
     value: str = ...
     hash: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPassportElementErrorSource(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPassportElementErrorSourceUnspecified(InputPassportElementErrorSource):
     element_hash: bytes = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPassportElementErrorSourceDataField(InputPassportElementErrorSource):
     field_name: str = ...
     data_hash: bytes = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPassportElementErrorSourceFrontSide(InputPassportElementErrorSource):
     file_hash: bytes = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPassportElementErrorSourceReverseSide(InputPassportElementErrorSource):
     file_hash: bytes = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPassportElementErrorSourceSelfie(InputPassportElementErrorSource):
     file_hash: bytes = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPassportElementErrorSourceTranslationFile(InputPassportElementErrorSource):
     file_hash: bytes = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPassportElementErrorSourceTranslationFiles(InputPassportElementErrorSource):
     file_hashes: list[bytes] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPassportElementErrorSourceFile(InputPassportElementErrorSource):
     file_hash: bytes = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPassportElementErrorSourceFiles(InputPassportElementErrorSource):
     file_hashes: list[bytes] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPassportElementError(ObjectBase):
     type: PassportElementType | None = ...
     message: str = ...
     source: InputPassportElementErrorSource | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageContent(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageText(MessageContent):
     text: FormattedText | None = ...
     link_preview: LinkPreview | None = ...
     link_preview_options: LinkPreviewOptions | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageAnimation(MessageContent):
     animation: Animation | None = ...
     caption: FormattedText | None = ...
@@ -4567,24 +4567,24 @@ class MessageAnimation(MessageContent):
     has_spoiler: bool = ...
     is_secret: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageAudio(MessageContent):
     audio: Audio | None = ...
     caption: FormattedText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageDocument(MessageContent):
     document: Document | None = ...
     caption: FormattedText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessagePaidMedia(MessageContent):
     star_count: int = ...
     media: list[PaidMedia] | None = ...
     caption: FormattedText | None = ...
     show_caption_above_media: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessagePhoto(MessageContent):
     photo: Photo | None = ...
     caption: FormattedText | None = ...
@@ -4592,12 +4592,12 @@ class MessagePhoto(MessageContent):
     has_spoiler: bool = ...
     is_secret: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageSticker(MessageContent):
     sticker: Sticker | None = ...
     is_premium: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageVideo(MessageContent):
     video: Video | None = ...
     alternative_videos: list[AlternativeVideo] | None = ...
@@ -4609,28 +4609,28 @@ class MessageVideo(MessageContent):
     has_spoiler: bool = ...
     is_secret: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageVideoNote(MessageContent):
     video_note: VideoNote | None = ...
     is_viewed: bool = ...
     is_secret: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageVoiceNote(MessageContent):
     voice_note: VoiceNote | None = ...
     caption: FormattedText | None = ...
     is_listened: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageExpiredPhoto(MessageContent): ...
-@dataclass
+@dataclass(slots=True)
 class MessageExpiredVideo(MessageContent): ...
-@dataclass
+@dataclass(slots=True)
 class MessageExpiredVideoNote(MessageContent): ...
-@dataclass
+@dataclass(slots=True)
 class MessageExpiredVoiceNote(MessageContent): ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageLocation(MessageContent):
     location: Location | None = ...
     live_period: int = ...
@@ -4638,20 +4638,20 @@ class MessageLocation(MessageContent):
     heading: int = ...
     proximity_alert_radius: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageVenue(MessageContent):
     venue: Venue | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageContact(MessageContent):
     contact: Contact | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageAnimatedEmoji(MessageContent):
     animated_emoji: AnimatedEmoji | None = ...
     emoji: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageDice(MessageContent):
     initial_state: DiceStickers | None = ...
     final_state: DiceStickers | None = ...
@@ -4659,25 +4659,25 @@ class MessageDice(MessageContent):
     value: int = ...
     success_animation_frame_number: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageGame(MessageContent):
     game: Game | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessagePoll(MessageContent):
     poll: Poll | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageStory(MessageContent):
     story_poster_chat_id: int = ...
     story_id: int = ...
     via_mention: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageChecklist(MessageContent):
     list_: Checklist | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageInvoice(MessageContent):
     product_info: ProductInfo | None = ...
     currency: str = ...
@@ -4689,13 +4689,13 @@ class MessageInvoice(MessageContent):
     paid_media: PaidMedia | None = ...
     paid_media_caption: FormattedText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageCall(MessageContent):
     is_video: bool = ...
     discard_reason: CallDiscardReason | None = ...
     duration: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageGroupCall(MessageContent):
     is_active: bool = ...
     was_missed: bool = ...
@@ -4703,131 +4703,131 @@ class MessageGroupCall(MessageContent):
     duration: int = ...
     other_participant_ids: list[MessageSender] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageVideoChatScheduled(MessageContent):
     group_call_id: int = ...
     start_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageVideoChatStarted(MessageContent):
     group_call_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageVideoChatEnded(MessageContent):
     duration: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageInviteVideoChatParticipants(MessageContent):
     group_call_id: int = ...
     user_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageBasicGroupChatCreate(MessageContent):
     title: str = ...
     member_user_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageSupergroupChatCreate(MessageContent):
     title: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageChatChangeTitle(MessageContent):
     title: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageChatChangePhoto(MessageContent):
     photo: ChatPhoto | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageChatDeletePhoto(MessageContent): ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageChatAddMembers(MessageContent):
     member_user_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageChatJoinByLink(MessageContent): ...
-@dataclass
+@dataclass(slots=True)
 class MessageChatJoinByRequest(MessageContent): ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageChatDeleteMember(MessageContent):
     user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageChatUpgradeTo(MessageContent):
     supergroup_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageChatUpgradeFrom(MessageContent):
     title: str = ...
     basic_group_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessagePinMessage(MessageContent):
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageScreenshotTaken(MessageContent): ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageChatSetBackground(MessageContent):
     old_background_message_id: int = ...
     background: ChatBackground | None = ...
     only_for_self: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageChatSetTheme(MessageContent):
     theme: ChatTheme | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageChatSetMessageAutoDeleteTime(MessageContent):
     message_auto_delete_time: int = ...
     from_user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageChatBoost(MessageContent):
     boost_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageForumTopicCreated(MessageContent):
     name: str = ...
     is_name_implicit: bool = ...
     icon: ForumTopicIcon | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageForumTopicEdited(MessageContent):
     name: str = ...
     edit_icon_custom_emoji_id: bool = ...
     icon_custom_emoji_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageForumTopicIsClosedToggled(MessageContent):
     is_closed: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageForumTopicIsHiddenToggled(MessageContent):
     is_hidden: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageSuggestProfilePhoto(MessageContent):
     photo: ChatPhoto | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageSuggestBirthdate(MessageContent):
     birthdate: Birthdate | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageCustomServiceAction(MessageContent):
     text: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageGameScore(MessageContent):
     game_message_id: int = ...
     game_id: int = ...
     score: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessagePaymentSuccessful(MessageContent):
     invoice_chat_id: int = ...
     invoice_message_id: int = ...
@@ -4838,7 +4838,7 @@ class MessagePaymentSuccessful(MessageContent):
     is_first_recurring: bool = ...
     invoice_name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessagePaymentSuccessfulBot(MessageContent):
     currency: str = ...
     total_amount: int = ...
@@ -4851,7 +4851,7 @@ class MessagePaymentSuccessfulBot(MessageContent):
     telegram_payment_charge_id: str = ...
     provider_payment_charge_id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessagePaymentRefunded(MessageContent):
     owner_id: MessageSender | None = ...
     currency: str = ...
@@ -4860,7 +4860,7 @@ class MessagePaymentRefunded(MessageContent):
     telegram_payment_charge_id: str = ...
     provider_payment_charge_id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageGiftedPremium(MessageContent):
     gifter_user_id: int = ...
     receiver_user_id: int = ...
@@ -4873,7 +4873,7 @@ class MessageGiftedPremium(MessageContent):
     day_count: int = ...
     sticker: Sticker | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessagePremiumGiftCode(MessageContent):
     creator_id: MessageSender | None = ...
     text: FormattedText | None = ...
@@ -4888,25 +4888,25 @@ class MessagePremiumGiftCode(MessageContent):
     sticker: Sticker | None = ...
     code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageGiveawayCreated(MessageContent):
     star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageGiveaway(MessageContent):
     parameters: GiveawayParameters | None = ...
     winner_count: int = ...
     prize: GiveawayPrize | None = ...
     sticker: Sticker | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageGiveawayCompleted(MessageContent):
     giveaway_message_id: int = ...
     winner_count: int = ...
     is_star_giveaway: bool = ...
     unclaimed_prize_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageGiveawayWinners(MessageContent):
     boosted_chat_id: int = ...
     giveaway_message_id: int = ...
@@ -4920,7 +4920,7 @@ class MessageGiveawayWinners(MessageContent):
     winner_user_ids: list[int] | None = ...
     unclaimed_prize_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageGiftedStars(MessageContent):
     gifter_user_id: int = ...
     receiver_user_id: int = ...
@@ -4932,7 +4932,7 @@ class MessageGiftedStars(MessageContent):
     transaction_id: str = ...
     sticker: Sticker | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageGiftedTon(MessageContent):
     gifter_user_id: int = ...
     receiver_user_id: int = ...
@@ -4940,7 +4940,7 @@ class MessageGiftedTon(MessageContent):
     transaction_id: str = ...
     sticker: Sticker | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageGiveawayPrizeStars(MessageContent):
     star_count: int = ...
     transaction_id: str = ...
@@ -4949,7 +4949,7 @@ class MessageGiveawayPrizeStars(MessageContent):
     is_unclaimed: bool = ...
     sticker: Sticker | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageGift(MessageContent):
     gift: Gift | None = ...
     sender_id: MessageSender | None = ...
@@ -4970,7 +4970,7 @@ class MessageGift(MessageContent):
     upgraded_received_gift_id: str = ...
     prepaid_upgrade_hash: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageUpgradedGift(MessageContent):
     gift: UpgradedGift | None = ...
     sender_id: MessageSender | None = ...
@@ -4986,185 +4986,185 @@ class MessageUpgradedGift(MessageContent):
     next_resale_date: int = ...
     export_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageRefundedUpgradedGift(MessageContent):
     gift: Gift | None = ...
     sender_id: MessageSender | None = ...
     receiver_id: MessageSender | None = ...
     origin: UpgradedGiftOrigin | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessagePaidMessagesRefunded(MessageContent):
     message_count: int = ...
     star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessagePaidMessagePriceChanged(MessageContent):
     paid_message_star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageDirectMessagePriceChanged(MessageContent):
     is_enabled: bool = ...
     paid_message_star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageChecklistTasksDone(MessageContent):
     checklist_message_id: int = ...
     marked_as_done_task_ids: list[int] | None = ...
     marked_as_not_done_task_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageChecklistTasksAdded(MessageContent):
     checklist_message_id: int = ...
     tasks: list[ChecklistTask] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageSuggestedPostApprovalFailed(MessageContent):
     suggested_post_message_id: int = ...
     price: SuggestedPostPrice | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageSuggestedPostApproved(MessageContent):
     suggested_post_message_id: int = ...
     price: SuggestedPostPrice | None = ...
     send_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageSuggestedPostDeclined(MessageContent):
     suggested_post_message_id: int = ...
     comment: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageSuggestedPostPaid(MessageContent):
     suggested_post_message_id: int = ...
     star_amount: StarAmount | None = ...
     ton_amount: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageSuggestedPostRefunded(MessageContent):
     suggested_post_message_id: int = ...
     reason: SuggestedPostRefundReason | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageContactRegistered(MessageContent): ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageUsersShared(MessageContent):
     users: list[SharedUser] | None = ...
     button_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageChatShared(MessageContent):
     chat: SharedChat | None = ...
     button_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageBotWriteAccessAllowed(MessageContent):
     reason: BotWriteAccessAllowReason | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageWebAppDataSent(MessageContent):
     button_text: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageWebAppDataReceived(MessageContent):
     button_text: str = ...
     data: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessagePassportDataSent(MessageContent):
     types: list[PassportElementType] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessagePassportDataReceived(MessageContent):
     elements: list[EncryptedPassportElement] | None = ...
     credentials: EncryptedCredentials | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageProximityAlertTriggered(MessageContent):
     traveler_id: MessageSender | None = ...
     watcher_id: MessageSender | None = ...
     distance: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageUnsupported(MessageContent): ...
-@dataclass
+@dataclass(slots=True)
 class TextEntityType(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class TextEntityTypeMention(TextEntityType): ...
-@dataclass
+@dataclass(slots=True)
 class TextEntityTypeHashtag(TextEntityType): ...
-@dataclass
+@dataclass(slots=True)
 class TextEntityTypeCashtag(TextEntityType): ...
-@dataclass
+@dataclass(slots=True)
 class TextEntityTypeBotCommand(TextEntityType): ...
-@dataclass
+@dataclass(slots=True)
 class TextEntityTypeUrl(TextEntityType): ...
-@dataclass
+@dataclass(slots=True)
 class TextEntityTypeEmailAddress(TextEntityType): ...
-@dataclass
+@dataclass(slots=True)
 class TextEntityTypePhoneNumber(TextEntityType): ...
-@dataclass
+@dataclass(slots=True)
 class TextEntityTypeBankCardNumber(TextEntityType): ...
-@dataclass
+@dataclass(slots=True)
 class TextEntityTypeBold(TextEntityType): ...
-@dataclass
+@dataclass(slots=True)
 class TextEntityTypeItalic(TextEntityType): ...
-@dataclass
+@dataclass(slots=True)
 class TextEntityTypeUnderline(TextEntityType): ...
-@dataclass
+@dataclass(slots=True)
 class TextEntityTypeStrikethrough(TextEntityType): ...
-@dataclass
+@dataclass(slots=True)
 class TextEntityTypeSpoiler(TextEntityType): ...
-@dataclass
+@dataclass(slots=True)
 class TextEntityTypeCode(TextEntityType): ...
-@dataclass
+@dataclass(slots=True)
 class TextEntityTypePre(TextEntityType): ...
 
-@dataclass
+@dataclass(slots=True)
 class TextEntityTypePreCode(TextEntityType):
     language: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class TextEntityTypeBlockQuote(TextEntityType): ...
-@dataclass
+@dataclass(slots=True)
 class TextEntityTypeExpandableBlockQuote(TextEntityType): ...
 
-@dataclass
+@dataclass(slots=True)
 class TextEntityTypeTextUrl(TextEntityType):
     url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class TextEntityTypeMentionName(TextEntityType):
     user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class TextEntityTypeCustomEmoji(TextEntityType):
     custom_emoji_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class TextEntityTypeMediaTimestamp(TextEntityType):
     media_timestamp: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputThumbnail(ObjectBase):
     thumbnail: InputFile | None = ...
     width: int = ...
     height: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPaidMediaType(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class InputPaidMediaTypePhoto(InputPaidMediaType): ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPaidMediaTypeVideo(InputPaidMediaType):
     cover: InputFile | None = ...
     start_timestamp: int = ...
     duration: int = ...
     supports_streaming: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputPaidMedia(ObjectBase):
     type: InputPaidMediaType | None = ...
     media: InputFile | None = ...
@@ -5173,32 +5173,32 @@ class InputPaidMedia(ObjectBase):
     width: int = ...
     height: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageSchedulingState(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageSchedulingStateSendAtDate(MessageSchedulingState):
     send_date: int = ...
     repeat_period: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageSchedulingStateSendWhenOnline(MessageSchedulingState): ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageSchedulingStateSendWhenVideoProcessed(MessageSchedulingState):
     send_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageSelfDestructType(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageSelfDestructTypeTimer(MessageSelfDestructType):
     self_destruct_time: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageSelfDestructTypeImmediately(MessageSelfDestructType): ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageSendOptions(ObjectBase):
     suggested_post_info: InputSuggestedPostInfo | None = ...
     disable_notification: bool = ...
@@ -5212,23 +5212,23 @@ class MessageSendOptions(ObjectBase):
     sending_id: int = ...
     only_preview: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageCopyOptions(ObjectBase):
     send_copy: bool = ...
     replace_caption: bool = ...
     new_caption: FormattedText | None = ...
     new_show_caption_above_media: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputMessageContent(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class InputMessageText(InputMessageContent):
     text: FormattedText | None = ...
     link_preview_options: LinkPreviewOptions | None = ...
     clear_draft: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputMessageAnimation(InputMessageContent):
     animation: InputFile | None = ...
     thumbnail: InputThumbnail | None = ...
@@ -5240,7 +5240,7 @@ class InputMessageAnimation(InputMessageContent):
     show_caption_above_media: bool = ...
     has_spoiler: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputMessageAudio(InputMessageContent):
     audio: InputFile | None = ...
     album_cover_thumbnail: InputThumbnail | None = ...
@@ -5249,14 +5249,14 @@ class InputMessageAudio(InputMessageContent):
     performer: str = ...
     caption: FormattedText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputMessageDocument(InputMessageContent):
     document: InputFile | None = ...
     thumbnail: InputThumbnail | None = ...
     disable_content_type_detection: bool = ...
     caption: FormattedText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputMessagePaidMedia(InputMessageContent):
     star_count: int = ...
     paid_media: list[InputPaidMedia] | None = ...
@@ -5264,7 +5264,7 @@ class InputMessagePaidMedia(InputMessageContent):
     show_caption_above_media: bool = ...
     payload: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputMessagePhoto(InputMessageContent):
     photo: InputFile | None = ...
     thumbnail: InputThumbnail | None = ...
@@ -5276,7 +5276,7 @@ class InputMessagePhoto(InputMessageContent):
     self_destruct_type: MessageSelfDestructType | None = ...
     has_spoiler: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputMessageSticker(InputMessageContent):
     sticker: InputFile | None = ...
     thumbnail: InputThumbnail | None = ...
@@ -5284,7 +5284,7 @@ class InputMessageSticker(InputMessageContent):
     height: int = ...
     emoji: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputMessageVideo(InputMessageContent):
     video: InputFile | None = ...
     thumbnail: InputThumbnail | None = ...
@@ -5300,7 +5300,7 @@ class InputMessageVideo(InputMessageContent):
     self_destruct_type: MessageSelfDestructType | None = ...
     has_spoiler: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputMessageVideoNote(InputMessageContent):
     video_note: InputFile | None = ...
     thumbnail: InputThumbnail | None = ...
@@ -5308,7 +5308,7 @@ class InputMessageVideoNote(InputMessageContent):
     length: int = ...
     self_destruct_type: MessageSelfDestructType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputMessageVoiceNote(InputMessageContent):
     voice_note: InputFile | None = ...
     duration: int = ...
@@ -5316,32 +5316,32 @@ class InputMessageVoiceNote(InputMessageContent):
     caption: FormattedText | None = ...
     self_destruct_type: MessageSelfDestructType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputMessageLocation(InputMessageContent):
     location: Location | None = ...
     live_period: int = ...
     heading: int = ...
     proximity_alert_radius: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputMessageVenue(InputMessageContent):
     venue: Venue | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputMessageContact(InputMessageContent):
     contact: Contact | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputMessageDice(InputMessageContent):
     emoji: str = ...
     clear_draft: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputMessageGame(InputMessageContent):
     bot_user_id: int = ...
     game_short_name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputMessageInvoice(InputMessageContent):
     invoice: Invoice | None = ...
     title: str = ...
@@ -5357,7 +5357,7 @@ class InputMessageInvoice(InputMessageContent):
     paid_media: InputPaidMedia | None = ...
     paid_media_caption: FormattedText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputMessagePoll(InputMessageContent):
     question: FormattedText | None = ...
     options: list[FormattedText] | None = ...
@@ -5367,16 +5367,16 @@ class InputMessagePoll(InputMessageContent):
     close_date: int = ...
     is_closed: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputMessageStory(InputMessageContent):
     story_poster_chat_id: int = ...
     story_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputMessageChecklist(InputMessageContent):
     checklist: InputChecklist | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputMessageForwarded(InputMessageContent):
     from_chat_id: int = ...
     message_id: int = ...
@@ -5385,7 +5385,7 @@ class InputMessageForwarded(InputMessageContent):
     new_video_start_timestamp: int = ...
     copy_options: MessageCopyOptions | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageProperties(ObjectBase):
     can_add_offer: bool = ...
     can_add_tasks: bool = ...
@@ -5423,140 +5423,140 @@ class MessageProperties(ObjectBase):
     can_set_fact_check: bool = ...
     need_show_statistics: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchMessagesFilter(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class SearchMessagesFilterEmpty(SearchMessagesFilter): ...
-@dataclass
+@dataclass(slots=True)
 class SearchMessagesFilterAnimation(SearchMessagesFilter): ...
-@dataclass
+@dataclass(slots=True)
 class SearchMessagesFilterAudio(SearchMessagesFilter): ...
-@dataclass
+@dataclass(slots=True)
 class SearchMessagesFilterDocument(SearchMessagesFilter): ...
-@dataclass
+@dataclass(slots=True)
 class SearchMessagesFilterPhoto(SearchMessagesFilter): ...
-@dataclass
+@dataclass(slots=True)
 class SearchMessagesFilterVideo(SearchMessagesFilter): ...
-@dataclass
+@dataclass(slots=True)
 class SearchMessagesFilterVoiceNote(SearchMessagesFilter): ...
-@dataclass
+@dataclass(slots=True)
 class SearchMessagesFilterPhotoAndVideo(SearchMessagesFilter): ...
-@dataclass
+@dataclass(slots=True)
 class SearchMessagesFilterUrl(SearchMessagesFilter): ...
-@dataclass
+@dataclass(slots=True)
 class SearchMessagesFilterChatPhoto(SearchMessagesFilter): ...
-@dataclass
+@dataclass(slots=True)
 class SearchMessagesFilterVideoNote(SearchMessagesFilter): ...
-@dataclass
+@dataclass(slots=True)
 class SearchMessagesFilterVoiceAndVideoNote(SearchMessagesFilter): ...
-@dataclass
+@dataclass(slots=True)
 class SearchMessagesFilterMention(SearchMessagesFilter): ...
-@dataclass
+@dataclass(slots=True)
 class SearchMessagesFilterUnreadMention(SearchMessagesFilter): ...
-@dataclass
+@dataclass(slots=True)
 class SearchMessagesFilterUnreadReaction(SearchMessagesFilter): ...
-@dataclass
+@dataclass(slots=True)
 class SearchMessagesFilterFailedToSend(SearchMessagesFilter): ...
-@dataclass
+@dataclass(slots=True)
 class SearchMessagesFilterPinned(SearchMessagesFilter): ...
-@dataclass
+@dataclass(slots=True)
 class SearchMessagesChatTypeFilter(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class SearchMessagesChatTypeFilterPrivate(SearchMessagesChatTypeFilter): ...
-@dataclass
+@dataclass(slots=True)
 class SearchMessagesChatTypeFilterGroup(SearchMessagesChatTypeFilter): ...
-@dataclass
+@dataclass(slots=True)
 class SearchMessagesChatTypeFilterChannel(SearchMessagesChatTypeFilter): ...
-@dataclass
+@dataclass(slots=True)
 class ChatAction(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class ChatActionTyping(ChatAction): ...
-@dataclass
+@dataclass(slots=True)
 class ChatActionRecordingVideo(ChatAction): ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatActionUploadingVideo(ChatAction):
     progress: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatActionRecordingVoiceNote(ChatAction): ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatActionUploadingVoiceNote(ChatAction):
     progress: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatActionUploadingPhoto(ChatAction):
     progress: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatActionUploadingDocument(ChatAction):
     progress: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatActionChoosingSticker(ChatAction): ...
-@dataclass
+@dataclass(slots=True)
 class ChatActionChoosingLocation(ChatAction): ...
-@dataclass
+@dataclass(slots=True)
 class ChatActionChoosingContact(ChatAction): ...
-@dataclass
+@dataclass(slots=True)
 class ChatActionStartPlayingGame(ChatAction): ...
-@dataclass
+@dataclass(slots=True)
 class ChatActionRecordingVideoNote(ChatAction): ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatActionUploadingVideoNote(ChatAction):
     progress: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatActionWatchingAnimations(ChatAction):
     emoji: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatActionCancel(ChatAction): ...
-@dataclass
+@dataclass(slots=True)
 class UserStatus(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class UserStatusEmpty(UserStatus): ...
 
-@dataclass
+@dataclass(slots=True)
 class UserStatusOnline(UserStatus):
     expires: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UserStatusOffline(UserStatus):
     was_online: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UserStatusRecently(UserStatus):
     by_my_privacy_settings: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class UserStatusLastWeek(UserStatus):
     by_my_privacy_settings: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class UserStatusLastMonth(UserStatus):
     by_my_privacy_settings: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class EmojiKeyword(ObjectBase):
     emoji: str = ...
     keyword: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class EmojiKeywords(ObjectBase):
     emoji_keywords: list[EmojiKeyword] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Stickers(ObjectBase):
     stickers: list[Sticker] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Emojis(ObjectBase):
     emojis: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StickerSet(ObjectBase):
     id: int = ...
     title: str = ...
@@ -5574,7 +5574,7 @@ class StickerSet(ObjectBase):
     stickers: list[Sticker] | None = ...
     emojis: list[Emojis] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StickerSetInfo(ObjectBase):
     id: int = ...
     title: str = ...
@@ -5592,55 +5592,55 @@ class StickerSetInfo(ObjectBase):
     size: int = ...
     covers: list[Sticker] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StickerSets(ObjectBase):
     total_count: int = ...
     sets: list[StickerSetInfo] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class TrendingStickerSets(ObjectBase):
     total_count: int = ...
     sets: list[StickerSetInfo] | None = ...
     is_premium: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class EmojiCategorySource(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class EmojiCategorySourceSearch(EmojiCategorySource):
     emojis: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EmojiCategorySourcePremium(EmojiCategorySource): ...
 
-@dataclass
+@dataclass(slots=True)
 class EmojiCategory(ObjectBase):
     name: str = ...
     icon: Sticker | None = ...
     source: EmojiCategorySource | None = ...
     is_greeting: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class EmojiCategories(ObjectBase):
     categories: list[EmojiCategory] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EmojiCategoryType(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class EmojiCategoryTypeDefault(EmojiCategoryType): ...
-@dataclass
+@dataclass(slots=True)
 class EmojiCategoryTypeRegularStickers(EmojiCategoryType): ...
-@dataclass
+@dataclass(slots=True)
 class EmojiCategoryTypeEmojiStatus(EmojiCategoryType): ...
-@dataclass
+@dataclass(slots=True)
 class EmojiCategoryTypeChatPhoto(EmojiCategoryType): ...
 
-@dataclass
+@dataclass(slots=True)
 class CurrentWeather(ObjectBase):
     temperature: float = ...
     emoji: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryAreaPosition(ObjectBase):
     x_percentage: float = ...
     y_percentage: float = ...
@@ -5649,102 +5649,102 @@ class StoryAreaPosition(ObjectBase):
     rotation_angle: float = ...
     corner_radius_percentage: float = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryAreaType(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryAreaTypeLocation(StoryAreaType):
     location: Location | None = ...
     address: LocationAddress | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryAreaTypeVenue(StoryAreaType):
     venue: Venue | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryAreaTypeSuggestedReaction(StoryAreaType):
     reaction_type: ReactionType | None = ...
     total_count: int = ...
     is_dark: bool = ...
     is_flipped: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryAreaTypeMessage(StoryAreaType):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryAreaTypeLink(StoryAreaType):
     url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryAreaTypeWeather(StoryAreaType):
     temperature: float = ...
     emoji: str = ...
     background_color: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryAreaTypeUpgradedGift(StoryAreaType):
     gift_name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryArea(ObjectBase):
     position: StoryAreaPosition | None = ...
     type: StoryAreaType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputStoryAreaType(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class InputStoryAreaTypeLocation(InputStoryAreaType):
     location: Location | None = ...
     address: LocationAddress | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputStoryAreaTypeFoundVenue(InputStoryAreaType):
     query_id: int = ...
     result_id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputStoryAreaTypePreviousVenue(InputStoryAreaType):
     venue_provider: str = ...
     venue_id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputStoryAreaTypeSuggestedReaction(InputStoryAreaType):
     reaction_type: ReactionType | None = ...
     is_dark: bool = ...
     is_flipped: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputStoryAreaTypeMessage(InputStoryAreaType):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputStoryAreaTypeLink(InputStoryAreaType):
     url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputStoryAreaTypeWeather(InputStoryAreaType):
     temperature: float = ...
     emoji: str = ...
     background_color: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputStoryAreaTypeUpgradedGift(InputStoryAreaType):
     gift_name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputStoryArea(ObjectBase):
     position: StoryAreaPosition | None = ...
     type: InputStoryAreaType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputStoryAreas(ObjectBase):
     areas: list[InputStoryArea] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryVideo(ObjectBase):
     duration: float = ...
     width: int = ...
@@ -5757,34 +5757,34 @@ class StoryVideo(ObjectBase):
     cover_frame_timestamp: float = ...
     video: File | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryContent(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryContentPhoto(StoryContent):
     photo: Photo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryContentVideo(StoryContent):
     video: StoryVideo | None = ...
     alternative_video: StoryVideo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryContentLive(StoryContent):
     group_call_id: int = ...
     is_rtmp_stream: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryContentUnsupported(StoryContent): ...
-@dataclass
+@dataclass(slots=True)
 class InputStoryContent(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class InputStoryContentPhoto(InputStoryContent):
     photo: InputFile | None = ...
     added_sticker_file_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputStoryContentVideo(InputStoryContent):
     video: InputFile | None = ...
     added_sticker_file_ids: list[int] | None = ...
@@ -5792,37 +5792,37 @@ class InputStoryContentVideo(InputStoryContent):
     cover_frame_timestamp: float = ...
     is_animation: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryList(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class StoryListMain(StoryList): ...
-@dataclass
+@dataclass(slots=True)
 class StoryListArchive(StoryList): ...
-@dataclass
+@dataclass(slots=True)
 class StoryOrigin(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryOriginPublicStory(StoryOrigin):
     chat_id: int = ...
     story_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryOriginHiddenUser(StoryOrigin):
     poster_name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryRepostInfo(ObjectBase):
     origin: StoryOrigin | None = ...
     is_content_modified: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryInteractionInfo(ObjectBase):
     view_count: int = ...
     forward_count: int = ...
     reaction_count: int = ...
     recent_viewer_user_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Story(ObjectBase):
     id: int = ...
     poster_chat_id: int = ...
@@ -5852,42 +5852,42 @@ class Story(ObjectBase):
     caption: FormattedText | None = ...
     album_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Stories(ObjectBase):
     total_count: int = ...
     stories: list[Story] | None = ...
     pinned_story_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class FoundStories(ObjectBase):
     total_count: int = ...
     stories: list[Story] | None = ...
     next_offset: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryAlbum(ObjectBase):
     id: int = ...
     name: str = ...
     photo_icon: Photo | None = ...
     video_icon: Video | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryAlbums(ObjectBase):
     albums: list[StoryAlbum] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryFullId(ObjectBase):
     poster_chat_id: int = ...
     story_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryInfo(ObjectBase):
     story_id: int = ...
     date: int = ...
     is_for_close_friends: bool = ...
     is_live: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatActiveStories(ObjectBase):
     chat_id: int = ...
     list_: StoryList | None = ...
@@ -5896,29 +5896,29 @@ class ChatActiveStories(ObjectBase):
     max_read_story_id: int = ...
     stories: list[StoryInfo] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryInteractionType(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryInteractionTypeView(StoryInteractionType):
     chosen_reaction_type: ReactionType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryInteractionTypeForward(StoryInteractionType):
     message: Message | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryInteractionTypeRepost(StoryInteractionType):
     story: Story | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryInteraction(ObjectBase):
     actor_id: MessageSender | None = ...
     interaction_date: int = ...
     block_list: BlockList | None = ...
     type: StoryInteractionType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryInteractions(ObjectBase):
     total_count: int = ...
     total_forward_count: int = ...
@@ -5926,7 +5926,7 @@ class StoryInteractions(ObjectBase):
     interactions: list[StoryInteraction] | None = ...
     next_offset: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class QuickReplyMessage(ObjectBase):
     id: int = ...
     sending_state: MessageSendingState | None = ...
@@ -5937,49 +5937,49 @@ class QuickReplyMessage(ObjectBase):
     content: MessageContent | None = ...
     reply_markup: ReplyMarkup | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class QuickReplyMessages(ObjectBase):
     messages: list[QuickReplyMessage] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class QuickReplyShortcut(ObjectBase):
     id: int = ...
     name: str = ...
     first_message: QuickReplyMessage | None = ...
     message_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PublicForward(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class PublicForwardMessage(PublicForward):
     message: Message | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PublicForwardStory(PublicForward):
     story: Story | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PublicForwards(ObjectBase):
     total_count: int = ...
     forwards: list[PublicForward] | None = ...
     next_offset: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class BotMediaPreview(ObjectBase):
     date: int = ...
     content: StoryContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class BotMediaPreviews(ObjectBase):
     previews: list[BotMediaPreview] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class BotMediaPreviewInfo(ObjectBase):
     previews: list[BotMediaPreview] | None = ...
     language_codes: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatBoostLevelFeatures(ObjectBase):
     level: int = ...
     story_per_day_count: int = ...
@@ -5997,7 +5997,7 @@ class ChatBoostLevelFeatures(ObjectBase):
     can_recognize_speech: bool = ...
     can_disable_sponsored_messages: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatBoostFeatures(ObjectBase):
     features: list[ChatBoostLevelFeatures] | None = ...
     min_profile_background_custom_emoji_boost_level: int = ...
@@ -6010,15 +6010,15 @@ class ChatBoostFeatures(ObjectBase):
     min_speech_recognition_boost_level: int = ...
     min_sponsored_message_disable_boost_level: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatBoostSource(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatBoostSourceGiftCode(ChatBoostSource):
     user_id: int = ...
     gift_code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatBoostSourceGiveaway(ChatBoostSource):
     user_id: int = ...
     gift_code: str = ...
@@ -6026,11 +6026,11 @@ class ChatBoostSourceGiveaway(ChatBoostSource):
     giveaway_message_id: int = ...
     is_unclaimed: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatBoostSourcePremium(ChatBoostSource):
     user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PrepaidGiveaway(ObjectBase):
     id: int = ...
     winner_count: int = ...
@@ -6038,7 +6038,7 @@ class PrepaidGiveaway(ObjectBase):
     boost_count: int = ...
     payment_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatBoostStatus(ObjectBase):
     boost_url: str = ...
     applied_slot_ids: list[int] | None = ...
@@ -6051,7 +6051,7 @@ class ChatBoostStatus(ObjectBase):
     premium_member_percentage: float = ...
     prepaid_giveaways: list[PrepaidGiveaway] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatBoost(ObjectBase):
     id: str = ...
     count: int = ...
@@ -6059,13 +6059,13 @@ class ChatBoost(ObjectBase):
     start_date: int = ...
     expiration_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class FoundChatBoosts(ObjectBase):
     total_count: int = ...
     boosts: list[ChatBoost] | None = ...
     next_offset: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatBoostSlot(ObjectBase):
     slot_id: int = ...
     currently_boosted_chat_id: int = ...
@@ -6073,37 +6073,37 @@ class ChatBoostSlot(ObjectBase):
     expiration_date: int = ...
     cooldown_until_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatBoostSlots(ObjectBase):
     slots: list[ChatBoostSlot] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ResendCodeReason(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class ResendCodeReasonUserRequest(ResendCodeReason): ...
 
-@dataclass
+@dataclass(slots=True)
 class ResendCodeReasonVerificationFailed(ResendCodeReason):
     error_message: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class CallDiscardReason(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class CallDiscardReasonEmpty(CallDiscardReason): ...
-@dataclass
+@dataclass(slots=True)
 class CallDiscardReasonMissed(CallDiscardReason): ...
-@dataclass
+@dataclass(slots=True)
 class CallDiscardReasonDeclined(CallDiscardReason): ...
-@dataclass
+@dataclass(slots=True)
 class CallDiscardReasonDisconnected(CallDiscardReason): ...
-@dataclass
+@dataclass(slots=True)
 class CallDiscardReasonHungUp(CallDiscardReason): ...
 
-@dataclass
+@dataclass(slots=True)
 class CallDiscardReasonUpgradeToGroupCall(CallDiscardReason):
     invite_link: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class CallProtocol(ObjectBase):
     udp_p2p: bool = ...
     udp_reflector: bool = ...
@@ -6111,22 +6111,22 @@ class CallProtocol(ObjectBase):
     max_layer: int = ...
     library_versions: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class CallServerType(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class CallServerTypeTelegramReflector(CallServerType):
     peer_tag: bytes = ...
     is_tcp: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class CallServerTypeWebrtc(CallServerType):
     username: str = ...
     password: str = ...
     supports_turn: bool = ...
     supports_stun: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class CallServer(ObjectBase):
     id: int = ...
     ip_address: str = ...
@@ -6134,26 +6134,26 @@ class CallServer(ObjectBase):
     port: int = ...
     type: CallServerType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class CallId(ObjectBase):
     id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GroupCallId(ObjectBase):
     id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CallState(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class CallStatePending(CallState):
     is_created: bool = ...
     is_received: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class CallStateExchangingKeys(CallState): ...
 
-@dataclass
+@dataclass(slots=True)
 class CallStateReady(CallState):
     protocol: CallProtocol | None = ...
     servers: list[CallServer] | None = ...
@@ -6164,57 +6164,57 @@ class CallStateReady(CallState):
     is_group_call_supported: bool = ...
     custom_parameters: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class CallStateHangingUp(CallState): ...
 
-@dataclass
+@dataclass(slots=True)
 class CallStateDiscarded(CallState):
     reason: CallDiscardReason | None = ...
     need_rating: bool = ...
     need_debug_information: bool = ...
     need_log: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class CallStateError(CallState):
     error: Error | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GroupCallJoinParameters(ObjectBase):
     audio_source_id: int = ...
     payload: str = ...
     is_muted: bool = ...
     is_my_video_enabled: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GroupCallVideoQuality(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class GroupCallVideoQualityThumbnail(GroupCallVideoQuality): ...
-@dataclass
+@dataclass(slots=True)
 class GroupCallVideoQualityMedium(GroupCallVideoQuality): ...
-@dataclass
+@dataclass(slots=True)
 class GroupCallVideoQualityFull(GroupCallVideoQuality): ...
 
-@dataclass
+@dataclass(slots=True)
 class GroupCallStream(ObjectBase):
     channel_id: int = ...
     scale: int = ...
     time_offset: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GroupCallStreams(ObjectBase):
     streams: list[GroupCallStream] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class RtmpUrl(ObjectBase):
     url: str = ...
     stream_key: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GroupCallRecentSpeaker(ObjectBase):
     participant_id: MessageSender | None = ...
     is_speaking: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GroupCall(ObjectBase):
     id: int = ...
     title: str = ...
@@ -6248,18 +6248,18 @@ class GroupCall(ObjectBase):
     is_video_recorded: bool = ...
     duration: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GroupCallVideoSourceGroup(ObjectBase):
     semantics: str = ...
     source_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GroupCallParticipantVideoInfo(ObjectBase):
     source_groups: list[GroupCallVideoSourceGroup] | None = ...
     endpoint_id: str = ...
     is_paused: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GroupCallParticipant(ObjectBase):
     participant_id: MessageSender | None = ...
     audio_source_id: int = ...
@@ -6280,17 +6280,17 @@ class GroupCallParticipant(ObjectBase):
     volume_level: int = ...
     order: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GroupCallParticipants(ObjectBase):
     total_count: int = ...
     participant_ids: list[MessageSender] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GroupCallInfo(ObjectBase):
     group_call_id: int = ...
     join_payload: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GroupCallMessage(ObjectBase):
     message_id: int = ...
     sender_id: MessageSender | None = ...
@@ -6300,7 +6300,7 @@ class GroupCallMessage(ObjectBase):
     is_from_owner: bool = ...
     can_be_deleted: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GroupCallMessageLevel(ObjectBase):
     min_star_count: int = ...
     pin_duration: int = ...
@@ -6310,60 +6310,60 @@ class GroupCallMessageLevel(ObjectBase):
     second_color: int = ...
     background_color: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class InviteGroupCallParticipantResult(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class InviteGroupCallParticipantResultUserPrivacyRestricted(InviteGroupCallParticipantResult): ...
-@dataclass
+@dataclass(slots=True)
 class InviteGroupCallParticipantResultUserAlreadyParticipant(InviteGroupCallParticipantResult): ...
-@dataclass
+@dataclass(slots=True)
 class InviteGroupCallParticipantResultUserWasBanned(InviteGroupCallParticipantResult): ...
 
-@dataclass
+@dataclass(slots=True)
 class InviteGroupCallParticipantResultSuccess(InviteGroupCallParticipantResult):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GroupCallDataChannel(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class GroupCallDataChannelMain(GroupCallDataChannel): ...
-@dataclass
+@dataclass(slots=True)
 class GroupCallDataChannelScreenSharing(GroupCallDataChannel): ...
-@dataclass
+@dataclass(slots=True)
 class InputGroupCall(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class InputGroupCallLink(InputGroupCall):
     link: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputGroupCallMessage(InputGroupCall):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CallProblem(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class CallProblemEcho(CallProblem): ...
-@dataclass
+@dataclass(slots=True)
 class CallProblemNoise(CallProblem): ...
-@dataclass
+@dataclass(slots=True)
 class CallProblemInterruptions(CallProblem): ...
-@dataclass
+@dataclass(slots=True)
 class CallProblemDistortedSpeech(CallProblem): ...
-@dataclass
+@dataclass(slots=True)
 class CallProblemSilentLocal(CallProblem): ...
-@dataclass
+@dataclass(slots=True)
 class CallProblemSilentRemote(CallProblem): ...
-@dataclass
+@dataclass(slots=True)
 class CallProblemDropped(CallProblem): ...
-@dataclass
+@dataclass(slots=True)
 class CallProblemDistortedVideo(CallProblem): ...
-@dataclass
+@dataclass(slots=True)
 class CallProblemPixelatedVideo(CallProblem): ...
 
-@dataclass
+@dataclass(slots=True)
 class Call(ObjectBase):
     id: int = ...
     user_id: int = ...
@@ -6371,17 +6371,17 @@ class Call(ObjectBase):
     is_video: bool = ...
     state: CallState | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class FirebaseAuthenticationSettings(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class FirebaseAuthenticationSettingsAndroid(FirebaseAuthenticationSettings): ...
 
-@dataclass
+@dataclass(slots=True)
 class FirebaseAuthenticationSettingsIos(FirebaseAuthenticationSettings):
     device_token: str = ...
     is_app_sandbox: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PhoneNumberAuthenticationSettings(ObjectBase):
     allow_flash_call: bool = ...
     allow_missed_call: bool = ...
@@ -6391,25 +6391,25 @@ class PhoneNumberAuthenticationSettings(ObjectBase):
     firebase_authentication_settings: FirebaseAuthenticationSettings | None = ...
     authentication_tokens: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class AddedReaction(ObjectBase):
     type: ReactionType | None = ...
     sender_id: MessageSender | None = ...
     is_outgoing: bool = ...
     date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AddedReactions(ObjectBase):
     total_count: int = ...
     reactions: list[AddedReaction] | None = ...
     next_offset: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class AvailableReaction(ObjectBase):
     type: ReactionType | None = ...
     needs_premium: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class AvailableReactions(ObjectBase):
     top_reactions: list[AvailableReaction] | None = ...
     recent_reactions: list[AvailableReaction] | None = ...
@@ -6418,7 +6418,7 @@ class AvailableReactions(ObjectBase):
     are_tags: bool = ...
     unavailability_reason: ReactionUnavailabilityReason | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EmojiReaction(ObjectBase):
     emoji: str = ...
     title: str = ...
@@ -6431,25 +6431,25 @@ class EmojiReaction(ObjectBase):
     around_animation: Sticker | None = ...
     center_animation: Sticker | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReactionUnavailabilityReason(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class ReactionUnavailabilityReasonAnonymousAdministrator(ReactionUnavailabilityReason): ...
-@dataclass
+@dataclass(slots=True)
 class ReactionUnavailabilityReasonGuest(ReactionUnavailabilityReason): ...
 
-@dataclass
+@dataclass(slots=True)
 class Animations(ObjectBase):
     animations: list[Animation] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class DiceStickers(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class DiceStickersRegular(DiceStickers):
     sticker: Sticker | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class DiceStickersSlotMachine(DiceStickers):
     background: Sticker | None = ...
     lever: Sticker | None = ...
@@ -6457,34 +6457,34 @@ class DiceStickersSlotMachine(DiceStickers):
     center_reel: Sticker | None = ...
     right_reel: Sticker | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ImportedContact(ObjectBase):
     phone_number: str = ...
     first_name: str = ...
     last_name: str = ...
     note: FormattedText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ImportedContacts(ObjectBase):
     user_ids: list[int] | None = ...
     importer_count: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SpeechRecognitionResult(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class SpeechRecognitionResultPending(SpeechRecognitionResult):
     partial_text: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SpeechRecognitionResultText(SpeechRecognitionResult):
     text: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SpeechRecognitionResultError(SpeechRecognitionResult):
     error: Error | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class BusinessConnection(ObjectBase):
     id: str = ...
     user_id: int = ...
@@ -6493,12 +6493,12 @@ class BusinessConnection(ObjectBase):
     rights: BusinessBotRights | None = ...
     is_enabled: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class AttachmentMenuBotColor(ObjectBase):
     light_color: int = ...
     dark_color: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AttachmentMenuBot(ObjectBase):
     bot_user_id: int = ...
     supports_self_chat: bool = ...
@@ -6524,60 +6524,60 @@ class AttachmentMenuBot(ObjectBase):
     icon_color: AttachmentMenuBotColor | None = ...
     web_app_placeholder: File | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SentWebAppMessage(ObjectBase):
     inline_message_id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class BotWriteAccessAllowReason(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class BotWriteAccessAllowReasonConnectedWebsite(BotWriteAccessAllowReason):
     domain_name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class BotWriteAccessAllowReasonAddedToAttachmentMenu(BotWriteAccessAllowReason): ...
 
-@dataclass
+@dataclass(slots=True)
 class BotWriteAccessAllowReasonLaunchedWebApp(BotWriteAccessAllowReason):
     web_app: WebApp | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class BotWriteAccessAllowReasonAcceptedRequest(BotWriteAccessAllowReason): ...
 
-@dataclass
+@dataclass(slots=True)
 class HttpUrl(ObjectBase):
     url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class UserLink(ObjectBase):
     url: str = ...
     expires_in: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class TargetChatTypes(ObjectBase):
     allow_user_chats: bool = ...
     allow_bot_chats: bool = ...
     allow_group_chats: bool = ...
     allow_channel_chats: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class TargetChat(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class TargetChatCurrent(TargetChat): ...
 
-@dataclass
+@dataclass(slots=True)
 class TargetChatChosen(TargetChat):
     types: TargetChatTypes | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class TargetChatInternalLink(TargetChat):
     link: InternalLinkType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputInlineQueryResult(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class InputInlineQueryResultAnimation(InputInlineQueryResult):
     id: str = ...
     title: str = ...
@@ -6591,7 +6591,7 @@ class InputInlineQueryResultAnimation(InputInlineQueryResult):
     reply_markup: ReplyMarkup | None = ...
     input_message_content: InputMessageContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputInlineQueryResultArticle(InputInlineQueryResult):
     id: str = ...
     url: str = ...
@@ -6603,7 +6603,7 @@ class InputInlineQueryResultArticle(InputInlineQueryResult):
     reply_markup: ReplyMarkup | None = ...
     input_message_content: InputMessageContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputInlineQueryResultAudio(InputInlineQueryResult):
     id: str = ...
     title: str = ...
@@ -6613,7 +6613,7 @@ class InputInlineQueryResultAudio(InputInlineQueryResult):
     reply_markup: ReplyMarkup | None = ...
     input_message_content: InputMessageContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputInlineQueryResultContact(InputInlineQueryResult):
     id: str = ...
     contact: Contact | None = ...
@@ -6623,7 +6623,7 @@ class InputInlineQueryResultContact(InputInlineQueryResult):
     reply_markup: ReplyMarkup | None = ...
     input_message_content: InputMessageContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputInlineQueryResultDocument(InputInlineQueryResult):
     id: str = ...
     title: str = ...
@@ -6636,13 +6636,13 @@ class InputInlineQueryResultDocument(InputInlineQueryResult):
     reply_markup: ReplyMarkup | None = ...
     input_message_content: InputMessageContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputInlineQueryResultGame(InputInlineQueryResult):
     id: str = ...
     game_short_name: str = ...
     reply_markup: ReplyMarkup | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputInlineQueryResultLocation(InputInlineQueryResult):
     id: str = ...
     location: Location | None = ...
@@ -6654,7 +6654,7 @@ class InputInlineQueryResultLocation(InputInlineQueryResult):
     reply_markup: ReplyMarkup | None = ...
     input_message_content: InputMessageContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputInlineQueryResultPhoto(InputInlineQueryResult):
     id: str = ...
     title: str = ...
@@ -6666,7 +6666,7 @@ class InputInlineQueryResultPhoto(InputInlineQueryResult):
     reply_markup: ReplyMarkup | None = ...
     input_message_content: InputMessageContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputInlineQueryResultSticker(InputInlineQueryResult):
     id: str = ...
     thumbnail_url: str = ...
@@ -6676,7 +6676,7 @@ class InputInlineQueryResultSticker(InputInlineQueryResult):
     reply_markup: ReplyMarkup | None = ...
     input_message_content: InputMessageContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputInlineQueryResultVenue(InputInlineQueryResult):
     id: str = ...
     venue: Venue | None = ...
@@ -6686,7 +6686,7 @@ class InputInlineQueryResultVenue(InputInlineQueryResult):
     reply_markup: ReplyMarkup | None = ...
     input_message_content: InputMessageContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputInlineQueryResultVideo(InputInlineQueryResult):
     id: str = ...
     title: str = ...
@@ -6700,7 +6700,7 @@ class InputInlineQueryResultVideo(InputInlineQueryResult):
     reply_markup: ReplyMarkup | None = ...
     input_message_content: InputMessageContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputInlineQueryResultVoiceNote(InputInlineQueryResult):
     id: str = ...
     title: str = ...
@@ -6709,10 +6709,10 @@ class InputInlineQueryResultVoiceNote(InputInlineQueryResult):
     reply_markup: ReplyMarkup | None = ...
     input_message_content: InputMessageContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineQueryResult(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineQueryResultArticle(InlineQueryResult):
     id: str = ...
     url: str = ...
@@ -6720,401 +6720,401 @@ class InlineQueryResultArticle(InlineQueryResult):
     description: str = ...
     thumbnail: Thumbnail | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineQueryResultContact(InlineQueryResult):
     id: str = ...
     contact: Contact | None = ...
     thumbnail: Thumbnail | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineQueryResultLocation(InlineQueryResult):
     id: str = ...
     location: Location | None = ...
     title: str = ...
     thumbnail: Thumbnail | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineQueryResultVenue(InlineQueryResult):
     id: str = ...
     venue: Venue | None = ...
     thumbnail: Thumbnail | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineQueryResultGame(InlineQueryResult):
     id: str = ...
     game: Game | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineQueryResultAnimation(InlineQueryResult):
     id: str = ...
     animation: Animation | None = ...
     title: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineQueryResultAudio(InlineQueryResult):
     id: str = ...
     audio: Audio | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineQueryResultDocument(InlineQueryResult):
     id: str = ...
     document: Document | None = ...
     title: str = ...
     description: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineQueryResultPhoto(InlineQueryResult):
     id: str = ...
     photo: Photo | None = ...
     title: str = ...
     description: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineQueryResultSticker(InlineQueryResult):
     id: str = ...
     sticker: Sticker | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineQueryResultVideo(InlineQueryResult):
     id: str = ...
     video: Video | None = ...
     title: str = ...
     description: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineQueryResultVoiceNote(InlineQueryResult):
     id: str = ...
     voice_note: VoiceNote | None = ...
     title: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineQueryResultsButtonType(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineQueryResultsButtonTypeStartBot(InlineQueryResultsButtonType):
     parameter: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineQueryResultsButtonTypeWebApp(InlineQueryResultsButtonType):
     url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineQueryResultsButton(ObjectBase):
     text: str = ...
     type: InlineQueryResultsButtonType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InlineQueryResults(ObjectBase):
     inline_query_id: int = ...
     button: InlineQueryResultsButton | None = ...
     results: list[InlineQueryResult] | None = ...
     next_offset: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class PreparedInlineMessageId(ObjectBase):
     id: str = ...
     expiration_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PreparedInlineMessage(ObjectBase):
     inline_query_id: int = ...
     result: InlineQueryResult | None = ...
     chat_types: TargetChatTypes | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class CallbackQueryPayload(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class CallbackQueryPayloadData(CallbackQueryPayload):
     data: bytes = ...
 
-@dataclass
+@dataclass(slots=True)
 class CallbackQueryPayloadDataWithPassword(CallbackQueryPayload):
     password: str = ...
     data: bytes = ...
 
-@dataclass
+@dataclass(slots=True)
 class CallbackQueryPayloadGame(CallbackQueryPayload):
     game_short_name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class CallbackQueryAnswer(ObjectBase):
     text: str = ...
     show_alert: bool = ...
     url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class CustomRequestResult(ObjectBase):
     result: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GameHighScore(ObjectBase):
     position: int = ...
     user_id: int = ...
     score: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GameHighScores(ObjectBase):
     scores: list[GameHighScore] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventAction(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventMessageEdited(ChatEventAction):
     old_message: Message | None = ...
     new_message: Message | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventMessageDeleted(ChatEventAction):
     message: Message | None = ...
     can_report_anti_spam_false_positive: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventMessagePinned(ChatEventAction):
     message: Message | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventMessageUnpinned(ChatEventAction):
     message: Message | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventPollStopped(ChatEventAction):
     message: Message | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventMemberJoined(ChatEventAction): ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventMemberJoinedByInviteLink(ChatEventAction):
     invite_link: ChatInviteLink | None = ...
     via_chat_folder_invite_link: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventMemberJoinedByRequest(ChatEventAction):
     approver_user_id: int = ...
     invite_link: ChatInviteLink | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventMemberInvited(ChatEventAction):
     user_id: int = ...
     status: ChatMemberStatus | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventMemberLeft(ChatEventAction): ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventMemberPromoted(ChatEventAction):
     user_id: int = ...
     old_status: ChatMemberStatus | None = ...
     new_status: ChatMemberStatus | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventMemberRestricted(ChatEventAction):
     member_id: MessageSender | None = ...
     old_status: ChatMemberStatus | None = ...
     new_status: ChatMemberStatus | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventMemberSubscriptionExtended(ChatEventAction):
     user_id: int = ...
     old_status: ChatMemberStatus | None = ...
     new_status: ChatMemberStatus | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventAvailableReactionsChanged(ChatEventAction):
     old_available_reactions: ChatAvailableReactions | None = ...
     new_available_reactions: ChatAvailableReactions | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventBackgroundChanged(ChatEventAction):
     old_background: ChatBackground | None = ...
     new_background: ChatBackground | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventDescriptionChanged(ChatEventAction):
     old_description: str = ...
     new_description: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventEmojiStatusChanged(ChatEventAction):
     old_emoji_status: EmojiStatus | None = ...
     new_emoji_status: EmojiStatus | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventLinkedChatChanged(ChatEventAction):
     old_linked_chat_id: int = ...
     new_linked_chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventLocationChanged(ChatEventAction):
     old_location: ChatLocation | None = ...
     new_location: ChatLocation | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventMessageAutoDeleteTimeChanged(ChatEventAction):
     old_message_auto_delete_time: int = ...
     new_message_auto_delete_time: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventPermissionsChanged(ChatEventAction):
     old_permissions: ChatPermissions | None = ...
     new_permissions: ChatPermissions | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventPhotoChanged(ChatEventAction):
     old_photo: ChatPhoto | None = ...
     new_photo: ChatPhoto | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventSlowModeDelayChanged(ChatEventAction):
     old_slow_mode_delay: int = ...
     new_slow_mode_delay: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventStickerSetChanged(ChatEventAction):
     old_sticker_set_id: int = ...
     new_sticker_set_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventCustomEmojiStickerSetChanged(ChatEventAction):
     old_sticker_set_id: int = ...
     new_sticker_set_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventTitleChanged(ChatEventAction):
     old_title: str = ...
     new_title: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventUsernameChanged(ChatEventAction):
     old_username: str = ...
     new_username: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventActiveUsernamesChanged(ChatEventAction):
     old_usernames: list[str] | None = ...
     new_usernames: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventAccentColorChanged(ChatEventAction):
     old_accent_color_id: int = ...
     old_background_custom_emoji_id: int = ...
     new_accent_color_id: int = ...
     new_background_custom_emoji_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventProfileAccentColorChanged(ChatEventAction):
     old_profile_accent_color_id: int = ...
     old_profile_background_custom_emoji_id: int = ...
     new_profile_accent_color_id: int = ...
     new_profile_background_custom_emoji_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventHasProtectedContentToggled(ChatEventAction):
     has_protected_content: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventInvitesToggled(ChatEventAction):
     can_invite_users: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventIsAllHistoryAvailableToggled(ChatEventAction):
     is_all_history_available: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventHasAggressiveAntiSpamEnabledToggled(ChatEventAction):
     has_aggressive_anti_spam_enabled: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventSignMessagesToggled(ChatEventAction):
     sign_messages: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventShowMessageSenderToggled(ChatEventAction):
     show_message_sender: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventAutomaticTranslationToggled(ChatEventAction):
     has_automatic_translation: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventInviteLinkEdited(ChatEventAction):
     old_invite_link: ChatInviteLink | None = ...
     new_invite_link: ChatInviteLink | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventInviteLinkRevoked(ChatEventAction):
     invite_link: ChatInviteLink | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventInviteLinkDeleted(ChatEventAction):
     invite_link: ChatInviteLink | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventVideoChatCreated(ChatEventAction):
     group_call_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventVideoChatEnded(ChatEventAction):
     group_call_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventVideoChatMuteNewParticipantsToggled(ChatEventAction):
     mute_new_participants: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventVideoChatParticipantIsMutedToggled(ChatEventAction):
     participant_id: MessageSender | None = ...
     is_muted: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventVideoChatParticipantVolumeLevelChanged(ChatEventAction):
     participant_id: MessageSender | None = ...
     volume_level: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventIsForumToggled(ChatEventAction):
     is_forum: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventForumTopicCreated(ChatEventAction):
     topic_info: ForumTopicInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventForumTopicEdited(ChatEventAction):
     old_topic_info: ForumTopicInfo | None = ...
     new_topic_info: ForumTopicInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventForumTopicToggleIsClosed(ChatEventAction):
     topic_info: ForumTopicInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventForumTopicToggleIsHidden(ChatEventAction):
     topic_info: ForumTopicInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventForumTopicDeleted(ChatEventAction):
     topic_info: ForumTopicInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventForumTopicPinned(ChatEventAction):
     old_topic_info: ForumTopicInfo | None = ...
     new_topic_info: ForumTopicInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEvent(ObjectBase):
     id: int = ...
     date: int = ...
     member_id: MessageSender | None = ...
     action: ChatEventAction | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEvents(ObjectBase):
     events: list[ChatEvent] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatEventLogFilters(ObjectBase):
     message_edits: bool = ...
     message_deletions: bool = ...
@@ -7131,14 +7131,14 @@ class ChatEventLogFilters(ObjectBase):
     forum_changes: bool = ...
     subscription_extensions: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class LanguagePackStringValue(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class LanguagePackStringValueOrdinary(LanguagePackStringValue):
     value: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class LanguagePackStringValuePluralized(LanguagePackStringValue):
     zero_value: str = ...
     one_value: str = ...
@@ -7147,19 +7147,19 @@ class LanguagePackStringValuePluralized(LanguagePackStringValue):
     many_value: str = ...
     other_value: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class LanguagePackStringValueDeleted(LanguagePackStringValue): ...
 
-@dataclass
+@dataclass(slots=True)
 class LanguagePackString(ObjectBase):
     key: str = ...
     value: LanguagePackStringValue | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LanguagePackStrings(ObjectBase):
     strings: list[LanguagePackString] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LanguagePackInfo(ObjectBase):
     id: str = ...
     base_language_pack_id: str = ...
@@ -7175,218 +7175,218 @@ class LanguagePackInfo(ObjectBase):
     local_string_count: int = ...
     translation_url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class LocalizationTargetInfo(ObjectBase):
     language_packs: list[LanguagePackInfo] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PremiumLimitType(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumLimitTypeSupergroupCount(PremiumLimitType): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumLimitTypePinnedChatCount(PremiumLimitType): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumLimitTypeCreatedPublicChatCount(PremiumLimitType): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumLimitTypeSavedAnimationCount(PremiumLimitType): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumLimitTypeFavoriteStickerCount(PremiumLimitType): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumLimitTypeChatFolderCount(PremiumLimitType): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumLimitTypeChatFolderChosenChatCount(PremiumLimitType): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumLimitTypePinnedArchivedChatCount(PremiumLimitType): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumLimitTypePinnedSavedMessagesTopicCount(PremiumLimitType): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumLimitTypeCaptionLength(PremiumLimitType): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumLimitTypeBioLength(PremiumLimitType): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumLimitTypeChatFolderInviteLinkCount(PremiumLimitType): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumLimitTypeShareableChatFolderCount(PremiumLimitType): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumLimitTypeActiveStoryCount(PremiumLimitType): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumLimitTypeWeeklyPostedStoryCount(PremiumLimitType): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumLimitTypeMonthlyPostedStoryCount(PremiumLimitType): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumLimitTypeStoryCaptionLength(PremiumLimitType): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumLimitTypeStorySuggestedReactionAreaCount(PremiumLimitType): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumLimitTypeSimilarChatCount(PremiumLimitType): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumFeature(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumFeatureIncreasedLimits(PremiumFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumFeatureIncreasedUploadFileSize(PremiumFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumFeatureImprovedDownloadSpeed(PremiumFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumFeatureVoiceRecognition(PremiumFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumFeatureDisabledAds(PremiumFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumFeatureUniqueReactions(PremiumFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumFeatureUniqueStickers(PremiumFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumFeatureCustomEmoji(PremiumFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumFeatureAdvancedChatManagement(PremiumFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumFeatureProfileBadge(PremiumFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumFeatureEmojiStatus(PremiumFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumFeatureAnimatedProfilePhoto(PremiumFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumFeatureForumTopicIcon(PremiumFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumFeatureAppIcons(PremiumFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumFeatureRealTimeChatTranslation(PremiumFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumFeatureUpgradedStories(PremiumFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumFeatureChatBoost(PremiumFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumFeatureAccentColor(PremiumFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumFeatureBackgroundForBoth(PremiumFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumFeatureSavedMessagesTags(PremiumFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumFeatureMessagePrivacy(PremiumFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumFeatureLastSeenTimes(PremiumFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumFeatureBusiness(PremiumFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumFeatureMessageEffects(PremiumFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumFeatureChecklists(PremiumFeature): ...
-@dataclass
+@dataclass(slots=True)
 class BusinessFeature(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class BusinessFeatureLocation(BusinessFeature): ...
-@dataclass
+@dataclass(slots=True)
 class BusinessFeatureOpeningHours(BusinessFeature): ...
-@dataclass
+@dataclass(slots=True)
 class BusinessFeatureQuickReplies(BusinessFeature): ...
-@dataclass
+@dataclass(slots=True)
 class BusinessFeatureGreetingMessage(BusinessFeature): ...
-@dataclass
+@dataclass(slots=True)
 class BusinessFeatureAwayMessage(BusinessFeature): ...
-@dataclass
+@dataclass(slots=True)
 class BusinessFeatureAccountLinks(BusinessFeature): ...
-@dataclass
+@dataclass(slots=True)
 class BusinessFeatureStartPage(BusinessFeature): ...
-@dataclass
+@dataclass(slots=True)
 class BusinessFeatureBots(BusinessFeature): ...
-@dataclass
+@dataclass(slots=True)
 class BusinessFeatureEmojiStatus(BusinessFeature): ...
-@dataclass
+@dataclass(slots=True)
 class BusinessFeatureChatFolderTags(BusinessFeature): ...
-@dataclass
+@dataclass(slots=True)
 class BusinessFeatureUpgradedStories(BusinessFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumStoryFeature(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumStoryFeaturePriorityOrder(PremiumStoryFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumStoryFeatureStealthMode(PremiumStoryFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumStoryFeaturePermanentViewsHistory(PremiumStoryFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumStoryFeatureCustomExpirationDuration(PremiumStoryFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumStoryFeatureSaveStories(PremiumStoryFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumStoryFeatureLinksAndFormatting(PremiumStoryFeature): ...
-@dataclass
+@dataclass(slots=True)
 class PremiumStoryFeatureVideoQuality(PremiumStoryFeature): ...
 
-@dataclass
+@dataclass(slots=True)
 class PremiumLimit(ObjectBase):
     type: PremiumLimitType | None = ...
     default_value: int = ...
     premium_value: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PremiumFeatures(ObjectBase):
     features: list[PremiumFeature] | None = ...
     limits: list[PremiumLimit] | None = ...
     payment_link: InternalLinkType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class BusinessFeatures(ObjectBase):
     features: list[BusinessFeature] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PremiumSource(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class PremiumSourceLimitExceeded(PremiumSource):
     limit_type: PremiumLimitType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PremiumSourceFeature(PremiumSource):
     feature: PremiumFeature | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PremiumSourceBusinessFeature(PremiumSource):
     feature: BusinessFeature | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PremiumSourceStoryFeature(PremiumSource):
     feature: PremiumStoryFeature | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PremiumSourceLink(PremiumSource):
     referrer: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class PremiumSourceSettings(PremiumSource): ...
 
-@dataclass
+@dataclass(slots=True)
 class PremiumFeaturePromotionAnimation(ObjectBase):
     feature: PremiumFeature | None = ...
     animation: Animation | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class BusinessFeaturePromotionAnimation(ObjectBase):
     feature: BusinessFeature | None = ...
     animation: Animation | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class PremiumState(ObjectBase):
     state: FormattedText | None = ...
     payment_options: list[PremiumStatePaymentOption] | None = ...
     animations: list[PremiumFeaturePromotionAnimation] | None = ...
     business_animations: list[BusinessFeaturePromotionAnimation] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StorePaymentPurpose(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class StorePaymentPurposePremiumSubscription(StorePaymentPurpose):
     is_restore: bool = ...
     is_upgrade: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class StorePaymentPurposePremiumGift(StorePaymentPurpose):
     currency: str = ...
     amount: int = ...
     user_id: int = ...
     text: FormattedText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StorePaymentPurposePremiumGiftCodes(StorePaymentPurpose):
     boosted_chat_id: int = ...
     currency: str = ...
@@ -7394,13 +7394,13 @@ class StorePaymentPurposePremiumGiftCodes(StorePaymentPurpose):
     user_ids: list[int] | None = ...
     text: FormattedText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StorePaymentPurposePremiumGiveaway(StorePaymentPurpose):
     parameters: GiveawayParameters | None = ...
     currency: str = ...
     amount: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StorePaymentPurposeStarGiveaway(StorePaymentPurpose):
     parameters: GiveawayParameters | None = ...
     currency: str = ...
@@ -7408,37 +7408,37 @@ class StorePaymentPurposeStarGiveaway(StorePaymentPurpose):
     winner_count: int = ...
     star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StorePaymentPurposeStars(StorePaymentPurpose):
     currency: str = ...
     amount: int = ...
     star_count: int = ...
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StorePaymentPurposeGiftedStars(StorePaymentPurpose):
     user_id: int = ...
     currency: str = ...
     amount: int = ...
     star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoreTransaction(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class StoreTransactionAppStore(StoreTransaction):
     receipt: bytes = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoreTransactionGooglePlay(StoreTransaction):
     package_name: str = ...
     store_product_id: str = ...
     purchase_token: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class TelegramPaymentPurpose(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class TelegramPaymentPurposePremiumGift(TelegramPaymentPurpose):
     currency: str = ...
     amount: int = ...
@@ -7446,7 +7446,7 @@ class TelegramPaymentPurposePremiumGift(TelegramPaymentPurpose):
     month_count: int = ...
     text: FormattedText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class TelegramPaymentPurposePremiumGiftCodes(TelegramPaymentPurpose):
     boosted_chat_id: int = ...
     currency: str = ...
@@ -7455,7 +7455,7 @@ class TelegramPaymentPurposePremiumGiftCodes(TelegramPaymentPurpose):
     month_count: int = ...
     text: FormattedText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class TelegramPaymentPurposePremiumGiveaway(TelegramPaymentPurpose):
     parameters: GiveawayParameters | None = ...
     currency: str = ...
@@ -7463,21 +7463,21 @@ class TelegramPaymentPurposePremiumGiveaway(TelegramPaymentPurpose):
     winner_count: int = ...
     month_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class TelegramPaymentPurposeStars(TelegramPaymentPurpose):
     currency: str = ...
     amount: int = ...
     star_count: int = ...
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class TelegramPaymentPurposeGiftedStars(TelegramPaymentPurpose):
     user_id: int = ...
     currency: str = ...
     amount: int = ...
     star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class TelegramPaymentPurposeStarGiveaway(TelegramPaymentPurpose):
     parameters: GiveawayParameters | None = ...
     currency: str = ...
@@ -7485,481 +7485,481 @@ class TelegramPaymentPurposeStarGiveaway(TelegramPaymentPurpose):
     winner_count: int = ...
     star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class TelegramPaymentPurposeJoinChat(TelegramPaymentPurpose):
     invite_link: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeviceToken(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class DeviceTokenFirebaseCloudMessaging(DeviceToken):
     token: str = ...
     encrypt: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeviceTokenApplePush(DeviceToken):
     device_token: str = ...
     is_app_sandbox: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeviceTokenApplePushVoIP(DeviceToken):
     device_token: str = ...
     is_app_sandbox: bool = ...
     encrypt: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeviceTokenWindowsPush(DeviceToken):
     access_token: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeviceTokenMicrosoftPush(DeviceToken):
     channel_uri: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeviceTokenMicrosoftPushVoIP(DeviceToken):
     channel_uri: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeviceTokenWebPush(DeviceToken):
     endpoint: str = ...
     p256dh_base64url: str = ...
     auth_base64url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeviceTokenSimplePush(DeviceToken):
     endpoint: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeviceTokenUbuntuPush(DeviceToken):
     token: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeviceTokenBlackBerryPush(DeviceToken):
     token: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeviceTokenTizenPush(DeviceToken):
     reg_id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeviceTokenHuaweiPush(DeviceToken):
     token: str = ...
     encrypt: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushReceiverId(ObjectBase):
     id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class BackgroundFill(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class BackgroundFillSolid(BackgroundFill):
     color: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class BackgroundFillGradient(BackgroundFill):
     top_color: int = ...
     bottom_color: int = ...
     rotation_angle: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class BackgroundFillFreeformGradient(BackgroundFill):
     colors: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class BackgroundType(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class BackgroundTypeWallpaper(BackgroundType):
     is_blurred: bool = ...
     is_moving: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class BackgroundTypePattern(BackgroundType):
     fill: BackgroundFill | None = ...
     intensity: int = ...
     is_inverted: bool = ...
     is_moving: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class BackgroundTypeFill(BackgroundType):
     fill: BackgroundFill | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class BackgroundTypeChatTheme(BackgroundType):
     theme_name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputBackground(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class InputBackgroundLocal(InputBackground):
     background: InputFile | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputBackgroundRemote(InputBackground):
     background_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputBackgroundPrevious(InputBackground):
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class EmojiChatTheme(ObjectBase):
     name: str = ...
     light_settings: ThemeSettings | None = ...
     dark_settings: ThemeSettings | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GiftChatTheme(ObjectBase):
     gift: UpgradedGift | None = ...
     light_settings: ThemeSettings | None = ...
     dark_settings: ThemeSettings | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GiftChatThemes(ObjectBase):
     themes: list[GiftChatTheme] | None = ...
     next_offset: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatTheme(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatThemeEmoji(ChatTheme):
     name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatThemeGift(ChatTheme):
     gift_theme: GiftChatTheme | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputChatTheme(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class InputChatThemeEmoji(InputChatTheme):
     name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputChatThemeGift(InputChatTheme):
     name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class TimeZone(ObjectBase):
     id: str = ...
     name: str = ...
     utc_time_offset: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class TimeZones(ObjectBase):
     time_zones: list[TimeZone] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Hashtags(ObjectBase):
     hashtags: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class CanPostStoryResult(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class CanPostStoryResultOk(CanPostStoryResult):
     story_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CanPostStoryResultPremiumNeeded(CanPostStoryResult): ...
-@dataclass
+@dataclass(slots=True)
 class CanPostStoryResultBoostNeeded(CanPostStoryResult): ...
-@dataclass
+@dataclass(slots=True)
 class CanPostStoryResultActiveStoryLimitExceeded(CanPostStoryResult): ...
 
-@dataclass
+@dataclass(slots=True)
 class CanPostStoryResultWeeklyLimitExceeded(CanPostStoryResult):
     retry_after: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CanPostStoryResultMonthlyLimitExceeded(CanPostStoryResult):
     retry_after: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CanPostStoryResultLiveStoryIsActive(CanPostStoryResult):
     story_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StartLiveStoryResult(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class StartLiveStoryResultOk(StartLiveStoryResult):
     story: Story | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StartLiveStoryResultFail(StartLiveStoryResult):
     error_type: CanPostStoryResult | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class CanTransferOwnershipResult(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class CanTransferOwnershipResultOk(CanTransferOwnershipResult): ...
-@dataclass
+@dataclass(slots=True)
 class CanTransferOwnershipResultPasswordNeeded(CanTransferOwnershipResult): ...
 
-@dataclass
+@dataclass(slots=True)
 class CanTransferOwnershipResultPasswordTooFresh(CanTransferOwnershipResult):
     retry_after: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CanTransferOwnershipResultSessionTooFresh(CanTransferOwnershipResult):
     retry_after: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CheckChatUsernameResult(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class CheckChatUsernameResultOk(CheckChatUsernameResult): ...
-@dataclass
+@dataclass(slots=True)
 class CheckChatUsernameResultUsernameInvalid(CheckChatUsernameResult): ...
-@dataclass
+@dataclass(slots=True)
 class CheckChatUsernameResultUsernameOccupied(CheckChatUsernameResult): ...
-@dataclass
+@dataclass(slots=True)
 class CheckChatUsernameResultUsernamePurchasable(CheckChatUsernameResult): ...
-@dataclass
+@dataclass(slots=True)
 class CheckChatUsernameResultPublicChatsTooMany(CheckChatUsernameResult): ...
-@dataclass
+@dataclass(slots=True)
 class CheckChatUsernameResultPublicGroupsUnavailable(CheckChatUsernameResult): ...
-@dataclass
+@dataclass(slots=True)
 class CheckStickerSetNameResult(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class CheckStickerSetNameResultOk(CheckStickerSetNameResult): ...
-@dataclass
+@dataclass(slots=True)
 class CheckStickerSetNameResultNameInvalid(CheckStickerSetNameResult): ...
-@dataclass
+@dataclass(slots=True)
 class CheckStickerSetNameResultNameOccupied(CheckStickerSetNameResult): ...
-@dataclass
+@dataclass(slots=True)
 class ResetPasswordResult(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class ResetPasswordResultOk(ResetPasswordResult): ...
 
-@dataclass
+@dataclass(slots=True)
 class ResetPasswordResultPending(ResetPasswordResult):
     pending_reset_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ResetPasswordResultDeclined(ResetPasswordResult):
     retry_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageFileType(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageFileTypePrivate(MessageFileType):
     name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageFileTypeGroup(MessageFileType):
     title: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageFileTypeUnknown(MessageFileType): ...
-@dataclass
+@dataclass(slots=True)
 class PushMessageContent(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentHidden(PushMessageContent):
     is_pinned: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentAnimation(PushMessageContent):
     animation: Animation | None = ...
     caption: str = ...
     is_pinned: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentAudio(PushMessageContent):
     audio: Audio | None = ...
     is_pinned: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentContact(PushMessageContent):
     name: str = ...
     is_pinned: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentContactRegistered(PushMessageContent):
     as_premium_account: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentDocument(PushMessageContent):
     document: Document | None = ...
     is_pinned: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentGame(PushMessageContent):
     title: str = ...
     is_pinned: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentGameScore(PushMessageContent):
     title: str = ...
     score: int = ...
     is_pinned: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentInvoice(PushMessageContent):
     price: str = ...
     is_pinned: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentLocation(PushMessageContent):
     is_live: bool = ...
     is_pinned: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentPaidMedia(PushMessageContent):
     star_count: int = ...
     is_pinned: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentPhoto(PushMessageContent):
     photo: Photo | None = ...
     caption: str = ...
     is_secret: bool = ...
     is_pinned: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentPoll(PushMessageContent):
     question: str = ...
     is_regular: bool = ...
     is_pinned: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentPremiumGiftCode(PushMessageContent):
     month_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentGiveaway(PushMessageContent):
     winner_count: int = ...
     prize: GiveawayPrize | None = ...
     is_pinned: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentGift(PushMessageContent):
     star_count: int = ...
     is_prepaid_upgrade: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentUpgradedGift(PushMessageContent):
     is_upgrade: bool = ...
     is_prepaid_upgrade: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentScreenshotTaken(PushMessageContent): ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentSticker(PushMessageContent):
     sticker: Sticker | None = ...
     emoji: str = ...
     is_pinned: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentStory(PushMessageContent):
     is_mention: bool = ...
     is_pinned: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentText(PushMessageContent):
     text: str = ...
     is_pinned: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentChecklist(PushMessageContent):
     title: str = ...
     is_pinned: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentVideo(PushMessageContent):
     video: Video | None = ...
     caption: str = ...
     is_secret: bool = ...
     is_pinned: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentVideoNote(PushMessageContent):
     video_note: VideoNote | None = ...
     is_pinned: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentVoiceNote(PushMessageContent):
     voice_note: VoiceNote | None = ...
     is_pinned: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentBasicGroupChatCreate(PushMessageContent): ...
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentVideoChatStarted(PushMessageContent): ...
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentVideoChatEnded(PushMessageContent): ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentInviteVideoChatParticipants(PushMessageContent):
     is_current_user: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentChatAddMembers(PushMessageContent):
     member_name: str = ...
     is_current_user: bool = ...
     is_returned: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentChatChangePhoto(PushMessageContent): ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentChatChangeTitle(PushMessageContent):
     title: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentChatSetBackground(PushMessageContent):
     is_same: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentChatSetTheme(PushMessageContent):
     name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentChatDeleteMember(PushMessageContent):
     member_name: str = ...
     is_current_user: bool = ...
     is_left: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentChatJoinByLink(PushMessageContent): ...
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentChatJoinByRequest(PushMessageContent): ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentRecurringPayment(PushMessageContent):
     amount: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentSuggestProfilePhoto(PushMessageContent): ...
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentSuggestBirthdate(PushMessageContent): ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentProximityAlertTriggered(PushMessageContent):
     distance: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentChecklistTasksAdded(PushMessageContent):
     task_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentChecklistTasksDone(PushMessageContent):
     task_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentMessageForwards(PushMessageContent):
     total_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PushMessageContentMediaAlbum(PushMessageContent):
     total_count: int = ...
     has_photos: bool = ...
@@ -7967,22 +7967,22 @@ class PushMessageContentMediaAlbum(PushMessageContent):
     has_audios: bool = ...
     has_documents: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class NotificationType(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class NotificationTypeNewMessage(NotificationType):
     message: Message | None = ...
     show_preview: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class NotificationTypeNewSecretChat(NotificationType): ...
 
-@dataclass
+@dataclass(slots=True)
 class NotificationTypeNewCall(NotificationType):
     call_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class NotificationTypeNewPushMessage(NotificationType):
     message_id: int = ...
     sender_id: MessageSender | None = ...
@@ -7990,18 +7990,18 @@ class NotificationTypeNewPushMessage(NotificationType):
     is_outgoing: bool = ...
     content: PushMessageContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class NotificationGroupType(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class NotificationGroupTypeMessages(NotificationGroupType): ...
-@dataclass
+@dataclass(slots=True)
 class NotificationGroupTypeMentions(NotificationGroupType): ...
-@dataclass
+@dataclass(slots=True)
 class NotificationGroupTypeSecretChat(NotificationGroupType): ...
-@dataclass
+@dataclass(slots=True)
 class NotificationGroupTypeCalls(NotificationGroupType): ...
 
-@dataclass
+@dataclass(slots=True)
 class NotificationSound(ObjectBase):
     id: int = ...
     duration: int = ...
@@ -8010,18 +8010,18 @@ class NotificationSound(ObjectBase):
     data: str = ...
     sound: File | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class NotificationSounds(ObjectBase):
     notification_sounds: list[NotificationSound] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Notification(ObjectBase):
     id: int = ...
     date: int = ...
     is_silent: bool = ...
     type: NotificationType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class NotificationGroup(ObjectBase):
     id: int = ...
     type: NotificationGroupType | None = ...
@@ -8029,210 +8029,210 @@ class NotificationGroup(ObjectBase):
     total_count: int = ...
     notifications: list[Notification] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class OptionValue(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class OptionValueBoolean(OptionValue):
     value: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class OptionValueEmpty(OptionValue): ...
 
-@dataclass
+@dataclass(slots=True)
 class OptionValueInteger(OptionValue):
     value: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class OptionValueString(OptionValue):
     value: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class JsonObjectMember(ObjectBase):
     key: str = ...
     value: JsonValue | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class JsonValue(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class JsonValueNull(JsonValue): ...
 
-@dataclass
+@dataclass(slots=True)
 class JsonValueBoolean(JsonValue):
     value: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class JsonValueNumber(JsonValue):
     value: float = ...
 
-@dataclass
+@dataclass(slots=True)
 class JsonValueString(JsonValue):
     value: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class JsonValueArray(JsonValue):
     values: list[JsonValue] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class JsonValueObject(JsonValue):
     members: list[JsonObjectMember] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryPrivacySettings(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryPrivacySettingsEveryone(StoryPrivacySettings):
     except_user_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryPrivacySettingsContacts(StoryPrivacySettings):
     except_user_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryPrivacySettingsCloseFriends(StoryPrivacySettings): ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryPrivacySettingsSelectedUsers(StoryPrivacySettings):
     user_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySettingRule(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySettingRuleAllowAll(UserPrivacySettingRule): ...
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySettingRuleAllowContacts(UserPrivacySettingRule): ...
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySettingRuleAllowBots(UserPrivacySettingRule): ...
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySettingRuleAllowPremiumUsers(UserPrivacySettingRule): ...
 
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySettingRuleAllowUsers(UserPrivacySettingRule):
     user_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySettingRuleAllowChatMembers(UserPrivacySettingRule):
     chat_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySettingRuleRestrictAll(UserPrivacySettingRule): ...
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySettingRuleRestrictContacts(UserPrivacySettingRule): ...
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySettingRuleRestrictBots(UserPrivacySettingRule): ...
 
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySettingRuleRestrictUsers(UserPrivacySettingRule):
     user_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySettingRuleRestrictChatMembers(UserPrivacySettingRule):
     chat_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySettingRules(ObjectBase):
     rules: list[UserPrivacySettingRule] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySetting(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySettingShowStatus(UserPrivacySetting): ...
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySettingShowProfilePhoto(UserPrivacySetting): ...
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySettingShowLinkInForwardedMessages(UserPrivacySetting): ...
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySettingShowPhoneNumber(UserPrivacySetting): ...
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySettingShowBio(UserPrivacySetting): ...
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySettingShowBirthdate(UserPrivacySetting): ...
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySettingShowProfileAudio(UserPrivacySetting): ...
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySettingAllowChatInvites(UserPrivacySetting): ...
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySettingAllowCalls(UserPrivacySetting): ...
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySettingAllowPeerToPeerCalls(UserPrivacySetting): ...
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySettingAllowFindingByPhoneNumber(UserPrivacySetting): ...
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySettingAllowPrivateVoiceAndVideoNoteMessages(UserPrivacySetting): ...
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySettingAutosaveGifts(UserPrivacySetting): ...
-@dataclass
+@dataclass(slots=True)
 class UserPrivacySettingAllowUnpaidMessages(UserPrivacySetting): ...
 
-@dataclass
+@dataclass(slots=True)
 class ReadDatePrivacySettings(ObjectBase):
     show_read_date: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class NewChatPrivacySettings(ObjectBase):
     allow_new_chats_from_unknown_users: bool = ...
     incoming_paid_message_star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CanSendMessageToUserResult(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class CanSendMessageToUserResultOk(CanSendMessageToUserResult): ...
 
-@dataclass
+@dataclass(slots=True)
 class CanSendMessageToUserResultUserHasPaidMessages(CanSendMessageToUserResult):
     outgoing_paid_message_star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CanSendMessageToUserResultUserIsDeleted(CanSendMessageToUserResult): ...
-@dataclass
+@dataclass(slots=True)
 class CanSendMessageToUserResultUserRestrictsNewChats(CanSendMessageToUserResult): ...
 
-@dataclass
+@dataclass(slots=True)
 class AccountTtl(ObjectBase):
     days: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageAutoDeleteTime(ObjectBase):
     time: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SessionType(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class SessionTypeAndroid(SessionType): ...
-@dataclass
+@dataclass(slots=True)
 class SessionTypeApple(SessionType): ...
-@dataclass
+@dataclass(slots=True)
 class SessionTypeBrave(SessionType): ...
-@dataclass
+@dataclass(slots=True)
 class SessionTypeChrome(SessionType): ...
-@dataclass
+@dataclass(slots=True)
 class SessionTypeEdge(SessionType): ...
-@dataclass
+@dataclass(slots=True)
 class SessionTypeFirefox(SessionType): ...
-@dataclass
+@dataclass(slots=True)
 class SessionTypeIpad(SessionType): ...
-@dataclass
+@dataclass(slots=True)
 class SessionTypeIphone(SessionType): ...
-@dataclass
+@dataclass(slots=True)
 class SessionTypeLinux(SessionType): ...
-@dataclass
+@dataclass(slots=True)
 class SessionTypeMac(SessionType): ...
-@dataclass
+@dataclass(slots=True)
 class SessionTypeOpera(SessionType): ...
-@dataclass
+@dataclass(slots=True)
 class SessionTypeSafari(SessionType): ...
-@dataclass
+@dataclass(slots=True)
 class SessionTypeUbuntu(SessionType): ...
-@dataclass
+@dataclass(slots=True)
 class SessionTypeUnknown(SessionType): ...
-@dataclass
+@dataclass(slots=True)
 class SessionTypeVivaldi(SessionType): ...
-@dataclass
+@dataclass(slots=True)
 class SessionTypeWindows(SessionType): ...
-@dataclass
+@dataclass(slots=True)
 class SessionTypeXbox(SessionType): ...
 
-@dataclass
+@dataclass(slots=True)
 class Session(ObjectBase):
     id: int = ...
     is_current: bool = ...
@@ -8253,19 +8253,19 @@ class Session(ObjectBase):
     ip_address: str = ...
     location: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class Sessions(ObjectBase):
     sessions: list[Session] | None = ...
     inactive_session_ttl_days: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UnconfirmedSession(ObjectBase):
     id: int = ...
     log_in_date: int = ...
     device_model: str = ...
     location: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ConnectedWebsite(ObjectBase):
     id: int = ...
     domain_name: str = ...
@@ -8277,204 +8277,204 @@ class ConnectedWebsite(ObjectBase):
     ip_address: str = ...
     location: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ConnectedWebsites(ObjectBase):
     websites: list[ConnectedWebsite] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReportReason(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class ReportReasonSpam(ReportReason): ...
-@dataclass
+@dataclass(slots=True)
 class ReportReasonViolence(ReportReason): ...
-@dataclass
+@dataclass(slots=True)
 class ReportReasonPornography(ReportReason): ...
-@dataclass
+@dataclass(slots=True)
 class ReportReasonChildAbuse(ReportReason): ...
-@dataclass
+@dataclass(slots=True)
 class ReportReasonCopyright(ReportReason): ...
-@dataclass
+@dataclass(slots=True)
 class ReportReasonUnrelatedLocation(ReportReason): ...
-@dataclass
+@dataclass(slots=True)
 class ReportReasonFake(ReportReason): ...
-@dataclass
+@dataclass(slots=True)
 class ReportReasonIllegalDrugs(ReportReason): ...
-@dataclass
+@dataclass(slots=True)
 class ReportReasonPersonalDetails(ReportReason): ...
-@dataclass
+@dataclass(slots=True)
 class ReportReasonCustom(ReportReason): ...
-@dataclass
+@dataclass(slots=True)
 class ReportChatResult(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class ReportChatResultOk(ReportChatResult): ...
 
-@dataclass
+@dataclass(slots=True)
 class ReportChatResultOptionRequired(ReportChatResult):
     title: str = ...
     options: list[ReportOption] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReportChatResultTextRequired(ReportChatResult):
     option_id: bytes = ...
     is_optional: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReportChatResultMessagesRequired(ReportChatResult): ...
-@dataclass
+@dataclass(slots=True)
 class ReportStoryResult(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class ReportStoryResultOk(ReportStoryResult): ...
 
-@dataclass
+@dataclass(slots=True)
 class ReportStoryResultOptionRequired(ReportStoryResult):
     title: str = ...
     options: list[ReportOption] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReportStoryResultTextRequired(ReportStoryResult):
     option_id: bytes = ...
     is_optional: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkType(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeActiveSessions(InternalLinkType): ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeAttachmentMenuBot(InternalLinkType):
     target_chat: TargetChat | None = ...
     bot_username: str = ...
     url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeAuthenticationCode(InternalLinkType):
     code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeBackground(InternalLinkType):
     background_name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeBotAddToChannel(InternalLinkType):
     bot_username: str = ...
     administrator_rights: ChatAdministratorRights | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeBotStart(InternalLinkType):
     bot_username: str = ...
     start_parameter: str = ...
     autostart: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeBotStartInGroup(InternalLinkType):
     bot_username: str = ...
     start_parameter: str = ...
     administrator_rights: ChatAdministratorRights | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeBusinessChat(InternalLinkType):
     link_name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeBuyStars(InternalLinkType):
     star_count: int = ...
     purpose: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeChangePhoneNumber(InternalLinkType): ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeChatAffiliateProgram(InternalLinkType):
     username: str = ...
     referrer: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeChatBoost(InternalLinkType):
     url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeChatFolderInvite(InternalLinkType):
     invite_link: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeChatFolderSettings(InternalLinkType): ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeChatInvite(InternalLinkType):
     invite_link: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeDefaultMessageAutoDeleteTimerSettings(InternalLinkType): ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeDirectMessagesChat(InternalLinkType):
     channel_username: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeEditProfileSettings(InternalLinkType): ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeGame(InternalLinkType):
     bot_username: str = ...
     game_short_name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeGiftAuction(InternalLinkType):
     auction_id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeGiftCollection(InternalLinkType):
     gift_owner_username: str = ...
     collection_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeGroupCall(InternalLinkType):
     invite_link: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeInstantView(InternalLinkType):
     url: str = ...
     fallback_url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeInvoice(InternalLinkType):
     invoice_name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeLanguagePack(InternalLinkType):
     language_pack_id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeLanguageSettings(InternalLinkType): ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeLiveStory(InternalLinkType):
     story_poster_username: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeLoginEmailSettings(InternalLinkType): ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeMainWebApp(InternalLinkType):
     bot_username: str = ...
     start_parameter: str = ...
     mode: WebAppOpenMode | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeMessage(InternalLinkType):
     url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeMessageDraft(InternalLinkType):
     text: FormattedText | None = ...
     contains_link: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeMyStars(InternalLinkType): ...
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeMyToncoins(InternalLinkType): ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypePassportDataRequest(InternalLinkType):
     bot_user_id: int = ...
     scope: str = ...
@@ -8482,113 +8482,113 @@ class InternalLinkTypePassportDataRequest(InternalLinkType):
     nonce: str = ...
     callback_url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypePasswordSettings(InternalLinkType): ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypePhoneNumberConfirmation(InternalLinkType):
     hash: str = ...
     phone_number: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypePhoneNumberPrivacySettings(InternalLinkType): ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypePremiumFeatures(InternalLinkType):
     referrer: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypePremiumGift(InternalLinkType):
     referrer: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypePremiumGiftCode(InternalLinkType):
     code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypePrivacyAndSecuritySettings(InternalLinkType): ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeProxy(InternalLinkType):
     server: str = ...
     port: int = ...
     type: ProxyType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypePublicChat(InternalLinkType):
     chat_username: str = ...
     draft_text: str = ...
     open_profile: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeQrCodeAuthentication(InternalLinkType): ...
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeRestorePurchases(InternalLinkType): ...
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeSettings(InternalLinkType): ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeStickerSet(InternalLinkType):
     sticker_set_name: str = ...
     expect_custom_emoji: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeStory(InternalLinkType):
     story_poster_username: str = ...
     story_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeStoryAlbum(InternalLinkType):
     story_album_owner_username: str = ...
     story_album_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeTheme(InternalLinkType):
     theme_name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeThemeSettings(InternalLinkType): ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeUnknownDeepLink(InternalLinkType):
     link: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeUnsupportedProxy(InternalLinkType): ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeUpgradedGift(InternalLinkType):
     name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeUserPhoneNumber(InternalLinkType):
     phone_number: str = ...
     draft_text: str = ...
     open_profile: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeUserToken(InternalLinkType):
     token: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeVideoChat(InternalLinkType):
     chat_username: str = ...
     invite_hash: str = ...
     is_live_stream: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class InternalLinkTypeWebApp(InternalLinkType):
     bot_username: str = ...
     web_app_short_name: str = ...
     start_parameter: str = ...
     mode: WebAppOpenMode | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageLink(ObjectBase):
     link: str = ...
     is_public: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageLinkInfo(ObjectBase):
     is_public: bool = ...
     chat_id: int = ...
@@ -8597,91 +8597,91 @@ class MessageLinkInfo(ObjectBase):
     media_timestamp: int = ...
     for_album: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatBoostLink(ObjectBase):
     link: str = ...
     is_public: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatBoostLinkInfo(ObjectBase):
     is_public: bool = ...
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class BlockList(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class BlockListMain(BlockList): ...
-@dataclass
+@dataclass(slots=True)
 class BlockListStories(BlockList): ...
-@dataclass
+@dataclass(slots=True)
 class FileType(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class FileTypeNone(FileType): ...
-@dataclass
+@dataclass(slots=True)
 class FileTypeAnimation(FileType): ...
-@dataclass
+@dataclass(slots=True)
 class FileTypeAudio(FileType): ...
-@dataclass
+@dataclass(slots=True)
 class FileTypeDocument(FileType): ...
-@dataclass
+@dataclass(slots=True)
 class FileTypeNotificationSound(FileType): ...
-@dataclass
+@dataclass(slots=True)
 class FileTypePhoto(FileType): ...
-@dataclass
+@dataclass(slots=True)
 class FileTypePhotoStory(FileType): ...
-@dataclass
+@dataclass(slots=True)
 class FileTypeProfilePhoto(FileType): ...
-@dataclass
+@dataclass(slots=True)
 class FileTypeSecret(FileType): ...
-@dataclass
+@dataclass(slots=True)
 class FileTypeSecretThumbnail(FileType): ...
-@dataclass
+@dataclass(slots=True)
 class FileTypeSecure(FileType): ...
-@dataclass
+@dataclass(slots=True)
 class FileTypeSelfDestructingPhoto(FileType): ...
-@dataclass
+@dataclass(slots=True)
 class FileTypeSelfDestructingVideo(FileType): ...
-@dataclass
+@dataclass(slots=True)
 class FileTypeSelfDestructingVideoNote(FileType): ...
-@dataclass
+@dataclass(slots=True)
 class FileTypeSelfDestructingVoiceNote(FileType): ...
-@dataclass
+@dataclass(slots=True)
 class FileTypeSticker(FileType): ...
-@dataclass
+@dataclass(slots=True)
 class FileTypeThumbnail(FileType): ...
-@dataclass
+@dataclass(slots=True)
 class FileTypeUnknown(FileType): ...
-@dataclass
+@dataclass(slots=True)
 class FileTypeVideo(FileType): ...
-@dataclass
+@dataclass(slots=True)
 class FileTypeVideoNote(FileType): ...
-@dataclass
+@dataclass(slots=True)
 class FileTypeVideoStory(FileType): ...
-@dataclass
+@dataclass(slots=True)
 class FileTypeVoiceNote(FileType): ...
-@dataclass
+@dataclass(slots=True)
 class FileTypeWallpaper(FileType): ...
 
-@dataclass
+@dataclass(slots=True)
 class StorageStatisticsByFileType(ObjectBase):
     file_type: FileType | None = ...
     size: int = ...
     count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StorageStatisticsByChat(ObjectBase):
     chat_id: int = ...
     size: int = ...
     count: int = ...
     by_file_type: list[StorageStatisticsByFileType] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StorageStatistics(ObjectBase):
     size: int = ...
     count: int = ...
     by_chat: list[StorageStatisticsByChat] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StorageStatisticsFast(ObjectBase):
     files_size: int = ...
     file_count: int = ...
@@ -8689,45 +8689,45 @@ class StorageStatisticsFast(ObjectBase):
     language_pack_database_size: int = ...
     log_size: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseStatistics(ObjectBase):
     statistics: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class NetworkType(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class NetworkTypeNone(NetworkType): ...
-@dataclass
+@dataclass(slots=True)
 class NetworkTypeMobile(NetworkType): ...
-@dataclass
+@dataclass(slots=True)
 class NetworkTypeMobileRoaming(NetworkType): ...
-@dataclass
+@dataclass(slots=True)
 class NetworkTypeWiFi(NetworkType): ...
-@dataclass
+@dataclass(slots=True)
 class NetworkTypeOther(NetworkType): ...
-@dataclass
+@dataclass(slots=True)
 class NetworkStatisticsEntry(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class NetworkStatisticsEntryFile(NetworkStatisticsEntry):
     file_type: FileType | None = ...
     network_type: NetworkType | None = ...
     sent_bytes: int = ...
     received_bytes: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class NetworkStatisticsEntryCall(NetworkStatisticsEntry):
     network_type: NetworkType | None = ...
     sent_bytes: int = ...
     received_bytes: int = ...
     duration: float = ...
 
-@dataclass
+@dataclass(slots=True)
 class NetworkStatistics(ObjectBase):
     since_date: int = ...
     entries: list[NetworkStatisticsEntry] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class AutoDownloadSettings(ObjectBase):
     is_auto_download_enabled: bool = ...
     max_photo_file_size: int = ...
@@ -8739,225 +8739,225 @@ class AutoDownloadSettings(ObjectBase):
     preload_stories: bool = ...
     use_less_data_for_calls: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class AutoDownloadSettingsPresets(ObjectBase):
     low: AutoDownloadSettings | None = ...
     medium: AutoDownloadSettings | None = ...
     high: AutoDownloadSettings | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class AutosaveSettingsScope(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class AutosaveSettingsScopePrivateChats(AutosaveSettingsScope): ...
-@dataclass
+@dataclass(slots=True)
 class AutosaveSettingsScopeGroupChats(AutosaveSettingsScope): ...
-@dataclass
+@dataclass(slots=True)
 class AutosaveSettingsScopeChannelChats(AutosaveSettingsScope): ...
 
-@dataclass
+@dataclass(slots=True)
 class AutosaveSettingsScopeChat(AutosaveSettingsScope):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ScopeAutosaveSettings(ObjectBase):
     autosave_photos: bool = ...
     autosave_videos: bool = ...
     max_video_file_size: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AutosaveSettingsException(ObjectBase):
     chat_id: int = ...
     settings: ScopeAutosaveSettings | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class AutosaveSettings(ObjectBase):
     private_chat_settings: ScopeAutosaveSettings | None = ...
     group_settings: ScopeAutosaveSettings | None = ...
     channel_settings: ScopeAutosaveSettings | None = ...
     exceptions: list[AutosaveSettingsException] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionState(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class ConnectionStateWaitingForNetwork(ConnectionState): ...
-@dataclass
+@dataclass(slots=True)
 class ConnectionStateConnectingToProxy(ConnectionState): ...
-@dataclass
+@dataclass(slots=True)
 class ConnectionStateConnecting(ConnectionState): ...
-@dataclass
+@dataclass(slots=True)
 class ConnectionStateUpdating(ConnectionState): ...
-@dataclass
+@dataclass(slots=True)
 class ConnectionStateReady(ConnectionState): ...
 
-@dataclass
+@dataclass(slots=True)
 class AgeVerificationParameters(ObjectBase):
     min_age: int = ...
     verification_bot_username: str = ...
     country: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class TopChatCategory(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class TopChatCategoryUsers(TopChatCategory): ...
-@dataclass
+@dataclass(slots=True)
 class TopChatCategoryBots(TopChatCategory): ...
-@dataclass
+@dataclass(slots=True)
 class TopChatCategoryGroups(TopChatCategory): ...
-@dataclass
+@dataclass(slots=True)
 class TopChatCategoryChannels(TopChatCategory): ...
-@dataclass
+@dataclass(slots=True)
 class TopChatCategoryInlineBots(TopChatCategory): ...
-@dataclass
+@dataclass(slots=True)
 class TopChatCategoryWebAppBots(TopChatCategory): ...
-@dataclass
+@dataclass(slots=True)
 class TopChatCategoryCalls(TopChatCategory): ...
-@dataclass
+@dataclass(slots=True)
 class TopChatCategoryForwardChats(TopChatCategory): ...
 
-@dataclass
+@dataclass(slots=True)
 class FoundPosition(ObjectBase):
     position: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class FoundPositions(ObjectBase):
     total_count: int = ...
     positions: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class TMeUrlType(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class TMeUrlTypeUser(TMeUrlType):
     user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class TMeUrlTypeSupergroup(TMeUrlType):
     supergroup_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class TMeUrlTypeChatInvite(TMeUrlType):
     info: ChatInviteLinkInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class TMeUrlTypeStickerSet(TMeUrlType):
     sticker_set_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class TMeUrl(ObjectBase):
     url: str = ...
     type: TMeUrlType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class TMeUrls(ObjectBase):
     urls: list[TMeUrl] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SuggestedAction(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class SuggestedActionEnableArchiveAndMuteNewChats(SuggestedAction): ...
-@dataclass
+@dataclass(slots=True)
 class SuggestedActionCheckPassword(SuggestedAction): ...
-@dataclass
+@dataclass(slots=True)
 class SuggestedActionCheckPhoneNumber(SuggestedAction): ...
-@dataclass
+@dataclass(slots=True)
 class SuggestedActionViewChecksHint(SuggestedAction): ...
 
-@dataclass
+@dataclass(slots=True)
 class SuggestedActionConvertToBroadcastGroup(SuggestedAction):
     supergroup_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SuggestedActionSetPassword(SuggestedAction):
     authorization_delay: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SuggestedActionUpgradePremium(SuggestedAction): ...
-@dataclass
+@dataclass(slots=True)
 class SuggestedActionRestorePremium(SuggestedAction): ...
-@dataclass
+@dataclass(slots=True)
 class SuggestedActionSubscribeToAnnualPremium(SuggestedAction): ...
-@dataclass
+@dataclass(slots=True)
 class SuggestedActionGiftPremiumForChristmas(SuggestedAction): ...
-@dataclass
+@dataclass(slots=True)
 class SuggestedActionSetBirthdate(SuggestedAction): ...
-@dataclass
+@dataclass(slots=True)
 class SuggestedActionSetProfilePhoto(SuggestedAction): ...
 
-@dataclass
+@dataclass(slots=True)
 class SuggestedActionExtendPremium(SuggestedAction):
     manage_premium_subscription_url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SuggestedActionExtendStarSubscriptions(SuggestedAction): ...
 
-@dataclass
+@dataclass(slots=True)
 class SuggestedActionCustom(SuggestedAction):
     name: str = ...
     title: FormattedText | None = ...
     description: FormattedText | None = ...
     url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SuggestedActionSetLoginEmailAddress(SuggestedAction):
     can_be_hidden: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class Count(ObjectBase):
     count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class Text(ObjectBase):
     text: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class Data(ObjectBase):
     data: bytes = ...
 
-@dataclass
+@dataclass(slots=True)
 class Seconds(ObjectBase):
     seconds: float = ...
 
-@dataclass
+@dataclass(slots=True)
 class FileDownloadedPrefixSize(ObjectBase):
     size: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarCount(ObjectBase):
     star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeepLinkInfo(ObjectBase):
     text: FormattedText | None = ...
     need_update_application: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class TextParseMode(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class TextParseModeMarkdown(TextParseMode):
     version: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class TextParseModeHTML(TextParseMode): ...
-@dataclass
+@dataclass(slots=True)
 class ProxyType(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class ProxyTypeSocks5(ProxyType):
     username: str = ...
     password: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ProxyTypeHttp(ProxyType):
     username: str = ...
     password: str = ...
     http_only: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ProxyTypeMtproto(ProxyType):
     secret: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class Proxy(ObjectBase):
     id: int = ...
     server: str = ...
@@ -8966,11 +8966,11 @@ class Proxy(ObjectBase):
     is_enabled: bool = ...
     type: ProxyType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class Proxies(ObjectBase):
     proxies: list[Proxy] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InputSticker(ObjectBase):
     sticker: InputFile | None = ...
     format: StickerFormat | None = ...
@@ -8978,73 +8978,73 @@ class InputSticker(ObjectBase):
     mask_position: MaskPosition | None = ...
     keywords: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class DateRange(ObjectBase):
     start_date: int = ...
     end_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StatisticalValue(ObjectBase):
     value: float = ...
     previous_value: float = ...
     growth_rate_percentage: float = ...
 
-@dataclass
+@dataclass(slots=True)
 class StatisticalGraph(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class StatisticalGraphData(StatisticalGraph):
     json_data: str = ...
     zoom_token: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class StatisticalGraphAsync(StatisticalGraph):
     token: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class StatisticalGraphError(StatisticalGraph):
     error_message: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatStatisticsObjectType(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatStatisticsObjectTypeMessage(ChatStatisticsObjectType):
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatStatisticsObjectTypeStory(ChatStatisticsObjectType):
     story_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatStatisticsInteractionInfo(ObjectBase):
     object_type: ChatStatisticsObjectType | None = ...
     view_count: int = ...
     forward_count: int = ...
     reaction_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatStatisticsMessageSenderInfo(ObjectBase):
     user_id: int = ...
     sent_message_count: int = ...
     average_character_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatStatisticsAdministratorActionsInfo(ObjectBase):
     user_id: int = ...
     deleted_message_count: int = ...
     banned_user_count: int = ...
     restricted_user_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatStatisticsInviterInfo(ObjectBase):
     user_id: int = ...
     added_member_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatStatistics(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatStatisticsSupergroup(ChatStatistics):
     period: DateRange | None = ...
     member_count: StatisticalValue | None = ...
@@ -9063,7 +9063,7 @@ class ChatStatisticsSupergroup(ChatStatistics):
     top_administrators: list[ChatStatisticsAdministratorActionsInfo] | None = ...
     top_inviters: list[ChatStatisticsInviterInfo] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatStatisticsChannel(ChatStatistics):
     period: DateRange | None = ...
     member_count: StatisticalValue | None = ...
@@ -9088,7 +9088,7 @@ class ChatStatisticsChannel(ChatStatistics):
     instant_view_interaction_graph: StatisticalGraph | None = ...
     recent_interactions: list[ChatStatisticsInteractionInfo] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatRevenueAmount(ObjectBase):
     cryptocurrency: str = ...
     total_amount: int = ...
@@ -9096,71 +9096,71 @@ class ChatRevenueAmount(ObjectBase):
     available_amount: int = ...
     withdrawal_enabled: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatRevenueStatistics(ObjectBase):
     revenue_by_hour_graph: StatisticalGraph | None = ...
     revenue_graph: StatisticalGraph | None = ...
     revenue_amount: ChatRevenueAmount | None = ...
     usd_rate: float = ...
 
-@dataclass
+@dataclass(slots=True)
 class MessageStatistics(ObjectBase):
     message_interaction_graph: StatisticalGraph | None = ...
     message_reaction_graph: StatisticalGraph | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StoryStatistics(ObjectBase):
     story_interaction_graph: StatisticalGraph | None = ...
     story_reaction_graph: StatisticalGraph | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class RevenueWithdrawalState(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class RevenueWithdrawalStatePending(RevenueWithdrawalState): ...
 
-@dataclass
+@dataclass(slots=True)
 class RevenueWithdrawalStateSucceeded(RevenueWithdrawalState):
     date: int = ...
     url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class RevenueWithdrawalStateFailed(RevenueWithdrawalState): ...
-@dataclass
+@dataclass(slots=True)
 class ChatRevenueTransactionType(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class ChatRevenueTransactionTypeUnsupported(ChatRevenueTransactionType): ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatRevenueTransactionTypeSponsoredMessageEarnings(ChatRevenueTransactionType):
     start_date: int = ...
     end_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatRevenueTransactionTypeSuggestedPostEarnings(ChatRevenueTransactionType):
     user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatRevenueTransactionTypeFragmentWithdrawal(ChatRevenueTransactionType):
     withdrawal_date: int = ...
     state: RevenueWithdrawalState | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatRevenueTransactionTypeFragmentRefund(ChatRevenueTransactionType):
     refund_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatRevenueTransaction(ObjectBase):
     cryptocurrency: str = ...
     cryptocurrency_amount: int = ...
     type: ChatRevenueTransactionType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChatRevenueTransactions(ObjectBase):
     ton_amount: int = ...
     transactions: list[ChatRevenueTransaction] | None = ...
     next_offset: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarRevenueStatus(ObjectBase):
     total_amount: StarAmount | None = ...
     current_amount: StarAmount | None = ...
@@ -9168,182 +9168,182 @@ class StarRevenueStatus(ObjectBase):
     withdrawal_enabled: bool = ...
     next_withdrawal_in: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StarRevenueStatistics(ObjectBase):
     revenue_by_day_graph: StatisticalGraph | None = ...
     status: StarRevenueStatus | None = ...
     usd_rate: float = ...
 
-@dataclass
+@dataclass(slots=True)
 class TonRevenueStatus(ObjectBase):
     total_amount: int = ...
     balance_amount: int = ...
     available_amount: int = ...
     withdrawal_enabled: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class TonRevenueStatistics(ObjectBase):
     revenue_by_day_graph: StatisticalGraph | None = ...
     status: TonRevenueStatus | None = ...
     usd_rate: float = ...
 
-@dataclass
+@dataclass(slots=True)
 class Point(ObjectBase):
     x: float = ...
     y: float = ...
 
-@dataclass
+@dataclass(slots=True)
 class VectorPathCommand(ObjectBase): ...
 
-@dataclass
+@dataclass(slots=True)
 class VectorPathCommandLine(VectorPathCommand):
     end_point: Point | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class VectorPathCommandCubicBezierCurve(VectorPathCommand):
     start_control_point: Point | None = ...
     end_control_point: Point | None = ...
     end_point: Point | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class BotCommandScope(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class BotCommandScopeDefault(BotCommandScope): ...
-@dataclass
+@dataclass(slots=True)
 class BotCommandScopeAllPrivateChats(BotCommandScope): ...
-@dataclass
+@dataclass(slots=True)
 class BotCommandScopeAllGroupChats(BotCommandScope): ...
-@dataclass
+@dataclass(slots=True)
 class BotCommandScopeAllChatAdministrators(BotCommandScope): ...
 
-@dataclass
+@dataclass(slots=True)
 class BotCommandScopeChat(BotCommandScope):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class BotCommandScopeChatAdministrators(BotCommandScope):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class BotCommandScopeChatMember(BotCommandScope):
     chat_id: int = ...
     user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PhoneNumberCodeType(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class PhoneNumberCodeTypeChange(PhoneNumberCodeType): ...
-@dataclass
+@dataclass(slots=True)
 class PhoneNumberCodeTypeVerify(PhoneNumberCodeType): ...
 
-@dataclass
+@dataclass(slots=True)
 class PhoneNumberCodeTypeConfirmOwnership(PhoneNumberCodeType):
     hash: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateAuthorizationState(Update):
     authorization_state: AuthorizationState | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateNewMessage(Update):
     message: Message | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateMessageSendAcknowledged(Update):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateMessageSendSucceeded(Update):
     message: Message | None = ...
     old_message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateMessageSendFailed(Update):
     message: Message | None = ...
     old_message_id: int = ...
     error: Error | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateMessageContent(Update):
     chat_id: int = ...
     message_id: int = ...
     new_content: MessageContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateMessageEdited(Update):
     chat_id: int = ...
     message_id: int = ...
     edit_date: int = ...
     reply_markup: ReplyMarkup | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateMessageIsPinned(Update):
     chat_id: int = ...
     message_id: int = ...
     is_pinned: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateMessageInteractionInfo(Update):
     chat_id: int = ...
     message_id: int = ...
     interaction_info: MessageInteractionInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateMessageContentOpened(Update):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateMessageMentionRead(Update):
     chat_id: int = ...
     message_id: int = ...
     unread_mention_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateMessageUnreadReactions(Update):
     chat_id: int = ...
     message_id: int = ...
     unread_reactions: list[UnreadReaction] | None = ...
     unread_reaction_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateMessageFactCheck(Update):
     chat_id: int = ...
     message_id: int = ...
     fact_check: FactCheck | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateMessageSuggestedPostInfo(Update):
     chat_id: int = ...
     message_id: int = ...
     suggested_post_info: SuggestedPostInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateMessageLiveLocationViewed(Update):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateVideoPublished(Update):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateNewChat(Update):
     chat: Chat | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatTitle(Update):
     chat_id: int = ...
     title: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatPhoto(Update):
     chat_id: int = ...
     photo: ChatPhotoInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatAccentColors(Update):
     chat_id: int = ...
     accent_color_id: int = ...
@@ -9352,205 +9352,205 @@ class UpdateChatAccentColors(Update):
     profile_accent_color_id: int = ...
     profile_background_custom_emoji_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatPermissions(Update):
     chat_id: int = ...
     permissions: ChatPermissions | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatLastMessage(Update):
     chat_id: int = ...
     last_message: Message | None = ...
     positions: list[ChatPosition] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatPosition(Update):
     chat_id: int = ...
     position: ChatPosition | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatAddedToList(Update):
     chat_id: int = ...
     chat_list: ChatList | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatRemovedFromList(Update):
     chat_id: int = ...
     chat_list: ChatList | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatReadInbox(Update):
     chat_id: int = ...
     last_read_inbox_message_id: int = ...
     unread_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatReadOutbox(Update):
     chat_id: int = ...
     last_read_outbox_message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatActionBar(Update):
     chat_id: int = ...
     action_bar: ChatActionBar | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatBusinessBotManageBar(Update):
     chat_id: int = ...
     business_bot_manage_bar: BusinessBotManageBar | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatAvailableReactions(Update):
     chat_id: int = ...
     available_reactions: ChatAvailableReactions | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatDraftMessage(Update):
     chat_id: int = ...
     draft_message: DraftMessage | None = ...
     positions: list[ChatPosition] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatEmojiStatus(Update):
     chat_id: int = ...
     emoji_status: EmojiStatus | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatMessageSender(Update):
     chat_id: int = ...
     message_sender_id: MessageSender | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatMessageAutoDeleteTime(Update):
     chat_id: int = ...
     message_auto_delete_time: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatNotificationSettings(Update):
     chat_id: int = ...
     notification_settings: ChatNotificationSettings | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatPendingJoinRequests(Update):
     chat_id: int = ...
     pending_join_requests: ChatJoinRequestsInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatReplyMarkup(Update):
     chat_id: int = ...
     reply_markup_message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatBackground(Update):
     chat_id: int = ...
     background: ChatBackground | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatTheme(Update):
     chat_id: int = ...
     theme: ChatTheme | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatUnreadMentionCount(Update):
     chat_id: int = ...
     unread_mention_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatUnreadReactionCount(Update):
     chat_id: int = ...
     unread_reaction_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatVideoChat(Update):
     chat_id: int = ...
     video_chat: VideoChat | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatDefaultDisableNotification(Update):
     chat_id: int = ...
     default_disable_notification: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatHasProtectedContent(Update):
     chat_id: int = ...
     has_protected_content: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatIsTranslatable(Update):
     chat_id: int = ...
     is_translatable: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatIsMarkedAsUnread(Update):
     chat_id: int = ...
     is_marked_as_unread: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatViewAsTopics(Update):
     chat_id: int = ...
     view_as_topics: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatBlockList(Update):
     chat_id: int = ...
     block_list: BlockList | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatHasScheduledMessages(Update):
     chat_id: int = ...
     has_scheduled_messages: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatFolders(Update):
     chat_folders: list[ChatFolderInfo] | None = ...
     main_chat_list_position: int = ...
     are_tags_enabled: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatOnlineMemberCount(Update):
     chat_id: int = ...
     online_member_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateSavedMessagesTopic(Update):
     topic: SavedMessagesTopic | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateSavedMessagesTopicCount(Update):
     topic_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateDirectMessagesChatTopic(Update):
     topic: DirectMessagesChatTopic | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateTopicMessageCount(Update):
     chat_id: int = ...
     topic_id: MessageTopic | None = ...
     message_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateQuickReplyShortcut(Update):
     shortcut: QuickReplyShortcut | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateQuickReplyShortcutDeleted(Update):
     shortcut_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateQuickReplyShortcuts(Update):
     shortcut_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateQuickReplyShortcutMessages(Update):
     shortcut_id: int = ...
     messages: list[QuickReplyMessage] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateForumTopicInfo(Update):
     info: ForumTopicInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateForumTopic(Update):
     chat_id: int = ...
     forum_topic_id: int = ...
@@ -9562,21 +9562,21 @@ class UpdateForumTopic(Update):
     notification_settings: ChatNotificationSettings | None = ...
     draft_message: DraftMessage | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateScopeNotificationSettings(Update):
     scope: NotificationSettingsScope | None = ...
     notification_settings: ScopeNotificationSettings | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateReactionNotificationSettings(Update):
     notification_settings: ReactionNotificationSettings | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateNotification(Update):
     notification_group_id: int = ...
     notification: Notification | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateNotificationGroup(Update):
     notification_group_id: int = ...
     type: NotificationGroupType | None = ...
@@ -9587,203 +9587,203 @@ class UpdateNotificationGroup(Update):
     added_notifications: list[Notification] | None = ...
     removed_notification_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateActiveNotifications(Update):
     groups: list[NotificationGroup] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateHavePendingNotifications(Update):
     have_delayed_notifications: bool = ...
     have_unreceived_notifications: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateDeleteMessages(Update):
     chat_id: int = ...
     message_ids: list[int] | None = ...
     is_permanent: bool = ...
     from_cache: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatAction(Update):
     chat_id: int = ...
     topic_id: MessageTopic | None = ...
     sender_id: MessageSender | None = ...
     action: ChatAction | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdatePendingTextMessage(Update):
     chat_id: int = ...
     forum_topic_id: int = ...
     draft_id: int = ...
     text: FormattedText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateUserStatus(Update):
     user_id: int = ...
     status: UserStatus | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateUser(Update):
     user: User | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateBasicGroup(Update):
     basic_group: BasicGroup | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateSupergroup(Update):
     supergroup: Supergroup | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateSecretChat(Update):
     secret_chat: SecretChat | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateUserFullInfo(Update):
     user_id: int = ...
     user_full_info: UserFullInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateBasicGroupFullInfo(Update):
     basic_group_id: int = ...
     basic_group_full_info: BasicGroupFullInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateSupergroupFullInfo(Update):
     supergroup_id: int = ...
     supergroup_full_info: SupergroupFullInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateServiceNotification(Update):
     type: str = ...
     content: MessageContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateFile(Update):
     file: File | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateFileGenerationStart(Update):
     generation_id: int = ...
     original_path: str = ...
     destination_path: str = ...
     conversion: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateFileGenerationStop(Update):
     generation_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateFileDownloads(Update):
     total_size: int = ...
     total_count: int = ...
     downloaded_size: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateFileAddedToDownloads(Update):
     file_download: FileDownload | None = ...
     counts: DownloadedFileCounts | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateFileDownload(Update):
     file_id: int = ...
     complete_date: int = ...
     is_paused: bool = ...
     counts: DownloadedFileCounts | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateFileRemovedFromDownloads(Update):
     file_id: int = ...
     counts: DownloadedFileCounts | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateApplicationVerificationRequired(Update):
     verification_id: int = ...
     nonce: str = ...
     cloud_project_number: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateApplicationRecaptchaVerificationRequired(Update):
     verification_id: int = ...
     action: str = ...
     recaptcha_key_id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateCall(Update):
     call: Call | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateGroupCall(Update):
     group_call: GroupCall | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateGroupCallParticipant(Update):
     group_call_id: int = ...
     participant: GroupCallParticipant | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateGroupCallParticipants(Update):
     group_call_id: int = ...
     participant_user_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateGroupCallVerificationState(Update):
     group_call_id: int = ...
     generation: int = ...
     emojis: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateNewGroupCallMessage(Update):
     group_call_id: int = ...
     message: GroupCallMessage | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateNewGroupCallPaidReaction(Update):
     group_call_id: int = ...
     sender_id: MessageSender | None = ...
     star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateGroupCallMessageSendFailed(Update):
     group_call_id: int = ...
     message_id: int = ...
     error: Error | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateGroupCallMessagesDeleted(Update):
     group_call_id: int = ...
     message_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateLiveStoryTopDonors(Update):
     group_call_id: int = ...
     donors: LiveStoryDonors | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateNewCallSignalingData(Update):
     call_id: int = ...
     data: bytes = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateGiftAuctionState(Update):
     state: GiftAuctionState | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateActiveGiftAuctions(Update):
     states: list[GiftAuctionState] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateUserPrivacySettingRules(Update):
     setting: UserPrivacySetting | None = ...
     rules: UserPrivacySettingRules | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateUnreadMessageCount(Update):
     chat_list: ChatList | None = ...
     unread_count: int = ...
     unread_unmuted_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateUnreadChatCount(Update):
     chat_list: ChatList | None = ...
     total_count: int = ...
@@ -9792,250 +9792,250 @@ class UpdateUnreadChatCount(Update):
     marked_as_unread_count: int = ...
     marked_as_unread_unmuted_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateStory(Update):
     story: Story | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateStoryDeleted(Update):
     story_poster_chat_id: int = ...
     story_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateStoryPostSucceeded(Update):
     story: Story | None = ...
     old_story_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateStoryPostFailed(Update):
     story: Story | None = ...
     error: Error | None = ...
     error_type: CanPostStoryResult | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatActiveStories(Update):
     active_stories: ChatActiveStories | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateStoryListChatCount(Update):
     story_list: StoryList | None = ...
     chat_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateStoryStealthMode(Update):
     active_until_date: int = ...
     cooldown_until_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateTrustedMiniAppBots(Update):
     bot_user_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateOption(Update):
     name: str = ...
     value: OptionValue | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateStickerSet(Update):
     sticker_set: StickerSet | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateInstalledStickerSets(Update):
     sticker_type: StickerType | None = ...
     sticker_set_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateTrendingStickerSets(Update):
     sticker_type: StickerType | None = ...
     sticker_sets: TrendingStickerSets | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateRecentStickers(Update):
     is_attached: bool = ...
     sticker_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateFavoriteStickers(Update):
     sticker_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateSavedAnimations(Update):
     animation_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateSavedNotificationSounds(Update):
     notification_sound_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateDefaultBackground(Update):
     for_dark_theme: bool = ...
     background: Background | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateEmojiChatThemes(Update):
     chat_themes: list[EmojiChatTheme] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateAccentColors(Update):
     colors: list[AccentColor] | None = ...
     available_accent_color_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateProfileAccentColors(Update):
     colors: list[ProfileAccentColor] | None = ...
     available_accent_color_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateLanguagePackStrings(Update):
     localization_target: str = ...
     language_pack_id: str = ...
     strings: list[LanguagePackString] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateConnectionState(Update):
     state: ConnectionState | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateFreezeState(Update):
     is_frozen: bool = ...
     freezing_date: int = ...
     deletion_date: int = ...
     appeal_link: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateAgeVerificationParameters(Update):
     parameters: AgeVerificationParameters | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateTermsOfService(Update):
     terms_of_service_id: str = ...
     terms_of_service: TermsOfService | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateUnconfirmedSession(Update):
     session: UnconfirmedSession | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateAttachmentMenuBots(Update):
     bots: list[AttachmentMenuBot] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateWebAppMessageSent(Update):
     web_app_launch_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateActiveEmojiReactions(Update):
     emojis: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateAvailableMessageEffects(Update):
     reaction_effect_ids: list[int] | None = ...
     sticker_effect_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateDefaultReactionType(Update):
     reaction_type: ReactionType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateDefaultPaidReactionType(Update):
     type: PaidReactionType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateSavedMessagesTags(Update):
     saved_messages_topic_id: int = ...
     tags: SavedMessagesTags | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateActiveLiveLocationMessages(Update):
     messages: list[Message] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateOwnedStarCount(Update):
     star_amount: StarAmount | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateOwnedTonCount(Update):
     ton_amount: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatRevenueAmount(Update):
     chat_id: int = ...
     revenue_amount: ChatRevenueAmount | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateStarRevenueStatus(Update):
     owner_id: MessageSender | None = ...
     status: StarRevenueStatus | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateTonRevenueStatus(Update):
     status: TonRevenueStatus | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateSpeechRecognitionTrial(Update):
     max_media_duration: int = ...
     weekly_count: int = ...
     left_count: int = ...
     next_reset_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateGroupCallMessageLevels(Update):
     levels: list[GroupCallMessageLevel] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateDiceEmojis(Update):
     emojis: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateAnimatedEmojiMessageClicked(Update):
     chat_id: int = ...
     message_id: int = ...
     sticker: Sticker | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateAnimationSearchParameters(Update):
     provider: str = ...
     emojis: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateSuggestedActions(Update):
     added_actions: list[SuggestedAction] | None = ...
     removed_actions: list[SuggestedAction] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateSpeedLimitNotification(Update):
     is_upload: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateContactCloseBirthdays(Update):
     close_birthday_users: list[CloseBirthdayUser] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateAutosaveSettings(Update):
     scope: AutosaveSettingsScope | None = ...
     settings: ScopeAutosaveSettings | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateBusinessConnection(Update):
     connection: BusinessConnection | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateNewBusinessMessage(Update):
     connection_id: str = ...
     message: BusinessMessage | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateBusinessMessageEdited(Update):
     connection_id: str = ...
     message: BusinessMessage | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateBusinessMessagesDeleted(Update):
     connection_id: str = ...
     chat_id: int = ...
     message_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateNewInlineQuery(Update):
     id: int = ...
     sender_user_id: int = ...
@@ -10044,7 +10044,7 @@ class UpdateNewInlineQuery(Update):
     query: str = ...
     offset: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateNewChosenInlineResult(Update):
     sender_user_id: int = ...
     user_location: Location | None = ...
@@ -10052,7 +10052,7 @@ class UpdateNewChosenInlineResult(Update):
     result_id: str = ...
     inline_message_id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateNewCallbackQuery(Update):
     id: int = ...
     sender_user_id: int = ...
@@ -10061,7 +10061,7 @@ class UpdateNewCallbackQuery(Update):
     chat_instance: int = ...
     payload: CallbackQueryPayload | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateNewInlineCallbackQuery(Update):
     id: int = ...
     sender_user_id: int = ...
@@ -10069,7 +10069,7 @@ class UpdateNewInlineCallbackQuery(Update):
     chat_instance: int = ...
     payload: CallbackQueryPayload | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateNewBusinessCallbackQuery(Update):
     id: int = ...
     sender_user_id: int = ...
@@ -10078,14 +10078,14 @@ class UpdateNewBusinessCallbackQuery(Update):
     chat_instance: int = ...
     payload: CallbackQueryPayload | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateNewShippingQuery(Update):
     id: int = ...
     sender_user_id: int = ...
     invoice_payload: str = ...
     shipping_address: Address | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateNewPreCheckoutQuery(Update):
     id: int = ...
     sender_user_id: int = ...
@@ -10095,27 +10095,27 @@ class UpdateNewPreCheckoutQuery(Update):
     shipping_option_id: str = ...
     order_info: OrderInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateNewCustomEvent(Update):
     event: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateNewCustomQuery(Update):
     id: int = ...
     data: str = ...
     timeout: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdatePoll(Update):
     poll: Poll | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdatePollAnswer(Update):
     poll_id: int = ...
     voter_id: MessageSender | None = ...
     option_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatMember(Update):
     chat_id: int = ...
     actor_user_id: int = ...
@@ -10126,19 +10126,19 @@ class UpdateChatMember(Update):
     old_chat_member: ChatMember | None = ...
     new_chat_member: ChatMember | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateNewChatJoinRequest(Update):
     chat_id: int = ...
     request: ChatJoinRequest | None = ...
     user_chat_id: int = ...
     invite_link: ChatInviteLink | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateChatBoost(Update):
     chat_id: int = ...
     boost: ChatBoost | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateMessageReaction(Update):
     chat_id: int = ...
     message_id: int = ...
@@ -10147,82 +10147,82 @@ class UpdateMessageReaction(Update):
     old_reaction_types: list[ReactionType] | None = ...
     new_reaction_types: list[ReactionType] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdateMessageReactions(Update):
     chat_id: int = ...
     message_id: int = ...
     date: int = ...
     reactions: list[MessageReaction] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpdatePaidMediaPurchased(Update):
     user_id: int = ...
     payload: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class Updates(ObjectBase):
     updates: list[Update] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LogStream(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class LogStreamDefault(LogStream): ...
 
-@dataclass
+@dataclass(slots=True)
 class LogStreamFile(LogStream):
     path: str = ...
     max_file_size: int = ...
     redirect_stderr: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class LogStreamEmpty(LogStream): ...
 
-@dataclass
+@dataclass(slots=True)
 class LogVerbosityLevel(ObjectBase):
     verbosity_level: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class LogTags(ObjectBase):
     tags: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class UserSupportInfo(ObjectBase):
     message: FormattedText | None = ...
     author: str = ...
     date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class TestInt(ObjectBase):
     value: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class TestString(ObjectBase):
     value: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class TestBytes(ObjectBase):
     value: bytes = ...
 
-@dataclass
+@dataclass(slots=True)
 class TestVectorInt(ObjectBase):
     value: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class TestVectorIntObject(ObjectBase):
     value: list[TestInt] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class TestVectorString(ObjectBase):
     value: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class TestVectorStringObject(ObjectBase):
     value: list[TestString] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetAuthorizationState(Function[AuthorizationState]): ...
 
-@dataclass
+@dataclass(slots=True)
 class SetTdlibParameters(Function[Ok]):
     use_test_dc: bool = ...
     database_directory: str = ...
@@ -10239,103 +10239,103 @@ class SetTdlibParameters(Function[Ok]):
     system_version: str = ...
     application_version: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetAuthenticationPhoneNumber(Function[Ok]):
     phone_number: str = ...
     settings: PhoneNumberAuthenticationSettings | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class CheckAuthenticationPremiumPurchase(Function[Ok]):
     currency: str = ...
     amount: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetAuthenticationPremiumPurchaseTransaction(Function[Ok]):
     transaction: StoreTransaction | None = ...
     is_restore: bool = ...
     currency: str = ...
     amount: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetAuthenticationEmailAddress(Function[Ok]):
     email_address: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ResendAuthenticationCode(Function[Ok]):
     reason: ResendCodeReason | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class CheckAuthenticationEmailCode(Function[Ok]):
     code: EmailAddressAuthentication | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class CheckAuthenticationCode(Function[Ok]):
     code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class RequestQrCodeAuthentication(Function[Ok]):
     other_user_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class RegisterUser(Function[Ok]):
     first_name: str = ...
     last_name: str = ...
     disable_notification: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ResetAuthenticationEmailAddress(Function[Ok]): ...
 
-@dataclass
+@dataclass(slots=True)
 class CheckAuthenticationPassword(Function[Ok]):
     password: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class RequestAuthenticationPasswordRecovery(Function[Ok]): ...
 
-@dataclass
+@dataclass(slots=True)
 class CheckAuthenticationPasswordRecoveryCode(Function[Ok]):
     recovery_code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class RecoverAuthenticationPassword(Function[Ok]):
     recovery_code: str = ...
     new_password: str = ...
     new_hint: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SendAuthenticationFirebaseSms(Function[Ok]):
     token: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReportAuthenticationCodeMissing(Function[Ok]):
     mobile_network_code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class CheckAuthenticationBotToken(Function[Ok]):
     token: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class LogOut(Function[Ok]): ...
-@dataclass
+@dataclass(slots=True)
 class Close(Function[Ok]): ...
-@dataclass
+@dataclass(slots=True)
 class Destroy(Function[Ok]): ...
 
-@dataclass
+@dataclass(slots=True)
 class ConfirmQrCodeAuthentication(Function[Session]):
     link: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetCurrentState(Function[Updates]): ...
 
-@dataclass
+@dataclass(slots=True)
 class SetDatabaseEncryptionKey(Function[Ok]):
     new_encryption_key: bytes = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetPasswordState(Function[PasswordState]): ...
 
-@dataclass
+@dataclass(slots=True)
 class SetPassword(Function[PasswordState]):
     old_password: str = ...
     new_password: str = ...
@@ -10343,281 +10343,281 @@ class SetPassword(Function[PasswordState]):
     set_recovery_email_address: bool = ...
     new_recovery_email_address: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class IsLoginEmailAddressRequired(Function[Ok]): ...
 
-@dataclass
+@dataclass(slots=True)
 class SetLoginEmailAddress(Function[EmailAddressAuthenticationCodeInfo]):
     new_login_email_address: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ResendLoginEmailAddressCode(Function[EmailAddressAuthenticationCodeInfo]): ...
 
-@dataclass
+@dataclass(slots=True)
 class CheckLoginEmailAddressCode(Function[Ok]):
     code: EmailAddressAuthentication | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetRecoveryEmailAddress(Function[RecoveryEmailAddress]):
     password: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetRecoveryEmailAddress(Function[PasswordState]):
     password: str = ...
     new_recovery_email_address: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class CheckRecoveryEmailAddressCode(Function[PasswordState]):
     code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ResendRecoveryEmailAddressCode(Function[PasswordState]): ...
-@dataclass
+@dataclass(slots=True)
 class CancelRecoveryEmailAddressVerification(Function[PasswordState]): ...
-@dataclass
+@dataclass(slots=True)
 class RequestPasswordRecovery(Function[EmailAddressAuthenticationCodeInfo]): ...
 
-@dataclass
+@dataclass(slots=True)
 class CheckPasswordRecoveryCode(Function[Ok]):
     recovery_code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class RecoverPassword(Function[PasswordState]):
     recovery_code: str = ...
     new_password: str = ...
     new_hint: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ResetPassword(Function[ResetPasswordResult]): ...
-@dataclass
+@dataclass(slots=True)
 class CancelPasswordReset(Function[Ok]): ...
 
-@dataclass
+@dataclass(slots=True)
 class CreateTemporaryPassword(Function[TemporaryPasswordState]):
     password: str = ...
     valid_for: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetTemporaryPasswordState(Function[TemporaryPasswordState]): ...
-@dataclass
+@dataclass(slots=True)
 class GetMe(Function[User]): ...
 
-@dataclass
+@dataclass(slots=True)
 class GetUser(Function[User]):
     user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetUserFullInfo(Function[UserFullInfo]):
     user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetBasicGroup(Function[BasicGroup]):
     basic_group_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetBasicGroupFullInfo(Function[BasicGroupFullInfo]):
     basic_group_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetSupergroup(Function[Supergroup]):
     supergroup_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetSupergroupFullInfo(Function[SupergroupFullInfo]):
     supergroup_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetSecretChat(Function[SecretChat]):
     secret_chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChat(Function[Chat]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetMessage(Function[Message]):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetMessageLocally(Function[Message]):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetRepliedMessage(Function[Message]):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatPinnedMessage(Function[Message]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetCallbackQueryMessage(Function[Message]):
     chat_id: int = ...
     message_id: int = ...
     callback_query_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetMessages(Function[Messages]):
     chat_id: int = ...
     message_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetMessageProperties(Function[MessageProperties]):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetMessageThread(Function[MessageThreadInfo]):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetMessageReadDate(Function[MessageReadDate]):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetMessageViewers(Function[MessageViewers]):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetMessageAuthor(Function[User]):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetFile(Function[File]):
     file_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetRemoteFile(Function[File]):
     remote_file_id: str = ...
     file_type: FileType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LoadChats(Function[Ok]):
     chat_list: ChatList | None = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChats(Function[Chats]):
     chat_list: ChatList | None = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchPublicChat(Function[Chat]):
     username: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchPublicChats(Function[Chats]):
     query: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchChats(Function[Chats]):
     query: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchChatsOnServer(Function[Chats]):
     query: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetRecommendedChats(Function[Chats]): ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatSimilarChats(Function[Chats]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatSimilarChatCount(Function[Count]):
     chat_id: int = ...
     return_local: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class OpenChatSimilarChat(Function[Ok]):
     chat_id: int = ...
     opened_chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetBotSimilarBots(Function[Users]):
     bot_user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetBotSimilarBotCount(Function[Count]):
     bot_user_id: int = ...
     return_local: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class OpenBotSimilarBot(Function[Ok]):
     bot_user_id: int = ...
     opened_bot_user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetTopChats(Function[Chats]):
     category: TopChatCategory | None = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class RemoveTopChat(Function[Ok]):
     category: TopChatCategory | None = ...
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchRecentlyFoundChats(Function[Chats]):
     query: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AddRecentlyFoundChat(Function[Ok]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class RemoveRecentlyFoundChat(Function[Ok]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ClearRecentlyFoundChats(Function[Ok]): ...
 
-@dataclass
+@dataclass(slots=True)
 class GetRecentlyOpenedChats(Function[Chats]):
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CheckChatUsername(Function[CheckChatUsernameResult]):
     chat_id: int = ...
     username: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetCreatedPublicChats(Function[Chats]):
     type: PublicChatType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class CheckCreatedPublicChatsLimit(Function[Ok]):
     type: PublicChatType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetSuitableDiscussionChats(Function[Chats]): ...
-@dataclass
+@dataclass(slots=True)
 class GetInactiveSupergroupChats(Function[Chats]): ...
-@dataclass
+@dataclass(slots=True)
 class GetSuitablePersonalChats(Function[Chats]): ...
 
-@dataclass
+@dataclass(slots=True)
 class LoadDirectMessagesChatTopics(Function[Ok]):
     chat_id: int = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetDirectMessagesChatTopic(Function[DirectMessagesChatTopic]):
     chat_id: int = ...
     topic_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetDirectMessagesChatTopicHistory(Function[Messages]):
     chat_id: int = ...
     topic_id: int = ...
@@ -10625,94 +10625,94 @@ class GetDirectMessagesChatTopicHistory(Function[Messages]):
     offset: int = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetDirectMessagesChatTopicMessageByDate(Function[Message]):
     chat_id: int = ...
     topic_id: int = ...
     date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteDirectMessagesChatTopicHistory(Function[Ok]):
     chat_id: int = ...
     topic_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteDirectMessagesChatTopicMessagesByDate(Function[Ok]):
     chat_id: int = ...
     topic_id: int = ...
     min_date: int = ...
     max_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetDirectMessagesChatTopicIsMarkedAsUnread(Function[Ok]):
     chat_id: int = ...
     topic_id: int = ...
     is_marked_as_unread: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class UnpinAllDirectMessagesChatTopicMessages(Function[Ok]):
     chat_id: int = ...
     topic_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReadAllDirectMessagesChatTopicReactions(Function[Ok]):
     chat_id: int = ...
     topic_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetDirectMessagesChatTopicRevenue(Function[StarCount]):
     chat_id: int = ...
     topic_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleDirectMessagesChatTopicCanSendUnpaidMessages(Function[Ok]):
     chat_id: int = ...
     topic_id: int = ...
     can_send_unpaid_messages: bool = ...
     refund_payments: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class LoadSavedMessagesTopics(Function[Ok]):
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetSavedMessagesTopicHistory(Function[Messages]):
     saved_messages_topic_id: int = ...
     from_message_id: int = ...
     offset: int = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetSavedMessagesTopicMessageByDate(Function[Message]):
     saved_messages_topic_id: int = ...
     date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteSavedMessagesTopicHistory(Function[Ok]):
     saved_messages_topic_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteSavedMessagesTopicMessagesByDate(Function[Ok]):
     saved_messages_topic_id: int = ...
     min_date: int = ...
     max_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleSavedMessagesTopicIsPinned(Function[Ok]):
     saved_messages_topic_id: int = ...
     is_pinned: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetPinnedSavedMessagesTopics(Function[Ok]):
     saved_messages_topic_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetGroupsInCommon(Function[Chats]):
     user_id: int = ...
     offset_chat_id: int = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatHistory(Function[Messages]):
     chat_id: int = ...
     from_message_id: int = ...
@@ -10720,7 +10720,7 @@ class GetChatHistory(Function[Messages]):
     limit: int = ...
     only_local: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetMessageThreadHistory(Function[Messages]):
     chat_id: int = ...
     message_id: int = ...
@@ -10728,17 +10728,17 @@ class GetMessageThreadHistory(Function[Messages]):
     offset: int = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteChatHistory(Function[Ok]):
     chat_id: int = ...
     remove_from_chat_list: bool = ...
     revoke: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteChat(Function[Ok]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchChatMessages(Function[FoundChatMessages]):
     chat_id: int = ...
     topic_id: MessageTopic | None = ...
@@ -10749,7 +10749,7 @@ class SearchChatMessages(Function[FoundChatMessages]):
     limit: int = ...
     filter: SearchMessagesFilter | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchMessages(Function[FoundMessages]):
     chat_list: ChatList | None = ...
     query: str = ...
@@ -10760,7 +10760,7 @@ class SearchMessages(Function[FoundMessages]):
     min_date: int = ...
     max_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchSecretMessages(Function[FoundMessages]):
     chat_id: int = ...
     query: str = ...
@@ -10768,7 +10768,7 @@ class SearchSecretMessages(Function[FoundMessages]):
     limit: int = ...
     filter: SearchMessagesFilter | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchSavedMessages(Function[FoundChatMessages]):
     saved_messages_topic_id: int = ...
     tag: ReactionType | None = ...
@@ -10777,82 +10777,82 @@ class SearchSavedMessages(Function[FoundChatMessages]):
     offset: int = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchCallMessages(Function[FoundMessages]):
     offset: str = ...
     limit: int = ...
     only_missed: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchOutgoingDocumentMessages(Function[FoundMessages]):
     query: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetPublicPostSearchLimits(Function[PublicPostSearchLimits]):
     query: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchPublicPosts(Function[FoundPublicPosts]):
     query: str = ...
     offset: str = ...
     limit: int = ...
     star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchPublicMessagesByTag(Function[FoundMessages]):
     tag: str = ...
     offset: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchPublicStoriesByTag(Function[FoundStories]):
     story_poster_chat_id: int = ...
     tag: str = ...
     offset: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchPublicStoriesByLocation(Function[FoundStories]):
     address: LocationAddress | None = ...
     offset: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchPublicStoriesByVenue(Function[FoundStories]):
     venue_provider: str = ...
     venue_id: str = ...
     offset: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetSearchedForTags(Function[Hashtags]):
     tag_prefix: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class RemoveSearchedForTag(Function[Ok]):
     tag: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ClearSearchedForTags(Function[Ok]):
     clear_cashtags: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteAllCallMessages(Function[Ok]):
     revoke: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchChatRecentLocationMessages(Function[Messages]):
     chat_id: int = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatMessageByDate(Function[Message]):
     chat_id: int = ...
     date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatSparseMessagePositions(Function[MessagePositions]):
     chat_id: int = ...
     filter: SearchMessagesFilter | None = ...
@@ -10860,94 +10860,94 @@ class GetChatSparseMessagePositions(Function[MessagePositions]):
     limit: int = ...
     saved_messages_topic_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatMessageCalendar(Function[MessageCalendar]):
     chat_id: int = ...
     topic_id: MessageTopic | None = ...
     filter: SearchMessagesFilter | None = ...
     from_message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatMessageCount(Function[Count]):
     chat_id: int = ...
     topic_id: MessageTopic | None = ...
     filter: SearchMessagesFilter | None = ...
     return_local: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatMessagePosition(Function[Count]):
     chat_id: int = ...
     topic_id: MessageTopic | None = ...
     filter: SearchMessagesFilter | None = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatScheduledMessages(Function[Messages]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatSponsoredMessages(Function[SponsoredMessages]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ClickChatSponsoredMessage(Function[Ok]):
     chat_id: int = ...
     message_id: int = ...
     is_media_click: bool = ...
     from_fullscreen: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReportChatSponsoredMessage(Function[ReportSponsoredResult]):
     chat_id: int = ...
     message_id: int = ...
     option_id: bytes = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetSearchSponsoredChats(Function[SponsoredChats]):
     query: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ViewSponsoredChat(Function[Ok]):
     sponsored_chat_unique_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class OpenSponsoredChat(Function[Ok]):
     sponsored_chat_unique_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReportSponsoredChat(Function[ReportSponsoredResult]):
     sponsored_chat_unique_id: int = ...
     option_id: bytes = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetVideoMessageAdvertisements(Function[VideoMessageAdvertisements]):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ViewVideoMessageAdvertisement(Function[Ok]):
     advertisement_unique_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ClickVideoMessageAdvertisement(Function[Ok]):
     advertisement_unique_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReportVideoMessageAdvertisement(Function[ReportSponsoredResult]):
     advertisement_unique_id: int = ...
     option_id: bytes = ...
 
-@dataclass
+@dataclass(slots=True)
 class RemoveNotification(Function[Ok]):
     notification_group_id: int = ...
     notification_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class RemoveNotificationGroup(Function[Ok]):
     notification_group_id: int = ...
     max_notification_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetMessageLink(Function[MessageLink]):
     chat_id: int = ...
     message_id: int = ...
@@ -10955,48 +10955,48 @@ class GetMessageLink(Function[MessageLink]):
     for_album: bool = ...
     in_message_thread: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetMessageEmbeddingCode(Function[Text]):
     chat_id: int = ...
     message_id: int = ...
     for_album: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetMessageLinkInfo(Function[MessageLinkInfo]):
     url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class TranslateText(Function[FormattedText]):
     text: FormattedText | None = ...
     to_language_code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class TranslateMessageText(Function[FormattedText]):
     chat_id: int = ...
     message_id: int = ...
     to_language_code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class RecognizeSpeech(Function[Ok]):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class RateSpeechRecognition(Function[Ok]):
     chat_id: int = ...
     message_id: int = ...
     is_good: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatAvailableMessageSenders(Function[ChatMessageSenders]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetChatMessageSender(Function[Ok]):
     chat_id: int = ...
     message_sender_id: MessageSender | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SendMessage(Function[Message]):
     chat_id: int = ...
     topic_id: MessageTopic | None = ...
@@ -11005,7 +11005,7 @@ class SendMessage(Function[Message]):
     reply_markup: ReplyMarkup | None = ...
     input_message_content: InputMessageContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SendMessageAlbum(Function[Messages]):
     chat_id: int = ...
     topic_id: MessageTopic | None = ...
@@ -11013,13 +11013,13 @@ class SendMessageAlbum(Function[Messages]):
     options: MessageSendOptions | None = ...
     input_message_contents: list[InputMessageContent] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SendBotStartMessage(Function[Message]):
     bot_user_id: int = ...
     chat_id: int = ...
     parameter: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SendInlineQueryResultMessage(Function[Message]):
     chat_id: int = ...
     topic_id: MessageTopic | None = ...
@@ -11029,7 +11029,7 @@ class SendInlineQueryResultMessage(Function[Message]):
     result_id: str = ...
     hide_via_bot: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ForwardMessages(Function[Messages]):
     chat_id: int = ...
     topic_id: MessageTopic | None = ...
@@ -11039,20 +11039,20 @@ class ForwardMessages(Function[Messages]):
     send_copy: bool = ...
     remove_caption: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class SendQuickReplyShortcutMessages(Function[Messages]):
     chat_id: int = ...
     shortcut_id: int = ...
     sending_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ResendMessages(Function[Messages]):
     chat_id: int = ...
     message_ids: list[int] | None = ...
     quote: InputTextQuote | None = ...
     paid_message_star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AddLocalMessage(Function[Message]):
     chat_id: int = ...
     sender_id: MessageSender | None = ...
@@ -11060,32 +11060,32 @@ class AddLocalMessage(Function[Message]):
     disable_notification: bool = ...
     input_message_content: InputMessageContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteMessages(Function[Ok]):
     chat_id: int = ...
     message_ids: list[int] | None = ...
     revoke: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteChatMessagesBySender(Function[Ok]):
     chat_id: int = ...
     sender_id: MessageSender | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteChatMessagesByDate(Function[Ok]):
     chat_id: int = ...
     min_date: int = ...
     max_date: int = ...
     revoke: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditMessageText(Function[Message]):
     chat_id: int = ...
     message_id: int = ...
     reply_markup: ReplyMarkup | None = ...
     input_message_content: InputMessageContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditMessageLiveLocation(Function[Message]):
     chat_id: int = ...
     message_id: int = ...
@@ -11095,21 +11095,21 @@ class EditMessageLiveLocation(Function[Message]):
     heading: int = ...
     proximity_alert_radius: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditMessageChecklist(Function[Message]):
     chat_id: int = ...
     message_id: int = ...
     reply_markup: ReplyMarkup | None = ...
     checklist: InputChecklist | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditMessageMedia(Function[Message]):
     chat_id: int = ...
     message_id: int = ...
     reply_markup: ReplyMarkup | None = ...
     input_message_content: InputMessageContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditMessageCaption(Function[Message]):
     chat_id: int = ...
     message_id: int = ...
@@ -11117,19 +11117,19 @@ class EditMessageCaption(Function[Message]):
     caption: FormattedText | None = ...
     show_caption_above_media: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditMessageReplyMarkup(Function[Message]):
     chat_id: int = ...
     message_id: int = ...
     reply_markup: ReplyMarkup | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditInlineMessageText(Function[Ok]):
     inline_message_id: str = ...
     reply_markup: ReplyMarkup | None = ...
     input_message_content: InputMessageContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditInlineMessageLiveLocation(Function[Ok]):
     inline_message_id: str = ...
     reply_markup: ReplyMarkup | None = ...
@@ -11138,37 +11138,37 @@ class EditInlineMessageLiveLocation(Function[Ok]):
     heading: int = ...
     proximity_alert_radius: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditInlineMessageMedia(Function[Ok]):
     inline_message_id: str = ...
     reply_markup: ReplyMarkup | None = ...
     input_message_content: InputMessageContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditInlineMessageCaption(Function[Ok]):
     inline_message_id: str = ...
     reply_markup: ReplyMarkup | None = ...
     caption: FormattedText | None = ...
     show_caption_above_media: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditInlineMessageReplyMarkup(Function[Ok]):
     inline_message_id: str = ...
     reply_markup: ReplyMarkup | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditMessageSchedulingState(Function[Ok]):
     chat_id: int = ...
     message_id: int = ...
     scheduling_state: MessageSchedulingState | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetMessageFactCheck(Function[Ok]):
     chat_id: int = ...
     message_id: int = ...
     text: FormattedText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SendBusinessMessage(Function[BusinessMessage]):
     business_connection_id: str = ...
     chat_id: int = ...
@@ -11179,7 +11179,7 @@ class SendBusinessMessage(Function[BusinessMessage]):
     reply_markup: ReplyMarkup | None = ...
     input_message_content: InputMessageContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SendBusinessMessageAlbum(Function[BusinessMessages]):
     business_connection_id: str = ...
     chat_id: int = ...
@@ -11189,7 +11189,7 @@ class SendBusinessMessageAlbum(Function[BusinessMessages]):
     effect_id: int = ...
     input_message_contents: list[InputMessageContent] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditBusinessMessageText(Function[BusinessMessage]):
     business_connection_id: str = ...
     chat_id: int = ...
@@ -11197,7 +11197,7 @@ class EditBusinessMessageText(Function[BusinessMessage]):
     reply_markup: ReplyMarkup | None = ...
     input_message_content: InputMessageContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditBusinessMessageLiveLocation(Function[BusinessMessage]):
     business_connection_id: str = ...
     chat_id: int = ...
@@ -11208,7 +11208,7 @@ class EditBusinessMessageLiveLocation(Function[BusinessMessage]):
     heading: int = ...
     proximity_alert_radius: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditBusinessMessageChecklist(Function[BusinessMessage]):
     business_connection_id: str = ...
     chat_id: int = ...
@@ -11216,7 +11216,7 @@ class EditBusinessMessageChecklist(Function[BusinessMessage]):
     reply_markup: ReplyMarkup | None = ...
     checklist: InputChecklist | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditBusinessMessageMedia(Function[BusinessMessage]):
     business_connection_id: str = ...
     chat_id: int = ...
@@ -11224,7 +11224,7 @@ class EditBusinessMessageMedia(Function[BusinessMessage]):
     reply_markup: ReplyMarkup | None = ...
     input_message_content: InputMessageContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditBusinessMessageCaption(Function[BusinessMessage]):
     business_connection_id: str = ...
     chat_id: int = ...
@@ -11233,39 +11233,39 @@ class EditBusinessMessageCaption(Function[BusinessMessage]):
     caption: FormattedText | None = ...
     show_caption_above_media: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditBusinessMessageReplyMarkup(Function[BusinessMessage]):
     business_connection_id: str = ...
     chat_id: int = ...
     message_id: int = ...
     reply_markup: ReplyMarkup | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StopBusinessPoll(Function[BusinessMessage]):
     business_connection_id: str = ...
     chat_id: int = ...
     message_id: int = ...
     reply_markup: ReplyMarkup | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetBusinessMessageIsPinned(Function[Ok]):
     business_connection_id: str = ...
     chat_id: int = ...
     message_id: int = ...
     is_pinned: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReadBusinessMessage(Function[Ok]):
     business_connection_id: str = ...
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteBusinessMessages(Function[Ok]):
     business_connection_id: str = ...
     message_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditBusinessStory(Function[Story]):
     story_poster_chat_id: int = ...
     story_id: int = ...
@@ -11274,83 +11274,83 @@ class EditBusinessStory(Function[Story]):
     caption: FormattedText | None = ...
     privacy_settings: StoryPrivacySettings | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteBusinessStory(Function[Ok]):
     business_connection_id: str = ...
     story_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetBusinessAccountName(Function[Ok]):
     business_connection_id: str = ...
     first_name: str = ...
     last_name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetBusinessAccountBio(Function[Ok]):
     business_connection_id: str = ...
     bio: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetBusinessAccountProfilePhoto(Function[Ok]):
     business_connection_id: str = ...
     photo: InputChatPhoto | None = ...
     is_public: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetBusinessAccountUsername(Function[Ok]):
     business_connection_id: str = ...
     username: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetBusinessAccountGiftSettings(Function[Ok]):
     business_connection_id: str = ...
     settings: GiftSettings | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetBusinessAccountStarAmount(Function[StarAmount]):
     business_connection_id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class TransferBusinessAccountStars(Function[Ok]):
     business_connection_id: str = ...
     star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CheckQuickReplyShortcutName(Function[Ok]):
     name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class LoadQuickReplyShortcuts(Function[Ok]): ...
 
-@dataclass
+@dataclass(slots=True)
 class SetQuickReplyShortcutName(Function[Ok]):
     shortcut_id: int = ...
     name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteQuickReplyShortcut(Function[Ok]):
     shortcut_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReorderQuickReplyShortcuts(Function[Ok]):
     shortcut_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LoadQuickReplyShortcutMessages(Function[Ok]):
     shortcut_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteQuickReplyShortcutMessages(Function[Ok]):
     shortcut_id: int = ...
     message_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class AddQuickReplyShortcutMessage(Function[QuickReplyMessage]):
     shortcut_name: str = ...
     reply_to_message_id: int = ...
     input_message_content: InputMessageContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class AddQuickReplyShortcutInlineQueryResultMessage(Function[QuickReplyMessage]):
     shortcut_name: str = ...
     reply_to_message_id: int = ...
@@ -11358,34 +11358,34 @@ class AddQuickReplyShortcutInlineQueryResultMessage(Function[QuickReplyMessage])
     result_id: str = ...
     hide_via_bot: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class AddQuickReplyShortcutMessageAlbum(Function[QuickReplyMessages]):
     shortcut_name: str = ...
     reply_to_message_id: int = ...
     input_message_contents: list[InputMessageContent] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReaddQuickReplyShortcutMessages(Function[QuickReplyMessages]):
     shortcut_name: str = ...
     message_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditQuickReplyMessage(Function[Ok]):
     shortcut_id: int = ...
     message_id: int = ...
     input_message_content: InputMessageContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetForumTopicDefaultIcons(Function[Stickers]): ...
 
-@dataclass
+@dataclass(slots=True)
 class CreateForumTopic(Function[ForumTopicInfo]):
     chat_id: int = ...
     name: str = ...
     is_name_implicit: bool = ...
     icon: ForumTopicIcon | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditForumTopic(Function[Ok]):
     chat_id: int = ...
     forum_topic_id: int = ...
@@ -11393,12 +11393,12 @@ class EditForumTopic(Function[Ok]):
     edit_icon_custom_emoji: bool = ...
     icon_custom_emoji_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetForumTopic(Function[ForumTopic]):
     chat_id: int = ...
     forum_topic_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetForumTopicHistory(Function[Messages]):
     chat_id: int = ...
     forum_topic_id: int = ...
@@ -11406,12 +11406,12 @@ class GetForumTopicHistory(Function[Messages]):
     offset: int = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetForumTopicLink(Function[MessageLink]):
     chat_id: int = ...
     forum_topic_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetForumTopics(Function[ForumTopics]):
     chat_id: int = ...
     query: str = ...
@@ -11420,71 +11420,71 @@ class GetForumTopics(Function[ForumTopics]):
     offset_forum_topic_id: int = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetForumTopicNotificationSettings(Function[Ok]):
     chat_id: int = ...
     forum_topic_id: int = ...
     notification_settings: ChatNotificationSettings | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleForumTopicIsClosed(Function[Ok]):
     chat_id: int = ...
     forum_topic_id: int = ...
     is_closed: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleGeneralForumTopicIsHidden(Function[Ok]):
     chat_id: int = ...
     is_hidden: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleForumTopicIsPinned(Function[Ok]):
     chat_id: int = ...
     forum_topic_id: int = ...
     is_pinned: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetPinnedForumTopics(Function[Ok]):
     chat_id: int = ...
     forum_topic_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteForumTopic(Function[Ok]):
     chat_id: int = ...
     forum_topic_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReadAllForumTopicMentions(Function[Ok]):
     chat_id: int = ...
     forum_topic_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReadAllForumTopicReactions(Function[Ok]):
     chat_id: int = ...
     forum_topic_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UnpinAllForumTopicMessages(Function[Ok]):
     chat_id: int = ...
     forum_topic_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetEmojiReaction(Function[EmojiReaction]):
     emoji: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetCustomEmojiReactionAnimations(Function[Stickers]): ...
 
-@dataclass
+@dataclass(slots=True)
 class GetMessageAvailableReactions(Function[AvailableReactions]):
     chat_id: int = ...
     message_id: int = ...
     row_size: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ClearRecentReactions(Function[Ok]): ...
 
-@dataclass
+@dataclass(slots=True)
 class AddMessageReaction(Function[Ok]):
     chat_id: int = ...
     message_id: int = ...
@@ -11492,47 +11492,47 @@ class AddMessageReaction(Function[Ok]):
     is_big: bool = ...
     update_recent_reactions: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class RemoveMessageReaction(Function[Ok]):
     chat_id: int = ...
     message_id: int = ...
     reaction_type: ReactionType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatAvailablePaidMessageReactionSenders(Function[MessageSenders]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AddPendingPaidMessageReaction(Function[Ok]):
     chat_id: int = ...
     message_id: int = ...
     star_count: int = ...
     type: PaidReactionType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class CommitPendingPaidMessageReactions(Function[Ok]):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class RemovePendingPaidMessageReactions(Function[Ok]):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetPaidMessageReactionType(Function[Ok]):
     chat_id: int = ...
     message_id: int = ...
     type: PaidReactionType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetMessageReactions(Function[Ok]):
     chat_id: int = ...
     message_id: int = ...
     reaction_types: list[ReactionType] | None = ...
     is_big: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetMessageAddedReactions(Function[AddedReactions]):
     chat_id: int = ...
     message_id: int = ...
@@ -11540,88 +11540,88 @@ class GetMessageAddedReactions(Function[AddedReactions]):
     offset: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetDefaultReactionType(Function[Ok]):
     reaction_type: ReactionType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetSavedMessagesTags(Function[SavedMessagesTags]):
     saved_messages_topic_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetSavedMessagesTagLabel(Function[Ok]):
     tag: ReactionType | None = ...
     label: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetMessageEffect(Function[MessageEffect]):
     effect_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchQuote(Function[FoundPosition]):
     text: FormattedText | None = ...
     quote: FormattedText | None = ...
     quote_position: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetTextEntities(Function[TextEntities]):
     text: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ParseTextEntities(Function[FormattedText]):
     text: str = ...
     parse_mode: TextParseMode | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ParseMarkdown(Function[FormattedText]):
     text: FormattedText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetMarkdownText(Function[FormattedText]):
     text: FormattedText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetCountryFlagEmoji(Function[Text]):
     country_code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetFileMimeType(Function[Text]):
     file_name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetFileExtension(Function[Text]):
     mime_type: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class CleanFileName(Function[Text]):
     file_name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetLanguagePackString(Function[LanguagePackStringValue]):
     language_pack_database_path: str = ...
     localization_target: str = ...
     language_pack_id: str = ...
     key: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetJsonValue(Function[JsonValue]):
     json: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetJsonString(Function[Text]):
     json_value: JsonValue | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetThemeParametersJsonString(Function[Text]):
     theme: ThemeParameters | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetPollAnswer(Function[Ok]):
     chat_id: int = ...
     message_id: int = ...
     option_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetPollVoters(Function[MessageSenders]):
     chat_id: int = ...
     message_id: int = ...
@@ -11629,50 +11629,50 @@ class GetPollVoters(Function[MessageSenders]):
     offset: int = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StopPoll(Function[Ok]):
     chat_id: int = ...
     message_id: int = ...
     reply_markup: ReplyMarkup | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class AddChecklistTasks(Function[Ok]):
     chat_id: int = ...
     message_id: int = ...
     tasks: list[InputChecklistTask] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class MarkChecklistTasksAsDone(Function[Ok]):
     chat_id: int = ...
     message_id: int = ...
     marked_as_done_task_ids: list[int] | None = ...
     marked_as_not_done_task_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class HideSuggestedAction(Function[Ok]):
     action: SuggestedAction | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class HideContactCloseBirthdays(Function[Ok]): ...
 
-@dataclass
+@dataclass(slots=True)
 class GetBusinessConnection(Function[BusinessConnection]):
     connection_id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetLoginUrlInfo(Function[LoginUrlInfo]):
     chat_id: int = ...
     message_id: int = ...
     button_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetLoginUrl(Function[HttpUrl]):
     chat_id: int = ...
     message_id: int = ...
     button_id: int = ...
     allow_write_access: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ShareUsersWithBot(Function[Ok]):
     chat_id: int = ...
     message_id: int = ...
@@ -11680,7 +11680,7 @@ class ShareUsersWithBot(Function[Ok]):
     shared_user_ids: list[int] | None = ...
     only_check: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ShareChatWithBot(Function[Ok]):
     chat_id: int = ...
     message_id: int = ...
@@ -11688,7 +11688,7 @@ class ShareChatWithBot(Function[Ok]):
     shared_chat_id: int = ...
     only_check: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetInlineQueryResults(Function[InlineQueryResults]):
     bot_user_id: int = ...
     chat_id: int = ...
@@ -11696,7 +11696,7 @@ class GetInlineQueryResults(Function[InlineQueryResults]):
     query: str = ...
     offset: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class AnswerInlineQuery(Function[Ok]):
     inline_query_id: int = ...
     is_personal: bool = ...
@@ -11705,32 +11705,32 @@ class AnswerInlineQuery(Function[Ok]):
     cache_time: int = ...
     next_offset: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SavePreparedInlineMessage(Function[PreparedInlineMessageId]):
     user_id: int = ...
     result: InputInlineQueryResult | None = ...
     chat_types: TargetChatTypes | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetPreparedInlineMessage(Function[PreparedInlineMessage]):
     bot_user_id: int = ...
     prepared_message_id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetGrossingWebAppBots(Function[FoundUsers]):
     offset: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchWebApp(Function[FoundWebApp]):
     bot_user_id: int = ...
     web_app_short_name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetWebAppPlaceholder(Function[Outline]):
     bot_user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetWebAppLinkUrl(Function[HttpUrl]):
     chat_id: int = ...
     bot_user_id: int = ...
@@ -11739,26 +11739,26 @@ class GetWebAppLinkUrl(Function[HttpUrl]):
     allow_write_access: bool = ...
     parameters: WebAppOpenParameters | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetMainWebApp(Function[MainWebApp]):
     chat_id: int = ...
     bot_user_id: int = ...
     start_parameter: str = ...
     parameters: WebAppOpenParameters | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetWebAppUrl(Function[HttpUrl]):
     bot_user_id: int = ...
     url: str = ...
     parameters: WebAppOpenParameters | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SendWebAppData(Function[Ok]):
     bot_user_id: int = ...
     button_text: str = ...
     data: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class OpenWebApp(Function[WebAppInfo]):
     chat_id: int = ...
     bot_user_id: int = ...
@@ -11767,28 +11767,28 @@ class OpenWebApp(Function[WebAppInfo]):
     reply_to: InputMessageReplyTo | None = ...
     parameters: WebAppOpenParameters | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class CloseWebApp(Function[Ok]):
     web_app_launch_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AnswerWebAppQuery(Function[SentWebAppMessage]):
     web_app_query_id: str = ...
     result: InputInlineQueryResult | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class CheckWebAppFileDownload(Function[Ok]):
     bot_user_id: int = ...
     file_name: str = ...
     url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetCallbackQueryAnswer(Function[CallbackQueryAnswer]):
     chat_id: int = ...
     message_id: int = ...
     payload: CallbackQueryPayload | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class AnswerCallbackQuery(Function[Ok]):
     callback_query_id: int = ...
     text: str = ...
@@ -11796,18 +11796,18 @@ class AnswerCallbackQuery(Function[Ok]):
     url: str = ...
     cache_time: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AnswerShippingQuery(Function[Ok]):
     shipping_query_id: int = ...
     shipping_options: list[ShippingOption] | None = ...
     error_message: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class AnswerPreCheckoutQuery(Function[Ok]):
     pre_checkout_query_id: int = ...
     error_message: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetGameScore(Function[Message]):
     chat_id: int = ...
     message_id: int = ...
@@ -11816,7 +11816,7 @@ class SetGameScore(Function[Message]):
     score: int = ...
     force: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetInlineGameScore(Function[Ok]):
     inline_message_id: str = ...
     edit_message: bool = ...
@@ -11824,113 +11824,113 @@ class SetInlineGameScore(Function[Ok]):
     score: int = ...
     force: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetGameHighScores(Function[GameHighScores]):
     chat_id: int = ...
     message_id: int = ...
     user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetInlineGameHighScores(Function[GameHighScores]):
     inline_message_id: str = ...
     user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteChatReplyMarkup(Function[Ok]):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SendChatAction(Function[Ok]):
     chat_id: int = ...
     topic_id: MessageTopic | None = ...
     business_connection_id: str = ...
     action: ChatAction | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SendTextMessageDraft(Function[Ok]):
     chat_id: int = ...
     forum_topic_id: int = ...
     draft_id: int = ...
     text: FormattedText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class OpenChat(Function[Ok]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CloseChat(Function[Ok]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ViewMessages(Function[Ok]):
     chat_id: int = ...
     message_ids: list[int] | None = ...
     source: MessageSource | None = ...
     force_read: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class OpenMessageContent(Function[Ok]):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ClickAnimatedEmojiMessage(Function[Sticker]):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetInternalLink(Function[HttpUrl]):
     type: InternalLinkType | None = ...
     is_http: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetInternalLinkType(Function[InternalLinkType]):
     link: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetExternalLinkInfo(Function[LoginUrlInfo]):
     link: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetExternalLink(Function[HttpUrl]):
     link: str = ...
     allow_write_access: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReadAllChatMentions(Function[Ok]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReadAllChatReactions(Function[Ok]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CreatePrivateChat(Function[Chat]):
     user_id: int = ...
     force: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class CreateBasicGroupChat(Function[Chat]):
     basic_group_id: int = ...
     force: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class CreateSupergroupChat(Function[Chat]):
     supergroup_id: int = ...
     force: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class CreateSecretChat(Function[Chat]):
     secret_chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CreateNewBasicGroupChat(Function[CreatedBasicGroupChat]):
     user_ids: list[int] | None = ...
     title: str = ...
     message_auto_delete_time: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CreateNewSupergroupChat(Function[Chat]):
     title: str = ...
     is_forum: bool = ...
@@ -11940,154 +11940,154 @@ class CreateNewSupergroupChat(Function[Chat]):
     message_auto_delete_time: int = ...
     for_import: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class CreateNewSecretChat(Function[Chat]):
     user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpgradeBasicGroupChatToSupergroupChat(Function[Chat]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatListsToAddChat(Function[ChatLists]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AddChatToList(Function[Ok]):
     chat_id: int = ...
     chat_list: ChatList | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatFolder(Function[ChatFolder]):
     chat_folder_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CreateChatFolder(Function[ChatFolderInfo]):
     folder: ChatFolder | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditChatFolder(Function[ChatFolderInfo]):
     chat_folder_id: int = ...
     folder: ChatFolder | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteChatFolder(Function[Ok]):
     chat_folder_id: int = ...
     leave_chat_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatFolderChatsToLeave(Function[Chats]):
     chat_folder_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatFolderChatCount(Function[Count]):
     folder: ChatFolder | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReorderChatFolders(Function[Ok]):
     chat_folder_ids: list[int] | None = ...
     main_chat_list_position: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleChatFolderTags(Function[Ok]):
     are_tags_enabled: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetRecommendedChatFolders(Function[RecommendedChatFolders]): ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatFolderDefaultIconName(Function[ChatFolderIcon]):
     folder: ChatFolder | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatsForChatFolderInviteLink(Function[Chats]):
     chat_folder_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CreateChatFolderInviteLink(Function[ChatFolderInviteLink]):
     chat_folder_id: int = ...
     name: str = ...
     chat_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatFolderInviteLinks(Function[ChatFolderInviteLinks]):
     chat_folder_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditChatFolderInviteLink(Function[ChatFolderInviteLink]):
     chat_folder_id: int = ...
     invite_link: str = ...
     name: str = ...
     chat_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteChatFolderInviteLink(Function[Ok]):
     chat_folder_id: int = ...
     invite_link: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class CheckChatFolderInviteLink(Function[ChatFolderInviteLinkInfo]):
     invite_link: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class AddChatFolderByInviteLink(Function[Ok]):
     invite_link: str = ...
     chat_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatFolderNewChats(Function[Chats]):
     chat_folder_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ProcessChatFolderNewChats(Function[Ok]):
     chat_folder_id: int = ...
     added_chat_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetArchiveChatListSettings(Function[ArchiveChatListSettings]): ...
 
-@dataclass
+@dataclass(slots=True)
 class SetArchiveChatListSettings(Function[Ok]):
     settings: ArchiveChatListSettings | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetChatTitle(Function[Ok]):
     chat_id: int = ...
     title: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetChatPhoto(Function[Ok]):
     chat_id: int = ...
     photo: InputChatPhoto | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetChatAccentColor(Function[Ok]):
     chat_id: int = ...
     accent_color_id: int = ...
     background_custom_emoji_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetChatProfileAccentColor(Function[Ok]):
     chat_id: int = ...
     profile_accent_color_id: int = ...
     profile_background_custom_emoji_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetChatMessageAutoDeleteTime(Function[Ok]):
     chat_id: int = ...
     message_auto_delete_time: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetChatEmojiStatus(Function[Ok]):
     chat_id: int = ...
     emoji_status: EmojiStatus | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetChatPermissions(Function[Ok]):
     chat_id: int = ...
     permissions: ChatPermissions | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetChatBackground(Function[Ok]):
     chat_id: int = ...
     background: InputBackground | None = ...
@@ -12095,239 +12095,239 @@ class SetChatBackground(Function[Ok]):
     dark_theme_dimming: int = ...
     only_for_self: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteChatBackground(Function[Ok]):
     chat_id: int = ...
     restore_previous: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetGiftChatThemes(Function[GiftChatThemes]):
     offset: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetChatTheme(Function[Ok]):
     chat_id: int = ...
     theme: InputChatTheme | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetChatDraftMessage(Function[Ok]):
     chat_id: int = ...
     topic_id: MessageTopic | None = ...
     draft_message: DraftMessage | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetChatNotificationSettings(Function[Ok]):
     chat_id: int = ...
     notification_settings: ChatNotificationSettings | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleChatHasProtectedContent(Function[Ok]):
     chat_id: int = ...
     has_protected_content: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleChatViewAsTopics(Function[Ok]):
     chat_id: int = ...
     view_as_topics: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleChatIsTranslatable(Function[Ok]):
     chat_id: int = ...
     is_translatable: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleChatIsMarkedAsUnread(Function[Ok]):
     chat_id: int = ...
     is_marked_as_unread: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleChatDefaultDisableNotification(Function[Ok]):
     chat_id: int = ...
     default_disable_notification: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetChatAvailableReactions(Function[Ok]):
     chat_id: int = ...
     available_reactions: ChatAvailableReactions | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetChatClientData(Function[Ok]):
     chat_id: int = ...
     client_data: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetChatDescription(Function[Ok]):
     chat_id: int = ...
     description: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetChatDiscussionGroup(Function[Ok]):
     chat_id: int = ...
     discussion_chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetChatDirectMessagesGroup(Function[Ok]):
     chat_id: int = ...
     is_enabled: bool = ...
     paid_message_star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetChatLocation(Function[Ok]):
     chat_id: int = ...
     location: ChatLocation | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetChatSlowModeDelay(Function[Ok]):
     chat_id: int = ...
     slow_mode_delay: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PinChatMessage(Function[Ok]):
     chat_id: int = ...
     message_id: int = ...
     disable_notification: bool = ...
     only_for_self: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class UnpinChatMessage(Function[Ok]):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UnpinAllChatMessages(Function[Ok]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class JoinChat(Function[Ok]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class LeaveChat(Function[Ok]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AddChatMember(Function[FailedToAddMembers]):
     chat_id: int = ...
     user_id: int = ...
     forward_limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AddChatMembers(Function[FailedToAddMembers]):
     chat_id: int = ...
     user_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetChatMemberStatus(Function[Ok]):
     chat_id: int = ...
     member_id: MessageSender | None = ...
     status: ChatMemberStatus | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class BanChatMember(Function[Ok]):
     chat_id: int = ...
     member_id: MessageSender | None = ...
     banned_until_date: int = ...
     revoke_messages: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class CanTransferOwnership(Function[CanTransferOwnershipResult]): ...
 
-@dataclass
+@dataclass(slots=True)
 class TransferChatOwnership(Function[Ok]):
     chat_id: int = ...
     user_id: int = ...
     password: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatMember(Function[ChatMember]):
     chat_id: int = ...
     member_id: MessageSender | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchChatMembers(Function[ChatMembers]):
     chat_id: int = ...
     query: str = ...
     limit: int = ...
     filter: ChatMembersFilter | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatAdministrators(Function[ChatAdministrators]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ClearAllDraftMessages(Function[Ok]):
     exclude_secret_chats: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetSavedNotificationSound(Function[NotificationSounds]):
     notification_sound_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetSavedNotificationSounds(Function[NotificationSounds]): ...
 
-@dataclass
+@dataclass(slots=True)
 class AddSavedNotificationSound(Function[NotificationSound]):
     sound: InputFile | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class RemoveSavedNotificationSound(Function[Ok]):
     notification_sound_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatNotificationSettingsExceptions(Function[Chats]):
     scope: NotificationSettingsScope | None = ...
     compare_sound: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetScopeNotificationSettings(Function[ScopeNotificationSettings]):
     scope: NotificationSettingsScope | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetScopeNotificationSettings(Function[Ok]):
     scope: NotificationSettingsScope | None = ...
     notification_settings: ScopeNotificationSettings | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetReactionNotificationSettings(Function[Ok]):
     notification_settings: ReactionNotificationSettings | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ResetAllNotificationSettings(Function[Ok]): ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleChatIsPinned(Function[Ok]):
     chat_list: ChatList | None = ...
     chat_id: int = ...
     is_pinned: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetPinnedChats(Function[Ok]):
     chat_list: ChatList | None = ...
     chat_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReadChatList(Function[Ok]):
     chat_list: ChatList | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetCurrentWeather(Function[CurrentWeather]):
     location: Location | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetStory(Function[Story]):
     story_poster_chat_id: int = ...
     story_id: int = ...
     only_local: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatsToPostStories(Function[Chats]): ...
 
-@dataclass
+@dataclass(slots=True)
 class CanPostStory(Function[CanPostStoryResult]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PostStory(Function[Story]):
     chat_id: int = ...
     content: InputStoryContent | None = ...
@@ -12340,7 +12340,7 @@ class PostStory(Function[Story]):
     is_posted_to_chat_page: bool = ...
     protect_content: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class StartLiveStory(Function[StartLiveStoryResult]):
     chat_id: int = ...
     privacy_settings: StoryPrivacySettings | None = ...
@@ -12349,7 +12349,7 @@ class StartLiveStory(Function[StartLiveStoryResult]):
     enable_messages: bool = ...
     paid_message_star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditStory(Function[Ok]):
     story_poster_chat_id: int = ...
     story_id: int = ...
@@ -12357,83 +12357,83 @@ class EditStory(Function[Ok]):
     areas: InputStoryAreas | None = ...
     caption: FormattedText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditStoryCover(Function[Ok]):
     story_poster_chat_id: int = ...
     story_id: int = ...
     cover_frame_timestamp: float = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetStoryPrivacySettings(Function[Ok]):
     story_id: int = ...
     privacy_settings: StoryPrivacySettings | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleStoryIsPostedToChatPage(Function[Ok]):
     story_poster_chat_id: int = ...
     story_id: int = ...
     is_posted_to_chat_page: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteStory(Function[Ok]):
     story_poster_chat_id: int = ...
     story_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetStoryNotificationSettingsExceptions(Function[Chats]): ...
 
-@dataclass
+@dataclass(slots=True)
 class LoadActiveStories(Function[Ok]):
     story_list: StoryList | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetChatActiveStoriesList(Function[Ok]):
     chat_id: int = ...
     story_list: StoryList | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatActiveStories(Function[ChatActiveStories]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatPostedToChatPageStories(Function[Stories]):
     chat_id: int = ...
     from_story_id: int = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatArchivedStories(Function[Stories]):
     chat_id: int = ...
     from_story_id: int = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetChatPinnedStories(Function[Ok]):
     chat_id: int = ...
     story_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class OpenStory(Function[Ok]):
     story_poster_chat_id: int = ...
     story_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CloseStory(Function[Ok]):
     story_poster_chat_id: int = ...
     story_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetStoryAvailableReactions(Function[AvailableReactions]):
     row_size: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetStoryReaction(Function[Ok]):
     story_poster_chat_id: int = ...
     story_id: int = ...
     reaction_type: ReactionType | None = ...
     update_recent_reactions: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetStoryInteractions(Function[StoryInteractions]):
     story_id: int = ...
     query: str = ...
@@ -12443,7 +12443,7 @@ class GetStoryInteractions(Function[StoryInteractions]):
     offset: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatStoryInteractions(Function[StoryInteractions]):
     story_poster_chat_id: int = ...
     story_id: int = ...
@@ -12452,143 +12452,143 @@ class GetChatStoryInteractions(Function[StoryInteractions]):
     offset: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReportStory(Function[ReportStoryResult]):
     story_poster_chat_id: int = ...
     story_id: int = ...
     option_id: bytes = ...
     text: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ActivateStoryStealthMode(Function[Ok]): ...
 
-@dataclass
+@dataclass(slots=True)
 class GetStoryPublicForwards(Function[PublicForwards]):
     story_poster_chat_id: int = ...
     story_id: int = ...
     offset: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatStoryAlbums(Function[StoryAlbums]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetStoryAlbumStories(Function[Stories]):
     chat_id: int = ...
     story_album_id: int = ...
     offset: int = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CreateStoryAlbum(Function[StoryAlbum]):
     story_poster_chat_id: int = ...
     name: str = ...
     story_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReorderStoryAlbums(Function[Ok]):
     chat_id: int = ...
     story_album_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteStoryAlbum(Function[Ok]):
     chat_id: int = ...
     story_album_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetStoryAlbumName(Function[StoryAlbum]):
     chat_id: int = ...
     story_album_id: int = ...
     name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class AddStoryAlbumStories(Function[StoryAlbum]):
     chat_id: int = ...
     story_album_id: int = ...
     story_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class RemoveStoryAlbumStories(Function[StoryAlbum]):
     chat_id: int = ...
     story_album_id: int = ...
     story_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReorderStoryAlbumStories(Function[StoryAlbum]):
     chat_id: int = ...
     story_album_id: int = ...
     story_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatBoostLevelFeatures(Function[ChatBoostLevelFeatures]):
     is_channel: bool = ...
     level: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatBoostFeatures(Function[ChatBoostFeatures]):
     is_channel: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetAvailableChatBoostSlots(Function[ChatBoostSlots]): ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatBoostStatus(Function[ChatBoostStatus]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class BoostChat(Function[ChatBoostSlots]):
     chat_id: int = ...
     slot_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatBoostLink(Function[ChatBoostLink]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatBoostLinkInfo(Function[ChatBoostLinkInfo]):
     url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatBoosts(Function[FoundChatBoosts]):
     chat_id: int = ...
     only_gift_codes: bool = ...
     offset: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetUserChatBoosts(Function[FoundChatBoosts]):
     chat_id: int = ...
     user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetAttachmentMenuBot(Function[AttachmentMenuBot]):
     bot_user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleBotIsAddedToAttachmentMenu(Function[Ok]):
     bot_user_id: int = ...
     is_added: bool = ...
     allow_write_access: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetThemedEmojiStatuses(Function[EmojiStatusCustomEmojis]): ...
-@dataclass
+@dataclass(slots=True)
 class GetRecentEmojiStatuses(Function[EmojiStatuses]): ...
-@dataclass
+@dataclass(slots=True)
 class GetUpgradedGiftEmojiStatuses(Function[EmojiStatuses]): ...
-@dataclass
+@dataclass(slots=True)
 class GetDefaultEmojiStatuses(Function[EmojiStatusCustomEmojis]): ...
-@dataclass
+@dataclass(slots=True)
 class ClearRecentEmojiStatuses(Function[Ok]): ...
-@dataclass
+@dataclass(slots=True)
 class GetThemedChatEmojiStatuses(Function[EmojiStatusCustomEmojis]): ...
-@dataclass
+@dataclass(slots=True)
 class GetDefaultChatEmojiStatuses(Function[EmojiStatusCustomEmojis]): ...
-@dataclass
+@dataclass(slots=True)
 class GetDisallowedChatEmojiStatuses(Function[EmojiStatusCustomEmojis]): ...
 
-@dataclass
+@dataclass(slots=True)
 class DownloadFile(Function[File]):
     file_id: int = ...
     priority: int = ...
@@ -12596,86 +12596,86 @@ class DownloadFile(Function[File]):
     limit: int = ...
     synchronous: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetFileDownloadedPrefixSize(Function[FileDownloadedPrefixSize]):
     file_id: int = ...
     offset: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CancelDownloadFile(Function[Ok]):
     file_id: int = ...
     only_if_pending: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetSuggestedFileName(Function[Text]):
     file_id: int = ...
     directory: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class PreliminaryUploadFile(Function[File]):
     file: InputFile | None = ...
     file_type: FileType | None = ...
     priority: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CancelPreliminaryUploadFile(Function[Ok]):
     file_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class WriteGeneratedFilePart(Function[Ok]):
     generation_id: int = ...
     offset: int = ...
     data: bytes = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetFileGenerationProgress(Function[Ok]):
     generation_id: int = ...
     expected_size: int = ...
     local_prefix_size: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class FinishFileGeneration(Function[Ok]):
     generation_id: int = ...
     error: Error | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReadFilePart(Function[Data]):
     file_id: int = ...
     offset: int = ...
     count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteFile(Function[Ok]):
     file_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AddFileToDownloads(Function[File]):
     file_id: int = ...
     chat_id: int = ...
     message_id: int = ...
     priority: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleDownloadIsPaused(Function[Ok]):
     file_id: int = ...
     is_paused: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleAllDownloadsArePaused(Function[Ok]):
     are_paused: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class RemoveFileFromDownloads(Function[Ok]):
     file_id: int = ...
     delete_from_cache: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class RemoveAllFilesFromDownloads(Function[Ok]):
     only_active: bool = ...
     only_completed: bool = ...
     delete_from_cache: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchFileDownloads(Function[FoundFileDownloads]):
     query: str = ...
     only_active: bool = ...
@@ -12683,30 +12683,30 @@ class SearchFileDownloads(Function[FoundFileDownloads]):
     offset: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetApplicationVerificationToken(Function[Ok]):
     verification_id: int = ...
     token: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetMessageFileType(Function[MessageFileType]):
     message_file_head: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetMessageImportConfirmationText(Function[Text]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ImportMessages(Function[Ok]):
     chat_id: int = ...
     message_file: InputFile | None = ...
     attached_files: list[InputFile] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReplacePrimaryChatInviteLink(Function[ChatInviteLink]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CreateChatInviteLink(Function[ChatInviteLink]):
     chat_id: int = ...
     name: str = ...
@@ -12714,13 +12714,13 @@ class CreateChatInviteLink(Function[ChatInviteLink]):
     member_limit: int = ...
     creates_join_request: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class CreateChatSubscriptionInviteLink(Function[ChatInviteLink]):
     chat_id: int = ...
     name: str = ...
     subscription_pricing: StarSubscriptionPricing | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditChatInviteLink(Function[ChatInviteLink]):
     chat_id: int = ...
     invite_link: str = ...
@@ -12729,22 +12729,22 @@ class EditChatInviteLink(Function[ChatInviteLink]):
     member_limit: int = ...
     creates_join_request: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditChatSubscriptionInviteLink(Function[ChatInviteLink]):
     chat_id: int = ...
     invite_link: str = ...
     name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatInviteLink(Function[ChatInviteLink]):
     chat_id: int = ...
     invite_link: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatInviteLinkCounts(Function[ChatInviteLinkCounts]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatInviteLinks(Function[ChatInviteLinks]):
     chat_id: int = ...
     creator_user_id: int = ...
@@ -12753,7 +12753,7 @@ class GetChatInviteLinks(Function[ChatInviteLinks]):
     offset_invite_link: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatInviteLinkMembers(Function[ChatInviteLinkMembers]):
     chat_id: int = ...
     invite_link: str = ...
@@ -12761,30 +12761,30 @@ class GetChatInviteLinkMembers(Function[ChatInviteLinkMembers]):
     offset_member: ChatInviteLinkMember | None = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class RevokeChatInviteLink(Function[ChatInviteLinks]):
     chat_id: int = ...
     invite_link: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteRevokedChatInviteLink(Function[Ok]):
     chat_id: int = ...
     invite_link: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteAllRevokedChatInviteLinks(Function[Ok]):
     chat_id: int = ...
     creator_user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CheckChatInviteLink(Function[ChatInviteLinkInfo]):
     invite_link: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class JoinChatByInviteLink(Function[Chat]):
     invite_link: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatJoinRequests(Function[ChatJoinRequests]):
     chat_id: int = ...
     invite_link: str = ...
@@ -12792,53 +12792,53 @@ class GetChatJoinRequests(Function[ChatJoinRequests]):
     offset_request: ChatJoinRequest | None = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ProcessChatJoinRequest(Function[Ok]):
     chat_id: int = ...
     user_id: int = ...
     approve: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ProcessChatJoinRequests(Function[Ok]):
     chat_id: int = ...
     invite_link: str = ...
     approve: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ApproveSuggestedPost(Function[Ok]):
     chat_id: int = ...
     message_id: int = ...
     send_date: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeclineSuggestedPost(Function[Ok]):
     chat_id: int = ...
     message_id: int = ...
     comment: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class AddOffer(Function[Message]):
     chat_id: int = ...
     message_id: int = ...
     options: MessageSendOptions | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class CreateCall(Function[CallId]):
     user_id: int = ...
     protocol: CallProtocol | None = ...
     is_video: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class AcceptCall(Function[Ok]):
     call_id: int = ...
     protocol: CallProtocol | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SendCallSignalingData(Function[Ok]):
     call_id: int = ...
     data: bytes = ...
 
-@dataclass
+@dataclass(slots=True)
 class DiscardCall(Function[Ok]):
     call_id: int = ...
     is_disconnected: bool = ...
@@ -12847,270 +12847,270 @@ class DiscardCall(Function[Ok]):
     is_video: bool = ...
     connection_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SendCallRating(Function[Ok]):
     call_id: int = ...
     rating: int = ...
     comment: str = ...
     problems: list[CallProblem] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SendCallDebugInformation(Function[Ok]):
     call_id: int = ...
     debug_information: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SendCallLog(Function[Ok]):
     call_id: int = ...
     log_file: InputFile | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetVideoChatAvailableParticipants(Function[MessageSenders]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetVideoChatDefaultParticipant(Function[Ok]):
     chat_id: int = ...
     default_participant_id: MessageSender | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class CreateVideoChat(Function[GroupCallId]):
     chat_id: int = ...
     title: str = ...
     start_date: int = ...
     is_rtmp_stream: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class CreateGroupCall(Function[GroupCallInfo]):
     join_parameters: GroupCallJoinParameters | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetVideoChatRtmpUrl(Function[RtmpUrl]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReplaceVideoChatRtmpUrl(Function[RtmpUrl]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetLiveStoryRtmpUrl(Function[RtmpUrl]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReplaceLiveStoryRtmpUrl(Function[RtmpUrl]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetGroupCall(Function[GroupCall]):
     group_call_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StartScheduledVideoChat(Function[Ok]):
     group_call_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleVideoChatEnabledStartNotification(Function[Ok]):
     group_call_id: int = ...
     enabled_start_notification: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class JoinGroupCall(Function[GroupCallInfo]):
     input_group_call: InputGroupCall | None = ...
     join_parameters: GroupCallJoinParameters | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class JoinVideoChat(Function[Text]):
     group_call_id: int = ...
     participant_id: MessageSender | None = ...
     join_parameters: GroupCallJoinParameters | None = ...
     invite_hash: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class JoinLiveStory(Function[Text]):
     group_call_id: int = ...
     join_parameters: GroupCallJoinParameters | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class StartGroupCallScreenSharing(Function[Text]):
     group_call_id: int = ...
     audio_source_id: int = ...
     payload: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleGroupCallScreenSharingIsPaused(Function[Ok]):
     group_call_id: int = ...
     is_paused: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class EndGroupCallScreenSharing(Function[Ok]):
     group_call_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetVideoChatTitle(Function[Ok]):
     group_call_id: int = ...
     title: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleVideoChatMuteNewParticipants(Function[Ok]):
     group_call_id: int = ...
     mute_new_participants: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleGroupCallAreMessagesAllowed(Function[Ok]):
     group_call_id: int = ...
     are_messages_allowed: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetLiveStoryStreamer(Function[GroupCallParticipant]):
     group_call_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetLiveStoryAvailableMessageSenders(Function[ChatMessageSenders]):
     group_call_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetLiveStoryMessageSender(Function[Ok]):
     group_call_id: int = ...
     message_sender_id: MessageSender | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SendGroupCallMessage(Function[Ok]):
     group_call_id: int = ...
     text: FormattedText | None = ...
     paid_message_star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AddPendingLiveStoryReaction(Function[Ok]):
     group_call_id: int = ...
     star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CommitPendingLiveStoryReactions(Function[Ok]):
     group_call_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class RemovePendingLiveStoryReactions(Function[Ok]):
     group_call_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteGroupCallMessages(Function[Ok]):
     group_call_id: int = ...
     message_ids: list[int] | None = ...
     report_spam: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteGroupCallMessagesBySender(Function[Ok]):
     group_call_id: int = ...
     sender_id: MessageSender | None = ...
     report_spam: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetLiveStoryTopDonors(Function[LiveStoryDonors]):
     group_call_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class InviteGroupCallParticipant(Function[InviteGroupCallParticipantResult]):
     group_call_id: int = ...
     user_id: int = ...
     is_video: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeclineGroupCallInvitation(Function[Ok]):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class BanGroupCallParticipants(Function[Ok]):
     group_call_id: int = ...
     user_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class InviteVideoChatParticipants(Function[Ok]):
     group_call_id: int = ...
     user_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetVideoChatInviteLink(Function[HttpUrl]):
     group_call_id: int = ...
     can_self_unmute: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class RevokeGroupCallInviteLink(Function[Ok]):
     group_call_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class StartGroupCallRecording(Function[Ok]):
     group_call_id: int = ...
     title: str = ...
     record_video: bool = ...
     use_portrait_orientation: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class EndGroupCallRecording(Function[Ok]):
     group_call_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleGroupCallIsMyVideoPaused(Function[Ok]):
     group_call_id: int = ...
     is_my_video_paused: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleGroupCallIsMyVideoEnabled(Function[Ok]):
     group_call_id: int = ...
     is_my_video_enabled: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetGroupCallPaidMessageStarCount(Function[Ok]):
     group_call_id: int = ...
     paid_message_star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetGroupCallParticipantIsSpeaking(Function[MessageSender]):
     group_call_id: int = ...
     audio_source: int = ...
     is_speaking: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleGroupCallParticipantIsMuted(Function[Ok]):
     group_call_id: int = ...
     participant_id: MessageSender | None = ...
     is_muted: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetGroupCallParticipantVolumeLevel(Function[Ok]):
     group_call_id: int = ...
     participant_id: MessageSender | None = ...
     volume_level: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleGroupCallParticipantIsHandRaised(Function[Ok]):
     group_call_id: int = ...
     participant_id: MessageSender | None = ...
     is_hand_raised: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetGroupCallParticipants(Function[GroupCallParticipants]):
     input_group_call: InputGroupCall | None = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class LoadGroupCallParticipants(Function[Ok]):
     group_call_id: int = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class LeaveGroupCall(Function[Ok]):
     group_call_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class EndGroupCall(Function[Ok]):
     group_call_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetGroupCallStreams(Function[GroupCallStreams]):
     group_call_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetGroupCallStreamSegment(Function[Data]):
     group_call_id: int = ...
     time_offset: int = ...
@@ -13118,166 +13118,166 @@ class GetGroupCallStreamSegment(Function[Data]):
     channel_id: int = ...
     video_quality: GroupCallVideoQuality | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EncryptGroupCallData(Function[Data]):
     group_call_id: int = ...
     data_channel: GroupCallDataChannel | None = ...
     data: bytes = ...
     unencrypted_prefix_size: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class DecryptGroupCallData(Function[Data]):
     group_call_id: int = ...
     participant_id: MessageSender | None = ...
     data_channel: GroupCallDataChannel | None = ...
     data: bytes = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetMessageSenderBlockList(Function[Ok]):
     sender_id: MessageSender | None = ...
     block_list: BlockList | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class BlockMessageSenderFromReplies(Function[Ok]):
     message_id: int = ...
     delete_message: bool = ...
     delete_all_messages: bool = ...
     report_spam: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetBlockedMessageSenders(Function[MessageSenders]):
     block_list: BlockList | None = ...
     offset: int = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AddContact(Function[Ok]):
     user_id: int = ...
     contact: ImportedContact | None = ...
     share_phone_number: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ImportContacts(Function[ImportedContacts]):
     contacts: list[ImportedContact] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetContacts(Function[Users]): ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchContacts(Function[Users]):
     query: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class RemoveContacts(Function[Ok]):
     user_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetImportedContactCount(Function[Count]): ...
 
-@dataclass
+@dataclass(slots=True)
 class ChangeImportedContacts(Function[ImportedContacts]):
     contacts: list[ImportedContact] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ClearImportedContacts(Function[Ok]): ...
 
-@dataclass
+@dataclass(slots=True)
 class SetCloseFriends(Function[Ok]):
     user_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetCloseFriends(Function[Users]): ...
 
-@dataclass
+@dataclass(slots=True)
 class SetUserPersonalProfilePhoto(Function[Ok]):
     user_id: int = ...
     photo: InputChatPhoto | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetUserNote(Function[Ok]):
     user_id: int = ...
     note: FormattedText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SuggestUserProfilePhoto(Function[Ok]):
     user_id: int = ...
     photo: InputChatPhoto | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SuggestUserBirthdate(Function[Ok]):
     user_id: int = ...
     birthdate: Birthdate | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleBotCanManageEmojiStatus(Function[Ok]):
     bot_user_id: int = ...
     can_manage_emoji_status: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetUserEmojiStatus(Function[Ok]):
     user_id: int = ...
     emoji_status: EmojiStatus | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchUserByPhoneNumber(Function[User]):
     phone_number: str = ...
     only_local: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class SharePhoneNumber(Function[Ok]):
     user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetUserProfilePhotos(Function[ChatPhotos]):
     user_id: int = ...
     offset: int = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetUserProfileAudios(Function[Audios]):
     user_id: int = ...
     offset: int = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class IsProfileAudio(Function[Ok]):
     file_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AddProfileAudio(Function[Ok]):
     file_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetProfileAudioPosition(Function[Ok]):
     file_id: int = ...
     after_file_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class RemoveProfileAudio(Function[Ok]):
     file_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetStickerOutline(Function[Outline]):
     sticker_file_id: int = ...
     for_animated_emoji: bool = ...
     for_clicked_animated_emoji_message: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetStickers(Function[Stickers]):
     sticker_type: StickerType | None = ...
     query: str = ...
     limit: int = ...
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetAllStickerEmojis(Function[Emojis]):
     sticker_type: StickerType | None = ...
     query: str = ...
     chat_id: int = ...
     return_only_main_emoji: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchStickers(Function[Stickers]):
     sticker_type: StickerType | None = ...
     emojis: str = ...
@@ -13286,618 +13286,618 @@ class SearchStickers(Function[Stickers]):
     offset: int = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetGreetingStickers(Function[Stickers]): ...
 
-@dataclass
+@dataclass(slots=True)
 class GetPremiumStickers(Function[Stickers]):
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetInstalledStickerSets(Function[StickerSets]):
     sticker_type: StickerType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetArchivedStickerSets(Function[StickerSets]):
     sticker_type: StickerType | None = ...
     offset_sticker_set_id: int = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetTrendingStickerSets(Function[TrendingStickerSets]):
     sticker_type: StickerType | None = ...
     offset: int = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetAttachedStickerSets(Function[StickerSets]):
     file_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetStickerSet(Function[StickerSet]):
     set_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetStickerSetName(Function[Text]):
     set_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchStickerSet(Function[StickerSet]):
     name: str = ...
     ignore_cache: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchInstalledStickerSets(Function[StickerSets]):
     sticker_type: StickerType | None = ...
     query: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchStickerSets(Function[StickerSets]):
     sticker_type: StickerType | None = ...
     query: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ChangeStickerSet(Function[Ok]):
     set_id: int = ...
     is_installed: bool = ...
     is_archived: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ViewTrendingStickerSets(Function[Ok]):
     sticker_set_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReorderInstalledStickerSets(Function[Ok]):
     sticker_type: StickerType | None = ...
     sticker_set_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetRecentStickers(Function[Stickers]):
     is_attached: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class AddRecentSticker(Function[Stickers]):
     is_attached: bool = ...
     sticker: InputFile | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class RemoveRecentSticker(Function[Ok]):
     is_attached: bool = ...
     sticker: InputFile | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ClearRecentStickers(Function[Ok]):
     is_attached: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetFavoriteStickers(Function[Stickers]): ...
 
-@dataclass
+@dataclass(slots=True)
 class AddFavoriteSticker(Function[Ok]):
     sticker: InputFile | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class RemoveFavoriteSticker(Function[Ok]):
     sticker: InputFile | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetStickerEmojis(Function[Emojis]):
     sticker: InputFile | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchEmojis(Function[EmojiKeywords]):
     text: str = ...
     input_language_codes: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetKeywordEmojis(Function[Emojis]):
     text: str = ...
     input_language_codes: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetEmojiCategories(Function[EmojiCategories]):
     type: EmojiCategoryType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetAnimatedEmoji(Function[AnimatedEmoji]):
     emoji: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetEmojiSuggestionsUrl(Function[HttpUrl]):
     language_code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetCustomEmojiStickers(Function[Stickers]):
     custom_emoji_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetDefaultChatPhotoCustomEmojiStickers(Function[Stickers]): ...
-@dataclass
+@dataclass(slots=True)
 class GetDefaultProfilePhotoCustomEmojiStickers(Function[Stickers]): ...
-@dataclass
+@dataclass(slots=True)
 class GetDefaultBackgroundCustomEmojiStickers(Function[Stickers]): ...
-@dataclass
+@dataclass(slots=True)
 class GetSavedAnimations(Function[Animations]): ...
 
-@dataclass
+@dataclass(slots=True)
 class AddSavedAnimation(Function[Ok]):
     animation: InputFile | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class RemoveSavedAnimation(Function[Ok]):
     animation: InputFile | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetRecentInlineBots(Function[Users]): ...
-@dataclass
+@dataclass(slots=True)
 class GetOwnedBots(Function[Users]): ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchHashtags(Function[Hashtags]):
     prefix: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class RemoveRecentHashtag(Function[Ok]):
     hashtag: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetLinkPreview(Function[LinkPreview]):
     text: FormattedText | None = ...
     link_preview_options: LinkPreviewOptions | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetWebPageInstantView(Function[WebPageInstantView]):
     url: str = ...
     only_local: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetProfilePhoto(Function[Ok]):
     photo: InputChatPhoto | None = ...
     is_public: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteProfilePhoto(Function[Ok]):
     profile_photo_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetAccentColor(Function[Ok]):
     accent_color_id: int = ...
     background_custom_emoji_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetUpgradedGiftColors(Function[Ok]):
     upgraded_gift_colors_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetProfileAccentColor(Function[Ok]):
     profile_accent_color_id: int = ...
     profile_background_custom_emoji_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetName(Function[Ok]):
     first_name: str = ...
     last_name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetBio(Function[Ok]):
     bio: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetUsername(Function[Ok]):
     username: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleUsernameIsActive(Function[Ok]):
     username: str = ...
     is_active: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReorderActiveUsernames(Function[Ok]):
     usernames: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetBirthdate(Function[Ok]):
     birthdate: Birthdate | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetMainProfileTab(Function[Ok]):
     main_profile_tab: ProfileTab | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetPersonalChat(Function[Ok]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetEmojiStatus(Function[Ok]):
     emoji_status: EmojiStatus | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleHasSponsoredMessagesEnabled(Function[Ok]):
     has_sponsored_messages_enabled: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetBusinessLocation(Function[Ok]):
     location: BusinessLocation | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetBusinessOpeningHours(Function[Ok]):
     opening_hours: BusinessOpeningHours | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetBusinessGreetingMessageSettings(Function[Ok]):
     greeting_message_settings: BusinessGreetingMessageSettings | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetBusinessAwayMessageSettings(Function[Ok]):
     away_message_settings: BusinessAwayMessageSettings | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetBusinessStartPage(Function[Ok]):
     start_page: InputBusinessStartPage | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SendPhoneNumberCode(Function[AuthenticationCodeInfo]):
     phone_number: str = ...
     settings: PhoneNumberAuthenticationSettings | None = ...
     type: PhoneNumberCodeType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SendPhoneNumberFirebaseSms(Function[Ok]):
     token: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReportPhoneNumberCodeMissing(Function[Ok]):
     mobile_network_code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ResendPhoneNumberCode(Function[AuthenticationCodeInfo]):
     reason: ResendCodeReason | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class CheckPhoneNumberCode(Function[Ok]):
     code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetBusinessConnectedBot(Function[BusinessConnectedBot]): ...
 
-@dataclass
+@dataclass(slots=True)
 class SetBusinessConnectedBot(Function[Ok]):
     bot: BusinessConnectedBot | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteBusinessConnectedBot(Function[Ok]):
     bot_user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleBusinessConnectedBotChatIsPaused(Function[Ok]):
     chat_id: int = ...
     is_paused: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class RemoveBusinessConnectedBotFromChat(Function[Ok]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetBusinessChatLinks(Function[BusinessChatLinks]): ...
 
-@dataclass
+@dataclass(slots=True)
 class CreateBusinessChatLink(Function[BusinessChatLink]):
     link_info: InputBusinessChatLink | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditBusinessChatLink(Function[BusinessChatLink]):
     link: str = ...
     link_info: InputBusinessChatLink | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteBusinessChatLink(Function[Ok]):
     link: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetBusinessChatLinkInfo(Function[BusinessChatLinkInfo]):
     link_name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetUserLink(Function[UserLink]): ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchUserByToken(Function[User]):
     token: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetCommands(Function[Ok]):
     scope: BotCommandScope | None = ...
     language_code: str = ...
     commands: list[BotCommand] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteCommands(Function[Ok]):
     scope: BotCommandScope | None = ...
     language_code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetCommands(Function[BotCommands]):
     scope: BotCommandScope | None = ...
     language_code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetMenuButton(Function[Ok]):
     user_id: int = ...
     menu_button: BotMenuButton | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetMenuButton(Function[BotMenuButton]):
     user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetDefaultGroupAdministratorRights(Function[Ok]):
     default_group_administrator_rights: ChatAdministratorRights | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetDefaultChannelAdministratorRights(Function[Ok]):
     default_channel_administrator_rights: ChatAdministratorRights | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class CanBotSendMessages(Function[Ok]):
     bot_user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AllowBotToSendMessages(Function[Ok]):
     bot_user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SendWebAppCustomRequest(Function[CustomRequestResult]):
     bot_user_id: int = ...
     method: str = ...
     parameters: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetBotMediaPreviews(Function[BotMediaPreviews]):
     bot_user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetBotMediaPreviewInfo(Function[BotMediaPreviewInfo]):
     bot_user_id: int = ...
     language_code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class AddBotMediaPreview(Function[BotMediaPreview]):
     bot_user_id: int = ...
     language_code: str = ...
     content: InputStoryContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditBotMediaPreview(Function[BotMediaPreview]):
     bot_user_id: int = ...
     language_code: str = ...
     file_id: int = ...
     content: InputStoryContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReorderBotMediaPreviews(Function[Ok]):
     bot_user_id: int = ...
     language_code: str = ...
     file_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteBotMediaPreviews(Function[Ok]):
     bot_user_id: int = ...
     language_code: str = ...
     file_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetBotName(Function[Ok]):
     bot_user_id: int = ...
     language_code: str = ...
     name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetBotName(Function[Text]):
     bot_user_id: int = ...
     language_code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetBotProfilePhoto(Function[Ok]):
     bot_user_id: int = ...
     photo: InputChatPhoto | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleBotUsernameIsActive(Function[Ok]):
     bot_user_id: int = ...
     username: str = ...
     is_active: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReorderBotActiveUsernames(Function[Ok]):
     bot_user_id: int = ...
     usernames: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetBotInfoDescription(Function[Ok]):
     bot_user_id: int = ...
     language_code: str = ...
     description: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetBotInfoDescription(Function[Text]):
     bot_user_id: int = ...
     language_code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetBotInfoShortDescription(Function[Ok]):
     bot_user_id: int = ...
     language_code: str = ...
     short_description: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetBotInfoShortDescription(Function[Text]):
     bot_user_id: int = ...
     language_code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetMessageSenderBotVerification(Function[Ok]):
     bot_user_id: int = ...
     verified_id: MessageSender | None = ...
     custom_description: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class RemoveMessageSenderBotVerification(Function[Ok]):
     bot_user_id: int = ...
     verified_id: MessageSender | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetActiveSessions(Function[Sessions]): ...
 
-@dataclass
+@dataclass(slots=True)
 class TerminateSession(Function[Ok]):
     session_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class TerminateAllOtherSessions(Function[Ok]): ...
 
-@dataclass
+@dataclass(slots=True)
 class ConfirmSession(Function[Ok]):
     session_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleSessionCanAcceptCalls(Function[Ok]):
     session_id: int = ...
     can_accept_calls: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleSessionCanAcceptSecretChats(Function[Ok]):
     session_id: int = ...
     can_accept_secret_chats: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetInactiveSessionTtl(Function[Ok]):
     inactive_session_ttl_days: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetConnectedWebsites(Function[ConnectedWebsites]): ...
 
-@dataclass
+@dataclass(slots=True)
 class DisconnectWebsite(Function[Ok]):
     website_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class DisconnectAllWebsites(Function[Ok]): ...
 
-@dataclass
+@dataclass(slots=True)
 class SetSupergroupUsername(Function[Ok]):
     supergroup_id: int = ...
     username: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleSupergroupUsernameIsActive(Function[Ok]):
     supergroup_id: int = ...
     username: str = ...
     is_active: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class DisableAllSupergroupUsernames(Function[Ok]):
     supergroup_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReorderSupergroupActiveUsernames(Function[Ok]):
     supergroup_id: int = ...
     usernames: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetSupergroupStickerSet(Function[Ok]):
     supergroup_id: int = ...
     sticker_set_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetSupergroupCustomEmojiStickerSet(Function[Ok]):
     supergroup_id: int = ...
     custom_emoji_sticker_set_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetSupergroupUnrestrictBoostCount(Function[Ok]):
     supergroup_id: int = ...
     unrestrict_boost_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetSupergroupMainProfileTab(Function[Ok]):
     supergroup_id: int = ...
     main_profile_tab: ProfileTab | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleSupergroupSignMessages(Function[Ok]):
     supergroup_id: int = ...
     sign_messages: bool = ...
     show_message_sender: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleSupergroupJoinToSendMessages(Function[Ok]):
     supergroup_id: int = ...
     join_to_send_messages: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleSupergroupJoinByRequest(Function[Ok]):
     supergroup_id: int = ...
     join_by_request: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleSupergroupIsAllHistoryAvailable(Function[Ok]):
     supergroup_id: int = ...
     is_all_history_available: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleSupergroupCanHaveSponsoredMessages(Function[Ok]):
     supergroup_id: int = ...
     can_have_sponsored_messages: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleSupergroupHasAutomaticTranslation(Function[Ok]):
     supergroup_id: int = ...
     has_automatic_translation: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleSupergroupHasHiddenMembers(Function[Ok]):
     supergroup_id: int = ...
     has_hidden_members: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleSupergroupHasAggressiveAntiSpamEnabled(Function[Ok]):
     supergroup_id: int = ...
     has_aggressive_anti_spam_enabled: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleSupergroupIsForum(Function[Ok]):
     supergroup_id: int = ...
     is_forum: bool = ...
     has_forum_tabs: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleSupergroupIsBroadcastGroup(Function[Ok]):
     supergroup_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReportSupergroupSpam(Function[Ok]):
     supergroup_id: int = ...
     message_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReportSupergroupAntiSpamFalsePositive(Function[Ok]):
     supergroup_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetSupergroupMembers(Function[ChatMembers]):
     supergroup_id: int = ...
     filter: SupergroupMembersFilter | None = ...
     offset: int = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CloseSecretChat(Function[Ok]):
     secret_chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatEventLog(Function[ChatEvents]):
     chat_id: int = ...
     query: str = ...
@@ -13906,21 +13906,21 @@ class GetChatEventLog(Function[ChatEvents]):
     filters: ChatEventLogFilters | None = ...
     user_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetTimeZones(Function[TimeZones]): ...
 
-@dataclass
+@dataclass(slots=True)
 class GetPaymentForm(Function[PaymentForm]):
     input_invoice: InputInvoice | None = ...
     theme: ThemeParameters | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ValidateOrderInfo(Function[ValidatedOrderInfo]):
     input_invoice: InputInvoice | None = ...
     order_info: OrderInfo | None = ...
     allow_save: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class SendPaymentForm(Function[PaymentResult]):
     input_invoice: InputInvoice | None = ...
     payment_form_id: int = ...
@@ -13929,30 +13929,30 @@ class SendPaymentForm(Function[PaymentResult]):
     credentials: InputCredentials | None = ...
     tip_amount: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetPaymentReceipt(Function[PaymentReceipt]):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetSavedOrderInfo(Function[OrderInfo]): ...
-@dataclass
+@dataclass(slots=True)
 class DeleteSavedOrderInfo(Function[Ok]): ...
-@dataclass
+@dataclass(slots=True)
 class DeleteSavedCredentials(Function[Ok]): ...
 
-@dataclass
+@dataclass(slots=True)
 class SetGiftSettings(Function[Ok]):
     settings: GiftSettings | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetAvailableGifts(Function[AvailableGifts]): ...
 
-@dataclass
+@dataclass(slots=True)
 class CanSendGift(Function[CanSendGiftResult]):
     gift_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SendGift(Function[Ok]):
     gift_id: int = ...
     owner_id: MessageSender | None = ...
@@ -13960,23 +13960,23 @@ class SendGift(Function[Ok]):
     is_private: bool = ...
     pay_for_upgrade: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetGiftAuctionState(Function[GiftAuctionState]):
     auction_id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetGiftAuctionAcquiredGifts(Function[GiftAuctionAcquiredGifts]):
     gift_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class OpenGiftAuction(Function[Ok]):
     gift_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CloseGiftAuction(Function[Ok]):
     gift_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PlaceGiftAuctionBid(Function[Ok]):
     gift_id: int = ...
     star_count: int = ...
@@ -13984,67 +13984,67 @@ class PlaceGiftAuctionBid(Function[Ok]):
     text: FormattedText | None = ...
     is_private: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class IncreaseGiftAuctionBid(Function[Ok]):
     gift_id: int = ...
     star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SellGift(Function[Ok]):
     business_connection_id: str = ...
     received_gift_id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleGiftIsSaved(Function[Ok]):
     received_gift_id: str = ...
     is_saved: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetPinnedGifts(Function[Ok]):
     owner_id: MessageSender | None = ...
     received_gift_ids: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ToggleChatGiftNotifications(Function[Ok]):
     chat_id: int = ...
     are_enabled: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetGiftUpgradePreview(Function[GiftUpgradePreview]):
     gift_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class UpgradeGift(Function[UpgradeGiftResult]):
     business_connection_id: str = ...
     received_gift_id: str = ...
     keep_original_details: bool = ...
     star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class BuyGiftUpgrade(Function[Ok]):
     owner_id: MessageSender | None = ...
     prepaid_upgrade_hash: str = ...
     star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class TransferGift(Function[Ok]):
     business_connection_id: str = ...
     received_gift_id: str = ...
     new_owner_id: MessageSender | None = ...
     star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class DropGiftOriginalDetails(Function[Ok]):
     received_gift_id: str = ...
     star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SendResoldGift(Function[GiftResaleResult]):
     gift_name: str = ...
     owner_id: MessageSender | None = ...
     price: GiftResalePrice | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetReceivedGifts(Function[ReceivedGifts]):
     business_connection_id: str = ...
     owner_id: MessageSender | None = ...
@@ -14061,29 +14061,29 @@ class GetReceivedGifts(Function[ReceivedGifts]):
     offset: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetReceivedGift(Function[ReceivedGift]):
     received_gift_id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetUpgradedGift(Function[UpgradedGift]):
     name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetUpgradedGiftValueInfo(Function[UpgradedGiftValueInfo]):
     name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetUpgradedGiftWithdrawalUrl(Function[HttpUrl]):
     received_gift_id: str = ...
     password: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetGiftResalePrice(Function[Ok]):
     received_gift_id: str = ...
     price: GiftResalePrice | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchGiftsForResale(Function[GiftsForResale]):
     gift_id: int = ...
     order: GiftForResaleOrder | None = ...
@@ -14091,328 +14091,328 @@ class SearchGiftsForResale(Function[GiftsForResale]):
     offset: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetGiftCollections(Function[GiftCollections]):
     owner_id: MessageSender | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class CreateGiftCollection(Function[GiftCollection]):
     owner_id: MessageSender | None = ...
     name: str = ...
     received_gift_ids: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReorderGiftCollections(Function[Ok]):
     owner_id: MessageSender | None = ...
     collection_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteGiftCollection(Function[Ok]):
     owner_id: MessageSender | None = ...
     collection_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetGiftCollectionName(Function[GiftCollection]):
     owner_id: MessageSender | None = ...
     collection_id: int = ...
     name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class AddGiftCollectionGifts(Function[GiftCollection]):
     owner_id: MessageSender | None = ...
     collection_id: int = ...
     received_gift_ids: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class RemoveGiftCollectionGifts(Function[GiftCollection]):
     owner_id: MessageSender | None = ...
     collection_id: int = ...
     received_gift_ids: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReorderGiftCollectionGifts(Function[GiftCollection]):
     owner_id: MessageSender | None = ...
     collection_id: int = ...
     received_gift_ids: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class CreateInvoiceLink(Function[HttpUrl]):
     business_connection_id: str = ...
     invoice: InputMessageContent | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class RefundStarPayment(Function[Ok]):
     user_id: int = ...
     telegram_payment_charge_id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetSupportUser(Function[User]): ...
 
-@dataclass
+@dataclass(slots=True)
 class GetBackgroundUrl(Function[HttpUrl]):
     name: str = ...
     type: BackgroundType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchBackground(Function[Background]):
     name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetDefaultBackground(Function[Background]):
     background: InputBackground | None = ...
     type: BackgroundType | None = ...
     for_dark_theme: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteDefaultBackground(Function[Ok]):
     for_dark_theme: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetInstalledBackgrounds(Function[Backgrounds]):
     for_dark_theme: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class RemoveInstalledBackground(Function[Ok]):
     background_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ResetInstalledBackgrounds(Function[Ok]): ...
 
-@dataclass
+@dataclass(slots=True)
 class GetLocalizationTargetInfo(Function[LocalizationTargetInfo]):
     only_local: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetLanguagePackInfo(Function[LanguagePackInfo]):
     language_pack_id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetLanguagePackStrings(Function[LanguagePackStrings]):
     language_pack_id: str = ...
     keys: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SynchronizeLanguagePack(Function[Ok]):
     language_pack_id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class AddCustomServerLanguagePack(Function[Ok]):
     language_pack_id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetCustomLanguagePack(Function[Ok]):
     info: LanguagePackInfo | None = ...
     strings: list[LanguagePackString] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditCustomLanguagePackInfo(Function[Ok]):
     info: LanguagePackInfo | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetCustomLanguagePackString(Function[Ok]):
     language_pack_id: str = ...
     new_string: LanguagePackString | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteLanguagePack(Function[Ok]):
     language_pack_id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class RegisterDevice(Function[PushReceiverId]):
     device_token: DeviceToken | None = ...
     other_user_ids: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ProcessPushNotification(Function[Ok]):
     payload: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetPushReceiverId(Function[PushReceiverId]):
     payload: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetRecentlyVisitedTMeUrls(Function[TMeUrls]):
     referrer: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetUserPrivacySettingRules(Function[Ok]):
     setting: UserPrivacySetting | None = ...
     rules: UserPrivacySettingRules | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetUserPrivacySettingRules(Function[UserPrivacySettingRules]):
     setting: UserPrivacySetting | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetReadDatePrivacySettings(Function[Ok]):
     settings: ReadDatePrivacySettings | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetReadDatePrivacySettings(Function[ReadDatePrivacySettings]): ...
 
-@dataclass
+@dataclass(slots=True)
 class SetNewChatPrivacySettings(Function[Ok]):
     settings: NewChatPrivacySettings | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetNewChatPrivacySettings(Function[NewChatPrivacySettings]): ...
 
-@dataclass
+@dataclass(slots=True)
 class GetPaidMessageRevenue(Function[StarCount]):
     user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class AllowUnpaidMessagesFromUser(Function[Ok]):
     user_id: int = ...
     refund_payments: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetChatPaidMessageStarCount(Function[Ok]):
     chat_id: int = ...
     paid_message_star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CanSendMessageToUser(Function[CanSendMessageToUserResult]):
     user_id: int = ...
     only_local: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetOption(Function[OptionValue]):
     name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetOption(Function[Ok]):
     name: str = ...
     value: OptionValue | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetAccountTtl(Function[Ok]):
     ttl: AccountTtl | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetAccountTtl(Function[AccountTtl]): ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteAccount(Function[Ok]):
     reason: str = ...
     password: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetDefaultMessageAutoDeleteTime(Function[Ok]):
     message_auto_delete_time: MessageAutoDeleteTime | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetDefaultMessageAutoDeleteTime(Function[MessageAutoDeleteTime]): ...
 
-@dataclass
+@dataclass(slots=True)
 class RemoveChatActionBar(Function[Ok]):
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReportChat(Function[ReportChatResult]):
     chat_id: int = ...
     option_id: bytes = ...
     message_ids: list[int] | None = ...
     text: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReportChatPhoto(Function[Ok]):
     chat_id: int = ...
     file_id: int = ...
     reason: ReportReason | None = ...
     text: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReportMessageReactions(Function[Ok]):
     chat_id: int = ...
     message_id: int = ...
     sender_id: MessageSender | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatRevenueStatistics(Function[ChatRevenueStatistics]):
     chat_id: int = ...
     is_dark: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatRevenueWithdrawalUrl(Function[HttpUrl]):
     chat_id: int = ...
     password: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatRevenueTransactions(Function[ChatRevenueTransactions]):
     chat_id: int = ...
     offset: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetTonTransactions(Function[TonTransactions]):
     direction: TransactionDirection | None = ...
     offset: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetStarRevenueStatistics(Function[StarRevenueStatistics]):
     owner_id: MessageSender | None = ...
     is_dark: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetStarWithdrawalUrl(Function[HttpUrl]):
     owner_id: MessageSender | None = ...
     star_count: int = ...
     password: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetStarAdAccountUrl(Function[HttpUrl]):
     owner_id: MessageSender | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetTonRevenueStatistics(Function[TonRevenueStatistics]):
     is_dark: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetTonWithdrawalUrl(Function[HttpUrl]):
     password: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetChatStatistics(Function[ChatStatistics]):
     chat_id: int = ...
     is_dark: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetMessageStatistics(Function[MessageStatistics]):
     chat_id: int = ...
     message_id: int = ...
     is_dark: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetMessagePublicForwards(Function[PublicForwards]):
     chat_id: int = ...
     message_id: int = ...
     offset: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetStoryStatistics(Function[StoryStatistics]):
     chat_id: int = ...
     story_id: int = ...
     is_dark: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetStatisticalGraph(Function[StatisticalGraph]):
     chat_id: int = ...
     token: str = ...
     x: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetStorageStatistics(Function[StorageStatistics]):
     chat_limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetStorageStatisticsFast(Function[StorageStatisticsFast]): ...
-@dataclass
+@dataclass(slots=True)
 class GetDatabaseStatistics(Function[DatabaseStatistics]): ...
 
-@dataclass
+@dataclass(slots=True)
 class OptimizeStorage(Function[StorageStatistics]):
     size: int = ...
     ttl: int = ...
@@ -14424,118 +14424,118 @@ class OptimizeStorage(Function[StorageStatistics]):
     return_deleted_file_statistics: bool = ...
     chat_limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetNetworkType(Function[Ok]):
     type: NetworkType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetNetworkStatistics(Function[NetworkStatistics]):
     only_current: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class AddNetworkStatistics(Function[Ok]):
     entry: NetworkStatisticsEntry | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ResetNetworkStatistics(Function[Ok]): ...
-@dataclass
+@dataclass(slots=True)
 class GetAutoDownloadSettingsPresets(Function[AutoDownloadSettingsPresets]): ...
 
-@dataclass
+@dataclass(slots=True)
 class SetAutoDownloadSettings(Function[Ok]):
     settings: AutoDownloadSettings | None = ...
     type: NetworkType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetAutosaveSettings(Function[AutosaveSettings]): ...
 
-@dataclass
+@dataclass(slots=True)
 class SetAutosaveSettings(Function[Ok]):
     scope: AutosaveSettingsScope | None = ...
     settings: ScopeAutosaveSettings | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ClearAutosaveSettingsExceptions(Function[Ok]): ...
 
-@dataclass
+@dataclass(slots=True)
 class GetBankCardInfo(Function[BankCardInfo]):
     bank_card_number: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetPassportElement(Function[PassportElement]):
     type: PassportElementType | None = ...
     password: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetAllPassportElements(Function[PassportElements]):
     password: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetPassportElement(Function[PassportElement]):
     element: InputPassportElement | None = ...
     password: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeletePassportElement(Function[Ok]):
     type: PassportElementType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetPassportElementErrors(Function[Ok]):
     user_id: int = ...
     errors: list[InputPassportElementError] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetPreferredCountryLanguage(Function[Text]):
     country_code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SendEmailAddressVerificationCode(Function[EmailAddressAuthenticationCodeInfo]):
     email_address: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ResendEmailAddressVerificationCode(Function[EmailAddressAuthenticationCodeInfo]): ...
 
-@dataclass
+@dataclass(slots=True)
 class CheckEmailAddressVerificationCode(Function[Ok]):
     code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetPassportAuthorizationForm(Function[PassportAuthorizationForm]):
     bot_user_id: int = ...
     scope: str = ...
     public_key: str = ...
     nonce: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetPassportAuthorizationFormAvailableElements(Function[PassportElementsWithErrors]):
     authorization_form_id: int = ...
     password: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SendPassportAuthorizationForm(Function[Ok]):
     authorization_form_id: int = ...
     types: list[PassportElementType] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetBotUpdatesStatus(Function[Ok]):
     pending_update_count: int = ...
     error_message: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class UploadStickerFile(Function[File]):
     user_id: int = ...
     sticker_format: StickerFormat | None = ...
     sticker: InputFile | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetSuggestedStickerSetName(Function[Text]):
     title: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class CheckStickerSetName(Function[CheckStickerSetNameResult]):
     name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class CreateNewStickerSet(Function[StickerSet]):
     user_id: int = ...
     title: str = ...
@@ -14545,70 +14545,70 @@ class CreateNewStickerSet(Function[StickerSet]):
     stickers: list[InputSticker] | None = ...
     source: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class AddStickerToSet(Function[Ok]):
     user_id: int = ...
     name: str = ...
     sticker: InputSticker | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReplaceStickerInSet(Function[Ok]):
     user_id: int = ...
     name: str = ...
     old_sticker: InputFile | None = ...
     new_sticker: InputSticker | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetStickerSetThumbnail(Function[Ok]):
     user_id: int = ...
     name: str = ...
     thumbnail: InputFile | None = ...
     format: StickerFormat | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetCustomEmojiStickerSetThumbnail(Function[Ok]):
     name: str = ...
     custom_emoji_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetStickerSetTitle(Function[Ok]):
     name: str = ...
     title: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class DeleteStickerSet(Function[Ok]):
     name: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetStickerPositionInSet(Function[Ok]):
     sticker: InputFile | None = ...
     position: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class RemoveStickerFromSet(Function[Ok]):
     sticker: InputFile | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetStickerEmojis(Function[Ok]):
     sticker: InputFile | None = ...
     emojis: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetStickerKeywords(Function[Ok]):
     sticker: InputFile | None = ...
     keywords: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetStickerMaskPosition(Function[Ok]):
     sticker: InputFile | None = ...
     mask_position: MaskPosition | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetOwnedStickerSets(Function[StickerSets]):
     offset_sticker_set_id: int = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetMapThumbnailFile(Function[File]):
     location: Location | None = ...
     zoom: int = ...
@@ -14617,74 +14617,74 @@ class GetMapThumbnailFile(Function[File]):
     scale: int = ...
     chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetPremiumLimit(Function[PremiumLimit]):
     limit_type: PremiumLimitType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetPremiumFeatures(Function[PremiumFeatures]):
     source: PremiumSource | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetPremiumStickerExamples(Function[Stickers]): ...
 
-@dataclass
+@dataclass(slots=True)
 class GetPremiumInfoSticker(Function[Sticker]):
     month_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ViewPremiumFeature(Function[Ok]):
     feature: PremiumFeature | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class ClickPremiumSubscriptionButton(Function[Ok]): ...
-@dataclass
+@dataclass(slots=True)
 class GetPremiumState(Function[PremiumState]): ...
-@dataclass
+@dataclass(slots=True)
 class GetPremiumGiftPaymentOptions(Function[PremiumGiftPaymentOptions]): ...
 
-@dataclass
+@dataclass(slots=True)
 class GetPremiumGiveawayPaymentOptions(Function[PremiumGiveawayPaymentOptions]):
     boosted_chat_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class CheckPremiumGiftCode(Function[PremiumGiftCodeInfo]):
     code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class ApplyPremiumGiftCode(Function[Ok]):
     code: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GiftPremiumWithStars(Function[Ok]):
     user_id: int = ...
     star_count: int = ...
     month_count: int = ...
     text: FormattedText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class LaunchPrepaidGiveaway(Function[Ok]):
     giveaway_id: int = ...
     parameters: GiveawayParameters | None = ...
     winner_count: int = ...
     star_count: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetGiveawayInfo(Function[GiveawayInfo]):
     chat_id: int = ...
     message_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetStarPaymentOptions(Function[StarPaymentOptions]): ...
 
-@dataclass
+@dataclass(slots=True)
 class GetStarGiftPaymentOptions(Function[StarPaymentOptions]):
     user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetStarGiveawayPaymentOptions(Function[StarGiveawayPaymentOptions]): ...
 
-@dataclass
+@dataclass(slots=True)
 class GetStarTransactions(Function[StarTransactions]):
     owner_id: MessageSender | None = ...
     subscription_id: str = ...
@@ -14692,144 +14692,144 @@ class GetStarTransactions(Function[StarTransactions]):
     offset: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetStarSubscriptions(Function[StarSubscriptions]):
     only_expiring: bool = ...
     offset: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class CanPurchaseFromStore(Function[Ok]):
     purpose: StorePaymentPurpose | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class AssignStoreTransaction(Function[Ok]):
     transaction: StoreTransaction | None = ...
     purpose: StorePaymentPurpose | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditStarSubscription(Function[Ok]):
     subscription_id: str = ...
     is_canceled: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditUserStarSubscription(Function[Ok]):
     user_id: int = ...
     telegram_payment_charge_id: str = ...
     is_canceled: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class ReuseStarSubscription(Function[Ok]):
     subscription_id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetChatAffiliateProgram(Function[Ok]):
     chat_id: int = ...
     parameters: AffiliateProgramParameters | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchChatAffiliateProgram(Function[Chat]):
     username: str = ...
     referrer: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchAffiliatePrograms(Function[FoundAffiliatePrograms]):
     affiliate: AffiliateType | None = ...
     sort_order: AffiliateProgramSortOrder | None = ...
     offset: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class ConnectAffiliateProgram(Function[ConnectedAffiliateProgram]):
     affiliate: AffiliateType | None = ...
     bot_user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class DisconnectAffiliateProgram(Function[ConnectedAffiliateProgram]):
     affiliate: AffiliateType | None = ...
     url: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetConnectedAffiliateProgram(Function[ConnectedAffiliateProgram]):
     affiliate: AffiliateType | None = ...
     bot_user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetConnectedAffiliatePrograms(Function[ConnectedAffiliatePrograms]):
     affiliate: AffiliateType | None = ...
     offset: str = ...
     limit: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetBusinessFeatures(Function[BusinessFeatures]):
     source: BusinessFeature | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class AcceptTermsOfService(Function[Ok]):
     terms_of_service_id: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SearchStringsByPrefix(Function[FoundPositions]):
     strings: list[str] | None = ...
     query: str = ...
     limit: int = ...
     return_none_for_empty_query: bool = ...
 
-@dataclass
+@dataclass(slots=True)
 class SendCustomRequest(Function[CustomRequestResult]):
     method: str = ...
     parameters: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class AnswerCustomQuery(Function[Ok]):
     custom_query_id: int = ...
     data: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetAlarm(Function[Ok]):
     seconds: float = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetCountries(Function[Countries]): ...
-@dataclass
+@dataclass(slots=True)
 class GetCountryCode(Function[Text]): ...
 
-@dataclass
+@dataclass(slots=True)
 class GetPhoneNumberInfo(Function[PhoneNumberInfo]):
     phone_number_prefix: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetPhoneNumberInfoSync(Function[PhoneNumberInfo]):
     language_code: str = ...
     phone_number_prefix: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetCollectibleItemInfo(Function[CollectibleItemInfo]):
     type: CollectibleItemType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetDeepLinkInfo(Function[DeepLinkInfo]):
     link: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetApplicationConfig(Function[JsonValue]): ...
 
-@dataclass
+@dataclass(slots=True)
 class SaveApplicationLogEvent(Function[Ok]):
     type: str = ...
     chat_id: int = ...
     data: JsonValue | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetApplicationDownloadLink(Function[HttpUrl]): ...
 
-@dataclass
+@dataclass(slots=True)
 class AddProxy(Function[Proxy]):
     server: str = ...
     port: int = ...
     enable: bool = ...
     type: ProxyType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EditProxy(Function[Proxy]):
     proxy_id: int = ...
     server: str = ...
@@ -14837,104 +14837,104 @@ class EditProxy(Function[Proxy]):
     enable: bool = ...
     type: ProxyType | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class EnableProxy(Function[Ok]):
     proxy_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class DisableProxy(Function[Ok]): ...
 
-@dataclass
+@dataclass(slots=True)
 class RemoveProxy(Function[Ok]):
     proxy_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetProxies(Function[Proxies]): ...
 
-@dataclass
+@dataclass(slots=True)
 class GetProxyLink(Function[HttpUrl]):
     proxy_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class PingProxy(Function[Seconds]):
     proxy_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetLogStream(Function[Ok]):
     log_stream: LogStream | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetLogStream(Function[LogStream]): ...
 
-@dataclass
+@dataclass(slots=True)
 class SetLogVerbosityLevel(Function[Ok]):
     new_verbosity_level: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetLogVerbosityLevel(Function[LogVerbosityLevel]): ...
-@dataclass
+@dataclass(slots=True)
 class GetLogTags(Function[LogTags]): ...
 
-@dataclass
+@dataclass(slots=True)
 class SetLogTagVerbosityLevel(Function[Ok]):
     tag: str = ...
     new_verbosity_level: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetLogTagVerbosityLevel(Function[LogVerbosityLevel]):
     tag: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class AddLogMessage(Function[Ok]):
     verbosity_level: int = ...
     text: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetUserSupportInfo(Function[UserSupportInfo]):
     user_id: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class SetUserSupportInfo(Function[UserSupportInfo]):
     user_id: int = ...
     message: FormattedText | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class GetSupportName(Function[Text]): ...
-@dataclass
+@dataclass(slots=True)
 class TestCallEmpty(Function[Ok]): ...
 
-@dataclass
+@dataclass(slots=True)
 class TestCallString(Function[TestString]):
     x: str = ...
 
-@dataclass
+@dataclass(slots=True)
 class TestCallBytes(Function[TestBytes]):
     x: bytes = ...
 
-@dataclass
+@dataclass(slots=True)
 class TestCallVectorInt(Function[TestVectorInt]):
     x: list[int] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class TestCallVectorIntObject(Function[TestVectorIntObject]):
     x: list[TestInt] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class TestCallVectorString(Function[TestVectorString]):
     x: list[str] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class TestCallVectorStringObject(Function[TestVectorStringObject]):
     x: list[TestString] | None = ...
 
-@dataclass
+@dataclass(slots=True)
 class TestSquareInt(Function[TestInt]):
     x: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class TestNetwork(Function[Ok]): ...
 
-@dataclass
+@dataclass(slots=True)
 class TestProxy(Function[Ok]):
     server: str = ...
     port: int = ...
@@ -14942,11 +14942,11 @@ class TestProxy(Function[Ok]):
     dc_id: int = ...
     timeout: float = ...
 
-@dataclass
+@dataclass(slots=True)
 class TestGetDifference(Function[Ok]): ...
-@dataclass
+@dataclass(slots=True)
 class TestUseUpdate(Function[Update]): ...
 
-@dataclass
+@dataclass(slots=True)
 class TestReturnError(Function[Error]):
     error: Error | None = ...
@@ -0,0 +1,412 @@
+from __future__ import annotations
+
+import dataclasses
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Mapping, Type
+
+from bygram.core.serializer import serialize_object
+from bygram.core.types import T, raw_table
+from bygram.types import raw
+from bygram.types.base import Function, ObjectBase, Update
+
+
+@functools.cache
+def _get_chat_fields(update_type: Type[Update]) -> tuple[str, ...]:
+    return tuple(
+        f.name
+        for f in dataclasses.fields(update_type)
+        if f.init and f.name != "chat_id"
+    )
+
+
+class EntityCache:
+    # Users, chats and groups of a client, kept up to date by updates of TDLib.
+    # Cached objects are the ones from updates and are changed in place
+    def __init__(self) -> None:
+        self._users: dict[int, raw.User] = {}
+        self._chats: dict[int, raw.Chat] = {}
+        self._basic_groups: dict[int, raw.BasicGroup] = {}
+        self._supergroups: dict[int, raw.Supergroup] = {}
+        self._secret_chats: dict[int, raw.SecretChat] = {}
+        self._user_full_info: dict[int, raw.UserFullInfo] = {}
+        self._basic_group_full_info: dict[int, raw.BasicGroupFullInfo] = {}
+        self._supergroup_full_info: dict[int, raw.SupergroupFullInfo] = {}
+        self._appliers = _get_appliers()
+
+    def user(self, user_id: int) -> raw.User | None:
+        return self._users.get(user_id)
+
+    def chat(self, chat_id: int) -> raw.Chat | None:
+        return self._chats.get(chat_id)
+
+    def basic_group(self, basic_group_id: int) -> raw.BasicGroup | None:
+        return self._basic_groups.get(basic_group_id)
+
+    def supergroup(self, supergroup_id: int) -> raw.Supergroup | None:
+        return self._supergroups.get(supergroup_id)
+
+    def secret_chat(self, secret_chat_id: int) -> raw.SecretChat | None:
+        return self._secret_chats.get(secret_chat_id)
+
+    def user_full_info(self, user_id: int) -> raw.UserFullInfo | None:
+        return self._user_full_info.get(user_id)
+
+    def basic_group_full_info(
+        self, basic_group_id: int
+    ) -> raw.BasicGroupFullInfo | None:
+        return self._basic_group_full_info.get(basic_group_id)
+
+    def supergroup_full_info(self, supergroup_id: int) -> raw.SupergroupFullInfo | None:
+        return self._supergroup_full_info.get(supergroup_id)
+
+    def apply(self, update: Update) -> bool:
+        # False if the update doesn't change cached objects
+        apply = self._appliers.get(type(update))
+        if apply is None:
+            return False
+        apply(self, update)
+        return True
+
+    # Reading id of a lazily decoded object loads it, so fields set later are kept
+
+    def _apply_user(self, update: raw.UpdateUser):
+        user = update.user
+        if user is None:
+            return
+        self._users[user.id] = user
+
+    def _apply_user_status(self, update: raw.UpdateUserStatus):
+        if user := self._users.get(update.user_id):
+            user.status = update.status
+
+    def _apply_basic_group(self, update: raw.UpdateBasicGroup):
+        basic_group = update.basic_group
+        if basic_group is None:
+            return
+        self._basic_groups[basic_group.id] = basic_group
+
+    def _apply_supergroup(self, update: raw.UpdateSupergroup):
+        supergroup = update.supergroup
+        if supergroup is None:
+            return
+        self._supergroups[supergroup.id] = supergroup
+
+    def _apply_secret_chat(self, update: raw.UpdateSecretChat):
+        secret_chat = update.secret_chat
+        if secret_chat is None:
+            return
+        self._secret_chats[secret_chat.id] = secret_chat
+
+    def _apply_user_full_info(self, update: raw.UpdateUserFullInfo):
+        if update.user_full_info is None:
+            return
+        self._user_full_info[update.user_id] = update.user_full_info
+
+    def _apply_basic_group_full_info(self, update: raw.UpdateBasicGroupFullInfo):
+        if update.basic_group_full_info is None:
+            return
+        self._basic_group_full_info[update.basic_group_id] = (
+            update.basic_group_full_info
+        )
+
+    def _apply_supergroup_full_info(self, update: raw.UpdateSupergroupFullInfo):
+        if update.supergroup_full_info is None:
+            return
+        self._supergroup_full_info[update.supergroup_id] = update.supergroup_full_info
+
+    def _apply_new_chat(self, update: raw.UpdateNewChat):
+        chat = update.chat
+        if chat is None:
+            return
+        self._chats[chat.id] = chat
+
+    def _apply_chat_fields(self, update: Update):
+        chat = self._chats.get(update.chat_id)  # type: ignore
+        if chat is None:
+            return
+        for name in _get_chat_fields(type(update)):
+            setattr(chat, name, getattr(update, name))
+
+    def _apply_chat_position(self, update: raw.UpdateChatPosition):
+        chat = self._chats.get(update.chat_id)
+        position = update.position
+        if chat is None or position is None or chat.positions is None:
+            return
+        positions = [p for p in chat.positions if p.list_ != position.list_]
+        # Zero order means that the chat is removed from the list
+        if position.order:
+            positions.append(position)
+        chat.positions = positions
+
+    def _apply_chat_added_to_list(self, update: raw.UpdateChatAddedToList):
+        chat = self._chats.get(update.chat_id)
+        if chat is None or update.chat_list is None or chat.chat_lists is None:
+            return
+        if update.chat_list not in chat.chat_lists:
+            chat.chat_lists = [*chat.chat_lists, update.chat_list]
+
+    def _apply_chat_removed_from_list(self, update: raw.UpdateChatRemovedFromList):
+        chat = self._chats.get(update.chat_id)
+        if chat is None or chat.chat_lists is None:
+            return
+        chat.chat_lists = [c for c in chat.chat_lists if c != update.chat_list]
+
+
+@raw_table
+def _get_appliers() -> dict[Type[Update], Callable[[EntityCache, Any], None]]:
+    appliers: dict[Type[Update], Callable[[EntityCache, Any], None]] = {
+        raw.UpdateUser: EntityCache._apply_user,
+        raw.UpdateUserStatus: EntityCache._apply_user_status,
+        raw.UpdateBasicGroup: EntityCache._apply_basic_group,
+        raw.UpdateSupergroup: EntityCache._apply_supergroup,
+        raw.UpdateSecretChat: EntityCache._apply_secret_chat,
+        raw.UpdateUserFullInfo: EntityCache._apply_user_full_info,
+        raw.UpdateBasicGroupFullInfo: EntityCache._apply_basic_group_full_info,
+        raw.UpdateSupergroupFullInfo: EntityCache._apply_supergroup_full_info,
+        raw.UpdateNewChat: EntityCache._apply_new_chat,
+        raw.UpdateChatPosition: EntityCache._apply_chat_position,
+        raw.UpdateChatAddedToList: EntityCache._apply_chat_added_to_list,
+        raw.UpdateChatRemovedFromList: EntityCache._apply_chat_removed_from_list,
+    }
+    # Updates which set fields of a chat with the same names
+    chat_field_updates: tuple[Type[Update], ...] = (
+        raw.UpdateChatTitle,
+        raw.UpdateChatPhoto,
+        raw.UpdateChatAccentColors,
+        raw.UpdateChatPermissions,
+        raw.UpdateChatLastMessage,
+        raw.UpdateChatReadInbox,
+        raw.UpdateChatReadOutbox,
+        raw.UpdateChatActionBar,
+        raw.UpdateChatBusinessBotManageBar,
+        raw.UpdateChatAvailableReactions,
+        raw.UpdateChatDraftMessage,
+        raw.UpdateChatEmojiStatus,
+        raw.UpdateChatMessageSender,
+        raw.UpdateChatMessageAutoDeleteTime,
+        raw.UpdateChatNotificationSettings,
+        raw.UpdateChatPendingJoinRequests,
+        raw.UpdateChatReplyMarkup,
+        raw.UpdateChatBackground,
+        raw.UpdateChatTheme,
+        raw.UpdateChatUnreadMentionCount,
+        raw.UpdateChatUnreadReactionCount,
+        raw.UpdateChatVideoChat,
+        raw.UpdateChatDefaultDisableNotification,
+        raw.UpdateChatHasProtectedContent,
+        raw.UpdateChatIsTranslatable,
+        raw.UpdateChatIsMarkedAsUnread,
+        raw.UpdateChatViewAsTopics,
+        raw.UpdateChatBlockList,
+        raw.UpdateChatHasScheduledMessages,
+    )
+    for update_type in chat_field_updates:
+        appliers[update_type] = EntityCache._apply_chat_fields
+    return appliers
+
+
+@functools.cache
+def get_cached_update_types() -> tuple[Type[Update], ...]:
+    # Updates which are applied to the entity cache
+    return tuple(_get_appliers())
+
+
+@dataclasses.dataclass(frozen=True)
+class CachePolicy:
+    # Responses live for ttl seconds, least recently used ones are evicted when
+    # there are more than max_entries of them or their size in JSON exceeds max_bytes
+    ttl: float | None = None
+    max_entries: int | None = None
+    max_bytes: int | None = None
+
+
+@raw_table
+def get_response_cache_policies() -> Mapping[Type[Function], CachePolicy]:
+    # Semi-static data worth caching, used when the response cache is enabled
+    return {
+        raw.GetChatMember: CachePolicy(ttl=60, max_entries=10000),
+        raw.GetUserFullInfo: CachePolicy(ttl=300, max_entries=1000),
+        raw.GetBasicGroupFullInfo: CachePolicy(ttl=300, max_entries=1000),
+        raw.GetSupergroupFullInfo: CachePolicy(ttl=300, max_entries=1000),
+        raw.GetStickerSet: CachePolicy(ttl=3600, max_bytes=16 * 1024 * 1024),
+        raw.GetOption: CachePolicy(ttl=3600),
+    }
+
+
+@dataclasses.dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    def add(self, other: "CacheStats"):
+        self.hits += other.hits
+        self.misses += other.misses
+        self.evictions += other.evictions
+        self.expirations += other.expirations
+        self.invalidations += other.invalidations
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, ObjectBase):
+        return (type(value), *[_freeze(v) for v in _get_fields(type(value))(value)])
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@functools.cache
+def _get_fields(object_type: Type[ObjectBase]) -> Callable[[Any], tuple]:
+    names = [f.name for f in dataclasses.fields(object_type) if f.init]
+    return lambda obj: tuple(getattr(obj, name) for name in names)
+
+
+def get_response_key(function: Function) -> Hashable:
+    # Equal functions have equal keys
+    return _freeze(function)
+
+
+class _ResponseStore:
+    # Cached responses of one function type, in order from least recently used
+    def __init__(self, policy: CachePolicy) -> None:
+        self.policy = policy
+        self.entries: OrderedDict[Hashable, tuple[Any, float, int]] = OrderedDict()
+        self.size = 0
+        self.stats = CacheStats()
+        # Changed by invalidation, so responses requested before it are not stored
+        self.generation = 0
+
+    def get(self, key: Hashable, now: float) -> Any | None:
+        entry = self.entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        response, expires_at, _ = entry
+        if expires_at <= now:
+            self._remove(key)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.stats.hits += 1
+        return response
+
+    def put(self, key: Hashable, response: Any, now: float):
+        policy = self.policy
+        size = 0
+        if policy.max_bytes is not None:
+            size = len(serialize_object(response))
+            if size > policy.max_bytes:
+                return
+        expires_at = now + policy.ttl if policy.ttl is not None else float("inf")
+
+        if key in self.entries:
+            self._remove(key)
+        self.entries[key] = (response, expires_at, size)
+        self.size += size
+        while self._is_full():
+            self._remove(next(iter(self.entries)))
+            self.stats.evictions += 1
+
+    def _is_full(self) -> bool:
+        policy = self.policy
+        if policy.max_entries is not None and len(self.entries) > policy.max_entries:
+            return True
+        return policy.max_bytes is not None and self.size > policy.max_bytes
+
+    def invalidate(self, key: Hashable):
+        self.generation += 1
+        if key in self.entries:
+            self._remove(key)
+            self.stats.invalidations += 1
+
+    def _remove(self, key: Hashable):
+        _, _, size = self.entries.pop(key)
+        self.size -= size
+
+
+class ResponseCache:
+    # Responses to functions with a policy, per client. Errors are not cached.
+    # All callers get the same cached object
+    def __init__(
+        self,
+        policies: Mapping[Type[Function], CachePolicy] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        # Without policies get_response_cache_policies() is used
+        if policies is None:
+            policies = get_response_cache_policies()
+        self._stores = {t: _ResponseStore(policy) for t, policy in policies.items()}
+        self._clock = clock
+        self._invalidations = _get_invalidations()
+
+    async def fetch(
+        self, function: Function[T], execute: Callable[[Function[T]], Awaitable[T]]
+    ) -> T:
+        store = self._stores.get(type(function))
+        if store is None:
+            return await execute(function)
+
+        key = get_response_key(function)
+        response = store.get(key, self._clock())
+        if response is not None:
+            return response
+
+        generation = store.generation
+        response = await execute(function)
+        if store.generation == generation:
+            store.put(key, response, self._clock())
+        return response
+
+    def invalidate(self, update: Update) -> bool:
+        # False if the update doesn't make any response outdated
+        get_function = self._invalidations.get(type(update))
+        if get_function is None:
+            return False
+        function = get_function(update)
+        if store := self._stores.get(type(function)):
+            store.invalidate(get_response_key(function))
+        return True
+
+    def clear(self):
+        for store in self._stores.values():
+            store.entries.clear()
+            store.size = 0
+            store.generation += 1
+
+    def stats(self, function_type: Type[Function] | None = None) -> CacheStats:
+        if function_type is not None:
+            return self._stores[function_type].stats
+        result = CacheStats()
+        for store in self._stores.values():
+            result.add(store.stats)
+        return result
+
+
+@raw_table
+def _get_invalidations() -> dict[Type[Update], Callable[[Any], Function]]:
+    # Functions whose responses are made outdated by an update
+    return {
+        raw.UpdateChatMember: lambda u: raw.GetChatMember(
+            u.chat_id, u.new_chat_member.member_id
+        ),
+        raw.UpdateUserFullInfo: lambda u: raw.GetUserFullInfo(u.user_id),
+        raw.UpdateBasicGroupFullInfo: lambda u: raw.GetBasicGroupFullInfo(
+            u.basic_group_id
+        ),
+        raw.UpdateSupergroupFullInfo: lambda u: raw.GetSupergroupFullInfo(
+            u.supergroup_id
+        ),
+        raw.UpdateStickerSet: lambda u: raw.GetStickerSet(u.sticker_set.id),
+        raw.UpdateOption: lambda u: raw.GetOption(u.name),
+    }
+
+
+@functools.cache
+def get_invalidating_update_types() -> tuple[Type[Update], ...]:
+    # Updates which invalidate cached responses
+    return tuple(_get_invalidations())
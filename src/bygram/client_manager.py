@@ -1,9 +1,31 @@
+from __future__ import annotations
+
 import asyncio
+import functools
 import logging
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Iterable,
+    Mapping,
+    Type,
+)
 
+from bygram.cache import CachePolicy, EntityCache, ResponseCache
 from bygram.core.serializer import SerializedWrapper
 from bygram.core.types import T
+from bygram.downloads import DownloadManager
 from bygram.executor import Executor
+from bygram.files import DEFAULT_CHUNK_SIZE, FileReader, open_file
+from bygram.pagination import (
+    MAX_PAGE_SIZE,
+    iter_chats,
+    iter_history,
+    iter_search_chat_messages,
+    iter_search_messages,
+)
 from bygram.types.base import Function
 from bygram.types.raw import (
     AuthorizationStateClosed,
@@ -11,27 +33,155 @@ from bygram.types.raw import (
     UpdateAuthorizationState,
 )
 
+if TYPE_CHECKING:
+    from bygram.types.raw import (
+        ChatList,
+        Message,
+        SearchChatMessages,
+        SearchMessages,
+    )
+
 logger = logging.getLogger(__name__)
 
 SHUTDOWN_TIMEOUT = 60
 
 
 class Client:
-    def __init__(self, client_id: int, executor: Executor) -> None:
+    def __init__(
+        self,
+        client_id: int,
+        executor: Executor,
+        response_cache: ResponseCache | None = None,
+    ) -> None:
         self.id = client_id
         self._executor = executor
         self._shutdowned = False
-
-    async def execute(self, function: Function[T], timeout: float = 30) -> T:
+        # Filled only when the library manager is created with entity_cache
+        self.cache = EntityCache()
+        self.response_cache = response_cache
+        # May be replaced with a manager with other limits. Progress of downloads is
+        # tracked when the library manager is created with download_progress
+        self.downloads = DownloadManager(self.execute)
+
+    def _check_not_shutdowned(self):
         if self._shutdowned:
             raise RuntimeError("Current client already shutdowned")
+
+    @property
+    def in_flight(self) -> int:
+        # Requests of the client still waiting for a response
+        return self._executor.in_flight(self.id)
+
+    async def execute(self, function: Function[T], timeout: float = 30) -> T:
+        self._check_not_shutdowned()
+        if self.response_cache is not None:
+            return await self.response_cache.fetch(
+                function,
+                functools.partial(self._executor.execute, self.id, timeout=timeout),
+            )
         return await self._executor.execute(self.id, function, timeout)
 
+    async def execute_many(
+        self, functions: Iterable[Function], timeout: float = 30
+    ) -> list[Any]:
+        # Results in order of functions. A failed request gets its exception
+        # (TdlibException, TimeoutError) instead of the result
+        self._check_not_shutdowned()
+        return await self._executor.execute_many(self.id, functions, timeout)
+
+    def execute_as_completed(
+        self, functions: Iterable[Function], timeout: float = 30
+    ) -> AsyncIterator[tuple[int, Any]]:
+        # Yields (index of function, result or exception) as requests complete
+        self._check_not_shutdowned()
+        return self._executor.execute_as_completed(self.id, functions, timeout)
+
+    async def open_file(
+        self,
+        file_id: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        read_ahead: int = 2,
+        use_local_path: bool = True,
+    ) -> FileReader:
+        # Async seekable reader of a downloaded file, should be closed after use:
+        # async with await client.open_file(file_id) as reader: ...
+        return await open_file(
+            self.execute,
+            file_id,
+            chunk_size=chunk_size,
+            read_ahead=read_ahead,
+            use_local_path=use_local_path,
+        )
+
+    # Paginated functions as async iterators. The next read_ahead pages are
+    # requested while the current one is consumed
+
+    def iter_history(
+        self,
+        chat_id: int,
+        limit: int | None = None,
+        from_message_id: int = 0,
+        only_local: bool = False,
+        page_size: int = MAX_PAGE_SIZE,
+        read_ahead: int = 1,
+    ) -> AsyncGenerator[Message, None]:
+        return iter_history(
+            self.execute,
+            chat_id,
+            limit=limit,
+            from_message_id=from_message_id,
+            only_local=only_local,
+            page_size=page_size,
+            read_ahead=read_ahead,
+        )
+
+    def iter_search_chat_messages(
+        self,
+        function: SearchChatMessages,
+        limit: int | None = None,
+        read_ahead: int = 1,
+    ) -> AsyncGenerator[Message, None]:
+        return iter_search_chat_messages(
+            self.execute, function, limit=limit, read_ahead=read_ahead
+        )
+
+    def iter_search_messages(
+        self,
+        function: SearchMessages,
+        limit: int | None = None,
+        read_ahead: int = 1,
+    ) -> AsyncGenerator[Message, None]:
+        return iter_search_messages(
+            self.execute, function, limit=limit, read_ahead=read_ahead
+        )
+
+    def iter_chats(
+        self,
+        chat_list: ChatList | None = None,
+        limit: int | None = None,
+        page_size: int = MAX_PAGE_SIZE,
+        read_ahead: int = 1,
+    ) -> AsyncGenerator[int, None]:
+        return iter_chats(
+            self.execute,
+            chat_list,
+            limit=limit,
+            page_size=page_size,
+            read_ahead=read_ahead,
+        )
+
 
 class ClientManager:
-    def __init__(self, executor: Executor, wrapper: SerializedWrapper) -> None:
+    def __init__(
+        self,
+        executor: Executor,
+        wrapper: SerializedWrapper,
+        response_cache_policies: Mapping[Type[Function], CachePolicy] | None = None,
+    ) -> None:
+        # With response_cache_policies every client caches responses to these functions
         self._executor = executor
         self._wrapper = wrapper
+        self._response_cache_policies = response_cache_policies
 
         self._clients: dict[int, Client] = {}
         self._client_closed_event = None
@@ -42,7 +192,12 @@ class ClientManager:
             raise RuntimeError("Client manager is shutting down")
 
         client_id = self._wrapper.create_client()
-        self._clients[client_id] = client = Client(client_id, self._executor)
+        response_cache = None
+        if self._response_cache_policies is not None:
+            response_cache = ResponseCache(self._response_cache_policies)
+        self._clients[client_id] = client = Client(
+            client_id, self._executor, response_cache
+        )
         return client
 
     def get_client_by_id(self, client_id: int):
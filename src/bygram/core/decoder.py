@@ -0,0 +1,140 @@
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Callable
+
+from bygram.core.types import DeserializedObject
+
+logger = logging.getLogger(__name__)
+
+Decode = Callable[[bytes], DeserializedObject | None]
+Handover = Callable[[deque[DeserializedObject]], None]
+PeekClientId = Callable[[bytes], int | None]
+
+
+@dataclass
+class DecodeStats:
+    decoded: int = 0
+    total_time: float = 0
+    max_time: float = 0
+
+    @property
+    def average_time(self) -> float:
+        if not self.decoded:
+            return 0
+        return self.total_time / self.decoded
+
+    def add(self, other: "DecodeStats"):
+        self.decoded += other.decoded
+        self.total_time += other.total_time
+        self.max_time = max(self.max_time, other.max_time)
+
+
+class _DecodeWorker:
+    def __init__(
+        self,
+        name: str,
+        decode: Decode,
+        handover: Handover,
+        queue_size: int,
+        batch_size: int,
+    ) -> None:
+        self._decode = decode
+        self._handover = handover
+        self._batch_size = batch_size
+        self.queue: queue.Queue[bytes | None] = queue.Queue(queue_size)
+        self.stats = DecodeStats()
+        self._thread = threading.Thread(target=self._work_loop, name=name, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def _next_raw_batch(self) -> list[bytes | None]:
+        batch = [self.queue.get()]
+        while batch[-1] is not None and len(batch) < self._batch_size:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _decode_timed(self, raw: bytes) -> DeserializedObject | None:
+        start = time.perf_counter()
+        obj = self._decode(raw)
+        elapsed = time.perf_counter() - start
+
+        stats = self.stats
+        stats.decoded += 1
+        stats.total_time += elapsed
+        if elapsed > stats.max_time:
+            stats.max_time = elapsed
+        return obj
+
+    def _work_loop(self):
+        running = True
+        while running:
+            events = deque()
+            for raw in self._next_raw_batch():
+                if raw is None:
+                    running = False
+                    break
+                try:
+                    if obj := self._decode_timed(raw):
+                        events.append(obj)
+                except Exception:
+                    logger.exception("Error while decoding update")
+
+            if events:
+                try:
+                    self._handover(events)
+                except Exception:
+                    logger.exception("Error while processing update")
+
+
+class DecodePool:
+    # Objects of one client are always decoded by the same worker, so their order is kept.
+    # Workers are threads, they decode in parallel only on free-threaded builds
+    def __init__(
+        self,
+        decode: Decode,
+        handover: Handover,
+        peek_client_id: PeekClientId,
+        workers: int,
+        queue_size: int = 20,
+        batch_size: int = 1,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be positive")
+
+        self._peek_client_id = peek_client_id
+        self._workers = [
+            _DecodeWorker(f"bygram-decoder-{i}", decode, handover, queue_size, batch_size)
+            for i in range(workers)
+        ]
+        self._started = False
+
+    def start(self):
+        if self._started:
+            return
+        self._started = True
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, raw: bytes):
+        client_id = self._peek_client_id(raw) or 0
+        self._workers[client_id % len(self._workers)].queue.put(raw)
+
+    def stats(self) -> DecodeStats:
+        result = DecodeStats()
+        for worker in self._workers:
+            result.add(worker.stats)
+        return result
+
+    def shutdown(self):
+        for worker in self._workers:
+            with suppress(queue.Full):
+                worker.queue.put_nowait(None)
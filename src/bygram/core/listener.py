@@ -1,53 +1,181 @@
 import asyncio
 import logging
 import threading
+from collections import deque
 from concurrent.futures import CancelledError
 from contextlib import suppress
-from typing import Callable
+from typing import Any, Callable
 
+from bygram.core.decoder import Decode, DecodePool, DecodeStats, PeekClientId
 from bygram.core.types import DeserializedObject
+from bygram.types.base import ObjectBase
 
 logger = logging.getLogger(__name__)
 
+# How often a receiver thread blocked on a full queue checks for shutdown
+_CAPACITY_POLL_INTERVAL = 0.5
+
 
 class EventListener:
     def __init__(
         self,
         loop: asyncio.AbstractEventLoop,
-        receive: Callable[[float], DeserializedObject | None],
+        receive: Callable[[float], Any],
         timeout: float = 60,
         queue_size: int = 20,
+        batch_size: int = 1,
+        decode: Decode | None = None,
+        decode_workers: int = 0,
+        peek_client_id: PeekClientId | None = None,
+        on_response: Callable[[ObjectBase, Any], None] | None = None,
     ) -> None:
+        # With batch_size > 1 the receiver thread drains everything that is already
+        # received (up to batch_size events) and hands it over with a single loop
+        # wakeup. queue_size then limits the number of pending batches.
+        # If decode is passed, receive returns raw objects which are decoded in the
+        # receiver thread or, with decode_workers > 0, in a pool of decoding threads.
+        # Responses (objects with @extra) are passed to on_response right in the event
+        # loop, bypassing the queue of updates.
+        # A raw object may be a view valid only until the next receive call, so it
+        # is decoded before receiving the next one or copied for the decoding pool
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        if decode_workers and not (decode and peek_client_id):
+            raise ValueError("decode_workers requires decode and peek_client_id")
+
         self._loop = loop
         self._receive = receive
+        self._decode = decode
+        self._on_response = on_response
         self._timeout = timeout
-        self._queue: asyncio.Queue = asyncio.Queue(queue_size)
+        self._batch_size = batch_size
+        self._queue: asyncio.Queue = asyncio.Queue(queue_size if batch_size == 1 else 0)
+        self._batch: deque[DeserializedObject] = deque()
+        self._batches_capacity = threading.Semaphore(queue_size)
+        self._decode_pool: DecodePool | None = None
+        if decode and peek_client_id and decode_workers:
+            self._decode_pool = DecodePool(
+                decode,
+                self._handover,
+                peek_client_id,
+                decode_workers,
+                queue_size=queue_size,
+                batch_size=batch_size,
+            )
         self._thread = threading.Thread(target=self._listen_loop, daemon=True)
         self._started = False
         self._shutdown = False
 
+    def _decode_event(self, raw: Any) -> DeserializedObject | None:
+        if self._decode is None:
+            return raw
+        return self._decode(raw)
+
     def _receive_update(self) -> DeserializedObject | None:
-        return self._receive(self._timeout)
+        raw = self._receive(self._timeout)
+        if raw:
+            return self._decode_event(raw)
+        return None
+
+    def _receive_batch(self) -> deque[DeserializedObject]:
+        batch = deque()
+        received = 0
+        raw = self._receive(self._timeout)
+        while raw:
+            if obj := self._decode_event(raw):
+                batch.append(obj)
+            received += 1
+            if received >= self._batch_size:
+                break
+            raw = self._receive(0)
+        return batch
 
     def _put_object_to_async_queue(self, event: DeserializedObject):
         future = asyncio.run_coroutine_threadsafe(self._queue.put(event), self._loop)
         with suppress(CancelledError):
             future.result()
 
+    def _put_batch_to_async_queue(self, batch: deque[DeserializedObject]):
+        while not self._batches_capacity.acquire(timeout=_CAPACITY_POLL_INTERVAL):
+            if self._shutdown:
+                return
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, batch)
+
+    def _resolve_responses(self, responses: list[DeserializedObject]):
+        assert self._on_response
+        for response in responses:
+            try:
+                self._on_response(response.obj, response.extra)
+            except Exception:
+                logger.exception("Error while processing response %s", response)
+
+    def _take_responses(
+        self, events: deque[DeserializedObject]
+    ) -> deque[DeserializedObject]:
+        responses = [e for e in events if e.extra is not None]
+        if not responses:
+            return events
+
+        self._loop.call_soon_threadsafe(self._resolve_responses, responses)
+        return deque(e for e in events if e.extra is None)
+
+    def _handover(self, events: deque[DeserializedObject]):
+        if self._on_response:
+            events = self._take_responses(events)
+            if not events:
+                return
+
+        if self._batch_size == 1:
+            for event in events:
+                self._put_object_to_async_queue(event)
+        else:
+            self._put_batch_to_async_queue(events)
+
+    def _listen_cycle(self):
+        if self._decode_pool:
+            raw = self._receive(self._timeout)
+            if raw:
+                self._decode_pool.submit(bytes(raw))
+        elif self._batch_size == 1:
+            obj = self._receive_update()
+            if obj:
+                if self._on_response and obj.extra is not None:
+                    self._loop.call_soon_threadsafe(self._resolve_responses, [obj])
+                else:
+                    self._put_object_to_async_queue(obj)
+        else:
+            batch = self._receive_batch()
+            if batch:
+                self._handover(batch)
+
     def _listen_loop(self):
         while not self._shutdown:
             try:
-                obj = self._receive_update()
-                if obj:
-                    self._put_object_to_async_queue(obj)
+                self._listen_cycle()
             except Exception:
                 logger.exception("Error while processing update")
 
     async def wait_for_event(self) -> DeserializedObject:
         if not self._started:
+            if self._decode_pool:
+                self._decode_pool.start()
             self._thread.start()
             self._started = True
-        return await self._queue.get()
+
+        if self._batch_size == 1:
+            return await self._queue.get()
+
+        if not self._batch:
+            self._batch = await self._queue.get()
+            self._batches_capacity.release()
+        return self._batch.popleft()
+
+    def decode_stats(self) -> DecodeStats | None:
+        if self._decode_pool is None:
+            return None
+        return self._decode_pool.stats()
 
     def shutdown(self):
         self._shutdown = True
+        if self._decode_pool:
+            self._decode_pool.shutdown()
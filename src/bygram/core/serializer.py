@@ -1,17 +1,40 @@
+import abc
 import base64
+import functools
 import importlib
 import json
-from dataclasses import asdict
-from typing import Any, cast
+import re
+from typing import Any, Callable, cast
 
 from bygram.core.types import DeserializedObject
 from bygram.core.wrapper import TdLibWrapper
 from bygram.types.base import Function, ObjectBase, T
 
-__all__ = ["serialize_object", "deserialize_object"]
+__all__ = [
+    "serialize_object",
+    "deserialize_object",
+    "deserialize_object_lazy",
+    "peek_client_id",
+    "peek_type",
+    "Codec",
+    "StdlibCodec",
+    "OrjsonCodec",
+    "available_codecs",
+    "default_codec",
+]
 
 _TYPES_IMPORT_PATH = "bygram.types.raw"
 
+_CLIENT_ID_RE = re.compile(rb'"@client_id":\s*(\d+)')
+# TDLib puts @client_id at the end of the object
+_CLIENT_ID_TAIL_SIZE = 64
+# and @type at the beginning
+_TYPE_RE = re.compile(rb'\{\s*"@type":\s*"(\w+)"')
+_EXTRA_KEY_RE = re.compile(rb'"@extra":')
+
+# Raw objects are bytes, or memoryview when the wrapper receives without copying
+Buffer = bytes | memoryview
+
 
 class CustomJSONEncoder(json.JSONEncoder):
     def default(self, o: Any) -> Any:
@@ -26,12 +49,10 @@ class CustomJSONEncoder(json.JSONEncoder):
 
 
 def serialize_object(obj: ObjectBase, extra: Any | None = None) -> bytes:
-    data = asdict(obj)
+    data = obj._to_json_dict()
     if extra:
         data["@extra"] = extra
-    json_str = json.dumps(data, cls=CustomJSONEncoder)
-    json_str = json_str.replace('"_type"', '"@type"')
-    return json_str.encode()
+    return json.dumps(data, cls=CustomJSONEncoder).encode()
 
 
 def _convert_type_to_pythonic(t: str):
@@ -50,9 +71,22 @@ def _find_class_by_type(t: str):
     return current_cls
 
 
+class _TypesRegistry(dict[str, type[ObjectBase]]):
+    """``@type`` to class mapping. Every type is resolved only once"""
+
+    def __missing__(self, type_: str) -> type[ObjectBase]:
+        cls = self[type_] = _find_class_by_type(type_)
+        return cls
+
+
+_types = _TypesRegistry()
+_new_object = object.__new__
+
+
 def deserialize_object(obj: bytes) -> DeserializedObject:
     client_id = None
     extra = None
+    types = _types
 
     def object_hook(d: dict):
         nonlocal client_id
@@ -65,7 +99,7 @@ def deserialize_object(obj: bytes) -> DeserializedObject:
         if "list" in d:
             d["list_"] = d.pop("list")
         if type_:
-            return _find_class_by_type(type_)(**d)
+            return types[type_](**d)
 
         raise ValueError(f"Invalid object: {d}")
 
@@ -73,26 +107,248 @@ def deserialize_object(obj: bytes) -> DeserializedObject:
     return DeserializedObject(deserialized, client_id, extra)
 
 
+class _LazyFields:
+    __slots__ = ("data",)
+
+    def __init__(self, data: dict) -> None:
+        self.data = data
+
+    def load(self, obj: ObjectBase):
+        kwargs = {}
+        for key, value in self.data.items():
+            value_type = type(value)
+            if value_type is dict:
+                value = _lazy_object(value)
+            elif value_type is list:
+                value = _lazy_list(value)
+            kwargs[key] = value
+        del kwargs["@type"]
+        if "list" in kwargs:
+            kwargs["list_"] = kwargs.pop("list")
+        type(obj).__init__(obj, **kwargs)
+
+
+def _lazy_object(data: dict) -> ObjectBase:
+    type_ = data.get("@type")
+    if not type_:
+        raise ValueError(f"Invalid object: {data}")
+    obj = _new_object(_types[type_])
+    obj._lazy = _LazyFields(data)
+    return obj
+
+
+def _lazy_list(values: list) -> list:
+    result = []
+    for value in values:
+        value_type = type(value)
+        if value_type is dict:
+            value = _lazy_object(value)
+        elif value_type is list:
+            value = _lazy_list(value)
+        result.append(value)
+    return result
+
+
+def _json_loads(obj: Buffer) -> Any:
+    # json.loads doesn't accept memoryview
+    return json.loads(bytes(obj))
+
+
+def deserialize_object_lazy(
+    obj: Buffer, loads: Callable[[Buffer], Any] = _json_loads
+) -> DeserializedObject:
+    # Objects are created without fields. Fields of an object are decoded on the
+    # first read of any of them, so unused nested objects stay plain JSON.
+    # Requires types generated with slots. A field assigned before the object is
+    # loaded is overwritten by loading
+    data = loads(obj)
+    client_id = data.pop("@client_id", None)
+    extra = data.pop("@extra", None)
+    return DeserializedObject(_lazy_object(data), client_id, extra)
+
+
+def peek_client_id(obj: Buffer) -> int | None:
+    match = _CLIENT_ID_RE.search(obj, max(len(obj) - _CLIENT_ID_TAIL_SIZE, 0))
+    if match is None:
+        match = _CLIENT_ID_RE.search(obj)
+    if match is None:
+        return None
+    return int(match.group(1))
+
+
+def peek_type(obj: Buffer) -> str | None:
+    match = _TYPE_RE.match(obj)
+    if match is None:
+        return None
+    return match.group(1).decode()
+
+
+def _build_object(d: dict) -> ObjectBase:
+    d.pop("@client_id", None)
+    d.pop("@extra", None)
+    type_ = d.pop("@type", None)
+    for key, value in d.items():
+        value_type = type(value)
+        if value_type is dict:
+            d[key] = _build_object(value)
+        elif value_type is list:
+            d[key] = _build_list(value)
+    if "list" in d:
+        d["list_"] = d.pop("list")
+    if type_:
+        return _types[type_](**d)
+
+    raise ValueError(f"Invalid object: {d}")
+
+
+def _build_list(values: list) -> list:
+    result = []
+    for value in values:
+        value_type = type(value)
+        if value_type is dict:
+            value = _build_object(value)
+        elif value_type is list:
+            value = _build_list(value)
+        result.append(value)
+    return result
+
+
+class Codec(abc.ABC):
+    name: str
+
+    @abc.abstractmethod
+    def loads(self, obj: Buffer) -> Any:
+        pass
+
+    @abc.abstractmethod
+    def deserialize(self, obj: Buffer) -> DeserializedObject:
+        pass
+
+    def serialize(self, obj: ObjectBase, extra: Any | None = None) -> bytes:
+        # Requests are small, all codecs produce the same bytes with stdlib json
+        return serialize_object(obj, extra)
+
+
+class StdlibCodec(Codec):
+    name = "json"
+
+    def loads(self, obj: Buffer) -> Any:
+        return json.loads(bytes(obj))
+
+    def deserialize(self, obj: Buffer) -> DeserializedObject:
+        return deserialize_object(bytes(obj))
+
+
+class OrjsonCodec(Codec):
+    # Parses with orjson and builds types from the parsed tree.
+    # Input rejected by orjson is parsed by stdlib json, so results are the same
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, obj: Buffer) -> Any:
+        # orjson reads memoryview without copying
+        try:
+            return self._orjson.loads(obj)
+        except self._orjson.JSONDecodeError:
+            return json.loads(bytes(obj))
+
+    def deserialize(self, obj: Buffer) -> DeserializedObject:
+        data = self.loads(obj)
+        if type(data) is not dict:
+            return DeserializedObject(data)
+        client_id = data.pop("@client_id", None)
+        extra = data.pop("@extra", None)
+        return DeserializedObject(_build_object(data), client_id, extra)
+
+
+_CODECS: list[type[Codec]] = [OrjsonCodec, StdlibCodec]
+
+
+def available_codecs() -> list[Codec]:
+    # Fastest first
+    codecs = []
+    for codec_class in _CODECS:
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            continue
+    return codecs
+
+
+def default_codec() -> Codec:
+    # stdlib json, even if orjson is installed. Installing a package shouldn't
+    # change decoding of every client, pass codec=OrjsonCodec() to use it
+    return StdlibCodec()
+
+
 class SerializedWrapper:
-    def __init__(self, wrapper: TdLibWrapper) -> None:
+    def __init__(
+        self,
+        wrapper: TdLibWrapper,
+        lazy: bool = False,
+        codec: Codec | None = None,
+    ) -> None:
         self._wrapper = wrapper
+        self._codec = codec or default_codec()
+        if lazy:
+            self._deserialize = functools.partial(
+                deserialize_object_lazy, loads=self._codec.loads
+            )
+        else:
+            self._deserialize = self._codec.deserialize
+        self._handled_update_types: Callable[[], frozenset[str] | None] | None = None
+
+    def set_handled_update_types(
+        self, get_types: Callable[[], frozenset[str] | None] | None
+    ):
+        # Updates with other @type are dropped without decoding.
+        # get_types returns None when all updates are needed
+        self._handled_update_types = get_types
+
+    def _is_skipped(self, raw: Buffer) -> bool:
+        if self._handled_update_types is None:
+            return False
+        types = self._handled_update_types()
+        if types is None:
+            return False
+
+        type_ = peek_type(raw)
+        if type_ is None or not type_.startswith("update") or type_ in types:
+            return False
+        # Responses are always decoded
+        return _EXTRA_KEY_RE.search(raw) is None
 
     def create_client(self) -> int:
         return self._wrapper.create_client()
 
     def send(self, client_id: int, func: Function, extra: Any | None = None):
-        serialized = serialize_object(func, extra)
+        serialized = self._codec.serialize(func, extra)
         self._wrapper.send(client_id, serialized)
 
+    def receive_raw(self, timeout: float) -> Buffer | None:
+        return self._wrapper.receive(timeout)
+
+    def decode(self, raw: Buffer) -> DeserializedObject | None:
+        if self._is_skipped(raw):
+            return None
+        return self._deserialize(raw)
+
     def receive(self, timeout: float) -> DeserializedObject | None:
-        raw = self._wrapper.receive(timeout)
+        raw = self.receive_raw(timeout)
         if raw:
-            return deserialize_object(raw)
+            return self.decode(raw)
         else:
             return None
 
+    def close(self):
+        self._wrapper.close()
+
     def execute(self, func: Function[T]) -> T:
-        serialized = serialize_object(func)
+        serialized = self._codec.serialize(func)
         response = self._wrapper.execute(serialized)
-        deserialized = deserialize_object(response)
+        deserialized = self._codec.deserialize(response)
         return cast(T, deserialized.obj)
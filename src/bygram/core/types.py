@@ -1,9 +1,11 @@
+import functools
 from dataclasses import dataclass
-from typing import Any, Generic, TypeVar
+from typing import Any, Callable, Generic, TypeVar
 
 from bygram.types.base import ObjectBase
 
 T = TypeVar("T", bound=ObjectBase)
+R = TypeVar("R")
 
 
 @dataclass
@@ -11,3 +13,9 @@ class DeserializedObject(Generic[T]):
     obj: T
     client_id: int | None = None
     extra: Any | None = None
+
+
+def raw_table(build: Callable[[], R]) -> Callable[[], R]:
+    # Getter of a table which refers to raw types. The table is built on first
+    # use, so importing the module which defines it doesn't import the raw types
+    return functools.cache(build)
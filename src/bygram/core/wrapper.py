@@ -1,10 +1,38 @@
 import ctypes
+import functools
 import platform
+from typing import Callable
+
+_PyBUF_READ = 0x100
+
+_memoryview_from_memory = ctypes.pythonapi.PyMemoryView_FromMemory
+_memoryview_from_memory.argtypes = [ctypes.c_void_p, ctypes.c_ssize_t, ctypes.c_int]
+_memoryview_from_memory.restype = ctypes.py_object
+
+
+@functools.cache
+def _get_strlen() -> Callable[[int], int]:
+    strlen = ctypes.CDLL(None).strlen
+    strlen.argtypes = [ctypes.c_void_p]
+    strlen.restype = ctypes.c_size_t
+    return strlen
+
+
+def _memoryview_at(address: int | None) -> memoryview | None:
+    # Read-only view of a null-terminated string, without copying it
+    if not address:
+        return None
+    return _memoryview_from_memory(address, _get_strlen()(address), _PyBUF_READ)
 
 
 class TdLibWrapper:
-    def __init__(self, cdll: ctypes.CDLL) -> None:
+    def __init__(self, cdll: ctypes.CDLL, zero_copy: bool = False) -> None:
+        # With zero_copy receive and execute return memoryview over the buffer of
+        # TDLib. It is valid only until the next call of the same function, so the
+        # result must be decoded (or copied) before that
         self.cdll = cdll
+        self.zero_copy = zero_copy
+        result_type = ctypes.c_void_p if zero_copy else ctypes.c_char_p
 
         self._create_client = self.cdll.td_create_client_id
         self._create_client.argtypes = []
@@ -16,11 +44,11 @@ class TdLibWrapper:
 
         self._json_client_receive = self.cdll.td_receive
         self._json_client_receive.argtypes = [ctypes.c_double]
-        self._json_client_receive.restype = ctypes.c_char_p
+        self._json_client_receive.restype = result_type
 
         self._json_client_execute = self.cdll.td_execute
         self._json_client_execute.argtypes = [ctypes.c_char_p]
-        self._json_client_execute.restype = ctypes.c_char_p
+        self._json_client_execute.restype = result_type
 
     def create_client(self) -> int:
         return self._create_client()
@@ -28,12 +56,22 @@ class TdLibWrapper:
     def send(self, client_id: int, request: bytes) -> None:
         self._json_client_send(client_id, request)
 
-    def receive(self, timeout: float) -> bytes | None:
+    def receive(self, timeout: float) -> bytes | memoryview | None:
+        if self.zero_copy:
+            return _memoryview_at(self._json_client_receive(timeout))
         return self._json_client_receive(timeout)
 
-    def execute(self, request: bytes) -> bytes:
+    def execute(self, request: bytes) -> bytes | memoryview:
+        if self.zero_copy:
+            result = _memoryview_at(self._json_client_execute(request))
+            assert result is not None
+            return result
         return self._json_client_execute(request)
 
+    def close(self) -> None:
+        # TDLib instance lives as long as the process
+        pass
+
 
 def _to_full_path(path: str) -> str:
     return path
@@ -43,11 +81,11 @@ def _load_linux(path: str) -> ctypes.CDLL:
     return ctypes.CDLL(path)
 
 
-def load_library(path: str) -> TdLibWrapper:
+def load_library(path: str, zero_copy: bool = False) -> TdLibWrapper:
     path = _to_full_path(path)
     if platform.system() == "Linux":
         cdll = _load_linux(path)
     else:
         raise RuntimeError("Sorry but your OS is not supported")
 
-    return TdLibWrapper(cdll)
+    return TdLibWrapper(cdll, zero_copy=zero_copy)
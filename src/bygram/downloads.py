@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import logging
+import math
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from bygram.types import raw
+from bygram.types.base import Update
+
+logger = logging.getLogger(__name__)
+
+# Allowed priorities of TDLib downloads
+MIN_PRIORITY = 1
+MAX_PRIORITY = 32
+
+Execute = Callable[..., Awaitable[Any]]
+
+
+class _Download:
+    __slots__ = ("file_id", "priority", "future", "refs", "size", "task", "deadline")
+
+    def __init__(self, file_id: int, priority: int, future: asyncio.Future) -> None:
+        self.file_id = file_id
+        self.priority = priority
+        self.future = future
+        # Number of callers which didn't release the file yet
+        self.refs = 0
+        self.size = 0
+        self.task: asyncio.Task | None = None
+        self.deadline: asyncio.Timeout | None = None
+
+
+class DownloadManager:
+    # Downloads files of a client in at most max_concurrent slots, files with higher
+    # priority first. Concurrent requests of the same file share the download.
+    # A file counts toward max_pending_bytes from the start of its download until
+    # all callers release it, and no new downloads start while the limit is
+    # reached, so a slow consumer (e.g. copying files to slow disk) holds TDLib back.
+    # A download fails with TimeoutError after timeout seconds without progress.
+    # The timer restarts on every UpdateFile passed to apply(), so without
+    # download_progress it limits the whole download
+    def __init__(
+        self,
+        execute: Execute,
+        max_concurrent: int = 4,
+        max_pending_bytes: int | None = None,
+        timeout: float = 3600,
+    ) -> None:
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be positive")
+
+        self._execute = execute
+        self._max_concurrent = max_concurrent
+        self._max_pending_bytes = max_pending_bytes
+        self._timeout = timeout
+        self._downloads: dict[int, _Download] = {}
+        # (-priority, order, download), entries of started, released or raised
+        # downloads stay in the queue and are skipped
+        self._queue: list[tuple[int, int, _Download]] = []
+        self._order = itertools.count()
+        self._active = 0
+        self._pending_bytes = 0
+        self._bytes_released = asyncio.Event()
+        self._progress: dict[int, raw.File] = {}
+        # Strong references to running cancellations
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def pending_bytes(self) -> int:
+        return self._pending_bytes
+
+    def download(self, file_id: int, priority: int = 1) -> asyncio.Future[raw.File]:
+        # Future of the downloaded file. Call release() when the file is processed
+        if not MIN_PRIORITY <= priority <= MAX_PRIORITY:
+            raise ValueError(f"priority must be from {MIN_PRIORITY} to {MAX_PRIORITY}")
+
+        download = self._downloads.get(file_id)
+        if download is None:
+            future = asyncio.get_running_loop().create_future()
+            download = self._downloads[file_id] = _Download(file_id, priority, future)
+            self._push(download)
+        elif download.task is None and priority > download.priority:
+            download.priority = priority
+            self._push(download)
+        download.refs += 1
+
+        self._start_downloads()
+        # Cancelling the future of one caller doesn't affect others
+        return asyncio.shield(download.future)
+
+    @contextlib.asynccontextmanager
+    async def downloaded(
+        self, file_id: int, priority: int = 1
+    ) -> AsyncIterator[raw.File]:
+        future = self.download(file_id, priority)
+        try:
+            yield await future
+        finally:
+            self.release(file_id)
+
+    def release(self, file_id: int):
+        # The file isn't needed by the caller anymore. A download which isn't needed
+        # by anybody is cancelled
+        download = self._downloads.get(file_id)
+        if download is None:
+            return
+        download.refs -= 1
+        if download.refs:
+            return
+
+        del self._downloads[file_id]
+        self._progress.pop(file_id, None)
+        if download.future.done():
+            self._release_bytes(download.size)
+        elif download.task is not None:
+            task = asyncio.create_task(self._cancel(file_id))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        else:
+            download.future.cancel()
+
+    def progress(self, file_id: int) -> raw.File | None:
+        # The last state of a file being downloaded, from UpdateFile
+        return self._progress.get(file_id)
+
+    def apply(self, update: Update) -> bool:
+        if not isinstance(update, raw.UpdateFile):
+            return False
+        file = update.file
+        assert file
+        download = self._downloads.get(file.id)
+        if download is None or download.task is None or download.future.done():
+            return False
+        self._progress[file.id] = file
+        if download.deadline is not None:
+            download.deadline.reschedule(
+                asyncio.get_running_loop().time() + self._timeout
+            )
+        return True
+
+    def _push(self, download: _Download):
+        heapq.heappush(self._queue, (-download.priority, next(self._order), download))
+
+    def _is_over_limit(self) -> bool:
+        return (
+            self._max_pending_bytes is not None
+            and self._pending_bytes >= self._max_pending_bytes
+        )
+
+    def _fits(self, size: int) -> bool:
+        # A file larger than the limit is downloaded when nothing else is pending
+        assert self._max_pending_bytes is not None
+        return (
+            not self._pending_bytes
+            or self._pending_bytes + size <= self._max_pending_bytes
+        )
+
+    async def _reserve_bytes(self, download: _Download):
+        file: raw.File = await self._execute(raw.GetFile(download.file_id))
+        size = file.size or file.expected_size
+        while not self._fits(size):
+            self._bytes_released.clear()
+            await self._bytes_released.wait()
+        download.size = size
+        self._pending_bytes += size
+
+    def _release_bytes(self, size: int):
+        if size:
+            self._pending_bytes -= size
+            self._bytes_released.set()
+        self._start_downloads()
+
+    def _start_downloads(self):
+        while self._queue and self._active < self._max_concurrent:
+            if self._is_over_limit():
+                return
+            _, _, download = heapq.heappop(self._queue)
+            if (
+                download.task is not None
+                or self._downloads.get(download.file_id) is not download
+            ):
+                continue
+            self._active += 1
+            download.task = asyncio.create_task(self._run(download))
+
+    async def _run(self, download: _Download):
+        try:
+            if self._max_pending_bytes is not None:
+                await self._reserve_bytes(download)
+                if not download.refs:
+                    # Released while waiting for the room
+                    self._finish_failed(download, asyncio.CancelledError())
+                    return
+            async with asyncio.timeout(self._timeout) as download.deadline:
+                file = await self._execute(
+                    raw.DownloadFile(download.file_id, download.priority, 0, 0, True),
+                    timeout=math.inf,
+                )
+        except TimeoutError as e:
+            # TDLib keeps downloading the stalled file otherwise
+            await self._cancel(download.file_id)
+            self._finish_failed(download, e)
+        except Exception as e:
+            self._finish_failed(download, e)
+        else:
+            self._progress.pop(download.file_id, None)
+            if download.refs:
+                download.future.set_result(file)
+            else:
+                self._release_bytes(download.size)
+        finally:
+            download.deadline = None
+            self._active -= 1
+            self._start_downloads()
+
+    def _finish_failed(self, download: _Download, exc: BaseException):
+        self._release_bytes(download.size)
+        self._progress.pop(download.file_id, None)
+        if self._downloads.get(download.file_id) is download:
+            del self._downloads[download.file_id]
+        if download.refs:
+            download.future.set_exception(exc)
+        else:
+            # Cancelled by release()
+            download.future.cancel()
+
+    async def _cancel(self, file_id: int):
+        try:
+            await self._execute(raw.CancelDownloadFile(file_id, False))
+        except Exception:
+            logger.exception("Can't cancel download of file %s", file_id)
@@ -1,33 +1,118 @@
 import asyncio
+import dataclasses
+import functools
 import logging
-from typing import Any, Callable
+from typing import Any, AsyncIterator, Callable, Hashable, Iterable, Type
 
-from bygram.core.types import T
+from bygram.core.types import T, raw_table
 from bygram.exceptions import TdlibException
+from bygram.types import raw
 from bygram.types.base import Function, ObjectBase
 from bygram.types.raw import Error
 
 logger = logging.getLogger(__name__)
 
 
+@raw_table
+def get_coalesced_functions() -> frozenset[Type[Function]]:
+    # Read-only functions whose concurrent identical calls of a client may share
+    # one request when coalescing is enabled
+    return frozenset(
+        (
+            raw.GetMe,
+            raw.GetUser,
+            raw.GetUserFullInfo,
+            raw.GetBasicGroup,
+            raw.GetBasicGroupFullInfo,
+            raw.GetSupergroup,
+            raw.GetSupergroupFullInfo,
+            raw.GetSecretChat,
+            raw.GetChat,
+            raw.GetChatAdministrators,
+            raw.GetMessage,
+            raw.GetMessageLocally,
+            raw.GetChatPinnedMessage,
+            raw.GetFile,
+            raw.GetRemoteFile,
+            raw.GetOption,
+        )
+    )
+
+
+@functools.cache
+def _get_key_fields(function_type: Type[Function]) -> tuple[str, ...]:
+    return tuple(f.name for f in dataclasses.fields(function_type) if f.init)
+
+
+def get_coalescing_key(client_id: int, function: Function) -> Hashable | None:
+    # None if the function has unhashable fields
+    key = (
+        client_id,
+        type(function),
+        *[getattr(function, name) for name in _get_key_fields(type(function))],
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class _SharedRequest:
+    __slots__ = ("request_id", "future", "waiters")
+
+    def __init__(self, request_id: int, future: asyncio.Future) -> None:
+        self.request_id = request_id
+        self.future = future
+        self.waiters = 0
+
+
 class Executor:
     def __init__(
         self,
         send: Callable[[int, Function, Any | None], None],
         loop: asyncio.AbstractEventLoop,
+        max_in_flight_per_client: int | None = None,
+        coalesce: bool = False,
     ) -> None:
+        # With max_in_flight_per_client new requests of a client wait until one of
+        # its in-flight requests is finished. The wait counts toward the timeout.
+        # With coalesce execute of a function from get_coalesced_functions() joins the
+        # in-flight request of the same client with equal function, if there is one.
+        # All callers then get the same result object
+        if max_in_flight_per_client is not None and max_in_flight_per_client < 1:
+            raise ValueError("max_in_flight_per_client must be positive")
+
         self._send = send
         self._loop = loop
-        self._waiting_response: dict[Any, asyncio.Future] = {}
+        self._max_in_flight = max_in_flight_per_client
+        # Future and client id of each request by its id
+        self._waiting_response: dict[Any, tuple[asyncio.Future, int]] = {}
+        self._in_flight: dict[int, int] = {}
+        self._capacity: dict[int, asyncio.Semaphore] = {}
+        self._coalesce = coalesce
+        self._shared_requests: dict[Hashable, _SharedRequest] = {}
         self._request_id = 1
 
     async def process_response(self, response: ObjectBase, extra: Any):
-        waiting_lock = self._waiting_response.pop(extra, None)
-        if waiting_lock is None:
+        self.resolve_response(response, extra)
+
+    def resolve_response(self, response: ObjectBase, extra: Any):
+        waiting = self._waiting_response.pop(extra, None)
+        if waiting is None:
+            if isinstance(extra, int) and extra <= self._request_id:
+                # Late response to a request which timed out or was cancelled
+                logger.debug("Response to abandoned request %s: %s", extra, response)
+                return
             logger.warning(
                 "Can't find waiter with extra %s. Lost response %s", extra, response
             )
             return
+        waiting_lock, client_id = waiting
+        self._finish_request(client_id)
+        if waiting_lock.done():
+            # The request is already cancelled or timed out
+            return
 
         if isinstance(response, Error):
             exc = TdlibException(response.code, response.message)
@@ -39,9 +124,180 @@ class Executor:
         self._request_id += 1
         return self._request_id
 
-    async def execute(self, client_id: int, function: Function[T], timeout: float) -> T:
+    def in_flight(self, client_id: int | None = None) -> int:
+        # Number of sent requests still waiting for a response, of all clients by default
+        if client_id is None:
+            return len(self._waiting_response)
+        return self._in_flight.get(client_id, 0)
+
+    async def _acquire(self, client_id: int):
+        capacity = self._capacity.get(client_id)
+        if capacity is None:
+            assert self._max_in_flight is not None
+            capacity = self._capacity[client_id] = asyncio.Semaphore(
+                self._max_in_flight
+            )
+        await capacity.acquire()
+
+    def _finish_request(self, client_id: int):
+        in_flight = self._in_flight[client_id] - 1
+        if in_flight:
+            self._in_flight[client_id] = in_flight
+        else:
+            del self._in_flight[client_id]
+        if self._max_in_flight is not None:
+            self._capacity[client_id].release()
+
+    def _forget_request(self, request_id: int | None):
+        # Request timed out or was cancelled, its response will be ignored
+        waiting = self._waiting_response.pop(request_id, None)
+        if waiting is not None:
+            waiting_lock, client_id = waiting
+            waiting_lock.cancel()
+            self._finish_request(client_id)
+
+    def _send_request(
+        self, client_id: int, function: Function
+    ) -> tuple[int, asyncio.Future]:
         request_id = self._next_request_id()
-        wait_future = self._waiting_response[request_id] = self._loop.create_future()
-        self._send(client_id, function, request_id)
+        wait_future = self._loop.create_future()
+        self._waiting_response[request_id] = (wait_future, client_id)
+        self._in_flight[client_id] = self._in_flight.get(client_id, 0) + 1
+        try:
+            self._send(client_id, function, request_id)
+        except BaseException:
+            self._forget_request(request_id)
+            raise
+        return request_id, wait_future
+
+    async def _send_requests(
+        self, client_id: int, functions: Iterable[Function], deadline: float
+    ) -> list[tuple[int | None, asyncio.Future]]:
+        # Requests which didn't get capacity before the deadline are not sent,
+        # they have no request id and their futures stay pending. If sending fails,
+        # already sent requests are forgotten
+        requests: list[tuple[int | None, asyncio.Future]] = []
+        try:
+            for function in functions:
+                if self._max_in_flight is not None:
+                    try:
+                        async with asyncio.timeout_at(deadline):
+                            await self._acquire(client_id)
+                    except TimeoutError:
+                        requests.append((None, self._loop.create_future()))
+                        continue
+                requests.append(self._send_request(client_id, function))
+        except BaseException:
+            for request_id, _ in requests:
+                self._forget_request(request_id)
+            raise
+        return requests
+
+    async def execute(self, client_id: int, function: Function[T], timeout: float) -> T:
+        if self._coalesce and type(function) in get_coalesced_functions():
+            key = get_coalescing_key(client_id, function)
+            if key is not None:
+                return await self._execute_shared(client_id, function, key, timeout)
+
+        async with asyncio.timeout(timeout):
+            if self._max_in_flight is not None:
+                await self._acquire(client_id)
+            request_id, wait_future = self._send_request(client_id, function)
+            try:
+                return await wait_future
+            finally:
+                self._forget_request(request_id)
+
+    async def _execute_shared(
+        self, client_id: int, function: Function[T], key: Hashable, timeout: float
+    ) -> T:
+        # The request is forgotten when its last waiter leaves, so a waiter which
+        # timed out or was cancelled doesn't affect the others
         async with asyncio.timeout(timeout):
-            return await wait_future
+            shared = self._shared_requests.get(key)
+            if shared is None and self._max_in_flight is not None:
+                await self._acquire(client_id)
+                shared = self._shared_requests.get(key)
+                if shared is not None:
+                    # Started by another caller while waiting for capacity
+                    self._capacity[client_id].release()
+            if shared is None:
+                shared = self._shared_requests[key] = _SharedRequest(
+                    *self._send_request(client_id, function)
+                )
+
+            shared.waiters += 1
+            try:
+                return await asyncio.shield(shared.future)
+            finally:
+                shared.waiters -= 1
+                if not shared.waiters:
+                    del self._shared_requests[key]
+                    self._forget_request(shared.request_id)
+
+    @staticmethod
+    def _take_result(wait_future: asyncio.Future) -> Any:
+        # Result or exception of a request, TimeoutError if it is still not finished
+        if not wait_future.done():
+            wait_future.cancel()
+            return TimeoutError()
+        if wait_future.cancelled():
+            return asyncio.CancelledError()
+        return wait_future.exception() or wait_future.result()
+
+    async def execute_many(
+        self, client_id: int, functions: Iterable[Function], timeout: float
+    ) -> list[Any]:
+        # All requests are sent at once and share one deadline. Results are returned
+        # in order of functions, failed requests have the exception instead
+        deadline = self._loop.time() + timeout
+        requests = await self._send_requests(client_id, functions, deadline)
+        try:
+            if requests:
+                await asyncio.wait(
+                    [f for _, f in requests],
+                    timeout=max(deadline - self._loop.time(), 0),
+                )
+        finally:
+            results = [self._take_result(f) for _, f in requests]
+            for request_id, _ in requests:
+                self._forget_request(request_id)
+        return results
+
+    async def execute_as_completed(
+        self, client_id: int, functions: Iterable[Function], timeout: float
+    ) -> AsyncIterator[tuple[int, Any]]:
+        # Same as execute_many, but yields (index, result) as requests complete.
+        # Requests not completed before the deadline are yielded with TimeoutError
+        deadline = self._loop.time() + timeout
+        requests = await self._send_requests(client_id, functions, deadline)
+        wait_futures = [f for _, f in requests]
+        completed: asyncio.Queue[int | None] = asyncio.Queue()
+        for index, wait_future in enumerate(wait_futures):
+            wait_future.add_done_callback(
+                functools.partial(self._put_index, completed, index)
+            )
+        expire = self._loop.call_at(deadline, completed.put_nowait, None)
+
+        left = set(range(len(wait_futures)))
+        try:
+            while left:
+                index = await completed.get()
+                if index is None:
+                    break
+                if index in left:
+                    left.remove(index)
+                    yield index, self._take_result(wait_futures[index])
+
+            for index in sorted(left):
+                left.remove(index)
+                yield index, self._take_result(wait_futures[index])
+        finally:
+            expire.cancel()
+            for request_id, wait_future in requests:
+                wait_future.cancel()
+                self._forget_request(request_id)
+
+    @staticmethod
+    def _put_index(queue: asyncio.Queue, index: int, _: asyncio.Future):
+        queue.put_nowait(index)
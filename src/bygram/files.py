@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import os
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from bygram.types import raw
+
+Execute = Callable[..., Awaitable[Any]]
+# Reads count bytes at the offset
+ReadAt = Callable[[int, int], Awaitable[bytes]]
+
+DEFAULT_CHUNK_SIZE = 512 * 1024
+
+
+class FileReader:
+    # Async seekable reader of a file. The file is read by chunks and the next
+    # read_ahead chunks are read while the current one is consumed, so at most
+    # read_ahead + 1 chunks are kept in memory
+    def __init__(
+        self,
+        read_at: ReadAt,
+        size: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        read_ahead: int = 2,
+        on_close: Callable[[], Any] | None = None,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        if read_ahead < 0:
+            raise ValueError("read_ahead must not be negative")
+
+        self._read_at = read_at
+        self._on_close = on_close
+        self.size = size
+        self._chunk_size = chunk_size
+        self._read_ahead = read_ahead
+        self._position = 0
+        self._chunks: dict[int, asyncio.Task[bytes]] = {}
+        self._closed = False
+
+    async def __aenter__(self) -> FileReader:
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        # Chunks from the current position to the end
+        while data := await self.read(self._chunk_size):
+            yield data
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += self.size
+        elif whence != os.SEEK_SET:
+            raise ValueError(f"Invalid whence: {whence}")
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        self._position = offset
+        return offset
+
+    async def read(self, size: int = -1) -> bytes:
+        if self._closed:
+            raise ValueError("I/O operation on closed file")
+
+        end = self.size if size < 0 else min(self._position + size, self.size)
+        parts = []
+        while self._position < end:
+            index, start = divmod(self._position, self._chunk_size)
+            chunk = await self._get_chunk(index)
+            part = chunk[start : start + end - self._position]
+            if not part:
+                break
+            parts.append(part)
+            self._position += len(part)
+        return b"".join(parts)
+
+    async def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        for task in self._chunks.values():
+            _drop_chunk(task)
+        self._chunks.clear()
+        if self._on_close:
+            self._on_close()
+
+    def _get_chunk(self, index: int) -> asyncio.Task[bytes]:
+        # Chunks before the current one and beyond the read-ahead window are dropped
+        last = min(index + self._read_ahead, (self.size - 1) // self._chunk_size)
+        for i in list(self._chunks):
+            if not index <= i <= last:
+                _drop_chunk(self._chunks.pop(i))
+        for i in range(index, last + 1):
+            if i not in self._chunks:
+                offset = i * self._chunk_size
+                count = min(self._chunk_size, self.size - offset)
+                self._chunks[i] = asyncio.create_task(self._read_chunk(offset, count))
+        return self._chunks[index]
+
+    async def _read_chunk(self, offset: int, count: int) -> bytes:
+        # read_at may return any awaitable, tasks need a coroutine
+        return await self._read_at(offset, count)
+
+
+def _drop_chunk(task: asyncio.Task[bytes]):
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        # Errors of chunks which were read ahead but not needed are ignored
+        task.exception()
+
+
+def _get_readable_size(file: raw.File) -> int:
+    local = file.local
+    assert local
+    if local.is_downloading_completed:
+        return file.size or local.downloaded_size
+    # Only the downloaded beginning of the file can be read
+    return local.downloaded_prefix_size
+
+
+def open_local_file(
+    file: raw.File, chunk_size: int = DEFAULT_CHUNK_SIZE, read_ahead: int = 2
+) -> FileReader:
+    # Chunks are read by the thread pool, with pread, so they can be read in parallel
+    assert file.local and file.local.path
+    fd = os.open(file.local.path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+    except BaseException:
+        os.close(fd)
+        raise
+
+    async def read_at(offset: int, count: int) -> bytes:
+        return await asyncio.to_thread(os.pread, fd, count, offset)
+
+    return FileReader(
+        read_at,
+        size,
+        chunk_size=chunk_size,
+        read_ahead=read_ahead,
+        on_close=lambda: os.close(fd),
+    )
+
+
+def open_tdlib_file(
+    execute: Execute,
+    file: raw.File,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    read_ahead: int = 2,
+) -> FileReader:
+    # For the case when files of TDLib are not accessible, e.g. it runs in a
+    # container or a sharded process on another file system
+
+    async def read_at(offset: int, count: int) -> bytes:
+        part: raw.Data = await execute(raw.ReadFilePart(file.id, offset, count))
+        data: bytes | str = part.data
+        # Bytes are base64 in JSON
+        if isinstance(data, str):
+            return base64.b64decode(data)
+        return data
+
+    return FileReader(
+        read_at, _get_readable_size(file), chunk_size=chunk_size, read_ahead=read_ahead
+    )
+
+
+async def open_file(
+    execute: Execute,
+    file_id: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    read_ahead: int = 2,
+    use_local_path: bool = True,
+) -> FileReader:
+    # A downloaded file is read from its local path when it is accessible,
+    # otherwise (or for partially downloaded files) through ReadFilePart
+    file: raw.File = await execute(raw.GetFile(file_id))
+    local = file.local
+    assert local
+    if use_local_path and local.is_downloading_completed and local.path:
+        try:
+            return open_local_file(file, chunk_size=chunk_size, read_ahead=read_ahead)
+        except OSError:
+            pass
+    return open_tdlib_file(execute, file, chunk_size=chunk_size, read_ahead=read_ahead)
@@ -1,15 +1,24 @@
 import asyncio
 import logging
+import sys
 from enum import Enum, auto
+from typing import Mapping, Type
 
+from bygram.cache import CachePolicy
 from bygram.client_manager import Client, ClientManager
+from bygram.core.decoder import DecodeStats
 from bygram.core.listener import EventListener
-from bygram.core.serializer import SerializedWrapper
+from bygram.core.serializer import Codec, SerializedWrapper, peek_client_id
 from bygram.core.types import T
 from bygram.core.wrapper import load_library
 from bygram.executor import Executor
 from bygram.routing.dispatcher import Dispatcher
-from bygram.routing.middlewares import ClientManagerMiddleware
+from bygram.routing.middlewares import (
+    ClientManagerMiddleware,
+    DownloadProgressMiddleware,
+    EntityCacheMiddleware,
+    ResponseCacheMiddleware,
+)
 from bygram.strategy import EventsLoop
 from bygram.types.base import Function
 
@@ -29,6 +38,18 @@ def create_library_manager(
     path: str,
     loop: asyncio.AbstractEventLoop | None = None,
     receive_timeout: float = 60,
+    receive_batch_size: int = 1,
+    decode_workers: int = 0,
+    max_concurrent_updates: int | None = None,
+    lazy_decode: bool = False,
+    codec: Codec | None = None,
+    zero_copy_receive: bool = False,
+    max_in_flight_per_client: int | None = None,
+    coalesce_requests: bool = False,
+    entity_cache: bool = False,
+    response_cache_policies: Mapping[Type[Function], CachePolicy] | None = None,
+    download_progress: bool = False,
+    fast_responses: bool = False,
 ):
     global _instance
     if _instance and _instance._state != LibraryState.shutdowned:
@@ -37,29 +58,86 @@ def create_library_manager(
     if loop is None:
         loop = asyncio.get_event_loop()
 
-    wrapper = load_library(path)
-    serialized_wrapper = SerializedWrapper(wrapper)
-    listener = EventListener(loop, serialized_wrapper.receive, timeout=receive_timeout)
-    executor = Executor(serialized_wrapper.send, loop)
-    event_loop = EventsLoop(listener, executor)
-    client_manager = ClientManager(executor, serialized_wrapper)
-    library_manager = LibraryManager(client_manager, event_loop, serialized_wrapper)
+    # decode_workers > 0 decodes in a pool of threads. Decoding is pure Python, so
+    # it only runs in parallel on free-threaded builds. With the GIL the workers
+    # take turns and are slower than decoding in the receiver thread
+    if decode_workers and _is_gil_enabled():
+        logger.warning(
+            "decode_workers=%s doesn't speed up decoding when the GIL is enabled",
+            decode_workers,
+        )
+
+    wrapper = load_library(path, zero_copy=zero_copy_receive)
+    serialized_wrapper = SerializedWrapper(wrapper, lazy=lazy_decode, codec=codec)
+    executor = Executor(
+        serialized_wrapper.send,
+        loop,
+        max_in_flight_per_client=max_in_flight_per_client,
+        coalesce=coalesce_requests,
+    )
+    # Responses are resolved once the updates received before them are
+    # dispatched, without waiting for their handlers. With fast_responses they
+    # resolve their futures right after decoding, even before these updates are
+    # dispatched. TDLib sends updates caused by a request before its response, so
+    # execute() may return before the dispatcher (and caches updated by
+    # middlewares) handles these updates, e.g. UpdateNewChat after LoadChats
+    listener = EventListener(
+        loop,
+        serialized_wrapper.receive_raw,
+        timeout=receive_timeout,
+        batch_size=receive_batch_size,
+        decode=serialized_wrapper.decode,
+        decode_workers=decode_workers,
+        peek_client_id=peek_client_id,
+        on_response=executor.resolve_response if fast_responses else None,
+    )
+    event_loop = EventsLoop(
+        listener, executor, max_concurrent_updates=max_concurrent_updates
+    )
+    # Pass get_response_cache_policies() from bygram.cache to cache the usual
+    # semi-static data
+    client_manager = ClientManager(
+        executor, serialized_wrapper, response_cache_policies=response_cache_policies
+    )
+    library_manager = LibraryManager(
+        client_manager,
+        event_loop,
+        serialized_wrapper,
+        entity_cache=entity_cache,
+        response_cache=response_cache_policies is not None,
+        download_progress=download_progress,
+    )
 
     _instance = library_manager
     return library_manager
 
 
+def _is_gil_enabled() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is None or is_gil_enabled()
+
+
 class LibraryManager:
     def __init__(
         self,
         client_manager: ClientManager,
         event_loop: EventsLoop,
         serialized_wrapper: SerializedWrapper,
+        entity_cache: bool = False,
+        response_cache: bool = False,
+        download_progress: bool = False,
     ) -> None:
+        # With entity_cache updates about users, chats and groups are applied to
+        # client.cache of their client. With response_cache updates invalidate
+        # client.response_cache. With download_progress UpdateFile is passed to
+        # client.downloads
         self._client_manager = client_manager
         self._serialized_wrapper = serialized_wrapper
         self._event_loop = event_loop
         self._dispatcher: Dispatcher | None = None
+        self._entity_cache = entity_cache
+        self._response_cache = response_cache
+        self._download_progress = download_progress
 
         self._state = LibraryState.created
 
@@ -86,7 +164,20 @@ class LibraryManager:
 
         self._dispatcher = dp
         self._event_loop.attach_dispatcher(self._dispatcher)
+        # The last added middleware runs first
+        if self._entity_cache:
+            self._dispatcher.add_middleware(EntityCacheMiddleware())
+        if self._response_cache:
+            self._dispatcher.add_middleware(ResponseCacheMiddleware())
+        if self._download_progress:
+            self._dispatcher.add_middleware(DownloadProgressMiddleware())
         self._dispatcher.add_middleware(ClientManagerMiddleware(self._client_manager))
+        self._serialized_wrapper.set_handled_update_types(
+            lambda: dp.handled_update_types
+        )
+
+    def decode_stats(self) -> DecodeStats | None:
+        return self._event_loop.listener.decode_stats()
 
     def init(self):
         if self._state == LibraryState.initalized:
@@ -108,6 +199,8 @@ class LibraryManager:
         # Properly shutting down event reading loop
         await self._event_loop.shutdown()
 
+        self._serialized_wrapper.close()
+
     async def shutdown(self):
         if self._state != LibraryState.initalized:
             return
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, Callable, TypeVar
+
+from bygram.types import raw
+
+Cursor = TypeVar("Cursor")
+Item = TypeVar("Item")
+
+Execute = Callable[..., Awaitable[Any]]
+# Items of the page for the cursor and the cursor of the next page, None after the
+# last one. The second argument is the number of items to request
+FetchPage = Callable[[Cursor, int], Awaitable[tuple[list[Item], Cursor | None]]]
+
+# Maximum limit of TDLib for most of paginated functions
+MAX_PAGE_SIZE = 100
+
+
+async def _fetch_pages(
+    fetch_page: FetchPage[Cursor, Item],
+    cursor: Cursor,
+    limit: int | None,
+    page_size: int,
+) -> AsyncIterator[list[Item]]:
+    fetched = 0
+    next_cursor: Cursor | None = cursor
+    while next_cursor is not None and (limit is None or fetched < limit):
+        count = page_size if limit is None else min(page_size, limit - fetched)
+        items, next_cursor = await fetch_page(next_cursor, count)
+        if limit is not None:
+            items = items[: limit - fetched]
+        fetched += len(items)
+        if items:
+            yield items
+
+
+async def _read_ahead(
+    pages: AsyncIterator[list[Item]], depth: int
+) -> AsyncIterator[list[Item]]:
+    # Next pages are requested by a task while the current one is consumed
+    if not depth:
+        async for page in pages:
+            yield page
+        return
+
+    queue: asyncio.Queue[list[Item] | Exception | None] = asyncio.Queue(depth)
+
+    async def produce():
+        try:
+            async for page in pages:
+                await queue.put(page)
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(None)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while (page := await queue.get()) is not None:
+            if isinstance(page, Exception):
+                raise page
+            yield page
+    finally:
+        producer.cancel()
+
+
+async def paginate(
+    fetch_page: FetchPage[Cursor, Item],
+    cursor: Cursor,
+    limit: int | None = None,
+    page_size: int = MAX_PAGE_SIZE,
+    read_ahead: int = 1,
+) -> AsyncGenerator[Item, None]:
+    # Up to limit items of all pages. With read_ahead > 0 that many pages are
+    # requested before they are needed. Break out of the loop within
+    # contextlib.aclosing to stop requesting pages right away
+    if page_size < 1:
+        raise ValueError("page_size must be positive")
+    if read_ahead < 0:
+        raise ValueError("read_ahead must not be negative")
+
+    pages = _fetch_pages(fetch_page, cursor, limit, page_size)
+    async for page in _read_ahead(pages, read_ahead):
+        for item in page:
+            yield item
+
+
+def iter_history(
+    execute: Execute,
+    chat_id: int,
+    limit: int | None = None,
+    from_message_id: int = 0,
+    only_local: bool = False,
+    page_size: int = MAX_PAGE_SIZE,
+    read_ahead: int = 1,
+) -> AsyncGenerator[raw.Message, None]:
+    # Messages from the newest one (or from_message_id) to the oldest one
+
+    async def fetch_page(
+        cursor: tuple[int, bool], count: int
+    ) -> tuple[list[raw.Message], tuple[int, bool] | None]:
+        from_id, is_next_page = cursor
+        if is_next_page:
+            # The page may start with from_message_id, which ends the previous page
+            count = min(count + 1, MAX_PAGE_SIZE)
+        result: raw.Messages = await execute(
+            raw.GetChatHistory(chat_id, from_id, 0, count, only_local)
+        )
+        # TDLib may return fewer messages than requested, only the empty page
+        # means the end of the history
+        assert result.messages is not None
+        messages = [
+            m
+            for m in result.messages
+            if m is not None and not (is_next_page and m.id >= from_id)
+        ]
+        if not messages:
+            return [], None
+        return messages, (messages[-1].id, True)
+
+    return paginate(fetch_page, (from_message_id, False), limit, page_size, read_ahead)
+
+
+def iter_search_chat_messages(
+    execute: Execute,
+    function: raw.SearchChatMessages,
+    limit: int | None = None,
+    read_ahead: int = 1,
+) -> AsyncGenerator[raw.Message, None]:
+    # Fields of the function set the search, its limit is the page size
+
+    async def fetch_page(
+        cursor: tuple[int, int], count: int
+    ) -> tuple[list[raw.Message], tuple[int, int] | None]:
+        from_message_id, offset = cursor
+        result: raw.FoundChatMessages = await execute(
+            dataclasses.replace(
+                function, from_message_id=from_message_id, offset=offset, limit=count
+            )
+        )
+        assert result.messages is not None
+        messages = [m for m in result.messages if m is not None]
+        if not messages or not result.next_from_message_id:
+            return messages, None
+        return messages, (result.next_from_message_id, 0)
+
+    return paginate(
+        fetch_page,
+        (function.from_message_id, function.offset),
+        limit,
+        function.limit or MAX_PAGE_SIZE,
+        read_ahead,
+    )
+
+
+def iter_search_messages(
+    execute: Execute,
+    function: raw.SearchMessages,
+    limit: int | None = None,
+    read_ahead: int = 1,
+) -> AsyncGenerator[raw.Message, None]:
+    # Fields of the function set the search, its limit is the page size
+
+    async def fetch_page(
+        offset: str, count: int
+    ) -> tuple[list[raw.Message], str | None]:
+        result: raw.FoundMessages = await execute(
+            dataclasses.replace(function, offset=offset, limit=count)
+        )
+        assert result.messages is not None
+        messages = [m for m in result.messages if m is not None]
+        if not messages or not result.next_offset:
+            return messages, None
+        return messages, result.next_offset
+
+    return paginate(
+        fetch_page, function.offset, limit, function.limit or MAX_PAGE_SIZE, read_ahead
+    )
+
+
+def iter_chats(
+    execute: Execute,
+    chat_list: raw.ChatList | None = None,
+    limit: int | None = None,
+    page_size: int = MAX_PAGE_SIZE,
+    read_ahead: int = 1,
+) -> AsyncGenerator[int, None]:
+    # Identifiers of chats in order of the chat list, the main one by default.
+    # GetChats always returns the beginning of the list and loads chats as
+    # needed, so every page asks for a longer beginning
+
+    async def fetch_page(skip: int, count: int) -> tuple[list[int], int | None]:
+        result: raw.Chats = await execute(raw.GetChats(chat_list, skip + count))
+        assert result.chat_ids is not None
+        chat_ids = result.chat_ids[skip:]
+        if len(result.chat_ids) < skip + count:
+            return chat_ids, None
+        return chat_ids, skip + len(chat_ids)
+
+    return paginate(fetch_page, 0, limit, page_size, read_ahead)
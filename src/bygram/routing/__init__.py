@@ -1,2 +1,10 @@
 from .dispatcher import Dispatcher
-from .filters import FilterBase
+from .filters import (
+    ChatIdFilter,
+    ContentTypeFilter,
+    FieldFilter,
+    FilterBase,
+    IndexedFilter,
+    SenderFilter,
+    TextFilter,
+)
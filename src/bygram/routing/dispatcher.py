@@ -1,12 +1,12 @@
 import functools
 import inspect
 import logging
-from typing import Any, Awaitable, Callable, Iterable, Type, TypeVar
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Type, TypeVar
 
 from bygram.routing.middlewares import MiddlewareBase
 from bygram.types.base import Update
 
-from .filters import FilterBase
+from .filters import FieldFilter, FilterBase, IndexedFilter
 
 T = TypeVar("T", bound=Update)
 
@@ -15,26 +15,89 @@ Callback = Callable[..., Awaitable[Any]]
 logger = logging.getLogger(__name__)
 
 
-def inject_dependencies(callback: Callback, update: Update, data: dict):
-    kwargs = {}
-    func_sig = inspect.signature(callback)
-    for param in func_sig.parameters:
-        if param in data:
-            kwargs[param] = data[param]
+class Injector:
+    # Parameters of a callback are inspected once, when it is registered.
+    # The first positional parameter receives the update, the rest are taken from
+    # data by name. Parameters missing from data keep their defaults
+    def __init__(self, callback: Callback) -> None:
+        self.callback = callback
+        self.pass_all = False
+
+        names = []
+        update_param = None
+        for param in inspect.signature(callback).parameters.values():
+            if param.kind is param.VAR_KEYWORD:
+                self.pass_all = True
+            elif param.kind in (param.POSITIONAL_ONLY, param.VAR_POSITIONAL):
+                if update_param is None:
+                    update_param = param.name
+            elif param.kind is param.POSITIONAL_OR_KEYWORD and update_param is None:
+                update_param = param.name
+            else:
+                names.append(param.name)
+
+        self.names = tuple(names)
+        self._update_param = update_param
+
+    def build_kwargs(self, data: dict) -> dict:
+        if self.pass_all:
+            kwargs = data.copy()
+            kwargs.pop(self._update_param, None)
+            return kwargs
+        return {name: data[name] for name in self.names if name in data}
+
+    def __call__(self, update: Update, data: dict):
+        return self.callback(update, **self.build_kwargs(data))
 
-    return callback(update, **kwargs)
+
+def inject_dependencies(callback: Callback, update: Update, data: dict):
+    return Injector(callback)(update, data)
 
 
 class Handler:
     def __init__(self, callback: Callback, filters: Iterable[FilterBase]) -> None:
         self.callback = callback
         self.callback_signature = inspect.signature(self.callback)
-        self.filters = filters
-
-    async def is_pass_filters(self, update: Update, data: dict) -> bool:
+        self.filters = list(filters)
+        self._injector = Injector(callback)
+
+        # The first indexed filter is used to find the handler in HandlersIndex.
+        # Other declarative filters are checked directly, before the rest
+        self.indexed_filter: IndexedFilter | None = None
+        self.field_filters: list[FieldFilter] = []
+        self.fallback_filters: list[tuple[FilterBase, Injector]] = []
         for filter in self.filters:
+            if isinstance(filter, IndexedFilter) and self.indexed_filter is None:
+                self.indexed_filter = filter
+            elif isinstance(filter, FieldFilter):
+                self.field_filters.append(filter)
+            else:
+                self.fallback_filters.append((filter, Injector(filter)))
+
+    def _is_pass_field_filters(self, update: Update, check_indexed: bool) -> bool:
+        filters = self.field_filters
+        if check_indexed and self.indexed_filter:
+            filters = [self.indexed_filter, *filters]
+        for filter in filters:
             try:
-                result = await inject_dependencies(filter, update, data)
+                if not filter.check(update):
+                    return False
+            except Exception:
+                logger.exception(
+                    "Error with filter %s at callback %s", filter, self.callback
+                )
+                return False
+        return True
+
+    async def is_pass_filters(
+        self, update: Update, data: dict, check_indexed: bool = True
+    ) -> bool:
+        if not self._is_pass_field_filters(update, check_indexed):
+            return False
+
+        for filter, injector in self.fallback_filters:
+            try:
+                result = await injector(update, data)
             except Exception:
                 logger.exception(
                     "Error with filter %s at callback %s", filter, self.callback
@@ -48,7 +111,54 @@ class Handler:
         return True
 
     async def __call__(self, update: Update, data: dict) -> Any:
-        return await inject_dependencies(self.callback, update, data)
+        return await self._injector(update, data)
+
+
+class HandlersIndex:
+    # Handlers of one update type. Handlers with an indexed filter are found by the
+    # value of the update, so only the candidates are checked
+    def __init__(self, handlers: list[Handler]) -> None:
+        self.handlers = handlers
+        self._unindexed: list[int] = []
+        self._lookups: dict[
+            Hashable, tuple[Callable[[Update], Hashable], dict[Hashable, list[int]]]
+        ] = {}
+        for position, handler in enumerate(handlers):
+            filter = handler.indexed_filter
+            if filter is None:
+                self._unindexed.append(position)
+                continue
+            _, by_value = self._lookups.setdefault(filter.key, (filter.get_value, {}))
+            for value in filter.values:
+                by_value.setdefault(value, []).append(position)
+
+    def find(self, update: Update) -> list[Handler]:
+        # Candidates in the order of registration
+        if not self._lookups:
+            return self.handlers
+
+        positions = self._unindexed
+        merged = False
+        for get_value, by_value in self._lookups.values():
+            try:
+                found = by_value.get(get_value(update))
+            except Exception:
+                logger.exception("Error while getting %s of %s", get_value, update)
+                continue
+            if found:
+                if positions:
+                    positions = positions + found
+                    merged = True
+                else:
+                    positions = found
+        if merged:
+            positions = sorted(positions)
+
+        handlers = self.handlers
+        return [handlers[i] for i in positions]
+
+
+Routes = tuple[HandlersIndex, list["Router"]]
 
 
 class Router:
@@ -56,6 +166,13 @@ class Router:
         self.callbacks: dict[Type[Update], list[Handler]] = {}
         self.routers: list[Router] = []
         self.middlewares: list[MiddlewareBase] = []
+        self._chain: Callable[[Update, dict], Awaitable[Any]] | None = None
+        self._copy_data = False
+        # Handlers in the order of registration, for matching by MRO
+        self._handlers: list[tuple[Type[Update], Handler]] = []
+        self._parents: list[Router] = []
+        # Update type -> matching handlers and sub-routers interested in the type
+        self._routes: dict[Type[Update], Routes] = {}
 
     def include_router(self, router: "Router"):
         self.include_routers(router)
@@ -63,40 +180,71 @@ class Router:
     def include_routers(self, *routers: "Router"):
         # TODO: Add check on recursive router adding
         self.routers.extend(routers)
+        for router in routers:
+            router._parents.append(self)
+        self._invalidate_routes()
 
     def add_middleware(self, middleware: MiddlewareBase):
         self.middlewares.append(middleware)
-
-    def _create_chain(self, endpoint: Callable[[Update, dict], Awaitable[Any]]):
-        handler = endpoint
-        for middleware in self.middlewares:
-            handler = functools.partial(middleware, next_handler=handler)
-
-        return handler
+        self._chain = None
+
+    def _invalidate_routes(self):
+        # Routes of all parents depend on routes of this router
+        routers: list[Router] = [self]
+        seen = set()
+        while routers:
+            router = routers.pop()
+            if id(router) in seen:
+                continue
+            seen.add(id(router))
+            router._routes.clear()
+            router._on_routes_changed()
+            routers.extend(router._parents)
+
+    def _on_routes_changed(self):
+        pass
+
+    def _get_routes(self, update_type: Type[Update]) -> Routes:
+        routes = self._routes.get(update_type)
+        if routes is None:
+            handlers = [h for t, h in self._handlers if issubclass(update_type, t)]
+            routers = [r for r in self.routers if r._is_interested(update_type)]
+            routes = self._routes[update_type] = (HandlersIndex(handlers), routers)
+        return routes
+
+    def _is_interested(self, update_type: Type[Update]) -> bool:
+        index, routers = self._get_routes(update_type)
+        return bool(index.handlers or routers)
+
+    def _get_chain(self) -> Callable[[Update, dict], Awaitable[Any]]:
+        # The chain is built once and rebuilt after adding a middleware
+        if self._chain is None:
+            handler = self._process_update
+            for middleware in self.middlewares:
+                handler = functools.partial(middleware, next_handler=handler)
+            self._chain = handler
+            # Only middlewares and filters with injection can change data, otherwise it is shared
+            self._copy_data = bool(self.middlewares) or any(
+                h.fallback_filters for _, h in self._handlers
+            )
+        return self._chain
 
     async def _handle_update(self, update: Update, data: dict) -> bool:
-        data = data.copy()
-        executed = False
-
-        async def endpoint(update: Update, data: dict):
-            nonlocal executed
-            executed = await self._process_update(update, data)
-
-        chained_function = self._create_chain(endpoint)
-        await chained_function(update, data)
-        return executed
+        chain = self._get_chain()
+        if self._copy_data:
+            data = data.copy()
+        return await chain(update, data) is True
 
     async def _process_update(self, update: Update, data: dict) -> bool:
-        callbacks = self.callbacks.get(type(update))
-        if not callbacks:
-            return False
+        # Sub-routers without handlers for the update are skipped with their middlewares
+        index, routers = self._get_routes(type(update))
 
-        for c in callbacks:
-            if not await c.is_pass_filters(update, data):
+        for c in index.find(update):
+            if not await c.is_pass_filters(update, data, check_indexed=False):
                 continue
             await c(update, data)
 
-        for i in self.routers:
+        for i in routers:
             if await i._handle_update(update, data):
                 return True
 
@@ -108,21 +256,66 @@ class Router:
         handler = Handler(callback, filters)
         handlers = self.callbacks.setdefault(type, [])
         handlers.append(handler)
+        self._handlers.append((type, handler))
+        self._chain = None
+        self._invalidate_routes()
 
     def register(self, type: Type[Update], *filters: FilterBase):
         return functools.partial(self.add_handler, type, filters=filters)
 
 
+def get_tl_type_name(type: Type[Update]) -> str | None:
+    field = getattr(type, "__dataclass_fields__", {}).get("_type")
+    if field is None or not isinstance(field.default, str):
+        return None
+    return field.default
+
+
 class Dispatcher(Router):
     def __init__(self) -> None:
         super().__init__()
         self.di: dict[str, Any] = {}
+        # @type of updates with handlers or needed by middlewares, None if all are
+        # needed. It is replaced as a whole, so the receiver thread can read it
+        self.handled_update_types: frozenset[str] | None = frozenset()
+
+    def _collect_update_types(self) -> frozenset[str] | None:
+        types: list[Type[Update]] = []
+        for middleware in self.middlewares:
+            types.extend(middleware.update_types)
+
+        routers: list[Router] = [self]
+        seen = set()
+        while routers:
+            router = routers.pop()
+            if id(router) in seen:
+                continue
+            seen.add(id(router))
+            types.extend(router.callbacks)
+            routers.extend(router.routers)
+
+        names = set()
+        for type in types:
+            name = get_tl_type_name(type)
+            if name is None:
+                # Handlers of base or custom classes can match any update
+                return None
+            names.add(name)
+        return frozenset(names)
+
+    def _on_routes_changed(self):
+        self.handled_update_types = self._collect_update_types()
+
+    def add_middleware(self, middleware: MiddlewareBase):
+        super().add_middleware(middleware)
+        self._on_routes_changed()
 
     async def _feed_update(self, update: Update, client_id: int):
         data = self.di.copy()
         data["client_id"] = client_id
         try:
-            await self._handle_update(update, data)
+            # data is already a fresh copy here
+            await self._get_chain()(update, data)
         except Exception:
             logger.exception("Error while processing update %s", update)
 
@@ -1,12 +1,95 @@
 import abc
-from typing import Generic, TypeVar
+import re
+from typing import Any, Generic, Hashable, Type, TypeVar
 
-from bygram.types.base import Update
+from bygram.types.base import ObjectBase, Update
 
 T = TypeVar("T", bound=Update)
 
 
+def get_update_message(update: Update) -> Any:
+    return getattr(update, "message", None)
+
+
+def get_update_chat_id(update: Update) -> int | None:
+    chat_id = getattr(update, "chat_id", None)
+    if chat_id is None:
+        chat_id = getattr(get_update_message(update), "chat_id", None)
+    return chat_id
+
+
 class FilterBase(Generic[T], abc.ABC):
     @abc.abstractmethod
     async def __call__(self, event: Update, data: dict) -> bool | dict:
         pass
+
+
+class FieldFilter(FilterBase[T]):
+    # Declarative filter which only looks at the update, so the dispatcher checks it
+    # directly, without dependency injection
+    @abc.abstractmethod
+    def check(self, event: Update) -> bool:
+        pass
+
+    async def __call__(self, event: Update, data: dict) -> bool | dict:
+        return self.check(event)
+
+
+class IndexedFilter(FieldFilter[T]):
+    # Passes when the value extracted from the update is one of the values.
+    # Handlers with such filters are found by a hash lookup of the value
+    key: Hashable
+
+    def __init__(self, *values: Hashable) -> None:
+        self.values = frozenset(values)
+
+    @staticmethod
+    @abc.abstractmethod
+    def get_value(event: Update) -> Hashable:
+        pass
+
+    def check(self, event: Update) -> bool:
+        return self.get_value(event) in self.values
+
+
+class ChatIdFilter(IndexedFilter[T]):
+    key = "chat_id"
+
+    @staticmethod
+    def get_value(event: Update) -> Hashable:
+        return get_update_chat_id(event)
+
+
+class SenderFilter(IndexedFilter[T]):
+    # Messages sent by one of the users
+    key = "sender_user_id"
+
+    @staticmethod
+    def get_value(event: Update) -> Hashable:
+        sender = getattr(get_update_message(event), "sender_id", None)
+        return getattr(sender, "user_id", None)
+
+
+class ContentTypeFilter(IndexedFilter[T]):
+    key = "content_type"
+
+    def __init__(self, *types: Type[ObjectBase]) -> None:
+        super().__init__(*types)
+
+    @staticmethod
+    def get_value(event: Update) -> Hashable:
+        return type(getattr(get_update_message(event), "content", None))
+
+
+class TextFilter(FieldFilter[T]):
+    # Text or caption of the message matches the regular expression
+    def __init__(self, pattern: str | re.Pattern) -> None:
+        self.pattern = re.compile(pattern)
+
+    def check(self, event: Update) -> bool:
+        content = getattr(get_update_message(event), "content", None)
+        text = getattr(content, "text", None) or getattr(content, "caption", None)
+        text = getattr(text, "text", None)
+        if text is None:
+            return False
+        return self.pattern.search(text) is not None
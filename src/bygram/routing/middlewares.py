@@ -1,12 +1,17 @@
 import abc
-from typing import Any, Awaitable, Callable
+from typing import Any, Awaitable, Callable, Type
 
+from bygram.cache import get_cached_update_types, get_invalidating_update_types
 from bygram.client_manager import ClientManager
 from bygram.types.base import Update
-from bygram.types.raw import UpdateAuthorizationState
+from bygram.types.raw import UpdateAuthorizationState, UpdateFile
 
 
 class MiddlewareBase(abc.ABC):
+    # Updates which are needed by the middleware itself, even without handlers.
+    # Dispatcher skips decoding of other updates which nobody handles
+    update_types: tuple[Type[Update], ...] = ()
+
     @abc.abstractmethod
     async def __call__(
         self,
@@ -32,6 +37,8 @@ class FindClientMiddleware(MiddlewareBase):
 
 
 class ClientManagerMiddleware(MiddlewareBase):
+    update_types = (UpdateAuthorizationState,)
+
     def __init__(self, client_manager: ClientManager) -> None:
         self._client_manager = client_manager
 
@@ -48,3 +55,50 @@ class ClientManagerMiddleware(MiddlewareBase):
                 update, client_id
             )
         return await next_handler(update, data)
+
+
+class EntityCacheMiddleware(MiddlewareBase):
+    # Applies updates to the entity cache of the client before handlers see them.
+    # Expects the client in data, set by ClientManagerMiddleware
+    def __init__(self) -> None:
+        self.update_types = get_cached_update_types()
+
+    async def __call__(
+        self,
+        update: Update,
+        data: dict,
+        next_handler: Callable[[Update, dict], Awaitable[Any]],
+    ) -> Any:
+        data["client"].cache.apply(update)
+        return await next_handler(update, data)
+
+
+class ResponseCacheMiddleware(MiddlewareBase):
+    # Drops cached responses of the client made outdated by updates
+    def __init__(self) -> None:
+        self.update_types = get_invalidating_update_types()
+
+    async def __call__(
+        self,
+        update: Update,
+        data: dict,
+        next_handler: Callable[[Update, dict], Awaitable[Any]],
+    ) -> Any:
+        response_cache = data["client"].response_cache
+        if response_cache is not None:
+            response_cache.invalidate(update)
+        return await next_handler(update, data)
+
+
+class DownloadProgressMiddleware(MiddlewareBase):
+    # Passes progress of files to the download manager of the client
+    update_types = (UpdateFile,)
+
+    async def __call__(
+        self,
+        update: Update,
+        data: dict,
+        next_handler: Callable[[Update, dict], Awaitable[Any]],
+    ) -> Any:
+        data["client"].downloads.apply(update)
+        return await next_handler(update, data)
@@ -0,0 +1,386 @@
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import pickle
+import threading
+from contextlib import suppress
+from multiprocessing.connection import Connection
+from typing import Any, Awaitable, Callable, Iterable
+
+from bygram.core.types import T
+from bygram.manager import LibraryManager, create_library_manager
+from bygram.routing.dispatcher import Dispatcher
+from bygram.routing.middlewares import MiddlewareBase
+from bygram.types.base import Function, Update
+from bygram.types.raw import AuthorizationStateClosed, UpdateAuthorizationState
+
+logger = logging.getLogger(__name__)
+
+# Commands of the parent, (op, call id, local client id, arguments)
+_CREATE_CLIENT = 1
+_EXECUTE = 2
+_EXECUTE_MANY = 3
+_STOP = 4
+
+# Messages of a shard, (kind, call id or local client id, value)
+_RESULT = 1
+_ERROR = 2
+_CLIENT_CLOSED = 3
+
+_STOP_TIMEOUT = 70
+
+# Builds the dispatcher of a shard. Must be picklable, e.g. a module-level function
+Setup = Callable[[], Dispatcher]
+CreateManager = Callable[..., LibraryManager]
+
+
+def to_global_client_id(client_id: int, shard: int, shards: int) -> int:
+    return client_id * shards + shard
+
+
+def to_local_client_id(client_id: int, shards: int) -> tuple[int, int]:
+    # Shard and client id inside of it
+    return client_id % shards, client_id // shards
+
+
+def _dumps(message: tuple) -> bytes:
+    return pickle.dumps(message, pickle.HIGHEST_PROTOCOL)
+
+
+class _ClosedClientsMiddleware(MiddlewareBase):
+    update_types = (UpdateAuthorizationState,)
+
+    def __init__(self, on_closed: Callable[[int], Any]) -> None:
+        self._on_closed = on_closed
+
+    async def __call__(
+        self,
+        update: Update,
+        data: dict,
+        next_handler: Callable[[Update, dict], Awaitable[Any]],
+    ) -> Any:
+        result = await next_handler(update, data)
+        if isinstance(update, UpdateAuthorizationState) and isinstance(
+            update.authorization_state, AuthorizationStateClosed
+        ):
+            self._on_closed(data["client_id"])
+        return result
+
+
+def _read_messages(
+    connection: Connection,
+    loop: asyncio.AbstractEventLoop,
+    on_message: Callable[[tuple], Any],
+    on_error: Callable[[Exception], Any],
+    on_closed: Callable[[], Any],
+):
+    # Pipes are drained by a thread, so the other side never blocks on sending.
+    # A message which can't be unpickled (e.g. an exception whose class can't be
+    # imported) is passed to on_error, as its call is unknown
+    while True:
+        try:
+            data = connection.recv_bytes()
+        except (EOFError, OSError):
+            break
+        try:
+            message = pickle.loads(data)
+        except Exception as e:
+            loop.call_soon_threadsafe(on_error, e)
+            continue
+        loop.call_soon_threadsafe(on_message, message)
+    # The loop is already closed when the pipe is closed on shutdown
+    with suppress(RuntimeError):
+        loop.call_soon_threadsafe(on_closed)
+
+
+class _ShardWorker:
+    # Runs in a shard process: a LibraryManager with its own TDLib instance,
+    # receiver thread, decoding and dispatcher, controlled by the parent
+    def __init__(self, connection: Connection, manager: LibraryManager) -> None:
+        self._connection = connection
+        self._manager = manager
+        self._clients: dict = {}
+        self._tasks: set[asyncio.Task] = set()
+        self.stopped = asyncio.Event()
+
+    def on_client_closed(self, client_id: int):
+        if self._clients.pop(client_id, None) is not None:
+            self._send(_CLIENT_CLOSED, client_id, None)
+
+    def _send(self, kind: int, id: int, value: Any):
+        try:
+            data = _dumps((kind, id, value))
+        except Exception as e:
+            data = _dumps((_ERROR, id, RuntimeError(f"Can't pickle {value!r}: {e}")))
+        self._connection.send_bytes(data)
+
+    def on_error(self, exc: Exception):
+        # The caller of the unknown command would wait forever, so the shard stops
+        # and the parent fails all its calls
+        logger.error("Can't read a command of the parent, stopping: %r", exc)
+        self.stopped.set()
+
+    def on_message(self, message: tuple):
+        op, call_id, client_id, args = message
+        if op == _CREATE_CLIENT:
+            client = self._manager.create_client()
+            self._clients[client.id] = client
+            self._send(_RESULT, call_id, client.id)
+        elif op == _STOP:
+            self.stopped.set()
+        else:
+            task = asyncio.create_task(self._call(op, call_id, client_id, args))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _call(self, op: int, call_id: int, client_id: int, args: tuple):
+        try:
+            client = self._clients[client_id]
+            if op == _EXECUTE:
+                result = await client.execute(*args)
+            else:
+                result = await client.execute_many(*args)
+        except Exception as e:
+            self._send(_ERROR, call_id, e)
+        else:
+            self._send(_RESULT, call_id, result)
+
+
+async def _run_shard(
+    connection: Connection,
+    path: str,
+    setup: Setup | None,
+    create_manager: CreateManager,
+    options: dict,
+):
+    loop = asyncio.get_running_loop()
+    manager = create_manager(path, loop=loop, **options)
+    worker = _ShardWorker(connection, manager)
+
+    dispatcher = setup() if setup is not None else Dispatcher()
+    dispatcher.add_middleware(_ClosedClientsMiddleware(worker.on_client_closed))
+    manager.attach_dispatcher(dispatcher)
+    manager.init()
+
+    reader = threading.Thread(
+        target=_read_messages,
+        args=(connection, loop, worker.on_message, worker.on_error, worker.stopped.set),
+        daemon=True,
+    )
+    reader.start()
+    await worker.stopped.wait()
+    await manager.shutdown()
+
+
+def _shard_main(
+    connection: Connection,
+    path: str,
+    setup: Setup | None,
+    create_manager: CreateManager,
+    options: dict,
+):
+    asyncio.run(_run_shard(connection, path, setup, create_manager, options))
+
+
+class _Shard:
+    def __init__(
+        self,
+        index: int,
+        process: Any,
+        connection: Connection,
+        on_client_closed: Callable[[int, int], Any],
+    ) -> None:
+        self.index = index
+        self.process = process
+        self.connection = connection
+        # Clients which are not closed yet
+        self.clients = 0
+        self._on_client_closed = on_client_closed
+        self._calls: dict[int, asyncio.Future] = {}
+        self._call_ids = itertools.count(1)
+        self._stopped = False
+
+    def start_reading(self, loop: asyncio.AbstractEventLoop):
+        threading.Thread(
+            target=_read_messages,
+            args=(
+                self.connection,
+                loop,
+                self._on_message,
+                self._on_error,
+                self._on_stopped,
+            ),
+            name=f"bygram-shard-{self.index}-reader",
+            daemon=True,
+        ).start()
+
+    def call(self, op: int, client_id: int = 0, args: tuple = ()) -> asyncio.Future:
+        if self._stopped:
+            raise RuntimeError(f"Shard {self.index} is stopped")
+        call_id = next(self._call_ids)
+        future = self._calls[call_id] = asyncio.get_running_loop().create_future()
+        self.connection.send_bytes(_dumps((op, call_id, client_id, args)))
+        return future
+
+    def stop(self):
+        if not self._stopped:
+            self.connection.send_bytes(_dumps((_STOP, 0, 0, ())))
+
+    def _on_message(self, message: tuple):
+        kind, id, value = message
+        if kind == _CLIENT_CLOSED:
+            self.clients -= 1
+            self._on_client_closed(self.index, id)
+            return
+
+        future = self._calls.pop(id, None)
+        if future is None or future.done():
+            return
+        if kind == _ERROR:
+            future.set_exception(value)
+        else:
+            future.set_result(value)
+
+    def _on_error(self, exc: Exception):
+        # The result belongs to an unknown call, so none of them can wait for it
+        logger.error("Can't read a message of shard %s: %r", self.index, exc)
+        self._fail_calls(f"Can't read a message of shard {self.index}: {exc!r}")
+
+    def _on_stopped(self):
+        self._stopped = True
+        self._fail_calls(f"Shard {self.index} stopped")
+
+    def _fail_calls(self, message: str):
+        for future in self._calls.values():
+            if not future.done():
+                future.set_exception(RuntimeError(message))
+        self._calls.clear()
+
+
+class ShardClient:
+    # Proxy of a client which lives in a shard process
+    def __init__(self, client_id: int, shard: _Shard, local_id: int) -> None:
+        self.id = client_id
+        self.shard = shard.index
+        self._shard = shard
+        self._local_id = local_id
+        self.closed = False
+
+    def _check_not_closed(self):
+        if self.closed:
+            raise RuntimeError("Current client already shutdowned")
+
+    async def execute(self, function: Function[T], timeout: float = 30) -> T:
+        self._check_not_closed()
+        return await self._shard.call(_EXECUTE, self._local_id, (function, timeout))
+
+    async def execute_many(
+        self, functions: Iterable[Function], timeout: float = 30
+    ) -> list[Any]:
+        # The whole batch is a single round trip to the shard
+        self._check_not_closed()
+        return await self._shard.call(
+            _EXECUTE_MANY, self._local_id, (list(functions), timeout)
+        )
+
+
+class ShardedLibraryManager:
+    # Spawns shards processes, each with its own LibraryManager (TDLib instance,
+    # receiver thread, decoding, dispatcher and handlers), and places every new
+    # client on the shard with the fewest open clients. Updates are handled in the
+    # shards by dispatchers built by setup, so handlers get the client of their
+    # shard. The parent only proxies execute calls of ShardClient over a pipe:
+    # it has no dispatcher, and iter_* helpers, open_file, downloads and cache of
+    # the clients are available only to the handlers in the shards.
+    # options are passed to create_library_manager, setup and options must be
+    # picklable
+    def __init__(
+        self,
+        path: str,
+        shards: int,
+        setup: Setup | None = None,
+        create_manager: CreateManager = create_library_manager,
+        **options: Any,
+    ) -> None:
+        if shards < 1:
+            raise ValueError("shards must be positive")
+
+        self._path = path
+        self._shards_count = shards
+        self._setup = setup
+        self._create_manager = create_manager
+        self._options = options
+        self._shards: list[_Shard] = []
+        self._clients: dict[int, ShardClient] = {}
+
+    @property
+    def shards(self) -> int:
+        return self._shards_count
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.shutdown()
+
+    def start(self):
+        if self._shards:
+            return
+
+        loop = asyncio.get_running_loop()
+        context = multiprocessing.get_context("spawn")
+        for index in range(self._shards_count):
+            connection, child_connection = context.Pipe()
+            process = context.Process(
+                target=_shard_main,
+                args=(
+                    child_connection,
+                    self._path,
+                    self._setup,
+                    self._create_manager,
+                    self._options,
+                ),
+                name=f"bygram-shard-{index}",
+                daemon=True,
+            )
+            process.start()
+            child_connection.close()
+            shard = _Shard(index, process, connection, self._on_client_closed)
+            shard.start_reading(loop)
+            self._shards.append(shard)
+
+    async def create_client(self) -> ShardClient:
+        self.start()
+        shard = min(self._shards, key=lambda s: s.clients)
+        shard.clients += 1
+        try:
+            local_id = await shard.call(_CREATE_CLIENT)
+        except BaseException:
+            shard.clients -= 1
+            raise
+        client_id = to_global_client_id(local_id, shard.index, self.shards)
+        client = self._clients[client_id] = ShardClient(client_id, shard, local_id)
+        return client
+
+    def get_client_by_id(self, client_id: int) -> ShardClient:
+        return self._clients[client_id]
+
+    def _on_client_closed(self, shard: int, local_id: int):
+        client_id = to_global_client_id(local_id, shard, self.shards)
+        client = self._clients.pop(client_id, None)
+        if client is not None:
+            client.closed = True
+
+    async def shutdown(self):
+        # Every shard closes its clients and stops
+        shards, self._shards = self._shards, []
+        for shard in shards:
+            shard.stop()
+        for shard in shards:
+            await asyncio.to_thread(shard.process.join, _STOP_TIMEOUT)
+            if shard.process.is_alive():
+                logger.error("Shard %s didn't stop in time", shard.index)
+                shard.process.terminate()
+            shard.connection.close()
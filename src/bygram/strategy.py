@@ -1,10 +1,134 @@
 import asyncio
+import logging
+from collections import deque
 from contextlib import suppress
+from typing import Any, Awaitable, Callable, Hashable
 
 from bygram.core.listener import EventListener
 from bygram.core.types import DeserializedObject
 from bygram.executor import Executor
 from bygram.routing.dispatcher import Dispatcher
+from bygram.routing.filters import get_update_chat_id
+from bygram.types.base import Update
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of scheduled updates per allowed concurrent update
+PENDING_UPDATES_FACTOR = 100
+
+
+class SequentialUpdates:
+    # Runs updates one by one in the order of receiving, in a task, so responses
+    # are resolved while a handler runs. Updates are buffered while handlers are
+    # slower than TDLib
+    def __init__(self, feed_update: Callable[[Update, int], Awaitable[Any]]) -> None:
+        self._feed_update = feed_update
+        self._updates: deque[tuple[Update, int]] = deque()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._updates)
+
+    def schedule(self, update: Update, client_id: int):
+        self._updates.append((update, client_id))
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        try:
+            while self._updates:
+                update, client_id = self._updates[0]
+                try:
+                    await self._feed_update(update, client_id)
+                except Exception:
+                    logger.exception("Error while processing update %s", update)
+                finally:
+                    self._updates.popleft()
+        finally:
+            self._task = None
+
+    async def shutdown(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._updates.clear()
+
+
+class UpdatesScheduler:
+    # Runs updates concurrently, while updates with the same (client_id, chat_id)
+    # key are processed one by one in the order of receiving. Over max_pending
+    # updates are buffered in order and scheduled as earlier ones finish, so only
+    # updates are held back and responses keep being read
+    def __init__(
+        self,
+        feed_update: Callable[[Update, int], Awaitable[Any]],
+        max_concurrent: int,
+        max_pending: int | None = None,
+    ) -> None:
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be positive")
+
+        self._feed_update = feed_update
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._max_pending = max_pending or max_concurrent * PENDING_UPDATES_FACTOR
+        self._pending = 0
+        self._buffer: deque[tuple[Update, int]] = deque()
+        self._chains: dict[Hashable, deque[Update]] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def pending(self) -> int:
+        # Scheduled and buffered updates
+        return self._pending + len(self._buffer)
+
+    def schedule(self, update: Update, client_id: int):
+        if self._buffer or self._pending >= self._max_pending:
+            self._buffer.append((update, client_id))
+        else:
+            self._start(update, client_id)
+
+    def _start(self, update: Update, client_id: int):
+        self._pending += 1
+        key = (client_id, get_update_chat_id(update))
+        chain = self._chains.get(key)
+        if chain is not None:
+            chain.append(update)
+            return
+
+        self._chains[key] = deque([update])
+        task = asyncio.create_task(self._run_chain(key, client_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_chain(self, key: Hashable, client_id: int):
+        chain = self._chains[key]
+        try:
+            while chain:
+                try:
+                    async with self._semaphore:
+                        await self._feed_update(chain[0], client_id)
+                except Exception:
+                    logger.exception("Error while processing update %s", chain[0])
+                finally:
+                    chain.popleft()
+                    self._release_pending(1)
+        finally:
+            del self._chains[key]
+            # Updates left after cancellation are dropped
+            if chain:
+                self._release_pending(len(chain))
+
+    def _release_pending(self, count: int):
+        self._pending -= count
+        while self._buffer and self._pending < self._max_pending:
+            self._start(*self._buffer.popleft())
+
+    async def shutdown(self):
+        self._buffer.clear()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
 
 
 class EventsLoop:
@@ -13,6 +137,7 @@ class EventsLoop:
         listener: EventListener,
         executor: Executor,
         dispatcher: Dispatcher | None = None,
+        max_concurrent_updates: int | None = None,
     ) -> None:
         self.listener = listener
         self.executor = executor
@@ -20,6 +145,16 @@ class EventsLoop:
 
         self._initalized = False
         self._events_task: asyncio.Task | None = None
+        # Updates are handled in tasks, so responses are resolved as soon as they
+        # are read, even when handlers wait for them. Updates received before a
+        # response may still be queued when execute() returns
+        self._scheduler: UpdatesScheduler | SequentialUpdates
+        if max_concurrent_updates is not None:
+            self._scheduler = UpdatesScheduler(
+                self._feed_update, max_concurrent_updates
+            )
+        else:
+            self._scheduler = SequentialUpdates(self._feed_update)
 
     def attach_dispatcher(self, dp: Dispatcher):
         if self.dispatcher:
@@ -41,12 +176,16 @@ class EventsLoop:
     async def _wait_event(self) -> DeserializedObject:
         return await self.listener.wait_for_event()
 
+    async def _feed_update(self, update: Update, client_id: int):
+        assert self.dispatcher
+        await self.dispatcher.feed_update(update, client_id)
+
     async def _resend_event(self, event: DeserializedObject):
         if event.extra is not None:
             await self.executor.process_response(event.obj, event.extra)
         elif self.dispatcher:
             assert event.client_id
-            await self.dispatcher.feed_update(event.obj, event.client_id)
+            self._scheduler.schedule(event.obj, event.client_id)
 
     async def _event_cycle(self):
         event = await self._wait_event()
@@ -67,3 +206,5 @@ class EventsLoop:
 
         with suppress(asyncio.CancelledError):
             await self._events_task
+
+        await self._scheduler.shutdown()
@@ -1,2 +1,14 @@
+from . import raw
 from .base import *
-from .raw import *
+
+# Star imports bring the generated types too, which imports all their modules
+__all__ = ["raw", "T", "TlObject", "ObjectBase", "Update", "Function"]
+__all__ += raw.__all__
+
+
+def __getattr__(name: str):
+    # Generated types are imported lazily, see bygram.types.raw
+    try:
+        return getattr(raw, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
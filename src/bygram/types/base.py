@@ -1,24 +1,87 @@
-from dataclasses import dataclass
-from typing import Generic, TypeVar
+import base64
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 T = TypeVar("T")
 
 
-@dataclass
+def _bytes_to_json(value: bytes | None) -> str | None:
+    if value is None:
+        return None
+    return base64.b64encode(value).decode()
+
+
+def _list_to_json(value: list | None) -> list | None:
+    if value is None:
+        return None
+    return [_value_to_json(i) for i in value]
+
+
+def _value_to_json(value: Any) -> Any:
+    if isinstance(value, ObjectBase):
+        return value._to_json_dict()
+    if isinstance(value, (list, tuple)):
+        return [_value_to_json(i) for i in value]
+    if isinstance(value, bytes):
+        return _bytes_to_json(value)
+    if isinstance(value, dict):
+        return {k: _value_to_json(v) for k, v in value.items()}
+    return value
+
+
+@dataclass(slots=True)
 class TlObject:
     pass
 
 
 @dataclass
 class ObjectBase(TlObject):
-    pass
+    # Lazily decoded objects keep an object with load() method in _lazy, which
+    # sets all fields on the first access to any of them. This relies on slots:
+    # unset fields raise AttributeError and get here
+    __slots__ = ("_lazy",)
 
+    if not TYPE_CHECKING:
+        # Hidden from type checkers, so unknown attributes are still reported
+        def __getattr__(self, name: str) -> Any:
+            if name != "_lazy":
+                try:
+                    lazy = object.__getattribute__(self, "_lazy")
+                except AttributeError:
+                    pass
+                else:
+                    # Cleared first, so a failed load isn't retried on every access
+                    del self._lazy
+                    try:
+                        lazy.load(self)
+                    except Exception as e:
+                        raise AttributeError(
+                            f"Can't load {type(self).__name__!r} object: {e}",
+                            name=name,
+                            obj=self,
+                        ) from e
+                    return object.__getattribute__(self, name)
 
-@dataclass
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}",
+                name=name,
+                obj=self,
+            )
+
+    def _to_json_dict(self) -> dict:
+        # Generated types override it with a specialized version
+        result = {}
+        for f in fields(self):
+            key = "@type" if f.name == "_type" else f.name
+            result[key] = _value_to_json(getattr(self, f.name))
+        return result
+
+
+@dataclass(slots=True)
 class Update(ObjectBase):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Function(ObjectBase, Generic[T]):
     pass
@@ -0,0 +1,5823 @@
+"""
+Generated TDLib types.
+
+Types are split into submodules which are imported on first access to any of their classes
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .classes_00 import AuthenticationCodeInfo, AuthenticationCodeType, AuthenticationCodeTypeCall, AuthenticationCodeTypeFirebaseAndroid, AuthenticationCodeTypeFirebaseIos, AuthenticationCodeTypeFlashCall, AuthenticationCodeTypeFragment, AuthenticationCodeTypeMissedCall, AuthenticationCodeTypeSms, AuthenticationCodeTypeSmsPhrase, AuthenticationCodeTypeSmsWord, AuthenticationCodeTypeTelegramMessage, AuthorizationState, AuthorizationStateClosed, AuthorizationStateClosing, AuthorizationStateLoggingOut, AuthorizationStateReady, AuthorizationStateWaitCode, AuthorizationStateWaitEmailAddress, AuthorizationStateWaitEmailCode, AuthorizationStateWaitOtherDeviceConfirmation, AuthorizationStateWaitPassword, AuthorizationStateWaitPhoneNumber, AuthorizationStateWaitPremiumPurchase, AuthorizationStateWaitRegistration, AuthorizationStateWaitTdlibParameters, EmailAddressAuthentication, EmailAddressAuthenticationAppleId, EmailAddressAuthenticationCode, EmailAddressAuthenticationCodeInfo, EmailAddressAuthenticationGoogleId, EmailAddressResetState, EmailAddressResetStateAvailable, EmailAddressResetStatePending, Error, File, FirebaseDeviceVerificationParameters, FirebaseDeviceVerificationParametersPlayIntegrity, FirebaseDeviceVerificationParametersSafetyNet, FormattedText, InputFile, InputFileGenerated, InputFileId, InputFileLocal, InputFileRemote, LocalFile, Minithumbnail, Ok, PasswordState, PhotoSize, RecoveryEmailAddress, RemoteFile, TemporaryPasswordState, TermsOfService, TextEntities, TextEntity, ThumbnailFormat, ThumbnailFormatGif, ThumbnailFormatJpeg, ThumbnailFormatMpeg4, ThumbnailFormatPng, ThumbnailFormatTgs, ThumbnailFormatWebm, ThumbnailFormatWebp
+    from .classes_01 import AlternativeVideo, AnimatedEmoji, Animation, Audio, Background, Backgrounds, Birthdate, BotCommand, BotCommands, BotMenuButton, BotVerification, BotVerificationParameters, ChatBackground, ChatLocation, ChatPhotoInfo, Checklist, ChecklistTask, ClosedVectorPath, Contact, Document, Game, InputChecklist, InputChecklistTask, Location, MaskPoint, MaskPointChin, MaskPointEyes, MaskPointForehead, MaskPointMouth, MaskPosition, Outline, Photo, Poll, PollOption, PollType, PollTypeQuiz, PollTypeRegular, ProfilePhoto, Sticker, StickerFormat, StickerFormatTgs, StickerFormatWebm, StickerFormatWebp, StickerFullType, StickerFullTypeCustomEmoji, StickerFullTypeMask, StickerFullTypeRegular, StickerType, StickerTypeCustomEmoji, StickerTypeMask, StickerTypeRegular, Thumbnail, UserType, UserTypeBot, UserTypeDeleted, UserTypeRegular, UserTypeUnknown, Venue, VerificationStatus, Video, VideoNote, VideoStoryboard, VoiceNote, WebApp
+    from .classes_02 import AffiliateInfo, AffiliateProgramInfo, AffiliateProgramParameters, AffiliateProgramSortOrder, AffiliateProgramSortOrderCreationDate, AffiliateProgramSortOrderProfitability, AffiliateProgramSortOrderRevenue, AffiliateType, AffiliateTypeBot, AffiliateTypeChannel, AffiliateTypeCurrentUser, AnimatedChatPhoto, BusinessAwayMessageSchedule, BusinessAwayMessageScheduleAlways, BusinessAwayMessageScheduleCustom, BusinessAwayMessageScheduleOutsideOfOpeningHours, BusinessAwayMessageSettings, BusinessBotRights, BusinessChatLink, BusinessChatLinkInfo, BusinessChatLinks, BusinessConnectedBot, BusinessGreetingMessageSettings, BusinessInfo, BusinessLocation, BusinessOpeningHours, BusinessOpeningHoursInterval, BusinessRecipients, BusinessStartPage, ChatAdministratorRights, ChatPermissions, ChatPhoto, ChatPhotoSticker, ChatPhotoStickerType, ChatPhotoStickerTypeCustomEmoji, ChatPhotoStickerTypeRegularOrMask, ChatPhotos, CloseBirthdayUser, InputBusinessChatLink, InputBusinessStartPage, InputChatPhoto, InputChatPhotoAnimation, InputChatPhotoPrevious, InputChatPhotoStatic, InputChatPhotoSticker, InputSuggestedPostInfo, StarAmount, StarSubscription, StarSubscriptionPricing, StarSubscriptionType, StarSubscriptionTypeBot, StarSubscriptionTypeChannel, StarSubscriptions, SuggestedPostInfo, SuggestedPostPrice, SuggestedPostPriceStar, SuggestedPostPriceTon, SuggestedPostRefundReason, SuggestedPostRefundReasonPaymentRefunded, SuggestedPostRefundReasonPostDeleted, SuggestedPostState, SuggestedPostStateApproved, SuggestedPostStateDeclined, SuggestedPostStatePending
+    from .classes_03 import AcceptedGiftTypes, AvailableGift, AvailableGifts, ConnectedAffiliateProgram, ConnectedAffiliatePrograms, FoundAffiliateProgram, FoundAffiliatePrograms, Gift, GiftForResale, GiftForResaleOrder, GiftForResaleOrderNumber, GiftForResaleOrderPrice, GiftForResaleOrderPriceChangeDate, GiftSettings, GiftUpgradePreview, GiftsForResale, PremiumGiftCodeInfo, PremiumGiftPaymentOption, PremiumGiftPaymentOptions, PremiumGiveawayPaymentOption, PremiumGiveawayPaymentOptions, PremiumPaymentOption, PremiumStatePaymentOption, ProductInfo, ReceivedGift, ReceivedGifts, SentGift, SentGiftRegular, SentGiftUpgraded, StarGiveawayPaymentOption, StarGiveawayPaymentOptions, StarGiveawayWinnerOption, StarPaymentOption, StarPaymentOptions, StarTransactionType, StarTransactionTypeAffiliateProgramCommission, StarTransactionTypeAppStoreDeposit, StarTransactionTypeBotInvoicePurchase, StarTransactionTypeBotInvoiceSale, StarTransactionTypeBotPaidMediaPurchase, StarTransactionTypeBotPaidMediaSale, StarTransactionTypeBotSubscriptionPurchase, StarTransactionTypeBotSubscriptionSale, StarTransactionTypeBusinessBotTransferReceive, StarTransactionTypeBusinessBotTransferSend, StarTransactionTypeChannelPaidMediaPurchase, StarTransactionTypeChannelPaidMediaSale, StarTransactionTypeChannelPaidReactionReceive, StarTransactionTypeChannelPaidReactionSend, StarTransactionTypeChannelSubscriptionPurchase, StarTransactionTypeChannelSubscriptionSale, StarTransactionTypeFragmentDeposit, StarTransactionTypeFragmentWithdrawal, StarTransactionTypeGiftPurchase, StarTransactionTypeGiftSale, StarTransactionTypeGiftTransfer, StarTransactionTypeGiftUpgrade, StarTransactionTypeGiveawayDeposit, StarTransactionTypeGooglePlayDeposit, StarTransactionTypePaidMessageReceive, StarTransactionTypePaidMessageSend, StarTransactionTypePremiumBotDeposit, StarTransactionTypePremiumPurchase, StarTransactionTypeSuggestedPostPaymentReceive, StarTransactionTypeSuggestedPostPaymentSend, StarTransactionTypeTelegramAdsWithdrawal, StarTransactionTypeTelegramApiUsage, StarTransactionTypeUnsupported, StarTransactionTypeUpgradedGiftPurchase, StarTransactionTypeUpgradedGiftSale, StarTransactionTypeUserDeposit, TransactionDirection, TransactionDirectionIncoming, TransactionDirectionOutgoing, UpgradeGiftResult, UpgradedGift, UpgradedGiftAttributeId, UpgradedGiftAttributeIdBackdrop, UpgradedGiftAttributeIdModel, UpgradedGiftAttributeIdSymbol, UpgradedGiftBackdrop, UpgradedGiftBackdropColors, UpgradedGiftBackdropCount, UpgradedGiftModel, UpgradedGiftModelCount, UpgradedGiftOrigin, UpgradedGiftOriginResale, UpgradedGiftOriginTransfer, UpgradedGiftOriginUpgrade, UpgradedGiftOriginalDetails, UpgradedGiftSymbol, UpgradedGiftSymbolCount
+    from .classes_04 import AccentColor, BotInfo, ChatAdministrator, ChatAdministrators, ChatInviteLink, ChatMember, ChatMemberStatus, ChatMemberStatusAdministrator, ChatMemberStatusBanned, ChatMemberStatusCreator, ChatMemberStatusLeft, ChatMemberStatusMember, ChatMemberStatusRestricted, ChatMembers, ChatMembersFilter, ChatMembersFilterAdministrators, ChatMembersFilterBanned, ChatMembersFilterBots, ChatMembersFilterContacts, ChatMembersFilterMembers, ChatMembersFilterMention, ChatMembersFilterRestricted, EmojiStatus, EmojiStatusCustomEmojis, EmojiStatusType, EmojiStatusTypeCustomEmoji, EmojiStatusTypeUpgradedGift, EmojiStatuses, FoundUsers, GiveawayInfo, GiveawayInfoCompleted, GiveawayInfoOngoing, GiveawayParticipantStatus, GiveawayParticipantStatusAdministrator, GiveawayParticipantStatusAlreadyWasMember, GiveawayParticipantStatusDisallowedCountry, GiveawayParticipantStatusEligible, GiveawayParticipantStatusParticipating, GiveawayPrize, GiveawayPrizePremium, GiveawayPrizeStars, ProfileAccentColor, ProfileAccentColors, StarTransaction, StarTransactions, SupergroupMembersFilter, SupergroupMembersFilterAdministrators, SupergroupMembersFilterBanned, SupergroupMembersFilterBots, SupergroupMembersFilterContacts, SupergroupMembersFilterMention, SupergroupMembersFilterRecent, SupergroupMembersFilterRestricted, SupergroupMembersFilterSearch, TonTransaction, TonTransactionType, TonTransactionTypeFragmentDeposit, TonTransactionTypeSuggestedPostPayment, TonTransactionTypeUnsupported, TonTransactions, User, UserFullInfo, Usernames, Users
+    from .classes_05 import BasicGroup, BasicGroupFullInfo, ChatInviteLinkCount, ChatInviteLinkCounts, ChatInviteLinkInfo, ChatInviteLinkMember, ChatInviteLinkMembers, ChatInviteLinkSubscriptionInfo, ChatInviteLinks, ChatJoinRequest, ChatJoinRequests, ChatJoinRequestsInfo, ChatMessageSender, ChatMessageSenders, ForwardSource, InviteLinkChatType, InviteLinkChatTypeBasicGroup, InviteLinkChatTypeChannel, InviteLinkChatTypeSupergroup, MessageEffectType, MessageEffectTypeEmojiReaction, MessageEffectTypePremiumSticker, MessageForwardInfo, MessageImportInfo, MessageInteractionInfo, MessageOrigin, MessageOriginChannel, MessageOriginChat, MessageOriginHiddenUser, MessageOriginUser, MessageReaction, MessageReactions, MessageReadDate, MessageReadDateMyPrivacyRestricted, MessageReadDateRead, MessageReadDateTooOld, MessageReadDateUnread, MessageReadDateUserPrivacyRestricted, MessageReplyInfo, MessageSender, MessageSenderChat, MessageSenderUser, MessageSenders, MessageTopic, MessageTopicDirectMessages, MessageTopicForum, MessageTopicSavedMessages, MessageViewer, MessageViewers, PaidReactionType, PaidReactionTypeAnonymous, PaidReactionTypeChat, PaidReactionTypeRegular, PaidReactor, ReactionType, ReactionTypeCustomEmoji, ReactionTypeEmoji, ReactionTypePaid, SecretChat, SecretChatState, SecretChatStateClosed, SecretChatStatePending, SecretChatStateReady, Supergroup, SupergroupFullInfo, UnreadReaction
+    from .classes_06 import AdvertisementSponsor, BusinessMessage, BusinessMessages, ChatNotificationSettings, DownloadedFileCounts, FactCheck, FileDownload, FoundChatMessages, FoundFileDownloads, FoundMessages, InputMessageReplyTo, InputMessageReplyToExternalMessage, InputMessageReplyToMessage, InputMessageReplyToStory, InputTextQuote, Message, MessageCalendar, MessageCalendarDay, MessageEffect, MessagePosition, MessagePositions, MessageReplyTo, MessageReplyToMessage, MessageReplyToStory, MessageSendingState, MessageSendingStateFailed, MessageSendingStatePending, MessageSource, MessageSourceChatEventLog, MessageSourceChatHistory, MessageSourceChatList, MessageSourceDirectMessagesChatTopicHistory, MessageSourceForumTopicHistory, MessageSourceHistoryPreview, MessageSourceMessageThreadHistory, MessageSourceNotification, MessageSourceOther, MessageSourceScreenshot, MessageSourceSearch, Messages, NotificationSettingsScope, NotificationSettingsScopeChannelChats, NotificationSettingsScopeGroupChats, NotificationSettingsScopePrivateChats, ReactionNotificationSettings, ReactionNotificationSource, ReactionNotificationSourceAll, ReactionNotificationSourceContacts, ReactionNotificationSourceNone, ReportOption, ReportSponsoredResult, ReportSponsoredResultAdsHidden, ReportSponsoredResultFailed, ReportSponsoredResultOk, ReportSponsoredResultOptionRequired, ReportSponsoredResultPremiumRequired, ScopeNotificationSettings, SponsoredChat, SponsoredChats, SponsoredMessage, SponsoredMessages, TextQuote, VideoMessageAdvertisement, VideoMessageAdvertisements
+    from .classes_07 import AccountInfo, ArchiveChatListSettings, BusinessBotManageBar, Chat, ChatActionBar, ChatActionBarAddContact, ChatActionBarInviteMembers, ChatActionBarJoinRequest, ChatActionBarReportAddBlock, ChatActionBarReportSpam, ChatActionBarSharePhoneNumber, ChatAvailableReactions, ChatAvailableReactionsAll, ChatAvailableReactionsSome, ChatFolder, ChatFolderIcon, ChatFolderInfo, ChatFolderInviteLink, ChatFolderInviteLinkInfo, ChatFolderInviteLinks, ChatFolderName, ChatList, ChatListArchive, ChatListFolder, ChatListMain, ChatLists, ChatPosition, ChatSource, ChatSourceMtprotoProxy, ChatSourcePublicServiceAnnouncement, ChatType, ChatTypeBasicGroup, ChatTypePrivate, ChatTypeSecret, ChatTypeSupergroup, Chats, CreatedBasicGroupChat, DraftMessage, FailedToAddMember, FailedToAddMembers, InlineKeyboardButtonType, InlineKeyboardButtonTypeBuy, InlineKeyboardButtonTypeCallback, InlineKeyboardButtonTypeCallbackGame, InlineKeyboardButtonTypeCallbackWithPassword, InlineKeyboardButtonTypeCopyText, InlineKeyboardButtonTypeLoginUrl, InlineKeyboardButtonTypeSwitchInline, InlineKeyboardButtonTypeUrl, InlineKeyboardButtonTypeUser, InlineKeyboardButtonTypeWebApp, KeyboardButton, KeyboardButtonType, KeyboardButtonTypeRequestChat, KeyboardButtonTypeRequestLocation, KeyboardButtonTypeRequestPhoneNumber, KeyboardButtonTypeRequestPoll, KeyboardButtonTypeRequestUsers, KeyboardButtonTypeText, KeyboardButtonTypeWebApp, PublicChatType, PublicChatTypeHasUsername, PublicChatTypeIsLocationBased, RecommendedChatFolder, RecommendedChatFolders, SavedMessagesTag, SavedMessagesTags, VideoChat
+    from .classes_08 import DirectMessagesChatTopic, ForumTopic, ForumTopicIcon, ForumTopicInfo, ForumTopics, FoundWebApp, InlineKeyboardButton, LinkPreviewOptions, LoginUrlInfo, LoginUrlInfoOpen, LoginUrlInfoRequestConfirmation, MainWebApp, MessageThreadInfo, PageBlock, PageBlockAnchor, PageBlockAnimation, PageBlockAudio, PageBlockAuthorDate, PageBlockBlockQuote, PageBlockCaption, PageBlockChatLink, PageBlockCollage, PageBlockCover, PageBlockDetails, PageBlockDivider, PageBlockEmbedded, PageBlockEmbeddedPost, PageBlockFooter, PageBlockHeader, PageBlockHorizontalAlignment, PageBlockHorizontalAlignmentCenter, PageBlockHorizontalAlignmentLeft, PageBlockHorizontalAlignmentRight, PageBlockKicker, PageBlockList, PageBlockListItem, PageBlockMap, PageBlockParagraph, PageBlockPhoto, PageBlockPreformatted, PageBlockPullQuote, PageBlockRelatedArticle, PageBlockRelatedArticles, PageBlockSlideshow, PageBlockSubheader, PageBlockSubtitle, PageBlockTable, PageBlockTableCell, PageBlockTitle, PageBlockVerticalAlignment, PageBlockVerticalAlignmentBottom, PageBlockVerticalAlignmentMiddle, PageBlockVerticalAlignmentTop, PageBlockVideo, PageBlockVoiceNote, ReplyMarkup, ReplyMarkupForceReply, ReplyMarkupInlineKeyboard, ReplyMarkupRemoveKeyboard, ReplyMarkupShowKeyboard, RichText, RichTextAnchor, RichTextAnchorLink, RichTextBold, RichTextEmailAddress, RichTextFixed, RichTextIcon, RichTextItalic, RichTextMarked, RichTextPhoneNumber, RichTextPlain, RichTextReference, RichTextStrikethrough, RichTextSubscript, RichTextSuperscript, RichTextUnderline, RichTextUrl, RichTexts, SavedMessagesTopic, SavedMessagesTopicType, SavedMessagesTopicTypeAuthorHidden, SavedMessagesTopicTypeMyNotes, SavedMessagesTopicTypeSavedFromChat, SharedChat, SharedUser, ThemeParameters, ThemeSettings, WebAppInfo, WebAppOpenMode, WebAppOpenModeCompact, WebAppOpenModeFullScreen, WebAppOpenModeFullSize, WebAppOpenParameters
+    from .classes_09 import Address, BankCardActionOpenUrl, BankCardInfo, CollectibleItemInfo, CollectibleItemType, CollectibleItemTypePhoneNumber, CollectibleItemTypeUsername, Countries, CountryInfo, InputCredentials, InputCredentialsApplePay, InputCredentialsGooglePay, InputCredentialsNew, InputCredentialsSaved, Invoice, LabeledPricePart, LinkPreview, LinkPreviewAlbumMedia, LinkPreviewAlbumMediaPhoto, LinkPreviewAlbumMediaVideo, LinkPreviewType, LinkPreviewTypeAlbum, LinkPreviewTypeAnimation, LinkPreviewTypeApp, LinkPreviewTypeArticle, LinkPreviewTypeAudio, LinkPreviewTypeBackground, LinkPreviewTypeChannelBoost, LinkPreviewTypeChat, LinkPreviewTypeDocument, LinkPreviewTypeEmbeddedAnimationPlayer, LinkPreviewTypeEmbeddedAudioPlayer, LinkPreviewTypeEmbeddedVideoPlayer, LinkPreviewTypeExternalAudio, LinkPreviewTypeExternalVideo, LinkPreviewTypeGroupCall, LinkPreviewTypeInvoice, LinkPreviewTypeMessage, LinkPreviewTypePhoto, LinkPreviewTypePremiumGiftCode, LinkPreviewTypeShareableChatFolder, LinkPreviewTypeSticker, LinkPreviewTypeStickerSet, LinkPreviewTypeStory, LinkPreviewTypeSupergroupBoost, LinkPreviewTypeTheme, LinkPreviewTypeUnsupported, LinkPreviewTypeUpgradedGift, LinkPreviewTypeUser, LinkPreviewTypeVideo, LinkPreviewTypeVideoChat, LinkPreviewTypeVideoNote, LinkPreviewTypeVoiceNote, LinkPreviewTypeWebApp, LocationAddress, OrderInfo, PaymentProvider, PaymentProviderOther, PaymentProviderSmartGlocal, PaymentProviderStripe, PhoneNumberInfo, SavedCredentials, ShippingOption, WebPageInstantView
+    from .classes_10 import Date, DatedFile, GiveawayParameters, IdentityDocument, InputIdentityDocument, InputInvoice, InputInvoiceMessage, InputInvoiceName, InputInvoiceTelegram, InputPassportElement, InputPassportElementAddress, InputPassportElementBankStatement, InputPassportElementDriverLicense, InputPassportElementEmailAddress, InputPassportElementIdentityCard, InputPassportElementInternalPassport, InputPassportElementPassport, InputPassportElementPassportRegistration, InputPassportElementPersonalDetails, InputPassportElementPhoneNumber, InputPassportElementRentalAgreement, InputPassportElementTemporaryRegistration, InputPassportElementUtilityBill, InputPersonalDocument, PaidMedia, PaidMediaPhoto, PaidMediaPreview, PaidMediaUnsupported, PaidMediaVideo, PassportElement, PassportElementAddress, PassportElementBankStatement, PassportElementDriverLicense, PassportElementEmailAddress, PassportElementIdentityCard, PassportElementInternalPassport, PassportElementPassport, PassportElementPassportRegistration, PassportElementPersonalDetails, PassportElementPhoneNumber, PassportElementRentalAgreement, PassportElementTemporaryRegistration, PassportElementType, PassportElementTypeAddress, PassportElementTypeBankStatement, PassportElementTypeDriverLicense, PassportElementTypeEmailAddress, PassportElementTypeIdentityCard, PassportElementTypeInternalPassport, PassportElementTypePassport, PassportElementTypePassportRegistration, PassportElementTypePersonalDetails, PassportElementTypePhoneNumber, PassportElementTypeRentalAgreement, PassportElementTypeTemporaryRegistration, PassportElementTypeUtilityBill, PassportElementUtilityBill, PaymentForm, PaymentFormType, PaymentFormTypeRegular, PaymentFormTypeStarSubscription, PaymentFormTypeStars, PaymentOption, PaymentReceipt, PaymentReceiptType, PaymentReceiptTypeRegular, PaymentReceiptTypeStars, PaymentResult, PersonalDetails, PersonalDocument, ValidatedOrderInfo
+    from .classes_11 import EncryptedCredentials, EncryptedPassportElement, InputPassportElementError, InputPassportElementErrorSource, InputPassportElementErrorSourceDataField, InputPassportElementErrorSourceFile, InputPassportElementErrorSourceFiles, InputPassportElementErrorSourceFrontSide, InputPassportElementErrorSourceReverseSide, InputPassportElementErrorSourceSelfie, InputPassportElementErrorSourceTranslationFile, InputPassportElementErrorSourceTranslationFiles, InputPassportElementErrorSourceUnspecified, MessageAnimatedEmoji, MessageAnimation, MessageAudio, MessageBasicGroupChatCreate, MessageBotWriteAccessAllowed, MessageCall, MessageChatAddMembers, MessageChatBoost, MessageChatChangePhoto, MessageChatChangeTitle, MessageChatDeleteMember, MessageChatDeletePhoto, MessageChatJoinByLink, MessageChatJoinByRequest, MessageChatSetBackground, MessageChatSetMessageAutoDeleteTime, MessageChatSetTheme, MessageChatShared, MessageChatUpgradeFrom, MessageChatUpgradeTo, MessageChecklist, MessageChecklistTasksAdded, MessageChecklistTasksDone, MessageContact, MessageContactRegistered, MessageContent, MessageCustomServiceAction, MessageDice, MessageDirectMessagePriceChanged, MessageDocument, MessageExpiredPhoto, MessageExpiredVideo, MessageExpiredVideoNote, MessageExpiredVoiceNote, MessageForumTopicCreated, MessageForumTopicEdited, MessageForumTopicIsClosedToggled, MessageForumTopicIsHiddenToggled, MessageGame, MessageGameScore, MessageGift, MessageGiftedPremium, MessageGiftedStars, MessageGiftedTon, MessageGiveaway, MessageGiveawayCompleted, MessageGiveawayCreated, MessageGiveawayPrizeStars, MessageGiveawayWinners, MessageGroupCall, MessageInviteVideoChatParticipants, MessageInvoice, MessageLocation, MessagePaidMedia, MessagePaidMessagePriceChanged, MessagePaidMessagesRefunded, MessagePassportDataReceived, MessagePassportDataSent, MessagePaymentRefunded, MessagePaymentSuccessful, MessagePaymentSuccessfulBot, MessagePhoto, MessagePinMessage, MessagePoll, MessagePremiumGiftCode, MessageProximityAlertTriggered, MessageRefundedUpgradedGift, MessageScreenshotTaken, MessageSticker, MessageStory, MessageSuggestProfilePhoto, MessageSuggestedPostApprovalFailed, MessageSuggestedPostApproved, MessageSuggestedPostDeclined, MessageSuggestedPostPaid, MessageSuggestedPostRefunded, MessageSupergroupChatCreate, MessageText, MessageUnsupported, MessageUpgradedGift, MessageUsersShared, MessageVenue, MessageVideo, MessageVideoChatEnded, MessageVideoChatScheduled, MessageVideoChatStarted, MessageVideoNote, MessageVoiceNote, MessageWebAppDataReceived, MessageWebAppDataSent, PassportAuthorizationForm, PassportElementError, PassportElementErrorSource, PassportElementErrorSourceDataField, PassportElementErrorSourceFile, PassportElementErrorSourceFiles, PassportElementErrorSourceFrontSide, PassportElementErrorSourceReverseSide, PassportElementErrorSourceSelfie, PassportElementErrorSourceTranslationFile, PassportElementErrorSourceTranslationFiles, PassportElementErrorSourceUnspecified, PassportElements, PassportElementsWithErrors, PassportRequiredElement, PassportSuitableElement
+    from .classes_12 import InputMessageAnimation, InputMessageAudio, InputMessageChecklist, InputMessageContact, InputMessageContent, InputMessageDice, InputMessageDocument, InputMessageForwarded, InputMessageGame, InputMessageInvoice, InputMessageLocation, InputMessagePaidMedia, InputMessagePhoto, InputMessagePoll, InputMessageSticker, InputMessageStory, InputMessageText, InputMessageVenue, InputMessageVideo, InputMessageVideoNote, InputMessageVoiceNote, InputPaidMedia, InputPaidMediaType, InputPaidMediaTypePhoto, InputPaidMediaTypeVideo, InputThumbnail, MessageCopyOptions, MessageProperties, MessageSchedulingState, MessageSchedulingStateSendAtDate, MessageSchedulingStateSendWhenOnline, MessageSchedulingStateSendWhenVideoProcessed, MessageSelfDestructType, MessageSelfDestructTypeImmediately, MessageSelfDestructTypeTimer, MessageSendOptions, SearchMessagesFilter, SearchMessagesFilterAnimation, SearchMessagesFilterAudio, SearchMessagesFilterChatPhoto, SearchMessagesFilterDocument, SearchMessagesFilterEmpty, SearchMessagesFilterFailedToSend, SearchMessagesFilterMention, SearchMessagesFilterPhoto, SearchMessagesFilterPhotoAndVideo, SearchMessagesFilterPinned, SearchMessagesFilterUnreadMention, SearchMessagesFilterUnreadReaction, SearchMessagesFilterUrl, SearchMessagesFilterVideo, SearchMessagesFilterVideoNote, SearchMessagesFilterVoiceAndVideoNote, SearchMessagesFilterVoiceNote, TextEntityType, TextEntityTypeBankCardNumber, TextEntityTypeBlockQuote, TextEntityTypeBold, TextEntityTypeBotCommand, TextEntityTypeCashtag, TextEntityTypeCode, TextEntityTypeCustomEmoji, TextEntityTypeEmailAddress, TextEntityTypeExpandableBlockQuote, TextEntityTypeHashtag, TextEntityTypeItalic, TextEntityTypeMediaTimestamp, TextEntityTypeMention, TextEntityTypeMentionName, TextEntityTypePhoneNumber, TextEntityTypePre, TextEntityTypePreCode, TextEntityTypeSpoiler, TextEntityTypeStrikethrough, TextEntityTypeTextUrl, TextEntityTypeUnderline, TextEntityTypeUrl
+    from .classes_13 import ChatAction, ChatActionCancel, ChatActionChoosingContact, ChatActionChoosingLocation, ChatActionChoosingSticker, ChatActionRecordingVideo, ChatActionRecordingVideoNote, ChatActionRecordingVoiceNote, ChatActionStartPlayingGame, ChatActionTyping, ChatActionUploadingDocument, ChatActionUploadingPhoto, ChatActionUploadingVideo, ChatActionUploadingVideoNote, ChatActionUploadingVoiceNote, ChatActionWatchingAnimations, CurrentWeather, EmojiCategories, EmojiCategory, EmojiCategorySource, EmojiCategorySourcePremium, EmojiCategorySourceSearch, EmojiCategoryType, EmojiCategoryTypeChatPhoto, EmojiCategoryTypeDefault, EmojiCategoryTypeEmojiStatus, EmojiCategoryTypeRegularStickers, EmojiKeyword, EmojiKeywords, Emojis, InputStoryAreaType, InputStoryAreaTypeFoundVenue, InputStoryAreaTypeLink, InputStoryAreaTypeLocation, InputStoryAreaTypeMessage, InputStoryAreaTypePreviousVenue, InputStoryAreaTypeSuggestedReaction, InputStoryAreaTypeUpgradedGift, InputStoryAreaTypeWeather, SearchMessagesChatTypeFilter, SearchMessagesChatTypeFilterChannel, SearchMessagesChatTypeFilterGroup, SearchMessagesChatTypeFilterPrivate, StickerSet, StickerSetInfo, StickerSets, Stickers, StoryArea, StoryAreaPosition, StoryAreaType, StoryAreaTypeLink, StoryAreaTypeLocation, StoryAreaTypeMessage, StoryAreaTypeSuggestedReaction, StoryAreaTypeUpgradedGift, StoryAreaTypeVenue, StoryAreaTypeWeather, TrendingStickerSets, UserStatus, UserStatusEmpty, UserStatusLastMonth, UserStatusLastWeek, UserStatusOffline, UserStatusOnline, UserStatusRecently
+    from .classes_14 import BotMediaPreview, BotMediaPreviewInfo, BotMediaPreviews, CallDiscardReason, CallDiscardReasonDeclined, CallDiscardReasonDisconnected, CallDiscardReasonEmpty, CallDiscardReasonHungUp, CallDiscardReasonMissed, CallDiscardReasonUpgradeToGroupCall, CallProtocol, CallServerType, CallServerTypeTelegramReflector, CallServerTypeWebrtc, ChatActiveStories, ChatBoost, ChatBoostFeatures, ChatBoostLevelFeatures, ChatBoostSlot, ChatBoostSlots, ChatBoostSource, ChatBoostSourceGiftCode, ChatBoostSourceGiveaway, ChatBoostSourcePremium, ChatBoostStatus, FoundChatBoosts, FoundStories, InputStoryArea, InputStoryAreas, InputStoryContent, InputStoryContentPhoto, InputStoryContentVideo, PrepaidGiveaway, PublicForward, PublicForwardMessage, PublicForwardStory, PublicForwards, QuickReplyMessage, QuickReplyMessages, QuickReplyShortcut, ResendCodeReason, ResendCodeReasonUserRequest, ResendCodeReasonVerificationFailed, Stories, Story, StoryContent, StoryContentPhoto, StoryContentUnsupported, StoryContentVideo, StoryFullId, StoryInfo, StoryInteraction, StoryInteractionInfo, StoryInteractionType, StoryInteractionTypeForward, StoryInteractionTypeRepost, StoryInteractionTypeView, StoryInteractions, StoryList, StoryListArchive, StoryListMain, StoryOrigin, StoryOriginHiddenUser, StoryOriginPublicStory, StoryRepostInfo, StoryVideo
+    from .classes_15 import AddedReaction, AddedReactions, Animations, AvailableReaction, AvailableReactions, Call, CallId, CallProblem, CallProblemDistortedSpeech, CallProblemDistortedVideo, CallProblemDropped, CallProblemEcho, CallProblemInterruptions, CallProblemNoise, CallProblemPixelatedVideo, CallProblemSilentLocal, CallProblemSilentRemote, CallServer, CallState, CallStateDiscarded, CallStateError, CallStateExchangingKeys, CallStateHangingUp, CallStatePending, CallStateReady, DiceStickers, DiceStickersRegular, DiceStickersSlotMachine, EmojiReaction, FirebaseAuthenticationSettings, FirebaseAuthenticationSettingsAndroid, FirebaseAuthenticationSettingsIos, GroupCall, GroupCallDataChannel, GroupCallDataChannelMain, GroupCallDataChannelScreenSharing, GroupCallId, GroupCallInfo, GroupCallJoinParameters, GroupCallParticipant, GroupCallParticipantVideoInfo, GroupCallParticipants, GroupCallRecentSpeaker, GroupCallVideoQuality, GroupCallVideoQualityFull, GroupCallVideoQualityMedium, GroupCallVideoQualityThumbnail, GroupCallVideoSourceGroup, ImportedContacts, InputGroupCall, InputGroupCallLink, InputGroupCallMessage, InviteGroupCallParticipantResult, InviteGroupCallParticipantResultSuccess, InviteGroupCallParticipantResultUserAlreadyParticipant, InviteGroupCallParticipantResultUserPrivacyRestricted, InviteGroupCallParticipantResultUserWasBanned, PhoneNumberAuthenticationSettings, ReactionUnavailabilityReason, ReactionUnavailabilityReasonAnonymousAdministrator, ReactionUnavailabilityReasonGuest, RtmpUrl, VideoChatStream, VideoChatStreams
+    from .classes_16 import AttachmentMenuBot, AttachmentMenuBotColor, BotWriteAccessAllowReason, BotWriteAccessAllowReasonAcceptedRequest, BotWriteAccessAllowReasonAddedToAttachmentMenu, BotWriteAccessAllowReasonConnectedWebsite, BotWriteAccessAllowReasonLaunchedWebApp, BusinessConnection, CallbackQueryAnswer, CallbackQueryPayload, CallbackQueryPayloadData, CallbackQueryPayloadDataWithPassword, CallbackQueryPayloadGame, ChatEventAccentColorChanged, ChatEventAction, ChatEventActiveUsernamesChanged, ChatEventAutomaticTranslationToggled, ChatEventAvailableReactionsChanged, ChatEventBackgroundChanged, ChatEventCustomEmojiStickerSetChanged, ChatEventDescriptionChanged, ChatEventEmojiStatusChanged, ChatEventForumTopicCreated, ChatEventForumTopicDeleted, ChatEventForumTopicEdited, ChatEventForumTopicPinned, ChatEventForumTopicToggleIsClosed, ChatEventForumTopicToggleIsHidden, ChatEventHasAggressiveAntiSpamEnabledToggled, ChatEventHasProtectedContentToggled, ChatEventInviteLinkDeleted, ChatEventInviteLinkEdited, ChatEventInviteLinkRevoked, ChatEventInvitesToggled, ChatEventIsAllHistoryAvailableToggled, ChatEventIsForumToggled, ChatEventLinkedChatChanged, ChatEventLocationChanged, ChatEventMemberInvited, ChatEventMemberJoined, ChatEventMemberJoinedByInviteLink, ChatEventMemberJoinedByRequest, ChatEventMemberLeft, ChatEventMemberPromoted, ChatEventMemberRestricted, ChatEventMemberSubscriptionExtended, ChatEventMessageAutoDeleteTimeChanged, ChatEventMessageDeleted, ChatEventMessageEdited, ChatEventMessagePinned, ChatEventMessageUnpinned, ChatEventPermissionsChanged, ChatEventPhotoChanged, ChatEventPollStopped, ChatEventProfileAccentColorChanged, ChatEventShowMessageSenderToggled, ChatEventSignMessagesToggled, ChatEventSlowModeDelayChanged, ChatEventStickerSetChanged, ChatEventTitleChanged, ChatEventUsernameChanged, ChatEventVideoChatCreated, ChatEventVideoChatEnded, ChatEventVideoChatMuteNewParticipantsToggled, ChatEventVideoChatParticipantIsMutedToggled, ChatEventVideoChatParticipantVolumeLevelChanged, CustomRequestResult, GameHighScore, GameHighScores, HttpUrl, InlineQueryResult, InlineQueryResultAnimation, InlineQueryResultArticle, InlineQueryResultAudio, InlineQueryResultContact, InlineQueryResultDocument, InlineQueryResultGame, InlineQueryResultLocation, InlineQueryResultPhoto, InlineQueryResultSticker, InlineQueryResultVenue, InlineQueryResultVideo, InlineQueryResultVoiceNote, InlineQueryResults, InlineQueryResultsButton, InlineQueryResultsButtonType, InlineQueryResultsButtonTypeStartBot, InlineQueryResultsButtonTypeWebApp, InputInlineQueryResult, InputInlineQueryResultAnimation, InputInlineQueryResultArticle, InputInlineQueryResultAudio, InputInlineQueryResultContact, InputInlineQueryResultDocument, InputInlineQueryResultGame, InputInlineQueryResultLocation, InputInlineQueryResultPhoto, InputInlineQueryResultSticker, InputInlineQueryResultVenue, InputInlineQueryResultVideo, InputInlineQueryResultVoiceNote, PreparedInlineMessage, PreparedInlineMessageId, SentWebAppMessage, SpeechRecognitionResult, SpeechRecognitionResultError, SpeechRecognitionResultPending, SpeechRecognitionResultText, TargetChat, TargetChatChosen, TargetChatCurrent, TargetChatInternalLink, TargetChatTypes, UserLink
+    from .classes_17 import BusinessFeature, BusinessFeatureAccountLinks, BusinessFeatureAwayMessage, BusinessFeatureBots, BusinessFeatureChatFolderTags, BusinessFeatureEmojiStatus, BusinessFeatureGreetingMessage, BusinessFeatureLocation, BusinessFeatureOpeningHours, BusinessFeatureQuickReplies, BusinessFeatureStartPage, BusinessFeatureUpgradedStories, ChatEvent, ChatEventLogFilters, ChatEvents, LanguagePackInfo, LanguagePackString, LanguagePackStringValue, LanguagePackStringValueDeleted, LanguagePackStringValueOrdinary, LanguagePackStringValuePluralized, LanguagePackStrings, LocalizationTargetInfo, PremiumFeature, PremiumFeatureAccentColor, PremiumFeatureAdvancedChatManagement, PremiumFeatureAnimatedProfilePhoto, PremiumFeatureAppIcons, PremiumFeatureBackgroundForBoth, PremiumFeatureBusiness, PremiumFeatureChatBoost, PremiumFeatureChecklists, PremiumFeatureCustomEmoji, PremiumFeatureDisabledAds, PremiumFeatureEmojiStatus, PremiumFeatureForumTopicIcon, PremiumFeatureImprovedDownloadSpeed, PremiumFeatureIncreasedLimits, PremiumFeatureIncreasedUploadFileSize, PremiumFeatureLastSeenTimes, PremiumFeatureMessageEffects, PremiumFeatureMessagePrivacy, PremiumFeatureProfileBadge, PremiumFeatureRealTimeChatTranslation, PremiumFeatureSavedMessagesTags, PremiumFeatureUniqueReactions, PremiumFeatureUniqueStickers, PremiumFeatureUpgradedStories, PremiumFeatureVoiceRecognition, PremiumLimitType, PremiumLimitTypeActiveStoryCount, PremiumLimitTypeBioLength, PremiumLimitTypeCaptionLength, PremiumLimitTypeChatFolderChosenChatCount, PremiumLimitTypeChatFolderCount, PremiumLimitTypeChatFolderInviteLinkCount, PremiumLimitTypeCreatedPublicChatCount, PremiumLimitTypeFavoriteStickerCount, PremiumLimitTypeMonthlyPostedStoryCount, PremiumLimitTypePinnedArchivedChatCount, PremiumLimitTypePinnedChatCount, PremiumLimitTypePinnedSavedMessagesTopicCount, PremiumLimitTypeSavedAnimationCount, PremiumLimitTypeShareableChatFolderCount, PremiumLimitTypeSimilarChatCount, PremiumLimitTypeStoryCaptionLength, PremiumLimitTypeStorySuggestedReactionAreaCount, PremiumLimitTypeSupergroupCount, PremiumLimitTypeWeeklyPostedStoryCount
+    from .classes_18 import BackgroundFill, BackgroundFillFreeformGradient, BackgroundFillGradient, BackgroundFillSolid, BackgroundType, BackgroundTypeChatTheme, BackgroundTypeFill, BackgroundTypePattern, BackgroundTypeWallpaper, BusinessFeaturePromotionAnimation, BusinessFeatures, DeviceToken, DeviceTokenApplePush, DeviceTokenApplePushVoIP, DeviceTokenBlackBerryPush, DeviceTokenFirebaseCloudMessaging, DeviceTokenHuaweiPush, DeviceTokenMicrosoftPush, DeviceTokenMicrosoftPushVoIP, DeviceTokenSimplePush, DeviceTokenTizenPush, DeviceTokenUbuntuPush, DeviceTokenWebPush, DeviceTokenWindowsPush, InputBackground, InputBackgroundLocal, InputBackgroundPrevious, InputBackgroundRemote, PremiumFeaturePromotionAnimation, PremiumFeatures, PremiumLimit, PremiumSource, PremiumSourceBusinessFeature, PremiumSourceFeature, PremiumSourceLimitExceeded, PremiumSourceLink, PremiumSourceSettings, PremiumSourceStoryFeature, PremiumState, PremiumStoryFeature, PremiumStoryFeatureCustomExpirationDuration, PremiumStoryFeatureLinksAndFormatting, PremiumStoryFeaturePermanentViewsHistory, PremiumStoryFeaturePriorityOrder, PremiumStoryFeatureSaveStories, PremiumStoryFeatureStealthMode, PremiumStoryFeatureVideoQuality, PushReceiverId, StorePaymentPurpose, StorePaymentPurposeGiftedStars, StorePaymentPurposePremiumGift, StorePaymentPurposePremiumGiftCodes, StorePaymentPurposePremiumGiveaway, StorePaymentPurposePremiumSubscription, StorePaymentPurposeStarGiveaway, StorePaymentPurposeStars, StoreTransaction, StoreTransactionAppStore, StoreTransactionGooglePlay, TelegramPaymentPurpose, TelegramPaymentPurposeGiftedStars, TelegramPaymentPurposeJoinChat, TelegramPaymentPurposePremiumGift, TelegramPaymentPurposePremiumGiftCodes, TelegramPaymentPurposePremiumGiveaway, TelegramPaymentPurposeStarGiveaway, TelegramPaymentPurposeStars
+    from .classes_19 import CanPostStoryResult, CanPostStoryResultActiveStoryLimitExceeded, CanPostStoryResultBoostNeeded, CanPostStoryResultMonthlyLimitExceeded, CanPostStoryResultOk, CanPostStoryResultPremiumNeeded, CanPostStoryResultWeeklyLimitExceeded, CanTransferOwnershipResult, CanTransferOwnershipResultOk, CanTransferOwnershipResultPasswordNeeded, CanTransferOwnershipResultPasswordTooFresh, CanTransferOwnershipResultSessionTooFresh, ChatTheme, CheckChatUsernameResult, CheckChatUsernameResultOk, CheckChatUsernameResultPublicChatsTooMany, CheckChatUsernameResultPublicGroupsUnavailable, CheckChatUsernameResultUsernameInvalid, CheckChatUsernameResultUsernameOccupied, CheckChatUsernameResultUsernamePurchasable, CheckStickerSetNameResult, CheckStickerSetNameResultNameInvalid, CheckStickerSetNameResultNameOccupied, CheckStickerSetNameResultOk, Hashtags, MessageFileType, MessageFileTypeGroup, MessageFileTypePrivate, MessageFileTypeUnknown, PushMessageContent, PushMessageContentAnimation, PushMessageContentAudio, PushMessageContentBasicGroupChatCreate, PushMessageContentChatAddMembers, PushMessageContentChatChangePhoto, PushMessageContentChatChangeTitle, PushMessageContentChatDeleteMember, PushMessageContentChatJoinByLink, PushMessageContentChatJoinByRequest, PushMessageContentChatSetBackground, PushMessageContentChatSetTheme, PushMessageContentChecklist, PushMessageContentChecklistTasksAdded, PushMessageContentChecklistTasksDone, PushMessageContentContact, PushMessageContentContactRegistered, PushMessageContentDocument, PushMessageContentGame, PushMessageContentGameScore, PushMessageContentGift, PushMessageContentGiveaway, PushMessageContentHidden, PushMessageContentInviteVideoChatParticipants, PushMessageContentInvoice, PushMessageContentLocation, PushMessageContentMediaAlbum, PushMessageContentMessageForwards, PushMessageContentPaidMedia, PushMessageContentPhoto, PushMessageContentPoll, PushMessageContentPremiumGiftCode, PushMessageContentProximityAlertTriggered, PushMessageContentRecurringPayment, PushMessageContentScreenshotTaken, PushMessageContentSticker, PushMessageContentStory, PushMessageContentSuggestProfilePhoto, PushMessageContentText, PushMessageContentUpgradedGift, PushMessageContentVideo, PushMessageContentVideoChatEnded, PushMessageContentVideoChatStarted, PushMessageContentVideoNote, PushMessageContentVoiceNote, ResetPasswordResult, ResetPasswordResultDeclined, ResetPasswordResultOk, ResetPasswordResultPending, TimeZone, TimeZones
+    from .classes_20 import CanSendMessageToUserResult, CanSendMessageToUserResultOk, CanSendMessageToUserResultUserHasPaidMessages, CanSendMessageToUserResultUserIsDeleted, CanSendMessageToUserResultUserRestrictsNewChats, JsonObjectMember, JsonValue, JsonValueArray, JsonValueBoolean, JsonValueNull, JsonValueNumber, JsonValueObject, JsonValueString, NewChatPrivacySettings, Notification, NotificationGroup, NotificationGroupType, NotificationGroupTypeCalls, NotificationGroupTypeMentions, NotificationGroupTypeMessages, NotificationGroupTypeSecretChat, NotificationSound, NotificationSounds, NotificationType, NotificationTypeNewCall, NotificationTypeNewMessage, NotificationTypeNewPushMessage, NotificationTypeNewSecretChat, OptionValue, OptionValueBoolean, OptionValueEmpty, OptionValueInteger, OptionValueString, ReadDatePrivacySettings, StoryPrivacySettings, StoryPrivacySettingsCloseFriends, StoryPrivacySettingsContacts, StoryPrivacySettingsEveryone, StoryPrivacySettingsSelectedUsers, UserPrivacySetting, UserPrivacySettingAllowCalls, UserPrivacySettingAllowChatInvites, UserPrivacySettingAllowFindingByPhoneNumber, UserPrivacySettingAllowPeerToPeerCalls, UserPrivacySettingAllowPrivateVoiceAndVideoNoteMessages, UserPrivacySettingAllowUnpaidMessages, UserPrivacySettingAutosaveGifts, UserPrivacySettingRule, UserPrivacySettingRuleAllowAll, UserPrivacySettingRuleAllowBots, UserPrivacySettingRuleAllowChatMembers, UserPrivacySettingRuleAllowContacts, UserPrivacySettingRuleAllowPremiumUsers, UserPrivacySettingRuleAllowUsers, UserPrivacySettingRuleRestrictAll, UserPrivacySettingRuleRestrictBots, UserPrivacySettingRuleRestrictChatMembers, UserPrivacySettingRuleRestrictContacts, UserPrivacySettingRuleRestrictUsers, UserPrivacySettingRules, UserPrivacySettingShowBio, UserPrivacySettingShowBirthdate, UserPrivacySettingShowLinkInForwardedMessages, UserPrivacySettingShowPhoneNumber, UserPrivacySettingShowProfilePhoto, UserPrivacySettingShowStatus
+    from .classes_21 import AccountTtl, ConnectedWebsite, ConnectedWebsites, InternalLinkType, InternalLinkTypeActiveSessions, InternalLinkTypeAttachmentMenuBot, InternalLinkTypeAuthenticationCode, InternalLinkTypeBackground, InternalLinkTypeBotAddToChannel, InternalLinkTypeBotStart, InternalLinkTypeBotStartInGroup, InternalLinkTypeBusinessChat, InternalLinkTypeBuyStars, InternalLinkTypeChangePhoneNumber, InternalLinkTypeChatAffiliateProgram, InternalLinkTypeChatBoost, InternalLinkTypeChatFolderInvite, InternalLinkTypeChatFolderSettings, InternalLinkTypeChatInvite, InternalLinkTypeDefaultMessageAutoDeleteTimerSettings, InternalLinkTypeEditProfileSettings, InternalLinkTypeGame, InternalLinkTypeGroupCall, InternalLinkTypeInstantView, InternalLinkTypeInvoice, InternalLinkTypeLanguagePack, InternalLinkTypeLanguageSettings, InternalLinkTypeMainWebApp, InternalLinkTypeMessage, InternalLinkTypeMessageDraft, InternalLinkTypeMyStars, InternalLinkTypeMyToncoins, InternalLinkTypePassportDataRequest, InternalLinkTypePhoneNumberConfirmation, InternalLinkTypePremiumFeatures, InternalLinkTypePremiumGift, InternalLinkTypePremiumGiftCode, InternalLinkTypePrivacyAndSecuritySettings, InternalLinkTypeProxy, InternalLinkTypePublicChat, InternalLinkTypeQrCodeAuthentication, InternalLinkTypeRestorePurchases, InternalLinkTypeSettings, InternalLinkTypeStickerSet, InternalLinkTypeStory, InternalLinkTypeTheme, InternalLinkTypeThemeSettings, InternalLinkTypeUnknownDeepLink, InternalLinkTypeUnsupportedProxy, InternalLinkTypeUpgradedGift, InternalLinkTypeUserPhoneNumber, InternalLinkTypeUserToken, InternalLinkTypeVideoChat, InternalLinkTypeWebApp, MessageAutoDeleteTime, ReportChatResult, ReportChatResultMessagesRequired, ReportChatResultOk, ReportChatResultOptionRequired, ReportChatResultTextRequired, ReportReason, ReportReasonChildAbuse, ReportReasonCopyright, ReportReasonCustom, ReportReasonFake, ReportReasonIllegalDrugs, ReportReasonPersonalDetails, ReportReasonPornography, ReportReasonSpam, ReportReasonUnrelatedLocation, ReportReasonViolence, ReportStoryResult, ReportStoryResultOk, ReportStoryResultOptionRequired, ReportStoryResultTextRequired, Session, SessionType, SessionTypeAndroid, SessionTypeApple, SessionTypeBrave, SessionTypeChrome, SessionTypeEdge, SessionTypeFirefox, SessionTypeIpad, SessionTypeIphone, SessionTypeLinux, SessionTypeMac, SessionTypeOpera, SessionTypeSafari, SessionTypeUbuntu, SessionTypeUnknown, SessionTypeVivaldi, SessionTypeWindows, SessionTypeXbox, Sessions, UnconfirmedSession
+    from .classes_22 import AutoDownloadSettings, AutoDownloadSettingsPresets, AutosaveSettings, AutosaveSettingsException, AutosaveSettingsScope, AutosaveSettingsScopeChannelChats, AutosaveSettingsScopeChat, AutosaveSettingsScopeGroupChats, AutosaveSettingsScopePrivateChats, BlockList, BlockListMain, BlockListStories, ChatBoostLink, ChatBoostLinkInfo, ConnectionState, ConnectionStateConnecting, ConnectionStateConnectingToProxy, ConnectionStateReady, ConnectionStateUpdating, ConnectionStateWaitingForNetwork, DatabaseStatistics, FileType, FileTypeAnimation, FileTypeAudio, FileTypeDocument, FileTypeNone, FileTypeNotificationSound, FileTypePhoto, FileTypePhotoStory, FileTypeProfilePhoto, FileTypeSecret, FileTypeSecretThumbnail, FileTypeSecure, FileTypeSelfDestructingPhoto, FileTypeSelfDestructingVideo, FileTypeSelfDestructingVideoNote, FileTypeSelfDestructingVoiceNote, FileTypeSticker, FileTypeThumbnail, FileTypeUnknown, FileTypeVideo, FileTypeVideoNote, FileTypeVideoStory, FileTypeVoiceNote, FileTypeWallpaper, MessageLink, MessageLinkInfo, NetworkStatistics, NetworkStatisticsEntry, NetworkStatisticsEntryCall, NetworkStatisticsEntryFile, NetworkType, NetworkTypeMobile, NetworkTypeMobileRoaming, NetworkTypeNone, NetworkTypeOther, NetworkTypeWiFi, ScopeAutosaveSettings, StorageStatistics, StorageStatisticsByChat, StorageStatisticsByFileType, StorageStatisticsFast, TopChatCategory, TopChatCategoryBots, TopChatCategoryCalls, TopChatCategoryChannels, TopChatCategoryForwardChats, TopChatCategoryGroups, TopChatCategoryInlineBots, TopChatCategoryUsers, TopChatCategoryWebAppBots
+    from .classes_23 import ChatRevenueAmount, ChatRevenueStatistics, ChatStatistics, ChatStatisticsAdministratorActionsInfo, ChatStatisticsChannel, ChatStatisticsInteractionInfo, ChatStatisticsInviterInfo, ChatStatisticsMessageSenderInfo, ChatStatisticsObjectType, ChatStatisticsObjectTypeMessage, ChatStatisticsObjectTypeStory, ChatStatisticsSupergroup, Count, Data, DateRange, DeepLinkInfo, FileDownloadedPrefixSize, FoundPosition, FoundPositions, InputSticker, MessageStatistics, Proxies, Proxy, ProxyType, ProxyTypeHttp, ProxyTypeMtproto, ProxyTypeSocks5, RevenueWithdrawalState, RevenueWithdrawalStateFailed, RevenueWithdrawalStatePending, RevenueWithdrawalStateSucceeded, Seconds, StarCount, StatisticalGraph, StatisticalGraphAsync, StatisticalGraphData, StatisticalGraphError, StatisticalValue, StoryStatistics, SuggestedAction, SuggestedActionCheckPassword, SuggestedActionCheckPhoneNumber, SuggestedActionConvertToBroadcastGroup, SuggestedActionCustom, SuggestedActionEnableArchiveAndMuteNewChats, SuggestedActionExtendPremium, SuggestedActionExtendStarSubscriptions, SuggestedActionGiftPremiumForChristmas, SuggestedActionRestorePremium, SuggestedActionSetBirthdate, SuggestedActionSetPassword, SuggestedActionSetProfilePhoto, SuggestedActionSubscribeToAnnualPremium, SuggestedActionUpgradePremium, SuggestedActionViewChecksHint, TMeUrl, TMeUrlType, TMeUrlTypeChatInvite, TMeUrlTypeStickerSet, TMeUrlTypeSupergroup, TMeUrlTypeUser, TMeUrls, Text, TextParseMode, TextParseModeHTML, TextParseModeMarkdown
+    from .classes_24 import BotCommandScope, BotCommandScopeAllChatAdministrators, BotCommandScopeAllGroupChats, BotCommandScopeAllPrivateChats, BotCommandScopeChat, BotCommandScopeChatAdministrators, BotCommandScopeChatMember, BotCommandScopeDefault, ChatRevenueTransaction, ChatRevenueTransactionType, ChatRevenueTransactionTypeFragmentRefund, ChatRevenueTransactionTypeFragmentWithdrawal, ChatRevenueTransactionTypeSponsoredMessageEarnings, ChatRevenueTransactionTypeSuggestedPostEarnings, ChatRevenueTransactionTypeUnsupported, ChatRevenueTransactions, PhoneNumberCodeType, PhoneNumberCodeTypeChange, PhoneNumberCodeTypeConfirmOwnership, PhoneNumberCodeTypeVerify, Point, StarRevenueStatistics, StarRevenueStatus, UpdateAccentColors, UpdateActiveEmojiReactions, UpdateActiveLiveLocationMessages, UpdateActiveNotifications, UpdateAnimatedEmojiMessageClicked, UpdateAnimationSearchParameters, UpdateApplicationRecaptchaVerificationRequired, UpdateApplicationVerificationRequired, UpdateAttachmentMenuBots, UpdateAuthorizationState, UpdateAutosaveSettings, UpdateAvailableMessageEffects, UpdateBasicGroup, UpdateBasicGroupFullInfo, UpdateBusinessConnection, UpdateBusinessMessageEdited, UpdateBusinessMessagesDeleted, UpdateCall, UpdateChatAccentColors, UpdateChatAction, UpdateChatActionBar, UpdateChatActiveStories, UpdateChatAddedToList, UpdateChatAvailableReactions, UpdateChatBackground, UpdateChatBlockList, UpdateChatBoost, UpdateChatBusinessBotManageBar, UpdateChatDefaultDisableNotification, UpdateChatDraftMessage, UpdateChatEmojiStatus, UpdateChatFolders, UpdateChatHasProtectedContent, UpdateChatHasScheduledMessages, UpdateChatIsMarkedAsUnread, UpdateChatIsTranslatable, UpdateChatLastMessage, UpdateChatMember, UpdateChatMessageAutoDeleteTime, UpdateChatMessageSender, UpdateChatNotificationSettings, UpdateChatOnlineMemberCount, UpdateChatPendingJoinRequests, UpdateChatPermissions, UpdateChatPhoto, UpdateChatPosition, UpdateChatReadInbox, UpdateChatReadOutbox, UpdateChatRemovedFromList, UpdateChatReplyMarkup, UpdateChatRevenueAmount, UpdateChatTheme, UpdateChatThemes, UpdateChatTitle, UpdateChatUnreadMentionCount, UpdateChatUnreadReactionCount, UpdateChatVideoChat, UpdateChatViewAsTopics, UpdateConnectionState, UpdateContactCloseBirthdays, UpdateDefaultBackground, UpdateDefaultPaidReactionType, UpdateDefaultReactionType, UpdateDeleteMessages, UpdateDiceEmojis, UpdateDirectMessagesChatTopic, UpdateFavoriteStickers, UpdateFile, UpdateFileAddedToDownloads, UpdateFileDownload, UpdateFileDownloads, UpdateFileGenerationStart, UpdateFileGenerationStop, UpdateFileRemovedFromDownloads, UpdateForumTopic, UpdateForumTopicInfo, UpdateFreezeState, UpdateGroupCall, UpdateGroupCallParticipant, UpdateGroupCallParticipants, UpdateGroupCallVerificationState, UpdateHavePendingNotifications, UpdateInstalledStickerSets, UpdateLanguagePackStrings, UpdateMessageContent, UpdateMessageContentOpened, UpdateMessageEdited, UpdateMessageFactCheck, UpdateMessageInteractionInfo, UpdateMessageIsPinned, UpdateMessageLiveLocationViewed, UpdateMessageMentionRead, UpdateMessageReaction, UpdateMessageReactions, UpdateMessageSendAcknowledged, UpdateMessageSendFailed, UpdateMessageSendSucceeded, UpdateMessageSuggestedPostInfo, UpdateMessageUnreadReactions, UpdateNewBusinessCallbackQuery, UpdateNewBusinessMessage, UpdateNewCallSignalingData, UpdateNewCallbackQuery, UpdateNewChat, UpdateNewChatJoinRequest, UpdateNewChosenInlineResult, UpdateNewCustomEvent, UpdateNewCustomQuery, UpdateNewInlineCallbackQuery, UpdateNewInlineQuery, UpdateNewMessage, UpdateNewPreCheckoutQuery, UpdateNewShippingQuery, UpdateNotification, UpdateNotificationGroup, UpdateOption, UpdateOwnedStarCount, UpdateOwnedTonCount, UpdatePaidMediaPurchased, UpdatePoll, UpdatePollAnswer, UpdateProfileAccentColors, UpdateQuickReplyShortcut, UpdateQuickReplyShortcutDeleted, UpdateQuickReplyShortcutMessages, UpdateQuickReplyShortcuts, UpdateReactionNotificationSettings, UpdateRecentStickers, UpdateSavedAnimations, UpdateSavedMessagesTags, UpdateSavedMessagesTopic, UpdateSavedMessagesTopicCount, UpdateSavedNotificationSounds, UpdateScopeNotificationSettings, UpdateSecretChat, UpdateServiceNotification, UpdateSpeechRecognitionTrial, UpdateSpeedLimitNotification, UpdateStarRevenueStatus, UpdateStickerSet, UpdateStory, UpdateStoryDeleted, UpdateStoryListChatCount, UpdateStoryPostFailed, UpdateStoryPostSucceeded, UpdateStoryStealthMode, UpdateSuggestedActions, UpdateSupergroup, UpdateSupergroupFullInfo, UpdateTermsOfService, UpdateTopicMessageCount, UpdateTrendingStickerSets, UpdateUnconfirmedSession, UpdateUnreadChatCount, UpdateUnreadMessageCount, UpdateUser, UpdateUserFullInfo, UpdateUserPrivacySettingRules, UpdateUserStatus, UpdateVideoPublished, UpdateWebAppMessageSent, VectorPathCommand, VectorPathCommandCubicBezierCurve, VectorPathCommandLine
+    from .classes_25 import LogStream, LogStreamDefault, LogStreamEmpty, LogStreamFile, LogTags, LogVerbosityLevel, TestBytes, TestInt, TestString, TestVectorInt, TestVectorIntObject, TestVectorString, TestVectorStringObject, Updates, UserSupportInfo
+    from .functions_00 import CancelPasswordReset, CancelRecoveryEmailAddressVerification, CheckAuthenticationBotToken, CheckAuthenticationCode, CheckAuthenticationEmailCode, CheckAuthenticationPassword, CheckAuthenticationPasswordRecoveryCode, CheckAuthenticationPremiumPurchase, CheckLoginEmailAddressCode, CheckPasswordRecoveryCode, CheckRecoveryEmailAddressCode, Close, ConfirmQrCodeAuthentication, CreateTemporaryPassword, Destroy, GetAuthorizationState, GetBasicGroup, GetBasicGroupFullInfo, GetCallbackQueryMessage, GetChat, GetChatPinnedMessage, GetCurrentState, GetFile, GetMe, GetMessage, GetMessageAuthor, GetMessageLocally, GetMessageProperties, GetMessageReadDate, GetMessageThread, GetMessageViewers, GetMessages, GetPasswordState, GetRecoveryEmailAddress, GetRemoteFile, GetRepliedMessage, GetSecretChat, GetSupergroup, GetSupergroupFullInfo, GetTemporaryPasswordState, GetUser, GetUserFullInfo, LogOut, RecoverAuthenticationPassword, RecoverPassword, RegisterUser, ReportAuthenticationCodeMissing, RequestAuthenticationPasswordRecovery, RequestPasswordRecovery, RequestQrCodeAuthentication, ResendAuthenticationCode, ResendLoginEmailAddressCode, ResendRecoveryEmailAddressCode, ResetAuthenticationEmailAddress, ResetPassword, SendAuthenticationFirebaseSms, SetAuthenticationEmailAddress, SetAuthenticationPhoneNumber, SetAuthenticationPremiumPurchaseTransaction, SetDatabaseEncryptionKey, SetLoginEmailAddress, SetPassword, SetRecoveryEmailAddress, SetTdlibParameters
+    from .functions_01 import AddRecentlyFoundChat, CheckChatUsername, CheckCreatedPublicChatsLimit, ClearRecentlyFoundChats, ClearSearchedForTags, DeleteAllCallMessages, DeleteChat, DeleteChatHistory, DeleteDirectMessagesChatTopicHistory, DeleteDirectMessagesChatTopicMessagesByDate, DeleteSavedMessagesTopicHistory, DeleteSavedMessagesTopicMessagesByDate, GetBotSimilarBotCount, GetBotSimilarBots, GetChatHistory, GetChatSimilarChatCount, GetChatSimilarChats, GetChats, GetCreatedPublicChats, GetDirectMessagesChatTopic, GetDirectMessagesChatTopicHistory, GetDirectMessagesChatTopicMessageByDate, GetDirectMessagesChatTopicRevenue, GetGroupsInCommon, GetInactiveSupergroupChats, GetMessageThreadHistory, GetRecentlyOpenedChats, GetRecommendedChats, GetSavedMessagesTopicHistory, GetSavedMessagesTopicMessageByDate, GetSearchedForTags, GetSuitableDiscussionChats, GetSuitablePersonalChats, GetTopChats, LoadChats, LoadDirectMessagesChatTopics, LoadSavedMessagesTopics, OpenBotSimilarBot, OpenChatSimilarChat, ReadAllDirectMessagesChatTopicReactions, RemoveRecentlyFoundChat, RemoveSearchedForTag, RemoveTopChat, SearchCallMessages, SearchChatMessages, SearchChats, SearchChatsOnServer, SearchMessages, SearchOutgoingDocumentMessages, SearchPublicChat, SearchPublicChats, SearchPublicMessagesByTag, SearchPublicStoriesByLocation, SearchPublicStoriesByTag, SearchPublicStoriesByVenue, SearchRecentlyFoundChats, SearchSavedMessages, SearchSecretMessages, SetDirectMessagesChatTopicDraftMessage, SetDirectMessagesChatTopicIsMarkedAsUnread, SetPinnedSavedMessagesTopics, ToggleDirectMessagesChatTopicCanSendUnpaidMessages, ToggleSavedMessagesTopicIsPinned, UnpinAllDirectMessagesChatTopicMessages
+    from .functions_02 import AddLocalMessage, ClickChatSponsoredMessage, ClickVideoMessageAdvertisement, DeleteChatMessagesByDate, DeleteChatMessagesBySender, DeleteMessages, EditBusinessMessageCaption, EditBusinessMessageChecklist, EditBusinessMessageLiveLocation, EditBusinessMessageMedia, EditBusinessMessageReplyMarkup, EditBusinessMessageText, EditInlineMessageCaption, EditInlineMessageLiveLocation, EditInlineMessageMedia, EditInlineMessageReplyMarkup, EditInlineMessageText, EditMessageCaption, EditMessageChecklist, EditMessageLiveLocation, EditMessageMedia, EditMessageReplyMarkup, EditMessageSchedulingState, EditMessageText, ForwardMessages, GetChatAvailableMessageSenders, GetChatMessageByDate, GetChatMessageCalendar, GetChatMessageCount, GetChatMessagePosition, GetChatScheduledMessages, GetChatSparseMessagePositions, GetChatSponsoredMessages, GetMessageEmbeddingCode, GetMessageLink, GetMessageLinkInfo, GetSearchSponsoredChats, GetVideoMessageAdvertisements, OpenSponsoredChat, RateSpeechRecognition, ReadBusinessMessage, RecognizeSpeech, RemoveNotification, RemoveNotificationGroup, ReportChatSponsoredMessage, ReportSponsoredChat, ReportVideoMessageAdvertisement, ResendMessages, SearchChatRecentLocationMessages, SendBotStartMessage, SendBusinessMessage, SendBusinessMessageAlbum, SendInlineQueryResultMessage, SendMessage, SendMessageAlbum, SendQuickReplyShortcutMessages, SetBusinessMessageIsPinned, SetChatMessageSender, SetMessageFactCheck, StopBusinessPoll, TranslateMessageText, TranslateText, ViewSponsoredChat, ViewVideoMessageAdvertisement
+    from .functions_03 import AddMessageReaction, AddPendingPaidMessageReaction, AddQuickReplyShortcutInlineQueryResultMessage, AddQuickReplyShortcutMessage, AddQuickReplyShortcutMessageAlbum, CheckQuickReplyShortcutName, CleanFileName, ClearRecentReactions, CommitPendingPaidMessageReactions, CreateForumTopic, DeleteBusinessMessages, DeleteBusinessStory, DeleteForumTopic, DeleteQuickReplyShortcut, DeleteQuickReplyShortcutMessages, EditBusinessStory, EditForumTopic, EditQuickReplyMessage, GetBusinessAccountStarAmount, GetChatAvailablePaidMessageReactionSenders, GetCountryFlagEmoji, GetCustomEmojiReactionAnimations, GetEmojiReaction, GetFileExtension, GetFileMimeType, GetForumTopic, GetForumTopicDefaultIcons, GetForumTopicLink, GetForumTopics, GetJsonString, GetJsonValue, GetLanguagePackString, GetMarkdownText, GetMessageAddedReactions, GetMessageAvailableReactions, GetMessageEffect, GetSavedMessagesTags, GetTextEntities, GetThemeParametersJsonString, LoadQuickReplyShortcutMessages, LoadQuickReplyShortcuts, ParseMarkdown, ParseTextEntities, ReaddQuickReplyShortcutMessages, RemoveMessageReaction, RemovePendingPaidMessageReactions, ReorderQuickReplyShortcuts, SearchQuote, SetBusinessAccountBio, SetBusinessAccountGiftSettings, SetBusinessAccountName, SetBusinessAccountProfilePhoto, SetBusinessAccountUsername, SetDefaultReactionType, SetForumTopicNotificationSettings, SetMessageReactions, SetPaidMessageReactionType, SetPinnedForumTopics, SetQuickReplyShortcutName, SetSavedMessagesTagLabel, ToggleForumTopicIsClosed, ToggleForumTopicIsPinned, ToggleGeneralForumTopicIsHidden, TransferBusinessAccountStars
+    from .functions_04 import AddChatToList, AddChecklistTasks, AnswerCallbackQuery, AnswerInlineQuery, AnswerPreCheckoutQuery, AnswerShippingQuery, AnswerWebAppQuery, CheckWebAppFileDownload, ClickAnimatedEmojiMessage, CloseChat, CloseWebApp, CreateBasicGroupChat, CreateChatFolder, CreateNewBasicGroupChat, CreateNewSecretChat, CreateNewSupergroupChat, CreatePrivateChat, CreateSecretChat, CreateSupergroupChat, DeleteChatFolder, DeleteChatReplyMarkup, EditChatFolder, GetBusinessConnection, GetCallbackQueryAnswer, GetChatFolder, GetChatListsToAddChat, GetExternalLink, GetExternalLinkInfo, GetGameHighScores, GetGrossingWebAppBots, GetInlineGameHighScores, GetInlineQueryResults, GetInternalLink, GetInternalLinkType, GetLoginUrl, GetLoginUrlInfo, GetMainWebApp, GetPollVoters, GetPreparedInlineMessage, GetWebAppLinkUrl, GetWebAppPlaceholder, GetWebAppUrl, HideContactCloseBirthdays, HideSuggestedAction, MarkChecklistTasksAsDone, OpenChat, OpenMessageContent, OpenWebApp, ReadAllChatMentions, ReadAllChatReactions, ReadAllMessageThreadMentions, ReadAllMessageThreadReactions, SavePreparedInlineMessage, SearchWebApp, SendChatAction, SendWebAppData, SetGameScore, SetInlineGameScore, SetPollAnswer, ShareChatWithBot, ShareUsersWithBot, StopPoll, UpgradeBasicGroupChatToSupergroupChat, ViewMessages
+    from .functions_05 import AddChatFolderByInviteLink, AddChatMember, AddChatMembers, AddSavedNotificationSound, BanChatMember, CanTransferOwnership, CheckChatFolderInviteLink, ClearAllDraftMessages, CreateChatFolderInviteLink, DeleteChatBackground, DeleteChatFolderInviteLink, EditChatFolderInviteLink, GetArchiveChatListSettings, GetChatAdministrators, GetChatFolderChatCount, GetChatFolderChatsToLeave, GetChatFolderDefaultIconName, GetChatFolderInviteLinks, GetChatFolderNewChats, GetChatMember, GetChatNotificationSettingsExceptions, GetChatsForChatFolderInviteLink, GetRecommendedChatFolders, GetSavedNotificationSound, GetSavedNotificationSounds, GetScopeNotificationSettings, JoinChat, LeaveChat, PinChatMessage, ProcessChatFolderNewChats, RemoveSavedNotificationSound, ReorderChatFolders, SearchChatMembers, SetArchiveChatListSettings, SetChatAccentColor, SetChatAvailableReactions, SetChatBackground, SetChatClientData, SetChatDescription, SetChatDirectMessagesGroup, SetChatDiscussionGroup, SetChatDraftMessage, SetChatEmojiStatus, SetChatLocation, SetChatMemberStatus, SetChatMessageAutoDeleteTime, SetChatNotificationSettings, SetChatPermissions, SetChatPhoto, SetChatProfileAccentColor, SetChatSlowModeDelay, SetChatTheme, SetChatTitle, SetScopeNotificationSettings, ToggleChatDefaultDisableNotification, ToggleChatFolderTags, ToggleChatHasProtectedContent, ToggleChatIsMarkedAsUnread, ToggleChatIsTranslatable, ToggleChatViewAsTopics, TransferChatOwnership, UnpinAllChatMessages, UnpinAllMessageThreadMessages, UnpinChatMessage
+    from .functions_06 import ActivateStoryStealthMode, AddFileToDownloads, BoostChat, CanPostStory, CancelDownloadFile, CancelPreliminaryUploadFile, ClearRecentEmojiStatuses, CloseStory, DeleteFile, DeleteStory, DownloadFile, EditStory, EditStoryCover, FinishFileGeneration, GetAttachmentMenuBot, GetAvailableChatBoostSlots, GetChatActiveStories, GetChatArchivedStories, GetChatBoostFeatures, GetChatBoostLevelFeatures, GetChatBoostLink, GetChatBoostLinkInfo, GetChatBoostStatus, GetChatBoosts, GetChatPostedToChatPageStories, GetChatStoryInteractions, GetChatsToPostStories, GetCurrentWeather, GetDefaultChatEmojiStatuses, GetDefaultEmojiStatuses, GetDisallowedChatEmojiStatuses, GetFileDownloadedPrefixSize, GetRecentEmojiStatuses, GetStory, GetStoryAvailableReactions, GetStoryInteractions, GetStoryNotificationSettingsExceptions, GetStoryPublicForwards, GetSuggestedFileName, GetThemedChatEmojiStatuses, GetThemedEmojiStatuses, GetUpgradedGiftEmojiStatuses, GetUserChatBoosts, LoadActiveStories, OpenStory, PostStory, PreliminaryUploadFile, ReadChatList, ReadFilePart, ReportStory, ResetAllNotificationSettings, SetChatActiveStoriesList, SetChatPinnedStories, SetFileGenerationProgress, SetPinnedChats, SetReactionNotificationSettings, SetStoryPrivacySettings, SetStoryReaction, ToggleAllDownloadsArePaused, ToggleBotIsAddedToAttachmentMenu, ToggleChatIsPinned, ToggleDownloadIsPaused, ToggleStoryIsPostedToChatPage, WriteGeneratedFilePart
+    from .functions_07 import AcceptCall, AddOffer, ApproveSuggestedPost, BanGroupCallParticipants, CheckChatInviteLink, CreateCall, CreateChatInviteLink, CreateChatSubscriptionInviteLink, CreateGroupCall, CreateVideoChat, DeclineGroupCallInvitation, DeclineSuggestedPost, DeleteAllRevokedChatInviteLinks, DeleteRevokedChatInviteLink, DiscardCall, EditChatInviteLink, EditChatSubscriptionInviteLink, EndGroupCallRecording, EndGroupCallScreenSharing, GetChatInviteLink, GetChatInviteLinkCounts, GetChatInviteLinkMembers, GetChatInviteLinks, GetChatJoinRequests, GetGroupCall, GetMessageFileType, GetMessageImportConfirmationText, GetVideoChatAvailableParticipants, GetVideoChatInviteLink, GetVideoChatRtmpUrl, ImportMessages, InviteGroupCallParticipant, InviteVideoChatParticipants, JoinChatByInviteLink, JoinGroupCall, JoinVideoChat, ProcessChatJoinRequest, ProcessChatJoinRequests, RemoveAllFilesFromDownloads, RemoveFileFromDownloads, ReplacePrimaryChatInviteLink, ReplaceVideoChatRtmpUrl, RevokeChatInviteLink, RevokeGroupCallInviteLink, SearchFileDownloads, SendCallDebugInformation, SendCallLog, SendCallRating, SendCallSignalingData, SetApplicationVerificationToken, SetGroupCallParticipantIsSpeaking, SetGroupCallParticipantVolumeLevel, SetVideoChatDefaultParticipant, SetVideoChatTitle, StartGroupCallRecording, StartGroupCallScreenSharing, StartScheduledVideoChat, ToggleGroupCallIsMyVideoEnabled, ToggleGroupCallIsMyVideoPaused, ToggleGroupCallParticipantIsHandRaised, ToggleGroupCallParticipantIsMuted, ToggleGroupCallScreenSharingIsPaused, ToggleVideoChatEnabledStartNotification, ToggleVideoChatMuteNewParticipants
+    from .functions_08 import AddContact, AddFavoriteSticker, AddRecentSticker, BlockMessageSenderFromReplies, ChangeImportedContacts, ChangeStickerSet, ClearImportedContacts, ClearRecentStickers, DecryptGroupCallData, EncryptGroupCallData, EndGroupCall, GetAllStickerEmojis, GetAnimatedEmoji, GetArchivedStickerSets, GetAttachedStickerSets, GetBlockedMessageSenders, GetCloseFriends, GetContacts, GetCustomEmojiStickers, GetDefaultBackgroundCustomEmojiStickers, GetDefaultChatPhotoCustomEmojiStickers, GetDefaultProfilePhotoCustomEmojiStickers, GetEmojiCategories, GetEmojiSuggestionsUrl, GetFavoriteStickers, GetGreetingStickers, GetGroupCallParticipants, GetImportedContactCount, GetInstalledStickerSets, GetKeywordEmojis, GetPremiumStickers, GetRecentStickers, GetSavedAnimations, GetStickerEmojis, GetStickerOutline, GetStickerSet, GetStickerSetName, GetStickers, GetTrendingStickerSets, GetUserProfilePhotos, GetVideoChatStreamSegment, GetVideoChatStreams, ImportContacts, LeaveGroupCall, LoadGroupCallParticipants, RemoveContacts, RemoveFavoriteSticker, RemoveRecentSticker, ReorderInstalledStickerSets, SearchContacts, SearchEmojis, SearchInstalledStickerSets, SearchStickerSet, SearchStickerSets, SearchStickers, SearchUserByPhoneNumber, SetCloseFriends, SetMessageSenderBlockList, SetUserEmojiStatus, SetUserPersonalProfilePhoto, SharePhoneNumber, SuggestUserProfilePhoto, ToggleBotCanManageEmojiStatus, ViewTrendingStickerSets
+    from .functions_09 import AddBotMediaPreview, AddSavedAnimation, AllowBotToSendMessages, CanBotSendMessages, CheckPhoneNumberCode, CreateBusinessChatLink, DeleteBotMediaPreviews, DeleteBusinessChatLink, DeleteBusinessConnectedBot, DeleteCommands, DeleteProfilePhoto, EditBotMediaPreview, EditBusinessChatLink, GetBotMediaPreviewInfo, GetBotMediaPreviews, GetBotName, GetBusinessChatLinkInfo, GetBusinessChatLinks, GetBusinessConnectedBot, GetCommands, GetLinkPreview, GetMenuButton, GetOwnedBots, GetRecentInlineBots, GetUserLink, GetWebPageInstantView, RemoveBusinessConnectedBotFromChat, RemoveRecentHashtag, RemoveSavedAnimation, ReorderActiveUsernames, ReorderBotActiveUsernames, ReorderBotMediaPreviews, ReportPhoneNumberCodeMissing, ResendPhoneNumberCode, SearchHashtags, SearchUserByToken, SendPhoneNumberCode, SendPhoneNumberFirebaseSms, SendWebAppCustomRequest, SetAccentColor, SetBio, SetBirthdate, SetBotName, SetBotProfilePhoto, SetBusinessAwayMessageSettings, SetBusinessConnectedBot, SetBusinessGreetingMessageSettings, SetBusinessLocation, SetBusinessOpeningHours, SetBusinessStartPage, SetCommands, SetDefaultChannelAdministratorRights, SetDefaultGroupAdministratorRights, SetEmojiStatus, SetMenuButton, SetName, SetPersonalChat, SetProfileAccentColor, SetProfilePhoto, SetUsername, ToggleBotUsernameIsActive, ToggleBusinessConnectedBotChatIsPaused, ToggleHasSponsoredMessagesEnabled, ToggleUsernameIsActive
+    from .functions_10 import CloseSecretChat, ConfirmSession, CreateInvoiceLink, DeleteSavedCredentials, DeleteSavedOrderInfo, DisableAllSupergroupUsernames, DisconnectAllWebsites, DisconnectWebsite, GetActiveSessions, GetAvailableGifts, GetBotInfoDescription, GetBotInfoShortDescription, GetChatEventLog, GetConnectedWebsites, GetGiftUpgradePreview, GetPaymentForm, GetPaymentReceipt, GetReceivedGift, GetReceivedGifts, GetSavedOrderInfo, GetSupergroupMembers, GetTimeZones, GetUpgradedGift, GetUpgradedGiftWithdrawalUrl, RemoveMessageSenderBotVerification, ReorderSupergroupActiveUsernames, ReportSupergroupAntiSpamFalsePositive, ReportSupergroupSpam, SearchGiftsForResale, SellGift, SendGift, SendPaymentForm, SendResoldGift, SetBotInfoDescription, SetBotInfoShortDescription, SetGiftResalePrice, SetGiftSettings, SetInactiveSessionTtl, SetMessageSenderBotVerification, SetPinnedGifts, SetSupergroupCustomEmojiStickerSet, SetSupergroupStickerSet, SetSupergroupUnrestrictBoostCount, SetSupergroupUsername, TerminateAllOtherSessions, TerminateSession, ToggleChatGiftNotifications, ToggleGiftIsSaved, ToggleSessionCanAcceptCalls, ToggleSessionCanAcceptSecretChats, ToggleSupergroupCanHaveSponsoredMessages, ToggleSupergroupHasAggressiveAntiSpamEnabled, ToggleSupergroupHasAutomaticTranslation, ToggleSupergroupHasHiddenMembers, ToggleSupergroupIsAllHistoryAvailable, ToggleSupergroupIsBroadcastGroup, ToggleSupergroupIsForum, ToggleSupergroupJoinByRequest, ToggleSupergroupJoinToSendMessages, ToggleSupergroupSignMessages, ToggleSupergroupUsernameIsActive, TransferGift, UpgradeGift, ValidateOrderInfo
+    from .functions_11 import AddCustomServerLanguagePack, AddNetworkStatistics, AllowUnpaidMessagesFromUser, CanSendMessageToUser, DeleteAccount, DeleteDefaultBackground, DeleteLanguagePack, EditCustomLanguagePackInfo, GetAccountTtl, GetAutoDownloadSettingsPresets, GetBackgroundUrl, GetChatRevenueStatistics, GetChatRevenueTransactions, GetChatRevenueWithdrawalUrl, GetChatStatistics, GetDatabaseStatistics, GetDefaultMessageAutoDeleteTime, GetInstalledBackgrounds, GetLanguagePackInfo, GetLanguagePackStrings, GetLocalizationTargetInfo, GetMessagePublicForwards, GetMessageStatistics, GetNetworkStatistics, GetNewChatPrivacySettings, GetOption, GetPaidMessageRevenue, GetPushReceiverId, GetReadDatePrivacySettings, GetRecentlyVisitedTMeUrls, GetStarAdAccountUrl, GetStarRevenueStatistics, GetStarWithdrawalUrl, GetStatisticalGraph, GetStorageStatistics, GetStorageStatisticsFast, GetStoryStatistics, GetSupportUser, GetTonTransactions, GetUserPrivacySettingRules, OptimizeStorage, ProcessPushNotification, RefundStarPayment, RegisterDevice, RemoveChatActionBar, RemoveInstalledBackground, ReportChat, ReportChatPhoto, ReportMessageReactions, ResetInstalledBackgrounds, ResetNetworkStatistics, SearchBackground, SetAccountTtl, SetChatPaidMessageStarCount, SetCustomLanguagePack, SetCustomLanguagePackString, SetDefaultBackground, SetDefaultMessageAutoDeleteTime, SetNetworkType, SetNewChatPrivacySettings, SetOption, SetReadDatePrivacySettings, SetUserPrivacySettingRules, SynchronizeLanguagePack
+    from .functions_12 import AddStickerToSet, ApplyPremiumGiftCode, AssignStoreTransaction, CanPurchaseFromStore, CheckEmailAddressVerificationCode, CheckPremiumGiftCode, CheckStickerSetName, ClearAutosaveSettingsExceptions, ClickPremiumSubscriptionButton, ConnectAffiliateProgram, CreateNewStickerSet, DeletePassportElement, DeleteStickerSet, DisconnectAffiliateProgram, EditStarSubscription, EditUserStarSubscription, GetAllPassportElements, GetAutosaveSettings, GetBankCardInfo, GetGiveawayInfo, GetMapThumbnailFile, GetOwnedStickerSets, GetPassportAuthorizationForm, GetPassportAuthorizationFormAvailableElements, GetPassportElement, GetPreferredCountryLanguage, GetPremiumFeatures, GetPremiumGiftPaymentOptions, GetPremiumGiveawayPaymentOptions, GetPremiumInfoSticker, GetPremiumLimit, GetPremiumState, GetPremiumStickerExamples, GetStarGiftPaymentOptions, GetStarGiveawayPaymentOptions, GetStarPaymentOptions, GetStarSubscriptions, GetStarTransactions, GetSuggestedStickerSetName, GiftPremiumWithStars, LaunchPrepaidGiveaway, RemoveStickerFromSet, ReplaceStickerInSet, ResendEmailAddressVerificationCode, ReuseStarSubscription, SearchAffiliatePrograms, SearchChatAffiliateProgram, SendEmailAddressVerificationCode, SendPassportAuthorizationForm, SetAutoDownloadSettings, SetAutosaveSettings, SetBotUpdatesStatus, SetChatAffiliateProgram, SetCustomEmojiStickerSetThumbnail, SetPassportElement, SetPassportElementErrors, SetStickerEmojis, SetStickerKeywords, SetStickerMaskPosition, SetStickerPositionInSet, SetStickerSetThumbnail, SetStickerSetTitle, UploadStickerFile, ViewPremiumFeature
+    from .functions_13 import AcceptTermsOfService, AddLogMessage, AddProxy, AnswerCustomQuery, DisableProxy, EditProxy, EnableProxy, GetApplicationConfig, GetApplicationDownloadLink, GetBusinessFeatures, GetCollectibleItemInfo, GetConnectedAffiliateProgram, GetConnectedAffiliatePrograms, GetCountries, GetCountryCode, GetDeepLinkInfo, GetLogStream, GetLogTagVerbosityLevel, GetLogTags, GetLogVerbosityLevel, GetPhoneNumberInfo, GetPhoneNumberInfoSync, GetProxies, GetProxyLink, GetSupportName, GetUserSupportInfo, PingProxy, RemoveProxy, SaveApplicationLogEvent, SearchStringsByPrefix, SendCustomRequest, SetAlarm, SetLogStream, SetLogTagVerbosityLevel, SetLogVerbosityLevel, SetUserSupportInfo, TestCallBytes, TestCallEmpty, TestCallString, TestCallVectorInt, TestCallVectorIntObject, TestCallVectorString, TestCallVectorStringObject, TestGetDifference, TestNetwork, TestProxy, TestReturnError, TestSquareInt, TestUseUpdate
+
+_MODULES = {
+    "Error": "classes_00",
+    "Ok": "classes_00",
+    "AuthenticationCodeType": "classes_00",
+    "AuthenticationCodeTypeTelegramMessage": "classes_00",
+    "AuthenticationCodeTypeSms": "classes_00",
+    "AuthenticationCodeTypeSmsWord": "classes_00",
+    "AuthenticationCodeTypeSmsPhrase": "classes_00",
+    "AuthenticationCodeTypeCall": "classes_00",
+    "AuthenticationCodeTypeFlashCall": "classes_00",
+    "AuthenticationCodeTypeMissedCall": "classes_00",
+    "AuthenticationCodeTypeFragment": "classes_00",
+    "AuthenticationCodeTypeFirebaseAndroid": "classes_00",
+    "AuthenticationCodeTypeFirebaseIos": "classes_00",
+    "AuthenticationCodeInfo": "classes_00",
+    "EmailAddressAuthenticationCodeInfo": "classes_00",
+    "EmailAddressAuthentication": "classes_00",
+    "EmailAddressAuthenticationCode": "classes_00",
+    "EmailAddressAuthenticationAppleId": "classes_00",
+    "EmailAddressAuthenticationGoogleId": "classes_00",
+    "EmailAddressResetState": "classes_00",
+    "EmailAddressResetStateAvailable": "classes_00",
+    "EmailAddressResetStatePending": "classes_00",
+    "TextEntity": "classes_00",
+    "TextEntities": "classes_00",
+    "FormattedText": "classes_00",
+    "TermsOfService": "classes_00",
+    "AuthorizationState": "classes_00",
+    "AuthorizationStateWaitTdlibParameters": "classes_00",
+    "AuthorizationStateWaitPhoneNumber": "classes_00",
+    "AuthorizationStateWaitPremiumPurchase": "classes_00",
+    "AuthorizationStateWaitEmailAddress": "classes_00",
+    "AuthorizationStateWaitEmailCode": "classes_00",
+    "AuthorizationStateWaitCode": "classes_00",
+    "AuthorizationStateWaitOtherDeviceConfirmation": "classes_00",
+    "AuthorizationStateWaitRegistration": "classes_00",
+    "AuthorizationStateWaitPassword": "classes_00",
+    "AuthorizationStateReady": "classes_00",
+    "AuthorizationStateLoggingOut": "classes_00",
+    "AuthorizationStateClosing": "classes_00",
+    "AuthorizationStateClosed": "classes_00",
+    "FirebaseDeviceVerificationParameters": "classes_00",
+    "FirebaseDeviceVerificationParametersSafetyNet": "classes_00",
+    "FirebaseDeviceVerificationParametersPlayIntegrity": "classes_00",
+    "PasswordState": "classes_00",
+    "RecoveryEmailAddress": "classes_00",
+    "TemporaryPasswordState": "classes_00",
+    "LocalFile": "classes_00",
+    "RemoteFile": "classes_00",
+    "File": "classes_00",
+    "InputFile": "classes_00",
+    "InputFileId": "classes_00",
+    "InputFileRemote": "classes_00",
+    "InputFileLocal": "classes_00",
+    "InputFileGenerated": "classes_00",
+    "PhotoSize": "classes_00",
+    "Minithumbnail": "classes_00",
+    "ThumbnailFormat": "classes_00",
+    "ThumbnailFormatJpeg": "classes_00",
+    "ThumbnailFormatGif": "classes_00",
+    "ThumbnailFormatMpeg4": "classes_00",
+    "ThumbnailFormatPng": "classes_00",
+    "ThumbnailFormatTgs": "classes_00",
+    "ThumbnailFormatWebm": "classes_00",
+    "ThumbnailFormatWebp": "classes_00",
+    "Thumbnail": "classes_01",
+    "MaskPoint": "classes_01",
+    "MaskPointForehead": "classes_01",
+    "MaskPointEyes": "classes_01",
+    "MaskPointMouth": "classes_01",
+    "MaskPointChin": "classes_01",
+    "MaskPosition": "classes_01",
+    "StickerFormat": "classes_01",
+    "StickerFormatWebp": "classes_01",
+    "StickerFormatTgs": "classes_01",
+    "StickerFormatWebm": "classes_01",
+    "StickerType": "classes_01",
+    "StickerTypeRegular": "classes_01",
+    "StickerTypeMask": "classes_01",
+    "StickerTypeCustomEmoji": "classes_01",
+    "StickerFullType": "classes_01",
+    "StickerFullTypeRegular": "classes_01",
+    "StickerFullTypeMask": "classes_01",
+    "StickerFullTypeCustomEmoji": "classes_01",
+    "ClosedVectorPath": "classes_01",
+    "Outline": "classes_01",
+    "PollOption": "classes_01",
+    "PollType": "classes_01",
+    "PollTypeRegular": "classes_01",
+    "PollTypeQuiz": "classes_01",
+    "ChecklistTask": "classes_01",
+    "InputChecklistTask": "classes_01",
+    "Checklist": "classes_01",
+    "InputChecklist": "classes_01",
+    "Animation": "classes_01",
+    "Audio": "classes_01",
+    "Document": "classes_01",
+    "Photo": "classes_01",
+    "Sticker": "classes_01",
+    "Video": "classes_01",
+    "VideoNote": "classes_01",
+    "VoiceNote": "classes_01",
+    "AnimatedEmoji": "classes_01",
+    "Contact": "classes_01",
+    "Location": "classes_01",
+    "Venue": "classes_01",
+    "Game": "classes_01",
+    "WebApp": "classes_01",
+    "Poll": "classes_01",
+    "AlternativeVideo": "classes_01",
+    "VideoStoryboard": "classes_01",
+    "Background": "classes_01",
+    "Backgrounds": "classes_01",
+    "ChatBackground": "classes_01",
+    "ProfilePhoto": "classes_01",
+    "ChatPhotoInfo": "classes_01",
+    "UserType": "classes_01",
+    "UserTypeRegular": "classes_01",
+    "UserTypeDeleted": "classes_01",
+    "UserTypeBot": "classes_01",
+    "UserTypeUnknown": "classes_01",
+    "BotCommand": "classes_01",
+    "BotCommands": "classes_01",
+    "BotMenuButton": "classes_01",
+    "BotVerificationParameters": "classes_01",
+    "BotVerification": "classes_01",
+    "VerificationStatus": "classes_01",
+    "ChatLocation": "classes_01",
+    "Birthdate": "classes_01",
+    "CloseBirthdayUser": "classes_02",
+    "BusinessAwayMessageSchedule": "classes_02",
+    "BusinessAwayMessageScheduleAlways": "classes_02",
+    "BusinessAwayMessageScheduleOutsideOfOpeningHours": "classes_02",
+    "BusinessAwayMessageScheduleCustom": "classes_02",
+    "BusinessLocation": "classes_02",
+    "BusinessRecipients": "classes_02",
+    "BusinessAwayMessageSettings": "classes_02",
+    "BusinessGreetingMessageSettings": "classes_02",
+    "BusinessBotRights": "classes_02",
+    "BusinessConnectedBot": "classes_02",
+    "BusinessStartPage": "classes_02",
+    "InputBusinessStartPage": "classes_02",
+    "BusinessOpeningHoursInterval": "classes_02",
+    "BusinessOpeningHours": "classes_02",
+    "BusinessInfo": "classes_02",
+    "BusinessChatLink": "classes_02",
+    "BusinessChatLinks": "classes_02",
+    "InputBusinessChatLink": "classes_02",
+    "BusinessChatLinkInfo": "classes_02",
+    "ChatPhotoStickerType": "classes_02",
+    "ChatPhotoStickerTypeRegularOrMask": "classes_02",
+    "ChatPhotoStickerTypeCustomEmoji": "classes_02",
+    "ChatPhotoSticker": "classes_02",
+    "AnimatedChatPhoto": "classes_02",
+    "ChatPhoto": "classes_02",
+    "ChatPhotos": "classes_02",
+    "InputChatPhoto": "classes_02",
+    "InputChatPhotoPrevious": "classes_02",
+    "InputChatPhotoStatic": "classes_02",
+    "InputChatPhotoAnimation": "classes_02",
+    "InputChatPhotoSticker": "classes_02",
+    "ChatPermissions": "classes_02",
+    "ChatAdministratorRights": "classes_02",
+    "SuggestedPostPrice": "classes_02",
+    "SuggestedPostPriceStar": "classes_02",
+    "SuggestedPostPriceTon": "classes_02",
+    "SuggestedPostState": "classes_02",
+    "SuggestedPostStatePending": "classes_02",
+    "SuggestedPostStateApproved": "classes_02",
+    "SuggestedPostStateDeclined": "classes_02",
+    "SuggestedPostInfo": "classes_02",
+    "InputSuggestedPostInfo": "classes_02",
+    "SuggestedPostRefundReason": "classes_02",
+    "SuggestedPostRefundReasonPostDeleted": "classes_02",
+    "SuggestedPostRefundReasonPaymentRefunded": "classes_02",
+    "StarAmount": "classes_02",
+    "StarSubscriptionType": "classes_02",
+    "StarSubscriptionTypeChannel": "classes_02",
+    "StarSubscriptionTypeBot": "classes_02",
+    "StarSubscriptionPricing": "classes_02",
+    "StarSubscription": "classes_02",
+    "StarSubscriptions": "classes_02",
+    "AffiliateType": "classes_02",
+    "AffiliateTypeCurrentUser": "classes_02",
+    "AffiliateTypeBot": "classes_02",
+    "AffiliateTypeChannel": "classes_02",
+    "AffiliateProgramSortOrder": "classes_02",
+    "AffiliateProgramSortOrderProfitability": "classes_02",
+    "AffiliateProgramSortOrderCreationDate": "classes_02",
+    "AffiliateProgramSortOrderRevenue": "classes_02",
+    "AffiliateProgramParameters": "classes_02",
+    "AffiliateProgramInfo": "classes_02",
+    "AffiliateInfo": "classes_02",
+    "FoundAffiliateProgram": "classes_03",
+    "FoundAffiliatePrograms": "classes_03",
+    "ConnectedAffiliateProgram": "classes_03",
+    "ConnectedAffiliatePrograms": "classes_03",
+    "ProductInfo": "classes_03",
+    "PremiumPaymentOption": "classes_03",
+    "PremiumStatePaymentOption": "classes_03",
+    "PremiumGiftPaymentOption": "classes_03",
+    "PremiumGiftPaymentOptions": "classes_03",
+    "PremiumGiveawayPaymentOption": "classes_03",
+    "PremiumGiveawayPaymentOptions": "classes_03",
+    "PremiumGiftCodeInfo": "classes_03",
+    "StarPaymentOption": "classes_03",
+    "StarPaymentOptions": "classes_03",
+    "StarGiveawayWinnerOption": "classes_03",
+    "StarGiveawayPaymentOption": "classes_03",
+    "StarGiveawayPaymentOptions": "classes_03",
+    "AcceptedGiftTypes": "classes_03",
+    "GiftSettings": "classes_03",
+    "UpgradedGiftOrigin": "classes_03",
+    "UpgradedGiftOriginUpgrade": "classes_03",
+    "UpgradedGiftOriginTransfer": "classes_03",
+    "UpgradedGiftOriginResale": "classes_03",
+    "UpgradedGiftModel": "classes_03",
+    "UpgradedGiftSymbol": "classes_03",
+    "UpgradedGiftBackdropColors": "classes_03",
+    "UpgradedGiftBackdrop": "classes_03",
+    "UpgradedGiftOriginalDetails": "classes_03",
+    "Gift": "classes_03",
+    "UpgradedGift": "classes_03",
+    "UpgradeGiftResult": "classes_03",
+    "AvailableGift": "classes_03",
+    "AvailableGifts": "classes_03",
+    "UpgradedGiftAttributeId": "classes_03",
+    "UpgradedGiftAttributeIdModel": "classes_03",
+    "UpgradedGiftAttributeIdSymbol": "classes_03",
+    "UpgradedGiftAttributeIdBackdrop": "classes_03",
+    "UpgradedGiftModelCount": "classes_03",
+    "UpgradedGiftSymbolCount": "classes_03",
+    "UpgradedGiftBackdropCount": "classes_03",
+    "GiftForResaleOrder": "classes_03",
+    "GiftForResaleOrderPrice": "classes_03",
+    "GiftForResaleOrderPriceChangeDate": "classes_03",
+    "GiftForResaleOrderNumber": "classes_03",
+    "GiftForResale": "classes_03",
+    "GiftsForResale": "classes_03",
+    "SentGift": "classes_03",
+    "SentGiftRegular": "classes_03",
+    "SentGiftUpgraded": "classes_03",
+    "ReceivedGift": "classes_03",
+    "ReceivedGifts": "classes_03",
+    "GiftUpgradePreview": "classes_03",
+    "TransactionDirection": "classes_03",
+    "TransactionDirectionIncoming": "classes_03",
+    "TransactionDirectionOutgoing": "classes_03",
+    "StarTransactionType": "classes_03",
+    "StarTransactionTypePremiumBotDeposit": "classes_03",
+    "StarTransactionTypeAppStoreDeposit": "classes_03",
+    "StarTransactionTypeGooglePlayDeposit": "classes_03",
+    "StarTransactionTypeFragmentDeposit": "classes_03",
+    "StarTransactionTypeUserDeposit": "classes_03",
+    "StarTransactionTypeGiveawayDeposit": "classes_03",
+    "StarTransactionTypeFragmentWithdrawal": "classes_03",
+    "StarTransactionTypeTelegramAdsWithdrawal": "classes_03",
+    "StarTransactionTypeTelegramApiUsage": "classes_03",
+    "StarTransactionTypeBotPaidMediaPurchase": "classes_03",
+    "StarTransactionTypeBotPaidMediaSale": "classes_03",
+    "StarTransactionTypeChannelPaidMediaPurchase": "classes_03",
+    "StarTransactionTypeChannelPaidMediaSale": "classes_03",
+    "StarTransactionTypeBotInvoicePurchase": "classes_03",
+    "StarTransactionTypeBotInvoiceSale": "classes_03",
+    "StarTransactionTypeBotSubscriptionPurchase": "classes_03",
+    "StarTransactionTypeBotSubscriptionSale": "classes_03",
+    "StarTransactionTypeChannelSubscriptionPurchase": "classes_03",
+    "StarTransactionTypeChannelSubscriptionSale": "classes_03",
+    "StarTransactionTypeGiftPurchase": "classes_03",
+    "StarTransactionTypeGiftTransfer": "classes_03",
+    "StarTransactionTypeGiftSale": "classes_03",
+    "StarTransactionTypeGiftUpgrade": "classes_03",
+    "StarTransactionTypeUpgradedGiftPurchase": "classes_03",
+    "StarTransactionTypeUpgradedGiftSale": "classes_03",
+    "StarTransactionTypeChannelPaidReactionSend": "classes_03",
+    "StarTransactionTypeChannelPaidReactionReceive": "classes_03",
+    "StarTransactionTypeAffiliateProgramCommission": "classes_03",
+    "StarTransactionTypePaidMessageSend": "classes_03",
+    "StarTransactionTypePaidMessageReceive": "classes_03",
+    "StarTransactionTypeSuggestedPostPaymentSend": "classes_03",
+    "StarTransactionTypeSuggestedPostPaymentReceive": "classes_03",
+    "StarTransactionTypePremiumPurchase": "classes_03",
+    "StarTransactionTypeBusinessBotTransferSend": "classes_03",
+    "StarTransactionTypeBusinessBotTransferReceive": "classes_03",
+    "StarTransactionTypeUnsupported": "classes_03",
+    "StarTransaction": "classes_04",
+    "StarTransactions": "classes_04",
+    "TonTransactionType": "classes_04",
+    "TonTransactionTypeFragmentDeposit": "classes_04",
+    "TonTransactionTypeSuggestedPostPayment": "classes_04",
+    "TonTransactionTypeUnsupported": "classes_04",
+    "TonTransaction": "classes_04",
+    "TonTransactions": "classes_04",
+    "GiveawayParticipantStatus": "classes_04",
+    "GiveawayParticipantStatusEligible": "classes_04",
+    "GiveawayParticipantStatusParticipating": "classes_04",
+    "GiveawayParticipantStatusAlreadyWasMember": "classes_04",
+    "GiveawayParticipantStatusAdministrator": "classes_04",
+    "GiveawayParticipantStatusDisallowedCountry": "classes_04",
+    "GiveawayInfo": "classes_04",
+    "GiveawayInfoOngoing": "classes_04",
+    "GiveawayInfoCompleted": "classes_04",
+    "GiveawayPrize": "classes_04",
+    "GiveawayPrizePremium": "classes_04",
+    "GiveawayPrizeStars": "classes_04",
+    "AccentColor": "classes_04",
+    "ProfileAccentColors": "classes_04",
+    "ProfileAccentColor": "classes_04",
+    "EmojiStatusType": "classes_04",
+    "EmojiStatusTypeCustomEmoji": "classes_04",
+    "EmojiStatusTypeUpgradedGift": "classes_04",
+    "EmojiStatus": "classes_04",
+    "EmojiStatuses": "classes_04",
+    "EmojiStatusCustomEmojis": "classes_04",
+    "Usernames": "classes_04",
+    "User": "classes_04",
+    "BotInfo": "classes_04",
+    "UserFullInfo": "classes_04",
+    "Users": "classes_04",
+    "FoundUsers": "classes_04",
+    "ChatAdministrator": "classes_04",
+    "ChatAdministrators": "classes_04",
+    "ChatMemberStatus": "classes_04",
+    "ChatMemberStatusCreator": "classes_04",
+    "ChatMemberStatusAdministrator": "classes_04",
+    "ChatMemberStatusMember": "classes_04",
+    "ChatMemberStatusRestricted": "classes_04",
+    "ChatMemberStatusLeft": "classes_04",
+    "ChatMemberStatusBanned": "classes_04",
+    "ChatMember": "classes_04",
+    "ChatMembers": "classes_04",
+    "ChatMembersFilter": "classes_04",
+    "ChatMembersFilterContacts": "classes_04",
+    "ChatMembersFilterAdministrators": "classes_04",
+    "ChatMembersFilterMembers": "classes_04",
+    "ChatMembersFilterMention": "classes_04",
+    "ChatMembersFilterRestricted": "classes_04",
+    "ChatMembersFilterBanned": "classes_04",
+    "ChatMembersFilterBots": "classes_04",
+    "SupergroupMembersFilter": "classes_04",
+    "SupergroupMembersFilterRecent": "classes_04",
+    "SupergroupMembersFilterContacts": "classes_04",
+    "SupergroupMembersFilterAdministrators": "classes_04",
+    "SupergroupMembersFilterSearch": "classes_04",
+    "SupergroupMembersFilterRestricted": "classes_04",
+    "SupergroupMembersFilterBanned": "classes_04",
+    "SupergroupMembersFilterMention": "classes_04",
+    "SupergroupMembersFilterBots": "classes_04",
+    "ChatInviteLink": "classes_04",
+    "ChatInviteLinks": "classes_05",
+    "ChatInviteLinkCount": "classes_05",
+    "ChatInviteLinkCounts": "classes_05",
+    "ChatInviteLinkMember": "classes_05",
+    "ChatInviteLinkMembers": "classes_05",
+    "InviteLinkChatType": "classes_05",
+    "InviteLinkChatTypeBasicGroup": "classes_05",
+    "InviteLinkChatTypeSupergroup": "classes_05",
+    "InviteLinkChatTypeChannel": "classes_05",
+    "ChatInviteLinkSubscriptionInfo": "classes_05",
+    "ChatInviteLinkInfo": "classes_05",
+    "ChatJoinRequest": "classes_05",
+    "ChatJoinRequests": "classes_05",
+    "ChatJoinRequestsInfo": "classes_05",
+    "BasicGroup": "classes_05",
+    "BasicGroupFullInfo": "classes_05",
+    "Supergroup": "classes_05",
+    "SupergroupFullInfo": "classes_05",
+    "SecretChatState": "classes_05",
+    "SecretChatStatePending": "classes_05",
+    "SecretChatStateReady": "classes_05",
+    "SecretChatStateClosed": "classes_05",
+    "SecretChat": "classes_05",
+    "MessageSender": "classes_05",
+    "MessageSenderUser": "classes_05",
+    "MessageSenderChat": "classes_05",
+    "MessageSenders": "classes_05",
+    "ChatMessageSender": "classes_05",
+    "ChatMessageSenders": "classes_05",
+    "MessageReadDate": "classes_05",
+    "MessageReadDateRead": "classes_05",
+    "MessageReadDateUnread": "classes_05",
+    "MessageReadDateTooOld": "classes_05",
+    "MessageReadDateUserPrivacyRestricted": "classes_05",
+    "MessageReadDateMyPrivacyRestricted": "classes_05",
+    "MessageViewer": "classes_05",
+    "MessageViewers": "classes_05",
+    "MessageOrigin": "classes_05",
+    "MessageOriginUser": "classes_05",
+    "MessageOriginHiddenUser": "classes_05",
+    "MessageOriginChat": "classes_05",
+    "MessageOriginChannel": "classes_05",
+    "ForwardSource": "classes_05",
+    "ReactionType": "classes_05",
+    "ReactionTypeEmoji": "classes_05",
+    "ReactionTypeCustomEmoji": "classes_05",
+    "ReactionTypePaid": "classes_05",
+    "PaidReactionType": "classes_05",
+    "PaidReactionTypeRegular": "classes_05",
+    "PaidReactionTypeAnonymous": "classes_05",
+    "PaidReactionTypeChat": "classes_05",
+    "PaidReactor": "classes_05",
+    "MessageForwardInfo": "classes_05",
+    "MessageImportInfo": "classes_05",
+    "MessageReplyInfo": "classes_05",
+    "MessageReaction": "classes_05",
+    "MessageReactions": "classes_05",
+    "MessageInteractionInfo": "classes_05",
+    "UnreadReaction": "classes_05",
+    "MessageTopic": "classes_05",
+    "MessageTopicForum": "classes_05",
+    "MessageTopicDirectMessages": "classes_05",
+    "MessageTopicSavedMessages": "classes_05",
+    "MessageEffectType": "classes_05",
+    "MessageEffectTypeEmojiReaction": "classes_05",
+    "MessageEffectTypePremiumSticker": "classes_05",
+    "MessageEffect": "classes_06",
+    "MessageSendingState": "classes_06",
+    "MessageSendingStatePending": "classes_06",
+    "MessageSendingStateFailed": "classes_06",
+    "TextQuote": "classes_06",
+    "InputTextQuote": "classes_06",
+    "MessageReplyTo": "classes_06",
+    "MessageReplyToMessage": "classes_06",
+    "MessageReplyToStory": "classes_06",
+    "InputMessageReplyTo": "classes_06",
+    "InputMessageReplyToMessage": "classes_06",
+    "InputMessageReplyToExternalMessage": "classes_06",
+    "InputMessageReplyToStory": "classes_06",
+    "FactCheck": "classes_06",
+    "Message": "classes_06",
+    "Messages": "classes_06",
+    "FoundMessages": "classes_06",
+    "FoundChatMessages": "classes_06",
+    "MessagePosition": "classes_06",
+    "MessagePositions": "classes_06",
+    "MessageCalendarDay": "classes_06",
+    "MessageCalendar": "classes_06",
+    "BusinessMessage": "classes_06",
+    "BusinessMessages": "classes_06",
+    "MessageSource": "classes_06",
+    "MessageSourceChatHistory": "classes_06",
+    "MessageSourceMessageThreadHistory": "classes_06",
+    "MessageSourceForumTopicHistory": "classes_06",
+    "MessageSourceDirectMessagesChatTopicHistory": "classes_06",
+    "MessageSourceHistoryPreview": "classes_06",
+    "MessageSourceChatList": "classes_06",
+    "MessageSourceSearch": "classes_06",
+    "MessageSourceChatEventLog": "classes_06",
+    "MessageSourceNotification": "classes_06",
+    "MessageSourceScreenshot": "classes_06",
+    "MessageSourceOther": "classes_06",
+    "AdvertisementSponsor": "classes_06",
+    "SponsoredMessage": "classes_06",
+    "SponsoredMessages": "classes_06",
+    "SponsoredChat": "classes_06",
+    "SponsoredChats": "classes_06",
+    "VideoMessageAdvertisement": "classes_06",
+    "VideoMessageAdvertisements": "classes_06",
+    "ReportOption": "classes_06",
+    "ReportSponsoredResult": "classes_06",
+    "ReportSponsoredResultOk": "classes_06",
+    "ReportSponsoredResultFailed": "classes_06",
+    "ReportSponsoredResultOptionRequired": "classes_06",
+    "ReportSponsoredResultAdsHidden": "classes_06",
+    "ReportSponsoredResultPremiumRequired": "classes_06",
+    "FileDownload": "classes_06",
+    "DownloadedFileCounts": "classes_06",
+    "FoundFileDownloads": "classes_06",
+    "NotificationSettingsScope": "classes_06",
+    "NotificationSettingsScopePrivateChats": "classes_06",
+    "NotificationSettingsScopeGroupChats": "classes_06",
+    "NotificationSettingsScopeChannelChats": "classes_06",
+    "ChatNotificationSettings": "classes_06",
+    "ScopeNotificationSettings": "classes_06",
+    "ReactionNotificationSource": "classes_06",
+    "ReactionNotificationSourceNone": "classes_06",
+    "ReactionNotificationSourceContacts": "classes_06",
+    "ReactionNotificationSourceAll": "classes_06",
+    "ReactionNotificationSettings": "classes_06",
+    "DraftMessage": "classes_07",
+    "ChatType": "classes_07",
+    "ChatTypePrivate": "classes_07",
+    "ChatTypeBasicGroup": "classes_07",
+    "ChatTypeSupergroup": "classes_07",
+    "ChatTypeSecret": "classes_07",
+    "ChatFolderIcon": "classes_07",
+    "ChatFolderName": "classes_07",
+    "ChatFolder": "classes_07",
+    "ChatFolderInfo": "classes_07",
+    "ChatFolderInviteLink": "classes_07",
+    "ChatFolderInviteLinks": "classes_07",
+    "ChatFolderInviteLinkInfo": "classes_07",
+    "RecommendedChatFolder": "classes_07",
+    "RecommendedChatFolders": "classes_07",
+    "ArchiveChatListSettings": "classes_07",
+    "ChatList": "classes_07",
+    "ChatListMain": "classes_07",
+    "ChatListArchive": "classes_07",
+    "ChatListFolder": "classes_07",
+    "ChatLists": "classes_07",
+    "ChatSource": "classes_07",
+    "ChatSourceMtprotoProxy": "classes_07",
+    "ChatSourcePublicServiceAnnouncement": "classes_07",
+    "ChatPosition": "classes_07",
+    "ChatAvailableReactions": "classes_07",
+    "ChatAvailableReactionsAll": "classes_07",
+    "ChatAvailableReactionsSome": "classes_07",
+    "SavedMessagesTag": "classes_07",
+    "SavedMessagesTags": "classes_07",
+    "BusinessBotManageBar": "classes_07",
+    "VideoChat": "classes_07",
+    "Chat": "classes_07",
+    "Chats": "classes_07",
+    "FailedToAddMember": "classes_07",
+    "FailedToAddMembers": "classes_07",
+    "CreatedBasicGroupChat": "classes_07",
+    "PublicChatType": "classes_07",
+    "PublicChatTypeHasUsername": "classes_07",
+    "PublicChatTypeIsLocationBased": "classes_07",
+    "AccountInfo": "classes_07",
+    "ChatActionBar": "classes_07",
+    "ChatActionBarReportSpam": "classes_07",
+    "ChatActionBarInviteMembers": "classes_07",
+    "ChatActionBarReportAddBlock": "classes_07",
+    "ChatActionBarAddContact": "classes_07",
+    "ChatActionBarSharePhoneNumber": "classes_07",
+    "ChatActionBarJoinRequest": "classes_07",
+    "KeyboardButtonType": "classes_07",
+    "KeyboardButtonTypeText": "classes_07",
+    "KeyboardButtonTypeRequestPhoneNumber": "classes_07",
+    "KeyboardButtonTypeRequestLocation": "classes_07",
+    "KeyboardButtonTypeRequestPoll": "classes_07",
+    "KeyboardButtonTypeRequestUsers": "classes_07",
+    "KeyboardButtonTypeRequestChat": "classes_07",
+    "KeyboardButtonTypeWebApp": "classes_07",
+    "KeyboardButton": "classes_07",
+    "InlineKeyboardButtonType": "classes_07",
+    "InlineKeyboardButtonTypeUrl": "classes_07",
+    "InlineKeyboardButtonTypeLoginUrl": "classes_07",
+    "InlineKeyboardButtonTypeWebApp": "classes_07",
+    "InlineKeyboardButtonTypeCallback": "classes_07",
+    "InlineKeyboardButtonTypeCallbackWithPassword": "classes_07",
+    "InlineKeyboardButtonTypeCallbackGame": "classes_07",
+    "InlineKeyboardButtonTypeSwitchInline": "classes_07",
+    "InlineKeyboardButtonTypeBuy": "classes_07",
+    "InlineKeyboardButtonTypeUser": "classes_07",
+    "InlineKeyboardButtonTypeCopyText": "classes_07",
+    "InlineKeyboardButton": "classes_08",
+    "ReplyMarkup": "classes_08",
+    "ReplyMarkupRemoveKeyboard": "classes_08",
+    "ReplyMarkupForceReply": "classes_08",
+    "ReplyMarkupShowKeyboard": "classes_08",
+    "ReplyMarkupInlineKeyboard": "classes_08",
+    "LoginUrlInfo": "classes_08",
+    "LoginUrlInfoOpen": "classes_08",
+    "LoginUrlInfoRequestConfirmation": "classes_08",
+    "ThemeParameters": "classes_08",
+    "WebAppOpenMode": "classes_08",
+    "WebAppOpenModeCompact": "classes_08",
+    "WebAppOpenModeFullSize": "classes_08",
+    "WebAppOpenModeFullScreen": "classes_08",
+    "FoundWebApp": "classes_08",
+    "WebAppInfo": "classes_08",
+    "MainWebApp": "classes_08",
+    "WebAppOpenParameters": "classes_08",
+    "MessageThreadInfo": "classes_08",
+    "SavedMessagesTopicType": "classes_08",
+    "SavedMessagesTopicTypeMyNotes": "classes_08",
+    "SavedMessagesTopicTypeAuthorHidden": "classes_08",
+    "SavedMessagesTopicTypeSavedFromChat": "classes_08",
+    "SavedMessagesTopic": "classes_08",
+    "DirectMessagesChatTopic": "classes_08",
+    "ForumTopicIcon": "classes_08",
+    "ForumTopicInfo": "classes_08",
+    "ForumTopic": "classes_08",
+    "ForumTopics": "classes_08",
+    "LinkPreviewOptions": "classes_08",
+    "SharedUser": "classes_08",
+    "SharedChat": "classes_08",
+    "ThemeSettings": "classes_08",
+    "RichText": "classes_08",
+    "RichTextPlain": "classes_08",
+    "RichTextBold": "classes_08",
+    "RichTextItalic": "classes_08",
+    "RichTextUnderline": "classes_08",
+    "RichTextStrikethrough": "classes_08",
+    "RichTextFixed": "classes_08",
+    "RichTextUrl": "classes_08",
+    "RichTextEmailAddress": "classes_08",
+    "RichTextSubscript": "classes_08",
+    "RichTextSuperscript": "classes_08",
+    "RichTextMarked": "classes_08",
+    "RichTextPhoneNumber": "classes_08",
+    "RichTextIcon": "classes_08",
+    "RichTextReference": "classes_08",
+    "RichTextAnchor": "classes_08",
+    "RichTextAnchorLink": "classes_08",
+    "RichTexts": "classes_08",
+    "PageBlockCaption": "classes_08",
+    "PageBlockListItem": "classes_08",
+    "PageBlockHorizontalAlignment": "classes_08",
+    "PageBlockHorizontalAlignmentLeft": "classes_08",
+    "PageBlockHorizontalAlignmentCenter": "classes_08",
+    "PageBlockHorizontalAlignmentRight": "classes_08",
+    "PageBlockVerticalAlignment": "classes_08",
+    "PageBlockVerticalAlignmentTop": "classes_08",
+    "PageBlockVerticalAlignmentMiddle": "classes_08",
+    "PageBlockVerticalAlignmentBottom": "classes_08",
+    "PageBlockTableCell": "classes_08",
+    "PageBlockRelatedArticle": "classes_08",
+    "PageBlock": "classes_08",
+    "PageBlockTitle": "classes_08",
+    "PageBlockSubtitle": "classes_08",
+    "PageBlockAuthorDate": "classes_08",
+    "PageBlockHeader": "classes_08",
+    "PageBlockSubheader": "classes_08",
+    "PageBlockKicker": "classes_08",
+    "PageBlockParagraph": "classes_08",
+    "PageBlockPreformatted": "classes_08",
+    "PageBlockFooter": "classes_08",
+    "PageBlockDivider": "classes_08",
+    "PageBlockAnchor": "classes_08",
+    "PageBlockList": "classes_08",
+    "PageBlockBlockQuote": "classes_08",
+    "PageBlockPullQuote": "classes_08",
+    "PageBlockAnimation": "classes_08",
+    "PageBlockAudio": "classes_08",
+    "PageBlockPhoto": "classes_08",
+    "PageBlockVideo": "classes_08",
+    "PageBlockVoiceNote": "classes_08",
+    "PageBlockCover": "classes_08",
+    "PageBlockEmbedded": "classes_08",
+    "PageBlockEmbeddedPost": "classes_08",
+    "PageBlockCollage": "classes_08",
+    "PageBlockSlideshow": "classes_08",
+    "PageBlockChatLink": "classes_08",
+    "PageBlockTable": "classes_08",
+    "PageBlockDetails": "classes_08",
+    "PageBlockRelatedArticles": "classes_08",
+    "PageBlockMap": "classes_08",
+    "WebPageInstantView": "classes_09",
+    "LinkPreviewAlbumMedia": "classes_09",
+    "LinkPreviewAlbumMediaPhoto": "classes_09",
+    "LinkPreviewAlbumMediaVideo": "classes_09",
+    "LinkPreviewType": "classes_09",
+    "LinkPreviewTypeAlbum": "classes_09",
+    "LinkPreviewTypeAnimation": "classes_09",
+    "LinkPreviewTypeApp": "classes_09",
+    "LinkPreviewTypeArticle": "classes_09",
+    "LinkPreviewTypeAudio": "classes_09",
+    "LinkPreviewTypeBackground": "classes_09",
+    "LinkPreviewTypeChannelBoost": "classes_09",
+    "LinkPreviewTypeChat": "classes_09",
+    "LinkPreviewTypeDocument": "classes_09",
+    "LinkPreviewTypeEmbeddedAnimationPlayer": "classes_09",
+    "LinkPreviewTypeEmbeddedAudioPlayer": "classes_09",
+    "LinkPreviewTypeEmbeddedVideoPlayer": "classes_09",
+    "LinkPreviewTypeExternalAudio": "classes_09",
+    "LinkPreviewTypeExternalVideo": "classes_09",
+    "LinkPreviewTypeGroupCall": "classes_09",
+    "LinkPreviewTypeInvoice": "classes_09",
+    "LinkPreviewTypeMessage": "classes_09",
+    "LinkPreviewTypePhoto": "classes_09",
+    "LinkPreviewTypePremiumGiftCode": "classes_09",
+    "LinkPreviewTypeShareableChatFolder": "classes_09",
+    "LinkPreviewTypeSticker": "classes_09",
+    "LinkPreviewTypeStickerSet": "classes_09",
+    "LinkPreviewTypeStory": "classes_09",
+    "LinkPreviewTypeSupergroupBoost": "classes_09",
+    "LinkPreviewTypeTheme": "classes_09",
+    "LinkPreviewTypeUnsupported": "classes_09",
+    "LinkPreviewTypeUpgradedGift": "classes_09",
+    "LinkPreviewTypeUser": "classes_09",
+    "LinkPreviewTypeVideo": "classes_09",
+    "LinkPreviewTypeVideoChat": "classes_09",
+    "LinkPreviewTypeVideoNote": "classes_09",
+    "LinkPreviewTypeVoiceNote": "classes_09",
+    "LinkPreviewTypeWebApp": "classes_09",
+    "LinkPreview": "classes_09",
+    "CountryInfo": "classes_09",
+    "Countries": "classes_09",
+    "PhoneNumberInfo": "classes_09",
+    "CollectibleItemType": "classes_09",
+    "CollectibleItemTypeUsername": "classes_09",
+    "CollectibleItemTypePhoneNumber": "classes_09",
+    "CollectibleItemInfo": "classes_09",
+    "BankCardActionOpenUrl": "classes_09",
+    "BankCardInfo": "classes_09",
+    "Address": "classes_09",
+    "LocationAddress": "classes_09",
+    "LabeledPricePart": "classes_09",
+    "Invoice": "classes_09",
+    "OrderInfo": "classes_09",
+    "ShippingOption": "classes_09",
+    "SavedCredentials": "classes_09",
+    "InputCredentials": "classes_09",
+    "InputCredentialsSaved": "classes_09",
+    "InputCredentialsNew": "classes_09",
+    "InputCredentialsApplePay": "classes_09",
+    "InputCredentialsGooglePay": "classes_09",
+    "PaymentProvider": "classes_09",
+    "PaymentProviderSmartGlocal": "classes_09",
+    "PaymentProviderStripe": "classes_09",
+    "PaymentProviderOther": "classes_09",
+    "PaymentOption": "classes_10",
+    "PaymentFormType": "classes_10",
+    "PaymentFormTypeRegular": "classes_10",
+    "PaymentFormTypeStars": "classes_10",
+    "PaymentFormTypeStarSubscription": "classes_10",
+    "PaymentForm": "classes_10",
+    "ValidatedOrderInfo": "classes_10",
+    "PaymentResult": "classes_10",
+    "PaymentReceiptType": "classes_10",
+    "PaymentReceiptTypeRegular": "classes_10",
+    "PaymentReceiptTypeStars": "classes_10",
+    "PaymentReceipt": "classes_10",
+    "InputInvoice": "classes_10",
+    "InputInvoiceMessage": "classes_10",
+    "InputInvoiceName": "classes_10",
+    "InputInvoiceTelegram": "classes_10",
+    "PaidMedia": "classes_10",
+    "PaidMediaPreview": "classes_10",
+    "PaidMediaPhoto": "classes_10",
+    "PaidMediaVideo": "classes_10",
+    "PaidMediaUnsupported": "classes_10",
+    "GiveawayParameters": "classes_10",
+    "DatedFile": "classes_10",
+    "PassportElementType": "classes_10",
+    "PassportElementTypePersonalDetails": "classes_10",
+    "PassportElementTypePassport": "classes_10",
+    "PassportElementTypeDriverLicense": "classes_10",
+    "PassportElementTypeIdentityCard": "classes_10",
+    "PassportElementTypeInternalPassport": "classes_10",
+    "PassportElementTypeAddress": "classes_10",
+    "PassportElementTypeUtilityBill": "classes_10",
+    "PassportElementTypeBankStatement": "classes_10",
+    "PassportElementTypeRentalAgreement": "classes_10",
+    "PassportElementTypePassportRegistration": "classes_10",
+    "PassportElementTypeTemporaryRegistration": "classes_10",
+    "PassportElementTypePhoneNumber": "classes_10",
+    "PassportElementTypeEmailAddress": "classes_10",
+    "Date": "classes_10",
+    "PersonalDetails": "classes_10",
+    "IdentityDocument": "classes_10",
+    "InputIdentityDocument": "classes_10",
+    "PersonalDocument": "classes_10",
+    "InputPersonalDocument": "classes_10",
+    "PassportElement": "classes_10",
+    "PassportElementPersonalDetails": "classes_10",
+    "PassportElementPassport": "classes_10",
+    "PassportElementDriverLicense": "classes_10",
+    "PassportElementIdentityCard": "classes_10",
+    "PassportElementInternalPassport": "classes_10",
+    "PassportElementAddress": "classes_10",
+    "PassportElementUtilityBill": "classes_10",
+    "PassportElementBankStatement": "classes_10",
+    "PassportElementRentalAgreement": "classes_10",
+    "PassportElementPassportRegistration": "classes_10",
+    "PassportElementTemporaryRegistration": "classes_10",
+    "PassportElementPhoneNumber": "classes_10",
+    "PassportElementEmailAddress": "classes_10",
+    "InputPassportElement": "classes_10",
+    "InputPassportElementPersonalDetails": "classes_10",
+    "InputPassportElementPassport": "classes_10",
+    "InputPassportElementDriverLicense": "classes_10",
+    "InputPassportElementIdentityCard": "classes_10",
+    "InputPassportElementInternalPassport": "classes_10",
+    "InputPassportElementAddress": "classes_10",
+    "InputPassportElementUtilityBill": "classes_10",
+    "InputPassportElementBankStatement": "classes_10",
+    "InputPassportElementRentalAgreement": "classes_10",
+    "InputPassportElementPassportRegistration": "classes_10",
+    "InputPassportElementTemporaryRegistration": "classes_10",
+    "InputPassportElementPhoneNumber": "classes_10",
+    "InputPassportElementEmailAddress": "classes_10",
+    "PassportElements": "classes_11",
+    "PassportElementErrorSource": "classes_11",
+    "PassportElementErrorSourceUnspecified": "classes_11",
+    "PassportElementErrorSourceDataField": "classes_11",
+    "PassportElementErrorSourceFrontSide": "classes_11",
+    "PassportElementErrorSourceReverseSide": "classes_11",
+    "PassportElementErrorSourceSelfie": "classes_11",
+    "PassportElementErrorSourceTranslationFile": "classes_11",
+    "PassportElementErrorSourceTranslationFiles": "classes_11",
+    "PassportElementErrorSourceFile": "classes_11",
+    "PassportElementErrorSourceFiles": "classes_11",
+    "PassportElementError": "classes_11",
+    "PassportSuitableElement": "classes_11",
+    "PassportRequiredElement": "classes_11",
+    "PassportAuthorizationForm": "classes_11",
+    "PassportElementsWithErrors": "classes_11",
+    "EncryptedCredentials": "classes_11",
+    "EncryptedPassportElement": "classes_11",
+    "InputPassportElementErrorSource": "classes_11",
+    "InputPassportElementErrorSourceUnspecified": "classes_11",
+    "InputPassportElementErrorSourceDataField": "classes_11",
+    "InputPassportElementErrorSourceFrontSide": "classes_11",
+    "InputPassportElementErrorSourceReverseSide": "classes_11",
+    "InputPassportElementErrorSourceSelfie": "classes_11",
+    "InputPassportElementErrorSourceTranslationFile": "classes_11",
+    "InputPassportElementErrorSourceTranslationFiles": "classes_11",
+    "InputPassportElementErrorSourceFile": "classes_11",
+    "InputPassportElementErrorSourceFiles": "classes_11",
+    "InputPassportElementError": "classes_11",
+    "MessageContent": "classes_11",
+    "MessageText": "classes_11",
+    "MessageAnimation": "classes_11",
+    "MessageAudio": "classes_11",
+    "MessageDocument": "classes_11",
+    "MessagePaidMedia": "classes_11",
+    "MessagePhoto": "classes_11",
+    "MessageSticker": "classes_11",
+    "MessageVideo": "classes_11",
+    "MessageVideoNote": "classes_11",
+    "MessageVoiceNote": "classes_11",
+    "MessageExpiredPhoto": "classes_11",
+    "MessageExpiredVideo": "classes_11",
+    "MessageExpiredVideoNote": "classes_11",
+    "MessageExpiredVoiceNote": "classes_11",
+    "MessageLocation": "classes_11",
+    "MessageVenue": "classes_11",
+    "MessageContact": "classes_11",
+    "MessageAnimatedEmoji": "classes_11",
+    "MessageDice": "classes_11",
+    "MessageGame": "classes_11",
+    "MessagePoll": "classes_11",
+    "MessageStory": "classes_11",
+    "MessageChecklist": "classes_11",
+    "MessageInvoice": "classes_11",
+    "MessageCall": "classes_11",
+    "MessageGroupCall": "classes_11",
+    "MessageVideoChatScheduled": "classes_11",
+    "MessageVideoChatStarted": "classes_11",
+    "MessageVideoChatEnded": "classes_11",
+    "MessageInviteVideoChatParticipants": "classes_11",
+    "MessageBasicGroupChatCreate": "classes_11",
+    "MessageSupergroupChatCreate": "classes_11",
+    "MessageChatChangeTitle": "classes_11",
+    "MessageChatChangePhoto": "classes_11",
+    "MessageChatDeletePhoto": "classes_11",
+    "MessageChatAddMembers": "classes_11",
+    "MessageChatJoinByLink": "classes_11",
+    "MessageChatJoinByRequest": "classes_11",
+    "MessageChatDeleteMember": "classes_11",
+    "MessageChatUpgradeTo": "classes_11",
+    "MessageChatUpgradeFrom": "classes_11",
+    "MessagePinMessage": "classes_11",
+    "MessageScreenshotTaken": "classes_11",
+    "MessageChatSetBackground": "classes_11",
+    "MessageChatSetTheme": "classes_11",
+    "MessageChatSetMessageAutoDeleteTime": "classes_11",
+    "MessageChatBoost": "classes_11",
+    "MessageForumTopicCreated": "classes_11",
+    "MessageForumTopicEdited": "classes_11",
+    "MessageForumTopicIsClosedToggled": "classes_11",
+    "MessageForumTopicIsHiddenToggled": "classes_11",
+    "MessageSuggestProfilePhoto": "classes_11",
+    "MessageCustomServiceAction": "classes_11",
+    "MessageGameScore": "classes_11",
+    "MessagePaymentSuccessful": "classes_11",
+    "MessagePaymentSuccessfulBot": "classes_11",
+    "MessagePaymentRefunded": "classes_11",
+    "MessageGiftedPremium": "classes_11",
+    "MessagePremiumGiftCode": "classes_11",
+    "MessageGiveawayCreated": "classes_11",
+    "MessageGiveaway": "classes_11",
+    "MessageGiveawayCompleted": "classes_11",
+    "MessageGiveawayWinners": "classes_11",
+    "MessageGiftedStars": "classes_11",
+    "MessageGiftedTon": "classes_11",
+    "MessageGiveawayPrizeStars": "classes_11",
+    "MessageGift": "classes_11",
+    "MessageUpgradedGift": "classes_11",
+    "MessageRefundedUpgradedGift": "classes_11",
+    "MessagePaidMessagesRefunded": "classes_11",
+    "MessagePaidMessagePriceChanged": "classes_11",
+    "MessageDirectMessagePriceChanged": "classes_11",
+    "MessageChecklistTasksDone": "classes_11",
+    "MessageChecklistTasksAdded": "classes_11",
+    "MessageSuggestedPostApprovalFailed": "classes_11",
+    "MessageSuggestedPostApproved": "classes_11",
+    "MessageSuggestedPostDeclined": "classes_11",
+    "MessageSuggestedPostPaid": "classes_11",
+    "MessageSuggestedPostRefunded": "classes_11",
+    "MessageContactRegistered": "classes_11",
+    "MessageUsersShared": "classes_11",
+    "MessageChatShared": "classes_11",
+    "MessageBotWriteAccessAllowed": "classes_11",
+    "MessageWebAppDataSent": "classes_11",
+    "MessageWebAppDataReceived": "classes_11",
+    "MessagePassportDataSent": "classes_11",
+    "MessagePassportDataReceived": "classes_11",
+    "MessageProximityAlertTriggered": "classes_11",
+    "MessageUnsupported": "classes_11",
+    "TextEntityType": "classes_12",
+    "TextEntityTypeMention": "classes_12",
+    "TextEntityTypeHashtag": "classes_12",
+    "TextEntityTypeCashtag": "classes_12",
+    "TextEntityTypeBotCommand": "classes_12",
+    "TextEntityTypeUrl": "classes_12",
+    "TextEntityTypeEmailAddress": "classes_12",
+    "TextEntityTypePhoneNumber": "classes_12",
+    "TextEntityTypeBankCardNumber": "classes_12",
+    "TextEntityTypeBold": "classes_12",
+    "TextEntityTypeItalic": "classes_12",
+    "TextEntityTypeUnderline": "classes_12",
+    "TextEntityTypeStrikethrough": "classes_12",
+    "TextEntityTypeSpoiler": "classes_12",
+    "TextEntityTypeCode": "classes_12",
+    "TextEntityTypePre": "classes_12",
+    "TextEntityTypePreCode": "classes_12",
+    "TextEntityTypeBlockQuote": "classes_12",
+    "TextEntityTypeExpandableBlockQuote": "classes_12",
+    "TextEntityTypeTextUrl": "classes_12",
+    "TextEntityTypeMentionName": "classes_12",
+    "TextEntityTypeCustomEmoji": "classes_12",
+    "TextEntityTypeMediaTimestamp": "classes_12",
+    "InputThumbnail": "classes_12",
+    "InputPaidMediaType": "classes_12",
+    "InputPaidMediaTypePhoto": "classes_12",
+    "InputPaidMediaTypeVideo": "classes_12",
+    "InputPaidMedia": "classes_12",
+    "MessageSchedulingState": "classes_12",
+    "MessageSchedulingStateSendAtDate": "classes_12",
+    "MessageSchedulingStateSendWhenOnline": "classes_12",
+    "MessageSchedulingStateSendWhenVideoProcessed": "classes_12",
+    "MessageSelfDestructType": "classes_12",
+    "MessageSelfDestructTypeTimer": "classes_12",
+    "MessageSelfDestructTypeImmediately": "classes_12",
+    "MessageSendOptions": "classes_12",
+    "MessageCopyOptions": "classes_12",
+    "InputMessageContent": "classes_12",
+    "InputMessageText": "classes_12",
+    "InputMessageAnimation": "classes_12",
+    "InputMessageAudio": "classes_12",
+    "InputMessageDocument": "classes_12",
+    "InputMessagePaidMedia": "classes_12",
+    "InputMessagePhoto": "classes_12",
+    "InputMessageSticker": "classes_12",
+    "InputMessageVideo": "classes_12",
+    "InputMessageVideoNote": "classes_12",
+    "InputMessageVoiceNote": "classes_12",
+    "InputMessageLocation": "classes_12",
+    "InputMessageVenue": "classes_12",
+    "InputMessageContact": "classes_12",
+    "InputMessageDice": "classes_12",
+    "InputMessageGame": "classes_12",
+    "InputMessageInvoice": "classes_12",
+    "InputMessagePoll": "classes_12",
+    "InputMessageStory": "classes_12",
+    "InputMessageChecklist": "classes_12",
+    "InputMessageForwarded": "classes_12",
+    "MessageProperties": "classes_12",
+    "SearchMessagesFilter": "classes_12",
+    "SearchMessagesFilterEmpty": "classes_12",
+    "SearchMessagesFilterAnimation": "classes_12",
+    "SearchMessagesFilterAudio": "classes_12",
+    "SearchMessagesFilterDocument": "classes_12",
+    "SearchMessagesFilterPhoto": "classes_12",
+    "SearchMessagesFilterVideo": "classes_12",
+    "SearchMessagesFilterVoiceNote": "classes_12",
+    "SearchMessagesFilterPhotoAndVideo": "classes_12",
+    "SearchMessagesFilterUrl": "classes_12",
+    "SearchMessagesFilterChatPhoto": "classes_12",
+    "SearchMessagesFilterVideoNote": "classes_12",
+    "SearchMessagesFilterVoiceAndVideoNote": "classes_12",
+    "SearchMessagesFilterMention": "classes_12",
+    "SearchMessagesFilterUnreadMention": "classes_12",
+    "SearchMessagesFilterUnreadReaction": "classes_12",
+    "SearchMessagesFilterFailedToSend": "classes_12",
+    "SearchMessagesFilterPinned": "classes_12",
+    "SearchMessagesChatTypeFilter": "classes_13",
+    "SearchMessagesChatTypeFilterPrivate": "classes_13",
+    "SearchMessagesChatTypeFilterGroup": "classes_13",
+    "SearchMessagesChatTypeFilterChannel": "classes_13",
+    "ChatAction": "classes_13",
+    "ChatActionTyping": "classes_13",
+    "ChatActionRecordingVideo": "classes_13",
+    "ChatActionUploadingVideo": "classes_13",
+    "ChatActionRecordingVoiceNote": "classes_13",
+    "ChatActionUploadingVoiceNote": "classes_13",
+    "ChatActionUploadingPhoto": "classes_13",
+    "ChatActionUploadingDocument": "classes_13",
+    "ChatActionChoosingSticker": "classes_13",
+    "ChatActionChoosingLocation": "classes_13",
+    "ChatActionChoosingContact": "classes_13",
+    "ChatActionStartPlayingGame": "classes_13",
+    "ChatActionRecordingVideoNote": "classes_13",
+    "ChatActionUploadingVideoNote": "classes_13",
+    "ChatActionWatchingAnimations": "classes_13",
+    "ChatActionCancel": "classes_13",
+    "UserStatus": "classes_13",
+    "UserStatusEmpty": "classes_13",
+    "UserStatusOnline": "classes_13",
+    "UserStatusOffline": "classes_13",
+    "UserStatusRecently": "classes_13",
+    "UserStatusLastWeek": "classes_13",
+    "UserStatusLastMonth": "classes_13",
+    "EmojiKeyword": "classes_13",
+    "EmojiKeywords": "classes_13",
+    "Stickers": "classes_13",
+    "Emojis": "classes_13",
+    "StickerSet": "classes_13",
+    "StickerSetInfo": "classes_13",
+    "StickerSets": "classes_13",
+    "TrendingStickerSets": "classes_13",
+    "EmojiCategorySource": "classes_13",
+    "EmojiCategorySourceSearch": "classes_13",
+    "EmojiCategorySourcePremium": "classes_13",
+    "EmojiCategory": "classes_13",
+    "EmojiCategories": "classes_13",
+    "EmojiCategoryType": "classes_13",
+    "EmojiCategoryTypeDefault": "classes_13",
+    "EmojiCategoryTypeRegularStickers": "classes_13",
+    "EmojiCategoryTypeEmojiStatus": "classes_13",
+    "EmojiCategoryTypeChatPhoto": "classes_13",
+    "CurrentWeather": "classes_13",
+    "StoryAreaPosition": "classes_13",
+    "StoryAreaType": "classes_13",
+    "StoryAreaTypeLocation": "classes_13",
+    "StoryAreaTypeVenue": "classes_13",
+    "StoryAreaTypeSuggestedReaction": "classes_13",
+    "StoryAreaTypeMessage": "classes_13",
+    "StoryAreaTypeLink": "classes_13",
+    "StoryAreaTypeWeather": "classes_13",
+    "StoryAreaTypeUpgradedGift": "classes_13",
+    "StoryArea": "classes_13",
+    "InputStoryAreaType": "classes_13",
+    "InputStoryAreaTypeLocation": "classes_13",
+    "InputStoryAreaTypeFoundVenue": "classes_13",
+    "InputStoryAreaTypePreviousVenue": "classes_13",
+    "InputStoryAreaTypeSuggestedReaction": "classes_13",
+    "InputStoryAreaTypeMessage": "classes_13",
+    "InputStoryAreaTypeLink": "classes_13",
+    "InputStoryAreaTypeWeather": "classes_13",
+    "InputStoryAreaTypeUpgradedGift": "classes_13",
+    "InputStoryArea": "classes_14",
+    "InputStoryAreas": "classes_14",
+    "StoryVideo": "classes_14",
+    "StoryContent": "classes_14",
+    "StoryContentPhoto": "classes_14",
+    "StoryContentVideo": "classes_14",
+    "StoryContentUnsupported": "classes_14",
+    "InputStoryContent": "classes_14",
+    "InputStoryContentPhoto": "classes_14",
+    "InputStoryContentVideo": "classes_14",
+    "StoryList": "classes_14",
+    "StoryListMain": "classes_14",
+    "StoryListArchive": "classes_14",
+    "StoryOrigin": "classes_14",
+    "StoryOriginPublicStory": "classes_14",
+    "StoryOriginHiddenUser": "classes_14",
+    "StoryRepostInfo": "classes_14",
+    "StoryInteractionInfo": "classes_14",
+    "Story": "classes_14",
+    "Stories": "classes_14",
+    "FoundStories": "classes_14",
+    "StoryFullId": "classes_14",
+    "StoryInfo": "classes_14",
+    "ChatActiveStories": "classes_14",
+    "StoryInteractionType": "classes_14",
+    "StoryInteractionTypeView": "classes_14",
+    "StoryInteractionTypeForward": "classes_14",
+    "StoryInteractionTypeRepost": "classes_14",
+    "StoryInteraction": "classes_14",
+    "StoryInteractions": "classes_14",
+    "QuickReplyMessage": "classes_14",
+    "QuickReplyMessages": "classes_14",
+    "QuickReplyShortcut": "classes_14",
+    "PublicForward": "classes_14",
+    "PublicForwardMessage": "classes_14",
+    "PublicForwardStory": "classes_14",
+    "PublicForwards": "classes_14",
+    "BotMediaPreview": "classes_14",
+    "BotMediaPreviews": "classes_14",
+    "BotMediaPreviewInfo": "classes_14",
+    "ChatBoostLevelFeatures": "classes_14",
+    "ChatBoostFeatures": "classes_14",
+    "ChatBoostSource": "classes_14",
+    "ChatBoostSourceGiftCode": "classes_14",
+    "ChatBoostSourceGiveaway": "classes_14",
+    "ChatBoostSourcePremium": "classes_14",
+    "PrepaidGiveaway": "classes_14",
+    "ChatBoostStatus": "classes_14",
+    "ChatBoost": "classes_14",
+    "FoundChatBoosts": "classes_14",
+    "ChatBoostSlot": "classes_14",
+    "ChatBoostSlots": "classes_14",
+    "ResendCodeReason": "classes_14",
+    "ResendCodeReasonUserRequest": "classes_14",
+    "ResendCodeReasonVerificationFailed": "classes_14",
+    "CallDiscardReason": "classes_14",
+    "CallDiscardReasonEmpty": "classes_14",
+    "CallDiscardReasonMissed": "classes_14",
+    "CallDiscardReasonDeclined": "classes_14",
+    "CallDiscardReasonDisconnected": "classes_14",
+    "CallDiscardReasonHungUp": "classes_14",
+    "CallDiscardReasonUpgradeToGroupCall": "classes_14",
+    "CallProtocol": "classes_14",
+    "CallServerType": "classes_14",
+    "CallServerTypeTelegramReflector": "classes_14",
+    "CallServerTypeWebrtc": "classes_14",
+    "CallServer": "classes_15",
+    "CallId": "classes_15",
+    "GroupCallId": "classes_15",
+    "CallState": "classes_15",
+    "CallStatePending": "classes_15",
+    "CallStateExchangingKeys": "classes_15",
+    "CallStateReady": "classes_15",
+    "CallStateHangingUp": "classes_15",
+    "CallStateDiscarded": "classes_15",
+    "CallStateError": "classes_15",
+    "GroupCallJoinParameters": "classes_15",
+    "GroupCallVideoQuality": "classes_15",
+    "GroupCallVideoQualityThumbnail": "classes_15",
+    "GroupCallVideoQualityMedium": "classes_15",
+    "GroupCallVideoQualityFull": "classes_15",
+    "VideoChatStream": "classes_15",
+    "VideoChatStreams": "classes_15",
+    "RtmpUrl": "classes_15",
+    "GroupCallRecentSpeaker": "classes_15",
+    "GroupCall": "classes_15",
+    "GroupCallVideoSourceGroup": "classes_15",
+    "GroupCallParticipantVideoInfo": "classes_15",
+    "GroupCallParticipant": "classes_15",
+    "GroupCallParticipants": "classes_15",
+    "GroupCallInfo": "classes_15",
+    "InviteGroupCallParticipantResult": "classes_15",
+    "InviteGroupCallParticipantResultUserPrivacyRestricted": "classes_15",
+    "InviteGroupCallParticipantResultUserAlreadyParticipant": "classes_15",
+    "InviteGroupCallParticipantResultUserWasBanned": "classes_15",
+    "InviteGroupCallParticipantResultSuccess": "classes_15",
+    "GroupCallDataChannel": "classes_15",
+    "GroupCallDataChannelMain": "classes_15",
+    "GroupCallDataChannelScreenSharing": "classes_15",
+    "InputGroupCall": "classes_15",
+    "InputGroupCallLink": "classes_15",
+    "InputGroupCallMessage": "classes_15",
+    "CallProblem": "classes_15",
+    "CallProblemEcho": "classes_15",
+    "CallProblemNoise": "classes_15",
+    "CallProblemInterruptions": "classes_15",
+    "CallProblemDistortedSpeech": "classes_15",
+    "CallProblemSilentLocal": "classes_15",
+    "CallProblemSilentRemote": "classes_15",
+    "CallProblemDropped": "classes_15",
+    "CallProblemDistortedVideo": "classes_15",
+    "CallProblemPixelatedVideo": "classes_15",
+    "Call": "classes_15",
+    "FirebaseAuthenticationSettings": "classes_15",
+    "FirebaseAuthenticationSettingsAndroid": "classes_15",
+    "FirebaseAuthenticationSettingsIos": "classes_15",
+    "PhoneNumberAuthenticationSettings": "classes_15",
+    "AddedReaction": "classes_15",
+    "AddedReactions": "classes_15",
+    "AvailableReaction": "classes_15",
+    "AvailableReactions": "classes_15",
+    "EmojiReaction": "classes_15",
+    "ReactionUnavailabilityReason": "classes_15",
+    "ReactionUnavailabilityReasonAnonymousAdministrator": "classes_15",
+    "ReactionUnavailabilityReasonGuest": "classes_15",
+    "Animations": "classes_15",
+    "DiceStickers": "classes_15",
+    "DiceStickersRegular": "classes_15",
+    "DiceStickersSlotMachine": "classes_15",
+    "ImportedContacts": "classes_15",
+    "SpeechRecognitionResult": "classes_16",
+    "SpeechRecognitionResultPending": "classes_16",
+    "SpeechRecognitionResultText": "classes_16",
+    "SpeechRecognitionResultError": "classes_16",
+    "BusinessConnection": "classes_16",
+    "AttachmentMenuBotColor": "classes_16",
+    "AttachmentMenuBot": "classes_16",
+    "SentWebAppMessage": "classes_16",
+    "BotWriteAccessAllowReason": "classes_16",
+    "BotWriteAccessAllowReasonConnectedWebsite": "classes_16",
+    "BotWriteAccessAllowReasonAddedToAttachmentMenu": "classes_16",
+    "BotWriteAccessAllowReasonLaunchedWebApp": "classes_16",
+    "BotWriteAccessAllowReasonAcceptedRequest": "classes_16",
+    "HttpUrl": "classes_16",
+    "UserLink": "classes_16",
+    "TargetChatTypes": "classes_16",
+    "TargetChat": "classes_16",
+    "TargetChatCurrent": "classes_16",
+    "TargetChatChosen": "classes_16",
+    "TargetChatInternalLink": "classes_16",
+    "InputInlineQueryResult": "classes_16",
+    "InputInlineQueryResultAnimation": "classes_16",
+    "InputInlineQueryResultArticle": "classes_16",
+    "InputInlineQueryResultAudio": "classes_16",
+    "InputInlineQueryResultContact": "classes_16",
+    "InputInlineQueryResultDocument": "classes_16",
+    "InputInlineQueryResultGame": "classes_16",
+    "InputInlineQueryResultLocation": "classes_16",
+    "InputInlineQueryResultPhoto": "classes_16",
+    "InputInlineQueryResultSticker": "classes_16",
+    "InputInlineQueryResultVenue": "classes_16",
+    "InputInlineQueryResultVideo": "classes_16",
+    "InputInlineQueryResultVoiceNote": "classes_16",
+    "InlineQueryResult": "classes_16",
+    "InlineQueryResultArticle": "classes_16",
+    "InlineQueryResultContact": "classes_16",
+    "InlineQueryResultLocation": "classes_16",
+    "InlineQueryResultVenue": "classes_16",
+    "InlineQueryResultGame": "classes_16",
+    "InlineQueryResultAnimation": "classes_16",
+    "InlineQueryResultAudio": "classes_16",
+    "InlineQueryResultDocument": "classes_16",
+    "InlineQueryResultPhoto": "classes_16",
+    "InlineQueryResultSticker": "classes_16",
+    "InlineQueryResultVideo": "classes_16",
+    "InlineQueryResultVoiceNote": "classes_16",
+    "InlineQueryResultsButtonType": "classes_16",
+    "InlineQueryResultsButtonTypeStartBot": "classes_16",
+    "InlineQueryResultsButtonTypeWebApp": "classes_16",
+    "InlineQueryResultsButton": "classes_16",
+    "InlineQueryResults": "classes_16",
+    "PreparedInlineMessageId": "classes_16",
+    "PreparedInlineMessage": "classes_16",
+    "CallbackQueryPayload": "classes_16",
+    "CallbackQueryPayloadData": "classes_16",
+    "CallbackQueryPayloadDataWithPassword": "classes_16",
+    "CallbackQueryPayloadGame": "classes_16",
+    "CallbackQueryAnswer": "classes_16",
+    "CustomRequestResult": "classes_16",
+    "GameHighScore": "classes_16",
+    "GameHighScores": "classes_16",
+    "ChatEventAction": "classes_16",
+    "ChatEventMessageEdited": "classes_16",
+    "ChatEventMessageDeleted": "classes_16",
+    "ChatEventMessagePinned": "classes_16",
+    "ChatEventMessageUnpinned": "classes_16",
+    "ChatEventPollStopped": "classes_16",
+    "ChatEventMemberJoined": "classes_16",
+    "ChatEventMemberJoinedByInviteLink": "classes_16",
+    "ChatEventMemberJoinedByRequest": "classes_16",
+    "ChatEventMemberInvited": "classes_16",
+    "ChatEventMemberLeft": "classes_16",
+    "ChatEventMemberPromoted": "classes_16",
+    "ChatEventMemberRestricted": "classes_16",
+    "ChatEventMemberSubscriptionExtended": "classes_16",
+    "ChatEventAvailableReactionsChanged": "classes_16",
+    "ChatEventBackgroundChanged": "classes_16",
+    "ChatEventDescriptionChanged": "classes_16",
+    "ChatEventEmojiStatusChanged": "classes_16",
+    "ChatEventLinkedChatChanged": "classes_16",
+    "ChatEventLocationChanged": "classes_16",
+    "ChatEventMessageAutoDeleteTimeChanged": "classes_16",
+    "ChatEventPermissionsChanged": "classes_16",
+    "ChatEventPhotoChanged": "classes_16",
+    "ChatEventSlowModeDelayChanged": "classes_16",
+    "ChatEventStickerSetChanged": "classes_16",
+    "ChatEventCustomEmojiStickerSetChanged": "classes_16",
+    "ChatEventTitleChanged": "classes_16",
+    "ChatEventUsernameChanged": "classes_16",
+    "ChatEventActiveUsernamesChanged": "classes_16",
+    "ChatEventAccentColorChanged": "classes_16",
+    "ChatEventProfileAccentColorChanged": "classes_16",
+    "ChatEventHasProtectedContentToggled": "classes_16",
+    "ChatEventInvitesToggled": "classes_16",
+    "ChatEventIsAllHistoryAvailableToggled": "classes_16",
+    "ChatEventHasAggressiveAntiSpamEnabledToggled": "classes_16",
+    "ChatEventSignMessagesToggled": "classes_16",
+    "ChatEventShowMessageSenderToggled": "classes_16",
+    "ChatEventAutomaticTranslationToggled": "classes_16",
+    "ChatEventInviteLinkEdited": "classes_16",
+    "ChatEventInviteLinkRevoked": "classes_16",
+    "ChatEventInviteLinkDeleted": "classes_16",
+    "ChatEventVideoChatCreated": "classes_16",
+    "ChatEventVideoChatEnded": "classes_16",
+    "ChatEventVideoChatMuteNewParticipantsToggled": "classes_16",
+    "ChatEventVideoChatParticipantIsMutedToggled": "classes_16",
+    "ChatEventVideoChatParticipantVolumeLevelChanged": "classes_16",
+    "ChatEventIsForumToggled": "classes_16",
+    "ChatEventForumTopicCreated": "classes_16",
+    "ChatEventForumTopicEdited": "classes_16",
+    "ChatEventForumTopicToggleIsClosed": "classes_16",
+    "ChatEventForumTopicToggleIsHidden": "classes_16",
+    "ChatEventForumTopicDeleted": "classes_16",
+    "ChatEventForumTopicPinned": "classes_16",
+    "ChatEvent": "classes_17",
+    "ChatEvents": "classes_17",
+    "ChatEventLogFilters": "classes_17",
+    "LanguagePackStringValue": "classes_17",
+    "LanguagePackStringValueOrdinary": "classes_17",
+    "LanguagePackStringValuePluralized": "classes_17",
+    "LanguagePackStringValueDeleted": "classes_17",
+    "LanguagePackString": "classes_17",
+    "LanguagePackStrings": "classes_17",
+    "LanguagePackInfo": "classes_17",
+    "LocalizationTargetInfo": "classes_17",
+    "PremiumLimitType": "classes_17",
+    "PremiumLimitTypeSupergroupCount": "classes_17",
+    "PremiumLimitTypePinnedChatCount": "classes_17",
+    "PremiumLimitTypeCreatedPublicChatCount": "classes_17",
+    "PremiumLimitTypeSavedAnimationCount": "classes_17",
+    "PremiumLimitTypeFavoriteStickerCount": "classes_17",
+    "PremiumLimitTypeChatFolderCount": "classes_17",
+    "PremiumLimitTypeChatFolderChosenChatCount": "classes_17",
+    "PremiumLimitTypePinnedArchivedChatCount": "classes_17",
+    "PremiumLimitTypePinnedSavedMessagesTopicCount": "classes_17",
+    "PremiumLimitTypeCaptionLength": "classes_17",
+    "PremiumLimitTypeBioLength": "classes_17",
+    "PremiumLimitTypeChatFolderInviteLinkCount": "classes_17",
+    "PremiumLimitTypeShareableChatFolderCount": "classes_17",
+    "PremiumLimitTypeActiveStoryCount": "classes_17",
+    "PremiumLimitTypeWeeklyPostedStoryCount": "classes_17",
+    "PremiumLimitTypeMonthlyPostedStoryCount": "classes_17",
+    "PremiumLimitTypeStoryCaptionLength": "classes_17",
+    "PremiumLimitTypeStorySuggestedReactionAreaCount": "classes_17",
+    "PremiumLimitTypeSimilarChatCount": "classes_17",
+    "PremiumFeature": "classes_17",
+    "PremiumFeatureIncreasedLimits": "classes_17",
+    "PremiumFeatureIncreasedUploadFileSize": "classes_17",
+    "PremiumFeatureImprovedDownloadSpeed": "classes_17",
+    "PremiumFeatureVoiceRecognition": "classes_17",
+    "PremiumFeatureDisabledAds": "classes_17",
+    "PremiumFeatureUniqueReactions": "classes_17",
+    "PremiumFeatureUniqueStickers": "classes_17",
+    "PremiumFeatureCustomEmoji": "classes_17",
+    "PremiumFeatureAdvancedChatManagement": "classes_17",
+    "PremiumFeatureProfileBadge": "classes_17",
+    "PremiumFeatureEmojiStatus": "classes_17",
+    "PremiumFeatureAnimatedProfilePhoto": "classes_17",
+    "PremiumFeatureForumTopicIcon": "classes_17",
+    "PremiumFeatureAppIcons": "classes_17",
+    "PremiumFeatureRealTimeChatTranslation": "classes_17",
+    "PremiumFeatureUpgradedStories": "classes_17",
+    "PremiumFeatureChatBoost": "classes_17",
+    "PremiumFeatureAccentColor": "classes_17",
+    "PremiumFeatureBackgroundForBoth": "classes_17",
+    "PremiumFeatureSavedMessagesTags": "classes_17",
+    "PremiumFeatureMessagePrivacy": "classes_17",
+    "PremiumFeatureLastSeenTimes": "classes_17",
+    "PremiumFeatureBusiness": "classes_17",
+    "PremiumFeatureMessageEffects": "classes_17",
+    "PremiumFeatureChecklists": "classes_17",
+    "BusinessFeature": "classes_17",
+    "BusinessFeatureLocation": "classes_17",
+    "BusinessFeatureOpeningHours": "classes_17",
+    "BusinessFeatureQuickReplies": "classes_17",
+    "BusinessFeatureGreetingMessage": "classes_17",
+    "BusinessFeatureAwayMessage": "classes_17",
+    "BusinessFeatureAccountLinks": "classes_17",
+    "BusinessFeatureStartPage": "classes_17",
+    "BusinessFeatureBots": "classes_17",
+    "BusinessFeatureEmojiStatus": "classes_17",
+    "BusinessFeatureChatFolderTags": "classes_17",
+    "BusinessFeatureUpgradedStories": "classes_17",
+    "PremiumStoryFeature": "classes_18",
+    "PremiumStoryFeaturePriorityOrder": "classes_18",
+    "PremiumStoryFeatureStealthMode": "classes_18",
+    "PremiumStoryFeaturePermanentViewsHistory": "classes_18",
+    "PremiumStoryFeatureCustomExpirationDuration": "classes_18",
+    "PremiumStoryFeatureSaveStories": "classes_18",
+    "PremiumStoryFeatureLinksAndFormatting": "classes_18",
+    "PremiumStoryFeatureVideoQuality": "classes_18",
+    "PremiumLimit": "classes_18",
+    "PremiumFeatures": "classes_18",
+    "BusinessFeatures": "classes_18",
+    "PremiumSource": "classes_18",
+    "PremiumSourceLimitExceeded": "classes_18",
+    "PremiumSourceFeature": "classes_18",
+    "PremiumSourceBusinessFeature": "classes_18",
+    "PremiumSourceStoryFeature": "classes_18",
+    "PremiumSourceLink": "classes_18",
+    "PremiumSourceSettings": "classes_18",
+    "PremiumFeaturePromotionAnimation": "classes_18",
+    "BusinessFeaturePromotionAnimation": "classes_18",
+    "PremiumState": "classes_18",
+    "StorePaymentPurpose": "classes_18",
+    "StorePaymentPurposePremiumSubscription": "classes_18",
+    "StorePaymentPurposePremiumGift": "classes_18",
+    "StorePaymentPurposePremiumGiftCodes": "classes_18",
+    "StorePaymentPurposePremiumGiveaway": "classes_18",
+    "StorePaymentPurposeStarGiveaway": "classes_18",
+    "StorePaymentPurposeStars": "classes_18",
+    "StorePaymentPurposeGiftedStars": "classes_18",
+    "StoreTransaction": "classes_18",
+    "StoreTransactionAppStore": "classes_18",
+    "StoreTransactionGooglePlay": "classes_18",
+    "TelegramPaymentPurpose": "classes_18",
+    "TelegramPaymentPurposePremiumGift": "classes_18",
+    "TelegramPaymentPurposePremiumGiftCodes": "classes_18",
+    "TelegramPaymentPurposePremiumGiveaway": "classes_18",
+    "TelegramPaymentPurposeStars": "classes_18",
+    "TelegramPaymentPurposeGiftedStars": "classes_18",
+    "TelegramPaymentPurposeStarGiveaway": "classes_18",
+    "TelegramPaymentPurposeJoinChat": "classes_18",
+    "DeviceToken": "classes_18",
+    "DeviceTokenFirebaseCloudMessaging": "classes_18",
+    "DeviceTokenApplePush": "classes_18",
+    "DeviceTokenApplePushVoIP": "classes_18",
+    "DeviceTokenWindowsPush": "classes_18",
+    "DeviceTokenMicrosoftPush": "classes_18",
+    "DeviceTokenMicrosoftPushVoIP": "classes_18",
+    "DeviceTokenWebPush": "classes_18",
+    "DeviceTokenSimplePush": "classes_18",
+    "DeviceTokenUbuntuPush": "classes_18",
+    "DeviceTokenBlackBerryPush": "classes_18",
+    "DeviceTokenTizenPush": "classes_18",
+    "DeviceTokenHuaweiPush": "classes_18",
+    "PushReceiverId": "classes_18",
+    "BackgroundFill": "classes_18",
+    "BackgroundFillSolid": "classes_18",
+    "BackgroundFillGradient": "classes_18",
+    "BackgroundFillFreeformGradient": "classes_18",
+    "BackgroundType": "classes_18",
+    "BackgroundTypeWallpaper": "classes_18",
+    "BackgroundTypePattern": "classes_18",
+    "BackgroundTypeFill": "classes_18",
+    "BackgroundTypeChatTheme": "classes_18",
+    "InputBackground": "classes_18",
+    "InputBackgroundLocal": "classes_18",
+    "InputBackgroundRemote": "classes_18",
+    "InputBackgroundPrevious": "classes_18",
+    "ChatTheme": "classes_19",
+    "TimeZone": "classes_19",
+    "TimeZones": "classes_19",
+    "Hashtags": "classes_19",
+    "CanPostStoryResult": "classes_19",
+    "CanPostStoryResultOk": "classes_19",
+    "CanPostStoryResultPremiumNeeded": "classes_19",
+    "CanPostStoryResultBoostNeeded": "classes_19",
+    "CanPostStoryResultActiveStoryLimitExceeded": "classes_19",
+    "CanPostStoryResultWeeklyLimitExceeded": "classes_19",
+    "CanPostStoryResultMonthlyLimitExceeded": "classes_19",
+    "CanTransferOwnershipResult": "classes_19",
+    "CanTransferOwnershipResultOk": "classes_19",
+    "CanTransferOwnershipResultPasswordNeeded": "classes_19",
+    "CanTransferOwnershipResultPasswordTooFresh": "classes_19",
+    "CanTransferOwnershipResultSessionTooFresh": "classes_19",
+    "CheckChatUsernameResult": "classes_19",
+    "CheckChatUsernameResultOk": "classes_19",
+    "CheckChatUsernameResultUsernameInvalid": "classes_19",
+    "CheckChatUsernameResultUsernameOccupied": "classes_19",
+    "CheckChatUsernameResultUsernamePurchasable": "classes_19",
+    "CheckChatUsernameResultPublicChatsTooMany": "classes_19",
+    "CheckChatUsernameResultPublicGroupsUnavailable": "classes_19",
+    "CheckStickerSetNameResult": "classes_19",
+    "CheckStickerSetNameResultOk": "classes_19",
+    "CheckStickerSetNameResultNameInvalid": "classes_19",
+    "CheckStickerSetNameResultNameOccupied": "classes_19",
+    "ResetPasswordResult": "classes_19",
+    "ResetPasswordResultOk": "classes_19",
+    "ResetPasswordResultPending": "classes_19",
+    "ResetPasswordResultDeclined": "classes_19",
+    "MessageFileType": "classes_19",
+    "MessageFileTypePrivate": "classes_19",
+    "MessageFileTypeGroup": "classes_19",
+    "MessageFileTypeUnknown": "classes_19",
+    "PushMessageContent": "classes_19",
+    "PushMessageContentHidden": "classes_19",
+    "PushMessageContentAnimation": "classes_19",
+    "PushMessageContentAudio": "classes_19",
+    "PushMessageContentContact": "classes_19",
+    "PushMessageContentContactRegistered": "classes_19",
+    "PushMessageContentDocument": "classes_19",
+    "PushMessageContentGame": "classes_19",
+    "PushMessageContentGameScore": "classes_19",
+    "PushMessageContentInvoice": "classes_19",
+    "PushMessageContentLocation": "classes_19",
+    "PushMessageContentPaidMedia": "classes_19",
+    "PushMessageContentPhoto": "classes_19",
+    "PushMessageContentPoll": "classes_19",
+    "PushMessageContentPremiumGiftCode": "classes_19",
+    "PushMessageContentGiveaway": "classes_19",
+    "PushMessageContentGift": "classes_19",
+    "PushMessageContentUpgradedGift": "classes_19",
+    "PushMessageContentScreenshotTaken": "classes_19",
+    "PushMessageContentSticker": "classes_19",
+    "PushMessageContentStory": "classes_19",
+    "PushMessageContentText": "classes_19",
+    "PushMessageContentChecklist": "classes_19",
+    "PushMessageContentVideo": "classes_19",
+    "PushMessageContentVideoNote": "classes_19",
+    "PushMessageContentVoiceNote": "classes_19",
+    "PushMessageContentBasicGroupChatCreate": "classes_19",
+    "PushMessageContentVideoChatStarted": "classes_19",
+    "PushMessageContentVideoChatEnded": "classes_19",
+    "PushMessageContentInviteVideoChatParticipants": "classes_19",
+    "PushMessageContentChatAddMembers": "classes_19",
+    "PushMessageContentChatChangePhoto": "classes_19",
+    "PushMessageContentChatChangeTitle": "classes_19",
+    "PushMessageContentChatSetBackground": "classes_19",
+    "PushMessageContentChatSetTheme": "classes_19",
+    "PushMessageContentChatDeleteMember": "classes_19",
+    "PushMessageContentChatJoinByLink": "classes_19",
+    "PushMessageContentChatJoinByRequest": "classes_19",
+    "PushMessageContentRecurringPayment": "classes_19",
+    "PushMessageContentSuggestProfilePhoto": "classes_19",
+    "PushMessageContentProximityAlertTriggered": "classes_19",
+    "PushMessageContentChecklistTasksAdded": "classes_19",
+    "PushMessageContentChecklistTasksDone": "classes_19",
+    "PushMessageContentMessageForwards": "classes_19",
+    "PushMessageContentMediaAlbum": "classes_19",
+    "NotificationType": "classes_20",
+    "NotificationTypeNewMessage": "classes_20",
+    "NotificationTypeNewSecretChat": "classes_20",
+    "NotificationTypeNewCall": "classes_20",
+    "NotificationTypeNewPushMessage": "classes_20",
+    "NotificationGroupType": "classes_20",
+    "NotificationGroupTypeMessages": "classes_20",
+    "NotificationGroupTypeMentions": "classes_20",
+    "NotificationGroupTypeSecretChat": "classes_20",
+    "NotificationGroupTypeCalls": "classes_20",
+    "NotificationSound": "classes_20",
+    "NotificationSounds": "classes_20",
+    "Notification": "classes_20",
+    "NotificationGroup": "classes_20",
+    "OptionValue": "classes_20",
+    "OptionValueBoolean": "classes_20",
+    "OptionValueEmpty": "classes_20",
+    "OptionValueInteger": "classes_20",
+    "OptionValueString": "classes_20",
+    "JsonObjectMember": "classes_20",
+    "JsonValue": "classes_20",
+    "JsonValueNull": "classes_20",
+    "JsonValueBoolean": "classes_20",
+    "JsonValueNumber": "classes_20",
+    "JsonValueString": "classes_20",
+    "JsonValueArray": "classes_20",
+    "JsonValueObject": "classes_20",
+    "StoryPrivacySettings": "classes_20",
+    "StoryPrivacySettingsEveryone": "classes_20",
+    "StoryPrivacySettingsContacts": "classes_20",
+    "StoryPrivacySettingsCloseFriends": "classes_20",
+    "StoryPrivacySettingsSelectedUsers": "classes_20",
+    "UserPrivacySettingRule": "classes_20",
+    "UserPrivacySettingRuleAllowAll": "classes_20",
+    "UserPrivacySettingRuleAllowContacts": "classes_20",
+    "UserPrivacySettingRuleAllowBots": "classes_20",
+    "UserPrivacySettingRuleAllowPremiumUsers": "classes_20",
+    "UserPrivacySettingRuleAllowUsers": "classes_20",
+    "UserPrivacySettingRuleAllowChatMembers": "classes_20",
+    "UserPrivacySettingRuleRestrictAll": "classes_20",
+    "UserPrivacySettingRuleRestrictContacts": "classes_20",
+    "UserPrivacySettingRuleRestrictBots": "classes_20",
+    "UserPrivacySettingRuleRestrictUsers": "classes_20",
+    "UserPrivacySettingRuleRestrictChatMembers": "classes_20",
+    "UserPrivacySettingRules": "classes_20",
+    "UserPrivacySetting": "classes_20",
+    "UserPrivacySettingShowStatus": "classes_20",
+    "UserPrivacySettingShowProfilePhoto": "classes_20",
+    "UserPrivacySettingShowLinkInForwardedMessages": "classes_20",
+    "UserPrivacySettingShowPhoneNumber": "classes_20",
+    "UserPrivacySettingShowBio": "classes_20",
+    "UserPrivacySettingShowBirthdate": "classes_20",
+    "UserPrivacySettingAllowChatInvites": "classes_20",
+    "UserPrivacySettingAllowCalls": "classes_20",
+    "UserPrivacySettingAllowPeerToPeerCalls": "classes_20",
+    "UserPrivacySettingAllowFindingByPhoneNumber": "classes_20",
+    "UserPrivacySettingAllowPrivateVoiceAndVideoNoteMessages": "classes_20",
+    "UserPrivacySettingAutosaveGifts": "classes_20",
+    "UserPrivacySettingAllowUnpaidMessages": "classes_20",
+    "ReadDatePrivacySettings": "classes_20",
+    "NewChatPrivacySettings": "classes_20",
+    "CanSendMessageToUserResult": "classes_20",
+    "CanSendMessageToUserResultOk": "classes_20",
+    "CanSendMessageToUserResultUserHasPaidMessages": "classes_20",
+    "CanSendMessageToUserResultUserIsDeleted": "classes_20",
+    "CanSendMessageToUserResultUserRestrictsNewChats": "classes_20",
+    "AccountTtl": "classes_21",
+    "MessageAutoDeleteTime": "classes_21",
+    "SessionType": "classes_21",
+    "SessionTypeAndroid": "classes_21",
+    "SessionTypeApple": "classes_21",
+    "SessionTypeBrave": "classes_21",
+    "SessionTypeChrome": "classes_21",
+    "SessionTypeEdge": "classes_21",
+    "SessionTypeFirefox": "classes_21",
+    "SessionTypeIpad": "classes_21",
+    "SessionTypeIphone": "classes_21",
+    "SessionTypeLinux": "classes_21",
+    "SessionTypeMac": "classes_21",
+    "SessionTypeOpera": "classes_21",
+    "SessionTypeSafari": "classes_21",
+    "SessionTypeUbuntu": "classes_21",
+    "SessionTypeUnknown": "classes_21",
+    "SessionTypeVivaldi": "classes_21",
+    "SessionTypeWindows": "classes_21",
+    "SessionTypeXbox": "classes_21",
+    "Session": "classes_21",
+    "Sessions": "classes_21",
+    "UnconfirmedSession": "classes_21",
+    "ConnectedWebsite": "classes_21",
+    "ConnectedWebsites": "classes_21",
+    "ReportReason": "classes_21",
+    "ReportReasonSpam": "classes_21",
+    "ReportReasonViolence": "classes_21",
+    "ReportReasonPornography": "classes_21",
+    "ReportReasonChildAbuse": "classes_21",
+    "ReportReasonCopyright": "classes_21",
+    "ReportReasonUnrelatedLocation": "classes_21",
+    "ReportReasonFake": "classes_21",
+    "ReportReasonIllegalDrugs": "classes_21",
+    "ReportReasonPersonalDetails": "classes_21",
+    "ReportReasonCustom": "classes_21",
+    "ReportChatResult": "classes_21",
+    "ReportChatResultOk": "classes_21",
+    "ReportChatResultOptionRequired": "classes_21",
+    "ReportChatResultTextRequired": "classes_21",
+    "ReportChatResultMessagesRequired": "classes_21",
+    "ReportStoryResult": "classes_21",
+    "ReportStoryResultOk": "classes_21",
+    "ReportStoryResultOptionRequired": "classes_21",
+    "ReportStoryResultTextRequired": "classes_21",
+    "InternalLinkType": "classes_21",
+    "InternalLinkTypeActiveSessions": "classes_21",
+    "InternalLinkTypeAttachmentMenuBot": "classes_21",
+    "InternalLinkTypeAuthenticationCode": "classes_21",
+    "InternalLinkTypeBackground": "classes_21",
+    "InternalLinkTypeBotAddToChannel": "classes_21",
+    "InternalLinkTypeBotStart": "classes_21",
+    "InternalLinkTypeBotStartInGroup": "classes_21",
+    "InternalLinkTypeBusinessChat": "classes_21",
+    "InternalLinkTypeBuyStars": "classes_21",
+    "InternalLinkTypeChangePhoneNumber": "classes_21",
+    "InternalLinkTypeChatAffiliateProgram": "classes_21",
+    "InternalLinkTypeChatBoost": "classes_21",
+    "InternalLinkTypeChatFolderInvite": "classes_21",
+    "InternalLinkTypeChatFolderSettings": "classes_21",
+    "InternalLinkTypeChatInvite": "classes_21",
+    "InternalLinkTypeDefaultMessageAutoDeleteTimerSettings": "classes_21",
+    "InternalLinkTypeEditProfileSettings": "classes_21",
+    "InternalLinkTypeGame": "classes_21",
+    "InternalLinkTypeGroupCall": "classes_21",
+    "InternalLinkTypeInstantView": "classes_21",
+    "InternalLinkTypeInvoice": "classes_21",
+    "InternalLinkTypeLanguagePack": "classes_21",
+    "InternalLinkTypeLanguageSettings": "classes_21",
+    "InternalLinkTypeMainWebApp": "classes_21",
+    "InternalLinkTypeMessage": "classes_21",
+    "InternalLinkTypeMessageDraft": "classes_21",
+    "InternalLinkTypeMyStars": "classes_21",
+    "InternalLinkTypeMyToncoins": "classes_21",
+    "InternalLinkTypePassportDataRequest": "classes_21",
+    "InternalLinkTypePhoneNumberConfirmation": "classes_21",
+    "InternalLinkTypePremiumFeatures": "classes_21",
+    "InternalLinkTypePremiumGift": "classes_21",
+    "InternalLinkTypePremiumGiftCode": "classes_21",
+    "InternalLinkTypePrivacyAndSecuritySettings": "classes_21",
+    "InternalLinkTypeProxy": "classes_21",
+    "InternalLinkTypePublicChat": "classes_21",
+    "InternalLinkTypeQrCodeAuthentication": "classes_21",
+    "InternalLinkTypeRestorePurchases": "classes_21",
+    "InternalLinkTypeSettings": "classes_21",
+    "InternalLinkTypeStickerSet": "classes_21",
+    "InternalLinkTypeStory": "classes_21",
+    "InternalLinkTypeTheme": "classes_21",
+    "InternalLinkTypeThemeSettings": "classes_21",
+    "InternalLinkTypeUnknownDeepLink": "classes_21",
+    "InternalLinkTypeUnsupportedProxy": "classes_21",
+    "InternalLinkTypeUpgradedGift": "classes_21",
+    "InternalLinkTypeUserPhoneNumber": "classes_21",
+    "InternalLinkTypeUserToken": "classes_21",
+    "InternalLinkTypeVideoChat": "classes_21",
+    "InternalLinkTypeWebApp": "classes_21",
+    "MessageLink": "classes_22",
+    "MessageLinkInfo": "classes_22",
+    "ChatBoostLink": "classes_22",
+    "ChatBoostLinkInfo": "classes_22",
+    "BlockList": "classes_22",
+    "BlockListMain": "classes_22",
+    "BlockListStories": "classes_22",
+    "FileType": "classes_22",
+    "FileTypeNone": "classes_22",
+    "FileTypeAnimation": "classes_22",
+    "FileTypeAudio": "classes_22",
+    "FileTypeDocument": "classes_22",
+    "FileTypeNotificationSound": "classes_22",
+    "FileTypePhoto": "classes_22",
+    "FileTypePhotoStory": "classes_22",
+    "FileTypeProfilePhoto": "classes_22",
+    "FileTypeSecret": "classes_22",
+    "FileTypeSecretThumbnail": "classes_22",
+    "FileTypeSecure": "classes_22",
+    "FileTypeSelfDestructingPhoto": "classes_22",
+    "FileTypeSelfDestructingVideo": "classes_22",
+    "FileTypeSelfDestructingVideoNote": "classes_22",
+    "FileTypeSelfDestructingVoiceNote": "classes_22",
+    "FileTypeSticker": "classes_22",
+    "FileTypeThumbnail": "classes_22",
+    "FileTypeUnknown": "classes_22",
+    "FileTypeVideo": "classes_22",
+    "FileTypeVideoNote": "classes_22",
+    "FileTypeVideoStory": "classes_22",
+    "FileTypeVoiceNote": "classes_22",
+    "FileTypeWallpaper": "classes_22",
+    "StorageStatisticsByFileType": "classes_22",
+    "StorageStatisticsByChat": "classes_22",
+    "StorageStatistics": "classes_22",
+    "StorageStatisticsFast": "classes_22",
+    "DatabaseStatistics": "classes_22",
+    "NetworkType": "classes_22",
+    "NetworkTypeNone": "classes_22",
+    "NetworkTypeMobile": "classes_22",
+    "NetworkTypeMobileRoaming": "classes_22",
+    "NetworkTypeWiFi": "classes_22",
+    "NetworkTypeOther": "classes_22",
+    "NetworkStatisticsEntry": "classes_22",
+    "NetworkStatisticsEntryFile": "classes_22",
+    "NetworkStatisticsEntryCall": "classes_22",
+    "NetworkStatistics": "classes_22",
+    "AutoDownloadSettings": "classes_22",
+    "AutoDownloadSettingsPresets": "classes_22",
+    "AutosaveSettingsScope": "classes_22",
+    "AutosaveSettingsScopePrivateChats": "classes_22",
+    "AutosaveSettingsScopeGroupChats": "classes_22",
+    "AutosaveSettingsScopeChannelChats": "classes_22",
+    "AutosaveSettingsScopeChat": "classes_22",
+    "ScopeAutosaveSettings": "classes_22",
+    "AutosaveSettingsException": "classes_22",
+    "AutosaveSettings": "classes_22",
+    "ConnectionState": "classes_22",
+    "ConnectionStateWaitingForNetwork": "classes_22",
+    "ConnectionStateConnectingToProxy": "classes_22",
+    "ConnectionStateConnecting": "classes_22",
+    "ConnectionStateUpdating": "classes_22",
+    "ConnectionStateReady": "classes_22",
+    "TopChatCategory": "classes_22",
+    "TopChatCategoryUsers": "classes_22",
+    "TopChatCategoryBots": "classes_22",
+    "TopChatCategoryGroups": "classes_22",
+    "TopChatCategoryChannels": "classes_22",
+    "TopChatCategoryInlineBots": "classes_22",
+    "TopChatCategoryWebAppBots": "classes_22",
+    "TopChatCategoryCalls": "classes_22",
+    "TopChatCategoryForwardChats": "classes_22",
+    "FoundPosition": "classes_23",
+    "FoundPositions": "classes_23",
+    "TMeUrlType": "classes_23",
+    "TMeUrlTypeUser": "classes_23",
+    "TMeUrlTypeSupergroup": "classes_23",
+    "TMeUrlTypeChatInvite": "classes_23",
+    "TMeUrlTypeStickerSet": "classes_23",
+    "TMeUrl": "classes_23",
+    "TMeUrls": "classes_23",
+    "SuggestedAction": "classes_23",
+    "SuggestedActionEnableArchiveAndMuteNewChats": "classes_23",
+    "SuggestedActionCheckPassword": "classes_23",
+    "SuggestedActionCheckPhoneNumber": "classes_23",
+    "SuggestedActionViewChecksHint": "classes_23",
+    "SuggestedActionConvertToBroadcastGroup": "classes_23",
+    "SuggestedActionSetPassword": "classes_23",
+    "SuggestedActionUpgradePremium": "classes_23",
+    "SuggestedActionRestorePremium": "classes_23",
+    "SuggestedActionSubscribeToAnnualPremium": "classes_23",
+    "SuggestedActionGiftPremiumForChristmas": "classes_23",
+    "SuggestedActionSetBirthdate": "classes_23",
+    "SuggestedActionSetProfilePhoto": "classes_23",
+    "SuggestedActionExtendPremium": "classes_23",
+    "SuggestedActionExtendStarSubscriptions": "classes_23",
+    "SuggestedActionCustom": "classes_23",
+    "Count": "classes_23",
+    "Text": "classes_23",
+    "Data": "classes_23",
+    "Seconds": "classes_23",
+    "FileDownloadedPrefixSize": "classes_23",
+    "StarCount": "classes_23",
+    "DeepLinkInfo": "classes_23",
+    "TextParseMode": "classes_23",
+    "TextParseModeMarkdown": "classes_23",
+    "TextParseModeHTML": "classes_23",
+    "ProxyType": "classes_23",
+    "ProxyTypeSocks5": "classes_23",
+    "ProxyTypeHttp": "classes_23",
+    "ProxyTypeMtproto": "classes_23",
+    "Proxy": "classes_23",
+    "Proxies": "classes_23",
+    "InputSticker": "classes_23",
+    "DateRange": "classes_23",
+    "StatisticalValue": "classes_23",
+    "StatisticalGraph": "classes_23",
+    "StatisticalGraphData": "classes_23",
+    "StatisticalGraphAsync": "classes_23",
+    "StatisticalGraphError": "classes_23",
+    "ChatStatisticsObjectType": "classes_23",
+    "ChatStatisticsObjectTypeMessage": "classes_23",
+    "ChatStatisticsObjectTypeStory": "classes_23",
+    "ChatStatisticsInteractionInfo": "classes_23",
+    "ChatStatisticsMessageSenderInfo": "classes_23",
+    "ChatStatisticsAdministratorActionsInfo": "classes_23",
+    "ChatStatisticsInviterInfo": "classes_23",
+    "ChatStatistics": "classes_23",
+    "ChatStatisticsSupergroup": "classes_23",
+    "ChatStatisticsChannel": "classes_23",
+    "ChatRevenueAmount": "classes_23",
+    "ChatRevenueStatistics": "classes_23",
+    "MessageStatistics": "classes_23",
+    "StoryStatistics": "classes_23",
+    "RevenueWithdrawalState": "classes_23",
+    "RevenueWithdrawalStatePending": "classes_23",
+    "RevenueWithdrawalStateSucceeded": "classes_23",
+    "RevenueWithdrawalStateFailed": "classes_23",
+    "ChatRevenueTransactionType": "classes_24",
+    "ChatRevenueTransactionTypeUnsupported": "classes_24",
+    "ChatRevenueTransactionTypeSponsoredMessageEarnings": "classes_24",
+    "ChatRevenueTransactionTypeSuggestedPostEarnings": "classes_24",
+    "ChatRevenueTransactionTypeFragmentWithdrawal": "classes_24",
+    "ChatRevenueTransactionTypeFragmentRefund": "classes_24",
+    "ChatRevenueTransaction": "classes_24",
+    "ChatRevenueTransactions": "classes_24",
+    "StarRevenueStatus": "classes_24",
+    "StarRevenueStatistics": "classes_24",
+    "Point": "classes_24",
+    "VectorPathCommand": "classes_24",
+    "VectorPathCommandLine": "classes_24",
+    "VectorPathCommandCubicBezierCurve": "classes_24",
+    "BotCommandScope": "classes_24",
+    "BotCommandScopeDefault": "classes_24",
+    "BotCommandScopeAllPrivateChats": "classes_24",
+    "BotCommandScopeAllGroupChats": "classes_24",
+    "BotCommandScopeAllChatAdministrators": "classes_24",
+    "BotCommandScopeChat": "classes_24",
+    "BotCommandScopeChatAdministrators": "classes_24",
+    "BotCommandScopeChatMember": "classes_24",
+    "PhoneNumberCodeType": "classes_24",
+    "PhoneNumberCodeTypeChange": "classes_24",
+    "PhoneNumberCodeTypeVerify": "classes_24",
+    "PhoneNumberCodeTypeConfirmOwnership": "classes_24",
+    "UpdateAuthorizationState": "classes_24",
+    "UpdateNewMessage": "classes_24",
+    "UpdateMessageSendAcknowledged": "classes_24",
+    "UpdateMessageSendSucceeded": "classes_24",
+    "UpdateMessageSendFailed": "classes_24",
+    "UpdateMessageContent": "classes_24",
+    "UpdateMessageEdited": "classes_24",
+    "UpdateMessageIsPinned": "classes_24",
+    "UpdateMessageInteractionInfo": "classes_24",
+    "UpdateMessageContentOpened": "classes_24",
+    "UpdateMessageMentionRead": "classes_24",
+    "UpdateMessageUnreadReactions": "classes_24",
+    "UpdateMessageFactCheck": "classes_24",
+    "UpdateMessageSuggestedPostInfo": "classes_24",
+    "UpdateMessageLiveLocationViewed": "classes_24",
+    "UpdateVideoPublished": "classes_24",
+    "UpdateNewChat": "classes_24",
+    "UpdateChatTitle": "classes_24",
+    "UpdateChatPhoto": "classes_24",
+    "UpdateChatAccentColors": "classes_24",
+    "UpdateChatPermissions": "classes_24",
+    "UpdateChatLastMessage": "classes_24",
+    "UpdateChatPosition": "classes_24",
+    "UpdateChatAddedToList": "classes_24",
+    "UpdateChatRemovedFromList": "classes_24",
+    "UpdateChatReadInbox": "classes_24",
+    "UpdateChatReadOutbox": "classes_24",
+    "UpdateChatActionBar": "classes_24",
+    "UpdateChatBusinessBotManageBar": "classes_24",
+    "UpdateChatAvailableReactions": "classes_24",
+    "UpdateChatDraftMessage": "classes_24",
+    "UpdateChatEmojiStatus": "classes_24",
+    "UpdateChatMessageSender": "classes_24",
+    "UpdateChatMessageAutoDeleteTime": "classes_24",
+    "UpdateChatNotificationSettings": "classes_24",
+    "UpdateChatPendingJoinRequests": "classes_24",
+    "UpdateChatReplyMarkup": "classes_24",
+    "UpdateChatBackground": "classes_24",
+    "UpdateChatTheme": "classes_24",
+    "UpdateChatUnreadMentionCount": "classes_24",
+    "UpdateChatUnreadReactionCount": "classes_24",
+    "UpdateChatVideoChat": "classes_24",
+    "UpdateChatDefaultDisableNotification": "classes_24",
+    "UpdateChatHasProtectedContent": "classes_24",
+    "UpdateChatIsTranslatable": "classes_24",
+    "UpdateChatIsMarkedAsUnread": "classes_24",
+    "UpdateChatViewAsTopics": "classes_24",
+    "UpdateChatBlockList": "classes_24",
+    "UpdateChatHasScheduledMessages": "classes_24",
+    "UpdateChatFolders": "classes_24",
+    "UpdateChatOnlineMemberCount": "classes_24",
+    "UpdateSavedMessagesTopic": "classes_24",
+    "UpdateSavedMessagesTopicCount": "classes_24",
+    "UpdateDirectMessagesChatTopic": "classes_24",
+    "UpdateTopicMessageCount": "classes_24",
+    "UpdateQuickReplyShortcut": "classes_24",
+    "UpdateQuickReplyShortcutDeleted": "classes_24",
+    "UpdateQuickReplyShortcuts": "classes_24",
+    "UpdateQuickReplyShortcutMessages": "classes_24",
+    "UpdateForumTopicInfo": "classes_24",
+    "UpdateForumTopic": "classes_24",
+    "UpdateScopeNotificationSettings": "classes_24",
+    "UpdateReactionNotificationSettings": "classes_24",
+    "UpdateNotification": "classes_24",
+    "UpdateNotificationGroup": "classes_24",
+    "UpdateActiveNotifications": "classes_24",
+    "UpdateHavePendingNotifications": "classes_24",
+    "UpdateDeleteMessages": "classes_24",
+    "UpdateChatAction": "classes_24",
+    "UpdateUserStatus": "classes_24",
+    "UpdateUser": "classes_24",
+    "UpdateBasicGroup": "classes_24",
+    "UpdateSupergroup": "classes_24",
+    "UpdateSecretChat": "classes_24",
+    "UpdateUserFullInfo": "classes_24",
+    "UpdateBasicGroupFullInfo": "classes_24",
+    "UpdateSupergroupFullInfo": "classes_24",
+    "UpdateServiceNotification": "classes_24",
+    "UpdateFile": "classes_24",
+    "UpdateFileGenerationStart": "classes_24",
+    "UpdateFileGenerationStop": "classes_24",
+    "UpdateFileDownloads": "classes_24",
+    "UpdateFileAddedToDownloads": "classes_24",
+    "UpdateFileDownload": "classes_24",
+    "UpdateFileRemovedFromDownloads": "classes_24",
+    "UpdateApplicationVerificationRequired": "classes_24",
+    "UpdateApplicationRecaptchaVerificationRequired": "classes_24",
+    "UpdateCall": "classes_24",
+    "UpdateGroupCall": "classes_24",
+    "UpdateGroupCallParticipant": "classes_24",
+    "UpdateGroupCallParticipants": "classes_24",
+    "UpdateGroupCallVerificationState": "classes_24",
+    "UpdateNewCallSignalingData": "classes_24",
+    "UpdateUserPrivacySettingRules": "classes_24",
+    "UpdateUnreadMessageCount": "classes_24",
+    "UpdateUnreadChatCount": "classes_24",
+    "UpdateStory": "classes_24",
+    "UpdateStoryDeleted": "classes_24",
+    "UpdateStoryPostSucceeded": "classes_24",
+    "UpdateStoryPostFailed": "classes_24",
+    "UpdateChatActiveStories": "classes_24",
+    "UpdateStoryListChatCount": "classes_24",
+    "UpdateStoryStealthMode": "classes_24",
+    "UpdateOption": "classes_24",
+    "UpdateStickerSet": "classes_24",
+    "UpdateInstalledStickerSets": "classes_24",
+    "UpdateTrendingStickerSets": "classes_24",
+    "UpdateRecentStickers": "classes_24",
+    "UpdateFavoriteStickers": "classes_24",
+    "UpdateSavedAnimations": "classes_24",
+    "UpdateSavedNotificationSounds": "classes_24",
+    "UpdateDefaultBackground": "classes_24",
+    "UpdateChatThemes": "classes_24",
+    "UpdateAccentColors": "classes_24",
+    "UpdateProfileAccentColors": "classes_24",
+    "UpdateLanguagePackStrings": "classes_24",
+    "UpdateConnectionState": "classes_24",
+    "UpdateFreezeState": "classes_24",
+    "UpdateTermsOfService": "classes_24",
+    "UpdateUnconfirmedSession": "classes_24",
+    "UpdateAttachmentMenuBots": "classes_24",
+    "UpdateWebAppMessageSent": "classes_24",
+    "UpdateActiveEmojiReactions": "classes_24",
+    "UpdateAvailableMessageEffects": "classes_24",
+    "UpdateDefaultReactionType": "classes_24",
+    "UpdateDefaultPaidReactionType": "classes_24",
+    "UpdateSavedMessagesTags": "classes_24",
+    "UpdateActiveLiveLocationMessages": "classes_24",
+    "UpdateOwnedStarCount": "classes_24",
+    "UpdateOwnedTonCount": "classes_24",
+    "UpdateChatRevenueAmount": "classes_24",
+    "UpdateStarRevenueStatus": "classes_24",
+    "UpdateSpeechRecognitionTrial": "classes_24",
+    "UpdateDiceEmojis": "classes_24",
+    "UpdateAnimatedEmojiMessageClicked": "classes_24",
+    "UpdateAnimationSearchParameters": "classes_24",
+    "UpdateSuggestedActions": "classes_24",
+    "UpdateSpeedLimitNotification": "classes_24",
+    "UpdateContactCloseBirthdays": "classes_24",
+    "UpdateAutosaveSettings": "classes_24",
+    "UpdateBusinessConnection": "classes_24",
+    "UpdateNewBusinessMessage": "classes_24",
+    "UpdateBusinessMessageEdited": "classes_24",
+    "UpdateBusinessMessagesDeleted": "classes_24",
+    "UpdateNewInlineQuery": "classes_24",
+    "UpdateNewChosenInlineResult": "classes_24",
+    "UpdateNewCallbackQuery": "classes_24",
+    "UpdateNewInlineCallbackQuery": "classes_24",
+    "UpdateNewBusinessCallbackQuery": "classes_24",
+    "UpdateNewShippingQuery": "classes_24",
+    "UpdateNewPreCheckoutQuery": "classes_24",
+    "UpdateNewCustomEvent": "classes_24",
+    "UpdateNewCustomQuery": "classes_24",
+    "UpdatePoll": "classes_24",
+    "UpdatePollAnswer": "classes_24",
+    "UpdateChatMember": "classes_24",
+    "UpdateNewChatJoinRequest": "classes_24",
+    "UpdateChatBoost": "classes_24",
+    "UpdateMessageReaction": "classes_24",
+    "UpdateMessageReactions": "classes_24",
+    "UpdatePaidMediaPurchased": "classes_24",
+    "Updates": "classes_25",
+    "LogStream": "classes_25",
+    "LogStreamDefault": "classes_25",
+    "LogStreamFile": "classes_25",
+    "LogStreamEmpty": "classes_25",
+    "LogVerbosityLevel": "classes_25",
+    "LogTags": "classes_25",
+    "UserSupportInfo": "classes_25",
+    "TestInt": "classes_25",
+    "TestString": "classes_25",
+    "TestBytes": "classes_25",
+    "TestVectorInt": "classes_25",
+    "TestVectorIntObject": "classes_25",
+    "TestVectorString": "classes_25",
+    "TestVectorStringObject": "classes_25",
+    "GetAuthorizationState": "functions_00",
+    "SetTdlibParameters": "functions_00",
+    "SetAuthenticationPhoneNumber": "functions_00",
+    "CheckAuthenticationPremiumPurchase": "functions_00",
+    "SetAuthenticationPremiumPurchaseTransaction": "functions_00",
+    "SetAuthenticationEmailAddress": "functions_00",
+    "ResendAuthenticationCode": "functions_00",
+    "CheckAuthenticationEmailCode": "functions_00",
+    "CheckAuthenticationCode": "functions_00",
+    "RequestQrCodeAuthentication": "functions_00",
+    "RegisterUser": "functions_00",
+    "ResetAuthenticationEmailAddress": "functions_00",
+    "CheckAuthenticationPassword": "functions_00",
+    "RequestAuthenticationPasswordRecovery": "functions_00",
+    "CheckAuthenticationPasswordRecoveryCode": "functions_00",
+    "RecoverAuthenticationPassword": "functions_00",
+    "SendAuthenticationFirebaseSms": "functions_00",
+    "ReportAuthenticationCodeMissing": "functions_00",
+    "CheckAuthenticationBotToken": "functions_00",
+    "LogOut": "functions_00",
+    "Close": "functions_00",
+    "Destroy": "functions_00",
+    "ConfirmQrCodeAuthentication": "functions_00",
+    "GetCurrentState": "functions_00",
+    "SetDatabaseEncryptionKey": "functions_00",
+    "GetPasswordState": "functions_00",
+    "SetPassword": "functions_00",
+    "SetLoginEmailAddress": "functions_00",
+    "ResendLoginEmailAddressCode": "functions_00",
+    "CheckLoginEmailAddressCode": "functions_00",
+    "GetRecoveryEmailAddress": "functions_00",
+    "SetRecoveryEmailAddress": "functions_00",
+    "CheckRecoveryEmailAddressCode": "functions_00",
+    "ResendRecoveryEmailAddressCode": "functions_00",
+    "CancelRecoveryEmailAddressVerification": "functions_00",
+    "RequestPasswordRecovery": "functions_00",
+    "CheckPasswordRecoveryCode": "functions_00",
+    "RecoverPassword": "functions_00",
+    "ResetPassword": "functions_00",
+    "CancelPasswordReset": "functions_00",
+    "CreateTemporaryPassword": "functions_00",
+    "GetTemporaryPasswordState": "functions_00",
+    "GetMe": "functions_00",
+    "GetUser": "functions_00",
+    "GetUserFullInfo": "functions_00",
+    "GetBasicGroup": "functions_00",
+    "GetBasicGroupFullInfo": "functions_00",
+    "GetSupergroup": "functions_00",
+    "GetSupergroupFullInfo": "functions_00",
+    "GetSecretChat": "functions_00",
+    "GetChat": "functions_00",
+    "GetMessage": "functions_00",
+    "GetMessageLocally": "functions_00",
+    "GetRepliedMessage": "functions_00",
+    "GetChatPinnedMessage": "functions_00",
+    "GetCallbackQueryMessage": "functions_00",
+    "GetMessages": "functions_00",
+    "GetMessageProperties": "functions_00",
+    "GetMessageThread": "functions_00",
+    "GetMessageReadDate": "functions_00",
+    "GetMessageViewers": "functions_00",
+    "GetMessageAuthor": "functions_00",
+    "GetFile": "functions_00",
+    "GetRemoteFile": "functions_00",
+    "LoadChats": "functions_01",
+    "GetChats": "functions_01",
+    "SearchPublicChat": "functions_01",
+    "SearchPublicChats": "functions_01",
+    "SearchChats": "functions_01",
+    "SearchChatsOnServer": "functions_01",
+    "GetRecommendedChats": "functions_01",
+    "GetChatSimilarChats": "functions_01",
+    "GetChatSimilarChatCount": "functions_01",
+    "OpenChatSimilarChat": "functions_01",
+    "GetBotSimilarBots": "functions_01",
+    "GetBotSimilarBotCount": "functions_01",
+    "OpenBotSimilarBot": "functions_01",
+    "GetTopChats": "functions_01",
+    "RemoveTopChat": "functions_01",
+    "SearchRecentlyFoundChats": "functions_01",
+    "AddRecentlyFoundChat": "functions_01",
+    "RemoveRecentlyFoundChat": "functions_01",
+    "ClearRecentlyFoundChats": "functions_01",
+    "GetRecentlyOpenedChats": "functions_01",
+    "CheckChatUsername": "functions_01",
+    "GetCreatedPublicChats": "functions_01",
+    "CheckCreatedPublicChatsLimit": "functions_01",
+    "GetSuitableDiscussionChats": "functions_01",
+    "GetInactiveSupergroupChats": "functions_01",
+    "GetSuitablePersonalChats": "functions_01",
+    "LoadDirectMessagesChatTopics": "functions_01",
+    "GetDirectMessagesChatTopic": "functions_01",
+    "GetDirectMessagesChatTopicHistory": "functions_01",
+    "GetDirectMessagesChatTopicMessageByDate": "functions_01",
+    "DeleteDirectMessagesChatTopicHistory": "functions_01",
+    "DeleteDirectMessagesChatTopicMessagesByDate": "functions_01",
+    "SetDirectMessagesChatTopicIsMarkedAsUnread": "functions_01",
+    "SetDirectMessagesChatTopicDraftMessage": "functions_01",
+    "UnpinAllDirectMessagesChatTopicMessages": "functions_01",
+    "ReadAllDirectMessagesChatTopicReactions": "functions_01",
+    "GetDirectMessagesChatTopicRevenue": "functions_01",
+    "ToggleDirectMessagesChatTopicCanSendUnpaidMessages": "functions_01",
+    "LoadSavedMessagesTopics": "functions_01",
+    "GetSavedMessagesTopicHistory": "functions_01",
+    "GetSavedMessagesTopicMessageByDate": "functions_01",
+    "DeleteSavedMessagesTopicHistory": "functions_01",
+    "DeleteSavedMessagesTopicMessagesByDate": "functions_01",
+    "ToggleSavedMessagesTopicIsPinned": "functions_01",
+    "SetPinnedSavedMessagesTopics": "functions_01",
+    "GetGroupsInCommon": "functions_01",
+    "GetChatHistory": "functions_01",
+    "GetMessageThreadHistory": "functions_01",
+    "DeleteChatHistory": "functions_01",
+    "DeleteChat": "functions_01",
+    "SearchChatMessages": "functions_01",
+    "SearchMessages": "functions_01",
+    "SearchSecretMessages": "functions_01",
+    "SearchSavedMessages": "functions_01",
+    "SearchCallMessages": "functions_01",
+    "SearchOutgoingDocumentMessages": "functions_01",
+    "SearchPublicMessagesByTag": "functions_01",
+    "SearchPublicStoriesByTag": "functions_01",
+    "SearchPublicStoriesByLocation": "functions_01",
+    "SearchPublicStoriesByVenue": "functions_01",
+    "GetSearchedForTags": "functions_01",
+    "RemoveSearchedForTag": "functions_01",
+    "ClearSearchedForTags": "functions_01",
+    "DeleteAllCallMessages": "functions_01",
+    "SearchChatRecentLocationMessages": "functions_02",
+    "GetChatMessageByDate": "functions_02",
+    "GetChatSparseMessagePositions": "functions_02",
+    "GetChatMessageCalendar": "functions_02",
+    "GetChatMessageCount": "functions_02",
+    "GetChatMessagePosition": "functions_02",
+    "GetChatScheduledMessages": "functions_02",
+    "GetChatSponsoredMessages": "functions_02",
+    "ClickChatSponsoredMessage": "functions_02",
+    "ReportChatSponsoredMessage": "functions_02",
+    "GetSearchSponsoredChats": "functions_02",
+    "ViewSponsoredChat": "functions_02",
+    "OpenSponsoredChat": "functions_02",
+    "ReportSponsoredChat": "functions_02",
+    "GetVideoMessageAdvertisements": "functions_02",
+    "ViewVideoMessageAdvertisement": "functions_02",
+    "ClickVideoMessageAdvertisement": "functions_02",
+    "ReportVideoMessageAdvertisement": "functions_02",
+    "RemoveNotification": "functions_02",
+    "RemoveNotificationGroup": "functions_02",
+    "GetMessageLink": "functions_02",
+    "GetMessageEmbeddingCode": "functions_02",
+    "GetMessageLinkInfo": "functions_02",
+    "TranslateText": "functions_02",
+    "TranslateMessageText": "functions_02",
+    "RecognizeSpeech": "functions_02",
+    "RateSpeechRecognition": "functions_02",
+    "GetChatAvailableMessageSenders": "functions_02",
+    "SetChatMessageSender": "functions_02",
+    "SendMessage": "functions_02",
+    "SendMessageAlbum": "functions_02",
+    "SendBotStartMessage": "functions_02",
+    "SendInlineQueryResultMessage": "functions_02",
+    "ForwardMessages": "functions_02",
+    "SendQuickReplyShortcutMessages": "functions_02",
+    "ResendMessages": "functions_02",
+    "AddLocalMessage": "functions_02",
+    "DeleteMessages": "functions_02",
+    "DeleteChatMessagesBySender": "functions_02",
+    "DeleteChatMessagesByDate": "functions_02",
+    "EditMessageText": "functions_02",
+    "EditMessageLiveLocation": "functions_02",
+    "EditMessageChecklist": "functions_02",
+    "EditMessageMedia": "functions_02",
+    "EditMessageCaption": "functions_02",
+    "EditMessageReplyMarkup": "functions_02",
+    "EditInlineMessageText": "functions_02",
+    "EditInlineMessageLiveLocation": "functions_02",
+    "EditInlineMessageMedia": "functions_02",
+    "EditInlineMessageCaption": "functions_02",
+    "EditInlineMessageReplyMarkup": "functions_02",
+    "EditMessageSchedulingState": "functions_02",
+    "SetMessageFactCheck": "functions_02",
+    "SendBusinessMessage": "functions_02",
+    "SendBusinessMessageAlbum": "functions_02",
+    "EditBusinessMessageText": "functions_02",
+    "EditBusinessMessageLiveLocation": "functions_02",
+    "EditBusinessMessageChecklist": "functions_02",
+    "EditBusinessMessageMedia": "functions_02",
+    "EditBusinessMessageCaption": "functions_02",
+    "EditBusinessMessageReplyMarkup": "functions_02",
+    "StopBusinessPoll": "functions_02",
+    "SetBusinessMessageIsPinned": "functions_02",
+    "ReadBusinessMessage": "functions_02",
+    "DeleteBusinessMessages": "functions_03",
+    "EditBusinessStory": "functions_03",
+    "DeleteBusinessStory": "functions_03",
+    "SetBusinessAccountName": "functions_03",
+    "SetBusinessAccountBio": "functions_03",
+    "SetBusinessAccountProfilePhoto": "functions_03",
+    "SetBusinessAccountUsername": "functions_03",
+    "SetBusinessAccountGiftSettings": "functions_03",
+    "GetBusinessAccountStarAmount": "functions_03",
+    "TransferBusinessAccountStars": "functions_03",
+    "CheckQuickReplyShortcutName": "functions_03",
+    "LoadQuickReplyShortcuts": "functions_03",
+    "SetQuickReplyShortcutName": "functions_03",
+    "DeleteQuickReplyShortcut": "functions_03",
+    "ReorderQuickReplyShortcuts": "functions_03",
+    "LoadQuickReplyShortcutMessages": "functions_03",
+    "DeleteQuickReplyShortcutMessages": "functions_03",
+    "AddQuickReplyShortcutMessage": "functions_03",
+    "AddQuickReplyShortcutInlineQueryResultMessage": "functions_03",
+    "AddQuickReplyShortcutMessageAlbum": "functions_03",
+    "ReaddQuickReplyShortcutMessages": "functions_03",
+    "EditQuickReplyMessage": "functions_03",
+    "GetForumTopicDefaultIcons": "functions_03",
+    "CreateForumTopic": "functions_03",
+    "EditForumTopic": "functions_03",
+    "GetForumTopic": "functions_03",
+    "GetForumTopicLink": "functions_03",
+    "GetForumTopics": "functions_03",
+    "SetForumTopicNotificationSettings": "functions_03",
+    "ToggleForumTopicIsClosed": "functions_03",
+    "ToggleGeneralForumTopicIsHidden": "functions_03",
+    "ToggleForumTopicIsPinned": "functions_03",
+    "SetPinnedForumTopics": "functions_03",
+    "DeleteForumTopic": "functions_03",
+    "GetEmojiReaction": "functions_03",
+    "GetCustomEmojiReactionAnimations": "functions_03",
+    "GetMessageAvailableReactions": "functions_03",
+    "ClearRecentReactions": "functions_03",
+    "AddMessageReaction": "functions_03",
+    "RemoveMessageReaction": "functions_03",
+    "GetChatAvailablePaidMessageReactionSenders": "functions_03",
+    "AddPendingPaidMessageReaction": "functions_03",
+    "CommitPendingPaidMessageReactions": "functions_03",
+    "RemovePendingPaidMessageReactions": "functions_03",
+    "SetPaidMessageReactionType": "functions_03",
+    "SetMessageReactions": "functions_03",
+    "GetMessageAddedReactions": "functions_03",
+    "SetDefaultReactionType": "functions_03",
+    "GetSavedMessagesTags": "functions_03",
+    "SetSavedMessagesTagLabel": "functions_03",
+    "GetMessageEffect": "functions_03",
+    "SearchQuote": "functions_03",
+    "GetTextEntities": "functions_03",
+    "ParseTextEntities": "functions_03",
+    "ParseMarkdown": "functions_03",
+    "GetMarkdownText": "functions_03",
+    "GetCountryFlagEmoji": "functions_03",
+    "GetFileMimeType": "functions_03",
+    "GetFileExtension": "functions_03",
+    "CleanFileName": "functions_03",
+    "GetLanguagePackString": "functions_03",
+    "GetJsonValue": "functions_03",
+    "GetJsonString": "functions_03",
+    "GetThemeParametersJsonString": "functions_03",
+    "SetPollAnswer": "functions_04",
+    "GetPollVoters": "functions_04",
+    "StopPoll": "functions_04",
+    "AddChecklistTasks": "functions_04",
+    "MarkChecklistTasksAsDone": "functions_04",
+    "HideSuggestedAction": "functions_04",
+    "HideContactCloseBirthdays": "functions_04",
+    "GetBusinessConnection": "functions_04",
+    "GetLoginUrlInfo": "functions_04",
+    "GetLoginUrl": "functions_04",
+    "ShareUsersWithBot": "functions_04",
+    "ShareChatWithBot": "functions_04",
+    "GetInlineQueryResults": "functions_04",
+    "AnswerInlineQuery": "functions_04",
+    "SavePreparedInlineMessage": "functions_04",
+    "GetPreparedInlineMessage": "functions_04",
+    "GetGrossingWebAppBots": "functions_04",
+    "SearchWebApp": "functions_04",
+    "GetWebAppPlaceholder": "functions_04",
+    "GetWebAppLinkUrl": "functions_04",
+    "GetMainWebApp": "functions_04",
+    "GetWebAppUrl": "functions_04",
+    "SendWebAppData": "functions_04",
+    "OpenWebApp": "functions_04",
+    "CloseWebApp": "functions_04",
+    "AnswerWebAppQuery": "functions_04",
+    "CheckWebAppFileDownload": "functions_04",
+    "GetCallbackQueryAnswer": "functions_04",
+    "AnswerCallbackQuery": "functions_04",
+    "AnswerShippingQuery": "functions_04",
+    "AnswerPreCheckoutQuery": "functions_04",
+    "SetGameScore": "functions_04",
+    "SetInlineGameScore": "functions_04",
+    "GetGameHighScores": "functions_04",
+    "GetInlineGameHighScores": "functions_04",
+    "DeleteChatReplyMarkup": "functions_04",
+    "SendChatAction": "functions_04",
+    "OpenChat": "functions_04",
+    "CloseChat": "functions_04",
+    "ViewMessages": "functions_04",
+    "OpenMessageContent": "functions_04",
+    "ClickAnimatedEmojiMessage": "functions_04",
+    "GetInternalLink": "functions_04",
+    "GetInternalLinkType": "functions_04",
+    "GetExternalLinkInfo": "functions_04",
+    "GetExternalLink": "functions_04",
+    "ReadAllChatMentions": "functions_04",
+    "ReadAllMessageThreadMentions": "functions_04",
+    "ReadAllChatReactions": "functions_04",
+    "ReadAllMessageThreadReactions": "functions_04",
+    "CreatePrivateChat": "functions_04",
+    "CreateBasicGroupChat": "functions_04",
+    "CreateSupergroupChat": "functions_04",
+    "CreateSecretChat": "functions_04",
+    "CreateNewBasicGroupChat": "functions_04",
+    "CreateNewSupergroupChat": "functions_04",
+    "CreateNewSecretChat": "functions_04",
+    "UpgradeBasicGroupChatToSupergroupChat": "functions_04",
+    "GetChatListsToAddChat": "functions_04",
+    "AddChatToList": "functions_04",
+    "GetChatFolder": "functions_04",
+    "CreateChatFolder": "functions_04",
+    "EditChatFolder": "functions_04",
+    "DeleteChatFolder": "functions_04",
+    "GetChatFolderChatsToLeave": "functions_05",
+    "GetChatFolderChatCount": "functions_05",
+    "ReorderChatFolders": "functions_05",
+    "ToggleChatFolderTags": "functions_05",
+    "GetRecommendedChatFolders": "functions_05",
+    "GetChatFolderDefaultIconName": "functions_05",
+    "GetChatsForChatFolderInviteLink": "functions_05",
+    "CreateChatFolderInviteLink": "functions_05",
+    "GetChatFolderInviteLinks": "functions_05",
+    "EditChatFolderInviteLink": "functions_05",
+    "DeleteChatFolderInviteLink": "functions_05",
+    "CheckChatFolderInviteLink": "functions_05",
+    "AddChatFolderByInviteLink": "functions_05",
+    "GetChatFolderNewChats": "functions_05",
+    "ProcessChatFolderNewChats": "functions_05",
+    "GetArchiveChatListSettings": "functions_05",
+    "SetArchiveChatListSettings": "functions_05",
+    "SetChatTitle": "functions_05",
+    "SetChatPhoto": "functions_05",
+    "SetChatAccentColor": "functions_05",
+    "SetChatProfileAccentColor": "functions_05",
+    "SetChatMessageAutoDeleteTime": "functions_05",
+    "SetChatEmojiStatus": "functions_05",
+    "SetChatPermissions": "functions_05",
+    "SetChatBackground": "functions_05",
+    "DeleteChatBackground": "functions_05",
+    "SetChatTheme": "functions_05",
+    "SetChatDraftMessage": "functions_05",
+    "SetChatNotificationSettings": "functions_05",
+    "ToggleChatHasProtectedContent": "functions_05",
+    "ToggleChatViewAsTopics": "functions_05",
+    "ToggleChatIsTranslatable": "functions_05",
+    "ToggleChatIsMarkedAsUnread": "functions_05",
+    "ToggleChatDefaultDisableNotification": "functions_05",
+    "SetChatAvailableReactions": "functions_05",
+    "SetChatClientData": "functions_05",
+    "SetChatDescription": "functions_05",
+    "SetChatDiscussionGroup": "functions_05",
+    "SetChatDirectMessagesGroup": "functions_05",
+    "SetChatLocation": "functions_05",
+    "SetChatSlowModeDelay": "functions_05",
+    "PinChatMessage": "functions_05",
+    "UnpinChatMessage": "functions_05",
+    "UnpinAllChatMessages": "functions_05",
+    "UnpinAllMessageThreadMessages": "functions_05",
+    "JoinChat": "functions_05",
+    "LeaveChat": "functions_05",
+    "AddChatMember": "functions_05",
+    "AddChatMembers": "functions_05",
+    "SetChatMemberStatus": "functions_05",
+    "BanChatMember": "functions_05",
+    "CanTransferOwnership": "functions_05",
+    "TransferChatOwnership": "functions_05",
+    "GetChatMember": "functions_05",
+    "SearchChatMembers": "functions_05",
+    "GetChatAdministrators": "functions_05",
+    "ClearAllDraftMessages": "functions_05",
+    "GetSavedNotificationSound": "functions_05",
+    "GetSavedNotificationSounds": "functions_05",
+    "AddSavedNotificationSound": "functions_05",
+    "RemoveSavedNotificationSound": "functions_05",
+    "GetChatNotificationSettingsExceptions": "functions_05",
+    "GetScopeNotificationSettings": "functions_05",
+    "SetScopeNotificationSettings": "functions_05",
+    "SetReactionNotificationSettings": "functions_06",
+    "ResetAllNotificationSettings": "functions_06",
+    "ToggleChatIsPinned": "functions_06",
+    "SetPinnedChats": "functions_06",
+    "ReadChatList": "functions_06",
+    "GetCurrentWeather": "functions_06",
+    "GetStory": "functions_06",
+    "GetChatsToPostStories": "functions_06",
+    "CanPostStory": "functions_06",
+    "PostStory": "functions_06",
+    "EditStory": "functions_06",
+    "EditStoryCover": "functions_06",
+    "SetStoryPrivacySettings": "functions_06",
+    "ToggleStoryIsPostedToChatPage": "functions_06",
+    "DeleteStory": "functions_06",
+    "GetStoryNotificationSettingsExceptions": "functions_06",
+    "LoadActiveStories": "functions_06",
+    "SetChatActiveStoriesList": "functions_06",
+    "GetChatActiveStories": "functions_06",
+    "GetChatPostedToChatPageStories": "functions_06",
+    "GetChatArchivedStories": "functions_06",
+    "SetChatPinnedStories": "functions_06",
+    "OpenStory": "functions_06",
+    "CloseStory": "functions_06",
+    "GetStoryAvailableReactions": "functions_06",
+    "SetStoryReaction": "functions_06",
+    "GetStoryInteractions": "functions_06",
+    "GetChatStoryInteractions": "functions_06",
+    "ReportStory": "functions_06",
+    "ActivateStoryStealthMode": "functions_06",
+    "GetStoryPublicForwards": "functions_06",
+    "GetChatBoostLevelFeatures": "functions_06",
+    "GetChatBoostFeatures": "functions_06",
+    "GetAvailableChatBoostSlots": "functions_06",
+    "GetChatBoostStatus": "functions_06",
+    "BoostChat": "functions_06",
+    "GetChatBoostLink": "functions_06",
+    "GetChatBoostLinkInfo": "functions_06",
+    "GetChatBoosts": "functions_06",
+    "GetUserChatBoosts": "functions_06",
+    "GetAttachmentMenuBot": "functions_06",
+    "ToggleBotIsAddedToAttachmentMenu": "functions_06",
+    "GetThemedEmojiStatuses": "functions_06",
+    "GetRecentEmojiStatuses": "functions_06",
+    "GetUpgradedGiftEmojiStatuses": "functions_06",
+    "GetDefaultEmojiStatuses": "functions_06",
+    "ClearRecentEmojiStatuses": "functions_06",
+    "GetThemedChatEmojiStatuses": "functions_06",
+    "GetDefaultChatEmojiStatuses": "functions_06",
+    "GetDisallowedChatEmojiStatuses": "functions_06",
+    "DownloadFile": "functions_06",
+    "GetFileDownloadedPrefixSize": "functions_06",
+    "CancelDownloadFile": "functions_06",
+    "GetSuggestedFileName": "functions_06",
+    "PreliminaryUploadFile": "functions_06",
+    "CancelPreliminaryUploadFile": "functions_06",
+    "WriteGeneratedFilePart": "functions_06",
+    "SetFileGenerationProgress": "functions_06",
+    "FinishFileGeneration": "functions_06",
+    "ReadFilePart": "functions_06",
+    "DeleteFile": "functions_06",
+    "AddFileToDownloads": "functions_06",
+    "ToggleDownloadIsPaused": "functions_06",
+    "ToggleAllDownloadsArePaused": "functions_06",
+    "RemoveFileFromDownloads": "functions_07",
+    "RemoveAllFilesFromDownloads": "functions_07",
+    "SearchFileDownloads": "functions_07",
+    "SetApplicationVerificationToken": "functions_07",
+    "GetMessageFileType": "functions_07",
+    "GetMessageImportConfirmationText": "functions_07",
+    "ImportMessages": "functions_07",
+    "ReplacePrimaryChatInviteLink": "functions_07",
+    "CreateChatInviteLink": "functions_07",
+    "CreateChatSubscriptionInviteLink": "functions_07",
+    "EditChatInviteLink": "functions_07",
+    "EditChatSubscriptionInviteLink": "functions_07",
+    "GetChatInviteLink": "functions_07",
+    "GetChatInviteLinkCounts": "functions_07",
+    "GetChatInviteLinks": "functions_07",
+    "GetChatInviteLinkMembers": "functions_07",
+    "RevokeChatInviteLink": "functions_07",
+    "DeleteRevokedChatInviteLink": "functions_07",
+    "DeleteAllRevokedChatInviteLinks": "functions_07",
+    "CheckChatInviteLink": "functions_07",
+    "JoinChatByInviteLink": "functions_07",
+    "GetChatJoinRequests": "functions_07",
+    "ProcessChatJoinRequest": "functions_07",
+    "ProcessChatJoinRequests": "functions_07",
+    "ApproveSuggestedPost": "functions_07",
+    "DeclineSuggestedPost": "functions_07",
+    "AddOffer": "functions_07",
+    "CreateCall": "functions_07",
+    "AcceptCall": "functions_07",
+    "SendCallSignalingData": "functions_07",
+    "DiscardCall": "functions_07",
+    "SendCallRating": "functions_07",
+    "SendCallDebugInformation": "functions_07",
+    "SendCallLog": "functions_07",
+    "GetVideoChatAvailableParticipants": "functions_07",
+    "SetVideoChatDefaultParticipant": "functions_07",
+    "CreateVideoChat": "functions_07",
+    "CreateGroupCall": "functions_07",
+    "GetVideoChatRtmpUrl": "functions_07",
+    "ReplaceVideoChatRtmpUrl": "functions_07",
+    "GetGroupCall": "functions_07",
+    "StartScheduledVideoChat": "functions_07",
+    "ToggleVideoChatEnabledStartNotification": "functions_07",
+    "JoinGroupCall": "functions_07",
+    "JoinVideoChat": "functions_07",
+    "StartGroupCallScreenSharing": "functions_07",
+    "ToggleGroupCallScreenSharingIsPaused": "functions_07",
+    "EndGroupCallScreenSharing": "functions_07",
+    "SetVideoChatTitle": "functions_07",
+    "ToggleVideoChatMuteNewParticipants": "functions_07",
+    "InviteGroupCallParticipant": "functions_07",
+    "DeclineGroupCallInvitation": "functions_07",
+    "BanGroupCallParticipants": "functions_07",
+    "InviteVideoChatParticipants": "functions_07",
+    "GetVideoChatInviteLink": "functions_07",
+    "RevokeGroupCallInviteLink": "functions_07",
+    "StartGroupCallRecording": "functions_07",
+    "EndGroupCallRecording": "functions_07",
+    "ToggleGroupCallIsMyVideoPaused": "functions_07",
+    "ToggleGroupCallIsMyVideoEnabled": "functions_07",
+    "SetGroupCallParticipantIsSpeaking": "functions_07",
+    "ToggleGroupCallParticipantIsMuted": "functions_07",
+    "SetGroupCallParticipantVolumeLevel": "functions_07",
+    "ToggleGroupCallParticipantIsHandRaised": "functions_07",
+    "GetGroupCallParticipants": "functions_08",
+    "LoadGroupCallParticipants": "functions_08",
+    "LeaveGroupCall": "functions_08",
+    "EndGroupCall": "functions_08",
+    "GetVideoChatStreams": "functions_08",
+    "GetVideoChatStreamSegment": "functions_08",
+    "EncryptGroupCallData": "functions_08",
+    "DecryptGroupCallData": "functions_08",
+    "SetMessageSenderBlockList": "functions_08",
+    "BlockMessageSenderFromReplies": "functions_08",
+    "GetBlockedMessageSenders": "functions_08",
+    "AddContact": "functions_08",
+    "ImportContacts": "functions_08",
+    "GetContacts": "functions_08",
+    "SearchContacts": "functions_08",
+    "RemoveContacts": "functions_08",
+    "GetImportedContactCount": "functions_08",
+    "ChangeImportedContacts": "functions_08",
+    "ClearImportedContacts": "functions_08",
+    "SetCloseFriends": "functions_08",
+    "GetCloseFriends": "functions_08",
+    "SetUserPersonalProfilePhoto": "functions_08",
+    "SuggestUserProfilePhoto": "functions_08",
+    "ToggleBotCanManageEmojiStatus": "functions_08",
+    "SetUserEmojiStatus": "functions_08",
+    "SearchUserByPhoneNumber": "functions_08",
+    "SharePhoneNumber": "functions_08",
+    "GetUserProfilePhotos": "functions_08",
+    "GetStickerOutline": "functions_08",
+    "GetStickers": "functions_08",
+    "GetAllStickerEmojis": "functions_08",
+    "SearchStickers": "functions_08",
+    "GetGreetingStickers": "functions_08",
+    "GetPremiumStickers": "functions_08",
+    "GetInstalledStickerSets": "functions_08",
+    "GetArchivedStickerSets": "functions_08",
+    "GetTrendingStickerSets": "functions_08",
+    "GetAttachedStickerSets": "functions_08",
+    "GetStickerSet": "functions_08",
+    "GetStickerSetName": "functions_08",
+    "SearchStickerSet": "functions_08",
+    "SearchInstalledStickerSets": "functions_08",
+    "SearchStickerSets": "functions_08",
+    "ChangeStickerSet": "functions_08",
+    "ViewTrendingStickerSets": "functions_08",
+    "ReorderInstalledStickerSets": "functions_08",
+    "GetRecentStickers": "functions_08",
+    "AddRecentSticker": "functions_08",
+    "RemoveRecentSticker": "functions_08",
+    "ClearRecentStickers": "functions_08",
+    "GetFavoriteStickers": "functions_08",
+    "AddFavoriteSticker": "functions_08",
+    "RemoveFavoriteSticker": "functions_08",
+    "GetStickerEmojis": "functions_08",
+    "SearchEmojis": "functions_08",
+    "GetKeywordEmojis": "functions_08",
+    "GetEmojiCategories": "functions_08",
+    "GetAnimatedEmoji": "functions_08",
+    "GetEmojiSuggestionsUrl": "functions_08",
+    "GetCustomEmojiStickers": "functions_08",
+    "GetDefaultChatPhotoCustomEmojiStickers": "functions_08",
+    "GetDefaultProfilePhotoCustomEmojiStickers": "functions_08",
+    "GetDefaultBackgroundCustomEmojiStickers": "functions_08",
+    "GetSavedAnimations": "functions_08",
+    "AddSavedAnimation": "functions_09",
+    "RemoveSavedAnimation": "functions_09",
+    "GetRecentInlineBots": "functions_09",
+    "GetOwnedBots": "functions_09",
+    "SearchHashtags": "functions_09",
+    "RemoveRecentHashtag": "functions_09",
+    "GetLinkPreview": "functions_09",
+    "GetWebPageInstantView": "functions_09",
+    "SetProfilePhoto": "functions_09",
+    "DeleteProfilePhoto": "functions_09",
+    "SetAccentColor": "functions_09",
+    "SetProfileAccentColor": "functions_09",
+    "SetName": "functions_09",
+    "SetBio": "functions_09",
+    "SetUsername": "functions_09",
+    "ToggleUsernameIsActive": "functions_09",
+    "ReorderActiveUsernames": "functions_09",
+    "SetBirthdate": "functions_09",
+    "SetPersonalChat": "functions_09",
+    "SetEmojiStatus": "functions_09",
+    "ToggleHasSponsoredMessagesEnabled": "functions_09",
+    "SetBusinessLocation": "functions_09",
+    "SetBusinessOpeningHours": "functions_09",
+    "SetBusinessGreetingMessageSettings": "functions_09",
+    "SetBusinessAwayMessageSettings": "functions_09",
+    "SetBusinessStartPage": "functions_09",
+    "SendPhoneNumberCode": "functions_09",
+    "SendPhoneNumberFirebaseSms": "functions_09",
+    "ReportPhoneNumberCodeMissing": "functions_09",
+    "ResendPhoneNumberCode": "functions_09",
+    "CheckPhoneNumberCode": "functions_09",
+    "GetBusinessConnectedBot": "functions_09",
+    "SetBusinessConnectedBot": "functions_09",
+    "DeleteBusinessConnectedBot": "functions_09",
+    "ToggleBusinessConnectedBotChatIsPaused": "functions_09",
+    "RemoveBusinessConnectedBotFromChat": "functions_09",
+    "GetBusinessChatLinks": "functions_09",
+    "CreateBusinessChatLink": "functions_09",
+    "EditBusinessChatLink": "functions_09",
+    "DeleteBusinessChatLink": "functions_09",
+    "GetBusinessChatLinkInfo": "functions_09",
+    "GetUserLink": "functions_09",
+    "SearchUserByToken": "functions_09",
+    "SetCommands": "functions_09",
+    "DeleteCommands": "functions_09",
+    "GetCommands": "functions_09",
+    "SetMenuButton": "functions_09",
+    "GetMenuButton": "functions_09",
+    "SetDefaultGroupAdministratorRights": "functions_09",
+    "SetDefaultChannelAdministratorRights": "functions_09",
+    "CanBotSendMessages": "functions_09",
+    "AllowBotToSendMessages": "functions_09",
+    "SendWebAppCustomRequest": "functions_09",
+    "GetBotMediaPreviews": "functions_09",
+    "GetBotMediaPreviewInfo": "functions_09",
+    "AddBotMediaPreview": "functions_09",
+    "EditBotMediaPreview": "functions_09",
+    "ReorderBotMediaPreviews": "functions_09",
+    "DeleteBotMediaPreviews": "functions_09",
+    "SetBotName": "functions_09",
+    "GetBotName": "functions_09",
+    "SetBotProfilePhoto": "functions_09",
+    "ToggleBotUsernameIsActive": "functions_09",
+    "ReorderBotActiveUsernames": "functions_09",
+    "SetBotInfoDescription": "functions_10",
+    "GetBotInfoDescription": "functions_10",
+    "SetBotInfoShortDescription": "functions_10",
+    "GetBotInfoShortDescription": "functions_10",
+    "SetMessageSenderBotVerification": "functions_10",
+    "RemoveMessageSenderBotVerification": "functions_10",
+    "GetActiveSessions": "functions_10",
+    "TerminateSession": "functions_10",
+    "TerminateAllOtherSessions": "functions_10",
+    "ConfirmSession": "functions_10",
+    "ToggleSessionCanAcceptCalls": "functions_10",
+    "ToggleSessionCanAcceptSecretChats": "functions_10",
+    "SetInactiveSessionTtl": "functions_10",
+    "GetConnectedWebsites": "functions_10",
+    "DisconnectWebsite": "functions_10",
+    "DisconnectAllWebsites": "functions_10",
+    "SetSupergroupUsername": "functions_10",
+    "ToggleSupergroupUsernameIsActive": "functions_10",
+    "DisableAllSupergroupUsernames": "functions_10",
+    "ReorderSupergroupActiveUsernames": "functions_10",
+    "SetSupergroupStickerSet": "functions_10",
+    "SetSupergroupCustomEmojiStickerSet": "functions_10",
+    "SetSupergroupUnrestrictBoostCount": "functions_10",
+    "ToggleSupergroupSignMessages": "functions_10",
+    "ToggleSupergroupJoinToSendMessages": "functions_10",
+    "ToggleSupergroupJoinByRequest": "functions_10",
+    "ToggleSupergroupIsAllHistoryAvailable": "functions_10",
+    "ToggleSupergroupCanHaveSponsoredMessages": "functions_10",
+    "ToggleSupergroupHasAutomaticTranslation": "functions_10",
+    "ToggleSupergroupHasHiddenMembers": "functions_10",
+    "ToggleSupergroupHasAggressiveAntiSpamEnabled": "functions_10",
+    "ToggleSupergroupIsForum": "functions_10",
+    "ToggleSupergroupIsBroadcastGroup": "functions_10",
+    "ReportSupergroupSpam": "functions_10",
+    "ReportSupergroupAntiSpamFalsePositive": "functions_10",
+    "GetSupergroupMembers": "functions_10",
+    "CloseSecretChat": "functions_10",
+    "GetChatEventLog": "functions_10",
+    "GetTimeZones": "functions_10",
+    "GetPaymentForm": "functions_10",
+    "ValidateOrderInfo": "functions_10",
+    "SendPaymentForm": "functions_10",
+    "GetPaymentReceipt": "functions_10",
+    "GetSavedOrderInfo": "functions_10",
+    "DeleteSavedOrderInfo": "functions_10",
+    "DeleteSavedCredentials": "functions_10",
+    "SetGiftSettings": "functions_10",
+    "GetAvailableGifts": "functions_10",
+    "SendGift": "functions_10",
+    "SellGift": "functions_10",
+    "ToggleGiftIsSaved": "functions_10",
+    "SetPinnedGifts": "functions_10",
+    "ToggleChatGiftNotifications": "functions_10",
+    "GetGiftUpgradePreview": "functions_10",
+    "UpgradeGift": "functions_10",
+    "TransferGift": "functions_10",
+    "SendResoldGift": "functions_10",
+    "GetReceivedGifts": "functions_10",
+    "GetReceivedGift": "functions_10",
+    "GetUpgradedGift": "functions_10",
+    "GetUpgradedGiftWithdrawalUrl": "functions_10",
+    "SetGiftResalePrice": "functions_10",
+    "SearchGiftsForResale": "functions_10",
+    "CreateInvoiceLink": "functions_10",
+    "RefundStarPayment": "functions_11",
+    "GetSupportUser": "functions_11",
+    "GetBackgroundUrl": "functions_11",
+    "SearchBackground": "functions_11",
+    "SetDefaultBackground": "functions_11",
+    "DeleteDefaultBackground": "functions_11",
+    "GetInstalledBackgrounds": "functions_11",
+    "RemoveInstalledBackground": "functions_11",
+    "ResetInstalledBackgrounds": "functions_11",
+    "GetLocalizationTargetInfo": "functions_11",
+    "GetLanguagePackInfo": "functions_11",
+    "GetLanguagePackStrings": "functions_11",
+    "SynchronizeLanguagePack": "functions_11",
+    "AddCustomServerLanguagePack": "functions_11",
+    "SetCustomLanguagePack": "functions_11",
+    "EditCustomLanguagePackInfo": "functions_11",
+    "SetCustomLanguagePackString": "functions_11",
+    "DeleteLanguagePack": "functions_11",
+    "RegisterDevice": "functions_11",
+    "ProcessPushNotification": "functions_11",
+    "GetPushReceiverId": "functions_11",
+    "GetRecentlyVisitedTMeUrls": "functions_11",
+    "SetUserPrivacySettingRules": "functions_11",
+    "GetUserPrivacySettingRules": "functions_11",
+    "SetReadDatePrivacySettings": "functions_11",
+    "GetReadDatePrivacySettings": "functions_11",
+    "SetNewChatPrivacySettings": "functions_11",
+    "GetNewChatPrivacySettings": "functions_11",
+    "GetPaidMessageRevenue": "functions_11",
+    "AllowUnpaidMessagesFromUser": "functions_11",
+    "SetChatPaidMessageStarCount": "functions_11",
+    "CanSendMessageToUser": "functions_11",
+    "GetOption": "functions_11",
+    "SetOption": "functions_11",
+    "SetAccountTtl": "functions_11",
+    "GetAccountTtl": "functions_11",
+    "DeleteAccount": "functions_11",
+    "SetDefaultMessageAutoDeleteTime": "functions_11",
+    "GetDefaultMessageAutoDeleteTime": "functions_11",
+    "RemoveChatActionBar": "functions_11",
+    "ReportChat": "functions_11",
+    "ReportChatPhoto": "functions_11",
+    "ReportMessageReactions": "functions_11",
+    "GetChatRevenueStatistics": "functions_11",
+    "GetChatRevenueWithdrawalUrl": "functions_11",
+    "GetChatRevenueTransactions": "functions_11",
+    "GetTonTransactions": "functions_11",
+    "GetStarRevenueStatistics": "functions_11",
+    "GetStarWithdrawalUrl": "functions_11",
+    "GetStarAdAccountUrl": "functions_11",
+    "GetChatStatistics": "functions_11",
+    "GetMessageStatistics": "functions_11",
+    "GetMessagePublicForwards": "functions_11",
+    "GetStoryStatistics": "functions_11",
+    "GetStatisticalGraph": "functions_11",
+    "GetStorageStatistics": "functions_11",
+    "GetStorageStatisticsFast": "functions_11",
+    "GetDatabaseStatistics": "functions_11",
+    "OptimizeStorage": "functions_11",
+    "SetNetworkType": "functions_11",
+    "GetNetworkStatistics": "functions_11",
+    "AddNetworkStatistics": "functions_11",
+    "ResetNetworkStatistics": "functions_11",
+    "GetAutoDownloadSettingsPresets": "functions_11",
+    "SetAutoDownloadSettings": "functions_12",
+    "GetAutosaveSettings": "functions_12",
+    "SetAutosaveSettings": "functions_12",
+    "ClearAutosaveSettingsExceptions": "functions_12",
+    "GetBankCardInfo": "functions_12",
+    "GetPassportElement": "functions_12",
+    "GetAllPassportElements": "functions_12",
+    "SetPassportElement": "functions_12",
+    "DeletePassportElement": "functions_12",
+    "SetPassportElementErrors": "functions_12",
+    "GetPreferredCountryLanguage": "functions_12",
+    "SendEmailAddressVerificationCode": "functions_12",
+    "ResendEmailAddressVerificationCode": "functions_12",
+    "CheckEmailAddressVerificationCode": "functions_12",
+    "GetPassportAuthorizationForm": "functions_12",
+    "GetPassportAuthorizationFormAvailableElements": "functions_12",
+    "SendPassportAuthorizationForm": "functions_12",
+    "SetBotUpdatesStatus": "functions_12",
+    "UploadStickerFile": "functions_12",
+    "GetSuggestedStickerSetName": "functions_12",
+    "CheckStickerSetName": "functions_12",
+    "CreateNewStickerSet": "functions_12",
+    "AddStickerToSet": "functions_12",
+    "ReplaceStickerInSet": "functions_12",
+    "SetStickerSetThumbnail": "functions_12",
+    "SetCustomEmojiStickerSetThumbnail": "functions_12",
+    "SetStickerSetTitle": "functions_12",
+    "DeleteStickerSet": "functions_12",
+    "SetStickerPositionInSet": "functions_12",
+    "RemoveStickerFromSet": "functions_12",
+    "SetStickerEmojis": "functions_12",
+    "SetStickerKeywords": "functions_12",
+    "SetStickerMaskPosition": "functions_12",
+    "GetOwnedStickerSets": "functions_12",
+    "GetMapThumbnailFile": "functions_12",
+    "GetPremiumLimit": "functions_12",
+    "GetPremiumFeatures": "functions_12",
+    "GetPremiumStickerExamples": "functions_12",
+    "GetPremiumInfoSticker": "functions_12",
+    "ViewPremiumFeature": "functions_12",
+    "ClickPremiumSubscriptionButton": "functions_12",
+    "GetPremiumState": "functions_12",
+    "GetPremiumGiftPaymentOptions": "functions_12",
+    "GetPremiumGiveawayPaymentOptions": "functions_12",
+    "CheckPremiumGiftCode": "functions_12",
+    "ApplyPremiumGiftCode": "functions_12",
+    "GiftPremiumWithStars": "functions_12",
+    "LaunchPrepaidGiveaway": "functions_12",
+    "GetGiveawayInfo": "functions_12",
+    "GetStarPaymentOptions": "functions_12",
+    "GetStarGiftPaymentOptions": "functions_12",
+    "GetStarGiveawayPaymentOptions": "functions_12",
+    "GetStarTransactions": "functions_12",
+    "GetStarSubscriptions": "functions_12",
+    "CanPurchaseFromStore": "functions_12",
+    "AssignStoreTransaction": "functions_12",
+    "EditStarSubscription": "functions_12",
+    "EditUserStarSubscription": "functions_12",
+    "ReuseStarSubscription": "functions_12",
+    "SetChatAffiliateProgram": "functions_12",
+    "SearchChatAffiliateProgram": "functions_12",
+    "SearchAffiliatePrograms": "functions_12",
+    "ConnectAffiliateProgram": "functions_12",
+    "DisconnectAffiliateProgram": "functions_12",
+    "GetConnectedAffiliateProgram": "functions_13",
+    "GetConnectedAffiliatePrograms": "functions_13",
+    "GetBusinessFeatures": "functions_13",
+    "AcceptTermsOfService": "functions_13",
+    "SearchStringsByPrefix": "functions_13",
+    "SendCustomRequest": "functions_13",
+    "AnswerCustomQuery": "functions_13",
+    "SetAlarm": "functions_13",
+    "GetCountries": "functions_13",
+    "GetCountryCode": "functions_13",
+    "GetPhoneNumberInfo": "functions_13",
+    "GetPhoneNumberInfoSync": "functions_13",
+    "GetCollectibleItemInfo": "functions_13",
+    "GetDeepLinkInfo": "functions_13",
+    "GetApplicationConfig": "functions_13",
+    "SaveApplicationLogEvent": "functions_13",
+    "GetApplicationDownloadLink": "functions_13",
+    "AddProxy": "functions_13",
+    "EditProxy": "functions_13",
+    "EnableProxy": "functions_13",
+    "DisableProxy": "functions_13",
+    "RemoveProxy": "functions_13",
+    "GetProxies": "functions_13",
+    "GetProxyLink": "functions_13",
+    "PingProxy": "functions_13",
+    "SetLogStream": "functions_13",
+    "GetLogStream": "functions_13",
+    "SetLogVerbosityLevel": "functions_13",
+    "GetLogVerbosityLevel": "functions_13",
+    "GetLogTags": "functions_13",
+    "SetLogTagVerbosityLevel": "functions_13",
+    "GetLogTagVerbosityLevel": "functions_13",
+    "AddLogMessage": "functions_13",
+    "GetUserSupportInfo": "functions_13",
+    "SetUserSupportInfo": "functions_13",
+    "GetSupportName": "functions_13",
+    "TestCallEmpty": "functions_13",
+    "TestCallString": "functions_13",
+    "TestCallBytes": "functions_13",
+    "TestCallVectorInt": "functions_13",
+    "TestCallVectorIntObject": "functions_13",
+    "TestCallVectorString": "functions_13",
+    "TestCallVectorStringObject": "functions_13",
+    "TestSquareInt": "functions_13",
+    "TestNetwork": "functions_13",
+    "TestProxy": "functions_13",
+    "TestGetDifference": "functions_13",
+    "TestUseUpdate": "functions_13",
+    "TestReturnError": "functions_13",
+}
+
+__all__ = [
+    "Error",
+    "Ok",
+    "AuthenticationCodeType",
+    "AuthenticationCodeTypeTelegramMessage",
+    "AuthenticationCodeTypeSms",
+    "AuthenticationCodeTypeSmsWord",
+    "AuthenticationCodeTypeSmsPhrase",
+    "AuthenticationCodeTypeCall",
+    "AuthenticationCodeTypeFlashCall",
+    "AuthenticationCodeTypeMissedCall",
+    "AuthenticationCodeTypeFragment",
+    "AuthenticationCodeTypeFirebaseAndroid",
+    "AuthenticationCodeTypeFirebaseIos",
+    "AuthenticationCodeInfo",
+    "EmailAddressAuthenticationCodeInfo",
+    "EmailAddressAuthentication",
+    "EmailAddressAuthenticationCode",
+    "EmailAddressAuthenticationAppleId",
+    "EmailAddressAuthenticationGoogleId",
+    "EmailAddressResetState",
+    "EmailAddressResetStateAvailable",
+    "EmailAddressResetStatePending",
+    "TextEntity",
+    "TextEntities",
+    "FormattedText",
+    "TermsOfService",
+    "AuthorizationState",
+    "AuthorizationStateWaitTdlibParameters",
+    "AuthorizationStateWaitPhoneNumber",
+    "AuthorizationStateWaitPremiumPurchase",
+    "AuthorizationStateWaitEmailAddress",
+    "AuthorizationStateWaitEmailCode",
+    "AuthorizationStateWaitCode",
+    "AuthorizationStateWaitOtherDeviceConfirmation",
+    "AuthorizationStateWaitRegistration",
+    "AuthorizationStateWaitPassword",
+    "AuthorizationStateReady",
+    "AuthorizationStateLoggingOut",
+    "AuthorizationStateClosing",
+    "AuthorizationStateClosed",
+    "FirebaseDeviceVerificationParameters",
+    "FirebaseDeviceVerificationParametersSafetyNet",
+    "FirebaseDeviceVerificationParametersPlayIntegrity",
+    "PasswordState",
+    "RecoveryEmailAddress",
+    "TemporaryPasswordState",
+    "LocalFile",
+    "RemoteFile",
+    "File",
+    "InputFile",
+    "InputFileId",
+    "InputFileRemote",
+    "InputFileLocal",
+    "InputFileGenerated",
+    "PhotoSize",
+    "Minithumbnail",
+    "ThumbnailFormat",
+    "ThumbnailFormatJpeg",
+    "ThumbnailFormatGif",
+    "ThumbnailFormatMpeg4",
+    "ThumbnailFormatPng",
+    "ThumbnailFormatTgs",
+    "ThumbnailFormatWebm",
+    "ThumbnailFormatWebp",
+    "Thumbnail",
+    "MaskPoint",
+    "MaskPointForehead",
+    "MaskPointEyes",
+    "MaskPointMouth",
+    "MaskPointChin",
+    "MaskPosition",
+    "StickerFormat",
+    "StickerFormatWebp",
+    "StickerFormatTgs",
+    "StickerFormatWebm",
+    "StickerType",
+    "StickerTypeRegular",
+    "StickerTypeMask",
+    "StickerTypeCustomEmoji",
+    "StickerFullType",
+    "StickerFullTypeRegular",
+    "StickerFullTypeMask",
+    "StickerFullTypeCustomEmoji",
+    "ClosedVectorPath",
+    "Outline",
+    "PollOption",
+    "PollType",
+    "PollTypeRegular",
+    "PollTypeQuiz",
+    "ChecklistTask",
+    "InputChecklistTask",
+    "Checklist",
+    "InputChecklist",
+    "Animation",
+    "Audio",
+    "Document",
+    "Photo",
+    "Sticker",
+    "Video",
+    "VideoNote",
+    "VoiceNote",
+    "AnimatedEmoji",
+    "Contact",
+    "Location",
+    "Venue",
+    "Game",
+    "WebApp",
+    "Poll",
+    "AlternativeVideo",
+    "VideoStoryboard",
+    "Background",
+    "Backgrounds",
+    "ChatBackground",
+    "ProfilePhoto",
+    "ChatPhotoInfo",
+    "UserType",
+    "UserTypeRegular",
+    "UserTypeDeleted",
+    "UserTypeBot",
+    "UserTypeUnknown",
+    "BotCommand",
+    "BotCommands",
+    "BotMenuButton",
+    "BotVerificationParameters",
+    "BotVerification",
+    "VerificationStatus",
+    "ChatLocation",
+    "Birthdate",
+    "CloseBirthdayUser",
+    "BusinessAwayMessageSchedule",
+    "BusinessAwayMessageScheduleAlways",
+    "BusinessAwayMessageScheduleOutsideOfOpeningHours",
+    "BusinessAwayMessageScheduleCustom",
+    "BusinessLocation",
+    "BusinessRecipients",
+    "BusinessAwayMessageSettings",
+    "BusinessGreetingMessageSettings",
+    "BusinessBotRights",
+    "BusinessConnectedBot",
+    "BusinessStartPage",
+    "InputBusinessStartPage",
+    "BusinessOpeningHoursInterval",
+    "BusinessOpeningHours",
+    "BusinessInfo",
+    "BusinessChatLink",
+    "BusinessChatLinks",
+    "InputBusinessChatLink",
+    "BusinessChatLinkInfo",
+    "ChatPhotoStickerType",
+    "ChatPhotoStickerTypeRegularOrMask",
+    "ChatPhotoStickerTypeCustomEmoji",
+    "ChatPhotoSticker",
+    "AnimatedChatPhoto",
+    "ChatPhoto",
+    "ChatPhotos",
+    "InputChatPhoto",
+    "InputChatPhotoPrevious",
+    "InputChatPhotoStatic",
+    "InputChatPhotoAnimation",
+    "InputChatPhotoSticker",
+    "ChatPermissions",
+    "ChatAdministratorRights",
+    "SuggestedPostPrice",
+    "SuggestedPostPriceStar",
+    "SuggestedPostPriceTon",
+    "SuggestedPostState",
+    "SuggestedPostStatePending",
+    "SuggestedPostStateApproved",
+    "SuggestedPostStateDeclined",
+    "SuggestedPostInfo",
+    "InputSuggestedPostInfo",
+    "SuggestedPostRefundReason",
+    "SuggestedPostRefundReasonPostDeleted",
+    "SuggestedPostRefundReasonPaymentRefunded",
+    "StarAmount",
+    "StarSubscriptionType",
+    "StarSubscriptionTypeChannel",
+    "StarSubscriptionTypeBot",
+    "StarSubscriptionPricing",
+    "StarSubscription",
+    "StarSubscriptions",
+    "AffiliateType",
+    "AffiliateTypeCurrentUser",
+    "AffiliateTypeBot",
+    "AffiliateTypeChannel",
+    "AffiliateProgramSortOrder",
+    "AffiliateProgramSortOrderProfitability",
+    "AffiliateProgramSortOrderCreationDate",
+    "AffiliateProgramSortOrderRevenue",
+    "AffiliateProgramParameters",
+    "AffiliateProgramInfo",
+    "AffiliateInfo",
+    "FoundAffiliateProgram",
+    "FoundAffiliatePrograms",
+    "ConnectedAffiliateProgram",
+    "ConnectedAffiliatePrograms",
+    "ProductInfo",
+    "PremiumPaymentOption",
+    "PremiumStatePaymentOption",
+    "PremiumGiftPaymentOption",
+    "PremiumGiftPaymentOptions",
+    "PremiumGiveawayPaymentOption",
+    "PremiumGiveawayPaymentOptions",
+    "PremiumGiftCodeInfo",
+    "StarPaymentOption",
+    "StarPaymentOptions",
+    "StarGiveawayWinnerOption",
+    "StarGiveawayPaymentOption",
+    "StarGiveawayPaymentOptions",
+    "AcceptedGiftTypes",
+    "GiftSettings",
+    "UpgradedGiftOrigin",
+    "UpgradedGiftOriginUpgrade",
+    "UpgradedGiftOriginTransfer",
+    "UpgradedGiftOriginResale",
+    "UpgradedGiftModel",
+    "UpgradedGiftSymbol",
+    "UpgradedGiftBackdropColors",
+    "UpgradedGiftBackdrop",
+    "UpgradedGiftOriginalDetails",
+    "Gift",
+    "UpgradedGift",
+    "UpgradeGiftResult",
+    "AvailableGift",
+    "AvailableGifts",
+    "UpgradedGiftAttributeId",
+    "UpgradedGiftAttributeIdModel",
+    "UpgradedGiftAttributeIdSymbol",
+    "UpgradedGiftAttributeIdBackdrop",
+    "UpgradedGiftModelCount",
+    "UpgradedGiftSymbolCount",
+    "UpgradedGiftBackdropCount",
+    "GiftForResaleOrder",
+    "GiftForResaleOrderPrice",
+    "GiftForResaleOrderPriceChangeDate",
+    "GiftForResaleOrderNumber",
+    "GiftForResale",
+    "GiftsForResale",
+    "SentGift",
+    "SentGiftRegular",
+    "SentGiftUpgraded",
+    "ReceivedGift",
+    "ReceivedGifts",
+    "GiftUpgradePreview",
+    "TransactionDirection",
+    "TransactionDirectionIncoming",
+    "TransactionDirectionOutgoing",
+    "StarTransactionType",
+    "StarTransactionTypePremiumBotDeposit",
+    "StarTransactionTypeAppStoreDeposit",
+    "StarTransactionTypeGooglePlayDeposit",
+    "StarTransactionTypeFragmentDeposit",
+    "StarTransactionTypeUserDeposit",
+    "StarTransactionTypeGiveawayDeposit",
+    "StarTransactionTypeFragmentWithdrawal",
+    "StarTransactionTypeTelegramAdsWithdrawal",
+    "StarTransactionTypeTelegramApiUsage",
+    "StarTransactionTypeBotPaidMediaPurchase",
+    "StarTransactionTypeBotPaidMediaSale",
+    "StarTransactionTypeChannelPaidMediaPurchase",
+    "StarTransactionTypeChannelPaidMediaSale",
+    "StarTransactionTypeBotInvoicePurchase",
+    "StarTransactionTypeBotInvoiceSale",
+    "StarTransactionTypeBotSubscriptionPurchase",
+    "StarTransactionTypeBotSubscriptionSale",
+    "StarTransactionTypeChannelSubscriptionPurchase",
+    "StarTransactionTypeChannelSubscriptionSale",
+    "StarTransactionTypeGiftPurchase",
+    "StarTransactionTypeGiftTransfer",
+    "StarTransactionTypeGiftSale",
+    "StarTransactionTypeGiftUpgrade",
+    "StarTransactionTypeUpgradedGiftPurchase",
+    "StarTransactionTypeUpgradedGiftSale",
+    "StarTransactionTypeChannelPaidReactionSend",
+    "StarTransactionTypeChannelPaidReactionReceive",
+    "StarTransactionTypeAffiliateProgramCommission",
+    "StarTransactionTypePaidMessageSend",
+    "StarTransactionTypePaidMessageReceive",
+    "StarTransactionTypeSuggestedPostPaymentSend",
+    "StarTransactionTypeSuggestedPostPaymentReceive",
+    "StarTransactionTypePremiumPurchase",
+    "StarTransactionTypeBusinessBotTransferSend",
+    "StarTransactionTypeBusinessBotTransferReceive",
+    "StarTransactionTypeUnsupported",
+    "StarTransaction",
+    "StarTransactions",
+    "TonTransactionType",
+    "TonTransactionTypeFragmentDeposit",
+    "TonTransactionTypeSuggestedPostPayment",
+    "TonTransactionTypeUnsupported",
+    "TonTransaction",
+    "TonTransactions",
+    "GiveawayParticipantStatus",
+    "GiveawayParticipantStatusEligible",
+    "GiveawayParticipantStatusParticipating",
+    "GiveawayParticipantStatusAlreadyWasMember",
+    "GiveawayParticipantStatusAdministrator",
+    "GiveawayParticipantStatusDisallowedCountry",
+    "GiveawayInfo",
+    "GiveawayInfoOngoing",
+    "GiveawayInfoCompleted",
+    "GiveawayPrize",
+    "GiveawayPrizePremium",
+    "GiveawayPrizeStars",
+    "AccentColor",
+    "ProfileAccentColors",
+    "ProfileAccentColor",
+    "EmojiStatusType",
+    "EmojiStatusTypeCustomEmoji",
+    "EmojiStatusTypeUpgradedGift",
+    "EmojiStatus",
+    "EmojiStatuses",
+    "EmojiStatusCustomEmojis",
+    "Usernames",
+    "User",
+    "BotInfo",
+    "UserFullInfo",
+    "Users",
+    "FoundUsers",
+    "ChatAdministrator",
+    "ChatAdministrators",
+    "ChatMemberStatus",
+    "ChatMemberStatusCreator",
+    "ChatMemberStatusAdministrator",
+    "ChatMemberStatusMember",
+    "ChatMemberStatusRestricted",
+    "ChatMemberStatusLeft",
+    "ChatMemberStatusBanned",
+    "ChatMember",
+    "ChatMembers",
+    "ChatMembersFilter",
+    "ChatMembersFilterContacts",
+    "ChatMembersFilterAdministrators",
+    "ChatMembersFilterMembers",
+    "ChatMembersFilterMention",
+    "ChatMembersFilterRestricted",
+    "ChatMembersFilterBanned",
+    "ChatMembersFilterBots",
+    "SupergroupMembersFilter",
+    "SupergroupMembersFilterRecent",
+    "SupergroupMembersFilterContacts",
+    "SupergroupMembersFilterAdministrators",
+    "SupergroupMembersFilterSearch",
+    "SupergroupMembersFilterRestricted",
+    "SupergroupMembersFilterBanned",
+    "SupergroupMembersFilterMention",
+    "SupergroupMembersFilterBots",
+    "ChatInviteLink",
+    "ChatInviteLinks",
+    "ChatInviteLinkCount",
+    "ChatInviteLinkCounts",
+    "ChatInviteLinkMember",
+    "ChatInviteLinkMembers",
+    "InviteLinkChatType",
+    "InviteLinkChatTypeBasicGroup",
+    "InviteLinkChatTypeSupergroup",
+    "InviteLinkChatTypeChannel",
+    "ChatInviteLinkSubscriptionInfo",
+    "ChatInviteLinkInfo",
+    "ChatJoinRequest",
+    "ChatJoinRequests",
+    "ChatJoinRequestsInfo",
+    "BasicGroup",
+    "BasicGroupFullInfo",
+    "Supergroup",
+    "SupergroupFullInfo",
+    "SecretChatState",
+    "SecretChatStatePending",
+    "SecretChatStateReady",
+    "SecretChatStateClosed",
+    "SecretChat",
+    "MessageSender",
+    "MessageSenderUser",
+    "MessageSenderChat",
+    "MessageSenders",
+    "ChatMessageSender",
+    "ChatMessageSenders",
+    "MessageReadDate",
+    "MessageReadDateRead",
+    "MessageReadDateUnread",
+    "MessageReadDateTooOld",
+    "MessageReadDateUserPrivacyRestricted",
+    "MessageReadDateMyPrivacyRestricted",
+    "MessageViewer",
+    "MessageViewers",
+    "MessageOrigin",
+    "MessageOriginUser",
+    "MessageOriginHiddenUser",
+    "MessageOriginChat",
+    "MessageOriginChannel",
+    "ForwardSource",
+    "ReactionType",
+    "ReactionTypeEmoji",
+    "ReactionTypeCustomEmoji",
+    "ReactionTypePaid",
+    "PaidReactionType",
+    "PaidReactionTypeRegular",
+    "PaidReactionTypeAnonymous",
+    "PaidReactionTypeChat",
+    "PaidReactor",
+    "MessageForwardInfo",
+    "MessageImportInfo",
+    "MessageReplyInfo",
+    "MessageReaction",
+    "MessageReactions",
+    "MessageInteractionInfo",
+    "UnreadReaction",
+    "MessageTopic",
+    "MessageTopicForum",
+    "MessageTopicDirectMessages",
+    "MessageTopicSavedMessages",
+    "MessageEffectType",
+    "MessageEffectTypeEmojiReaction",
+    "MessageEffectTypePremiumSticker",
+    "MessageEffect",
+    "MessageSendingState",
+    "MessageSendingStatePending",
+    "MessageSendingStateFailed",
+    "TextQuote",
+    "InputTextQuote",
+    "MessageReplyTo",
+    "MessageReplyToMessage",
+    "MessageReplyToStory",
+    "InputMessageReplyTo",
+    "InputMessageReplyToMessage",
+    "InputMessageReplyToExternalMessage",
+    "InputMessageReplyToStory",
+    "FactCheck",
+    "Message",
+    "Messages",
+    "FoundMessages",
+    "FoundChatMessages",
+    "MessagePosition",
+    "MessagePositions",
+    "MessageCalendarDay",
+    "MessageCalendar",
+    "BusinessMessage",
+    "BusinessMessages",
+    "MessageSource",
+    "MessageSourceChatHistory",
+    "MessageSourceMessageThreadHistory",
+    "MessageSourceForumTopicHistory",
+    "MessageSourceDirectMessagesChatTopicHistory",
+    "MessageSourceHistoryPreview",
+    "MessageSourceChatList",
+    "MessageSourceSearch",
+    "MessageSourceChatEventLog",
+    "MessageSourceNotification",
+    "MessageSourceScreenshot",
+    "MessageSourceOther",
+    "AdvertisementSponsor",
+    "SponsoredMessage",
+    "SponsoredMessages",
+    "SponsoredChat",
+    "SponsoredChats",
+    "VideoMessageAdvertisement",
+    "VideoMessageAdvertisements",
+    "ReportOption",
+    "ReportSponsoredResult",
+    "ReportSponsoredResultOk",
+    "ReportSponsoredResultFailed",
+    "ReportSponsoredResultOptionRequired",
+    "ReportSponsoredResultAdsHidden",
+    "ReportSponsoredResultPremiumRequired",
+    "FileDownload",
+    "DownloadedFileCounts",
+    "FoundFileDownloads",
+    "NotificationSettingsScope",
+    "NotificationSettingsScopePrivateChats",
+    "NotificationSettingsScopeGroupChats",
+    "NotificationSettingsScopeChannelChats",
+    "ChatNotificationSettings",
+    "ScopeNotificationSettings",
+    "ReactionNotificationSource",
+    "ReactionNotificationSourceNone",
+    "ReactionNotificationSourceContacts",
+    "ReactionNotificationSourceAll",
+    "ReactionNotificationSettings",
+    "DraftMessage",
+    "ChatType",
+    "ChatTypePrivate",
+    "ChatTypeBasicGroup",
+    "ChatTypeSupergroup",
+    "ChatTypeSecret",
+    "ChatFolderIcon",
+    "ChatFolderName",
+    "ChatFolder",
+    "ChatFolderInfo",
+    "ChatFolderInviteLink",
+    "ChatFolderInviteLinks",
+    "ChatFolderInviteLinkInfo",
+    "RecommendedChatFolder",
+    "RecommendedChatFolders",
+    "ArchiveChatListSettings",
+    "ChatList",
+    "ChatListMain",
+    "ChatListArchive",
+    "ChatListFolder",
+    "ChatLists",
+    "ChatSource",
+    "ChatSourceMtprotoProxy",
+    "ChatSourcePublicServiceAnnouncement",
+    "ChatPosition",
+    "ChatAvailableReactions",
+    "ChatAvailableReactionsAll",
+    "ChatAvailableReactionsSome",
+    "SavedMessagesTag",
+    "SavedMessagesTags",
+    "BusinessBotManageBar",
+    "VideoChat",
+    "Chat",
+    "Chats",
+    "FailedToAddMember",
+    "FailedToAddMembers",
+    "CreatedBasicGroupChat",
+    "PublicChatType",
+    "PublicChatTypeHasUsername",
+    "PublicChatTypeIsLocationBased",
+    "AccountInfo",
+    "ChatActionBar",
+    "ChatActionBarReportSpam",
+    "ChatActionBarInviteMembers",
+    "ChatActionBarReportAddBlock",
+    "ChatActionBarAddContact",
+    "ChatActionBarSharePhoneNumber",
+    "ChatActionBarJoinRequest",
+    "KeyboardButtonType",
+    "KeyboardButtonTypeText",
+    "KeyboardButtonTypeRequestPhoneNumber",
+    "KeyboardButtonTypeRequestLocation",
+    "KeyboardButtonTypeRequestPoll",
+    "KeyboardButtonTypeRequestUsers",
+    "KeyboardButtonTypeRequestChat",
+    "KeyboardButtonTypeWebApp",
+    "KeyboardButton",
+    "InlineKeyboardButtonType",
+    "InlineKeyboardButtonTypeUrl",
+    "InlineKeyboardButtonTypeLoginUrl",
+    "InlineKeyboardButtonTypeWebApp",
+    "InlineKeyboardButtonTypeCallback",
+    "InlineKeyboardButtonTypeCallbackWithPassword",
+    "InlineKeyboardButtonTypeCallbackGame",
+    "InlineKeyboardButtonTypeSwitchInline",
+    "InlineKeyboardButtonTypeBuy",
+    "InlineKeyboardButtonTypeUser",
+    "InlineKeyboardButtonTypeCopyText",
+    "InlineKeyboardButton",
+    "ReplyMarkup",
+    "ReplyMarkupRemoveKeyboard",
+    "ReplyMarkupForceReply",
+    "ReplyMarkupShowKeyboard",
+    "ReplyMarkupInlineKeyboard",
+    "LoginUrlInfo",
+    "LoginUrlInfoOpen",
+    "LoginUrlInfoRequestConfirmation",
+    "ThemeParameters",
+    "WebAppOpenMode",
+    "WebAppOpenModeCompact",
+    "WebAppOpenModeFullSize",
+    "WebAppOpenModeFullScreen",
+    "FoundWebApp",
+    "WebAppInfo",
+    "MainWebApp",
+    "WebAppOpenParameters",
+    "MessageThreadInfo",
+    "SavedMessagesTopicType",
+    "SavedMessagesTopicTypeMyNotes",
+    "SavedMessagesTopicTypeAuthorHidden",
+    "SavedMessagesTopicTypeSavedFromChat",
+    "SavedMessagesTopic",
+    "DirectMessagesChatTopic",
+    "ForumTopicIcon",
+    "ForumTopicInfo",
+    "ForumTopic",
+    "ForumTopics",
+    "LinkPreviewOptions",
+    "SharedUser",
+    "SharedChat",
+    "ThemeSettings",
+    "RichText",
+    "RichTextPlain",
+    "RichTextBold",
+    "RichTextItalic",
+    "RichTextUnderline",
+    "RichTextStrikethrough",
+    "RichTextFixed",
+    "RichTextUrl",
+    "RichTextEmailAddress",
+    "RichTextSubscript",
+    "RichTextSuperscript",
+    "RichTextMarked",
+    "RichTextPhoneNumber",
+    "RichTextIcon",
+    "RichTextReference",
+    "RichTextAnchor",
+    "RichTextAnchorLink",
+    "RichTexts",
+    "PageBlockCaption",
+    "PageBlockListItem",
+    "PageBlockHorizontalAlignment",
+    "PageBlockHorizontalAlignmentLeft",
+    "PageBlockHorizontalAlignmentCenter",
+    "PageBlockHorizontalAlignmentRight",
+    "PageBlockVerticalAlignment",
+    "PageBlockVerticalAlignmentTop",
+    "PageBlockVerticalAlignmentMiddle",
+    "PageBlockVerticalAlignmentBottom",
+    "PageBlockTableCell",
+    "PageBlockRelatedArticle",
+    "PageBlock",
+    "PageBlockTitle",
+    "PageBlockSubtitle",
+    "PageBlockAuthorDate",
+    "PageBlockHeader",
+    "PageBlockSubheader",
+    "PageBlockKicker",
+    "PageBlockParagraph",
+    "PageBlockPreformatted",
+    "PageBlockFooter",
+    "PageBlockDivider",
+    "PageBlockAnchor",
+    "PageBlockList",
+    "PageBlockBlockQuote",
+    "PageBlockPullQuote",
+    "PageBlockAnimation",
+    "PageBlockAudio",
+    "PageBlockPhoto",
+    "PageBlockVideo",
+    "PageBlockVoiceNote",
+    "PageBlockCover",
+    "PageBlockEmbedded",
+    "PageBlockEmbeddedPost",
+    "PageBlockCollage",
+    "PageBlockSlideshow",
+    "PageBlockChatLink",
+    "PageBlockTable",
+    "PageBlockDetails",
+    "PageBlockRelatedArticles",
+    "PageBlockMap",
+    "WebPageInstantView",
+    "LinkPreviewAlbumMedia",
+    "LinkPreviewAlbumMediaPhoto",
+    "LinkPreviewAlbumMediaVideo",
+    "LinkPreviewType",
+    "LinkPreviewTypeAlbum",
+    "LinkPreviewTypeAnimation",
+    "LinkPreviewTypeApp",
+    "LinkPreviewTypeArticle",
+    "LinkPreviewTypeAudio",
+    "LinkPreviewTypeBackground",
+    "LinkPreviewTypeChannelBoost",
+    "LinkPreviewTypeChat",
+    "LinkPreviewTypeDocument",
+    "LinkPreviewTypeEmbeddedAnimationPlayer",
+    "LinkPreviewTypeEmbeddedAudioPlayer",
+    "LinkPreviewTypeEmbeddedVideoPlayer",
+    "LinkPreviewTypeExternalAudio",
+    "LinkPreviewTypeExternalVideo",
+    "LinkPreviewTypeGroupCall",
+    "LinkPreviewTypeInvoice",
+    "LinkPreviewTypeMessage",
+    "LinkPreviewTypePhoto",
+    "LinkPreviewTypePremiumGiftCode",
+    "LinkPreviewTypeShareableChatFolder",
+    "LinkPreviewTypeSticker",
+    "LinkPreviewTypeStickerSet",
+    "LinkPreviewTypeStory",
+    "LinkPreviewTypeSupergroupBoost",
+    "LinkPreviewTypeTheme",
+    "LinkPreviewTypeUnsupported",
+    "LinkPreviewTypeUpgradedGift",
+    "LinkPreviewTypeUser",
+    "LinkPreviewTypeVideo",
+    "LinkPreviewTypeVideoChat",
+    "LinkPreviewTypeVideoNote",
+    "LinkPreviewTypeVoiceNote",
+    "LinkPreviewTypeWebApp",
+    "LinkPreview",
+    "CountryInfo",
+    "Countries",
+    "PhoneNumberInfo",
+    "CollectibleItemType",
+    "CollectibleItemTypeUsername",
+    "CollectibleItemTypePhoneNumber",
+    "CollectibleItemInfo",
+    "BankCardActionOpenUrl",
+    "BankCardInfo",
+    "Address",
+    "LocationAddress",
+    "LabeledPricePart",
+    "Invoice",
+    "OrderInfo",
+    "ShippingOption",
+    "SavedCredentials",
+    "InputCredentials",
+    "InputCredentialsSaved",
+    "InputCredentialsNew",
+    "InputCredentialsApplePay",
+    "InputCredentialsGooglePay",
+    "PaymentProvider",
+    "PaymentProviderSmartGlocal",
+    "PaymentProviderStripe",
+    "PaymentProviderOther",
+    "PaymentOption",
+    "PaymentFormType",
+    "PaymentFormTypeRegular",
+    "PaymentFormTypeStars",
+    "PaymentFormTypeStarSubscription",
+    "PaymentForm",
+    "ValidatedOrderInfo",
+    "PaymentResult",
+    "PaymentReceiptType",
+    "PaymentReceiptTypeRegular",
+    "PaymentReceiptTypeStars",
+    "PaymentReceipt",
+    "InputInvoice",
+    "InputInvoiceMessage",
+    "InputInvoiceName",
+    "InputInvoiceTelegram",
+    "PaidMedia",
+    "PaidMediaPreview",
+    "PaidMediaPhoto",
+    "PaidMediaVideo",
+    "PaidMediaUnsupported",
+    "GiveawayParameters",
+    "DatedFile",
+    "PassportElementType",
+    "PassportElementTypePersonalDetails",
+    "PassportElementTypePassport",
+    "PassportElementTypeDriverLicense",
+    "PassportElementTypeIdentityCard",
+    "PassportElementTypeInternalPassport",
+    "PassportElementTypeAddress",
+    "PassportElementTypeUtilityBill",
+    "PassportElementTypeBankStatement",
+    "PassportElementTypeRentalAgreement",
+    "PassportElementTypePassportRegistration",
+    "PassportElementTypeTemporaryRegistration",
+    "PassportElementTypePhoneNumber",
+    "PassportElementTypeEmailAddress",
+    "Date",
+    "PersonalDetails",
+    "IdentityDocument",
+    "InputIdentityDocument",
+    "PersonalDocument",
+    "InputPersonalDocument",
+    "PassportElement",
+    "PassportElementPersonalDetails",
+    "PassportElementPassport",
+    "PassportElementDriverLicense",
+    "PassportElementIdentityCard",
+    "PassportElementInternalPassport",
+    "PassportElementAddress",
+    "PassportElementUtilityBill",
+    "PassportElementBankStatement",
+    "PassportElementRentalAgreement",
+    "PassportElementPassportRegistration",
+    "PassportElementTemporaryRegistration",
+    "PassportElementPhoneNumber",
+    "PassportElementEmailAddress",
+    "InputPassportElement",
+    "InputPassportElementPersonalDetails",
+    "InputPassportElementPassport",
+    "InputPassportElementDriverLicense",
+    "InputPassportElementIdentityCard",
+    "InputPassportElementInternalPassport",
+    "InputPassportElementAddress",
+    "InputPassportElementUtilityBill",
+    "InputPassportElementBankStatement",
+    "InputPassportElementRentalAgreement",
+    "InputPassportElementPassportRegistration",
+    "InputPassportElementTemporaryRegistration",
+    "InputPassportElementPhoneNumber",
+    "InputPassportElementEmailAddress",
+    "PassportElements",
+    "PassportElementErrorSource",
+    "PassportElementErrorSourceUnspecified",
+    "PassportElementErrorSourceDataField",
+    "PassportElementErrorSourceFrontSide",
+    "PassportElementErrorSourceReverseSide",
+    "PassportElementErrorSourceSelfie",
+    "PassportElementErrorSourceTranslationFile",
+    "PassportElementErrorSourceTranslationFiles",
+    "PassportElementErrorSourceFile",
+    "PassportElementErrorSourceFiles",
+    "PassportElementError",
+    "PassportSuitableElement",
+    "PassportRequiredElement",
+    "PassportAuthorizationForm",
+    "PassportElementsWithErrors",
+    "EncryptedCredentials",
+    "EncryptedPassportElement",
+    "InputPassportElementErrorSource",
+    "InputPassportElementErrorSourceUnspecified",
+    "InputPassportElementErrorSourceDataField",
+    "InputPassportElementErrorSourceFrontSide",
+    "InputPassportElementErrorSourceReverseSide",
+    "InputPassportElementErrorSourceSelfie",
+    "InputPassportElementErrorSourceTranslationFile",
+    "InputPassportElementErrorSourceTranslationFiles",
+    "InputPassportElementErrorSourceFile",
+    "InputPassportElementErrorSourceFiles",
+    "InputPassportElementError",
+    "MessageContent",
+    "MessageText",
+    "MessageAnimation",
+    "MessageAudio",
+    "MessageDocument",
+    "MessagePaidMedia",
+    "MessagePhoto",
+    "MessageSticker",
+    "MessageVideo",
+    "MessageVideoNote",
+    "MessageVoiceNote",
+    "MessageExpiredPhoto",
+    "MessageExpiredVideo",
+    "MessageExpiredVideoNote",
+    "MessageExpiredVoiceNote",
+    "MessageLocation",
+    "MessageVenue",
+    "MessageContact",
+    "MessageAnimatedEmoji",
+    "MessageDice",
+    "MessageGame",
+    "MessagePoll",
+    "MessageStory",
+    "MessageChecklist",
+    "MessageInvoice",
+    "MessageCall",
+    "MessageGroupCall",
+    "MessageVideoChatScheduled",
+    "MessageVideoChatStarted",
+    "MessageVideoChatEnded",
+    "MessageInviteVideoChatParticipants",
+    "MessageBasicGroupChatCreate",
+    "MessageSupergroupChatCreate",
+    "MessageChatChangeTitle",
+    "MessageChatChangePhoto",
+    "MessageChatDeletePhoto",
+    "MessageChatAddMembers",
+    "MessageChatJoinByLink",
+    "MessageChatJoinByRequest",
+    "MessageChatDeleteMember",
+    "MessageChatUpgradeTo",
+    "MessageChatUpgradeFrom",
+    "MessagePinMessage",
+    "MessageScreenshotTaken",
+    "MessageChatSetBackground",
+    "MessageChatSetTheme",
+    "MessageChatSetMessageAutoDeleteTime",
+    "MessageChatBoost",
+    "MessageForumTopicCreated",
+    "MessageForumTopicEdited",
+    "MessageForumTopicIsClosedToggled",
+    "MessageForumTopicIsHiddenToggled",
+    "MessageSuggestProfilePhoto",
+    "MessageCustomServiceAction",
+    "MessageGameScore",
+    "MessagePaymentSuccessful",
+    "MessagePaymentSuccessfulBot",
+    "MessagePaymentRefunded",
+    "MessageGiftedPremium",
+    "MessagePremiumGiftCode",
+    "MessageGiveawayCreated",
+    "MessageGiveaway",
+    "MessageGiveawayCompleted",
+    "MessageGiveawayWinners",
+    "MessageGiftedStars",
+    "MessageGiftedTon",
+    "MessageGiveawayPrizeStars",
+    "MessageGift",
+    "MessageUpgradedGift",
+    "MessageRefundedUpgradedGift",
+    "MessagePaidMessagesRefunded",
+    "MessagePaidMessagePriceChanged",
+    "MessageDirectMessagePriceChanged",
+    "MessageChecklistTasksDone",
+    "MessageChecklistTasksAdded",
+    "MessageSuggestedPostApprovalFailed",
+    "MessageSuggestedPostApproved",
+    "MessageSuggestedPostDeclined",
+    "MessageSuggestedPostPaid",
+    "MessageSuggestedPostRefunded",
+    "MessageContactRegistered",
+    "MessageUsersShared",
+    "MessageChatShared",
+    "MessageBotWriteAccessAllowed",
+    "MessageWebAppDataSent",
+    "MessageWebAppDataReceived",
+    "MessagePassportDataSent",
+    "MessagePassportDataReceived",
+    "MessageProximityAlertTriggered",
+    "MessageUnsupported",
+    "TextEntityType",
+    "TextEntityTypeMention",
+    "TextEntityTypeHashtag",
+    "TextEntityTypeCashtag",
+    "TextEntityTypeBotCommand",
+    "TextEntityTypeUrl",
+    "TextEntityTypeEmailAddress",
+    "TextEntityTypePhoneNumber",
+    "TextEntityTypeBankCardNumber",
+    "TextEntityTypeBold",
+    "TextEntityTypeItalic",
+    "TextEntityTypeUnderline",
+    "TextEntityTypeStrikethrough",
+    "TextEntityTypeSpoiler",
+    "TextEntityTypeCode",
+    "TextEntityTypePre",
+    "TextEntityTypePreCode",
+    "TextEntityTypeBlockQuote",
+    "TextEntityTypeExpandableBlockQuote",
+    "TextEntityTypeTextUrl",
+    "TextEntityTypeMentionName",
+    "TextEntityTypeCustomEmoji",
+    "TextEntityTypeMediaTimestamp",
+    "InputThumbnail",
+    "InputPaidMediaType",
+    "InputPaidMediaTypePhoto",
+    "InputPaidMediaTypeVideo",
+    "InputPaidMedia",
+    "MessageSchedulingState",
+    "MessageSchedulingStateSendAtDate",
+    "MessageSchedulingStateSendWhenOnline",
+    "MessageSchedulingStateSendWhenVideoProcessed",
+    "MessageSelfDestructType",
+    "MessageSelfDestructTypeTimer",
+    "MessageSelfDestructTypeImmediately",
+    "MessageSendOptions",
+    "MessageCopyOptions",
+    "InputMessageContent",
+    "InputMessageText",
+    "InputMessageAnimation",
+    "InputMessageAudio",
+    "InputMessageDocument",
+    "InputMessagePaidMedia",
+    "InputMessagePhoto",
+    "InputMessageSticker",
+    "InputMessageVideo",
+    "InputMessageVideoNote",
+    "InputMessageVoiceNote",
+    "InputMessageLocation",
+    "InputMessageVenue",
+    "InputMessageContact",
+    "InputMessageDice",
+    "InputMessageGame",
+    "InputMessageInvoice",
+    "InputMessagePoll",
+    "InputMessageStory",
+    "InputMessageChecklist",
+    "InputMessageForwarded",
+    "MessageProperties",
+    "SearchMessagesFilter",
+    "SearchMessagesFilterEmpty",
+    "SearchMessagesFilterAnimation",
+    "SearchMessagesFilterAudio",
+    "SearchMessagesFilterDocument",
+    "SearchMessagesFilterPhoto",
+    "SearchMessagesFilterVideo",
+    "SearchMessagesFilterVoiceNote",
+    "SearchMessagesFilterPhotoAndVideo",
+    "SearchMessagesFilterUrl",
+    "SearchMessagesFilterChatPhoto",
+    "SearchMessagesFilterVideoNote",
+    "SearchMessagesFilterVoiceAndVideoNote",
+    "SearchMessagesFilterMention",
+    "SearchMessagesFilterUnreadMention",
+    "SearchMessagesFilterUnreadReaction",
+    "SearchMessagesFilterFailedToSend",
+    "SearchMessagesFilterPinned",
+    "SearchMessagesChatTypeFilter",
+    "SearchMessagesChatTypeFilterPrivate",
+    "SearchMessagesChatTypeFilterGroup",
+    "SearchMessagesChatTypeFilterChannel",
+    "ChatAction",
+    "ChatActionTyping",
+    "ChatActionRecordingVideo",
+    "ChatActionUploadingVideo",
+    "ChatActionRecordingVoiceNote",
+    "ChatActionUploadingVoiceNote",
+    "ChatActionUploadingPhoto",
+    "ChatActionUploadingDocument",
+    "ChatActionChoosingSticker",
+    "ChatActionChoosingLocation",
+    "ChatActionChoosingContact",
+    "ChatActionStartPlayingGame",
+    "ChatActionRecordingVideoNote",
+    "ChatActionUploadingVideoNote",
+    "ChatActionWatchingAnimations",
+    "ChatActionCancel",
+    "UserStatus",
+    "UserStatusEmpty",
+    "UserStatusOnline",
+    "UserStatusOffline",
+    "UserStatusRecently",
+    "UserStatusLastWeek",
+    "UserStatusLastMonth",
+    "EmojiKeyword",
+    "EmojiKeywords",
+    "Stickers",
+    "Emojis",
+    "StickerSet",
+    "StickerSetInfo",
+    "StickerSets",
+    "TrendingStickerSets",
+    "EmojiCategorySource",
+    "EmojiCategorySourceSearch",
+    "EmojiCategorySourcePremium",
+    "EmojiCategory",
+    "EmojiCategories",
+    "EmojiCategoryType",
+    "EmojiCategoryTypeDefault",
+    "EmojiCategoryTypeRegularStickers",
+    "EmojiCategoryTypeEmojiStatus",
+    "EmojiCategoryTypeChatPhoto",
+    "CurrentWeather",
+    "StoryAreaPosition",
+    "StoryAreaType",
+    "StoryAreaTypeLocation",
+    "StoryAreaTypeVenue",
+    "StoryAreaTypeSuggestedReaction",
+    "StoryAreaTypeMessage",
+    "StoryAreaTypeLink",
+    "StoryAreaTypeWeather",
+    "StoryAreaTypeUpgradedGift",
+    "StoryArea",
+    "InputStoryAreaType",
+    "InputStoryAreaTypeLocation",
+    "InputStoryAreaTypeFoundVenue",
+    "InputStoryAreaTypePreviousVenue",
+    "InputStoryAreaTypeSuggestedReaction",
+    "InputStoryAreaTypeMessage",
+    "InputStoryAreaTypeLink",
+    "InputStoryAreaTypeWeather",
+    "InputStoryAreaTypeUpgradedGift",
+    "InputStoryArea",
+    "InputStoryAreas",
+    "StoryVideo",
+    "StoryContent",
+    "StoryContentPhoto",
+    "StoryContentVideo",
+    "StoryContentUnsupported",
+    "InputStoryContent",
+    "InputStoryContentPhoto",
+    "InputStoryContentVideo",
+    "StoryList",
+    "StoryListMain",
+    "StoryListArchive",
+    "StoryOrigin",
+    "StoryOriginPublicStory",
+    "StoryOriginHiddenUser",
+    "StoryRepostInfo",
+    "StoryInteractionInfo",
+    "Story",
+    "Stories",
+    "FoundStories",
+    "StoryFullId",
+    "StoryInfo",
+    "ChatActiveStories",
+    "StoryInteractionType",
+    "StoryInteractionTypeView",
+    "StoryInteractionTypeForward",
+    "StoryInteractionTypeRepost",
+    "StoryInteraction",
+    "StoryInteractions",
+    "QuickReplyMessage",
+    "QuickReplyMessages",
+    "QuickReplyShortcut",
+    "PublicForward",
+    "PublicForwardMessage",
+    "PublicForwardStory",
+    "PublicForwards",
+    "BotMediaPreview",
+    "BotMediaPreviews",
+    "BotMediaPreviewInfo",
+    "ChatBoostLevelFeatures",
+    "ChatBoostFeatures",
+    "ChatBoostSource",
+    "ChatBoostSourceGiftCode",
+    "ChatBoostSourceGiveaway",
+    "ChatBoostSourcePremium",
+    "PrepaidGiveaway",
+    "ChatBoostStatus",
+    "ChatBoost",
+    "FoundChatBoosts",
+    "ChatBoostSlot",
+    "ChatBoostSlots",
+    "ResendCodeReason",
+    "ResendCodeReasonUserRequest",
+    "ResendCodeReasonVerificationFailed",
+    "CallDiscardReason",
+    "CallDiscardReasonEmpty",
+    "CallDiscardReasonMissed",
+    "CallDiscardReasonDeclined",
+    "CallDiscardReasonDisconnected",
+    "CallDiscardReasonHungUp",
+    "CallDiscardReasonUpgradeToGroupCall",
+    "CallProtocol",
+    "CallServerType",
+    "CallServerTypeTelegramReflector",
+    "CallServerTypeWebrtc",
+    "CallServer",
+    "CallId",
+    "GroupCallId",
+    "CallState",
+    "CallStatePending",
+    "CallStateExchangingKeys",
+    "CallStateReady",
+    "CallStateHangingUp",
+    "CallStateDiscarded",
+    "CallStateError",
+    "GroupCallJoinParameters",
+    "GroupCallVideoQuality",
+    "GroupCallVideoQualityThumbnail",
+    "GroupCallVideoQualityMedium",
+    "GroupCallVideoQualityFull",
+    "VideoChatStream",
+    "VideoChatStreams",
+    "RtmpUrl",
+    "GroupCallRecentSpeaker",
+    "GroupCall",
+    "GroupCallVideoSourceGroup",
+    "GroupCallParticipantVideoInfo",
+    "GroupCallParticipant",
+    "GroupCallParticipants",
+    "GroupCallInfo",
+    "InviteGroupCallParticipantResult",
+    "InviteGroupCallParticipantResultUserPrivacyRestricted",
+    "InviteGroupCallParticipantResultUserAlreadyParticipant",
+    "InviteGroupCallParticipantResultUserWasBanned",
+    "InviteGroupCallParticipantResultSuccess",
+    "GroupCallDataChannel",
+    "GroupCallDataChannelMain",
+    "GroupCallDataChannelScreenSharing",
+    "InputGroupCall",
+    "InputGroupCallLink",
+    "InputGroupCallMessage",
+    "CallProblem",
+    "CallProblemEcho",
+    "CallProblemNoise",
+    "CallProblemInterruptions",
+    "CallProblemDistortedSpeech",
+    "CallProblemSilentLocal",
+    "CallProblemSilentRemote",
+    "CallProblemDropped",
+    "CallProblemDistortedVideo",
+    "CallProblemPixelatedVideo",
+    "Call",
+    "FirebaseAuthenticationSettings",
+    "FirebaseAuthenticationSettingsAndroid",
+    "FirebaseAuthenticationSettingsIos",
+    "PhoneNumberAuthenticationSettings",
+    "AddedReaction",
+    "AddedReactions",
+    "AvailableReaction",
+    "AvailableReactions",
+    "EmojiReaction",
+    "ReactionUnavailabilityReason",
+    "ReactionUnavailabilityReasonAnonymousAdministrator",
+    "ReactionUnavailabilityReasonGuest",
+    "Animations",
+    "DiceStickers",
+    "DiceStickersRegular",
+    "DiceStickersSlotMachine",
+    "ImportedContacts",
+    "SpeechRecognitionResult",
+    "SpeechRecognitionResultPending",
+    "SpeechRecognitionResultText",
+    "SpeechRecognitionResultError",
+    "BusinessConnection",
+    "AttachmentMenuBotColor",
+    "AttachmentMenuBot",
+    "SentWebAppMessage",
+    "BotWriteAccessAllowReason",
+    "BotWriteAccessAllowReasonConnectedWebsite",
+    "BotWriteAccessAllowReasonAddedToAttachmentMenu",
+    "BotWriteAccessAllowReasonLaunchedWebApp",
+    "BotWriteAccessAllowReasonAcceptedRequest",
+    "HttpUrl",
+    "UserLink",
+    "TargetChatTypes",
+    "TargetChat",
+    "TargetChatCurrent",
+    "TargetChatChosen",
+    "TargetChatInternalLink",
+    "InputInlineQueryResult",
+    "InputInlineQueryResultAnimation",
+    "InputInlineQueryResultArticle",
+    "InputInlineQueryResultAudio",
+    "InputInlineQueryResultContact",
+    "InputInlineQueryResultDocument",
+    "InputInlineQueryResultGame",
+    "InputInlineQueryResultLocation",
+    "InputInlineQueryResultPhoto",
+    "InputInlineQueryResultSticker",
+    "InputInlineQueryResultVenue",
+    "InputInlineQueryResultVideo",
+    "InputInlineQueryResultVoiceNote",
+    "InlineQueryResult",
+    "InlineQueryResultArticle",
+    "InlineQueryResultContact",
+    "InlineQueryResultLocation",
+    "InlineQueryResultVenue",
+    "InlineQueryResultGame",
+    "InlineQueryResultAnimation",
+    "InlineQueryResultAudio",
+    "InlineQueryResultDocument",
+    "InlineQueryResultPhoto",
+    "InlineQueryResultSticker",
+    "InlineQueryResultVideo",
+    "InlineQueryResultVoiceNote",
+    "InlineQueryResultsButtonType",
+    "InlineQueryResultsButtonTypeStartBot",
+    "InlineQueryResultsButtonTypeWebApp",
+    "InlineQueryResultsButton",
+    "InlineQueryResults",
+    "PreparedInlineMessageId",
+    "PreparedInlineMessage",
+    "CallbackQueryPayload",
+    "CallbackQueryPayloadData",
+    "CallbackQueryPayloadDataWithPassword",
+    "CallbackQueryPayloadGame",
+    "CallbackQueryAnswer",
+    "CustomRequestResult",
+    "GameHighScore",
+    "GameHighScores",
+    "ChatEventAction",
+    "ChatEventMessageEdited",
+    "ChatEventMessageDeleted",
+    "ChatEventMessagePinned",
+    "ChatEventMessageUnpinned",
+    "ChatEventPollStopped",
+    "ChatEventMemberJoined",
+    "ChatEventMemberJoinedByInviteLink",
+    "ChatEventMemberJoinedByRequest",
+    "ChatEventMemberInvited",
+    "ChatEventMemberLeft",
+    "ChatEventMemberPromoted",
+    "ChatEventMemberRestricted",
+    "ChatEventMemberSubscriptionExtended",
+    "ChatEventAvailableReactionsChanged",
+    "ChatEventBackgroundChanged",
+    "ChatEventDescriptionChanged",
+    "ChatEventEmojiStatusChanged",
+    "ChatEventLinkedChatChanged",
+    "ChatEventLocationChanged",
+    "ChatEventMessageAutoDeleteTimeChanged",
+    "ChatEventPermissionsChanged",
+    "ChatEventPhotoChanged",
+    "ChatEventSlowModeDelayChanged",
+    "ChatEventStickerSetChanged",
+    "ChatEventCustomEmojiStickerSetChanged",
+    "ChatEventTitleChanged",
+    "ChatEventUsernameChanged",
+    "ChatEventActiveUsernamesChanged",
+    "ChatEventAccentColorChanged",
+    "ChatEventProfileAccentColorChanged",
+    "ChatEventHasProtectedContentToggled",
+    "ChatEventInvitesToggled",
+    "ChatEventIsAllHistoryAvailableToggled",
+    "ChatEventHasAggressiveAntiSpamEnabledToggled",
+    "ChatEventSignMessagesToggled",
+    "ChatEventShowMessageSenderToggled",
+    "ChatEventAutomaticTranslationToggled",
+    "ChatEventInviteLinkEdited",
+    "ChatEventInviteLinkRevoked",
+    "ChatEventInviteLinkDeleted",
+    "ChatEventVideoChatCreated",
+    "ChatEventVideoChatEnded",
+    "ChatEventVideoChatMuteNewParticipantsToggled",
+    "ChatEventVideoChatParticipantIsMutedToggled",
+    "ChatEventVideoChatParticipantVolumeLevelChanged",
+    "ChatEventIsForumToggled",
+    "ChatEventForumTopicCreated",
+    "ChatEventForumTopicEdited",
+    "ChatEventForumTopicToggleIsClosed",
+    "ChatEventForumTopicToggleIsHidden",
+    "ChatEventForumTopicDeleted",
+    "ChatEventForumTopicPinned",
+    "ChatEvent",
+    "ChatEvents",
+    "ChatEventLogFilters",
+    "LanguagePackStringValue",
+    "LanguagePackStringValueOrdinary",
+    "LanguagePackStringValuePluralized",
+    "LanguagePackStringValueDeleted",
+    "LanguagePackString",
+    "LanguagePackStrings",
+    "LanguagePackInfo",
+    "LocalizationTargetInfo",
+    "PremiumLimitType",
+    "PremiumLimitTypeSupergroupCount",
+    "PremiumLimitTypePinnedChatCount",
+    "PremiumLimitTypeCreatedPublicChatCount",
+    "PremiumLimitTypeSavedAnimationCount",
+    "PremiumLimitTypeFavoriteStickerCount",
+    "PremiumLimitTypeChatFolderCount",
+    "PremiumLimitTypeChatFolderChosenChatCount",
+    "PremiumLimitTypePinnedArchivedChatCount",
+    "PremiumLimitTypePinnedSavedMessagesTopicCount",
+    "PremiumLimitTypeCaptionLength",
+    "PremiumLimitTypeBioLength",
+    "PremiumLimitTypeChatFolderInviteLinkCount",
+    "PremiumLimitTypeShareableChatFolderCount",
+    "PremiumLimitTypeActiveStoryCount",
+    "PremiumLimitTypeWeeklyPostedStoryCount",
+    "PremiumLimitTypeMonthlyPostedStoryCount",
+    "PremiumLimitTypeStoryCaptionLength",
+    "PremiumLimitTypeStorySuggestedReactionAreaCount",
+    "PremiumLimitTypeSimilarChatCount",
+    "PremiumFeature",
+    "PremiumFeatureIncreasedLimits",
+    "PremiumFeatureIncreasedUploadFileSize",
+    "PremiumFeatureImprovedDownloadSpeed",
+    "PremiumFeatureVoiceRecognition",
+    "PremiumFeatureDisabledAds",
+    "PremiumFeatureUniqueReactions",
+    "PremiumFeatureUniqueStickers",
+    "PremiumFeatureCustomEmoji",
+    "PremiumFeatureAdvancedChatManagement",
+    "PremiumFeatureProfileBadge",
+    "PremiumFeatureEmojiStatus",
+    "PremiumFeatureAnimatedProfilePhoto",
+    "PremiumFeatureForumTopicIcon",
+    "PremiumFeatureAppIcons",
+    "PremiumFeatureRealTimeChatTranslation",
+    "PremiumFeatureUpgradedStories",
+    "PremiumFeatureChatBoost",
+    "PremiumFeatureAccentColor",
+    "PremiumFeatureBackgroundForBoth",
+    "PremiumFeatureSavedMessagesTags",
+    "PremiumFeatureMessagePrivacy",
+    "PremiumFeatureLastSeenTimes",
+    "PremiumFeatureBusiness",
+    "PremiumFeatureMessageEffects",
+    "PremiumFeatureChecklists",
+    "BusinessFeature",
+    "BusinessFeatureLocation",
+    "BusinessFeatureOpeningHours",
+    "BusinessFeatureQuickReplies",
+    "BusinessFeatureGreetingMessage",
+    "BusinessFeatureAwayMessage",
+    "BusinessFeatureAccountLinks",
+    "BusinessFeatureStartPage",
+    "BusinessFeatureBots",
+    "BusinessFeatureEmojiStatus",
+    "BusinessFeatureChatFolderTags",
+    "BusinessFeatureUpgradedStories",
+    "PremiumStoryFeature",
+    "PremiumStoryFeaturePriorityOrder",
+    "PremiumStoryFeatureStealthMode",
+    "PremiumStoryFeaturePermanentViewsHistory",
+    "PremiumStoryFeatureCustomExpirationDuration",
+    "PremiumStoryFeatureSaveStories",
+    "PremiumStoryFeatureLinksAndFormatting",
+    "PremiumStoryFeatureVideoQuality",
+    "PremiumLimit",
+    "PremiumFeatures",
+    "BusinessFeatures",
+    "PremiumSource",
+    "PremiumSourceLimitExceeded",
+    "PremiumSourceFeature",
+    "PremiumSourceBusinessFeature",
+    "PremiumSourceStoryFeature",
+    "PremiumSourceLink",
+    "PremiumSourceSettings",
+    "PremiumFeaturePromotionAnimation",
+    "BusinessFeaturePromotionAnimation",
+    "PremiumState",
+    "StorePaymentPurpose",
+    "StorePaymentPurposePremiumSubscription",
+    "StorePaymentPurposePremiumGift",
+    "StorePaymentPurposePremiumGiftCodes",
+    "StorePaymentPurposePremiumGiveaway",
+    "StorePaymentPurposeStarGiveaway",
+    "StorePaymentPurposeStars",
+    "StorePaymentPurposeGiftedStars",
+    "StoreTransaction",
+    "StoreTransactionAppStore",
+    "StoreTransactionGooglePlay",
+    "TelegramPaymentPurpose",
+    "TelegramPaymentPurposePremiumGift",
+    "TelegramPaymentPurposePremiumGiftCodes",
+    "TelegramPaymentPurposePremiumGiveaway",
+    "TelegramPaymentPurposeStars",
+    "TelegramPaymentPurposeGiftedStars",
+    "TelegramPaymentPurposeStarGiveaway",
+    "TelegramPaymentPurposeJoinChat",
+    "DeviceToken",
+    "DeviceTokenFirebaseCloudMessaging",
+    "DeviceTokenApplePush",
+    "DeviceTokenApplePushVoIP",
+    "DeviceTokenWindowsPush",
+    "DeviceTokenMicrosoftPush",
+    "DeviceTokenMicrosoftPushVoIP",
+    "DeviceTokenWebPush",
+    "DeviceTokenSimplePush",
+    "DeviceTokenUbuntuPush",
+    "DeviceTokenBlackBerryPush",
+    "DeviceTokenTizenPush",
+    "DeviceTokenHuaweiPush",
+    "PushReceiverId",
+    "BackgroundFill",
+    "BackgroundFillSolid",
+    "BackgroundFillGradient",
+    "BackgroundFillFreeformGradient",
+    "BackgroundType",
+    "BackgroundTypeWallpaper",
+    "BackgroundTypePattern",
+    "BackgroundTypeFill",
+    "BackgroundTypeChatTheme",
+    "InputBackground",
+    "InputBackgroundLocal",
+    "InputBackgroundRemote",
+    "InputBackgroundPrevious",
+    "ChatTheme",
+    "TimeZone",
+    "TimeZones",
+    "Hashtags",
+    "CanPostStoryResult",
+    "CanPostStoryResultOk",
+    "CanPostStoryResultPremiumNeeded",
+    "CanPostStoryResultBoostNeeded",
+    "CanPostStoryResultActiveStoryLimitExceeded",
+    "CanPostStoryResultWeeklyLimitExceeded",
+    "CanPostStoryResultMonthlyLimitExceeded",
+    "CanTransferOwnershipResult",
+    "CanTransferOwnershipResultOk",
+    "CanTransferOwnershipResultPasswordNeeded",
+    "CanTransferOwnershipResultPasswordTooFresh",
+    "CanTransferOwnershipResultSessionTooFresh",
+    "CheckChatUsernameResult",
+    "CheckChatUsernameResultOk",
+    "CheckChatUsernameResultUsernameInvalid",
+    "CheckChatUsernameResultUsernameOccupied",
+    "CheckChatUsernameResultUsernamePurchasable",
+    "CheckChatUsernameResultPublicChatsTooMany",
+    "CheckChatUsernameResultPublicGroupsUnavailable",
+    "CheckStickerSetNameResult",
+    "CheckStickerSetNameResultOk",
+    "CheckStickerSetNameResultNameInvalid",
+    "CheckStickerSetNameResultNameOccupied",
+    "ResetPasswordResult",
+    "ResetPasswordResultOk",
+    "ResetPasswordResultPending",
+    "ResetPasswordResultDeclined",
+    "MessageFileType",
+    "MessageFileTypePrivate",
+    "MessageFileTypeGroup",
+    "MessageFileTypeUnknown",
+    "PushMessageContent",
+    "PushMessageContentHidden",
+    "PushMessageContentAnimation",
+    "PushMessageContentAudio",
+    "PushMessageContentContact",
+    "PushMessageContentContactRegistered",
+    "PushMessageContentDocument",
+    "PushMessageContentGame",
+    "PushMessageContentGameScore",
+    "PushMessageContentInvoice",
+    "PushMessageContentLocation",
+    "PushMessageContentPaidMedia",
+    "PushMessageContentPhoto",
+    "PushMessageContentPoll",
+    "PushMessageContentPremiumGiftCode",
+    "PushMessageContentGiveaway",
+    "PushMessageContentGift",
+    "PushMessageContentUpgradedGift",
+    "PushMessageContentScreenshotTaken",
+    "PushMessageContentSticker",
+    "PushMessageContentStory",
+    "PushMessageContentText",
+    "PushMessageContentChecklist",
+    "PushMessageContentVideo",
+    "PushMessageContentVideoNote",
+    "PushMessageContentVoiceNote",
+    "PushMessageContentBasicGroupChatCreate",
+    "PushMessageContentVideoChatStarted",
+    "PushMessageContentVideoChatEnded",
+    "PushMessageContentInviteVideoChatParticipants",
+    "PushMessageContentChatAddMembers",
+    "PushMessageContentChatChangePhoto",
+    "PushMessageContentChatChangeTitle",
+    "PushMessageContentChatSetBackground",
+    "PushMessageContentChatSetTheme",
+    "PushMessageContentChatDeleteMember",
+    "PushMessageContentChatJoinByLink",
+    "PushMessageContentChatJoinByRequest",
+    "PushMessageContentRecurringPayment",
+    "PushMessageContentSuggestProfilePhoto",
+    "PushMessageContentProximityAlertTriggered",
+    "PushMessageContentChecklistTasksAdded",
+    "PushMessageContentChecklistTasksDone",
+    "PushMessageContentMessageForwards",
+    "PushMessageContentMediaAlbum",
+    "NotificationType",
+    "NotificationTypeNewMessage",
+    "NotificationTypeNewSecretChat",
+    "NotificationTypeNewCall",
+    "NotificationTypeNewPushMessage",
+    "NotificationGroupType",
+    "NotificationGroupTypeMessages",
+    "NotificationGroupTypeMentions",
+    "NotificationGroupTypeSecretChat",
+    "NotificationGroupTypeCalls",
+    "NotificationSound",
+    "NotificationSounds",
+    "Notification",
+    "NotificationGroup",
+    "OptionValue",
+    "OptionValueBoolean",
+    "OptionValueEmpty",
+    "OptionValueInteger",
+    "OptionValueString",
+    "JsonObjectMember",
+    "JsonValue",
+    "JsonValueNull",
+    "JsonValueBoolean",
+    "JsonValueNumber",
+    "JsonValueString",
+    "JsonValueArray",
+    "JsonValueObject",
+    "StoryPrivacySettings",
+    "StoryPrivacySettingsEveryone",
+    "StoryPrivacySettingsContacts",
+    "StoryPrivacySettingsCloseFriends",
+    "StoryPrivacySettingsSelectedUsers",
+    "UserPrivacySettingRule",
+    "UserPrivacySettingRuleAllowAll",
+    "UserPrivacySettingRuleAllowContacts",
+    "UserPrivacySettingRuleAllowBots",
+    "UserPrivacySettingRuleAllowPremiumUsers",
+    "UserPrivacySettingRuleAllowUsers",
+    "UserPrivacySettingRuleAllowChatMembers",
+    "UserPrivacySettingRuleRestrictAll",
+    "UserPrivacySettingRuleRestrictContacts",
+    "UserPrivacySettingRuleRestrictBots",
+    "UserPrivacySettingRuleRestrictUsers",
+    "UserPrivacySettingRuleRestrictChatMembers",
+    "UserPrivacySettingRules",
+    "UserPrivacySetting",
+    "UserPrivacySettingShowStatus",
+    "UserPrivacySettingShowProfilePhoto",
+    "UserPrivacySettingShowLinkInForwardedMessages",
+    "UserPrivacySettingShowPhoneNumber",
+    "UserPrivacySettingShowBio",
+    "UserPrivacySettingShowBirthdate",
+    "UserPrivacySettingAllowChatInvites",
+    "UserPrivacySettingAllowCalls",
+    "UserPrivacySettingAllowPeerToPeerCalls",
+    "UserPrivacySettingAllowFindingByPhoneNumber",
+    "UserPrivacySettingAllowPrivateVoiceAndVideoNoteMessages",
+    "UserPrivacySettingAutosaveGifts",
+    "UserPrivacySettingAllowUnpaidMessages",
+    "ReadDatePrivacySettings",
+    "NewChatPrivacySettings",
+    "CanSendMessageToUserResult",
+    "CanSendMessageToUserResultOk",
+    "CanSendMessageToUserResultUserHasPaidMessages",
+    "CanSendMessageToUserResultUserIsDeleted",
+    "CanSendMessageToUserResultUserRestrictsNewChats",
+    "AccountTtl",
+    "MessageAutoDeleteTime",
+    "SessionType",
+    "SessionTypeAndroid",
+    "SessionTypeApple",
+    "SessionTypeBrave",
+    "SessionTypeChrome",
+    "SessionTypeEdge",
+    "SessionTypeFirefox",
+    "SessionTypeIpad",
+    "SessionTypeIphone",
+    "SessionTypeLinux",
+    "SessionTypeMac",
+    "SessionTypeOpera",
+    "SessionTypeSafari",
+    "SessionTypeUbuntu",
+    "SessionTypeUnknown",
+    "SessionTypeVivaldi",
+    "SessionTypeWindows",
+    "SessionTypeXbox",
+    "Session",
+    "Sessions",
+    "UnconfirmedSession",
+    "ConnectedWebsite",
+    "ConnectedWebsites",
+    "ReportReason",
+    "ReportReasonSpam",
+    "ReportReasonViolence",
+    "ReportReasonPornography",
+    "ReportReasonChildAbuse",
+    "ReportReasonCopyright",
+    "ReportReasonUnrelatedLocation",
+    "ReportReasonFake",
+    "ReportReasonIllegalDrugs",
+    "ReportReasonPersonalDetails",
+    "ReportReasonCustom",
+    "ReportChatResult",
+    "ReportChatResultOk",
+    "ReportChatResultOptionRequired",
+    "ReportChatResultTextRequired",
+    "ReportChatResultMessagesRequired",
+    "ReportStoryResult",
+    "ReportStoryResultOk",
+    "ReportStoryResultOptionRequired",
+    "ReportStoryResultTextRequired",
+    "InternalLinkType",
+    "InternalLinkTypeActiveSessions",
+    "InternalLinkTypeAttachmentMenuBot",
+    "InternalLinkTypeAuthenticationCode",
+    "InternalLinkTypeBackground",
+    "InternalLinkTypeBotAddToChannel",
+    "InternalLinkTypeBotStart",
+    "InternalLinkTypeBotStartInGroup",
+    "InternalLinkTypeBusinessChat",
+    "InternalLinkTypeBuyStars",
+    "InternalLinkTypeChangePhoneNumber",
+    "InternalLinkTypeChatAffiliateProgram",
+    "InternalLinkTypeChatBoost",
+    "InternalLinkTypeChatFolderInvite",
+    "InternalLinkTypeChatFolderSettings",
+    "InternalLinkTypeChatInvite",
+    "InternalLinkTypeDefaultMessageAutoDeleteTimerSettings",
+    "InternalLinkTypeEditProfileSettings",
+    "InternalLinkTypeGame",
+    "InternalLinkTypeGroupCall",
+    "InternalLinkTypeInstantView",
+    "InternalLinkTypeInvoice",
+    "InternalLinkTypeLanguagePack",
+    "InternalLinkTypeLanguageSettings",
+    "InternalLinkTypeMainWebApp",
+    "InternalLinkTypeMessage",
+    "InternalLinkTypeMessageDraft",
+    "InternalLinkTypeMyStars",
+    "InternalLinkTypeMyToncoins",
+    "InternalLinkTypePassportDataRequest",
+    "InternalLinkTypePhoneNumberConfirmation",
+    "InternalLinkTypePremiumFeatures",
+    "InternalLinkTypePremiumGift",
+    "InternalLinkTypePremiumGiftCode",
+    "InternalLinkTypePrivacyAndSecuritySettings",
+    "InternalLinkTypeProxy",
+    "InternalLinkTypePublicChat",
+    "InternalLinkTypeQrCodeAuthentication",
+    "InternalLinkTypeRestorePurchases",
+    "InternalLinkTypeSettings",
+    "InternalLinkTypeStickerSet",
+    "InternalLinkTypeStory",
+    "InternalLinkTypeTheme",
+    "InternalLinkTypeThemeSettings",
+    "InternalLinkTypeUnknownDeepLink",
+    "InternalLinkTypeUnsupportedProxy",
+    "InternalLinkTypeUpgradedGift",
+    "InternalLinkTypeUserPhoneNumber",
+    "InternalLinkTypeUserToken",
+    "InternalLinkTypeVideoChat",
+    "InternalLinkTypeWebApp",
+    "MessageLink",
+    "MessageLinkInfo",
+    "ChatBoostLink",
+    "ChatBoostLinkInfo",
+    "BlockList",
+    "BlockListMain",
+    "BlockListStories",
+    "FileType",
+    "FileTypeNone",
+    "FileTypeAnimation",
+    "FileTypeAudio",
+    "FileTypeDocument",
+    "FileTypeNotificationSound",
+    "FileTypePhoto",
+    "FileTypePhotoStory",
+    "FileTypeProfilePhoto",
+    "FileTypeSecret",
+    "FileTypeSecretThumbnail",
+    "FileTypeSecure",
+    "FileTypeSelfDestructingPhoto",
+    "FileTypeSelfDestructingVideo",
+    "FileTypeSelfDestructingVideoNote",
+    "FileTypeSelfDestructingVoiceNote",
+    "FileTypeSticker",
+    "FileTypeThumbnail",
+    "FileTypeUnknown",
+    "FileTypeVideo",
+    "FileTypeVideoNote",
+    "FileTypeVideoStory",
+    "FileTypeVoiceNote",
+    "FileTypeWallpaper",
+    "StorageStatisticsByFileType",
+    "StorageStatisticsByChat",
+    "StorageStatistics",
+    "StorageStatisticsFast",
+    "DatabaseStatistics",
+    "NetworkType",
+    "NetworkTypeNone",
+    "NetworkTypeMobile",
+    "NetworkTypeMobileRoaming",
+    "NetworkTypeWiFi",
+    "NetworkTypeOther",
+    "NetworkStatisticsEntry",
+    "NetworkStatisticsEntryFile",
+    "NetworkStatisticsEntryCall",
+    "NetworkStatistics",
+    "AutoDownloadSettings",
+    "AutoDownloadSettingsPresets",
+    "AutosaveSettingsScope",
+    "AutosaveSettingsScopePrivateChats",
+    "AutosaveSettingsScopeGroupChats",
+    "AutosaveSettingsScopeChannelChats",
+    "AutosaveSettingsScopeChat",
+    "ScopeAutosaveSettings",
+    "AutosaveSettingsException",
+    "AutosaveSettings",
+    "ConnectionState",
+    "ConnectionStateWaitingForNetwork",
+    "ConnectionStateConnectingToProxy",
+    "ConnectionStateConnecting",
+    "ConnectionStateUpdating",
+    "ConnectionStateReady",
+    "TopChatCategory",
+    "TopChatCategoryUsers",
+    "TopChatCategoryBots",
+    "TopChatCategoryGroups",
+    "TopChatCategoryChannels",
+    "TopChatCategoryInlineBots",
+    "TopChatCategoryWebAppBots",
+    "TopChatCategoryCalls",
+    "TopChatCategoryForwardChats",
+    "FoundPosition",
+    "FoundPositions",
+    "TMeUrlType",
+    "TMeUrlTypeUser",
+    "TMeUrlTypeSupergroup",
+    "TMeUrlTypeChatInvite",
+    "TMeUrlTypeStickerSet",
+    "TMeUrl",
+    "TMeUrls",
+    "SuggestedAction",
+    "SuggestedActionEnableArchiveAndMuteNewChats",
+    "SuggestedActionCheckPassword",
+    "SuggestedActionCheckPhoneNumber",
+    "SuggestedActionViewChecksHint",
+    "SuggestedActionConvertToBroadcastGroup",
+    "SuggestedActionSetPassword",
+    "SuggestedActionUpgradePremium",
+    "SuggestedActionRestorePremium",
+    "SuggestedActionSubscribeToAnnualPremium",
+    "SuggestedActionGiftPremiumForChristmas",
+    "SuggestedActionSetBirthdate",
+    "SuggestedActionSetProfilePhoto",
+    "SuggestedActionExtendPremium",
+    "SuggestedActionExtendStarSubscriptions",
+    "SuggestedActionCustom",
+    "Count",
+    "Text",
+    "Data",
+    "Seconds",
+    "FileDownloadedPrefixSize",
+    "StarCount",
+    "DeepLinkInfo",
+    "TextParseMode",
+    "TextParseModeMarkdown",
+    "TextParseModeHTML",
+    "ProxyType",
+    "ProxyTypeSocks5",
+    "ProxyTypeHttp",
+    "ProxyTypeMtproto",
+    "Proxy",
+    "Proxies",
+    "InputSticker",
+    "DateRange",
+    "StatisticalValue",
+    "StatisticalGraph",
+    "StatisticalGraphData",
+    "StatisticalGraphAsync",
+    "StatisticalGraphError",
+    "ChatStatisticsObjectType",
+    "ChatStatisticsObjectTypeMessage",
+    "ChatStatisticsObjectTypeStory",
+    "ChatStatisticsInteractionInfo",
+    "ChatStatisticsMessageSenderInfo",
+    "ChatStatisticsAdministratorActionsInfo",
+    "ChatStatisticsInviterInfo",
+    "ChatStatistics",
+    "ChatStatisticsSupergroup",
+    "ChatStatisticsChannel",
+    "ChatRevenueAmount",
+    "ChatRevenueStatistics",
+    "MessageStatistics",
+    "StoryStatistics",
+    "RevenueWithdrawalState",
+    "RevenueWithdrawalStatePending",
+    "RevenueWithdrawalStateSucceeded",
+    "RevenueWithdrawalStateFailed",
+    "ChatRevenueTransactionType",
+    "ChatRevenueTransactionTypeUnsupported",
+    "ChatRevenueTransactionTypeSponsoredMessageEarnings",
+    "ChatRevenueTransactionTypeSuggestedPostEarnings",
+    "ChatRevenueTransactionTypeFragmentWithdrawal",
+    "ChatRevenueTransactionTypeFragmentRefund",
+    "ChatRevenueTransaction",
+    "ChatRevenueTransactions",
+    "StarRevenueStatus",
+    "StarRevenueStatistics",
+    "Point",
+    "VectorPathCommand",
+    "VectorPathCommandLine",
+    "VectorPathCommandCubicBezierCurve",
+    "BotCommandScope",
+    "BotCommandScopeDefault",
+    "BotCommandScopeAllPrivateChats",
+    "BotCommandScopeAllGroupChats",
+    "BotCommandScopeAllChatAdministrators",
+    "BotCommandScopeChat",
+    "BotCommandScopeChatAdministrators",
+    "BotCommandScopeChatMember",
+    "PhoneNumberCodeType",
+    "PhoneNumberCodeTypeChange",
+    "PhoneNumberCodeTypeVerify",
+    "PhoneNumberCodeTypeConfirmOwnership",
+    "UpdateAuthorizationState",
+    "UpdateNewMessage",
+    "UpdateMessageSendAcknowledged",
+    "UpdateMessageSendSucceeded",
+    "UpdateMessageSendFailed",
+    "UpdateMessageContent",
+    "UpdateMessageEdited",
+    "UpdateMessageIsPinned",
+    "UpdateMessageInteractionInfo",
+    "UpdateMessageContentOpened",
+    "UpdateMessageMentionRead",
+    "UpdateMessageUnreadReactions",
+    "UpdateMessageFactCheck",
+    "UpdateMessageSuggestedPostInfo",
+    "UpdateMessageLiveLocationViewed",
+    "UpdateVideoPublished",
+    "UpdateNewChat",
+    "UpdateChatTitle",
+    "UpdateChatPhoto",
+    "UpdateChatAccentColors",
+    "UpdateChatPermissions",
+    "UpdateChatLastMessage",
+    "UpdateChatPosition",
+    "UpdateChatAddedToList",
+    "UpdateChatRemovedFromList",
+    "UpdateChatReadInbox",
+    "UpdateChatReadOutbox",
+    "UpdateChatActionBar",
+    "UpdateChatBusinessBotManageBar",
+    "UpdateChatAvailableReactions",
+    "UpdateChatDraftMessage",
+    "UpdateChatEmojiStatus",
+    "UpdateChatMessageSender",
+    "UpdateChatMessageAutoDeleteTime",
+    "UpdateChatNotificationSettings",
+    "UpdateChatPendingJoinRequests",
+    "UpdateChatReplyMarkup",
+    "UpdateChatBackground",
+    "UpdateChatTheme",
+    "UpdateChatUnreadMentionCount",
+    "UpdateChatUnreadReactionCount",
+    "UpdateChatVideoChat",
+    "UpdateChatDefaultDisableNotification",
+    "UpdateChatHasProtectedContent",
+    "UpdateChatIsTranslatable",
+    "UpdateChatIsMarkedAsUnread",
+    "UpdateChatViewAsTopics",
+    "UpdateChatBlockList",
+    "UpdateChatHasScheduledMessages",
+    "UpdateChatFolders",
+    "UpdateChatOnlineMemberCount",
+    "UpdateSavedMessagesTopic",
+    "UpdateSavedMessagesTopicCount",
+    "UpdateDirectMessagesChatTopic",
+    "UpdateTopicMessageCount",
+    "UpdateQuickReplyShortcut",
+    "UpdateQuickReplyShortcutDeleted",
+    "UpdateQuickReplyShortcuts",
+    "UpdateQuickReplyShortcutMessages",
+    "UpdateForumTopicInfo",
+    "UpdateForumTopic",
+    "UpdateScopeNotificationSettings",
+    "UpdateReactionNotificationSettings",
+    "UpdateNotification",
+    "UpdateNotificationGroup",
+    "UpdateActiveNotifications",
+    "UpdateHavePendingNotifications",
+    "UpdateDeleteMessages",
+    "UpdateChatAction",
+    "UpdateUserStatus",
+    "UpdateUser",
+    "UpdateBasicGroup",
+    "UpdateSupergroup",
+    "UpdateSecretChat",
+    "UpdateUserFullInfo",
+    "UpdateBasicGroupFullInfo",
+    "UpdateSupergroupFullInfo",
+    "UpdateServiceNotification",
+    "UpdateFile",
+    "UpdateFileGenerationStart",
+    "UpdateFileGenerationStop",
+    "UpdateFileDownloads",
+    "UpdateFileAddedToDownloads",
+    "UpdateFileDownload",
+    "UpdateFileRemovedFromDownloads",
+    "UpdateApplicationVerificationRequired",
+    "UpdateApplicationRecaptchaVerificationRequired",
+    "UpdateCall",
+    "UpdateGroupCall",
+    "UpdateGroupCallParticipant",
+    "UpdateGroupCallParticipants",
+    "UpdateGroupCallVerificationState",
+    "UpdateNewCallSignalingData",
+    "UpdateUserPrivacySettingRules",
+    "UpdateUnreadMessageCount",
+    "UpdateUnreadChatCount",
+    "UpdateStory",
+    "UpdateStoryDeleted",
+    "UpdateStoryPostSucceeded",
+    "UpdateStoryPostFailed",
+    "UpdateChatActiveStories",
+    "UpdateStoryListChatCount",
+    "UpdateStoryStealthMode",
+    "UpdateOption",
+    "UpdateStickerSet",
+    "UpdateInstalledStickerSets",
+    "UpdateTrendingStickerSets",
+    "UpdateRecentStickers",
+    "UpdateFavoriteStickers",
+    "UpdateSavedAnimations",
+    "UpdateSavedNotificationSounds",
+    "UpdateDefaultBackground",
+    "UpdateChatThemes",
+    "UpdateAccentColors",
+    "UpdateProfileAccentColors",
+    "UpdateLanguagePackStrings",
+    "UpdateConnectionState",
+    "UpdateFreezeState",
+    "UpdateTermsOfService",
+    "UpdateUnconfirmedSession",
+    "UpdateAttachmentMenuBots",
+    "UpdateWebAppMessageSent",
+    "UpdateActiveEmojiReactions",
+    "UpdateAvailableMessageEffects",
+    "UpdateDefaultReactionType",
+    "UpdateDefaultPaidReactionType",
+    "UpdateSavedMessagesTags",
+    "UpdateActiveLiveLocationMessages",
+    "UpdateOwnedStarCount",
+    "UpdateOwnedTonCount",
+    "UpdateChatRevenueAmount",
+    "UpdateStarRevenueStatus",
+    "UpdateSpeechRecognitionTrial",
+    "UpdateDiceEmojis",
+    "UpdateAnimatedEmojiMessageClicked",
+    "UpdateAnimationSearchParameters",
+    "UpdateSuggestedActions",
+    "UpdateSpeedLimitNotification",
+    "UpdateContactCloseBirthdays",
+    "UpdateAutosaveSettings",
+    "UpdateBusinessConnection",
+    "UpdateNewBusinessMessage",
+    "UpdateBusinessMessageEdited",
+    "UpdateBusinessMessagesDeleted",
+    "UpdateNewInlineQuery",
+    "UpdateNewChosenInlineResult",
+    "UpdateNewCallbackQuery",
+    "UpdateNewInlineCallbackQuery",
+    "UpdateNewBusinessCallbackQuery",
+    "UpdateNewShippingQuery",
+    "UpdateNewPreCheckoutQuery",
+    "UpdateNewCustomEvent",
+    "UpdateNewCustomQuery",
+    "UpdatePoll",
+    "UpdatePollAnswer",
+    "UpdateChatMember",
+    "UpdateNewChatJoinRequest",
+    "UpdateChatBoost",
+    "UpdateMessageReaction",
+    "UpdateMessageReactions",
+    "UpdatePaidMediaPurchased",
+    "Updates",
+    "LogStream",
+    "LogStreamDefault",
+    "LogStreamFile",
+    "LogStreamEmpty",
+    "LogVerbosityLevel",
+    "LogTags",
+    "UserSupportInfo",
+    "TestInt",
+    "TestString",
+    "TestBytes",
+    "TestVectorInt",
+    "TestVectorIntObject",
+    "TestVectorString",
+    "TestVectorStringObject",
+    "GetAuthorizationState",
+    "SetTdlibParameters",
+    "SetAuthenticationPhoneNumber",
+    "CheckAuthenticationPremiumPurchase",
+    "SetAuthenticationPremiumPurchaseTransaction",
+    "SetAuthenticationEmailAddress",
+    "ResendAuthenticationCode",
+    "CheckAuthenticationEmailCode",
+    "CheckAuthenticationCode",
+    "RequestQrCodeAuthentication",
+    "RegisterUser",
+    "ResetAuthenticationEmailAddress",
+    "CheckAuthenticationPassword",
+    "RequestAuthenticationPasswordRecovery",
+    "CheckAuthenticationPasswordRecoveryCode",
+    "RecoverAuthenticationPassword",
+    "SendAuthenticationFirebaseSms",
+    "ReportAuthenticationCodeMissing",
+    "CheckAuthenticationBotToken",
+    "LogOut",
+    "Close",
+    "Destroy",
+    "ConfirmQrCodeAuthentication",
+    "GetCurrentState",
+    "SetDatabaseEncryptionKey",
+    "GetPasswordState",
+    "SetPassword",
+    "SetLoginEmailAddress",
+    "ResendLoginEmailAddressCode",
+    "CheckLoginEmailAddressCode",
+    "GetRecoveryEmailAddress",
+    "SetRecoveryEmailAddress",
+    "CheckRecoveryEmailAddressCode",
+    "ResendRecoveryEmailAddressCode",
+    "CancelRecoveryEmailAddressVerification",
+    "RequestPasswordRecovery",
+    "CheckPasswordRecoveryCode",
+    "RecoverPassword",
+    "ResetPassword",
+    "CancelPasswordReset",
+    "CreateTemporaryPassword",
+    "GetTemporaryPasswordState",
+    "GetMe",
+    "GetUser",
+    "GetUserFullInfo",
+    "GetBasicGroup",
+    "GetBasicGroupFullInfo",
+    "GetSupergroup",
+    "GetSupergroupFullInfo",
+    "GetSecretChat",
+    "GetChat",
+    "GetMessage",
+    "GetMessageLocally",
+    "GetRepliedMessage",
+    "GetChatPinnedMessage",
+    "GetCallbackQueryMessage",
+    "GetMessages",
+    "GetMessageProperties",
+    "GetMessageThread",
+    "GetMessageReadDate",
+    "GetMessageViewers",
+    "GetMessageAuthor",
+    "GetFile",
+    "GetRemoteFile",
+    "LoadChats",
+    "GetChats",
+    "SearchPublicChat",
+    "SearchPublicChats",
+    "SearchChats",
+    "SearchChatsOnServer",
+    "GetRecommendedChats",
+    "GetChatSimilarChats",
+    "GetChatSimilarChatCount",
+    "OpenChatSimilarChat",
+    "GetBotSimilarBots",
+    "GetBotSimilarBotCount",
+    "OpenBotSimilarBot",
+    "GetTopChats",
+    "RemoveTopChat",
+    "SearchRecentlyFoundChats",
+    "AddRecentlyFoundChat",
+    "RemoveRecentlyFoundChat",
+    "ClearRecentlyFoundChats",
+    "GetRecentlyOpenedChats",
+    "CheckChatUsername",
+    "GetCreatedPublicChats",
+    "CheckCreatedPublicChatsLimit",
+    "GetSuitableDiscussionChats",
+    "GetInactiveSupergroupChats",
+    "GetSuitablePersonalChats",
+    "LoadDirectMessagesChatTopics",
+    "GetDirectMessagesChatTopic",
+    "GetDirectMessagesChatTopicHistory",
+    "GetDirectMessagesChatTopicMessageByDate",
+    "DeleteDirectMessagesChatTopicHistory",
+    "DeleteDirectMessagesChatTopicMessagesByDate",
+    "SetDirectMessagesChatTopicIsMarkedAsUnread",
+    "SetDirectMessagesChatTopicDraftMessage",
+    "UnpinAllDirectMessagesChatTopicMessages",
+    "ReadAllDirectMessagesChatTopicReactions",
+    "GetDirectMessagesChatTopicRevenue",
+    "ToggleDirectMessagesChatTopicCanSendUnpaidMessages",
+    "LoadSavedMessagesTopics",
+    "GetSavedMessagesTopicHistory",
+    "GetSavedMessagesTopicMessageByDate",
+    "DeleteSavedMessagesTopicHistory",
+    "DeleteSavedMessagesTopicMessagesByDate",
+    "ToggleSavedMessagesTopicIsPinned",
+    "SetPinnedSavedMessagesTopics",
+    "GetGroupsInCommon",
+    "GetChatHistory",
+    "GetMessageThreadHistory",
+    "DeleteChatHistory",
+    "DeleteChat",
+    "SearchChatMessages",
+    "SearchMessages",
+    "SearchSecretMessages",
+    "SearchSavedMessages",
+    "SearchCallMessages",
+    "SearchOutgoingDocumentMessages",
+    "SearchPublicMessagesByTag",
+    "SearchPublicStoriesByTag",
+    "SearchPublicStoriesByLocation",
+    "SearchPublicStoriesByVenue",
+    "GetSearchedForTags",
+    "RemoveSearchedForTag",
+    "ClearSearchedForTags",
+    "DeleteAllCallMessages",
+    "SearchChatRecentLocationMessages",
+    "GetChatMessageByDate",
+    "GetChatSparseMessagePositions",
+    "GetChatMessageCalendar",
+    "GetChatMessageCount",
+    "GetChatMessagePosition",
+    "GetChatScheduledMessages",
+    "GetChatSponsoredMessages",
+    "ClickChatSponsoredMessage",
+    "ReportChatSponsoredMessage",
+    "GetSearchSponsoredChats",
+    "ViewSponsoredChat",
+    "OpenSponsoredChat",
+    "ReportSponsoredChat",
+    "GetVideoMessageAdvertisements",
+    "ViewVideoMessageAdvertisement",
+    "ClickVideoMessageAdvertisement",
+    "ReportVideoMessageAdvertisement",
+    "RemoveNotification",
+    "RemoveNotificationGroup",
+    "GetMessageLink",
+    "GetMessageEmbeddingCode",
+    "GetMessageLinkInfo",
+    "TranslateText",
+    "TranslateMessageText",
+    "RecognizeSpeech",
+    "RateSpeechRecognition",
+    "GetChatAvailableMessageSenders",
+    "SetChatMessageSender",
+    "SendMessage",
+    "SendMessageAlbum",
+    "SendBotStartMessage",
+    "SendInlineQueryResultMessage",
+    "ForwardMessages",
+    "SendQuickReplyShortcutMessages",
+    "ResendMessages",
+    "AddLocalMessage",
+    "DeleteMessages",
+    "DeleteChatMessagesBySender",
+    "DeleteChatMessagesByDate",
+    "EditMessageText",
+    "EditMessageLiveLocation",
+    "EditMessageChecklist",
+    "EditMessageMedia",
+    "EditMessageCaption",
+    "EditMessageReplyMarkup",
+    "EditInlineMessageText",
+    "EditInlineMessageLiveLocation",
+    "EditInlineMessageMedia",
+    "EditInlineMessageCaption",
+    "EditInlineMessageReplyMarkup",
+    "EditMessageSchedulingState",
+    "SetMessageFactCheck",
+    "SendBusinessMessage",
+    "SendBusinessMessageAlbum",
+    "EditBusinessMessageText",
+    "EditBusinessMessageLiveLocation",
+    "EditBusinessMessageChecklist",
+    "EditBusinessMessageMedia",
+    "EditBusinessMessageCaption",
+    "EditBusinessMessageReplyMarkup",
+    "StopBusinessPoll",
+    "SetBusinessMessageIsPinned",
+    "ReadBusinessMessage",
+    "DeleteBusinessMessages",
+    "EditBusinessStory",
+    "DeleteBusinessStory",
+    "SetBusinessAccountName",
+    "SetBusinessAccountBio",
+    "SetBusinessAccountProfilePhoto",
+    "SetBusinessAccountUsername",
+    "SetBusinessAccountGiftSettings",
+    "GetBusinessAccountStarAmount",
+    "TransferBusinessAccountStars",
+    "CheckQuickReplyShortcutName",
+    "LoadQuickReplyShortcuts",
+    "SetQuickReplyShortcutName",
+    "DeleteQuickReplyShortcut",
+    "ReorderQuickReplyShortcuts",
+    "LoadQuickReplyShortcutMessages",
+    "DeleteQuickReplyShortcutMessages",
+    "AddQuickReplyShortcutMessage",
+    "AddQuickReplyShortcutInlineQueryResultMessage",
+    "AddQuickReplyShortcutMessageAlbum",
+    "ReaddQuickReplyShortcutMessages",
+    "EditQuickReplyMessage",
+    "GetForumTopicDefaultIcons",
+    "CreateForumTopic",
+    "EditForumTopic",
+    "GetForumTopic",
+    "GetForumTopicLink",
+    "GetForumTopics",
+    "SetForumTopicNotificationSettings",
+    "ToggleForumTopicIsClosed",
+    "ToggleGeneralForumTopicIsHidden",
+    "ToggleForumTopicIsPinned",
+    "SetPinnedForumTopics",
+    "DeleteForumTopic",
+    "GetEmojiReaction",
+    "GetCustomEmojiReactionAnimations",
+    "GetMessageAvailableReactions",
+    "ClearRecentReactions",
+    "AddMessageReaction",
+    "RemoveMessageReaction",
+    "GetChatAvailablePaidMessageReactionSenders",
+    "AddPendingPaidMessageReaction",
+    "CommitPendingPaidMessageReactions",
+    "RemovePendingPaidMessageReactions",
+    "SetPaidMessageReactionType",
+    "SetMessageReactions",
+    "GetMessageAddedReactions",
+    "SetDefaultReactionType",
+    "GetSavedMessagesTags",
+    "SetSavedMessagesTagLabel",
+    "GetMessageEffect",
+    "SearchQuote",
+    "GetTextEntities",
+    "ParseTextEntities",
+    "ParseMarkdown",
+    "GetMarkdownText",
+    "GetCountryFlagEmoji",
+    "GetFileMimeType",
+    "GetFileExtension",
+    "CleanFileName",
+    "GetLanguagePackString",
+    "GetJsonValue",
+    "GetJsonString",
+    "GetThemeParametersJsonString",
+    "SetPollAnswer",
+    "GetPollVoters",
+    "StopPoll",
+    "AddChecklistTasks",
+    "MarkChecklistTasksAsDone",
+    "HideSuggestedAction",
+    "HideContactCloseBirthdays",
+    "GetBusinessConnection",
+    "GetLoginUrlInfo",
+    "GetLoginUrl",
+    "ShareUsersWithBot",
+    "ShareChatWithBot",
+    "GetInlineQueryResults",
+    "AnswerInlineQuery",
+    "SavePreparedInlineMessage",
+    "GetPreparedInlineMessage",
+    "GetGrossingWebAppBots",
+    "SearchWebApp",
+    "GetWebAppPlaceholder",
+    "GetWebAppLinkUrl",
+    "GetMainWebApp",
+    "GetWebAppUrl",
+    "SendWebAppData",
+    "OpenWebApp",
+    "CloseWebApp",
+    "AnswerWebAppQuery",
+    "CheckWebAppFileDownload",
+    "GetCallbackQueryAnswer",
+    "AnswerCallbackQuery",
+    "AnswerShippingQuery",
+    "AnswerPreCheckoutQuery",
+    "SetGameScore",
+    "SetInlineGameScore",
+    "GetGameHighScores",
+    "GetInlineGameHighScores",
+    "DeleteChatReplyMarkup",
+    "SendChatAction",
+    "OpenChat",
+    "CloseChat",
+    "ViewMessages",
+    "OpenMessageContent",
+    "ClickAnimatedEmojiMessage",
+    "GetInternalLink",
+    "GetInternalLinkType",
+    "GetExternalLinkInfo",
+    "GetExternalLink",
+    "ReadAllChatMentions",
+    "ReadAllMessageThreadMentions",
+    "ReadAllChatReactions",
+    "ReadAllMessageThreadReactions",
+    "CreatePrivateChat",
+    "CreateBasicGroupChat",
+    "CreateSupergroupChat",
+    "CreateSecretChat",
+    "CreateNewBasicGroupChat",
+    "CreateNewSupergroupChat",
+    "CreateNewSecretChat",
+    "UpgradeBasicGroupChatToSupergroupChat",
+    "GetChatListsToAddChat",
+    "AddChatToList",
+    "GetChatFolder",
+    "CreateChatFolder",
+    "EditChatFolder",
+    "DeleteChatFolder",
+    "GetChatFolderChatsToLeave",
+    "GetChatFolderChatCount",
+    "ReorderChatFolders",
+    "ToggleChatFolderTags",
+    "GetRecommendedChatFolders",
+    "GetChatFolderDefaultIconName",
+    "GetChatsForChatFolderInviteLink",
+    "CreateChatFolderInviteLink",
+    "GetChatFolderInviteLinks",
+    "EditChatFolderInviteLink",
+    "DeleteChatFolderInviteLink",
+    "CheckChatFolderInviteLink",
+    "AddChatFolderByInviteLink",
+    "GetChatFolderNewChats",
+    "ProcessChatFolderNewChats",
+    "GetArchiveChatListSettings",
+    "SetArchiveChatListSettings",
+    "SetChatTitle",
+    "SetChatPhoto",
+    "SetChatAccentColor",
+    "SetChatProfileAccentColor",
+    "SetChatMessageAutoDeleteTime",
+    "SetChatEmojiStatus",
+    "SetChatPermissions",
+    "SetChatBackground",
+    "DeleteChatBackground",
+    "SetChatTheme",
+    "SetChatDraftMessage",
+    "SetChatNotificationSettings",
+    "ToggleChatHasProtectedContent",
+    "ToggleChatViewAsTopics",
+    "ToggleChatIsTranslatable",
+    "ToggleChatIsMarkedAsUnread",
+    "ToggleChatDefaultDisableNotification",
+    "SetChatAvailableReactions",
+    "SetChatClientData",
+    "SetChatDescription",
+    "SetChatDiscussionGroup",
+    "SetChatDirectMessagesGroup",
+    "SetChatLocation",
+    "SetChatSlowModeDelay",
+    "PinChatMessage",
+    "UnpinChatMessage",
+    "UnpinAllChatMessages",
+    "UnpinAllMessageThreadMessages",
+    "JoinChat",
+    "LeaveChat",
+    "AddChatMember",
+    "AddChatMembers",
+    "SetChatMemberStatus",
+    "BanChatMember",
+    "CanTransferOwnership",
+    "TransferChatOwnership",
+    "GetChatMember",
+    "SearchChatMembers",
+    "GetChatAdministrators",
+    "ClearAllDraftMessages",
+    "GetSavedNotificationSound",
+    "GetSavedNotificationSounds",
+    "AddSavedNotificationSound",
+    "RemoveSavedNotificationSound",
+    "GetChatNotificationSettingsExceptions",
+    "GetScopeNotificationSettings",
+    "SetScopeNotificationSettings",
+    "SetReactionNotificationSettings",
+    "ResetAllNotificationSettings",
+    "ToggleChatIsPinned",
+    "SetPinnedChats",
+    "ReadChatList",
+    "GetCurrentWeather",
+    "GetStory",
+    "GetChatsToPostStories",
+    "CanPostStory",
+    "PostStory",
+    "EditStory",
+    "EditStoryCover",
+    "SetStoryPrivacySettings",
+    "ToggleStoryIsPostedToChatPage",
+    "DeleteStory",
+    "GetStoryNotificationSettingsExceptions",
+    "LoadActiveStories",
+    "SetChatActiveStoriesList",
+    "GetChatActiveStories",
+    "GetChatPostedToChatPageStories",
+    "GetChatArchivedStories",
+    "SetChatPinnedStories",
+    "OpenStory",
+    "CloseStory",
+    "GetStoryAvailableReactions",
+    "SetStoryReaction",
+    "GetStoryInteractions",
+    "GetChatStoryInteractions",
+    "ReportStory",
+    "ActivateStoryStealthMode",
+    "GetStoryPublicForwards",
+    "GetChatBoostLevelFeatures",
+    "GetChatBoostFeatures",
+    "GetAvailableChatBoostSlots",
+    "GetChatBoostStatus",
+    "BoostChat",
+    "GetChatBoostLink",
+    "GetChatBoostLinkInfo",
+    "GetChatBoosts",
+    "GetUserChatBoosts",
+    "GetAttachmentMenuBot",
+    "ToggleBotIsAddedToAttachmentMenu",
+    "GetThemedEmojiStatuses",
+    "GetRecentEmojiStatuses",
+    "GetUpgradedGiftEmojiStatuses",
+    "GetDefaultEmojiStatuses",
+    "ClearRecentEmojiStatuses",
+    "GetThemedChatEmojiStatuses",
+    "GetDefaultChatEmojiStatuses",
+    "GetDisallowedChatEmojiStatuses",
+    "DownloadFile",
+    "GetFileDownloadedPrefixSize",
+    "CancelDownloadFile",
+    "GetSuggestedFileName",
+    "PreliminaryUploadFile",
+    "CancelPreliminaryUploadFile",
+    "WriteGeneratedFilePart",
+    "SetFileGenerationProgress",
+    "FinishFileGeneration",
+    "ReadFilePart",
+    "DeleteFile",
+    "AddFileToDownloads",
+    "ToggleDownloadIsPaused",
+    "ToggleAllDownloadsArePaused",
+    "RemoveFileFromDownloads",
+    "RemoveAllFilesFromDownloads",
+    "SearchFileDownloads",
+    "SetApplicationVerificationToken",
+    "GetMessageFileType",
+    "GetMessageImportConfirmationText",
+    "ImportMessages",
+    "ReplacePrimaryChatInviteLink",
+    "CreateChatInviteLink",
+    "CreateChatSubscriptionInviteLink",
+    "EditChatInviteLink",
+    "EditChatSubscriptionInviteLink",
+    "GetChatInviteLink",
+    "GetChatInviteLinkCounts",
+    "GetChatInviteLinks",
+    "GetChatInviteLinkMembers",
+    "RevokeChatInviteLink",
+    "DeleteRevokedChatInviteLink",
+    "DeleteAllRevokedChatInviteLinks",
+    "CheckChatInviteLink",
+    "JoinChatByInviteLink",
+    "GetChatJoinRequests",
+    "ProcessChatJoinRequest",
+    "ProcessChatJoinRequests",
+    "ApproveSuggestedPost",
+    "DeclineSuggestedPost",
+    "AddOffer",
+    "CreateCall",
+    "AcceptCall",
+    "SendCallSignalingData",
+    "DiscardCall",
+    "SendCallRating",
+    "SendCallDebugInformation",
+    "SendCallLog",
+    "GetVideoChatAvailableParticipants",
+    "SetVideoChatDefaultParticipant",
+    "CreateVideoChat",
+    "CreateGroupCall",
+    "GetVideoChatRtmpUrl",
+    "ReplaceVideoChatRtmpUrl",
+    "GetGroupCall",
+    "StartScheduledVideoChat",
+    "ToggleVideoChatEnabledStartNotification",
+    "JoinGroupCall",
+    "JoinVideoChat",
+    "StartGroupCallScreenSharing",
+    "ToggleGroupCallScreenSharingIsPaused",
+    "EndGroupCallScreenSharing",
+    "SetVideoChatTitle",
+    "ToggleVideoChatMuteNewParticipants",
+    "InviteGroupCallParticipant",
+    "DeclineGroupCallInvitation",
+    "BanGroupCallParticipants",
+    "InviteVideoChatParticipants",
+    "GetVideoChatInviteLink",
+    "RevokeGroupCallInviteLink",
+    "StartGroupCallRecording",
+    "EndGroupCallRecording",
+    "ToggleGroupCallIsMyVideoPaused",
+    "ToggleGroupCallIsMyVideoEnabled",
+    "SetGroupCallParticipantIsSpeaking",
+    "ToggleGroupCallParticipantIsMuted",
+    "SetGroupCallParticipantVolumeLevel",
+    "ToggleGroupCallParticipantIsHandRaised",
+    "GetGroupCallParticipants",
+    "LoadGroupCallParticipants",
+    "LeaveGroupCall",
+    "EndGroupCall",
+    "GetVideoChatStreams",
+    "GetVideoChatStreamSegment",
+    "EncryptGroupCallData",
+    "DecryptGroupCallData",
+    "SetMessageSenderBlockList",
+    "BlockMessageSenderFromReplies",
+    "GetBlockedMessageSenders",
+    "AddContact",
+    "ImportContacts",
+    "GetContacts",
+    "SearchContacts",
+    "RemoveContacts",
+    "GetImportedContactCount",
+    "ChangeImportedContacts",
+    "ClearImportedContacts",
+    "SetCloseFriends",
+    "GetCloseFriends",
+    "SetUserPersonalProfilePhoto",
+    "SuggestUserProfilePhoto",
+    "ToggleBotCanManageEmojiStatus",
+    "SetUserEmojiStatus",
+    "SearchUserByPhoneNumber",
+    "SharePhoneNumber",
+    "GetUserProfilePhotos",
+    "GetStickerOutline",
+    "GetStickers",
+    "GetAllStickerEmojis",
+    "SearchStickers",
+    "GetGreetingStickers",
+    "GetPremiumStickers",
+    "GetInstalledStickerSets",
+    "GetArchivedStickerSets",
+    "GetTrendingStickerSets",
+    "GetAttachedStickerSets",
+    "GetStickerSet",
+    "GetStickerSetName",
+    "SearchStickerSet",
+    "SearchInstalledStickerSets",
+    "SearchStickerSets",
+    "ChangeStickerSet",
+    "ViewTrendingStickerSets",
+    "ReorderInstalledStickerSets",
+    "GetRecentStickers",
+    "AddRecentSticker",
+    "RemoveRecentSticker",
+    "ClearRecentStickers",
+    "GetFavoriteStickers",
+    "AddFavoriteSticker",
+    "RemoveFavoriteSticker",
+    "GetStickerEmojis",
+    "SearchEmojis",
+    "GetKeywordEmojis",
+    "GetEmojiCategories",
+    "GetAnimatedEmoji",
+    "GetEmojiSuggestionsUrl",
+    "GetCustomEmojiStickers",
+    "GetDefaultChatPhotoCustomEmojiStickers",
+    "GetDefaultProfilePhotoCustomEmojiStickers",
+    "GetDefaultBackgroundCustomEmojiStickers",
+    "GetSavedAnimations",
+    "AddSavedAnimation",
+    "RemoveSavedAnimation",
+    "GetRecentInlineBots",
+    "GetOwnedBots",
+    "SearchHashtags",
+    "RemoveRecentHashtag",
+    "GetLinkPreview",
+    "GetWebPageInstantView",
+    "SetProfilePhoto",
+    "DeleteProfilePhoto",
+    "SetAccentColor",
+    "SetProfileAccentColor",
+    "SetName",
+    "SetBio",
+    "SetUsername",
+    "ToggleUsernameIsActive",
+    "ReorderActiveUsernames",
+    "SetBirthdate",
+    "SetPersonalChat",
+    "SetEmojiStatus",
+    "ToggleHasSponsoredMessagesEnabled",
+    "SetBusinessLocation",
+    "SetBusinessOpeningHours",
+    "SetBusinessGreetingMessageSettings",
+    "SetBusinessAwayMessageSettings",
+    "SetBusinessStartPage",
+    "SendPhoneNumberCode",
+    "SendPhoneNumberFirebaseSms",
+    "ReportPhoneNumberCodeMissing",
+    "ResendPhoneNumberCode",
+    "CheckPhoneNumberCode",
+    "GetBusinessConnectedBot",
+    "SetBusinessConnectedBot",
+    "DeleteBusinessConnectedBot",
+    "ToggleBusinessConnectedBotChatIsPaused",
+    "RemoveBusinessConnectedBotFromChat",
+    "GetBusinessChatLinks",
+    "CreateBusinessChatLink",
+    "EditBusinessChatLink",
+    "DeleteBusinessChatLink",
+    "GetBusinessChatLinkInfo",
+    "GetUserLink",
+    "SearchUserByToken",
+    "SetCommands",
+    "DeleteCommands",
+    "GetCommands",
+    "SetMenuButton",
+    "GetMenuButton",
+    "SetDefaultGroupAdministratorRights",
+    "SetDefaultChannelAdministratorRights",
+    "CanBotSendMessages",
+    "AllowBotToSendMessages",
+    "SendWebAppCustomRequest",
+    "GetBotMediaPreviews",
+    "GetBotMediaPreviewInfo",
+    "AddBotMediaPreview",
+    "EditBotMediaPreview",
+    "ReorderBotMediaPreviews",
+    "DeleteBotMediaPreviews",
+    "SetBotName",
+    "GetBotName",
+    "SetBotProfilePhoto",
+    "ToggleBotUsernameIsActive",
+    "ReorderBotActiveUsernames",
+    "SetBotInfoDescription",
+    "GetBotInfoDescription",
+    "SetBotInfoShortDescription",
+    "GetBotInfoShortDescription",
+    "SetMessageSenderBotVerification",
+    "RemoveMessageSenderBotVerification",
+    "GetActiveSessions",
+    "TerminateSession",
+    "TerminateAllOtherSessions",
+    "ConfirmSession",
+    "ToggleSessionCanAcceptCalls",
+    "ToggleSessionCanAcceptSecretChats",
+    "SetInactiveSessionTtl",
+    "GetConnectedWebsites",
+    "DisconnectWebsite",
+    "DisconnectAllWebsites",
+    "SetSupergroupUsername",
+    "ToggleSupergroupUsernameIsActive",
+    "DisableAllSupergroupUsernames",
+    "ReorderSupergroupActiveUsernames",
+    "SetSupergroupStickerSet",
+    "SetSupergroupCustomEmojiStickerSet",
+    "SetSupergroupUnrestrictBoostCount",
+    "ToggleSupergroupSignMessages",
+    "ToggleSupergroupJoinToSendMessages",
+    "ToggleSupergroupJoinByRequest",
+    "ToggleSupergroupIsAllHistoryAvailable",
+    "ToggleSupergroupCanHaveSponsoredMessages",
+    "ToggleSupergroupHasAutomaticTranslation",
+    "ToggleSupergroupHasHiddenMembers",
+    "ToggleSupergroupHasAggressiveAntiSpamEnabled",
+    "ToggleSupergroupIsForum",
+    "ToggleSupergroupIsBroadcastGroup",
+    "ReportSupergroupSpam",
+    "ReportSupergroupAntiSpamFalsePositive",
+    "GetSupergroupMembers",
+    "CloseSecretChat",
+    "GetChatEventLog",
+    "GetTimeZones",
+    "GetPaymentForm",
+    "ValidateOrderInfo",
+    "SendPaymentForm",
+    "GetPaymentReceipt",
+    "GetSavedOrderInfo",
+    "DeleteSavedOrderInfo",
+    "DeleteSavedCredentials",
+    "SetGiftSettings",
+    "GetAvailableGifts",
+    "SendGift",
+    "SellGift",
+    "ToggleGiftIsSaved",
+    "SetPinnedGifts",
+    "ToggleChatGiftNotifications",
+    "GetGiftUpgradePreview",
+    "UpgradeGift",
+    "TransferGift",
+    "SendResoldGift",
+    "GetReceivedGifts",
+    "GetReceivedGift",
+    "GetUpgradedGift",
+    "GetUpgradedGiftWithdrawalUrl",
+    "SetGiftResalePrice",
+    "SearchGiftsForResale",
+    "CreateInvoiceLink",
+    "RefundStarPayment",
+    "GetSupportUser",
+    "GetBackgroundUrl",
+    "SearchBackground",
+    "SetDefaultBackground",
+    "DeleteDefaultBackground",
+    "GetInstalledBackgrounds",
+    "RemoveInstalledBackground",
+    "ResetInstalledBackgrounds",
+    "GetLocalizationTargetInfo",
+    "GetLanguagePackInfo",
+    "GetLanguagePackStrings",
+    "SynchronizeLanguagePack",
+    "AddCustomServerLanguagePack",
+    "SetCustomLanguagePack",
+    "EditCustomLanguagePackInfo",
+    "SetCustomLanguagePackString",
+    "DeleteLanguagePack",
+    "RegisterDevice",
+    "ProcessPushNotification",
+    "GetPushReceiverId",
+    "GetRecentlyVisitedTMeUrls",
+    "SetUserPrivacySettingRules",
+    "GetUserPrivacySettingRules",
+    "SetReadDatePrivacySettings",
+    "GetReadDatePrivacySettings",
+    "SetNewChatPrivacySettings",
+    "GetNewChatPrivacySettings",
+    "GetPaidMessageRevenue",
+    "AllowUnpaidMessagesFromUser",
+    "SetChatPaidMessageStarCount",
+    "CanSendMessageToUser",
+    "GetOption",
+    "SetOption",
+    "SetAccountTtl",
+    "GetAccountTtl",
+    "DeleteAccount",
+    "SetDefaultMessageAutoDeleteTime",
+    "GetDefaultMessageAutoDeleteTime",
+    "RemoveChatActionBar",
+    "ReportChat",
+    "ReportChatPhoto",
+    "ReportMessageReactions",
+    "GetChatRevenueStatistics",
+    "GetChatRevenueWithdrawalUrl",
+    "GetChatRevenueTransactions",
+    "GetTonTransactions",
+    "GetStarRevenueStatistics",
+    "GetStarWithdrawalUrl",
+    "GetStarAdAccountUrl",
+    "GetChatStatistics",
+    "GetMessageStatistics",
+    "GetMessagePublicForwards",
+    "GetStoryStatistics",
+    "GetStatisticalGraph",
+    "GetStorageStatistics",
+    "GetStorageStatisticsFast",
+    "GetDatabaseStatistics",
+    "OptimizeStorage",
+    "SetNetworkType",
+    "GetNetworkStatistics",
+    "AddNetworkStatistics",
+    "ResetNetworkStatistics",
+    "GetAutoDownloadSettingsPresets",
+    "SetAutoDownloadSettings",
+    "GetAutosaveSettings",
+    "SetAutosaveSettings",
+    "ClearAutosaveSettingsExceptions",
+    "GetBankCardInfo",
+    "GetPassportElement",
+    "GetAllPassportElements",
+    "SetPassportElement",
+    "DeletePassportElement",
+    "SetPassportElementErrors",
+    "GetPreferredCountryLanguage",
+    "SendEmailAddressVerificationCode",
+    "ResendEmailAddressVerificationCode",
+    "CheckEmailAddressVerificationCode",
+    "GetPassportAuthorizationForm",
+    "GetPassportAuthorizationFormAvailableElements",
+    "SendPassportAuthorizationForm",
+    "SetBotUpdatesStatus",
+    "UploadStickerFile",
+    "GetSuggestedStickerSetName",
+    "CheckStickerSetName",
+    "CreateNewStickerSet",
+    "AddStickerToSet",
+    "ReplaceStickerInSet",
+    "SetStickerSetThumbnail",
+    "SetCustomEmojiStickerSetThumbnail",
+    "SetStickerSetTitle",
+    "DeleteStickerSet",
+    "SetStickerPositionInSet",
+    "RemoveStickerFromSet",
+    "SetStickerEmojis",
+    "SetStickerKeywords",
+    "SetStickerMaskPosition",
+    "GetOwnedStickerSets",
+    "GetMapThumbnailFile",
+    "GetPremiumLimit",
+    "GetPremiumFeatures",
+    "GetPremiumStickerExamples",
+    "GetPremiumInfoSticker",
+    "ViewPremiumFeature",
+    "ClickPremiumSubscriptionButton",
+    "GetPremiumState",
+    "GetPremiumGiftPaymentOptions",
+    "GetPremiumGiveawayPaymentOptions",
+    "CheckPremiumGiftCode",
+    "ApplyPremiumGiftCode",
+    "GiftPremiumWithStars",
+    "LaunchPrepaidGiveaway",
+    "GetGiveawayInfo",
+    "GetStarPaymentOptions",
+    "GetStarGiftPaymentOptions",
+    "GetStarGiveawayPaymentOptions",
+    "GetStarTransactions",
+    "GetStarSubscriptions",
+    "CanPurchaseFromStore",
+    "AssignStoreTransaction",
+    "EditStarSubscription",
+    "EditUserStarSubscription",
+    "ReuseStarSubscription",
+    "SetChatAffiliateProgram",
+    "SearchChatAffiliateProgram",
+    "SearchAffiliatePrograms",
+    "ConnectAffiliateProgram",
+    "DisconnectAffiliateProgram",
+    "GetConnectedAffiliateProgram",
+    "GetConnectedAffiliatePrograms",
+    "GetBusinessFeatures",
+    "AcceptTermsOfService",
+    "SearchStringsByPrefix",
+    "SendCustomRequest",
+    "AnswerCustomQuery",
+    "SetAlarm",
+    "GetCountries",
+    "GetCountryCode",
+    "GetPhoneNumberInfo",
+    "GetPhoneNumberInfoSync",
+    "GetCollectibleItemInfo",
+    "GetDeepLinkInfo",
+    "GetApplicationConfig",
+    "SaveApplicationLogEvent",
+    "GetApplicationDownloadLink",
+    "AddProxy",
+    "EditProxy",
+    "EnableProxy",
+    "DisableProxy",
+    "RemoveProxy",
+    "GetProxies",
+    "GetProxyLink",
+    "PingProxy",
+    "SetLogStream",
+    "GetLogStream",
+    "SetLogVerbosityLevel",
+    "GetLogVerbosityLevel",
+    "GetLogTags",
+    "SetLogTagVerbosityLevel",
+    "GetLogTagVerbosityLevel",
+    "AddLogMessage",
+    "GetUserSupportInfo",
+    "SetUserSupportInfo",
+    "GetSupportName",
+    "TestCallEmpty",
+    "TestCallString",
+    "TestCallBytes",
+    "TestCallVectorInt",
+    "TestCallVectorIntObject",
+    "TestCallVectorString",
+    "TestCallVectorStringObject",
+    "TestSquareInt",
+    "TestNetwork",
+    "TestProxy",
+    "TestGetDifference",
+    "TestUseUpdate",
+    "TestReturnError",
+]
+
+
+def __getattr__(name: str):
+    module_name = _MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = globals()[name] = getattr(module, name)
+    return value
+
+
+def __dir__():
+    return __all__
@@ -0,0 +1,1194 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_12 import TextEntityType
+
+@dataclass(slots=True)
+class Error(ObjectBase):
+    """
+    An object of this type can be returned on every function call, in case of an error
+
+    :param code: Error code; subject to future changes. If the error code is 406, the error message must not be processed in any way and must not be displayed to the user
+    :param message: Error message; subject to future changes
+    """
+
+    _type: "str" = field(default="error", init=False, repr=False)
+    code: "int" = 0
+    message: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "code": self.code,
+            "message": self.message,
+        }
+
+@dataclass(slots=True)
+class Ok(ObjectBase):
+    """
+    An object of this type is returned on a successful function call for certain functions
+
+    """
+
+    _type: "str" = field(default="ok", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class AuthenticationCodeType(ObjectBase):
+    """
+    Provides information about the method by which an authentication code is delivered to the user
+
+    """
+
+    _type: "str" = field(default="AuthenticationCodeType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class AuthenticationCodeTypeTelegramMessage(AuthenticationCodeType):
+    """
+    A digit-only authentication code is delivered via a private Telegram message, which can be viewed from another active session
+
+    :param length: Length of the code
+    """
+
+    _type: "str" = field(default="authenticationCodeTypeTelegramMessage", init=False, repr=False)
+    length: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "length": self.length,
+        }
+
+@dataclass(slots=True)
+class AuthenticationCodeTypeSms(AuthenticationCodeType):
+    """
+    A digit-only authentication code is delivered via an SMS message to the specified phone number; non-official applications may not receive this type of code
+
+    :param length: Length of the code
+    """
+
+    _type: "str" = field(default="authenticationCodeTypeSms", init=False, repr=False)
+    length: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "length": self.length,
+        }
+
+@dataclass(slots=True)
+class AuthenticationCodeTypeSmsWord(AuthenticationCodeType):
+    """
+    An authentication code is a word delivered via an SMS message to the specified phone number; non-official applications may not receive this type of code
+
+    :param first_letter: The first letters of the word if known
+    """
+
+    _type: "str" = field(default="authenticationCodeTypeSmsWord", init=False, repr=False)
+    first_letter: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "first_letter": self.first_letter,
+        }
+
+@dataclass(slots=True)
+class AuthenticationCodeTypeSmsPhrase(AuthenticationCodeType):
+    """
+    An authentication code is a phrase from multiple words delivered via an SMS message to the specified phone number; non-official applications may not receive this type of code
+
+    :param first_word: The first word of the phrase if known
+    """
+
+    _type: "str" = field(default="authenticationCodeTypeSmsPhrase", init=False, repr=False)
+    first_word: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "first_word": self.first_word,
+        }
+
+@dataclass(slots=True)
+class AuthenticationCodeTypeCall(AuthenticationCodeType):
+    """
+    A digit-only authentication code is delivered via a phone call to the specified phone number
+
+    :param length: Length of the code
+    """
+
+    _type: "str" = field(default="authenticationCodeTypeCall", init=False, repr=False)
+    length: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "length": self.length,
+        }
+
+@dataclass(slots=True)
+class AuthenticationCodeTypeFlashCall(AuthenticationCodeType):
+    """
+    An authentication code is delivered by an immediately canceled call to the specified phone number. The phone number that calls is the code that must be entered automatically
+
+    :param pattern: Pattern of the phone number from which the call will be made
+    """
+
+    _type: "str" = field(default="authenticationCodeTypeFlashCall", init=False, repr=False)
+    pattern: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "pattern": self.pattern,
+        }
+
+@dataclass(slots=True)
+class AuthenticationCodeTypeMissedCall(AuthenticationCodeType):
+    """
+    An authentication code is delivered by an immediately canceled call to the specified phone number. The last digits of the phone number that calls are the code that must be entered manually by the user
+
+    :param phone_number_prefix: Prefix of the phone number from which the call will be made
+    :param length: Number of digits in the code, excluding the prefix
+    """
+
+    _type: "str" = field(default="authenticationCodeTypeMissedCall", init=False, repr=False)
+    phone_number_prefix: "str" = ""
+    length: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "phone_number_prefix": self.phone_number_prefix,
+            "length": self.length,
+        }
+
+@dataclass(slots=True)
+class AuthenticationCodeTypeFragment(AuthenticationCodeType):
+    """
+    A digit-only authentication code is delivered to https://fragment.com. The user must be logged in there via a wallet owning the phone number's NFT
+
+    :param url: URL to open to receive the code
+    :param length: Length of the code
+    """
+
+    _type: "str" = field(default="authenticationCodeTypeFragment", init=False, repr=False)
+    url: "str" = ""
+    length: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+            "length": self.length,
+        }
+
+@dataclass(slots=True)
+class AuthenticationCodeTypeFirebaseAndroid(AuthenticationCodeType):
+    """
+    A digit-only authentication code is delivered via Firebase Authentication to the official Android application
+
+    :param device_verification_parameters: Parameters to be used for device verification
+    :param length: Length of the code
+    """
+
+    _type: "str" = field(default="authenticationCodeTypeFirebaseAndroid", init=False, repr=False)
+    device_verification_parameters: "FirebaseDeviceVerificationParameters | None" = None
+    length: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "device_verification_parameters": self.device_verification_parameters._to_json_dict() if self.device_verification_parameters is not None else None,
+            "length": self.length,
+        }
+
+@dataclass(slots=True)
+class AuthenticationCodeTypeFirebaseIos(AuthenticationCodeType):
+    """
+    A digit-only authentication code is delivered via Firebase Authentication to the official iOS application
+
+    :param receipt: Receipt of successful application token validation to compare with receipt from push notification
+    :param push_timeout: Time after the next authentication method is expected to be used if verification push notification isn't received, in seconds
+    :param length: Length of the code
+    """
+
+    _type: "str" = field(default="authenticationCodeTypeFirebaseIos", init=False, repr=False)
+    receipt: "str" = ""
+    push_timeout: "int" = 0
+    length: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "receipt": self.receipt,
+            "push_timeout": self.push_timeout,
+            "length": self.length,
+        }
+
+@dataclass(slots=True)
+class AuthenticationCodeInfo(ObjectBase):
+    """
+    Information about the authentication code that was sent
+
+    :param phone_number: A phone number that is being authenticated
+    :param type: The way the code was sent to the user
+    :param next_type: The way the next code will be sent to the user; may be null
+    :param timeout: Timeout before the code can be re-sent, in seconds
+    """
+
+    _type: "str" = field(default="authenticationCodeInfo", init=False, repr=False)
+    phone_number: "str" = ""
+    type: "AuthenticationCodeType | None" = None
+    next_type: "AuthenticationCodeType | None" = None
+    timeout: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "phone_number": self.phone_number,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "next_type": self.next_type._to_json_dict() if self.next_type is not None else None,
+            "timeout": self.timeout,
+        }
+
+@dataclass(slots=True)
+class EmailAddressAuthenticationCodeInfo(ObjectBase):
+    """
+    Information about the email address authentication code that was sent
+
+    :param email_address_pattern: Pattern of the email address to which an authentication code was sent
+    :param length: Length of the code; 0 if unknown
+    """
+
+    _type: "str" = field(default="emailAddressAuthenticationCodeInfo", init=False, repr=False)
+    email_address_pattern: "str" = ""
+    length: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "email_address_pattern": self.email_address_pattern,
+            "length": self.length,
+        }
+
+@dataclass(slots=True)
+class EmailAddressAuthentication(ObjectBase):
+    """
+    Contains authentication data for an email address
+
+    """
+
+    _type: "str" = field(default="EmailAddressAuthentication", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class EmailAddressAuthenticationCode(EmailAddressAuthentication):
+    """
+    An authentication code delivered to a user's email address
+
+    :param code: The code
+    """
+
+    _type: "str" = field(default="emailAddressAuthenticationCode", init=False, repr=False)
+    code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "code": self.code,
+        }
+
+@dataclass(slots=True)
+class EmailAddressAuthenticationAppleId(EmailAddressAuthentication):
+    """
+    An authentication token received through Apple ID
+
+    :param token: The token
+    """
+
+    _type: "str" = field(default="emailAddressAuthenticationAppleId", init=False, repr=False)
+    token: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "token": self.token,
+        }
+
+@dataclass(slots=True)
+class EmailAddressAuthenticationGoogleId(EmailAddressAuthentication):
+    """
+    An authentication token received through Google ID
+
+    :param token: The token
+    """
+
+    _type: "str" = field(default="emailAddressAuthenticationGoogleId", init=False, repr=False)
+    token: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "token": self.token,
+        }
+
+@dataclass(slots=True)
+class EmailAddressResetState(ObjectBase):
+    """
+    Describes reset state of an email address
+
+    """
+
+    _type: "str" = field(default="EmailAddressResetState", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class EmailAddressResetStateAvailable(EmailAddressResetState):
+    """
+    Email address can be reset after the given period. Call resetAuthenticationEmailAddress to reset it and allow the user to authorize with a code sent to the user's phone number
+
+    :param wait_period: Time required to wait before the email address can be reset; 0 if the user is subscribed to Telegram Premium
+    """
+
+    _type: "str" = field(default="emailAddressResetStateAvailable", init=False, repr=False)
+    wait_period: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "wait_period": self.wait_period,
+        }
+
+@dataclass(slots=True)
+class EmailAddressResetStatePending(EmailAddressResetState):
+    """
+    Email address reset has already been requested. Call resetAuthenticationEmailAddress to check whether immediate reset is possible
+
+    :param reset_in: Left time before the email address will be reset, in seconds. updateAuthorizationState is not sent when this field changes
+    """
+
+    _type: "str" = field(default="emailAddressResetStatePending", init=False, repr=False)
+    reset_in: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "reset_in": self.reset_in,
+        }
+
+@dataclass(slots=True)
+class TextEntity(ObjectBase):
+    """
+    Represents a part of the text that needs to be formatted in some unusual way
+
+    :param offset: Offset of the entity, in UTF-16 code units
+    :param length: Length of the entity, in UTF-16 code units
+    :param type: Type of the entity
+    """
+
+    _type: "str" = field(default="textEntity", init=False, repr=False)
+    offset: "int" = 0
+    length: "int" = 0
+    type: "TextEntityType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "offset": self.offset,
+            "length": self.length,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+@dataclass(slots=True)
+class TextEntities(ObjectBase):
+    """
+    Contains a list of text entities
+
+    :param entities: List of text entities
+    """
+
+    _type: "str" = field(default="textEntities", init=False, repr=False)
+    entities: "list[TextEntity] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "entities": _list_to_json(self.entities),
+        }
+
+@dataclass(slots=True)
+class FormattedText(ObjectBase):
+    """
+    A text with some entities
+
+    :param text: The text
+    :param entities: Entities contained in the text. Entities can be nested, but must not mutually intersect with each other. Pre, Code and PreCode entities can't contain other entities. BlockQuote entities can't contain other BlockQuote entities. Bold, Italic, Underline, Strikethrough, and Spoiler entities can contain and can be part of any other entities. All other entities can't contain each other
+    """
+
+    _type: "str" = field(default="formattedText", init=False, repr=False)
+    text: "str" = ""
+    entities: "list[TextEntity] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text,
+            "entities": _list_to_json(self.entities),
+        }
+
+@dataclass(slots=True)
+class TermsOfService(ObjectBase):
+    """
+    Contains Telegram terms of service
+
+    :param text: Text of the terms of service
+    :param min_user_age: The minimum age of a user to be able to accept the terms; 0 if age isn't restricted
+    :param show_popup: True, if a blocking popup with terms of service must be shown to the user
+    """
+
+    _type: "str" = field(default="termsOfService", init=False, repr=False)
+    text: "FormattedText | None" = None
+    min_user_age: "int" = 0
+    show_popup: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "min_user_age": self.min_user_age,
+            "show_popup": self.show_popup,
+        }
+
+@dataclass(slots=True)
+class AuthorizationState(ObjectBase):
+    """
+    Represents the current authorization state of the TDLib client
+
+    """
+
+    _type: "str" = field(default="AuthorizationState", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class AuthorizationStateWaitTdlibParameters(AuthorizationState):
+    """
+    Initialization parameters are needed. Call setTdlibParameters to provide them
+
+    """
+
+    _type: "str" = field(default="authorizationStateWaitTdlibParameters", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class AuthorizationStateWaitPhoneNumber(AuthorizationState):
+    """
+    TDLib needs the user's phone number to authorize. Call setAuthenticationPhoneNumber to provide the phone number, or use requestQrCodeAuthentication or checkAuthenticationBotToken for other authentication options
+
+    """
+
+    _type: "str" = field(default="authorizationStateWaitPhoneNumber", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class AuthorizationStateWaitPremiumPurchase(AuthorizationState):
+    """
+    The user must buy Telegram Premium as an in-store purchase to log in. Call checkAuthenticationPremiumPurchase and then setAuthenticationPremiumPurchaseTransaction
+
+    :param store_product_id: Identifier of the store product that must be bought
+    """
+
+    _type: "str" = field(default="authorizationStateWaitPremiumPurchase", init=False, repr=False)
+    store_product_id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "store_product_id": self.store_product_id,
+        }
+
+@dataclass(slots=True)
+class AuthorizationStateWaitEmailAddress(AuthorizationState):
+    """
+    TDLib needs the user's email address to authorize. Call setAuthenticationEmailAddress to provide the email address, or directly call checkAuthenticationEmailCode with Apple ID/Google ID token if allowed
+
+    :param allow_apple_id: True, if authorization through Apple ID is allowed
+    :param allow_google_id: True, if authorization through Google ID is allowed
+    """
+
+    _type: "str" = field(default="authorizationStateWaitEmailAddress", init=False, repr=False)
+    allow_apple_id: "bool" = False
+    allow_google_id: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "allow_apple_id": self.allow_apple_id,
+            "allow_google_id": self.allow_google_id,
+        }
+
+@dataclass(slots=True)
+class AuthorizationStateWaitEmailCode(AuthorizationState):
+    """
+    TDLib needs the user's authentication code sent to an email address to authorize. Call checkAuthenticationEmailCode to provide the code
+
+    :param allow_apple_id: True, if authorization through Apple ID is allowed
+    :param allow_google_id: True, if authorization through Google ID is allowed
+    :param code_info: Information about the sent authentication code
+    :param email_address_reset_state: Reset state of the email address; may be null if the email address can't be reset
+    """
+
+    _type: "str" = field(default="authorizationStateWaitEmailCode", init=False, repr=False)
+    allow_apple_id: "bool" = False
+    allow_google_id: "bool" = False
+    code_info: "EmailAddressAuthenticationCodeInfo | None" = None
+    email_address_reset_state: "EmailAddressResetState | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "allow_apple_id": self.allow_apple_id,
+            "allow_google_id": self.allow_google_id,
+            "code_info": self.code_info._to_json_dict() if self.code_info is not None else None,
+            "email_address_reset_state": self.email_address_reset_state._to_json_dict() if self.email_address_reset_state is not None else None,
+        }
+
+@dataclass(slots=True)
+class AuthorizationStateWaitCode(AuthorizationState):
+    """
+    TDLib needs the user's authentication code to authorize. Call checkAuthenticationCode to check the code
+
+    :param code_info: Information about the authorization code that was sent
+    """
+
+    _type: "str" = field(default="authorizationStateWaitCode", init=False, repr=False)
+    code_info: "AuthenticationCodeInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "code_info": self.code_info._to_json_dict() if self.code_info is not None else None,
+        }
+
+@dataclass(slots=True)
+class AuthorizationStateWaitOtherDeviceConfirmation(AuthorizationState):
+    """
+    The user needs to confirm authorization on another logged in device by scanning a QR code with the provided link
+
+    :param link: A tg:// URL for the QR code. The link will be updated frequently
+    """
+
+    _type: "str" = field(default="authorizationStateWaitOtherDeviceConfirmation", init=False, repr=False)
+    link: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "link": self.link,
+        }
+
+@dataclass(slots=True)
+class AuthorizationStateWaitRegistration(AuthorizationState):
+    """
+    The user is unregistered and need to accept terms of service and enter their first name and last name to finish registration. Call registerUser to accept the terms of service and provide the data
+
+    :param terms_of_service: Telegram terms of service
+    """
+
+    _type: "str" = field(default="authorizationStateWaitRegistration", init=False, repr=False)
+    terms_of_service: "TermsOfService | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "terms_of_service": self.terms_of_service._to_json_dict() if self.terms_of_service is not None else None,
+        }
+
+@dataclass(slots=True)
+class AuthorizationStateWaitPassword(AuthorizationState):
+    """
+    The user has been authorized, but needs to enter a 2-step verification password to start using the application. Call checkAuthenticationPassword to provide the password, or requestAuthenticationPasswordRecovery to recover the password, or deleteAccount to delete the account after a week
+
+    :param password_hint: Hint for the password; may be empty
+    :param has_recovery_email_address: True, if a recovery email address has been set up
+    :param has_passport_data: True, if some Telegram Passport elements were saved
+    :param recovery_email_address_pattern: Pattern of the email address to which the recovery email was sent; empty until a recovery email has been sent
+    """
+
+    _type: "str" = field(default="authorizationStateWaitPassword", init=False, repr=False)
+    password_hint: "str" = ""
+    has_recovery_email_address: "bool" = False
+    has_passport_data: "bool" = False
+    recovery_email_address_pattern: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "password_hint": self.password_hint,
+            "has_recovery_email_address": self.has_recovery_email_address,
+            "has_passport_data": self.has_passport_data,
+            "recovery_email_address_pattern": self.recovery_email_address_pattern,
+        }
+
+@dataclass(slots=True)
+class AuthorizationStateReady(AuthorizationState):
+    """
+    The user has been successfully authorized. TDLib is now ready to answer general requests
+
+    """
+
+    _type: "str" = field(default="authorizationStateReady", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class AuthorizationStateLoggingOut(AuthorizationState):
+    """
+    The user is currently logging out
+
+    """
+
+    _type: "str" = field(default="authorizationStateLoggingOut", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class AuthorizationStateClosing(AuthorizationState):
+    """
+    TDLib is closing, all subsequent queries will be answered with the error 500. Note that closing TDLib can take a while. All resources will be freed only after authorizationStateClosed has been received
+
+    """
+
+    _type: "str" = field(default="authorizationStateClosing", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class AuthorizationStateClosed(AuthorizationState):
+    """
+    TDLib client is in its final state. All databases are closed and all resources are released. No other updates will be received after this. All queries will be responded to with error code 500. To continue working, one must create a new instance of the TDLib client
+
+    """
+
+    _type: "str" = field(default="authorizationStateClosed", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FirebaseDeviceVerificationParameters(ObjectBase):
+    """
+    Describes parameters to be used for device verification
+
+    """
+
+    _type: "str" = field(default="FirebaseDeviceVerificationParameters", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FirebaseDeviceVerificationParametersSafetyNet(FirebaseDeviceVerificationParameters):
+    """
+    Device verification must be performed with the SafetyNet Attestation API
+
+    :param nonce: Nonce to pass to the SafetyNet Attestation API
+    """
+
+    _type: "str" = field(default="firebaseDeviceVerificationParametersSafetyNet", init=False, repr=False)
+    nonce: "bytes" = b""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "nonce": _bytes_to_json(self.nonce),
+        }
+
+@dataclass(slots=True)
+class FirebaseDeviceVerificationParametersPlayIntegrity(FirebaseDeviceVerificationParameters):
+    """
+    Device verification must be performed with the classic Play Integrity verification (https://developer.android.com/google/play/integrity/classic)
+
+    :param nonce: Base64url-encoded nonce to pass to the Play Integrity API
+    :param cloud_project_number: Cloud project number to pass to the Play Integrity API
+    """
+
+    _type: "str" = field(default="firebaseDeviceVerificationParametersPlayIntegrity", init=False, repr=False)
+    nonce: "str" = ""
+    cloud_project_number: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "nonce": self.nonce,
+            "cloud_project_number": self.cloud_project_number,
+        }
+
+@dataclass(slots=True)
+class PasswordState(ObjectBase):
+    """
+    Represents the current state of 2-step verification
+
+    :param has_password: True, if a 2-step verification password is set
+    :param password_hint: Hint for the password; may be empty
+    :param has_recovery_email_address: True, if a recovery email is set
+    :param has_passport_data: True, if some Telegram Passport elements were saved
+    :param recovery_email_address_code_info: Information about the recovery email address to which the confirmation email was sent; may be null
+    :param login_email_address_pattern: Pattern of the email address set up for logging in
+    :param pending_reset_date: If not 0, point in time (Unix timestamp) after which the 2-step verification password can be reset immediately using resetPassword
+    """
+
+    _type: "str" = field(default="passwordState", init=False, repr=False)
+    has_password: "bool" = False
+    password_hint: "str" = ""
+    has_recovery_email_address: "bool" = False
+    has_passport_data: "bool" = False
+    recovery_email_address_code_info: "EmailAddressAuthenticationCodeInfo | None" = None
+    login_email_address_pattern: "str" = ""
+    pending_reset_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "has_password": self.has_password,
+            "password_hint": self.password_hint,
+            "has_recovery_email_address": self.has_recovery_email_address,
+            "has_passport_data": self.has_passport_data,
+            "recovery_email_address_code_info": self.recovery_email_address_code_info._to_json_dict() if self.recovery_email_address_code_info is not None else None,
+            "login_email_address_pattern": self.login_email_address_pattern,
+            "pending_reset_date": self.pending_reset_date,
+        }
+
+@dataclass(slots=True)
+class RecoveryEmailAddress(ObjectBase):
+    """
+    Contains information about the current recovery email address
+
+    :param recovery_email_address: Recovery email address
+    """
+
+    _type: "str" = field(default="recoveryEmailAddress", init=False, repr=False)
+    recovery_email_address: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "recovery_email_address": self.recovery_email_address,
+        }
+
+@dataclass(slots=True)
+class TemporaryPasswordState(ObjectBase):
+    """
+    Returns information about the availability of a temporary password, which can be used for payments
+
+    :param has_password: True, if a temporary password is available
+    :param valid_for: Time left before the temporary password expires, in seconds
+    """
+
+    _type: "str" = field(default="temporaryPasswordState", init=False, repr=False)
+    has_password: "bool" = False
+    valid_for: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "has_password": self.has_password,
+            "valid_for": self.valid_for,
+        }
+
+@dataclass(slots=True)
+class LocalFile(ObjectBase):
+    """
+    Represents a local file
+
+    :param path: Local path to the locally available file part; may be empty
+    :param can_be_downloaded: True, if it is possible to download or generate the file
+    :param can_be_deleted: True, if the file can be deleted
+    :param is_downloading_active: True, if the file is currently being downloaded (or a local copy is being generated by some other means)
+    :param is_downloading_completed: True, if the local copy is fully available
+    :param download_offset: Download will be started from this offset. downloaded_prefix_size is calculated from this offset
+    :param downloaded_prefix_size: If is_downloading_completed is false, then only some prefix of the file starting from download_offset is ready to be read. downloaded_prefix_size is the size of that prefix in bytes
+    :param downloaded_size: Total downloaded file size, in bytes. Can be used only for calculating download progress. The actual file size may be bigger, and some parts of it may contain garbage
+    """
+
+    _type: "str" = field(default="localFile", init=False, repr=False)
+    path: "str" = ""
+    can_be_downloaded: "bool" = False
+    can_be_deleted: "bool" = False
+    is_downloading_active: "bool" = False
+    is_downloading_completed: "bool" = False
+    download_offset: "int" = 0
+    downloaded_prefix_size: "int" = 0
+    downloaded_size: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "path": self.path,
+            "can_be_downloaded": self.can_be_downloaded,
+            "can_be_deleted": self.can_be_deleted,
+            "is_downloading_active": self.is_downloading_active,
+            "is_downloading_completed": self.is_downloading_completed,
+            "download_offset": self.download_offset,
+            "downloaded_prefix_size": self.downloaded_prefix_size,
+            "downloaded_size": self.downloaded_size,
+        }
+
+@dataclass(slots=True)
+class RemoteFile(ObjectBase):
+    """
+    Represents a remote file
+
+    :param id: Remote file identifier; may be empty. Can be used by the current user across application restarts or even from other devices. Uniquely identifies a file, but a file can have a lot of different valid identifiers.
+     If the identifier starts with "http://" or "https://", it represents the HTTP URL of the file. TDLib is currently unable to download files if only their URL is known.
+     If downloadFile/addFileToDownloads is called on such a file or if it is sent to a secret chat, TDLib starts a file generation process by sending updateFileGenerationStart to the application with the HTTP URL in the original_path and "#url#" as the conversion string.
+     Application must generate the file by downloading it to the specified location
+    :param unique_id: Unique file identifier; may be empty if unknown. The unique file identifier which is the same for the same file even for different users and is persistent over time
+    :param is_uploading_active: True, if the file is currently being uploaded (or a remote copy is being generated by some other means)
+    :param is_uploading_completed: True, if a remote copy is fully available
+    :param uploaded_size: Size of the remote available part of the file, in bytes; 0 if unknown
+    """
+
+    _type: "str" = field(default="remoteFile", init=False, repr=False)
+    id: "str" = ""
+    unique_id: "str" = ""
+    is_uploading_active: "bool" = False
+    is_uploading_completed: "bool" = False
+    uploaded_size: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "unique_id": self.unique_id,
+            "is_uploading_active": self.is_uploading_active,
+            "is_uploading_completed": self.is_uploading_completed,
+            "uploaded_size": self.uploaded_size,
+        }
+
+@dataclass(slots=True)
+class File(ObjectBase):
+    """
+    Represents a file
+
+    :param id: Unique file identifier
+    :param size: File size, in bytes; 0 if unknown
+    :param expected_size: Approximate file size in bytes in case the exact file size is unknown. Can be used to show download/upload progress
+    :param local: Information about the local copy of the file
+    :param remote: Information about the remote copy of the file
+    """
+
+    _type: "str" = field(default="file", init=False, repr=False)
+    id: "int" = 0
+    size: "int" = 0
+    expected_size: "int" = 0
+    local: "LocalFile | None" = None
+    remote: "RemoteFile | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "size": self.size,
+            "expected_size": self.expected_size,
+            "local": self.local._to_json_dict() if self.local is not None else None,
+            "remote": self.remote._to_json_dict() if self.remote is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputFile(ObjectBase):
+    """
+    Points to a file
+
+    """
+
+    _type: "str" = field(default="InputFile", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InputFileId(InputFile):
+    """
+    A file defined by its unique identifier
+
+    :param id: Unique file identifier
+    """
+
+    _type: "str" = field(default="inputFileId", init=False, repr=False)
+    id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+        }
+
+@dataclass(slots=True)
+class InputFileRemote(InputFile):
+    """
+    A file defined by its remote identifier. The remote identifier is guaranteed to be usable only if the corresponding file is still accessible to the user and known to TDLib. For example, if the file is from a message, then the message must be not deleted and accessible to the user. If the file database is disabled, then the corresponding object with the file must be preloaded by the application
+
+    :param id: Remote file identifier
+    """
+
+    _type: "str" = field(default="inputFileRemote", init=False, repr=False)
+    id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+        }
+
+@dataclass(slots=True)
+class InputFileLocal(InputFile):
+    """
+    A file defined by a local path
+
+    :param path: Local path to the file
+    """
+
+    _type: "str" = field(default="inputFileLocal", init=False, repr=False)
+    path: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "path": self.path,
+        }
+
+@dataclass(slots=True)
+class InputFileGenerated(InputFile):
+    """
+    A file generated by the application. The application must handle updates updateFileGenerationStart and updateFileGenerationStop to generate the file when asked by TDLib
+
+    :param original_path: Local path to a file from which the file is generated. The path doesn't have to be a valid path and is used by TDLib only to detect name and MIME type of the generated file
+    :param conversion: String specifying the conversion applied to the original file; must be persistent across application restarts. Conversions beginning with '#' are reserved for internal TDLib usage
+    :param expected_size: Expected size of the generated file, in bytes; pass 0 if unknown
+    """
+
+    _type: "str" = field(default="inputFileGenerated", init=False, repr=False)
+    original_path: "str" = ""
+    conversion: "str" = ""
+    expected_size: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "original_path": self.original_path,
+            "conversion": self.conversion,
+            "expected_size": self.expected_size,
+        }
+
+@dataclass(slots=True)
+class PhotoSize(ObjectBase):
+    """
+    Describes an image in JPEG format
+
+    :param type: Image type (see https://core.telegram.org/constructor/photoSize)
+    :param photo: Information about the image file
+    :param width: Image width
+    :param height: Image height
+    :param progressive_sizes: Sizes of progressive JPEG file prefixes, which can be used to preliminarily show the image; in bytes
+    """
+
+    _type: "str" = field(default="photoSize", init=False, repr=False)
+    type: "str" = ""
+    photo: "File | None" = None
+    width: "int" = 0
+    height: "int" = 0
+    progressive_sizes: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "type": self.type,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+            "width": self.width,
+            "height": self.height,
+            "progressive_sizes": self.progressive_sizes,
+        }
+
+@dataclass(slots=True)
+class Minithumbnail(ObjectBase):
+    """
+    Thumbnail image of a very poor quality and low resolution
+
+    :param width: Thumbnail width, usually doesn't exceed 40
+    :param height: Thumbnail height, usually doesn't exceed 40
+    :param data: The thumbnail in JPEG format
+    """
+
+    _type: "str" = field(default="minithumbnail", init=False, repr=False)
+    width: "int" = 0
+    height: "int" = 0
+    data: "bytes" = b""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "width": self.width,
+            "height": self.height,
+            "data": _bytes_to_json(self.data),
+        }
+
+@dataclass(slots=True)
+class ThumbnailFormat(ObjectBase):
+    """
+    Describes format of a thumbnail
+
+    """
+
+    _type: "str" = field(default="ThumbnailFormat", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ThumbnailFormatJpeg(ThumbnailFormat):
+    """
+    The thumbnail is in JPEG format
+
+    """
+
+    _type: "str" = field(default="thumbnailFormatJpeg", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ThumbnailFormatGif(ThumbnailFormat):
+    """
+    The thumbnail is in static GIF format. It will be used only for some bot inline query results
+
+    """
+
+    _type: "str" = field(default="thumbnailFormatGif", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ThumbnailFormatMpeg4(ThumbnailFormat):
+    """
+    The thumbnail is in MPEG4 format. It will be used only for some animations and videos
+
+    """
+
+    _type: "str" = field(default="thumbnailFormatMpeg4", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ThumbnailFormatPng(ThumbnailFormat):
+    """
+    The thumbnail is in PNG format. It will be used only for background patterns
+
+    """
+
+    _type: "str" = field(default="thumbnailFormatPng", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ThumbnailFormatTgs(ThumbnailFormat):
+    """
+    The thumbnail is in TGS format. It will be used only for sticker sets
+
+    """
+
+    _type: "str" = field(default="thumbnailFormatTgs", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ThumbnailFormatWebm(ThumbnailFormat):
+    """
+    The thumbnail is in WEBM format. It will be used only for sticker sets
+
+    """
+
+    _type: "str" = field(default="thumbnailFormatWebm", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ThumbnailFormatWebp(ThumbnailFormat):
+    """
+    The thumbnail is in WEBP format. It will be used only for some stickers and sticker sets
+
+    """
+
+    _type: "str" = field(default="thumbnailFormatWebp", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
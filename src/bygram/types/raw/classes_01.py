@@ -0,0 +1,1501 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import File, FormattedText, Minithumbnail, PhotoSize, ThumbnailFormat
+    from .classes_05 import MessageSender
+    from .classes_16 import SpeechRecognitionResult
+    from .classes_18 import BackgroundType
+    from .classes_24 import VectorPathCommand
+
+@dataclass(slots=True)
+class Thumbnail(ObjectBase):
+    """
+    Represents a thumbnail
+
+    :param format: Thumbnail format
+    :param width: Thumbnail width
+    :param height: Thumbnail height
+    :param file: The thumbnail
+    """
+
+    _type: "str" = field(default="thumbnail", init=False, repr=False)
+    format: "ThumbnailFormat | None" = None
+    width: "int" = 0
+    height: "int" = 0
+    file: "File | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "format": self.format._to_json_dict() if self.format is not None else None,
+            "width": self.width,
+            "height": self.height,
+            "file": self.file._to_json_dict() if self.file is not None else None,
+        }
+
+@dataclass(slots=True)
+class MaskPoint(ObjectBase):
+    """
+    Part of the face, relative to which a mask is placed
+
+    """
+
+    _type: "str" = field(default="MaskPoint", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MaskPointForehead(MaskPoint):
+    """
+    The mask is placed relatively to the forehead
+
+    """
+
+    _type: "str" = field(default="maskPointForehead", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MaskPointEyes(MaskPoint):
+    """
+    The mask is placed relatively to the eyes
+
+    """
+
+    _type: "str" = field(default="maskPointEyes", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MaskPointMouth(MaskPoint):
+    """
+    The mask is placed relatively to the mouth
+
+    """
+
+    _type: "str" = field(default="maskPointMouth", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MaskPointChin(MaskPoint):
+    """
+    The mask is placed relatively to the chin
+
+    """
+
+    _type: "str" = field(default="maskPointChin", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MaskPosition(ObjectBase):
+    """
+    Position on a photo where a mask is placed
+
+    :param point: Part of the face, relative to which the mask is placed
+    :param x_shift: Shift by X-axis measured in widths of the mask scaled to the face size, from left to right. (For example, -1.0 will place the mask just to the left of the default mask position)
+    :param y_shift: Shift by Y-axis measured in heights of the mask scaled to the face size, from top to bottom. (For example, 1.0 will place the mask just below the default mask position)
+    :param scale: Mask scaling coefficient. (For example, 2.0 means a doubled size)
+    """
+
+    _type: "str" = field(default="maskPosition", init=False, repr=False)
+    point: "MaskPoint | None" = None
+    x_shift: "float" = 0
+    y_shift: "float" = 0
+    scale: "float" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "point": self.point._to_json_dict() if self.point is not None else None,
+            "x_shift": self.x_shift,
+            "y_shift": self.y_shift,
+            "scale": self.scale,
+        }
+
+@dataclass(slots=True)
+class StickerFormat(ObjectBase):
+    """
+    Describes format of a sticker
+
+    """
+
+    _type: "str" = field(default="StickerFormat", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StickerFormatWebp(StickerFormat):
+    """
+    The sticker is an image in WEBP format
+
+    """
+
+    _type: "str" = field(default="stickerFormatWebp", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StickerFormatTgs(StickerFormat):
+    """
+    The sticker is an animation in TGS format
+
+    """
+
+    _type: "str" = field(default="stickerFormatTgs", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StickerFormatWebm(StickerFormat):
+    """
+    The sticker is a video in WEBM format
+
+    """
+
+    _type: "str" = field(default="stickerFormatWebm", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StickerType(ObjectBase):
+    """
+    Describes type of sticker
+
+    """
+
+    _type: "str" = field(default="StickerType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StickerTypeRegular(StickerType):
+    """
+    The sticker is a regular sticker
+
+    """
+
+    _type: "str" = field(default="stickerTypeRegular", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StickerTypeMask(StickerType):
+    """
+    The sticker is a mask in WEBP format to be placed on photos or videos
+
+    """
+
+    _type: "str" = field(default="stickerTypeMask", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StickerTypeCustomEmoji(StickerType):
+    """
+    The sticker is a custom emoji to be used inside message text and caption
+
+    """
+
+    _type: "str" = field(default="stickerTypeCustomEmoji", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StickerFullType(ObjectBase):
+    """
+    Contains full information about sticker type
+
+    """
+
+    _type: "str" = field(default="StickerFullType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StickerFullTypeRegular(StickerFullType):
+    """
+    The sticker is a regular sticker
+
+    :param premium_animation: Premium animation of the sticker; may be null. If present, only Telegram Premium users can use the sticker
+    """
+
+    _type: "str" = field(default="stickerFullTypeRegular", init=False, repr=False)
+    premium_animation: "File | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "premium_animation": self.premium_animation._to_json_dict() if self.premium_animation is not None else None,
+        }
+
+@dataclass(slots=True)
+class StickerFullTypeMask(StickerFullType):
+    """
+    The sticker is a mask in WEBP format to be placed on photos or videos
+
+    :param mask_position: Position where the mask is placed; may be null
+    """
+
+    _type: "str" = field(default="stickerFullTypeMask", init=False, repr=False)
+    mask_position: "MaskPosition | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "mask_position": self.mask_position._to_json_dict() if self.mask_position is not None else None,
+        }
+
+@dataclass(slots=True)
+class StickerFullTypeCustomEmoji(StickerFullType):
+    """
+    The sticker is a custom emoji to be used inside message text and caption. Currently, only Telegram Premium users can use custom emoji
+
+    :param custom_emoji_id: Identifier of the custom emoji
+    :param needs_repainting: True, if the sticker must be repainted to a text color in messages, the color of the Telegram Premium badge in emoji status, white color on chat photos, or another appropriate color in other places
+    """
+
+    _type: "str" = field(default="stickerFullTypeCustomEmoji", init=False, repr=False)
+    custom_emoji_id: "int" = 0
+    needs_repainting: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "custom_emoji_id": self.custom_emoji_id,
+            "needs_repainting": self.needs_repainting,
+        }
+
+@dataclass(slots=True)
+class ClosedVectorPath(ObjectBase):
+    """
+    Represents a closed vector path. The path begins at the end point of the last command. The coordinate system origin is in the upper-left corner
+
+    :param commands: List of vector path commands
+    """
+
+    _type: "str" = field(default="closedVectorPath", init=False, repr=False)
+    commands: "list[VectorPathCommand] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "commands": _list_to_json(self.commands),
+        }
+
+@dataclass(slots=True)
+class Outline(ObjectBase):
+    """
+    Represents outline of an image
+
+    :param paths: The list of closed vector paths
+    """
+
+    _type: "str" = field(default="outline", init=False, repr=False)
+    paths: "list[ClosedVectorPath] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "paths": _list_to_json(self.paths),
+        }
+
+@dataclass(slots=True)
+class PollOption(ObjectBase):
+    """
+    Describes one answer option of a poll
+
+    :param text: Option text; 1-100 characters. Only custom emoji entities are allowed
+    :param voter_count: Number of voters for this option, available only for closed or voted polls
+    :param vote_percentage: The percentage of votes for this option; 0-100
+    :param is_chosen: True, if the option was chosen by the user
+    :param is_being_chosen: True, if the option is being chosen by a pending setPollAnswer request
+    """
+
+    _type: "str" = field(default="pollOption", init=False, repr=False)
+    text: "FormattedText | None" = None
+    voter_count: "int" = 0
+    vote_percentage: "int" = 0
+    is_chosen: "bool" = False
+    is_being_chosen: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "voter_count": self.voter_count,
+            "vote_percentage": self.vote_percentage,
+            "is_chosen": self.is_chosen,
+            "is_being_chosen": self.is_being_chosen,
+        }
+
+@dataclass(slots=True)
+class PollType(ObjectBase):
+    """
+    Describes the type of poll
+
+    """
+
+    _type: "str" = field(default="PollType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PollTypeRegular(PollType):
+    """
+    A regular poll
+
+    :param allow_multiple_answers: True, if multiple answer options can be chosen simultaneously
+    """
+
+    _type: "str" = field(default="pollTypeRegular", init=False, repr=False)
+    allow_multiple_answers: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "allow_multiple_answers": self.allow_multiple_answers,
+        }
+
+@dataclass(slots=True)
+class PollTypeQuiz(PollType):
+    """
+    A poll in quiz mode, which has exactly one correct answer option and can be answered only once
+
+    :param correct_option_id: 0-based identifier of the correct answer option; -1 for a yet unanswered poll
+    :param explanation: Text that is shown when the user chooses an incorrect answer or taps on the lamp icon; 0-200 characters with at most 2 line feeds; empty for a yet unanswered poll
+    """
+
+    _type: "str" = field(default="pollTypeQuiz", init=False, repr=False)
+    correct_option_id: "int" = 0
+    explanation: "FormattedText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "correct_option_id": self.correct_option_id,
+            "explanation": self.explanation._to_json_dict() if self.explanation is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChecklistTask(ObjectBase):
+    """
+    Describes a task in a checklist
+
+    :param id: Unique identifier of the task
+    :param text: Text of the task; may contain only Bold, Italic, Underline, Strikethrough, Spoiler, CustomEmoji, Url, EmailAddress, Mention, Hashtag, Cashtag and PhoneNumber entities
+    :param completed_by_user_id: Identifier of the user that completed the task; 0 if the task isn't completed
+    :param completion_date: Point in time (Unix timestamp) when the task was completed; 0 if the task isn't completed
+    """
+
+    _type: "str" = field(default="checklistTask", init=False, repr=False)
+    id: "int" = 0
+    text: "FormattedText | None" = None
+    completed_by_user_id: "int" = 0
+    completion_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "completed_by_user_id": self.completed_by_user_id,
+            "completion_date": self.completion_date,
+        }
+
+@dataclass(slots=True)
+class InputChecklistTask(ObjectBase):
+    """
+    Describes a task in a checklist to be sent
+
+    :param id: Unique identifier of the task; must be positive
+    :param text: Text of the task; 1-getOption("checklist_task_text_length_max") characters without line feeds. May contain only Bold, Italic, Underline, Strikethrough, Spoiler, and CustomEmoji entities
+    """
+
+    _type: "str" = field(default="inputChecklistTask", init=False, repr=False)
+    id: "int" = 0
+    text: "FormattedText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+        }
+
+@dataclass(slots=True)
+class Checklist(ObjectBase):
+    """
+    Describes a checklist
+
+    :param title: Title of the checklist; may contain only Bold, Italic, Underline, Strikethrough, Spoiler, and CustomEmoji entities
+    :param tasks: List of tasks in the checklist
+    :param others_can_add_tasks: True, if users other than creator of the list can add tasks to the list
+    :param can_add_tasks: True, if the current user can add tasks to the list if they have Telegram Premium subscription
+    :param others_can_mark_tasks_as_done: True, if users other than creator of the list can mark tasks as done or not done. If true, then the checklist is called "group checklist"
+    :param can_mark_tasks_as_done: True, if the current user can mark tasks as done or not done if they have Telegram Premium subscription
+    """
+
+    _type: "str" = field(default="checklist", init=False, repr=False)
+    title: "FormattedText | None" = None
+    tasks: "list[ChecklistTask] | None" = None
+    others_can_add_tasks: "bool" = False
+    can_add_tasks: "bool" = False
+    others_can_mark_tasks_as_done: "bool" = False
+    can_mark_tasks_as_done: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "title": self.title._to_json_dict() if self.title is not None else None,
+            "tasks": _list_to_json(self.tasks),
+            "others_can_add_tasks": self.others_can_add_tasks,
+            "can_add_tasks": self.can_add_tasks,
+            "others_can_mark_tasks_as_done": self.others_can_mark_tasks_as_done,
+            "can_mark_tasks_as_done": self.can_mark_tasks_as_done,
+        }
+
+@dataclass(slots=True)
+class InputChecklist(ObjectBase):
+    """
+    Describes a checklist to be sent
+
+    :param title: Title of the checklist; 1-getOption("checklist_title_length_max") characters. May contain only Bold, Italic, Underline, Strikethrough, Spoiler, and CustomEmoji entities
+    :param tasks: List of tasks in the checklist; 1-getOption("checklist_task_count_max") tasks
+    :param others_can_add_tasks: True, if other users can add tasks to the list
+    :param others_can_mark_tasks_as_done: True, if other users can mark tasks as done or not done
+    """
+
+    _type: "str" = field(default="inputChecklist", init=False, repr=False)
+    title: "FormattedText | None" = None
+    tasks: "list[InputChecklistTask] | None" = None
+    others_can_add_tasks: "bool" = False
+    others_can_mark_tasks_as_done: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "title": self.title._to_json_dict() if self.title is not None else None,
+            "tasks": _list_to_json(self.tasks),
+            "others_can_add_tasks": self.others_can_add_tasks,
+            "others_can_mark_tasks_as_done": self.others_can_mark_tasks_as_done,
+        }
+
+@dataclass(slots=True)
+class Animation(ObjectBase):
+    """
+    Describes an animation file. The animation must be encoded in GIF or MPEG4 format
+
+    :param duration: Duration of the animation, in seconds; as defined by the sender
+    :param width: Width of the animation
+    :param height: Height of the animation
+    :param file_name: Original name of the file; as defined by the sender
+    :param mime_type: MIME type of the file, usually "image/gif" or "video/mp4"
+    :param has_stickers: True, if stickers were added to the animation. The list of corresponding sticker set can be received using getAttachedStickerSets
+    :param minithumbnail: Animation minithumbnail; may be null
+    :param thumbnail: Animation thumbnail in JPEG or MPEG4 format; may be null
+    :param animation: File containing the animation
+    """
+
+    _type: "str" = field(default="animation", init=False, repr=False)
+    duration: "int" = 0
+    width: "int" = 0
+    height: "int" = 0
+    file_name: "str" = ""
+    mime_type: "str" = ""
+    has_stickers: "bool" = False
+    minithumbnail: "Minithumbnail | None" = None
+    thumbnail: "Thumbnail | None" = None
+    animation: "File | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "duration": self.duration,
+            "width": self.width,
+            "height": self.height,
+            "file_name": self.file_name,
+            "mime_type": self.mime_type,
+            "has_stickers": self.has_stickers,
+            "minithumbnail": self.minithumbnail._to_json_dict() if self.minithumbnail is not None else None,
+            "thumbnail": self.thumbnail._to_json_dict() if self.thumbnail is not None else None,
+            "animation": self.animation._to_json_dict() if self.animation is not None else None,
+        }
+
+@dataclass(slots=True)
+class Audio(ObjectBase):
+    """
+    Describes an audio file. Audio is usually in MP3 or M4A format
+
+    :param duration: Duration of the audio, in seconds; as defined by the sender
+    :param title: Title of the audio; as defined by the sender
+    :param performer: Performer of the audio; as defined by the sender
+    :param file_name: Original name of the file; as defined by the sender
+    :param mime_type: The MIME type of the file; as defined by the sender
+    :param album_cover_minithumbnail: The minithumbnail of the album cover; may be null
+    :param album_cover_thumbnail: The thumbnail of the album cover in JPEG format; as defined by the sender. The full size thumbnail is expected to be extracted from the downloaded audio file; may be null
+    :param external_album_covers: Album cover variants to use if the downloaded audio file contains no album cover. Provided thumbnail dimensions are approximate
+    :param audio: File containing the audio
+    """
+
+    _type: "str" = field(default="audio", init=False, repr=False)
+    duration: "int" = 0
+    title: "str" = ""
+    performer: "str" = ""
+    file_name: "str" = ""
+    mime_type: "str" = ""
+    album_cover_minithumbnail: "Minithumbnail | None" = None
+    album_cover_thumbnail: "Thumbnail | None" = None
+    external_album_covers: "list[Thumbnail] | None" = None
+    audio: "File | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "duration": self.duration,
+            "title": self.title,
+            "performer": self.performer,
+            "file_name": self.file_name,
+            "mime_type": self.mime_type,
+            "album_cover_minithumbnail": self.album_cover_minithumbnail._to_json_dict() if self.album_cover_minithumbnail is not None else None,
+            "album_cover_thumbnail": self.album_cover_thumbnail._to_json_dict() if self.album_cover_thumbnail is not None else None,
+            "external_album_covers": _list_to_json(self.external_album_covers),
+            "audio": self.audio._to_json_dict() if self.audio is not None else None,
+        }
+
+@dataclass(slots=True)
+class Document(ObjectBase):
+    """
+    Describes a document of any type
+
+    :param file_name: Original name of the file; as defined by the sender
+    :param mime_type: MIME type of the file; as defined by the sender
+    :param minithumbnail: Document minithumbnail; may be null
+    :param thumbnail: Document thumbnail in JPEG or PNG format (PNG will be used only for background patterns); as defined by the sender; may be null
+    :param document: File containing the document
+    """
+
+    _type: "str" = field(default="document", init=False, repr=False)
+    file_name: "str" = ""
+    mime_type: "str" = ""
+    minithumbnail: "Minithumbnail | None" = None
+    thumbnail: "Thumbnail | None" = None
+    document: "File | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_name": self.file_name,
+            "mime_type": self.mime_type,
+            "minithumbnail": self.minithumbnail._to_json_dict() if self.minithumbnail is not None else None,
+            "thumbnail": self.thumbnail._to_json_dict() if self.thumbnail is not None else None,
+            "document": self.document._to_json_dict() if self.document is not None else None,
+        }
+
+@dataclass(slots=True)
+class Photo(ObjectBase):
+    """
+    Describes a photo
+
+    :param has_stickers: True, if stickers were added to the photo. The list of corresponding sticker sets can be received using getAttachedStickerSets
+    :param minithumbnail: Photo minithumbnail; may be null
+    :param sizes: Available variants of the photo, in different sizes
+    """
+
+    _type: "str" = field(default="photo", init=False, repr=False)
+    has_stickers: "bool" = False
+    minithumbnail: "Minithumbnail | None" = None
+    sizes: "list[PhotoSize] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "has_stickers": self.has_stickers,
+            "minithumbnail": self.minithumbnail._to_json_dict() if self.minithumbnail is not None else None,
+            "sizes": _list_to_json(self.sizes),
+        }
+
+@dataclass(slots=True)
+class Sticker(ObjectBase):
+    """
+    Describes a sticker
+
+    :param id: Unique sticker identifier within the set; 0 if none
+    :param set_id: Identifier of the sticker set to which the sticker belongs; 0 if none
+    :param width: Sticker width; as defined by the sender
+    :param height: Sticker height; as defined by the sender
+    :param emoji: Emoji corresponding to the sticker
+    :param format: Sticker format
+    :param full_type: Sticker's full type
+    :param thumbnail: Sticker thumbnail in WEBP or JPEG format; may be null
+    :param sticker: File containing the sticker
+    """
+
+    _type: "str" = field(default="sticker", init=False, repr=False)
+    id: "int" = 0
+    set_id: "int" = 0
+    width: "int" = 0
+    height: "int" = 0
+    emoji: "str" = ""
+    format: "StickerFormat | None" = None
+    full_type: "StickerFullType | None" = None
+    thumbnail: "Thumbnail | None" = None
+    sticker: "File | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "set_id": self.set_id,
+            "width": self.width,
+            "height": self.height,
+            "emoji": self.emoji,
+            "format": self.format._to_json_dict() if self.format is not None else None,
+            "full_type": self.full_type._to_json_dict() if self.full_type is not None else None,
+            "thumbnail": self.thumbnail._to_json_dict() if self.thumbnail is not None else None,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+        }
+
+@dataclass(slots=True)
+class Video(ObjectBase):
+    """
+    Describes a video file
+
+    :param duration: Duration of the video, in seconds; as defined by the sender
+    :param width: Video width; as defined by the sender
+    :param height: Video height; as defined by the sender
+    :param file_name: Original name of the file; as defined by the sender
+    :param mime_type: MIME type of the file; as defined by the sender
+    :param has_stickers: True, if stickers were added to the video. The list of corresponding sticker sets can be received using getAttachedStickerSets
+    :param supports_streaming: True, if the video is expected to be streamed
+    :param minithumbnail: Video minithumbnail; may be null
+    :param thumbnail: Video thumbnail in JPEG or MPEG4 format; as defined by the sender; may be null
+    :param video: File containing the video
+    """
+
+    _type: "str" = field(default="video", init=False, repr=False)
+    duration: "int" = 0
+    width: "int" = 0
+    height: "int" = 0
+    file_name: "str" = ""
+    mime_type: "str" = ""
+    has_stickers: "bool" = False
+    supports_streaming: "bool" = False
+    minithumbnail: "Minithumbnail | None" = None
+    thumbnail: "Thumbnail | None" = None
+    video: "File | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "duration": self.duration,
+            "width": self.width,
+            "height": self.height,
+            "file_name": self.file_name,
+            "mime_type": self.mime_type,
+            "has_stickers": self.has_stickers,
+            "supports_streaming": self.supports_streaming,
+            "minithumbnail": self.minithumbnail._to_json_dict() if self.minithumbnail is not None else None,
+            "thumbnail": self.thumbnail._to_json_dict() if self.thumbnail is not None else None,
+            "video": self.video._to_json_dict() if self.video is not None else None,
+        }
+
+@dataclass(slots=True)
+class VideoNote(ObjectBase):
+    """
+    Describes a video note. The video must be equal in width and height, cropped to a circle, and stored in MPEG4 format
+
+    :param duration: Duration of the video, in seconds; as defined by the sender
+    :param waveform: A waveform representation of the video note's audio in 5-bit format; may be empty if unknown
+    :param length: Video width and height; as defined by the sender
+    :param minithumbnail: Video minithumbnail; may be null
+    :param thumbnail: Video thumbnail in JPEG format; as defined by the sender; may be null
+    :param speech_recognition_result: Result of speech recognition in the video note; may be null
+    :param video: File containing the video
+    """
+
+    _type: "str" = field(default="videoNote", init=False, repr=False)
+    duration: "int" = 0
+    waveform: "bytes" = b""
+    length: "int" = 0
+    minithumbnail: "Minithumbnail | None" = None
+    thumbnail: "Thumbnail | None" = None
+    speech_recognition_result: "SpeechRecognitionResult | None" = None
+    video: "File | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "duration": self.duration,
+            "waveform": _bytes_to_json(self.waveform),
+            "length": self.length,
+            "minithumbnail": self.minithumbnail._to_json_dict() if self.minithumbnail is not None else None,
+            "thumbnail": self.thumbnail._to_json_dict() if self.thumbnail is not None else None,
+            "speech_recognition_result": self.speech_recognition_result._to_json_dict() if self.speech_recognition_result is not None else None,
+            "video": self.video._to_json_dict() if self.video is not None else None,
+        }
+
+@dataclass(slots=True)
+class VoiceNote(ObjectBase):
+    """
+    Describes a voice note
+
+    :param duration: Duration of the voice note, in seconds; as defined by the sender
+    :param waveform: A waveform representation of the voice note in 5-bit format
+    :param mime_type: MIME type of the file; as defined by the sender. Usually, one of "audio/ogg" for Opus in an OGG container, "audio/mpeg" for an MP3 audio, or "audio/mp4" for an M4A audio
+    :param speech_recognition_result: Result of speech recognition in the voice note; may be null
+    :param voice: File containing the voice note
+    """
+
+    _type: "str" = field(default="voiceNote", init=False, repr=False)
+    duration: "int" = 0
+    waveform: "bytes" = b""
+    mime_type: "str" = ""
+    speech_recognition_result: "SpeechRecognitionResult | None" = None
+    voice: "File | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "duration": self.duration,
+            "waveform": _bytes_to_json(self.waveform),
+            "mime_type": self.mime_type,
+            "speech_recognition_result": self.speech_recognition_result._to_json_dict() if self.speech_recognition_result is not None else None,
+            "voice": self.voice._to_json_dict() if self.voice is not None else None,
+        }
+
+@dataclass(slots=True)
+class AnimatedEmoji(ObjectBase):
+    """
+    Describes an animated or custom representation of an emoji
+
+    :param sticker: Sticker for the emoji; may be null if yet unknown for a custom emoji. If the sticker is a custom emoji, then it can have arbitrary format
+    :param sticker_width: Expected width of the sticker, which can be used if the sticker is null
+    :param sticker_height: Expected height of the sticker, which can be used if the sticker is null
+    :param fitzpatrick_type: Emoji modifier fitzpatrick type; 0-6; 0 if none
+    :param sound: File containing the sound to be played when the sticker is clicked; may be null. The sound is encoded with the Opus codec, and stored inside an OGG container
+    """
+
+    _type: "str" = field(default="animatedEmoji", init=False, repr=False)
+    sticker: "Sticker | None" = None
+    sticker_width: "int" = 0
+    sticker_height: "int" = 0
+    fitzpatrick_type: "int" = 0
+    sound: "File | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+            "sticker_width": self.sticker_width,
+            "sticker_height": self.sticker_height,
+            "fitzpatrick_type": self.fitzpatrick_type,
+            "sound": self.sound._to_json_dict() if self.sound is not None else None,
+        }
+
+@dataclass(slots=True)
+class Contact(ObjectBase):
+    """
+    Describes a user contact
+
+    :param phone_number: Phone number of the user
+    :param first_name: First name of the user; 1-255 characters in length
+    :param last_name: Last name of the user
+    :param vcard: Additional data about the user in a form of vCard; 0-2048 bytes in length
+    :param user_id: Identifier of the user, if known; 0 otherwise
+    """
+
+    _type: "str" = field(default="contact", init=False, repr=False)
+    phone_number: "str" = ""
+    first_name: "str" = ""
+    last_name: "str" = ""
+    vcard: "str" = ""
+    user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "phone_number": self.phone_number,
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+            "vcard": self.vcard,
+            "user_id": self.user_id,
+        }
+
+@dataclass(slots=True)
+class Location(ObjectBase):
+    """
+    Describes a location on planet Earth
+
+    :param latitude: Latitude of the location in degrees; as defined by the sender
+    :param longitude: Longitude of the location, in degrees; as defined by the sender
+    :param horizontal_accuracy: The estimated horizontal accuracy of the location, in meters; as defined by the sender. 0 if unknown
+    """
+
+    _type: "str" = field(default="location", init=False, repr=False)
+    latitude: "float" = 0
+    longitude: "float" = 0
+    horizontal_accuracy: "float" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "horizontal_accuracy": self.horizontal_accuracy,
+        }
+
+@dataclass(slots=True)
+class Venue(ObjectBase):
+    """
+    Describes a venue
+
+    :param location: Venue location; as defined by the sender
+    :param title: Venue name; as defined by the sender
+    :param address: Venue address; as defined by the sender
+    :param provider: Provider of the venue database; as defined by the sender. Currently, only "foursquare" and "gplaces" (Google Places) need to be supported
+    :param id: Identifier of the venue in the provider database; as defined by the sender
+    :param type: Type of the venue in the provider database; as defined by the sender
+    """
+
+    _type: "str" = field(default="venue", init=False, repr=False)
+    location: "Location | None" = None
+    title: "str" = ""
+    address: "str" = ""
+    provider: "str" = ""
+    id: "str" = ""
+    type: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "location": self.location._to_json_dict() if self.location is not None else None,
+            "title": self.title,
+            "address": self.address,
+            "provider": self.provider,
+            "id": self.id,
+            "type": self.type,
+        }
+
+@dataclass(slots=True)
+class Game(ObjectBase):
+    """
+    Describes a game. Use getInternalLink with internalLinkTypeGame to share the game
+
+    :param id: Unique game identifier
+    :param short_name: Game short name
+    :param title: Game title
+    :param text: Game text, usually containing scoreboards for a game
+    :param description: Describes a game. Use getInternalLink with internalLinkTypeGame to share the game
+    :param photo: Game photo
+    :param animation: Game animation; may be null
+    """
+
+    _type: "str" = field(default="game", init=False, repr=False)
+    id: "int" = 0
+    short_name: "str" = ""
+    title: "str" = ""
+    text: "FormattedText | None" = None
+    description: "str" = ""
+    photo: "Photo | None" = None
+    animation: "Animation | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "short_name": self.short_name,
+            "title": self.title,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "description": self.description,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+            "animation": self.animation._to_json_dict() if self.animation is not None else None,
+        }
+
+@dataclass(slots=True)
+class WebApp(ObjectBase):
+    """
+    Describes a Web App. Use getInternalLink with internalLinkTypeWebApp to share the Web App
+
+    :param short_name: Web App short name
+    :param title: Web App title
+    :param description: Describes a Web App. Use getInternalLink with internalLinkTypeWebApp to share the Web App
+    :param photo: Web App photo
+    :param animation: Web App animation; may be null
+    """
+
+    _type: "str" = field(default="webApp", init=False, repr=False)
+    short_name: "str" = ""
+    title: "str" = ""
+    description: "str" = ""
+    photo: "Photo | None" = None
+    animation: "Animation | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "short_name": self.short_name,
+            "title": self.title,
+            "description": self.description,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+            "animation": self.animation._to_json_dict() if self.animation is not None else None,
+        }
+
+@dataclass(slots=True)
+class Poll(ObjectBase):
+    """
+    Describes a poll
+
+    :param id: Unique poll identifier
+    :param question: Poll question; 1-300 characters. Only custom emoji entities are allowed
+    :param options: List of poll answer options
+    :param total_voter_count: Total number of voters, participating in the poll
+    :param recent_voter_ids: Identifiers of recent voters, if the poll is non-anonymous
+    :param is_anonymous: True, if the poll is anonymous
+    :param type: Type of the poll
+    :param open_period: Amount of time the poll will be active after creation, in seconds
+    :param close_date: Point in time (Unix timestamp) when the poll will automatically be closed
+    :param is_closed: True, if the poll is closed
+    """
+
+    _type: "str" = field(default="poll", init=False, repr=False)
+    id: "int" = 0
+    question: "FormattedText | None" = None
+    options: "list[PollOption] | None" = None
+    total_voter_count: "int" = 0
+    recent_voter_ids: "list[MessageSender] | None" = None
+    is_anonymous: "bool" = False
+    type: "PollType | None" = None
+    open_period: "int" = 0
+    close_date: "int" = 0
+    is_closed: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "question": self.question._to_json_dict() if self.question is not None else None,
+            "options": _list_to_json(self.options),
+            "total_voter_count": self.total_voter_count,
+            "recent_voter_ids": _list_to_json(self.recent_voter_ids),
+            "is_anonymous": self.is_anonymous,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "open_period": self.open_period,
+            "close_date": self.close_date,
+            "is_closed": self.is_closed,
+        }
+
+@dataclass(slots=True)
+class AlternativeVideo(ObjectBase):
+    """
+    Describes an alternative re-encoded quality of a video file
+
+    :param id: Unique identifier of the alternative video, which is used in the HLS file
+    :param width: Video width
+    :param height: Video height
+    :param codec: Codec used for video file encoding, for example, "h264", "h265", or "av1"
+    :param hls_file: HLS file describing the video
+    :param video: File containing the video
+    """
+
+    _type: "str" = field(default="alternativeVideo", init=False, repr=False)
+    id: "int" = 0
+    width: "int" = 0
+    height: "int" = 0
+    codec: "str" = ""
+    hls_file: "File | None" = None
+    video: "File | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "width": self.width,
+            "height": self.height,
+            "codec": self.codec,
+            "hls_file": self.hls_file._to_json_dict() if self.hls_file is not None else None,
+            "video": self.video._to_json_dict() if self.video is not None else None,
+        }
+
+@dataclass(slots=True)
+class VideoStoryboard(ObjectBase):
+    """
+    Describes a storyboard for a video
+
+    :param storyboard_file: A JPEG file that contains tiled previews of video
+    :param width: Width of a tile
+    :param height: Height of a tile
+    :param map_file: File that describes mapping of position in the video to a tile in the JPEG file
+    """
+
+    _type: "str" = field(default="videoStoryboard", init=False, repr=False)
+    storyboard_file: "File | None" = None
+    width: "int" = 0
+    height: "int" = 0
+    map_file: "File | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "storyboard_file": self.storyboard_file._to_json_dict() if self.storyboard_file is not None else None,
+            "width": self.width,
+            "height": self.height,
+            "map_file": self.map_file._to_json_dict() if self.map_file is not None else None,
+        }
+
+@dataclass(slots=True)
+class Background(ObjectBase):
+    """
+    Describes a chat background
+
+    :param id: Unique background identifier
+    :param is_default: True, if this is one of default backgrounds
+    :param is_dark: True, if the background is dark and is recommended to be used with dark theme
+    :param name: Unique background name
+    :param document: Document with the background; may be null. Null only for filled and chat theme backgrounds
+    :param type: Type of the background
+    """
+
+    _type: "str" = field(default="background", init=False, repr=False)
+    id: "int" = 0
+    is_default: "bool" = False
+    is_dark: "bool" = False
+    name: "str" = ""
+    document: "Document | None" = None
+    type: "BackgroundType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "is_default": self.is_default,
+            "is_dark": self.is_dark,
+            "name": self.name,
+            "document": self.document._to_json_dict() if self.document is not None else None,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+@dataclass(slots=True)
+class Backgrounds(ObjectBase):
+    """
+    Contains a list of backgrounds
+
+    :param backgrounds: A list of backgrounds
+    """
+
+    _type: "str" = field(default="backgrounds", init=False, repr=False)
+    backgrounds: "list[Background] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "backgrounds": _list_to_json(self.backgrounds),
+        }
+
+@dataclass(slots=True)
+class ChatBackground(ObjectBase):
+    """
+    Describes a background set for a specific chat
+
+    :param background: The background
+    :param dark_theme_dimming: Dimming of the background in dark themes, as a percentage; 0-100. Applied only to Wallpaper and Fill types of background
+    """
+
+    _type: "str" = field(default="chatBackground", init=False, repr=False)
+    background: "Background | None" = None
+    dark_theme_dimming: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "background": self.background._to_json_dict() if self.background is not None else None,
+            "dark_theme_dimming": self.dark_theme_dimming,
+        }
+
+@dataclass(slots=True)
+class ProfilePhoto(ObjectBase):
+    """
+    Describes a user profile photo
+
+    :param id: Photo identifier; 0 for an empty photo. Can be used to find a photo in a list of user profile photos
+    :param small: A small (160x160) user profile photo. The file can be downloaded only before the photo is changed
+    :param big: A big (640x640) user profile photo. The file can be downloaded only before the photo is changed
+    :param minithumbnail: User profile photo minithumbnail; may be null
+    :param has_animation: True, if the photo has animated variant
+    :param is_personal: True, if the photo is visible only for the current user
+    """
+
+    _type: "str" = field(default="profilePhoto", init=False, repr=False)
+    id: "int" = 0
+    small: "File | None" = None
+    big: "File | None" = None
+    minithumbnail: "Minithumbnail | None" = None
+    has_animation: "bool" = False
+    is_personal: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "small": self.small._to_json_dict() if self.small is not None else None,
+            "big": self.big._to_json_dict() if self.big is not None else None,
+            "minithumbnail": self.minithumbnail._to_json_dict() if self.minithumbnail is not None else None,
+            "has_animation": self.has_animation,
+            "is_personal": self.is_personal,
+        }
+
+@dataclass(slots=True)
+class ChatPhotoInfo(ObjectBase):
+    """
+    Contains basic information about the photo of a chat
+
+    :param small: A small (160x160) chat photo variant in JPEG format. The file can be downloaded only before the photo is changed
+    :param big: A big (640x640) chat photo variant in JPEG format. The file can be downloaded only before the photo is changed
+    :param minithumbnail: Chat photo minithumbnail; may be null
+    :param has_animation: True, if the photo has animated variant
+    :param is_personal: True, if the photo is visible only for the current user
+    """
+
+    _type: "str" = field(default="chatPhotoInfo", init=False, repr=False)
+    small: "File | None" = None
+    big: "File | None" = None
+    minithumbnail: "Minithumbnail | None" = None
+    has_animation: "bool" = False
+    is_personal: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "small": self.small._to_json_dict() if self.small is not None else None,
+            "big": self.big._to_json_dict() if self.big is not None else None,
+            "minithumbnail": self.minithumbnail._to_json_dict() if self.minithumbnail is not None else None,
+            "has_animation": self.has_animation,
+            "is_personal": self.is_personal,
+        }
+
+@dataclass(slots=True)
+class UserType(ObjectBase):
+    """
+    Represents the type of user. The following types are possible: regular users, deleted users and bots
+
+    """
+
+    _type: "str" = field(default="UserType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UserTypeRegular(UserType):
+    """
+    A regular user
+
+    """
+
+    _type: "str" = field(default="userTypeRegular", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UserTypeDeleted(UserType):
+    """
+    A deleted user or deleted bot. No information on the user besides the user identifier is available. It is not possible to perform any active actions on this type of user
+
+    """
+
+    _type: "str" = field(default="userTypeDeleted", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UserTypeBot(UserType):
+    """
+    A bot (see https://core.telegram.org/bots)
+
+    :param can_be_edited: True, if the bot is owned by the current user and can be edited using the methods toggleBotUsernameIsActive, reorderBotActiveUsernames, setBotProfilePhoto, setBotName, setBotInfoDescription, and setBotInfoShortDescription
+    :param can_join_groups: True, if the bot can be invited to basic group and supergroup chats
+    :param can_read_all_group_messages: True, if the bot can read all messages in basic group or supergroup chats and not just those addressed to the bot. In private and channel chats a bot can always read all messages
+    :param has_main_web_app: True, if the bot has the main Web App
+    :param is_inline: True, if the bot supports inline queries
+    :param inline_query_placeholder: Placeholder for inline queries (displayed on the application input field)
+    :param need_location: True, if the location of the user is expected to be sent with every inline query to this bot
+    :param can_connect_to_business: True, if the bot supports connection to Telegram Business accounts
+    :param can_be_added_to_attachment_menu: True, if the bot can be added to attachment or side menu
+    :param active_user_count: The number of recently active users of the bot
+    """
+
+    _type: "str" = field(default="userTypeBot", init=False, repr=False)
+    can_be_edited: "bool" = False
+    can_join_groups: "bool" = False
+    can_read_all_group_messages: "bool" = False
+    has_main_web_app: "bool" = False
+    is_inline: "bool" = False
+    inline_query_placeholder: "str" = ""
+    need_location: "bool" = False
+    can_connect_to_business: "bool" = False
+    can_be_added_to_attachment_menu: "bool" = False
+    active_user_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "can_be_edited": self.can_be_edited,
+            "can_join_groups": self.can_join_groups,
+            "can_read_all_group_messages": self.can_read_all_group_messages,
+            "has_main_web_app": self.has_main_web_app,
+            "is_inline": self.is_inline,
+            "inline_query_placeholder": self.inline_query_placeholder,
+            "need_location": self.need_location,
+            "can_connect_to_business": self.can_connect_to_business,
+            "can_be_added_to_attachment_menu": self.can_be_added_to_attachment_menu,
+            "active_user_count": self.active_user_count,
+        }
+
+@dataclass(slots=True)
+class UserTypeUnknown(UserType):
+    """
+    No information on the user besides the user identifier is available, yet this user has not been deleted. This object is extremely rare and must be handled like a deleted user. It is not possible to perform any actions on users of this type
+
+    """
+
+    _type: "str" = field(default="userTypeUnknown", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class BotCommand(ObjectBase):
+    """
+    Represents a command supported by a bot
+
+    :param command: Text of the bot command
+    :param description: Represents a command supported by a bot
+    """
+
+    _type: "str" = field(default="botCommand", init=False, repr=False)
+    command: "str" = ""
+    description: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "command": self.command,
+            "description": self.description,
+        }
+
+@dataclass(slots=True)
+class BotCommands(ObjectBase):
+    """
+    Contains a list of bot commands
+
+    :param bot_user_id: Bot's user identifier
+    :param commands: List of bot commands
+    """
+
+    _type: "str" = field(default="botCommands", init=False, repr=False)
+    bot_user_id: "int" = 0
+    commands: "list[BotCommand] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "commands": _list_to_json(self.commands),
+        }
+
+@dataclass(slots=True)
+class BotMenuButton(ObjectBase):
+    """
+    Describes a button to be shown instead of bot commands menu button
+
+    :param text: Text of the button
+    :param url: URL of a Web App to open when the button is pressed. If the link is of the type internalLinkTypeWebApp, then it must be processed accordingly. Otherwise, the link must be passed to openWebApp
+    """
+
+    _type: "str" = field(default="botMenuButton", init=False, repr=False)
+    text: "str" = ""
+    url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text,
+            "url": self.url,
+        }
+
+@dataclass(slots=True)
+class BotVerificationParameters(ObjectBase):
+    """
+    Describes parameters of verification that is provided by a bot
+
+    :param icon_custom_emoji_id: Identifier of the custom emoji that is used as the verification sign
+    :param organization_name: Name of the organization that provides verification
+    :param default_custom_description: Default custom description of verification reason to be used as placeholder in setMessageSenderBotVerification; may be null if none
+    :param can_set_custom_description: True, if the bot is allowed to provide custom description for verified entities
+    """
+
+    _type: "str" = field(default="botVerificationParameters", init=False, repr=False)
+    icon_custom_emoji_id: "int" = 0
+    organization_name: "str" = ""
+    default_custom_description: "FormattedText | None" = None
+    can_set_custom_description: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "icon_custom_emoji_id": self.icon_custom_emoji_id,
+            "organization_name": self.organization_name,
+            "default_custom_description": self.default_custom_description._to_json_dict() if self.default_custom_description is not None else None,
+            "can_set_custom_description": self.can_set_custom_description,
+        }
+
+@dataclass(slots=True)
+class BotVerification(ObjectBase):
+    """
+    Describes verification status provided by a bot
+
+    :param bot_user_id: Identifier of the bot that provided the verification
+    :param icon_custom_emoji_id: Identifier of the custom emoji that is used as the verification sign
+    :param custom_description: Custom description of verification reason set by the bot. Can contain only Mention, Hashtag, Cashtag, PhoneNumber, BankCardNumber, Url, and EmailAddress entities
+    """
+
+    _type: "str" = field(default="botVerification", init=False, repr=False)
+    bot_user_id: "int" = 0
+    icon_custom_emoji_id: "int" = 0
+    custom_description: "FormattedText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "icon_custom_emoji_id": self.icon_custom_emoji_id,
+            "custom_description": self.custom_description._to_json_dict() if self.custom_description is not None else None,
+        }
+
+@dataclass(slots=True)
+class VerificationStatus(ObjectBase):
+    """
+    Contains information about verification status of a chat or a user
+
+    :param is_verified: True, if the chat or the user is verified by Telegram
+    :param is_scam: True, if the chat or the user is marked as scam by Telegram
+    :param is_fake: True, if the chat or the user is marked as fake by Telegram
+    :param bot_verification_icon_custom_emoji_id: Identifier of the custom emoji to be shown as verification sign provided by a bot for the user; 0 if none
+    """
+
+    _type: "str" = field(default="verificationStatus", init=False, repr=False)
+    is_verified: "bool" = False
+    is_scam: "bool" = False
+    is_fake: "bool" = False
+    bot_verification_icon_custom_emoji_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_verified": self.is_verified,
+            "is_scam": self.is_scam,
+            "is_fake": self.is_fake,
+            "bot_verification_icon_custom_emoji_id": self.bot_verification_icon_custom_emoji_id,
+        }
+
+@dataclass(slots=True)
+class ChatLocation(ObjectBase):
+    """
+    Represents a location to which a chat is connected
+
+    :param location: The location
+    :param address: Location address; 1-64 characters, as defined by the chat owner
+    """
+
+    _type: "str" = field(default="chatLocation", init=False, repr=False)
+    location: "Location | None" = None
+    address: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "location": self.location._to_json_dict() if self.location is not None else None,
+            "address": self.address,
+        }
+
+@dataclass(slots=True)
+class Birthdate(ObjectBase):
+    """
+    Represents a birthdate of a user
+
+    :param day: Day of the month; 1-31
+    :param month: Month of the year; 1-12
+    :param year: Birth year; 0 if unknown
+    """
+
+    _type: "str" = field(default="birthdate", init=False, repr=False)
+    day: "int" = 0
+    month: "int" = 0
+    year: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "day": self.day,
+            "month": self.month,
+            "year": self.year,
+        }
+
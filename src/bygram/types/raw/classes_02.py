@@ -0,0 +1,1379 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import File, FormattedText, InputFile, Minithumbnail, PhotoSize
+    from .classes_01 import Birthdate, Location, Photo, Sticker
+    from .classes_18 import BackgroundFill
+
+@dataclass(slots=True)
+class CloseBirthdayUser(ObjectBase):
+    """
+    Describes a user that had or will have a birthday soon
+
+    :param user_id: User identifier
+    :param birthdate: Birthdate of the user
+    """
+
+    _type: "str" = field(default="closeBirthdayUser", init=False, repr=False)
+    user_id: "int" = 0
+    birthdate: "Birthdate | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "birthdate": self.birthdate._to_json_dict() if self.birthdate is not None else None,
+        }
+
+@dataclass(slots=True)
+class BusinessAwayMessageSchedule(ObjectBase):
+    """
+    Describes conditions for sending of away messages by a Telegram Business account
+
+    """
+
+    _type: "str" = field(default="BusinessAwayMessageSchedule", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class BusinessAwayMessageScheduleAlways(BusinessAwayMessageSchedule):
+    """
+    Send away messages always
+
+    """
+
+    _type: "str" = field(default="businessAwayMessageScheduleAlways", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class BusinessAwayMessageScheduleOutsideOfOpeningHours(BusinessAwayMessageSchedule):
+    """
+    Send away messages outside of the business opening hours
+
+    """
+
+    _type: "str" = field(default="businessAwayMessageScheduleOutsideOfOpeningHours", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class BusinessAwayMessageScheduleCustom(BusinessAwayMessageSchedule):
+    """
+    Send away messages only in the specified time span
+
+    :param start_date: Point in time (Unix timestamp) when the away messages will start to be sent
+    :param end_date: Point in time (Unix timestamp) when the away messages will stop to be sent
+    """
+
+    _type: "str" = field(default="businessAwayMessageScheduleCustom", init=False, repr=False)
+    start_date: "int" = 0
+    end_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+        }
+
+@dataclass(slots=True)
+class BusinessLocation(ObjectBase):
+    """
+    Represents a location of a business
+
+    :param location: The location; may be null if not specified
+    :param address: Location address; 1-96 characters
+    """
+
+    _type: "str" = field(default="businessLocation", init=False, repr=False)
+    location: "Location | None" = None
+    address: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "location": self.location._to_json_dict() if self.location is not None else None,
+            "address": self.address,
+        }
+
+@dataclass(slots=True)
+class BusinessRecipients(ObjectBase):
+    """
+    Describes private chats chosen for automatic interaction with a business
+
+    :param chat_ids: Identifiers of selected private chats
+    :param excluded_chat_ids: Identifiers of private chats that are always excluded; for businessConnectedBot only
+    :param select_existing_chats: True, if all existing private chats are selected
+    :param select_new_chats: True, if all new private chats are selected
+    :param select_contacts: True, if all private chats with contacts are selected
+    :param select_non_contacts: True, if all private chats with non-contacts are selected
+    :param exclude_selected: If true, then all private chats except the selected are chosen. Otherwise, only the selected chats are chosen
+    """
+
+    _type: "str" = field(default="businessRecipients", init=False, repr=False)
+    chat_ids: "list[int] | None" = None
+    excluded_chat_ids: "list[int] | None" = None
+    select_existing_chats: "bool" = False
+    select_new_chats: "bool" = False
+    select_contacts: "bool" = False
+    select_non_contacts: "bool" = False
+    exclude_selected: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_ids": self.chat_ids,
+            "excluded_chat_ids": self.excluded_chat_ids,
+            "select_existing_chats": self.select_existing_chats,
+            "select_new_chats": self.select_new_chats,
+            "select_contacts": self.select_contacts,
+            "select_non_contacts": self.select_non_contacts,
+            "exclude_selected": self.exclude_selected,
+        }
+
+@dataclass(slots=True)
+class BusinessAwayMessageSettings(ObjectBase):
+    """
+    Describes settings for messages that are automatically sent by a Telegram Business account when it is away
+
+    :param shortcut_id: Unique quick reply shortcut identifier for the away messages
+    :param recipients: Chosen recipients of the away messages
+    :param schedule: Settings used to check whether the current user is away
+    :param offline_only: True, if the messages must not be sent if the account was online in the last 10 minutes
+    """
+
+    _type: "str" = field(default="businessAwayMessageSettings", init=False, repr=False)
+    shortcut_id: "int" = 0
+    recipients: "BusinessRecipients | None" = None
+    schedule: "BusinessAwayMessageSchedule | None" = None
+    offline_only: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "shortcut_id": self.shortcut_id,
+            "recipients": self.recipients._to_json_dict() if self.recipients is not None else None,
+            "schedule": self.schedule._to_json_dict() if self.schedule is not None else None,
+            "offline_only": self.offline_only,
+        }
+
+@dataclass(slots=True)
+class BusinessGreetingMessageSettings(ObjectBase):
+    """
+    Describes settings for greeting messages that are automatically sent by a Telegram Business account as response to incoming messages in an inactive private chat
+
+    :param shortcut_id: Unique quick reply shortcut identifier for the greeting messages
+    :param recipients: Chosen recipients of the greeting messages
+    :param inactivity_days: The number of days after which a chat will be considered as inactive; currently, must be on of 7, 14, 21, or 28
+    """
+
+    _type: "str" = field(default="businessGreetingMessageSettings", init=False, repr=False)
+    shortcut_id: "int" = 0
+    recipients: "BusinessRecipients | None" = None
+    inactivity_days: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "shortcut_id": self.shortcut_id,
+            "recipients": self.recipients._to_json_dict() if self.recipients is not None else None,
+            "inactivity_days": self.inactivity_days,
+        }
+
+@dataclass(slots=True)
+class BusinessBotRights(ObjectBase):
+    """
+    Describes rights of a business bot
+
+    :param can_reply: True, if the bot can send and edit messages in the private chats that had incoming messages in the last 24 hours
+    :param can_read_messages: True, if the bot can mark incoming private messages as read
+    :param can_delete_sent_messages: True, if the bot can delete sent messages
+    :param can_delete_all_messages: True, if the bot can delete any message
+    :param can_edit_name: True, if the bot can edit name of the business account
+    :param can_edit_bio: True, if the bot can edit bio of the business account
+    :param can_edit_profile_photo: True, if the bot can edit profile photo of the business account
+    :param can_edit_username: True, if the bot can edit username of the business account
+    :param can_view_gifts_and_stars: True, if the bot can view gifts and amount of Telegram Stars owned by the business account
+    :param can_sell_gifts: True, if the bot can sell regular gifts received by the business account
+    :param can_change_gift_settings: True, if the bot can change gift receiving settings of the business account
+    :param can_transfer_and_upgrade_gifts: True, if the bot can transfer and upgrade gifts received by the business account
+    :param can_transfer_stars: True, if the bot can transfer Telegram Stars received by the business account to account of the bot, or use them to upgrade and transfer gifts
+    :param can_manage_stories: True, if the bot can post, edit and delete stories
+    """
+
+    _type: "str" = field(default="businessBotRights", init=False, repr=False)
+    can_reply: "bool" = False
+    can_read_messages: "bool" = False
+    can_delete_sent_messages: "bool" = False
+    can_delete_all_messages: "bool" = False
+    can_edit_name: "bool" = False
+    can_edit_bio: "bool" = False
+    can_edit_profile_photo: "bool" = False
+    can_edit_username: "bool" = False
+    can_view_gifts_and_stars: "bool" = False
+    can_sell_gifts: "bool" = False
+    can_change_gift_settings: "bool" = False
+    can_transfer_and_upgrade_gifts: "bool" = False
+    can_transfer_stars: "bool" = False
+    can_manage_stories: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "can_reply": self.can_reply,
+            "can_read_messages": self.can_read_messages,
+            "can_delete_sent_messages": self.can_delete_sent_messages,
+            "can_delete_all_messages": self.can_delete_all_messages,
+            "can_edit_name": self.can_edit_name,
+            "can_edit_bio": self.can_edit_bio,
+            "can_edit_profile_photo": self.can_edit_profile_photo,
+            "can_edit_username": self.can_edit_username,
+            "can_view_gifts_and_stars": self.can_view_gifts_and_stars,
+            "can_sell_gifts": self.can_sell_gifts,
+            "can_change_gift_settings": self.can_change_gift_settings,
+            "can_transfer_and_upgrade_gifts": self.can_transfer_and_upgrade_gifts,
+            "can_transfer_stars": self.can_transfer_stars,
+            "can_manage_stories": self.can_manage_stories,
+        }
+
+@dataclass(slots=True)
+class BusinessConnectedBot(ObjectBase):
+    """
+    Describes a bot connected to a business account
+
+    :param bot_user_id: User identifier of the bot
+    :param recipients: Private chats that will be accessible to the bot
+    :param rights: Rights of the bot
+    """
+
+    _type: "str" = field(default="businessConnectedBot", init=False, repr=False)
+    bot_user_id: "int" = 0
+    recipients: "BusinessRecipients | None" = None
+    rights: "BusinessBotRights | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "recipients": self.recipients._to_json_dict() if self.recipients is not None else None,
+            "rights": self.rights._to_json_dict() if self.rights is not None else None,
+        }
+
+@dataclass(slots=True)
+class BusinessStartPage(ObjectBase):
+    """
+    Describes settings for a business account start page
+
+    :param title: Title text of the start page
+    :param message: Message text of the start page
+    :param sticker: Greeting sticker of the start page; may be null if none
+    """
+
+    _type: "str" = field(default="businessStartPage", init=False, repr=False)
+    title: "str" = ""
+    message: "str" = ""
+    sticker: "Sticker | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "title": self.title,
+            "message": self.message,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputBusinessStartPage(ObjectBase):
+    """
+    Describes settings for a business account start page to set
+
+    :param title: Title text of the start page; 0-getOption("business_start_page_title_length_max") characters
+    :param message: Message text of the start page; 0-getOption("business_start_page_message_length_max") characters
+    :param sticker: Greeting sticker of the start page; pass null if none. The sticker must belong to a sticker set and must not be a custom emoji
+    """
+
+    _type: "str" = field(default="inputBusinessStartPage", init=False, repr=False)
+    title: "str" = ""
+    message: "str" = ""
+    sticker: "InputFile | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "title": self.title,
+            "message": self.message,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+        }
+
+@dataclass(slots=True)
+class BusinessOpeningHoursInterval(ObjectBase):
+    """
+    Describes an interval of time when the business is open
+
+    :param start_minute: The minute's sequence number in a week, starting on Monday, marking the start of the time interval during which the business is open; 0-7*24*60
+    :param end_minute: The minute's sequence number in a week, starting on Monday, marking the end of the time interval during which the business is open; 1-8*24*60
+    """
+
+    _type: "str" = field(default="businessOpeningHoursInterval", init=False, repr=False)
+    start_minute: "int" = 0
+    end_minute: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "start_minute": self.start_minute,
+            "end_minute": self.end_minute,
+        }
+
+@dataclass(slots=True)
+class BusinessOpeningHours(ObjectBase):
+    """
+    Describes opening hours of a business
+
+    :param time_zone_id: Unique time zone identifier
+    :param opening_hours: Intervals of the time when the business is open
+    """
+
+    _type: "str" = field(default="businessOpeningHours", init=False, repr=False)
+    time_zone_id: "str" = ""
+    opening_hours: "list[BusinessOpeningHoursInterval] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "time_zone_id": self.time_zone_id,
+            "opening_hours": _list_to_json(self.opening_hours),
+        }
+
+@dataclass(slots=True)
+class BusinessInfo(ObjectBase):
+    """
+    Contains information about a Telegram Business account
+
+    :param location: Location of the business; may be null if none
+    :param opening_hours: Opening hours of the business; may be null if none. The hours are guaranteed to be valid and has already been split by week days
+    :param local_opening_hours: Opening hours of the business in the local time; may be null if none. The hours are guaranteed to be valid and has already been split by week days.
+     Local time zone identifier will be empty. An updateUserFullInfo update is not triggered when value of this field changes
+    :param next_open_in: Time left before the business will open the next time, in seconds; 0 if unknown. An updateUserFullInfo update is not triggered when value of this field changes
+    :param next_close_in: Time left before the business will close the next time, in seconds; 0 if unknown. An updateUserFullInfo update is not triggered when value of this field changes
+    :param greeting_message_settings: The greeting message; may be null if none or the Business account is not of the current user
+    :param away_message_settings: The away message; may be null if none or the Business account is not of the current user
+    :param start_page: Information about start page of the account; may be null if none
+    """
+
+    _type: "str" = field(default="businessInfo", init=False, repr=False)
+    location: "BusinessLocation | None" = None
+    opening_hours: "BusinessOpeningHours | None" = None
+    local_opening_hours: "BusinessOpeningHours | None" = None
+    next_open_in: "int" = 0
+    next_close_in: "int" = 0
+    greeting_message_settings: "BusinessGreetingMessageSettings | None" = None
+    away_message_settings: "BusinessAwayMessageSettings | None" = None
+    start_page: "BusinessStartPage | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "location": self.location._to_json_dict() if self.location is not None else None,
+            "opening_hours": self.opening_hours._to_json_dict() if self.opening_hours is not None else None,
+            "local_opening_hours": self.local_opening_hours._to_json_dict() if self.local_opening_hours is not None else None,
+            "next_open_in": self.next_open_in,
+            "next_close_in": self.next_close_in,
+            "greeting_message_settings": self.greeting_message_settings._to_json_dict() if self.greeting_message_settings is not None else None,
+            "away_message_settings": self.away_message_settings._to_json_dict() if self.away_message_settings is not None else None,
+            "start_page": self.start_page._to_json_dict() if self.start_page is not None else None,
+        }
+
+@dataclass(slots=True)
+class BusinessChatLink(ObjectBase):
+    """
+    Contains information about a business chat link
+
+    :param link: The HTTPS link
+    :param text: Message draft text that will be added to the input field
+    :param title: Link title
+    :param view_count: Number of times the link was used
+    """
+
+    _type: "str" = field(default="businessChatLink", init=False, repr=False)
+    link: "str" = ""
+    text: "FormattedText | None" = None
+    title: "str" = ""
+    view_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "link": self.link,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "title": self.title,
+            "view_count": self.view_count,
+        }
+
+@dataclass(slots=True)
+class BusinessChatLinks(ObjectBase):
+    """
+    Contains a list of business chat links created by the user
+
+    :param links: List of links
+    """
+
+    _type: "str" = field(default="businessChatLinks", init=False, repr=False)
+    links: "list[BusinessChatLink] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "links": _list_to_json(self.links),
+        }
+
+@dataclass(slots=True)
+class InputBusinessChatLink(ObjectBase):
+    """
+    Describes a business chat link to create or edit
+
+    :param text: Message draft text that will be added to the input field
+    :param title: Link title
+    """
+
+    _type: "str" = field(default="inputBusinessChatLink", init=False, repr=False)
+    text: "FormattedText | None" = None
+    title: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "title": self.title,
+        }
+
+@dataclass(slots=True)
+class BusinessChatLinkInfo(ObjectBase):
+    """
+    Contains information about a business chat link
+
+    :param chat_id: Identifier of the private chat that created the link
+    :param text: Message draft text that must be added to the input field
+    """
+
+    _type: "str" = field(default="businessChatLinkInfo", init=False, repr=False)
+    chat_id: "int" = 0
+    text: "FormattedText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatPhotoStickerType(ObjectBase):
+    """
+    Describes type of sticker, which was used to create a chat photo
+
+    """
+
+    _type: "str" = field(default="ChatPhotoStickerType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatPhotoStickerTypeRegularOrMask(ChatPhotoStickerType):
+    """
+    Information about the sticker, which was used to create the chat photo
+
+    :param sticker_set_id: Sticker set identifier
+    :param sticker_id: Identifier of the sticker in the set
+    """
+
+    _type: "str" = field(default="chatPhotoStickerTypeRegularOrMask", init=False, repr=False)
+    sticker_set_id: "int" = 0
+    sticker_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker_set_id": self.sticker_set_id,
+            "sticker_id": self.sticker_id,
+        }
+
+@dataclass(slots=True)
+class ChatPhotoStickerTypeCustomEmoji(ChatPhotoStickerType):
+    """
+    Information about the custom emoji, which was used to create the chat photo
+
+    :param custom_emoji_id: Identifier of the custom emoji
+    """
+
+    _type: "str" = field(default="chatPhotoStickerTypeCustomEmoji", init=False, repr=False)
+    custom_emoji_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "custom_emoji_id": self.custom_emoji_id,
+        }
+
+@dataclass(slots=True)
+class ChatPhotoSticker(ObjectBase):
+    """
+    Information about the sticker, which was used to create the chat photo. The sticker is shown at the center of the photo and occupies at most 67% of it
+
+    :param type: Type of the sticker
+    :param background_fill: The fill to be used as background for the sticker; rotation angle in backgroundFillGradient isn't supported
+    """
+
+    _type: "str" = field(default="chatPhotoSticker", init=False, repr=False)
+    type: "ChatPhotoStickerType | None" = None
+    background_fill: "BackgroundFill | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "background_fill": self.background_fill._to_json_dict() if self.background_fill is not None else None,
+        }
+
+@dataclass(slots=True)
+class AnimatedChatPhoto(ObjectBase):
+    """
+    Animated variant of a chat photo in MPEG4 format
+
+    :param length: Animation width and height
+    :param file: Information about the animation file
+    :param main_frame_timestamp: Timestamp of the frame, used as a static chat photo
+    """
+
+    _type: "str" = field(default="animatedChatPhoto", init=False, repr=False)
+    length: "int" = 0
+    file: "File | None" = None
+    main_frame_timestamp: "float" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "length": self.length,
+            "file": self.file._to_json_dict() if self.file is not None else None,
+            "main_frame_timestamp": self.main_frame_timestamp,
+        }
+
+@dataclass(slots=True)
+class ChatPhoto(ObjectBase):
+    """
+    Describes a chat or user profile photo
+
+    :param id: Unique photo identifier
+    :param added_date: Point in time (Unix timestamp) when the photo has been added
+    :param minithumbnail: Photo minithumbnail; may be null
+    :param sizes: Available variants of the photo in JPEG format, in different size
+    :param animation: A big (up to 1280x1280) animated variant of the photo in MPEG4 format; may be null
+    :param small_animation: A small (160x160) animated variant of the photo in MPEG4 format; may be null even if the big animation is available
+    :param sticker: Sticker-based version of the chat photo; may be null
+    """
+
+    _type: "str" = field(default="chatPhoto", init=False, repr=False)
+    id: "int" = 0
+    added_date: "int" = 0
+    minithumbnail: "Minithumbnail | None" = None
+    sizes: "list[PhotoSize] | None" = None
+    animation: "AnimatedChatPhoto | None" = None
+    small_animation: "AnimatedChatPhoto | None" = None
+    sticker: "ChatPhotoSticker | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "added_date": self.added_date,
+            "minithumbnail": self.minithumbnail._to_json_dict() if self.minithumbnail is not None else None,
+            "sizes": _list_to_json(self.sizes),
+            "animation": self.animation._to_json_dict() if self.animation is not None else None,
+            "small_animation": self.small_animation._to_json_dict() if self.small_animation is not None else None,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatPhotos(ObjectBase):
+    """
+    Contains a list of chat or user profile photos
+
+    :param total_count: Total number of photos
+    :param photos: List of photos
+    """
+
+    _type: "str" = field(default="chatPhotos", init=False, repr=False)
+    total_count: "int" = 0
+    photos: "list[ChatPhoto] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "photos": _list_to_json(self.photos),
+        }
+
+@dataclass(slots=True)
+class InputChatPhoto(ObjectBase):
+    """
+    Describes a photo to be set as a user profile or chat photo
+
+    """
+
+    _type: "str" = field(default="InputChatPhoto", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InputChatPhotoPrevious(InputChatPhoto):
+    """
+    A previously used profile photo of the current user
+
+    :param chat_photo_id: Identifier of the current user's profile photo to reuse
+    """
+
+    _type: "str" = field(default="inputChatPhotoPrevious", init=False, repr=False)
+    chat_photo_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_photo_id": self.chat_photo_id,
+        }
+
+@dataclass(slots=True)
+class InputChatPhotoStatic(InputChatPhoto):
+    """
+    A static photo in JPEG format
+
+    :param photo: Photo to be set as profile photo. Only inputFileLocal and inputFileGenerated are allowed
+    """
+
+    _type: "str" = field(default="inputChatPhotoStatic", init=False, repr=False)
+    photo: "InputFile | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputChatPhotoAnimation(InputChatPhoto):
+    """
+    An animation in MPEG4 format; must be square, at most 10 seconds long, have width between 160 and 1280 and be at most 2MB in size
+
+    :param animation: Animation to be set as profile photo. Only inputFileLocal and inputFileGenerated are allowed
+    :param main_frame_timestamp: Timestamp of the frame, which will be used as static chat photo
+    """
+
+    _type: "str" = field(default="inputChatPhotoAnimation", init=False, repr=False)
+    animation: "InputFile | None" = None
+    main_frame_timestamp: "float" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "animation": self.animation._to_json_dict() if self.animation is not None else None,
+            "main_frame_timestamp": self.main_frame_timestamp,
+        }
+
+@dataclass(slots=True)
+class InputChatPhotoSticker(InputChatPhoto):
+    """
+    A sticker on a custom background
+
+    :param sticker: Information about the sticker
+    """
+
+    _type: "str" = field(default="inputChatPhotoSticker", init=False, repr=False)
+    sticker: "ChatPhotoSticker | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatPermissions(ObjectBase):
+    """
+    Describes actions that a user is allowed to take in a chat
+
+    :param can_send_basic_messages: True, if the user can send text messages, contacts, giveaways, giveaway winners, invoices, locations, and venues
+    :param can_send_audios: True, if the user can send music files
+    :param can_send_documents: True, if the user can send documents
+    :param can_send_photos: True, if the user can send photos
+    :param can_send_videos: True, if the user can send videos
+    :param can_send_video_notes: True, if the user can send video notes
+    :param can_send_voice_notes: True, if the user can send voice notes
+    :param can_send_polls: True, if the user can send polls and checklists
+    :param can_send_other_messages: True, if the user can send animations, games, stickers, and dice and use inline bots
+    :param can_add_link_previews: True, if the user may add a link preview to their messages
+    :param can_change_info: True, if the user can change the chat title, photo, and other settings
+    :param can_invite_users: True, if the user can invite new users to the chat
+    :param can_pin_messages: True, if the user can pin messages
+    :param can_create_topics: True, if the user can create topics
+    """
+
+    _type: "str" = field(default="chatPermissions", init=False, repr=False)
+    can_send_basic_messages: "bool" = False
+    can_send_audios: "bool" = False
+    can_send_documents: "bool" = False
+    can_send_photos: "bool" = False
+    can_send_videos: "bool" = False
+    can_send_video_notes: "bool" = False
+    can_send_voice_notes: "bool" = False
+    can_send_polls: "bool" = False
+    can_send_other_messages: "bool" = False
+    can_add_link_previews: "bool" = False
+    can_change_info: "bool" = False
+    can_invite_users: "bool" = False
+    can_pin_messages: "bool" = False
+    can_create_topics: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "can_send_basic_messages": self.can_send_basic_messages,
+            "can_send_audios": self.can_send_audios,
+            "can_send_documents": self.can_send_documents,
+            "can_send_photos": self.can_send_photos,
+            "can_send_videos": self.can_send_videos,
+            "can_send_video_notes": self.can_send_video_notes,
+            "can_send_voice_notes": self.can_send_voice_notes,
+            "can_send_polls": self.can_send_polls,
+            "can_send_other_messages": self.can_send_other_messages,
+            "can_add_link_previews": self.can_add_link_previews,
+            "can_change_info": self.can_change_info,
+            "can_invite_users": self.can_invite_users,
+            "can_pin_messages": self.can_pin_messages,
+            "can_create_topics": self.can_create_topics,
+        }
+
+@dataclass(slots=True)
+class ChatAdministratorRights(ObjectBase):
+    """
+    Describes rights of the administrator
+
+    :param can_manage_chat: True, if the administrator can access the chat event log, get boost list, see hidden supergroup and channel members, report supergroup spam messages,
+     ignore slow mode, and send messages to the chat without paying Telegram Stars. Implied by any other privilege; applicable to supergroups and channels only
+    :param can_change_info: True, if the administrator can change the chat title, photo, and other settings
+    :param can_post_messages: True, if the administrator can create channel posts, approve suggested channel posts, or view channel statistics; applicable to channels only
+    :param can_edit_messages: True, if the administrator can edit messages of other users and pin messages; applicable to channels only
+    :param can_delete_messages: True, if the administrator can delete messages of other users
+    :param can_invite_users: True, if the administrator can invite new users to the chat
+    :param can_restrict_members: True, if the administrator can restrict, ban, or unban chat members or view supergroup statistics; always true for channels
+    :param can_pin_messages: True, if the administrator can pin messages; applicable to basic groups and supergroups only
+    :param can_manage_topics: True, if the administrator can create, rename, close, reopen, hide, and unhide forum topics; applicable to forum supergroups only
+    :param can_promote_members: True, if the administrator can add new administrators with a subset of their own privileges or demote administrators that were directly or indirectly promoted by them
+    :param can_manage_video_chats: True, if the administrator can manage video chats
+    :param can_post_stories: True, if the administrator can create new chat stories, or edit and delete posted stories; applicable to supergroups and channels only
+    :param can_edit_stories: True, if the administrator can edit stories posted by other users, post stories to the chat page, pin chat stories, and access story archive; applicable to supergroups and channels only
+    :param can_delete_stories: True, if the administrator can delete stories posted by other users; applicable to supergroups and channels only
+    :param can_manage_direct_messages: True, if the administrator can answer to channel direct messages; applicable to channels only
+    :param is_anonymous: True, if the administrator isn't shown in the chat member list and sends messages anonymously; applicable to supergroups only
+    """
+
+    _type: "str" = field(default="chatAdministratorRights", init=False, repr=False)
+    can_manage_chat: "bool" = False
+    can_change_info: "bool" = False
+    can_post_messages: "bool" = False
+    can_edit_messages: "bool" = False
+    can_delete_messages: "bool" = False
+    can_invite_users: "bool" = False
+    can_restrict_members: "bool" = False
+    can_pin_messages: "bool" = False
+    can_manage_topics: "bool" = False
+    can_promote_members: "bool" = False
+    can_manage_video_chats: "bool" = False
+    can_post_stories: "bool" = False
+    can_edit_stories: "bool" = False
+    can_delete_stories: "bool" = False
+    can_manage_direct_messages: "bool" = False
+    is_anonymous: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "can_manage_chat": self.can_manage_chat,
+            "can_change_info": self.can_change_info,
+            "can_post_messages": self.can_post_messages,
+            "can_edit_messages": self.can_edit_messages,
+            "can_delete_messages": self.can_delete_messages,
+            "can_invite_users": self.can_invite_users,
+            "can_restrict_members": self.can_restrict_members,
+            "can_pin_messages": self.can_pin_messages,
+            "can_manage_topics": self.can_manage_topics,
+            "can_promote_members": self.can_promote_members,
+            "can_manage_video_chats": self.can_manage_video_chats,
+            "can_post_stories": self.can_post_stories,
+            "can_edit_stories": self.can_edit_stories,
+            "can_delete_stories": self.can_delete_stories,
+            "can_manage_direct_messages": self.can_manage_direct_messages,
+            "is_anonymous": self.is_anonymous,
+        }
+
+@dataclass(slots=True)
+class SuggestedPostPrice(ObjectBase):
+    """
+    Describes price of a suggested post
+
+    """
+
+    _type: "str" = field(default="SuggestedPostPrice", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SuggestedPostPriceStar(SuggestedPostPrice):
+    """
+    Describes price of a suggested post in Telegram Stars
+
+    :param star_count: The amount of Telegram Stars agreed to pay for the post; getOption("suggested_post_star_count_min")-getOption("suggested_post_star_count_max")
+    """
+
+    _type: "str" = field(default="suggestedPostPriceStar", init=False, repr=False)
+    star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "star_count": self.star_count,
+        }
+
+@dataclass(slots=True)
+class SuggestedPostPriceTon(SuggestedPostPrice):
+    """
+    Describes price of a suggested post in Toncoins
+
+    :param toncoin_cent_count: The amount of 1/100 of Toncoin agreed to pay for the post; getOption("suggested_post_toncoin_cent_count_min")-getOption("suggested_post_toncoin_cent_count_max")
+    """
+
+    _type: "str" = field(default="suggestedPostPriceTon", init=False, repr=False)
+    toncoin_cent_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "toncoin_cent_count": self.toncoin_cent_count,
+        }
+
+@dataclass(slots=True)
+class SuggestedPostState(ObjectBase):
+    """
+    Describes state of a suggested post
+
+    """
+
+    _type: "str" = field(default="SuggestedPostState", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SuggestedPostStatePending(SuggestedPostState):
+    """
+    The post must be approved or declined
+
+    """
+
+    _type: "str" = field(default="suggestedPostStatePending", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SuggestedPostStateApproved(SuggestedPostState):
+    """
+    The post was approved
+
+    """
+
+    _type: "str" = field(default="suggestedPostStateApproved", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SuggestedPostStateDeclined(SuggestedPostState):
+    """
+    The post was declined
+
+    """
+
+    _type: "str" = field(default="suggestedPostStateDeclined", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SuggestedPostInfo(ObjectBase):
+    """
+    Contains information about a suggested post. If the post can be approved or declined, then changes to the post can be also suggested. Use sendMessage with reply to the message and suggested post information to suggest message changes. Use addOffer to suggest price or time changes
+
+    :param price: Price of the suggested post; may be null if the post is non-paid
+    :param send_date: Point in time (Unix timestamp) when the post is expected to be published; 0 if the specific date isn't set yet
+    :param state: State of the post
+    :param can_be_approved: True, if the suggested post can be approved by the current user using approveSuggestedPost; updates aren't sent when value of this field changes
+    :param can_be_declined: True, if the suggested post can be declined by the current user using declineSuggestedPost; updates aren't sent when value of this field changes
+    """
+
+    _type: "str" = field(default="suggestedPostInfo", init=False, repr=False)
+    price: "SuggestedPostPrice | None" = None
+    send_date: "int" = 0
+    state: "SuggestedPostState | None" = None
+    can_be_approved: "bool" = False
+    can_be_declined: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "price": self.price._to_json_dict() if self.price is not None else None,
+            "send_date": self.send_date,
+            "state": self.state._to_json_dict() if self.state is not None else None,
+            "can_be_approved": self.can_be_approved,
+            "can_be_declined": self.can_be_declined,
+        }
+
+@dataclass(slots=True)
+class InputSuggestedPostInfo(ObjectBase):
+    """
+    Contains information about a post to suggest
+
+    :param price: Price of the suggested post; pass null to suggest a post without payment. If the current user isn't an administrator of the channel direct messages chat
+     and has no enough funds to pay for the post, then the error "BALANCE_TOO_LOW" will be returned immediately
+    :param send_date: Point in time (Unix timestamp) when the post is expected to be published; pass 0 if the date isn't restricted. If specified,
+     then the date must be getOption("suggested_post_send_delay_min")-getOption("suggested_post_send_delay_max") seconds in the future
+    """
+
+    _type: "str" = field(default="inputSuggestedPostInfo", init=False, repr=False)
+    price: "SuggestedPostPrice | None" = None
+    send_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "price": self.price._to_json_dict() if self.price is not None else None,
+            "send_date": self.send_date,
+        }
+
+@dataclass(slots=True)
+class SuggestedPostRefundReason(ObjectBase):
+    """
+    Describes reason for refund of the payment for a suggested post
+
+    """
+
+    _type: "str" = field(default="SuggestedPostRefundReason", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SuggestedPostRefundReasonPostDeleted(SuggestedPostRefundReason):
+    """
+    The post was refunded, because it was deleted by channel administrators in less than getOption("suggested_post_lifetime_min") seconds
+
+    """
+
+    _type: "str" = field(default="suggestedPostRefundReasonPostDeleted", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SuggestedPostRefundReasonPaymentRefunded(SuggestedPostRefundReason):
+    """
+    The post was refunded, because the payment for the post was refunded
+
+    """
+
+    _type: "str" = field(default="suggestedPostRefundReasonPaymentRefunded", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StarAmount(ObjectBase):
+    """
+    Describes a possibly non-integer amount of Telegram Stars
+
+    :param star_count: The integer amount of Telegram Stars rounded to 0
+    :param nanostar_count: The number of 1/1000000000 shares of Telegram Stars; from -999999999 to 999999999
+    """
+
+    _type: "str" = field(default="starAmount", init=False, repr=False)
+    star_count: "int" = 0
+    nanostar_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "star_count": self.star_count,
+            "nanostar_count": self.nanostar_count,
+        }
+
+@dataclass(slots=True)
+class StarSubscriptionType(ObjectBase):
+    """
+    Describes type of subscription paid in Telegram Stars
+
+    """
+
+    _type: "str" = field(default="StarSubscriptionType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StarSubscriptionTypeChannel(StarSubscriptionType):
+    """
+    Describes a subscription to a channel chat
+
+    :param can_reuse: True, if the subscription is active and the user can use the method reuseStarSubscription to join the subscribed chat again
+    :param invite_link: The invite link that can be used to renew the subscription if it has been expired; may be empty, if the link isn't available anymore
+    """
+
+    _type: "str" = field(default="starSubscriptionTypeChannel", init=False, repr=False)
+    can_reuse: "bool" = False
+    invite_link: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "can_reuse": self.can_reuse,
+            "invite_link": self.invite_link,
+        }
+
+@dataclass(slots=True)
+class StarSubscriptionTypeBot(StarSubscriptionType):
+    """
+    Describes a subscription in a bot or a business account
+
+    :param is_canceled_by_bot: True, if the subscription was canceled by the bot and can't be extended
+    :param title: Subscription invoice title
+    :param photo: Subscription invoice photo
+    :param invoice_link: The link to the subscription invoice
+    """
+
+    _type: "str" = field(default="starSubscriptionTypeBot", init=False, repr=False)
+    is_canceled_by_bot: "bool" = False
+    title: "str" = ""
+    photo: "Photo | None" = None
+    invoice_link: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_canceled_by_bot": self.is_canceled_by_bot,
+            "title": self.title,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+            "invoice_link": self.invoice_link,
+        }
+
+@dataclass(slots=True)
+class StarSubscriptionPricing(ObjectBase):
+    """
+    Describes subscription plan paid in Telegram Stars
+
+    :param period: The number of seconds between consecutive Telegram Star debiting
+    :param star_count: The amount of Telegram Stars that must be paid for each period
+    """
+
+    _type: "str" = field(default="starSubscriptionPricing", init=False, repr=False)
+    period: "int" = 0
+    star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "period": self.period,
+            "star_count": self.star_count,
+        }
+
+@dataclass(slots=True)
+class StarSubscription(ObjectBase):
+    """
+    Contains information about subscription to a channel chat, a bot, or a business account that was paid in Telegram Stars
+
+    :param id: Unique identifier of the subscription
+    :param chat_id: Identifier of the chat that is subscribed
+    :param expiration_date: Point in time (Unix timestamp) when the subscription will expire or expired
+    :param is_canceled: True, if the subscription was canceled
+    :param is_expiring: True, if the subscription expires soon and there are no enough Telegram Stars on the user's balance to extend it
+    :param pricing: The subscription plan
+    :param type: Type of the subscription
+    """
+
+    _type: "str" = field(default="starSubscription", init=False, repr=False)
+    id: "str" = ""
+    chat_id: "int" = 0
+    expiration_date: "int" = 0
+    is_canceled: "bool" = False
+    is_expiring: "bool" = False
+    pricing: "StarSubscriptionPricing | None" = None
+    type: "StarSubscriptionType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "chat_id": self.chat_id,
+            "expiration_date": self.expiration_date,
+            "is_canceled": self.is_canceled,
+            "is_expiring": self.is_expiring,
+            "pricing": self.pricing._to_json_dict() if self.pricing is not None else None,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+@dataclass(slots=True)
+class StarSubscriptions(ObjectBase):
+    """
+    Represents a list of Telegram Star subscriptions
+
+    :param star_amount: The amount of owned Telegram Stars
+    :param subscriptions: List of subscriptions for Telegram Stars
+    :param required_star_count: The number of Telegram Stars required to buy to extend subscriptions expiring soon
+    :param next_offset: The offset for the next request. If empty, then there are no more results
+    """
+
+    _type: "str" = field(default="starSubscriptions", init=False, repr=False)
+    star_amount: "StarAmount | None" = None
+    subscriptions: "list[StarSubscription] | None" = None
+    required_star_count: "int" = 0
+    next_offset: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "star_amount": self.star_amount._to_json_dict() if self.star_amount is not None else None,
+            "subscriptions": _list_to_json(self.subscriptions),
+            "required_star_count": self.required_star_count,
+            "next_offset": self.next_offset,
+        }
+
+@dataclass(slots=True)
+class AffiliateType(ObjectBase):
+    """
+    Describes type of affiliate for an affiliate program
+
+    """
+
+    _type: "str" = field(default="AffiliateType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class AffiliateTypeCurrentUser(AffiliateType):
+    """
+    The affiliate is the current user
+
+    """
+
+    _type: "str" = field(default="affiliateTypeCurrentUser", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class AffiliateTypeBot(AffiliateType):
+    """
+    The affiliate is a bot owned by the current user
+
+    :param user_id: User identifier of the bot
+    """
+
+    _type: "str" = field(default="affiliateTypeBot", init=False, repr=False)
+    user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+        }
+
+@dataclass(slots=True)
+class AffiliateTypeChannel(AffiliateType):
+    """
+    The affiliate is a channel chat where the current user has can_post_messages administrator right
+
+    :param chat_id: Identifier of the channel chat
+    """
+
+    _type: "str" = field(default="affiliateTypeChannel", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+@dataclass(slots=True)
+class AffiliateProgramSortOrder(ObjectBase):
+    """
+    Describes the order of the found affiliate programs
+
+    """
+
+    _type: "str" = field(default="AffiliateProgramSortOrder", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class AffiliateProgramSortOrderProfitability(AffiliateProgramSortOrder):
+    """
+    The affiliate programs must be sorted by the profitability
+
+    """
+
+    _type: "str" = field(default="affiliateProgramSortOrderProfitability", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class AffiliateProgramSortOrderCreationDate(AffiliateProgramSortOrder):
+    """
+    The affiliate programs must be sorted by creation date
+
+    """
+
+    _type: "str" = field(default="affiliateProgramSortOrderCreationDate", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class AffiliateProgramSortOrderRevenue(AffiliateProgramSortOrder):
+    """
+    The affiliate programs must be sorted by the expected revenue
+
+    """
+
+    _type: "str" = field(default="affiliateProgramSortOrderRevenue", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class AffiliateProgramParameters(ObjectBase):
+    """
+    Describes parameters of an affiliate program
+
+    :param commission_per_mille: The number of Telegram Stars received by the affiliate for each 1000 Telegram Stars received by the program owner;
+     getOption("affiliate_program_commission_per_mille_min")-getOption("affiliate_program_commission_per_mille_max")
+    :param month_count: Number of months the program will be active; 0-36. If 0, then the program is eternal
+    """
+
+    _type: "str" = field(default="affiliateProgramParameters", init=False, repr=False)
+    commission_per_mille: "int" = 0
+    month_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "commission_per_mille": self.commission_per_mille,
+            "month_count": self.month_count,
+        }
+
+@dataclass(slots=True)
+class AffiliateProgramInfo(ObjectBase):
+    """
+    Contains information about an active affiliate program
+
+    :param parameters: Parameters of the affiliate program
+    :param end_date: Point in time (Unix timestamp) when the affiliate program will be closed; 0 if the affiliate program isn't scheduled to be closed.
+     If positive, then the program can't be connected using connectAffiliateProgram, but active connections will work until the date
+    :param daily_revenue_per_user_amount: The amount of daily revenue per user in Telegram Stars of the bot that created the affiliate program
+    """
+
+    _type: "str" = field(default="affiliateProgramInfo", init=False, repr=False)
+    parameters: "AffiliateProgramParameters | None" = None
+    end_date: "int" = 0
+    daily_revenue_per_user_amount: "StarAmount | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "parameters": self.parameters._to_json_dict() if self.parameters is not None else None,
+            "end_date": self.end_date,
+            "daily_revenue_per_user_amount": self.daily_revenue_per_user_amount._to_json_dict() if self.daily_revenue_per_user_amount is not None else None,
+        }
+
+@dataclass(slots=True)
+class AffiliateInfo(ObjectBase):
+    """
+    Contains information about an affiliate that received commission from a Telegram Star transaction
+
+    :param commission_per_mille: The number of Telegram Stars received by the affiliate for each 1000 Telegram Stars received by the program owner
+    :param affiliate_chat_id: Identifier of the chat which received the commission
+    :param star_amount: The amount of Telegram Stars that were received by the affiliate; can be negative for refunds
+    """
+
+    _type: "str" = field(default="affiliateInfo", init=False, repr=False)
+    commission_per_mille: "int" = 0
+    affiliate_chat_id: "int" = 0
+    star_amount: "StarAmount | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "commission_per_mille": self.commission_per_mille,
+            "affiliate_chat_id": self.affiliate_chat_id,
+            "star_amount": self.star_amount._to_json_dict() if self.star_amount is not None else None,
+        }
+
@@ -0,0 +1,2036 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import FormattedText
+    from .classes_01 import Photo, Sticker
+    from .classes_02 import AffiliateInfo, AffiliateProgramInfo, AffiliateProgramParameters, StarAmount
+    from .classes_05 import MessageSender
+    from .classes_10 import PaidMedia
+    from .classes_21 import InternalLinkType
+    from .classes_23 import RevenueWithdrawalState
+
+@dataclass(slots=True)
+class FoundAffiliateProgram(ObjectBase):
+    """
+    Describes a found affiliate program
+
+    :param bot_user_id: User identifier of the bot created the program
+    :param info: Information about the affiliate program
+    """
+
+    _type: "str" = field(default="foundAffiliateProgram", init=False, repr=False)
+    bot_user_id: "int" = 0
+    info: "AffiliateProgramInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "info": self.info._to_json_dict() if self.info is not None else None,
+        }
+
+@dataclass(slots=True)
+class FoundAffiliatePrograms(ObjectBase):
+    """
+    Represents a list of found affiliate programs
+
+    :param total_count: The total number of found affiliate programs
+    :param programs: The list of affiliate programs
+    :param next_offset: The offset for the next request. If empty, then there are no more results
+    """
+
+    _type: "str" = field(default="foundAffiliatePrograms", init=False, repr=False)
+    total_count: "int" = 0
+    programs: "list[FoundAffiliateProgram] | None" = None
+    next_offset: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "programs": _list_to_json(self.programs),
+            "next_offset": self.next_offset,
+        }
+
+@dataclass(slots=True)
+class ConnectedAffiliateProgram(ObjectBase):
+    """
+    Describes an affiliate program that was connected to an affiliate
+
+    :param url: The link that can be used to refer users if the program is still active
+    :param bot_user_id: User identifier of the bot created the program
+    :param parameters: The parameters of the affiliate program
+    :param connection_date: Point in time (Unix timestamp) when the affiliate program was connected
+    :param is_disconnected: True, if the program was canceled by the bot, or disconnected by the chat owner and isn't available anymore
+    :param user_count: The number of users that used the affiliate program
+    :param revenue_star_count: The number of Telegram Stars that were earned by the affiliate program
+    """
+
+    _type: "str" = field(default="connectedAffiliateProgram", init=False, repr=False)
+    url: "str" = ""
+    bot_user_id: "int" = 0
+    parameters: "AffiliateProgramParameters | None" = None
+    connection_date: "int" = 0
+    is_disconnected: "bool" = False
+    user_count: "int" = 0
+    revenue_star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+            "bot_user_id": self.bot_user_id,
+            "parameters": self.parameters._to_json_dict() if self.parameters is not None else None,
+            "connection_date": self.connection_date,
+            "is_disconnected": self.is_disconnected,
+            "user_count": self.user_count,
+            "revenue_star_count": self.revenue_star_count,
+        }
+
+@dataclass(slots=True)
+class ConnectedAffiliatePrograms(ObjectBase):
+    """
+    Represents a list of affiliate programs that were connected to an affiliate
+
+    :param total_count: The total number of affiliate programs that were connected to the affiliate
+    :param programs: The list of connected affiliate programs
+    :param next_offset: The offset for the next request. If empty, then there are no more results
+    """
+
+    _type: "str" = field(default="connectedAffiliatePrograms", init=False, repr=False)
+    total_count: "int" = 0
+    programs: "list[ConnectedAffiliateProgram] | None" = None
+    next_offset: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "programs": _list_to_json(self.programs),
+            "next_offset": self.next_offset,
+        }
+
+@dataclass(slots=True)
+class ProductInfo(ObjectBase):
+    """
+    Contains information about a product that can be paid with invoice
+
+    :param title: Product title
+    :param description: Contains information about a product that can be paid with invoice
+    :param photo: Product photo; may be null
+    """
+
+    _type: "str" = field(default="productInfo", init=False, repr=False)
+    title: "str" = ""
+    description: "FormattedText | None" = None
+    photo: "Photo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "title": self.title,
+            "description": self.description._to_json_dict() if self.description is not None else None,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+        }
+
+@dataclass(slots=True)
+class PremiumPaymentOption(ObjectBase):
+    """
+    Describes an option for buying Telegram Premium to a user
+
+    :param currency: ISO 4217 currency code for Telegram Premium subscription payment
+    :param amount: The amount to pay, in the smallest units of the currency
+    :param discount_percentage: The discount associated with this option, as a percentage
+    :param month_count: Number of months the Telegram Premium subscription will be active. Use getPremiumInfoSticker to get the sticker to be used as representation of the Telegram Premium subscription
+    :param store_product_id: Identifier of the store product associated with the option
+    :param payment_link: An internal link to be opened for buying Telegram Premium to the user if store payment isn't possible; may be null if direct payment isn't available
+    """
+
+    _type: "str" = field(default="premiumPaymentOption", init=False, repr=False)
+    currency: "str" = ""
+    amount: "int" = 0
+    discount_percentage: "int" = 0
+    month_count: "int" = 0
+    store_product_id: "str" = ""
+    payment_link: "InternalLinkType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "currency": self.currency,
+            "amount": self.amount,
+            "discount_percentage": self.discount_percentage,
+            "month_count": self.month_count,
+            "store_product_id": self.store_product_id,
+            "payment_link": self.payment_link._to_json_dict() if self.payment_link is not None else None,
+        }
+
+@dataclass(slots=True)
+class PremiumStatePaymentOption(ObjectBase):
+    """
+    Describes an option for buying or upgrading Telegram Premium for self
+
+    :param payment_option: Information about the payment option
+    :param is_current: True, if this is the currently used Telegram Premium subscription option
+    :param is_upgrade: True, if the payment option can be used to upgrade the existing Telegram Premium subscription
+    :param last_transaction_id: Identifier of the last in-store transaction for the currently used option
+    """
+
+    _type: "str" = field(default="premiumStatePaymentOption", init=False, repr=False)
+    payment_option: "PremiumPaymentOption | None" = None
+    is_current: "bool" = False
+    is_upgrade: "bool" = False
+    last_transaction_id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "payment_option": self.payment_option._to_json_dict() if self.payment_option is not None else None,
+            "is_current": self.is_current,
+            "is_upgrade": self.is_upgrade,
+            "last_transaction_id": self.last_transaction_id,
+        }
+
+@dataclass(slots=True)
+class PremiumGiftPaymentOption(ObjectBase):
+    """
+    Describes an option for gifting Telegram Premium to a user. Use telegramPaymentPurposePremiumGift for out-of-store payments or payments in Telegram Stars
+
+    :param currency: ISO 4217 currency code for the payment
+    :param amount: The amount to pay, in the smallest units of the currency
+    :param star_count: The alternative amount of Telegram Stars to pay; 0 if payment in Telegram Stars is not possible
+    :param discount_percentage: The discount associated with this option, as a percentage
+    :param month_count: Number of months the Telegram Premium subscription will be active
+    :param store_product_id: Identifier of the store product associated with the option
+    :param sticker: A sticker to be shown along with the option; may be null if unknown
+    """
+
+    _type: "str" = field(default="premiumGiftPaymentOption", init=False, repr=False)
+    currency: "str" = ""
+    amount: "int" = 0
+    star_count: "int" = 0
+    discount_percentage: "int" = 0
+    month_count: "int" = 0
+    store_product_id: "str" = ""
+    sticker: "Sticker | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "currency": self.currency,
+            "amount": self.amount,
+            "star_count": self.star_count,
+            "discount_percentage": self.discount_percentage,
+            "month_count": self.month_count,
+            "store_product_id": self.store_product_id,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+        }
+
+@dataclass(slots=True)
+class PremiumGiftPaymentOptions(ObjectBase):
+    """
+    Contains a list of options for gifting Telegram Premium to a user
+
+    :param options: The list of options sorted by Telegram Premium subscription duration
+    """
+
+    _type: "str" = field(default="premiumGiftPaymentOptions", init=False, repr=False)
+    options: "list[PremiumGiftPaymentOption] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "options": _list_to_json(self.options),
+        }
+
+@dataclass(slots=True)
+class PremiumGiveawayPaymentOption(ObjectBase):
+    """
+    Describes an option for creating of Telegram Premium giveaway or manual distribution of Telegram Premium among chat members. Use telegramPaymentPurposePremiumGiftCodes or telegramPaymentPurposePremiumGiveaway for out-of-store payments
+
+    :param currency: ISO 4217 currency code for Telegram Premium gift code payment
+    :param amount: The amount to pay, in the smallest units of the currency
+    :param winner_count: Number of users which will be able to activate the gift codes
+    :param month_count: Number of months the Telegram Premium subscription will be active
+    :param store_product_id: Identifier of the store product associated with the option; may be empty if none
+    :param store_product_quantity: Number of times the store product must be paid
+    """
+
+    _type: "str" = field(default="premiumGiveawayPaymentOption", init=False, repr=False)
+    currency: "str" = ""
+    amount: "int" = 0
+    winner_count: "int" = 0
+    month_count: "int" = 0
+    store_product_id: "str" = ""
+    store_product_quantity: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "currency": self.currency,
+            "amount": self.amount,
+            "winner_count": self.winner_count,
+            "month_count": self.month_count,
+            "store_product_id": self.store_product_id,
+            "store_product_quantity": self.store_product_quantity,
+        }
+
+@dataclass(slots=True)
+class PremiumGiveawayPaymentOptions(ObjectBase):
+    """
+    Contains a list of options for creating of Telegram Premium giveaway or manual distribution of Telegram Premium among chat members
+
+    :param options: The list of options
+    """
+
+    _type: "str" = field(default="premiumGiveawayPaymentOptions", init=False, repr=False)
+    options: "list[PremiumGiveawayPaymentOption] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "options": _list_to_json(self.options),
+        }
+
+@dataclass(slots=True)
+class PremiumGiftCodeInfo(ObjectBase):
+    """
+    Contains information about a Telegram Premium gift code
+
+    :param creator_id: Identifier of a chat or a user that created the gift code; may be null if unknown. If null and the code is from messagePremiumGiftCode message, then creator_id from the message can be used
+    :param creation_date: Point in time (Unix timestamp) when the code was created
+    :param is_from_giveaway: True, if the gift code was created for a giveaway
+    :param giveaway_message_id: Identifier of the corresponding giveaway message in the creator_id chat; can be 0 or an identifier of a deleted message
+    :param month_count: Number of months the Telegram Premium subscription will be active after code activation
+    :param user_id: Identifier of a user for which the code was created; 0 if none
+    :param use_date: Point in time (Unix timestamp) when the code was activated; 0 if none
+    """
+
+    _type: "str" = field(default="premiumGiftCodeInfo", init=False, repr=False)
+    creator_id: "MessageSender | None" = None
+    creation_date: "int" = 0
+    is_from_giveaway: "bool" = False
+    giveaway_message_id: "int" = 0
+    month_count: "int" = 0
+    user_id: "int" = 0
+    use_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "creator_id": self.creator_id._to_json_dict() if self.creator_id is not None else None,
+            "creation_date": self.creation_date,
+            "is_from_giveaway": self.is_from_giveaway,
+            "giveaway_message_id": self.giveaway_message_id,
+            "month_count": self.month_count,
+            "user_id": self.user_id,
+            "use_date": self.use_date,
+        }
+
+@dataclass(slots=True)
+class StarPaymentOption(ObjectBase):
+    """
+    Describes an option for buying Telegram Stars. Use telegramPaymentPurposeStars for out-of-store payments
+
+    :param currency: ISO 4217 currency code for the payment
+    :param amount: The amount to pay, in the smallest units of the currency
+    :param star_count: Number of Telegram Stars that will be purchased
+    :param store_product_id: Identifier of the store product associated with the option; may be empty if none
+    :param is_additional: True, if the option must be shown only in the full list of payment options
+    """
+
+    _type: "str" = field(default="starPaymentOption", init=False, repr=False)
+    currency: "str" = ""
+    amount: "int" = 0
+    star_count: "int" = 0
+    store_product_id: "str" = ""
+    is_additional: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "currency": self.currency,
+            "amount": self.amount,
+            "star_count": self.star_count,
+            "store_product_id": self.store_product_id,
+            "is_additional": self.is_additional,
+        }
+
+@dataclass(slots=True)
+class StarPaymentOptions(ObjectBase):
+    """
+    Contains a list of options for buying Telegram Stars
+
+    :param options: The list of options
+    """
+
+    _type: "str" = field(default="starPaymentOptions", init=False, repr=False)
+    options: "list[StarPaymentOption] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "options": _list_to_json(self.options),
+        }
+
+@dataclass(slots=True)
+class StarGiveawayWinnerOption(ObjectBase):
+    """
+    Describes an option for the number of winners of a Telegram Star giveaway
+
+    :param winner_count: The number of users that will be chosen as winners
+    :param won_star_count: The number of Telegram Stars that will be won by the winners of the giveaway
+    :param is_default: True, if the option must be chosen by default
+    """
+
+    _type: "str" = field(default="starGiveawayWinnerOption", init=False, repr=False)
+    winner_count: "int" = 0
+    won_star_count: "int" = 0
+    is_default: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "winner_count": self.winner_count,
+            "won_star_count": self.won_star_count,
+            "is_default": self.is_default,
+        }
+
+@dataclass(slots=True)
+class StarGiveawayPaymentOption(ObjectBase):
+    """
+    Describes an option for creating of Telegram Star giveaway. Use telegramPaymentPurposeStarGiveaway for out-of-store payments
+
+    :param currency: ISO 4217 currency code for the payment
+    :param amount: The amount to pay, in the smallest units of the currency
+    :param star_count: Number of Telegram Stars that will be distributed among winners
+    :param store_product_id: Identifier of the store product associated with the option; may be empty if none
+    :param yearly_boost_count: Number of times the chat will be boosted for one year if the option is chosen
+    :param winner_options: Allowed options for the number of giveaway winners
+    :param is_default: True, if the option must be chosen by default
+    :param is_additional: True, if the option must be shown only in the full list of payment options
+    """
+
+    _type: "str" = field(default="starGiveawayPaymentOption", init=False, repr=False)
+    currency: "str" = ""
+    amount: "int" = 0
+    star_count: "int" = 0
+    store_product_id: "str" = ""
+    yearly_boost_count: "int" = 0
+    winner_options: "list[StarGiveawayWinnerOption] | None" = None
+    is_default: "bool" = False
+    is_additional: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "currency": self.currency,
+            "amount": self.amount,
+            "star_count": self.star_count,
+            "store_product_id": self.store_product_id,
+            "yearly_boost_count": self.yearly_boost_count,
+            "winner_options": _list_to_json(self.winner_options),
+            "is_default": self.is_default,
+            "is_additional": self.is_additional,
+        }
+
+@dataclass(slots=True)
+class StarGiveawayPaymentOptions(ObjectBase):
+    """
+    Contains a list of options for creating of Telegram Star giveaway
+
+    :param options: The list of options
+    """
+
+    _type: "str" = field(default="starGiveawayPaymentOptions", init=False, repr=False)
+    options: "list[StarGiveawayPaymentOption] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "options": _list_to_json(self.options),
+        }
+
+@dataclass(slots=True)
+class AcceptedGiftTypes(ObjectBase):
+    """
+    Describes gift types that are accepted by a user
+
+    :param unlimited_gifts: True, if unlimited regular gifts are accepted
+    :param limited_gifts: True, if limited regular gifts are accepted
+    :param upgraded_gifts: True, if upgraded gifts and regular gifts that can be upgraded for free are accepted
+    :param premium_subscription: True, if Telegram Premium subscription is accepted
+    """
+
+    _type: "str" = field(default="acceptedGiftTypes", init=False, repr=False)
+    unlimited_gifts: "bool" = False
+    limited_gifts: "bool" = False
+    upgraded_gifts: "bool" = False
+    premium_subscription: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "unlimited_gifts": self.unlimited_gifts,
+            "limited_gifts": self.limited_gifts,
+            "upgraded_gifts": self.upgraded_gifts,
+            "premium_subscription": self.premium_subscription,
+        }
+
+@dataclass(slots=True)
+class GiftSettings(ObjectBase):
+    """
+    Contains settings for gift receiving for a user
+
+    :param show_gift_button: True, if a button for sending a gift to the user or by the user must always be shown in the input field
+    :param accepted_gift_types: Types of gifts accepted by the user; for Telegram Premium users only
+    """
+
+    _type: "str" = field(default="giftSettings", init=False, repr=False)
+    show_gift_button: "bool" = False
+    accepted_gift_types: "AcceptedGiftTypes | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "show_gift_button": self.show_gift_button,
+            "accepted_gift_types": self.accepted_gift_types._to_json_dict() if self.accepted_gift_types is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpgradedGiftOrigin(ObjectBase):
+    """
+    Describes origin from which the upgraded gift was obtained
+
+    """
+
+    _type: "str" = field(default="UpgradedGiftOrigin", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UpgradedGiftOriginUpgrade(UpgradedGiftOrigin):
+    """
+    The gift was obtained by upgrading of a previously received gift
+
+    :param gift_message_id: Identifier of the message with the regular gift that was upgraded; can be 0 or an identifier of a deleted message
+    """
+
+    _type: "str" = field(default="upgradedGiftOriginUpgrade", init=False, repr=False)
+    gift_message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "gift_message_id": self.gift_message_id,
+        }
+
+@dataclass(slots=True)
+class UpgradedGiftOriginTransfer(UpgradedGiftOrigin):
+    """
+    The gift was transferred from another owner
+
+    """
+
+    _type: "str" = field(default="upgradedGiftOriginTransfer", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UpgradedGiftOriginResale(UpgradedGiftOrigin):
+    """
+    The gift was bought from another user
+
+    :param star_count: Number of Telegram Stars that were paid by the sender for the gift
+    """
+
+    _type: "str" = field(default="upgradedGiftOriginResale", init=False, repr=False)
+    star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "star_count": self.star_count,
+        }
+
+@dataclass(slots=True)
+class UpgradedGiftModel(ObjectBase):
+    """
+    Describes a model of an upgraded gift
+
+    :param name: Name of the model
+    :param sticker: The sticker representing the upgraded gift
+    :param rarity_per_mille: The number of upgraded gifts that receive this model for each 1000 gifts upgraded
+    """
+
+    _type: "str" = field(default="upgradedGiftModel", init=False, repr=False)
+    name: "str" = ""
+    sticker: "Sticker | None" = None
+    rarity_per_mille: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+            "rarity_per_mille": self.rarity_per_mille,
+        }
+
+@dataclass(slots=True)
+class UpgradedGiftSymbol(ObjectBase):
+    """
+    Describes a symbol shown on the pattern of an upgraded gift
+
+    :param name: Name of the symbol
+    :param sticker: The sticker representing the symbol
+    :param rarity_per_mille: The number of upgraded gifts that receive this symbol for each 1000 gifts upgraded
+    """
+
+    _type: "str" = field(default="upgradedGiftSymbol", init=False, repr=False)
+    name: "str" = ""
+    sticker: "Sticker | None" = None
+    rarity_per_mille: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+            "rarity_per_mille": self.rarity_per_mille,
+        }
+
+@dataclass(slots=True)
+class UpgradedGiftBackdropColors(ObjectBase):
+    """
+    Describes colors of a backdrop of an upgraded gift
+
+    :param center_color: A color in the center of the backdrop in the RGB format
+    :param edge_color: A color on the edges of the backdrop in the RGB format
+    :param symbol_color: A color to be applied for the symbol in the RGB format
+    :param text_color: A color for the text on the backdrop in the RGB format
+    """
+
+    _type: "str" = field(default="upgradedGiftBackdropColors", init=False, repr=False)
+    center_color: "int" = 0
+    edge_color: "int" = 0
+    symbol_color: "int" = 0
+    text_color: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "center_color": self.center_color,
+            "edge_color": self.edge_color,
+            "symbol_color": self.symbol_color,
+            "text_color": self.text_color,
+        }
+
+@dataclass(slots=True)
+class UpgradedGiftBackdrop(ObjectBase):
+    """
+    Describes a backdrop of an upgraded gift
+
+    :param id: Unique identifier of the backdrop
+    :param name: Name of the backdrop
+    :param colors: Colors of the backdrop
+    :param rarity_per_mille: The number of upgraded gifts that receive this backdrop for each 1000 gifts upgraded
+    """
+
+    _type: "str" = field(default="upgradedGiftBackdrop", init=False, repr=False)
+    id: "int" = 0
+    name: "str" = ""
+    colors: "UpgradedGiftBackdropColors | None" = None
+    rarity_per_mille: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "name": self.name,
+            "colors": self.colors._to_json_dict() if self.colors is not None else None,
+            "rarity_per_mille": self.rarity_per_mille,
+        }
+
+@dataclass(slots=True)
+class UpgradedGiftOriginalDetails(ObjectBase):
+    """
+    Describes the original details about the gift
+
+    :param sender_id: Identifier of the user or the chat that sent the gift; may be null if the gift was private
+    :param receiver_id: Identifier of the user or the chat that received the gift
+    :param text: Message added to the gift
+    :param date: Point in time (Unix timestamp) when the gift was sent
+    """
+
+    _type: "str" = field(default="upgradedGiftOriginalDetails", init=False, repr=False)
+    sender_id: "MessageSender | None" = None
+    receiver_id: "MessageSender | None" = None
+    text: "FormattedText | None" = None
+    date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sender_id": self.sender_id._to_json_dict() if self.sender_id is not None else None,
+            "receiver_id": self.receiver_id._to_json_dict() if self.receiver_id is not None else None,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "date": self.date,
+        }
+
+@dataclass(slots=True)
+class Gift(ObjectBase):
+    """
+    Describes a gift that can be sent to another user or channel chat
+
+    :param id: Unique identifier of the gift
+    :param publisher_chat_id: Identifier of the chat that published the gift; 0 if none
+    :param sticker: The sticker representing the gift
+    :param star_count: Number of Telegram Stars that must be paid for the gift
+    :param default_sell_star_count: Number of Telegram Stars that can be claimed by the receiver instead of the regular gift by default. If the gift was paid with just bought Telegram Stars, then full value can be claimed
+    :param upgrade_star_count: Number of Telegram Stars that must be paid to upgrade the gift; 0 if upgrade isn't possible
+    :param is_for_birthday: True, if the gift is a birthday gift
+    :param remaining_count: Number of remaining times the gift can be purchased; 0 if not limited or the gift was sold out
+    :param total_count: Number of total times the gift can be purchased; 0 if not limited
+    :param first_send_date: Point in time (Unix timestamp) when the gift was send for the first time; for sold out gifts only
+    :param last_send_date: Point in time (Unix timestamp) when the gift was send for the last time; for sold out gifts only
+    """
+
+    _type: "str" = field(default="gift", init=False, repr=False)
+    id: "int" = 0
+    publisher_chat_id: "int" = 0
+    sticker: "Sticker | None" = None
+    star_count: "int" = 0
+    default_sell_star_count: "int" = 0
+    upgrade_star_count: "int" = 0
+    is_for_birthday: "bool" = False
+    remaining_count: "int" = 0
+    total_count: "int" = 0
+    first_send_date: "int" = 0
+    last_send_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "publisher_chat_id": self.publisher_chat_id,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+            "star_count": self.star_count,
+            "default_sell_star_count": self.default_sell_star_count,
+            "upgrade_star_count": self.upgrade_star_count,
+            "is_for_birthday": self.is_for_birthday,
+            "remaining_count": self.remaining_count,
+            "total_count": self.total_count,
+            "first_send_date": self.first_send_date,
+            "last_send_date": self.last_send_date,
+        }
+
+@dataclass(slots=True)
+class UpgradedGift(ObjectBase):
+    """
+    Describes an upgraded gift that can be transferred to another owner or transferred to the TON blockchain as an NFT
+
+    :param id: Unique identifier of the gift
+    :param publisher_chat_id: Identifier of the chat that published the gift; 0 if none
+    :param title: The title of the upgraded gift
+    :param name: Unique name of the upgraded gift that can be used with internalLinkTypeUpgradedGift or sendResoldGift
+    :param number: Unique number of the upgraded gift among gifts upgraded from the same gift
+    :param total_upgraded_count: Total number of gifts that were upgraded from the same gift
+    :param max_upgraded_count: The maximum number of gifts that can be upgraded from the same gift
+    :param owner_id: Identifier of the user or the chat that owns the upgraded gift; may be null if none or unknown
+    :param owner_address: Address of the gift NFT owner in TON blockchain; may be empty if none. Append the address to getOption("ton_blockchain_explorer_url") to get a link with information about the address
+    :param owner_name: Name of the owner for the case when owner identifier and address aren't known
+    :param gift_address: Address of the gift NFT in TON blockchain; may be empty if none. Append the address to getOption("ton_blockchain_explorer_url") to get a link with information about the address
+    :param model: Model of the upgraded gift
+    :param symbol: Symbol of the upgraded gift
+    :param backdrop: Backdrop of the upgraded gift
+    :param original_details: Information about the originally sent gift; may be null if unknown
+    :param resale_star_count: Number of Telegram Stars that must be paid to buy the gift and send it to someone else; 0 if resale isn't possible
+    """
+
+    _type: "str" = field(default="upgradedGift", init=False, repr=False)
+    id: "int" = 0
+    publisher_chat_id: "int" = 0
+    title: "str" = ""
+    name: "str" = ""
+    number: "int" = 0
+    total_upgraded_count: "int" = 0
+    max_upgraded_count: "int" = 0
+    owner_id: "MessageSender | None" = None
+    owner_address: "str" = ""
+    owner_name: "str" = ""
+    gift_address: "str" = ""
+    model: "UpgradedGiftModel | None" = None
+    symbol: "UpgradedGiftSymbol | None" = None
+    backdrop: "UpgradedGiftBackdrop | None" = None
+    original_details: "UpgradedGiftOriginalDetails | None" = None
+    resale_star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "publisher_chat_id": self.publisher_chat_id,
+            "title": self.title,
+            "name": self.name,
+            "number": self.number,
+            "total_upgraded_count": self.total_upgraded_count,
+            "max_upgraded_count": self.max_upgraded_count,
+            "owner_id": self.owner_id._to_json_dict() if self.owner_id is not None else None,
+            "owner_address": self.owner_address,
+            "owner_name": self.owner_name,
+            "gift_address": self.gift_address,
+            "model": self.model._to_json_dict() if self.model is not None else None,
+            "symbol": self.symbol._to_json_dict() if self.symbol is not None else None,
+            "backdrop": self.backdrop._to_json_dict() if self.backdrop is not None else None,
+            "original_details": self.original_details._to_json_dict() if self.original_details is not None else None,
+            "resale_star_count": self.resale_star_count,
+        }
+
+@dataclass(slots=True)
+class UpgradeGiftResult(ObjectBase):
+    """
+    Contains result of gift upgrading
+
+    :param gift: The upgraded gift
+    :param received_gift_id: Unique identifier of the received gift for the current user
+    :param is_saved: True, if the gift is displayed on the user's or the channel's profile page
+    :param can_be_transferred: True, if the gift can be transferred to another owner
+    :param transfer_star_count: Number of Telegram Stars that must be paid to transfer the upgraded gift
+    :param next_transfer_date: Point in time (Unix timestamp) when the gift can be transferred to another owner; 0 if the gift can be transferred immediately or transfer isn't possible
+    :param next_resale_date: Point in time (Unix timestamp) when the gift can be resold to another user; 0 if the gift can't be resold; only for the receiver of the gift
+    :param export_date: Point in time (Unix timestamp) when the gift can be transferred to the TON blockchain as an NFT
+    """
+
+    _type: "str" = field(default="upgradeGiftResult", init=False, repr=False)
+    gift: "UpgradedGift | None" = None
+    received_gift_id: "str" = ""
+    is_saved: "bool" = False
+    can_be_transferred: "bool" = False
+    transfer_star_count: "int" = 0
+    next_transfer_date: "int" = 0
+    next_resale_date: "int" = 0
+    export_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "gift": self.gift._to_json_dict() if self.gift is not None else None,
+            "received_gift_id": self.received_gift_id,
+            "is_saved": self.is_saved,
+            "can_be_transferred": self.can_be_transferred,
+            "transfer_star_count": self.transfer_star_count,
+            "next_transfer_date": self.next_transfer_date,
+            "next_resale_date": self.next_resale_date,
+            "export_date": self.export_date,
+        }
+
+@dataclass(slots=True)
+class AvailableGift(ObjectBase):
+    """
+    Describes a gift that is available for purchase
+
+    :param gift: The gift
+    :param resale_count: Number of gifts that are available for resale
+    :param min_resale_star_count: The minimum price for the gifts available for resale; 0 if there are no such gifts
+    :param title: The title of the upgraded gift; empty if the gift isn't available for resale
+    """
+
+    _type: "str" = field(default="availableGift", init=False, repr=False)
+    gift: "Gift | None" = None
+    resale_count: "int" = 0
+    min_resale_star_count: "int" = 0
+    title: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "gift": self.gift._to_json_dict() if self.gift is not None else None,
+            "resale_count": self.resale_count,
+            "min_resale_star_count": self.min_resale_star_count,
+            "title": self.title,
+        }
+
+@dataclass(slots=True)
+class AvailableGifts(ObjectBase):
+    """
+    Contains a list of gifts that can be sent to another user or channel chat
+
+    :param gifts: The list of gifts
+    """
+
+    _type: "str" = field(default="availableGifts", init=False, repr=False)
+    gifts: "list[AvailableGift] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "gifts": _list_to_json(self.gifts),
+        }
+
+@dataclass(slots=True)
+class UpgradedGiftAttributeId(ObjectBase):
+    """
+    Contains identifier of an upgraded gift attribute to search for
+
+    """
+
+    _type: "str" = field(default="UpgradedGiftAttributeId", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UpgradedGiftAttributeIdModel(UpgradedGiftAttributeId):
+    """
+    Identifier of a gift model
+
+    :param sticker_id: Identifier of the sticker representing the model
+    """
+
+    _type: "str" = field(default="upgradedGiftAttributeIdModel", init=False, repr=False)
+    sticker_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker_id": self.sticker_id,
+        }
+
+@dataclass(slots=True)
+class UpgradedGiftAttributeIdSymbol(UpgradedGiftAttributeId):
+    """
+    Identifier of a gift symbol
+
+    :param sticker_id: Identifier of the sticker representing the symbol
+    """
+
+    _type: "str" = field(default="upgradedGiftAttributeIdSymbol", init=False, repr=False)
+    sticker_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker_id": self.sticker_id,
+        }
+
+@dataclass(slots=True)
+class UpgradedGiftAttributeIdBackdrop(UpgradedGiftAttributeId):
+    """
+    Identifier of a gift backdrop
+
+    :param backdrop_id: Identifier of the backdrop
+    """
+
+    _type: "str" = field(default="upgradedGiftAttributeIdBackdrop", init=False, repr=False)
+    backdrop_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "backdrop_id": self.backdrop_id,
+        }
+
+@dataclass(slots=True)
+class UpgradedGiftModelCount(ObjectBase):
+    """
+    Describes a model of an upgraded gift with the number of gifts found
+
+    :param model: The model
+    :param total_count: Total number of gifts with the model
+    """
+
+    _type: "str" = field(default="upgradedGiftModelCount", init=False, repr=False)
+    model: "UpgradedGiftModel | None" = None
+    total_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "model": self.model._to_json_dict() if self.model is not None else None,
+            "total_count": self.total_count,
+        }
+
+@dataclass(slots=True)
+class UpgradedGiftSymbolCount(ObjectBase):
+    """
+    Describes a symbol shown on the pattern of an upgraded gift
+
+    :param symbol: The symbol
+    :param total_count: Total number of gifts with the symbol
+    """
+
+    _type: "str" = field(default="upgradedGiftSymbolCount", init=False, repr=False)
+    symbol: "UpgradedGiftSymbol | None" = None
+    total_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "symbol": self.symbol._to_json_dict() if self.symbol is not None else None,
+            "total_count": self.total_count,
+        }
+
+@dataclass(slots=True)
+class UpgradedGiftBackdropCount(ObjectBase):
+    """
+    Describes a backdrop of an upgraded gift
+
+    :param backdrop: The backdrop
+    :param total_count: Total number of gifts with the symbol
+    """
+
+    _type: "str" = field(default="upgradedGiftBackdropCount", init=False, repr=False)
+    backdrop: "UpgradedGiftBackdrop | None" = None
+    total_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "backdrop": self.backdrop._to_json_dict() if self.backdrop is not None else None,
+            "total_count": self.total_count,
+        }
+
+@dataclass(slots=True)
+class GiftForResaleOrder(ObjectBase):
+    """
+    Describes order in which upgraded gifts for resale will be sorted
+
+    """
+
+    _type: "str" = field(default="GiftForResaleOrder", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class GiftForResaleOrderPrice(GiftForResaleOrder):
+    """
+    The gifts will be sorted by their price from the lowest to the highest
+
+    """
+
+    _type: "str" = field(default="giftForResaleOrderPrice", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class GiftForResaleOrderPriceChangeDate(GiftForResaleOrder):
+    """
+    The gifts will be sorted by the last date when their price was changed from the newest to the oldest
+
+    """
+
+    _type: "str" = field(default="giftForResaleOrderPriceChangeDate", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class GiftForResaleOrderNumber(GiftForResaleOrder):
+    """
+    The gifts will be sorted by their number from the smallest to the largest
+
+    """
+
+    _type: "str" = field(default="giftForResaleOrderNumber", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class GiftForResale(ObjectBase):
+    """
+    Describes a gift available for resale
+
+    :param gift: The gift
+    :param received_gift_id: Unique identifier of the received gift for the current user; only for the gifts owned by the current user
+    """
+
+    _type: "str" = field(default="giftForResale", init=False, repr=False)
+    gift: "UpgradedGift | None" = None
+    received_gift_id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "gift": self.gift._to_json_dict() if self.gift is not None else None,
+            "received_gift_id": self.received_gift_id,
+        }
+
+@dataclass(slots=True)
+class GiftsForResale(ObjectBase):
+    """
+    Describes gifts available for resale
+
+    :param total_count: Total number of gifts found
+    :param gifts: The gifts
+    :param models: Available models; for searchGiftsForResale requests without offset and attributes only
+    :param symbols: Available symbols; for searchGiftsForResale requests without offset and attributes only
+    :param backdrops: Available backdrops; for searchGiftsForResale requests without offset and attributes only
+    :param next_offset: The offset for the next request. If empty, then there are no more results
+    """
+
+    _type: "str" = field(default="giftsForResale", init=False, repr=False)
+    total_count: "int" = 0
+    gifts: "list[GiftForResale] | None" = None
+    models: "list[UpgradedGiftModelCount] | None" = None
+    symbols: "list[UpgradedGiftSymbolCount] | None" = None
+    backdrops: "list[UpgradedGiftBackdropCount] | None" = None
+    next_offset: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "gifts": _list_to_json(self.gifts),
+            "models": _list_to_json(self.models),
+            "symbols": _list_to_json(self.symbols),
+            "backdrops": _list_to_json(self.backdrops),
+            "next_offset": self.next_offset,
+        }
+
+@dataclass(slots=True)
+class SentGift(ObjectBase):
+    """
+    Represents content of a gift received by a user or a channel chat
+
+    """
+
+    _type: "str" = field(default="SentGift", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SentGiftRegular(SentGift):
+    """
+    Regular gift
+
+    :param gift: The gift
+    """
+
+    _type: "str" = field(default="sentGiftRegular", init=False, repr=False)
+    gift: "Gift | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "gift": self.gift._to_json_dict() if self.gift is not None else None,
+        }
+
+@dataclass(slots=True)
+class SentGiftUpgraded(SentGift):
+    """
+    Upgraded gift
+
+    :param gift: The gift
+    """
+
+    _type: "str" = field(default="sentGiftUpgraded", init=False, repr=False)
+    gift: "UpgradedGift | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "gift": self.gift._to_json_dict() if self.gift is not None else None,
+        }
+
+@dataclass(slots=True)
+class ReceivedGift(ObjectBase):
+    """
+    Represents a gift received by a user or a chat
+
+    :param received_gift_id: Unique identifier of the received gift for the current user; only for the receiver of the gift
+    :param sender_id: Identifier of a user or a chat that sent the gift; may be null if unknown
+    :param text: Message added to the gift
+    :param is_private: True, if the sender and gift text are shown only to the gift receiver; otherwise, everyone are able to see them
+    :param is_saved: True, if the gift is displayed on the chat's profile page; only for the receiver of the gift
+    :param is_pinned: True, if the gift is pinned to the top of the chat's profile page
+    :param can_be_upgraded: True, if the gift is a regular gift that can be upgraded to a unique gift; only for the receiver of the gift
+    :param can_be_transferred: True, if the gift is an upgraded gift that can be transferred to another owner; only for the receiver of the gift
+    :param was_refunded: True, if the gift was refunded and isn't available anymore
+    :param date: Point in time (Unix timestamp) when the gift was sent
+    :param gift: The gift
+    :param sell_star_count: Number of Telegram Stars that can be claimed by the receiver instead of the regular gift; 0 if the gift can't be sold by the current user
+    :param prepaid_upgrade_star_count: Number of Telegram Stars that were paid by the sender for the ability to upgrade the gift
+    :param transfer_star_count: Number of Telegram Stars that must be paid to transfer the upgraded gift; only for the receiver of the gift
+    :param next_transfer_date: Point in time (Unix timestamp) when the gift can be transferred to another owner; 0 if the gift can be transferred immediately or transfer isn't possible; only for the receiver of the gift
+    :param next_resale_date: Point in time (Unix timestamp) when the gift can be resold to another user; 0 if the gift can't be resold; only for the receiver of the gift
+    :param export_date: Point in time (Unix timestamp) when the upgraded gift can be transferred to the TON blockchain as an NFT; 0 if NFT export isn't possible; only for the receiver of the gift
+    """
+
+    _type: "str" = field(default="receivedGift", init=False, repr=False)
+    received_gift_id: "str" = ""
+    sender_id: "MessageSender | None" = None
+    text: "FormattedText | None" = None
+    is_private: "bool" = False
+    is_saved: "bool" = False
+    is_pinned: "bool" = False
+    can_be_upgraded: "bool" = False
+    can_be_transferred: "bool" = False
+    was_refunded: "bool" = False
+    date: "int" = 0
+    gift: "SentGift | None" = None
+    sell_star_count: "int" = 0
+    prepaid_upgrade_star_count: "int" = 0
+    transfer_star_count: "int" = 0
+    next_transfer_date: "int" = 0
+    next_resale_date: "int" = 0
+    export_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "received_gift_id": self.received_gift_id,
+            "sender_id": self.sender_id._to_json_dict() if self.sender_id is not None else None,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "is_private": self.is_private,
+            "is_saved": self.is_saved,
+            "is_pinned": self.is_pinned,
+            "can_be_upgraded": self.can_be_upgraded,
+            "can_be_transferred": self.can_be_transferred,
+            "was_refunded": self.was_refunded,
+            "date": self.date,
+            "gift": self.gift._to_json_dict() if self.gift is not None else None,
+            "sell_star_count": self.sell_star_count,
+            "prepaid_upgrade_star_count": self.prepaid_upgrade_star_count,
+            "transfer_star_count": self.transfer_star_count,
+            "next_transfer_date": self.next_transfer_date,
+            "next_resale_date": self.next_resale_date,
+            "export_date": self.export_date,
+        }
+
+@dataclass(slots=True)
+class ReceivedGifts(ObjectBase):
+    """
+    Represents a list of gifts received by a user or a chat
+
+    :param total_count: The total number of received gifts
+    :param gifts: The list of gifts
+    :param are_notifications_enabled: True, if notifications about new gifts of the owner are enabled
+    :param next_offset: The offset for the next request. If empty, then there are no more results
+    """
+
+    _type: "str" = field(default="receivedGifts", init=False, repr=False)
+    total_count: "int" = 0
+    gifts: "list[ReceivedGift] | None" = None
+    are_notifications_enabled: "bool" = False
+    next_offset: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "gifts": _list_to_json(self.gifts),
+            "are_notifications_enabled": self.are_notifications_enabled,
+            "next_offset": self.next_offset,
+        }
+
+@dataclass(slots=True)
+class GiftUpgradePreview(ObjectBase):
+    """
+    Contains examples of possible upgraded gifts for the given regular gift
+
+    :param models: Examples of possible models that can be chosen for the gift after upgrade
+    :param symbols: Examples of possible symbols that can be chosen for the gift after upgrade
+    :param backdrops: Examples of possible backdrops that can be chosen for the gift after upgrade
+    """
+
+    _type: "str" = field(default="giftUpgradePreview", init=False, repr=False)
+    models: "list[UpgradedGiftModel] | None" = None
+    symbols: "list[UpgradedGiftSymbol] | None" = None
+    backdrops: "list[UpgradedGiftBackdrop] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "models": _list_to_json(self.models),
+            "symbols": _list_to_json(self.symbols),
+            "backdrops": _list_to_json(self.backdrops),
+        }
+
+@dataclass(slots=True)
+class TransactionDirection(ObjectBase):
+    """
+    Describes direction of transactions in a transaction list
+
+    """
+
+    _type: "str" = field(default="TransactionDirection", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TransactionDirectionIncoming(TransactionDirection):
+    """
+    The transaction is incoming and increases the amount of owned currency
+
+    """
+
+    _type: "str" = field(default="transactionDirectionIncoming", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TransactionDirectionOutgoing(TransactionDirection):
+    """
+    The transaction is outgoing and decreases the amount of owned currency
+
+    """
+
+    _type: "str" = field(default="transactionDirectionOutgoing", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StarTransactionType(ObjectBase):
+    """
+    Describes type of transaction with Telegram Stars
+
+    """
+
+    _type: "str" = field(default="StarTransactionType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypePremiumBotDeposit(StarTransactionType):
+    """
+    The transaction is a deposit of Telegram Stars from the Premium bot; for regular users only
+
+    """
+
+    _type: "str" = field(default="starTransactionTypePremiumBotDeposit", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeAppStoreDeposit(StarTransactionType):
+    """
+    The transaction is a deposit of Telegram Stars from App Store; for regular users only
+
+    """
+
+    _type: "str" = field(default="starTransactionTypeAppStoreDeposit", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeGooglePlayDeposit(StarTransactionType):
+    """
+    The transaction is a deposit of Telegram Stars from Google Play; for regular users only
+
+    """
+
+    _type: "str" = field(default="starTransactionTypeGooglePlayDeposit", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeFragmentDeposit(StarTransactionType):
+    """
+    The transaction is a deposit of Telegram Stars from Fragment; for regular users and bots only
+
+    """
+
+    _type: "str" = field(default="starTransactionTypeFragmentDeposit", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeUserDeposit(StarTransactionType):
+    """
+    The transaction is a deposit of Telegram Stars by another user; for regular users only
+
+    :param user_id: Identifier of the user that gifted Telegram Stars; 0 if the user was anonymous
+    :param sticker: The sticker to be shown in the transaction information; may be null if unknown
+    """
+
+    _type: "str" = field(default="starTransactionTypeUserDeposit", init=False, repr=False)
+    user_id: "int" = 0
+    sticker: "Sticker | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeGiveawayDeposit(StarTransactionType):
+    """
+    The transaction is a deposit of Telegram Stars from a giveaway; for regular users only
+
+    :param chat_id: Identifier of a supergroup or a channel chat that created the giveaway
+    :param giveaway_message_id: Identifier of the message with the giveaway; can be 0 or an identifier of a deleted message
+    """
+
+    _type: "str" = field(default="starTransactionTypeGiveawayDeposit", init=False, repr=False)
+    chat_id: "int" = 0
+    giveaway_message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "giveaway_message_id": self.giveaway_message_id,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeFragmentWithdrawal(StarTransactionType):
+    """
+    The transaction is a withdrawal of earned Telegram Stars to Fragment; for regular users, bots, supergroup and channel chats only
+
+    :param withdrawal_state: State of the withdrawal; may be null for refunds from Fragment
+    """
+
+    _type: "str" = field(default="starTransactionTypeFragmentWithdrawal", init=False, repr=False)
+    withdrawal_state: "RevenueWithdrawalState | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "withdrawal_state": self.withdrawal_state._to_json_dict() if self.withdrawal_state is not None else None,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeTelegramAdsWithdrawal(StarTransactionType):
+    """
+    The transaction is a withdrawal of earned Telegram Stars to Telegram Ad platform; for bots and channel chats only
+
+    """
+
+    _type: "str" = field(default="starTransactionTypeTelegramAdsWithdrawal", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeTelegramApiUsage(StarTransactionType):
+    """
+    The transaction is a payment for Telegram API usage; for bots only
+
+    :param request_count: The number of billed requests
+    """
+
+    _type: "str" = field(default="starTransactionTypeTelegramApiUsage", init=False, repr=False)
+    request_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "request_count": self.request_count,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeBotPaidMediaPurchase(StarTransactionType):
+    """
+    The transaction is a purchase of paid media from a bot or a business account by the current user; for regular users only
+
+    :param user_id: Identifier of the bot or the business account user that sent the paid media
+    :param media: The bought media if the transaction wasn't refunded
+    """
+
+    _type: "str" = field(default="starTransactionTypeBotPaidMediaPurchase", init=False, repr=False)
+    user_id: "int" = 0
+    media: "list[PaidMedia] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "media": _list_to_json(self.media),
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeBotPaidMediaSale(StarTransactionType):
+    """
+    The transaction is a sale of paid media by the bot or a business account managed by the bot; for bots only
+
+    :param user_id: Identifier of the user that bought the media
+    :param media: The bought media
+    :param payload: Bot-provided payload
+    :param affiliate: Information about the affiliate which received commission from the transaction; may be null if none
+    """
+
+    _type: "str" = field(default="starTransactionTypeBotPaidMediaSale", init=False, repr=False)
+    user_id: "int" = 0
+    media: "list[PaidMedia] | None" = None
+    payload: "str" = ""
+    affiliate: "AffiliateInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "media": _list_to_json(self.media),
+            "payload": self.payload,
+            "affiliate": self.affiliate._to_json_dict() if self.affiliate is not None else None,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeChannelPaidMediaPurchase(StarTransactionType):
+    """
+    The transaction is a purchase of paid media from a channel by the current user; for regular users only
+
+    :param chat_id: Identifier of the channel chat that sent the paid media
+    :param message_id: Identifier of the corresponding message with paid media; can be 0 or an identifier of a deleted message
+    :param media: The bought media if the transaction wasn't refunded
+    """
+
+    _type: "str" = field(default="starTransactionTypeChannelPaidMediaPurchase", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    media: "list[PaidMedia] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "media": _list_to_json(self.media),
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeChannelPaidMediaSale(StarTransactionType):
+    """
+    The transaction is a sale of paid media by the channel chat; for channel chats only
+
+    :param user_id: Identifier of the user that bought the media
+    :param message_id: Identifier of the corresponding message with paid media; can be 0 or an identifier of a deleted message
+    :param media: The bought media
+    """
+
+    _type: "str" = field(default="starTransactionTypeChannelPaidMediaSale", init=False, repr=False)
+    user_id: "int" = 0
+    message_id: "int" = 0
+    media: "list[PaidMedia] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "message_id": self.message_id,
+            "media": _list_to_json(self.media),
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeBotInvoicePurchase(StarTransactionType):
+    """
+    The transaction is a purchase of a product from a bot or a business account by the current user; for regular users only
+
+    :param user_id: Identifier of the bot or the business account user that created the invoice
+    :param product_info: Information about the bought product
+    """
+
+    _type: "str" = field(default="starTransactionTypeBotInvoicePurchase", init=False, repr=False)
+    user_id: "int" = 0
+    product_info: "ProductInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "product_info": self.product_info._to_json_dict() if self.product_info is not None else None,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeBotInvoiceSale(StarTransactionType):
+    """
+    The transaction is a sale of a product by the bot; for bots only
+
+    :param user_id: Identifier of the user that bought the product
+    :param product_info: Information about the bought product
+    :param invoice_payload: Invoice payload
+    :param affiliate: Information about the affiliate which received commission from the transaction; may be null if none
+    """
+
+    _type: "str" = field(default="starTransactionTypeBotInvoiceSale", init=False, repr=False)
+    user_id: "int" = 0
+    product_info: "ProductInfo | None" = None
+    invoice_payload: "bytes" = b""
+    affiliate: "AffiliateInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "product_info": self.product_info._to_json_dict() if self.product_info is not None else None,
+            "invoice_payload": _bytes_to_json(self.invoice_payload),
+            "affiliate": self.affiliate._to_json_dict() if self.affiliate is not None else None,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeBotSubscriptionPurchase(StarTransactionType):
+    """
+    The transaction is a purchase of a subscription from a bot or a business account by the current user; for regular users only
+
+    :param user_id: Identifier of the bot or the business account user that created the subscription link
+    :param subscription_period: The number of seconds between consecutive Telegram Star debitings
+    :param product_info: Information about the bought subscription
+    """
+
+    _type: "str" = field(default="starTransactionTypeBotSubscriptionPurchase", init=False, repr=False)
+    user_id: "int" = 0
+    subscription_period: "int" = 0
+    product_info: "ProductInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "subscription_period": self.subscription_period,
+            "product_info": self.product_info._to_json_dict() if self.product_info is not None else None,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeBotSubscriptionSale(StarTransactionType):
+    """
+    The transaction is a sale of a subscription by the bot; for bots only
+
+    :param user_id: Identifier of the user that bought the subscription
+    :param subscription_period: The number of seconds between consecutive Telegram Star debitings
+    :param product_info: Information about the bought subscription
+    :param invoice_payload: Invoice payload
+    :param affiliate: Information about the affiliate which received commission from the transaction; may be null if none
+    """
+
+    _type: "str" = field(default="starTransactionTypeBotSubscriptionSale", init=False, repr=False)
+    user_id: "int" = 0
+    subscription_period: "int" = 0
+    product_info: "ProductInfo | None" = None
+    invoice_payload: "bytes" = b""
+    affiliate: "AffiliateInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "subscription_period": self.subscription_period,
+            "product_info": self.product_info._to_json_dict() if self.product_info is not None else None,
+            "invoice_payload": _bytes_to_json(self.invoice_payload),
+            "affiliate": self.affiliate._to_json_dict() if self.affiliate is not None else None,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeChannelSubscriptionPurchase(StarTransactionType):
+    """
+    The transaction is a purchase of a subscription to a channel chat by the current user; for regular users only
+
+    :param chat_id: Identifier of the channel chat that created the subscription
+    :param subscription_period: The number of seconds between consecutive Telegram Star debitings
+    """
+
+    _type: "str" = field(default="starTransactionTypeChannelSubscriptionPurchase", init=False, repr=False)
+    chat_id: "int" = 0
+    subscription_period: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "subscription_period": self.subscription_period,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeChannelSubscriptionSale(StarTransactionType):
+    """
+    The transaction is a sale of a subscription by the channel chat; for channel chats only
+
+    :param user_id: Identifier of the user that bought the subscription
+    :param subscription_period: The number of seconds between consecutive Telegram Star debitings
+    """
+
+    _type: "str" = field(default="starTransactionTypeChannelSubscriptionSale", init=False, repr=False)
+    user_id: "int" = 0
+    subscription_period: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "subscription_period": self.subscription_period,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeGiftPurchase(StarTransactionType):
+    """
+    The transaction is a purchase of a regular gift; for regular users and bots only
+
+    :param owner_id: Identifier of the user or the channel that received the gift
+    :param gift: The gift
+    """
+
+    _type: "str" = field(default="starTransactionTypeGiftPurchase", init=False, repr=False)
+    owner_id: "MessageSender | None" = None
+    gift: "Gift | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "owner_id": self.owner_id._to_json_dict() if self.owner_id is not None else None,
+            "gift": self.gift._to_json_dict() if self.gift is not None else None,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeGiftTransfer(StarTransactionType):
+    """
+    The transaction is a transfer of an upgraded gift; for regular users only
+
+    :param owner_id: Identifier of the user or the channel that received the gift
+    :param gift: The gift
+    """
+
+    _type: "str" = field(default="starTransactionTypeGiftTransfer", init=False, repr=False)
+    owner_id: "MessageSender | None" = None
+    gift: "UpgradedGift | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "owner_id": self.owner_id._to_json_dict() if self.owner_id is not None else None,
+            "gift": self.gift._to_json_dict() if self.gift is not None else None,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeGiftSale(StarTransactionType):
+    """
+    The transaction is a sale of a received gift; for regular users and channel chats only
+
+    :param user_id: Identifier of the user that sent the gift
+    :param gift: The gift
+    """
+
+    _type: "str" = field(default="starTransactionTypeGiftSale", init=False, repr=False)
+    user_id: "int" = 0
+    gift: "Gift | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "gift": self.gift._to_json_dict() if self.gift is not None else None,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeGiftUpgrade(StarTransactionType):
+    """
+    The transaction is an upgrade of a gift; for regular users only
+
+    :param user_id: Identifier of the user that initially sent the gift
+    :param gift: The upgraded gift
+    """
+
+    _type: "str" = field(default="starTransactionTypeGiftUpgrade", init=False, repr=False)
+    user_id: "int" = 0
+    gift: "UpgradedGift | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "gift": self.gift._to_json_dict() if self.gift is not None else None,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeUpgradedGiftPurchase(StarTransactionType):
+    """
+    The transaction is a purchase of an upgraded gift for some user or channel; for regular users only
+
+    :param user_id: Identifier of the user that sold the gift
+    :param gift: The gift
+    """
+
+    _type: "str" = field(default="starTransactionTypeUpgradedGiftPurchase", init=False, repr=False)
+    user_id: "int" = 0
+    gift: "UpgradedGift | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "gift": self.gift._to_json_dict() if self.gift is not None else None,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeUpgradedGiftSale(StarTransactionType):
+    """
+    The transaction is a sale of an upgraded gift; for regular users only
+
+    :param user_id: Identifier of the user that bought the gift
+    :param gift: The gift
+    :param affiliate: Information about commission received by Telegram from the transaction
+    """
+
+    _type: "str" = field(default="starTransactionTypeUpgradedGiftSale", init=False, repr=False)
+    user_id: "int" = 0
+    gift: "UpgradedGift | None" = None
+    affiliate: "AffiliateInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "gift": self.gift._to_json_dict() if self.gift is not None else None,
+            "affiliate": self.affiliate._to_json_dict() if self.affiliate is not None else None,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeChannelPaidReactionSend(StarTransactionType):
+    """
+    The transaction is a sending of a paid reaction to a message in a channel chat by the current user; for regular users only
+
+    :param chat_id: Identifier of the channel chat
+    :param message_id: Identifier of the reacted message; can be 0 or an identifier of a deleted message
+    """
+
+    _type: "str" = field(default="starTransactionTypeChannelPaidReactionSend", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeChannelPaidReactionReceive(StarTransactionType):
+    """
+    The transaction is a receiving of a paid reaction to a message by the channel chat; for channel chats only
+
+    :param user_id: Identifier of the user that added the paid reaction
+    :param message_id: Identifier of the reacted message; can be 0 or an identifier of a deleted message
+    """
+
+    _type: "str" = field(default="starTransactionTypeChannelPaidReactionReceive", init=False, repr=False)
+    user_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "message_id": self.message_id,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeAffiliateProgramCommission(StarTransactionType):
+    """
+    The transaction is a receiving of a commission from an affiliate program; for regular users, bots and channel chats only
+
+    :param chat_id: Identifier of the chat that created the affiliate program
+    :param commission_per_mille: The number of Telegram Stars received by the affiliate for each 1000 Telegram Stars received by the program owner
+    """
+
+    _type: "str" = field(default="starTransactionTypeAffiliateProgramCommission", init=False, repr=False)
+    chat_id: "int" = 0
+    commission_per_mille: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "commission_per_mille": self.commission_per_mille,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypePaidMessageSend(StarTransactionType):
+    """
+    The transaction is a sending of a paid message; for regular users only
+
+    :param chat_id: Identifier of the chat that received the payment
+    :param message_count: Number of sent paid messages
+    """
+
+    _type: "str" = field(default="starTransactionTypePaidMessageSend", init=False, repr=False)
+    chat_id: "int" = 0
+    message_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_count": self.message_count,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypePaidMessageReceive(StarTransactionType):
+    """
+    The transaction is a receiving of a paid message; for regular users, supergroup and channel chats only
+
+    :param sender_id: Identifier of the sender of the message
+    :param message_count: Number of received paid messages
+    :param commission_per_mille: The number of Telegram Stars received by the Telegram for each 1000 Telegram Stars paid for message sending
+    :param commission_star_amount: The amount of Telegram Stars that were received by Telegram; can be negative for refunds
+    """
+
+    _type: "str" = field(default="starTransactionTypePaidMessageReceive", init=False, repr=False)
+    sender_id: "MessageSender | None" = None
+    message_count: "int" = 0
+    commission_per_mille: "int" = 0
+    commission_star_amount: "StarAmount | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sender_id": self.sender_id._to_json_dict() if self.sender_id is not None else None,
+            "message_count": self.message_count,
+            "commission_per_mille": self.commission_per_mille,
+            "commission_star_amount": self.commission_star_amount._to_json_dict() if self.commission_star_amount is not None else None,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeSuggestedPostPaymentSend(StarTransactionType):
+    """
+    The transaction is a payment for a suggested post; for regular users only
+
+    :param chat_id: Identifier of the channel chat that posted the post
+    """
+
+    _type: "str" = field(default="starTransactionTypeSuggestedPostPaymentSend", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeSuggestedPostPaymentReceive(StarTransactionType):
+    """
+    The transaction is a receiving of a payment for a suggested post by the channel chat; for channel chats only
+
+    :param user_id: Identifier of the user that paid for the suggested post
+    """
+
+    _type: "str" = field(default="starTransactionTypeSuggestedPostPaymentReceive", init=False, repr=False)
+    user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypePremiumPurchase(StarTransactionType):
+    """
+    The transaction is a purchase of Telegram Premium subscription; for regular users and bots only
+
+    :param user_id: Identifier of the user that received the Telegram Premium subscription
+    :param month_count: Number of months the Telegram Premium subscription will be active
+    :param sticker: A sticker to be shown in the transaction information; may be null if unknown
+    """
+
+    _type: "str" = field(default="starTransactionTypePremiumPurchase", init=False, repr=False)
+    user_id: "int" = 0
+    month_count: "int" = 0
+    sticker: "Sticker | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "month_count": self.month_count,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeBusinessBotTransferSend(StarTransactionType):
+    """
+    The transaction is a transfer of Telegram Stars to a business bot; for regular users only
+
+    :param user_id: Identifier of the bot that received Telegram Stars
+    """
+
+    _type: "str" = field(default="starTransactionTypeBusinessBotTransferSend", init=False, repr=False)
+    user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeBusinessBotTransferReceive(StarTransactionType):
+    """
+    The transaction is a transfer of Telegram Stars from a business account; for bots only
+
+    :param user_id: Identifier of the user that sent Telegram Stars
+    """
+
+    _type: "str" = field(default="starTransactionTypeBusinessBotTransferReceive", init=False, repr=False)
+    user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+        }
+
+@dataclass(slots=True)
+class StarTransactionTypeUnsupported(StarTransactionType):
+    """
+    The transaction is a transaction of an unsupported type
+
+    """
+
+    _type: "str" = field(default="starTransactionTypeUnsupported", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
@@ -0,0 +1,1456 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import FormattedText
+    from .classes_01 import Animation, Birthdate, BotCommand, BotMenuButton, BotVerification, BotVerificationParameters, Photo, ProfilePhoto, Sticker, UserType, VerificationStatus
+    from .classes_02 import AffiliateProgramInfo, BusinessInfo, ChatAdministratorRights, ChatPermissions, ChatPhoto, StarAmount, StarSubscriptionPricing
+    from .classes_03 import GiftSettings, StarTransactionType, UpgradedGiftBackdropColors
+    from .classes_05 import MessageSender
+    from .classes_13 import UserStatus
+    from .classes_21 import InternalLinkType
+    from .classes_22 import BlockList
+
+@dataclass(slots=True)
+class StarTransaction(ObjectBase):
+    """
+    Represents a transaction changing the amount of owned Telegram Stars
+
+    :param id: Unique identifier of the transaction
+    :param star_amount: The amount of added owned Telegram Stars; negative for outgoing transactions
+    :param is_refund: True, if the transaction is a refund of a previous transaction
+    :param date: Point in time (Unix timestamp) when the transaction was completed
+    :param type: Type of the transaction
+    """
+
+    _type: "str" = field(default="starTransaction", init=False, repr=False)
+    id: "str" = ""
+    star_amount: "StarAmount | None" = None
+    is_refund: "bool" = False
+    date: "int" = 0
+    type: "StarTransactionType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "star_amount": self.star_amount._to_json_dict() if self.star_amount is not None else None,
+            "is_refund": self.is_refund,
+            "date": self.date,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+@dataclass(slots=True)
+class StarTransactions(ObjectBase):
+    """
+    Represents a list of Telegram Star transactions
+
+    :param star_amount: The amount of owned Telegram Stars
+    :param transactions: List of transactions with Telegram Stars
+    :param next_offset: The offset for the next request. If empty, then there are no more results
+    """
+
+    _type: "str" = field(default="starTransactions", init=False, repr=False)
+    star_amount: "StarAmount | None" = None
+    transactions: "list[StarTransaction] | None" = None
+    next_offset: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "star_amount": self.star_amount._to_json_dict() if self.star_amount is not None else None,
+            "transactions": _list_to_json(self.transactions),
+            "next_offset": self.next_offset,
+        }
+
+@dataclass(slots=True)
+class TonTransactionType(ObjectBase):
+    """
+    Describes type of transaction with Toncoins
+
+    """
+
+    _type: "str" = field(default="TonTransactionType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TonTransactionTypeFragmentDeposit(TonTransactionType):
+    """
+    The transaction is a deposit of Toncoins from Fragment
+
+    :param is_gift: True, if the transaction is a gift from another user
+    :param sticker: The sticker to be shown in the transaction information; may be null if unknown
+    """
+
+    _type: "str" = field(default="tonTransactionTypeFragmentDeposit", init=False, repr=False)
+    is_gift: "bool" = False
+    sticker: "Sticker | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_gift": self.is_gift,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+        }
+
+@dataclass(slots=True)
+class TonTransactionTypeSuggestedPostPayment(TonTransactionType):
+    """
+    The transaction is a payment for a suggested post
+
+    :param chat_id: Identifier of the channel chat that posted the post
+    """
+
+    _type: "str" = field(default="tonTransactionTypeSuggestedPostPayment", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+@dataclass(slots=True)
+class TonTransactionTypeUnsupported(TonTransactionType):
+    """
+    The transaction is a transaction of an unsupported type
+
+    """
+
+    _type: "str" = field(default="tonTransactionTypeUnsupported", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TonTransaction(ObjectBase):
+    """
+    Represents a transaction changing the amount of owned Toncoins
+
+    :param id: Unique identifier of the transaction
+    :param ton_amount: The amount of added owned Toncoins; negative for outgoing transactions
+    :param is_refund: True, if the transaction is a refund of a previous transaction
+    :param date: Point in time (Unix timestamp) when the transaction was completed
+    :param type: Type of the transaction
+    """
+
+    _type: "str" = field(default="tonTransaction", init=False, repr=False)
+    id: "str" = ""
+    ton_amount: "int" = 0
+    is_refund: "bool" = False
+    date: "int" = 0
+    type: "TonTransactionType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "ton_amount": self.ton_amount,
+            "is_refund": self.is_refund,
+            "date": self.date,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+@dataclass(slots=True)
+class TonTransactions(ObjectBase):
+    """
+    Represents a list of Toncoin transactions
+
+    :param ton_amount: The total amount of owned Toncoins
+    :param transactions: List of Toncoin transactions
+    :param next_offset: The offset for the next request. If empty, then there are no more results
+    """
+
+    _type: "str" = field(default="tonTransactions", init=False, repr=False)
+    ton_amount: "int" = 0
+    transactions: "list[TonTransaction] | None" = None
+    next_offset: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "ton_amount": self.ton_amount,
+            "transactions": _list_to_json(self.transactions),
+            "next_offset": self.next_offset,
+        }
+
+@dataclass(slots=True)
+class GiveawayParticipantStatus(ObjectBase):
+    """
+    Contains information about status of a user in a giveaway
+
+    """
+
+    _type: "str" = field(default="GiveawayParticipantStatus", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class GiveawayParticipantStatusEligible(GiveawayParticipantStatus):
+    """
+    The user is eligible for the giveaway
+
+    """
+
+    _type: "str" = field(default="giveawayParticipantStatusEligible", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class GiveawayParticipantStatusParticipating(GiveawayParticipantStatus):
+    """
+    The user participates in the giveaway
+
+    """
+
+    _type: "str" = field(default="giveawayParticipantStatusParticipating", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class GiveawayParticipantStatusAlreadyWasMember(GiveawayParticipantStatus):
+    """
+    The user can't participate in the giveaway, because they have already been member of the chat
+
+    :param joined_chat_date: Point in time (Unix timestamp) when the user joined the chat
+    """
+
+    _type: "str" = field(default="giveawayParticipantStatusAlreadyWasMember", init=False, repr=False)
+    joined_chat_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "joined_chat_date": self.joined_chat_date,
+        }
+
+@dataclass(slots=True)
+class GiveawayParticipantStatusAdministrator(GiveawayParticipantStatus):
+    """
+    The user can't participate in the giveaway, because they are an administrator in one of the chats that created the giveaway
+
+    :param chat_id: Identifier of the chat administered by the user
+    """
+
+    _type: "str" = field(default="giveawayParticipantStatusAdministrator", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+@dataclass(slots=True)
+class GiveawayParticipantStatusDisallowedCountry(GiveawayParticipantStatus):
+    """
+    The user can't participate in the giveaway, because they phone number is from a disallowed country
+
+    :param user_country_code: A two-letter ISO 3166-1 alpha-2 country code of the user's country
+    """
+
+    _type: "str" = field(default="giveawayParticipantStatusDisallowedCountry", init=False, repr=False)
+    user_country_code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_country_code": self.user_country_code,
+        }
+
+@dataclass(slots=True)
+class GiveawayInfo(ObjectBase):
+    """
+    Contains information about a giveaway
+
+    """
+
+    _type: "str" = field(default="GiveawayInfo", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class GiveawayInfoOngoing(GiveawayInfo):
+    """
+    Describes an ongoing giveaway
+
+    :param creation_date: Point in time (Unix timestamp) when the giveaway was created
+    :param status: Status of the current user in the giveaway
+    :param is_ended: True, if the giveaway has ended and results are being prepared
+    """
+
+    _type: "str" = field(default="giveawayInfoOngoing", init=False, repr=False)
+    creation_date: "int" = 0
+    status: "GiveawayParticipantStatus | None" = None
+    is_ended: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "creation_date": self.creation_date,
+            "status": self.status._to_json_dict() if self.status is not None else None,
+            "is_ended": self.is_ended,
+        }
+
+@dataclass(slots=True)
+class GiveawayInfoCompleted(GiveawayInfo):
+    """
+    Describes a completed giveaway
+
+    :param creation_date: Point in time (Unix timestamp) when the giveaway was created
+    :param actual_winners_selection_date: Point in time (Unix timestamp) when the winners were selected. May be bigger than winners selection date specified in parameters of the giveaway
+    :param was_refunded: True, if the giveaway was canceled and was fully refunded
+    :param is_winner: True, if the current user is a winner of the giveaway
+    :param winner_count: Number of winners in the giveaway
+    :param activation_count: Number of winners, which activated their gift codes; for Telegram Premium giveaways only
+    :param gift_code: Telegram Premium gift code that was received by the current user; empty if the user isn't a winner in the giveaway or the giveaway isn't a Telegram Premium giveaway
+    :param won_star_count: The amount of Telegram Stars won by the current user; 0 if the user isn't a winner in the giveaway or the giveaway isn't a Telegram Star giveaway
+    """
+
+    _type: "str" = field(default="giveawayInfoCompleted", init=False, repr=False)
+    creation_date: "int" = 0
+    actual_winners_selection_date: "int" = 0
+    was_refunded: "bool" = False
+    is_winner: "bool" = False
+    winner_count: "int" = 0
+    activation_count: "int" = 0
+    gift_code: "str" = ""
+    won_star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "creation_date": self.creation_date,
+            "actual_winners_selection_date": self.actual_winners_selection_date,
+            "was_refunded": self.was_refunded,
+            "is_winner": self.is_winner,
+            "winner_count": self.winner_count,
+            "activation_count": self.activation_count,
+            "gift_code": self.gift_code,
+            "won_star_count": self.won_star_count,
+        }
+
+@dataclass(slots=True)
+class GiveawayPrize(ObjectBase):
+    """
+    Contains information about a giveaway prize
+
+    """
+
+    _type: "str" = field(default="GiveawayPrize", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class GiveawayPrizePremium(GiveawayPrize):
+    """
+    The giveaway sends Telegram Premium subscriptions to the winners
+
+    :param month_count: Number of months the Telegram Premium subscription will be active after code activation
+    """
+
+    _type: "str" = field(default="giveawayPrizePremium", init=False, repr=False)
+    month_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "month_count": self.month_count,
+        }
+
+@dataclass(slots=True)
+class GiveawayPrizeStars(GiveawayPrize):
+    """
+    The giveaway sends Telegram Stars to the winners
+
+    :param star_count: Number of Telegram Stars that will be shared by all winners
+    """
+
+    _type: "str" = field(default="giveawayPrizeStars", init=False, repr=False)
+    star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "star_count": self.star_count,
+        }
+
+@dataclass(slots=True)
+class AccentColor(ObjectBase):
+    """
+    Contains information about supported accent color for user/chat name, background of empty chat photo, replies to messages and link previews
+
+    :param id: Accent color identifier
+    :param built_in_accent_color_id: Identifier of a built-in color to use in places, where only one color is needed; 0-6
+    :param light_theme_colors: The list of 1-3 colors in RGB format, describing the accent color, as expected to be shown in light themes
+    :param dark_theme_colors: The list of 1-3 colors in RGB format, describing the accent color, as expected to be shown in dark themes
+    :param min_channel_chat_boost_level: The minimum chat boost level required to use the color in a channel chat
+    """
+
+    _type: "str" = field(default="accentColor", init=False, repr=False)
+    id: "int" = 0
+    built_in_accent_color_id: "int" = 0
+    light_theme_colors: "list[int] | None" = None
+    dark_theme_colors: "list[int] | None" = None
+    min_channel_chat_boost_level: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "built_in_accent_color_id": self.built_in_accent_color_id,
+            "light_theme_colors": self.light_theme_colors,
+            "dark_theme_colors": self.dark_theme_colors,
+            "min_channel_chat_boost_level": self.min_channel_chat_boost_level,
+        }
+
+@dataclass(slots=True)
+class ProfileAccentColors(ObjectBase):
+    """
+    Contains information about supported accent colors for user profile photo background in RGB format
+
+    :param palette_colors: The list of 1-2 colors in RGB format, describing the colors, as expected to be shown in the color palette settings
+    :param background_colors: The list of 1-2 colors in RGB format, describing the colors, as expected to be used for the profile photo background
+    :param story_colors: The list of 2 colors in RGB format, describing the colors of the gradient to be used for the unread active story indicator around profile photo
+    """
+
+    _type: "str" = field(default="profileAccentColors", init=False, repr=False)
+    palette_colors: "list[int] | None" = None
+    background_colors: "list[int] | None" = None
+    story_colors: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "palette_colors": self.palette_colors,
+            "background_colors": self.background_colors,
+            "story_colors": self.story_colors,
+        }
+
+@dataclass(slots=True)
+class ProfileAccentColor(ObjectBase):
+    """
+    Contains information about supported accent color for user profile photo background
+
+    :param id: Profile accent color identifier
+    :param light_theme_colors: Accent colors expected to be used in light themes
+    :param dark_theme_colors: Accent colors expected to be used in dark themes
+    :param min_supergroup_chat_boost_level: The minimum chat boost level required to use the color in a supergroup chat
+    :param min_channel_chat_boost_level: The minimum chat boost level required to use the color in a channel chat
+    """
+
+    _type: "str" = field(default="profileAccentColor", init=False, repr=False)
+    id: "int" = 0
+    light_theme_colors: "ProfileAccentColors | None" = None
+    dark_theme_colors: "ProfileAccentColors | None" = None
+    min_supergroup_chat_boost_level: "int" = 0
+    min_channel_chat_boost_level: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "light_theme_colors": self.light_theme_colors._to_json_dict() if self.light_theme_colors is not None else None,
+            "dark_theme_colors": self.dark_theme_colors._to_json_dict() if self.dark_theme_colors is not None else None,
+            "min_supergroup_chat_boost_level": self.min_supergroup_chat_boost_level,
+            "min_channel_chat_boost_level": self.min_channel_chat_boost_level,
+        }
+
+@dataclass(slots=True)
+class EmojiStatusType(ObjectBase):
+    """
+    Describes type of emoji status
+
+    """
+
+    _type: "str" = field(default="EmojiStatusType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class EmojiStatusTypeCustomEmoji(EmojiStatusType):
+    """
+    A custom emoji set as emoji status
+
+    :param custom_emoji_id: Identifier of the custom emoji in stickerFormatTgs format
+    """
+
+    _type: "str" = field(default="emojiStatusTypeCustomEmoji", init=False, repr=False)
+    custom_emoji_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "custom_emoji_id": self.custom_emoji_id,
+        }
+
+@dataclass(slots=True)
+class EmojiStatusTypeUpgradedGift(EmojiStatusType):
+    """
+    An upgraded gift set as emoji status
+
+    :param upgraded_gift_id: Identifier of the upgraded gift
+    :param gift_title: The title of the upgraded gift
+    :param gift_name: Unique name of the upgraded gift that can be used with internalLinkTypeUpgradedGift
+    :param model_custom_emoji_id: Custom emoji identifier of the model of the upgraded gift
+    :param symbol_custom_emoji_id: Custom emoji identifier of the symbol of the upgraded gift
+    :param backdrop_colors: Colors of the backdrop of the upgraded gift
+    """
+
+    _type: "str" = field(default="emojiStatusTypeUpgradedGift", init=False, repr=False)
+    upgraded_gift_id: "int" = 0
+    gift_title: "str" = ""
+    gift_name: "str" = ""
+    model_custom_emoji_id: "int" = 0
+    symbol_custom_emoji_id: "int" = 0
+    backdrop_colors: "UpgradedGiftBackdropColors | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "upgraded_gift_id": self.upgraded_gift_id,
+            "gift_title": self.gift_title,
+            "gift_name": self.gift_name,
+            "model_custom_emoji_id": self.model_custom_emoji_id,
+            "symbol_custom_emoji_id": self.symbol_custom_emoji_id,
+            "backdrop_colors": self.backdrop_colors._to_json_dict() if self.backdrop_colors is not None else None,
+        }
+
+@dataclass(slots=True)
+class EmojiStatus(ObjectBase):
+    """
+    Describes an emoji to be shown instead of the Telegram Premium badge
+
+    :param type: Type of the emoji status
+    :param expiration_date: Point in time (Unix timestamp) when the status will expire; 0 if never
+    """
+
+    _type: "str" = field(default="emojiStatus", init=False, repr=False)
+    type: "EmojiStatusType | None" = None
+    expiration_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "expiration_date": self.expiration_date,
+        }
+
+@dataclass(slots=True)
+class EmojiStatuses(ObjectBase):
+    """
+    Contains a list of emoji statuses
+
+    :param emoji_statuses: The list of emoji statuses identifiers
+    """
+
+    _type: "str" = field(default="emojiStatuses", init=False, repr=False)
+    emoji_statuses: "list[EmojiStatus] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "emoji_statuses": _list_to_json(self.emoji_statuses),
+        }
+
+@dataclass(slots=True)
+class EmojiStatusCustomEmojis(ObjectBase):
+    """
+    Contains a list of custom emoji identifiers for emoji statuses
+
+    :param custom_emoji_ids: The list of custom emoji identifiers
+    """
+
+    _type: "str" = field(default="emojiStatusCustomEmojis", init=False, repr=False)
+    custom_emoji_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "custom_emoji_ids": self.custom_emoji_ids,
+        }
+
+@dataclass(slots=True)
+class Usernames(ObjectBase):
+    """
+    Describes usernames assigned to a user, a supergroup, or a channel
+
+    :param active_usernames: List of active usernames; the first one must be shown as the primary username. The order of active usernames can be changed with reorderActiveUsernames, reorderBotActiveUsernames or reorderSupergroupActiveUsernames
+    :param disabled_usernames: List of currently disabled usernames; the username can be activated with toggleUsernameIsActive, toggleBotUsernameIsActive, or toggleSupergroupUsernameIsActive
+    :param editable_username: The active username, which can be changed with setUsername or setSupergroupUsername. Information about other active usernames can be received using getCollectibleItemInfo
+    """
+
+    _type: "str" = field(default="usernames", init=False, repr=False)
+    active_usernames: "list[str] | None" = None
+    disabled_usernames: "list[str] | None" = None
+    editable_username: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "active_usernames": self.active_usernames,
+            "disabled_usernames": self.disabled_usernames,
+            "editable_username": self.editable_username,
+        }
+
+@dataclass(slots=True)
+class User(ObjectBase):
+    """
+    Represents a user
+
+    :param id: User identifier
+    :param first_name: First name of the user
+    :param last_name: Last name of the user
+    :param usernames: Usernames of the user; may be null
+    :param phone_number: Phone number of the user
+    :param status: Current online status of the user
+    :param profile_photo: Profile photo of the user; may be null
+    :param accent_color_id: Identifier of the accent color for name, and backgrounds of profile photo, reply header, and link preview
+    :param background_custom_emoji_id: Identifier of a custom emoji to be shown on the reply header and link preview background; 0 if none
+    :param profile_accent_color_id: Identifier of the accent color for the user's profile; -1 if none
+    :param profile_background_custom_emoji_id: Identifier of a custom emoji to be shown on the background of the user's profile; 0 if none
+    :param emoji_status: Emoji status to be shown instead of the default Telegram Premium badge; may be null
+    :param is_contact: The user is a contact of the current user
+    :param is_mutual_contact: The user is a contact of the current user and the current user is a contact of the user
+    :param is_close_friend: The user is a close friend of the current user; implies that the user is a contact
+    :param verification_status: Information about verification status of the user; may be null if none
+    :param is_premium: True, if the user is a Telegram Premium user
+    :param is_support: True, if the user is Telegram support account
+    :param restriction_reason: If non-empty, it contains a human-readable description of the reason why access to this user must be restricted
+    :param has_active_stories: True, if the user has non-expired stories available to the current user
+    :param has_unread_active_stories: True, if the user has unread non-expired stories available to the current user
+    :param restricts_new_chats: True, if the user may restrict new chats with non-contacts. Use canSendMessageToUser to check whether the current user can message the user or try to create a chat with them
+    :param paid_message_star_count: Number of Telegram Stars that must be paid by general user for each sent message to the user. If positive and userFullInfo is unknown, use canSendMessageToUser to check whether the current user must pay
+    :param have_access: If false, the user is inaccessible, and the only information known about the user is inside this class. Identifier of the user can't be passed to any method
+    :param type: Type of the user
+    :param language_code: IETF language tag of the user's language; only available to bots
+    :param added_to_attachment_menu: True, if the user added the current bot to attachment menu; only available to bots
+    """
+
+    _type: "str" = field(default="user", init=False, repr=False)
+    id: "int" = 0
+    first_name: "str" = ""
+    last_name: "str" = ""
+    usernames: "Usernames | None" = None
+    phone_number: "str" = ""
+    status: "UserStatus | None" = None
+    profile_photo: "ProfilePhoto | None" = None
+    accent_color_id: "int" = 0
+    background_custom_emoji_id: "int" = 0
+    profile_accent_color_id: "int" = 0
+    profile_background_custom_emoji_id: "int" = 0
+    emoji_status: "EmojiStatus | None" = None
+    is_contact: "bool" = False
+    is_mutual_contact: "bool" = False
+    is_close_friend: "bool" = False
+    verification_status: "VerificationStatus | None" = None
+    is_premium: "bool" = False
+    is_support: "bool" = False
+    restriction_reason: "str" = ""
+    has_active_stories: "bool" = False
+    has_unread_active_stories: "bool" = False
+    restricts_new_chats: "bool" = False
+    paid_message_star_count: "int" = 0
+    have_access: "bool" = False
+    type: "UserType | None" = None
+    language_code: "str" = ""
+    added_to_attachment_menu: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+            "usernames": self.usernames._to_json_dict() if self.usernames is not None else None,
+            "phone_number": self.phone_number,
+            "status": self.status._to_json_dict() if self.status is not None else None,
+            "profile_photo": self.profile_photo._to_json_dict() if self.profile_photo is not None else None,
+            "accent_color_id": self.accent_color_id,
+            "background_custom_emoji_id": self.background_custom_emoji_id,
+            "profile_accent_color_id": self.profile_accent_color_id,
+            "profile_background_custom_emoji_id": self.profile_background_custom_emoji_id,
+            "emoji_status": self.emoji_status._to_json_dict() if self.emoji_status is not None else None,
+            "is_contact": self.is_contact,
+            "is_mutual_contact": self.is_mutual_contact,
+            "is_close_friend": self.is_close_friend,
+            "verification_status": self.verification_status._to_json_dict() if self.verification_status is not None else None,
+            "is_premium": self.is_premium,
+            "is_support": self.is_support,
+            "restriction_reason": self.restriction_reason,
+            "has_active_stories": self.has_active_stories,
+            "has_unread_active_stories": self.has_unread_active_stories,
+            "restricts_new_chats": self.restricts_new_chats,
+            "paid_message_star_count": self.paid_message_star_count,
+            "have_access": self.have_access,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "language_code": self.language_code,
+            "added_to_attachment_menu": self.added_to_attachment_menu,
+        }
+
+@dataclass(slots=True)
+class BotInfo(ObjectBase):
+    """
+    Contains information about a bot
+
+    :param short_description: The text that is shown on the bot's profile page and is sent together with the link when users share the bot
+    :param description: Contains information about a bot
+    :param photo: Photo shown in the chat with the bot if the chat is empty; may be null
+    :param animation: Animation shown in the chat with the bot if the chat is empty; may be null
+    :param menu_button: Information about a button to show instead of the bot commands menu button; may be null if ordinary bot commands menu must be shown
+    :param commands: List of the bot commands
+    :param privacy_policy_url: The HTTP link to the privacy policy of the bot. If empty, then /privacy command must be used if supported by the bot. If the command isn't supported, then https://telegram.org/privacy-tpa must be opened
+    :param default_group_administrator_rights: Default administrator rights for adding the bot to basic group and supergroup chats; may be null
+    :param default_channel_administrator_rights: Default administrator rights for adding the bot to channels; may be null
+    :param affiliate_program: Information about the affiliate program of the bot; may be null if none
+    :param web_app_background_light_color: Default light background color for bot Web Apps; -1 if not specified
+    :param web_app_background_dark_color: Default dark background color for bot Web Apps; -1 if not specified
+    :param web_app_header_light_color: Default light header color for bot Web Apps; -1 if not specified
+    :param web_app_header_dark_color: Default dark header color for bot Web Apps; -1 if not specified
+    :param verification_parameters: Parameters of the verification that can be provided by the bot; may be null if none or the current user isn't the owner of the bot
+    :param can_get_revenue_statistics: True, if the bot's revenue statistics are available to the current user
+    :param can_manage_emoji_status: True, if the bot can manage emoji status of the current user
+    :param has_media_previews: True, if the bot has media previews
+    :param edit_commands_link: The internal link, which can be used to edit bot commands; may be null
+    :param edit_description_link: The internal link, which can be used to edit bot description; may be null
+    :param edit_description_media_link: The internal link, which can be used to edit the photo or animation shown in the chat with the bot if the chat is empty; may be null
+    :param edit_settings_link: The internal link, which can be used to edit bot settings; may be null
+    """
+
+    _type: "str" = field(default="botInfo", init=False, repr=False)
+    short_description: "str" = ""
+    description: "str" = ""
+    photo: "Photo | None" = None
+    animation: "Animation | None" = None
+    menu_button: "BotMenuButton | None" = None
+    commands: "list[BotCommand] | None" = None
+    privacy_policy_url: "str" = ""
+    default_group_administrator_rights: "ChatAdministratorRights | None" = None
+    default_channel_administrator_rights: "ChatAdministratorRights | None" = None
+    affiliate_program: "AffiliateProgramInfo | None" = None
+    web_app_background_light_color: "int" = 0
+    web_app_background_dark_color: "int" = 0
+    web_app_header_light_color: "int" = 0
+    web_app_header_dark_color: "int" = 0
+    verification_parameters: "BotVerificationParameters | None" = None
+    can_get_revenue_statistics: "bool" = False
+    can_manage_emoji_status: "bool" = False
+    has_media_previews: "bool" = False
+    edit_commands_link: "InternalLinkType | None" = None
+    edit_description_link: "InternalLinkType | None" = None
+    edit_description_media_link: "InternalLinkType | None" = None
+    edit_settings_link: "InternalLinkType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "short_description": self.short_description,
+            "description": self.description,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+            "animation": self.animation._to_json_dict() if self.animation is not None else None,
+            "menu_button": self.menu_button._to_json_dict() if self.menu_button is not None else None,
+            "commands": _list_to_json(self.commands),
+            "privacy_policy_url": self.privacy_policy_url,
+            "default_group_administrator_rights": self.default_group_administrator_rights._to_json_dict() if self.default_group_administrator_rights is not None else None,
+            "default_channel_administrator_rights": self.default_channel_administrator_rights._to_json_dict() if self.default_channel_administrator_rights is not None else None,
+            "affiliate_program": self.affiliate_program._to_json_dict() if self.affiliate_program is not None else None,
+            "web_app_background_light_color": self.web_app_background_light_color,
+            "web_app_background_dark_color": self.web_app_background_dark_color,
+            "web_app_header_light_color": self.web_app_header_light_color,
+            "web_app_header_dark_color": self.web_app_header_dark_color,
+            "verification_parameters": self.verification_parameters._to_json_dict() if self.verification_parameters is not None else None,
+            "can_get_revenue_statistics": self.can_get_revenue_statistics,
+            "can_manage_emoji_status": self.can_manage_emoji_status,
+            "has_media_previews": self.has_media_previews,
+            "edit_commands_link": self.edit_commands_link._to_json_dict() if self.edit_commands_link is not None else None,
+            "edit_description_link": self.edit_description_link._to_json_dict() if self.edit_description_link is not None else None,
+            "edit_description_media_link": self.edit_description_media_link._to_json_dict() if self.edit_description_media_link is not None else None,
+            "edit_settings_link": self.edit_settings_link._to_json_dict() if self.edit_settings_link is not None else None,
+        }
+
+@dataclass(slots=True)
+class UserFullInfo(ObjectBase):
+    """
+    Contains full information about a user
+
+    :param personal_photo: User profile photo set by the current user for the contact; may be null. If null and user.profile_photo is null, then the photo is empty; otherwise, it is unknown.
+     If non-null, then it is the same photo as in user.profile_photo and chat.photo. This photo isn't returned in the list of user photos
+    :param photo: User profile photo; may be null. If null and user.profile_photo is null, then the photo is empty; otherwise, it is unknown.
+     If non-null and personal_photo is null, then it is the same photo as in user.profile_photo and chat.photo
+    :param public_photo: User profile photo visible if the main photo is hidden by privacy settings; may be null. If null and user.profile_photo is null, then the photo is empty; otherwise, it is unknown.
+     If non-null and both photo and personal_photo are null, then it is the same photo as in user.profile_photo and chat.photo. This photo isn't returned in the list of user photos
+    :param block_list: Block list to which the user is added; may be null if none
+    :param can_be_called: True, if the user can be called
+    :param supports_video_calls: True, if a video call can be created with the user
+    :param has_private_calls: True, if the user can't be called due to their privacy settings
+    :param has_private_forwards: True, if the user can't be linked in forwarded messages due to their privacy settings
+    :param has_restricted_voice_and_video_note_messages: True, if voice and video notes can't be sent or forwarded to the user
+    :param has_posted_to_profile_stories: True, if the user has posted to profile stories
+    :param has_sponsored_messages_enabled: True, if the user always enabled sponsored messages; known only for the current user
+    :param need_phone_number_privacy_exception: True, if the current user needs to explicitly allow to share their phone number with the user when the method addContact is used
+    :param set_chat_background: True, if the user set chat background for both chat users and it wasn't reverted yet
+    :param bio: A short user bio; may be null for bots
+    :param birthdate: Birthdate of the user; may be null if unknown
+    :param personal_chat_id: Identifier of the personal chat of the user; 0 if none
+    :param gift_count: Number of saved to profile gifts for other users or the total number of received gifts for the current user
+    :param group_in_common_count: Number of group chats where both the other user and the current user are a member; 0 for the current user
+    :param incoming_paid_message_star_count: Number of Telegram Stars that must be paid by the user for each sent message to the current user
+    :param outgoing_paid_message_star_count: Number of Telegram Stars that must be paid by the current user for each sent message to the user
+    :param gift_settings: Settings for gift receiving for the user
+    :param bot_verification: Information about verification status of the user provided by a bot; may be null if none or unknown
+    :param business_info: Information about business settings for Telegram Business accounts; may be null if none
+    :param bot_info: For bots, information about the bot; may be null if the user isn't a bot
+    """
+
+    _type: "str" = field(default="userFullInfo", init=False, repr=False)
+    personal_photo: "ChatPhoto | None" = None
+    photo: "ChatPhoto | None" = None
+    public_photo: "ChatPhoto | None" = None
+    block_list: "BlockList | None" = None
+    can_be_called: "bool" = False
+    supports_video_calls: "bool" = False
+    has_private_calls: "bool" = False
+    has_private_forwards: "bool" = False
+    has_restricted_voice_and_video_note_messages: "bool" = False
+    has_posted_to_profile_stories: "bool" = False
+    has_sponsored_messages_enabled: "bool" = False
+    need_phone_number_privacy_exception: "bool" = False
+    set_chat_background: "bool" = False
+    bio: "FormattedText | None" = None
+    birthdate: "Birthdate | None" = None
+    personal_chat_id: "int" = 0
+    gift_count: "int" = 0
+    group_in_common_count: "int" = 0
+    incoming_paid_message_star_count: "int" = 0
+    outgoing_paid_message_star_count: "int" = 0
+    gift_settings: "GiftSettings | None" = None
+    bot_verification: "BotVerification | None" = None
+    business_info: "BusinessInfo | None" = None
+    bot_info: "BotInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "personal_photo": self.personal_photo._to_json_dict() if self.personal_photo is not None else None,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+            "public_photo": self.public_photo._to_json_dict() if self.public_photo is not None else None,
+            "block_list": self.block_list._to_json_dict() if self.block_list is not None else None,
+            "can_be_called": self.can_be_called,
+            "supports_video_calls": self.supports_video_calls,
+            "has_private_calls": self.has_private_calls,
+            "has_private_forwards": self.has_private_forwards,
+            "has_restricted_voice_and_video_note_messages": self.has_restricted_voice_and_video_note_messages,
+            "has_posted_to_profile_stories": self.has_posted_to_profile_stories,
+            "has_sponsored_messages_enabled": self.has_sponsored_messages_enabled,
+            "need_phone_number_privacy_exception": self.need_phone_number_privacy_exception,
+            "set_chat_background": self.set_chat_background,
+            "bio": self.bio._to_json_dict() if self.bio is not None else None,
+            "birthdate": self.birthdate._to_json_dict() if self.birthdate is not None else None,
+            "personal_chat_id": self.personal_chat_id,
+            "gift_count": self.gift_count,
+            "group_in_common_count": self.group_in_common_count,
+            "incoming_paid_message_star_count": self.incoming_paid_message_star_count,
+            "outgoing_paid_message_star_count": self.outgoing_paid_message_star_count,
+            "gift_settings": self.gift_settings._to_json_dict() if self.gift_settings is not None else None,
+            "bot_verification": self.bot_verification._to_json_dict() if self.bot_verification is not None else None,
+            "business_info": self.business_info._to_json_dict() if self.business_info is not None else None,
+            "bot_info": self.bot_info._to_json_dict() if self.bot_info is not None else None,
+        }
+
+@dataclass(slots=True)
+class Users(ObjectBase):
+    """
+    Represents a list of users
+
+    :param total_count: Approximate total number of users found
+    :param user_ids: A list of user identifiers
+    """
+
+    _type: "str" = field(default="users", init=False, repr=False)
+    total_count: "int" = 0
+    user_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "user_ids": self.user_ids,
+        }
+
+@dataclass(slots=True)
+class FoundUsers(ObjectBase):
+    """
+    Represents a list of found users
+
+    :param user_ids: Identifiers of the found users
+    :param next_offset: The offset for the next request. If empty, then there are no more results
+    """
+
+    _type: "str" = field(default="foundUsers", init=False, repr=False)
+    user_ids: "list[int] | None" = None
+    next_offset: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_ids": self.user_ids,
+            "next_offset": self.next_offset,
+        }
+
+@dataclass(slots=True)
+class ChatAdministrator(ObjectBase):
+    """
+    Contains information about a chat administrator
+
+    :param user_id: User identifier of the administrator
+    :param custom_title: Custom title of the administrator
+    :param is_owner: True, if the user is the owner of the chat
+    """
+
+    _type: "str" = field(default="chatAdministrator", init=False, repr=False)
+    user_id: "int" = 0
+    custom_title: "str" = ""
+    is_owner: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "custom_title": self.custom_title,
+            "is_owner": self.is_owner,
+        }
+
+@dataclass(slots=True)
+class ChatAdministrators(ObjectBase):
+    """
+    Represents a list of chat administrators
+
+    :param administrators: A list of chat administrators
+    """
+
+    _type: "str" = field(default="chatAdministrators", init=False, repr=False)
+    administrators: "list[ChatAdministrator] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "administrators": _list_to_json(self.administrators),
+        }
+
+@dataclass(slots=True)
+class ChatMemberStatus(ObjectBase):
+    """
+    Provides information about the status of a member in a chat
+
+    """
+
+    _type: "str" = field(default="ChatMemberStatus", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatMemberStatusCreator(ChatMemberStatus):
+    """
+    The user is the owner of the chat and has all the administrator privileges
+
+    :param custom_title: A custom title of the owner; 0-16 characters without emoji; applicable to supergroups only
+    :param is_anonymous: True, if the creator isn't shown in the chat member list and sends messages anonymously; applicable to supergroups only
+    :param is_member: True, if the user is a member of the chat
+    """
+
+    _type: "str" = field(default="chatMemberStatusCreator", init=False, repr=False)
+    custom_title: "str" = ""
+    is_anonymous: "bool" = False
+    is_member: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "custom_title": self.custom_title,
+            "is_anonymous": self.is_anonymous,
+            "is_member": self.is_member,
+        }
+
+@dataclass(slots=True)
+class ChatMemberStatusAdministrator(ChatMemberStatus):
+    """
+    The user is a member of the chat and has some additional privileges. In basic groups, administrators can edit and delete messages sent by others, add new members, ban unprivileged members, and manage video chats. In supergroups and channels, there are more detailed options for administrator privileges
+
+    :param custom_title: A custom title of the administrator; 0-16 characters without emoji; applicable to supergroups only
+    :param can_be_edited: True, if the current user can edit the administrator privileges for the called user
+    :param rights: Rights of the administrator
+    """
+
+    _type: "str" = field(default="chatMemberStatusAdministrator", init=False, repr=False)
+    custom_title: "str" = ""
+    can_be_edited: "bool" = False
+    rights: "ChatAdministratorRights | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "custom_title": self.custom_title,
+            "can_be_edited": self.can_be_edited,
+            "rights": self.rights._to_json_dict() if self.rights is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatMemberStatusMember(ChatMemberStatus):
+    """
+    The user is a member of the chat, without any additional privileges or restrictions
+
+    :param member_until_date: Point in time (Unix timestamp) when the user will be removed from the chat because of the expired subscription; 0 if never. Ignored in setChatMemberStatus
+    """
+
+    _type: "str" = field(default="chatMemberStatusMember", init=False, repr=False)
+    member_until_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "member_until_date": self.member_until_date,
+        }
+
+@dataclass(slots=True)
+class ChatMemberStatusRestricted(ChatMemberStatus):
+    """
+    The user is under certain restrictions in the chat. Not supported in basic groups and channels
+
+    :param is_member: True, if the user is a member of the chat
+    :param restricted_until_date: Point in time (Unix timestamp) when restrictions will be lifted from the user; 0 if never. If the user is restricted for more than 366 days or for less than 30 seconds from the current time, the user is considered to be restricted forever
+    :param permissions: User permissions in the chat
+    """
+
+    _type: "str" = field(default="chatMemberStatusRestricted", init=False, repr=False)
+    is_member: "bool" = False
+    restricted_until_date: "int" = 0
+    permissions: "ChatPermissions | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_member": self.is_member,
+            "restricted_until_date": self.restricted_until_date,
+            "permissions": self.permissions._to_json_dict() if self.permissions is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatMemberStatusLeft(ChatMemberStatus):
+    """
+    The user or the chat is not a chat member
+
+    """
+
+    _type: "str" = field(default="chatMemberStatusLeft", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatMemberStatusBanned(ChatMemberStatus):
+    """
+    The user or the chat was banned (and hence is not a member of the chat). Implies the user can't return to the chat, view messages, or be used as a participant identifier to join a video chat of the chat
+
+    :param banned_until_date: Point in time (Unix timestamp) when the user will be unbanned; 0 if never. If the user is banned for more than 366 days or for less than 30 seconds from the current time, the user is considered to be banned forever. Always 0 in basic groups
+    """
+
+    _type: "str" = field(default="chatMemberStatusBanned", init=False, repr=False)
+    banned_until_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "banned_until_date": self.banned_until_date,
+        }
+
+@dataclass(slots=True)
+class ChatMember(ObjectBase):
+    """
+    Describes a user or a chat as a member of another chat
+
+    :param member_id: Identifier of the chat member. Currently, other chats can be only Left or Banned. Only supergroups and channels can have other chats as Left or Banned members and these chats must be supergroups or channels
+    :param inviter_user_id: Identifier of a user that invited/promoted/banned this member in the chat; 0 if unknown
+    :param joined_chat_date: Point in time (Unix timestamp) when the user joined/was promoted/was banned in the chat
+    :param status: Status of the member in the chat
+    """
+
+    _type: "str" = field(default="chatMember", init=False, repr=False)
+    member_id: "MessageSender | None" = None
+    inviter_user_id: "int" = 0
+    joined_chat_date: "int" = 0
+    status: "ChatMemberStatus | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "member_id": self.member_id._to_json_dict() if self.member_id is not None else None,
+            "inviter_user_id": self.inviter_user_id,
+            "joined_chat_date": self.joined_chat_date,
+            "status": self.status._to_json_dict() if self.status is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatMembers(ObjectBase):
+    """
+    Contains a list of chat members
+
+    :param total_count: Approximate total number of chat members found
+    :param members: A list of chat members
+    """
+
+    _type: "str" = field(default="chatMembers", init=False, repr=False)
+    total_count: "int" = 0
+    members: "list[ChatMember] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "members": _list_to_json(self.members),
+        }
+
+@dataclass(slots=True)
+class ChatMembersFilter(ObjectBase):
+    """
+    Specifies the kind of chat members to return in searchChatMembers
+
+    """
+
+    _type: "str" = field(default="ChatMembersFilter", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatMembersFilterContacts(ChatMembersFilter):
+    """
+    Returns contacts of the user
+
+    """
+
+    _type: "str" = field(default="chatMembersFilterContacts", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatMembersFilterAdministrators(ChatMembersFilter):
+    """
+    Returns the owner and administrators
+
+    """
+
+    _type: "str" = field(default="chatMembersFilterAdministrators", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatMembersFilterMembers(ChatMembersFilter):
+    """
+    Returns all chat members, including restricted chat members
+
+    """
+
+    _type: "str" = field(default="chatMembersFilterMembers", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatMembersFilterMention(ChatMembersFilter):
+    """
+    Returns users which can be mentioned in the chat
+
+    :param message_thread_id: If non-zero, the identifier of the current message thread
+    """
+
+    _type: "str" = field(default="chatMembersFilterMention", init=False, repr=False)
+    message_thread_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "message_thread_id": self.message_thread_id,
+        }
+
+@dataclass(slots=True)
+class ChatMembersFilterRestricted(ChatMembersFilter):
+    """
+    Returns users under certain restrictions in the chat; can be used only by administrators in a supergroup
+
+    """
+
+    _type: "str" = field(default="chatMembersFilterRestricted", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatMembersFilterBanned(ChatMembersFilter):
+    """
+    Returns users banned from the chat; can be used only by administrators in a supergroup or in a channel
+
+    """
+
+    _type: "str" = field(default="chatMembersFilterBanned", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatMembersFilterBots(ChatMembersFilter):
+    """
+    Returns bot members of the chat
+
+    """
+
+    _type: "str" = field(default="chatMembersFilterBots", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SupergroupMembersFilter(ObjectBase):
+    """
+    Specifies the kind of chat members to return in getSupergroupMembers
+
+    """
+
+    _type: "str" = field(default="SupergroupMembersFilter", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SupergroupMembersFilterRecent(SupergroupMembersFilter):
+    """
+    Returns recently active users in reverse chronological order
+
+    """
+
+    _type: "str" = field(default="supergroupMembersFilterRecent", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SupergroupMembersFilterContacts(SupergroupMembersFilter):
+    """
+    Returns contacts of the user, which are members of the supergroup or channel
+
+    :param query: Query to search for
+    """
+
+    _type: "str" = field(default="supergroupMembersFilterContacts", init=False, repr=False)
+    query: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "query": self.query,
+        }
+
+@dataclass(slots=True)
+class SupergroupMembersFilterAdministrators(SupergroupMembersFilter):
+    """
+    Returns the owner and administrators
+
+    """
+
+    _type: "str" = field(default="supergroupMembersFilterAdministrators", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SupergroupMembersFilterSearch(SupergroupMembersFilter):
+    """
+    Used to search for supergroup or channel members via a (string) query
+
+    :param query: Query to search for
+    """
+
+    _type: "str" = field(default="supergroupMembersFilterSearch", init=False, repr=False)
+    query: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "query": self.query,
+        }
+
+@dataclass(slots=True)
+class SupergroupMembersFilterRestricted(SupergroupMembersFilter):
+    """
+    Returns restricted supergroup members; can be used only by administrators
+
+    :param query: Query to search for
+    """
+
+    _type: "str" = field(default="supergroupMembersFilterRestricted", init=False, repr=False)
+    query: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "query": self.query,
+        }
+
+@dataclass(slots=True)
+class SupergroupMembersFilterBanned(SupergroupMembersFilter):
+    """
+    Returns users banned from the supergroup or channel; can be used only by administrators
+
+    :param query: Query to search for
+    """
+
+    _type: "str" = field(default="supergroupMembersFilterBanned", init=False, repr=False)
+    query: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "query": self.query,
+        }
+
+@dataclass(slots=True)
+class SupergroupMembersFilterMention(SupergroupMembersFilter):
+    """
+    Returns users which can be mentioned in the supergroup
+
+    :param query: Query to search for
+    :param message_thread_id: If non-zero, the identifier of the current message thread
+    """
+
+    _type: "str" = field(default="supergroupMembersFilterMention", init=False, repr=False)
+    query: "str" = ""
+    message_thread_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "query": self.query,
+            "message_thread_id": self.message_thread_id,
+        }
+
+@dataclass(slots=True)
+class SupergroupMembersFilterBots(SupergroupMembersFilter):
+    """
+    Returns bot members of the supergroup or channel
+
+    """
+
+    _type: "str" = field(default="supergroupMembersFilterBots", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatInviteLink(ObjectBase):
+    """
+    Contains a chat invite link
+
+    :param invite_link: Chat invite link
+    :param name: Name of the link
+    :param creator_user_id: User identifier of an administrator created the link
+    :param date: Point in time (Unix timestamp) when the link was created
+    :param edit_date: Point in time (Unix timestamp) when the link was last edited; 0 if never or unknown
+    :param expiration_date: Point in time (Unix timestamp) when the link will expire; 0 if never
+    :param subscription_pricing: Information about subscription plan that is applied to the users joining the chat by the link; may be null if the link doesn't require subscription
+    :param member_limit: The maximum number of members, which can join the chat using the link simultaneously; 0 if not limited. Always 0 if the link requires approval
+    :param member_count: Number of chat members, which joined the chat using the link
+    :param expired_member_count: Number of chat members, which joined the chat using the link, but have already left because of expired subscription; for subscription links only
+    :param pending_join_request_count: Number of pending join requests created using this link
+    :param creates_join_request: True, if the link only creates join request. If true, total number of joining members will be unlimited
+    :param is_primary: True, if the link is primary. Primary invite link can't have name, expiration date, or usage limit. There is exactly one primary invite link for each administrator with can_invite_users right at a given time
+    :param is_revoked: True, if the link was revoked
+    """
+
+    _type: "str" = field(default="chatInviteLink", init=False, repr=False)
+    invite_link: "str" = ""
+    name: "str" = ""
+    creator_user_id: "int" = 0
+    date: "int" = 0
+    edit_date: "int" = 0
+    expiration_date: "int" = 0
+    subscription_pricing: "StarSubscriptionPricing | None" = None
+    member_limit: "int" = 0
+    member_count: "int" = 0
+    expired_member_count: "int" = 0
+    pending_join_request_count: "int" = 0
+    creates_join_request: "bool" = False
+    is_primary: "bool" = False
+    is_revoked: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "invite_link": self.invite_link,
+            "name": self.name,
+            "creator_user_id": self.creator_user_id,
+            "date": self.date,
+            "edit_date": self.edit_date,
+            "expiration_date": self.expiration_date,
+            "subscription_pricing": self.subscription_pricing._to_json_dict() if self.subscription_pricing is not None else None,
+            "member_limit": self.member_limit,
+            "member_count": self.member_count,
+            "expired_member_count": self.expired_member_count,
+            "pending_join_request_count": self.pending_join_request_count,
+            "creates_join_request": self.creates_join_request,
+            "is_primary": self.is_primary,
+            "is_revoked": self.is_revoked,
+        }
+
@@ -0,0 +1,1495 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_01 import BotCommands, BotVerification, ChatLocation, ChatPhotoInfo, Sticker, VerificationStatus
+    from .classes_02 import ChatPhoto, StarSubscriptionPricing
+    from .classes_04 import ChatInviteLink, ChatMember, ChatMemberStatus, Usernames
+
+@dataclass(slots=True)
+class ChatInviteLinks(ObjectBase):
+    """
+    Contains a list of chat invite links
+
+    :param total_count: Approximate total number of chat invite links found
+    :param invite_links: List of invite links
+    """
+
+    _type: "str" = field(default="chatInviteLinks", init=False, repr=False)
+    total_count: "int" = 0
+    invite_links: "list[ChatInviteLink] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "invite_links": _list_to_json(self.invite_links),
+        }
+
+@dataclass(slots=True)
+class ChatInviteLinkCount(ObjectBase):
+    """
+    Describes a chat administrator with a number of active and revoked chat invite links
+
+    :param user_id: Administrator's user identifier
+    :param invite_link_count: Number of active invite links
+    :param revoked_invite_link_count: Number of revoked invite links
+    """
+
+    _type: "str" = field(default="chatInviteLinkCount", init=False, repr=False)
+    user_id: "int" = 0
+    invite_link_count: "int" = 0
+    revoked_invite_link_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "invite_link_count": self.invite_link_count,
+            "revoked_invite_link_count": self.revoked_invite_link_count,
+        }
+
+@dataclass(slots=True)
+class ChatInviteLinkCounts(ObjectBase):
+    """
+    Contains a list of chat invite link counts
+
+    :param invite_link_counts: List of invite link counts
+    """
+
+    _type: "str" = field(default="chatInviteLinkCounts", init=False, repr=False)
+    invite_link_counts: "list[ChatInviteLinkCount] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "invite_link_counts": _list_to_json(self.invite_link_counts),
+        }
+
+@dataclass(slots=True)
+class ChatInviteLinkMember(ObjectBase):
+    """
+    Describes a chat member joined a chat via an invite link
+
+    :param user_id: User identifier
+    :param joined_chat_date: Point in time (Unix timestamp) when the user joined the chat
+    :param via_chat_folder_invite_link: True, if the user has joined the chat using an invite link for a chat folder
+    :param approver_user_id: User identifier of the chat administrator, approved user join request
+    """
+
+    _type: "str" = field(default="chatInviteLinkMember", init=False, repr=False)
+    user_id: "int" = 0
+    joined_chat_date: "int" = 0
+    via_chat_folder_invite_link: "bool" = False
+    approver_user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "joined_chat_date": self.joined_chat_date,
+            "via_chat_folder_invite_link": self.via_chat_folder_invite_link,
+            "approver_user_id": self.approver_user_id,
+        }
+
+@dataclass(slots=True)
+class ChatInviteLinkMembers(ObjectBase):
+    """
+    Contains a list of chat members joined a chat via an invite link
+
+    :param total_count: Approximate total number of chat members found
+    :param members: List of chat members, joined a chat via an invite link
+    """
+
+    _type: "str" = field(default="chatInviteLinkMembers", init=False, repr=False)
+    total_count: "int" = 0
+    members: "list[ChatInviteLinkMember] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "members": _list_to_json(self.members),
+        }
+
+@dataclass(slots=True)
+class InviteLinkChatType(ObjectBase):
+    """
+    Describes the type of chat to which points an invite link
+
+    """
+
+    _type: "str" = field(default="InviteLinkChatType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InviteLinkChatTypeBasicGroup(InviteLinkChatType):
+    """
+    The link is an invite link for a basic group
+
+    """
+
+    _type: "str" = field(default="inviteLinkChatTypeBasicGroup", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InviteLinkChatTypeSupergroup(InviteLinkChatType):
+    """
+    The link is an invite link for a supergroup
+
+    """
+
+    _type: "str" = field(default="inviteLinkChatTypeSupergroup", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InviteLinkChatTypeChannel(InviteLinkChatType):
+    """
+    The link is an invite link for a channel
+
+    """
+
+    _type: "str" = field(default="inviteLinkChatTypeChannel", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatInviteLinkSubscriptionInfo(ObjectBase):
+    """
+    Contains information about subscription plan that must be paid by the user to use a chat invite link
+
+    :param pricing: Information about subscription plan that must be paid by the user to use the link
+    :param can_reuse: True, if the user has already paid for the subscription and can use joinChatByInviteLink to join the subscribed chat again
+    :param form_id: Identifier of the payment form to use for subscription payment; 0 if the subscription can't be paid
+    """
+
+    _type: "str" = field(default="chatInviteLinkSubscriptionInfo", init=False, repr=False)
+    pricing: "StarSubscriptionPricing | None" = None
+    can_reuse: "bool" = False
+    form_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "pricing": self.pricing._to_json_dict() if self.pricing is not None else None,
+            "can_reuse": self.can_reuse,
+            "form_id": self.form_id,
+        }
+
+@dataclass(slots=True)
+class ChatInviteLinkInfo(ObjectBase):
+    """
+    Contains information about a chat invite link
+
+    :param chat_id: Chat identifier of the invite link; 0 if the user has no access to the chat before joining
+    :param accessible_for: If non-zero, the amount of time for which read access to the chat will remain available, in seconds
+    :param type: Type of the chat
+    :param title: Title of the chat
+    :param photo: Chat photo; may be null
+    :param accent_color_id: Identifier of the accent color for chat title and background of chat photo
+    :param description: Contains information about a chat invite link
+    :param member_count: Number of members in the chat
+    :param member_user_ids: User identifiers of some chat members that may be known to the current user
+    :param subscription_info: Information about subscription plan that must be paid by the user to use the link; may be null if the link doesn't require subscription
+    :param creates_join_request: True, if the link only creates join request
+    :param is_public: True, if the chat is a public supergroup or channel, i.e. it has a username or it is a location-based supergroup
+    :param verification_status: Information about verification status of the chat; may be null if none
+    """
+
+    _type: "str" = field(default="chatInviteLinkInfo", init=False, repr=False)
+    chat_id: "int" = 0
+    accessible_for: "int" = 0
+    type: "InviteLinkChatType | None" = None
+    title: "str" = ""
+    photo: "ChatPhotoInfo | None" = None
+    accent_color_id: "int" = 0
+    description: "str" = ""
+    member_count: "int" = 0
+    member_user_ids: "list[int] | None" = None
+    subscription_info: "ChatInviteLinkSubscriptionInfo | None" = None
+    creates_join_request: "bool" = False
+    is_public: "bool" = False
+    verification_status: "VerificationStatus | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "accessible_for": self.accessible_for,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "title": self.title,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+            "accent_color_id": self.accent_color_id,
+            "description": self.description,
+            "member_count": self.member_count,
+            "member_user_ids": self.member_user_ids,
+            "subscription_info": self.subscription_info._to_json_dict() if self.subscription_info is not None else None,
+            "creates_join_request": self.creates_join_request,
+            "is_public": self.is_public,
+            "verification_status": self.verification_status._to_json_dict() if self.verification_status is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatJoinRequest(ObjectBase):
+    """
+    Describes a user that sent a join request and waits for administrator approval
+
+    :param user_id: User identifier
+    :param date: Point in time (Unix timestamp) when the user sent the join request
+    :param bio: A short bio of the user
+    """
+
+    _type: "str" = field(default="chatJoinRequest", init=False, repr=False)
+    user_id: "int" = 0
+    date: "int" = 0
+    bio: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "date": self.date,
+            "bio": self.bio,
+        }
+
+@dataclass(slots=True)
+class ChatJoinRequests(ObjectBase):
+    """
+    Contains a list of requests to join a chat
+
+    :param total_count: Approximate total number of requests found
+    :param requests: List of the requests
+    """
+
+    _type: "str" = field(default="chatJoinRequests", init=False, repr=False)
+    total_count: "int" = 0
+    requests: "list[ChatJoinRequest] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "requests": _list_to_json(self.requests),
+        }
+
+@dataclass(slots=True)
+class ChatJoinRequestsInfo(ObjectBase):
+    """
+    Contains information about pending join requests for a chat
+
+    :param total_count: Total number of pending join requests
+    :param user_ids: Identifiers of at most 3 users sent the newest pending join requests
+    """
+
+    _type: "str" = field(default="chatJoinRequestsInfo", init=False, repr=False)
+    total_count: "int" = 0
+    user_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "user_ids": self.user_ids,
+        }
+
+@dataclass(slots=True)
+class BasicGroup(ObjectBase):
+    """
+    Represents a basic group of 0-200 users (must be upgraded to a supergroup to accommodate more than 200 users)
+
+    :param id: Group identifier
+    :param member_count: Number of members in the group
+    :param status: Status of the current user in the group
+    :param is_active: True, if the group is active
+    :param upgraded_to_supergroup_id: Identifier of the supergroup to which this group was upgraded; 0 if none
+    """
+
+    _type: "str" = field(default="basicGroup", init=False, repr=False)
+    id: "int" = 0
+    member_count: "int" = 0
+    status: "ChatMemberStatus | None" = None
+    is_active: "bool" = False
+    upgraded_to_supergroup_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "member_count": self.member_count,
+            "status": self.status._to_json_dict() if self.status is not None else None,
+            "is_active": self.is_active,
+            "upgraded_to_supergroup_id": self.upgraded_to_supergroup_id,
+        }
+
+@dataclass(slots=True)
+class BasicGroupFullInfo(ObjectBase):
+    """
+    Contains full information about a basic group
+
+    :param photo: Chat photo; may be null if empty or unknown. If non-null, then it is the same photo as in chat.photo
+    :param description: Contains full information about a basic group
+    :param creator_user_id: User identifier of the creator of the group; 0 if unknown
+    :param members: Group members
+    :param can_hide_members: True, if non-administrators and non-bots can be hidden in responses to getSupergroupMembers and searchChatMembers for non-administrators after upgrading the basic group to a supergroup
+    :param can_toggle_aggressive_anti_spam: True, if aggressive anti-spam checks can be enabled or disabled in the supergroup after upgrading the basic group to a supergroup
+    :param invite_link: Primary invite link for this group; may be null. For chat administrators with can_invite_users right only. Updated only after the basic group is opened
+    :param bot_commands: List of commands of bots in the group
+    """
+
+    _type: "str" = field(default="basicGroupFullInfo", init=False, repr=False)
+    photo: "ChatPhoto | None" = None
+    description: "str" = ""
+    creator_user_id: "int" = 0
+    members: "list[ChatMember] | None" = None
+    can_hide_members: "bool" = False
+    can_toggle_aggressive_anti_spam: "bool" = False
+    invite_link: "ChatInviteLink | None" = None
+    bot_commands: "list[BotCommands] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+            "description": self.description,
+            "creator_user_id": self.creator_user_id,
+            "members": _list_to_json(self.members),
+            "can_hide_members": self.can_hide_members,
+            "can_toggle_aggressive_anti_spam": self.can_toggle_aggressive_anti_spam,
+            "invite_link": self.invite_link._to_json_dict() if self.invite_link is not None else None,
+            "bot_commands": _list_to_json(self.bot_commands),
+        }
+
+@dataclass(slots=True)
+class Supergroup(ObjectBase):
+    """
+    Represents a supergroup or channel with zero or more members (subscribers in the case of channels). From the point of view of the system, a channel is a special kind of a supergroup: only administrators can post and see the list of members, and posts from all administrators use the name and photo of the channel instead of individual names and profile photos.
+     Unlike supergroups, channels can have an unlimited number of subscribers
+
+    :param id: Supergroup or channel identifier
+    :param usernames: Usernames of the supergroup or channel; may be null
+    :param date: Point in time (Unix timestamp) when the current user joined, or the point in time when the supergroup or channel was created, in case the user is not a member
+    :param status: Status of the current user in the supergroup or channel; custom title will always be empty
+    :param member_count: Number of members in the supergroup or channel; 0 if unknown. Currently, it is guaranteed to be known only if the supergroup or channel was received through
+     getChatSimilarChats, getChatsToPostStories, getCreatedPublicChats, getGroupsInCommon, getInactiveSupergroupChats, getRecommendedChats, getSuitableDiscussionChats,
+     getUserPrivacySettingRules, getVideoChatAvailableParticipants, searchPublicChats, or in chatFolderInviteLinkInfo.missing_chat_ids, or in userFullInfo.personal_chat_id,
+     or for chats with messages or stories from publicForwards and foundStories
+    :param boost_level: Approximate boost level for the chat
+    :param has_automatic_translation: True, if automatic translation of messages is enabled in the channel
+    :param has_linked_chat: True, if the channel has a discussion group, or the supergroup is the designated discussion group for a channel
+    :param has_location: True, if the supergroup is connected to a location, i.e. the supergroup is a location-based supergroup
+    :param sign_messages: True, if messages sent to the channel contains name of the sender. This field is only applicable to channels
+    :param show_message_sender: True, if messages sent to the channel have information about the sender user. This field is only applicable to channels
+    :param join_to_send_messages: True, if users need to join the supergroup before they can send messages. May be false only for discussion supergroups and channel direct messages groups
+    :param join_by_request: True, if all users directly joining the supergroup need to be approved by supergroup administrators. Always false for channels and supergroups without username, location, or a linked chat
+    :param is_slow_mode_enabled: True, if the slow mode is enabled in the supergroup
+    :param is_channel: True, if the supergroup is a channel
+    :param is_broadcast_group: True, if the supergroup is a broadcast group, i.e. only administrators can send messages and there is no limit on the number of members
+    :param is_forum: True, if the supergroup is a forum with topics
+    :param is_direct_messages_group: True, if the supergroup is a direct message group for a channel chat
+    :param is_administered_direct_messages_group: True, if the supergroup is a direct messages group for a channel chat that is administered by the current user
+    :param verification_status: Information about verification status of the supergroup or channel; may be null if none
+    :param has_direct_messages_group: True, if the channel has direct messages group
+    :param has_forum_tabs: True, if the supergroup is a forum, which topics are shown in the same way as in channel direct messages groups
+    :param has_sensitive_content: True, if content of media messages in the supergroup or channel chat must be hidden with 18+ spoiler
+    :param restriction_reason: If non-empty, contains a human-readable description of the reason why access to this supergroup or channel must be restricted
+    :param paid_message_star_count: Number of Telegram Stars that must be paid by non-administrator users of the supergroup chat for each sent message
+    :param has_active_stories: True, if the supergroup or channel has non-expired stories available to the current user
+    :param has_unread_active_stories: True, if the supergroup or channel has unread non-expired stories available to the current user
+    """
+
+    _type: "str" = field(default="supergroup", init=False, repr=False)
+    id: "int" = 0
+    usernames: "Usernames | None" = None
+    date: "int" = 0
+    status: "ChatMemberStatus | None" = None
+    member_count: "int" = 0
+    boost_level: "int" = 0
+    has_automatic_translation: "bool" = False
+    has_linked_chat: "bool" = False
+    has_location: "bool" = False
+    sign_messages: "bool" = False
+    show_message_sender: "bool" = False
+    join_to_send_messages: "bool" = False
+    join_by_request: "bool" = False
+    is_slow_mode_enabled: "bool" = False
+    is_channel: "bool" = False
+    is_broadcast_group: "bool" = False
+    is_forum: "bool" = False
+    is_direct_messages_group: "bool" = False
+    is_administered_direct_messages_group: "bool" = False
+    verification_status: "VerificationStatus | None" = None
+    has_direct_messages_group: "bool" = False
+    has_forum_tabs: "bool" = False
+    has_sensitive_content: "bool" = False
+    restriction_reason: "str" = ""
+    paid_message_star_count: "int" = 0
+    has_active_stories: "bool" = False
+    has_unread_active_stories: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "usernames": self.usernames._to_json_dict() if self.usernames is not None else None,
+            "date": self.date,
+            "status": self.status._to_json_dict() if self.status is not None else None,
+            "member_count": self.member_count,
+            "boost_level": self.boost_level,
+            "has_automatic_translation": self.has_automatic_translation,
+            "has_linked_chat": self.has_linked_chat,
+            "has_location": self.has_location,
+            "sign_messages": self.sign_messages,
+            "show_message_sender": self.show_message_sender,
+            "join_to_send_messages": self.join_to_send_messages,
+            "join_by_request": self.join_by_request,
+            "is_slow_mode_enabled": self.is_slow_mode_enabled,
+            "is_channel": self.is_channel,
+            "is_broadcast_group": self.is_broadcast_group,
+            "is_forum": self.is_forum,
+            "is_direct_messages_group": self.is_direct_messages_group,
+            "is_administered_direct_messages_group": self.is_administered_direct_messages_group,
+            "verification_status": self.verification_status._to_json_dict() if self.verification_status is not None else None,
+            "has_direct_messages_group": self.has_direct_messages_group,
+            "has_forum_tabs": self.has_forum_tabs,
+            "has_sensitive_content": self.has_sensitive_content,
+            "restriction_reason": self.restriction_reason,
+            "paid_message_star_count": self.paid_message_star_count,
+            "has_active_stories": self.has_active_stories,
+            "has_unread_active_stories": self.has_unread_active_stories,
+        }
+
+@dataclass(slots=True)
+class SupergroupFullInfo(ObjectBase):
+    """
+    Contains full information about a supergroup or channel
+
+    :param photo: Chat photo; may be null if empty or unknown. If non-null, then it is the same photo as in chat.photo
+    :param description: Contains full information about a supergroup or channel
+    :param member_count: Number of members in the supergroup or channel; 0 if unknown
+    :param administrator_count: Number of privileged users in the supergroup or channel; 0 if unknown
+    :param restricted_count: Number of restricted users in the supergroup; 0 if unknown
+    :param banned_count: Number of users banned from chat; 0 if unknown
+    :param linked_chat_id: Chat identifier of a discussion group for the channel, or a channel, for which the supergroup is the designated discussion group; 0 if none or unknown
+    :param direct_messages_chat_id: Chat identifier of a direct messages group for the channel, or a channel, for which the supergroup is the designated direct messages group; 0 if none
+    :param slow_mode_delay: Delay between consecutive sent messages for non-administrator supergroup members, in seconds
+    :param slow_mode_delay_expires_in: Time left before next message can be sent in the supergroup, in seconds. An updateSupergroupFullInfo update is not triggered when value of this field changes, but both new and old values are non-zero
+    :param can_enable_paid_messages: True, if paid messages can be enabled in the supergroup chat; for supergroup only
+    :param can_enable_paid_reaction: True, if paid reaction can be enabled in the channel chat; for channels only
+    :param can_get_members: True, if members of the chat can be retrieved via getSupergroupMembers or searchChatMembers
+    :param has_hidden_members: True, if non-administrators can receive only administrators and bots using getSupergroupMembers or searchChatMembers
+    :param can_hide_members: True, if non-administrators and non-bots can be hidden in responses to getSupergroupMembers and searchChatMembers for non-administrators
+    :param can_set_sticker_set: True, if the supergroup sticker set can be changed
+    :param can_set_location: True, if the supergroup location can be changed
+    :param can_get_statistics: True, if the supergroup or channel statistics are available
+    :param can_get_revenue_statistics: True, if the supergroup or channel revenue statistics are available
+    :param can_get_star_revenue_statistics: True, if the supergroup or channel Telegram Star revenue statistics are available
+    :param can_send_gift: True, if the user can send a gift to the supergroup or channel using sendGift or transferGift
+    :param can_toggle_aggressive_anti_spam: True, if aggressive anti-spam checks can be enabled or disabled in the supergroup
+    :param is_all_history_available: True, if new chat members will have access to old messages. In public, discussion, of forum groups and all channels, old messages are always available,
+     so this option affects only private non-forum supergroups without a linked chat. The value of this field is only available to chat administrators
+    :param can_have_sponsored_messages: True, if the chat can have sponsored messages. The value of this field is only available to the owner of the chat
+    :param has_aggressive_anti_spam_enabled: True, if aggressive anti-spam checks are enabled in the supergroup. The value of this field is only available to chat administrators
+    :param has_paid_media_allowed: True, if paid media can be sent and forwarded to the channel chat; for channels only
+    :param has_pinned_stories: True, if the supergroup or channel has pinned stories
+    :param gift_count: Number of saved to profile gifts for channels without can_post_messages administrator right, otherwise, the total number of received gifts
+    :param my_boost_count: Number of times the current user boosted the supergroup or channel
+    :param unrestrict_boost_count: Number of times the supergroup must be boosted by a user to ignore slow mode and chat permission restrictions; 0 if unspecified
+    :param outgoing_paid_message_star_count: Number of Telegram Stars that must be paid by the current user for each sent message to the supergroup
+    :param sticker_set_id: Identifier of the supergroup sticker set that must be shown before user sticker sets; 0 if none
+    :param custom_emoji_sticker_set_id: Identifier of the custom emoji sticker set that can be used in the supergroup without Telegram Premium subscription; 0 if none
+    :param location: Location to which the supergroup is connected; may be null if none
+    :param invite_link: Primary invite link for the chat; may be null. For chat administrators with can_invite_users right only
+    :param bot_commands: List of commands of bots in the group
+    :param bot_verification: Information about verification status of the supergroup or the channel provided by a bot; may be null if none or unknown
+    :param upgraded_from_basic_group_id: Identifier of the basic group from which supergroup was upgraded; 0 if none
+    :param upgraded_from_max_message_id: Identifier of the last message in the basic group from which supergroup was upgraded; 0 if none
+    """
+
+    _type: "str" = field(default="supergroupFullInfo", init=False, repr=False)
+    photo: "ChatPhoto | None" = None
+    description: "str" = ""
+    member_count: "int" = 0
+    administrator_count: "int" = 0
+    restricted_count: "int" = 0
+    banned_count: "int" = 0
+    linked_chat_id: "int" = 0
+    direct_messages_chat_id: "int" = 0
+    slow_mode_delay: "int" = 0
+    slow_mode_delay_expires_in: "float" = 0
+    can_enable_paid_messages: "bool" = False
+    can_enable_paid_reaction: "bool" = False
+    can_get_members: "bool" = False
+    has_hidden_members: "bool" = False
+    can_hide_members: "bool" = False
+    can_set_sticker_set: "bool" = False
+    can_set_location: "bool" = False
+    can_get_statistics: "bool" = False
+    can_get_revenue_statistics: "bool" = False
+    can_get_star_revenue_statistics: "bool" = False
+    can_send_gift: "bool" = False
+    can_toggle_aggressive_anti_spam: "bool" = False
+    is_all_history_available: "bool" = False
+    can_have_sponsored_messages: "bool" = False
+    has_aggressive_anti_spam_enabled: "bool" = False
+    has_paid_media_allowed: "bool" = False
+    has_pinned_stories: "bool" = False
+    gift_count: "int" = 0
+    my_boost_count: "int" = 0
+    unrestrict_boost_count: "int" = 0
+    outgoing_paid_message_star_count: "int" = 0
+    sticker_set_id: "int" = 0
+    custom_emoji_sticker_set_id: "int" = 0
+    location: "ChatLocation | None" = None
+    invite_link: "ChatInviteLink | None" = None
+    bot_commands: "list[BotCommands] | None" = None
+    bot_verification: "BotVerification | None" = None
+    upgraded_from_basic_group_id: "int" = 0
+    upgraded_from_max_message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+            "description": self.description,
+            "member_count": self.member_count,
+            "administrator_count": self.administrator_count,
+            "restricted_count": self.restricted_count,
+            "banned_count": self.banned_count,
+            "linked_chat_id": self.linked_chat_id,
+            "direct_messages_chat_id": self.direct_messages_chat_id,
+            "slow_mode_delay": self.slow_mode_delay,
+            "slow_mode_delay_expires_in": self.slow_mode_delay_expires_in,
+            "can_enable_paid_messages": self.can_enable_paid_messages,
+            "can_enable_paid_reaction": self.can_enable_paid_reaction,
+            "can_get_members": self.can_get_members,
+            "has_hidden_members": self.has_hidden_members,
+            "can_hide_members": self.can_hide_members,
+            "can_set_sticker_set": self.can_set_sticker_set,
+            "can_set_location": self.can_set_location,
+            "can_get_statistics": self.can_get_statistics,
+            "can_get_revenue_statistics": self.can_get_revenue_statistics,
+            "can_get_star_revenue_statistics": self.can_get_star_revenue_statistics,
+            "can_send_gift": self.can_send_gift,
+            "can_toggle_aggressive_anti_spam": self.can_toggle_aggressive_anti_spam,
+            "is_all_history_available": self.is_all_history_available,
+            "can_have_sponsored_messages": self.can_have_sponsored_messages,
+            "has_aggressive_anti_spam_enabled": self.has_aggressive_anti_spam_enabled,
+            "has_paid_media_allowed": self.has_paid_media_allowed,
+            "has_pinned_stories": self.has_pinned_stories,
+            "gift_count": self.gift_count,
+            "my_boost_count": self.my_boost_count,
+            "unrestrict_boost_count": self.unrestrict_boost_count,
+            "outgoing_paid_message_star_count": self.outgoing_paid_message_star_count,
+            "sticker_set_id": self.sticker_set_id,
+            "custom_emoji_sticker_set_id": self.custom_emoji_sticker_set_id,
+            "location": self.location._to_json_dict() if self.location is not None else None,
+            "invite_link": self.invite_link._to_json_dict() if self.invite_link is not None else None,
+            "bot_commands": _list_to_json(self.bot_commands),
+            "bot_verification": self.bot_verification._to_json_dict() if self.bot_verification is not None else None,
+            "upgraded_from_basic_group_id": self.upgraded_from_basic_group_id,
+            "upgraded_from_max_message_id": self.upgraded_from_max_message_id,
+        }
+
+@dataclass(slots=True)
+class SecretChatState(ObjectBase):
+    """
+    Describes the current secret chat state
+
+    """
+
+    _type: "str" = field(default="SecretChatState", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SecretChatStatePending(SecretChatState):
+    """
+    The secret chat is not yet created; waiting for the other user to get online
+
+    """
+
+    _type: "str" = field(default="secretChatStatePending", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SecretChatStateReady(SecretChatState):
+    """
+    The secret chat is ready to use
+
+    """
+
+    _type: "str" = field(default="secretChatStateReady", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SecretChatStateClosed(SecretChatState):
+    """
+    The secret chat is closed
+
+    """
+
+    _type: "str" = field(default="secretChatStateClosed", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SecretChat(ObjectBase):
+    """
+    Represents a secret chat
+
+    :param id: Secret chat identifier
+    :param user_id: Identifier of the chat partner
+    :param state: State of the secret chat
+    :param is_outbound: True, if the chat was created by the current user; false otherwise
+    :param key_hash: Hash of the currently used key for comparison with the hash of the chat partner's key. This is a string of 36 little-endian bytes, which must be split into groups of 2 bits, each denoting a pixel of one of 4 colors FFFFFF, D5E6F3, 2D5775, and 2F99C9.
+     The pixels must be used to make a 12x12 square image filled from left to right, top to bottom. Alternatively, the first 32 bytes of the hash can be converted to the hexadecimal format and printed as 32 2-digit hex numbers
+    :param layer: Secret chat layer; determines features supported by the chat partner's application. Nested text entities and underline and strikethrough entities are supported if the layer >= 101,
+     files bigger than 2000MB are supported if the layer >= 143, spoiler and custom emoji text entities are supported if the layer >= 144
+    """
+
+    _type: "str" = field(default="secretChat", init=False, repr=False)
+    id: "int" = 0
+    user_id: "int" = 0
+    state: "SecretChatState | None" = None
+    is_outbound: "bool" = False
+    key_hash: "bytes" = b""
+    layer: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "user_id": self.user_id,
+            "state": self.state._to_json_dict() if self.state is not None else None,
+            "is_outbound": self.is_outbound,
+            "key_hash": _bytes_to_json(self.key_hash),
+            "layer": self.layer,
+        }
+
+@dataclass(slots=True)
+class MessageSender(ObjectBase):
+    """
+    Contains information about the sender of a message
+
+    """
+
+    _type: "str" = field(default="MessageSender", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageSenderUser(MessageSender):
+    """
+    The message was sent by a known user
+
+    :param user_id: Identifier of the user that sent the message
+    """
+
+    _type: "str" = field(default="messageSenderUser", init=False, repr=False)
+    user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+        }
+
+@dataclass(slots=True)
+class MessageSenderChat(MessageSender):
+    """
+    The message was sent on behalf of a chat
+
+    :param chat_id: Identifier of the chat that sent the message
+    """
+
+    _type: "str" = field(default="messageSenderChat", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+@dataclass(slots=True)
+class MessageSenders(ObjectBase):
+    """
+    Represents a list of message senders
+
+    :param total_count: Approximate total number of messages senders found
+    :param senders: List of message senders
+    """
+
+    _type: "str" = field(default="messageSenders", init=False, repr=False)
+    total_count: "int" = 0
+    senders: "list[MessageSender] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "senders": _list_to_json(self.senders),
+        }
+
+@dataclass(slots=True)
+class ChatMessageSender(ObjectBase):
+    """
+    Represents a message sender, which can be used to send messages in a chat
+
+    :param sender: The message sender
+    :param needs_premium: True, if Telegram Premium is needed to use the message sender
+    """
+
+    _type: "str" = field(default="chatMessageSender", init=False, repr=False)
+    sender: "MessageSender | None" = None
+    needs_premium: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sender": self.sender._to_json_dict() if self.sender is not None else None,
+            "needs_premium": self.needs_premium,
+        }
+
+@dataclass(slots=True)
+class ChatMessageSenders(ObjectBase):
+    """
+    Represents a list of message senders, which can be used to send messages in a chat
+
+    :param senders: List of available message senders
+    """
+
+    _type: "str" = field(default="chatMessageSenders", init=False, repr=False)
+    senders: "list[ChatMessageSender] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "senders": _list_to_json(self.senders),
+        }
+
+@dataclass(slots=True)
+class MessageReadDate(ObjectBase):
+    """
+    Describes read date of a recent outgoing message in a private chat
+
+    """
+
+    _type: "str" = field(default="MessageReadDate", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageReadDateRead(MessageReadDate):
+    """
+    Contains read date of the message
+
+    :param read_date: Point in time (Unix timestamp) when the message was read by the other user
+    """
+
+    _type: "str" = field(default="messageReadDateRead", init=False, repr=False)
+    read_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "read_date": self.read_date,
+        }
+
+@dataclass(slots=True)
+class MessageReadDateUnread(MessageReadDate):
+    """
+    The message is unread yet
+
+    """
+
+    _type: "str" = field(default="messageReadDateUnread", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageReadDateTooOld(MessageReadDate):
+    """
+    The message is too old to get read date
+
+    """
+
+    _type: "str" = field(default="messageReadDateTooOld", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageReadDateUserPrivacyRestricted(MessageReadDate):
+    """
+    The read date is unknown due to privacy settings of the other user
+
+    """
+
+    _type: "str" = field(default="messageReadDateUserPrivacyRestricted", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageReadDateMyPrivacyRestricted(MessageReadDate):
+    """
+    The read date is unknown due to privacy settings of the current user, but will be known if the user subscribes to Telegram Premium
+
+    """
+
+    _type: "str" = field(default="messageReadDateMyPrivacyRestricted", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageViewer(ObjectBase):
+    """
+    Represents a viewer of a message
+
+    :param user_id: User identifier of the viewer
+    :param view_date: Approximate point in time (Unix timestamp) when the message was viewed
+    """
+
+    _type: "str" = field(default="messageViewer", init=False, repr=False)
+    user_id: "int" = 0
+    view_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "view_date": self.view_date,
+        }
+
+@dataclass(slots=True)
+class MessageViewers(ObjectBase):
+    """
+    Represents a list of message viewers
+
+    :param viewers: List of message viewers
+    """
+
+    _type: "str" = field(default="messageViewers", init=False, repr=False)
+    viewers: "list[MessageViewer] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "viewers": _list_to_json(self.viewers),
+        }
+
+@dataclass(slots=True)
+class MessageOrigin(ObjectBase):
+    """
+    Contains information about the origin of a message
+
+    """
+
+    _type: "str" = field(default="MessageOrigin", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageOriginUser(MessageOrigin):
+    """
+    The message was originally sent by a known user
+
+    :param sender_user_id: Identifier of the user that originally sent the message
+    """
+
+    _type: "str" = field(default="messageOriginUser", init=False, repr=False)
+    sender_user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sender_user_id": self.sender_user_id,
+        }
+
+@dataclass(slots=True)
+class MessageOriginHiddenUser(MessageOrigin):
+    """
+    The message was originally sent by a user, which is hidden by their privacy settings
+
+    :param sender_name: Name of the sender
+    """
+
+    _type: "str" = field(default="messageOriginHiddenUser", init=False, repr=False)
+    sender_name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sender_name": self.sender_name,
+        }
+
+@dataclass(slots=True)
+class MessageOriginChat(MessageOrigin):
+    """
+    The message was originally sent on behalf of a chat
+
+    :param sender_chat_id: Identifier of the chat that originally sent the message
+    :param author_signature: For messages originally sent by an anonymous chat administrator, original message author signature
+    """
+
+    _type: "str" = field(default="messageOriginChat", init=False, repr=False)
+    sender_chat_id: "int" = 0
+    author_signature: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sender_chat_id": self.sender_chat_id,
+            "author_signature": self.author_signature,
+        }
+
+@dataclass(slots=True)
+class MessageOriginChannel(MessageOrigin):
+    """
+    The message was originally a post in a channel
+
+    :param chat_id: Identifier of the channel chat to which the message was originally sent
+    :param message_id: Message identifier of the original message
+    :param author_signature: Original post author signature
+    """
+
+    _type: "str" = field(default="messageOriginChannel", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    author_signature: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "author_signature": self.author_signature,
+        }
+
+@dataclass(slots=True)
+class ForwardSource(ObjectBase):
+    """
+    Contains information about the last message from which a new message was forwarded last time
+
+    :param chat_id: Identifier of the chat to which the message that was forwarded belonged; may be 0 if unknown
+    :param message_id: Identifier of the message; may be 0 if unknown
+    :param sender_id: Identifier of the sender of the message; may be null if unknown or the new message was forwarded not to Saved Messages
+    :param sender_name: Name of the sender of the message if the sender is hidden by their privacy settings
+    :param date: Point in time (Unix timestamp) when the message is sent; 0 if unknown
+    :param is_outgoing: True, if the message that was forwarded is outgoing; always false if sender is unknown
+    """
+
+    _type: "str" = field(default="forwardSource", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    sender_id: "MessageSender | None" = None
+    sender_name: "str" = ""
+    date: "int" = 0
+    is_outgoing: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "sender_id": self.sender_id._to_json_dict() if self.sender_id is not None else None,
+            "sender_name": self.sender_name,
+            "date": self.date,
+            "is_outgoing": self.is_outgoing,
+        }
+
+@dataclass(slots=True)
+class ReactionType(ObjectBase):
+    """
+    Describes type of message reaction
+
+    """
+
+    _type: "str" = field(default="ReactionType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReactionTypeEmoji(ReactionType):
+    """
+    A reaction with an emoji
+
+    :param emoji: Text representation of the reaction
+    """
+
+    _type: "str" = field(default="reactionTypeEmoji", init=False, repr=False)
+    emoji: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "emoji": self.emoji,
+        }
+
+@dataclass(slots=True)
+class ReactionTypeCustomEmoji(ReactionType):
+    """
+    A reaction with a custom emoji
+
+    :param custom_emoji_id: Unique identifier of the custom emoji
+    """
+
+    _type: "str" = field(default="reactionTypeCustomEmoji", init=False, repr=False)
+    custom_emoji_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "custom_emoji_id": self.custom_emoji_id,
+        }
+
+@dataclass(slots=True)
+class ReactionTypePaid(ReactionType):
+    """
+    The paid reaction in a channel chat
+
+    """
+
+    _type: "str" = field(default="reactionTypePaid", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PaidReactionType(ObjectBase):
+    """
+    Describes type of paid message reaction
+
+    """
+
+    _type: "str" = field(default="PaidReactionType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PaidReactionTypeRegular(PaidReactionType):
+    """
+    A paid reaction on behalf of the current user
+
+    """
+
+    _type: "str" = field(default="paidReactionTypeRegular", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PaidReactionTypeAnonymous(PaidReactionType):
+    """
+    An anonymous paid reaction
+
+    """
+
+    _type: "str" = field(default="paidReactionTypeAnonymous", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PaidReactionTypeChat(PaidReactionType):
+    """
+    A paid reaction on behalf of an owned chat
+
+    :param chat_id: Identifier of the chat
+    """
+
+    _type: "str" = field(default="paidReactionTypeChat", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+@dataclass(slots=True)
+class PaidReactor(ObjectBase):
+    """
+    Contains information about a user that added paid reactions
+
+    :param sender_id: Identifier of the user or chat that added the reactions; may be null for anonymous reactors that aren't the current user
+    :param star_count: Number of Telegram Stars added
+    :param is_top: True, if the reactor is one of the most active reactors; may be false if the reactor is the current user
+    :param is_me: True, if the paid reaction was added by the current user
+    :param is_anonymous: True, if the reactor is anonymous
+    """
+
+    _type: "str" = field(default="paidReactor", init=False, repr=False)
+    sender_id: "MessageSender | None" = None
+    star_count: "int" = 0
+    is_top: "bool" = False
+    is_me: "bool" = False
+    is_anonymous: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sender_id": self.sender_id._to_json_dict() if self.sender_id is not None else None,
+            "star_count": self.star_count,
+            "is_top": self.is_top,
+            "is_me": self.is_me,
+            "is_anonymous": self.is_anonymous,
+        }
+
+@dataclass(slots=True)
+class MessageForwardInfo(ObjectBase):
+    """
+    Contains information about a forwarded message
+
+    :param origin: Origin of the forwarded message
+    :param date: Point in time (Unix timestamp) when the message was originally sent
+    :param source: For messages forwarded to the chat with the current user (Saved Messages), to the Replies bot chat, or to the channel's discussion group, information about the source message from which the message was forwarded last time; may be null for other forwards or if unknown
+    :param public_service_announcement_type: The type of public service announcement for the forwarded message
+    """
+
+    _type: "str" = field(default="messageForwardInfo", init=False, repr=False)
+    origin: "MessageOrigin | None" = None
+    date: "int" = 0
+    source: "ForwardSource | None" = None
+    public_service_announcement_type: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "origin": self.origin._to_json_dict() if self.origin is not None else None,
+            "date": self.date,
+            "source": self.source._to_json_dict() if self.source is not None else None,
+            "public_service_announcement_type": self.public_service_announcement_type,
+        }
+
+@dataclass(slots=True)
+class MessageImportInfo(ObjectBase):
+    """
+    Contains information about a message created with importMessages
+
+    :param sender_name: Name of the original sender
+    :param date: Point in time (Unix timestamp) when the message was originally sent
+    """
+
+    _type: "str" = field(default="messageImportInfo", init=False, repr=False)
+    sender_name: "str" = ""
+    date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sender_name": self.sender_name,
+            "date": self.date,
+        }
+
+@dataclass(slots=True)
+class MessageReplyInfo(ObjectBase):
+    """
+    Contains information about replies to a message
+
+    :param reply_count: Number of times the message was directly or indirectly replied
+    :param recent_replier_ids: Identifiers of at most 3 recent repliers to the message; available in channels with a discussion supergroup. The users and chats are expected to be inaccessible: only their photo and name will be available
+    :param last_read_inbox_message_id: Identifier of the last read incoming reply to the message
+    :param last_read_outbox_message_id: Identifier of the last read outgoing reply to the message
+    :param last_message_id: Identifier of the last reply to the message
+    """
+
+    _type: "str" = field(default="messageReplyInfo", init=False, repr=False)
+    reply_count: "int" = 0
+    recent_replier_ids: "list[MessageSender] | None" = None
+    last_read_inbox_message_id: "int" = 0
+    last_read_outbox_message_id: "int" = 0
+    last_message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "reply_count": self.reply_count,
+            "recent_replier_ids": _list_to_json(self.recent_replier_ids),
+            "last_read_inbox_message_id": self.last_read_inbox_message_id,
+            "last_read_outbox_message_id": self.last_read_outbox_message_id,
+            "last_message_id": self.last_message_id,
+        }
+
+@dataclass(slots=True)
+class MessageReaction(ObjectBase):
+    """
+    Contains information about a reaction to a message
+
+    :param type: Type of the reaction
+    :param total_count: Number of times the reaction was added
+    :param is_chosen: True, if the reaction is chosen by the current user
+    :param used_sender_id: Identifier of the message sender used by the current user to add the reaction; may be null if unknown or the reaction isn't chosen
+    :param recent_sender_ids: Identifiers of at most 3 recent message senders, added the reaction; available in private, basic group and supergroup chats
+    """
+
+    _type: "str" = field(default="messageReaction", init=False, repr=False)
+    type: "ReactionType | None" = None
+    total_count: "int" = 0
+    is_chosen: "bool" = False
+    used_sender_id: "MessageSender | None" = None
+    recent_sender_ids: "list[MessageSender] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "total_count": self.total_count,
+            "is_chosen": self.is_chosen,
+            "used_sender_id": self.used_sender_id._to_json_dict() if self.used_sender_id is not None else None,
+            "recent_sender_ids": _list_to_json(self.recent_sender_ids),
+        }
+
+@dataclass(slots=True)
+class MessageReactions(ObjectBase):
+    """
+    Contains a list of reactions added to a message
+
+    :param reactions: List of added reactions
+    :param are_tags: True, if the reactions are tags and Telegram Premium users can filter messages by them
+    :param paid_reactors: Information about top users that added the paid reaction
+    :param can_get_added_reactions: True, if the list of added reactions is available using getMessageAddedReactions
+    """
+
+    _type: "str" = field(default="messageReactions", init=False, repr=False)
+    reactions: "list[MessageReaction] | None" = None
+    are_tags: "bool" = False
+    paid_reactors: "list[PaidReactor] | None" = None
+    can_get_added_reactions: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "reactions": _list_to_json(self.reactions),
+            "are_tags": self.are_tags,
+            "paid_reactors": _list_to_json(self.paid_reactors),
+            "can_get_added_reactions": self.can_get_added_reactions,
+        }
+
+@dataclass(slots=True)
+class MessageInteractionInfo(ObjectBase):
+    """
+    Contains information about interactions with a message
+
+    :param view_count: Number of times the message was viewed
+    :param forward_count: Number of times the message was forwarded
+    :param reply_info: Information about direct or indirect replies to the message; may be null. Currently, available only in channels with a discussion supergroup and discussion supergroups for messages, which are not replies itself
+    :param reactions: The list of reactions or tags added to the message; may be null
+    """
+
+    _type: "str" = field(default="messageInteractionInfo", init=False, repr=False)
+    view_count: "int" = 0
+    forward_count: "int" = 0
+    reply_info: "MessageReplyInfo | None" = None
+    reactions: "MessageReactions | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "view_count": self.view_count,
+            "forward_count": self.forward_count,
+            "reply_info": self.reply_info._to_json_dict() if self.reply_info is not None else None,
+            "reactions": self.reactions._to_json_dict() if self.reactions is not None else None,
+        }
+
+@dataclass(slots=True)
+class UnreadReaction(ObjectBase):
+    """
+    Contains information about an unread reaction to a message
+
+    :param type: Type of the reaction
+    :param sender_id: Identifier of the sender, added the reaction
+    :param is_big: True, if the reaction was added with a big animation
+    """
+
+    _type: "str" = field(default="unreadReaction", init=False, repr=False)
+    type: "ReactionType | None" = None
+    sender_id: "MessageSender | None" = None
+    is_big: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "sender_id": self.sender_id._to_json_dict() if self.sender_id is not None else None,
+            "is_big": self.is_big,
+        }
+
+@dataclass(slots=True)
+class MessageTopic(ObjectBase):
+    """
+    Describes a topic of messages in a chat
+
+    """
+
+    _type: "str" = field(default="MessageTopic", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageTopicForum(MessageTopic):
+    """
+    A topic in a forum supergroup chat
+
+    :param forum_topic_id: Unique identifier of the forum topic; all messages in a non-forum supergroup chats belongs to the General topic
+    """
+
+    _type: "str" = field(default="messageTopicForum", init=False, repr=False)
+    forum_topic_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "forum_topic_id": self.forum_topic_id,
+        }
+
+@dataclass(slots=True)
+class MessageTopicDirectMessages(MessageTopic):
+    """
+    A topic in a channel direct messages chat administered by the current user
+
+    :param direct_messages_chat_topic_id: Unique identifier of the topic
+    """
+
+    _type: "str" = field(default="messageTopicDirectMessages", init=False, repr=False)
+    direct_messages_chat_topic_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "direct_messages_chat_topic_id": self.direct_messages_chat_topic_id,
+        }
+
+@dataclass(slots=True)
+class MessageTopicSavedMessages(MessageTopic):
+    """
+    A topic in Saved Messages chat
+
+    :param saved_messages_topic_id: Unique identifier of the Saved Messages topic
+    """
+
+    _type: "str" = field(default="messageTopicSavedMessages", init=False, repr=False)
+    saved_messages_topic_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "saved_messages_topic_id": self.saved_messages_topic_id,
+        }
+
+@dataclass(slots=True)
+class MessageEffectType(ObjectBase):
+    """
+    Describes type of emoji effect
+
+    """
+
+    _type: "str" = field(default="MessageEffectType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageEffectTypeEmojiReaction(MessageEffectType):
+    """
+    An effect from an emoji reaction
+
+    :param select_animation: Select animation for the effect in TGS format
+    :param effect_animation: Effect animation for the effect in TGS format
+    """
+
+    _type: "str" = field(default="messageEffectTypeEmojiReaction", init=False, repr=False)
+    select_animation: "Sticker | None" = None
+    effect_animation: "Sticker | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "select_animation": self.select_animation._to_json_dict() if self.select_animation is not None else None,
+            "effect_animation": self.effect_animation._to_json_dict() if self.effect_animation is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessageEffectTypePremiumSticker(MessageEffectType):
+    """
+    An effect from a premium sticker
+
+    :param sticker: The premium sticker. The effect can be found at sticker.full_type.premium_animation
+    """
+
+    _type: "str" = field(default="messageEffectTypePremiumSticker", init=False, repr=False)
+    sticker: "Sticker | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+        }
+
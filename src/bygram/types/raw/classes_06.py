@@ -0,0 +1,1428 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import Error, FormattedText
+    from .classes_01 import Photo, Sticker
+    from .classes_02 import SuggestedPostInfo
+    from .classes_05 import MessageEffectType, MessageForwardInfo, MessageImportInfo, MessageInteractionInfo, MessageOrigin, MessageSender, MessageTopic, UnreadReaction
+    from .classes_08 import ReplyMarkup
+    from .classes_11 import MessageContent
+    from .classes_12 import MessageSchedulingState, MessageSelfDestructType
+
+@dataclass(slots=True)
+class MessageEffect(ObjectBase):
+    """
+    Contains information about an effect added to a message
+
+    :param id: Unique identifier of the effect
+    :param static_icon: Static icon for the effect in WEBP format; may be null if none
+    :param emoji: Emoji corresponding to the effect that can be used if static icon isn't available
+    :param is_premium: True, if Telegram Premium subscription is required to use the effect
+    :param type: Type of the effect
+    """
+
+    _type: "str" = field(default="messageEffect", init=False, repr=False)
+    id: "int" = 0
+    static_icon: "Sticker | None" = None
+    emoji: "str" = ""
+    is_premium: "bool" = False
+    type: "MessageEffectType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "static_icon": self.static_icon._to_json_dict() if self.static_icon is not None else None,
+            "emoji": self.emoji,
+            "is_premium": self.is_premium,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessageSendingState(ObjectBase):
+    """
+    Contains information about the sending state of the message
+
+    """
+
+    _type: "str" = field(default="MessageSendingState", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageSendingStatePending(MessageSendingState):
+    """
+    The message is being sent now, but has not yet been delivered to the server
+
+    :param sending_id: Non-persistent message sending identifier, specified by the application
+    """
+
+    _type: "str" = field(default="messageSendingStatePending", init=False, repr=False)
+    sending_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sending_id": self.sending_id,
+        }
+
+@dataclass(slots=True)
+class MessageSendingStateFailed(MessageSendingState):
+    """
+    The message failed to be sent
+
+    :param error: The cause of the message sending failure
+    :param can_retry: True, if the message can be re-sent using resendMessages or readdQuickReplyShortcutMessages
+    :param need_another_sender: True, if the message can be re-sent only on behalf of a different sender
+    :param need_another_reply_quote: True, if the message can be re-sent only if another quote is chosen in the message that is replied by the given message
+    :param need_drop_reply: True, if the message can be re-sent only if the message to be replied is removed. This will be done automatically by resendMessages
+    :param required_paid_message_star_count: The number of Telegram Stars that must be paid to send the message; 0 if the current amount is correct
+    :param retry_after: Time left before the message can be re-sent, in seconds. No update is sent when this field changes
+    """
+
+    _type: "str" = field(default="messageSendingStateFailed", init=False, repr=False)
+    error: "Error | None" = None
+    can_retry: "bool" = False
+    need_another_sender: "bool" = False
+    need_another_reply_quote: "bool" = False
+    need_drop_reply: "bool" = False
+    required_paid_message_star_count: "int" = 0
+    retry_after: "float" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "error": self.error._to_json_dict() if self.error is not None else None,
+            "can_retry": self.can_retry,
+            "need_another_sender": self.need_another_sender,
+            "need_another_reply_quote": self.need_another_reply_quote,
+            "need_drop_reply": self.need_drop_reply,
+            "required_paid_message_star_count": self.required_paid_message_star_count,
+            "retry_after": self.retry_after,
+        }
+
+@dataclass(slots=True)
+class TextQuote(ObjectBase):
+    """
+    Describes manually or automatically chosen quote from another message
+
+    :param text: Text of the quote. Only Bold, Italic, Underline, Strikethrough, Spoiler, and CustomEmoji entities can be present in the text
+    :param position: Approximate quote position in the original message in UTF-16 code units as specified by the message sender
+    :param is_manual: True, if the quote was manually chosen by the message sender
+    """
+
+    _type: "str" = field(default="textQuote", init=False, repr=False)
+    text: "FormattedText | None" = None
+    position: "int" = 0
+    is_manual: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "position": self.position,
+            "is_manual": self.is_manual,
+        }
+
+@dataclass(slots=True)
+class InputTextQuote(ObjectBase):
+    """
+    Describes manually chosen quote from another message
+
+    :param text: Text of the quote; 0-getOption("message_reply_quote_length_max") characters. Only Bold, Italic, Underline, Strikethrough, Spoiler, and CustomEmoji entities are allowed to be kept and must be kept in the quote
+    :param position: Quote position in the original message in UTF-16 code units
+    """
+
+    _type: "str" = field(default="inputTextQuote", init=False, repr=False)
+    text: "FormattedText | None" = None
+    position: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "position": self.position,
+        }
+
+@dataclass(slots=True)
+class MessageReplyTo(ObjectBase):
+    """
+    Contains information about the message or the story a message is replying to
+
+    """
+
+    _type: "str" = field(default="MessageReplyTo", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageReplyToMessage(MessageReplyTo):
+    """
+    Describes a message replied by a given message
+
+    :param chat_id: The identifier of the chat to which the message belongs; may be 0 if the replied message is in unknown chat
+    :param message_id: The identifier of the message; may be 0 if the replied message is in unknown chat
+    :param quote: Chosen quote from the replied message; may be null if none
+    :param checklist_task_id: Identifier of the checklist task in the original message that was replied; 0 if none
+    :param origin: Information about origin of the message if the message was from another chat or topic; may be null for messages from the same chat
+    :param origin_send_date: Point in time (Unix timestamp) when the message was sent if the message was from another chat or topic; 0 for messages from the same chat
+    :param content: Media content of the message if the message was from another chat or topic; may be null for messages from the same chat and messages without media.
+     Can be only one of the following types: messageAnimation, messageAudio, messageChecklist, messageContact, messageDice, messageDocument, messageGame,
+     messageGiveaway, messageGiveawayWinners, messageInvoice, messageLocation, messagePaidMedia, messagePhoto, messagePoll, messageSticker, messageStory,
+     messageText (for link preview), messageVenue, messageVideo, messageVideoNote, or messageVoiceNote
+    """
+
+    _type: "str" = field(default="messageReplyToMessage", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    quote: "TextQuote | None" = None
+    checklist_task_id: "int" = 0
+    origin: "MessageOrigin | None" = None
+    origin_send_date: "int" = 0
+    content: "MessageContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "quote": self.quote._to_json_dict() if self.quote is not None else None,
+            "checklist_task_id": self.checklist_task_id,
+            "origin": self.origin._to_json_dict() if self.origin is not None else None,
+            "origin_send_date": self.origin_send_date,
+            "content": self.content._to_json_dict() if self.content is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessageReplyToStory(MessageReplyTo):
+    """
+    Describes a story replied by a given message
+
+    :param story_poster_chat_id: The identifier of the poster of the story
+    :param story_id: The identifier of the story
+    """
+
+    _type: "str" = field(default="messageReplyToStory", init=False, repr=False)
+    story_poster_chat_id: "int" = 0
+    story_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_poster_chat_id": self.story_poster_chat_id,
+            "story_id": self.story_id,
+        }
+
+@dataclass(slots=True)
+class InputMessageReplyTo(ObjectBase):
+    """
+    Contains information about the message or the story to be replied
+
+    """
+
+    _type: "str" = field(default="InputMessageReplyTo", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InputMessageReplyToMessage(InputMessageReplyTo):
+    """
+    Describes a message to be replied in the same chat and forum topic
+
+    :param message_id: The identifier of the message to be replied in the same chat and forum topic. A message can be replied in the same chat and forum topic only if messageProperties.can_be_replied
+    :param quote: Quote from the message to be replied; pass null if none. Must always be null for replies in secret chats
+    :param checklist_task_id: Identifier of the checklist task in the message to be replied; pass 0 to reply to the whole message
+    """
+
+    _type: "str" = field(default="inputMessageReplyToMessage", init=False, repr=False)
+    message_id: "int" = 0
+    quote: "InputTextQuote | None" = None
+    checklist_task_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "message_id": self.message_id,
+            "quote": self.quote._to_json_dict() if self.quote is not None else None,
+            "checklist_task_id": self.checklist_task_id,
+        }
+
+@dataclass(slots=True)
+class InputMessageReplyToExternalMessage(InputMessageReplyTo):
+    """
+    Describes a message to be replied that is from a different chat or a forum topic; not supported in secret chats
+
+    :param chat_id: The identifier of the chat to which the message to be replied belongs
+    :param message_id: The identifier of the message to be replied in the specified chat. A message can be replied in another chat or forum topic only if messageProperties.can_be_replied_in_another_chat
+    :param quote: Quote from the message to be replied; pass null if none
+    :param checklist_task_id: Identifier of the checklist task in the message to be replied; pass 0 to reply to the whole message
+    """
+
+    _type: "str" = field(default="inputMessageReplyToExternalMessage", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    quote: "InputTextQuote | None" = None
+    checklist_task_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "quote": self.quote._to_json_dict() if self.quote is not None else None,
+            "checklist_task_id": self.checklist_task_id,
+        }
+
+@dataclass(slots=True)
+class InputMessageReplyToStory(InputMessageReplyTo):
+    """
+    Describes a story to be replied
+
+    :param story_poster_chat_id: The identifier of the poster of the story. Currently, stories can be replied only in the chat that posted the story; channel stories can't be replied
+    :param story_id: The identifier of the story
+    """
+
+    _type: "str" = field(default="inputMessageReplyToStory", init=False, repr=False)
+    story_poster_chat_id: "int" = 0
+    story_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_poster_chat_id": self.story_poster_chat_id,
+            "story_id": self.story_id,
+        }
+
+@dataclass(slots=True)
+class FactCheck(ObjectBase):
+    """
+    Describes a fact-check added to the message by an independent checker
+
+    :param text: Text of the fact-check
+    :param country_code: A two-letter ISO 3166-1 alpha-2 country code of the country for which the fact-check is shown
+    """
+
+    _type: "str" = field(default="factCheck", init=False, repr=False)
+    text: "FormattedText | None" = None
+    country_code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "country_code": self.country_code,
+        }
+
+@dataclass(slots=True)
+class Message(ObjectBase):
+    """
+    Describes a message
+
+    :param id: Message identifier; unique for the chat to which the message belongs
+    :param sender_id: Identifier of the sender of the message
+    :param chat_id: Chat identifier
+    :param sending_state: The sending state of the message; may be null if the message isn't being sent and didn't fail to be sent
+    :param scheduling_state: The scheduling state of the message; may be null if the message isn't scheduled
+    :param is_outgoing: True, if the message is outgoing
+    :param is_pinned: True, if the message is pinned
+    :param is_from_offline: True, if the message was sent because of a scheduled action by the message sender, for example, as away, or greeting service message
+    :param can_be_saved: True, if content of the message can be saved locally
+    :param has_timestamped_media: True, if media timestamp entities refers to a media in this message as opposed to a media in the replied message
+    :param is_channel_post: True, if the message is a channel post. All messages to channels are channel posts, all other messages are not channel posts
+    :param is_paid_star_suggested_post: True, if the message is a suggested channel post which was paid in Telegram Stars; a warning must be shown if the message is deleted in less than getOption("suggested_post_lifetime_min") seconds after sending
+    :param is_paid_ton_suggested_post: True, if the message is a suggested channel post which was paid in Toncoins; a warning must be shown if the message is deleted in less than getOption("suggested_post_lifetime_min") seconds after sending
+    :param contains_unread_mention: True, if the message contains an unread mention for the current user
+    :param date: Point in time (Unix timestamp) when the message was sent; 0 for scheduled messages
+    :param edit_date: Point in time (Unix timestamp) when the message was last edited; 0 for scheduled messages
+    :param forward_info: Information about the initial message sender; may be null if none or unknown
+    :param import_info: Information about the initial message for messages created with importMessages; may be null if the message isn't imported
+    :param interaction_info: Information about interactions with the message; may be null if none
+    :param unread_reactions: Information about unread reactions added to the message
+    :param fact_check: Information about fact-check added to the message; may be null if none
+    :param suggested_post_info: Information about the suggested post; may be null if the message isn't a suggested post
+    :param reply_to: Information about the message or the story this message is replying to; may be null if none
+    :param message_thread_id: If non-zero, the identifier of the message thread the message belongs to; unique within the chat to which the message belongs
+    :param topic_id: Identifier of the topic within the chat to which the message belongs; may be null if none
+    :param self_destruct_type: The message's self-destruct type; may be null if none
+    :param self_destruct_in: Time left before the message self-destruct timer expires, in seconds; 0 if self-destruction isn't scheduled yet
+    :param auto_delete_in: Time left before the message will be automatically deleted by message_auto_delete_time setting of the chat, in seconds; 0 if never
+    :param via_bot_user_id: If non-zero, the user identifier of the inline bot through which this message was sent
+    :param sender_business_bot_user_id: If non-zero, the user identifier of the business bot that sent this message
+    :param sender_boost_count: Number of times the sender of the message boosted the supergroup at the time the message was sent; 0 if none or unknown. For messages sent by the current user, supergroupFullInfo.my_boost_count must be used instead
+    :param paid_message_star_count: The number of Telegram Stars the sender paid to send the message
+    :param author_signature: For channel posts and anonymous group messages, optional author signature
+    :param media_album_id: Unique identifier of an album this message belongs to; 0 if none. Only audios, documents, photos and videos can be grouped together in albums
+    :param effect_id: Unique identifier of the effect added to the message; 0 if none
+    :param has_sensitive_content: True, if media content of the message must be hidden with 18+ spoiler
+    :param restriction_reason: If non-empty, contains a human-readable description of the reason why access to this message must be restricted
+    :param content: Content of the message
+    :param reply_markup: Reply markup for the message; may be null if none
+    """
+
+    _type: "str" = field(default="message", init=False, repr=False)
+    id: "int" = 0
+    sender_id: "MessageSender | None" = None
+    chat_id: "int" = 0
+    sending_state: "MessageSendingState | None" = None
+    scheduling_state: "MessageSchedulingState | None" = None
+    is_outgoing: "bool" = False
+    is_pinned: "bool" = False
+    is_from_offline: "bool" = False
+    can_be_saved: "bool" = False
+    has_timestamped_media: "bool" = False
+    is_channel_post: "bool" = False
+    is_paid_star_suggested_post: "bool" = False
+    is_paid_ton_suggested_post: "bool" = False
+    contains_unread_mention: "bool" = False
+    date: "int" = 0
+    edit_date: "int" = 0
+    forward_info: "MessageForwardInfo | None" = None
+    import_info: "MessageImportInfo | None" = None
+    interaction_info: "MessageInteractionInfo | None" = None
+    unread_reactions: "list[UnreadReaction] | None" = None
+    fact_check: "FactCheck | None" = None
+    suggested_post_info: "SuggestedPostInfo | None" = None
+    reply_to: "MessageReplyTo | None" = None
+    message_thread_id: "int" = 0
+    topic_id: "MessageTopic | None" = None
+    self_destruct_type: "MessageSelfDestructType | None" = None
+    self_destruct_in: "float" = 0
+    auto_delete_in: "float" = 0
+    via_bot_user_id: "int" = 0
+    sender_business_bot_user_id: "int" = 0
+    sender_boost_count: "int" = 0
+    paid_message_star_count: "int" = 0
+    author_signature: "str" = ""
+    media_album_id: "int" = 0
+    effect_id: "int" = 0
+    has_sensitive_content: "bool" = False
+    restriction_reason: "str" = ""
+    content: "MessageContent | None" = None
+    reply_markup: "ReplyMarkup | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "sender_id": self.sender_id._to_json_dict() if self.sender_id is not None else None,
+            "chat_id": self.chat_id,
+            "sending_state": self.sending_state._to_json_dict() if self.sending_state is not None else None,
+            "scheduling_state": self.scheduling_state._to_json_dict() if self.scheduling_state is not None else None,
+            "is_outgoing": self.is_outgoing,
+            "is_pinned": self.is_pinned,
+            "is_from_offline": self.is_from_offline,
+            "can_be_saved": self.can_be_saved,
+            "has_timestamped_media": self.has_timestamped_media,
+            "is_channel_post": self.is_channel_post,
+            "is_paid_star_suggested_post": self.is_paid_star_suggested_post,
+            "is_paid_ton_suggested_post": self.is_paid_ton_suggested_post,
+            "contains_unread_mention": self.contains_unread_mention,
+            "date": self.date,
+            "edit_date": self.edit_date,
+            "forward_info": self.forward_info._to_json_dict() if self.forward_info is not None else None,
+            "import_info": self.import_info._to_json_dict() if self.import_info is not None else None,
+            "interaction_info": self.interaction_info._to_json_dict() if self.interaction_info is not None else None,
+            "unread_reactions": _list_to_json(self.unread_reactions),
+            "fact_check": self.fact_check._to_json_dict() if self.fact_check is not None else None,
+            "suggested_post_info": self.suggested_post_info._to_json_dict() if self.suggested_post_info is not None else None,
+            "reply_to": self.reply_to._to_json_dict() if self.reply_to is not None else None,
+            "message_thread_id": self.message_thread_id,
+            "topic_id": self.topic_id._to_json_dict() if self.topic_id is not None else None,
+            "self_destruct_type": self.self_destruct_type._to_json_dict() if self.self_destruct_type is not None else None,
+            "self_destruct_in": self.self_destruct_in,
+            "auto_delete_in": self.auto_delete_in,
+            "via_bot_user_id": self.via_bot_user_id,
+            "sender_business_bot_user_id": self.sender_business_bot_user_id,
+            "sender_boost_count": self.sender_boost_count,
+            "paid_message_star_count": self.paid_message_star_count,
+            "author_signature": self.author_signature,
+            "media_album_id": self.media_album_id,
+            "effect_id": self.effect_id,
+            "has_sensitive_content": self.has_sensitive_content,
+            "restriction_reason": self.restriction_reason,
+            "content": self.content._to_json_dict() if self.content is not None else None,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+        }
+
+@dataclass(slots=True)
+class Messages(ObjectBase):
+    """
+    Contains a list of messages
+
+    :param total_count: Approximate total number of messages found
+    :param messages: List of messages; messages may be null
+    """
+
+    _type: "str" = field(default="messages", init=False, repr=False)
+    total_count: "int" = 0
+    messages: "list[Message] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "messages": _list_to_json(self.messages),
+        }
+
+@dataclass(slots=True)
+class FoundMessages(ObjectBase):
+    """
+    Contains a list of messages found by a search
+
+    :param total_count: Approximate total number of messages found; -1 if unknown
+    :param messages: List of messages
+    :param next_offset: The offset for the next request. If empty, then there are no more results
+    """
+
+    _type: "str" = field(default="foundMessages", init=False, repr=False)
+    total_count: "int" = 0
+    messages: "list[Message] | None" = None
+    next_offset: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "messages": _list_to_json(self.messages),
+            "next_offset": self.next_offset,
+        }
+
+@dataclass(slots=True)
+class FoundChatMessages(ObjectBase):
+    """
+    Contains a list of messages found by a search in a given chat
+
+    :param total_count: Approximate total number of messages found; -1 if unknown
+    :param messages: List of messages
+    :param next_from_message_id: The offset for the next request. If 0, there are no more results
+    """
+
+    _type: "str" = field(default="foundChatMessages", init=False, repr=False)
+    total_count: "int" = 0
+    messages: "list[Message] | None" = None
+    next_from_message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "messages": _list_to_json(self.messages),
+            "next_from_message_id": self.next_from_message_id,
+        }
+
+@dataclass(slots=True)
+class MessagePosition(ObjectBase):
+    """
+    Contains information about a message in a specific position
+
+    :param position: 0-based message position in the full list of suitable messages
+    :param message_id: Message identifier
+    :param date: Point in time (Unix timestamp) when the message was sent
+    """
+
+    _type: "str" = field(default="messagePosition", init=False, repr=False)
+    position: "int" = 0
+    message_id: "int" = 0
+    date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "position": self.position,
+            "message_id": self.message_id,
+            "date": self.date,
+        }
+
+@dataclass(slots=True)
+class MessagePositions(ObjectBase):
+    """
+    Contains a list of message positions
+
+    :param total_count: Total number of messages found
+    :param positions: List of message positions
+    """
+
+    _type: "str" = field(default="messagePositions", init=False, repr=False)
+    total_count: "int" = 0
+    positions: "list[MessagePosition] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "positions": _list_to_json(self.positions),
+        }
+
+@dataclass(slots=True)
+class MessageCalendarDay(ObjectBase):
+    """
+    Contains information about found messages sent on a specific day
+
+    :param total_count: Total number of found messages sent on the day
+    :param message: First message sent on the day
+    """
+
+    _type: "str" = field(default="messageCalendarDay", init=False, repr=False)
+    total_count: "int" = 0
+    message: "Message | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "message": self.message._to_json_dict() if self.message is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessageCalendar(ObjectBase):
+    """
+    Contains information about found messages, split by days according to the option "utc_time_offset"
+
+    :param total_count: Total number of found messages
+    :param days: Information about messages sent
+    """
+
+    _type: "str" = field(default="messageCalendar", init=False, repr=False)
+    total_count: "int" = 0
+    days: "list[MessageCalendarDay] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "days": _list_to_json(self.days),
+        }
+
+@dataclass(slots=True)
+class BusinessMessage(ObjectBase):
+    """
+    Describes a message from a business account as received by a bot
+
+    :param message: The message
+    :param reply_to_message: Message that is replied by the message in the same chat; may be null if none
+    """
+
+    _type: "str" = field(default="businessMessage", init=False, repr=False)
+    message: "Message | None" = None
+    reply_to_message: "Message | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "message": self.message._to_json_dict() if self.message is not None else None,
+            "reply_to_message": self.reply_to_message._to_json_dict() if self.reply_to_message is not None else None,
+        }
+
+@dataclass(slots=True)
+class BusinessMessages(ObjectBase):
+    """
+    Contains a list of messages from a business account as received by a bot
+
+    :param messages: List of business messages
+    """
+
+    _type: "str" = field(default="businessMessages", init=False, repr=False)
+    messages: "list[BusinessMessage] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "messages": _list_to_json(self.messages),
+        }
+
+@dataclass(slots=True)
+class MessageSource(ObjectBase):
+    """
+    Describes source of a message
+
+    """
+
+    _type: "str" = field(default="MessageSource", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageSourceChatHistory(MessageSource):
+    """
+    The message is from a chat history
+
+    """
+
+    _type: "str" = field(default="messageSourceChatHistory", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageSourceMessageThreadHistory(MessageSource):
+    """
+    The message is from history of a message thread
+
+    """
+
+    _type: "str" = field(default="messageSourceMessageThreadHistory", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageSourceForumTopicHistory(MessageSource):
+    """
+    The message is from history of a forum topic
+
+    """
+
+    _type: "str" = field(default="messageSourceForumTopicHistory", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageSourceDirectMessagesChatTopicHistory(MessageSource):
+    """
+    The message is from history of a topic in a channel direct messages chat administered by the current user
+
+    """
+
+    _type: "str" = field(default="messageSourceDirectMessagesChatTopicHistory", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageSourceHistoryPreview(MessageSource):
+    """
+    The message is from chat, message thread or forum topic history preview
+
+    """
+
+    _type: "str" = field(default="messageSourceHistoryPreview", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageSourceChatList(MessageSource):
+    """
+    The message is from a chat list or a forum topic list
+
+    """
+
+    _type: "str" = field(default="messageSourceChatList", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageSourceSearch(MessageSource):
+    """
+    The message is from search results, including file downloads, local file list, outgoing document messages, calendar
+
+    """
+
+    _type: "str" = field(default="messageSourceSearch", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageSourceChatEventLog(MessageSource):
+    """
+    The message is from a chat event log
+
+    """
+
+    _type: "str" = field(default="messageSourceChatEventLog", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageSourceNotification(MessageSource):
+    """
+    The message is from a notification
+
+    """
+
+    _type: "str" = field(default="messageSourceNotification", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageSourceScreenshot(MessageSource):
+    """
+    The message was screenshotted; the source must be used only if the message content was visible during the screenshot
+
+    """
+
+    _type: "str" = field(default="messageSourceScreenshot", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageSourceOther(MessageSource):
+    """
+    The message is from some other source
+
+    """
+
+    _type: "str" = field(default="messageSourceOther", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class AdvertisementSponsor(ObjectBase):
+    """
+    Information about the sponsor of an advertisement
+
+    :param url: URL of the sponsor to be opened when the advertisement is clicked
+    :param photo: Photo of the sponsor; may be null if must not be shown
+    :param info: Additional optional information about the sponsor to be shown along with the advertisement
+    """
+
+    _type: "str" = field(default="advertisementSponsor", init=False, repr=False)
+    url: "str" = ""
+    photo: "Photo | None" = None
+    info: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+            "info": self.info,
+        }
+
+@dataclass(slots=True)
+class SponsoredMessage(ObjectBase):
+    """
+    Describes a sponsored message
+
+    :param message_id: Message identifier; unique for the chat to which the sponsored message belongs among both ordinary and sponsored messages
+    :param is_recommended: True, if the message needs to be labeled as "recommended" instead of "sponsored"
+    :param can_be_reported: True, if the message can be reported to Telegram moderators through reportChatSponsoredMessage
+    :param content: Content of the message. Currently, can be only of the types messageText, messageAnimation, messagePhoto, or messageVideo. Video messages can be viewed fullscreen
+    :param sponsor: Information about the sponsor of the message
+    :param title: Title of the sponsored message
+    :param button_text: Text for the message action button
+    :param accent_color_id: Identifier of the accent color for title, button text and message background
+    :param background_custom_emoji_id: Identifier of a custom emoji to be shown on the message background; 0 if none
+    :param additional_info: If non-empty, additional information about the sponsored message to be shown along with the message
+    """
+
+    _type: "str" = field(default="sponsoredMessage", init=False, repr=False)
+    message_id: "int" = 0
+    is_recommended: "bool" = False
+    can_be_reported: "bool" = False
+    content: "MessageContent | None" = None
+    sponsor: "AdvertisementSponsor | None" = None
+    title: "str" = ""
+    button_text: "str" = ""
+    accent_color_id: "int" = 0
+    background_custom_emoji_id: "int" = 0
+    additional_info: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "message_id": self.message_id,
+            "is_recommended": self.is_recommended,
+            "can_be_reported": self.can_be_reported,
+            "content": self.content._to_json_dict() if self.content is not None else None,
+            "sponsor": self.sponsor._to_json_dict() if self.sponsor is not None else None,
+            "title": self.title,
+            "button_text": self.button_text,
+            "accent_color_id": self.accent_color_id,
+            "background_custom_emoji_id": self.background_custom_emoji_id,
+            "additional_info": self.additional_info,
+        }
+
+@dataclass(slots=True)
+class SponsoredMessages(ObjectBase):
+    """
+    Contains a list of sponsored messages
+
+    :param messages: List of sponsored messages
+    :param messages_between: The minimum number of messages between shown sponsored messages, or 0 if only one sponsored message must be shown after all ordinary messages
+    """
+
+    _type: "str" = field(default="sponsoredMessages", init=False, repr=False)
+    messages: "list[SponsoredMessage] | None" = None
+    messages_between: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "messages": _list_to_json(self.messages),
+            "messages_between": self.messages_between,
+        }
+
+@dataclass(slots=True)
+class SponsoredChat(ObjectBase):
+    """
+    Describes a sponsored chat
+
+    :param unique_id: Unique identifier of this result
+    :param chat_id: Chat identifier
+    :param sponsor_info: Additional optional information about the sponsor to be shown along with the chat
+    :param additional_info: If non-empty, additional information about the sponsored chat to be shown along with the chat
+    """
+
+    _type: "str" = field(default="sponsoredChat", init=False, repr=False)
+    unique_id: "int" = 0
+    chat_id: "int" = 0
+    sponsor_info: "str" = ""
+    additional_info: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "unique_id": self.unique_id,
+            "chat_id": self.chat_id,
+            "sponsor_info": self.sponsor_info,
+            "additional_info": self.additional_info,
+        }
+
+@dataclass(slots=True)
+class SponsoredChats(ObjectBase):
+    """
+    Contains a list of sponsored chats
+
+    :param chats: List of sponsored chats
+    """
+
+    _type: "str" = field(default="sponsoredChats", init=False, repr=False)
+    chats: "list[SponsoredChat] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chats": _list_to_json(self.chats),
+        }
+
+@dataclass(slots=True)
+class VideoMessageAdvertisement(ObjectBase):
+    """
+    Describes an advertisent to be shown while a video from a message is watched
+
+    :param unique_id: Unique identifier of this result
+    :param text: Text of the advertisement
+    :param min_display_duration: The minimum amount of time the advertisement must be displayed before it can be hidden by the user, in seconds
+    :param max_display_duration: The maximum amount of time the advertisement must be displayed before it must be automatically hidden, in seconds
+    :param can_be_reported: True, if the advertisement can be reported to Telegram moderators through reportVideoMessageAdvertisement
+    :param sponsor: Information about the sponsor of the advertisement
+    :param title: Title of the sponsored message
+    :param additional_info: If non-empty, additional information about the sponsored message to be shown along with the message
+    """
+
+    _type: "str" = field(default="videoMessageAdvertisement", init=False, repr=False)
+    unique_id: "int" = 0
+    text: "str" = ""
+    min_display_duration: "int" = 0
+    max_display_duration: "int" = 0
+    can_be_reported: "bool" = False
+    sponsor: "AdvertisementSponsor | None" = None
+    title: "str" = ""
+    additional_info: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "unique_id": self.unique_id,
+            "text": self.text,
+            "min_display_duration": self.min_display_duration,
+            "max_display_duration": self.max_display_duration,
+            "can_be_reported": self.can_be_reported,
+            "sponsor": self.sponsor._to_json_dict() if self.sponsor is not None else None,
+            "title": self.title,
+            "additional_info": self.additional_info,
+        }
+
+@dataclass(slots=True)
+class VideoMessageAdvertisements(ObjectBase):
+    """
+    Contains a list of advertisements to be shown while a video from a message is watched
+
+    :param advertisements: List of advertisements
+    :param start_delay: Delay before the first advertisement is shown, in seconds
+    :param between_delay: Delay between consecutive advertisements, in seconds
+    """
+
+    _type: "str" = field(default="videoMessageAdvertisements", init=False, repr=False)
+    advertisements: "list[VideoMessageAdvertisement] | None" = None
+    start_delay: "int" = 0
+    between_delay: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "advertisements": _list_to_json(self.advertisements),
+            "start_delay": self.start_delay,
+            "between_delay": self.between_delay,
+        }
+
+@dataclass(slots=True)
+class ReportOption(ObjectBase):
+    """
+    Describes an option to report an entity to Telegram
+
+    :param id: Unique identifier of the option
+    :param text: Text of the option
+    """
+
+    _type: "str" = field(default="reportOption", init=False, repr=False)
+    id: "bytes" = b""
+    text: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": _bytes_to_json(self.id),
+            "text": self.text,
+        }
+
+@dataclass(slots=True)
+class ReportSponsoredResult(ObjectBase):
+    """
+    Describes result of sponsored message or chat report
+
+    """
+
+    _type: "str" = field(default="ReportSponsoredResult", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReportSponsoredResultOk(ReportSponsoredResult):
+    """
+    The message was reported successfully
+
+    """
+
+    _type: "str" = field(default="reportSponsoredResultOk", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReportSponsoredResultFailed(ReportSponsoredResult):
+    """
+    The sponsored message is too old or not found
+
+    """
+
+    _type: "str" = field(default="reportSponsoredResultFailed", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReportSponsoredResultOptionRequired(ReportSponsoredResult):
+    """
+    The user must choose an option to report the message and repeat request with the chosen option
+
+    :param title: Title for the option choice
+    :param options: List of available options
+    """
+
+    _type: "str" = field(default="reportSponsoredResultOptionRequired", init=False, repr=False)
+    title: "str" = ""
+    options: "list[ReportOption] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "title": self.title,
+            "options": _list_to_json(self.options),
+        }
+
+@dataclass(slots=True)
+class ReportSponsoredResultAdsHidden(ReportSponsoredResult):
+    """
+    Sponsored messages were hidden for the user in all chats
+
+    """
+
+    _type: "str" = field(default="reportSponsoredResultAdsHidden", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReportSponsoredResultPremiumRequired(ReportSponsoredResult):
+    """
+    The user asked to hide sponsored messages, but Telegram Premium is required for this
+
+    """
+
+    _type: "str" = field(default="reportSponsoredResultPremiumRequired", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FileDownload(ObjectBase):
+    """
+    Describes a file added to file download list
+
+    :param file_id: File identifier
+    :param message: The message with the file
+    :param add_date: Point in time (Unix timestamp) when the file was added to the download list
+    :param complete_date: Point in time (Unix timestamp) when the file downloading was completed; 0 if the file downloading isn't completed
+    :param is_paused: True, if downloading of the file is paused
+    """
+
+    _type: "str" = field(default="fileDownload", init=False, repr=False)
+    file_id: "int" = 0
+    message: "Message | None" = None
+    add_date: "int" = 0
+    complete_date: "int" = 0
+    is_paused: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_id": self.file_id,
+            "message": self.message._to_json_dict() if self.message is not None else None,
+            "add_date": self.add_date,
+            "complete_date": self.complete_date,
+            "is_paused": self.is_paused,
+        }
+
+@dataclass(slots=True)
+class DownloadedFileCounts(ObjectBase):
+    """
+    Contains number of being downloaded and recently downloaded files found
+
+    :param active_count: Number of active file downloads found, including paused
+    :param paused_count: Number of paused file downloads found
+    :param completed_count: Number of completed file downloads found
+    """
+
+    _type: "str" = field(default="downloadedFileCounts", init=False, repr=False)
+    active_count: "int" = 0
+    paused_count: "int" = 0
+    completed_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "active_count": self.active_count,
+            "paused_count": self.paused_count,
+            "completed_count": self.completed_count,
+        }
+
+@dataclass(slots=True)
+class FoundFileDownloads(ObjectBase):
+    """
+    Contains a list of downloaded files, found by a search
+
+    :param total_counts: Total number of suitable files, ignoring offset
+    :param files: The list of files
+    :param next_offset: The offset for the next request. If empty, then there are no more results
+    """
+
+    _type: "str" = field(default="foundFileDownloads", init=False, repr=False)
+    total_counts: "DownloadedFileCounts | None" = None
+    files: "list[FileDownload] | None" = None
+    next_offset: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_counts": self.total_counts._to_json_dict() if self.total_counts is not None else None,
+            "files": _list_to_json(self.files),
+            "next_offset": self.next_offset,
+        }
+
+@dataclass(slots=True)
+class NotificationSettingsScope(ObjectBase):
+    """
+    Describes the types of chats to which notification settings are relevant
+
+    """
+
+    _type: "str" = field(default="NotificationSettingsScope", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class NotificationSettingsScopePrivateChats(NotificationSettingsScope):
+    """
+    Notification settings applied to all private and secret chats when the corresponding chat setting has a default value
+
+    """
+
+    _type: "str" = field(default="notificationSettingsScopePrivateChats", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class NotificationSettingsScopeGroupChats(NotificationSettingsScope):
+    """
+    Notification settings applied to all basic group and supergroup chats when the corresponding chat setting has a default value
+
+    """
+
+    _type: "str" = field(default="notificationSettingsScopeGroupChats", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class NotificationSettingsScopeChannelChats(NotificationSettingsScope):
+    """
+    Notification settings applied to all channel chats when the corresponding chat setting has a default value
+
+    """
+
+    _type: "str" = field(default="notificationSettingsScopeChannelChats", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatNotificationSettings(ObjectBase):
+    """
+    Contains information about notification settings for a chat or a forum topic
+
+    :param use_default_mute_for: If true, the value for the relevant type of chat or the forum chat is used instead of mute_for
+    :param mute_for: Time left before notifications will be unmuted, in seconds
+    :param use_default_sound: If true, the value for the relevant type of chat or the forum chat is used instead of sound_id
+    :param sound_id: Identifier of the notification sound to be played for messages; 0 if sound is disabled
+    :param use_default_show_preview: If true, the value for the relevant type of chat or the forum chat is used instead of show_preview
+    :param show_preview: True, if message content must be displayed in notifications
+    :param use_default_mute_stories: If true, the value for the relevant type of chat is used instead of mute_stories
+    :param mute_stories: True, if story notifications are disabled for the chat
+    :param use_default_story_sound: If true, the value for the relevant type of chat is used instead of story_sound_id
+    :param story_sound_id: Identifier of the notification sound to be played for stories; 0 if sound is disabled
+    :param use_default_show_story_poster: If true, the value for the relevant type of chat is used instead of show_story_poster
+    :param show_story_poster: True, if the chat that posted a story must be displayed in notifications
+    :param use_default_disable_pinned_message_notifications: If true, the value for the relevant type of chat or the forum chat is used instead of disable_pinned_message_notifications
+    :param disable_pinned_message_notifications: If true, notifications for incoming pinned messages will be created as for an ordinary unread message
+    :param use_default_disable_mention_notifications: If true, the value for the relevant type of chat or the forum chat is used instead of disable_mention_notifications
+    :param disable_mention_notifications: If true, notifications for messages with mentions will be created as for an ordinary unread message
+    """
+
+    _type: "str" = field(default="chatNotificationSettings", init=False, repr=False)
+    use_default_mute_for: "bool" = False
+    mute_for: "int" = 0
+    use_default_sound: "bool" = False
+    sound_id: "int" = 0
+    use_default_show_preview: "bool" = False
+    show_preview: "bool" = False
+    use_default_mute_stories: "bool" = False
+    mute_stories: "bool" = False
+    use_default_story_sound: "bool" = False
+    story_sound_id: "int" = 0
+    use_default_show_story_poster: "bool" = False
+    show_story_poster: "bool" = False
+    use_default_disable_pinned_message_notifications: "bool" = False
+    disable_pinned_message_notifications: "bool" = False
+    use_default_disable_mention_notifications: "bool" = False
+    disable_mention_notifications: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "use_default_mute_for": self.use_default_mute_for,
+            "mute_for": self.mute_for,
+            "use_default_sound": self.use_default_sound,
+            "sound_id": self.sound_id,
+            "use_default_show_preview": self.use_default_show_preview,
+            "show_preview": self.show_preview,
+            "use_default_mute_stories": self.use_default_mute_stories,
+            "mute_stories": self.mute_stories,
+            "use_default_story_sound": self.use_default_story_sound,
+            "story_sound_id": self.story_sound_id,
+            "use_default_show_story_poster": self.use_default_show_story_poster,
+            "show_story_poster": self.show_story_poster,
+            "use_default_disable_pinned_message_notifications": self.use_default_disable_pinned_message_notifications,
+            "disable_pinned_message_notifications": self.disable_pinned_message_notifications,
+            "use_default_disable_mention_notifications": self.use_default_disable_mention_notifications,
+            "disable_mention_notifications": self.disable_mention_notifications,
+        }
+
+@dataclass(slots=True)
+class ScopeNotificationSettings(ObjectBase):
+    """
+    Contains information about notification settings for several chats
+
+    :param mute_for: Time left before notifications will be unmuted, in seconds
+    :param sound_id: Identifier of the notification sound to be played; 0 if sound is disabled
+    :param show_preview: True, if message content must be displayed in notifications
+    :param use_default_mute_stories: If true, story notifications are received only for the first 5 chats from topChatCategoryUsers regardless of the value of mute_stories
+    :param mute_stories: True, if story notifications are disabled
+    :param story_sound_id: Identifier of the notification sound to be played for stories; 0 if sound is disabled
+    :param show_story_poster: True, if the chat that posted a story must be displayed in notifications
+    :param disable_pinned_message_notifications: True, if notifications for incoming pinned messages will be created as for an ordinary unread message
+    :param disable_mention_notifications: True, if notifications for messages with mentions will be created as for an ordinary unread message
+    """
+
+    _type: "str" = field(default="scopeNotificationSettings", init=False, repr=False)
+    mute_for: "int" = 0
+    sound_id: "int" = 0
+    show_preview: "bool" = False
+    use_default_mute_stories: "bool" = False
+    mute_stories: "bool" = False
+    story_sound_id: "int" = 0
+    show_story_poster: "bool" = False
+    disable_pinned_message_notifications: "bool" = False
+    disable_mention_notifications: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "mute_for": self.mute_for,
+            "sound_id": self.sound_id,
+            "show_preview": self.show_preview,
+            "use_default_mute_stories": self.use_default_mute_stories,
+            "mute_stories": self.mute_stories,
+            "story_sound_id": self.story_sound_id,
+            "show_story_poster": self.show_story_poster,
+            "disable_pinned_message_notifications": self.disable_pinned_message_notifications,
+            "disable_mention_notifications": self.disable_mention_notifications,
+        }
+
+@dataclass(slots=True)
+class ReactionNotificationSource(ObjectBase):
+    """
+    Describes sources of reactions for which notifications will be shown
+
+    """
+
+    _type: "str" = field(default="ReactionNotificationSource", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReactionNotificationSourceNone(ReactionNotificationSource):
+    """
+    Notifications for reactions are disabled
+
+    """
+
+    _type: "str" = field(default="reactionNotificationSourceNone", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReactionNotificationSourceContacts(ReactionNotificationSource):
+    """
+    Notifications for reactions are shown only for reactions from contacts
+
+    """
+
+    _type: "str" = field(default="reactionNotificationSourceContacts", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReactionNotificationSourceAll(ReactionNotificationSource):
+    """
+    Notifications for reactions are shown for all reactions
+
+    """
+
+    _type: "str" = field(default="reactionNotificationSourceAll", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReactionNotificationSettings(ObjectBase):
+    """
+    Contains information about notification settings for reactions
+
+    :param message_reaction_source: Source of message reactions for which notifications are shown
+    :param story_reaction_source: Source of story reactions for which notifications are shown
+    :param sound_id: Identifier of the notification sound to be played; 0 if sound is disabled
+    :param show_preview: True, if reaction sender and emoji must be displayed in notifications
+    """
+
+    _type: "str" = field(default="reactionNotificationSettings", init=False, repr=False)
+    message_reaction_source: "ReactionNotificationSource | None" = None
+    story_reaction_source: "ReactionNotificationSource | None" = None
+    sound_id: "int" = 0
+    show_preview: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "message_reaction_source": self.message_reaction_source._to_json_dict() if self.message_reaction_source is not None else None,
+            "story_reaction_source": self.story_reaction_source._to_json_dict() if self.story_reaction_source is not None else None,
+            "sound_id": self.sound_id,
+            "show_preview": self.show_preview,
+        }
+
@@ -0,0 +1,1471 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import FormattedText
+    from .classes_01 import ChatBackground, ChatPhotoInfo
+    from .classes_02 import ChatAdministratorRights, ChatPermissions, InputSuggestedPostInfo
+    from .classes_04 import EmojiStatus
+    from .classes_05 import ChatJoinRequestsInfo, MessageSender, ReactionType
+    from .classes_06 import ChatNotificationSettings, InputMessageReplyTo, Message
+    from .classes_12 import InputMessageContent
+    from .classes_16 import TargetChat
+    from .classes_22 import BlockList
+
+@dataclass(slots=True)
+class DraftMessage(ObjectBase):
+    """
+    Contains information about a message draft
+
+    :param reply_to: Information about the message to be replied; must be of the type inputMessageReplyToMessage; may be null if none
+    :param date: Point in time (Unix timestamp) when the draft was created
+    :param input_message_text: Content of the message draft; must be of the type inputMessageText, inputMessageVideoNote, or inputMessageVoiceNote
+    :param effect_id: Identifier of the effect to apply to the message when it is sent; 0 if none
+    :param suggested_post_info: Information about the suggested post; may be null if none
+    """
+
+    _type: "str" = field(default="draftMessage", init=False, repr=False)
+    reply_to: "InputMessageReplyTo | None" = None
+    date: "int" = 0
+    input_message_text: "InputMessageContent | None" = None
+    effect_id: "int" = 0
+    suggested_post_info: "InputSuggestedPostInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "reply_to": self.reply_to._to_json_dict() if self.reply_to is not None else None,
+            "date": self.date,
+            "input_message_text": self.input_message_text._to_json_dict() if self.input_message_text is not None else None,
+            "effect_id": self.effect_id,
+            "suggested_post_info": self.suggested_post_info._to_json_dict() if self.suggested_post_info is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatType(ObjectBase):
+    """
+    Describes the type of chat
+
+    """
+
+    _type: "str" = field(default="ChatType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatTypePrivate(ChatType):
+    """
+    An ordinary chat with a user
+
+    :param user_id: User identifier
+    """
+
+    _type: "str" = field(default="chatTypePrivate", init=False, repr=False)
+    user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+        }
+
+@dataclass(slots=True)
+class ChatTypeBasicGroup(ChatType):
+    """
+    A basic group (a chat with 0-200 other users)
+
+    :param basic_group_id: Basic group identifier
+    """
+
+    _type: "str" = field(default="chatTypeBasicGroup", init=False, repr=False)
+    basic_group_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "basic_group_id": self.basic_group_id,
+        }
+
+@dataclass(slots=True)
+class ChatTypeSupergroup(ChatType):
+    """
+    A supergroup or channel (with unlimited members)
+
+    :param supergroup_id: Supergroup or channel identifier
+    :param is_channel: True, if the supergroup is a channel
+    """
+
+    _type: "str" = field(default="chatTypeSupergroup", init=False, repr=False)
+    supergroup_id: "int" = 0
+    is_channel: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+            "is_channel": self.is_channel,
+        }
+
+@dataclass(slots=True)
+class ChatTypeSecret(ChatType):
+    """
+    A secret chat with a user
+
+    :param secret_chat_id: Secret chat identifier
+    :param user_id: User identifier of the other user in the secret chat
+    """
+
+    _type: "str" = field(default="chatTypeSecret", init=False, repr=False)
+    secret_chat_id: "int" = 0
+    user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "secret_chat_id": self.secret_chat_id,
+            "user_id": self.user_id,
+        }
+
+@dataclass(slots=True)
+class ChatFolderIcon(ObjectBase):
+    """
+    Represents an icon for a chat folder
+
+    :param name: The chosen icon name for short folder representation; one of "All", "Unread", "Unmuted", "Bots", "Channels", "Groups", "Private", "Custom", "Setup", "Cat", "Crown", "Favorite", "Flower", "Game", "Home", "Love", "Mask", "Party", "Sport", "Study", "Trade", "Travel", "Work", "Airplane", "Book", "Light", "Like", "Money", "Note", "Palette"
+    """
+
+    _type: "str" = field(default="chatFolderIcon", init=False, repr=False)
+    name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name,
+        }
+
+@dataclass(slots=True)
+class ChatFolderName(ObjectBase):
+    """
+    Describes name of a chat folder
+
+    :param text: The text of the chat folder name; 1-12 characters without line feeds. May contain only CustomEmoji entities
+    :param animate_custom_emoji: True, if custom emoji in the name must be animated
+    """
+
+    _type: "str" = field(default="chatFolderName", init=False, repr=False)
+    text: "FormattedText | None" = None
+    animate_custom_emoji: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "animate_custom_emoji": self.animate_custom_emoji,
+        }
+
+@dataclass(slots=True)
+class ChatFolder(ObjectBase):
+    """
+    Represents a folder for user chats
+
+    :param name: The name of the folder
+    :param icon: The chosen icon for the chat folder; may be null. If null, use getChatFolderDefaultIconName to get default icon name for the folder
+    :param color_id: The identifier of the chosen color for the chat folder icon; from -1 to 6. If -1, then color is disabled. Can't be changed if folder tags are disabled or the current user doesn't have Telegram Premium subscription
+    :param is_shareable: True, if at least one link has been created for the folder
+    :param pinned_chat_ids: The chat identifiers of pinned chats in the folder. There can be up to getOption("chat_folder_chosen_chat_count_max") pinned and always included non-secret chats and the same number of secret chats, but the limit can be increased with Telegram Premium
+    :param included_chat_ids: The chat identifiers of always included chats in the folder. There can be up to getOption("chat_folder_chosen_chat_count_max") pinned and always included non-secret chats and the same number of secret chats, but the limit can be increased with Telegram Premium
+    :param excluded_chat_ids: The chat identifiers of always excluded chats in the folder. There can be up to getOption("chat_folder_chosen_chat_count_max") always excluded non-secret chats and the same number of secret chats, but the limit can be increased with Telegram Premium
+    :param exclude_muted: True, if muted chats need to be excluded
+    :param exclude_read: True, if read chats need to be excluded
+    :param exclude_archived: True, if archived chats need to be excluded
+    :param include_contacts: True, if contacts need to be included
+    :param include_non_contacts: True, if non-contact users need to be included
+    :param include_bots: True, if bots need to be included
+    :param include_groups: True, if basic groups and supergroups need to be included
+    :param include_channels: True, if channels need to be included
+    """
+
+    _type: "str" = field(default="chatFolder", init=False, repr=False)
+    name: "ChatFolderName | None" = None
+    icon: "ChatFolderIcon | None" = None
+    color_id: "int" = 0
+    is_shareable: "bool" = False
+    pinned_chat_ids: "list[int] | None" = None
+    included_chat_ids: "list[int] | None" = None
+    excluded_chat_ids: "list[int] | None" = None
+    exclude_muted: "bool" = False
+    exclude_read: "bool" = False
+    exclude_archived: "bool" = False
+    include_contacts: "bool" = False
+    include_non_contacts: "bool" = False
+    include_bots: "bool" = False
+    include_groups: "bool" = False
+    include_channels: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name._to_json_dict() if self.name is not None else None,
+            "icon": self.icon._to_json_dict() if self.icon is not None else None,
+            "color_id": self.color_id,
+            "is_shareable": self.is_shareable,
+            "pinned_chat_ids": self.pinned_chat_ids,
+            "included_chat_ids": self.included_chat_ids,
+            "excluded_chat_ids": self.excluded_chat_ids,
+            "exclude_muted": self.exclude_muted,
+            "exclude_read": self.exclude_read,
+            "exclude_archived": self.exclude_archived,
+            "include_contacts": self.include_contacts,
+            "include_non_contacts": self.include_non_contacts,
+            "include_bots": self.include_bots,
+            "include_groups": self.include_groups,
+            "include_channels": self.include_channels,
+        }
+
+@dataclass(slots=True)
+class ChatFolderInfo(ObjectBase):
+    """
+    Contains basic information about a chat folder
+
+    :param id: Unique chat folder identifier
+    :param name: The name of the folder
+    :param icon: The chosen or default icon for the chat folder
+    :param color_id: The identifier of the chosen color for the chat folder icon; from -1 to 6. If -1, then color is disabled
+    :param is_shareable: True, if at least one link has been created for the folder
+    :param has_my_invite_links: True, if the chat folder has invite links created by the current user
+    """
+
+    _type: "str" = field(default="chatFolderInfo", init=False, repr=False)
+    id: "int" = 0
+    name: "ChatFolderName | None" = None
+    icon: "ChatFolderIcon | None" = None
+    color_id: "int" = 0
+    is_shareable: "bool" = False
+    has_my_invite_links: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "name": self.name._to_json_dict() if self.name is not None else None,
+            "icon": self.icon._to_json_dict() if self.icon is not None else None,
+            "color_id": self.color_id,
+            "is_shareable": self.is_shareable,
+            "has_my_invite_links": self.has_my_invite_links,
+        }
+
+@dataclass(slots=True)
+class ChatFolderInviteLink(ObjectBase):
+    """
+    Contains a chat folder invite link
+
+    :param invite_link: The chat folder invite link
+    :param name: Name of the link
+    :param chat_ids: Identifiers of chats, included in the link
+    """
+
+    _type: "str" = field(default="chatFolderInviteLink", init=False, repr=False)
+    invite_link: "str" = ""
+    name: "str" = ""
+    chat_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "invite_link": self.invite_link,
+            "name": self.name,
+            "chat_ids": self.chat_ids,
+        }
+
+@dataclass(slots=True)
+class ChatFolderInviteLinks(ObjectBase):
+    """
+    Represents a list of chat folder invite links
+
+    :param invite_links: List of the invite links
+    """
+
+    _type: "str" = field(default="chatFolderInviteLinks", init=False, repr=False)
+    invite_links: "list[ChatFolderInviteLink] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "invite_links": _list_to_json(self.invite_links),
+        }
+
+@dataclass(slots=True)
+class ChatFolderInviteLinkInfo(ObjectBase):
+    """
+    Contains information about an invite link to a chat folder
+
+    :param chat_folder_info: Basic information about the chat folder; chat folder identifier will be 0 if the user didn't have the chat folder yet
+    :param missing_chat_ids: Identifiers of the chats from the link, which aren't added to the folder yet
+    :param added_chat_ids: Identifiers of the chats from the link, which are added to the folder already
+    """
+
+    _type: "str" = field(default="chatFolderInviteLinkInfo", init=False, repr=False)
+    chat_folder_info: "ChatFolderInfo | None" = None
+    missing_chat_ids: "list[int] | None" = None
+    added_chat_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_folder_info": self.chat_folder_info._to_json_dict() if self.chat_folder_info is not None else None,
+            "missing_chat_ids": self.missing_chat_ids,
+            "added_chat_ids": self.added_chat_ids,
+        }
+
+@dataclass(slots=True)
+class RecommendedChatFolder(ObjectBase):
+    """
+    Describes a recommended chat folder
+
+    :param folder: The chat folder
+    :param description: Describes a recommended chat folder
+    """
+
+    _type: "str" = field(default="recommendedChatFolder", init=False, repr=False)
+    folder: "ChatFolder | None" = None
+    description: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "folder": self.folder._to_json_dict() if self.folder is not None else None,
+            "description": self.description,
+        }
+
+@dataclass(slots=True)
+class RecommendedChatFolders(ObjectBase):
+    """
+    Contains a list of recommended chat folders
+
+    :param chat_folders: List of recommended chat folders
+    """
+
+    _type: "str" = field(default="recommendedChatFolders", init=False, repr=False)
+    chat_folders: "list[RecommendedChatFolder] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_folders": _list_to_json(self.chat_folders),
+        }
+
+@dataclass(slots=True)
+class ArchiveChatListSettings(ObjectBase):
+    """
+    Contains settings for automatic moving of chats to and from the Archive chat lists
+
+    :param archive_and_mute_new_chats_from_unknown_users: True, if new chats from non-contacts will be automatically archived and muted. Can be set to true only if the option "can_archive_and_mute_new_chats_from_unknown_users" is true
+    :param keep_unmuted_chats_archived: True, if unmuted chats will be kept in the Archive chat list when they get a new message
+    :param keep_chats_from_folders_archived: True, if unmuted chats, that are always included or pinned in a folder, will be kept in the Archive chat list when they get a new message. Ignored if keep_unmuted_chats_archived == true
+    """
+
+    _type: "str" = field(default="archiveChatListSettings", init=False, repr=False)
+    archive_and_mute_new_chats_from_unknown_users: "bool" = False
+    keep_unmuted_chats_archived: "bool" = False
+    keep_chats_from_folders_archived: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "archive_and_mute_new_chats_from_unknown_users": self.archive_and_mute_new_chats_from_unknown_users,
+            "keep_unmuted_chats_archived": self.keep_unmuted_chats_archived,
+            "keep_chats_from_folders_archived": self.keep_chats_from_folders_archived,
+        }
+
+@dataclass(slots=True)
+class ChatList(ObjectBase):
+    """
+    Describes a list of chats
+
+    """
+
+    _type: "str" = field(default="ChatList", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatListMain(ChatList):
+    """
+    A main list of chats
+
+    """
+
+    _type: "str" = field(default="chatListMain", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatListArchive(ChatList):
+    """
+    A list of chats usually located at the top of the main chat list. Unmuted chats are automatically moved from the Archive to the Main chat list when a new message arrives
+
+    """
+
+    _type: "str" = field(default="chatListArchive", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatListFolder(ChatList):
+    """
+    A list of chats added to a chat folder
+
+    :param chat_folder_id: Chat folder identifier
+    """
+
+    _type: "str" = field(default="chatListFolder", init=False, repr=False)
+    chat_folder_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_folder_id": self.chat_folder_id,
+        }
+
+@dataclass(slots=True)
+class ChatLists(ObjectBase):
+    """
+    Contains a list of chat lists
+
+    :param chat_lists: List of chat lists
+    """
+
+    _type: "str" = field(default="chatLists", init=False, repr=False)
+    chat_lists: "list[ChatList] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_lists": _list_to_json(self.chat_lists),
+        }
+
+@dataclass(slots=True)
+class ChatSource(ObjectBase):
+    """
+    Describes a reason why an external chat is shown in a chat list
+
+    """
+
+    _type: "str" = field(default="ChatSource", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatSourceMtprotoProxy(ChatSource):
+    """
+    The chat is sponsored by the user's MTProxy server
+
+    """
+
+    _type: "str" = field(default="chatSourceMtprotoProxy", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatSourcePublicServiceAnnouncement(ChatSource):
+    """
+    The chat contains a public service announcement
+
+    :param type: The type of the announcement
+    :param text: The text of the announcement
+    """
+
+    _type: "str" = field(default="chatSourcePublicServiceAnnouncement", init=False, repr=False)
+    type: "str" = ""
+    text: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "type": self.type,
+            "text": self.text,
+        }
+
+@dataclass(slots=True)
+class ChatPosition(ObjectBase):
+    """
+    Describes a position of a chat in a chat list
+
+    :param list_: The chat list
+    :param order: A parameter used to determine order of the chat in the chat list. Chats must be sorted by the pair (order, chat.id) in descending order
+    :param is_pinned: True, if the chat is pinned in the chat list
+    :param source: Source of the chat in the chat list; may be null
+    """
+
+    _type: "str" = field(default="chatPosition", init=False, repr=False)
+    list_: "ChatList | None" = None
+    order: "int" = 0
+    is_pinned: "bool" = False
+    source: "ChatSource | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "list": self.list_._to_json_dict() if self.list_ is not None else None,
+            "order": self.order,
+            "is_pinned": self.is_pinned,
+            "source": self.source._to_json_dict() if self.source is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatAvailableReactions(ObjectBase):
+    """
+    Describes reactions available in the chat
+
+    """
+
+    _type: "str" = field(default="ChatAvailableReactions", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatAvailableReactionsAll(ChatAvailableReactions):
+    """
+    All reactions are available in the chat, excluding the paid reaction and custom reactions in channel chats
+
+    :param max_reaction_count: The maximum allowed number of reactions per message; 1-11
+    """
+
+    _type: "str" = field(default="chatAvailableReactionsAll", init=False, repr=False)
+    max_reaction_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "max_reaction_count": self.max_reaction_count,
+        }
+
+@dataclass(slots=True)
+class ChatAvailableReactionsSome(ChatAvailableReactions):
+    """
+    Only specific reactions are available in the chat
+
+    :param reactions: The list of reactions
+    :param max_reaction_count: The maximum allowed number of reactions per message; 1-11
+    """
+
+    _type: "str" = field(default="chatAvailableReactionsSome", init=False, repr=False)
+    reactions: "list[ReactionType] | None" = None
+    max_reaction_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "reactions": _list_to_json(self.reactions),
+            "max_reaction_count": self.max_reaction_count,
+        }
+
+@dataclass(slots=True)
+class SavedMessagesTag(ObjectBase):
+    """
+    Represents a tag used in Saved Messages or a Saved Messages topic
+
+    :param tag: The tag
+    :param label: Label of the tag; 0-12 characters. Always empty if the tag is returned for a Saved Messages topic
+    :param count: Number of times the tag was used; may be 0 if the tag has non-empty label
+    """
+
+    _type: "str" = field(default="savedMessagesTag", init=False, repr=False)
+    tag: "ReactionType | None" = None
+    label: "str" = ""
+    count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "tag": self.tag._to_json_dict() if self.tag is not None else None,
+            "label": self.label,
+            "count": self.count,
+        }
+
+@dataclass(slots=True)
+class SavedMessagesTags(ObjectBase):
+    """
+    Contains a list of tags used in Saved Messages
+
+    :param tags: List of tags
+    """
+
+    _type: "str" = field(default="savedMessagesTags", init=False, repr=False)
+    tags: "list[SavedMessagesTag] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "tags": _list_to_json(self.tags),
+        }
+
+@dataclass(slots=True)
+class BusinessBotManageBar(ObjectBase):
+    """
+    Contains information about a business bot that manages the chat
+
+    :param bot_user_id: User identifier of the bot
+    :param manage_url: URL to be opened to manage the bot
+    :param is_bot_paused: True, if the bot is paused. Use toggleBusinessConnectedBotChatIsPaused to change the value of the field
+    :param can_bot_reply: True, if the bot can reply
+    """
+
+    _type: "str" = field(default="businessBotManageBar", init=False, repr=False)
+    bot_user_id: "int" = 0
+    manage_url: "str" = ""
+    is_bot_paused: "bool" = False
+    can_bot_reply: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "manage_url": self.manage_url,
+            "is_bot_paused": self.is_bot_paused,
+            "can_bot_reply": self.can_bot_reply,
+        }
+
+@dataclass(slots=True)
+class VideoChat(ObjectBase):
+    """
+    Describes a video chat, i.e. a group call bound to a chat
+
+    :param group_call_id: Group call identifier of an active video chat; 0 if none. Full information about the video chat can be received through the method getGroupCall
+    :param has_participants: True, if the video chat has participants
+    :param default_participant_id: Default group call participant identifier to join the video chat; may be null
+    """
+
+    _type: "str" = field(default="videoChat", init=False, repr=False)
+    group_call_id: "int" = 0
+    has_participants: "bool" = False
+    default_participant_id: "MessageSender | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "has_participants": self.has_participants,
+            "default_participant_id": self.default_participant_id._to_json_dict() if self.default_participant_id is not None else None,
+        }
+
+@dataclass(slots=True)
+class Chat(ObjectBase):
+    """
+    A chat. (Can be a private chat, basic group, supergroup, or secret chat)
+
+    :param id: Chat unique identifier
+    :param type: Type of the chat
+    :param title: Chat title
+    :param photo: Chat photo; may be null
+    :param accent_color_id: Identifier of the accent color for message sender name, and backgrounds of chat photo, reply header, and link preview
+    :param background_custom_emoji_id: Identifier of a custom emoji to be shown on the reply header and link preview background for messages sent by the chat; 0 if none
+    :param profile_accent_color_id: Identifier of the profile accent color for the chat's profile; -1 if none
+    :param profile_background_custom_emoji_id: Identifier of a custom emoji to be shown on the background of the chat's profile; 0 if none
+    :param permissions: Actions that non-administrator chat members are allowed to take in the chat
+    :param last_message: Last message in the chat; may be null if none or unknown
+    :param positions: Positions of the chat in chat lists
+    :param chat_lists: Chat lists to which the chat belongs. A chat can have a non-zero position in a chat list even if it doesn't belong to the chat list and have no position in a chat list even if it belongs to the chat list
+    :param message_sender_id: Identifier of a user or chat that is selected to send messages in the chat; may be null if the user can't change message sender
+    :param block_list: Block list to which the chat is added; may be null if none
+    :param has_protected_content: True, if chat content can't be saved locally, forwarded, or copied
+    :param is_translatable: True, if translation of all messages in the chat must be suggested to the user
+    :param is_marked_as_unread: True, if the chat is marked as unread
+    :param view_as_topics: True, if the chat is a forum supergroup that must be shown in the "View as topics" mode, or Saved Messages chat that must be shown in the "View as chats"
+    :param has_scheduled_messages: True, if the chat has scheduled messages
+    :param can_be_deleted_only_for_self: True, if the chat messages can be deleted only for the current user while other users will continue to see the messages
+    :param can_be_deleted_for_all_users: True, if the chat messages can be deleted for all users
+    :param can_be_reported: True, if the chat can be reported to Telegram moderators through reportChat or reportChatPhoto
+    :param default_disable_notification: Default value of the disable_notification parameter, used when a message is sent to the chat
+    :param unread_count: Number of unread messages in the chat
+    :param last_read_inbox_message_id: Identifier of the last read incoming message
+    :param last_read_outbox_message_id: Identifier of the last read outgoing message
+    :param unread_mention_count: Number of unread messages with a mention/reply in the chat
+    :param unread_reaction_count: Number of messages with unread reactions in the chat
+    :param notification_settings: Notification settings for the chat
+    :param available_reactions: Types of reaction, available in the chat
+    :param message_auto_delete_time: Current message auto-delete or self-destruct timer setting for the chat, in seconds; 0 if disabled. Self-destruct timer in secret chats starts after the message or its content is viewed. Auto-delete timer in other chats starts from the send date
+    :param emoji_status: Emoji status to be shown along with chat title; may be null
+    :param background: Background set for the chat; may be null if none
+    :param theme_name: If non-empty, name of a theme, set for the chat
+    :param action_bar: Information about actions which must be possible to do through the chat action bar; may be null if none
+    :param business_bot_manage_bar: Information about bar for managing a business bot in the chat; may be null if none
+    :param video_chat: Information about video chat of the chat
+    :param pending_join_requests: Information about pending join requests; may be null if none
+    :param reply_markup_message_id: Identifier of the message from which reply markup needs to be used; 0 if there is no default custom reply markup in the chat
+    :param draft_message: A draft of a message in the chat; may be null if none
+    :param client_data: Application-specific data associated with the chat. (For example, the chat scroll position or local chat notification settings can be stored here.) Persistent if the message database is used
+    """
+
+    _type: "str" = field(default="chat", init=False, repr=False)
+    id: "int" = 0
+    type: "ChatType | None" = None
+    title: "str" = ""
+    photo: "ChatPhotoInfo | None" = None
+    accent_color_id: "int" = 0
+    background_custom_emoji_id: "int" = 0
+    profile_accent_color_id: "int" = 0
+    profile_background_custom_emoji_id: "int" = 0
+    permissions: "ChatPermissions | None" = None
+    last_message: "Message | None" = None
+    positions: "list[ChatPosition] | None" = None
+    chat_lists: "list[ChatList] | None" = None
+    message_sender_id: "MessageSender | None" = None
+    block_list: "BlockList | None" = None
+    has_protected_content: "bool" = False
+    is_translatable: "bool" = False
+    is_marked_as_unread: "bool" = False
+    view_as_topics: "bool" = False
+    has_scheduled_messages: "bool" = False
+    can_be_deleted_only_for_self: "bool" = False
+    can_be_deleted_for_all_users: "bool" = False
+    can_be_reported: "bool" = False
+    default_disable_notification: "bool" = False
+    unread_count: "int" = 0
+    last_read_inbox_message_id: "int" = 0
+    last_read_outbox_message_id: "int" = 0
+    unread_mention_count: "int" = 0
+    unread_reaction_count: "int" = 0
+    notification_settings: "ChatNotificationSettings | None" = None
+    available_reactions: "ChatAvailableReactions | None" = None
+    message_auto_delete_time: "int" = 0
+    emoji_status: "EmojiStatus | None" = None
+    background: "ChatBackground | None" = None
+    theme_name: "str" = ""
+    action_bar: "ChatActionBar | None" = None
+    business_bot_manage_bar: "BusinessBotManageBar | None" = None
+    video_chat: "VideoChat | None" = None
+    pending_join_requests: "ChatJoinRequestsInfo | None" = None
+    reply_markup_message_id: "int" = 0
+    draft_message: "DraftMessage | None" = None
+    client_data: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "title": self.title,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+            "accent_color_id": self.accent_color_id,
+            "background_custom_emoji_id": self.background_custom_emoji_id,
+            "profile_accent_color_id": self.profile_accent_color_id,
+            "profile_background_custom_emoji_id": self.profile_background_custom_emoji_id,
+            "permissions": self.permissions._to_json_dict() if self.permissions is not None else None,
+            "last_message": self.last_message._to_json_dict() if self.last_message is not None else None,
+            "positions": _list_to_json(self.positions),
+            "chat_lists": _list_to_json(self.chat_lists),
+            "message_sender_id": self.message_sender_id._to_json_dict() if self.message_sender_id is not None else None,
+            "block_list": self.block_list._to_json_dict() if self.block_list is not None else None,
+            "has_protected_content": self.has_protected_content,
+            "is_translatable": self.is_translatable,
+            "is_marked_as_unread": self.is_marked_as_unread,
+            "view_as_topics": self.view_as_topics,
+            "has_scheduled_messages": self.has_scheduled_messages,
+            "can_be_deleted_only_for_self": self.can_be_deleted_only_for_self,
+            "can_be_deleted_for_all_users": self.can_be_deleted_for_all_users,
+            "can_be_reported": self.can_be_reported,
+            "default_disable_notification": self.default_disable_notification,
+            "unread_count": self.unread_count,
+            "last_read_inbox_message_id": self.last_read_inbox_message_id,
+            "last_read_outbox_message_id": self.last_read_outbox_message_id,
+            "unread_mention_count": self.unread_mention_count,
+            "unread_reaction_count": self.unread_reaction_count,
+            "notification_settings": self.notification_settings._to_json_dict() if self.notification_settings is not None else None,
+            "available_reactions": self.available_reactions._to_json_dict() if self.available_reactions is not None else None,
+            "message_auto_delete_time": self.message_auto_delete_time,
+            "emoji_status": self.emoji_status._to_json_dict() if self.emoji_status is not None else None,
+            "background": self.background._to_json_dict() if self.background is not None else None,
+            "theme_name": self.theme_name,
+            "action_bar": self.action_bar._to_json_dict() if self.action_bar is not None else None,
+            "business_bot_manage_bar": self.business_bot_manage_bar._to_json_dict() if self.business_bot_manage_bar is not None else None,
+            "video_chat": self.video_chat._to_json_dict() if self.video_chat is not None else None,
+            "pending_join_requests": self.pending_join_requests._to_json_dict() if self.pending_join_requests is not None else None,
+            "reply_markup_message_id": self.reply_markup_message_id,
+            "draft_message": self.draft_message._to_json_dict() if self.draft_message is not None else None,
+            "client_data": self.client_data,
+        }
+
+@dataclass(slots=True)
+class Chats(ObjectBase):
+    """
+    Represents a list of chats
+
+    :param total_count: Approximate total number of chats found
+    :param chat_ids: List of chat identifiers
+    """
+
+    _type: "str" = field(default="chats", init=False, repr=False)
+    total_count: "int" = 0
+    chat_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "chat_ids": self.chat_ids,
+        }
+
+@dataclass(slots=True)
+class FailedToAddMember(ObjectBase):
+    """
+    Contains information about a user that has failed to be added to a chat
+
+    :param user_id: User identifier
+    :param premium_would_allow_invite: True, if subscription to Telegram Premium would have allowed to add the user to the chat
+    :param premium_required_to_send_messages: True, if subscription to Telegram Premium is required to send the user chat invite link
+    """
+
+    _type: "str" = field(default="failedToAddMember", init=False, repr=False)
+    user_id: "int" = 0
+    premium_would_allow_invite: "bool" = False
+    premium_required_to_send_messages: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "premium_would_allow_invite": self.premium_would_allow_invite,
+            "premium_required_to_send_messages": self.premium_required_to_send_messages,
+        }
+
+@dataclass(slots=True)
+class FailedToAddMembers(ObjectBase):
+    """
+    Represents a list of users that has failed to be added to a chat
+
+    :param failed_to_add_members: Information about users that weren't added to the chat
+    """
+
+    _type: "str" = field(default="failedToAddMembers", init=False, repr=False)
+    failed_to_add_members: "list[FailedToAddMember] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "failed_to_add_members": _list_to_json(self.failed_to_add_members),
+        }
+
+@dataclass(slots=True)
+class CreatedBasicGroupChat(ObjectBase):
+    """
+    Contains information about a newly created basic group chat
+
+    :param chat_id: Chat identifier
+    :param failed_to_add_members: Information about failed to add members
+    """
+
+    _type: "str" = field(default="createdBasicGroupChat", init=False, repr=False)
+    chat_id: "int" = 0
+    failed_to_add_members: "FailedToAddMembers | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "failed_to_add_members": self.failed_to_add_members._to_json_dict() if self.failed_to_add_members is not None else None,
+        }
+
+@dataclass(slots=True)
+class PublicChatType(ObjectBase):
+    """
+    Describes type of public chat
+
+    """
+
+    _type: "str" = field(default="PublicChatType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PublicChatTypeHasUsername(PublicChatType):
+    """
+    The chat is public, because it has an active username
+
+    """
+
+    _type: "str" = field(default="publicChatTypeHasUsername", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PublicChatTypeIsLocationBased(PublicChatType):
+    """
+    The chat is public, because it is a location-based supergroup
+
+    """
+
+    _type: "str" = field(default="publicChatTypeIsLocationBased", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class AccountInfo(ObjectBase):
+    """
+    Contains basic information about another user that started a chat with the current user
+
+    :param registration_month: Month when the user was registered in Telegram; 0-12; may be 0 if unknown
+    :param registration_year: Year when the user was registered in Telegram; 0-9999; may be 0 if unknown
+    :param phone_number_country_code: A two-letter ISO 3166-1 alpha-2 country code based on the phone number of the user; may be empty if unknown
+    :param last_name_change_date: Point in time (Unix timestamp) when the user changed name last time; 0 if unknown
+    :param last_photo_change_date: Point in time (Unix timestamp) when the user changed photo last time; 0 if unknown
+    """
+
+    _type: "str" = field(default="accountInfo", init=False, repr=False)
+    registration_month: "int" = 0
+    registration_year: "int" = 0
+    phone_number_country_code: "str" = ""
+    last_name_change_date: "int" = 0
+    last_photo_change_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "registration_month": self.registration_month,
+            "registration_year": self.registration_year,
+            "phone_number_country_code": self.phone_number_country_code,
+            "last_name_change_date": self.last_name_change_date,
+            "last_photo_change_date": self.last_photo_change_date,
+        }
+
+@dataclass(slots=True)
+class ChatActionBar(ObjectBase):
+    """
+    Describes actions which must be possible to do through a chat action bar
+
+    """
+
+    _type: "str" = field(default="ChatActionBar", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatActionBarReportSpam(ChatActionBar):
+    """
+    The chat can be reported as spam using the method reportChat with an empty option_id and message_ids. If the chat is a private chat with a user with an emoji status, then a notice about emoji status usage must be shown
+
+    :param can_unarchive: If true, the chat was automatically archived and can be moved back to the main chat list using addChatToList simultaneously with setting chat notification settings to default using setChatNotificationSettings
+    """
+
+    _type: "str" = field(default="chatActionBarReportSpam", init=False, repr=False)
+    can_unarchive: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "can_unarchive": self.can_unarchive,
+        }
+
+@dataclass(slots=True)
+class ChatActionBarInviteMembers(ChatActionBar):
+    """
+    The chat is a recently created group chat to which new members can be invited
+
+    """
+
+    _type: "str" = field(default="chatActionBarInviteMembers", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatActionBarReportAddBlock(ChatActionBar):
+    """
+    The chat is a private or secret chat, which can be reported using the method reportChat, or the other user can be blocked using the method setMessageSenderBlockList, or the other user can be added to the contact list using the method addContact. If the chat is a private chat with a user with an emoji status, then a notice about emoji status usage must be shown
+
+    :param can_unarchive: If true, the chat was automatically archived and can be moved back to the main chat list using addChatToList simultaneously with setting chat notification settings to default using setChatNotificationSettings
+    :param account_info: Basic information about the other user in the chat; may be null if unknown
+    """
+
+    _type: "str" = field(default="chatActionBarReportAddBlock", init=False, repr=False)
+    can_unarchive: "bool" = False
+    account_info: "AccountInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "can_unarchive": self.can_unarchive,
+            "account_info": self.account_info._to_json_dict() if self.account_info is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatActionBarAddContact(ChatActionBar):
+    """
+    The chat is a private or secret chat and the other user can be added to the contact list using the method addContact
+
+    """
+
+    _type: "str" = field(default="chatActionBarAddContact", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatActionBarSharePhoneNumber(ChatActionBar):
+    """
+    The chat is a private or secret chat with a mutual contact and the user's phone number can be shared with the other user using the method sharePhoneNumber
+
+    """
+
+    _type: "str" = field(default="chatActionBarSharePhoneNumber", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatActionBarJoinRequest(ChatActionBar):
+    """
+    The chat is a private chat with an administrator of a chat to which the user sent join request
+
+    :param title: Title of the chat to which the join request was sent
+    :param is_channel: True, if the join request was sent to a channel chat
+    :param request_date: Point in time (Unix timestamp) when the join request was sent
+    """
+
+    _type: "str" = field(default="chatActionBarJoinRequest", init=False, repr=False)
+    title: "str" = ""
+    is_channel: "bool" = False
+    request_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "title": self.title,
+            "is_channel": self.is_channel,
+            "request_date": self.request_date,
+        }
+
+@dataclass(slots=True)
+class KeyboardButtonType(ObjectBase):
+    """
+    Describes a keyboard button type
+
+    """
+
+    _type: "str" = field(default="KeyboardButtonType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class KeyboardButtonTypeText(KeyboardButtonType):
+    """
+    A simple button, with text that must be sent when the button is pressed
+
+    """
+
+    _type: "str" = field(default="keyboardButtonTypeText", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class KeyboardButtonTypeRequestPhoneNumber(KeyboardButtonType):
+    """
+    A button that sends the user's phone number when pressed; available only in private chats
+
+    """
+
+    _type: "str" = field(default="keyboardButtonTypeRequestPhoneNumber", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class KeyboardButtonTypeRequestLocation(KeyboardButtonType):
+    """
+    A button that sends the user's location when pressed; available only in private chats
+
+    """
+
+    _type: "str" = field(default="keyboardButtonTypeRequestLocation", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class KeyboardButtonTypeRequestPoll(KeyboardButtonType):
+    """
+    A button that allows the user to create and send a poll when pressed; available only in private chats
+
+    :param force_regular: If true, only regular polls must be allowed to create
+    :param force_quiz: If true, only polls in quiz mode must be allowed to create
+    """
+
+    _type: "str" = field(default="keyboardButtonTypeRequestPoll", init=False, repr=False)
+    force_regular: "bool" = False
+    force_quiz: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "force_regular": self.force_regular,
+            "force_quiz": self.force_quiz,
+        }
+
+@dataclass(slots=True)
+class KeyboardButtonTypeRequestUsers(KeyboardButtonType):
+    """
+    A button that requests users to be shared by the current user; available only in private chats. Use the method shareUsersWithBot to complete the request
+
+    :param id: Unique button identifier
+    :param restrict_user_is_bot: True, if the shared users must or must not be bots
+    :param user_is_bot: True, if the shared users must be bots; otherwise, the shared users must not be bots. Ignored if restrict_user_is_bot is false
+    :param restrict_user_is_premium: True, if the shared users must or must not be Telegram Premium users
+    :param user_is_premium: True, if the shared users must be Telegram Premium users; otherwise, the shared users must not be Telegram Premium users. Ignored if restrict_user_is_premium is false
+    :param max_quantity: The maximum number of users to share
+    :param request_name: Pass true to request name of the users; bots only
+    :param request_username: Pass true to request username of the users; bots only
+    :param request_photo: Pass true to request photo of the users; bots only
+    """
+
+    _type: "str" = field(default="keyboardButtonTypeRequestUsers", init=False, repr=False)
+    id: "int" = 0
+    restrict_user_is_bot: "bool" = False
+    user_is_bot: "bool" = False
+    restrict_user_is_premium: "bool" = False
+    user_is_premium: "bool" = False
+    max_quantity: "int" = 0
+    request_name: "bool" = False
+    request_username: "bool" = False
+    request_photo: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "restrict_user_is_bot": self.restrict_user_is_bot,
+            "user_is_bot": self.user_is_bot,
+            "restrict_user_is_premium": self.restrict_user_is_premium,
+            "user_is_premium": self.user_is_premium,
+            "max_quantity": self.max_quantity,
+            "request_name": self.request_name,
+            "request_username": self.request_username,
+            "request_photo": self.request_photo,
+        }
+
+@dataclass(slots=True)
+class KeyboardButtonTypeRequestChat(KeyboardButtonType):
+    """
+    A button that requests a chat to be shared by the current user; available only in private chats. Use the method shareChatWithBot to complete the request
+
+    :param id: Unique button identifier
+    :param chat_is_channel: True, if the chat must be a channel; otherwise, a basic group or a supergroup chat is shared
+    :param restrict_chat_is_forum: True, if the chat must or must not be a forum supergroup
+    :param chat_is_forum: True, if the chat must be a forum supergroup; otherwise, the chat must not be a forum supergroup. Ignored if restrict_chat_is_forum is false
+    :param restrict_chat_has_username: True, if the chat must or must not have a username
+    :param chat_has_username: True, if the chat must have a username; otherwise, the chat must not have a username. Ignored if restrict_chat_has_username is false
+    :param chat_is_created: True, if the chat must be created by the current user
+    :param user_administrator_rights: Expected user administrator rights in the chat; may be null if they aren't restricted
+    :param bot_administrator_rights: Expected bot administrator rights in the chat; may be null if they aren't restricted
+    :param bot_is_member: True, if the bot must be a member of the chat; for basic group and supergroup chats only
+    :param request_title: Pass true to request title of the chat; bots only
+    :param request_username: Pass true to request username of the chat; bots only
+    :param request_photo: Pass true to request photo of the chat; bots only
+    """
+
+    _type: "str" = field(default="keyboardButtonTypeRequestChat", init=False, repr=False)
+    id: "int" = 0
+    chat_is_channel: "bool" = False
+    restrict_chat_is_forum: "bool" = False
+    chat_is_forum: "bool" = False
+    restrict_chat_has_username: "bool" = False
+    chat_has_username: "bool" = False
+    chat_is_created: "bool" = False
+    user_administrator_rights: "ChatAdministratorRights | None" = None
+    bot_administrator_rights: "ChatAdministratorRights | None" = None
+    bot_is_member: "bool" = False
+    request_title: "bool" = False
+    request_username: "bool" = False
+    request_photo: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "chat_is_channel": self.chat_is_channel,
+            "restrict_chat_is_forum": self.restrict_chat_is_forum,
+            "chat_is_forum": self.chat_is_forum,
+            "restrict_chat_has_username": self.restrict_chat_has_username,
+            "chat_has_username": self.chat_has_username,
+            "chat_is_created": self.chat_is_created,
+            "user_administrator_rights": self.user_administrator_rights._to_json_dict() if self.user_administrator_rights is not None else None,
+            "bot_administrator_rights": self.bot_administrator_rights._to_json_dict() if self.bot_administrator_rights is not None else None,
+            "bot_is_member": self.bot_is_member,
+            "request_title": self.request_title,
+            "request_username": self.request_username,
+            "request_photo": self.request_photo,
+        }
+
+@dataclass(slots=True)
+class KeyboardButtonTypeWebApp(KeyboardButtonType):
+    """
+    A button that opens a Web App by calling getWebAppUrl
+
+    :param url: An HTTP URL to pass to getWebAppUrl
+    """
+
+    _type: "str" = field(default="keyboardButtonTypeWebApp", init=False, repr=False)
+    url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+        }
+
+@dataclass(slots=True)
+class KeyboardButton(ObjectBase):
+    """
+    Represents a single button in a bot keyboard
+
+    :param text: Text of the button
+    :param type: Type of the button
+    """
+
+    _type: "str" = field(default="keyboardButton", init=False, repr=False)
+    text: "str" = ""
+    type: "KeyboardButtonType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+@dataclass(slots=True)
+class InlineKeyboardButtonType(ObjectBase):
+    """
+    Describes the type of inline keyboard button
+
+    """
+
+    _type: "str" = field(default="InlineKeyboardButtonType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InlineKeyboardButtonTypeUrl(InlineKeyboardButtonType):
+    """
+    A button that opens a specified URL
+
+    :param url: HTTP or tg:// URL to open. If the link is of the type internalLinkTypeWebApp, then the button must be marked as a Web App button
+    """
+
+    _type: "str" = field(default="inlineKeyboardButtonTypeUrl", init=False, repr=False)
+    url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+        }
+
+@dataclass(slots=True)
+class InlineKeyboardButtonTypeLoginUrl(InlineKeyboardButtonType):
+    """
+    A button that opens a specified URL and automatically authorize the current user by calling getLoginUrlInfo
+
+    :param url: An HTTP URL to pass to getLoginUrlInfo
+    :param id: Unique button identifier
+    :param forward_text: If non-empty, new text of the button in forwarded messages
+    """
+
+    _type: "str" = field(default="inlineKeyboardButtonTypeLoginUrl", init=False, repr=False)
+    url: "str" = ""
+    id: "int" = 0
+    forward_text: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+            "id": self.id,
+            "forward_text": self.forward_text,
+        }
+
+@dataclass(slots=True)
+class InlineKeyboardButtonTypeWebApp(InlineKeyboardButtonType):
+    """
+    A button that opens a Web App by calling openWebApp
+
+    :param url: An HTTP URL to pass to openWebApp
+    """
+
+    _type: "str" = field(default="inlineKeyboardButtonTypeWebApp", init=False, repr=False)
+    url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+        }
+
+@dataclass(slots=True)
+class InlineKeyboardButtonTypeCallback(InlineKeyboardButtonType):
+    """
+    A button that sends a callback query to a bot
+
+    :param data: Data to be sent to the bot via a callback query
+    """
+
+    _type: "str" = field(default="inlineKeyboardButtonTypeCallback", init=False, repr=False)
+    data: "bytes" = b""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "data": _bytes_to_json(self.data),
+        }
+
+@dataclass(slots=True)
+class InlineKeyboardButtonTypeCallbackWithPassword(InlineKeyboardButtonType):
+    """
+    A button that asks for the 2-step verification password of the current user and then sends a callback query to a bot
+
+    :param data: Data to be sent to the bot via a callback query
+    """
+
+    _type: "str" = field(default="inlineKeyboardButtonTypeCallbackWithPassword", init=False, repr=False)
+    data: "bytes" = b""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "data": _bytes_to_json(self.data),
+        }
+
+@dataclass(slots=True)
+class InlineKeyboardButtonTypeCallbackGame(InlineKeyboardButtonType):
+    """
+    A button with a game that sends a callback query to a bot. This button must be in the first column and row of the keyboard and can be attached only to a message with content of the type messageGame
+
+    """
+
+    _type: "str" = field(default="inlineKeyboardButtonTypeCallbackGame", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InlineKeyboardButtonTypeSwitchInline(InlineKeyboardButtonType):
+    """
+    A button that forces an inline query to the bot to be inserted in the input field
+
+    :param query: Inline query to be sent to the bot
+    :param target_chat: Target chat from which to send the inline query
+    """
+
+    _type: "str" = field(default="inlineKeyboardButtonTypeSwitchInline", init=False, repr=False)
+    query: "str" = ""
+    target_chat: "TargetChat | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "query": self.query,
+            "target_chat": self.target_chat._to_json_dict() if self.target_chat is not None else None,
+        }
+
+@dataclass(slots=True)
+class InlineKeyboardButtonTypeBuy(InlineKeyboardButtonType):
+    """
+    A button to buy something. This button must be in the first column and row of the keyboard and can be attached only to a message with content of the type messageInvoice
+
+    """
+
+    _type: "str" = field(default="inlineKeyboardButtonTypeBuy", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InlineKeyboardButtonTypeUser(InlineKeyboardButtonType):
+    """
+    A button with a user reference to be handled in the same way as textEntityTypeMentionName entities
+
+    :param user_id: User identifier
+    """
+
+    _type: "str" = field(default="inlineKeyboardButtonTypeUser", init=False, repr=False)
+    user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+        }
+
+@dataclass(slots=True)
+class InlineKeyboardButtonTypeCopyText(InlineKeyboardButtonType):
+    """
+    A button that copies specified text to clipboard
+
+    :param text: The text to copy to clipboard
+    """
+
+    _type: "str" = field(default="inlineKeyboardButtonTypeCopyText", init=False, repr=False)
+    text: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text,
+        }
+
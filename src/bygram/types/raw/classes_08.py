@@ -0,0 +1,1994 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_01 import Animation, Audio, Background, ChatPhotoInfo, Document, Location, Photo, Video, VoiceNote, WebApp
+    from .classes_05 import MessageReplyInfo, MessageSender
+    from .classes_06 import ChatNotificationSettings, Message
+    from .classes_07 import DraftMessage, InlineKeyboardButtonType, KeyboardButton
+    from .classes_18 import BackgroundFill
+
+@dataclass(slots=True)
+class InlineKeyboardButton(ObjectBase):
+    """
+    Represents a single button in an inline keyboard
+
+    :param text: Text of the button
+    :param type: Type of the button
+    """
+
+    _type: "str" = field(default="inlineKeyboardButton", init=False, repr=False)
+    text: "str" = ""
+    type: "InlineKeyboardButtonType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+@dataclass(slots=True)
+class ReplyMarkup(ObjectBase):
+    """
+    Contains a description of a custom keyboard and actions that can be done with it to quickly reply to bots
+
+    """
+
+    _type: "str" = field(default="ReplyMarkup", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReplyMarkupRemoveKeyboard(ReplyMarkup):
+    """
+    Instructs application to remove the keyboard once this message has been received. This kind of keyboard can't be received in an incoming message; instead, updateChatReplyMarkup with message_id == 0 will be sent
+
+    :param is_personal: True, if the keyboard is removed only for the mentioned users or the target user of a reply
+    """
+
+    _type: "str" = field(default="replyMarkupRemoveKeyboard", init=False, repr=False)
+    is_personal: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_personal": self.is_personal,
+        }
+
+@dataclass(slots=True)
+class ReplyMarkupForceReply(ReplyMarkup):
+    """
+    Instructs application to force a reply to this message
+
+    :param is_personal: True, if a forced reply must automatically be shown to the current user. For outgoing messages, specify true to show the forced reply only for the mentioned users and for the target user of a reply
+    :param input_field_placeholder: If non-empty, the placeholder to be shown in the input field when the reply is active; 0-64 characters
+    """
+
+    _type: "str" = field(default="replyMarkupForceReply", init=False, repr=False)
+    is_personal: "bool" = False
+    input_field_placeholder: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_personal": self.is_personal,
+            "input_field_placeholder": self.input_field_placeholder,
+        }
+
+@dataclass(slots=True)
+class ReplyMarkupShowKeyboard(ReplyMarkup):
+    """
+    Contains a custom keyboard layout to quickly reply to bots
+
+    :param rows: A list of rows of bot keyboard buttons
+    :param is_persistent: True, if the keyboard is expected to always be shown when the ordinary keyboard is hidden
+    :param resize_keyboard: True, if the application needs to resize the keyboard vertically
+    :param one_time: True, if the application needs to hide the keyboard after use
+    :param is_personal: True, if the keyboard must automatically be shown to the current user. For outgoing messages, specify true to show the keyboard only for the mentioned users and for the target user of a reply
+    :param input_field_placeholder: If non-empty, the placeholder to be shown in the input field when the keyboard is active; 0-64 characters
+    """
+
+    _type: "str" = field(default="replyMarkupShowKeyboard", init=False, repr=False)
+    rows: "list[list[KeyboardButton]] | None" = None
+    is_persistent: "bool" = False
+    resize_keyboard: "bool" = False
+    one_time: "bool" = False
+    is_personal: "bool" = False
+    input_field_placeholder: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "rows": _list_to_json(self.rows),
+            "is_persistent": self.is_persistent,
+            "resize_keyboard": self.resize_keyboard,
+            "one_time": self.one_time,
+            "is_personal": self.is_personal,
+            "input_field_placeholder": self.input_field_placeholder,
+        }
+
+@dataclass(slots=True)
+class ReplyMarkupInlineKeyboard(ReplyMarkup):
+    """
+    Contains an inline keyboard layout
+
+    :param rows: A list of rows of inline keyboard buttons
+    """
+
+    _type: "str" = field(default="replyMarkupInlineKeyboard", init=False, repr=False)
+    rows: "list[list[InlineKeyboardButton]] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "rows": _list_to_json(self.rows),
+        }
+
+@dataclass(slots=True)
+class LoginUrlInfo(ObjectBase):
+    """
+    Contains information about an inline button of type inlineKeyboardButtonTypeLoginUrl
+
+    """
+
+    _type: "str" = field(default="LoginUrlInfo", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class LoginUrlInfoOpen(LoginUrlInfo):
+    """
+    An HTTP URL needs to be open
+
+    :param url: The URL to open
+    :param skip_confirmation: True, if there is no need to show an ordinary open URL confirmation
+    """
+
+    _type: "str" = field(default="loginUrlInfoOpen", init=False, repr=False)
+    url: "str" = ""
+    skip_confirmation: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+            "skip_confirmation": self.skip_confirmation,
+        }
+
+@dataclass(slots=True)
+class LoginUrlInfoRequestConfirmation(LoginUrlInfo):
+    """
+    An authorization confirmation dialog needs to be shown to the user
+
+    :param url: An HTTP URL to be opened
+    :param domain: A domain of the URL
+    :param bot_user_id: User identifier of a bot linked with the website
+    :param request_write_access: True, if the user must be asked for the permission to the bot to send them messages
+    """
+
+    _type: "str" = field(default="loginUrlInfoRequestConfirmation", init=False, repr=False)
+    url: "str" = ""
+    domain: "str" = ""
+    bot_user_id: "int" = 0
+    request_write_access: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+            "domain": self.domain,
+            "bot_user_id": self.bot_user_id,
+            "request_write_access": self.request_write_access,
+        }
+
+@dataclass(slots=True)
+class ThemeParameters(ObjectBase):
+    """
+    Contains parameters of the application theme
+
+    :param background_color: A color of the background in the RGB format
+    :param secondary_background_color: A secondary color for the background in the RGB format
+    :param header_background_color: A color of the header background in the RGB format
+    :param bottom_bar_background_color: A color of the bottom bar background in the RGB format
+    :param section_background_color: A color of the section background in the RGB format
+    :param section_separator_color: A color of the section separator in the RGB format
+    :param text_color: A color of text in the RGB format
+    :param accent_text_color: An accent color of the text in the RGB format
+    :param section_header_text_color: A color of text on the section headers in the RGB format
+    :param subtitle_text_color: A color of the subtitle text in the RGB format
+    :param destructive_text_color: A color of the text for destructive actions in the RGB format
+    :param hint_color: A color of hints in the RGB format
+    :param link_color: A color of links in the RGB format
+    :param button_color: A color of the buttons in the RGB format
+    :param button_text_color: A color of text on the buttons in the RGB format
+    """
+
+    _type: "str" = field(default="themeParameters", init=False, repr=False)
+    background_color: "int" = 0
+    secondary_background_color: "int" = 0
+    header_background_color: "int" = 0
+    bottom_bar_background_color: "int" = 0
+    section_background_color: "int" = 0
+    section_separator_color: "int" = 0
+    text_color: "int" = 0
+    accent_text_color: "int" = 0
+    section_header_text_color: "int" = 0
+    subtitle_text_color: "int" = 0
+    destructive_text_color: "int" = 0
+    hint_color: "int" = 0
+    link_color: "int" = 0
+    button_color: "int" = 0
+    button_text_color: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "background_color": self.background_color,
+            "secondary_background_color": self.secondary_background_color,
+            "header_background_color": self.header_background_color,
+            "bottom_bar_background_color": self.bottom_bar_background_color,
+            "section_background_color": self.section_background_color,
+            "section_separator_color": self.section_separator_color,
+            "text_color": self.text_color,
+            "accent_text_color": self.accent_text_color,
+            "section_header_text_color": self.section_header_text_color,
+            "subtitle_text_color": self.subtitle_text_color,
+            "destructive_text_color": self.destructive_text_color,
+            "hint_color": self.hint_color,
+            "link_color": self.link_color,
+            "button_color": self.button_color,
+            "button_text_color": self.button_text_color,
+        }
+
+@dataclass(slots=True)
+class WebAppOpenMode(ObjectBase):
+    """
+    Describes mode in which a Web App is opened
+
+    """
+
+    _type: "str" = field(default="WebAppOpenMode", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class WebAppOpenModeCompact(WebAppOpenMode):
+    """
+    The Web App is opened in the compact mode
+
+    """
+
+    _type: "str" = field(default="webAppOpenModeCompact", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class WebAppOpenModeFullSize(WebAppOpenMode):
+    """
+    The Web App is opened in the full-size mode
+
+    """
+
+    _type: "str" = field(default="webAppOpenModeFullSize", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class WebAppOpenModeFullScreen(WebAppOpenMode):
+    """
+    The Web App is opened in the full-screen mode
+
+    """
+
+    _type: "str" = field(default="webAppOpenModeFullScreen", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FoundWebApp(ObjectBase):
+    """
+    Contains information about a Web App found by its short name
+
+    :param web_app: The Web App
+    :param request_write_access: True, if the user must be asked for the permission to the bot to send them messages
+    :param skip_confirmation: True, if there is no need to show an ordinary open URL confirmation before opening the Web App. The field must be ignored and confirmation must be shown anyway if the Web App link was hidden
+    """
+
+    _type: "str" = field(default="foundWebApp", init=False, repr=False)
+    web_app: "WebApp | None" = None
+    request_write_access: "bool" = False
+    skip_confirmation: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "web_app": self.web_app._to_json_dict() if self.web_app is not None else None,
+            "request_write_access": self.request_write_access,
+            "skip_confirmation": self.skip_confirmation,
+        }
+
+@dataclass(slots=True)
+class WebAppInfo(ObjectBase):
+    """
+    Contains information about a Web App
+
+    :param launch_id: Unique identifier for the Web App launch
+    :param url: A Web App URL to open in a web view
+    """
+
+    _type: "str" = field(default="webAppInfo", init=False, repr=False)
+    launch_id: "int" = 0
+    url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "launch_id": self.launch_id,
+            "url": self.url,
+        }
+
+@dataclass(slots=True)
+class MainWebApp(ObjectBase):
+    """
+    Contains information about the main Web App of a bot
+
+    :param url: URL of the Web App to open
+    :param mode: The mode in which the Web App must be opened
+    """
+
+    _type: "str" = field(default="mainWebApp", init=False, repr=False)
+    url: "str" = ""
+    mode: "WebAppOpenMode | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+            "mode": self.mode._to_json_dict() if self.mode is not None else None,
+        }
+
+@dataclass(slots=True)
+class WebAppOpenParameters(ObjectBase):
+    """
+    Options to be used when a Web App is opened
+
+    :param theme: Preferred Web App theme; pass null to use the default theme
+    :param application_name: Short name of the current application; 0-64 English letters, digits, and underscores
+    :param mode: The mode in which the Web App is opened; pass null to open in webAppOpenModeFullSize
+    """
+
+    _type: "str" = field(default="webAppOpenParameters", init=False, repr=False)
+    theme: "ThemeParameters | None" = None
+    application_name: "str" = ""
+    mode: "WebAppOpenMode | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "theme": self.theme._to_json_dict() if self.theme is not None else None,
+            "application_name": self.application_name,
+            "mode": self.mode._to_json_dict() if self.mode is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessageThreadInfo(ObjectBase):
+    """
+    Contains information about a message thread
+
+    :param chat_id: Identifier of the chat to which the message thread belongs
+    :param message_thread_id: Message thread identifier, unique within the chat
+    :param reply_info: Information about the message thread; may be null for forum topic threads
+    :param unread_message_count: Approximate number of unread messages in the message thread
+    :param messages: The messages from which the thread starts. The messages are returned in reverse chronological order (i.e., in order of decreasing message_id)
+    :param draft_message: A draft of a message in the message thread; may be null if none
+    """
+
+    _type: "str" = field(default="messageThreadInfo", init=False, repr=False)
+    chat_id: "int" = 0
+    message_thread_id: "int" = 0
+    reply_info: "MessageReplyInfo | None" = None
+    unread_message_count: "int" = 0
+    messages: "list[Message] | None" = None
+    draft_message: "DraftMessage | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_thread_id": self.message_thread_id,
+            "reply_info": self.reply_info._to_json_dict() if self.reply_info is not None else None,
+            "unread_message_count": self.unread_message_count,
+            "messages": _list_to_json(self.messages),
+            "draft_message": self.draft_message._to_json_dict() if self.draft_message is not None else None,
+        }
+
+@dataclass(slots=True)
+class SavedMessagesTopicType(ObjectBase):
+    """
+    Describes type of Saved Messages topic
+
+    """
+
+    _type: "str" = field(default="SavedMessagesTopicType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SavedMessagesTopicTypeMyNotes(SavedMessagesTopicType):
+    """
+    Topic containing messages sent by the current user of forwarded from an unknown chat
+
+    """
+
+    _type: "str" = field(default="savedMessagesTopicTypeMyNotes", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SavedMessagesTopicTypeAuthorHidden(SavedMessagesTopicType):
+    """
+    Topic containing messages forwarded from a user with hidden privacy
+
+    """
+
+    _type: "str" = field(default="savedMessagesTopicTypeAuthorHidden", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SavedMessagesTopicTypeSavedFromChat(SavedMessagesTopicType):
+    """
+    Topic containing messages forwarded from a specific chat
+
+    :param chat_id: Identifier of the chat
+    """
+
+    _type: "str" = field(default="savedMessagesTopicTypeSavedFromChat", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+@dataclass(slots=True)
+class SavedMessagesTopic(ObjectBase):
+    """
+    Contains information about a Saved Messages topic
+
+    :param id: Unique topic identifier
+    :param type: Type of the topic
+    :param is_pinned: True, if the topic is pinned
+    :param order: A parameter used to determine order of the topic in the topic list. Topics must be sorted by the order in descending order
+    :param last_message: Last message in the topic; may be null if none or unknown
+    :param draft_message: A draft of a message in the topic; may be null if none
+    """
+
+    _type: "str" = field(default="savedMessagesTopic", init=False, repr=False)
+    id: "int" = 0
+    type: "SavedMessagesTopicType | None" = None
+    is_pinned: "bool" = False
+    order: "int" = 0
+    last_message: "Message | None" = None
+    draft_message: "DraftMessage | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "is_pinned": self.is_pinned,
+            "order": self.order,
+            "last_message": self.last_message._to_json_dict() if self.last_message is not None else None,
+            "draft_message": self.draft_message._to_json_dict() if self.draft_message is not None else None,
+        }
+
+@dataclass(slots=True)
+class DirectMessagesChatTopic(ObjectBase):
+    """
+    Contains information about a topic in a channel direct messages chat administered by the current user
+
+    :param chat_id: Identifier of the chat to which the topic belongs
+    :param id: Unique topic identifier
+    :param sender_id: Identifier of the user or chat that sends the messages to the topic
+    :param order: A parameter used to determine order of the topic in the topic list. Topics must be sorted by the order in descending order
+    :param can_send_unpaid_messages: True, if the other party can send unpaid messages even if the chat has paid messages enabled
+    :param is_marked_as_unread: True, if the forum topic is marked as unread
+    :param unread_count: Number of unread messages in the chat
+    :param last_read_inbox_message_id: Identifier of the last read incoming message
+    :param last_read_outbox_message_id: Identifier of the last read outgoing message
+    :param unread_reaction_count: Number of messages with unread reactions in the chat
+    :param last_message: Last message in the topic; may be null if none or unknown
+    :param draft_message: A draft of a message in the topic; may be null if none
+    """
+
+    _type: "str" = field(default="directMessagesChatTopic", init=False, repr=False)
+    chat_id: "int" = 0
+    id: "int" = 0
+    sender_id: "MessageSender | None" = None
+    order: "int" = 0
+    can_send_unpaid_messages: "bool" = False
+    is_marked_as_unread: "bool" = False
+    unread_count: "int" = 0
+    last_read_inbox_message_id: "int" = 0
+    last_read_outbox_message_id: "int" = 0
+    unread_reaction_count: "int" = 0
+    last_message: "Message | None" = None
+    draft_message: "DraftMessage | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "id": self.id,
+            "sender_id": self.sender_id._to_json_dict() if self.sender_id is not None else None,
+            "order": self.order,
+            "can_send_unpaid_messages": self.can_send_unpaid_messages,
+            "is_marked_as_unread": self.is_marked_as_unread,
+            "unread_count": self.unread_count,
+            "last_read_inbox_message_id": self.last_read_inbox_message_id,
+            "last_read_outbox_message_id": self.last_read_outbox_message_id,
+            "unread_reaction_count": self.unread_reaction_count,
+            "last_message": self.last_message._to_json_dict() if self.last_message is not None else None,
+            "draft_message": self.draft_message._to_json_dict() if self.draft_message is not None else None,
+        }
+
+@dataclass(slots=True)
+class ForumTopicIcon(ObjectBase):
+    """
+    Describes a forum topic icon
+
+    :param color: Color of the topic icon in RGB format
+    :param custom_emoji_id: Unique identifier of the custom emoji shown on the topic icon; 0 if none
+    """
+
+    _type: "str" = field(default="forumTopicIcon", init=False, repr=False)
+    color: "int" = 0
+    custom_emoji_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "color": self.color,
+            "custom_emoji_id": self.custom_emoji_id,
+        }
+
+@dataclass(slots=True)
+class ForumTopicInfo(ObjectBase):
+    """
+    Contains basic information about a forum topic
+
+    :param chat_id: Identifier of the forum chat to which the topic belongs
+    :param forum_topic_id: Forum topic identifier of the topic
+    :param message_thread_id: Message thread identifier of the topic
+    :param name: Name of the topic
+    :param icon: Icon of the topic
+    :param creation_date: Point in time (Unix timestamp) when the topic was created
+    :param creator_id: Identifier of the creator of the topic
+    :param is_general: True, if the topic is the General topic list
+    :param is_outgoing: True, if the topic was created by the current user
+    :param is_closed: True, if the topic is closed. If the topic is closed, then the user must have can_manage_topics administrator right in the supergroup or must be the creator of the topic to send messages there
+    :param is_hidden: True, if the topic is hidden above the topic list and closed; for General topic only
+    """
+
+    _type: "str" = field(default="forumTopicInfo", init=False, repr=False)
+    chat_id: "int" = 0
+    forum_topic_id: "int" = 0
+    message_thread_id: "int" = 0
+    name: "str" = ""
+    icon: "ForumTopicIcon | None" = None
+    creation_date: "int" = 0
+    creator_id: "MessageSender | None" = None
+    is_general: "bool" = False
+    is_outgoing: "bool" = False
+    is_closed: "bool" = False
+    is_hidden: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "forum_topic_id": self.forum_topic_id,
+            "message_thread_id": self.message_thread_id,
+            "name": self.name,
+            "icon": self.icon._to_json_dict() if self.icon is not None else None,
+            "creation_date": self.creation_date,
+            "creator_id": self.creator_id._to_json_dict() if self.creator_id is not None else None,
+            "is_general": self.is_general,
+            "is_outgoing": self.is_outgoing,
+            "is_closed": self.is_closed,
+            "is_hidden": self.is_hidden,
+        }
+
+@dataclass(slots=True)
+class ForumTopic(ObjectBase):
+    """
+    Describes a forum topic
+
+    :param info: Basic information about the topic
+    :param last_message: Last message in the topic; may be null if unknown
+    :param order: A parameter used to determine order of the topic in the topic list. Topics must be sorted by the order in descending order
+    :param is_pinned: True, if the topic is pinned in the topic list
+    :param unread_count: Number of unread messages in the topic
+    :param last_read_inbox_message_id: Identifier of the last read incoming message
+    :param last_read_outbox_message_id: Identifier of the last read outgoing message
+    :param unread_mention_count: Number of unread messages with a mention/reply in the topic
+    :param unread_reaction_count: Number of messages with unread reactions in the topic
+    :param notification_settings: Notification settings for the topic
+    :param draft_message: A draft of a message in the topic; may be null if none
+    """
+
+    _type: "str" = field(default="forumTopic", init=False, repr=False)
+    info: "ForumTopicInfo | None" = None
+    last_message: "Message | None" = None
+    order: "int" = 0
+    is_pinned: "bool" = False
+    unread_count: "int" = 0
+    last_read_inbox_message_id: "int" = 0
+    last_read_outbox_message_id: "int" = 0
+    unread_mention_count: "int" = 0
+    unread_reaction_count: "int" = 0
+    notification_settings: "ChatNotificationSettings | None" = None
+    draft_message: "DraftMessage | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "info": self.info._to_json_dict() if self.info is not None else None,
+            "last_message": self.last_message._to_json_dict() if self.last_message is not None else None,
+            "order": self.order,
+            "is_pinned": self.is_pinned,
+            "unread_count": self.unread_count,
+            "last_read_inbox_message_id": self.last_read_inbox_message_id,
+            "last_read_outbox_message_id": self.last_read_outbox_message_id,
+            "unread_mention_count": self.unread_mention_count,
+            "unread_reaction_count": self.unread_reaction_count,
+            "notification_settings": self.notification_settings._to_json_dict() if self.notification_settings is not None else None,
+            "draft_message": self.draft_message._to_json_dict() if self.draft_message is not None else None,
+        }
+
+@dataclass(slots=True)
+class ForumTopics(ObjectBase):
+    """
+    Describes a list of forum topics
+
+    :param total_count: Approximate total number of forum topics found
+    :param topics: List of forum topics
+    :param next_offset_date: Offset date for the next getForumTopics request
+    :param next_offset_message_id: Offset message identifier for the next getForumTopics request
+    :param next_offset_message_thread_id: Offset message thread identifier for the next getForumTopics request
+    """
+
+    _type: "str" = field(default="forumTopics", init=False, repr=False)
+    total_count: "int" = 0
+    topics: "list[ForumTopic] | None" = None
+    next_offset_date: "int" = 0
+    next_offset_message_id: "int" = 0
+    next_offset_message_thread_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "topics": _list_to_json(self.topics),
+            "next_offset_date": self.next_offset_date,
+            "next_offset_message_id": self.next_offset_message_id,
+            "next_offset_message_thread_id": self.next_offset_message_thread_id,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewOptions(ObjectBase):
+    """
+    Options to be used for generation of a link preview
+
+    :param is_disabled: True, if link preview must be disabled
+    :param url: URL to use for link preview. If empty, then the first URL found in the message text will be used
+    :param force_small_media: True, if shown media preview must be small; ignored in secret chats or if the URL isn't explicitly specified
+    :param force_large_media: True, if shown media preview must be large; ignored in secret chats or if the URL isn't explicitly specified
+    :param show_above_text: True, if link preview must be shown above message text; otherwise, the link preview will be shown below the message text; ignored in secret chats
+    """
+
+    _type: "str" = field(default="linkPreviewOptions", init=False, repr=False)
+    is_disabled: "bool" = False
+    url: "str" = ""
+    force_small_media: "bool" = False
+    force_large_media: "bool" = False
+    show_above_text: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_disabled": self.is_disabled,
+            "url": self.url,
+            "force_small_media": self.force_small_media,
+            "force_large_media": self.force_large_media,
+            "show_above_text": self.show_above_text,
+        }
+
+@dataclass(slots=True)
+class SharedUser(ObjectBase):
+    """
+    Contains information about a user shared with a bot
+
+    :param user_id: User identifier
+    :param first_name: First name of the user; for bots only
+    :param last_name: Last name of the user; for bots only
+    :param username: Username of the user; for bots only
+    :param photo: Profile photo of the user; for bots only; may be null
+    """
+
+    _type: "str" = field(default="sharedUser", init=False, repr=False)
+    user_id: "int" = 0
+    first_name: "str" = ""
+    last_name: "str" = ""
+    username: "str" = ""
+    photo: "Photo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+            "username": self.username,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+        }
+
+@dataclass(slots=True)
+class SharedChat(ObjectBase):
+    """
+    Contains information about a chat shared with a bot
+
+    :param chat_id: Chat identifier
+    :param title: Title of the chat; for bots only
+    :param username: Username of the chat; for bots only
+    :param photo: Photo of the chat; for bots only; may be null
+    """
+
+    _type: "str" = field(default="sharedChat", init=False, repr=False)
+    chat_id: "int" = 0
+    title: "str" = ""
+    username: "str" = ""
+    photo: "Photo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "title": self.title,
+            "username": self.username,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+        }
+
+@dataclass(slots=True)
+class ThemeSettings(ObjectBase):
+    """
+    Describes theme settings
+
+    :param accent_color: Theme accent color in ARGB format
+    :param background: The background to be used in chats; may be null
+    :param outgoing_message_fill: The fill to be used as a background for outgoing messages
+    :param animate_outgoing_message_fill: If true, the freeform gradient fill needs to be animated on every sent message
+    :param outgoing_message_accent_color: Accent color of outgoing messages in ARGB format
+    """
+
+    _type: "str" = field(default="themeSettings", init=False, repr=False)
+    accent_color: "int" = 0
+    background: "Background | None" = None
+    outgoing_message_fill: "BackgroundFill | None" = None
+    animate_outgoing_message_fill: "bool" = False
+    outgoing_message_accent_color: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "accent_color": self.accent_color,
+            "background": self.background._to_json_dict() if self.background is not None else None,
+            "outgoing_message_fill": self.outgoing_message_fill._to_json_dict() if self.outgoing_message_fill is not None else None,
+            "animate_outgoing_message_fill": self.animate_outgoing_message_fill,
+            "outgoing_message_accent_color": self.outgoing_message_accent_color,
+        }
+
+@dataclass(slots=True)
+class RichText(ObjectBase):
+    """
+    Describes a formatted text object
+
+    """
+
+    _type: "str" = field(default="RichText", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class RichTextPlain(RichText):
+    """
+    A plain text
+
+    :param text: Text
+    """
+
+    _type: "str" = field(default="richTextPlain", init=False, repr=False)
+    text: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text,
+        }
+
+@dataclass(slots=True)
+class RichTextBold(RichText):
+    """
+    A bold rich text
+
+    :param text: Text
+    """
+
+    _type: "str" = field(default="richTextBold", init=False, repr=False)
+    text: "RichText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+        }
+
+@dataclass(slots=True)
+class RichTextItalic(RichText):
+    """
+    An italicized rich text
+
+    :param text: Text
+    """
+
+    _type: "str" = field(default="richTextItalic", init=False, repr=False)
+    text: "RichText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+        }
+
+@dataclass(slots=True)
+class RichTextUnderline(RichText):
+    """
+    An underlined rich text
+
+    :param text: Text
+    """
+
+    _type: "str" = field(default="richTextUnderline", init=False, repr=False)
+    text: "RichText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+        }
+
+@dataclass(slots=True)
+class RichTextStrikethrough(RichText):
+    """
+    A strikethrough rich text
+
+    :param text: Text
+    """
+
+    _type: "str" = field(default="richTextStrikethrough", init=False, repr=False)
+    text: "RichText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+        }
+
+@dataclass(slots=True)
+class RichTextFixed(RichText):
+    """
+    A fixed-width rich text
+
+    :param text: Text
+    """
+
+    _type: "str" = field(default="richTextFixed", init=False, repr=False)
+    text: "RichText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+        }
+
+@dataclass(slots=True)
+class RichTextUrl(RichText):
+    """
+    A rich text URL link
+
+    :param text: Text
+    :param url: URL
+    :param is_cached: True, if the URL has cached instant view server-side
+    """
+
+    _type: "str" = field(default="richTextUrl", init=False, repr=False)
+    text: "RichText | None" = None
+    url: "str" = ""
+    is_cached: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "url": self.url,
+            "is_cached": self.is_cached,
+        }
+
+@dataclass(slots=True)
+class RichTextEmailAddress(RichText):
+    """
+    A rich text email link
+
+    :param text: Text
+    :param email_address: Email address
+    """
+
+    _type: "str" = field(default="richTextEmailAddress", init=False, repr=False)
+    text: "RichText | None" = None
+    email_address: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "email_address": self.email_address,
+        }
+
+@dataclass(slots=True)
+class RichTextSubscript(RichText):
+    """
+    A subscript rich text
+
+    :param text: Text
+    """
+
+    _type: "str" = field(default="richTextSubscript", init=False, repr=False)
+    text: "RichText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+        }
+
+@dataclass(slots=True)
+class RichTextSuperscript(RichText):
+    """
+    A superscript rich text
+
+    :param text: Text
+    """
+
+    _type: "str" = field(default="richTextSuperscript", init=False, repr=False)
+    text: "RichText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+        }
+
+@dataclass(slots=True)
+class RichTextMarked(RichText):
+    """
+    A marked rich text
+
+    :param text: Text
+    """
+
+    _type: "str" = field(default="richTextMarked", init=False, repr=False)
+    text: "RichText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+        }
+
+@dataclass(slots=True)
+class RichTextPhoneNumber(RichText):
+    """
+    A rich text phone number
+
+    :param text: Text
+    :param phone_number: Phone number
+    """
+
+    _type: "str" = field(default="richTextPhoneNumber", init=False, repr=False)
+    text: "RichText | None" = None
+    phone_number: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "phone_number": self.phone_number,
+        }
+
+@dataclass(slots=True)
+class RichTextIcon(RichText):
+    """
+    A small image inside the text
+
+    :param document: The image represented as a document. The image can be in GIF, JPEG or PNG format
+    :param width: Width of a bounding box in which the image must be shown; 0 if unknown
+    :param height: Height of a bounding box in which the image must be shown; 0 if unknown
+    """
+
+    _type: "str" = field(default="richTextIcon", init=False, repr=False)
+    document: "Document | None" = None
+    width: "int" = 0
+    height: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "document": self.document._to_json_dict() if self.document is not None else None,
+            "width": self.width,
+            "height": self.height,
+        }
+
+@dataclass(slots=True)
+class RichTextReference(RichText):
+    """
+    A reference to a richTexts object on the same page
+
+    :param text: The text
+    :param anchor_name: The name of a richTextAnchor object, which is the first element of the target richTexts object
+    :param url: An HTTP URL, opening the reference
+    """
+
+    _type: "str" = field(default="richTextReference", init=False, repr=False)
+    text: "RichText | None" = None
+    anchor_name: "str" = ""
+    url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "anchor_name": self.anchor_name,
+            "url": self.url,
+        }
+
+@dataclass(slots=True)
+class RichTextAnchor(RichText):
+    """
+    An anchor
+
+    :param name: Anchor name
+    """
+
+    _type: "str" = field(default="richTextAnchor", init=False, repr=False)
+    name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name,
+        }
+
+@dataclass(slots=True)
+class RichTextAnchorLink(RichText):
+    """
+    A link to an anchor on the same page
+
+    :param text: The link text
+    :param anchor_name: The anchor name. If the name is empty, the link must bring back to top
+    :param url: An HTTP URL, opening the anchor
+    """
+
+    _type: "str" = field(default="richTextAnchorLink", init=False, repr=False)
+    text: "RichText | None" = None
+    anchor_name: "str" = ""
+    url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "anchor_name": self.anchor_name,
+            "url": self.url,
+        }
+
+@dataclass(slots=True)
+class RichTexts(RichText):
+    """
+    A concatenation of rich texts
+
+    :param texts: Texts
+    """
+
+    _type: "str" = field(default="richTexts", init=False, repr=False)
+    texts: "list[RichText] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "texts": _list_to_json(self.texts),
+        }
+
+@dataclass(slots=True)
+class PageBlockCaption(ObjectBase):
+    """
+    Contains a caption of another block
+
+    :param text: Content of the caption
+    :param credit: Block credit (like HTML tag <cite>)
+    """
+
+    _type: "str" = field(default="pageBlockCaption", init=False, repr=False)
+    text: "RichText | None" = None
+    credit: "RichText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "credit": self.credit._to_json_dict() if self.credit is not None else None,
+        }
+
+@dataclass(slots=True)
+class PageBlockListItem(ObjectBase):
+    """
+    Describes an item of a list page block
+
+    :param label: Item label
+    :param page_blocks: Item blocks
+    """
+
+    _type: "str" = field(default="pageBlockListItem", init=False, repr=False)
+    label: "str" = ""
+    page_blocks: "list[PageBlock] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "label": self.label,
+            "page_blocks": _list_to_json(self.page_blocks),
+        }
+
+@dataclass(slots=True)
+class PageBlockHorizontalAlignment(ObjectBase):
+    """
+    Describes a horizontal alignment of a table cell content
+
+    """
+
+    _type: "str" = field(default="PageBlockHorizontalAlignment", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PageBlockHorizontalAlignmentLeft(PageBlockHorizontalAlignment):
+    """
+    The content must be left-aligned
+
+    """
+
+    _type: "str" = field(default="pageBlockHorizontalAlignmentLeft", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PageBlockHorizontalAlignmentCenter(PageBlockHorizontalAlignment):
+    """
+    The content must be center-aligned
+
+    """
+
+    _type: "str" = field(default="pageBlockHorizontalAlignmentCenter", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PageBlockHorizontalAlignmentRight(PageBlockHorizontalAlignment):
+    """
+    The content must be right-aligned
+
+    """
+
+    _type: "str" = field(default="pageBlockHorizontalAlignmentRight", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PageBlockVerticalAlignment(ObjectBase):
+    """
+    Describes a Vertical alignment of a table cell content
+
+    """
+
+    _type: "str" = field(default="PageBlockVerticalAlignment", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PageBlockVerticalAlignmentTop(PageBlockVerticalAlignment):
+    """
+    The content must be top-aligned
+
+    """
+
+    _type: "str" = field(default="pageBlockVerticalAlignmentTop", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PageBlockVerticalAlignmentMiddle(PageBlockVerticalAlignment):
+    """
+    The content must be middle-aligned
+
+    """
+
+    _type: "str" = field(default="pageBlockVerticalAlignmentMiddle", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PageBlockVerticalAlignmentBottom(PageBlockVerticalAlignment):
+    """
+    The content must be bottom-aligned
+
+    """
+
+    _type: "str" = field(default="pageBlockVerticalAlignmentBottom", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PageBlockTableCell(ObjectBase):
+    """
+    Represents a cell of a table
+
+    :param text: Cell text; may be null. If the text is null, then the cell must be invisible
+    :param is_header: True, if it is a header cell
+    :param colspan: The number of columns the cell spans
+    :param rowspan: The number of rows the cell spans
+    :param align: Horizontal cell content alignment
+    :param valign: Vertical cell content alignment
+    """
+
+    _type: "str" = field(default="pageBlockTableCell", init=False, repr=False)
+    text: "RichText | None" = None
+    is_header: "bool" = False
+    colspan: "int" = 0
+    rowspan: "int" = 0
+    align: "PageBlockHorizontalAlignment | None" = None
+    valign: "PageBlockVerticalAlignment | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "is_header": self.is_header,
+            "colspan": self.colspan,
+            "rowspan": self.rowspan,
+            "align": self.align._to_json_dict() if self.align is not None else None,
+            "valign": self.valign._to_json_dict() if self.valign is not None else None,
+        }
+
+@dataclass(slots=True)
+class PageBlockRelatedArticle(ObjectBase):
+    """
+    Contains information about a related article
+
+    :param url: Related article URL
+    :param title: Article title; may be empty
+    :param description: Contains information about a related article
+    :param photo: Article photo; may be null
+    :param author: Article author; may be empty
+    :param publish_date: Point in time (Unix timestamp) when the article was published; 0 if unknown
+    """
+
+    _type: "str" = field(default="pageBlockRelatedArticle", init=False, repr=False)
+    url: "str" = ""
+    title: "str" = ""
+    description: "str" = ""
+    photo: "Photo | None" = None
+    author: "str" = ""
+    publish_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+            "title": self.title,
+            "description": self.description,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+            "author": self.author,
+            "publish_date": self.publish_date,
+        }
+
+@dataclass(slots=True)
+class PageBlock(ObjectBase):
+    """
+    Describes a block of an instant view for a web page
+
+    """
+
+    _type: "str" = field(default="PageBlock", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PageBlockTitle(PageBlock):
+    """
+    The title of a page
+
+    :param title: Title
+    """
+
+    _type: "str" = field(default="pageBlockTitle", init=False, repr=False)
+    title: "RichText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "title": self.title._to_json_dict() if self.title is not None else None,
+        }
+
+@dataclass(slots=True)
+class PageBlockSubtitle(PageBlock):
+    """
+    The subtitle of a page
+
+    :param subtitle: Subtitle
+    """
+
+    _type: "str" = field(default="pageBlockSubtitle", init=False, repr=False)
+    subtitle: "RichText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "subtitle": self.subtitle._to_json_dict() if self.subtitle is not None else None,
+        }
+
+@dataclass(slots=True)
+class PageBlockAuthorDate(PageBlock):
+    """
+    The author and publishing date of a page
+
+    :param author: Author
+    :param publish_date: Point in time (Unix timestamp) when the article was published; 0 if unknown
+    """
+
+    _type: "str" = field(default="pageBlockAuthorDate", init=False, repr=False)
+    author: "RichText | None" = None
+    publish_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "author": self.author._to_json_dict() if self.author is not None else None,
+            "publish_date": self.publish_date,
+        }
+
+@dataclass(slots=True)
+class PageBlockHeader(PageBlock):
+    """
+    A header
+
+    :param header: Header
+    """
+
+    _type: "str" = field(default="pageBlockHeader", init=False, repr=False)
+    header: "RichText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "header": self.header._to_json_dict() if self.header is not None else None,
+        }
+
+@dataclass(slots=True)
+class PageBlockSubheader(PageBlock):
+    """
+    A subheader
+
+    :param subheader: Subheader
+    """
+
+    _type: "str" = field(default="pageBlockSubheader", init=False, repr=False)
+    subheader: "RichText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "subheader": self.subheader._to_json_dict() if self.subheader is not None else None,
+        }
+
+@dataclass(slots=True)
+class PageBlockKicker(PageBlock):
+    """
+    A kicker
+
+    :param kicker: Kicker
+    """
+
+    _type: "str" = field(default="pageBlockKicker", init=False, repr=False)
+    kicker: "RichText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "kicker": self.kicker._to_json_dict() if self.kicker is not None else None,
+        }
+
+@dataclass(slots=True)
+class PageBlockParagraph(PageBlock):
+    """
+    A text paragraph
+
+    :param text: Paragraph text
+    """
+
+    _type: "str" = field(default="pageBlockParagraph", init=False, repr=False)
+    text: "RichText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+        }
+
+@dataclass(slots=True)
+class PageBlockPreformatted(PageBlock):
+    """
+    A preformatted text paragraph
+
+    :param text: Paragraph text
+    :param language: Programming language for which the text needs to be formatted
+    """
+
+    _type: "str" = field(default="pageBlockPreformatted", init=False, repr=False)
+    text: "RichText | None" = None
+    language: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "language": self.language,
+        }
+
+@dataclass(slots=True)
+class PageBlockFooter(PageBlock):
+    """
+    The footer of a page
+
+    :param footer: Footer
+    """
+
+    _type: "str" = field(default="pageBlockFooter", init=False, repr=False)
+    footer: "RichText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "footer": self.footer._to_json_dict() if self.footer is not None else None,
+        }
+
+@dataclass(slots=True)
+class PageBlockDivider(PageBlock):
+    """
+    An empty block separating a page
+
+    """
+
+    _type: "str" = field(default="pageBlockDivider", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PageBlockAnchor(PageBlock):
+    """
+    An invisible anchor on a page, which can be used in a URL to open the page from the specified anchor
+
+    :param name: Name of the anchor
+    """
+
+    _type: "str" = field(default="pageBlockAnchor", init=False, repr=False)
+    name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name,
+        }
+
+@dataclass(slots=True)
+class PageBlockList(PageBlock):
+    """
+    A list of data blocks
+
+    :param items: The items of the list
+    """
+
+    _type: "str" = field(default="pageBlockList", init=False, repr=False)
+    items: "list[PageBlockListItem] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "items": _list_to_json(self.items),
+        }
+
+@dataclass(slots=True)
+class PageBlockBlockQuote(PageBlock):
+    """
+    A block quote
+
+    :param text: Quote text
+    :param credit: Quote credit
+    """
+
+    _type: "str" = field(default="pageBlockBlockQuote", init=False, repr=False)
+    text: "RichText | None" = None
+    credit: "RichText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "credit": self.credit._to_json_dict() if self.credit is not None else None,
+        }
+
+@dataclass(slots=True)
+class PageBlockPullQuote(PageBlock):
+    """
+    A pull quote
+
+    :param text: Quote text
+    :param credit: Quote credit
+    """
+
+    _type: "str" = field(default="pageBlockPullQuote", init=False, repr=False)
+    text: "RichText | None" = None
+    credit: "RichText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "credit": self.credit._to_json_dict() if self.credit is not None else None,
+        }
+
+@dataclass(slots=True)
+class PageBlockAnimation(PageBlock):
+    """
+    An animation
+
+    :param animation: Animation file; may be null
+    :param caption: Animation caption
+    :param need_autoplay: True, if the animation must be played automatically
+    """
+
+    _type: "str" = field(default="pageBlockAnimation", init=False, repr=False)
+    animation: "Animation | None" = None
+    caption: "PageBlockCaption | None" = None
+    need_autoplay: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "animation": self.animation._to_json_dict() if self.animation is not None else None,
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+            "need_autoplay": self.need_autoplay,
+        }
+
+@dataclass(slots=True)
+class PageBlockAudio(PageBlock):
+    """
+    An audio file
+
+    :param audio: Audio file; may be null
+    :param caption: Audio file caption
+    """
+
+    _type: "str" = field(default="pageBlockAudio", init=False, repr=False)
+    audio: "Audio | None" = None
+    caption: "PageBlockCaption | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "audio": self.audio._to_json_dict() if self.audio is not None else None,
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+        }
+
+@dataclass(slots=True)
+class PageBlockPhoto(PageBlock):
+    """
+    A photo
+
+    :param photo: Photo file; may be null
+    :param caption: Photo caption
+    :param url: URL that needs to be opened when the photo is clicked
+    """
+
+    _type: "str" = field(default="pageBlockPhoto", init=False, repr=False)
+    photo: "Photo | None" = None
+    caption: "PageBlockCaption | None" = None
+    url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+            "url": self.url,
+        }
+
+@dataclass(slots=True)
+class PageBlockVideo(PageBlock):
+    """
+    A video
+
+    :param video: Video file; may be null
+    :param caption: Video caption
+    :param need_autoplay: True, if the video must be played automatically
+    :param is_looped: True, if the video must be looped
+    """
+
+    _type: "str" = field(default="pageBlockVideo", init=False, repr=False)
+    video: "Video | None" = None
+    caption: "PageBlockCaption | None" = None
+    need_autoplay: "bool" = False
+    is_looped: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "video": self.video._to_json_dict() if self.video is not None else None,
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+            "need_autoplay": self.need_autoplay,
+            "is_looped": self.is_looped,
+        }
+
+@dataclass(slots=True)
+class PageBlockVoiceNote(PageBlock):
+    """
+    A voice note
+
+    :param voice_note: Voice note; may be null
+    :param caption: Voice note caption
+    """
+
+    _type: "str" = field(default="pageBlockVoiceNote", init=False, repr=False)
+    voice_note: "VoiceNote | None" = None
+    caption: "PageBlockCaption | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "voice_note": self.voice_note._to_json_dict() if self.voice_note is not None else None,
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+        }
+
+@dataclass(slots=True)
+class PageBlockCover(PageBlock):
+    """
+    A page cover
+
+    :param cover: Cover
+    """
+
+    _type: "str" = field(default="pageBlockCover", init=False, repr=False)
+    cover: "PageBlock | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "cover": self.cover._to_json_dict() if self.cover is not None else None,
+        }
+
+@dataclass(slots=True)
+class PageBlockEmbedded(PageBlock):
+    """
+    An embedded web page
+
+    :param url: URL of the embedded page, if available
+    :param html: HTML-markup of the embedded page
+    :param poster_photo: Poster photo, if available; may be null
+    :param width: Block width; 0 if unknown
+    :param height: Block height; 0 if unknown
+    :param caption: Block caption
+    :param is_full_width: True, if the block must be full width
+    :param allow_scrolling: True, if scrolling needs to be allowed
+    """
+
+    _type: "str" = field(default="pageBlockEmbedded", init=False, repr=False)
+    url: "str" = ""
+    html: "str" = ""
+    poster_photo: "Photo | None" = None
+    width: "int" = 0
+    height: "int" = 0
+    caption: "PageBlockCaption | None" = None
+    is_full_width: "bool" = False
+    allow_scrolling: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+            "html": self.html,
+            "poster_photo": self.poster_photo._to_json_dict() if self.poster_photo is not None else None,
+            "width": self.width,
+            "height": self.height,
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+            "is_full_width": self.is_full_width,
+            "allow_scrolling": self.allow_scrolling,
+        }
+
+@dataclass(slots=True)
+class PageBlockEmbeddedPost(PageBlock):
+    """
+    An embedded post
+
+    :param url: URL of the embedded post
+    :param author: Post author
+    :param author_photo: Post author photo; may be null
+    :param date: Point in time (Unix timestamp) when the post was created; 0 if unknown
+    :param page_blocks: Post content
+    :param caption: Post caption
+    """
+
+    _type: "str" = field(default="pageBlockEmbeddedPost", init=False, repr=False)
+    url: "str" = ""
+    author: "str" = ""
+    author_photo: "Photo | None" = None
+    date: "int" = 0
+    page_blocks: "list[PageBlock] | None" = None
+    caption: "PageBlockCaption | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+            "author": self.author,
+            "author_photo": self.author_photo._to_json_dict() if self.author_photo is not None else None,
+            "date": self.date,
+            "page_blocks": _list_to_json(self.page_blocks),
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+        }
+
+@dataclass(slots=True)
+class PageBlockCollage(PageBlock):
+    """
+    A collage
+
+    :param page_blocks: Collage item contents
+    :param caption: Block caption
+    """
+
+    _type: "str" = field(default="pageBlockCollage", init=False, repr=False)
+    page_blocks: "list[PageBlock] | None" = None
+    caption: "PageBlockCaption | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "page_blocks": _list_to_json(self.page_blocks),
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+        }
+
+@dataclass(slots=True)
+class PageBlockSlideshow(PageBlock):
+    """
+    A slideshow
+
+    :param page_blocks: Slideshow item contents
+    :param caption: Block caption
+    """
+
+    _type: "str" = field(default="pageBlockSlideshow", init=False, repr=False)
+    page_blocks: "list[PageBlock] | None" = None
+    caption: "PageBlockCaption | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "page_blocks": _list_to_json(self.page_blocks),
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+        }
+
+@dataclass(slots=True)
+class PageBlockChatLink(PageBlock):
+    """
+    A link to a chat
+
+    :param title: Chat title
+    :param photo: Chat photo; may be null
+    :param accent_color_id: Identifier of the accent color for chat title and background of chat photo
+    :param username: Chat username by which all other information about the chat can be resolved
+    """
+
+    _type: "str" = field(default="pageBlockChatLink", init=False, repr=False)
+    title: "str" = ""
+    photo: "ChatPhotoInfo | None" = None
+    accent_color_id: "int" = 0
+    username: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "title": self.title,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+            "accent_color_id": self.accent_color_id,
+            "username": self.username,
+        }
+
+@dataclass(slots=True)
+class PageBlockTable(PageBlock):
+    """
+    A table
+
+    :param caption: Table caption
+    :param cells: Table cells
+    :param is_bordered: True, if the table is bordered
+    :param is_striped: True, if the table is striped
+    """
+
+    _type: "str" = field(default="pageBlockTable", init=False, repr=False)
+    caption: "RichText | None" = None
+    cells: "list[list[PageBlockTableCell]] | None" = None
+    is_bordered: "bool" = False
+    is_striped: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+            "cells": _list_to_json(self.cells),
+            "is_bordered": self.is_bordered,
+            "is_striped": self.is_striped,
+        }
+
+@dataclass(slots=True)
+class PageBlockDetails(PageBlock):
+    """
+    A collapsible block
+
+    :param header: Always visible heading for the block
+    :param page_blocks: Block contents
+    :param is_open: True, if the block is open by default
+    """
+
+    _type: "str" = field(default="pageBlockDetails", init=False, repr=False)
+    header: "RichText | None" = None
+    page_blocks: "list[PageBlock] | None" = None
+    is_open: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "header": self.header._to_json_dict() if self.header is not None else None,
+            "page_blocks": _list_to_json(self.page_blocks),
+            "is_open": self.is_open,
+        }
+
+@dataclass(slots=True)
+class PageBlockRelatedArticles(PageBlock):
+    """
+    Related articles
+
+    :param header: Block header
+    :param articles: List of related articles
+    """
+
+    _type: "str" = field(default="pageBlockRelatedArticles", init=False, repr=False)
+    header: "RichText | None" = None
+    articles: "list[PageBlockRelatedArticle] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "header": self.header._to_json_dict() if self.header is not None else None,
+            "articles": _list_to_json(self.articles),
+        }
+
+@dataclass(slots=True)
+class PageBlockMap(PageBlock):
+    """
+    A map
+
+    :param location: Location of the map center
+    :param zoom: Map zoom level
+    :param width: Map width
+    :param height: Map height
+    :param caption: Block caption
+    """
+
+    _type: "str" = field(default="pageBlockMap", init=False, repr=False)
+    location: "Location | None" = None
+    zoom: "int" = 0
+    width: "int" = 0
+    height: "int" = 0
+    caption: "PageBlockCaption | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "location": self.location._to_json_dict() if self.location is not None else None,
+            "zoom": self.zoom,
+            "width": self.width,
+            "height": self.height,
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+        }
+
@@ -0,0 +1,1351 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import FormattedText
+    from .classes_01 import Animation, Audio, Document, Photo, Sticker, Video, VideoNote, VoiceNote
+    from .classes_02 import ChatPhoto
+    from .classes_03 import UpgradedGift
+    from .classes_05 import InviteLinkChatType
+    from .classes_08 import PageBlock, ThemeSettings
+    from .classes_18 import BackgroundType
+    from .classes_21 import InternalLinkType
+
+@dataclass(slots=True)
+class WebPageInstantView(ObjectBase):
+    """
+    Describes an instant view page for a web page
+
+    :param page_blocks: Content of the instant view page
+    :param view_count: Number of the instant view views; 0 if unknown
+    :param version: Version of the instant view; currently, can be 1 or 2
+    :param is_rtl: True, if the instant view must be shown from right to left
+    :param is_full: True, if the instant view contains the full page. A network request might be needed to get the full instant view
+    :param feedback_link: An internal link to be opened to leave feedback about the instant view
+    """
+
+    _type: "str" = field(default="webPageInstantView", init=False, repr=False)
+    page_blocks: "list[PageBlock] | None" = None
+    view_count: "int" = 0
+    version: "int" = 0
+    is_rtl: "bool" = False
+    is_full: "bool" = False
+    feedback_link: "InternalLinkType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "page_blocks": _list_to_json(self.page_blocks),
+            "view_count": self.view_count,
+            "version": self.version,
+            "is_rtl": self.is_rtl,
+            "is_full": self.is_full,
+            "feedback_link": self.feedback_link._to_json_dict() if self.feedback_link is not None else None,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewAlbumMedia(ObjectBase):
+    """
+    Describes a media from a link preview album
+
+    """
+
+    _type: "str" = field(default="LinkPreviewAlbumMedia", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewAlbumMediaPhoto(LinkPreviewAlbumMedia):
+    """
+    The media is a photo
+
+    :param photo: Photo description
+    """
+
+    _type: "str" = field(default="linkPreviewAlbumMediaPhoto", init=False, repr=False)
+    photo: "Photo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewAlbumMediaVideo(LinkPreviewAlbumMedia):
+    """
+    The media is a video
+
+    :param video: Video description
+    """
+
+    _type: "str" = field(default="linkPreviewAlbumMediaVideo", init=False, repr=False)
+    video: "Video | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "video": self.video._to_json_dict() if self.video is not None else None,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewType(ObjectBase):
+    """
+    Describes type of link preview
+
+    """
+
+    _type: "str" = field(default="LinkPreviewType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeAlbum(LinkPreviewType):
+    """
+    The link is a link to a media album consisting of photos and videos
+
+    :param media: The list of album media
+    :param caption: Album caption
+    """
+
+    _type: "str" = field(default="linkPreviewTypeAlbum", init=False, repr=False)
+    media: "list[LinkPreviewAlbumMedia] | None" = None
+    caption: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "media": _list_to_json(self.media),
+            "caption": self.caption,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeAnimation(LinkPreviewType):
+    """
+    The link is a link to an animation
+
+    :param animation: The animation
+    """
+
+    _type: "str" = field(default="linkPreviewTypeAnimation", init=False, repr=False)
+    animation: "Animation | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "animation": self.animation._to_json_dict() if self.animation is not None else None,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeApp(LinkPreviewType):
+    """
+    The link is a link to an app at App Store or Google Play
+
+    :param photo: Photo for the app
+    """
+
+    _type: "str" = field(default="linkPreviewTypeApp", init=False, repr=False)
+    photo: "Photo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeArticle(LinkPreviewType):
+    """
+    The link is a link to a web site
+
+    :param photo: Article's main photo; may be null
+    """
+
+    _type: "str" = field(default="linkPreviewTypeArticle", init=False, repr=False)
+    photo: "Photo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeAudio(LinkPreviewType):
+    """
+    The link is a link to an audio
+
+    :param audio: The audio description
+    """
+
+    _type: "str" = field(default="linkPreviewTypeAudio", init=False, repr=False)
+    audio: "Audio | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "audio": self.audio._to_json_dict() if self.audio is not None else None,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeBackground(LinkPreviewType):
+    """
+    The link is a link to a background. Link preview title and description are available only for filled backgrounds
+
+    :param document: Document with the background; may be null for filled backgrounds
+    :param background_type: Type of the background; may be null if unknown
+    """
+
+    _type: "str" = field(default="linkPreviewTypeBackground", init=False, repr=False)
+    document: "Document | None" = None
+    background_type: "BackgroundType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "document": self.document._to_json_dict() if self.document is not None else None,
+            "background_type": self.background_type._to_json_dict() if self.background_type is not None else None,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeChannelBoost(LinkPreviewType):
+    """
+    The link is a link to boost a channel chat
+
+    :param photo: Photo of the chat; may be null
+    """
+
+    _type: "str" = field(default="linkPreviewTypeChannelBoost", init=False, repr=False)
+    photo: "ChatPhoto | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeChat(LinkPreviewType):
+    """
+    The link is a link to a chat
+
+    :param type: Type of the chat
+    :param photo: Photo of the chat; may be null
+    :param creates_join_request: True, if the link only creates join request
+    """
+
+    _type: "str" = field(default="linkPreviewTypeChat", init=False, repr=False)
+    type: "InviteLinkChatType | None" = None
+    photo: "ChatPhoto | None" = None
+    creates_join_request: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+            "creates_join_request": self.creates_join_request,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeDocument(LinkPreviewType):
+    """
+    The link is a link to a general file
+
+    :param document: The document description
+    """
+
+    _type: "str" = field(default="linkPreviewTypeDocument", init=False, repr=False)
+    document: "Document | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "document": self.document._to_json_dict() if self.document is not None else None,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeEmbeddedAnimationPlayer(LinkPreviewType):
+    """
+    The link is a link to an animation player
+
+    :param url: URL of the external animation player
+    :param thumbnail: Thumbnail of the animation; may be null if unknown
+    :param duration: Duration of the animation, in seconds
+    :param width: Expected width of the embedded player
+    :param height: Expected height of the embedded player
+    """
+
+    _type: "str" = field(default="linkPreviewTypeEmbeddedAnimationPlayer", init=False, repr=False)
+    url: "str" = ""
+    thumbnail: "Photo | None" = None
+    duration: "int" = 0
+    width: "int" = 0
+    height: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+            "thumbnail": self.thumbnail._to_json_dict() if self.thumbnail is not None else None,
+            "duration": self.duration,
+            "width": self.width,
+            "height": self.height,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeEmbeddedAudioPlayer(LinkPreviewType):
+    """
+    The link is a link to an audio player
+
+    :param url: URL of the external audio player
+    :param thumbnail: Thumbnail of the audio; may be null if unknown
+    :param duration: Duration of the audio, in seconds
+    :param width: Expected width of the embedded player
+    :param height: Expected height of the embedded player
+    """
+
+    _type: "str" = field(default="linkPreviewTypeEmbeddedAudioPlayer", init=False, repr=False)
+    url: "str" = ""
+    thumbnail: "Photo | None" = None
+    duration: "int" = 0
+    width: "int" = 0
+    height: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+            "thumbnail": self.thumbnail._to_json_dict() if self.thumbnail is not None else None,
+            "duration": self.duration,
+            "width": self.width,
+            "height": self.height,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeEmbeddedVideoPlayer(LinkPreviewType):
+    """
+    The link is a link to a video player
+
+    :param url: URL of the external video player
+    :param thumbnail: Thumbnail of the video; may be null if unknown
+    :param duration: Duration of the video, in seconds
+    :param width: Expected width of the embedded player
+    :param height: Expected height of the embedded player
+    """
+
+    _type: "str" = field(default="linkPreviewTypeEmbeddedVideoPlayer", init=False, repr=False)
+    url: "str" = ""
+    thumbnail: "Photo | None" = None
+    duration: "int" = 0
+    width: "int" = 0
+    height: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+            "thumbnail": self.thumbnail._to_json_dict() if self.thumbnail is not None else None,
+            "duration": self.duration,
+            "width": self.width,
+            "height": self.height,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeExternalAudio(LinkPreviewType):
+    """
+    The link is a link to an audio file
+
+    :param url: URL of the audio file
+    :param mime_type: MIME type of the audio file
+    :param duration: Duration of the audio, in seconds; 0 if unknown
+    """
+
+    _type: "str" = field(default="linkPreviewTypeExternalAudio", init=False, repr=False)
+    url: "str" = ""
+    mime_type: "str" = ""
+    duration: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+            "mime_type": self.mime_type,
+            "duration": self.duration,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeExternalVideo(LinkPreviewType):
+    """
+    The link is a link to a video file
+
+    :param url: URL of the video file
+    :param mime_type: MIME type of the video file
+    :param width: Expected width of the video preview; 0 if unknown
+    :param height: Expected height of the video preview; 0 if unknown
+    :param duration: Duration of the video, in seconds; 0 if unknown
+    """
+
+    _type: "str" = field(default="linkPreviewTypeExternalVideo", init=False, repr=False)
+    url: "str" = ""
+    mime_type: "str" = ""
+    width: "int" = 0
+    height: "int" = 0
+    duration: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+            "mime_type": self.mime_type,
+            "width": self.width,
+            "height": self.height,
+            "duration": self.duration,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeGroupCall(LinkPreviewType):
+    """
+    The link is a link to a group call that isn't bound to a chat
+
+    """
+
+    _type: "str" = field(default="linkPreviewTypeGroupCall", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeInvoice(LinkPreviewType):
+    """
+    The link is a link to an invoice
+
+    """
+
+    _type: "str" = field(default="linkPreviewTypeInvoice", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeMessage(LinkPreviewType):
+    """
+    The link is a link to a text or a poll Telegram message
+
+    """
+
+    _type: "str" = field(default="linkPreviewTypeMessage", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypePhoto(LinkPreviewType):
+    """
+    The link is a link to a photo
+
+    :param photo: The photo
+    """
+
+    _type: "str" = field(default="linkPreviewTypePhoto", init=False, repr=False)
+    photo: "Photo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypePremiumGiftCode(LinkPreviewType):
+    """
+    The link is a link to a Telegram Premium gift code
+
+    """
+
+    _type: "str" = field(default="linkPreviewTypePremiumGiftCode", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeShareableChatFolder(LinkPreviewType):
+    """
+    The link is a link to a shareable chat folder
+
+    """
+
+    _type: "str" = field(default="linkPreviewTypeShareableChatFolder", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeSticker(LinkPreviewType):
+    """
+    The link is a link to a sticker
+
+    :param sticker: The sticker. It can be an arbitrary WEBP image and can have dimensions bigger than 512
+    """
+
+    _type: "str" = field(default="linkPreviewTypeSticker", init=False, repr=False)
+    sticker: "Sticker | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeStickerSet(LinkPreviewType):
+    """
+    The link is a link to a sticker set
+
+    :param stickers: Up to 4 stickers from the sticker set
+    """
+
+    _type: "str" = field(default="linkPreviewTypeStickerSet", init=False, repr=False)
+    stickers: "list[Sticker] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "stickers": _list_to_json(self.stickers),
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeStory(LinkPreviewType):
+    """
+    The link is a link to a story. Link preview description is unavailable
+
+    :param story_poster_chat_id: The identifier of the chat that posted the story
+    :param story_id: Story identifier
+    """
+
+    _type: "str" = field(default="linkPreviewTypeStory", init=False, repr=False)
+    story_poster_chat_id: "int" = 0
+    story_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_poster_chat_id": self.story_poster_chat_id,
+            "story_id": self.story_id,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeSupergroupBoost(LinkPreviewType):
+    """
+    The link is a link to boost a supergroup chat
+
+    :param photo: Photo of the chat; may be null
+    """
+
+    _type: "str" = field(default="linkPreviewTypeSupergroupBoost", init=False, repr=False)
+    photo: "ChatPhoto | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeTheme(LinkPreviewType):
+    """
+    The link is a link to a cloud theme. TDLib has no theme support yet
+
+    :param documents: The list of files with theme description
+    :param settings: Settings for the cloud theme; may be null if unknown
+    """
+
+    _type: "str" = field(default="linkPreviewTypeTheme", init=False, repr=False)
+    documents: "list[Document] | None" = None
+    settings: "ThemeSettings | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "documents": _list_to_json(self.documents),
+            "settings": self.settings._to_json_dict() if self.settings is not None else None,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeUnsupported(LinkPreviewType):
+    """
+    The link preview type is unsupported yet
+
+    """
+
+    _type: "str" = field(default="linkPreviewTypeUnsupported", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeUpgradedGift(LinkPreviewType):
+    """
+    The link is a link to an upgraded gift
+
+    :param gift: The gift
+    """
+
+    _type: "str" = field(default="linkPreviewTypeUpgradedGift", init=False, repr=False)
+    gift: "UpgradedGift | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "gift": self.gift._to_json_dict() if self.gift is not None else None,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeUser(LinkPreviewType):
+    """
+    The link is a link to a user
+
+    :param photo: Photo of the user; may be null if none
+    :param is_bot: True, if the user is a bot
+    """
+
+    _type: "str" = field(default="linkPreviewTypeUser", init=False, repr=False)
+    photo: "ChatPhoto | None" = None
+    is_bot: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+            "is_bot": self.is_bot,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeVideo(LinkPreviewType):
+    """
+    The link is a link to a video
+
+    :param video: The video description
+    :param cover: Cover of the video; may be null if none
+    :param start_timestamp: Timestamp from which the video playing must start, in seconds
+    """
+
+    _type: "str" = field(default="linkPreviewTypeVideo", init=False, repr=False)
+    video: "Video | None" = None
+    cover: "Photo | None" = None
+    start_timestamp: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "video": self.video._to_json_dict() if self.video is not None else None,
+            "cover": self.cover._to_json_dict() if self.cover is not None else None,
+            "start_timestamp": self.start_timestamp,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeVideoChat(LinkPreviewType):
+    """
+    The link is a link to a video chat
+
+    :param photo: Photo of the chat with the video chat; may be null if none
+    :param is_live_stream: True, if the video chat is expected to be a live stream in a channel or a broadcast group
+    :param joins_as_speaker: True, if the user can use the link to join the video chat without being muted by administrators
+    """
+
+    _type: "str" = field(default="linkPreviewTypeVideoChat", init=False, repr=False)
+    photo: "ChatPhoto | None" = None
+    is_live_stream: "bool" = False
+    joins_as_speaker: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+            "is_live_stream": self.is_live_stream,
+            "joins_as_speaker": self.joins_as_speaker,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeVideoNote(LinkPreviewType):
+    """
+    The link is a link to a video note message
+
+    :param video_note: The video note
+    """
+
+    _type: "str" = field(default="linkPreviewTypeVideoNote", init=False, repr=False)
+    video_note: "VideoNote | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "video_note": self.video_note._to_json_dict() if self.video_note is not None else None,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeVoiceNote(LinkPreviewType):
+    """
+    The link is a link to a voice note message
+
+    :param voice_note: The voice note
+    """
+
+    _type: "str" = field(default="linkPreviewTypeVoiceNote", init=False, repr=False)
+    voice_note: "VoiceNote | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "voice_note": self.voice_note._to_json_dict() if self.voice_note is not None else None,
+        }
+
+@dataclass(slots=True)
+class LinkPreviewTypeWebApp(LinkPreviewType):
+    """
+    The link is a link to a Web App
+
+    :param photo: Web App photo; may be null if none
+    """
+
+    _type: "str" = field(default="linkPreviewTypeWebApp", init=False, repr=False)
+    photo: "Photo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+        }
+
+@dataclass(slots=True)
+class LinkPreview(ObjectBase):
+    """
+    Describes a link preview
+
+    :param url: Original URL of the link
+    :param display_url: URL to display
+    :param site_name: Short name of the site (e.g., Google Docs, App Store)
+    :param title: Title of the content
+    :param description: Describes a link preview
+    :param author: Author of the content
+    :param type: Type of the link preview
+    :param has_large_media: True, if size of media in the preview can be changed
+    :param show_large_media: True, if large media preview must be shown; otherwise, the media preview must be shown small and only the first frame must be shown for videos
+    :param show_media_above_description: True, if media must be shown above link preview description; otherwise, the media must be shown below the description
+    :param skip_confirmation: True, if there is no need to show an ordinary open URL confirmation, when opening the URL from the preview, because the URL is shown in the message text in clear
+    :param show_above_text: True, if the link preview must be shown above message text; otherwise, the link preview must be shown below the message text
+    :param instant_view_version: Version of instant view (currently, can be 1 or 2) for the web page; 0 if none
+    """
+
+    _type: "str" = field(default="linkPreview", init=False, repr=False)
+    url: "str" = ""
+    display_url: "str" = ""
+    site_name: "str" = ""
+    title: "str" = ""
+    description: "FormattedText | None" = None
+    author: "str" = ""
+    type: "LinkPreviewType | None" = None
+    has_large_media: "bool" = False
+    show_large_media: "bool" = False
+    show_media_above_description: "bool" = False
+    skip_confirmation: "bool" = False
+    show_above_text: "bool" = False
+    instant_view_version: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+            "display_url": self.display_url,
+            "site_name": self.site_name,
+            "title": self.title,
+            "description": self.description._to_json_dict() if self.description is not None else None,
+            "author": self.author,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "has_large_media": self.has_large_media,
+            "show_large_media": self.show_large_media,
+            "show_media_above_description": self.show_media_above_description,
+            "skip_confirmation": self.skip_confirmation,
+            "show_above_text": self.show_above_text,
+            "instant_view_version": self.instant_view_version,
+        }
+
+@dataclass(slots=True)
+class CountryInfo(ObjectBase):
+    """
+    Contains information about a country
+
+    :param country_code: A two-letter ISO 3166-1 alpha-2 country code
+    :param name: Native name of the country
+    :param english_name: English name of the country
+    :param is_hidden: True, if the country must be hidden from the list of all countries
+    :param calling_codes: List of country calling codes
+    """
+
+    _type: "str" = field(default="countryInfo", init=False, repr=False)
+    country_code: "str" = ""
+    name: "str" = ""
+    english_name: "str" = ""
+    is_hidden: "bool" = False
+    calling_codes: "list[str] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "country_code": self.country_code,
+            "name": self.name,
+            "english_name": self.english_name,
+            "is_hidden": self.is_hidden,
+            "calling_codes": self.calling_codes,
+        }
+
+@dataclass(slots=True)
+class Countries(ObjectBase):
+    """
+    Contains information about countries
+
+    :param countries: The list of countries
+    """
+
+    _type: "str" = field(default="countries", init=False, repr=False)
+    countries: "list[CountryInfo] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "countries": _list_to_json(self.countries),
+        }
+
+@dataclass(slots=True)
+class PhoneNumberInfo(ObjectBase):
+    """
+    Contains information about a phone number
+
+    :param country: Information about the country to which the phone number belongs; may be null
+    :param country_calling_code: The part of the phone number denoting country calling code or its part
+    :param formatted_phone_number: The phone number without country calling code formatted accordingly to local rules. Expected digits are returned as '-', but even more digits might be entered by the user
+    :param is_anonymous: True, if the phone number was bought at https://fragment.com and isn't tied to a SIM card. Information about the phone number can be received using getCollectibleItemInfo
+    """
+
+    _type: "str" = field(default="phoneNumberInfo", init=False, repr=False)
+    country: "CountryInfo | None" = None
+    country_calling_code: "str" = ""
+    formatted_phone_number: "str" = ""
+    is_anonymous: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "country": self.country._to_json_dict() if self.country is not None else None,
+            "country_calling_code": self.country_calling_code,
+            "formatted_phone_number": self.formatted_phone_number,
+            "is_anonymous": self.is_anonymous,
+        }
+
+@dataclass(slots=True)
+class CollectibleItemType(ObjectBase):
+    """
+    Describes a collectible item that can be purchased at https://fragment.com
+
+    """
+
+    _type: "str" = field(default="CollectibleItemType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CollectibleItemTypeUsername(CollectibleItemType):
+    """
+    A username
+
+    :param username: The username
+    """
+
+    _type: "str" = field(default="collectibleItemTypeUsername", init=False, repr=False)
+    username: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "username": self.username,
+        }
+
+@dataclass(slots=True)
+class CollectibleItemTypePhoneNumber(CollectibleItemType):
+    """
+    A phone number
+
+    :param phone_number: The phone number
+    """
+
+    _type: "str" = field(default="collectibleItemTypePhoneNumber", init=False, repr=False)
+    phone_number: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "phone_number": self.phone_number,
+        }
+
+@dataclass(slots=True)
+class CollectibleItemInfo(ObjectBase):
+    """
+    Contains information about a collectible item and its last purchase
+
+    :param purchase_date: Point in time (Unix timestamp) when the item was purchased
+    :param currency: Currency for the paid amount
+    :param amount: The paid amount, in the smallest units of the currency
+    :param cryptocurrency: Cryptocurrency used to pay for the item
+    :param cryptocurrency_amount: The paid amount, in the smallest units of the cryptocurrency
+    :param url: Individual URL for the item on https://fragment.com
+    """
+
+    _type: "str" = field(default="collectibleItemInfo", init=False, repr=False)
+    purchase_date: "int" = 0
+    currency: "str" = ""
+    amount: "int" = 0
+    cryptocurrency: "str" = ""
+    cryptocurrency_amount: "int" = 0
+    url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "purchase_date": self.purchase_date,
+            "currency": self.currency,
+            "amount": self.amount,
+            "cryptocurrency": self.cryptocurrency,
+            "cryptocurrency_amount": self.cryptocurrency_amount,
+            "url": self.url,
+        }
+
+@dataclass(slots=True)
+class BankCardActionOpenUrl(ObjectBase):
+    """
+    Describes an action associated with a bank card number
+
+    :param text: Action text
+    :param url: The URL to be opened
+    """
+
+    _type: "str" = field(default="bankCardActionOpenUrl", init=False, repr=False)
+    text: "str" = ""
+    url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text,
+            "url": self.url,
+        }
+
+@dataclass(slots=True)
+class BankCardInfo(ObjectBase):
+    """
+    Information about a bank card
+
+    :param title: Title of the bank card description
+    :param actions: Actions that can be done with the bank card number
+    """
+
+    _type: "str" = field(default="bankCardInfo", init=False, repr=False)
+    title: "str" = ""
+    actions: "list[BankCardActionOpenUrl] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "title": self.title,
+            "actions": _list_to_json(self.actions),
+        }
+
+@dataclass(slots=True)
+class Address(ObjectBase):
+    """
+    Describes an address
+
+    :param country_code: A two-letter ISO 3166-1 alpha-2 country code
+    :param state: State, if applicable
+    :param city: City
+    :param street_line1: First line of the address
+    :param street_line2: Second line of the address
+    :param postal_code: Address postal code
+    """
+
+    _type: "str" = field(default="address", init=False, repr=False)
+    country_code: "str" = ""
+    state: "str" = ""
+    city: "str" = ""
+    street_line1: "str" = ""
+    street_line2: "str" = ""
+    postal_code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "country_code": self.country_code,
+            "state": self.state,
+            "city": self.city,
+            "street_line1": self.street_line1,
+            "street_line2": self.street_line2,
+            "postal_code": self.postal_code,
+        }
+
+@dataclass(slots=True)
+class LocationAddress(ObjectBase):
+    """
+    Describes an address of a location
+
+    :param country_code: A two-letter ISO 3166-1 alpha-2 country code
+    :param state: State, if applicable; empty if unknown
+    :param city: City; empty if unknown
+    :param street: The address; empty if unknown
+    """
+
+    _type: "str" = field(default="locationAddress", init=False, repr=False)
+    country_code: "str" = ""
+    state: "str" = ""
+    city: "str" = ""
+    street: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "country_code": self.country_code,
+            "state": self.state,
+            "city": self.city,
+            "street": self.street,
+        }
+
+@dataclass(slots=True)
+class LabeledPricePart(ObjectBase):
+    """
+    Portion of the price of a product (e.g., "delivery cost", "tax amount")
+
+    :param label: Label for this portion of the product price
+    :param amount: Currency amount in the smallest units of the currency
+    """
+
+    _type: "str" = field(default="labeledPricePart", init=False, repr=False)
+    label: "str" = ""
+    amount: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "label": self.label,
+            "amount": self.amount,
+        }
+
+@dataclass(slots=True)
+class Invoice(ObjectBase):
+    """
+    Product invoice
+
+    :param currency: ISO 4217 currency code
+    :param price_parts: A list of objects used to calculate the total price of the product
+    :param subscription_period: The number of seconds between consecutive Telegram Star debiting for subscription invoices; 0 if the invoice doesn't create subscription
+    :param max_tip_amount: The maximum allowed amount of tip in the smallest units of the currency
+    :param suggested_tip_amounts: Suggested amounts of tip in the smallest units of the currency
+    :param recurring_payment_terms_of_service_url: An HTTP URL with terms of service for recurring payments. If non-empty, the invoice payment will result in recurring payments and the user must accept the terms of service before allowed to pay
+    :param terms_of_service_url: An HTTP URL with terms of service for non-recurring payments. If non-empty, then the user must accept the terms of service before allowed to pay
+    :param is_test: True, if the payment is a test payment
+    :param need_name: True, if the user's name is needed for payment
+    :param need_phone_number: True, if the user's phone number is needed for payment
+    :param need_email_address: True, if the user's email address is needed for payment
+    :param need_shipping_address: True, if the user's shipping address is needed for payment
+    :param send_phone_number_to_provider: True, if the user's phone number will be sent to the provider
+    :param send_email_address_to_provider: True, if the user's email address will be sent to the provider
+    :param is_flexible: True, if the total price depends on the shipping method
+    """
+
+    _type: "str" = field(default="invoice", init=False, repr=False)
+    currency: "str" = ""
+    price_parts: "list[LabeledPricePart] | None" = None
+    subscription_period: "int" = 0
+    max_tip_amount: "int" = 0
+    suggested_tip_amounts: "list[int] | None" = None
+    recurring_payment_terms_of_service_url: "str" = ""
+    terms_of_service_url: "str" = ""
+    is_test: "bool" = False
+    need_name: "bool" = False
+    need_phone_number: "bool" = False
+    need_email_address: "bool" = False
+    need_shipping_address: "bool" = False
+    send_phone_number_to_provider: "bool" = False
+    send_email_address_to_provider: "bool" = False
+    is_flexible: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "currency": self.currency,
+            "price_parts": _list_to_json(self.price_parts),
+            "subscription_period": self.subscription_period,
+            "max_tip_amount": self.max_tip_amount,
+            "suggested_tip_amounts": self.suggested_tip_amounts,
+            "recurring_payment_terms_of_service_url": self.recurring_payment_terms_of_service_url,
+            "terms_of_service_url": self.terms_of_service_url,
+            "is_test": self.is_test,
+            "need_name": self.need_name,
+            "need_phone_number": self.need_phone_number,
+            "need_email_address": self.need_email_address,
+            "need_shipping_address": self.need_shipping_address,
+            "send_phone_number_to_provider": self.send_phone_number_to_provider,
+            "send_email_address_to_provider": self.send_email_address_to_provider,
+            "is_flexible": self.is_flexible,
+        }
+
+@dataclass(slots=True)
+class OrderInfo(ObjectBase):
+    """
+    Order information
+
+    :param name: Name of the user
+    :param phone_number: Phone number of the user
+    :param email_address: Email address of the user
+    :param shipping_address: Shipping address for this order; may be null
+    """
+
+    _type: "str" = field(default="orderInfo", init=False, repr=False)
+    name: "str" = ""
+    phone_number: "str" = ""
+    email_address: "str" = ""
+    shipping_address: "Address | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name,
+            "phone_number": self.phone_number,
+            "email_address": self.email_address,
+            "shipping_address": self.shipping_address._to_json_dict() if self.shipping_address is not None else None,
+        }
+
+@dataclass(slots=True)
+class ShippingOption(ObjectBase):
+    """
+    One shipping option
+
+    :param id: Shipping option identifier
+    :param title: Option title
+    :param price_parts: A list of objects used to calculate the total shipping costs
+    """
+
+    _type: "str" = field(default="shippingOption", init=False, repr=False)
+    id: "str" = ""
+    title: "str" = ""
+    price_parts: "list[LabeledPricePart] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "title": self.title,
+            "price_parts": _list_to_json(self.price_parts),
+        }
+
+@dataclass(slots=True)
+class SavedCredentials(ObjectBase):
+    """
+    Contains information about saved payment credentials
+
+    :param id: Unique identifier of the saved credentials
+    :param title: Title of the saved credentials
+    """
+
+    _type: "str" = field(default="savedCredentials", init=False, repr=False)
+    id: "str" = ""
+    title: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "title": self.title,
+        }
+
+@dataclass(slots=True)
+class InputCredentials(ObjectBase):
+    """
+    Contains information about the payment method chosen by the user
+
+    """
+
+    _type: "str" = field(default="InputCredentials", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InputCredentialsSaved(InputCredentials):
+    """
+    Applies if a user chooses some previously saved payment credentials. To use their previously saved credentials, the user must have a valid temporary password
+
+    :param saved_credentials_id: Identifier of the saved credentials
+    """
+
+    _type: "str" = field(default="inputCredentialsSaved", init=False, repr=False)
+    saved_credentials_id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "saved_credentials_id": self.saved_credentials_id,
+        }
+
+@dataclass(slots=True)
+class InputCredentialsNew(InputCredentials):
+    """
+    Applies if a user enters new credentials on a payment provider website
+
+    :param data: JSON-encoded data with the credential identifier from the payment provider
+    :param allow_save: True, if the credential identifier can be saved on the server side
+    """
+
+    _type: "str" = field(default="inputCredentialsNew", init=False, repr=False)
+    data: "str" = ""
+    allow_save: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "data": self.data,
+            "allow_save": self.allow_save,
+        }
+
+@dataclass(slots=True)
+class InputCredentialsApplePay(InputCredentials):
+    """
+    Applies if a user enters new credentials using Apple Pay
+
+    :param data: JSON-encoded data with the credential identifier
+    """
+
+    _type: "str" = field(default="inputCredentialsApplePay", init=False, repr=False)
+    data: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "data": self.data,
+        }
+
+@dataclass(slots=True)
+class InputCredentialsGooglePay(InputCredentials):
+    """
+    Applies if a user enters new credentials using Google Pay
+
+    :param data: JSON-encoded data with the credential identifier
+    """
+
+    _type: "str" = field(default="inputCredentialsGooglePay", init=False, repr=False)
+    data: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "data": self.data,
+        }
+
+@dataclass(slots=True)
+class PaymentProvider(ObjectBase):
+    """
+    Contains information about a payment provider
+
+    """
+
+    _type: "str" = field(default="PaymentProvider", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PaymentProviderSmartGlocal(PaymentProvider):
+    """
+    Smart Glocal payment provider
+
+    :param public_token: Public payment token
+    :param tokenize_url: URL for sending card tokenization requests
+    """
+
+    _type: "str" = field(default="paymentProviderSmartGlocal", init=False, repr=False)
+    public_token: "str" = ""
+    tokenize_url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "public_token": self.public_token,
+            "tokenize_url": self.tokenize_url,
+        }
+
+@dataclass(slots=True)
+class PaymentProviderStripe(PaymentProvider):
+    """
+    Stripe payment provider
+
+    :param publishable_key: Stripe API publishable key
+    :param need_country: True, if the user country must be provided
+    :param need_postal_code: True, if the user ZIP/postal code must be provided
+    :param need_cardholder_name: True, if the cardholder name must be provided
+    """
+
+    _type: "str" = field(default="paymentProviderStripe", init=False, repr=False)
+    publishable_key: "str" = ""
+    need_country: "bool" = False
+    need_postal_code: "bool" = False
+    need_cardholder_name: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "publishable_key": self.publishable_key,
+            "need_country": self.need_country,
+            "need_postal_code": self.need_postal_code,
+            "need_cardholder_name": self.need_cardholder_name,
+        }
+
+@dataclass(slots=True)
+class PaymentProviderOther(PaymentProvider):
+    """
+    Some other payment provider, for which a web payment form must be shown
+
+    :param url: Payment form URL
+    """
+
+    _type: "str" = field(default="paymentProviderOther", init=False, repr=False)
+    url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+        }
+
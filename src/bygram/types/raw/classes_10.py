@@ -0,0 +1,1332 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import File, InputFile, Minithumbnail
+    from .classes_01 import Photo, Video
+    from .classes_02 import StarSubscriptionPricing
+    from .classes_03 import ProductInfo
+    from .classes_09 import Address, Invoice, OrderInfo, PaymentProvider, SavedCredentials, ShippingOption
+    from .classes_18 import TelegramPaymentPurpose
+
+@dataclass(slots=True)
+class PaymentOption(ObjectBase):
+    """
+    Describes an additional payment option
+
+    :param title: Title for the payment option
+    :param url: Payment form URL to be opened in a web view
+    """
+
+    _type: "str" = field(default="paymentOption", init=False, repr=False)
+    title: "str" = ""
+    url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "title": self.title,
+            "url": self.url,
+        }
+
+@dataclass(slots=True)
+class PaymentFormType(ObjectBase):
+    """
+    Describes type of payment form
+
+    """
+
+    _type: "str" = field(default="PaymentFormType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PaymentFormTypeRegular(PaymentFormType):
+    """
+    The payment form is for a regular payment
+
+    :param invoice: Full information about the invoice
+    :param payment_provider_user_id: User identifier of the payment provider bot
+    :param payment_provider: Information about the payment provider
+    :param additional_payment_options: The list of additional payment options
+    :param saved_order_info: Saved server-side order information; may be null
+    :param saved_credentials: The list of saved payment credentials
+    :param can_save_credentials: True, if the user can choose to save credentials
+    :param need_password: True, if the user will be able to save credentials, if sets up a 2-step verification password
+    """
+
+    _type: "str" = field(default="paymentFormTypeRegular", init=False, repr=False)
+    invoice: "Invoice | None" = None
+    payment_provider_user_id: "int" = 0
+    payment_provider: "PaymentProvider | None" = None
+    additional_payment_options: "list[PaymentOption] | None" = None
+    saved_order_info: "OrderInfo | None" = None
+    saved_credentials: "list[SavedCredentials] | None" = None
+    can_save_credentials: "bool" = False
+    need_password: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "invoice": self.invoice._to_json_dict() if self.invoice is not None else None,
+            "payment_provider_user_id": self.payment_provider_user_id,
+            "payment_provider": self.payment_provider._to_json_dict() if self.payment_provider is not None else None,
+            "additional_payment_options": _list_to_json(self.additional_payment_options),
+            "saved_order_info": self.saved_order_info._to_json_dict() if self.saved_order_info is not None else None,
+            "saved_credentials": _list_to_json(self.saved_credentials),
+            "can_save_credentials": self.can_save_credentials,
+            "need_password": self.need_password,
+        }
+
+@dataclass(slots=True)
+class PaymentFormTypeStars(PaymentFormType):
+    """
+    The payment form is for a payment in Telegram Stars
+
+    :param star_count: Number of Telegram Stars that will be paid
+    """
+
+    _type: "str" = field(default="paymentFormTypeStars", init=False, repr=False)
+    star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "star_count": self.star_count,
+        }
+
+@dataclass(slots=True)
+class PaymentFormTypeStarSubscription(PaymentFormType):
+    """
+    The payment form is for a payment in Telegram Stars for subscription
+
+    :param pricing: Information about subscription plan
+    """
+
+    _type: "str" = field(default="paymentFormTypeStarSubscription", init=False, repr=False)
+    pricing: "StarSubscriptionPricing | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "pricing": self.pricing._to_json_dict() if self.pricing is not None else None,
+        }
+
+@dataclass(slots=True)
+class PaymentForm(ObjectBase):
+    """
+    Contains information about an invoice payment form
+
+    :param id: The payment form identifier
+    :param type: Type of the payment form
+    :param seller_bot_user_id: User identifier of the seller bot
+    :param product_info: Information about the product
+    """
+
+    _type: "str" = field(default="paymentForm", init=False, repr=False)
+    id: "int" = 0
+    type: "PaymentFormType | None" = None
+    seller_bot_user_id: "int" = 0
+    product_info: "ProductInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "seller_bot_user_id": self.seller_bot_user_id,
+            "product_info": self.product_info._to_json_dict() if self.product_info is not None else None,
+        }
+
+@dataclass(slots=True)
+class ValidatedOrderInfo(ObjectBase):
+    """
+    Contains a temporary identifier of validated order information, which is stored for one hour, and the available shipping options
+
+    :param order_info_id: Temporary identifier of the order information
+    :param shipping_options: Available shipping options
+    """
+
+    _type: "str" = field(default="validatedOrderInfo", init=False, repr=False)
+    order_info_id: "str" = ""
+    shipping_options: "list[ShippingOption] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "order_info_id": self.order_info_id,
+            "shipping_options": _list_to_json(self.shipping_options),
+        }
+
+@dataclass(slots=True)
+class PaymentResult(ObjectBase):
+    """
+    Contains the result of a payment request
+
+    :param success: True, if the payment request was successful; otherwise, the verification_url will be non-empty
+    :param verification_url: URL for additional payment credentials verification
+    """
+
+    _type: "str" = field(default="paymentResult", init=False, repr=False)
+    success: "bool" = False
+    verification_url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "success": self.success,
+            "verification_url": self.verification_url,
+        }
+
+@dataclass(slots=True)
+class PaymentReceiptType(ObjectBase):
+    """
+    Describes type of successful payment
+
+    """
+
+    _type: "str" = field(default="PaymentReceiptType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PaymentReceiptTypeRegular(PaymentReceiptType):
+    """
+    The payment was done using a third-party payment provider
+
+    :param payment_provider_user_id: User identifier of the payment provider bot
+    :param invoice: Information about the invoice
+    :param order_info: Order information; may be null
+    :param shipping_option: Chosen shipping option; may be null
+    :param credentials_title: Title of the saved credentials chosen by the buyer
+    :param tip_amount: The amount of tip chosen by the buyer in the smallest units of the currency
+    """
+
+    _type: "str" = field(default="paymentReceiptTypeRegular", init=False, repr=False)
+    payment_provider_user_id: "int" = 0
+    invoice: "Invoice | None" = None
+    order_info: "OrderInfo | None" = None
+    shipping_option: "ShippingOption | None" = None
+    credentials_title: "str" = ""
+    tip_amount: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "payment_provider_user_id": self.payment_provider_user_id,
+            "invoice": self.invoice._to_json_dict() if self.invoice is not None else None,
+            "order_info": self.order_info._to_json_dict() if self.order_info is not None else None,
+            "shipping_option": self.shipping_option._to_json_dict() if self.shipping_option is not None else None,
+            "credentials_title": self.credentials_title,
+            "tip_amount": self.tip_amount,
+        }
+
+@dataclass(slots=True)
+class PaymentReceiptTypeStars(PaymentReceiptType):
+    """
+    The payment was done using Telegram Stars
+
+    :param star_count: Number of Telegram Stars that were paid
+    :param transaction_id: Unique identifier of the transaction that can be used to dispute it
+    """
+
+    _type: "str" = field(default="paymentReceiptTypeStars", init=False, repr=False)
+    star_count: "int" = 0
+    transaction_id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "star_count": self.star_count,
+            "transaction_id": self.transaction_id,
+        }
+
+@dataclass(slots=True)
+class PaymentReceipt(ObjectBase):
+    """
+    Contains information about a successful payment
+
+    :param product_info: Information about the product
+    :param date: Point in time (Unix timestamp) when the payment was made
+    :param seller_bot_user_id: User identifier of the seller bot
+    :param type: Type of the payment receipt
+    """
+
+    _type: "str" = field(default="paymentReceipt", init=False, repr=False)
+    product_info: "ProductInfo | None" = None
+    date: "int" = 0
+    seller_bot_user_id: "int" = 0
+    type: "PaymentReceiptType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "product_info": self.product_info._to_json_dict() if self.product_info is not None else None,
+            "date": self.date,
+            "seller_bot_user_id": self.seller_bot_user_id,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputInvoice(ObjectBase):
+    """
+    Describes an invoice to process
+
+    """
+
+    _type: "str" = field(default="InputInvoice", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InputInvoiceMessage(InputInvoice):
+    """
+    An invoice from a message of the type messageInvoice or paid media purchase from messagePaidMedia
+
+    :param chat_id: Chat identifier of the message
+    :param message_id: Message identifier. Use messageProperties.can_be_paid to check whether the message can be used in the method
+    """
+
+    _type: "str" = field(default="inputInvoiceMessage", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+@dataclass(slots=True)
+class InputInvoiceName(InputInvoice):
+    """
+    An invoice from a link of the type internalLinkTypeInvoice
+
+    :param name: Name of the invoice
+    """
+
+    _type: "str" = field(default="inputInvoiceName", init=False, repr=False)
+    name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name,
+        }
+
+@dataclass(slots=True)
+class InputInvoiceTelegram(InputInvoice):
+    """
+    An invoice for a payment toward Telegram; must not be used in the in-store apps
+
+    :param purpose: Transaction purpose
+    """
+
+    _type: "str" = field(default="inputInvoiceTelegram", init=False, repr=False)
+    purpose: "TelegramPaymentPurpose | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "purpose": self.purpose._to_json_dict() if self.purpose is not None else None,
+        }
+
+@dataclass(slots=True)
+class PaidMedia(ObjectBase):
+    """
+    Describes a paid media
+
+    """
+
+    _type: "str" = field(default="PaidMedia", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PaidMediaPreview(PaidMedia):
+    """
+    The media is hidden until the invoice is paid
+
+    :param width: Media width; 0 if unknown
+    :param height: Media height; 0 if unknown
+    :param duration: Media duration, in seconds; 0 if unknown
+    :param minithumbnail: Media minithumbnail; may be null
+    """
+
+    _type: "str" = field(default="paidMediaPreview", init=False, repr=False)
+    width: "int" = 0
+    height: "int" = 0
+    duration: "int" = 0
+    minithumbnail: "Minithumbnail | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "width": self.width,
+            "height": self.height,
+            "duration": self.duration,
+            "minithumbnail": self.minithumbnail._to_json_dict() if self.minithumbnail is not None else None,
+        }
+
+@dataclass(slots=True)
+class PaidMediaPhoto(PaidMedia):
+    """
+    The media is a photo
+
+    :param photo: The photo
+    """
+
+    _type: "str" = field(default="paidMediaPhoto", init=False, repr=False)
+    photo: "Photo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+        }
+
+@dataclass(slots=True)
+class PaidMediaVideo(PaidMedia):
+    """
+    The media is a video
+
+    :param video: The video
+    :param cover: Cover of the video; may be null if none
+    :param start_timestamp: Timestamp from which the video playing must start, in seconds
+    """
+
+    _type: "str" = field(default="paidMediaVideo", init=False, repr=False)
+    video: "Video | None" = None
+    cover: "Photo | None" = None
+    start_timestamp: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "video": self.video._to_json_dict() if self.video is not None else None,
+            "cover": self.cover._to_json_dict() if self.cover is not None else None,
+            "start_timestamp": self.start_timestamp,
+        }
+
+@dataclass(slots=True)
+class PaidMediaUnsupported(PaidMedia):
+    """
+    The media is unsupported
+
+    """
+
+    _type: "str" = field(default="paidMediaUnsupported", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class GiveawayParameters(ObjectBase):
+    """
+    Describes parameters of a giveaway
+
+    :param boosted_chat_id: Identifier of the supergroup or channel chat, which will be automatically boosted by the winners of the giveaway for duration of the Telegram Premium subscription,
+     or for the specified time. If the chat is a channel, then can_post_messages administrator right is required in the channel, otherwise, the user must be an administrator in the supergroup
+    :param additional_chat_ids: Identifiers of other supergroup or channel chats that must be subscribed by the users to be eligible for the giveaway. There can be up to getOption("giveaway_additional_chat_count_max") additional chats
+    :param winners_selection_date: Point in time (Unix timestamp) when the giveaway is expected to be performed; must be 60-getOption("giveaway_duration_max") seconds in the future in scheduled giveaways
+    :param only_new_members: True, if only new members of the chats will be eligible for the giveaway
+    :param has_public_winners: True, if the list of winners of the giveaway will be available to everyone
+    :param country_codes: The list of two-letter ISO 3166-1 alpha-2 codes of countries, users from which will be eligible for the giveaway. If empty, then all users can participate in the giveaway.
+     There can be up to getOption("giveaway_country_count_max") chosen countries. Users with phone number that was bought at https://fragment.com can participate in any giveaway and the country code "FT" must not be specified in the list
+    :param prize_description: Additional description of the giveaway prize; 0-128 characters
+    """
+
+    _type: "str" = field(default="giveawayParameters", init=False, repr=False)
+    boosted_chat_id: "int" = 0
+    additional_chat_ids: "list[int] | None" = None
+    winners_selection_date: "int" = 0
+    only_new_members: "bool" = False
+    has_public_winners: "bool" = False
+    country_codes: "list[str] | None" = None
+    prize_description: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "boosted_chat_id": self.boosted_chat_id,
+            "additional_chat_ids": self.additional_chat_ids,
+            "winners_selection_date": self.winners_selection_date,
+            "only_new_members": self.only_new_members,
+            "has_public_winners": self.has_public_winners,
+            "country_codes": self.country_codes,
+            "prize_description": self.prize_description,
+        }
+
+@dataclass(slots=True)
+class DatedFile(ObjectBase):
+    """
+    File with the date it was uploaded
+
+    :param file: The file
+    :param date: Point in time (Unix timestamp) when the file was uploaded
+    """
+
+    _type: "str" = field(default="datedFile", init=False, repr=False)
+    file: "File | None" = None
+    date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file": self.file._to_json_dict() if self.file is not None else None,
+            "date": self.date,
+        }
+
+@dataclass(slots=True)
+class PassportElementType(ObjectBase):
+    """
+    Contains the type of Telegram Passport element
+
+    """
+
+    _type: "str" = field(default="PassportElementType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PassportElementTypePersonalDetails(PassportElementType):
+    """
+    A Telegram Passport element containing the user's personal details
+
+    """
+
+    _type: "str" = field(default="passportElementTypePersonalDetails", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PassportElementTypePassport(PassportElementType):
+    """
+    A Telegram Passport element containing the user's passport
+
+    """
+
+    _type: "str" = field(default="passportElementTypePassport", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PassportElementTypeDriverLicense(PassportElementType):
+    """
+    A Telegram Passport element containing the user's driver license
+
+    """
+
+    _type: "str" = field(default="passportElementTypeDriverLicense", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PassportElementTypeIdentityCard(PassportElementType):
+    """
+    A Telegram Passport element containing the user's identity card
+
+    """
+
+    _type: "str" = field(default="passportElementTypeIdentityCard", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PassportElementTypeInternalPassport(PassportElementType):
+    """
+    A Telegram Passport element containing the user's internal passport
+
+    """
+
+    _type: "str" = field(default="passportElementTypeInternalPassport", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PassportElementTypeAddress(PassportElementType):
+    """
+    A Telegram Passport element containing the user's address
+
+    """
+
+    _type: "str" = field(default="passportElementTypeAddress", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PassportElementTypeUtilityBill(PassportElementType):
+    """
+    A Telegram Passport element containing the user's utility bill
+
+    """
+
+    _type: "str" = field(default="passportElementTypeUtilityBill", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PassportElementTypeBankStatement(PassportElementType):
+    """
+    A Telegram Passport element containing the user's bank statement
+
+    """
+
+    _type: "str" = field(default="passportElementTypeBankStatement", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PassportElementTypeRentalAgreement(PassportElementType):
+    """
+    A Telegram Passport element containing the user's rental agreement
+
+    """
+
+    _type: "str" = field(default="passportElementTypeRentalAgreement", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PassportElementTypePassportRegistration(PassportElementType):
+    """
+    A Telegram Passport element containing the registration page of the user's passport
+
+    """
+
+    _type: "str" = field(default="passportElementTypePassportRegistration", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PassportElementTypeTemporaryRegistration(PassportElementType):
+    """
+    A Telegram Passport element containing the user's temporary registration
+
+    """
+
+    _type: "str" = field(default="passportElementTypeTemporaryRegistration", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PassportElementTypePhoneNumber(PassportElementType):
+    """
+    A Telegram Passport element containing the user's phone number
+
+    """
+
+    _type: "str" = field(default="passportElementTypePhoneNumber", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PassportElementTypeEmailAddress(PassportElementType):
+    """
+    A Telegram Passport element containing the user's email address
+
+    """
+
+    _type: "str" = field(default="passportElementTypeEmailAddress", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class Date(ObjectBase):
+    """
+    Represents a date according to the Gregorian calendar
+
+    :param day: Day of the month; 1-31
+    :param month: Month; 1-12
+    :param year: Year; 1-9999
+    """
+
+    _type: "str" = field(default="date", init=False, repr=False)
+    day: "int" = 0
+    month: "int" = 0
+    year: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "day": self.day,
+            "month": self.month,
+            "year": self.year,
+        }
+
+@dataclass(slots=True)
+class PersonalDetails(ObjectBase):
+    """
+    Contains the user's personal details
+
+    :param first_name: First name of the user written in English; 1-255 characters
+    :param middle_name: Middle name of the user written in English; 0-255 characters
+    :param last_name: Last name of the user written in English; 1-255 characters
+    :param native_first_name: Native first name of the user; 1-255 characters
+    :param native_middle_name: Native middle name of the user; 0-255 characters
+    :param native_last_name: Native last name of the user; 1-255 characters
+    :param birthdate: Birthdate of the user
+    :param gender: Gender of the user, "male" or "female"
+    :param country_code: A two-letter ISO 3166-1 alpha-2 country code of the user's country
+    :param residence_country_code: A two-letter ISO 3166-1 alpha-2 country code of the user's residence country
+    """
+
+    _type: "str" = field(default="personalDetails", init=False, repr=False)
+    first_name: "str" = ""
+    middle_name: "str" = ""
+    last_name: "str" = ""
+    native_first_name: "str" = ""
+    native_middle_name: "str" = ""
+    native_last_name: "str" = ""
+    birthdate: "Date | None" = None
+    gender: "str" = ""
+    country_code: "str" = ""
+    residence_country_code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "first_name": self.first_name,
+            "middle_name": self.middle_name,
+            "last_name": self.last_name,
+            "native_first_name": self.native_first_name,
+            "native_middle_name": self.native_middle_name,
+            "native_last_name": self.native_last_name,
+            "birthdate": self.birthdate._to_json_dict() if self.birthdate is not None else None,
+            "gender": self.gender,
+            "country_code": self.country_code,
+            "residence_country_code": self.residence_country_code,
+        }
+
+@dataclass(slots=True)
+class IdentityDocument(ObjectBase):
+    """
+    An identity document
+
+    :param number: Document number; 1-24 characters
+    :param expiration_date: Document expiration date; may be null if not applicable
+    :param front_side: Front side of the document
+    :param reverse_side: Reverse side of the document; only for driver license and identity card; may be null
+    :param selfie: Selfie with the document; may be null
+    :param translation: List of files containing a certified English translation of the document
+    """
+
+    _type: "str" = field(default="identityDocument", init=False, repr=False)
+    number: "str" = ""
+    expiration_date: "Date | None" = None
+    front_side: "DatedFile | None" = None
+    reverse_side: "DatedFile | None" = None
+    selfie: "DatedFile | None" = None
+    translation: "list[DatedFile] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "number": self.number,
+            "expiration_date": self.expiration_date._to_json_dict() if self.expiration_date is not None else None,
+            "front_side": self.front_side._to_json_dict() if self.front_side is not None else None,
+            "reverse_side": self.reverse_side._to_json_dict() if self.reverse_side is not None else None,
+            "selfie": self.selfie._to_json_dict() if self.selfie is not None else None,
+            "translation": _list_to_json(self.translation),
+        }
+
+@dataclass(slots=True)
+class InputIdentityDocument(ObjectBase):
+    """
+    An identity document to be saved to Telegram Passport
+
+    :param number: Document number; 1-24 characters
+    :param expiration_date: Document expiration date; pass null if not applicable
+    :param front_side: Front side of the document
+    :param reverse_side: Reverse side of the document; only for driver license and identity card; pass null otherwise
+    :param selfie: Selfie with the document; pass null if unavailable
+    :param translation: List of files containing a certified English translation of the document
+    """
+
+    _type: "str" = field(default="inputIdentityDocument", init=False, repr=False)
+    number: "str" = ""
+    expiration_date: "Date | None" = None
+    front_side: "InputFile | None" = None
+    reverse_side: "InputFile | None" = None
+    selfie: "InputFile | None" = None
+    translation: "list[InputFile] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "number": self.number,
+            "expiration_date": self.expiration_date._to_json_dict() if self.expiration_date is not None else None,
+            "front_side": self.front_side._to_json_dict() if self.front_side is not None else None,
+            "reverse_side": self.reverse_side._to_json_dict() if self.reverse_side is not None else None,
+            "selfie": self.selfie._to_json_dict() if self.selfie is not None else None,
+            "translation": _list_to_json(self.translation),
+        }
+
+@dataclass(slots=True)
+class PersonalDocument(ObjectBase):
+    """
+    A personal document, containing some information about a user
+
+    :param files: List of files containing the pages of the document
+    :param translation: List of files containing a certified English translation of the document
+    """
+
+    _type: "str" = field(default="personalDocument", init=False, repr=False)
+    files: "list[DatedFile] | None" = None
+    translation: "list[DatedFile] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "files": _list_to_json(self.files),
+            "translation": _list_to_json(self.translation),
+        }
+
+@dataclass(slots=True)
+class InputPersonalDocument(ObjectBase):
+    """
+    A personal document to be saved to Telegram Passport
+
+    :param files: List of files containing the pages of the document
+    :param translation: List of files containing a certified English translation of the document
+    """
+
+    _type: "str" = field(default="inputPersonalDocument", init=False, repr=False)
+    files: "list[InputFile] | None" = None
+    translation: "list[InputFile] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "files": _list_to_json(self.files),
+            "translation": _list_to_json(self.translation),
+        }
+
+@dataclass(slots=True)
+class PassportElement(ObjectBase):
+    """
+    Contains information about a Telegram Passport element
+
+    """
+
+    _type: "str" = field(default="PassportElement", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PassportElementPersonalDetails(PassportElement):
+    """
+    A Telegram Passport element containing the user's personal details
+
+    :param personal_details: Personal details of the user
+    """
+
+    _type: "str" = field(default="passportElementPersonalDetails", init=False, repr=False)
+    personal_details: "PersonalDetails | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "personal_details": self.personal_details._to_json_dict() if self.personal_details is not None else None,
+        }
+
+@dataclass(slots=True)
+class PassportElementPassport(PassportElement):
+    """
+    A Telegram Passport element containing the user's passport
+
+    :param passport: Passport
+    """
+
+    _type: "str" = field(default="passportElementPassport", init=False, repr=False)
+    passport: "IdentityDocument | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "passport": self.passport._to_json_dict() if self.passport is not None else None,
+        }
+
+@dataclass(slots=True)
+class PassportElementDriverLicense(PassportElement):
+    """
+    A Telegram Passport element containing the user's driver license
+
+    :param driver_license: Driver license
+    """
+
+    _type: "str" = field(default="passportElementDriverLicense", init=False, repr=False)
+    driver_license: "IdentityDocument | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "driver_license": self.driver_license._to_json_dict() if self.driver_license is not None else None,
+        }
+
+@dataclass(slots=True)
+class PassportElementIdentityCard(PassportElement):
+    """
+    A Telegram Passport element containing the user's identity card
+
+    :param identity_card: Identity card
+    """
+
+    _type: "str" = field(default="passportElementIdentityCard", init=False, repr=False)
+    identity_card: "IdentityDocument | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "identity_card": self.identity_card._to_json_dict() if self.identity_card is not None else None,
+        }
+
+@dataclass(slots=True)
+class PassportElementInternalPassport(PassportElement):
+    """
+    A Telegram Passport element containing the user's internal passport
+
+    :param internal_passport: Internal passport
+    """
+
+    _type: "str" = field(default="passportElementInternalPassport", init=False, repr=False)
+    internal_passport: "IdentityDocument | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "internal_passport": self.internal_passport._to_json_dict() if self.internal_passport is not None else None,
+        }
+
+@dataclass(slots=True)
+class PassportElementAddress(PassportElement):
+    """
+    A Telegram Passport element containing the user's address
+
+    :param address: Address
+    """
+
+    _type: "str" = field(default="passportElementAddress", init=False, repr=False)
+    address: "Address | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "address": self.address._to_json_dict() if self.address is not None else None,
+        }
+
+@dataclass(slots=True)
+class PassportElementUtilityBill(PassportElement):
+    """
+    A Telegram Passport element containing the user's utility bill
+
+    :param utility_bill: Utility bill
+    """
+
+    _type: "str" = field(default="passportElementUtilityBill", init=False, repr=False)
+    utility_bill: "PersonalDocument | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "utility_bill": self.utility_bill._to_json_dict() if self.utility_bill is not None else None,
+        }
+
+@dataclass(slots=True)
+class PassportElementBankStatement(PassportElement):
+    """
+    A Telegram Passport element containing the user's bank statement
+
+    :param bank_statement: Bank statement
+    """
+
+    _type: "str" = field(default="passportElementBankStatement", init=False, repr=False)
+    bank_statement: "PersonalDocument | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bank_statement": self.bank_statement._to_json_dict() if self.bank_statement is not None else None,
+        }
+
+@dataclass(slots=True)
+class PassportElementRentalAgreement(PassportElement):
+    """
+    A Telegram Passport element containing the user's rental agreement
+
+    :param rental_agreement: Rental agreement
+    """
+
+    _type: "str" = field(default="passportElementRentalAgreement", init=False, repr=False)
+    rental_agreement: "PersonalDocument | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "rental_agreement": self.rental_agreement._to_json_dict() if self.rental_agreement is not None else None,
+        }
+
+@dataclass(slots=True)
+class PassportElementPassportRegistration(PassportElement):
+    """
+    A Telegram Passport element containing the user's passport registration pages
+
+    :param passport_registration: Passport registration pages
+    """
+
+    _type: "str" = field(default="passportElementPassportRegistration", init=False, repr=False)
+    passport_registration: "PersonalDocument | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "passport_registration": self.passport_registration._to_json_dict() if self.passport_registration is not None else None,
+        }
+
+@dataclass(slots=True)
+class PassportElementTemporaryRegistration(PassportElement):
+    """
+    A Telegram Passport element containing the user's temporary registration
+
+    :param temporary_registration: Temporary registration
+    """
+
+    _type: "str" = field(default="passportElementTemporaryRegistration", init=False, repr=False)
+    temporary_registration: "PersonalDocument | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "temporary_registration": self.temporary_registration._to_json_dict() if self.temporary_registration is not None else None,
+        }
+
+@dataclass(slots=True)
+class PassportElementPhoneNumber(PassportElement):
+    """
+    A Telegram Passport element containing the user's phone number
+
+    :param phone_number: Phone number
+    """
+
+    _type: "str" = field(default="passportElementPhoneNumber", init=False, repr=False)
+    phone_number: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "phone_number": self.phone_number,
+        }
+
+@dataclass(slots=True)
+class PassportElementEmailAddress(PassportElement):
+    """
+    A Telegram Passport element containing the user's email address
+
+    :param email_address: Email address
+    """
+
+    _type: "str" = field(default="passportElementEmailAddress", init=False, repr=False)
+    email_address: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "email_address": self.email_address,
+        }
+
+@dataclass(slots=True)
+class InputPassportElement(ObjectBase):
+    """
+    Contains information about a Telegram Passport element to be saved
+
+    """
+
+    _type: "str" = field(default="InputPassportElement", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InputPassportElementPersonalDetails(InputPassportElement):
+    """
+    A Telegram Passport element to be saved containing the user's personal details
+
+    :param personal_details: Personal details of the user
+    """
+
+    _type: "str" = field(default="inputPassportElementPersonalDetails", init=False, repr=False)
+    personal_details: "PersonalDetails | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "personal_details": self.personal_details._to_json_dict() if self.personal_details is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputPassportElementPassport(InputPassportElement):
+    """
+    A Telegram Passport element to be saved containing the user's passport
+
+    :param passport: The passport to be saved
+    """
+
+    _type: "str" = field(default="inputPassportElementPassport", init=False, repr=False)
+    passport: "InputIdentityDocument | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "passport": self.passport._to_json_dict() if self.passport is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputPassportElementDriverLicense(InputPassportElement):
+    """
+    A Telegram Passport element to be saved containing the user's driver license
+
+    :param driver_license: The driver license to be saved
+    """
+
+    _type: "str" = field(default="inputPassportElementDriverLicense", init=False, repr=False)
+    driver_license: "InputIdentityDocument | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "driver_license": self.driver_license._to_json_dict() if self.driver_license is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputPassportElementIdentityCard(InputPassportElement):
+    """
+    A Telegram Passport element to be saved containing the user's identity card
+
+    :param identity_card: The identity card to be saved
+    """
+
+    _type: "str" = field(default="inputPassportElementIdentityCard", init=False, repr=False)
+    identity_card: "InputIdentityDocument | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "identity_card": self.identity_card._to_json_dict() if self.identity_card is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputPassportElementInternalPassport(InputPassportElement):
+    """
+    A Telegram Passport element to be saved containing the user's internal passport
+
+    :param internal_passport: The internal passport to be saved
+    """
+
+    _type: "str" = field(default="inputPassportElementInternalPassport", init=False, repr=False)
+    internal_passport: "InputIdentityDocument | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "internal_passport": self.internal_passport._to_json_dict() if self.internal_passport is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputPassportElementAddress(InputPassportElement):
+    """
+    A Telegram Passport element to be saved containing the user's address
+
+    :param address: The address to be saved
+    """
+
+    _type: "str" = field(default="inputPassportElementAddress", init=False, repr=False)
+    address: "Address | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "address": self.address._to_json_dict() if self.address is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputPassportElementUtilityBill(InputPassportElement):
+    """
+    A Telegram Passport element to be saved containing the user's utility bill
+
+    :param utility_bill: The utility bill to be saved
+    """
+
+    _type: "str" = field(default="inputPassportElementUtilityBill", init=False, repr=False)
+    utility_bill: "InputPersonalDocument | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "utility_bill": self.utility_bill._to_json_dict() if self.utility_bill is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputPassportElementBankStatement(InputPassportElement):
+    """
+    A Telegram Passport element to be saved containing the user's bank statement
+
+    :param bank_statement: The bank statement to be saved
+    """
+
+    _type: "str" = field(default="inputPassportElementBankStatement", init=False, repr=False)
+    bank_statement: "InputPersonalDocument | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bank_statement": self.bank_statement._to_json_dict() if self.bank_statement is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputPassportElementRentalAgreement(InputPassportElement):
+    """
+    A Telegram Passport element to be saved containing the user's rental agreement
+
+    :param rental_agreement: The rental agreement to be saved
+    """
+
+    _type: "str" = field(default="inputPassportElementRentalAgreement", init=False, repr=False)
+    rental_agreement: "InputPersonalDocument | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "rental_agreement": self.rental_agreement._to_json_dict() if self.rental_agreement is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputPassportElementPassportRegistration(InputPassportElement):
+    """
+    A Telegram Passport element to be saved containing the user's passport registration
+
+    :param passport_registration: The passport registration page to be saved
+    """
+
+    _type: "str" = field(default="inputPassportElementPassportRegistration", init=False, repr=False)
+    passport_registration: "InputPersonalDocument | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "passport_registration": self.passport_registration._to_json_dict() if self.passport_registration is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputPassportElementTemporaryRegistration(InputPassportElement):
+    """
+    A Telegram Passport element to be saved containing the user's temporary registration
+
+    :param temporary_registration: The temporary registration document to be saved
+    """
+
+    _type: "str" = field(default="inputPassportElementTemporaryRegistration", init=False, repr=False)
+    temporary_registration: "InputPersonalDocument | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "temporary_registration": self.temporary_registration._to_json_dict() if self.temporary_registration is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputPassportElementPhoneNumber(InputPassportElement):
+    """
+    A Telegram Passport element to be saved containing the user's phone number
+
+    :param phone_number: The phone number to be saved
+    """
+
+    _type: "str" = field(default="inputPassportElementPhoneNumber", init=False, repr=False)
+    phone_number: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "phone_number": self.phone_number,
+        }
+
+@dataclass(slots=True)
+class InputPassportElementEmailAddress(InputPassportElement):
+    """
+    A Telegram Passport element to be saved containing the user's email address
+
+    :param email_address: The email address to be saved
+    """
+
+    _type: "str" = field(default="inputPassportElementEmailAddress", init=False, repr=False)
+    email_address: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "email_address": self.email_address,
+        }
+
@@ -0,0 +1,2595 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import FormattedText
+    from .classes_01 import AlternativeVideo, AnimatedEmoji, Animation, Audio, ChatBackground, Checklist, ChecklistTask, Contact, Document, Game, Location, Photo, Poll, Sticker, Venue, Video, VideoNote, VideoStoryboard, VoiceNote
+    from .classes_02 import ChatPhoto, StarAmount, SuggestedPostPrice, SuggestedPostRefundReason
+    from .classes_03 import Gift, ProductInfo, UpgradedGift, UpgradedGiftOrigin
+    from .classes_04 import GiveawayPrize
+    from .classes_05 import MessageSender
+    from .classes_08 import ForumTopicIcon, LinkPreviewOptions, SharedChat, SharedUser
+    from .classes_09 import LinkPreview, OrderInfo
+    from .classes_10 import DatedFile, GiveawayParameters, PaidMedia, PassportElement, PassportElementType
+    from .classes_14 import CallDiscardReason
+    from .classes_15 import DiceStickers
+    from .classes_16 import BotWriteAccessAllowReason
+
+@dataclass(slots=True)
+class PassportElements(ObjectBase):
+    """
+    Contains information about saved Telegram Passport elements
+
+    :param elements: Telegram Passport elements
+    """
+
+    _type: "str" = field(default="passportElements", init=False, repr=False)
+    elements: "list[PassportElement] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "elements": _list_to_json(self.elements),
+        }
+
+@dataclass(slots=True)
+class PassportElementErrorSource(ObjectBase):
+    """
+    Contains the description of an error in a Telegram Passport element
+
+    """
+
+    _type: "str" = field(default="PassportElementErrorSource", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PassportElementErrorSourceUnspecified(PassportElementErrorSource):
+    """
+    The element contains an error in an unspecified place. The error will be considered resolved when new data is added
+
+    """
+
+    _type: "str" = field(default="passportElementErrorSourceUnspecified", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PassportElementErrorSourceDataField(PassportElementErrorSource):
+    """
+    One of the data fields contains an error. The error will be considered resolved when the value of the field changes
+
+    :param field_name: Field name
+    """
+
+    _type: "str" = field(default="passportElementErrorSourceDataField", init=False, repr=False)
+    field_name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "field_name": self.field_name,
+        }
+
+@dataclass(slots=True)
+class PassportElementErrorSourceFrontSide(PassportElementErrorSource):
+    """
+    The front side of the document contains an error. The error will be considered resolved when the file with the front side changes
+
+    """
+
+    _type: "str" = field(default="passportElementErrorSourceFrontSide", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PassportElementErrorSourceReverseSide(PassportElementErrorSource):
+    """
+    The reverse side of the document contains an error. The error will be considered resolved when the file with the reverse side changes
+
+    """
+
+    _type: "str" = field(default="passportElementErrorSourceReverseSide", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PassportElementErrorSourceSelfie(PassportElementErrorSource):
+    """
+    The selfie with the document contains an error. The error will be considered resolved when the file with the selfie changes
+
+    """
+
+    _type: "str" = field(default="passportElementErrorSourceSelfie", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PassportElementErrorSourceTranslationFile(PassportElementErrorSource):
+    """
+    One of files with the translation of the document contains an error. The error will be considered resolved when the file changes
+
+    :param file_index: Index of a file with the error
+    """
+
+    _type: "str" = field(default="passportElementErrorSourceTranslationFile", init=False, repr=False)
+    file_index: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_index": self.file_index,
+        }
+
+@dataclass(slots=True)
+class PassportElementErrorSourceTranslationFiles(PassportElementErrorSource):
+    """
+    The translation of the document contains an error. The error will be considered resolved when the list of translation files changes
+
+    """
+
+    _type: "str" = field(default="passportElementErrorSourceTranslationFiles", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PassportElementErrorSourceFile(PassportElementErrorSource):
+    """
+    The file contains an error. The error will be considered resolved when the file changes
+
+    :param file_index: Index of a file with the error
+    """
+
+    _type: "str" = field(default="passportElementErrorSourceFile", init=False, repr=False)
+    file_index: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_index": self.file_index,
+        }
+
+@dataclass(slots=True)
+class PassportElementErrorSourceFiles(PassportElementErrorSource):
+    """
+    The list of attached files contains an error. The error will be considered resolved when the list of files changes
+
+    """
+
+    _type: "str" = field(default="passportElementErrorSourceFiles", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PassportElementError(ObjectBase):
+    """
+    Contains the description of an error in a Telegram Passport element
+
+    :param type: Type of the Telegram Passport element which has the error
+    :param message: Error message
+    :param source: Error source
+    """
+
+    _type: "str" = field(default="passportElementError", init=False, repr=False)
+    type: "PassportElementType | None" = None
+    message: "str" = ""
+    source: "PassportElementErrorSource | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "message": self.message,
+            "source": self.source._to_json_dict() if self.source is not None else None,
+        }
+
+@dataclass(slots=True)
+class PassportSuitableElement(ObjectBase):
+    """
+    Contains information about a Telegram Passport element that was requested by a service
+
+    :param type: Type of the element
+    :param is_selfie_required: True, if a selfie is required with the identity document
+    :param is_translation_required: True, if a certified English translation is required with the document
+    :param is_native_name_required: True, if personal details must include the user's name in the language of their country of residence
+    """
+
+    _type: "str" = field(default="passportSuitableElement", init=False, repr=False)
+    type: "PassportElementType | None" = None
+    is_selfie_required: "bool" = False
+    is_translation_required: "bool" = False
+    is_native_name_required: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "is_selfie_required": self.is_selfie_required,
+            "is_translation_required": self.is_translation_required,
+            "is_native_name_required": self.is_native_name_required,
+        }
+
+@dataclass(slots=True)
+class PassportRequiredElement(ObjectBase):
+    """
+    Contains a description of the required Telegram Passport element that was requested by a service
+
+    :param suitable_elements: List of Telegram Passport elements any of which is enough to provide
+    """
+
+    _type: "str" = field(default="passportRequiredElement", init=False, repr=False)
+    suitable_elements: "list[PassportSuitableElement] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "suitable_elements": _list_to_json(self.suitable_elements),
+        }
+
+@dataclass(slots=True)
+class PassportAuthorizationForm(ObjectBase):
+    """
+    Contains information about a Telegram Passport authorization form that was requested
+
+    :param id: Unique identifier of the authorization form
+    :param required_elements: Telegram Passport elements that must be provided to complete the form
+    :param privacy_policy_url: URL for the privacy policy of the service; may be empty
+    """
+
+    _type: "str" = field(default="passportAuthorizationForm", init=False, repr=False)
+    id: "int" = 0
+    required_elements: "list[PassportRequiredElement] | None" = None
+    privacy_policy_url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "required_elements": _list_to_json(self.required_elements),
+            "privacy_policy_url": self.privacy_policy_url,
+        }
+
+@dataclass(slots=True)
+class PassportElementsWithErrors(ObjectBase):
+    """
+    Contains information about a Telegram Passport elements and corresponding errors
+
+    :param elements: Telegram Passport elements
+    :param errors: Errors in the elements that are already available
+    """
+
+    _type: "str" = field(default="passportElementsWithErrors", init=False, repr=False)
+    elements: "list[PassportElement] | None" = None
+    errors: "list[PassportElementError] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "elements": _list_to_json(self.elements),
+            "errors": _list_to_json(self.errors),
+        }
+
+@dataclass(slots=True)
+class EncryptedCredentials(ObjectBase):
+    """
+    Contains encrypted Telegram Passport data credentials
+
+    :param data: The encrypted credentials
+    :param hash: The decrypted data hash
+    :param secret: Secret for data decryption, encrypted with the service's public key
+    """
+
+    _type: "str" = field(default="encryptedCredentials", init=False, repr=False)
+    data: "bytes" = b""
+    hash: "bytes" = b""
+    secret: "bytes" = b""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "data": _bytes_to_json(self.data),
+            "hash": _bytes_to_json(self.hash),
+            "secret": _bytes_to_json(self.secret),
+        }
+
+@dataclass(slots=True)
+class EncryptedPassportElement(ObjectBase):
+    """
+    Contains information about an encrypted Telegram Passport element; for bots only
+
+    :param type: Type of Telegram Passport element
+    :param data: Encrypted JSON-encoded data about the user
+    :param front_side: The front side of an identity document
+    :param reverse_side: The reverse side of an identity document; may be null
+    :param selfie: Selfie with the document; may be null
+    :param translation: List of files containing a certified English translation of the document
+    :param files: List of attached files
+    :param value: Unencrypted data, phone number or email address
+    :param hash: Hash of the entire element
+    """
+
+    _type: "str" = field(default="encryptedPassportElement", init=False, repr=False)
+    type: "PassportElementType | None" = None
+    data: "bytes" = b""
+    front_side: "DatedFile | None" = None
+    reverse_side: "DatedFile | None" = None
+    selfie: "DatedFile | None" = None
+    translation: "list[DatedFile] | None" = None
+    files: "list[DatedFile] | None" = None
+    value: "str" = ""
+    hash: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "data": _bytes_to_json(self.data),
+            "front_side": self.front_side._to_json_dict() if self.front_side is not None else None,
+            "reverse_side": self.reverse_side._to_json_dict() if self.reverse_side is not None else None,
+            "selfie": self.selfie._to_json_dict() if self.selfie is not None else None,
+            "translation": _list_to_json(self.translation),
+            "files": _list_to_json(self.files),
+            "value": self.value,
+            "hash": self.hash,
+        }
+
+@dataclass(slots=True)
+class InputPassportElementErrorSource(ObjectBase):
+    """
+    Contains the description of an error in a Telegram Passport element; for bots only
+
+    """
+
+    _type: "str" = field(default="InputPassportElementErrorSource", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InputPassportElementErrorSourceUnspecified(InputPassportElementErrorSource):
+    """
+    The element contains an error in an unspecified place. The error will be considered resolved when new data is added
+
+    :param element_hash: Current hash of the entire element
+    """
+
+    _type: "str" = field(default="inputPassportElementErrorSourceUnspecified", init=False, repr=False)
+    element_hash: "bytes" = b""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "element_hash": _bytes_to_json(self.element_hash),
+        }
+
+@dataclass(slots=True)
+class InputPassportElementErrorSourceDataField(InputPassportElementErrorSource):
+    """
+    A data field contains an error. The error is considered resolved when the field's value changes
+
+    :param field_name: Field name
+    :param data_hash: Current data hash
+    """
+
+    _type: "str" = field(default="inputPassportElementErrorSourceDataField", init=False, repr=False)
+    field_name: "str" = ""
+    data_hash: "bytes" = b""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "field_name": self.field_name,
+            "data_hash": _bytes_to_json(self.data_hash),
+        }
+
+@dataclass(slots=True)
+class InputPassportElementErrorSourceFrontSide(InputPassportElementErrorSource):
+    """
+    The front side of the document contains an error. The error is considered resolved when the file with the front side of the document changes
+
+    :param file_hash: Current hash of the file containing the front side
+    """
+
+    _type: "str" = field(default="inputPassportElementErrorSourceFrontSide", init=False, repr=False)
+    file_hash: "bytes" = b""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_hash": _bytes_to_json(self.file_hash),
+        }
+
+@dataclass(slots=True)
+class InputPassportElementErrorSourceReverseSide(InputPassportElementErrorSource):
+    """
+    The reverse side of the document contains an error. The error is considered resolved when the file with the reverse side of the document changes
+
+    :param file_hash: Current hash of the file containing the reverse side
+    """
+
+    _type: "str" = field(default="inputPassportElementErrorSourceReverseSide", init=False, repr=False)
+    file_hash: "bytes" = b""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_hash": _bytes_to_json(self.file_hash),
+        }
+
+@dataclass(slots=True)
+class InputPassportElementErrorSourceSelfie(InputPassportElementErrorSource):
+    """
+    The selfie contains an error. The error is considered resolved when the file with the selfie changes
+
+    :param file_hash: Current hash of the file containing the selfie
+    """
+
+    _type: "str" = field(default="inputPassportElementErrorSourceSelfie", init=False, repr=False)
+    file_hash: "bytes" = b""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_hash": _bytes_to_json(self.file_hash),
+        }
+
+@dataclass(slots=True)
+class InputPassportElementErrorSourceTranslationFile(InputPassportElementErrorSource):
+    """
+    One of the files containing the translation of the document contains an error. The error is considered resolved when the file with the translation changes
+
+    :param file_hash: Current hash of the file containing the translation
+    """
+
+    _type: "str" = field(default="inputPassportElementErrorSourceTranslationFile", init=False, repr=False)
+    file_hash: "bytes" = b""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_hash": _bytes_to_json(self.file_hash),
+        }
+
+@dataclass(slots=True)
+class InputPassportElementErrorSourceTranslationFiles(InputPassportElementErrorSource):
+    """
+    The translation of the document contains an error. The error is considered resolved when the list of files changes
+
+    :param file_hashes: Current hashes of all files with the translation
+    """
+
+    _type: "str" = field(default="inputPassportElementErrorSourceTranslationFiles", init=False, repr=False)
+    file_hashes: "list[bytes] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_hashes": _list_to_json(self.file_hashes),
+        }
+
+@dataclass(slots=True)
+class InputPassportElementErrorSourceFile(InputPassportElementErrorSource):
+    """
+    The file contains an error. The error is considered resolved when the file changes
+
+    :param file_hash: Current hash of the file which has the error
+    """
+
+    _type: "str" = field(default="inputPassportElementErrorSourceFile", init=False, repr=False)
+    file_hash: "bytes" = b""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_hash": _bytes_to_json(self.file_hash),
+        }
+
+@dataclass(slots=True)
+class InputPassportElementErrorSourceFiles(InputPassportElementErrorSource):
+    """
+    The list of attached files contains an error. The error is considered resolved when the file list changes
+
+    :param file_hashes: Current hashes of all attached files
+    """
+
+    _type: "str" = field(default="inputPassportElementErrorSourceFiles", init=False, repr=False)
+    file_hashes: "list[bytes] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_hashes": _list_to_json(self.file_hashes),
+        }
+
+@dataclass(slots=True)
+class InputPassportElementError(ObjectBase):
+    """
+    Contains the description of an error in a Telegram Passport element; for bots only
+
+    :param type: Type of Telegram Passport element that has the error
+    :param message: Error message
+    :param source: Error source
+    """
+
+    _type: "str" = field(default="inputPassportElementError", init=False, repr=False)
+    type: "PassportElementType | None" = None
+    message: "str" = ""
+    source: "InputPassportElementErrorSource | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "message": self.message,
+            "source": self.source._to_json_dict() if self.source is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessageContent(ObjectBase):
+    """
+    Contains the content of a message
+
+    """
+
+    _type: "str" = field(default="MessageContent", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageText(MessageContent):
+    """
+    A text message
+
+    :param text: Text of the message
+    :param link_preview: A link preview attached to the message; may be null
+    :param link_preview_options: Options which were used for generation of the link preview; may be null if default options were used
+    """
+
+    _type: "str" = field(default="messageText", init=False, repr=False)
+    text: "FormattedText | None" = None
+    link_preview: "LinkPreview | None" = None
+    link_preview_options: "LinkPreviewOptions | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "link_preview": self.link_preview._to_json_dict() if self.link_preview is not None else None,
+            "link_preview_options": self.link_preview_options._to_json_dict() if self.link_preview_options is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessageAnimation(MessageContent):
+    """
+    An animation message (GIF-style).
+
+    :param animation: The animation description
+    :param caption: Animation caption
+    :param show_caption_above_media: True, if the caption must be shown above the animation; otherwise, the caption must be shown below the animation
+    :param has_spoiler: True, if the animation preview must be covered by a spoiler animation
+    :param is_secret: True, if the animation thumbnail must be blurred and the animation must be shown only while tapped
+    """
+
+    _type: "str" = field(default="messageAnimation", init=False, repr=False)
+    animation: "Animation | None" = None
+    caption: "FormattedText | None" = None
+    show_caption_above_media: "bool" = False
+    has_spoiler: "bool" = False
+    is_secret: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "animation": self.animation._to_json_dict() if self.animation is not None else None,
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+            "show_caption_above_media": self.show_caption_above_media,
+            "has_spoiler": self.has_spoiler,
+            "is_secret": self.is_secret,
+        }
+
+@dataclass(slots=True)
+class MessageAudio(MessageContent):
+    """
+    An audio message
+
+    :param audio: The audio description
+    :param caption: Audio caption
+    """
+
+    _type: "str" = field(default="messageAudio", init=False, repr=False)
+    audio: "Audio | None" = None
+    caption: "FormattedText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "audio": self.audio._to_json_dict() if self.audio is not None else None,
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessageDocument(MessageContent):
+    """
+    A document message (general file)
+
+    :param document: The document description
+    :param caption: Document caption
+    """
+
+    _type: "str" = field(default="messageDocument", init=False, repr=False)
+    document: "Document | None" = None
+    caption: "FormattedText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "document": self.document._to_json_dict() if self.document is not None else None,
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessagePaidMedia(MessageContent):
+    """
+    A message with paid media
+
+    :param star_count: Number of Telegram Stars needed to buy access to the media in the message
+    :param media: Information about the media
+    :param caption: Media caption
+    :param show_caption_above_media: True, if the caption must be shown above the media; otherwise, the caption must be shown below the media
+    """
+
+    _type: "str" = field(default="messagePaidMedia", init=False, repr=False)
+    star_count: "int" = 0
+    media: "list[PaidMedia] | None" = None
+    caption: "FormattedText | None" = None
+    show_caption_above_media: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "star_count": self.star_count,
+            "media": _list_to_json(self.media),
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+            "show_caption_above_media": self.show_caption_above_media,
+        }
+
+@dataclass(slots=True)
+class MessagePhoto(MessageContent):
+    """
+    A photo message
+
+    :param photo: The photo
+    :param caption: Photo caption
+    :param show_caption_above_media: True, if the caption must be shown above the photo; otherwise, the caption must be shown below the photo
+    :param has_spoiler: True, if the photo preview must be covered by a spoiler animation
+    :param is_secret: True, if the photo must be blurred and must be shown only while tapped
+    """
+
+    _type: "str" = field(default="messagePhoto", init=False, repr=False)
+    photo: "Photo | None" = None
+    caption: "FormattedText | None" = None
+    show_caption_above_media: "bool" = False
+    has_spoiler: "bool" = False
+    is_secret: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+            "show_caption_above_media": self.show_caption_above_media,
+            "has_spoiler": self.has_spoiler,
+            "is_secret": self.is_secret,
+        }
+
+@dataclass(slots=True)
+class MessageSticker(MessageContent):
+    """
+    A sticker message
+
+    :param sticker: The sticker description
+    :param is_premium: True, if premium animation of the sticker must be played
+    """
+
+    _type: "str" = field(default="messageSticker", init=False, repr=False)
+    sticker: "Sticker | None" = None
+    is_premium: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+            "is_premium": self.is_premium,
+        }
+
+@dataclass(slots=True)
+class MessageVideo(MessageContent):
+    """
+    A video message
+
+    :param video: The video description
+    :param alternative_videos: Alternative qualities of the video
+    :param storyboards: Available storyboards for the video
+    :param cover: Cover of the video; may be null if none
+    :param start_timestamp: Timestamp from which the video playing must start, in seconds
+    :param caption: Video caption
+    :param show_caption_above_media: True, if the caption must be shown above the video; otherwise, the caption must be shown below the video
+    :param has_spoiler: True, if the video preview must be covered by a spoiler animation
+    :param is_secret: True, if the video thumbnail must be blurred and the video must be shown only while tapped
+    """
+
+    _type: "str" = field(default="messageVideo", init=False, repr=False)
+    video: "Video | None" = None
+    alternative_videos: "list[AlternativeVideo] | None" = None
+    storyboards: "list[VideoStoryboard] | None" = None
+    cover: "Photo | None" = None
+    start_timestamp: "int" = 0
+    caption: "FormattedText | None" = None
+    show_caption_above_media: "bool" = False
+    has_spoiler: "bool" = False
+    is_secret: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "video": self.video._to_json_dict() if self.video is not None else None,
+            "alternative_videos": _list_to_json(self.alternative_videos),
+            "storyboards": _list_to_json(self.storyboards),
+            "cover": self.cover._to_json_dict() if self.cover is not None else None,
+            "start_timestamp": self.start_timestamp,
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+            "show_caption_above_media": self.show_caption_above_media,
+            "has_spoiler": self.has_spoiler,
+            "is_secret": self.is_secret,
+        }
+
+@dataclass(slots=True)
+class MessageVideoNote(MessageContent):
+    """
+    A video note message
+
+    :param video_note: The video note description
+    :param is_viewed: True, if at least one of the recipients has viewed the video note
+    :param is_secret: True, if the video note thumbnail must be blurred and the video note must be shown only while tapped
+    """
+
+    _type: "str" = field(default="messageVideoNote", init=False, repr=False)
+    video_note: "VideoNote | None" = None
+    is_viewed: "bool" = False
+    is_secret: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "video_note": self.video_note._to_json_dict() if self.video_note is not None else None,
+            "is_viewed": self.is_viewed,
+            "is_secret": self.is_secret,
+        }
+
+@dataclass(slots=True)
+class MessageVoiceNote(MessageContent):
+    """
+    A voice note message
+
+    :param voice_note: The voice note description
+    :param caption: Voice note caption
+    :param is_listened: True, if at least one of the recipients has listened to the voice note
+    """
+
+    _type: "str" = field(default="messageVoiceNote", init=False, repr=False)
+    voice_note: "VoiceNote | None" = None
+    caption: "FormattedText | None" = None
+    is_listened: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "voice_note": self.voice_note._to_json_dict() if self.voice_note is not None else None,
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+            "is_listened": self.is_listened,
+        }
+
+@dataclass(slots=True)
+class MessageExpiredPhoto(MessageContent):
+    """
+    A self-destructed photo message
+
+    """
+
+    _type: "str" = field(default="messageExpiredPhoto", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageExpiredVideo(MessageContent):
+    """
+    A self-destructed video message
+
+    """
+
+    _type: "str" = field(default="messageExpiredVideo", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageExpiredVideoNote(MessageContent):
+    """
+    A self-destructed video note message
+
+    """
+
+    _type: "str" = field(default="messageExpiredVideoNote", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageExpiredVoiceNote(MessageContent):
+    """
+    A self-destructed voice note message
+
+    """
+
+    _type: "str" = field(default="messageExpiredVoiceNote", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageLocation(MessageContent):
+    """
+    A message with a location
+
+    :param location: The location description
+    :param live_period: Time relative to the message send date, for which the location can be updated, in seconds; if 0x7FFFFFFF, then location can be updated forever
+    :param expires_in: Left time for which the location can be updated, in seconds. If 0, then the location can't be updated anymore. The update updateMessageContent is not sent when this field changes
+    :param heading: For live locations, a direction in which the location moves, in degrees; 1-360. If 0 the direction is unknown
+    :param proximity_alert_radius: For live locations, a maximum distance to another chat member for proximity alerts, in meters (0-100000). 0 if the notification is disabled. Available only to the message sender
+    """
+
+    _type: "str" = field(default="messageLocation", init=False, repr=False)
+    location: "Location | None" = None
+    live_period: "int" = 0
+    expires_in: "int" = 0
+    heading: "int" = 0
+    proximity_alert_radius: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "location": self.location._to_json_dict() if self.location is not None else None,
+            "live_period": self.live_period,
+            "expires_in": self.expires_in,
+            "heading": self.heading,
+            "proximity_alert_radius": self.proximity_alert_radius,
+        }
+
+@dataclass(slots=True)
+class MessageVenue(MessageContent):
+    """
+    A message with information about a venue
+
+    :param venue: The venue description
+    """
+
+    _type: "str" = field(default="messageVenue", init=False, repr=False)
+    venue: "Venue | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "venue": self.venue._to_json_dict() if self.venue is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessageContact(MessageContent):
+    """
+    A message with a user contact
+
+    :param contact: The contact description
+    """
+
+    _type: "str" = field(default="messageContact", init=False, repr=False)
+    contact: "Contact | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "contact": self.contact._to_json_dict() if self.contact is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessageAnimatedEmoji(MessageContent):
+    """
+    A message with an animated emoji
+
+    :param animated_emoji: The animated emoji
+    :param emoji: The corresponding emoji
+    """
+
+    _type: "str" = field(default="messageAnimatedEmoji", init=False, repr=False)
+    animated_emoji: "AnimatedEmoji | None" = None
+    emoji: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "animated_emoji": self.animated_emoji._to_json_dict() if self.animated_emoji is not None else None,
+            "emoji": self.emoji,
+        }
+
+@dataclass(slots=True)
+class MessageDice(MessageContent):
+    """
+    A dice message. The dice value is randomly generated by the server
+
+    :param initial_state: The animated stickers with the initial dice animation; may be null if unknown. The update updateMessageContent will be sent when the sticker became known
+    :param final_state: The animated stickers with the final dice animation; may be null if unknown. The update updateMessageContent will be sent when the sticker became known
+    :param emoji: Emoji on which the dice throw animation is based
+    :param value: The dice value. If the value is 0, the dice don't have final state yet
+    :param success_animation_frame_number: Number of frame after which a success animation like a shower of confetti needs to be shown on updateMessageSendSucceeded
+    """
+
+    _type: "str" = field(default="messageDice", init=False, repr=False)
+    initial_state: "DiceStickers | None" = None
+    final_state: "DiceStickers | None" = None
+    emoji: "str" = ""
+    value: "int" = 0
+    success_animation_frame_number: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "initial_state": self.initial_state._to_json_dict() if self.initial_state is not None else None,
+            "final_state": self.final_state._to_json_dict() if self.final_state is not None else None,
+            "emoji": self.emoji,
+            "value": self.value,
+            "success_animation_frame_number": self.success_animation_frame_number,
+        }
+
+@dataclass(slots=True)
+class MessageGame(MessageContent):
+    """
+    A message with a game
+
+    :param game: The game description
+    """
+
+    _type: "str" = field(default="messageGame", init=False, repr=False)
+    game: "Game | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "game": self.game._to_json_dict() if self.game is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessagePoll(MessageContent):
+    """
+    A message with a poll
+
+    :param poll: The poll description
+    """
+
+    _type: "str" = field(default="messagePoll", init=False, repr=False)
+    poll: "Poll | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "poll": self.poll._to_json_dict() if self.poll is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessageStory(MessageContent):
+    """
+    A message with a forwarded story
+
+    :param story_poster_chat_id: Identifier of the chat that posted the story
+    :param story_id: Story identifier
+    :param via_mention: True, if the story was automatically forwarded because of a mention of the user
+    """
+
+    _type: "str" = field(default="messageStory", init=False, repr=False)
+    story_poster_chat_id: "int" = 0
+    story_id: "int" = 0
+    via_mention: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_poster_chat_id": self.story_poster_chat_id,
+            "story_id": self.story_id,
+            "via_mention": self.via_mention,
+        }
+
+@dataclass(slots=True)
+class MessageChecklist(MessageContent):
+    """
+    A message with a checklist
+
+    :param list_: The checklist description
+    """
+
+    _type: "str" = field(default="messageChecklist", init=False, repr=False)
+    list_: "Checklist | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "list": self.list_._to_json_dict() if self.list_ is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessageInvoice(MessageContent):
+    """
+    A message with an invoice from a bot. Use getInternalLink with internalLinkTypeBotStart to share the invoice
+
+    :param product_info: Information about the product
+    :param currency: Currency for the product price
+    :param total_amount: Product total price in the smallest units of the currency
+    :param start_parameter: Unique invoice bot start_parameter to be passed to getInternalLink
+    :param is_test: True, if the invoice is a test invoice
+    :param need_shipping_address: True, if the shipping address must be specified
+    :param receipt_message_id: The identifier of the message with the receipt, after the product has been purchased
+    :param paid_media: Extended media attached to the invoice; may be null if none
+    :param paid_media_caption: Extended media caption; may be null if none
+    """
+
+    _type: "str" = field(default="messageInvoice", init=False, repr=False)
+    product_info: "ProductInfo | None" = None
+    currency: "str" = ""
+    total_amount: "int" = 0
+    start_parameter: "str" = ""
+    is_test: "bool" = False
+    need_shipping_address: "bool" = False
+    receipt_message_id: "int" = 0
+    paid_media: "PaidMedia | None" = None
+    paid_media_caption: "FormattedText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "product_info": self.product_info._to_json_dict() if self.product_info is not None else None,
+            "currency": self.currency,
+            "total_amount": self.total_amount,
+            "start_parameter": self.start_parameter,
+            "is_test": self.is_test,
+            "need_shipping_address": self.need_shipping_address,
+            "receipt_message_id": self.receipt_message_id,
+            "paid_media": self.paid_media._to_json_dict() if self.paid_media is not None else None,
+            "paid_media_caption": self.paid_media_caption._to_json_dict() if self.paid_media_caption is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessageCall(MessageContent):
+    """
+    A message with information about an ended call
+
+    :param is_video: True, if the call was a video call
+    :param discard_reason: Reason why the call was discarded
+    :param duration: Call duration, in seconds
+    """
+
+    _type: "str" = field(default="messageCall", init=False, repr=False)
+    is_video: "bool" = False
+    discard_reason: "CallDiscardReason | None" = None
+    duration: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_video": self.is_video,
+            "discard_reason": self.discard_reason._to_json_dict() if self.discard_reason is not None else None,
+            "duration": self.duration,
+        }
+
+@dataclass(slots=True)
+class MessageGroupCall(MessageContent):
+    """
+    A message with information about a group call not bound to a chat. If the message is incoming, the call isn't active, isn't missed, and has no duration, and getOption("can_accept_calls") is true, then incoming call screen must be shown to the user. Use getGroupCallParticipants to show current group call participants on the screen.
+     Use joinGroupCall to accept the call or declineGroupCallInvitation to decline it. If the call become active or missed, then the call screen must be hidden
+
+    :param is_active: True, if the call is active, i.e. the called user joined the call
+    :param was_missed: True, if the called user missed or declined the call
+    :param is_video: True, if the call is a video call
+    :param duration: Call duration, in seconds; for left calls only
+    :param other_participant_ids: Identifiers of some other call participants
+    """
+
+    _type: "str" = field(default="messageGroupCall", init=False, repr=False)
+    is_active: "bool" = False
+    was_missed: "bool" = False
+    is_video: "bool" = False
+    duration: "int" = 0
+    other_participant_ids: "list[MessageSender] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_active": self.is_active,
+            "was_missed": self.was_missed,
+            "is_video": self.is_video,
+            "duration": self.duration,
+            "other_participant_ids": _list_to_json(self.other_participant_ids),
+        }
+
+@dataclass(slots=True)
+class MessageVideoChatScheduled(MessageContent):
+    """
+    A new video chat was scheduled
+
+    :param group_call_id: Identifier of the video chat. The video chat can be received through the method getGroupCall
+    :param start_date: Point in time (Unix timestamp) when the group call is expected to be started by an administrator
+    """
+
+    _type: "str" = field(default="messageVideoChatScheduled", init=False, repr=False)
+    group_call_id: "int" = 0
+    start_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "start_date": self.start_date,
+        }
+
+@dataclass(slots=True)
+class MessageVideoChatStarted(MessageContent):
+    """
+    A newly created video chat
+
+    :param group_call_id: Identifier of the video chat. The video chat can be received through the method getGroupCall
+    """
+
+    _type: "str" = field(default="messageVideoChatStarted", init=False, repr=False)
+    group_call_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+        }
+
+@dataclass(slots=True)
+class MessageVideoChatEnded(MessageContent):
+    """
+    A message with information about an ended video chat
+
+    :param duration: Call duration, in seconds
+    """
+
+    _type: "str" = field(default="messageVideoChatEnded", init=False, repr=False)
+    duration: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "duration": self.duration,
+        }
+
+@dataclass(slots=True)
+class MessageInviteVideoChatParticipants(MessageContent):
+    """
+    A message with information about an invitation to a video chat
+
+    :param group_call_id: Identifier of the video chat. The video chat can be received through the method getGroupCall
+    :param user_ids: Invited user identifiers
+    """
+
+    _type: "str" = field(default="messageInviteVideoChatParticipants", init=False, repr=False)
+    group_call_id: "int" = 0
+    user_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "user_ids": self.user_ids,
+        }
+
+@dataclass(slots=True)
+class MessageBasicGroupChatCreate(MessageContent):
+    """
+    A newly created basic group
+
+    :param title: Title of the basic group
+    :param member_user_ids: User identifiers of members in the basic group
+    """
+
+    _type: "str" = field(default="messageBasicGroupChatCreate", init=False, repr=False)
+    title: "str" = ""
+    member_user_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "title": self.title,
+            "member_user_ids": self.member_user_ids,
+        }
+
+@dataclass(slots=True)
+class MessageSupergroupChatCreate(MessageContent):
+    """
+    A newly created supergroup or channel
+
+    :param title: Title of the supergroup or channel
+    """
+
+    _type: "str" = field(default="messageSupergroupChatCreate", init=False, repr=False)
+    title: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "title": self.title,
+        }
+
+@dataclass(slots=True)
+class MessageChatChangeTitle(MessageContent):
+    """
+    An updated chat title
+
+    :param title: New chat title
+    """
+
+    _type: "str" = field(default="messageChatChangeTitle", init=False, repr=False)
+    title: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "title": self.title,
+        }
+
+@dataclass(slots=True)
+class MessageChatChangePhoto(MessageContent):
+    """
+    An updated chat photo
+
+    :param photo: New chat photo
+    """
+
+    _type: "str" = field(default="messageChatChangePhoto", init=False, repr=False)
+    photo: "ChatPhoto | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessageChatDeletePhoto(MessageContent):
+    """
+    A deleted chat photo
+
+    """
+
+    _type: "str" = field(default="messageChatDeletePhoto", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageChatAddMembers(MessageContent):
+    """
+    New chat members were added
+
+    :param member_user_ids: User identifiers of the new members
+    """
+
+    _type: "str" = field(default="messageChatAddMembers", init=False, repr=False)
+    member_user_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "member_user_ids": self.member_user_ids,
+        }
+
+@dataclass(slots=True)
+class MessageChatJoinByLink(MessageContent):
+    """
+    A new member joined the chat via an invite link
+
+    """
+
+    _type: "str" = field(default="messageChatJoinByLink", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageChatJoinByRequest(MessageContent):
+    """
+    A new member was accepted to the chat by an administrator
+
+    """
+
+    _type: "str" = field(default="messageChatJoinByRequest", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageChatDeleteMember(MessageContent):
+    """
+    A chat member was deleted
+
+    :param user_id: User identifier of the deleted chat member
+    """
+
+    _type: "str" = field(default="messageChatDeleteMember", init=False, repr=False)
+    user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+        }
+
+@dataclass(slots=True)
+class MessageChatUpgradeTo(MessageContent):
+    """
+    A basic group was upgraded to a supergroup and was deactivated as the result
+
+    :param supergroup_id: Identifier of the supergroup to which the basic group was upgraded
+    """
+
+    _type: "str" = field(default="messageChatUpgradeTo", init=False, repr=False)
+    supergroup_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+        }
+
+@dataclass(slots=True)
+class MessageChatUpgradeFrom(MessageContent):
+    """
+    A supergroup has been created from a basic group
+
+    :param title: Title of the newly created supergroup
+    :param basic_group_id: The identifier of the original basic group
+    """
+
+    _type: "str" = field(default="messageChatUpgradeFrom", init=False, repr=False)
+    title: "str" = ""
+    basic_group_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "title": self.title,
+            "basic_group_id": self.basic_group_id,
+        }
+
+@dataclass(slots=True)
+class MessagePinMessage(MessageContent):
+    """
+    A message has been pinned
+
+    :param message_id: Identifier of the pinned message, can be an identifier of a deleted message or 0
+    """
+
+    _type: "str" = field(default="messagePinMessage", init=False, repr=False)
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "message_id": self.message_id,
+        }
+
+@dataclass(slots=True)
+class MessageScreenshotTaken(MessageContent):
+    """
+    A screenshot of a message in the chat has been taken
+
+    """
+
+    _type: "str" = field(default="messageScreenshotTaken", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageChatSetBackground(MessageContent):
+    """
+    A new background was set in the chat
+
+    :param old_background_message_id: Identifier of the message with a previously set same background; 0 if none. Can be an identifier of a deleted message
+    :param background: The new background
+    :param only_for_self: True, if the background was set only for self
+    """
+
+    _type: "str" = field(default="messageChatSetBackground", init=False, repr=False)
+    old_background_message_id: "int" = 0
+    background: "ChatBackground | None" = None
+    only_for_self: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "old_background_message_id": self.old_background_message_id,
+            "background": self.background._to_json_dict() if self.background is not None else None,
+            "only_for_self": self.only_for_self,
+        }
+
+@dataclass(slots=True)
+class MessageChatSetTheme(MessageContent):
+    """
+    A theme in the chat has been changed
+
+    :param theme_name: If non-empty, name of a new theme, set for the chat. Otherwise, chat theme was reset to the default one
+    """
+
+    _type: "str" = field(default="messageChatSetTheme", init=False, repr=False)
+    theme_name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "theme_name": self.theme_name,
+        }
+
+@dataclass(slots=True)
+class MessageChatSetMessageAutoDeleteTime(MessageContent):
+    """
+    The auto-delete or self-destruct timer for messages in the chat has been changed
+
+    :param message_auto_delete_time: New value auto-delete or self-destruct time, in seconds; 0 if disabled
+    :param from_user_id: If not 0, a user identifier, which default setting was automatically applied
+    """
+
+    _type: "str" = field(default="messageChatSetMessageAutoDeleteTime", init=False, repr=False)
+    message_auto_delete_time: "int" = 0
+    from_user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "message_auto_delete_time": self.message_auto_delete_time,
+            "from_user_id": self.from_user_id,
+        }
+
+@dataclass(slots=True)
+class MessageChatBoost(MessageContent):
+    """
+    The chat was boosted by the sender of the message
+
+    :param boost_count: Number of times the chat was boosted
+    """
+
+    _type: "str" = field(default="messageChatBoost", init=False, repr=False)
+    boost_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "boost_count": self.boost_count,
+        }
+
+@dataclass(slots=True)
+class MessageForumTopicCreated(MessageContent):
+    """
+    A forum topic has been created
+
+    :param name: Name of the topic
+    :param icon: Icon of the topic
+    """
+
+    _type: "str" = field(default="messageForumTopicCreated", init=False, repr=False)
+    name: "str" = ""
+    icon: "ForumTopicIcon | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name,
+            "icon": self.icon._to_json_dict() if self.icon is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessageForumTopicEdited(MessageContent):
+    """
+    A forum topic has been edited
+
+    :param name: If non-empty, the new name of the topic
+    :param edit_icon_custom_emoji_id: True, if icon's custom_emoji_id is changed
+    :param icon_custom_emoji_id: New unique identifier of the custom emoji shown on the topic icon; 0 if none. Must be ignored if edit_icon_custom_emoji_id is false
+    """
+
+    _type: "str" = field(default="messageForumTopicEdited", init=False, repr=False)
+    name: "str" = ""
+    edit_icon_custom_emoji_id: "bool" = False
+    icon_custom_emoji_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name,
+            "edit_icon_custom_emoji_id": self.edit_icon_custom_emoji_id,
+            "icon_custom_emoji_id": self.icon_custom_emoji_id,
+        }
+
+@dataclass(slots=True)
+class MessageForumTopicIsClosedToggled(MessageContent):
+    """
+    A forum topic has been closed or opened
+
+    :param is_closed: True, if the topic was closed; otherwise, the topic was reopened
+    """
+
+    _type: "str" = field(default="messageForumTopicIsClosedToggled", init=False, repr=False)
+    is_closed: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_closed": self.is_closed,
+        }
+
+@dataclass(slots=True)
+class MessageForumTopicIsHiddenToggled(MessageContent):
+    """
+    A General forum topic has been hidden or unhidden
+
+    :param is_hidden: True, if the topic was hidden; otherwise, the topic was unhidden
+    """
+
+    _type: "str" = field(default="messageForumTopicIsHiddenToggled", init=False, repr=False)
+    is_hidden: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_hidden": self.is_hidden,
+        }
+
+@dataclass(slots=True)
+class MessageSuggestProfilePhoto(MessageContent):
+    """
+    A profile photo was suggested to a user in a private chat
+
+    :param photo: The suggested chat photo. Use the method setProfilePhoto with inputChatPhotoPrevious to apply the photo
+    """
+
+    _type: "str" = field(default="messageSuggestProfilePhoto", init=False, repr=False)
+    photo: "ChatPhoto | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessageCustomServiceAction(MessageContent):
+    """
+    A non-standard action has happened in the chat
+
+    :param text: Message text to be shown in the chat
+    """
+
+    _type: "str" = field(default="messageCustomServiceAction", init=False, repr=False)
+    text: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text,
+        }
+
+@dataclass(slots=True)
+class MessageGameScore(MessageContent):
+    """
+    A new high score was achieved in a game
+
+    :param game_message_id: Identifier of the message with the game, can be an identifier of a deleted message
+    :param game_id: Identifier of the game; may be different from the games presented in the message with the game
+    :param score: New score
+    """
+
+    _type: "str" = field(default="messageGameScore", init=False, repr=False)
+    game_message_id: "int" = 0
+    game_id: "int" = 0
+    score: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "game_message_id": self.game_message_id,
+            "game_id": self.game_id,
+            "score": self.score,
+        }
+
+@dataclass(slots=True)
+class MessagePaymentSuccessful(MessageContent):
+    """
+    A payment has been sent to a bot or a business account
+
+    :param invoice_chat_id: Identifier of the chat, containing the corresponding invoice message
+    :param invoice_message_id: Identifier of the message with the corresponding invoice; can be 0 or an identifier of a deleted message
+    :param currency: Currency for the price of the product
+    :param total_amount: Total price for the product, in the smallest units of the currency
+    :param subscription_until_date: Point in time (Unix timestamp) when the subscription will expire; 0 if unknown or the payment isn't recurring
+    :param is_recurring: True, if this is a recurring payment
+    :param is_first_recurring: True, if this is the first recurring payment
+    :param invoice_name: Name of the invoice; may be empty if unknown
+    """
+
+    _type: "str" = field(default="messagePaymentSuccessful", init=False, repr=False)
+    invoice_chat_id: "int" = 0
+    invoice_message_id: "int" = 0
+    currency: "str" = ""
+    total_amount: "int" = 0
+    subscription_until_date: "int" = 0
+    is_recurring: "bool" = False
+    is_first_recurring: "bool" = False
+    invoice_name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "invoice_chat_id": self.invoice_chat_id,
+            "invoice_message_id": self.invoice_message_id,
+            "currency": self.currency,
+            "total_amount": self.total_amount,
+            "subscription_until_date": self.subscription_until_date,
+            "is_recurring": self.is_recurring,
+            "is_first_recurring": self.is_first_recurring,
+            "invoice_name": self.invoice_name,
+        }
+
+@dataclass(slots=True)
+class MessagePaymentSuccessfulBot(MessageContent):
+    """
+    A payment has been received by the bot or the business account
+
+    :param currency: Currency for price of the product
+    :param total_amount: Total price for the product, in the smallest units of the currency
+    :param subscription_until_date: Point in time (Unix timestamp) when the subscription will expire; 0 if unknown or the payment isn't recurring
+    :param is_recurring: True, if this is a recurring payment
+    :param is_first_recurring: True, if this is the first recurring payment
+    :param invoice_payload: Invoice payload
+    :param shipping_option_id: Identifier of the shipping option chosen by the user; may be empty if not applicable; for bots only
+    :param order_info: Information about the order; may be null; for bots only
+    :param telegram_payment_charge_id: Telegram payment identifier
+    :param provider_payment_charge_id: Provider payment identifier
+    """
+
+    _type: "str" = field(default="messagePaymentSuccessfulBot", init=False, repr=False)
+    currency: "str" = ""
+    total_amount: "int" = 0
+    subscription_until_date: "int" = 0
+    is_recurring: "bool" = False
+    is_first_recurring: "bool" = False
+    invoice_payload: "bytes" = b""
+    shipping_option_id: "str" = ""
+    order_info: "OrderInfo | None" = None
+    telegram_payment_charge_id: "str" = ""
+    provider_payment_charge_id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "currency": self.currency,
+            "total_amount": self.total_amount,
+            "subscription_until_date": self.subscription_until_date,
+            "is_recurring": self.is_recurring,
+            "is_first_recurring": self.is_first_recurring,
+            "invoice_payload": _bytes_to_json(self.invoice_payload),
+            "shipping_option_id": self.shipping_option_id,
+            "order_info": self.order_info._to_json_dict() if self.order_info is not None else None,
+            "telegram_payment_charge_id": self.telegram_payment_charge_id,
+            "provider_payment_charge_id": self.provider_payment_charge_id,
+        }
+
+@dataclass(slots=True)
+class MessagePaymentRefunded(MessageContent):
+    """
+    A payment has been refunded
+
+    :param owner_id: Identifier of the previous owner of the Telegram Stars that refunds them
+    :param currency: Currency for the price of the product
+    :param total_amount: Total price for the product, in the smallest units of the currency
+    :param invoice_payload: Invoice payload; only for bots
+    :param telegram_payment_charge_id: Telegram payment identifier
+    :param provider_payment_charge_id: Provider payment identifier
+    """
+
+    _type: "str" = field(default="messagePaymentRefunded", init=False, repr=False)
+    owner_id: "MessageSender | None" = None
+    currency: "str" = ""
+    total_amount: "int" = 0
+    invoice_payload: "bytes" = b""
+    telegram_payment_charge_id: "str" = ""
+    provider_payment_charge_id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "owner_id": self.owner_id._to_json_dict() if self.owner_id is not None else None,
+            "currency": self.currency,
+            "total_amount": self.total_amount,
+            "invoice_payload": _bytes_to_json(self.invoice_payload),
+            "telegram_payment_charge_id": self.telegram_payment_charge_id,
+            "provider_payment_charge_id": self.provider_payment_charge_id,
+        }
+
+@dataclass(slots=True)
+class MessageGiftedPremium(MessageContent):
+    """
+    Telegram Premium was gifted to a user
+
+    :param gifter_user_id: The identifier of a user that gifted Telegram Premium; 0 if the gift was anonymous or is outgoing
+    :param receiver_user_id: The identifier of a user that received Telegram Premium; 0 if the gift is incoming
+    :param text: Message added to the gifted Telegram Premium by the sender
+    :param currency: Currency for the paid amount
+    :param amount: The paid amount, in the smallest units of the currency
+    :param cryptocurrency: Cryptocurrency used to pay for the gift; may be empty if none
+    :param cryptocurrency_amount: The paid amount, in the smallest units of the cryptocurrency; 0 if none
+    :param month_count: Number of months the Telegram Premium subscription will be active
+    :param sticker: A sticker to be shown in the message; may be null if unknown
+    """
+
+    _type: "str" = field(default="messageGiftedPremium", init=False, repr=False)
+    gifter_user_id: "int" = 0
+    receiver_user_id: "int" = 0
+    text: "FormattedText | None" = None
+    currency: "str" = ""
+    amount: "int" = 0
+    cryptocurrency: "str" = ""
+    cryptocurrency_amount: "int" = 0
+    month_count: "int" = 0
+    sticker: "Sticker | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "gifter_user_id": self.gifter_user_id,
+            "receiver_user_id": self.receiver_user_id,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "currency": self.currency,
+            "amount": self.amount,
+            "cryptocurrency": self.cryptocurrency,
+            "cryptocurrency_amount": self.cryptocurrency_amount,
+            "month_count": self.month_count,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessagePremiumGiftCode(MessageContent):
+    """
+    A Telegram Premium gift code was created for the user
+
+    :param creator_id: Identifier of a chat or a user that created the gift code; may be null if unknown
+    :param text: Message added to the gift
+    :param is_from_giveaway: True, if the gift code was created for a giveaway
+    :param is_unclaimed: True, if the winner for the corresponding Telegram Premium subscription wasn't chosen
+    :param currency: Currency for the paid amount; empty if unknown
+    :param amount: The paid amount, in the smallest units of the currency; 0 if unknown
+    :param cryptocurrency: Cryptocurrency used to pay for the gift; may be empty if none or unknown
+    :param cryptocurrency_amount: The paid amount, in the smallest units of the cryptocurrency; 0 if unknown
+    :param month_count: Number of months the Telegram Premium subscription will be active after code activation
+    :param sticker: A sticker to be shown in the message; may be null if unknown
+    :param code: The gift code
+    """
+
+    _type: "str" = field(default="messagePremiumGiftCode", init=False, repr=False)
+    creator_id: "MessageSender | None" = None
+    text: "FormattedText | None" = None
+    is_from_giveaway: "bool" = False
+    is_unclaimed: "bool" = False
+    currency: "str" = ""
+    amount: "int" = 0
+    cryptocurrency: "str" = ""
+    cryptocurrency_amount: "int" = 0
+    month_count: "int" = 0
+    sticker: "Sticker | None" = None
+    code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "creator_id": self.creator_id._to_json_dict() if self.creator_id is not None else None,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "is_from_giveaway": self.is_from_giveaway,
+            "is_unclaimed": self.is_unclaimed,
+            "currency": self.currency,
+            "amount": self.amount,
+            "cryptocurrency": self.cryptocurrency,
+            "cryptocurrency_amount": self.cryptocurrency_amount,
+            "month_count": self.month_count,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+            "code": self.code,
+        }
+
+@dataclass(slots=True)
+class MessageGiveawayCreated(MessageContent):
+    """
+    A giveaway was created for the chat. Use telegramPaymentPurposePremiumGiveaway, storePaymentPurposePremiumGiveaway, telegramPaymentPurposeStarGiveaway, or storePaymentPurposeStarGiveaway to create a giveaway
+
+    :param star_count: Number of Telegram Stars that will be shared by winners of the giveaway; 0 for Telegram Premium giveaways
+    """
+
+    _type: "str" = field(default="messageGiveawayCreated", init=False, repr=False)
+    star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "star_count": self.star_count,
+        }
+
+@dataclass(slots=True)
+class MessageGiveaway(MessageContent):
+    """
+    A giveaway
+
+    :param parameters: Giveaway parameters
+    :param winner_count: Number of users which will receive Telegram Premium subscription gift codes
+    :param prize: Prize of the giveaway
+    :param sticker: A sticker to be shown in the message; may be null if unknown
+    """
+
+    _type: "str" = field(default="messageGiveaway", init=False, repr=False)
+    parameters: "GiveawayParameters | None" = None
+    winner_count: "int" = 0
+    prize: "GiveawayPrize | None" = None
+    sticker: "Sticker | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "parameters": self.parameters._to_json_dict() if self.parameters is not None else None,
+            "winner_count": self.winner_count,
+            "prize": self.prize._to_json_dict() if self.prize is not None else None,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessageGiveawayCompleted(MessageContent):
+    """
+    A giveaway without public winners has been completed for the chat
+
+    :param giveaway_message_id: Identifier of the message with the giveaway; can be 0 if the message was deleted
+    :param winner_count: Number of winners in the giveaway
+    :param is_star_giveaway: True, if the giveaway is a Telegram Star giveaway
+    :param unclaimed_prize_count: Number of undistributed prizes; for Telegram Premium giveaways only
+    """
+
+    _type: "str" = field(default="messageGiveawayCompleted", init=False, repr=False)
+    giveaway_message_id: "int" = 0
+    winner_count: "int" = 0
+    is_star_giveaway: "bool" = False
+    unclaimed_prize_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "giveaway_message_id": self.giveaway_message_id,
+            "winner_count": self.winner_count,
+            "is_star_giveaway": self.is_star_giveaway,
+            "unclaimed_prize_count": self.unclaimed_prize_count,
+        }
+
+@dataclass(slots=True)
+class MessageGiveawayWinners(MessageContent):
+    """
+    A giveaway with public winners has been completed for the chat
+
+    :param boosted_chat_id: Identifier of the supergroup or channel chat, which was automatically boosted by the winners of the giveaway
+    :param giveaway_message_id: Identifier of the message with the giveaway in the boosted chat
+    :param additional_chat_count: Number of other chats that participated in the giveaway
+    :param actual_winners_selection_date: Point in time (Unix timestamp) when the winners were selected. May be bigger than winners selection date specified in parameters of the giveaway
+    :param only_new_members: True, if only new members of the chats were eligible for the giveaway
+    :param was_refunded: True, if the giveaway was canceled and was fully refunded
+    :param prize: Prize of the giveaway
+    :param prize_description: Additional description of the giveaway prize
+    :param winner_count: Total number of winners in the giveaway
+    :param winner_user_ids: Up to 100 user identifiers of the winners of the giveaway
+    :param unclaimed_prize_count: Number of undistributed prizes; for Telegram Premium giveaways only
+    """
+
+    _type: "str" = field(default="messageGiveawayWinners", init=False, repr=False)
+    boosted_chat_id: "int" = 0
+    giveaway_message_id: "int" = 0
+    additional_chat_count: "int" = 0
+    actual_winners_selection_date: "int" = 0
+    only_new_members: "bool" = False
+    was_refunded: "bool" = False
+    prize: "GiveawayPrize | None" = None
+    prize_description: "str" = ""
+    winner_count: "int" = 0
+    winner_user_ids: "list[int] | None" = None
+    unclaimed_prize_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "boosted_chat_id": self.boosted_chat_id,
+            "giveaway_message_id": self.giveaway_message_id,
+            "additional_chat_count": self.additional_chat_count,
+            "actual_winners_selection_date": self.actual_winners_selection_date,
+            "only_new_members": self.only_new_members,
+            "was_refunded": self.was_refunded,
+            "prize": self.prize._to_json_dict() if self.prize is not None else None,
+            "prize_description": self.prize_description,
+            "winner_count": self.winner_count,
+            "winner_user_ids": self.winner_user_ids,
+            "unclaimed_prize_count": self.unclaimed_prize_count,
+        }
+
+@dataclass(slots=True)
+class MessageGiftedStars(MessageContent):
+    """
+    Telegram Stars were gifted to a user
+
+    :param gifter_user_id: The identifier of a user that gifted Telegram Stars; 0 if the gift was anonymous or is outgoing
+    :param receiver_user_id: The identifier of a user that received Telegram Stars; 0 if the gift is incoming
+    :param currency: Currency for the paid amount
+    :param amount: The paid amount, in the smallest units of the currency
+    :param cryptocurrency: Cryptocurrency used to pay for the gift; may be empty if none
+    :param cryptocurrency_amount: The paid amount, in the smallest units of the cryptocurrency; 0 if none
+    :param star_count: Number of Telegram Stars that were gifted
+    :param transaction_id: Identifier of the transaction for Telegram Stars purchase; for receiver only
+    :param sticker: A sticker to be shown in the message; may be null if unknown
+    """
+
+    _type: "str" = field(default="messageGiftedStars", init=False, repr=False)
+    gifter_user_id: "int" = 0
+    receiver_user_id: "int" = 0
+    currency: "str" = ""
+    amount: "int" = 0
+    cryptocurrency: "str" = ""
+    cryptocurrency_amount: "int" = 0
+    star_count: "int" = 0
+    transaction_id: "str" = ""
+    sticker: "Sticker | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "gifter_user_id": self.gifter_user_id,
+            "receiver_user_id": self.receiver_user_id,
+            "currency": self.currency,
+            "amount": self.amount,
+            "cryptocurrency": self.cryptocurrency,
+            "cryptocurrency_amount": self.cryptocurrency_amount,
+            "star_count": self.star_count,
+            "transaction_id": self.transaction_id,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessageGiftedTon(MessageContent):
+    """
+    Toncoins were gifted to a user
+
+    :param gifter_user_id: The identifier of a user that gifted Toncoins; 0 if the gift was anonymous or is outgoing
+    :param receiver_user_id: The identifier of a user that received Toncoins; 0 if the gift is incoming
+    :param ton_amount: The received amount of Toncoins, in the smallest units of the cryptocurrency
+    :param transaction_id: Identifier of the transaction for Toncoin credit; for receiver only
+    :param sticker: A sticker to be shown in the message; may be null if unknown
+    """
+
+    _type: "str" = field(default="messageGiftedTon", init=False, repr=False)
+    gifter_user_id: "int" = 0
+    receiver_user_id: "int" = 0
+    ton_amount: "int" = 0
+    transaction_id: "str" = ""
+    sticker: "Sticker | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "gifter_user_id": self.gifter_user_id,
+            "receiver_user_id": self.receiver_user_id,
+            "ton_amount": self.ton_amount,
+            "transaction_id": self.transaction_id,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessageGiveawayPrizeStars(MessageContent):
+    """
+    A Telegram Stars were received by the current user from a giveaway
+
+    :param star_count: Number of Telegram Stars that were received
+    :param transaction_id: Identifier of the transaction for Telegram Stars credit
+    :param boosted_chat_id: Identifier of the supergroup or channel chat, which was automatically boosted by the winners of the giveaway
+    :param giveaway_message_id: Identifier of the message with the giveaway in the boosted chat; can be 0 if the message was deleted
+    :param is_unclaimed: True, if the corresponding winner wasn't chosen and the Telegram Stars were received by the owner of the boosted chat
+    :param sticker: A sticker to be shown in the message; may be null if unknown
+    """
+
+    _type: "str" = field(default="messageGiveawayPrizeStars", init=False, repr=False)
+    star_count: "int" = 0
+    transaction_id: "str" = ""
+    boosted_chat_id: "int" = 0
+    giveaway_message_id: "int" = 0
+    is_unclaimed: "bool" = False
+    sticker: "Sticker | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "star_count": self.star_count,
+            "transaction_id": self.transaction_id,
+            "boosted_chat_id": self.boosted_chat_id,
+            "giveaway_message_id": self.giveaway_message_id,
+            "is_unclaimed": self.is_unclaimed,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessageGift(MessageContent):
+    """
+    A regular gift was received or sent by the current user, or the current user was notified about a channel gift
+
+    :param gift: The gift
+    :param sender_id: Sender of the gift
+    :param receiver_id: Receiver of the gift
+    :param received_gift_id: Unique identifier of the received gift for the current user; only for the receiver of the gift
+    :param text: Message added to the gift
+    :param sell_star_count: Number of Telegram Stars that can be claimed by the receiver instead of the regular gift; 0 if the gift can't be sold by the receiver
+    :param prepaid_upgrade_star_count: Number of Telegram Stars that were paid by the sender for the ability to upgrade the gift
+    :param is_private: True, if the sender and gift text are shown only to the gift receiver; otherwise, everyone will be able to see them
+    :param is_saved: True, if the gift is displayed on the user's or the channel's profile page; only for the receiver of the gift
+    :param can_be_upgraded: True, if the gift can be upgraded to a unique gift; only for the receiver of the gift
+    :param was_converted: True, if the gift was converted to Telegram Stars; only for the receiver of the gift
+    :param was_upgraded: True, if the gift was upgraded to a unique gift
+    :param was_refunded: True, if the gift was refunded and isn't available anymore
+    :param upgraded_received_gift_id: Identifier of the corresponding upgraded gift; may be empty if unknown. Use getReceivedGift to get information about the gift
+    """
+
+    _type: "str" = field(default="messageGift", init=False, repr=False)
+    gift: "Gift | None" = None
+    sender_id: "MessageSender | None" = None
+    receiver_id: "MessageSender | None" = None
+    received_gift_id: "str" = ""
+    text: "FormattedText | None" = None
+    sell_star_count: "int" = 0
+    prepaid_upgrade_star_count: "int" = 0
+    is_private: "bool" = False
+    is_saved: "bool" = False
+    can_be_upgraded: "bool" = False
+    was_converted: "bool" = False
+    was_upgraded: "bool" = False
+    was_refunded: "bool" = False
+    upgraded_received_gift_id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "gift": self.gift._to_json_dict() if self.gift is not None else None,
+            "sender_id": self.sender_id._to_json_dict() if self.sender_id is not None else None,
+            "receiver_id": self.receiver_id._to_json_dict() if self.receiver_id is not None else None,
+            "received_gift_id": self.received_gift_id,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "sell_star_count": self.sell_star_count,
+            "prepaid_upgrade_star_count": self.prepaid_upgrade_star_count,
+            "is_private": self.is_private,
+            "is_saved": self.is_saved,
+            "can_be_upgraded": self.can_be_upgraded,
+            "was_converted": self.was_converted,
+            "was_upgraded": self.was_upgraded,
+            "was_refunded": self.was_refunded,
+            "upgraded_received_gift_id": self.upgraded_received_gift_id,
+        }
+
+@dataclass(slots=True)
+class MessageUpgradedGift(MessageContent):
+    """
+    An upgraded gift was received or sent by the current user, or the current user was notified about a channel gift
+
+    :param gift: The gift
+    :param sender_id: Sender of the gift; may be null for anonymous gifts
+    :param receiver_id: Receiver of the gift
+    :param origin: Origin of the upgraded gift
+    :param received_gift_id: Unique identifier of the received gift for the current user; only for the receiver of the gift
+    :param is_saved: True, if the gift is displayed on the user's or the channel's profile page; only for the receiver of the gift
+    :param can_be_transferred: True, if the gift can be transferred to another owner; only for the receiver of the gift
+    :param was_transferred: True, if the gift has already been transferred to another owner; only for the receiver of the gift
+    :param transfer_star_count: Number of Telegram Stars that must be paid to transfer the upgraded gift; only for the receiver of the gift
+    :param next_transfer_date: Point in time (Unix timestamp) when the gift can be transferred to another owner; 0 if the gift can be transferred immediately or transfer isn't possible; only for the receiver of the gift
+    :param next_resale_date: Point in time (Unix timestamp) when the gift can be resold to another user; 0 if the gift can't be resold; only for the receiver of the gift
+    :param export_date: Point in time (Unix timestamp) when the gift can be transferred to the TON blockchain as an NFT; 0 if NFT export isn't possible; only for the receiver of the gift
+    """
+
+    _type: "str" = field(default="messageUpgradedGift", init=False, repr=False)
+    gift: "UpgradedGift | None" = None
+    sender_id: "MessageSender | None" = None
+    receiver_id: "MessageSender | None" = None
+    origin: "UpgradedGiftOrigin | None" = None
+    received_gift_id: "str" = ""
+    is_saved: "bool" = False
+    can_be_transferred: "bool" = False
+    was_transferred: "bool" = False
+    transfer_star_count: "int" = 0
+    next_transfer_date: "int" = 0
+    next_resale_date: "int" = 0
+    export_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "gift": self.gift._to_json_dict() if self.gift is not None else None,
+            "sender_id": self.sender_id._to_json_dict() if self.sender_id is not None else None,
+            "receiver_id": self.receiver_id._to_json_dict() if self.receiver_id is not None else None,
+            "origin": self.origin._to_json_dict() if self.origin is not None else None,
+            "received_gift_id": self.received_gift_id,
+            "is_saved": self.is_saved,
+            "can_be_transferred": self.can_be_transferred,
+            "was_transferred": self.was_transferred,
+            "transfer_star_count": self.transfer_star_count,
+            "next_transfer_date": self.next_transfer_date,
+            "next_resale_date": self.next_resale_date,
+            "export_date": self.export_date,
+        }
+
+@dataclass(slots=True)
+class MessageRefundedUpgradedGift(MessageContent):
+    """
+    A gift which purchase, upgrade or transfer were refunded
+
+    :param gift: The gift
+    :param sender_id: Sender of the gift
+    :param receiver_id: Receiver of the gift
+    :param is_upgrade: True, if the gift was obtained by upgrading of a previously received gift; otherwise, this is a transferred or resold gift
+    """
+
+    _type: "str" = field(default="messageRefundedUpgradedGift", init=False, repr=False)
+    gift: "Gift | None" = None
+    sender_id: "MessageSender | None" = None
+    receiver_id: "MessageSender | None" = None
+    is_upgrade: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "gift": self.gift._to_json_dict() if self.gift is not None else None,
+            "sender_id": self.sender_id._to_json_dict() if self.sender_id is not None else None,
+            "receiver_id": self.receiver_id._to_json_dict() if self.receiver_id is not None else None,
+            "is_upgrade": self.is_upgrade,
+        }
+
+@dataclass(slots=True)
+class MessagePaidMessagesRefunded(MessageContent):
+    """
+    Paid messages were refunded
+
+    :param message_count: The number of refunded messages
+    :param star_count: The number of refunded Telegram Stars
+    """
+
+    _type: "str" = field(default="messagePaidMessagesRefunded", init=False, repr=False)
+    message_count: "int" = 0
+    star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "message_count": self.message_count,
+            "star_count": self.star_count,
+        }
+
+@dataclass(slots=True)
+class MessagePaidMessagePriceChanged(MessageContent):
+    """
+    A price for paid messages was changed in the supergroup chat
+
+    :param paid_message_star_count: The new number of Telegram Stars that must be paid by non-administrator users of the supergroup chat for each sent message
+    """
+
+    _type: "str" = field(default="messagePaidMessagePriceChanged", init=False, repr=False)
+    paid_message_star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "paid_message_star_count": self.paid_message_star_count,
+        }
+
+@dataclass(slots=True)
+class MessageDirectMessagePriceChanged(MessageContent):
+    """
+    A price for direct messages was changed in the channel chat
+
+    :param is_enabled: True, if direct messages group was enabled for the channel; false otherwise
+    :param paid_message_star_count: The new number of Telegram Stars that must be paid by non-administrator users of the channel chat for each message sent to the direct messages group;
+     0 if the direct messages group was disabled or the messages are free
+    """
+
+    _type: "str" = field(default="messageDirectMessagePriceChanged", init=False, repr=False)
+    is_enabled: "bool" = False
+    paid_message_star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_enabled": self.is_enabled,
+            "paid_message_star_count": self.paid_message_star_count,
+        }
+
+@dataclass(slots=True)
+class MessageChecklistTasksDone(MessageContent):
+    """
+    Some tasks from a checklist were marked as done or not done
+
+    :param checklist_message_id: Identifier of the message with the checklist; can be 0 if the message was deleted
+    :param marked_as_done_task_ids: Identifiers of tasks that were marked as done
+    :param marked_as_not_done_task_ids: Identifiers of tasks that were marked as not done
+    """
+
+    _type: "str" = field(default="messageChecklistTasksDone", init=False, repr=False)
+    checklist_message_id: "int" = 0
+    marked_as_done_task_ids: "list[int] | None" = None
+    marked_as_not_done_task_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "checklist_message_id": self.checklist_message_id,
+            "marked_as_done_task_ids": self.marked_as_done_task_ids,
+            "marked_as_not_done_task_ids": self.marked_as_not_done_task_ids,
+        }
+
+@dataclass(slots=True)
+class MessageChecklistTasksAdded(MessageContent):
+    """
+    Some tasks were added to a checklist
+
+    :param checklist_message_id: Identifier of the message with the checklist; can be 0 if the message was deleted
+    :param tasks: List of tasks added to the checklist
+    """
+
+    _type: "str" = field(default="messageChecklistTasksAdded", init=False, repr=False)
+    checklist_message_id: "int" = 0
+    tasks: "list[ChecklistTask] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "checklist_message_id": self.checklist_message_id,
+            "tasks": _list_to_json(self.tasks),
+        }
+
+@dataclass(slots=True)
+class MessageSuggestedPostApprovalFailed(MessageContent):
+    """
+    Approval of suggested post has failed, because the user which proposed the post had no enough funds
+
+    :param suggested_post_message_id: Identifier of the message with the suggested post; can be 0 if the message was deleted
+    :param price: Price of the suggested post
+    """
+
+    _type: "str" = field(default="messageSuggestedPostApprovalFailed", init=False, repr=False)
+    suggested_post_message_id: "int" = 0
+    price: "SuggestedPostPrice | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "suggested_post_message_id": self.suggested_post_message_id,
+            "price": self.price._to_json_dict() if self.price is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessageSuggestedPostApproved(MessageContent):
+    """
+    A suggested post was approved
+
+    :param suggested_post_message_id: Identifier of the message with the suggested post; can be 0 if the message was deleted
+    :param price: Price of the suggested post; may be null if the post is non-paid
+    :param send_date: Point in time (Unix timestamp) when the post is expected to be published
+    """
+
+    _type: "str" = field(default="messageSuggestedPostApproved", init=False, repr=False)
+    suggested_post_message_id: "int" = 0
+    price: "SuggestedPostPrice | None" = None
+    send_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "suggested_post_message_id": self.suggested_post_message_id,
+            "price": self.price._to_json_dict() if self.price is not None else None,
+            "send_date": self.send_date,
+        }
+
+@dataclass(slots=True)
+class MessageSuggestedPostDeclined(MessageContent):
+    """
+    A suggested post was declined
+
+    :param suggested_post_message_id: Identifier of the message with the suggested post; can be 0 if the message was deleted
+    :param comment: Comment added by administrator of the channel when the post was declined
+    """
+
+    _type: "str" = field(default="messageSuggestedPostDeclined", init=False, repr=False)
+    suggested_post_message_id: "int" = 0
+    comment: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "suggested_post_message_id": self.suggested_post_message_id,
+            "comment": self.comment,
+        }
+
+@dataclass(slots=True)
+class MessageSuggestedPostPaid(MessageContent):
+    """
+    A suggested post was published for getOption("suggested_post_lifetime_min") seconds and payment for the post was received
+
+    :param suggested_post_message_id: Identifier of the message with the suggested post; can be 0 if the message was deleted
+    :param star_amount: The amount of received Telegram Stars
+    :param ton_amount: The amount of received Toncoins; in the smallest units of the cryptocurrency
+    """
+
+    _type: "str" = field(default="messageSuggestedPostPaid", init=False, repr=False)
+    suggested_post_message_id: "int" = 0
+    star_amount: "StarAmount | None" = None
+    ton_amount: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "suggested_post_message_id": self.suggested_post_message_id,
+            "star_amount": self.star_amount._to_json_dict() if self.star_amount is not None else None,
+            "ton_amount": self.ton_amount,
+        }
+
+@dataclass(slots=True)
+class MessageSuggestedPostRefunded(MessageContent):
+    """
+    A suggested post was refunded
+
+    :param suggested_post_message_id: Identifier of the message with the suggested post; can be 0 if the message was deleted
+    :param reason: Reason of the refund
+    """
+
+    _type: "str" = field(default="messageSuggestedPostRefunded", init=False, repr=False)
+    suggested_post_message_id: "int" = 0
+    reason: "SuggestedPostRefundReason | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "suggested_post_message_id": self.suggested_post_message_id,
+            "reason": self.reason._to_json_dict() if self.reason is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessageContactRegistered(MessageContent):
+    """
+    A contact has registered with Telegram
+
+    """
+
+    _type: "str" = field(default="messageContactRegistered", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageUsersShared(MessageContent):
+    """
+    The current user shared users, which were requested by the bot
+
+    :param users: The shared users
+    :param button_id: Identifier of the keyboard button with the request
+    """
+
+    _type: "str" = field(default="messageUsersShared", init=False, repr=False)
+    users: "list[SharedUser] | None" = None
+    button_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "users": _list_to_json(self.users),
+            "button_id": self.button_id,
+        }
+
+@dataclass(slots=True)
+class MessageChatShared(MessageContent):
+    """
+    The current user shared a chat, which was requested by the bot
+
+    :param chat: The shared chat
+    :param button_id: Identifier of the keyboard button with the request
+    """
+
+    _type: "str" = field(default="messageChatShared", init=False, repr=False)
+    chat: "SharedChat | None" = None
+    button_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat": self.chat._to_json_dict() if self.chat is not None else None,
+            "button_id": self.button_id,
+        }
+
+@dataclass(slots=True)
+class MessageBotWriteAccessAllowed(MessageContent):
+    """
+    The user allowed the bot to send messages
+
+    :param reason: The reason why the bot was allowed to write messages
+    """
+
+    _type: "str" = field(default="messageBotWriteAccessAllowed", init=False, repr=False)
+    reason: "BotWriteAccessAllowReason | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "reason": self.reason._to_json_dict() if self.reason is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessageWebAppDataSent(MessageContent):
+    """
+    Data from a Web App has been sent to a bot
+
+    :param button_text: Text of the keyboardButtonTypeWebApp button, which opened the Web App
+    """
+
+    _type: "str" = field(default="messageWebAppDataSent", init=False, repr=False)
+    button_text: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "button_text": self.button_text,
+        }
+
+@dataclass(slots=True)
+class MessageWebAppDataReceived(MessageContent):
+    """
+    Data from a Web App has been received; for bots only
+
+    :param button_text: Text of the keyboardButtonTypeWebApp button, which opened the Web App
+    :param data: The data
+    """
+
+    _type: "str" = field(default="messageWebAppDataReceived", init=False, repr=False)
+    button_text: "str" = ""
+    data: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "button_text": self.button_text,
+            "data": self.data,
+        }
+
+@dataclass(slots=True)
+class MessagePassportDataSent(MessageContent):
+    """
+    Telegram Passport data has been sent to a bot
+
+    :param types: List of Telegram Passport element types sent
+    """
+
+    _type: "str" = field(default="messagePassportDataSent", init=False, repr=False)
+    types: "list[PassportElementType] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "types": _list_to_json(self.types),
+        }
+
+@dataclass(slots=True)
+class MessagePassportDataReceived(MessageContent):
+    """
+    Telegram Passport data has been received; for bots only
+
+    :param elements: List of received Telegram Passport elements
+    :param credentials: Encrypted data credentials
+    """
+
+    _type: "str" = field(default="messagePassportDataReceived", init=False, repr=False)
+    elements: "list[EncryptedPassportElement] | None" = None
+    credentials: "EncryptedCredentials | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "elements": _list_to_json(self.elements),
+            "credentials": self.credentials._to_json_dict() if self.credentials is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessageProximityAlertTriggered(MessageContent):
+    """
+    A user in the chat came within proximity alert range
+
+    :param traveler_id: The identifier of a user or chat that triggered the proximity alert
+    :param watcher_id: The identifier of a user or chat that subscribed for the proximity alert
+    :param distance: The distance between the users
+    """
+
+    _type: "str" = field(default="messageProximityAlertTriggered", init=False, repr=False)
+    traveler_id: "MessageSender | None" = None
+    watcher_id: "MessageSender | None" = None
+    distance: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "traveler_id": self.traveler_id._to_json_dict() if self.traveler_id is not None else None,
+            "watcher_id": self.watcher_id._to_json_dict() if self.watcher_id is not None else None,
+            "distance": self.distance,
+        }
+
+@dataclass(slots=True)
+class MessageUnsupported(MessageContent):
+    """
+    A message content that is not supported in the current TDLib version
+
+    """
+
+    _type: "str" = field(default="messageUnsupported", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
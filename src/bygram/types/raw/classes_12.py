@@ -0,0 +1,1618 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import FormattedText, InputFile
+    from .classes_01 import Contact, InputChecklist, Location, PollType, Venue
+    from .classes_02 import InputSuggestedPostInfo
+    from .classes_08 import LinkPreviewOptions
+    from .classes_09 import Invoice
+
+@dataclass(slots=True)
+class TextEntityType(ObjectBase):
+    """
+    Represents a part of the text which must be formatted differently
+
+    """
+
+    _type: "str" = field(default="TextEntityType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TextEntityTypeMention(TextEntityType):
+    """
+    A mention of a user, a supergroup, or a channel by their username
+
+    """
+
+    _type: "str" = field(default="textEntityTypeMention", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TextEntityTypeHashtag(TextEntityType):
+    """
+    A hashtag text, beginning with "#" and optionally containing a chat username at the end
+
+    """
+
+    _type: "str" = field(default="textEntityTypeHashtag", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TextEntityTypeCashtag(TextEntityType):
+    """
+    A cashtag text, beginning with "$", consisting of capital English letters (e.g., "$USD"), and optionally containing a chat username at the end
+
+    """
+
+    _type: "str" = field(default="textEntityTypeCashtag", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TextEntityTypeBotCommand(TextEntityType):
+    """
+    A bot command, beginning with "/"
+
+    """
+
+    _type: "str" = field(default="textEntityTypeBotCommand", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TextEntityTypeUrl(TextEntityType):
+    """
+    An HTTP URL
+
+    """
+
+    _type: "str" = field(default="textEntityTypeUrl", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TextEntityTypeEmailAddress(TextEntityType):
+    """
+    An email address
+
+    """
+
+    _type: "str" = field(default="textEntityTypeEmailAddress", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TextEntityTypePhoneNumber(TextEntityType):
+    """
+    A phone number
+
+    """
+
+    _type: "str" = field(default="textEntityTypePhoneNumber", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TextEntityTypeBankCardNumber(TextEntityType):
+    """
+    A bank card number. The getBankCardInfo method can be used to get information about the bank card
+
+    """
+
+    _type: "str" = field(default="textEntityTypeBankCardNumber", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TextEntityTypeBold(TextEntityType):
+    """
+    A bold text
+
+    """
+
+    _type: "str" = field(default="textEntityTypeBold", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TextEntityTypeItalic(TextEntityType):
+    """
+    An italic text
+
+    """
+
+    _type: "str" = field(default="textEntityTypeItalic", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TextEntityTypeUnderline(TextEntityType):
+    """
+    An underlined text
+
+    """
+
+    _type: "str" = field(default="textEntityTypeUnderline", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TextEntityTypeStrikethrough(TextEntityType):
+    """
+    A strikethrough text
+
+    """
+
+    _type: "str" = field(default="textEntityTypeStrikethrough", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TextEntityTypeSpoiler(TextEntityType):
+    """
+    A spoiler text
+
+    """
+
+    _type: "str" = field(default="textEntityTypeSpoiler", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TextEntityTypeCode(TextEntityType):
+    """
+    Text that must be formatted as if inside a code HTML tag
+
+    """
+
+    _type: "str" = field(default="textEntityTypeCode", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TextEntityTypePre(TextEntityType):
+    """
+    Text that must be formatted as if inside a pre HTML tag
+
+    """
+
+    _type: "str" = field(default="textEntityTypePre", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TextEntityTypePreCode(TextEntityType):
+    """
+    Text that must be formatted as if inside pre, and code HTML tags
+
+    :param language: Programming language of the code; as defined by the sender
+    """
+
+    _type: "str" = field(default="textEntityTypePreCode", init=False, repr=False)
+    language: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "language": self.language,
+        }
+
+@dataclass(slots=True)
+class TextEntityTypeBlockQuote(TextEntityType):
+    """
+    Text that must be formatted as if inside a blockquote HTML tag; not supported in secret chats
+
+    """
+
+    _type: "str" = field(default="textEntityTypeBlockQuote", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TextEntityTypeExpandableBlockQuote(TextEntityType):
+    """
+    Text that must be formatted as if inside a blockquote HTML tag and collapsed by default to 3 lines with the ability to show full text; not supported in secret chats
+
+    """
+
+    _type: "str" = field(default="textEntityTypeExpandableBlockQuote", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TextEntityTypeTextUrl(TextEntityType):
+    """
+    A text description shown instead of a raw URL
+
+    :param url: HTTP or tg:// URL to be opened when the link is clicked
+    """
+
+    _type: "str" = field(default="textEntityTypeTextUrl", init=False, repr=False)
+    url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+        }
+
+@dataclass(slots=True)
+class TextEntityTypeMentionName(TextEntityType):
+    """
+    A text shows instead of a raw mention of the user (e.g., when the user has no username)
+
+    :param user_id: Identifier of the mentioned user
+    """
+
+    _type: "str" = field(default="textEntityTypeMentionName", init=False, repr=False)
+    user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+        }
+
+@dataclass(slots=True)
+class TextEntityTypeCustomEmoji(TextEntityType):
+    """
+    A custom emoji. The text behind a custom emoji must be an emoji. Only premium users can use premium custom emoji
+
+    :param custom_emoji_id: Unique identifier of the custom emoji
+    """
+
+    _type: "str" = field(default="textEntityTypeCustomEmoji", init=False, repr=False)
+    custom_emoji_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "custom_emoji_id": self.custom_emoji_id,
+        }
+
+@dataclass(slots=True)
+class TextEntityTypeMediaTimestamp(TextEntityType):
+    """
+    A media timestamp
+
+    :param media_timestamp: Timestamp from which a video/audio/video note/voice note/story playing must start, in seconds. The media can be in the content or the link preview of the current message, or in the same places in the replied message
+    """
+
+    _type: "str" = field(default="textEntityTypeMediaTimestamp", init=False, repr=False)
+    media_timestamp: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "media_timestamp": self.media_timestamp,
+        }
+
+@dataclass(slots=True)
+class InputThumbnail(ObjectBase):
+    """
+    A thumbnail to be sent along with a file; must be in JPEG or WEBP format for stickers, and less than 200 KB in size
+
+    :param thumbnail: Thumbnail file to send. Sending thumbnails by file_id is currently not supported
+    :param width: Thumbnail width, usually shouldn't exceed 320. Use 0 if unknown
+    :param height: Thumbnail height, usually shouldn't exceed 320. Use 0 if unknown
+    """
+
+    _type: "str" = field(default="inputThumbnail", init=False, repr=False)
+    thumbnail: "InputFile | None" = None
+    width: "int" = 0
+    height: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "thumbnail": self.thumbnail._to_json_dict() if self.thumbnail is not None else None,
+            "width": self.width,
+            "height": self.height,
+        }
+
+@dataclass(slots=True)
+class InputPaidMediaType(ObjectBase):
+    """
+    Describes type of paid media to sent
+
+    """
+
+    _type: "str" = field(default="InputPaidMediaType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InputPaidMediaTypePhoto(InputPaidMediaType):
+    """
+    The media is a photo. The photo must be at most 10 MB in size. The photo's width and height must not exceed 10000 in total. Width and height ratio must be at most 20
+
+    """
+
+    _type: "str" = field(default="inputPaidMediaTypePhoto", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InputPaidMediaTypeVideo(InputPaidMediaType):
+    """
+    The media is a video
+
+    :param cover: Cover of the video; pass null to skip cover uploading
+    :param start_timestamp: Timestamp from which the video playing must start, in seconds
+    :param duration: Duration of the video, in seconds
+    :param supports_streaming: True, if the video is expected to be streamed
+    """
+
+    _type: "str" = field(default="inputPaidMediaTypeVideo", init=False, repr=False)
+    cover: "InputFile | None" = None
+    start_timestamp: "int" = 0
+    duration: "int" = 0
+    supports_streaming: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "cover": self.cover._to_json_dict() if self.cover is not None else None,
+            "start_timestamp": self.start_timestamp,
+            "duration": self.duration,
+            "supports_streaming": self.supports_streaming,
+        }
+
+@dataclass(slots=True)
+class InputPaidMedia(ObjectBase):
+    """
+    Describes a paid media to be sent
+
+    :param type: Type of the media
+    :param media: Photo or video to be sent
+    :param thumbnail: Media thumbnail; pass null to skip thumbnail uploading
+    :param added_sticker_file_ids: File identifiers of the stickers added to the media, if applicable
+    :param width: Media width
+    :param height: Media height
+    """
+
+    _type: "str" = field(default="inputPaidMedia", init=False, repr=False)
+    type: "InputPaidMediaType | None" = None
+    media: "InputFile | None" = None
+    thumbnail: "InputThumbnail | None" = None
+    added_sticker_file_ids: "list[int] | None" = None
+    width: "int" = 0
+    height: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "media": self.media._to_json_dict() if self.media is not None else None,
+            "thumbnail": self.thumbnail._to_json_dict() if self.thumbnail is not None else None,
+            "added_sticker_file_ids": self.added_sticker_file_ids,
+            "width": self.width,
+            "height": self.height,
+        }
+
+@dataclass(slots=True)
+class MessageSchedulingState(ObjectBase):
+    """
+    Contains information about the time when a scheduled message will be sent
+
+    """
+
+    _type: "str" = field(default="MessageSchedulingState", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageSchedulingStateSendAtDate(MessageSchedulingState):
+    """
+    The message will be sent at the specified date
+
+    :param send_date: Point in time (Unix timestamp) when the message will be sent. The date must be within 367 days in the future
+    """
+
+    _type: "str" = field(default="messageSchedulingStateSendAtDate", init=False, repr=False)
+    send_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "send_date": self.send_date,
+        }
+
+@dataclass(slots=True)
+class MessageSchedulingStateSendWhenOnline(MessageSchedulingState):
+    """
+    The message will be sent when the other user is online. Applicable to private chats only and when the exact online status of the other user is known
+
+    """
+
+    _type: "str" = field(default="messageSchedulingStateSendWhenOnline", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageSchedulingStateSendWhenVideoProcessed(MessageSchedulingState):
+    """
+    The message will be sent when the video in the message is converted and optimized; can be used only by the server
+
+    :param send_date: Approximate point in time (Unix timestamp) when the message is expected to be sent
+    """
+
+    _type: "str" = field(default="messageSchedulingStateSendWhenVideoProcessed", init=False, repr=False)
+    send_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "send_date": self.send_date,
+        }
+
+@dataclass(slots=True)
+class MessageSelfDestructType(ObjectBase):
+    """
+    Describes when a message will be self-destructed
+
+    """
+
+    _type: "str" = field(default="MessageSelfDestructType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageSelfDestructTypeTimer(MessageSelfDestructType):
+    """
+    The message will be self-destructed in the specified time after its content was opened
+
+    :param self_destruct_time: The message's self-destruct time, in seconds; must be between 0 and 60 in private chats
+    """
+
+    _type: "str" = field(default="messageSelfDestructTypeTimer", init=False, repr=False)
+    self_destruct_time: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "self_destruct_time": self.self_destruct_time,
+        }
+
+@dataclass(slots=True)
+class MessageSelfDestructTypeImmediately(MessageSelfDestructType):
+    """
+    The message can be opened only once and will be self-destructed once closed
+
+    """
+
+    _type: "str" = field(default="messageSelfDestructTypeImmediately", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageSendOptions(ObjectBase):
+    """
+    Options to be used when a message is sent
+
+    :param direct_messages_chat_topic_id: Unique identifier of the topic in a channel direct messages chat administered by the current user; pass 0 if the chat isn't a channel direct messages chat administered by the current user
+    :param suggested_post_info: Information about the suggested post; pass null if none. For messages to channel direct messages chat only. Applicable only to sendMessage and addOffer
+    :param disable_notification: Pass true to disable notification for the message
+    :param from_background: Pass true if the message is sent from the background
+    :param protect_content: Pass true if the content of the message must be protected from forwarding and saving; for bots only
+    :param allow_paid_broadcast: Pass true to allow the message to ignore regular broadcast limits for a small fee; for bots only
+    :param paid_message_star_count: The number of Telegram Stars the user agreed to pay to send the messages
+    :param update_order_of_installed_sticker_sets: Pass true if the user explicitly chosen a sticker or a custom emoji from an installed sticker set; applicable only to sendMessage and sendMessageAlbum
+    :param scheduling_state: Message scheduling state; pass null to send message immediately. Messages sent to a secret chat, to a chat with paid messages, to a channel direct messages chat,
+     live location messages and self-destructing messages can't be scheduled
+    :param effect_id: Identifier of the effect to apply to the message; pass 0 if none; applicable only to sendMessage and sendMessageAlbum in private chats
+    :param sending_id: Non-persistent identifier, which will be returned back in messageSendingStatePending object and can be used to match sent messages and corresponding updateNewMessage updates
+    :param only_preview: Pass true to get a fake message instead of actually sending them
+    """
+
+    _type: "str" = field(default="messageSendOptions", init=False, repr=False)
+    direct_messages_chat_topic_id: "int" = 0
+    suggested_post_info: "InputSuggestedPostInfo | None" = None
+    disable_notification: "bool" = False
+    from_background: "bool" = False
+    protect_content: "bool" = False
+    allow_paid_broadcast: "bool" = False
+    paid_message_star_count: "int" = 0
+    update_order_of_installed_sticker_sets: "bool" = False
+    scheduling_state: "MessageSchedulingState | None" = None
+    effect_id: "int" = 0
+    sending_id: "int" = 0
+    only_preview: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "direct_messages_chat_topic_id": self.direct_messages_chat_topic_id,
+            "suggested_post_info": self.suggested_post_info._to_json_dict() if self.suggested_post_info is not None else None,
+            "disable_notification": self.disable_notification,
+            "from_background": self.from_background,
+            "protect_content": self.protect_content,
+            "allow_paid_broadcast": self.allow_paid_broadcast,
+            "paid_message_star_count": self.paid_message_star_count,
+            "update_order_of_installed_sticker_sets": self.update_order_of_installed_sticker_sets,
+            "scheduling_state": self.scheduling_state._to_json_dict() if self.scheduling_state is not None else None,
+            "effect_id": self.effect_id,
+            "sending_id": self.sending_id,
+            "only_preview": self.only_preview,
+        }
+
+@dataclass(slots=True)
+class MessageCopyOptions(ObjectBase):
+    """
+    Options to be used when a message content is copied without reference to the original sender. Service messages, messages with messageInvoice, messagePaidMedia, messageGiveaway, or messageGiveawayWinners content can't be copied
+
+    :param send_copy: True, if content of the message needs to be copied without reference to the original sender. Always true if the message is forwarded to a secret chat or is local.
+     Use messageProperties.can_be_copied and messageProperties.can_be_copied_to_secret_chat to check whether the message is suitable
+    :param replace_caption: True, if media caption of the message copy needs to be replaced. Ignored if send_copy is false
+    :param new_caption: New message caption; pass null to copy message without caption. Ignored if replace_caption is false
+    :param new_show_caption_above_media: True, if new caption must be shown above the media; otherwise, new caption must be shown below the media; not supported in secret chats. Ignored if replace_caption is false
+    """
+
+    _type: "str" = field(default="messageCopyOptions", init=False, repr=False)
+    send_copy: "bool" = False
+    replace_caption: "bool" = False
+    new_caption: "FormattedText | None" = None
+    new_show_caption_above_media: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "send_copy": self.send_copy,
+            "replace_caption": self.replace_caption,
+            "new_caption": self.new_caption._to_json_dict() if self.new_caption is not None else None,
+            "new_show_caption_above_media": self.new_show_caption_above_media,
+        }
+
+@dataclass(slots=True)
+class InputMessageContent(ObjectBase):
+    """
+    The content of a message to send
+
+    """
+
+    _type: "str" = field(default="InputMessageContent", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InputMessageText(InputMessageContent):
+    """
+    A text message
+
+    :param text: Formatted text to be sent; 0-getOption("message_text_length_max") characters. Only Bold, Italic, Underline, Strikethrough, Spoiler, CustomEmoji, BlockQuote, ExpandableBlockQuote,
+     Code, Pre, PreCode, TextUrl and MentionName entities are allowed to be specified manually
+    :param link_preview_options: Options to be used for generation of a link preview; may be null if none; pass null to use default link preview options
+    :param clear_draft: True, if a chat message draft must be deleted
+    """
+
+    _type: "str" = field(default="inputMessageText", init=False, repr=False)
+    text: "FormattedText | None" = None
+    link_preview_options: "LinkPreviewOptions | None" = None
+    clear_draft: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "link_preview_options": self.link_preview_options._to_json_dict() if self.link_preview_options is not None else None,
+            "clear_draft": self.clear_draft,
+        }
+
+@dataclass(slots=True)
+class InputMessageAnimation(InputMessageContent):
+    """
+    An animation message (GIF-style).
+
+    :param animation: Animation file to be sent
+    :param thumbnail: Animation thumbnail; pass null to skip thumbnail uploading
+    :param added_sticker_file_ids: File identifiers of the stickers added to the animation, if applicable
+    :param duration: Duration of the animation, in seconds
+    :param width: Width of the animation; may be replaced by the server
+    :param height: Height of the animation; may be replaced by the server
+    :param caption: Animation caption; pass null to use an empty caption; 0-getOption("message_caption_length_max") characters
+    :param show_caption_above_media: True, if the caption must be shown above the animation; otherwise, the caption must be shown below the animation; not supported in secret chats
+    :param has_spoiler: True, if the animation preview must be covered by a spoiler animation; not supported in secret chats
+    """
+
+    _type: "str" = field(default="inputMessageAnimation", init=False, repr=False)
+    animation: "InputFile | None" = None
+    thumbnail: "InputThumbnail | None" = None
+    added_sticker_file_ids: "list[int] | None" = None
+    duration: "int" = 0
+    width: "int" = 0
+    height: "int" = 0
+    caption: "FormattedText | None" = None
+    show_caption_above_media: "bool" = False
+    has_spoiler: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "animation": self.animation._to_json_dict() if self.animation is not None else None,
+            "thumbnail": self.thumbnail._to_json_dict() if self.thumbnail is not None else None,
+            "added_sticker_file_ids": self.added_sticker_file_ids,
+            "duration": self.duration,
+            "width": self.width,
+            "height": self.height,
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+            "show_caption_above_media": self.show_caption_above_media,
+            "has_spoiler": self.has_spoiler,
+        }
+
+@dataclass(slots=True)
+class InputMessageAudio(InputMessageContent):
+    """
+    An audio message
+
+    :param audio: Audio file to be sent
+    :param album_cover_thumbnail: Thumbnail of the cover for the album; pass null to skip thumbnail uploading
+    :param duration: Duration of the audio, in seconds; may be replaced by the server
+    :param title: Title of the audio; 0-64 characters; may be replaced by the server
+    :param performer: Performer of the audio; 0-64 characters, may be replaced by the server
+    :param caption: Audio caption; pass null to use an empty caption; 0-getOption("message_caption_length_max") characters
+    """
+
+    _type: "str" = field(default="inputMessageAudio", init=False, repr=False)
+    audio: "InputFile | None" = None
+    album_cover_thumbnail: "InputThumbnail | None" = None
+    duration: "int" = 0
+    title: "str" = ""
+    performer: "str" = ""
+    caption: "FormattedText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "audio": self.audio._to_json_dict() if self.audio is not None else None,
+            "album_cover_thumbnail": self.album_cover_thumbnail._to_json_dict() if self.album_cover_thumbnail is not None else None,
+            "duration": self.duration,
+            "title": self.title,
+            "performer": self.performer,
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputMessageDocument(InputMessageContent):
+    """
+    A document message (general file)
+
+    :param document: Document to be sent
+    :param thumbnail: Document thumbnail; pass null to skip thumbnail uploading
+    :param disable_content_type_detection: Pass true to disable automatic file type detection and send the document as a file. Always true for files sent to secret chats
+    :param caption: Document caption; pass null to use an empty caption; 0-getOption("message_caption_length_max") characters
+    """
+
+    _type: "str" = field(default="inputMessageDocument", init=False, repr=False)
+    document: "InputFile | None" = None
+    thumbnail: "InputThumbnail | None" = None
+    disable_content_type_detection: "bool" = False
+    caption: "FormattedText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "document": self.document._to_json_dict() if self.document is not None else None,
+            "thumbnail": self.thumbnail._to_json_dict() if self.thumbnail is not None else None,
+            "disable_content_type_detection": self.disable_content_type_detection,
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputMessagePaidMedia(InputMessageContent):
+    """
+    A message with paid media; can be used only in channel chats with supergroupFullInfo.has_paid_media_allowed
+
+    :param star_count: The number of Telegram Stars that must be paid to see the media; 1-getOption("paid_media_message_star_count_max")
+    :param paid_media: The content of the paid media
+    :param caption: Message caption; pass null to use an empty caption; 0-getOption("message_caption_length_max") characters
+    :param show_caption_above_media: True, if the caption must be shown above the media; otherwise, the caption must be shown below the media; not supported in secret chats
+    :param payload: Bot-provided data for the paid media; bots only
+    """
+
+    _type: "str" = field(default="inputMessagePaidMedia", init=False, repr=False)
+    star_count: "int" = 0
+    paid_media: "list[InputPaidMedia] | None" = None
+    caption: "FormattedText | None" = None
+    show_caption_above_media: "bool" = False
+    payload: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "star_count": self.star_count,
+            "paid_media": _list_to_json(self.paid_media),
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+            "show_caption_above_media": self.show_caption_above_media,
+            "payload": self.payload,
+        }
+
+@dataclass(slots=True)
+class InputMessagePhoto(InputMessageContent):
+    """
+    A photo message
+
+    :param photo: Photo to send. The photo must be at most 10 MB in size. The photo's width and height must not exceed 10000 in total. Width and height ratio must be at most 20
+    :param thumbnail: Photo thumbnail to be sent; pass null to skip thumbnail uploading. The thumbnail is sent to the other party only in secret chats
+    :param added_sticker_file_ids: File identifiers of the stickers added to the photo, if applicable
+    :param width: Photo width
+    :param height: Photo height
+    :param caption: Photo caption; pass null to use an empty caption; 0-getOption("message_caption_length_max") characters
+    :param show_caption_above_media: True, if the caption must be shown above the photo; otherwise, the caption must be shown below the photo; not supported in secret chats
+    :param self_destruct_type: Photo self-destruct type; pass null if none; private chats only
+    :param has_spoiler: True, if the photo preview must be covered by a spoiler animation; not supported in secret chats
+    """
+
+    _type: "str" = field(default="inputMessagePhoto", init=False, repr=False)
+    photo: "InputFile | None" = None
+    thumbnail: "InputThumbnail | None" = None
+    added_sticker_file_ids: "list[int] | None" = None
+    width: "int" = 0
+    height: "int" = 0
+    caption: "FormattedText | None" = None
+    show_caption_above_media: "bool" = False
+    self_destruct_type: "MessageSelfDestructType | None" = None
+    has_spoiler: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+            "thumbnail": self.thumbnail._to_json_dict() if self.thumbnail is not None else None,
+            "added_sticker_file_ids": self.added_sticker_file_ids,
+            "width": self.width,
+            "height": self.height,
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+            "show_caption_above_media": self.show_caption_above_media,
+            "self_destruct_type": self.self_destruct_type._to_json_dict() if self.self_destruct_type is not None else None,
+            "has_spoiler": self.has_spoiler,
+        }
+
+@dataclass(slots=True)
+class InputMessageSticker(InputMessageContent):
+    """
+    A sticker message
+
+    :param sticker: Sticker to be sent
+    :param thumbnail: Sticker thumbnail; pass null to skip thumbnail uploading
+    :param width: Sticker width
+    :param height: Sticker height
+    :param emoji: Emoji used to choose the sticker
+    """
+
+    _type: "str" = field(default="inputMessageSticker", init=False, repr=False)
+    sticker: "InputFile | None" = None
+    thumbnail: "InputThumbnail | None" = None
+    width: "int" = 0
+    height: "int" = 0
+    emoji: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+            "thumbnail": self.thumbnail._to_json_dict() if self.thumbnail is not None else None,
+            "width": self.width,
+            "height": self.height,
+            "emoji": self.emoji,
+        }
+
+@dataclass(slots=True)
+class InputMessageVideo(InputMessageContent):
+    """
+    A video message
+
+    :param video: Video to be sent. The video is expected to be re-encoded to MPEG4 format with H.264 codec by the sender
+    :param thumbnail: Video thumbnail; pass null to skip thumbnail uploading
+    :param cover: Cover of the video; pass null to skip cover uploading; not supported in secret chats and for self-destructing messages
+    :param start_timestamp: Timestamp from which the video playing must start, in seconds
+    :param added_sticker_file_ids: File identifiers of the stickers added to the video, if applicable
+    :param duration: Duration of the video, in seconds
+    :param width: Video width
+    :param height: Video height
+    :param supports_streaming: True, if the video is expected to be streamed
+    :param caption: Video caption; pass null to use an empty caption; 0-getOption("message_caption_length_max") characters
+    :param show_caption_above_media: True, if the caption must be shown above the video; otherwise, the caption must be shown below the video; not supported in secret chats
+    :param self_destruct_type: Video self-destruct type; pass null if none; private chats only
+    :param has_spoiler: True, if the video preview must be covered by a spoiler animation; not supported in secret chats
+    """
+
+    _type: "str" = field(default="inputMessageVideo", init=False, repr=False)
+    video: "InputFile | None" = None
+    thumbnail: "InputThumbnail | None" = None
+    cover: "InputFile | None" = None
+    start_timestamp: "int" = 0
+    added_sticker_file_ids: "list[int] | None" = None
+    duration: "int" = 0
+    width: "int" = 0
+    height: "int" = 0
+    supports_streaming: "bool" = False
+    caption: "FormattedText | None" = None
+    show_caption_above_media: "bool" = False
+    self_destruct_type: "MessageSelfDestructType | None" = None
+    has_spoiler: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "video": self.video._to_json_dict() if self.video is not None else None,
+            "thumbnail": self.thumbnail._to_json_dict() if self.thumbnail is not None else None,
+            "cover": self.cover._to_json_dict() if self.cover is not None else None,
+            "start_timestamp": self.start_timestamp,
+            "added_sticker_file_ids": self.added_sticker_file_ids,
+            "duration": self.duration,
+            "width": self.width,
+            "height": self.height,
+            "supports_streaming": self.supports_streaming,
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+            "show_caption_above_media": self.show_caption_above_media,
+            "self_destruct_type": self.self_destruct_type._to_json_dict() if self.self_destruct_type is not None else None,
+            "has_spoiler": self.has_spoiler,
+        }
+
+@dataclass(slots=True)
+class InputMessageVideoNote(InputMessageContent):
+    """
+    A video note message
+
+    :param video_note: Video note to be sent. The video is expected to be encoded to MPEG4 format with H.264 codec and have no data outside of the visible circle
+    :param thumbnail: Video thumbnail; may be null if empty; pass null to skip thumbnail uploading
+    :param duration: Duration of the video, in seconds; 0-60
+    :param length: Video width and height; must be positive and not greater than 640
+    :param self_destruct_type: Video note self-destruct type; may be null if none; pass null if none; private chats only
+    """
+
+    _type: "str" = field(default="inputMessageVideoNote", init=False, repr=False)
+    video_note: "InputFile | None" = None
+    thumbnail: "InputThumbnail | None" = None
+    duration: "int" = 0
+    length: "int" = 0
+    self_destruct_type: "MessageSelfDestructType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "video_note": self.video_note._to_json_dict() if self.video_note is not None else None,
+            "thumbnail": self.thumbnail._to_json_dict() if self.thumbnail is not None else None,
+            "duration": self.duration,
+            "length": self.length,
+            "self_destruct_type": self.self_destruct_type._to_json_dict() if self.self_destruct_type is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputMessageVoiceNote(InputMessageContent):
+    """
+    A voice note message
+
+    :param voice_note: Voice note to be sent. The voice note must be encoded with the Opus codec and stored inside an OGG container with a single audio channel, or be in MP3 or M4A format as regular audio
+    :param duration: Duration of the voice note, in seconds
+    :param waveform: Waveform representation of the voice note in 5-bit format
+    :param caption: Voice note caption; may be null if empty; pass null to use an empty caption; 0-getOption("message_caption_length_max") characters
+    :param self_destruct_type: Voice note self-destruct type; may be null if none; pass null if none; private chats only
+    """
+
+    _type: "str" = field(default="inputMessageVoiceNote", init=False, repr=False)
+    voice_note: "InputFile | None" = None
+    duration: "int" = 0
+    waveform: "bytes" = b""
+    caption: "FormattedText | None" = None
+    self_destruct_type: "MessageSelfDestructType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "voice_note": self.voice_note._to_json_dict() if self.voice_note is not None else None,
+            "duration": self.duration,
+            "waveform": _bytes_to_json(self.waveform),
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+            "self_destruct_type": self.self_destruct_type._to_json_dict() if self.self_destruct_type is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputMessageLocation(InputMessageContent):
+    """
+    A message with a location
+
+    :param location: Location to be sent
+    :param live_period: Period for which the location can be updated, in seconds; must be between 60 and 86400 for a temporary live location, 0x7FFFFFFF for permanent live location, and 0 otherwise
+    :param heading: For live locations, a direction in which the location moves, in degrees; 1-360. Pass 0 if unknown
+    :param proximity_alert_radius: For live locations, a maximum distance to another chat member for proximity alerts, in meters (0-100000). Pass 0 if the notification is disabled. Can't be enabled in channels and Saved Messages
+    """
+
+    _type: "str" = field(default="inputMessageLocation", init=False, repr=False)
+    location: "Location | None" = None
+    live_period: "int" = 0
+    heading: "int" = 0
+    proximity_alert_radius: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "location": self.location._to_json_dict() if self.location is not None else None,
+            "live_period": self.live_period,
+            "heading": self.heading,
+            "proximity_alert_radius": self.proximity_alert_radius,
+        }
+
+@dataclass(slots=True)
+class InputMessageVenue(InputMessageContent):
+    """
+    A message with information about a venue
+
+    :param venue: Venue to send
+    """
+
+    _type: "str" = field(default="inputMessageVenue", init=False, repr=False)
+    venue: "Venue | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "venue": self.venue._to_json_dict() if self.venue is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputMessageContact(InputMessageContent):
+    """
+    A message containing a user contact
+
+    :param contact: Contact to send
+    """
+
+    _type: "str" = field(default="inputMessageContact", init=False, repr=False)
+    contact: "Contact | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "contact": self.contact._to_json_dict() if self.contact is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputMessageDice(InputMessageContent):
+    """
+    A dice message
+
+    :param emoji: Emoji on which the dice throw animation is based
+    :param clear_draft: True, if the chat message draft must be deleted
+    """
+
+    _type: "str" = field(default="inputMessageDice", init=False, repr=False)
+    emoji: "str" = ""
+    clear_draft: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "emoji": self.emoji,
+            "clear_draft": self.clear_draft,
+        }
+
+@dataclass(slots=True)
+class InputMessageGame(InputMessageContent):
+    """
+    A message with a game; not supported for channels or secret chats
+
+    :param bot_user_id: User identifier of the bot that owns the game
+    :param game_short_name: Short name of the game
+    """
+
+    _type: "str" = field(default="inputMessageGame", init=False, repr=False)
+    bot_user_id: "int" = 0
+    game_short_name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "game_short_name": self.game_short_name,
+        }
+
+@dataclass(slots=True)
+class InputMessageInvoice(InputMessageContent):
+    """
+    A message with an invoice; can be used only by bots
+
+    :param invoice: Invoice
+    :param title: Product title; 1-32 characters
+    :param description: A message with an invoice; can be used only by bots
+    :param photo_url: Product photo URL; optional
+    :param photo_size: Product photo size
+    :param photo_width: Product photo width
+    :param photo_height: Product photo height
+    :param payload: The invoice payload
+    :param provider_token: Payment provider token; may be empty for payments in Telegram Stars
+    :param provider_data: JSON-encoded data about the invoice, which will be shared with the payment provider
+    :param start_parameter: Unique invoice bot deep link parameter for the generation of this invoice. If empty, it would be possible to pay directly from forwards of the invoice message
+    :param paid_media: The content of paid media attached to the invoice; pass null if none
+    :param paid_media_caption: Paid media caption; pass null to use an empty caption; 0-getOption("message_caption_length_max") characters
+    """
+
+    _type: "str" = field(default="inputMessageInvoice", init=False, repr=False)
+    invoice: "Invoice | None" = None
+    title: "str" = ""
+    description: "str" = ""
+    photo_url: "str" = ""
+    photo_size: "int" = 0
+    photo_width: "int" = 0
+    photo_height: "int" = 0
+    payload: "bytes" = b""
+    provider_token: "str" = ""
+    provider_data: "str" = ""
+    start_parameter: "str" = ""
+    paid_media: "InputPaidMedia | None" = None
+    paid_media_caption: "FormattedText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "invoice": self.invoice._to_json_dict() if self.invoice is not None else None,
+            "title": self.title,
+            "description": self.description,
+            "photo_url": self.photo_url,
+            "photo_size": self.photo_size,
+            "photo_width": self.photo_width,
+            "photo_height": self.photo_height,
+            "payload": _bytes_to_json(self.payload),
+            "provider_token": self.provider_token,
+            "provider_data": self.provider_data,
+            "start_parameter": self.start_parameter,
+            "paid_media": self.paid_media._to_json_dict() if self.paid_media is not None else None,
+            "paid_media_caption": self.paid_media_caption._to_json_dict() if self.paid_media_caption is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputMessagePoll(InputMessageContent):
+    """
+    A message with a poll. Polls can't be sent to secret chats and channel direct messages chats. Polls can be sent to a private chat only if the chat is a chat with a bot or the Saved Messages chat
+
+    :param question: Poll question; 1-255 characters (up to 300 characters for bots). Only custom emoji entities are allowed to be added and only by Premium users
+    :param options: List of poll answer options, 2-getOption("poll_answer_count_max") strings 1-100 characters each. Only custom emoji entities are allowed to be added and only by Premium users
+    :param is_anonymous: True, if the poll voters are anonymous. Non-anonymous polls can't be sent or forwarded to channels
+    :param type: Type of the poll
+    :param open_period: Amount of time the poll will be active after creation, in seconds; for bots only
+    :param close_date: Point in time (Unix timestamp) when the poll will automatically be closed; for bots only
+    :param is_closed: True, if the poll needs to be sent already closed; for bots only
+    """
+
+    _type: "str" = field(default="inputMessagePoll", init=False, repr=False)
+    question: "FormattedText | None" = None
+    options: "list[FormattedText] | None" = None
+    is_anonymous: "bool" = False
+    type: "PollType | None" = None
+    open_period: "int" = 0
+    close_date: "int" = 0
+    is_closed: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "question": self.question._to_json_dict() if self.question is not None else None,
+            "options": _list_to_json(self.options),
+            "is_anonymous": self.is_anonymous,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "open_period": self.open_period,
+            "close_date": self.close_date,
+            "is_closed": self.is_closed,
+        }
+
+@dataclass(slots=True)
+class InputMessageStory(InputMessageContent):
+    """
+    A message with a forwarded story. Stories can't be forwarded to secret chats. A story can be forwarded only if story.can_be_forwarded
+
+    :param story_poster_chat_id: Identifier of the chat that posted the story
+    :param story_id: Story identifier
+    """
+
+    _type: "str" = field(default="inputMessageStory", init=False, repr=False)
+    story_poster_chat_id: "int" = 0
+    story_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_poster_chat_id": self.story_poster_chat_id,
+            "story_id": self.story_id,
+        }
+
+@dataclass(slots=True)
+class InputMessageChecklist(InputMessageContent):
+    """
+    A message with a checklist. Checklists can't be sent to secret chats, channel chats and channel direct messages chats; for Telegram Premium users only
+
+    :param checklist: The checklist to send
+    """
+
+    _type: "str" = field(default="inputMessageChecklist", init=False, repr=False)
+    checklist: "InputChecklist | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "checklist": self.checklist._to_json_dict() if self.checklist is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputMessageForwarded(InputMessageContent):
+    """
+    A forwarded message
+
+    :param from_chat_id: Identifier for the chat this forwarded message came from
+    :param message_id: Identifier of the message to forward. A message can be forwarded only if messageProperties.can_be_forwarded
+    :param in_game_share: Pass true if a game message is being shared from a launched game; applies only to game messages
+    :param replace_video_start_timestamp: Pass true to replace video start timestamp in the forwarded message
+    :param new_video_start_timestamp: The new video start timestamp; ignored if replace_video_start_timestamp == false
+    :param copy_options: Options to be used to copy content of the message without reference to the original sender; pass null to forward the message as usual
+    """
+
+    _type: "str" = field(default="inputMessageForwarded", init=False, repr=False)
+    from_chat_id: "int" = 0
+    message_id: "int" = 0
+    in_game_share: "bool" = False
+    replace_video_start_timestamp: "bool" = False
+    new_video_start_timestamp: "int" = 0
+    copy_options: "MessageCopyOptions | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "from_chat_id": self.from_chat_id,
+            "message_id": self.message_id,
+            "in_game_share": self.in_game_share,
+            "replace_video_start_timestamp": self.replace_video_start_timestamp,
+            "new_video_start_timestamp": self.new_video_start_timestamp,
+            "copy_options": self.copy_options._to_json_dict() if self.copy_options is not None else None,
+        }
+
+@dataclass(slots=True)
+class MessageProperties(ObjectBase):
+    """
+    Contains properties of a message and describes actions that can be done with the message right now
+
+    :param can_add_offer: True, if an offer can be added to the message using addOffer
+    :param can_add_tasks: True, if tasks can be added to the message's checklist using addChecklistTasks if the current user has Telegram Premium subscription
+    :param can_be_approved: True, if the message is a suggested post that can be approved by the user using approveSuggestedPost
+    :param can_be_copied: True, if content of the message can be copied using inputMessageForwarded or forwardMessages with copy options
+    :param can_be_copied_to_secret_chat: True, if content of the message can be copied to a secret chat using inputMessageForwarded or forwardMessages with copy options
+    :param can_be_declined: True, if the message is a suggested post that can be declined by the user using declineSuggestedPost
+    :param can_be_deleted_only_for_self: True, if the message can be deleted only for the current user while other users will continue to see it using the method deleteMessages with revoke == false
+    :param can_be_deleted_for_all_users: True, if the message can be deleted for all users using the method deleteMessages with revoke == true
+    :param can_be_edited: True, if the message can be edited using the methods editMessageText, editMessageCaption, or editMessageReplyMarkup.
+     For live location, poll, and checklist messages this fields shows whether editMessageLiveLocation, stopPoll, or editMessageChecklist respectively can be used with this message
+    :param can_be_forwarded: True, if the message can be forwarded using inputMessageForwarded or forwardMessages without copy options
+    :param can_be_paid: True, if the message can be paid using inputInvoiceMessage
+    :param can_be_pinned: True, if the message can be pinned or unpinned in the chat using pinChatMessage or unpinChatMessage
+    :param can_be_replied: True, if the message can be replied in the same chat and forum topic using inputMessageReplyToMessage
+    :param can_be_replied_in_another_chat: True, if the message can be replied in another chat or forum topic using inputMessageReplyToExternalMessage
+    :param can_be_saved: True, if content of the message can be saved locally
+    :param can_be_shared_in_story: True, if the message can be shared in a story using inputStoryAreaTypeMessage
+    :param can_edit_media: True, if the message can be edited using the method editMessageMedia
+    :param can_edit_scheduling_state: True, if scheduling state of the message can be edited
+    :param can_edit_suggested_post_info: True, if another price or post send time can be suggested using addOffer
+    :param can_get_author: True, if author of the message sent on behalf of a chat can be received through getMessageAuthor
+    :param can_get_embedding_code: True, if code for message embedding can be received using getMessageEmbeddingCode
+    :param can_get_link: True, if a link can be generated for the message using getMessageLink
+    :param can_get_media_timestamp_links: True, if media timestamp links can be generated for media timestamp entities in the message text, caption or link preview description using getMessageLink
+    :param can_get_message_thread: True, if information about the message thread is available through getMessageThread and getMessageThreadHistory
+    :param can_get_read_date: True, if read date of the message can be received through getMessageReadDate
+    :param can_get_statistics: True, if message statistics are available through getMessageStatistics and message forwards can be received using getMessagePublicForwards
+    :param can_get_video_advertisements: True, if advertisements for video of the message can be received though getVideoMessageAdvertisements
+    :param can_get_viewers: True, if chat members already viewed the message can be received through getMessageViewers
+    :param can_mark_tasks_as_done: True, if tasks can be marked as done or not done in the message's checklist using markChecklistTasksAsDone if the current user has Telegram Premium subscription
+    :param can_recognize_speech: True, if speech can be recognized for the message through recognizeSpeech
+    :param can_report_chat: True, if the message can be reported using reportChat
+    :param can_report_reactions: True, if reactions on the message can be reported through reportMessageReactions
+    :param can_report_supergroup_spam: True, if the message can be reported using reportSupergroupSpam
+    :param can_set_fact_check: True, if fact check for the message can be changed through setMessageFactCheck
+    :param need_show_statistics: True, if message statistics must be available from context menu of the message
+    """
+
+    _type: "str" = field(default="messageProperties", init=False, repr=False)
+    can_add_offer: "bool" = False
+    can_add_tasks: "bool" = False
+    can_be_approved: "bool" = False
+    can_be_copied: "bool" = False
+    can_be_copied_to_secret_chat: "bool" = False
+    can_be_declined: "bool" = False
+    can_be_deleted_only_for_self: "bool" = False
+    can_be_deleted_for_all_users: "bool" = False
+    can_be_edited: "bool" = False
+    can_be_forwarded: "bool" = False
+    can_be_paid: "bool" = False
+    can_be_pinned: "bool" = False
+    can_be_replied: "bool" = False
+    can_be_replied_in_another_chat: "bool" = False
+    can_be_saved: "bool" = False
+    can_be_shared_in_story: "bool" = False
+    can_edit_media: "bool" = False
+    can_edit_scheduling_state: "bool" = False
+    can_edit_suggested_post_info: "bool" = False
+    can_get_author: "bool" = False
+    can_get_embedding_code: "bool" = False
+    can_get_link: "bool" = False
+    can_get_media_timestamp_links: "bool" = False
+    can_get_message_thread: "bool" = False
+    can_get_read_date: "bool" = False
+    can_get_statistics: "bool" = False
+    can_get_video_advertisements: "bool" = False
+    can_get_viewers: "bool" = False
+    can_mark_tasks_as_done: "bool" = False
+    can_recognize_speech: "bool" = False
+    can_report_chat: "bool" = False
+    can_report_reactions: "bool" = False
+    can_report_supergroup_spam: "bool" = False
+    can_set_fact_check: "bool" = False
+    need_show_statistics: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "can_add_offer": self.can_add_offer,
+            "can_add_tasks": self.can_add_tasks,
+            "can_be_approved": self.can_be_approved,
+            "can_be_copied": self.can_be_copied,
+            "can_be_copied_to_secret_chat": self.can_be_copied_to_secret_chat,
+            "can_be_declined": self.can_be_declined,
+            "can_be_deleted_only_for_self": self.can_be_deleted_only_for_self,
+            "can_be_deleted_for_all_users": self.can_be_deleted_for_all_users,
+            "can_be_edited": self.can_be_edited,
+            "can_be_forwarded": self.can_be_forwarded,
+            "can_be_paid": self.can_be_paid,
+            "can_be_pinned": self.can_be_pinned,
+            "can_be_replied": self.can_be_replied,
+            "can_be_replied_in_another_chat": self.can_be_replied_in_another_chat,
+            "can_be_saved": self.can_be_saved,
+            "can_be_shared_in_story": self.can_be_shared_in_story,
+            "can_edit_media": self.can_edit_media,
+            "can_edit_scheduling_state": self.can_edit_scheduling_state,
+            "can_edit_suggested_post_info": self.can_edit_suggested_post_info,
+            "can_get_author": self.can_get_author,
+            "can_get_embedding_code": self.can_get_embedding_code,
+            "can_get_link": self.can_get_link,
+            "can_get_media_timestamp_links": self.can_get_media_timestamp_links,
+            "can_get_message_thread": self.can_get_message_thread,
+            "can_get_read_date": self.can_get_read_date,
+            "can_get_statistics": self.can_get_statistics,
+            "can_get_video_advertisements": self.can_get_video_advertisements,
+            "can_get_viewers": self.can_get_viewers,
+            "can_mark_tasks_as_done": self.can_mark_tasks_as_done,
+            "can_recognize_speech": self.can_recognize_speech,
+            "can_report_chat": self.can_report_chat,
+            "can_report_reactions": self.can_report_reactions,
+            "can_report_supergroup_spam": self.can_report_supergroup_spam,
+            "can_set_fact_check": self.can_set_fact_check,
+            "need_show_statistics": self.need_show_statistics,
+        }
+
+@dataclass(slots=True)
+class SearchMessagesFilter(ObjectBase):
+    """
+    Represents a filter for message search results
+
+    """
+
+    _type: "str" = field(default="SearchMessagesFilter", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SearchMessagesFilterEmpty(SearchMessagesFilter):
+    """
+    Returns all found messages, no filter is applied
+
+    """
+
+    _type: "str" = field(default="searchMessagesFilterEmpty", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SearchMessagesFilterAnimation(SearchMessagesFilter):
+    """
+    Returns only animation messages
+
+    """
+
+    _type: "str" = field(default="searchMessagesFilterAnimation", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SearchMessagesFilterAudio(SearchMessagesFilter):
+    """
+    Returns only audio messages
+
+    """
+
+    _type: "str" = field(default="searchMessagesFilterAudio", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SearchMessagesFilterDocument(SearchMessagesFilter):
+    """
+    Returns only document messages
+
+    """
+
+    _type: "str" = field(default="searchMessagesFilterDocument", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SearchMessagesFilterPhoto(SearchMessagesFilter):
+    """
+    Returns only photo messages
+
+    """
+
+    _type: "str" = field(default="searchMessagesFilterPhoto", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SearchMessagesFilterVideo(SearchMessagesFilter):
+    """
+    Returns only video messages
+
+    """
+
+    _type: "str" = field(default="searchMessagesFilterVideo", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SearchMessagesFilterVoiceNote(SearchMessagesFilter):
+    """
+    Returns only voice note messages
+
+    """
+
+    _type: "str" = field(default="searchMessagesFilterVoiceNote", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SearchMessagesFilterPhotoAndVideo(SearchMessagesFilter):
+    """
+    Returns only photo and video messages
+
+    """
+
+    _type: "str" = field(default="searchMessagesFilterPhotoAndVideo", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SearchMessagesFilterUrl(SearchMessagesFilter):
+    """
+    Returns only messages containing URLs
+
+    """
+
+    _type: "str" = field(default="searchMessagesFilterUrl", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SearchMessagesFilterChatPhoto(SearchMessagesFilter):
+    """
+    Returns only messages containing chat photos
+
+    """
+
+    _type: "str" = field(default="searchMessagesFilterChatPhoto", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SearchMessagesFilterVideoNote(SearchMessagesFilter):
+    """
+    Returns only video note messages
+
+    """
+
+    _type: "str" = field(default="searchMessagesFilterVideoNote", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SearchMessagesFilterVoiceAndVideoNote(SearchMessagesFilter):
+    """
+    Returns only voice and video note messages
+
+    """
+
+    _type: "str" = field(default="searchMessagesFilterVoiceAndVideoNote", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SearchMessagesFilterMention(SearchMessagesFilter):
+    """
+    Returns only messages with mentions of the current user, or messages that are replies to their messages
+
+    """
+
+    _type: "str" = field(default="searchMessagesFilterMention", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SearchMessagesFilterUnreadMention(SearchMessagesFilter):
+    """
+    Returns only messages with unread mentions of the current user, or messages that are replies to their messages. When using this filter the results can't be additionally filtered by a query, a message thread or by the sending user
+
+    """
+
+    _type: "str" = field(default="searchMessagesFilterUnreadMention", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SearchMessagesFilterUnreadReaction(SearchMessagesFilter):
+    """
+    Returns only messages with unread reactions for the current user. When using this filter the results can't be additionally filtered by a query, a message thread or by the sending user
+
+    """
+
+    _type: "str" = field(default="searchMessagesFilterUnreadReaction", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SearchMessagesFilterFailedToSend(SearchMessagesFilter):
+    """
+    Returns only failed to send messages. This filter can be used only if the message database is used
+
+    """
+
+    _type: "str" = field(default="searchMessagesFilterFailedToSend", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SearchMessagesFilterPinned(SearchMessagesFilter):
+    """
+    Returns only pinned messages
+
+    """
+
+    _type: "str" = field(default="searchMessagesFilterPinned", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
@@ -0,0 +1,1210 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_01 import Location, Outline, Sticker, StickerType, Thumbnail, Venue
+    from .classes_05 import ReactionType
+    from .classes_09 import LocationAddress
+
+@dataclass(slots=True)
+class SearchMessagesChatTypeFilter(ObjectBase):
+    """
+    Represents a filter for type of the chats in which to search messages
+
+    """
+
+    _type: "str" = field(default="SearchMessagesChatTypeFilter", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SearchMessagesChatTypeFilterPrivate(SearchMessagesChatTypeFilter):
+    """
+    Returns only messages in private chats
+
+    """
+
+    _type: "str" = field(default="searchMessagesChatTypeFilterPrivate", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SearchMessagesChatTypeFilterGroup(SearchMessagesChatTypeFilter):
+    """
+    Returns only messages in basic group and supergroup chats
+
+    """
+
+    _type: "str" = field(default="searchMessagesChatTypeFilterGroup", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SearchMessagesChatTypeFilterChannel(SearchMessagesChatTypeFilter):
+    """
+    Returns only messages in channel chats
+
+    """
+
+    _type: "str" = field(default="searchMessagesChatTypeFilterChannel", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatAction(ObjectBase):
+    """
+    Describes the different types of activity in a chat
+
+    """
+
+    _type: "str" = field(default="ChatAction", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatActionTyping(ChatAction):
+    """
+    The user is typing a message
+
+    """
+
+    _type: "str" = field(default="chatActionTyping", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatActionRecordingVideo(ChatAction):
+    """
+    The user is recording a video
+
+    """
+
+    _type: "str" = field(default="chatActionRecordingVideo", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatActionUploadingVideo(ChatAction):
+    """
+    The user is uploading a video
+
+    :param progress: Upload progress, as a percentage
+    """
+
+    _type: "str" = field(default="chatActionUploadingVideo", init=False, repr=False)
+    progress: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "progress": self.progress,
+        }
+
+@dataclass(slots=True)
+class ChatActionRecordingVoiceNote(ChatAction):
+    """
+    The user is recording a voice note
+
+    """
+
+    _type: "str" = field(default="chatActionRecordingVoiceNote", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatActionUploadingVoiceNote(ChatAction):
+    """
+    The user is uploading a voice note
+
+    :param progress: Upload progress, as a percentage
+    """
+
+    _type: "str" = field(default="chatActionUploadingVoiceNote", init=False, repr=False)
+    progress: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "progress": self.progress,
+        }
+
+@dataclass(slots=True)
+class ChatActionUploadingPhoto(ChatAction):
+    """
+    The user is uploading a photo
+
+    :param progress: Upload progress, as a percentage
+    """
+
+    _type: "str" = field(default="chatActionUploadingPhoto", init=False, repr=False)
+    progress: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "progress": self.progress,
+        }
+
+@dataclass(slots=True)
+class ChatActionUploadingDocument(ChatAction):
+    """
+    The user is uploading a document
+
+    :param progress: Upload progress, as a percentage
+    """
+
+    _type: "str" = field(default="chatActionUploadingDocument", init=False, repr=False)
+    progress: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "progress": self.progress,
+        }
+
+@dataclass(slots=True)
+class ChatActionChoosingSticker(ChatAction):
+    """
+    The user is picking a sticker to send
+
+    """
+
+    _type: "str" = field(default="chatActionChoosingSticker", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatActionChoosingLocation(ChatAction):
+    """
+    The user is picking a location or venue to send
+
+    """
+
+    _type: "str" = field(default="chatActionChoosingLocation", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatActionChoosingContact(ChatAction):
+    """
+    The user is picking a contact to send
+
+    """
+
+    _type: "str" = field(default="chatActionChoosingContact", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatActionStartPlayingGame(ChatAction):
+    """
+    The user has started to play a game
+
+    """
+
+    _type: "str" = field(default="chatActionStartPlayingGame", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatActionRecordingVideoNote(ChatAction):
+    """
+    The user is recording a video note
+
+    """
+
+    _type: "str" = field(default="chatActionRecordingVideoNote", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatActionUploadingVideoNote(ChatAction):
+    """
+    The user is uploading a video note
+
+    :param progress: Upload progress, as a percentage
+    """
+
+    _type: "str" = field(default="chatActionUploadingVideoNote", init=False, repr=False)
+    progress: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "progress": self.progress,
+        }
+
+@dataclass(slots=True)
+class ChatActionWatchingAnimations(ChatAction):
+    """
+    The user is watching animations sent by the other party by clicking on an animated emoji
+
+    :param emoji: The animated emoji
+    """
+
+    _type: "str" = field(default="chatActionWatchingAnimations", init=False, repr=False)
+    emoji: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "emoji": self.emoji,
+        }
+
+@dataclass(slots=True)
+class ChatActionCancel(ChatAction):
+    """
+    The user has canceled the previous action
+
+    """
+
+    _type: "str" = field(default="chatActionCancel", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UserStatus(ObjectBase):
+    """
+    Describes the last time the user was online
+
+    """
+
+    _type: "str" = field(default="UserStatus", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UserStatusEmpty(UserStatus):
+    """
+    The user's status has never been changed
+
+    """
+
+    _type: "str" = field(default="userStatusEmpty", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UserStatusOnline(UserStatus):
+    """
+    The user is online
+
+    :param expires: Point in time (Unix timestamp) when the user's online status will expire
+    """
+
+    _type: "str" = field(default="userStatusOnline", init=False, repr=False)
+    expires: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "expires": self.expires,
+        }
+
+@dataclass(slots=True)
+class UserStatusOffline(UserStatus):
+    """
+    The user is offline
+
+    :param was_online: Point in time (Unix timestamp) when the user was last online
+    """
+
+    _type: "str" = field(default="userStatusOffline", init=False, repr=False)
+    was_online: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "was_online": self.was_online,
+        }
+
+@dataclass(slots=True)
+class UserStatusRecently(UserStatus):
+    """
+    The user was online recently
+
+    :param by_my_privacy_settings: Exact user's status is hidden because the current user enabled userPrivacySettingShowStatus privacy setting for the user and has no Telegram Premium
+    """
+
+    _type: "str" = field(default="userStatusRecently", init=False, repr=False)
+    by_my_privacy_settings: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "by_my_privacy_settings": self.by_my_privacy_settings,
+        }
+
+@dataclass(slots=True)
+class UserStatusLastWeek(UserStatus):
+    """
+    The user is offline, but was online last week
+
+    :param by_my_privacy_settings: Exact user's status is hidden because the current user enabled userPrivacySettingShowStatus privacy setting for the user and has no Telegram Premium
+    """
+
+    _type: "str" = field(default="userStatusLastWeek", init=False, repr=False)
+    by_my_privacy_settings: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "by_my_privacy_settings": self.by_my_privacy_settings,
+        }
+
+@dataclass(slots=True)
+class UserStatusLastMonth(UserStatus):
+    """
+    The user is offline, but was online last month
+
+    :param by_my_privacy_settings: Exact user's status is hidden because the current user enabled userPrivacySettingShowStatus privacy setting for the user and has no Telegram Premium
+    """
+
+    _type: "str" = field(default="userStatusLastMonth", init=False, repr=False)
+    by_my_privacy_settings: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "by_my_privacy_settings": self.by_my_privacy_settings,
+        }
+
+@dataclass(slots=True)
+class EmojiKeyword(ObjectBase):
+    """
+    Represents an emoji with its keyword
+
+    :param emoji: The emoji
+    :param keyword: The keyword
+    """
+
+    _type: "str" = field(default="emojiKeyword", init=False, repr=False)
+    emoji: "str" = ""
+    keyword: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "emoji": self.emoji,
+            "keyword": self.keyword,
+        }
+
+@dataclass(slots=True)
+class EmojiKeywords(ObjectBase):
+    """
+    Represents a list of emojis with their keywords
+
+    :param emoji_keywords: List of emojis with their keywords
+    """
+
+    _type: "str" = field(default="emojiKeywords", init=False, repr=False)
+    emoji_keywords: "list[EmojiKeyword] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "emoji_keywords": _list_to_json(self.emoji_keywords),
+        }
+
+@dataclass(slots=True)
+class Stickers(ObjectBase):
+    """
+    Represents a list of stickers
+
+    :param stickers: List of stickers
+    """
+
+    _type: "str" = field(default="stickers", init=False, repr=False)
+    stickers: "list[Sticker] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "stickers": _list_to_json(self.stickers),
+        }
+
+@dataclass(slots=True)
+class Emojis(ObjectBase):
+    """
+    Represents a list of emojis
+
+    :param emojis: List of emojis
+    """
+
+    _type: "str" = field(default="emojis", init=False, repr=False)
+    emojis: "list[str] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "emojis": self.emojis,
+        }
+
+@dataclass(slots=True)
+class StickerSet(ObjectBase):
+    """
+    Represents a sticker set
+
+    :param id: Identifier of the sticker set
+    :param title: Title of the sticker set
+    :param name: Name of the sticker set
+    :param thumbnail: Sticker set thumbnail in WEBP, TGS, or WEBM format with width and height 100; may be null. The file can be downloaded only before the thumbnail is changed
+    :param thumbnail_outline: Sticker set thumbnail's outline; may be null if unknown
+    :param is_owned: True, if the sticker set is owned by the current user
+    :param is_installed: True, if the sticker set has been installed by the current user
+    :param is_archived: True, if the sticker set has been archived. A sticker set can't be installed and archived simultaneously
+    :param is_official: True, if the sticker set is official
+    :param sticker_type: Type of the stickers in the set
+    :param needs_repainting: True, if stickers in the sticker set are custom emoji that must be repainted; for custom emoji sticker sets only
+    :param is_allowed_as_chat_emoji_status: True, if stickers in the sticker set are custom emoji that can be used as chat emoji status; for custom emoji sticker sets only
+    :param is_viewed: True for already viewed trending sticker sets
+    :param stickers: List of stickers in this set
+    :param emojis: A list of emojis corresponding to the stickers in the same order. The list is only for informational purposes, because a sticker is always sent with a fixed emoji from the corresponding Sticker object
+    """
+
+    _type: "str" = field(default="stickerSet", init=False, repr=False)
+    id: "int" = 0
+    title: "str" = ""
+    name: "str" = ""
+    thumbnail: "Thumbnail | None" = None
+    thumbnail_outline: "Outline | None" = None
+    is_owned: "bool" = False
+    is_installed: "bool" = False
+    is_archived: "bool" = False
+    is_official: "bool" = False
+    sticker_type: "StickerType | None" = None
+    needs_repainting: "bool" = False
+    is_allowed_as_chat_emoji_status: "bool" = False
+    is_viewed: "bool" = False
+    stickers: "list[Sticker] | None" = None
+    emojis: "list[Emojis] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "title": self.title,
+            "name": self.name,
+            "thumbnail": self.thumbnail._to_json_dict() if self.thumbnail is not None else None,
+            "thumbnail_outline": self.thumbnail_outline._to_json_dict() if self.thumbnail_outline is not None else None,
+            "is_owned": self.is_owned,
+            "is_installed": self.is_installed,
+            "is_archived": self.is_archived,
+            "is_official": self.is_official,
+            "sticker_type": self.sticker_type._to_json_dict() if self.sticker_type is not None else None,
+            "needs_repainting": self.needs_repainting,
+            "is_allowed_as_chat_emoji_status": self.is_allowed_as_chat_emoji_status,
+            "is_viewed": self.is_viewed,
+            "stickers": _list_to_json(self.stickers),
+            "emojis": _list_to_json(self.emojis),
+        }
+
+@dataclass(slots=True)
+class StickerSetInfo(ObjectBase):
+    """
+    Represents short information about a sticker set
+
+    :param id: Identifier of the sticker set
+    :param title: Title of the sticker set
+    :param name: Name of the sticker set
+    :param thumbnail: Sticker set thumbnail in WEBP, TGS, or WEBM format with width and height 100; may be null. The file can be downloaded only before the thumbnail is changed
+    :param thumbnail_outline: Sticker set thumbnail's outline; may be null if unknown
+    :param is_owned: True, if the sticker set is owned by the current user
+    :param is_installed: True, if the sticker set has been installed by the current user
+    :param is_archived: True, if the sticker set has been archived. A sticker set can't be installed and archived simultaneously
+    :param is_official: True, if the sticker set is official
+    :param sticker_type: Type of the stickers in the set
+    :param needs_repainting: True, if stickers in the sticker set are custom emoji that must be repainted; for custom emoji sticker sets only
+    :param is_allowed_as_chat_emoji_status: True, if stickers in the sticker set are custom emoji that can be used as chat emoji status; for custom emoji sticker sets only
+    :param is_viewed: True for already viewed trending sticker sets
+    :param size: Total number of stickers in the set
+    :param covers: Up to the first 5 stickers from the set, depending on the context. If the application needs more stickers the full sticker set needs to be requested
+    """
+
+    _type: "str" = field(default="stickerSetInfo", init=False, repr=False)
+    id: "int" = 0
+    title: "str" = ""
+    name: "str" = ""
+    thumbnail: "Thumbnail | None" = None
+    thumbnail_outline: "Outline | None" = None
+    is_owned: "bool" = False
+    is_installed: "bool" = False
+    is_archived: "bool" = False
+    is_official: "bool" = False
+    sticker_type: "StickerType | None" = None
+    needs_repainting: "bool" = False
+    is_allowed_as_chat_emoji_status: "bool" = False
+    is_viewed: "bool" = False
+    size: "int" = 0
+    covers: "list[Sticker] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "title": self.title,
+            "name": self.name,
+            "thumbnail": self.thumbnail._to_json_dict() if self.thumbnail is not None else None,
+            "thumbnail_outline": self.thumbnail_outline._to_json_dict() if self.thumbnail_outline is not None else None,
+            "is_owned": self.is_owned,
+            "is_installed": self.is_installed,
+            "is_archived": self.is_archived,
+            "is_official": self.is_official,
+            "sticker_type": self.sticker_type._to_json_dict() if self.sticker_type is not None else None,
+            "needs_repainting": self.needs_repainting,
+            "is_allowed_as_chat_emoji_status": self.is_allowed_as_chat_emoji_status,
+            "is_viewed": self.is_viewed,
+            "size": self.size,
+            "covers": _list_to_json(self.covers),
+        }
+
+@dataclass(slots=True)
+class StickerSets(ObjectBase):
+    """
+    Represents a list of sticker sets
+
+    :param total_count: Approximate total number of sticker sets found
+    :param sets: List of sticker sets
+    """
+
+    _type: "str" = field(default="stickerSets", init=False, repr=False)
+    total_count: "int" = 0
+    sets: "list[StickerSetInfo] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "sets": _list_to_json(self.sets),
+        }
+
+@dataclass(slots=True)
+class TrendingStickerSets(ObjectBase):
+    """
+    Represents a list of trending sticker sets
+
+    :param total_count: Approximate total number of trending sticker sets
+    :param sets: List of trending sticker sets
+    :param is_premium: True, if the list contains sticker sets with premium stickers
+    """
+
+    _type: "str" = field(default="trendingStickerSets", init=False, repr=False)
+    total_count: "int" = 0
+    sets: "list[StickerSetInfo] | None" = None
+    is_premium: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "sets": _list_to_json(self.sets),
+            "is_premium": self.is_premium,
+        }
+
+@dataclass(slots=True)
+class EmojiCategorySource(ObjectBase):
+    """
+    Describes source of stickers for an emoji category
+
+    """
+
+    _type: "str" = field(default="EmojiCategorySource", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class EmojiCategorySourceSearch(EmojiCategorySource):
+    """
+    The category contains a list of similar emoji to search for in getStickers and searchStickers for stickers, or getInlineQueryResults with the bot getOption("animation_search_bot_username") for animations
+
+    :param emojis: List of emojis to search for
+    """
+
+    _type: "str" = field(default="emojiCategorySourceSearch", init=False, repr=False)
+    emojis: "list[str] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "emojis": self.emojis,
+        }
+
+@dataclass(slots=True)
+class EmojiCategorySourcePremium(EmojiCategorySource):
+    """
+    The category contains premium stickers that must be found by getPremiumStickers
+
+    """
+
+    _type: "str" = field(default="emojiCategorySourcePremium", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class EmojiCategory(ObjectBase):
+    """
+    Describes an emoji category
+
+    :param name: Name of the category
+    :param icon: Custom emoji sticker, which represents icon of the category
+    :param source: Source of stickers for the emoji category
+    :param is_greeting: True, if the category must be shown first when choosing a sticker for the start page
+    """
+
+    _type: "str" = field(default="emojiCategory", init=False, repr=False)
+    name: "str" = ""
+    icon: "Sticker | None" = None
+    source: "EmojiCategorySource | None" = None
+    is_greeting: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name,
+            "icon": self.icon._to_json_dict() if self.icon is not None else None,
+            "source": self.source._to_json_dict() if self.source is not None else None,
+            "is_greeting": self.is_greeting,
+        }
+
+@dataclass(slots=True)
+class EmojiCategories(ObjectBase):
+    """
+    Represents a list of emoji categories
+
+    :param categories: List of categories
+    """
+
+    _type: "str" = field(default="emojiCategories", init=False, repr=False)
+    categories: "list[EmojiCategory] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "categories": _list_to_json(self.categories),
+        }
+
+@dataclass(slots=True)
+class EmojiCategoryType(ObjectBase):
+    """
+    Describes type of emoji category
+
+    """
+
+    _type: "str" = field(default="EmojiCategoryType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class EmojiCategoryTypeDefault(EmojiCategoryType):
+    """
+    The category must be used by default (e.g., for custom emoji or animation search)
+
+    """
+
+    _type: "str" = field(default="emojiCategoryTypeDefault", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class EmojiCategoryTypeRegularStickers(EmojiCategoryType):
+    """
+    The category must be used by default for regular sticker selection. It may contain greeting emoji category and premium stickers
+
+    """
+
+    _type: "str" = field(default="emojiCategoryTypeRegularStickers", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class EmojiCategoryTypeEmojiStatus(EmojiCategoryType):
+    """
+    The category must be used for emoji status selection
+
+    """
+
+    _type: "str" = field(default="emojiCategoryTypeEmojiStatus", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class EmojiCategoryTypeChatPhoto(EmojiCategoryType):
+    """
+    The category must be used for chat photo emoji selection
+
+    """
+
+    _type: "str" = field(default="emojiCategoryTypeChatPhoto", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CurrentWeather(ObjectBase):
+    """
+    Describes the current weather
+
+    :param temperature: Temperature, in degree Celsius
+    :param emoji: Emoji representing the weather
+    """
+
+    _type: "str" = field(default="currentWeather", init=False, repr=False)
+    temperature: "float" = 0
+    emoji: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "temperature": self.temperature,
+            "emoji": self.emoji,
+        }
+
+@dataclass(slots=True)
+class StoryAreaPosition(ObjectBase):
+    """
+    Describes position of a clickable rectangle area on a story media
+
+    :param x_percentage: The abscissa of the rectangle's center, as a percentage of the media width
+    :param y_percentage: The ordinate of the rectangle's center, as a percentage of the media height
+    :param width_percentage: The width of the rectangle, as a percentage of the media width
+    :param height_percentage: The height of the rectangle, as a percentage of the media height
+    :param rotation_angle: Clockwise rotation angle of the rectangle, in degrees; 0-360
+    :param corner_radius_percentage: The radius of the rectangle corner rounding, as a percentage of the media width
+    """
+
+    _type: "str" = field(default="storyAreaPosition", init=False, repr=False)
+    x_percentage: "float" = 0
+    y_percentage: "float" = 0
+    width_percentage: "float" = 0
+    height_percentage: "float" = 0
+    rotation_angle: "float" = 0
+    corner_radius_percentage: "float" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "x_percentage": self.x_percentage,
+            "y_percentage": self.y_percentage,
+            "width_percentage": self.width_percentage,
+            "height_percentage": self.height_percentage,
+            "rotation_angle": self.rotation_angle,
+            "corner_radius_percentage": self.corner_radius_percentage,
+        }
+
+@dataclass(slots=True)
+class StoryAreaType(ObjectBase):
+    """
+    Describes type of clickable area on a story media
+
+    """
+
+    _type: "str" = field(default="StoryAreaType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StoryAreaTypeLocation(StoryAreaType):
+    """
+    An area pointing to a location
+
+    :param location: The location
+    :param address: Address of the location; may be null if unknown
+    """
+
+    _type: "str" = field(default="storyAreaTypeLocation", init=False, repr=False)
+    location: "Location | None" = None
+    address: "LocationAddress | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "location": self.location._to_json_dict() if self.location is not None else None,
+            "address": self.address._to_json_dict() if self.address is not None else None,
+        }
+
+@dataclass(slots=True)
+class StoryAreaTypeVenue(StoryAreaType):
+    """
+    An area pointing to a venue
+
+    :param venue: Information about the venue
+    """
+
+    _type: "str" = field(default="storyAreaTypeVenue", init=False, repr=False)
+    venue: "Venue | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "venue": self.venue._to_json_dict() if self.venue is not None else None,
+        }
+
+@dataclass(slots=True)
+class StoryAreaTypeSuggestedReaction(StoryAreaType):
+    """
+    An area pointing to a suggested reaction. App needs to show a clickable reaction on the area and call setStoryReaction when the are is clicked
+
+    :param reaction_type: Type of the reaction
+    :param total_count: Number of times the reaction was added
+    :param is_dark: True, if reaction has a dark background
+    :param is_flipped: True, if reaction corner is flipped
+    """
+
+    _type: "str" = field(default="storyAreaTypeSuggestedReaction", init=False, repr=False)
+    reaction_type: "ReactionType | None" = None
+    total_count: "int" = 0
+    is_dark: "bool" = False
+    is_flipped: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "reaction_type": self.reaction_type._to_json_dict() if self.reaction_type is not None else None,
+            "total_count": self.total_count,
+            "is_dark": self.is_dark,
+            "is_flipped": self.is_flipped,
+        }
+
+@dataclass(slots=True)
+class StoryAreaTypeMessage(StoryAreaType):
+    """
+    An area pointing to a message
+
+    :param chat_id: Identifier of the chat with the message
+    :param message_id: Identifier of the message
+    """
+
+    _type: "str" = field(default="storyAreaTypeMessage", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+@dataclass(slots=True)
+class StoryAreaTypeLink(StoryAreaType):
+    """
+    An area pointing to a HTTP or tg:// link
+
+    :param url: HTTP or tg:// URL to be opened when the area is clicked
+    """
+
+    _type: "str" = field(default="storyAreaTypeLink", init=False, repr=False)
+    url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+        }
+
+@dataclass(slots=True)
+class StoryAreaTypeWeather(StoryAreaType):
+    """
+    An area with information about weather
+
+    :param temperature: Temperature, in degree Celsius
+    :param emoji: Emoji representing the weather
+    :param background_color: A color of the area background in the ARGB format
+    """
+
+    _type: "str" = field(default="storyAreaTypeWeather", init=False, repr=False)
+    temperature: "float" = 0
+    emoji: "str" = ""
+    background_color: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "temperature": self.temperature,
+            "emoji": self.emoji,
+            "background_color": self.background_color,
+        }
+
+@dataclass(slots=True)
+class StoryAreaTypeUpgradedGift(StoryAreaType):
+    """
+    An area with an upgraded gift
+
+    :param gift_name: Unique name of the upgraded gift
+    """
+
+    _type: "str" = field(default="storyAreaTypeUpgradedGift", init=False, repr=False)
+    gift_name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "gift_name": self.gift_name,
+        }
+
+@dataclass(slots=True)
+class StoryArea(ObjectBase):
+    """
+    Describes a clickable rectangle area on a story media
+
+    :param position: Position of the area
+    :param type: Type of the area
+    """
+
+    _type: "str" = field(default="storyArea", init=False, repr=False)
+    position: "StoryAreaPosition | None" = None
+    type: "StoryAreaType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "position": self.position._to_json_dict() if self.position is not None else None,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputStoryAreaType(ObjectBase):
+    """
+    Describes type of clickable area on a story media to be added
+
+    """
+
+    _type: "str" = field(default="InputStoryAreaType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InputStoryAreaTypeLocation(InputStoryAreaType):
+    """
+    An area pointing to a location
+
+    :param location: The location
+    :param address: Address of the location; pass null if unknown
+    """
+
+    _type: "str" = field(default="inputStoryAreaTypeLocation", init=False, repr=False)
+    location: "Location | None" = None
+    address: "LocationAddress | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "location": self.location._to_json_dict() if self.location is not None else None,
+            "address": self.address._to_json_dict() if self.address is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputStoryAreaTypeFoundVenue(InputStoryAreaType):
+    """
+    An area pointing to a venue found by the bot getOption("venue_search_bot_username")
+
+    :param query_id: Identifier of the inline query, used to found the venue
+    :param result_id: Identifier of the inline query result
+    """
+
+    _type: "str" = field(default="inputStoryAreaTypeFoundVenue", init=False, repr=False)
+    query_id: "int" = 0
+    result_id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "query_id": self.query_id,
+            "result_id": self.result_id,
+        }
+
+@dataclass(slots=True)
+class InputStoryAreaTypePreviousVenue(InputStoryAreaType):
+    """
+    An area pointing to a venue already added to the story
+
+    :param venue_provider: Provider of the venue
+    :param venue_id: Identifier of the venue in the provider database
+    """
+
+    _type: "str" = field(default="inputStoryAreaTypePreviousVenue", init=False, repr=False)
+    venue_provider: "str" = ""
+    venue_id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "venue_provider": self.venue_provider,
+            "venue_id": self.venue_id,
+        }
+
+@dataclass(slots=True)
+class InputStoryAreaTypeSuggestedReaction(InputStoryAreaType):
+    """
+    An area pointing to a suggested reaction
+
+    :param reaction_type: Type of the reaction
+    :param is_dark: True, if reaction has a dark background
+    :param is_flipped: True, if reaction corner is flipped
+    """
+
+    _type: "str" = field(default="inputStoryAreaTypeSuggestedReaction", init=False, repr=False)
+    reaction_type: "ReactionType | None" = None
+    is_dark: "bool" = False
+    is_flipped: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "reaction_type": self.reaction_type._to_json_dict() if self.reaction_type is not None else None,
+            "is_dark": self.is_dark,
+            "is_flipped": self.is_flipped,
+        }
+
+@dataclass(slots=True)
+class InputStoryAreaTypeMessage(InputStoryAreaType):
+    """
+    An area pointing to a message
+
+    :param chat_id: Identifier of the chat with the message. Currently, the chat must be a supergroup or a channel chat
+    :param message_id: Identifier of the message. Use messageProperties.can_be_shared_in_story to check whether the message is suitable
+    """
+
+    _type: "str" = field(default="inputStoryAreaTypeMessage", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+@dataclass(slots=True)
+class InputStoryAreaTypeLink(InputStoryAreaType):
+    """
+    An area pointing to a HTTP or tg:// link
+
+    :param url: HTTP or tg:// URL to be opened when the area is clicked
+    """
+
+    _type: "str" = field(default="inputStoryAreaTypeLink", init=False, repr=False)
+    url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+        }
+
+@dataclass(slots=True)
+class InputStoryAreaTypeWeather(InputStoryAreaType):
+    """
+    An area with information about weather
+
+    :param temperature: Temperature, in degree Celsius
+    :param emoji: Emoji representing the weather
+    :param background_color: A color of the area background in the ARGB format
+    """
+
+    _type: "str" = field(default="inputStoryAreaTypeWeather", init=False, repr=False)
+    temperature: "float" = 0
+    emoji: "str" = ""
+    background_color: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "temperature": self.temperature,
+            "emoji": self.emoji,
+            "background_color": self.background_color,
+        }
+
+@dataclass(slots=True)
+class InputStoryAreaTypeUpgradedGift(InputStoryAreaType):
+    """
+    An area with an upgraded gift
+
+    :param gift_name: Unique name of the upgraded gift
+    """
+
+    _type: "str" = field(default="inputStoryAreaTypeUpgradedGift", init=False, repr=False)
+    gift_name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "gift_name": self.gift_name,
+        }
+
@@ -0,0 +1,1491 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import File, FormattedText, InputFile, Minithumbnail
+    from .classes_01 import Photo, Thumbnail
+    from .classes_04 import GiveawayPrize
+    from .classes_05 import MessageSender, ReactionType
+    from .classes_06 import Message, MessageSendingState
+    from .classes_08 import ReplyMarkup
+    from .classes_11 import MessageContent
+    from .classes_13 import InputStoryAreaType, StoryArea, StoryAreaPosition
+    from .classes_20 import StoryPrivacySettings
+    from .classes_22 import BlockList
+
+@dataclass(slots=True)
+class InputStoryArea(ObjectBase):
+    """
+    Describes a clickable rectangle area on a story media to be added
+
+    :param position: Position of the area
+    :param type: Type of the area
+    """
+
+    _type: "str" = field(default="inputStoryArea", init=False, repr=False)
+    position: "StoryAreaPosition | None" = None
+    type: "InputStoryAreaType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "position": self.position._to_json_dict() if self.position is not None else None,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputStoryAreas(ObjectBase):
+    """
+    Contains a list of story areas to be added
+
+    :param areas: List of input story areas. Currently, a story can have up to 10 inputStoryAreaTypeLocation, inputStoryAreaTypeFoundVenue, and inputStoryAreaTypePreviousVenue areas,
+     up to getOption("story_suggested_reaction_area_count_max") inputStoryAreaTypeSuggestedReaction areas,
+     up to 1 inputStoryAreaTypeMessage area,
+     up to getOption("story_link_area_count_max") inputStoryAreaTypeLink areas if the current user is a Telegram Premium user,
+     up to 3 inputStoryAreaTypeWeather areas, and
+     up to 1 inputStoryAreaTypeUpgradedGift area
+    """
+
+    _type: "str" = field(default="inputStoryAreas", init=False, repr=False)
+    areas: "list[InputStoryArea] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "areas": _list_to_json(self.areas),
+        }
+
+@dataclass(slots=True)
+class StoryVideo(ObjectBase):
+    """
+    Describes a video file posted as a story
+
+    :param duration: Duration of the video, in seconds
+    :param width: Video width
+    :param height: Video height
+    :param has_stickers: True, if stickers were added to the video. The list of corresponding sticker sets can be received using getAttachedStickerSets
+    :param is_animation: True, if the video has no sound
+    :param minithumbnail: Video minithumbnail; may be null
+    :param thumbnail: Video thumbnail in JPEG or MPEG4 format; may be null
+    :param preload_prefix_size: Size of file prefix, which is expected to be preloaded, in bytes
+    :param cover_frame_timestamp: Timestamp of the frame used as video thumbnail
+    :param video: File containing the video
+    """
+
+    _type: "str" = field(default="storyVideo", init=False, repr=False)
+    duration: "float" = 0
+    width: "int" = 0
+    height: "int" = 0
+    has_stickers: "bool" = False
+    is_animation: "bool" = False
+    minithumbnail: "Minithumbnail | None" = None
+    thumbnail: "Thumbnail | None" = None
+    preload_prefix_size: "int" = 0
+    cover_frame_timestamp: "float" = 0
+    video: "File | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "duration": self.duration,
+            "width": self.width,
+            "height": self.height,
+            "has_stickers": self.has_stickers,
+            "is_animation": self.is_animation,
+            "minithumbnail": self.minithumbnail._to_json_dict() if self.minithumbnail is not None else None,
+            "thumbnail": self.thumbnail._to_json_dict() if self.thumbnail is not None else None,
+            "preload_prefix_size": self.preload_prefix_size,
+            "cover_frame_timestamp": self.cover_frame_timestamp,
+            "video": self.video._to_json_dict() if self.video is not None else None,
+        }
+
+@dataclass(slots=True)
+class StoryContent(ObjectBase):
+    """
+    Contains the content of a story
+
+    """
+
+    _type: "str" = field(default="StoryContent", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StoryContentPhoto(StoryContent):
+    """
+    A photo story
+
+    :param photo: The photo
+    """
+
+    _type: "str" = field(default="storyContentPhoto", init=False, repr=False)
+    photo: "Photo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+        }
+
+@dataclass(slots=True)
+class StoryContentVideo(StoryContent):
+    """
+    A video story
+
+    :param video: The video in MPEG4 format
+    :param alternative_video: Alternative version of the video in MPEG4 format, encoded with H.264 codec; may be null
+    """
+
+    _type: "str" = field(default="storyContentVideo", init=False, repr=False)
+    video: "StoryVideo | None" = None
+    alternative_video: "StoryVideo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "video": self.video._to_json_dict() if self.video is not None else None,
+            "alternative_video": self.alternative_video._to_json_dict() if self.alternative_video is not None else None,
+        }
+
+@dataclass(slots=True)
+class StoryContentUnsupported(StoryContent):
+    """
+    A story content that is not supported in the current TDLib version
+
+    """
+
+    _type: "str" = field(default="storyContentUnsupported", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InputStoryContent(ObjectBase):
+    """
+    The content of a story to post
+
+    """
+
+    _type: "str" = field(default="InputStoryContent", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InputStoryContentPhoto(InputStoryContent):
+    """
+    A photo story
+
+    :param photo: Photo to send. The photo must be at most 10 MB in size. The photo size must be 1080x1920
+    :param added_sticker_file_ids: File identifiers of the stickers added to the photo, if applicable
+    """
+
+    _type: "str" = field(default="inputStoryContentPhoto", init=False, repr=False)
+    photo: "InputFile | None" = None
+    added_sticker_file_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+            "added_sticker_file_ids": self.added_sticker_file_ids,
+        }
+
+@dataclass(slots=True)
+class InputStoryContentVideo(InputStoryContent):
+    """
+    A video story
+
+    :param video: Video to be sent. The video size must be 720x1280. The video must be streamable and stored in MPEG4 format, after encoding with H.265 codec and key frames added each second
+    :param added_sticker_file_ids: File identifiers of the stickers added to the video, if applicable
+    :param duration: Precise duration of the video, in seconds; 0-60
+    :param cover_frame_timestamp: Timestamp of the frame, which will be used as video thumbnail
+    :param is_animation: True, if the video has no sound
+    """
+
+    _type: "str" = field(default="inputStoryContentVideo", init=False, repr=False)
+    video: "InputFile | None" = None
+    added_sticker_file_ids: "list[int] | None" = None
+    duration: "float" = 0
+    cover_frame_timestamp: "float" = 0
+    is_animation: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "video": self.video._to_json_dict() if self.video is not None else None,
+            "added_sticker_file_ids": self.added_sticker_file_ids,
+            "duration": self.duration,
+            "cover_frame_timestamp": self.cover_frame_timestamp,
+            "is_animation": self.is_animation,
+        }
+
+@dataclass(slots=True)
+class StoryList(ObjectBase):
+    """
+    Describes a list of stories
+
+    """
+
+    _type: "str" = field(default="StoryList", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StoryListMain(StoryList):
+    """
+    The list of stories, shown in the main chat list and folder chat lists
+
+    """
+
+    _type: "str" = field(default="storyListMain", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StoryListArchive(StoryList):
+    """
+    The list of stories, shown in the Arvhive chat list
+
+    """
+
+    _type: "str" = field(default="storyListArchive", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StoryOrigin(ObjectBase):
+    """
+    Contains information about the origin of a story that was reposted
+
+    """
+
+    _type: "str" = field(default="StoryOrigin", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StoryOriginPublicStory(StoryOrigin):
+    """
+    The original story was a public story that was posted by a known chat
+
+    :param chat_id: Identifier of the chat that posted original story
+    :param story_id: Story identifier of the original story
+    """
+
+    _type: "str" = field(default="storyOriginPublicStory", init=False, repr=False)
+    chat_id: "int" = 0
+    story_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "story_id": self.story_id,
+        }
+
+@dataclass(slots=True)
+class StoryOriginHiddenUser(StoryOrigin):
+    """
+    The original story was posted by an unknown user
+
+    :param poster_name: Name of the user or the chat that posted the story
+    """
+
+    _type: "str" = field(default="storyOriginHiddenUser", init=False, repr=False)
+    poster_name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "poster_name": self.poster_name,
+        }
+
+@dataclass(slots=True)
+class StoryRepostInfo(ObjectBase):
+    """
+    Contains information about original story that was reposted
+
+    :param origin: Origin of the story that was reposted
+    :param is_content_modified: True, if story content was modified during reposting; otherwise, story wasn't modified
+    """
+
+    _type: "str" = field(default="storyRepostInfo", init=False, repr=False)
+    origin: "StoryOrigin | None" = None
+    is_content_modified: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "origin": self.origin._to_json_dict() if self.origin is not None else None,
+            "is_content_modified": self.is_content_modified,
+        }
+
+@dataclass(slots=True)
+class StoryInteractionInfo(ObjectBase):
+    """
+    Contains information about interactions with a story
+
+    :param view_count: Number of times the story was viewed
+    :param forward_count: Number of times the story was forwarded; 0 if none or unknown
+    :param reaction_count: Number of reactions added to the story; 0 if none or unknown
+    :param recent_viewer_user_ids: Identifiers of at most 3 recent viewers of the story
+    """
+
+    _type: "str" = field(default="storyInteractionInfo", init=False, repr=False)
+    view_count: "int" = 0
+    forward_count: "int" = 0
+    reaction_count: "int" = 0
+    recent_viewer_user_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "view_count": self.view_count,
+            "forward_count": self.forward_count,
+            "reaction_count": self.reaction_count,
+            "recent_viewer_user_ids": self.recent_viewer_user_ids,
+        }
+
+@dataclass(slots=True)
+class Story(ObjectBase):
+    """
+    Represents a story
+
+    :param id: Unique story identifier among stories posted by the given chat
+    :param poster_chat_id: Identifier of the chat that posted the story
+    :param poster_id: Identifier of the user or chat that posted the story; may be null if the story is posted on behalf of the poster_chat_id
+    :param date: Point in time (Unix timestamp) when the story was published
+    :param is_being_posted: True, if the story is being posted by the current user
+    :param is_being_edited: True, if the story is being edited by the current user
+    :param is_edited: True, if the story was edited
+    :param is_posted_to_chat_page: True, if the story is saved in the profile of the chat that posted it and will be available there after expiration
+    :param is_visible_only_for_self: True, if the story is visible only for the current user
+    :param can_be_deleted: True, if the story can be deleted
+    :param can_be_edited: True, if the story can be edited
+    :param can_be_forwarded: True, if the story can be forwarded as a message. Otherwise, screenshots and saving of the story content must be also forbidden
+    :param can_be_replied: True, if the story can be replied in the chat with the user that posted the story
+    :param can_toggle_is_posted_to_chat_page: True, if the story's is_posted_to_chat_page value can be changed
+    :param can_get_statistics: True, if the story statistics are available through getStoryStatistics
+    :param can_get_interactions: True, if interactions with the story can be received through getStoryInteractions
+    :param has_expired_viewers: True, if users viewed the story can't be received, because the story has expired more than getOption("story_viewers_expiration_delay") seconds ago
+    :param repost_info: Information about the original story; may be null if the story wasn't reposted
+    :param interaction_info: Information about interactions with the story; may be null if the story isn't owned or there were no interactions
+    :param chosen_reaction_type: Type of the chosen reaction; may be null if none
+    :param privacy_settings: Privacy rules affecting story visibility; may be approximate for non-owned stories
+    :param content: Content of the story
+    :param areas: Clickable areas to be shown on the story content
+    :param caption: Caption of the story
+    """
+
+    _type: "str" = field(default="story", init=False, repr=False)
+    id: "int" = 0
+    poster_chat_id: "int" = 0
+    poster_id: "MessageSender | None" = None
+    date: "int" = 0
+    is_being_posted: "bool" = False
+    is_being_edited: "bool" = False
+    is_edited: "bool" = False
+    is_posted_to_chat_page: "bool" = False
+    is_visible_only_for_self: "bool" = False
+    can_be_deleted: "bool" = False
+    can_be_edited: "bool" = False
+    can_be_forwarded: "bool" = False
+    can_be_replied: "bool" = False
+    can_toggle_is_posted_to_chat_page: "bool" = False
+    can_get_statistics: "bool" = False
+    can_get_interactions: "bool" = False
+    has_expired_viewers: "bool" = False
+    repost_info: "StoryRepostInfo | None" = None
+    interaction_info: "StoryInteractionInfo | None" = None
+    chosen_reaction_type: "ReactionType | None" = None
+    privacy_settings: "StoryPrivacySettings | None" = None
+    content: "StoryContent | None" = None
+    areas: "list[StoryArea] | None" = None
+    caption: "FormattedText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "poster_chat_id": self.poster_chat_id,
+            "poster_id": self.poster_id._to_json_dict() if self.poster_id is not None else None,
+            "date": self.date,
+            "is_being_posted": self.is_being_posted,
+            "is_being_edited": self.is_being_edited,
+            "is_edited": self.is_edited,
+            "is_posted_to_chat_page": self.is_posted_to_chat_page,
+            "is_visible_only_for_self": self.is_visible_only_for_self,
+            "can_be_deleted": self.can_be_deleted,
+            "can_be_edited": self.can_be_edited,
+            "can_be_forwarded": self.can_be_forwarded,
+            "can_be_replied": self.can_be_replied,
+            "can_toggle_is_posted_to_chat_page": self.can_toggle_is_posted_to_chat_page,
+            "can_get_statistics": self.can_get_statistics,
+            "can_get_interactions": self.can_get_interactions,
+            "has_expired_viewers": self.has_expired_viewers,
+            "repost_info": self.repost_info._to_json_dict() if self.repost_info is not None else None,
+            "interaction_info": self.interaction_info._to_json_dict() if self.interaction_info is not None else None,
+            "chosen_reaction_type": self.chosen_reaction_type._to_json_dict() if self.chosen_reaction_type is not None else None,
+            "privacy_settings": self.privacy_settings._to_json_dict() if self.privacy_settings is not None else None,
+            "content": self.content._to_json_dict() if self.content is not None else None,
+            "areas": _list_to_json(self.areas),
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+        }
+
+@dataclass(slots=True)
+class Stories(ObjectBase):
+    """
+    Represents a list of stories
+
+    :param total_count: Approximate total number of stories found
+    :param stories: The list of stories
+    :param pinned_story_ids: Identifiers of the pinned stories; returned only in getChatPostedToChatPageStories with from_story_id == 0
+    """
+
+    _type: "str" = field(default="stories", init=False, repr=False)
+    total_count: "int" = 0
+    stories: "list[Story] | None" = None
+    pinned_story_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "stories": _list_to_json(self.stories),
+            "pinned_story_ids": self.pinned_story_ids,
+        }
+
+@dataclass(slots=True)
+class FoundStories(ObjectBase):
+    """
+    Contains a list of stories found by a search
+
+    :param total_count: Approximate total number of stories found
+    :param stories: List of stories
+    :param next_offset: The offset for the next request. If empty, then there are no more results
+    """
+
+    _type: "str" = field(default="foundStories", init=False, repr=False)
+    total_count: "int" = 0
+    stories: "list[Story] | None" = None
+    next_offset: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "stories": _list_to_json(self.stories),
+            "next_offset": self.next_offset,
+        }
+
+@dataclass(slots=True)
+class StoryFullId(ObjectBase):
+    """
+    Contains identifier of a story along with identifier of the chat that posted it
+
+    :param poster_chat_id: Identifier of the chat that posted the story
+    :param story_id: Unique story identifier among stories of the chat
+    """
+
+    _type: "str" = field(default="storyFullId", init=False, repr=False)
+    poster_chat_id: "int" = 0
+    story_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "poster_chat_id": self.poster_chat_id,
+            "story_id": self.story_id,
+        }
+
+@dataclass(slots=True)
+class StoryInfo(ObjectBase):
+    """
+    Contains basic information about a story
+
+    :param story_id: Unique story identifier among stories of the chat
+    :param date: Point in time (Unix timestamp) when the story was published
+    :param is_for_close_friends: True, if the story is available only to close friends
+    """
+
+    _type: "str" = field(default="storyInfo", init=False, repr=False)
+    story_id: "int" = 0
+    date: "int" = 0
+    is_for_close_friends: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_id": self.story_id,
+            "date": self.date,
+            "is_for_close_friends": self.is_for_close_friends,
+        }
+
+@dataclass(slots=True)
+class ChatActiveStories(ObjectBase):
+    """
+    Describes active stories posted by a chat
+
+    :param chat_id: Identifier of the chat that posted the stories
+    :param list_: Identifier of the story list in which the stories are shown; may be null if the stories aren't shown in a story list
+    :param order: A parameter used to determine order of the stories in the story list; 0 if the stories doesn't need to be shown in the story list. Stories must be sorted by the pair (order, story_poster_chat_id) in descending order
+    :param max_read_story_id: Identifier of the last read active story
+    :param stories: Basic information about the stories; use getStory to get full information about the stories. The stories are in chronological order (i.e., in order of increasing story identifiers)
+    """
+
+    _type: "str" = field(default="chatActiveStories", init=False, repr=False)
+    chat_id: "int" = 0
+    list_: "StoryList | None" = None
+    order: "int" = 0
+    max_read_story_id: "int" = 0
+    stories: "list[StoryInfo] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "list": self.list_._to_json_dict() if self.list_ is not None else None,
+            "order": self.order,
+            "max_read_story_id": self.max_read_story_id,
+            "stories": _list_to_json(self.stories),
+        }
+
+@dataclass(slots=True)
+class StoryInteractionType(ObjectBase):
+    """
+    Describes type of interaction with a story
+
+    """
+
+    _type: "str" = field(default="StoryInteractionType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StoryInteractionTypeView(StoryInteractionType):
+    """
+    A view of the story
+
+    :param chosen_reaction_type: Type of the reaction that was chosen by the viewer; may be null if none
+    """
+
+    _type: "str" = field(default="storyInteractionTypeView", init=False, repr=False)
+    chosen_reaction_type: "ReactionType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chosen_reaction_type": self.chosen_reaction_type._to_json_dict() if self.chosen_reaction_type is not None else None,
+        }
+
+@dataclass(slots=True)
+class StoryInteractionTypeForward(StoryInteractionType):
+    """
+    A forward of the story as a message
+
+    :param message: The message with story forward
+    """
+
+    _type: "str" = field(default="storyInteractionTypeForward", init=False, repr=False)
+    message: "Message | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "message": self.message._to_json_dict() if self.message is not None else None,
+        }
+
+@dataclass(slots=True)
+class StoryInteractionTypeRepost(StoryInteractionType):
+    """
+    A repost of the story as a story
+
+    :param story: The reposted story
+    """
+
+    _type: "str" = field(default="storyInteractionTypeRepost", init=False, repr=False)
+    story: "Story | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story": self.story._to_json_dict() if self.story is not None else None,
+        }
+
+@dataclass(slots=True)
+class StoryInteraction(ObjectBase):
+    """
+    Represents interaction with a story
+
+    :param actor_id: Identifier of the user or chat that made the interaction
+    :param interaction_date: Approximate point in time (Unix timestamp) when the interaction happened
+    :param block_list: Block list to which the actor is added; may be null if none or for chat stories
+    :param type: Type of the interaction
+    """
+
+    _type: "str" = field(default="storyInteraction", init=False, repr=False)
+    actor_id: "MessageSender | None" = None
+    interaction_date: "int" = 0
+    block_list: "BlockList | None" = None
+    type: "StoryInteractionType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "actor_id": self.actor_id._to_json_dict() if self.actor_id is not None else None,
+            "interaction_date": self.interaction_date,
+            "block_list": self.block_list._to_json_dict() if self.block_list is not None else None,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+@dataclass(slots=True)
+class StoryInteractions(ObjectBase):
+    """
+    Represents a list of interactions with a story
+
+    :param total_count: Approximate total number of interactions found
+    :param total_forward_count: Approximate total number of found forwards and reposts; always 0 for chat stories
+    :param total_reaction_count: Approximate total number of found reactions; always 0 for chat stories
+    :param interactions: List of story interactions
+    :param next_offset: The offset for the next request. If empty, then there are no more results
+    """
+
+    _type: "str" = field(default="storyInteractions", init=False, repr=False)
+    total_count: "int" = 0
+    total_forward_count: "int" = 0
+    total_reaction_count: "int" = 0
+    interactions: "list[StoryInteraction] | None" = None
+    next_offset: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "total_forward_count": self.total_forward_count,
+            "total_reaction_count": self.total_reaction_count,
+            "interactions": _list_to_json(self.interactions),
+            "next_offset": self.next_offset,
+        }
+
+@dataclass(slots=True)
+class QuickReplyMessage(ObjectBase):
+    """
+    Describes a message that can be used for quick reply
+
+    :param id: Unique message identifier among all quick replies
+    :param sending_state: The sending state of the message; may be null if the message isn't being sent and didn't fail to be sent
+    :param can_be_edited: True, if the message can be edited
+    :param reply_to_message_id: The identifier of the quick reply message to which the message replies; 0 if none
+    :param via_bot_user_id: If non-zero, the user identifier of the bot through which this message was sent
+    :param media_album_id: Unique identifier of an album this message belongs to; 0 if none. Only audios, documents, photos and videos can be grouped together in albums
+    :param content: Content of the message
+    :param reply_markup: Inline keyboard reply markup for the message; may be null if none
+    """
+
+    _type: "str" = field(default="quickReplyMessage", init=False, repr=False)
+    id: "int" = 0
+    sending_state: "MessageSendingState | None" = None
+    can_be_edited: "bool" = False
+    reply_to_message_id: "int" = 0
+    via_bot_user_id: "int" = 0
+    media_album_id: "int" = 0
+    content: "MessageContent | None" = None
+    reply_markup: "ReplyMarkup | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "sending_state": self.sending_state._to_json_dict() if self.sending_state is not None else None,
+            "can_be_edited": self.can_be_edited,
+            "reply_to_message_id": self.reply_to_message_id,
+            "via_bot_user_id": self.via_bot_user_id,
+            "media_album_id": self.media_album_id,
+            "content": self.content._to_json_dict() if self.content is not None else None,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+        }
+
+@dataclass(slots=True)
+class QuickReplyMessages(ObjectBase):
+    """
+    Contains a list of quick reply messages
+
+    :param messages: List of quick reply messages; messages may be null
+    """
+
+    _type: "str" = field(default="quickReplyMessages", init=False, repr=False)
+    messages: "list[QuickReplyMessage] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "messages": _list_to_json(self.messages),
+        }
+
+@dataclass(slots=True)
+class QuickReplyShortcut(ObjectBase):
+    """
+    Describes a shortcut that can be used for a quick reply
+
+    :param id: Unique shortcut identifier
+    :param name: The name of the shortcut that can be used to use the shortcut
+    :param first_message: The first shortcut message
+    :param message_count: The total number of messages in the shortcut
+    """
+
+    _type: "str" = field(default="quickReplyShortcut", init=False, repr=False)
+    id: "int" = 0
+    name: "str" = ""
+    first_message: "QuickReplyMessage | None" = None
+    message_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "name": self.name,
+            "first_message": self.first_message._to_json_dict() if self.first_message is not None else None,
+            "message_count": self.message_count,
+        }
+
+@dataclass(slots=True)
+class PublicForward(ObjectBase):
+    """
+    Describes a public forward or repost of a story
+
+    """
+
+    _type: "str" = field(default="PublicForward", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PublicForwardMessage(PublicForward):
+    """
+    Contains a public forward as a message
+
+    :param message: Information about the message
+    """
+
+    _type: "str" = field(default="publicForwardMessage", init=False, repr=False)
+    message: "Message | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "message": self.message._to_json_dict() if self.message is not None else None,
+        }
+
+@dataclass(slots=True)
+class PublicForwardStory(PublicForward):
+    """
+    Contains a public repost to a story
+
+    :param story: Information about the story
+    """
+
+    _type: "str" = field(default="publicForwardStory", init=False, repr=False)
+    story: "Story | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story": self.story._to_json_dict() if self.story is not None else None,
+        }
+
+@dataclass(slots=True)
+class PublicForwards(ObjectBase):
+    """
+    Represents a list of public forwards and reposts as a story of a message or a story
+
+    :param total_count: Approximate total number of messages and stories found
+    :param forwards: List of found public forwards and reposts
+    :param next_offset: The offset for the next request. If empty, then there are no more results
+    """
+
+    _type: "str" = field(default="publicForwards", init=False, repr=False)
+    total_count: "int" = 0
+    forwards: "list[PublicForward] | None" = None
+    next_offset: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "forwards": _list_to_json(self.forwards),
+            "next_offset": self.next_offset,
+        }
+
+@dataclass(slots=True)
+class BotMediaPreview(ObjectBase):
+    """
+    Describes media previews of a bot
+
+    :param date: Point in time (Unix timestamp) when the preview was added or changed last time
+    :param content: Content of the preview
+    """
+
+    _type: "str" = field(default="botMediaPreview", init=False, repr=False)
+    date: "int" = 0
+    content: "StoryContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "date": self.date,
+            "content": self.content._to_json_dict() if self.content is not None else None,
+        }
+
+@dataclass(slots=True)
+class BotMediaPreviews(ObjectBase):
+    """
+    Contains a list of media previews of a bot
+
+    :param previews: List of media previews
+    """
+
+    _type: "str" = field(default="botMediaPreviews", init=False, repr=False)
+    previews: "list[BotMediaPreview] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "previews": _list_to_json(self.previews),
+        }
+
+@dataclass(slots=True)
+class BotMediaPreviewInfo(ObjectBase):
+    """
+    Contains a list of media previews of a bot for the given language and the list of languages for which the bot has dedicated previews
+
+    :param previews: List of media previews
+    :param language_codes: List of language codes for which the bot has dedicated previews
+    """
+
+    _type: "str" = field(default="botMediaPreviewInfo", init=False, repr=False)
+    previews: "list[BotMediaPreview] | None" = None
+    language_codes: "list[str] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "previews": _list_to_json(self.previews),
+            "language_codes": self.language_codes,
+        }
+
+@dataclass(slots=True)
+class ChatBoostLevelFeatures(ObjectBase):
+    """
+    Contains a list of features available on a specific chat boost level
+
+    :param level: Target chat boost level
+    :param story_per_day_count: Number of stories that the chat can publish daily
+    :param custom_emoji_reaction_count: Number of custom emoji reactions that can be added to the list of available reactions
+    :param title_color_count: Number of custom colors for chat title
+    :param profile_accent_color_count: Number of custom colors for profile photo background
+    :param can_set_profile_background_custom_emoji: True, if custom emoji for profile background can be set
+    :param accent_color_count: Number of custom colors for background of empty chat photo, replies to messages and link previews
+    :param can_set_background_custom_emoji: True, if custom emoji for reply header and link preview background can be set
+    :param can_set_emoji_status: True, if emoji status can be set
+    :param chat_theme_background_count: Number of chat theme backgrounds that can be set as chat background
+    :param can_set_custom_background: True, if custom background can be set in the chat for all users
+    :param can_set_custom_emoji_sticker_set: True, if custom emoji sticker set can be set for the chat
+    :param can_enable_automatic_translation: True, if automatic translation of messages can be enabled in the chat
+    :param can_recognize_speech: True, if speech recognition can be used for video note and voice note messages by all users
+    :param can_disable_sponsored_messages: True, if sponsored messages can be disabled in the chat
+    """
+
+    _type: "str" = field(default="chatBoostLevelFeatures", init=False, repr=False)
+    level: "int" = 0
+    story_per_day_count: "int" = 0
+    custom_emoji_reaction_count: "int" = 0
+    title_color_count: "int" = 0
+    profile_accent_color_count: "int" = 0
+    can_set_profile_background_custom_emoji: "bool" = False
+    accent_color_count: "int" = 0
+    can_set_background_custom_emoji: "bool" = False
+    can_set_emoji_status: "bool" = False
+    chat_theme_background_count: "int" = 0
+    can_set_custom_background: "bool" = False
+    can_set_custom_emoji_sticker_set: "bool" = False
+    can_enable_automatic_translation: "bool" = False
+    can_recognize_speech: "bool" = False
+    can_disable_sponsored_messages: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "level": self.level,
+            "story_per_day_count": self.story_per_day_count,
+            "custom_emoji_reaction_count": self.custom_emoji_reaction_count,
+            "title_color_count": self.title_color_count,
+            "profile_accent_color_count": self.profile_accent_color_count,
+            "can_set_profile_background_custom_emoji": self.can_set_profile_background_custom_emoji,
+            "accent_color_count": self.accent_color_count,
+            "can_set_background_custom_emoji": self.can_set_background_custom_emoji,
+            "can_set_emoji_status": self.can_set_emoji_status,
+            "chat_theme_background_count": self.chat_theme_background_count,
+            "can_set_custom_background": self.can_set_custom_background,
+            "can_set_custom_emoji_sticker_set": self.can_set_custom_emoji_sticker_set,
+            "can_enable_automatic_translation": self.can_enable_automatic_translation,
+            "can_recognize_speech": self.can_recognize_speech,
+            "can_disable_sponsored_messages": self.can_disable_sponsored_messages,
+        }
+
+@dataclass(slots=True)
+class ChatBoostFeatures(ObjectBase):
+    """
+    Contains a list of features available on the first chat boost levels
+
+    :param features: The list of features
+    :param min_profile_background_custom_emoji_boost_level: The minimum boost level required to set custom emoji for profile background
+    :param min_background_custom_emoji_boost_level: The minimum boost level required to set custom emoji for reply header and link preview background; for channel chats only
+    :param min_emoji_status_boost_level: The minimum boost level required to set emoji status
+    :param min_chat_theme_background_boost_level: The minimum boost level required to set a chat theme background as chat background
+    :param min_custom_background_boost_level: The minimum boost level required to set custom chat background
+    :param min_custom_emoji_sticker_set_boost_level: The minimum boost level required to set custom emoji sticker set for the chat; for supergroup chats only
+    :param min_automatic_translation_boost_level: The minimum boost level allowing to enable automatic translation of messages for non-Premium users; for channel chats only
+    :param min_speech_recognition_boost_level: The minimum boost level allowing to recognize speech in video note and voice note messages for non-Premium users; for supergroup chats only
+    :param min_sponsored_message_disable_boost_level: The minimum boost level allowing to disable sponsored messages in the chat; for channel chats only
+    """
+
+    _type: "str" = field(default="chatBoostFeatures", init=False, repr=False)
+    features: "list[ChatBoostLevelFeatures] | None" = None
+    min_profile_background_custom_emoji_boost_level: "int" = 0
+    min_background_custom_emoji_boost_level: "int" = 0
+    min_emoji_status_boost_level: "int" = 0
+    min_chat_theme_background_boost_level: "int" = 0
+    min_custom_background_boost_level: "int" = 0
+    min_custom_emoji_sticker_set_boost_level: "int" = 0
+    min_automatic_translation_boost_level: "int" = 0
+    min_speech_recognition_boost_level: "int" = 0
+    min_sponsored_message_disable_boost_level: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "features": _list_to_json(self.features),
+            "min_profile_background_custom_emoji_boost_level": self.min_profile_background_custom_emoji_boost_level,
+            "min_background_custom_emoji_boost_level": self.min_background_custom_emoji_boost_level,
+            "min_emoji_status_boost_level": self.min_emoji_status_boost_level,
+            "min_chat_theme_background_boost_level": self.min_chat_theme_background_boost_level,
+            "min_custom_background_boost_level": self.min_custom_background_boost_level,
+            "min_custom_emoji_sticker_set_boost_level": self.min_custom_emoji_sticker_set_boost_level,
+            "min_automatic_translation_boost_level": self.min_automatic_translation_boost_level,
+            "min_speech_recognition_boost_level": self.min_speech_recognition_boost_level,
+            "min_sponsored_message_disable_boost_level": self.min_sponsored_message_disable_boost_level,
+        }
+
+@dataclass(slots=True)
+class ChatBoostSource(ObjectBase):
+    """
+    Describes source of a chat boost
+
+    """
+
+    _type: "str" = field(default="ChatBoostSource", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatBoostSourceGiftCode(ChatBoostSource):
+    """
+    The chat created a Telegram Premium gift code for a user
+
+    :param user_id: Identifier of a user, for which the gift code was created
+    :param gift_code: The created Telegram Premium gift code, which is known only if this is a gift code for the current user, or it has already been claimed
+    """
+
+    _type: "str" = field(default="chatBoostSourceGiftCode", init=False, repr=False)
+    user_id: "int" = 0
+    gift_code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "gift_code": self.gift_code,
+        }
+
+@dataclass(slots=True)
+class ChatBoostSourceGiveaway(ChatBoostSource):
+    """
+    The chat created a giveaway
+
+    :param user_id: Identifier of a user that won in the giveaway; 0 if none
+    :param gift_code: The created Telegram Premium gift code if it was used by the user or can be claimed by the current user; an empty string otherwise; for Telegram Premium giveways only
+    :param star_count: Number of Telegram Stars distributed among winners of the giveaway
+    :param giveaway_message_id: Identifier of the corresponding giveaway message; can be an identifier of a deleted message
+    :param is_unclaimed: True, if the winner for the corresponding giveaway prize wasn't chosen, because there were not enough participants
+    """
+
+    _type: "str" = field(default="chatBoostSourceGiveaway", init=False, repr=False)
+    user_id: "int" = 0
+    gift_code: "str" = ""
+    star_count: "int" = 0
+    giveaway_message_id: "int" = 0
+    is_unclaimed: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "gift_code": self.gift_code,
+            "star_count": self.star_count,
+            "giveaway_message_id": self.giveaway_message_id,
+            "is_unclaimed": self.is_unclaimed,
+        }
+
+@dataclass(slots=True)
+class ChatBoostSourcePremium(ChatBoostSource):
+    """
+    A user with Telegram Premium subscription or gifted Telegram Premium boosted the chat
+
+    :param user_id: Identifier of the user
+    """
+
+    _type: "str" = field(default="chatBoostSourcePremium", init=False, repr=False)
+    user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+        }
+
+@dataclass(slots=True)
+class PrepaidGiveaway(ObjectBase):
+    """
+    Describes a prepaid giveaway
+
+    :param id: Unique identifier of the prepaid giveaway
+    :param winner_count: Number of users which will receive giveaway prize
+    :param prize: Prize of the giveaway
+    :param boost_count: The number of boosts received by the chat from the giveaway; for Telegram Star giveaways only
+    :param payment_date: Point in time (Unix timestamp) when the giveaway was paid
+    """
+
+    _type: "str" = field(default="prepaidGiveaway", init=False, repr=False)
+    id: "int" = 0
+    winner_count: "int" = 0
+    prize: "GiveawayPrize | None" = None
+    boost_count: "int" = 0
+    payment_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "winner_count": self.winner_count,
+            "prize": self.prize._to_json_dict() if self.prize is not None else None,
+            "boost_count": self.boost_count,
+            "payment_date": self.payment_date,
+        }
+
+@dataclass(slots=True)
+class ChatBoostStatus(ObjectBase):
+    """
+    Describes current boost status of a chat
+
+    :param boost_url: An HTTP URL, which can be used to boost the chat
+    :param applied_slot_ids: Identifiers of boost slots of the current user applied to the chat
+    :param level: Current boost level of the chat
+    :param gift_code_boost_count: The number of boosts received by the chat from created Telegram Premium gift codes and giveaways; always 0 if the current user isn't an administrator in the chat
+    :param boost_count: The number of boosts received by the chat
+    :param current_level_boost_count: The number of boosts added to reach the current level
+    :param next_level_boost_count: The number of boosts needed to reach the next level; 0 if the next level isn't available
+    :param premium_member_count: Approximate number of Telegram Premium subscribers joined the chat; always 0 if the current user isn't an administrator in the chat
+    :param premium_member_percentage: A percentage of Telegram Premium subscribers joined the chat; always 0 if the current user isn't an administrator in the chat
+    :param prepaid_giveaways: The list of prepaid giveaways available for the chat; only for chat administrators
+    """
+
+    _type: "str" = field(default="chatBoostStatus", init=False, repr=False)
+    boost_url: "str" = ""
+    applied_slot_ids: "list[int] | None" = None
+    level: "int" = 0
+    gift_code_boost_count: "int" = 0
+    boost_count: "int" = 0
+    current_level_boost_count: "int" = 0
+    next_level_boost_count: "int" = 0
+    premium_member_count: "int" = 0
+    premium_member_percentage: "float" = 0
+    prepaid_giveaways: "list[PrepaidGiveaway] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "boost_url": self.boost_url,
+            "applied_slot_ids": self.applied_slot_ids,
+            "level": self.level,
+            "gift_code_boost_count": self.gift_code_boost_count,
+            "boost_count": self.boost_count,
+            "current_level_boost_count": self.current_level_boost_count,
+            "next_level_boost_count": self.next_level_boost_count,
+            "premium_member_count": self.premium_member_count,
+            "premium_member_percentage": self.premium_member_percentage,
+            "prepaid_giveaways": _list_to_json(self.prepaid_giveaways),
+        }
+
+@dataclass(slots=True)
+class ChatBoost(ObjectBase):
+    """
+    Describes a boost applied to a chat
+
+    :param id: Unique identifier of the boost
+    :param count: The number of identical boosts applied
+    :param source: Source of the boost
+    :param start_date: Point in time (Unix timestamp) when the chat was boosted
+    :param expiration_date: Point in time (Unix timestamp) when the boost will expire
+    """
+
+    _type: "str" = field(default="chatBoost", init=False, repr=False)
+    id: "str" = ""
+    count: "int" = 0
+    source: "ChatBoostSource | None" = None
+    start_date: "int" = 0
+    expiration_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "count": self.count,
+            "source": self.source._to_json_dict() if self.source is not None else None,
+            "start_date": self.start_date,
+            "expiration_date": self.expiration_date,
+        }
+
+@dataclass(slots=True)
+class FoundChatBoosts(ObjectBase):
+    """
+    Contains a list of boosts applied to a chat
+
+    :param total_count: Total number of boosts applied to the chat
+    :param boosts: List of boosts
+    :param next_offset: The offset for the next request. If empty, then there are no more results
+    """
+
+    _type: "str" = field(default="foundChatBoosts", init=False, repr=False)
+    total_count: "int" = 0
+    boosts: "list[ChatBoost] | None" = None
+    next_offset: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "boosts": _list_to_json(self.boosts),
+            "next_offset": self.next_offset,
+        }
+
+@dataclass(slots=True)
+class ChatBoostSlot(ObjectBase):
+    """
+    Describes a slot for chat boost
+
+    :param slot_id: Unique identifier of the slot
+    :param currently_boosted_chat_id: Identifier of the currently boosted chat; 0 if none
+    :param start_date: Point in time (Unix timestamp) when the chat was boosted; 0 if none
+    :param expiration_date: Point in time (Unix timestamp) when the boost will expire
+    :param cooldown_until_date: Point in time (Unix timestamp) after which the boost can be used for another chat
+    """
+
+    _type: "str" = field(default="chatBoostSlot", init=False, repr=False)
+    slot_id: "int" = 0
+    currently_boosted_chat_id: "int" = 0
+    start_date: "int" = 0
+    expiration_date: "int" = 0
+    cooldown_until_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "slot_id": self.slot_id,
+            "currently_boosted_chat_id": self.currently_boosted_chat_id,
+            "start_date": self.start_date,
+            "expiration_date": self.expiration_date,
+            "cooldown_until_date": self.cooldown_until_date,
+        }
+
+@dataclass(slots=True)
+class ChatBoostSlots(ObjectBase):
+    """
+    Contains a list of chat boost slots
+
+    :param slots: List of boost slots
+    """
+
+    _type: "str" = field(default="chatBoostSlots", init=False, repr=False)
+    slots: "list[ChatBoostSlot] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "slots": _list_to_json(self.slots),
+        }
+
+@dataclass(slots=True)
+class ResendCodeReason(ObjectBase):
+    """
+    Describes the reason why a code needs to be re-sent
+
+    """
+
+    _type: "str" = field(default="ResendCodeReason", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ResendCodeReasonUserRequest(ResendCodeReason):
+    """
+    The user requested to resend the code
+
+    """
+
+    _type: "str" = field(default="resendCodeReasonUserRequest", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ResendCodeReasonVerificationFailed(ResendCodeReason):
+    """
+    The code is re-sent, because device verification has failed
+
+    :param error_message: Cause of the verification failure, for example, "PLAY_SERVICES_NOT_AVAILABLE", "APNS_RECEIVE_TIMEOUT", or "APNS_INIT_FAILED"
+    """
+
+    _type: "str" = field(default="resendCodeReasonVerificationFailed", init=False, repr=False)
+    error_message: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "error_message": self.error_message,
+        }
+
+@dataclass(slots=True)
+class CallDiscardReason(ObjectBase):
+    """
+    Describes the reason why a call was discarded
+
+    """
+
+    _type: "str" = field(default="CallDiscardReason", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CallDiscardReasonEmpty(CallDiscardReason):
+    """
+    The call wasn't discarded, or the reason is unknown
+
+    """
+
+    _type: "str" = field(default="callDiscardReasonEmpty", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CallDiscardReasonMissed(CallDiscardReason):
+    """
+    The call was ended before the conversation started. It was canceled by the caller or missed by the other party
+
+    """
+
+    _type: "str" = field(default="callDiscardReasonMissed", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CallDiscardReasonDeclined(CallDiscardReason):
+    """
+    The call was ended before the conversation started. It was declined by the other party
+
+    """
+
+    _type: "str" = field(default="callDiscardReasonDeclined", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CallDiscardReasonDisconnected(CallDiscardReason):
+    """
+    The call was ended during the conversation because the users were disconnected
+
+    """
+
+    _type: "str" = field(default="callDiscardReasonDisconnected", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CallDiscardReasonHungUp(CallDiscardReason):
+    """
+    The call was ended because one of the parties hung up
+
+    """
+
+    _type: "str" = field(default="callDiscardReasonHungUp", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CallDiscardReasonUpgradeToGroupCall(CallDiscardReason):
+    """
+    The call was ended because it has been upgraded to a group call
+
+    :param invite_link: Invite link for the group call
+    """
+
+    _type: "str" = field(default="callDiscardReasonUpgradeToGroupCall", init=False, repr=False)
+    invite_link: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "invite_link": self.invite_link,
+        }
+
+@dataclass(slots=True)
+class CallProtocol(ObjectBase):
+    """
+    Specifies the supported call protocols
+
+    :param udp_p2p: True, if UDP peer-to-peer connections are supported
+    :param udp_reflector: True, if connection through UDP reflectors is supported
+    :param min_layer: The minimum supported API layer; use 65
+    :param max_layer: The maximum supported API layer; use 92
+    :param library_versions: List of supported tgcalls versions
+    """
+
+    _type: "str" = field(default="callProtocol", init=False, repr=False)
+    udp_p2p: "bool" = False
+    udp_reflector: "bool" = False
+    min_layer: "int" = 0
+    max_layer: "int" = 0
+    library_versions: "list[str] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "udp_p2p": self.udp_p2p,
+            "udp_reflector": self.udp_reflector,
+            "min_layer": self.min_layer,
+            "max_layer": self.max_layer,
+            "library_versions": self.library_versions,
+        }
+
+@dataclass(slots=True)
+class CallServerType(ObjectBase):
+    """
+    Describes the type of call server
+
+    """
+
+    _type: "str" = field(default="CallServerType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CallServerTypeTelegramReflector(CallServerType):
+    """
+    A Telegram call reflector
+
+    :param peer_tag: A peer tag to be used with the reflector
+    :param is_tcp: True, if the server uses TCP instead of UDP
+    """
+
+    _type: "str" = field(default="callServerTypeTelegramReflector", init=False, repr=False)
+    peer_tag: "bytes" = b""
+    is_tcp: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "peer_tag": _bytes_to_json(self.peer_tag),
+            "is_tcp": self.is_tcp,
+        }
+
+@dataclass(slots=True)
+class CallServerTypeWebrtc(CallServerType):
+    """
+    A WebRTC server
+
+    :param username: Username to be used for authentication
+    :param password: Authentication password
+    :param supports_turn: True, if the server supports TURN
+    :param supports_stun: True, if the server supports STUN
+    """
+
+    _type: "str" = field(default="callServerTypeWebrtc", init=False, repr=False)
+    username: "str" = ""
+    password: "str" = ""
+    supports_turn: "bool" = False
+    supports_stun: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "username": self.username,
+            "password": self.password,
+            "supports_turn": self.supports_turn,
+            "supports_stun": self.supports_stun,
+        }
+
@@ -0,0 +1,1320 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import Error
+    from .classes_01 import Animation, Sticker
+    from .classes_05 import MessageSender, ReactionType
+    from .classes_14 import CallDiscardReason, CallProtocol, CallServerType
+
+@dataclass(slots=True)
+class CallServer(ObjectBase):
+    """
+    Describes a server for relaying call data
+
+    :param id: Server identifier
+    :param ip_address: Server IPv4 address
+    :param ipv6_address: Server IPv6 address
+    :param port: Server port number
+    :param type: Server type
+    """
+
+    _type: "str" = field(default="callServer", init=False, repr=False)
+    id: "int" = 0
+    ip_address: "str" = ""
+    ipv6_address: "str" = ""
+    port: "int" = 0
+    type: "CallServerType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "ip_address": self.ip_address,
+            "ipv6_address": self.ipv6_address,
+            "port": self.port,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+@dataclass(slots=True)
+class CallId(ObjectBase):
+    """
+    Contains the call identifier
+
+    :param id: Call identifier
+    """
+
+    _type: "str" = field(default="callId", init=False, repr=False)
+    id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+        }
+
+@dataclass(slots=True)
+class GroupCallId(ObjectBase):
+    """
+    Contains the group call identifier
+
+    :param id: Group call identifier
+    """
+
+    _type: "str" = field(default="groupCallId", init=False, repr=False)
+    id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+        }
+
+@dataclass(slots=True)
+class CallState(ObjectBase):
+    """
+    Describes the current call state
+
+    """
+
+    _type: "str" = field(default="CallState", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CallStatePending(CallState):
+    """
+    The call is pending, waiting to be accepted by a user
+
+    :param is_created: True, if the call has already been created by the server
+    :param is_received: True, if the call has already been received by the other party
+    """
+
+    _type: "str" = field(default="callStatePending", init=False, repr=False)
+    is_created: "bool" = False
+    is_received: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_created": self.is_created,
+            "is_received": self.is_received,
+        }
+
+@dataclass(slots=True)
+class CallStateExchangingKeys(CallState):
+    """
+    The call has been answered and encryption keys are being exchanged
+
+    """
+
+    _type: "str" = field(default="callStateExchangingKeys", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CallStateReady(CallState):
+    """
+    The call is ready to use
+
+    :param protocol: Call protocols supported by the other call participant
+    :param servers: List of available call servers
+    :param config: A JSON-encoded call config
+    :param encryption_key: Call encryption key
+    :param emojis: Encryption key fingerprint represented as 4 emoji
+    :param allow_p2p: True, if peer-to-peer connection is allowed by users privacy settings
+    :param is_group_call_supported: True, if the other party supports upgrading of the call to a group call
+    :param custom_parameters: Custom JSON-encoded call parameters to be passed to tgcalls
+    """
+
+    _type: "str" = field(default="callStateReady", init=False, repr=False)
+    protocol: "CallProtocol | None" = None
+    servers: "list[CallServer] | None" = None
+    config: "str" = ""
+    encryption_key: "bytes" = b""
+    emojis: "list[str] | None" = None
+    allow_p2p: "bool" = False
+    is_group_call_supported: "bool" = False
+    custom_parameters: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "protocol": self.protocol._to_json_dict() if self.protocol is not None else None,
+            "servers": _list_to_json(self.servers),
+            "config": self.config,
+            "encryption_key": _bytes_to_json(self.encryption_key),
+            "emojis": self.emojis,
+            "allow_p2p": self.allow_p2p,
+            "is_group_call_supported": self.is_group_call_supported,
+            "custom_parameters": self.custom_parameters,
+        }
+
+@dataclass(slots=True)
+class CallStateHangingUp(CallState):
+    """
+    The call is hanging up after discardCall has been called
+
+    """
+
+    _type: "str" = field(default="callStateHangingUp", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CallStateDiscarded(CallState):
+    """
+    The call has ended successfully
+
+    :param reason: The reason why the call has ended
+    :param need_rating: True, if the call rating must be sent to the server
+    :param need_debug_information: True, if the call debug information must be sent to the server
+    :param need_log: True, if the call log must be sent to the server
+    """
+
+    _type: "str" = field(default="callStateDiscarded", init=False, repr=False)
+    reason: "CallDiscardReason | None" = None
+    need_rating: "bool" = False
+    need_debug_information: "bool" = False
+    need_log: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "reason": self.reason._to_json_dict() if self.reason is not None else None,
+            "need_rating": self.need_rating,
+            "need_debug_information": self.need_debug_information,
+            "need_log": self.need_log,
+        }
+
+@dataclass(slots=True)
+class CallStateError(CallState):
+    """
+    The call has ended with an error
+
+    :param error: Error. An error with the code 4005000 will be returned if an outgoing call is missed because of an expired timeout
+    """
+
+    _type: "str" = field(default="callStateError", init=False, repr=False)
+    error: "Error | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "error": self.error._to_json_dict() if self.error is not None else None,
+        }
+
+@dataclass(slots=True)
+class GroupCallJoinParameters(ObjectBase):
+    """
+    Describes parameters used to join a group call
+
+    :param audio_source_id: Audio channel synchronization source identifier; received from tgcalls
+    :param payload: Group call join payload; received from tgcalls
+    :param is_muted: Pass true to join the call with muted microphone
+    :param is_my_video_enabled: Pass true if the user's video is enabled
+    """
+
+    _type: "str" = field(default="groupCallJoinParameters", init=False, repr=False)
+    audio_source_id: "int" = 0
+    payload: "str" = ""
+    is_muted: "bool" = False
+    is_my_video_enabled: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "audio_source_id": self.audio_source_id,
+            "payload": self.payload,
+            "is_muted": self.is_muted,
+            "is_my_video_enabled": self.is_my_video_enabled,
+        }
+
+@dataclass(slots=True)
+class GroupCallVideoQuality(ObjectBase):
+    """
+    Describes the quality of a group call video
+
+    """
+
+    _type: "str" = field(default="GroupCallVideoQuality", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class GroupCallVideoQualityThumbnail(GroupCallVideoQuality):
+    """
+    The worst available video quality
+
+    """
+
+    _type: "str" = field(default="groupCallVideoQualityThumbnail", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class GroupCallVideoQualityMedium(GroupCallVideoQuality):
+    """
+    The medium video quality
+
+    """
+
+    _type: "str" = field(default="groupCallVideoQualityMedium", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class GroupCallVideoQualityFull(GroupCallVideoQuality):
+    """
+    The best available video quality
+
+    """
+
+    _type: "str" = field(default="groupCallVideoQualityFull", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class VideoChatStream(ObjectBase):
+    """
+    Describes an available stream in a video chat
+
+    :param channel_id: Identifier of an audio/video channel
+    :param scale: Scale of segment durations in the stream. The duration is 1000/(2**scale) milliseconds
+    :param time_offset: Point in time when the stream currently ends; Unix timestamp in milliseconds
+    """
+
+    _type: "str" = field(default="videoChatStream", init=False, repr=False)
+    channel_id: "int" = 0
+    scale: "int" = 0
+    time_offset: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "channel_id": self.channel_id,
+            "scale": self.scale,
+            "time_offset": self.time_offset,
+        }
+
+@dataclass(slots=True)
+class VideoChatStreams(ObjectBase):
+    """
+    Represents a list of video chat streams
+
+    :param streams: A list of video chat streams
+    """
+
+    _type: "str" = field(default="videoChatStreams", init=False, repr=False)
+    streams: "list[VideoChatStream] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "streams": _list_to_json(self.streams),
+        }
+
+@dataclass(slots=True)
+class RtmpUrl(ObjectBase):
+    """
+    Represents an RTMP URL
+
+    :param url: The URL
+    :param stream_key: Stream key
+    """
+
+    _type: "str" = field(default="rtmpUrl", init=False, repr=False)
+    url: "str" = ""
+    stream_key: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+            "stream_key": self.stream_key,
+        }
+
+@dataclass(slots=True)
+class GroupCallRecentSpeaker(ObjectBase):
+    """
+    Describes a recently speaking participant in a group call
+
+    :param participant_id: Group call participant identifier
+    :param is_speaking: True, is the user has spoken recently
+    """
+
+    _type: "str" = field(default="groupCallRecentSpeaker", init=False, repr=False)
+    participant_id: "MessageSender | None" = None
+    is_speaking: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "participant_id": self.participant_id._to_json_dict() if self.participant_id is not None else None,
+            "is_speaking": self.is_speaking,
+        }
+
+@dataclass(slots=True)
+class GroupCall(ObjectBase):
+    """
+    Describes a group call
+
+    :param id: Group call identifier
+    :param title: Group call title; for video chats only
+    :param invite_link: Invite link for the group call; for group calls that aren't bound to a chat. For video chats call getVideoChatInviteLink to get the link
+    :param scheduled_start_date: Point in time (Unix timestamp) when the group call is expected to be started by an administrator; 0 if it is already active or was ended; for video chats only
+    :param enabled_start_notification: True, if the group call is scheduled and the current user will receive a notification when the group call starts; for video chats only
+    :param is_active: True, if the call is active
+    :param is_video_chat: True, if the call is bound to a chat
+    :param is_rtmp_stream: True, if the call is an RTMP stream instead of an ordinary video chat; for video chats only
+    :param is_joined: True, if the call is joined
+    :param need_rejoin: True, if user was kicked from the call because of network loss and the call needs to be rejoined
+    :param is_owned: True, if the user is the owner of the call and can end the call, change volume level of other users, or ban users there; for group calls that aren't bound to a chat
+    :param can_be_managed: True, if the current user can manage the group call; for video chats only
+    :param participant_count: Number of participants in the group call
+    :param has_hidden_listeners: True, if group call participants, which are muted, aren't returned in participant list; for video chats only
+    :param loaded_all_participants: True, if all group call participants are loaded
+    :param recent_speakers: At most 3 recently speaking users in the group call
+    :param is_my_video_enabled: True, if the current user's video is enabled
+    :param is_my_video_paused: True, if the current user's video is paused
+    :param can_enable_video: True, if the current user can broadcast video or share screen
+    :param mute_new_participants: True, if only group call administrators can unmute new participants; for video chats only
+    :param can_toggle_mute_new_participants: True, if the current user can enable or disable mute_new_participants setting; for video chats only
+    :param record_duration: Duration of the ongoing group call recording, in seconds; 0 if none. An updateGroupCall update is not triggered when value of this field changes, but the same recording goes on
+    :param is_video_recorded: True, if a video file is being recorded for the call
+    :param duration: Call duration, in seconds; for ended calls only
+    """
+
+    _type: "str" = field(default="groupCall", init=False, repr=False)
+    id: "int" = 0
+    title: "str" = ""
+    invite_link: "str" = ""
+    scheduled_start_date: "int" = 0
+    enabled_start_notification: "bool" = False
+    is_active: "bool" = False
+    is_video_chat: "bool" = False
+    is_rtmp_stream: "bool" = False
+    is_joined: "bool" = False
+    need_rejoin: "bool" = False
+    is_owned: "bool" = False
+    can_be_managed: "bool" = False
+    participant_count: "int" = 0
+    has_hidden_listeners: "bool" = False
+    loaded_all_participants: "bool" = False
+    recent_speakers: "list[GroupCallRecentSpeaker] | None" = None
+    is_my_video_enabled: "bool" = False
+    is_my_video_paused: "bool" = False
+    can_enable_video: "bool" = False
+    mute_new_participants: "bool" = False
+    can_toggle_mute_new_participants: "bool" = False
+    record_duration: "int" = 0
+    is_video_recorded: "bool" = False
+    duration: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "title": self.title,
+            "invite_link": self.invite_link,
+            "scheduled_start_date": self.scheduled_start_date,
+            "enabled_start_notification": self.enabled_start_notification,
+            "is_active": self.is_active,
+            "is_video_chat": self.is_video_chat,
+            "is_rtmp_stream": self.is_rtmp_stream,
+            "is_joined": self.is_joined,
+            "need_rejoin": self.need_rejoin,
+            "is_owned": self.is_owned,
+            "can_be_managed": self.can_be_managed,
+            "participant_count": self.participant_count,
+            "has_hidden_listeners": self.has_hidden_listeners,
+            "loaded_all_participants": self.loaded_all_participants,
+            "recent_speakers": _list_to_json(self.recent_speakers),
+            "is_my_video_enabled": self.is_my_video_enabled,
+            "is_my_video_paused": self.is_my_video_paused,
+            "can_enable_video": self.can_enable_video,
+            "mute_new_participants": self.mute_new_participants,
+            "can_toggle_mute_new_participants": self.can_toggle_mute_new_participants,
+            "record_duration": self.record_duration,
+            "is_video_recorded": self.is_video_recorded,
+            "duration": self.duration,
+        }
+
+@dataclass(slots=True)
+class GroupCallVideoSourceGroup(ObjectBase):
+    """
+    Describes a group of video synchronization source identifiers
+
+    :param semantics: The semantics of sources, one of "SIM" or "FID"
+    :param source_ids: The list of synchronization source identifiers
+    """
+
+    _type: "str" = field(default="groupCallVideoSourceGroup", init=False, repr=False)
+    semantics: "str" = ""
+    source_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "semantics": self.semantics,
+            "source_ids": self.source_ids,
+        }
+
+@dataclass(slots=True)
+class GroupCallParticipantVideoInfo(ObjectBase):
+    """
+    Contains information about a group call participant's video channel
+
+    :param source_groups: List of synchronization source groups of the video
+    :param endpoint_id: Video channel endpoint identifier
+    :param is_paused: True, if the video is paused. This flag needs to be ignored, if new video frames are received
+    """
+
+    _type: "str" = field(default="groupCallParticipantVideoInfo", init=False, repr=False)
+    source_groups: "list[GroupCallVideoSourceGroup] | None" = None
+    endpoint_id: "str" = ""
+    is_paused: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "source_groups": _list_to_json(self.source_groups),
+            "endpoint_id": self.endpoint_id,
+            "is_paused": self.is_paused,
+        }
+
+@dataclass(slots=True)
+class GroupCallParticipant(ObjectBase):
+    """
+    Represents a group call participant
+
+    :param participant_id: Identifier of the group call participant
+    :param audio_source_id: User's audio channel synchronization source identifier
+    :param screen_sharing_audio_source_id: User's screen sharing audio channel synchronization source identifier
+    :param video_info: Information about user's video channel; may be null if there is no active video
+    :param screen_sharing_video_info: Information about user's screen sharing video channel; may be null if there is no active screen sharing video
+    :param bio: The participant user's bio or the participant chat's description
+    :param is_current_user: True, if the participant is the current user
+    :param is_speaking: True, if the participant is speaking as set by setGroupCallParticipantIsSpeaking
+    :param is_hand_raised: True, if the participant hand is raised
+    :param can_be_muted_for_all_users: True, if the current user can mute the participant for all other group call participants
+    :param can_be_unmuted_for_all_users: True, if the current user can allow the participant to unmute themselves or unmute the participant (if the participant is the current user)
+    :param can_be_muted_for_current_user: True, if the current user can mute the participant only for self
+    :param can_be_unmuted_for_current_user: True, if the current user can unmute the participant for self
+    :param is_muted_for_all_users: True, if the participant is muted for all users
+    :param is_muted_for_current_user: True, if the participant is muted for the current user
+    :param can_unmute_self: True, if the participant is muted for all users, but can unmute themselves
+    :param volume_level: Participant's volume level; 1-20000 in hundreds of percents
+    :param order: User's order in the group call participant list. Orders must be compared lexicographically. The bigger is order, the higher is user in the list. If order is empty, the user must be removed from the participant list
+    """
+
+    _type: "str" = field(default="groupCallParticipant", init=False, repr=False)
+    participant_id: "MessageSender | None" = None
+    audio_source_id: "int" = 0
+    screen_sharing_audio_source_id: "int" = 0
+    video_info: "GroupCallParticipantVideoInfo | None" = None
+    screen_sharing_video_info: "GroupCallParticipantVideoInfo | None" = None
+    bio: "str" = ""
+    is_current_user: "bool" = False
+    is_speaking: "bool" = False
+    is_hand_raised: "bool" = False
+    can_be_muted_for_all_users: "bool" = False
+    can_be_unmuted_for_all_users: "bool" = False
+    can_be_muted_for_current_user: "bool" = False
+    can_be_unmuted_for_current_user: "bool" = False
+    is_muted_for_all_users: "bool" = False
+    is_muted_for_current_user: "bool" = False
+    can_unmute_self: "bool" = False
+    volume_level: "int" = 0
+    order: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "participant_id": self.participant_id._to_json_dict() if self.participant_id is not None else None,
+            "audio_source_id": self.audio_source_id,
+            "screen_sharing_audio_source_id": self.screen_sharing_audio_source_id,
+            "video_info": self.video_info._to_json_dict() if self.video_info is not None else None,
+            "screen_sharing_video_info": self.screen_sharing_video_info._to_json_dict() if self.screen_sharing_video_info is not None else None,
+            "bio": self.bio,
+            "is_current_user": self.is_current_user,
+            "is_speaking": self.is_speaking,
+            "is_hand_raised": self.is_hand_raised,
+            "can_be_muted_for_all_users": self.can_be_muted_for_all_users,
+            "can_be_unmuted_for_all_users": self.can_be_unmuted_for_all_users,
+            "can_be_muted_for_current_user": self.can_be_muted_for_current_user,
+            "can_be_unmuted_for_current_user": self.can_be_unmuted_for_current_user,
+            "is_muted_for_all_users": self.is_muted_for_all_users,
+            "is_muted_for_current_user": self.is_muted_for_current_user,
+            "can_unmute_self": self.can_unmute_self,
+            "volume_level": self.volume_level,
+            "order": self.order,
+        }
+
+@dataclass(slots=True)
+class GroupCallParticipants(ObjectBase):
+    """
+    Contains identifiers of group call participants
+
+    :param total_count: Total number of group call participants
+    :param participant_ids: Identifiers of the participants
+    """
+
+    _type: "str" = field(default="groupCallParticipants", init=False, repr=False)
+    total_count: "int" = 0
+    participant_ids: "list[MessageSender] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "participant_ids": _list_to_json(self.participant_ids),
+        }
+
+@dataclass(slots=True)
+class GroupCallInfo(ObjectBase):
+    """
+    Contains information about a just created or just joined group call
+
+    :param group_call_id: Identifier of the group call
+    :param join_payload: Join response payload for tgcalls; empty if the call isn't joined
+    """
+
+    _type: "str" = field(default="groupCallInfo", init=False, repr=False)
+    group_call_id: "int" = 0
+    join_payload: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "join_payload": self.join_payload,
+        }
+
+@dataclass(slots=True)
+class InviteGroupCallParticipantResult(ObjectBase):
+    """
+    Describes result of group call participant invitation
+
+    """
+
+    _type: "str" = field(default="InviteGroupCallParticipantResult", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InviteGroupCallParticipantResultUserPrivacyRestricted(InviteGroupCallParticipantResult):
+    """
+    The user can't be invited due to their privacy settings
+
+    """
+
+    _type: "str" = field(default="inviteGroupCallParticipantResultUserPrivacyRestricted", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InviteGroupCallParticipantResultUserAlreadyParticipant(InviteGroupCallParticipantResult):
+    """
+    The user can't be invited because they are already a participant of the call
+
+    """
+
+    _type: "str" = field(default="inviteGroupCallParticipantResultUserAlreadyParticipant", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InviteGroupCallParticipantResultUserWasBanned(InviteGroupCallParticipantResult):
+    """
+    The user can't be invited because they were banned by the owner of the call and can be invited back only by the owner of the group call
+
+    """
+
+    _type: "str" = field(default="inviteGroupCallParticipantResultUserWasBanned", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InviteGroupCallParticipantResultSuccess(InviteGroupCallParticipantResult):
+    """
+    The user was invited and a service message of the type messageGroupCall was sent which can be used in declineGroupCallInvitation to cancel the invitation
+
+    :param chat_id: Identifier of the chat with the invitation message
+    :param message_id: Identifier of the message
+    """
+
+    _type: "str" = field(default="inviteGroupCallParticipantResultSuccess", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+@dataclass(slots=True)
+class GroupCallDataChannel(ObjectBase):
+    """
+    Describes data channel for a group call
+
+    """
+
+    _type: "str" = field(default="GroupCallDataChannel", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class GroupCallDataChannelMain(GroupCallDataChannel):
+    """
+    The main data channel for audio and video data
+
+    """
+
+    _type: "str" = field(default="groupCallDataChannelMain", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class GroupCallDataChannelScreenSharing(GroupCallDataChannel):
+    """
+    The data channel for screen sharing
+
+    """
+
+    _type: "str" = field(default="groupCallDataChannelScreenSharing", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InputGroupCall(ObjectBase):
+    """
+    Describes a non-joined group call that isn't bound to a chat
+
+    """
+
+    _type: "str" = field(default="InputGroupCall", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InputGroupCallLink(InputGroupCall):
+    """
+    The group call is accessible through a link
+
+    :param link: The link for the group call
+    """
+
+    _type: "str" = field(default="inputGroupCallLink", init=False, repr=False)
+    link: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "link": self.link,
+        }
+
+@dataclass(slots=True)
+class InputGroupCallMessage(InputGroupCall):
+    """
+    The group call is accessible through a message of the type messageGroupCall
+
+    :param chat_id: Identifier of the chat with the message
+    :param message_id: Identifier of the message of the type messageGroupCall
+    """
+
+    _type: "str" = field(default="inputGroupCallMessage", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+@dataclass(slots=True)
+class CallProblem(ObjectBase):
+    """
+    Describes the exact type of problem with a call
+
+    """
+
+    _type: "str" = field(default="CallProblem", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CallProblemEcho(CallProblem):
+    """
+    The user heard their own voice
+
+    """
+
+    _type: "str" = field(default="callProblemEcho", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CallProblemNoise(CallProblem):
+    """
+    The user heard background noise
+
+    """
+
+    _type: "str" = field(default="callProblemNoise", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CallProblemInterruptions(CallProblem):
+    """
+    The other side kept disappearing
+
+    """
+
+    _type: "str" = field(default="callProblemInterruptions", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CallProblemDistortedSpeech(CallProblem):
+    """
+    The speech was distorted
+
+    """
+
+    _type: "str" = field(default="callProblemDistortedSpeech", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CallProblemSilentLocal(CallProblem):
+    """
+    The user couldn't hear the other side
+
+    """
+
+    _type: "str" = field(default="callProblemSilentLocal", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CallProblemSilentRemote(CallProblem):
+    """
+    The other side couldn't hear the user
+
+    """
+
+    _type: "str" = field(default="callProblemSilentRemote", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CallProblemDropped(CallProblem):
+    """
+    The call ended unexpectedly
+
+    """
+
+    _type: "str" = field(default="callProblemDropped", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CallProblemDistortedVideo(CallProblem):
+    """
+    The video was distorted
+
+    """
+
+    _type: "str" = field(default="callProblemDistortedVideo", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CallProblemPixelatedVideo(CallProblem):
+    """
+    The video was pixelated
+
+    """
+
+    _type: "str" = field(default="callProblemPixelatedVideo", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class Call(ObjectBase):
+    """
+    Describes a call
+
+    :param id: Call identifier, not persistent
+    :param user_id: User identifier of the other call participant
+    :param is_outgoing: True, if the call is outgoing
+    :param is_video: True, if the call is a video call
+    :param state: Call state
+    """
+
+    _type: "str" = field(default="call", init=False, repr=False)
+    id: "int" = 0
+    user_id: "int" = 0
+    is_outgoing: "bool" = False
+    is_video: "bool" = False
+    state: "CallState | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "user_id": self.user_id,
+            "is_outgoing": self.is_outgoing,
+            "is_video": self.is_video,
+            "state": self.state._to_json_dict() if self.state is not None else None,
+        }
+
+@dataclass(slots=True)
+class FirebaseAuthenticationSettings(ObjectBase):
+    """
+    Contains settings for Firebase Authentication in the official applications
+
+    """
+
+    _type: "str" = field(default="FirebaseAuthenticationSettings", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FirebaseAuthenticationSettingsAndroid(FirebaseAuthenticationSettings):
+    """
+    Settings for Firebase Authentication in the official Android application
+
+    """
+
+    _type: "str" = field(default="firebaseAuthenticationSettingsAndroid", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FirebaseAuthenticationSettingsIos(FirebaseAuthenticationSettings):
+    """
+    Settings for Firebase Authentication in the official iOS application
+
+    :param device_token: Device token from Apple Push Notification service
+    :param is_app_sandbox: True, if App Sandbox is enabled
+    """
+
+    _type: "str" = field(default="firebaseAuthenticationSettingsIos", init=False, repr=False)
+    device_token: "str" = ""
+    is_app_sandbox: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "device_token": self.device_token,
+            "is_app_sandbox": self.is_app_sandbox,
+        }
+
+@dataclass(slots=True)
+class PhoneNumberAuthenticationSettings(ObjectBase):
+    """
+    Contains settings for the authentication of the user's phone number
+
+    :param allow_flash_call: Pass true if the authentication code may be sent via a flash call to the specified phone number
+    :param allow_missed_call: Pass true if the authentication code may be sent via a missed call to the specified phone number
+    :param is_current_phone_number: Pass true if the authenticated phone number is used on the current device
+    :param has_unknown_phone_number: Pass true if there is a SIM card in the current device, but it is not possible to check whether phone number matches
+    :param allow_sms_retriever_api: For official applications only. True, if the application can use Android SMS Retriever API (requires Google Play Services >= 10.2) to automatically receive the authentication code from the SMS. See https://developers.google.com/identity/sms-retriever/ for more details
+    :param firebase_authentication_settings: For official Android and iOS applications only; pass null otherwise. Settings for Firebase Authentication
+    :param authentication_tokens: List of up to 20 authentication tokens, recently received in updateOption("authentication_token") in previously logged out sessions; for setAuthenticationPhoneNumber only
+    """
+
+    _type: "str" = field(default="phoneNumberAuthenticationSettings", init=False, repr=False)
+    allow_flash_call: "bool" = False
+    allow_missed_call: "bool" = False
+    is_current_phone_number: "bool" = False
+    has_unknown_phone_number: "bool" = False
+    allow_sms_retriever_api: "bool" = False
+    firebase_authentication_settings: "FirebaseAuthenticationSettings | None" = None
+    authentication_tokens: "list[str] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "allow_flash_call": self.allow_flash_call,
+            "allow_missed_call": self.allow_missed_call,
+            "is_current_phone_number": self.is_current_phone_number,
+            "has_unknown_phone_number": self.has_unknown_phone_number,
+            "allow_sms_retriever_api": self.allow_sms_retriever_api,
+            "firebase_authentication_settings": self.firebase_authentication_settings._to_json_dict() if self.firebase_authentication_settings is not None else None,
+            "authentication_tokens": self.authentication_tokens,
+        }
+
+@dataclass(slots=True)
+class AddedReaction(ObjectBase):
+    """
+    Represents a reaction applied to a message
+
+    :param type: Type of the reaction
+    :param sender_id: Identifier of the chat member, applied the reaction
+    :param is_outgoing: True, if the reaction was added by the current user
+    :param date: Point in time (Unix timestamp) when the reaction was added
+    """
+
+    _type: "str" = field(default="addedReaction", init=False, repr=False)
+    type: "ReactionType | None" = None
+    sender_id: "MessageSender | None" = None
+    is_outgoing: "bool" = False
+    date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "sender_id": self.sender_id._to_json_dict() if self.sender_id is not None else None,
+            "is_outgoing": self.is_outgoing,
+            "date": self.date,
+        }
+
+@dataclass(slots=True)
+class AddedReactions(ObjectBase):
+    """
+    Represents a list of reactions added to a message
+
+    :param total_count: The total number of found reactions
+    :param reactions: The list of added reactions
+    :param next_offset: The offset for the next request. If empty, then there are no more results
+    """
+
+    _type: "str" = field(default="addedReactions", init=False, repr=False)
+    total_count: "int" = 0
+    reactions: "list[AddedReaction] | None" = None
+    next_offset: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "reactions": _list_to_json(self.reactions),
+            "next_offset": self.next_offset,
+        }
+
+@dataclass(slots=True)
+class AvailableReaction(ObjectBase):
+    """
+    Represents an available reaction
+
+    :param type: Type of the reaction
+    :param needs_premium: True, if Telegram Premium is needed to send the reaction
+    """
+
+    _type: "str" = field(default="availableReaction", init=False, repr=False)
+    type: "ReactionType | None" = None
+    needs_premium: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "needs_premium": self.needs_premium,
+        }
+
+@dataclass(slots=True)
+class AvailableReactions(ObjectBase):
+    """
+    Represents a list of reactions that can be added to a message
+
+    :param top_reactions: List of reactions to be shown at the top
+    :param recent_reactions: List of recently used reactions
+    :param popular_reactions: List of popular reactions
+    :param allow_custom_emoji: True, if any custom emoji reaction can be added by Telegram Premium subscribers
+    :param are_tags: True, if the reactions will be tags and the message can be found by them
+    :param unavailability_reason: The reason why the current user can't add reactions to the message, despite some other users can; may be null if none
+    """
+
+    _type: "str" = field(default="availableReactions", init=False, repr=False)
+    top_reactions: "list[AvailableReaction] | None" = None
+    recent_reactions: "list[AvailableReaction] | None" = None
+    popular_reactions: "list[AvailableReaction] | None" = None
+    allow_custom_emoji: "bool" = False
+    are_tags: "bool" = False
+    unavailability_reason: "ReactionUnavailabilityReason | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "top_reactions": _list_to_json(self.top_reactions),
+            "recent_reactions": _list_to_json(self.recent_reactions),
+            "popular_reactions": _list_to_json(self.popular_reactions),
+            "allow_custom_emoji": self.allow_custom_emoji,
+            "are_tags": self.are_tags,
+            "unavailability_reason": self.unavailability_reason._to_json_dict() if self.unavailability_reason is not None else None,
+        }
+
+@dataclass(slots=True)
+class EmojiReaction(ObjectBase):
+    """
+    Contains information about an emoji reaction
+
+    :param emoji: Text representation of the reaction
+    :param title: Reaction title
+    :param is_active: True, if the reaction can be added to new messages and enabled in chats
+    :param static_icon: Static icon for the reaction
+    :param appear_animation: Appear animation for the reaction
+    :param select_animation: Select animation for the reaction
+    :param activate_animation: Activate animation for the reaction
+    :param effect_animation: Effect animation for the reaction
+    :param around_animation: Around animation for the reaction; may be null
+    :param center_animation: Center animation for the reaction; may be null
+    """
+
+    _type: "str" = field(default="emojiReaction", init=False, repr=False)
+    emoji: "str" = ""
+    title: "str" = ""
+    is_active: "bool" = False
+    static_icon: "Sticker | None" = None
+    appear_animation: "Sticker | None" = None
+    select_animation: "Sticker | None" = None
+    activate_animation: "Sticker | None" = None
+    effect_animation: "Sticker | None" = None
+    around_animation: "Sticker | None" = None
+    center_animation: "Sticker | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "emoji": self.emoji,
+            "title": self.title,
+            "is_active": self.is_active,
+            "static_icon": self.static_icon._to_json_dict() if self.static_icon is not None else None,
+            "appear_animation": self.appear_animation._to_json_dict() if self.appear_animation is not None else None,
+            "select_animation": self.select_animation._to_json_dict() if self.select_animation is not None else None,
+            "activate_animation": self.activate_animation._to_json_dict() if self.activate_animation is not None else None,
+            "effect_animation": self.effect_animation._to_json_dict() if self.effect_animation is not None else None,
+            "around_animation": self.around_animation._to_json_dict() if self.around_animation is not None else None,
+            "center_animation": self.center_animation._to_json_dict() if self.center_animation is not None else None,
+        }
+
+@dataclass(slots=True)
+class ReactionUnavailabilityReason(ObjectBase):
+    """
+    Describes why the current user can't add reactions to the message, despite some other users can
+
+    """
+
+    _type: "str" = field(default="ReactionUnavailabilityReason", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReactionUnavailabilityReasonAnonymousAdministrator(ReactionUnavailabilityReason):
+    """
+    The user is an anonymous administrator in the supergroup, but isn't a creator of it, so they can't vote on behalf of the supergroup
+
+    """
+
+    _type: "str" = field(default="reactionUnavailabilityReasonAnonymousAdministrator", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReactionUnavailabilityReasonGuest(ReactionUnavailabilityReason):
+    """
+    The user isn't a member of the supergroup and can't send messages and reactions there without joining
+
+    """
+
+    _type: "str" = field(default="reactionUnavailabilityReasonGuest", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class Animations(ObjectBase):
+    """
+    Represents a list of animations
+
+    :param animations: List of animations
+    """
+
+    _type: "str" = field(default="animations", init=False, repr=False)
+    animations: "list[Animation] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "animations": _list_to_json(self.animations),
+        }
+
+@dataclass(slots=True)
+class DiceStickers(ObjectBase):
+    """
+    Contains animated stickers which must be used for dice animation rendering
+
+    """
+
+    _type: "str" = field(default="DiceStickers", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class DiceStickersRegular(DiceStickers):
+    """
+    A regular animated sticker
+
+    :param sticker: The animated sticker with the dice animation
+    """
+
+    _type: "str" = field(default="diceStickersRegular", init=False, repr=False)
+    sticker: "Sticker | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+        }
+
+@dataclass(slots=True)
+class DiceStickersSlotMachine(DiceStickers):
+    """
+    Animated stickers to be combined into a slot machine
+
+    :param background: The animated sticker with the slot machine background. The background animation must start playing after all reel animations finish
+    :param lever: The animated sticker with the lever animation. The lever animation must play once in the initial dice state
+    :param left_reel: The animated sticker with the left reel
+    :param center_reel: The animated sticker with the center reel
+    :param right_reel: The animated sticker with the right reel
+    """
+
+    _type: "str" = field(default="diceStickersSlotMachine", init=False, repr=False)
+    background: "Sticker | None" = None
+    lever: "Sticker | None" = None
+    left_reel: "Sticker | None" = None
+    center_reel: "Sticker | None" = None
+    right_reel: "Sticker | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "background": self.background._to_json_dict() if self.background is not None else None,
+            "lever": self.lever._to_json_dict() if self.lever is not None else None,
+            "left_reel": self.left_reel._to_json_dict() if self.left_reel is not None else None,
+            "center_reel": self.center_reel._to_json_dict() if self.center_reel is not None else None,
+            "right_reel": self.right_reel._to_json_dict() if self.right_reel is not None else None,
+        }
+
+@dataclass(slots=True)
+class ImportedContacts(ObjectBase):
+    """
+    Represents the result of an importContacts request
+
+    :param user_ids: User identifiers of the imported contacts in the same order as they were specified in the request; 0 if the contact is not yet a registered user
+    :param importer_count: The number of users that imported the corresponding contact; 0 for already registered users or if unavailable
+    """
+
+    _type: "str" = field(default="importedContacts", init=False, repr=False)
+    user_ids: "list[int] | None" = None
+    importer_count: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_ids": self.user_ids,
+            "importer_count": self.importer_count,
+        }
+
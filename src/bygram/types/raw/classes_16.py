@@ -0,0 +1,2491 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import Error, File
+    from .classes_01 import Animation, Audio, ChatBackground, ChatLocation, Contact, Document, Game, Location, Photo, Sticker, Thumbnail, Venue, Video, VoiceNote, WebApp
+    from .classes_02 import BusinessBotRights, ChatPermissions, ChatPhoto
+    from .classes_04 import ChatInviteLink, ChatMemberStatus, EmojiStatus
+    from .classes_05 import MessageSender
+    from .classes_06 import Message
+    from .classes_07 import ChatAvailableReactions
+    from .classes_08 import ForumTopicInfo, ReplyMarkup
+    from .classes_12 import InputMessageContent
+    from .classes_21 import InternalLinkType
+
+@dataclass(slots=True)
+class SpeechRecognitionResult(ObjectBase):
+    """
+    Describes result of speech recognition in a voice note
+
+    """
+
+    _type: "str" = field(default="SpeechRecognitionResult", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SpeechRecognitionResultPending(SpeechRecognitionResult):
+    """
+    The speech recognition is ongoing
+
+    :param partial_text: Partially recognized text
+    """
+
+    _type: "str" = field(default="speechRecognitionResultPending", init=False, repr=False)
+    partial_text: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "partial_text": self.partial_text,
+        }
+
+@dataclass(slots=True)
+class SpeechRecognitionResultText(SpeechRecognitionResult):
+    """
+    The speech recognition successfully finished
+
+    :param text: Recognized text
+    """
+
+    _type: "str" = field(default="speechRecognitionResultText", init=False, repr=False)
+    text: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text,
+        }
+
+@dataclass(slots=True)
+class SpeechRecognitionResultError(SpeechRecognitionResult):
+    """
+    The speech recognition failed
+
+    :param error: Recognition error. An error with a message "MSG_VOICE_TOO_LONG" is returned when media duration is too big to be recognized
+    """
+
+    _type: "str" = field(default="speechRecognitionResultError", init=False, repr=False)
+    error: "Error | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "error": self.error._to_json_dict() if self.error is not None else None,
+        }
+
+@dataclass(slots=True)
+class BusinessConnection(ObjectBase):
+    """
+    Describes a connection of the bot with a business account
+
+    :param id: Unique identifier of the connection
+    :param user_id: Identifier of the business user that created the connection
+    :param user_chat_id: Chat identifier of the private chat with the user
+    :param date: Point in time (Unix timestamp) when the connection was established
+    :param rights: Rights of the bot; may be null if the connection was disabled
+    :param is_enabled: True, if the connection is enabled; false otherwise
+    """
+
+    _type: "str" = field(default="businessConnection", init=False, repr=False)
+    id: "str" = ""
+    user_id: "int" = 0
+    user_chat_id: "int" = 0
+    date: "int" = 0
+    rights: "BusinessBotRights | None" = None
+    is_enabled: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "user_id": self.user_id,
+            "user_chat_id": self.user_chat_id,
+            "date": self.date,
+            "rights": self.rights._to_json_dict() if self.rights is not None else None,
+            "is_enabled": self.is_enabled,
+        }
+
+@dataclass(slots=True)
+class AttachmentMenuBotColor(ObjectBase):
+    """
+    Describes a color to highlight a bot added to attachment menu
+
+    :param light_color: Color in the RGB format for light themes
+    :param dark_color: Color in the RGB format for dark themes
+    """
+
+    _type: "str" = field(default="attachmentMenuBotColor", init=False, repr=False)
+    light_color: "int" = 0
+    dark_color: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "light_color": self.light_color,
+            "dark_color": self.dark_color,
+        }
+
+@dataclass(slots=True)
+class AttachmentMenuBot(ObjectBase):
+    """
+    Represents a bot, which can be added to attachment or side menu
+
+    :param bot_user_id: User identifier of the bot
+    :param supports_self_chat: True, if the bot supports opening from attachment menu in the chat with the bot
+    :param supports_user_chats: True, if the bot supports opening from attachment menu in private chats with ordinary users
+    :param supports_bot_chats: True, if the bot supports opening from attachment menu in private chats with other bots
+    :param supports_group_chats: True, if the bot supports opening from attachment menu in basic group and supergroup chats
+    :param supports_channel_chats: True, if the bot supports opening from attachment menu in channel chats
+    :param request_write_access: True, if the user must be asked for the permission to send messages to the bot
+    :param is_added: True, if the bot was explicitly added by the user. If the bot isn't added, then on the first bot launch toggleBotIsAddedToAttachmentMenu must be called and the bot must be added or removed
+    :param show_in_attachment_menu: True, if the bot must be shown in the attachment menu
+    :param show_in_side_menu: True, if the bot must be shown in the side menu
+    :param show_disclaimer_in_side_menu: True, if a disclaimer, why the bot is shown in the side menu, is needed
+    :param name: Name for the bot in attachment menu
+    :param name_color: Color to highlight selected name of the bot if appropriate; may be null
+    :param default_icon: Default icon for the bot in SVG format; may be null
+    :param ios_static_icon: Icon for the bot in SVG format for the official iOS app; may be null
+    :param ios_animated_icon: Icon for the bot in TGS format for the official iOS app; may be null
+    :param ios_side_menu_icon: Icon for the bot in PNG format for the official iOS app side menu; may be null
+    :param android_icon: Icon for the bot in TGS format for the official Android app; may be null
+    :param android_side_menu_icon: Icon for the bot in SVG format for the official Android app side menu; may be null
+    :param macos_icon: Icon for the bot in TGS format for the official native macOS app; may be null
+    :param macos_side_menu_icon: Icon for the bot in PNG format for the official macOS app side menu; may be null
+    :param icon_color: Color to highlight selected icon of the bot if appropriate; may be null
+    :param web_app_placeholder: Default placeholder for opened Web Apps in SVG format; may be null
+    """
+
+    _type: "str" = field(default="attachmentMenuBot", init=False, repr=False)
+    bot_user_id: "int" = 0
+    supports_self_chat: "bool" = False
+    supports_user_chats: "bool" = False
+    supports_bot_chats: "bool" = False
+    supports_group_chats: "bool" = False
+    supports_channel_chats: "bool" = False
+    request_write_access: "bool" = False
+    is_added: "bool" = False
+    show_in_attachment_menu: "bool" = False
+    show_in_side_menu: "bool" = False
+    show_disclaimer_in_side_menu: "bool" = False
+    name: "str" = ""
+    name_color: "AttachmentMenuBotColor | None" = None
+    default_icon: "File | None" = None
+    ios_static_icon: "File | None" = None
+    ios_animated_icon: "File | None" = None
+    ios_side_menu_icon: "File | None" = None
+    android_icon: "File | None" = None
+    android_side_menu_icon: "File | None" = None
+    macos_icon: "File | None" = None
+    macos_side_menu_icon: "File | None" = None
+    icon_color: "AttachmentMenuBotColor | None" = None
+    web_app_placeholder: "File | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "supports_self_chat": self.supports_self_chat,
+            "supports_user_chats": self.supports_user_chats,
+            "supports_bot_chats": self.supports_bot_chats,
+            "supports_group_chats": self.supports_group_chats,
+            "supports_channel_chats": self.supports_channel_chats,
+            "request_write_access": self.request_write_access,
+            "is_added": self.is_added,
+            "show_in_attachment_menu": self.show_in_attachment_menu,
+            "show_in_side_menu": self.show_in_side_menu,
+            "show_disclaimer_in_side_menu": self.show_disclaimer_in_side_menu,
+            "name": self.name,
+            "name_color": self.name_color._to_json_dict() if self.name_color is not None else None,
+            "default_icon": self.default_icon._to_json_dict() if self.default_icon is not None else None,
+            "ios_static_icon": self.ios_static_icon._to_json_dict() if self.ios_static_icon is not None else None,
+            "ios_animated_icon": self.ios_animated_icon._to_json_dict() if self.ios_animated_icon is not None else None,
+            "ios_side_menu_icon": self.ios_side_menu_icon._to_json_dict() if self.ios_side_menu_icon is not None else None,
+            "android_icon": self.android_icon._to_json_dict() if self.android_icon is not None else None,
+            "android_side_menu_icon": self.android_side_menu_icon._to_json_dict() if self.android_side_menu_icon is not None else None,
+            "macos_icon": self.macos_icon._to_json_dict() if self.macos_icon is not None else None,
+            "macos_side_menu_icon": self.macos_side_menu_icon._to_json_dict() if self.macos_side_menu_icon is not None else None,
+            "icon_color": self.icon_color._to_json_dict() if self.icon_color is not None else None,
+            "web_app_placeholder": self.web_app_placeholder._to_json_dict() if self.web_app_placeholder is not None else None,
+        }
+
+@dataclass(slots=True)
+class SentWebAppMessage(ObjectBase):
+    """
+    Information about the message sent by answerWebAppQuery
+
+    :param inline_message_id: Identifier of the sent inline message, if known
+    """
+
+    _type: "str" = field(default="sentWebAppMessage", init=False, repr=False)
+    inline_message_id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "inline_message_id": self.inline_message_id,
+        }
+
+@dataclass(slots=True)
+class BotWriteAccessAllowReason(ObjectBase):
+    """
+    Describes a reason why a bot was allowed to write messages to the current user
+
+    """
+
+    _type: "str" = field(default="BotWriteAccessAllowReason", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class BotWriteAccessAllowReasonConnectedWebsite(BotWriteAccessAllowReason):
+    """
+    The user connected a website by logging in using Telegram Login Widget on it
+
+    :param domain_name: Domain name of the connected website
+    """
+
+    _type: "str" = field(default="botWriteAccessAllowReasonConnectedWebsite", init=False, repr=False)
+    domain_name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "domain_name": self.domain_name,
+        }
+
+@dataclass(slots=True)
+class BotWriteAccessAllowReasonAddedToAttachmentMenu(BotWriteAccessAllowReason):
+    """
+    The user added the bot to attachment or side menu using toggleBotIsAddedToAttachmentMenu
+
+    """
+
+    _type: "str" = field(default="botWriteAccessAllowReasonAddedToAttachmentMenu", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class BotWriteAccessAllowReasonLaunchedWebApp(BotWriteAccessAllowReason):
+    """
+    The user launched a Web App using getWebAppLinkUrl
+
+    :param web_app: Information about the Web App
+    """
+
+    _type: "str" = field(default="botWriteAccessAllowReasonLaunchedWebApp", init=False, repr=False)
+    web_app: "WebApp | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "web_app": self.web_app._to_json_dict() if self.web_app is not None else None,
+        }
+
+@dataclass(slots=True)
+class BotWriteAccessAllowReasonAcceptedRequest(BotWriteAccessAllowReason):
+    """
+    The user accepted bot's request to send messages with allowBotToSendMessages
+
+    """
+
+    _type: "str" = field(default="botWriteAccessAllowReasonAcceptedRequest", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class HttpUrl(ObjectBase):
+    """
+    Contains an HTTP URL
+
+    :param url: The URL
+    """
+
+    _type: "str" = field(default="httpUrl", init=False, repr=False)
+    url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+        }
+
+@dataclass(slots=True)
+class UserLink(ObjectBase):
+    """
+    Contains an HTTPS URL, which can be used to get information about a user
+
+    :param url: The URL
+    :param expires_in: Left time for which the link is valid, in seconds; 0 if the link is a public username link
+    """
+
+    _type: "str" = field(default="userLink", init=False, repr=False)
+    url: "str" = ""
+    expires_in: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+            "expires_in": self.expires_in,
+        }
+
+@dataclass(slots=True)
+class TargetChatTypes(ObjectBase):
+    """
+    Describes allowed types for the target chat
+
+    :param allow_user_chats: True, if private chats with ordinary users are allowed
+    :param allow_bot_chats: True, if private chats with other bots are allowed
+    :param allow_group_chats: True, if basic group and supergroup chats are allowed
+    :param allow_channel_chats: True, if channel chats are allowed
+    """
+
+    _type: "str" = field(default="targetChatTypes", init=False, repr=False)
+    allow_user_chats: "bool" = False
+    allow_bot_chats: "bool" = False
+    allow_group_chats: "bool" = False
+    allow_channel_chats: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "allow_user_chats": self.allow_user_chats,
+            "allow_bot_chats": self.allow_bot_chats,
+            "allow_group_chats": self.allow_group_chats,
+            "allow_channel_chats": self.allow_channel_chats,
+        }
+
+@dataclass(slots=True)
+class TargetChat(ObjectBase):
+    """
+    Describes the target chat to be opened
+
+    """
+
+    _type: "str" = field(default="TargetChat", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TargetChatCurrent(TargetChat):
+    """
+    The currently opened chat and forum topic must be kept
+
+    """
+
+    _type: "str" = field(default="targetChatCurrent", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TargetChatChosen(TargetChat):
+    """
+    The chat needs to be chosen by the user among chats of the specified types
+
+    :param types: Allowed types for the chat
+    """
+
+    _type: "str" = field(default="targetChatChosen", init=False, repr=False)
+    types: "TargetChatTypes | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "types": self.types._to_json_dict() if self.types is not None else None,
+        }
+
+@dataclass(slots=True)
+class TargetChatInternalLink(TargetChat):
+    """
+    The chat needs to be open with the provided internal link
+
+    :param link: An internal link pointing to the chat
+    """
+
+    _type: "str" = field(default="targetChatInternalLink", init=False, repr=False)
+    link: "InternalLinkType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "link": self.link._to_json_dict() if self.link is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputInlineQueryResult(ObjectBase):
+    """
+    Represents a single result of an inline query; for bots only
+
+    """
+
+    _type: "str" = field(default="InputInlineQueryResult", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InputInlineQueryResultAnimation(InputInlineQueryResult):
+    """
+    Represents a link to an animated GIF or an animated (i.e., without sound) H.264/MPEG-4 AVC video
+
+    :param id: Unique identifier of the query result
+    :param title: Title of the query result
+    :param thumbnail_url: URL of the result thumbnail (JPEG, GIF, or MPEG4), if it exists
+    :param thumbnail_mime_type: MIME type of the video thumbnail. If non-empty, must be one of "image/jpeg", "image/gif" and "video/mp4"
+    :param video_url: The URL of the video file (file size must not exceed 1MB)
+    :param video_mime_type: MIME type of the video file. Must be one of "image/gif" and "video/mp4"
+    :param video_duration: Duration of the video, in seconds
+    :param video_width: Width of the video
+    :param video_height: Height of the video
+    :param reply_markup: The message reply markup; pass null if none. Must be of type replyMarkupInlineKeyboard or null
+    :param input_message_content: The content of the message to be sent. Must be one of the following types: inputMessageText, inputMessageAnimation, inputMessageInvoice, inputMessageLocation, inputMessageVenue or inputMessageContact
+    """
+
+    _type: "str" = field(default="inputInlineQueryResultAnimation", init=False, repr=False)
+    id: "str" = ""
+    title: "str" = ""
+    thumbnail_url: "str" = ""
+    thumbnail_mime_type: "str" = ""
+    video_url: "str" = ""
+    video_mime_type: "str" = ""
+    video_duration: "int" = 0
+    video_width: "int" = 0
+    video_height: "int" = 0
+    reply_markup: "ReplyMarkup | None" = None
+    input_message_content: "InputMessageContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "title": self.title,
+            "thumbnail_url": self.thumbnail_url,
+            "thumbnail_mime_type": self.thumbnail_mime_type,
+            "video_url": self.video_url,
+            "video_mime_type": self.video_mime_type,
+            "video_duration": self.video_duration,
+            "video_width": self.video_width,
+            "video_height": self.video_height,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+            "input_message_content": self.input_message_content._to_json_dict() if self.input_message_content is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputInlineQueryResultArticle(InputInlineQueryResult):
+    """
+    Represents a link to an article or web page
+
+    :param id: Unique identifier of the query result
+    :param url: URL of the result, if it exists
+    :param title: Title of the result
+    :param description: Represents a link to an article or web page
+    :param thumbnail_url: URL of the result thumbnail, if it exists
+    :param thumbnail_width: Thumbnail width, if known
+    :param thumbnail_height: Thumbnail height, if known
+    :param reply_markup: The message reply markup; pass null if none. Must be of type replyMarkupInlineKeyboard or null
+    :param input_message_content: The content of the message to be sent. Must be one of the following types: inputMessageText, inputMessageInvoice, inputMessageLocation, inputMessageVenue or inputMessageContact
+    """
+
+    _type: "str" = field(default="inputInlineQueryResultArticle", init=False, repr=False)
+    id: "str" = ""
+    url: "str" = ""
+    title: "str" = ""
+    description: "str" = ""
+    thumbnail_url: "str" = ""
+    thumbnail_width: "int" = 0
+    thumbnail_height: "int" = 0
+    reply_markup: "ReplyMarkup | None" = None
+    input_message_content: "InputMessageContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "url": self.url,
+            "title": self.title,
+            "description": self.description,
+            "thumbnail_url": self.thumbnail_url,
+            "thumbnail_width": self.thumbnail_width,
+            "thumbnail_height": self.thumbnail_height,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+            "input_message_content": self.input_message_content._to_json_dict() if self.input_message_content is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputInlineQueryResultAudio(InputInlineQueryResult):
+    """
+    Represents a link to an MP3 audio file
+
+    :param id: Unique identifier of the query result
+    :param title: Title of the audio file
+    :param performer: Performer of the audio file
+    :param audio_url: The URL of the audio file
+    :param audio_duration: Audio file duration, in seconds
+    :param reply_markup: The message reply markup; pass null if none. Must be of type replyMarkupInlineKeyboard or null
+    :param input_message_content: The content of the message to be sent. Must be one of the following types: inputMessageText, inputMessageAudio, inputMessageInvoice, inputMessageLocation, inputMessageVenue or inputMessageContact
+    """
+
+    _type: "str" = field(default="inputInlineQueryResultAudio", init=False, repr=False)
+    id: "str" = ""
+    title: "str" = ""
+    performer: "str" = ""
+    audio_url: "str" = ""
+    audio_duration: "int" = 0
+    reply_markup: "ReplyMarkup | None" = None
+    input_message_content: "InputMessageContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "title": self.title,
+            "performer": self.performer,
+            "audio_url": self.audio_url,
+            "audio_duration": self.audio_duration,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+            "input_message_content": self.input_message_content._to_json_dict() if self.input_message_content is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputInlineQueryResultContact(InputInlineQueryResult):
+    """
+    Represents a user contact
+
+    :param id: Unique identifier of the query result
+    :param contact: User contact
+    :param thumbnail_url: URL of the result thumbnail, if it exists
+    :param thumbnail_width: Thumbnail width, if known
+    :param thumbnail_height: Thumbnail height, if known
+    :param reply_markup: The message reply markup; pass null if none. Must be of type replyMarkupInlineKeyboard or null
+    :param input_message_content: The content of the message to be sent. Must be one of the following types: inputMessageText, inputMessageInvoice, inputMessageLocation, inputMessageVenue or inputMessageContact
+    """
+
+    _type: "str" = field(default="inputInlineQueryResultContact", init=False, repr=False)
+    id: "str" = ""
+    contact: "Contact | None" = None
+    thumbnail_url: "str" = ""
+    thumbnail_width: "int" = 0
+    thumbnail_height: "int" = 0
+    reply_markup: "ReplyMarkup | None" = None
+    input_message_content: "InputMessageContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "contact": self.contact._to_json_dict() if self.contact is not None else None,
+            "thumbnail_url": self.thumbnail_url,
+            "thumbnail_width": self.thumbnail_width,
+            "thumbnail_height": self.thumbnail_height,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+            "input_message_content": self.input_message_content._to_json_dict() if self.input_message_content is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputInlineQueryResultDocument(InputInlineQueryResult):
+    """
+    Represents a link to a file
+
+    :param id: Unique identifier of the query result
+    :param title: Title of the resulting file
+    :param description: Represents a link to a file
+    :param document_url: URL of the file
+    :param mime_type: MIME type of the file content; only "application/pdf" and "application/zip" are currently allowed
+    :param thumbnail_url: The URL of the file thumbnail, if it exists
+    :param thumbnail_width: Width of the thumbnail
+    :param thumbnail_height: Height of the thumbnail
+    :param reply_markup: The message reply markup; pass null if none. Must be of type replyMarkupInlineKeyboard or null
+    :param input_message_content: The content of the message to be sent. Must be one of the following types: inputMessageText, inputMessageDocument, inputMessageInvoice, inputMessageLocation, inputMessageVenue or inputMessageContact
+    """
+
+    _type: "str" = field(default="inputInlineQueryResultDocument", init=False, repr=False)
+    id: "str" = ""
+    title: "str" = ""
+    description: "str" = ""
+    document_url: "str" = ""
+    mime_type: "str" = ""
+    thumbnail_url: "str" = ""
+    thumbnail_width: "int" = 0
+    thumbnail_height: "int" = 0
+    reply_markup: "ReplyMarkup | None" = None
+    input_message_content: "InputMessageContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "document_url": self.document_url,
+            "mime_type": self.mime_type,
+            "thumbnail_url": self.thumbnail_url,
+            "thumbnail_width": self.thumbnail_width,
+            "thumbnail_height": self.thumbnail_height,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+            "input_message_content": self.input_message_content._to_json_dict() if self.input_message_content is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputInlineQueryResultGame(InputInlineQueryResult):
+    """
+    Represents a game
+
+    :param id: Unique identifier of the query result
+    :param game_short_name: Short name of the game
+    :param reply_markup: The message reply markup; pass null if none. Must be of type replyMarkupInlineKeyboard or null
+    """
+
+    _type: "str" = field(default="inputInlineQueryResultGame", init=False, repr=False)
+    id: "str" = ""
+    game_short_name: "str" = ""
+    reply_markup: "ReplyMarkup | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "game_short_name": self.game_short_name,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputInlineQueryResultLocation(InputInlineQueryResult):
+    """
+    Represents a point on the map
+
+    :param id: Unique identifier of the query result
+    :param location: Location result
+    :param live_period: Amount of time relative to the message sent time until the location can be updated, in seconds
+    :param title: Title of the result
+    :param thumbnail_url: URL of the result thumbnail, if it exists
+    :param thumbnail_width: Thumbnail width, if known
+    :param thumbnail_height: Thumbnail height, if known
+    :param reply_markup: The message reply markup; pass null if none. Must be of type replyMarkupInlineKeyboard or null
+    :param input_message_content: The content of the message to be sent. Must be one of the following types: inputMessageText, inputMessageInvoice, inputMessageLocation, inputMessageVenue or inputMessageContact
+    """
+
+    _type: "str" = field(default="inputInlineQueryResultLocation", init=False, repr=False)
+    id: "str" = ""
+    location: "Location | None" = None
+    live_period: "int" = 0
+    title: "str" = ""
+    thumbnail_url: "str" = ""
+    thumbnail_width: "int" = 0
+    thumbnail_height: "int" = 0
+    reply_markup: "ReplyMarkup | None" = None
+    input_message_content: "InputMessageContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "location": self.location._to_json_dict() if self.location is not None else None,
+            "live_period": self.live_period,
+            "title": self.title,
+            "thumbnail_url": self.thumbnail_url,
+            "thumbnail_width": self.thumbnail_width,
+            "thumbnail_height": self.thumbnail_height,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+            "input_message_content": self.input_message_content._to_json_dict() if self.input_message_content is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputInlineQueryResultPhoto(InputInlineQueryResult):
+    """
+    Represents link to a JPEG image
+
+    :param id: Unique identifier of the query result
+    :param title: Title of the result, if known
+    :param description: Represents link to a JPEG image
+    :param thumbnail_url: URL of the photo thumbnail, if it exists
+    :param photo_url: The URL of the JPEG photo (photo size must not exceed 5MB)
+    :param photo_width: Width of the photo
+    :param photo_height: Height of the photo
+    :param reply_markup: The message reply markup; pass null if none. Must be of type replyMarkupInlineKeyboard or null
+    :param input_message_content: The content of the message to be sent. Must be one of the following types: inputMessageText, inputMessagePhoto, inputMessageInvoice, inputMessageLocation, inputMessageVenue or inputMessageContact
+    """
+
+    _type: "str" = field(default="inputInlineQueryResultPhoto", init=False, repr=False)
+    id: "str" = ""
+    title: "str" = ""
+    description: "str" = ""
+    thumbnail_url: "str" = ""
+    photo_url: "str" = ""
+    photo_width: "int" = 0
+    photo_height: "int" = 0
+    reply_markup: "ReplyMarkup | None" = None
+    input_message_content: "InputMessageContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "thumbnail_url": self.thumbnail_url,
+            "photo_url": self.photo_url,
+            "photo_width": self.photo_width,
+            "photo_height": self.photo_height,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+            "input_message_content": self.input_message_content._to_json_dict() if self.input_message_content is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputInlineQueryResultSticker(InputInlineQueryResult):
+    """
+    Represents a link to a WEBP, TGS, or WEBM sticker
+
+    :param id: Unique identifier of the query result
+    :param thumbnail_url: URL of the sticker thumbnail, if it exists
+    :param sticker_url: The URL of the WEBP, TGS, or WEBM sticker (sticker file size must not exceed 5MB)
+    :param sticker_width: Width of the sticker
+    :param sticker_height: Height of the sticker
+    :param reply_markup: The message reply markup; pass null if none. Must be of type replyMarkupInlineKeyboard or null
+    :param input_message_content: The content of the message to be sent. Must be one of the following types: inputMessageText, inputMessageSticker, inputMessageInvoice, inputMessageLocation, inputMessageVenue or inputMessageContact
+    """
+
+    _type: "str" = field(default="inputInlineQueryResultSticker", init=False, repr=False)
+    id: "str" = ""
+    thumbnail_url: "str" = ""
+    sticker_url: "str" = ""
+    sticker_width: "int" = 0
+    sticker_height: "int" = 0
+    reply_markup: "ReplyMarkup | None" = None
+    input_message_content: "InputMessageContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "thumbnail_url": self.thumbnail_url,
+            "sticker_url": self.sticker_url,
+            "sticker_width": self.sticker_width,
+            "sticker_height": self.sticker_height,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+            "input_message_content": self.input_message_content._to_json_dict() if self.input_message_content is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputInlineQueryResultVenue(InputInlineQueryResult):
+    """
+    Represents information about a venue
+
+    :param id: Unique identifier of the query result
+    :param venue: Venue result
+    :param thumbnail_url: URL of the result thumbnail, if it exists
+    :param thumbnail_width: Thumbnail width, if known
+    :param thumbnail_height: Thumbnail height, if known
+    :param reply_markup: The message reply markup; pass null if none. Must be of type replyMarkupInlineKeyboard or null
+    :param input_message_content: The content of the message to be sent. Must be one of the following types: inputMessageText, inputMessageInvoice, inputMessageLocation, inputMessageVenue or inputMessageContact
+    """
+
+    _type: "str" = field(default="inputInlineQueryResultVenue", init=False, repr=False)
+    id: "str" = ""
+    venue: "Venue | None" = None
+    thumbnail_url: "str" = ""
+    thumbnail_width: "int" = 0
+    thumbnail_height: "int" = 0
+    reply_markup: "ReplyMarkup | None" = None
+    input_message_content: "InputMessageContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "venue": self.venue._to_json_dict() if self.venue is not None else None,
+            "thumbnail_url": self.thumbnail_url,
+            "thumbnail_width": self.thumbnail_width,
+            "thumbnail_height": self.thumbnail_height,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+            "input_message_content": self.input_message_content._to_json_dict() if self.input_message_content is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputInlineQueryResultVideo(InputInlineQueryResult):
+    """
+    Represents a link to a page containing an embedded video player or a video file
+
+    :param id: Unique identifier of the query result
+    :param title: Title of the result
+    :param description: Represents a link to a page containing an embedded video player or a video file
+    :param thumbnail_url: The URL of the video thumbnail (JPEG), if it exists
+    :param video_url: URL of the embedded video player or video file
+    :param mime_type: MIME type of the content of the video URL, only "text/html" or "video/mp4" are currently supported
+    :param video_width: Width of the video
+    :param video_height: Height of the video
+    :param video_duration: Video duration, in seconds
+    :param reply_markup: The message reply markup; pass null if none. Must be of type replyMarkupInlineKeyboard or null
+    :param input_message_content: The content of the message to be sent. Must be one of the following types: inputMessageText, inputMessageVideo, inputMessageInvoice, inputMessageLocation, inputMessageVenue or inputMessageContact
+    """
+
+    _type: "str" = field(default="inputInlineQueryResultVideo", init=False, repr=False)
+    id: "str" = ""
+    title: "str" = ""
+    description: "str" = ""
+    thumbnail_url: "str" = ""
+    video_url: "str" = ""
+    mime_type: "str" = ""
+    video_width: "int" = 0
+    video_height: "int" = 0
+    video_duration: "int" = 0
+    reply_markup: "ReplyMarkup | None" = None
+    input_message_content: "InputMessageContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "thumbnail_url": self.thumbnail_url,
+            "video_url": self.video_url,
+            "mime_type": self.mime_type,
+            "video_width": self.video_width,
+            "video_height": self.video_height,
+            "video_duration": self.video_duration,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+            "input_message_content": self.input_message_content._to_json_dict() if self.input_message_content is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputInlineQueryResultVoiceNote(InputInlineQueryResult):
+    """
+    Represents a link to an opus-encoded audio file within an OGG container, single channel audio
+
+    :param id: Unique identifier of the query result
+    :param title: Title of the voice note
+    :param voice_note_url: The URL of the voice note file
+    :param voice_note_duration: Duration of the voice note, in seconds
+    :param reply_markup: The message reply markup; pass null if none. Must be of type replyMarkupInlineKeyboard or null
+    :param input_message_content: The content of the message to be sent. Must be one of the following types: inputMessageText, inputMessageVoiceNote, inputMessageInvoice, inputMessageLocation, inputMessageVenue or inputMessageContact
+    """
+
+    _type: "str" = field(default="inputInlineQueryResultVoiceNote", init=False, repr=False)
+    id: "str" = ""
+    title: "str" = ""
+    voice_note_url: "str" = ""
+    voice_note_duration: "int" = 0
+    reply_markup: "ReplyMarkup | None" = None
+    input_message_content: "InputMessageContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "title": self.title,
+            "voice_note_url": self.voice_note_url,
+            "voice_note_duration": self.voice_note_duration,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+            "input_message_content": self.input_message_content._to_json_dict() if self.input_message_content is not None else None,
+        }
+
+@dataclass(slots=True)
+class InlineQueryResult(ObjectBase):
+    """
+    Represents a single result of an inline query
+
+    """
+
+    _type: "str" = field(default="InlineQueryResult", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InlineQueryResultArticle(InlineQueryResult):
+    """
+    Represents a link to an article or web page
+
+    :param id: Unique identifier of the query result
+    :param url: URL of the result, if it exists
+    :param title: Title of the result
+    :param description: Represents a link to an article or web page
+    :param thumbnail: Result thumbnail in JPEG format; may be null
+    """
+
+    _type: "str" = field(default="inlineQueryResultArticle", init=False, repr=False)
+    id: "str" = ""
+    url: "str" = ""
+    title: "str" = ""
+    description: "str" = ""
+    thumbnail: "Thumbnail | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "url": self.url,
+            "title": self.title,
+            "description": self.description,
+            "thumbnail": self.thumbnail._to_json_dict() if self.thumbnail is not None else None,
+        }
+
+@dataclass(slots=True)
+class InlineQueryResultContact(InlineQueryResult):
+    """
+    Represents a user contact
+
+    :param id: Unique identifier of the query result
+    :param contact: A user contact
+    :param thumbnail: Result thumbnail in JPEG format; may be null
+    """
+
+    _type: "str" = field(default="inlineQueryResultContact", init=False, repr=False)
+    id: "str" = ""
+    contact: "Contact | None" = None
+    thumbnail: "Thumbnail | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "contact": self.contact._to_json_dict() if self.contact is not None else None,
+            "thumbnail": self.thumbnail._to_json_dict() if self.thumbnail is not None else None,
+        }
+
+@dataclass(slots=True)
+class InlineQueryResultLocation(InlineQueryResult):
+    """
+    Represents a point on the map
+
+    :param id: Unique identifier of the query result
+    :param location: Location result
+    :param title: Title of the result
+    :param thumbnail: Result thumbnail in JPEG format; may be null
+    """
+
+    _type: "str" = field(default="inlineQueryResultLocation", init=False, repr=False)
+    id: "str" = ""
+    location: "Location | None" = None
+    title: "str" = ""
+    thumbnail: "Thumbnail | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "location": self.location._to_json_dict() if self.location is not None else None,
+            "title": self.title,
+            "thumbnail": self.thumbnail._to_json_dict() if self.thumbnail is not None else None,
+        }
+
+@dataclass(slots=True)
+class InlineQueryResultVenue(InlineQueryResult):
+    """
+    Represents information about a venue
+
+    :param id: Unique identifier of the query result
+    :param venue: Venue result
+    :param thumbnail: Result thumbnail in JPEG format; may be null
+    """
+
+    _type: "str" = field(default="inlineQueryResultVenue", init=False, repr=False)
+    id: "str" = ""
+    venue: "Venue | None" = None
+    thumbnail: "Thumbnail | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "venue": self.venue._to_json_dict() if self.venue is not None else None,
+            "thumbnail": self.thumbnail._to_json_dict() if self.thumbnail is not None else None,
+        }
+
+@dataclass(slots=True)
+class InlineQueryResultGame(InlineQueryResult):
+    """
+    Represents information about a game
+
+    :param id: Unique identifier of the query result
+    :param game: Game result
+    """
+
+    _type: "str" = field(default="inlineQueryResultGame", init=False, repr=False)
+    id: "str" = ""
+    game: "Game | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "game": self.game._to_json_dict() if self.game is not None else None,
+        }
+
+@dataclass(slots=True)
+class InlineQueryResultAnimation(InlineQueryResult):
+    """
+    Represents an animation file
+
+    :param id: Unique identifier of the query result
+    :param animation: Animation file
+    :param title: Animation title
+    """
+
+    _type: "str" = field(default="inlineQueryResultAnimation", init=False, repr=False)
+    id: "str" = ""
+    animation: "Animation | None" = None
+    title: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "animation": self.animation._to_json_dict() if self.animation is not None else None,
+            "title": self.title,
+        }
+
+@dataclass(slots=True)
+class InlineQueryResultAudio(InlineQueryResult):
+    """
+    Represents an audio file
+
+    :param id: Unique identifier of the query result
+    :param audio: Audio file
+    """
+
+    _type: "str" = field(default="inlineQueryResultAudio", init=False, repr=False)
+    id: "str" = ""
+    audio: "Audio | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "audio": self.audio._to_json_dict() if self.audio is not None else None,
+        }
+
+@dataclass(slots=True)
+class InlineQueryResultDocument(InlineQueryResult):
+    """
+    Represents a document
+
+    :param id: Unique identifier of the query result
+    :param document: Document
+    :param title: Document title
+    :param description: Represents a document
+    """
+
+    _type: "str" = field(default="inlineQueryResultDocument", init=False, repr=False)
+    id: "str" = ""
+    document: "Document | None" = None
+    title: "str" = ""
+    description: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "document": self.document._to_json_dict() if self.document is not None else None,
+            "title": self.title,
+            "description": self.description,
+        }
+
+@dataclass(slots=True)
+class InlineQueryResultPhoto(InlineQueryResult):
+    """
+    Represents a photo
+
+    :param id: Unique identifier of the query result
+    :param photo: Photo
+    :param title: Title of the result, if known
+    :param description: Represents a photo
+    """
+
+    _type: "str" = field(default="inlineQueryResultPhoto", init=False, repr=False)
+    id: "str" = ""
+    photo: "Photo | None" = None
+    title: "str" = ""
+    description: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+            "title": self.title,
+            "description": self.description,
+        }
+
+@dataclass(slots=True)
+class InlineQueryResultSticker(InlineQueryResult):
+    """
+    Represents a sticker
+
+    :param id: Unique identifier of the query result
+    :param sticker: Sticker
+    """
+
+    _type: "str" = field(default="inlineQueryResultSticker", init=False, repr=False)
+    id: "str" = ""
+    sticker: "Sticker | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+        }
+
+@dataclass(slots=True)
+class InlineQueryResultVideo(InlineQueryResult):
+    """
+    Represents a video
+
+    :param id: Unique identifier of the query result
+    :param video: Video
+    :param title: Title of the video
+    :param description: Represents a video
+    """
+
+    _type: "str" = field(default="inlineQueryResultVideo", init=False, repr=False)
+    id: "str" = ""
+    video: "Video | None" = None
+    title: "str" = ""
+    description: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "video": self.video._to_json_dict() if self.video is not None else None,
+            "title": self.title,
+            "description": self.description,
+        }
+
+@dataclass(slots=True)
+class InlineQueryResultVoiceNote(InlineQueryResult):
+    """
+    Represents a voice note
+
+    :param id: Unique identifier of the query result
+    :param voice_note: Voice note
+    :param title: Title of the voice note
+    """
+
+    _type: "str" = field(default="inlineQueryResultVoiceNote", init=False, repr=False)
+    id: "str" = ""
+    voice_note: "VoiceNote | None" = None
+    title: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "voice_note": self.voice_note._to_json_dict() if self.voice_note is not None else None,
+            "title": self.title,
+        }
+
+@dataclass(slots=True)
+class InlineQueryResultsButtonType(ObjectBase):
+    """
+    Represents type of button in results of inline query
+
+    """
+
+    _type: "str" = field(default="InlineQueryResultsButtonType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InlineQueryResultsButtonTypeStartBot(InlineQueryResultsButtonType):
+    """
+    Describes the button that opens a private chat with the bot and sends a start message to the bot with the given parameter
+
+    :param parameter: The parameter for the bot start message
+    """
+
+    _type: "str" = field(default="inlineQueryResultsButtonTypeStartBot", init=False, repr=False)
+    parameter: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "parameter": self.parameter,
+        }
+
+@dataclass(slots=True)
+class InlineQueryResultsButtonTypeWebApp(InlineQueryResultsButtonType):
+    """
+    Describes the button that opens a Web App by calling getWebAppUrl
+
+    :param url: An HTTP URL to pass to getWebAppUrl
+    """
+
+    _type: "str" = field(default="inlineQueryResultsButtonTypeWebApp", init=False, repr=False)
+    url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+        }
+
+@dataclass(slots=True)
+class InlineQueryResultsButton(ObjectBase):
+    """
+    Represents a button to be shown above inline query results
+
+    :param text: The text of the button
+    :param type: Type of the button
+    """
+
+    _type: "str" = field(default="inlineQueryResultsButton", init=False, repr=False)
+    text: "str" = ""
+    type: "InlineQueryResultsButtonType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+@dataclass(slots=True)
+class InlineQueryResults(ObjectBase):
+    """
+    Represents the results of the inline query. Use sendInlineQueryResultMessage to send the result of the query
+
+    :param inline_query_id: Unique identifier of the inline query
+    :param button: Button to be shown above inline query results; may be null
+    :param results: Results of the query
+    :param next_offset: The offset for the next request. If empty, then there are no more results
+    """
+
+    _type: "str" = field(default="inlineQueryResults", init=False, repr=False)
+    inline_query_id: "int" = 0
+    button: "InlineQueryResultsButton | None" = None
+    results: "list[InlineQueryResult] | None" = None
+    next_offset: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "inline_query_id": self.inline_query_id,
+            "button": self.button._to_json_dict() if self.button is not None else None,
+            "results": _list_to_json(self.results),
+            "next_offset": self.next_offset,
+        }
+
+@dataclass(slots=True)
+class PreparedInlineMessageId(ObjectBase):
+    """
+    Represents an inline message that can be sent via the bot
+
+    :param id: Unique identifier for the message
+    :param expiration_date: Point in time (Unix timestamp) when the message can't be used anymore
+    """
+
+    _type: "str" = field(default="preparedInlineMessageId", init=False, repr=False)
+    id: "str" = ""
+    expiration_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "expiration_date": self.expiration_date,
+        }
+
+@dataclass(slots=True)
+class PreparedInlineMessage(ObjectBase):
+    """
+    Represents a ready to send inline message. Use sendInlineQueryResultMessage to send the message
+
+    :param inline_query_id: Unique identifier of the inline query to pass to sendInlineQueryResultMessage
+    :param result: Resulted inline message of the query
+    :param chat_types: Types of the chats to which the message can be sent
+    """
+
+    _type: "str" = field(default="preparedInlineMessage", init=False, repr=False)
+    inline_query_id: "int" = 0
+    result: "InlineQueryResult | None" = None
+    chat_types: "TargetChatTypes | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "inline_query_id": self.inline_query_id,
+            "result": self.result._to_json_dict() if self.result is not None else None,
+            "chat_types": self.chat_types._to_json_dict() if self.chat_types is not None else None,
+        }
+
+@dataclass(slots=True)
+class CallbackQueryPayload(ObjectBase):
+    """
+    Represents a payload of a callback query
+
+    """
+
+    _type: "str" = field(default="CallbackQueryPayload", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CallbackQueryPayloadData(CallbackQueryPayload):
+    """
+    The payload for a general callback button
+
+    :param data: Data that was attached to the callback button
+    """
+
+    _type: "str" = field(default="callbackQueryPayloadData", init=False, repr=False)
+    data: "bytes" = b""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "data": _bytes_to_json(self.data),
+        }
+
+@dataclass(slots=True)
+class CallbackQueryPayloadDataWithPassword(CallbackQueryPayload):
+    """
+    The payload for a callback button requiring password
+
+    :param password: The 2-step verification password for the current user
+    :param data: Data that was attached to the callback button
+    """
+
+    _type: "str" = field(default="callbackQueryPayloadDataWithPassword", init=False, repr=False)
+    password: "str" = ""
+    data: "bytes" = b""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "password": self.password,
+            "data": _bytes_to_json(self.data),
+        }
+
+@dataclass(slots=True)
+class CallbackQueryPayloadGame(CallbackQueryPayload):
+    """
+    The payload for a game callback button
+
+    :param game_short_name: A short name of the game that was attached to the callback button
+    """
+
+    _type: "str" = field(default="callbackQueryPayloadGame", init=False, repr=False)
+    game_short_name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "game_short_name": self.game_short_name,
+        }
+
+@dataclass(slots=True)
+class CallbackQueryAnswer(ObjectBase):
+    """
+    Contains a bot's answer to a callback query
+
+    :param text: Text of the answer
+    :param show_alert: True, if an alert must be shown to the user instead of a toast notification
+    :param url: URL to be opened
+    """
+
+    _type: "str" = field(default="callbackQueryAnswer", init=False, repr=False)
+    text: "str" = ""
+    show_alert: "bool" = False
+    url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text,
+            "show_alert": self.show_alert,
+            "url": self.url,
+        }
+
+@dataclass(slots=True)
+class CustomRequestResult(ObjectBase):
+    """
+    Contains the result of a custom request
+
+    :param result: A JSON-serialized result
+    """
+
+    _type: "str" = field(default="customRequestResult", init=False, repr=False)
+    result: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "result": self.result,
+        }
+
+@dataclass(slots=True)
+class GameHighScore(ObjectBase):
+    """
+    Contains one row of the game high score table
+
+    :param position: Position in the high score table
+    :param user_id: User identifier
+    :param score: User score
+    """
+
+    _type: "str" = field(default="gameHighScore", init=False, repr=False)
+    position: "int" = 0
+    user_id: "int" = 0
+    score: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "position": self.position,
+            "user_id": self.user_id,
+            "score": self.score,
+        }
+
+@dataclass(slots=True)
+class GameHighScores(ObjectBase):
+    """
+    Contains a list of game high scores
+
+    :param scores: A list of game high scores
+    """
+
+    _type: "str" = field(default="gameHighScores", init=False, repr=False)
+    scores: "list[GameHighScore] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "scores": _list_to_json(self.scores),
+        }
+
+@dataclass(slots=True)
+class ChatEventAction(ObjectBase):
+    """
+    Represents a chat event
+
+    """
+
+    _type: "str" = field(default="ChatEventAction", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatEventMessageEdited(ChatEventAction):
+    """
+    A message was edited
+
+    :param old_message: The original message before the edit
+    :param new_message: The message after it was edited
+    """
+
+    _type: "str" = field(default="chatEventMessageEdited", init=False, repr=False)
+    old_message: "Message | None" = None
+    new_message: "Message | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "old_message": self.old_message._to_json_dict() if self.old_message is not None else None,
+            "new_message": self.new_message._to_json_dict() if self.new_message is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatEventMessageDeleted(ChatEventAction):
+    """
+    A message was deleted
+
+    :param message: Deleted message
+    :param can_report_anti_spam_false_positive: True, if the message deletion can be reported via reportSupergroupAntiSpamFalsePositive
+    """
+
+    _type: "str" = field(default="chatEventMessageDeleted", init=False, repr=False)
+    message: "Message | None" = None
+    can_report_anti_spam_false_positive: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "message": self.message._to_json_dict() if self.message is not None else None,
+            "can_report_anti_spam_false_positive": self.can_report_anti_spam_false_positive,
+        }
+
+@dataclass(slots=True)
+class ChatEventMessagePinned(ChatEventAction):
+    """
+    A message was pinned
+
+    :param message: Pinned message
+    """
+
+    _type: "str" = field(default="chatEventMessagePinned", init=False, repr=False)
+    message: "Message | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "message": self.message._to_json_dict() if self.message is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatEventMessageUnpinned(ChatEventAction):
+    """
+    A message was unpinned
+
+    :param message: Unpinned message
+    """
+
+    _type: "str" = field(default="chatEventMessageUnpinned", init=False, repr=False)
+    message: "Message | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "message": self.message._to_json_dict() if self.message is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatEventPollStopped(ChatEventAction):
+    """
+    A poll in a message was stopped
+
+    :param message: The message with the poll
+    """
+
+    _type: "str" = field(default="chatEventPollStopped", init=False, repr=False)
+    message: "Message | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "message": self.message._to_json_dict() if self.message is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatEventMemberJoined(ChatEventAction):
+    """
+    A new member joined the chat
+
+    """
+
+    _type: "str" = field(default="chatEventMemberJoined", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatEventMemberJoinedByInviteLink(ChatEventAction):
+    """
+    A new member joined the chat via an invite link
+
+    :param invite_link: Invite link used to join the chat
+    :param via_chat_folder_invite_link: True, if the user has joined the chat using an invite link for a chat folder
+    """
+
+    _type: "str" = field(default="chatEventMemberJoinedByInviteLink", init=False, repr=False)
+    invite_link: "ChatInviteLink | None" = None
+    via_chat_folder_invite_link: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "invite_link": self.invite_link._to_json_dict() if self.invite_link is not None else None,
+            "via_chat_folder_invite_link": self.via_chat_folder_invite_link,
+        }
+
+@dataclass(slots=True)
+class ChatEventMemberJoinedByRequest(ChatEventAction):
+    """
+    A new member was accepted to the chat by an administrator
+
+    :param approver_user_id: User identifier of the chat administrator, approved user join request
+    :param invite_link: Invite link used to join the chat; may be null
+    """
+
+    _type: "str" = field(default="chatEventMemberJoinedByRequest", init=False, repr=False)
+    approver_user_id: "int" = 0
+    invite_link: "ChatInviteLink | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "approver_user_id": self.approver_user_id,
+            "invite_link": self.invite_link._to_json_dict() if self.invite_link is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatEventMemberInvited(ChatEventAction):
+    """
+    A new chat member was invited
+
+    :param user_id: New member user identifier
+    :param status: New member status
+    """
+
+    _type: "str" = field(default="chatEventMemberInvited", init=False, repr=False)
+    user_id: "int" = 0
+    status: "ChatMemberStatus | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "status": self.status._to_json_dict() if self.status is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatEventMemberLeft(ChatEventAction):
+    """
+    A member left the chat
+
+    """
+
+    _type: "str" = field(default="chatEventMemberLeft", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatEventMemberPromoted(ChatEventAction):
+    """
+    A chat member has gained/lost administrator status, or the list of their administrator privileges has changed
+
+    :param user_id: Affected chat member user identifier
+    :param old_status: Previous status of the chat member
+    :param new_status: New status of the chat member
+    """
+
+    _type: "str" = field(default="chatEventMemberPromoted", init=False, repr=False)
+    user_id: "int" = 0
+    old_status: "ChatMemberStatus | None" = None
+    new_status: "ChatMemberStatus | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "old_status": self.old_status._to_json_dict() if self.old_status is not None else None,
+            "new_status": self.new_status._to_json_dict() if self.new_status is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatEventMemberRestricted(ChatEventAction):
+    """
+    A chat member was restricted/unrestricted or banned/unbanned, or the list of their restrictions has changed
+
+    :param member_id: Affected chat member identifier
+    :param old_status: Previous status of the chat member
+    :param new_status: New status of the chat member
+    """
+
+    _type: "str" = field(default="chatEventMemberRestricted", init=False, repr=False)
+    member_id: "MessageSender | None" = None
+    old_status: "ChatMemberStatus | None" = None
+    new_status: "ChatMemberStatus | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "member_id": self.member_id._to_json_dict() if self.member_id is not None else None,
+            "old_status": self.old_status._to_json_dict() if self.old_status is not None else None,
+            "new_status": self.new_status._to_json_dict() if self.new_status is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatEventMemberSubscriptionExtended(ChatEventAction):
+    """
+    A chat member extended their subscription to the chat
+
+    :param user_id: Affected chat member user identifier
+    :param old_status: Previous status of the chat member
+    :param new_status: New status of the chat member
+    """
+
+    _type: "str" = field(default="chatEventMemberSubscriptionExtended", init=False, repr=False)
+    user_id: "int" = 0
+    old_status: "ChatMemberStatus | None" = None
+    new_status: "ChatMemberStatus | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "old_status": self.old_status._to_json_dict() if self.old_status is not None else None,
+            "new_status": self.new_status._to_json_dict() if self.new_status is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatEventAvailableReactionsChanged(ChatEventAction):
+    """
+    The chat available reactions were changed
+
+    :param old_available_reactions: Previous chat available reactions
+    :param new_available_reactions: New chat available reactions
+    """
+
+    _type: "str" = field(default="chatEventAvailableReactionsChanged", init=False, repr=False)
+    old_available_reactions: "ChatAvailableReactions | None" = None
+    new_available_reactions: "ChatAvailableReactions | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "old_available_reactions": self.old_available_reactions._to_json_dict() if self.old_available_reactions is not None else None,
+            "new_available_reactions": self.new_available_reactions._to_json_dict() if self.new_available_reactions is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatEventBackgroundChanged(ChatEventAction):
+    """
+    The chat background was changed
+
+    :param old_background: Previous background; may be null if none
+    :param new_background: New background; may be null if none
+    """
+
+    _type: "str" = field(default="chatEventBackgroundChanged", init=False, repr=False)
+    old_background: "ChatBackground | None" = None
+    new_background: "ChatBackground | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "old_background": self.old_background._to_json_dict() if self.old_background is not None else None,
+            "new_background": self.new_background._to_json_dict() if self.new_background is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatEventDescriptionChanged(ChatEventAction):
+    """
+    The chat description was changed
+
+    :param old_description: Previous chat description
+    :param new_description: New chat description
+    """
+
+    _type: "str" = field(default="chatEventDescriptionChanged", init=False, repr=False)
+    old_description: "str" = ""
+    new_description: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "old_description": self.old_description,
+            "new_description": self.new_description,
+        }
+
+@dataclass(slots=True)
+class ChatEventEmojiStatusChanged(ChatEventAction):
+    """
+    The chat emoji status was changed
+
+    :param old_emoji_status: Previous emoji status; may be null if none
+    :param new_emoji_status: New emoji status; may be null if none
+    """
+
+    _type: "str" = field(default="chatEventEmojiStatusChanged", init=False, repr=False)
+    old_emoji_status: "EmojiStatus | None" = None
+    new_emoji_status: "EmojiStatus | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "old_emoji_status": self.old_emoji_status._to_json_dict() if self.old_emoji_status is not None else None,
+            "new_emoji_status": self.new_emoji_status._to_json_dict() if self.new_emoji_status is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatEventLinkedChatChanged(ChatEventAction):
+    """
+    The linked chat of a supergroup was changed
+
+    :param old_linked_chat_id: Previous supergroup linked chat identifier
+    :param new_linked_chat_id: New supergroup linked chat identifier
+    """
+
+    _type: "str" = field(default="chatEventLinkedChatChanged", init=False, repr=False)
+    old_linked_chat_id: "int" = 0
+    new_linked_chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "old_linked_chat_id": self.old_linked_chat_id,
+            "new_linked_chat_id": self.new_linked_chat_id,
+        }
+
+@dataclass(slots=True)
+class ChatEventLocationChanged(ChatEventAction):
+    """
+    The supergroup location was changed
+
+    :param old_location: Previous location; may be null
+    :param new_location: New location; may be null
+    """
+
+    _type: "str" = field(default="chatEventLocationChanged", init=False, repr=False)
+    old_location: "ChatLocation | None" = None
+    new_location: "ChatLocation | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "old_location": self.old_location._to_json_dict() if self.old_location is not None else None,
+            "new_location": self.new_location._to_json_dict() if self.new_location is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatEventMessageAutoDeleteTimeChanged(ChatEventAction):
+    """
+    The message auto-delete timer was changed
+
+    :param old_message_auto_delete_time: Previous value of message_auto_delete_time
+    :param new_message_auto_delete_time: New value of message_auto_delete_time
+    """
+
+    _type: "str" = field(default="chatEventMessageAutoDeleteTimeChanged", init=False, repr=False)
+    old_message_auto_delete_time: "int" = 0
+    new_message_auto_delete_time: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "old_message_auto_delete_time": self.old_message_auto_delete_time,
+            "new_message_auto_delete_time": self.new_message_auto_delete_time,
+        }
+
+@dataclass(slots=True)
+class ChatEventPermissionsChanged(ChatEventAction):
+    """
+    The chat permissions were changed
+
+    :param old_permissions: Previous chat permissions
+    :param new_permissions: New chat permissions
+    """
+
+    _type: "str" = field(default="chatEventPermissionsChanged", init=False, repr=False)
+    old_permissions: "ChatPermissions | None" = None
+    new_permissions: "ChatPermissions | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "old_permissions": self.old_permissions._to_json_dict() if self.old_permissions is not None else None,
+            "new_permissions": self.new_permissions._to_json_dict() if self.new_permissions is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatEventPhotoChanged(ChatEventAction):
+    """
+    The chat photo was changed
+
+    :param old_photo: Previous chat photo value; may be null
+    :param new_photo: New chat photo value; may be null
+    """
+
+    _type: "str" = field(default="chatEventPhotoChanged", init=False, repr=False)
+    old_photo: "ChatPhoto | None" = None
+    new_photo: "ChatPhoto | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "old_photo": self.old_photo._to_json_dict() if self.old_photo is not None else None,
+            "new_photo": self.new_photo._to_json_dict() if self.new_photo is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatEventSlowModeDelayChanged(ChatEventAction):
+    """
+    The slow_mode_delay setting of a supergroup was changed
+
+    :param old_slow_mode_delay: Previous value of slow_mode_delay, in seconds
+    :param new_slow_mode_delay: New value of slow_mode_delay, in seconds
+    """
+
+    _type: "str" = field(default="chatEventSlowModeDelayChanged", init=False, repr=False)
+    old_slow_mode_delay: "int" = 0
+    new_slow_mode_delay: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "old_slow_mode_delay": self.old_slow_mode_delay,
+            "new_slow_mode_delay": self.new_slow_mode_delay,
+        }
+
+@dataclass(slots=True)
+class ChatEventStickerSetChanged(ChatEventAction):
+    """
+    The supergroup sticker set was changed
+
+    :param old_sticker_set_id: Previous identifier of the chat sticker set; 0 if none
+    :param new_sticker_set_id: New identifier of the chat sticker set; 0 if none
+    """
+
+    _type: "str" = field(default="chatEventStickerSetChanged", init=False, repr=False)
+    old_sticker_set_id: "int" = 0
+    new_sticker_set_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "old_sticker_set_id": self.old_sticker_set_id,
+            "new_sticker_set_id": self.new_sticker_set_id,
+        }
+
+@dataclass(slots=True)
+class ChatEventCustomEmojiStickerSetChanged(ChatEventAction):
+    """
+    The supergroup sticker set with allowed custom emoji was changed
+
+    :param old_sticker_set_id: Previous identifier of the chat sticker set; 0 if none
+    :param new_sticker_set_id: New identifier of the chat sticker set; 0 if none
+    """
+
+    _type: "str" = field(default="chatEventCustomEmojiStickerSetChanged", init=False, repr=False)
+    old_sticker_set_id: "int" = 0
+    new_sticker_set_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "old_sticker_set_id": self.old_sticker_set_id,
+            "new_sticker_set_id": self.new_sticker_set_id,
+        }
+
+@dataclass(slots=True)
+class ChatEventTitleChanged(ChatEventAction):
+    """
+    The chat title was changed
+
+    :param old_title: Previous chat title
+    :param new_title: New chat title
+    """
+
+    _type: "str" = field(default="chatEventTitleChanged", init=False, repr=False)
+    old_title: "str" = ""
+    new_title: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "old_title": self.old_title,
+            "new_title": self.new_title,
+        }
+
+@dataclass(slots=True)
+class ChatEventUsernameChanged(ChatEventAction):
+    """
+    The chat editable username was changed
+
+    :param old_username: Previous chat username
+    :param new_username: New chat username
+    """
+
+    _type: "str" = field(default="chatEventUsernameChanged", init=False, repr=False)
+    old_username: "str" = ""
+    new_username: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "old_username": self.old_username,
+            "new_username": self.new_username,
+        }
+
+@dataclass(slots=True)
+class ChatEventActiveUsernamesChanged(ChatEventAction):
+    """
+    The chat active usernames were changed
+
+    :param old_usernames: Previous list of active usernames
+    :param new_usernames: New list of active usernames
+    """
+
+    _type: "str" = field(default="chatEventActiveUsernamesChanged", init=False, repr=False)
+    old_usernames: "list[str] | None" = None
+    new_usernames: "list[str] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "old_usernames": self.old_usernames,
+            "new_usernames": self.new_usernames,
+        }
+
+@dataclass(slots=True)
+class ChatEventAccentColorChanged(ChatEventAction):
+    """
+    The chat accent color or background custom emoji were changed
+
+    :param old_accent_color_id: Previous identifier of chat accent color
+    :param old_background_custom_emoji_id: Previous identifier of the custom emoji; 0 if none
+    :param new_accent_color_id: New identifier of chat accent color
+    :param new_background_custom_emoji_id: New identifier of the custom emoji; 0 if none
+    """
+
+    _type: "str" = field(default="chatEventAccentColorChanged", init=False, repr=False)
+    old_accent_color_id: "int" = 0
+    old_background_custom_emoji_id: "int" = 0
+    new_accent_color_id: "int" = 0
+    new_background_custom_emoji_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "old_accent_color_id": self.old_accent_color_id,
+            "old_background_custom_emoji_id": self.old_background_custom_emoji_id,
+            "new_accent_color_id": self.new_accent_color_id,
+            "new_background_custom_emoji_id": self.new_background_custom_emoji_id,
+        }
+
+@dataclass(slots=True)
+class ChatEventProfileAccentColorChanged(ChatEventAction):
+    """
+    The chat's profile accent color or profile background custom emoji were changed
+
+    :param old_profile_accent_color_id: Previous identifier of chat's profile accent color; -1 if none
+    :param old_profile_background_custom_emoji_id: Previous identifier of the custom emoji; 0 if none
+    :param new_profile_accent_color_id: New identifier of chat's profile accent color; -1 if none
+    :param new_profile_background_custom_emoji_id: New identifier of the custom emoji; 0 if none
+    """
+
+    _type: "str" = field(default="chatEventProfileAccentColorChanged", init=False, repr=False)
+    old_profile_accent_color_id: "int" = 0
+    old_profile_background_custom_emoji_id: "int" = 0
+    new_profile_accent_color_id: "int" = 0
+    new_profile_background_custom_emoji_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "old_profile_accent_color_id": self.old_profile_accent_color_id,
+            "old_profile_background_custom_emoji_id": self.old_profile_background_custom_emoji_id,
+            "new_profile_accent_color_id": self.new_profile_accent_color_id,
+            "new_profile_background_custom_emoji_id": self.new_profile_background_custom_emoji_id,
+        }
+
+@dataclass(slots=True)
+class ChatEventHasProtectedContentToggled(ChatEventAction):
+    """
+    The has_protected_content setting of a channel was toggled
+
+    :param has_protected_content: New value of has_protected_content
+    """
+
+    _type: "str" = field(default="chatEventHasProtectedContentToggled", init=False, repr=False)
+    has_protected_content: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "has_protected_content": self.has_protected_content,
+        }
+
+@dataclass(slots=True)
+class ChatEventInvitesToggled(ChatEventAction):
+    """
+    The can_invite_users permission of a supergroup chat was toggled
+
+    :param can_invite_users: New value of can_invite_users permission
+    """
+
+    _type: "str" = field(default="chatEventInvitesToggled", init=False, repr=False)
+    can_invite_users: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "can_invite_users": self.can_invite_users,
+        }
+
+@dataclass(slots=True)
+class ChatEventIsAllHistoryAvailableToggled(ChatEventAction):
+    """
+    The is_all_history_available setting of a supergroup was toggled
+
+    :param is_all_history_available: New value of is_all_history_available
+    """
+
+    _type: "str" = field(default="chatEventIsAllHistoryAvailableToggled", init=False, repr=False)
+    is_all_history_available: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_all_history_available": self.is_all_history_available,
+        }
+
+@dataclass(slots=True)
+class ChatEventHasAggressiveAntiSpamEnabledToggled(ChatEventAction):
+    """
+    The has_aggressive_anti_spam_enabled setting of a supergroup was toggled
+
+    :param has_aggressive_anti_spam_enabled: New value of has_aggressive_anti_spam_enabled
+    """
+
+    _type: "str" = field(default="chatEventHasAggressiveAntiSpamEnabledToggled", init=False, repr=False)
+    has_aggressive_anti_spam_enabled: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "has_aggressive_anti_spam_enabled": self.has_aggressive_anti_spam_enabled,
+        }
+
+@dataclass(slots=True)
+class ChatEventSignMessagesToggled(ChatEventAction):
+    """
+    The sign_messages setting of a channel was toggled
+
+    :param sign_messages: New value of sign_messages
+    """
+
+    _type: "str" = field(default="chatEventSignMessagesToggled", init=False, repr=False)
+    sign_messages: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sign_messages": self.sign_messages,
+        }
+
+@dataclass(slots=True)
+class ChatEventShowMessageSenderToggled(ChatEventAction):
+    """
+    The show_message_sender setting of a channel was toggled
+
+    :param show_message_sender: New value of show_message_sender
+    """
+
+    _type: "str" = field(default="chatEventShowMessageSenderToggled", init=False, repr=False)
+    show_message_sender: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "show_message_sender": self.show_message_sender,
+        }
+
+@dataclass(slots=True)
+class ChatEventAutomaticTranslationToggled(ChatEventAction):
+    """
+    The has_automatic_translation setting of a channel was toggled
+
+    :param has_automatic_translation: New value of has_automatic_translation
+    """
+
+    _type: "str" = field(default="chatEventAutomaticTranslationToggled", init=False, repr=False)
+    has_automatic_translation: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "has_automatic_translation": self.has_automatic_translation,
+        }
+
+@dataclass(slots=True)
+class ChatEventInviteLinkEdited(ChatEventAction):
+    """
+    A chat invite link was edited
+
+    :param old_invite_link: Previous information about the invite link
+    :param new_invite_link: New information about the invite link
+    """
+
+    _type: "str" = field(default="chatEventInviteLinkEdited", init=False, repr=False)
+    old_invite_link: "ChatInviteLink | None" = None
+    new_invite_link: "ChatInviteLink | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "old_invite_link": self.old_invite_link._to_json_dict() if self.old_invite_link is not None else None,
+            "new_invite_link": self.new_invite_link._to_json_dict() if self.new_invite_link is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatEventInviteLinkRevoked(ChatEventAction):
+    """
+    A chat invite link was revoked
+
+    :param invite_link: The invite link
+    """
+
+    _type: "str" = field(default="chatEventInviteLinkRevoked", init=False, repr=False)
+    invite_link: "ChatInviteLink | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "invite_link": self.invite_link._to_json_dict() if self.invite_link is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatEventInviteLinkDeleted(ChatEventAction):
+    """
+    A revoked chat invite link was deleted
+
+    :param invite_link: The invite link
+    """
+
+    _type: "str" = field(default="chatEventInviteLinkDeleted", init=False, repr=False)
+    invite_link: "ChatInviteLink | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "invite_link": self.invite_link._to_json_dict() if self.invite_link is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatEventVideoChatCreated(ChatEventAction):
+    """
+    A video chat was created
+
+    :param group_call_id: Identifier of the video chat. The video chat can be received through the method getGroupCall
+    """
+
+    _type: "str" = field(default="chatEventVideoChatCreated", init=False, repr=False)
+    group_call_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+        }
+
+@dataclass(slots=True)
+class ChatEventVideoChatEnded(ChatEventAction):
+    """
+    A video chat was ended
+
+    :param group_call_id: Identifier of the video chat. The video chat can be received through the method getGroupCall
+    """
+
+    _type: "str" = field(default="chatEventVideoChatEnded", init=False, repr=False)
+    group_call_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+        }
+
+@dataclass(slots=True)
+class ChatEventVideoChatMuteNewParticipantsToggled(ChatEventAction):
+    """
+    The mute_new_participants setting of a video chat was toggled
+
+    :param mute_new_participants: New value of the mute_new_participants setting
+    """
+
+    _type: "str" = field(default="chatEventVideoChatMuteNewParticipantsToggled", init=False, repr=False)
+    mute_new_participants: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "mute_new_participants": self.mute_new_participants,
+        }
+
+@dataclass(slots=True)
+class ChatEventVideoChatParticipantIsMutedToggled(ChatEventAction):
+    """
+    A video chat participant was muted or unmuted
+
+    :param participant_id: Identifier of the affected group call participant
+    :param is_muted: New value of is_muted
+    """
+
+    _type: "str" = field(default="chatEventVideoChatParticipantIsMutedToggled", init=False, repr=False)
+    participant_id: "MessageSender | None" = None
+    is_muted: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "participant_id": self.participant_id._to_json_dict() if self.participant_id is not None else None,
+            "is_muted": self.is_muted,
+        }
+
+@dataclass(slots=True)
+class ChatEventVideoChatParticipantVolumeLevelChanged(ChatEventAction):
+    """
+    A video chat participant volume level was changed
+
+    :param participant_id: Identifier of the affected group call participant
+    :param volume_level: New value of volume_level; 1-20000 in hundreds of percents
+    """
+
+    _type: "str" = field(default="chatEventVideoChatParticipantVolumeLevelChanged", init=False, repr=False)
+    participant_id: "MessageSender | None" = None
+    volume_level: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "participant_id": self.participant_id._to_json_dict() if self.participant_id is not None else None,
+            "volume_level": self.volume_level,
+        }
+
+@dataclass(slots=True)
+class ChatEventIsForumToggled(ChatEventAction):
+    """
+    The is_forum setting of a channel was toggled
+
+    :param is_forum: New value of is_forum
+    """
+
+    _type: "str" = field(default="chatEventIsForumToggled", init=False, repr=False)
+    is_forum: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_forum": self.is_forum,
+        }
+
+@dataclass(slots=True)
+class ChatEventForumTopicCreated(ChatEventAction):
+    """
+    A new forum topic was created
+
+    :param topic_info: Information about the topic
+    """
+
+    _type: "str" = field(default="chatEventForumTopicCreated", init=False, repr=False)
+    topic_info: "ForumTopicInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "topic_info": self.topic_info._to_json_dict() if self.topic_info is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatEventForumTopicEdited(ChatEventAction):
+    """
+    A forum topic was edited
+
+    :param old_topic_info: Old information about the topic
+    :param new_topic_info: New information about the topic
+    """
+
+    _type: "str" = field(default="chatEventForumTopicEdited", init=False, repr=False)
+    old_topic_info: "ForumTopicInfo | None" = None
+    new_topic_info: "ForumTopicInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "old_topic_info": self.old_topic_info._to_json_dict() if self.old_topic_info is not None else None,
+            "new_topic_info": self.new_topic_info._to_json_dict() if self.new_topic_info is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatEventForumTopicToggleIsClosed(ChatEventAction):
+    """
+    A forum topic was closed or reopened
+
+    :param topic_info: New information about the topic
+    """
+
+    _type: "str" = field(default="chatEventForumTopicToggleIsClosed", init=False, repr=False)
+    topic_info: "ForumTopicInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "topic_info": self.topic_info._to_json_dict() if self.topic_info is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatEventForumTopicToggleIsHidden(ChatEventAction):
+    """
+    The General forum topic was hidden or unhidden
+
+    :param topic_info: New information about the topic
+    """
+
+    _type: "str" = field(default="chatEventForumTopicToggleIsHidden", init=False, repr=False)
+    topic_info: "ForumTopicInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "topic_info": self.topic_info._to_json_dict() if self.topic_info is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatEventForumTopicDeleted(ChatEventAction):
+    """
+    A forum topic was deleted
+
+    :param topic_info: Information about the topic
+    """
+
+    _type: "str" = field(default="chatEventForumTopicDeleted", init=False, repr=False)
+    topic_info: "ForumTopicInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "topic_info": self.topic_info._to_json_dict() if self.topic_info is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatEventForumTopicPinned(ChatEventAction):
+    """
+    A pinned forum topic was changed
+
+    :param old_topic_info: Information about the old pinned topic; may be null
+    :param new_topic_info: Information about the new pinned topic; may be null
+    """
+
+    _type: "str" = field(default="chatEventForumTopicPinned", init=False, repr=False)
+    old_topic_info: "ForumTopicInfo | None" = None
+    new_topic_info: "ForumTopicInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "old_topic_info": self.old_topic_info._to_json_dict() if self.old_topic_info is not None else None,
+            "new_topic_info": self.new_topic_info._to_json_dict() if self.new_topic_info is not None else None,
+        }
+
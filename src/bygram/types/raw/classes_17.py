@@ -0,0 +1,1103 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_05 import MessageSender
+    from .classes_16 import ChatEventAction
+
+@dataclass(slots=True)
+class ChatEvent(ObjectBase):
+    """
+    Represents a chat event
+
+    :param id: Chat event identifier
+    :param date: Point in time (Unix timestamp) when the event happened
+    :param member_id: Identifier of the user or chat who performed the action
+    :param action: The action
+    """
+
+    _type: "str" = field(default="chatEvent", init=False, repr=False)
+    id: "int" = 0
+    date: "int" = 0
+    member_id: "MessageSender | None" = None
+    action: "ChatEventAction | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "date": self.date,
+            "member_id": self.member_id._to_json_dict() if self.member_id is not None else None,
+            "action": self.action._to_json_dict() if self.action is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatEvents(ObjectBase):
+    """
+    Contains a list of chat events
+
+    :param events: List of events
+    """
+
+    _type: "str" = field(default="chatEvents", init=False, repr=False)
+    events: "list[ChatEvent] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "events": _list_to_json(self.events),
+        }
+
+@dataclass(slots=True)
+class ChatEventLogFilters(ObjectBase):
+    """
+    Represents a set of filters used to obtain a chat event log
+
+    :param message_edits: True, if message edits need to be returned
+    :param message_deletions: True, if message deletions need to be returned
+    :param message_pins: True, if pin/unpin events need to be returned
+    :param member_joins: True, if members joining events need to be returned
+    :param member_leaves: True, if members leaving events need to be returned
+    :param member_invites: True, if invited member events need to be returned
+    :param member_promotions: True, if member promotion/demotion events need to be returned
+    :param member_restrictions: True, if member restricted/unrestricted/banned/unbanned events need to be returned
+    :param info_changes: True, if changes in chat information need to be returned
+    :param setting_changes: True, if changes in chat settings need to be returned
+    :param invite_link_changes: True, if changes to invite links need to be returned
+    :param video_chat_changes: True, if video chat actions need to be returned
+    :param forum_changes: True, if forum-related actions need to be returned
+    :param subscription_extensions: True, if subscription extensions need to be returned
+    """
+
+    _type: "str" = field(default="chatEventLogFilters", init=False, repr=False)
+    message_edits: "bool" = False
+    message_deletions: "bool" = False
+    message_pins: "bool" = False
+    member_joins: "bool" = False
+    member_leaves: "bool" = False
+    member_invites: "bool" = False
+    member_promotions: "bool" = False
+    member_restrictions: "bool" = False
+    info_changes: "bool" = False
+    setting_changes: "bool" = False
+    invite_link_changes: "bool" = False
+    video_chat_changes: "bool" = False
+    forum_changes: "bool" = False
+    subscription_extensions: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "message_edits": self.message_edits,
+            "message_deletions": self.message_deletions,
+            "message_pins": self.message_pins,
+            "member_joins": self.member_joins,
+            "member_leaves": self.member_leaves,
+            "member_invites": self.member_invites,
+            "member_promotions": self.member_promotions,
+            "member_restrictions": self.member_restrictions,
+            "info_changes": self.info_changes,
+            "setting_changes": self.setting_changes,
+            "invite_link_changes": self.invite_link_changes,
+            "video_chat_changes": self.video_chat_changes,
+            "forum_changes": self.forum_changes,
+            "subscription_extensions": self.subscription_extensions,
+        }
+
+@dataclass(slots=True)
+class LanguagePackStringValue(ObjectBase):
+    """
+    Represents the value of a string in a language pack
+
+    """
+
+    _type: "str" = field(default="LanguagePackStringValue", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class LanguagePackStringValueOrdinary(LanguagePackStringValue):
+    """
+    An ordinary language pack string
+
+    :param value: String value
+    """
+
+    _type: "str" = field(default="languagePackStringValueOrdinary", init=False, repr=False)
+    value: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "value": self.value,
+        }
+
+@dataclass(slots=True)
+class LanguagePackStringValuePluralized(LanguagePackStringValue):
+    """
+    A language pack string which has different forms based on the number of some object it mentions. See https://www.unicode.org/cldr/charts/latest/supplemental/language_plural_rules.html for more information
+
+    :param zero_value: Value for zero objects
+    :param one_value: Value for one object
+    :param two_value: Value for two objects
+    :param few_value: Value for few objects
+    :param many_value: Value for many objects
+    :param other_value: Default value
+    """
+
+    _type: "str" = field(default="languagePackStringValuePluralized", init=False, repr=False)
+    zero_value: "str" = ""
+    one_value: "str" = ""
+    two_value: "str" = ""
+    few_value: "str" = ""
+    many_value: "str" = ""
+    other_value: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "zero_value": self.zero_value,
+            "one_value": self.one_value,
+            "two_value": self.two_value,
+            "few_value": self.few_value,
+            "many_value": self.many_value,
+            "other_value": self.other_value,
+        }
+
+@dataclass(slots=True)
+class LanguagePackStringValueDeleted(LanguagePackStringValue):
+    """
+    A deleted language pack string, the value must be taken from the built-in English language pack
+
+    """
+
+    _type: "str" = field(default="languagePackStringValueDeleted", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class LanguagePackString(ObjectBase):
+    """
+    Represents one language pack string
+
+    :param key: String key
+    :param value: String value; pass null if the string needs to be taken from the built-in English language pack
+    """
+
+    _type: "str" = field(default="languagePackString", init=False, repr=False)
+    key: "str" = ""
+    value: "LanguagePackStringValue | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "key": self.key,
+            "value": self.value._to_json_dict() if self.value is not None else None,
+        }
+
+@dataclass(slots=True)
+class LanguagePackStrings(ObjectBase):
+    """
+    Contains a list of language pack strings
+
+    :param strings: A list of language pack strings
+    """
+
+    _type: "str" = field(default="languagePackStrings", init=False, repr=False)
+    strings: "list[LanguagePackString] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "strings": _list_to_json(self.strings),
+        }
+
+@dataclass(slots=True)
+class LanguagePackInfo(ObjectBase):
+    """
+    Contains information about a language pack
+
+    :param id: Unique language pack identifier
+    :param base_language_pack_id: Identifier of a base language pack; may be empty. If a string is missed in the language pack, then it must be fetched from base language pack. Unsupported in custom language packs
+    :param name: Language name
+    :param native_name: Name of the language in that language
+    :param plural_code: A language code to be used to apply plural forms. See https://www.unicode.org/cldr/charts/latest/supplemental/language_plural_rules.html for more information
+    :param is_official: True, if the language pack is official
+    :param is_rtl: True, if the language pack strings are RTL
+    :param is_beta: True, if the language pack is a beta language pack
+    :param is_installed: True, if the language pack is installed by the current user
+    :param total_string_count: Total number of non-deleted strings from the language pack
+    :param translated_string_count: Total number of translated strings from the language pack
+    :param local_string_count: Total number of non-deleted strings from the language pack available locally
+    :param translation_url: Link to language translation interface; empty for custom local language packs
+    """
+
+    _type: "str" = field(default="languagePackInfo", init=False, repr=False)
+    id: "str" = ""
+    base_language_pack_id: "str" = ""
+    name: "str" = ""
+    native_name: "str" = ""
+    plural_code: "str" = ""
+    is_official: "bool" = False
+    is_rtl: "bool" = False
+    is_beta: "bool" = False
+    is_installed: "bool" = False
+    total_string_count: "int" = 0
+    translated_string_count: "int" = 0
+    local_string_count: "int" = 0
+    translation_url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "base_language_pack_id": self.base_language_pack_id,
+            "name": self.name,
+            "native_name": self.native_name,
+            "plural_code": self.plural_code,
+            "is_official": self.is_official,
+            "is_rtl": self.is_rtl,
+            "is_beta": self.is_beta,
+            "is_installed": self.is_installed,
+            "total_string_count": self.total_string_count,
+            "translated_string_count": self.translated_string_count,
+            "local_string_count": self.local_string_count,
+            "translation_url": self.translation_url,
+        }
+
+@dataclass(slots=True)
+class LocalizationTargetInfo(ObjectBase):
+    """
+    Contains information about the current localization target
+
+    :param language_packs: List of available language packs for this application
+    """
+
+    _type: "str" = field(default="localizationTargetInfo", init=False, repr=False)
+    language_packs: "list[LanguagePackInfo] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "language_packs": _list_to_json(self.language_packs),
+        }
+
+@dataclass(slots=True)
+class PremiumLimitType(ObjectBase):
+    """
+    Describes type of limit, increased for Premium users
+
+    """
+
+    _type: "str" = field(default="PremiumLimitType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumLimitTypeSupergroupCount(PremiumLimitType):
+    """
+    The maximum number of joined supergroups and channels
+
+    """
+
+    _type: "str" = field(default="premiumLimitTypeSupergroupCount", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumLimitTypePinnedChatCount(PremiumLimitType):
+    """
+    The maximum number of pinned chats in the main chat list
+
+    """
+
+    _type: "str" = field(default="premiumLimitTypePinnedChatCount", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumLimitTypeCreatedPublicChatCount(PremiumLimitType):
+    """
+    The maximum number of created public chats
+
+    """
+
+    _type: "str" = field(default="premiumLimitTypeCreatedPublicChatCount", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumLimitTypeSavedAnimationCount(PremiumLimitType):
+    """
+    The maximum number of saved animations
+
+    """
+
+    _type: "str" = field(default="premiumLimitTypeSavedAnimationCount", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumLimitTypeFavoriteStickerCount(PremiumLimitType):
+    """
+    The maximum number of favorite stickers
+
+    """
+
+    _type: "str" = field(default="premiumLimitTypeFavoriteStickerCount", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumLimitTypeChatFolderCount(PremiumLimitType):
+    """
+    The maximum number of chat folders
+
+    """
+
+    _type: "str" = field(default="premiumLimitTypeChatFolderCount", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumLimitTypeChatFolderChosenChatCount(PremiumLimitType):
+    """
+    The maximum number of pinned and always included, or always excluded chats in a chat folder
+
+    """
+
+    _type: "str" = field(default="premiumLimitTypeChatFolderChosenChatCount", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumLimitTypePinnedArchivedChatCount(PremiumLimitType):
+    """
+    The maximum number of pinned chats in the archive chat list
+
+    """
+
+    _type: "str" = field(default="premiumLimitTypePinnedArchivedChatCount", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumLimitTypePinnedSavedMessagesTopicCount(PremiumLimitType):
+    """
+    The maximum number of pinned Saved Messages topics
+
+    """
+
+    _type: "str" = field(default="premiumLimitTypePinnedSavedMessagesTopicCount", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumLimitTypeCaptionLength(PremiumLimitType):
+    """
+    The maximum length of sent media caption
+
+    """
+
+    _type: "str" = field(default="premiumLimitTypeCaptionLength", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumLimitTypeBioLength(PremiumLimitType):
+    """
+    The maximum length of the user's bio
+
+    """
+
+    _type: "str" = field(default="premiumLimitTypeBioLength", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumLimitTypeChatFolderInviteLinkCount(PremiumLimitType):
+    """
+    The maximum number of invite links for a chat folder
+
+    """
+
+    _type: "str" = field(default="premiumLimitTypeChatFolderInviteLinkCount", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumLimitTypeShareableChatFolderCount(PremiumLimitType):
+    """
+    The maximum number of added shareable chat folders
+
+    """
+
+    _type: "str" = field(default="premiumLimitTypeShareableChatFolderCount", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumLimitTypeActiveStoryCount(PremiumLimitType):
+    """
+    The maximum number of active stories
+
+    """
+
+    _type: "str" = field(default="premiumLimitTypeActiveStoryCount", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumLimitTypeWeeklyPostedStoryCount(PremiumLimitType):
+    """
+    The maximum number of stories posted per week
+
+    """
+
+    _type: "str" = field(default="premiumLimitTypeWeeklyPostedStoryCount", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumLimitTypeMonthlyPostedStoryCount(PremiumLimitType):
+    """
+    The maximum number of stories posted per month
+
+    """
+
+    _type: "str" = field(default="premiumLimitTypeMonthlyPostedStoryCount", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumLimitTypeStoryCaptionLength(PremiumLimitType):
+    """
+    The maximum length of captions of posted stories
+
+    """
+
+    _type: "str" = field(default="premiumLimitTypeStoryCaptionLength", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumLimitTypeStorySuggestedReactionAreaCount(PremiumLimitType):
+    """
+    The maximum number of suggested reaction areas on a story
+
+    """
+
+    _type: "str" = field(default="premiumLimitTypeStorySuggestedReactionAreaCount", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumLimitTypeSimilarChatCount(PremiumLimitType):
+    """
+    The maximum number of received similar chats
+
+    """
+
+    _type: "str" = field(default="premiumLimitTypeSimilarChatCount", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumFeature(ObjectBase):
+    """
+    Describes a feature available to Premium users
+
+    """
+
+    _type: "str" = field(default="PremiumFeature", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumFeatureIncreasedLimits(PremiumFeature):
+    """
+    Increased limits
+
+    """
+
+    _type: "str" = field(default="premiumFeatureIncreasedLimits", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumFeatureIncreasedUploadFileSize(PremiumFeature):
+    """
+    Increased maximum upload file size
+
+    """
+
+    _type: "str" = field(default="premiumFeatureIncreasedUploadFileSize", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumFeatureImprovedDownloadSpeed(PremiumFeature):
+    """
+    Improved download speed
+
+    """
+
+    _type: "str" = field(default="premiumFeatureImprovedDownloadSpeed", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumFeatureVoiceRecognition(PremiumFeature):
+    """
+    The ability to convert voice notes to text
+
+    """
+
+    _type: "str" = field(default="premiumFeatureVoiceRecognition", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumFeatureDisabledAds(PremiumFeature):
+    """
+    Disabled ads
+
+    """
+
+    _type: "str" = field(default="premiumFeatureDisabledAds", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumFeatureUniqueReactions(PremiumFeature):
+    """
+    Allowed to use more reactions
+
+    """
+
+    _type: "str" = field(default="premiumFeatureUniqueReactions", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumFeatureUniqueStickers(PremiumFeature):
+    """
+    Allowed to use premium stickers with unique effects
+
+    """
+
+    _type: "str" = field(default="premiumFeatureUniqueStickers", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumFeatureCustomEmoji(PremiumFeature):
+    """
+    Allowed to use custom emoji stickers in message texts and captions
+
+    """
+
+    _type: "str" = field(default="premiumFeatureCustomEmoji", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumFeatureAdvancedChatManagement(PremiumFeature):
+    """
+    Ability to change position of the main chat list, archive and mute all new chats from non-contacts, and completely disable notifications about the user's contacts joined Telegram
+
+    """
+
+    _type: "str" = field(default="premiumFeatureAdvancedChatManagement", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumFeatureProfileBadge(PremiumFeature):
+    """
+    A badge in the user's profile
+
+    """
+
+    _type: "str" = field(default="premiumFeatureProfileBadge", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumFeatureEmojiStatus(PremiumFeature):
+    """
+    The ability to show an emoji status along with the user's name
+
+    """
+
+    _type: "str" = field(default="premiumFeatureEmojiStatus", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumFeatureAnimatedProfilePhoto(PremiumFeature):
+    """
+    Profile photo animation on message and chat screens
+
+    """
+
+    _type: "str" = field(default="premiumFeatureAnimatedProfilePhoto", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumFeatureForumTopicIcon(PremiumFeature):
+    """
+    The ability to set a custom emoji as a forum topic icon
+
+    """
+
+    _type: "str" = field(default="premiumFeatureForumTopicIcon", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumFeatureAppIcons(PremiumFeature):
+    """
+    Allowed to set a premium application icons
+
+    """
+
+    _type: "str" = field(default="premiumFeatureAppIcons", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumFeatureRealTimeChatTranslation(PremiumFeature):
+    """
+    Allowed to translate chat messages real-time
+
+    """
+
+    _type: "str" = field(default="premiumFeatureRealTimeChatTranslation", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumFeatureUpgradedStories(PremiumFeature):
+    """
+    Allowed to use many additional features for stories
+
+    """
+
+    _type: "str" = field(default="premiumFeatureUpgradedStories", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumFeatureChatBoost(PremiumFeature):
+    """
+    The ability to boost chats
+
+    """
+
+    _type: "str" = field(default="premiumFeatureChatBoost", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumFeatureAccentColor(PremiumFeature):
+    """
+    The ability to choose accent color for replies and user profile
+
+    """
+
+    _type: "str" = field(default="premiumFeatureAccentColor", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumFeatureBackgroundForBoth(PremiumFeature):
+    """
+    The ability to set private chat background for both users
+
+    """
+
+    _type: "str" = field(default="premiumFeatureBackgroundForBoth", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumFeatureSavedMessagesTags(PremiumFeature):
+    """
+    The ability to use tags in Saved Messages
+
+    """
+
+    _type: "str" = field(default="premiumFeatureSavedMessagesTags", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumFeatureMessagePrivacy(PremiumFeature):
+    """
+    The ability to disallow incoming voice and video note messages in private chats using setUserPrivacySettingRules with userPrivacySettingAllowPrivateVoiceAndVideoNoteMessages and to restrict incoming messages from non-contacts using setNewChatPrivacySettings
+
+    """
+
+    _type: "str" = field(default="premiumFeatureMessagePrivacy", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumFeatureLastSeenTimes(PremiumFeature):
+    """
+    The ability to view last seen and read times of other users even if they can't view last seen or read time for the current user
+
+    """
+
+    _type: "str" = field(default="premiumFeatureLastSeenTimes", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumFeatureBusiness(PremiumFeature):
+    """
+    The ability to use Business features
+
+    """
+
+    _type: "str" = field(default="premiumFeatureBusiness", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumFeatureMessageEffects(PremiumFeature):
+    """
+    The ability to use all available message effects
+
+    """
+
+    _type: "str" = field(default="premiumFeatureMessageEffects", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumFeatureChecklists(PremiumFeature):
+    """
+    The ability to create and use checklist messages
+
+    """
+
+    _type: "str" = field(default="premiumFeatureChecklists", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class BusinessFeature(ObjectBase):
+    """
+    Describes a feature available to Business user accounts
+
+    """
+
+    _type: "str" = field(default="BusinessFeature", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class BusinessFeatureLocation(BusinessFeature):
+    """
+    The ability to set location
+
+    """
+
+    _type: "str" = field(default="businessFeatureLocation", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class BusinessFeatureOpeningHours(BusinessFeature):
+    """
+    The ability to set opening hours
+
+    """
+
+    _type: "str" = field(default="businessFeatureOpeningHours", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class BusinessFeatureQuickReplies(BusinessFeature):
+    """
+    The ability to use quick replies
+
+    """
+
+    _type: "str" = field(default="businessFeatureQuickReplies", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class BusinessFeatureGreetingMessage(BusinessFeature):
+    """
+    The ability to set up a greeting message
+
+    """
+
+    _type: "str" = field(default="businessFeatureGreetingMessage", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class BusinessFeatureAwayMessage(BusinessFeature):
+    """
+    The ability to set up an away message
+
+    """
+
+    _type: "str" = field(default="businessFeatureAwayMessage", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class BusinessFeatureAccountLinks(BusinessFeature):
+    """
+    The ability to create links to the business account with predefined message text
+
+    """
+
+    _type: "str" = field(default="businessFeatureAccountLinks", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class BusinessFeatureStartPage(BusinessFeature):
+    """
+    The ability to customize start page
+
+    """
+
+    _type: "str" = field(default="businessFeatureStartPage", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class BusinessFeatureBots(BusinessFeature):
+    """
+    The ability to connect a bot to the account
+
+    """
+
+    _type: "str" = field(default="businessFeatureBots", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class BusinessFeatureEmojiStatus(BusinessFeature):
+    """
+    The ability to show an emoji status along with the business name
+
+    """
+
+    _type: "str" = field(default="businessFeatureEmojiStatus", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class BusinessFeatureChatFolderTags(BusinessFeature):
+    """
+    The ability to display folder names for each chat in the chat list
+
+    """
+
+    _type: "str" = field(default="businessFeatureChatFolderTags", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class BusinessFeatureUpgradedStories(BusinessFeature):
+    """
+    Allowed to use many additional features for stories
+
+    """
+
+    _type: "str" = field(default="businessFeatureUpgradedStories", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
@@ -0,0 +1,1295 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import FormattedText, InputFile
+    from .classes_01 import Animation
+    from .classes_03 import PremiumStatePaymentOption
+    from .classes_10 import GiveawayParameters
+    from .classes_17 import BusinessFeature, PremiumFeature, PremiumLimitType
+    from .classes_21 import InternalLinkType
+
+@dataclass(slots=True)
+class PremiumStoryFeature(ObjectBase):
+    """
+    Describes a story feature available to Premium users
+
+    """
+
+    _type: "str" = field(default="PremiumStoryFeature", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumStoryFeaturePriorityOrder(PremiumStoryFeature):
+    """
+    Stories of the current user are displayed before stories of non-Premium contacts, supergroups, and channels
+
+    """
+
+    _type: "str" = field(default="premiumStoryFeaturePriorityOrder", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumStoryFeatureStealthMode(PremiumStoryFeature):
+    """
+    The ability to hide the fact that the user viewed other's stories
+
+    """
+
+    _type: "str" = field(default="premiumStoryFeatureStealthMode", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumStoryFeaturePermanentViewsHistory(PremiumStoryFeature):
+    """
+    The ability to check who opened the current user's stories after they expire
+
+    """
+
+    _type: "str" = field(default="premiumStoryFeaturePermanentViewsHistory", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumStoryFeatureCustomExpirationDuration(PremiumStoryFeature):
+    """
+    The ability to set custom expiration duration for stories
+
+    """
+
+    _type: "str" = field(default="premiumStoryFeatureCustomExpirationDuration", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumStoryFeatureSaveStories(PremiumStoryFeature):
+    """
+    The ability to save other's unprotected stories
+
+    """
+
+    _type: "str" = field(default="premiumStoryFeatureSaveStories", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumStoryFeatureLinksAndFormatting(PremiumStoryFeature):
+    """
+    The ability to use links and formatting in story caption, and use inputStoryAreaTypeLink areas
+
+    """
+
+    _type: "str" = field(default="premiumStoryFeatureLinksAndFormatting", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumStoryFeatureVideoQuality(PremiumStoryFeature):
+    """
+    The ability to choose better quality for viewed stories
+
+    """
+
+    _type: "str" = field(default="premiumStoryFeatureVideoQuality", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumLimit(ObjectBase):
+    """
+    Contains information about a limit, increased for Premium users
+
+    :param type: The type of the limit
+    :param default_value: Default value of the limit
+    :param premium_value: Value of the limit for Premium users
+    """
+
+    _type: "str" = field(default="premiumLimit", init=False, repr=False)
+    type: "PremiumLimitType | None" = None
+    default_value: "int" = 0
+    premium_value: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "default_value": self.default_value,
+            "premium_value": self.premium_value,
+        }
+
+@dataclass(slots=True)
+class PremiumFeatures(ObjectBase):
+    """
+    Contains information about features, available to Premium users
+
+    :param features: The list of available features
+    :param limits: The list of limits, increased for Premium users
+    :param payment_link: An internal link to be opened to pay for Telegram Premium if store payment isn't possible; may be null if direct payment isn't available
+    """
+
+    _type: "str" = field(default="premiumFeatures", init=False, repr=False)
+    features: "list[PremiumFeature] | None" = None
+    limits: "list[PremiumLimit] | None" = None
+    payment_link: "InternalLinkType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "features": _list_to_json(self.features),
+            "limits": _list_to_json(self.limits),
+            "payment_link": self.payment_link._to_json_dict() if self.payment_link is not None else None,
+        }
+
+@dataclass(slots=True)
+class BusinessFeatures(ObjectBase):
+    """
+    Contains information about features, available to Business user accounts
+
+    :param features: The list of available business features
+    """
+
+    _type: "str" = field(default="businessFeatures", init=False, repr=False)
+    features: "list[BusinessFeature] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "features": _list_to_json(self.features),
+        }
+
+@dataclass(slots=True)
+class PremiumSource(ObjectBase):
+    """
+    Describes a source from which the Premium features screen is opened
+
+    """
+
+    _type: "str" = field(default="PremiumSource", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumSourceLimitExceeded(PremiumSource):
+    """
+    A limit was exceeded
+
+    :param limit_type: Type of the exceeded limit
+    """
+
+    _type: "str" = field(default="premiumSourceLimitExceeded", init=False, repr=False)
+    limit_type: "PremiumLimitType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "limit_type": self.limit_type._to_json_dict() if self.limit_type is not None else None,
+        }
+
+@dataclass(slots=True)
+class PremiumSourceFeature(PremiumSource):
+    """
+    A user tried to use a Premium feature
+
+    :param feature: The used feature
+    """
+
+    _type: "str" = field(default="premiumSourceFeature", init=False, repr=False)
+    feature: "PremiumFeature | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "feature": self.feature._to_json_dict() if self.feature is not None else None,
+        }
+
+@dataclass(slots=True)
+class PremiumSourceBusinessFeature(PremiumSource):
+    """
+    A user tried to use a Business feature
+
+    :param feature: The used feature; pass null if none specific feature was used
+    """
+
+    _type: "str" = field(default="premiumSourceBusinessFeature", init=False, repr=False)
+    feature: "BusinessFeature | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "feature": self.feature._to_json_dict() if self.feature is not None else None,
+        }
+
+@dataclass(slots=True)
+class PremiumSourceStoryFeature(PremiumSource):
+    """
+    A user tried to use a Premium story feature
+
+    :param feature: The used feature
+    """
+
+    _type: "str" = field(default="premiumSourceStoryFeature", init=False, repr=False)
+    feature: "PremiumStoryFeature | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "feature": self.feature._to_json_dict() if self.feature is not None else None,
+        }
+
+@dataclass(slots=True)
+class PremiumSourceLink(PremiumSource):
+    """
+    A user opened an internal link of the type internalLinkTypePremiumFeatures
+
+    :param referrer: The referrer from the link
+    """
+
+    _type: "str" = field(default="premiumSourceLink", init=False, repr=False)
+    referrer: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "referrer": self.referrer,
+        }
+
+@dataclass(slots=True)
+class PremiumSourceSettings(PremiumSource):
+    """
+    A user opened the Premium features screen from settings
+
+    """
+
+    _type: "str" = field(default="premiumSourceSettings", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PremiumFeaturePromotionAnimation(ObjectBase):
+    """
+    Describes a promotion animation for a Premium feature
+
+    :param feature: Premium feature
+    :param animation: Promotion animation for the feature
+    """
+
+    _type: "str" = field(default="premiumFeaturePromotionAnimation", init=False, repr=False)
+    feature: "PremiumFeature | None" = None
+    animation: "Animation | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "feature": self.feature._to_json_dict() if self.feature is not None else None,
+            "animation": self.animation._to_json_dict() if self.animation is not None else None,
+        }
+
+@dataclass(slots=True)
+class BusinessFeaturePromotionAnimation(ObjectBase):
+    """
+    Describes a promotion animation for a Business feature
+
+    :param feature: Business feature
+    :param animation: Promotion animation for the feature
+    """
+
+    _type: "str" = field(default="businessFeaturePromotionAnimation", init=False, repr=False)
+    feature: "BusinessFeature | None" = None
+    animation: "Animation | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "feature": self.feature._to_json_dict() if self.feature is not None else None,
+            "animation": self.animation._to_json_dict() if self.animation is not None else None,
+        }
+
+@dataclass(slots=True)
+class PremiumState(ObjectBase):
+    """
+    Contains state of Telegram Premium subscription and promotion videos for Premium features
+
+    :param state: Text description of the state of the current Premium subscription; may be empty if the current user has no Telegram Premium subscription
+    :param payment_options: The list of available options for buying Telegram Premium
+    :param animations: The list of available promotion animations for Premium features
+    :param business_animations: The list of available promotion animations for Business features
+    """
+
+    _type: "str" = field(default="premiumState", init=False, repr=False)
+    state: "FormattedText | None" = None
+    payment_options: "list[PremiumStatePaymentOption] | None" = None
+    animations: "list[PremiumFeaturePromotionAnimation] | None" = None
+    business_animations: "list[BusinessFeaturePromotionAnimation] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "state": self.state._to_json_dict() if self.state is not None else None,
+            "payment_options": _list_to_json(self.payment_options),
+            "animations": _list_to_json(self.animations),
+            "business_animations": _list_to_json(self.business_animations),
+        }
+
+@dataclass(slots=True)
+class StorePaymentPurpose(ObjectBase):
+    """
+    Describes a purpose of an in-store payment
+
+    """
+
+    _type: "str" = field(default="StorePaymentPurpose", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StorePaymentPurposePremiumSubscription(StorePaymentPurpose):
+    """
+    The user subscribing to Telegram Premium
+
+    :param is_restore: Pass true if this is a restore of a Telegram Premium purchase; only for App Store
+    :param is_upgrade: Pass true if this is an upgrade from a monthly subscription to early subscription; only for App Store
+    """
+
+    _type: "str" = field(default="storePaymentPurposePremiumSubscription", init=False, repr=False)
+    is_restore: "bool" = False
+    is_upgrade: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_restore": self.is_restore,
+            "is_upgrade": self.is_upgrade,
+        }
+
+@dataclass(slots=True)
+class StorePaymentPurposePremiumGift(StorePaymentPurpose):
+    """
+    The user gifting Telegram Premium to another user
+
+    :param currency: ISO 4217 currency code of the payment currency
+    :param amount: Paid amount, in the smallest units of the currency
+    :param user_id: Identifiers of the user which will receive Telegram Premium
+    :param text: Text to show along with the gift codes; 0-getOption("gift_text_length_max") characters. Only Bold, Italic, Underline, Strikethrough, Spoiler, and CustomEmoji entities are allowed
+    """
+
+    _type: "str" = field(default="storePaymentPurposePremiumGift", init=False, repr=False)
+    currency: "str" = ""
+    amount: "int" = 0
+    user_id: "int" = 0
+    text: "FormattedText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "currency": self.currency,
+            "amount": self.amount,
+            "user_id": self.user_id,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+        }
+
+@dataclass(slots=True)
+class StorePaymentPurposePremiumGiftCodes(StorePaymentPurpose):
+    """
+    The user boosting a chat by creating Telegram Premium gift codes for other users
+
+    :param boosted_chat_id: Identifier of the supergroup or channel chat, which will be automatically boosted by the users for duration of the Premium subscription and which is administered by the user
+    :param currency: ISO 4217 currency code of the payment currency
+    :param amount: Paid amount, in the smallest units of the currency
+    :param user_ids: Identifiers of the users which can activate the gift codes
+    :param text: Text to show along with the gift codes; 0-getOption("gift_text_length_max") characters. Only Bold, Italic, Underline, Strikethrough, Spoiler, and CustomEmoji entities are allowed
+    """
+
+    _type: "str" = field(default="storePaymentPurposePremiumGiftCodes", init=False, repr=False)
+    boosted_chat_id: "int" = 0
+    currency: "str" = ""
+    amount: "int" = 0
+    user_ids: "list[int] | None" = None
+    text: "FormattedText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "boosted_chat_id": self.boosted_chat_id,
+            "currency": self.currency,
+            "amount": self.amount,
+            "user_ids": self.user_ids,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+        }
+
+@dataclass(slots=True)
+class StorePaymentPurposePremiumGiveaway(StorePaymentPurpose):
+    """
+    The user creating a Telegram Premium giveaway
+
+    :param parameters: Giveaway parameters
+    :param currency: ISO 4217 currency code of the payment currency
+    :param amount: Paid amount, in the smallest units of the currency
+    """
+
+    _type: "str" = field(default="storePaymentPurposePremiumGiveaway", init=False, repr=False)
+    parameters: "GiveawayParameters | None" = None
+    currency: "str" = ""
+    amount: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "parameters": self.parameters._to_json_dict() if self.parameters is not None else None,
+            "currency": self.currency,
+            "amount": self.amount,
+        }
+
+@dataclass(slots=True)
+class StorePaymentPurposeStarGiveaway(StorePaymentPurpose):
+    """
+    The user creating a Telegram Star giveaway
+
+    :param parameters: Giveaway parameters
+    :param currency: ISO 4217 currency code of the payment currency
+    :param amount: Paid amount, in the smallest units of the currency
+    :param winner_count: The number of users to receive Telegram Stars
+    :param star_count: The number of Telegram Stars to be distributed through the giveaway
+    """
+
+    _type: "str" = field(default="storePaymentPurposeStarGiveaway", init=False, repr=False)
+    parameters: "GiveawayParameters | None" = None
+    currency: "str" = ""
+    amount: "int" = 0
+    winner_count: "int" = 0
+    star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "parameters": self.parameters._to_json_dict() if self.parameters is not None else None,
+            "currency": self.currency,
+            "amount": self.amount,
+            "winner_count": self.winner_count,
+            "star_count": self.star_count,
+        }
+
+@dataclass(slots=True)
+class StorePaymentPurposeStars(StorePaymentPurpose):
+    """
+    The user buying Telegram Stars
+
+    :param currency: ISO 4217 currency code of the payment currency
+    :param amount: Paid amount, in the smallest units of the currency
+    :param star_count: Number of bought Telegram Stars
+    """
+
+    _type: "str" = field(default="storePaymentPurposeStars", init=False, repr=False)
+    currency: "str" = ""
+    amount: "int" = 0
+    star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "currency": self.currency,
+            "amount": self.amount,
+            "star_count": self.star_count,
+        }
+
+@dataclass(slots=True)
+class StorePaymentPurposeGiftedStars(StorePaymentPurpose):
+    """
+    The user buying Telegram Stars for other users
+
+    :param user_id: Identifier of the user to which Telegram Stars are gifted
+    :param currency: ISO 4217 currency code of the payment currency
+    :param amount: Paid amount, in the smallest units of the currency
+    :param star_count: Number of bought Telegram Stars
+    """
+
+    _type: "str" = field(default="storePaymentPurposeGiftedStars", init=False, repr=False)
+    user_id: "int" = 0
+    currency: "str" = ""
+    amount: "int" = 0
+    star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "currency": self.currency,
+            "amount": self.amount,
+            "star_count": self.star_count,
+        }
+
+@dataclass(slots=True)
+class StoreTransaction(ObjectBase):
+    """
+    Describes an in-store transaction
+
+    """
+
+    _type: "str" = field(default="StoreTransaction", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StoreTransactionAppStore(StoreTransaction):
+    """
+    A purchase through App Store
+
+    :param receipt: App Store receipt
+    """
+
+    _type: "str" = field(default="storeTransactionAppStore", init=False, repr=False)
+    receipt: "bytes" = b""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "receipt": _bytes_to_json(self.receipt),
+        }
+
+@dataclass(slots=True)
+class StoreTransactionGooglePlay(StoreTransaction):
+    """
+    A purchase through Google Play
+
+    :param package_name: Application package name
+    :param store_product_id: Identifier of the purchased store product
+    :param purchase_token: Google Play purchase token
+    """
+
+    _type: "str" = field(default="storeTransactionGooglePlay", init=False, repr=False)
+    package_name: "str" = ""
+    store_product_id: "str" = ""
+    purchase_token: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "package_name": self.package_name,
+            "store_product_id": self.store_product_id,
+            "purchase_token": self.purchase_token,
+        }
+
+@dataclass(slots=True)
+class TelegramPaymentPurpose(ObjectBase):
+    """
+    Describes a purpose of a payment toward Telegram
+
+    """
+
+    _type: "str" = field(default="TelegramPaymentPurpose", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TelegramPaymentPurposePremiumGift(TelegramPaymentPurpose):
+    """
+    The user gifting Telegram Premium to another user
+
+    :param currency: ISO 4217 currency code of the payment currency, or "XTR" for payments in Telegram Stars
+    :param amount: Paid amount, in the smallest units of the currency
+    :param user_id: Identifier of the user which will receive Telegram Premium
+    :param month_count: Number of months the Telegram Premium subscription will be active for the user
+    :param text: Text to show to the user receiving Telegram Premium; 0-getOption("gift_text_length_max") characters. Only Bold, Italic, Underline, Strikethrough, Spoiler, and CustomEmoji entities are allowed
+    """
+
+    _type: "str" = field(default="telegramPaymentPurposePremiumGift", init=False, repr=False)
+    currency: "str" = ""
+    amount: "int" = 0
+    user_id: "int" = 0
+    month_count: "int" = 0
+    text: "FormattedText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "currency": self.currency,
+            "amount": self.amount,
+            "user_id": self.user_id,
+            "month_count": self.month_count,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+        }
+
+@dataclass(slots=True)
+class TelegramPaymentPurposePremiumGiftCodes(TelegramPaymentPurpose):
+    """
+    The user boosting a chat by creating Telegram Premium gift codes for other users
+
+    :param boosted_chat_id: Identifier of the supergroup or channel chat, which will be automatically boosted by the users for duration of the Premium subscription and which is administered by the user
+    :param currency: ISO 4217 currency code of the payment currency
+    :param amount: Paid amount, in the smallest units of the currency
+    :param user_ids: Identifiers of the users which can activate the gift codes
+    :param month_count: Number of months the Telegram Premium subscription will be active for the users
+    :param text: Text to show along with the gift codes; 0-getOption("gift_text_length_max") characters. Only Bold, Italic, Underline, Strikethrough, Spoiler, and CustomEmoji entities are allowed
+    """
+
+    _type: "str" = field(default="telegramPaymentPurposePremiumGiftCodes", init=False, repr=False)
+    boosted_chat_id: "int" = 0
+    currency: "str" = ""
+    amount: "int" = 0
+    user_ids: "list[int] | None" = None
+    month_count: "int" = 0
+    text: "FormattedText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "boosted_chat_id": self.boosted_chat_id,
+            "currency": self.currency,
+            "amount": self.amount,
+            "user_ids": self.user_ids,
+            "month_count": self.month_count,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+        }
+
+@dataclass(slots=True)
+class TelegramPaymentPurposePremiumGiveaway(TelegramPaymentPurpose):
+    """
+    The user creating a Telegram Premium giveaway
+
+    :param parameters: Giveaway parameters
+    :param currency: ISO 4217 currency code of the payment currency
+    :param amount: Paid amount, in the smallest units of the currency
+    :param winner_count: Number of users which will be able to activate the gift codes
+    :param month_count: Number of months the Telegram Premium subscription will be active for the users
+    """
+
+    _type: "str" = field(default="telegramPaymentPurposePremiumGiveaway", init=False, repr=False)
+    parameters: "GiveawayParameters | None" = None
+    currency: "str" = ""
+    amount: "int" = 0
+    winner_count: "int" = 0
+    month_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "parameters": self.parameters._to_json_dict() if self.parameters is not None else None,
+            "currency": self.currency,
+            "amount": self.amount,
+            "winner_count": self.winner_count,
+            "month_count": self.month_count,
+        }
+
+@dataclass(slots=True)
+class TelegramPaymentPurposeStars(TelegramPaymentPurpose):
+    """
+    The user buying Telegram Stars
+
+    :param currency: ISO 4217 currency code of the payment currency
+    :param amount: Paid amount, in the smallest units of the currency
+    :param star_count: Number of bought Telegram Stars
+    """
+
+    _type: "str" = field(default="telegramPaymentPurposeStars", init=False, repr=False)
+    currency: "str" = ""
+    amount: "int" = 0
+    star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "currency": self.currency,
+            "amount": self.amount,
+            "star_count": self.star_count,
+        }
+
+@dataclass(slots=True)
+class TelegramPaymentPurposeGiftedStars(TelegramPaymentPurpose):
+    """
+    The user buying Telegram Stars for other users
+
+    :param user_id: Identifier of the user to which Telegram Stars are gifted
+    :param currency: ISO 4217 currency code of the payment currency
+    :param amount: Paid amount, in the smallest units of the currency
+    :param star_count: Number of bought Telegram Stars
+    """
+
+    _type: "str" = field(default="telegramPaymentPurposeGiftedStars", init=False, repr=False)
+    user_id: "int" = 0
+    currency: "str" = ""
+    amount: "int" = 0
+    star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "currency": self.currency,
+            "amount": self.amount,
+            "star_count": self.star_count,
+        }
+
+@dataclass(slots=True)
+class TelegramPaymentPurposeStarGiveaway(TelegramPaymentPurpose):
+    """
+    The user creating a Telegram Star giveaway
+
+    :param parameters: Giveaway parameters
+    :param currency: ISO 4217 currency code of the payment currency
+    :param amount: Paid amount, in the smallest units of the currency
+    :param winner_count: The number of users to receive Telegram Stars
+    :param star_count: The number of Telegram Stars to be distributed through the giveaway
+    """
+
+    _type: "str" = field(default="telegramPaymentPurposeStarGiveaway", init=False, repr=False)
+    parameters: "GiveawayParameters | None" = None
+    currency: "str" = ""
+    amount: "int" = 0
+    winner_count: "int" = 0
+    star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "parameters": self.parameters._to_json_dict() if self.parameters is not None else None,
+            "currency": self.currency,
+            "amount": self.amount,
+            "winner_count": self.winner_count,
+            "star_count": self.star_count,
+        }
+
+@dataclass(slots=True)
+class TelegramPaymentPurposeJoinChat(TelegramPaymentPurpose):
+    """
+    The user joins a chat and subscribes to regular payments in Telegram Stars
+
+    :param invite_link: Invite link to use
+    """
+
+    _type: "str" = field(default="telegramPaymentPurposeJoinChat", init=False, repr=False)
+    invite_link: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "invite_link": self.invite_link,
+        }
+
+@dataclass(slots=True)
+class DeviceToken(ObjectBase):
+    """
+    Represents a data needed to subscribe for push notifications through registerDevice method. To use specific push notification service, the correct application platform must be specified and a valid server authentication data must be uploaded at https://my.telegram.org
+
+    """
+
+    _type: "str" = field(default="DeviceToken", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class DeviceTokenFirebaseCloudMessaging(DeviceToken):
+    """
+    A token for Firebase Cloud Messaging
+
+    :param token: Device registration token; may be empty to deregister a device
+    :param encrypt: True, if push notifications must be additionally encrypted
+    """
+
+    _type: "str" = field(default="deviceTokenFirebaseCloudMessaging", init=False, repr=False)
+    token: "str" = ""
+    encrypt: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "token": self.token,
+            "encrypt": self.encrypt,
+        }
+
+@dataclass(slots=True)
+class DeviceTokenApplePush(DeviceToken):
+    """
+    A token for Apple Push Notification service
+
+    :param device_token: Device token; may be empty to deregister a device
+    :param is_app_sandbox: True, if App Sandbox is enabled
+    """
+
+    _type: "str" = field(default="deviceTokenApplePush", init=False, repr=False)
+    device_token: "str" = ""
+    is_app_sandbox: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "device_token": self.device_token,
+            "is_app_sandbox": self.is_app_sandbox,
+        }
+
+@dataclass(slots=True)
+class DeviceTokenApplePushVoIP(DeviceToken):
+    """
+    A token for Apple Push Notification service VoIP notifications
+
+    :param device_token: Device token; may be empty to deregister a device
+    :param is_app_sandbox: True, if App Sandbox is enabled
+    :param encrypt: True, if push notifications must be additionally encrypted
+    """
+
+    _type: "str" = field(default="deviceTokenApplePushVoIP", init=False, repr=False)
+    device_token: "str" = ""
+    is_app_sandbox: "bool" = False
+    encrypt: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "device_token": self.device_token,
+            "is_app_sandbox": self.is_app_sandbox,
+            "encrypt": self.encrypt,
+        }
+
+@dataclass(slots=True)
+class DeviceTokenWindowsPush(DeviceToken):
+    """
+    A token for Windows Push Notification Services
+
+    :param access_token: The access token that will be used to send notifications; may be empty to deregister a device
+    """
+
+    _type: "str" = field(default="deviceTokenWindowsPush", init=False, repr=False)
+    access_token: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "access_token": self.access_token,
+        }
+
+@dataclass(slots=True)
+class DeviceTokenMicrosoftPush(DeviceToken):
+    """
+    A token for Microsoft Push Notification Service
+
+    :param channel_uri: Push notification channel URI; may be empty to deregister a device
+    """
+
+    _type: "str" = field(default="deviceTokenMicrosoftPush", init=False, repr=False)
+    channel_uri: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "channel_uri": self.channel_uri,
+        }
+
+@dataclass(slots=True)
+class DeviceTokenMicrosoftPushVoIP(DeviceToken):
+    """
+    A token for Microsoft Push Notification Service VoIP channel
+
+    :param channel_uri: Push notification channel URI; may be empty to deregister a device
+    """
+
+    _type: "str" = field(default="deviceTokenMicrosoftPushVoIP", init=False, repr=False)
+    channel_uri: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "channel_uri": self.channel_uri,
+        }
+
+@dataclass(slots=True)
+class DeviceTokenWebPush(DeviceToken):
+    """
+    A token for web Push API
+
+    :param endpoint: Absolute URL exposed by the push service where the application server can send push messages; may be empty to deregister a device
+    :param p256dh_base64url: Base64url-encoded P-256 elliptic curve Diffie-Hellman public key
+    :param auth_base64url: Base64url-encoded authentication secret
+    """
+
+    _type: "str" = field(default="deviceTokenWebPush", init=False, repr=False)
+    endpoint: "str" = ""
+    p256dh_base64url: "str" = ""
+    auth_base64url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "endpoint": self.endpoint,
+            "p256dh_base64url": self.p256dh_base64url,
+            "auth_base64url": self.auth_base64url,
+        }
+
+@dataclass(slots=True)
+class DeviceTokenSimplePush(DeviceToken):
+    """
+    A token for Simple Push API for Firefox OS
+
+    :param endpoint: Absolute URL exposed by the push service where the application server can send push messages; may be empty to deregister a device
+    """
+
+    _type: "str" = field(default="deviceTokenSimplePush", init=False, repr=False)
+    endpoint: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "endpoint": self.endpoint,
+        }
+
+@dataclass(slots=True)
+class DeviceTokenUbuntuPush(DeviceToken):
+    """
+    A token for Ubuntu Push Client service
+
+    :param token: Token; may be empty to deregister a device
+    """
+
+    _type: "str" = field(default="deviceTokenUbuntuPush", init=False, repr=False)
+    token: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "token": self.token,
+        }
+
+@dataclass(slots=True)
+class DeviceTokenBlackBerryPush(DeviceToken):
+    """
+    A token for BlackBerry Push Service
+
+    :param token: Token; may be empty to deregister a device
+    """
+
+    _type: "str" = field(default="deviceTokenBlackBerryPush", init=False, repr=False)
+    token: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "token": self.token,
+        }
+
+@dataclass(slots=True)
+class DeviceTokenTizenPush(DeviceToken):
+    """
+    A token for Tizen Push Service
+
+    :param reg_id: Push service registration identifier; may be empty to deregister a device
+    """
+
+    _type: "str" = field(default="deviceTokenTizenPush", init=False, repr=False)
+    reg_id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "reg_id": self.reg_id,
+        }
+
+@dataclass(slots=True)
+class DeviceTokenHuaweiPush(DeviceToken):
+    """
+    A token for HUAWEI Push Service
+
+    :param token: Device registration token; may be empty to deregister a device
+    :param encrypt: True, if push notifications must be additionally encrypted
+    """
+
+    _type: "str" = field(default="deviceTokenHuaweiPush", init=False, repr=False)
+    token: "str" = ""
+    encrypt: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "token": self.token,
+            "encrypt": self.encrypt,
+        }
+
+@dataclass(slots=True)
+class PushReceiverId(ObjectBase):
+    """
+    Contains a globally unique push receiver identifier, which can be used to identify which account has received a push notification
+
+    :param id: The globally unique identifier of push notification subscription
+    """
+
+    _type: "str" = field(default="pushReceiverId", init=False, repr=False)
+    id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+        }
+
+@dataclass(slots=True)
+class BackgroundFill(ObjectBase):
+    """
+    Describes a fill of a background
+
+    """
+
+    _type: "str" = field(default="BackgroundFill", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class BackgroundFillSolid(BackgroundFill):
+    """
+    Describes a solid fill of a background
+
+    :param color: A color of the background in the RGB format
+    """
+
+    _type: "str" = field(default="backgroundFillSolid", init=False, repr=False)
+    color: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "color": self.color,
+        }
+
+@dataclass(slots=True)
+class BackgroundFillGradient(BackgroundFill):
+    """
+    Describes a gradient fill of a background
+
+    :param top_color: A top color of the background in the RGB format
+    :param bottom_color: A bottom color of the background in the RGB format
+    :param rotation_angle: Clockwise rotation angle of the gradient, in degrees; 0-359. Must always be divisible by 45
+    """
+
+    _type: "str" = field(default="backgroundFillGradient", init=False, repr=False)
+    top_color: "int" = 0
+    bottom_color: "int" = 0
+    rotation_angle: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "top_color": self.top_color,
+            "bottom_color": self.bottom_color,
+            "rotation_angle": self.rotation_angle,
+        }
+
+@dataclass(slots=True)
+class BackgroundFillFreeformGradient(BackgroundFill):
+    """
+    Describes a freeform gradient fill of a background
+
+    :param colors: A list of 3 or 4 colors of the freeform gradient in the RGB format
+    """
+
+    _type: "str" = field(default="backgroundFillFreeformGradient", init=False, repr=False)
+    colors: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "colors": self.colors,
+        }
+
+@dataclass(slots=True)
+class BackgroundType(ObjectBase):
+    """
+    Describes the type of background
+
+    """
+
+    _type: "str" = field(default="BackgroundType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class BackgroundTypeWallpaper(BackgroundType):
+    """
+    A wallpaper in JPEG format
+
+    :param is_blurred: True, if the wallpaper must be downscaled to fit in 450x450 square and then box-blurred with radius 12
+    :param is_moving: True, if the background needs to be slightly moved when device is tilted
+    """
+
+    _type: "str" = field(default="backgroundTypeWallpaper", init=False, repr=False)
+    is_blurred: "bool" = False
+    is_moving: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_blurred": self.is_blurred,
+            "is_moving": self.is_moving,
+        }
+
+@dataclass(slots=True)
+class BackgroundTypePattern(BackgroundType):
+    """
+    A PNG or TGV (gzipped subset of SVG with MIME type "application/x-tgwallpattern") pattern to be combined with the background fill chosen by the user
+
+    :param fill: Fill of the background
+    :param intensity: Intensity of the pattern when it is shown above the filled background; 0-100
+    :param is_inverted: True, if the background fill must be applied only to the pattern itself. All other pixels are black in this case. For dark themes only
+    :param is_moving: True, if the background needs to be slightly moved when device is tilted
+    """
+
+    _type: "str" = field(default="backgroundTypePattern", init=False, repr=False)
+    fill: "BackgroundFill | None" = None
+    intensity: "int" = 0
+    is_inverted: "bool" = False
+    is_moving: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "fill": self.fill._to_json_dict() if self.fill is not None else None,
+            "intensity": self.intensity,
+            "is_inverted": self.is_inverted,
+            "is_moving": self.is_moving,
+        }
+
+@dataclass(slots=True)
+class BackgroundTypeFill(BackgroundType):
+    """
+    A filled background
+
+    :param fill: The background fill
+    """
+
+    _type: "str" = field(default="backgroundTypeFill", init=False, repr=False)
+    fill: "BackgroundFill | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "fill": self.fill._to_json_dict() if self.fill is not None else None,
+        }
+
+@dataclass(slots=True)
+class BackgroundTypeChatTheme(BackgroundType):
+    """
+    A background from a chat theme; can be used only as a chat background in channels
+
+    :param theme_name: Name of the chat theme
+    """
+
+    _type: "str" = field(default="backgroundTypeChatTheme", init=False, repr=False)
+    theme_name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "theme_name": self.theme_name,
+        }
+
+@dataclass(slots=True)
+class InputBackground(ObjectBase):
+    """
+    Contains information about background to set
+
+    """
+
+    _type: "str" = field(default="InputBackground", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InputBackgroundLocal(InputBackground):
+    """
+    A background from a local file
+
+    :param background: Background file to use. Only inputFileLocal and inputFileGenerated are supported. The file must be in JPEG format for wallpapers and in PNG format for patterns
+    """
+
+    _type: "str" = field(default="inputBackgroundLocal", init=False, repr=False)
+    background: "InputFile | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "background": self.background._to_json_dict() if self.background is not None else None,
+        }
+
+@dataclass(slots=True)
+class InputBackgroundRemote(InputBackground):
+    """
+    A background from the server
+
+    :param background_id: The background identifier
+    """
+
+    _type: "str" = field(default="inputBackgroundRemote", init=False, repr=False)
+    background_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "background_id": self.background_id,
+        }
+
+@dataclass(slots=True)
+class InputBackgroundPrevious(InputBackground):
+    """
+    A background previously set in the chat; for chat backgrounds only
+
+    :param message_id: Identifier of the message with the background
+    """
+
+    _type: "str" = field(default="inputBackgroundPrevious", init=False, repr=False)
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "message_id": self.message_id,
+        }
+
@@ -0,0 +1,1393 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_01 import Animation, Audio, Document, Photo, Sticker, Video, VideoNote, VoiceNote
+    from .classes_04 import GiveawayPrize
+    from .classes_08 import ThemeSettings
+
+@dataclass(slots=True)
+class ChatTheme(ObjectBase):
+    """
+    Describes a chat theme
+
+    :param name: Theme name
+    :param light_settings: Theme settings for a light chat theme
+    :param dark_settings: Theme settings for a dark chat theme
+    """
+
+    _type: "str" = field(default="chatTheme", init=False, repr=False)
+    name: "str" = ""
+    light_settings: "ThemeSettings | None" = None
+    dark_settings: "ThemeSettings | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name,
+            "light_settings": self.light_settings._to_json_dict() if self.light_settings is not None else None,
+            "dark_settings": self.dark_settings._to_json_dict() if self.dark_settings is not None else None,
+        }
+
+@dataclass(slots=True)
+class TimeZone(ObjectBase):
+    """
+    Describes a time zone
+
+    :param id: Unique time zone identifier
+    :param name: Time zone name
+    :param utc_time_offset: Current UTC time offset for the time zone
+    """
+
+    _type: "str" = field(default="timeZone", init=False, repr=False)
+    id: "str" = ""
+    name: "str" = ""
+    utc_time_offset: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "name": self.name,
+            "utc_time_offset": self.utc_time_offset,
+        }
+
+@dataclass(slots=True)
+class TimeZones(ObjectBase):
+    """
+    Contains a list of time zones
+
+    :param time_zones: A list of time zones
+    """
+
+    _type: "str" = field(default="timeZones", init=False, repr=False)
+    time_zones: "list[TimeZone] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "time_zones": _list_to_json(self.time_zones),
+        }
+
+@dataclass(slots=True)
+class Hashtags(ObjectBase):
+    """
+    Contains a list of hashtags
+
+    :param hashtags: A list of hashtags
+    """
+
+    _type: "str" = field(default="hashtags", init=False, repr=False)
+    hashtags: "list[str] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "hashtags": self.hashtags,
+        }
+
+@dataclass(slots=True)
+class CanPostStoryResult(ObjectBase):
+    """
+    Represents result of checking whether the current user can post a story on behalf of the specific chat
+
+    """
+
+    _type: "str" = field(default="CanPostStoryResult", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CanPostStoryResultOk(CanPostStoryResult):
+    """
+    A story can be sent
+
+    :param story_count: Number of stories that can be posted by the user
+    """
+
+    _type: "str" = field(default="canPostStoryResultOk", init=False, repr=False)
+    story_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_count": self.story_count,
+        }
+
+@dataclass(slots=True)
+class CanPostStoryResultPremiumNeeded(CanPostStoryResult):
+    """
+    The user must subscribe to Telegram Premium to be able to post stories
+
+    """
+
+    _type: "str" = field(default="canPostStoryResultPremiumNeeded", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CanPostStoryResultBoostNeeded(CanPostStoryResult):
+    """
+    The chat must be boosted first by Telegram Premium subscribers to post more stories. Call getChatBoostStatus to get current boost status of the chat
+
+    """
+
+    _type: "str" = field(default="canPostStoryResultBoostNeeded", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CanPostStoryResultActiveStoryLimitExceeded(CanPostStoryResult):
+    """
+    The limit for the number of active stories exceeded. The user can buy Telegram Premium, delete an active story, or wait for the oldest story to expire
+
+    """
+
+    _type: "str" = field(default="canPostStoryResultActiveStoryLimitExceeded", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CanPostStoryResultWeeklyLimitExceeded(CanPostStoryResult):
+    """
+    The weekly limit for the number of posted stories exceeded. The user needs to buy Telegram Premium or wait specified time
+
+    :param retry_after: Time left before the user can post the next story
+    """
+
+    _type: "str" = field(default="canPostStoryResultWeeklyLimitExceeded", init=False, repr=False)
+    retry_after: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "retry_after": self.retry_after,
+        }
+
+@dataclass(slots=True)
+class CanPostStoryResultMonthlyLimitExceeded(CanPostStoryResult):
+    """
+    The monthly limit for the number of posted stories exceeded. The user needs to buy Telegram Premium or wait specified time
+
+    :param retry_after: Time left before the user can post the next story
+    """
+
+    _type: "str" = field(default="canPostStoryResultMonthlyLimitExceeded", init=False, repr=False)
+    retry_after: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "retry_after": self.retry_after,
+        }
+
+@dataclass(slots=True)
+class CanTransferOwnershipResult(ObjectBase):
+    """
+    Represents result of checking whether the current session can be used to transfer a chat ownership to another user
+
+    """
+
+    _type: "str" = field(default="CanTransferOwnershipResult", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CanTransferOwnershipResultOk(CanTransferOwnershipResult):
+    """
+    The session can be used
+
+    """
+
+    _type: "str" = field(default="canTransferOwnershipResultOk", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CanTransferOwnershipResultPasswordNeeded(CanTransferOwnershipResult):
+    """
+    The 2-step verification needs to be enabled first
+
+    """
+
+    _type: "str" = field(default="canTransferOwnershipResultPasswordNeeded", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CanTransferOwnershipResultPasswordTooFresh(CanTransferOwnershipResult):
+    """
+    The 2-step verification was enabled recently, user needs to wait
+
+    :param retry_after: Time left before the session can be used to transfer ownership of a chat, in seconds
+    """
+
+    _type: "str" = field(default="canTransferOwnershipResultPasswordTooFresh", init=False, repr=False)
+    retry_after: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "retry_after": self.retry_after,
+        }
+
+@dataclass(slots=True)
+class CanTransferOwnershipResultSessionTooFresh(CanTransferOwnershipResult):
+    """
+    The session was created recently, user needs to wait
+
+    :param retry_after: Time left before the session can be used to transfer ownership of a chat, in seconds
+    """
+
+    _type: "str" = field(default="canTransferOwnershipResultSessionTooFresh", init=False, repr=False)
+    retry_after: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "retry_after": self.retry_after,
+        }
+
+@dataclass(slots=True)
+class CheckChatUsernameResult(ObjectBase):
+    """
+    Represents result of checking whether a username can be set for a chat
+
+    """
+
+    _type: "str" = field(default="CheckChatUsernameResult", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CheckChatUsernameResultOk(CheckChatUsernameResult):
+    """
+    The username can be set
+
+    """
+
+    _type: "str" = field(default="checkChatUsernameResultOk", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CheckChatUsernameResultUsernameInvalid(CheckChatUsernameResult):
+    """
+    The username is invalid
+
+    """
+
+    _type: "str" = field(default="checkChatUsernameResultUsernameInvalid", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CheckChatUsernameResultUsernameOccupied(CheckChatUsernameResult):
+    """
+    The username is occupied
+
+    """
+
+    _type: "str" = field(default="checkChatUsernameResultUsernameOccupied", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CheckChatUsernameResultUsernamePurchasable(CheckChatUsernameResult):
+    """
+    The username can be purchased at https://fragment.com. Information about the username can be received using getCollectibleItemInfo
+
+    """
+
+    _type: "str" = field(default="checkChatUsernameResultUsernamePurchasable", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CheckChatUsernameResultPublicChatsTooMany(CheckChatUsernameResult):
+    """
+    The user has too many chats with username, one of them must be made private first
+
+    """
+
+    _type: "str" = field(default="checkChatUsernameResultPublicChatsTooMany", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CheckChatUsernameResultPublicGroupsUnavailable(CheckChatUsernameResult):
+    """
+    The user can't be a member of a public supergroup
+
+    """
+
+    _type: "str" = field(default="checkChatUsernameResultPublicGroupsUnavailable", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CheckStickerSetNameResult(ObjectBase):
+    """
+    Represents result of checking whether a name can be used for a new sticker set
+
+    """
+
+    _type: "str" = field(default="CheckStickerSetNameResult", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CheckStickerSetNameResultOk(CheckStickerSetNameResult):
+    """
+    The name can be set
+
+    """
+
+    _type: "str" = field(default="checkStickerSetNameResultOk", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CheckStickerSetNameResultNameInvalid(CheckStickerSetNameResult):
+    """
+    The name is invalid
+
+    """
+
+    _type: "str" = field(default="checkStickerSetNameResultNameInvalid", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CheckStickerSetNameResultNameOccupied(CheckStickerSetNameResult):
+    """
+    The name is occupied
+
+    """
+
+    _type: "str" = field(default="checkStickerSetNameResultNameOccupied", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ResetPasswordResult(ObjectBase):
+    """
+    Represents result of 2-step verification password reset
+
+    """
+
+    _type: "str" = field(default="ResetPasswordResult", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ResetPasswordResultOk(ResetPasswordResult):
+    """
+    The password was reset
+
+    """
+
+    _type: "str" = field(default="resetPasswordResultOk", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ResetPasswordResultPending(ResetPasswordResult):
+    """
+    The password reset request is pending
+
+    :param pending_reset_date: Point in time (Unix timestamp) after which the password can be reset immediately using resetPassword
+    """
+
+    _type: "str" = field(default="resetPasswordResultPending", init=False, repr=False)
+    pending_reset_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "pending_reset_date": self.pending_reset_date,
+        }
+
+@dataclass(slots=True)
+class ResetPasswordResultDeclined(ResetPasswordResult):
+    """
+    The password reset request was declined
+
+    :param retry_date: Point in time (Unix timestamp) when the password reset can be retried
+    """
+
+    _type: "str" = field(default="resetPasswordResultDeclined", init=False, repr=False)
+    retry_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "retry_date": self.retry_date,
+        }
+
+@dataclass(slots=True)
+class MessageFileType(ObjectBase):
+    """
+    Contains information about a file with messages exported from another app
+
+    """
+
+    _type: "str" = field(default="MessageFileType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class MessageFileTypePrivate(MessageFileType):
+    """
+    The messages were exported from a private chat
+
+    :param name: Name of the other party; may be empty if unrecognized
+    """
+
+    _type: "str" = field(default="messageFileTypePrivate", init=False, repr=False)
+    name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name,
+        }
+
+@dataclass(slots=True)
+class MessageFileTypeGroup(MessageFileType):
+    """
+    The messages were exported from a group chat
+
+    :param title: Title of the group chat; may be empty if unrecognized
+    """
+
+    _type: "str" = field(default="messageFileTypeGroup", init=False, repr=False)
+    title: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "title": self.title,
+        }
+
+@dataclass(slots=True)
+class MessageFileTypeUnknown(MessageFileType):
+    """
+    The messages were exported from a chat of unknown type
+
+    """
+
+    _type: "str" = field(default="messageFileTypeUnknown", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PushMessageContent(ObjectBase):
+    """
+    Contains content of a push message notification
+
+    """
+
+    _type: "str" = field(default="PushMessageContent", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentHidden(PushMessageContent):
+    """
+    A general message with hidden content
+
+    :param is_pinned: True, if the message is a pinned message with the specified content
+    """
+
+    _type: "str" = field(default="pushMessageContentHidden", init=False, repr=False)
+    is_pinned: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_pinned": self.is_pinned,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentAnimation(PushMessageContent):
+    """
+    An animation message (GIF-style).
+
+    :param animation: Message content; may be null
+    :param caption: Animation caption
+    :param is_pinned: True, if the message is a pinned message with the specified content
+    """
+
+    _type: "str" = field(default="pushMessageContentAnimation", init=False, repr=False)
+    animation: "Animation | None" = None
+    caption: "str" = ""
+    is_pinned: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "animation": self.animation._to_json_dict() if self.animation is not None else None,
+            "caption": self.caption,
+            "is_pinned": self.is_pinned,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentAudio(PushMessageContent):
+    """
+    An audio message
+
+    :param audio: Message content; may be null
+    :param is_pinned: True, if the message is a pinned message with the specified content
+    """
+
+    _type: "str" = field(default="pushMessageContentAudio", init=False, repr=False)
+    audio: "Audio | None" = None
+    is_pinned: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "audio": self.audio._to_json_dict() if self.audio is not None else None,
+            "is_pinned": self.is_pinned,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentContact(PushMessageContent):
+    """
+    A message with a user contact
+
+    :param name: Contact's name
+    :param is_pinned: True, if the message is a pinned message with the specified content
+    """
+
+    _type: "str" = field(default="pushMessageContentContact", init=False, repr=False)
+    name: "str" = ""
+    is_pinned: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name,
+            "is_pinned": self.is_pinned,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentContactRegistered(PushMessageContent):
+    """
+    A contact has registered with Telegram
+
+    """
+
+    _type: "str" = field(default="pushMessageContentContactRegistered", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentDocument(PushMessageContent):
+    """
+    A document message (a general file)
+
+    :param document: Message content; may be null
+    :param is_pinned: True, if the message is a pinned message with the specified content
+    """
+
+    _type: "str" = field(default="pushMessageContentDocument", init=False, repr=False)
+    document: "Document | None" = None
+    is_pinned: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "document": self.document._to_json_dict() if self.document is not None else None,
+            "is_pinned": self.is_pinned,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentGame(PushMessageContent):
+    """
+    A message with a game
+
+    :param title: Game title, empty for pinned game message
+    :param is_pinned: True, if the message is a pinned message with the specified content
+    """
+
+    _type: "str" = field(default="pushMessageContentGame", init=False, repr=False)
+    title: "str" = ""
+    is_pinned: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "title": self.title,
+            "is_pinned": self.is_pinned,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentGameScore(PushMessageContent):
+    """
+    A new high score was achieved in a game
+
+    :param title: Game title, empty for pinned message
+    :param score: New score, 0 for pinned message
+    :param is_pinned: True, if the message is a pinned message with the specified content
+    """
+
+    _type: "str" = field(default="pushMessageContentGameScore", init=False, repr=False)
+    title: "str" = ""
+    score: "int" = 0
+    is_pinned: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "title": self.title,
+            "score": self.score,
+            "is_pinned": self.is_pinned,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentInvoice(PushMessageContent):
+    """
+    A message with an invoice from a bot
+
+    :param price: Product price
+    :param is_pinned: True, if the message is a pinned message with the specified content
+    """
+
+    _type: "str" = field(default="pushMessageContentInvoice", init=False, repr=False)
+    price: "str" = ""
+    is_pinned: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "price": self.price,
+            "is_pinned": self.is_pinned,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentLocation(PushMessageContent):
+    """
+    A message with a location
+
+    :param is_live: True, if the location is live
+    :param is_pinned: True, if the message is a pinned message with the specified content
+    """
+
+    _type: "str" = field(default="pushMessageContentLocation", init=False, repr=False)
+    is_live: "bool" = False
+    is_pinned: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_live": self.is_live,
+            "is_pinned": self.is_pinned,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentPaidMedia(PushMessageContent):
+    """
+    A message with paid media
+
+    :param star_count: Number of Telegram Stars needed to buy access to the media in the message; 0 for pinned message
+    :param is_pinned: True, if the message is a pinned message with the specified content
+    """
+
+    _type: "str" = field(default="pushMessageContentPaidMedia", init=False, repr=False)
+    star_count: "int" = 0
+    is_pinned: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "star_count": self.star_count,
+            "is_pinned": self.is_pinned,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentPhoto(PushMessageContent):
+    """
+    A photo message
+
+    :param photo: Message content; may be null
+    :param caption: Photo caption
+    :param is_secret: True, if the photo is secret
+    :param is_pinned: True, if the message is a pinned message with the specified content
+    """
+
+    _type: "str" = field(default="pushMessageContentPhoto", init=False, repr=False)
+    photo: "Photo | None" = None
+    caption: "str" = ""
+    is_secret: "bool" = False
+    is_pinned: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+            "caption": self.caption,
+            "is_secret": self.is_secret,
+            "is_pinned": self.is_pinned,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentPoll(PushMessageContent):
+    """
+    A message with a poll
+
+    :param question: Poll question
+    :param is_regular: True, if the poll is regular and not in quiz mode
+    :param is_pinned: True, if the message is a pinned message with the specified content
+    """
+
+    _type: "str" = field(default="pushMessageContentPoll", init=False, repr=False)
+    question: "str" = ""
+    is_regular: "bool" = False
+    is_pinned: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "question": self.question,
+            "is_regular": self.is_regular,
+            "is_pinned": self.is_pinned,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentPremiumGiftCode(PushMessageContent):
+    """
+    A message with a Telegram Premium gift code created for the user
+
+    :param month_count: Number of months the Telegram Premium subscription will be active after code activation
+    """
+
+    _type: "str" = field(default="pushMessageContentPremiumGiftCode", init=False, repr=False)
+    month_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "month_count": self.month_count,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentGiveaway(PushMessageContent):
+    """
+    A message with a giveaway
+
+    :param winner_count: Number of users which will receive giveaway prizes; 0 for pinned message
+    :param prize: Prize of the giveaway; may be null for pinned message
+    :param is_pinned: True, if the message is a pinned message with the specified content
+    """
+
+    _type: "str" = field(default="pushMessageContentGiveaway", init=False, repr=False)
+    winner_count: "int" = 0
+    prize: "GiveawayPrize | None" = None
+    is_pinned: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "winner_count": self.winner_count,
+            "prize": self.prize._to_json_dict() if self.prize is not None else None,
+            "is_pinned": self.is_pinned,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentGift(PushMessageContent):
+    """
+    A message with a gift
+
+    :param star_count: Number of Telegram Stars that sender paid for the gift
+    """
+
+    _type: "str" = field(default="pushMessageContentGift", init=False, repr=False)
+    star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "star_count": self.star_count,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentUpgradedGift(PushMessageContent):
+    """
+    A message with an upgraded gift
+
+    :param is_upgrade: True, if the gift was obtained by upgrading of a previously received gift; otherwise, this is a transferred or resold gift
+    """
+
+    _type: "str" = field(default="pushMessageContentUpgradedGift", init=False, repr=False)
+    is_upgrade: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_upgrade": self.is_upgrade,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentScreenshotTaken(PushMessageContent):
+    """
+    A screenshot of a message in the chat has been taken
+
+    """
+
+    _type: "str" = field(default="pushMessageContentScreenshotTaken", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentSticker(PushMessageContent):
+    """
+    A message with a sticker
+
+    :param sticker: Message content; may be null
+    :param emoji: Emoji corresponding to the sticker; may be empty
+    :param is_pinned: True, if the message is a pinned message with the specified content
+    """
+
+    _type: "str" = field(default="pushMessageContentSticker", init=False, repr=False)
+    sticker: "Sticker | None" = None
+    emoji: "str" = ""
+    is_pinned: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+            "emoji": self.emoji,
+            "is_pinned": self.is_pinned,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentStory(PushMessageContent):
+    """
+    A message with a story
+
+    :param is_mention: True, if the user was mentioned in the story
+    :param is_pinned: True, if the message is a pinned message with the specified content
+    """
+
+    _type: "str" = field(default="pushMessageContentStory", init=False, repr=False)
+    is_mention: "bool" = False
+    is_pinned: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_mention": self.is_mention,
+            "is_pinned": self.is_pinned,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentText(PushMessageContent):
+    """
+    A text message
+
+    :param text: Message text
+    :param is_pinned: True, if the message is a pinned message with the specified content
+    """
+
+    _type: "str" = field(default="pushMessageContentText", init=False, repr=False)
+    text: "str" = ""
+    is_pinned: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text,
+            "is_pinned": self.is_pinned,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentChecklist(PushMessageContent):
+    """
+    A message with a checklist
+
+    :param title: Checklist title
+    :param is_pinned: True, if the message is a pinned message with the specified content
+    """
+
+    _type: "str" = field(default="pushMessageContentChecklist", init=False, repr=False)
+    title: "str" = ""
+    is_pinned: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "title": self.title,
+            "is_pinned": self.is_pinned,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentVideo(PushMessageContent):
+    """
+    A video message
+
+    :param video: Message content; may be null
+    :param caption: Video caption
+    :param is_secret: True, if the video is secret
+    :param is_pinned: True, if the message is a pinned message with the specified content
+    """
+
+    _type: "str" = field(default="pushMessageContentVideo", init=False, repr=False)
+    video: "Video | None" = None
+    caption: "str" = ""
+    is_secret: "bool" = False
+    is_pinned: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "video": self.video._to_json_dict() if self.video is not None else None,
+            "caption": self.caption,
+            "is_secret": self.is_secret,
+            "is_pinned": self.is_pinned,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentVideoNote(PushMessageContent):
+    """
+    A video note message
+
+    :param video_note: Message content; may be null
+    :param is_pinned: True, if the message is a pinned message with the specified content
+    """
+
+    _type: "str" = field(default="pushMessageContentVideoNote", init=False, repr=False)
+    video_note: "VideoNote | None" = None
+    is_pinned: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "video_note": self.video_note._to_json_dict() if self.video_note is not None else None,
+            "is_pinned": self.is_pinned,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentVoiceNote(PushMessageContent):
+    """
+    A voice note message
+
+    :param voice_note: Message content; may be null
+    :param is_pinned: True, if the message is a pinned message with the specified content
+    """
+
+    _type: "str" = field(default="pushMessageContentVoiceNote", init=False, repr=False)
+    voice_note: "VoiceNote | None" = None
+    is_pinned: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "voice_note": self.voice_note._to_json_dict() if self.voice_note is not None else None,
+            "is_pinned": self.is_pinned,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentBasicGroupChatCreate(PushMessageContent):
+    """
+    A newly created basic group
+
+    """
+
+    _type: "str" = field(default="pushMessageContentBasicGroupChatCreate", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentVideoChatStarted(PushMessageContent):
+    """
+    A video chat or live stream was started
+
+    """
+
+    _type: "str" = field(default="pushMessageContentVideoChatStarted", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentVideoChatEnded(PushMessageContent):
+    """
+    A video chat or live stream has ended
+
+    """
+
+    _type: "str" = field(default="pushMessageContentVideoChatEnded", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentInviteVideoChatParticipants(PushMessageContent):
+    """
+    An invitation of participants to a video chat or live stream
+
+    :param is_current_user: True, if the current user was invited to the video chat or the live stream
+    """
+
+    _type: "str" = field(default="pushMessageContentInviteVideoChatParticipants", init=False, repr=False)
+    is_current_user: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_current_user": self.is_current_user,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentChatAddMembers(PushMessageContent):
+    """
+    New chat members were invited to a group
+
+    :param member_name: Name of the added member
+    :param is_current_user: True, if the current user was added to the group
+    :param is_returned: True, if the user has returned to the group themselves
+    """
+
+    _type: "str" = field(default="pushMessageContentChatAddMembers", init=False, repr=False)
+    member_name: "str" = ""
+    is_current_user: "bool" = False
+    is_returned: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "member_name": self.member_name,
+            "is_current_user": self.is_current_user,
+            "is_returned": self.is_returned,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentChatChangePhoto(PushMessageContent):
+    """
+    A chat photo was edited
+
+    """
+
+    _type: "str" = field(default="pushMessageContentChatChangePhoto", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentChatChangeTitle(PushMessageContent):
+    """
+    A chat title was edited
+
+    :param title: New chat title
+    """
+
+    _type: "str" = field(default="pushMessageContentChatChangeTitle", init=False, repr=False)
+    title: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "title": self.title,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentChatSetBackground(PushMessageContent):
+    """
+    A chat background was edited
+
+    :param is_same: True, if the set background is the same as the background of the current user
+    """
+
+    _type: "str" = field(default="pushMessageContentChatSetBackground", init=False, repr=False)
+    is_same: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_same": self.is_same,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentChatSetTheme(PushMessageContent):
+    """
+    A chat theme was edited
+
+    :param theme_name: If non-empty, name of a new theme, set for the chat. Otherwise, the chat theme was reset to the default one
+    """
+
+    _type: "str" = field(default="pushMessageContentChatSetTheme", init=False, repr=False)
+    theme_name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "theme_name": self.theme_name,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentChatDeleteMember(PushMessageContent):
+    """
+    A chat member was deleted
+
+    :param member_name: Name of the deleted member
+    :param is_current_user: True, if the current user was deleted from the group
+    :param is_left: True, if the user has left the group themselves
+    """
+
+    _type: "str" = field(default="pushMessageContentChatDeleteMember", init=False, repr=False)
+    member_name: "str" = ""
+    is_current_user: "bool" = False
+    is_left: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "member_name": self.member_name,
+            "is_current_user": self.is_current_user,
+            "is_left": self.is_left,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentChatJoinByLink(PushMessageContent):
+    """
+    A new member joined the chat via an invite link
+
+    """
+
+    _type: "str" = field(default="pushMessageContentChatJoinByLink", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentChatJoinByRequest(PushMessageContent):
+    """
+    A new member was accepted to the chat by an administrator
+
+    """
+
+    _type: "str" = field(default="pushMessageContentChatJoinByRequest", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentRecurringPayment(PushMessageContent):
+    """
+    A new recurring payment was made by the current user
+
+    :param amount: The paid amount
+    """
+
+    _type: "str" = field(default="pushMessageContentRecurringPayment", init=False, repr=False)
+    amount: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "amount": self.amount,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentSuggestProfilePhoto(PushMessageContent):
+    """
+    A profile photo was suggested to the user
+
+    """
+
+    _type: "str" = field(default="pushMessageContentSuggestProfilePhoto", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentProximityAlertTriggered(PushMessageContent):
+    """
+    A user in the chat came within proximity alert range from the current user
+
+    :param distance: The distance to the user
+    """
+
+    _type: "str" = field(default="pushMessageContentProximityAlertTriggered", init=False, repr=False)
+    distance: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "distance": self.distance,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentChecklistTasksAdded(PushMessageContent):
+    """
+    Some tasks were added to a checklist
+
+    :param task_count: Number of added tasks
+    """
+
+    _type: "str" = field(default="pushMessageContentChecklistTasksAdded", init=False, repr=False)
+    task_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "task_count": self.task_count,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentChecklistTasksDone(PushMessageContent):
+    """
+    Some tasks from a checklist were marked as done or not done
+
+    :param task_count: Number of changed tasks
+    """
+
+    _type: "str" = field(default="pushMessageContentChecklistTasksDone", init=False, repr=False)
+    task_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "task_count": self.task_count,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentMessageForwards(PushMessageContent):
+    """
+    A forwarded messages
+
+    :param total_count: Number of forwarded messages
+    """
+
+    _type: "str" = field(default="pushMessageContentMessageForwards", init=False, repr=False)
+    total_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+        }
+
+@dataclass(slots=True)
+class PushMessageContentMediaAlbum(PushMessageContent):
+    """
+    A media album
+
+    :param total_count: Number of messages in the album
+    :param has_photos: True, if the album has at least one photo
+    :param has_videos: True, if the album has at least one video file
+    :param has_audios: True, if the album has at least one audio file
+    :param has_documents: True, if the album has at least one document
+    """
+
+    _type: "str" = field(default="pushMessageContentMediaAlbum", init=False, repr=False)
+    total_count: "int" = 0
+    has_photos: "bool" = False
+    has_videos: "bool" = False
+    has_audios: "bool" = False
+    has_documents: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "has_photos": self.has_photos,
+            "has_videos": self.has_videos,
+            "has_audios": self.has_audios,
+            "has_documents": self.has_documents,
+        }
+
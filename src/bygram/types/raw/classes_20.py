@@ -0,0 +1,1074 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import File
+    from .classes_05 import MessageSender
+    from .classes_06 import Message
+    from .classes_19 import PushMessageContent
+
+@dataclass(slots=True)
+class NotificationType(ObjectBase):
+    """
+    Contains detailed information about a notification
+
+    """
+
+    _type: "str" = field(default="NotificationType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class NotificationTypeNewMessage(NotificationType):
+    """
+    New message was received
+
+    :param message: The message
+    :param show_preview: True, if message content must be displayed in notifications
+    """
+
+    _type: "str" = field(default="notificationTypeNewMessage", init=False, repr=False)
+    message: "Message | None" = None
+    show_preview: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "message": self.message._to_json_dict() if self.message is not None else None,
+            "show_preview": self.show_preview,
+        }
+
+@dataclass(slots=True)
+class NotificationTypeNewSecretChat(NotificationType):
+    """
+    New secret chat was created
+
+    """
+
+    _type: "str" = field(default="notificationTypeNewSecretChat", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class NotificationTypeNewCall(NotificationType):
+    """
+    New call was received
+
+    :param call_id: Call identifier
+    """
+
+    _type: "str" = field(default="notificationTypeNewCall", init=False, repr=False)
+    call_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "call_id": self.call_id,
+        }
+
+@dataclass(slots=True)
+class NotificationTypeNewPushMessage(NotificationType):
+    """
+    New message was received through a push notification
+
+    :param message_id: The message identifier. The message will not be available in the chat history, but the identifier can be used in viewMessages, or as a message to be replied in the same chat
+    :param sender_id: Identifier of the sender of the message. Corresponding user or chat may be inaccessible
+    :param sender_name: Name of the sender
+    :param is_outgoing: True, if the message is outgoing
+    :param content: Push message content
+    """
+
+    _type: "str" = field(default="notificationTypeNewPushMessage", init=False, repr=False)
+    message_id: "int" = 0
+    sender_id: "MessageSender | None" = None
+    sender_name: "str" = ""
+    is_outgoing: "bool" = False
+    content: "PushMessageContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "message_id": self.message_id,
+            "sender_id": self.sender_id._to_json_dict() if self.sender_id is not None else None,
+            "sender_name": self.sender_name,
+            "is_outgoing": self.is_outgoing,
+            "content": self.content._to_json_dict() if self.content is not None else None,
+        }
+
+@dataclass(slots=True)
+class NotificationGroupType(ObjectBase):
+    """
+    Describes the type of notifications in a notification group
+
+    """
+
+    _type: "str" = field(default="NotificationGroupType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class NotificationGroupTypeMessages(NotificationGroupType):
+    """
+    A group containing notifications of type notificationTypeNewMessage and notificationTypeNewPushMessage with ordinary unread messages
+
+    """
+
+    _type: "str" = field(default="notificationGroupTypeMessages", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class NotificationGroupTypeMentions(NotificationGroupType):
+    """
+    A group containing notifications of type notificationTypeNewMessage and notificationTypeNewPushMessage with unread mentions of the current user, replies to their messages, or a pinned message
+
+    """
+
+    _type: "str" = field(default="notificationGroupTypeMentions", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class NotificationGroupTypeSecretChat(NotificationGroupType):
+    """
+    A group containing a notification of type notificationTypeNewSecretChat
+
+    """
+
+    _type: "str" = field(default="notificationGroupTypeSecretChat", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class NotificationGroupTypeCalls(NotificationGroupType):
+    """
+    A group containing notifications of type notificationTypeNewCall
+
+    """
+
+    _type: "str" = field(default="notificationGroupTypeCalls", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class NotificationSound(ObjectBase):
+    """
+    Describes a notification sound in MP3 format
+
+    :param id: Unique identifier of the notification sound
+    :param duration: Duration of the sound, in seconds
+    :param date: Point in time (Unix timestamp) when the sound was created
+    :param title: Title of the notification sound
+    :param data: Arbitrary data, defined while the sound was uploaded
+    :param sound: File containing the sound
+    """
+
+    _type: "str" = field(default="notificationSound", init=False, repr=False)
+    id: "int" = 0
+    duration: "int" = 0
+    date: "int" = 0
+    title: "str" = ""
+    data: "str" = ""
+    sound: "File | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "duration": self.duration,
+            "date": self.date,
+            "title": self.title,
+            "data": self.data,
+            "sound": self.sound._to_json_dict() if self.sound is not None else None,
+        }
+
+@dataclass(slots=True)
+class NotificationSounds(ObjectBase):
+    """
+    Contains a list of notification sounds
+
+    :param notification_sounds: A list of notification sounds
+    """
+
+    _type: "str" = field(default="notificationSounds", init=False, repr=False)
+    notification_sounds: "list[NotificationSound] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "notification_sounds": _list_to_json(self.notification_sounds),
+        }
+
+@dataclass(slots=True)
+class Notification(ObjectBase):
+    """
+    Contains information about a notification
+
+    :param id: Unique persistent identifier of this notification
+    :param date: Notification date
+    :param is_silent: True, if the notification was explicitly sent without sound
+    :param type: Notification type
+    """
+
+    _type: "str" = field(default="notification", init=False, repr=False)
+    id: "int" = 0
+    date: "int" = 0
+    is_silent: "bool" = False
+    type: "NotificationType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "date": self.date,
+            "is_silent": self.is_silent,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+@dataclass(slots=True)
+class NotificationGroup(ObjectBase):
+    """
+    Describes a group of notifications
+
+    :param id: Unique persistent auto-incremented from 1 identifier of the notification group
+    :param type: Type of the group
+    :param chat_id: Identifier of a chat to which all notifications in the group belong
+    :param total_count: Total number of active notifications in the group
+    :param notifications: The list of active notifications
+    """
+
+    _type: "str" = field(default="notificationGroup", init=False, repr=False)
+    id: "int" = 0
+    type: "NotificationGroupType | None" = None
+    chat_id: "int" = 0
+    total_count: "int" = 0
+    notifications: "list[Notification] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "chat_id": self.chat_id,
+            "total_count": self.total_count,
+            "notifications": _list_to_json(self.notifications),
+        }
+
+@dataclass(slots=True)
+class OptionValue(ObjectBase):
+    """
+    Represents the value of an option
+
+    """
+
+    _type: "str" = field(default="OptionValue", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class OptionValueBoolean(OptionValue):
+    """
+    Represents a boolean option
+
+    :param value: The value of the option
+    """
+
+    _type: "str" = field(default="optionValueBoolean", init=False, repr=False)
+    value: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "value": self.value,
+        }
+
+@dataclass(slots=True)
+class OptionValueEmpty(OptionValue):
+    """
+    Represents an unknown option or an option which has a default value
+
+    """
+
+    _type: "str" = field(default="optionValueEmpty", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class OptionValueInteger(OptionValue):
+    """
+    Represents an integer option
+
+    :param value: The value of the option
+    """
+
+    _type: "str" = field(default="optionValueInteger", init=False, repr=False)
+    value: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "value": self.value,
+        }
+
+@dataclass(slots=True)
+class OptionValueString(OptionValue):
+    """
+    Represents a string option
+
+    :param value: The value of the option
+    """
+
+    _type: "str" = field(default="optionValueString", init=False, repr=False)
+    value: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "value": self.value,
+        }
+
+@dataclass(slots=True)
+class JsonObjectMember(ObjectBase):
+    """
+    Represents one member of a JSON object
+
+    :param key: Member's key
+    :param value: Member's value
+    """
+
+    _type: "str" = field(default="jsonObjectMember", init=False, repr=False)
+    key: "str" = ""
+    value: "JsonValue | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "key": self.key,
+            "value": self.value._to_json_dict() if self.value is not None else None,
+        }
+
+@dataclass(slots=True)
+class JsonValue(ObjectBase):
+    """
+    Represents a JSON value
+
+    """
+
+    _type: "str" = field(default="JsonValue", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class JsonValueNull(JsonValue):
+    """
+    Represents a null JSON value
+
+    """
+
+    _type: "str" = field(default="jsonValueNull", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class JsonValueBoolean(JsonValue):
+    """
+    Represents a boolean JSON value
+
+    :param value: The value
+    """
+
+    _type: "str" = field(default="jsonValueBoolean", init=False, repr=False)
+    value: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "value": self.value,
+        }
+
+@dataclass(slots=True)
+class JsonValueNumber(JsonValue):
+    """
+    Represents a numeric JSON value
+
+    :param value: The value
+    """
+
+    _type: "str" = field(default="jsonValueNumber", init=False, repr=False)
+    value: "float" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "value": self.value,
+        }
+
+@dataclass(slots=True)
+class JsonValueString(JsonValue):
+    """
+    Represents a string JSON value
+
+    :param value: The value
+    """
+
+    _type: "str" = field(default="jsonValueString", init=False, repr=False)
+    value: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "value": self.value,
+        }
+
+@dataclass(slots=True)
+class JsonValueArray(JsonValue):
+    """
+    Represents a JSON array
+
+    :param values: The list of array elements
+    """
+
+    _type: "str" = field(default="jsonValueArray", init=False, repr=False)
+    values: "list[JsonValue] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "values": _list_to_json(self.values),
+        }
+
+@dataclass(slots=True)
+class JsonValueObject(JsonValue):
+    """
+    Represents a JSON object
+
+    :param members: The list of object members
+    """
+
+    _type: "str" = field(default="jsonValueObject", init=False, repr=False)
+    members: "list[JsonObjectMember] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "members": _list_to_json(self.members),
+        }
+
+@dataclass(slots=True)
+class StoryPrivacySettings(ObjectBase):
+    """
+    Describes privacy settings of a story
+
+    """
+
+    _type: "str" = field(default="StoryPrivacySettings", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StoryPrivacySettingsEveryone(StoryPrivacySettings):
+    """
+    The story can be viewed by everyone
+
+    :param except_user_ids: Identifiers of the users that can't see the story; always unknown and empty for non-owned stories
+    """
+
+    _type: "str" = field(default="storyPrivacySettingsEveryone", init=False, repr=False)
+    except_user_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "except_user_ids": self.except_user_ids,
+        }
+
+@dataclass(slots=True)
+class StoryPrivacySettingsContacts(StoryPrivacySettings):
+    """
+    The story can be viewed by all contacts except chosen users
+
+    :param except_user_ids: User identifiers of the contacts that can't see the story; always unknown and empty for non-owned stories
+    """
+
+    _type: "str" = field(default="storyPrivacySettingsContacts", init=False, repr=False)
+    except_user_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "except_user_ids": self.except_user_ids,
+        }
+
+@dataclass(slots=True)
+class StoryPrivacySettingsCloseFriends(StoryPrivacySettings):
+    """
+    The story can be viewed by all close friends
+
+    """
+
+    _type: "str" = field(default="storyPrivacySettingsCloseFriends", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StoryPrivacySettingsSelectedUsers(StoryPrivacySettings):
+    """
+    The story can be viewed by certain specified users
+
+    :param user_ids: Identifiers of the users; always unknown and empty for non-owned stories
+    """
+
+    _type: "str" = field(default="storyPrivacySettingsSelectedUsers", init=False, repr=False)
+    user_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_ids": self.user_ids,
+        }
+
+@dataclass(slots=True)
+class UserPrivacySettingRule(ObjectBase):
+    """
+    Represents a single rule for managing user privacy settings
+
+    """
+
+    _type: "str" = field(default="UserPrivacySettingRule", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UserPrivacySettingRuleAllowAll(UserPrivacySettingRule):
+    """
+    A rule to allow all users to do something
+
+    """
+
+    _type: "str" = field(default="userPrivacySettingRuleAllowAll", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UserPrivacySettingRuleAllowContacts(UserPrivacySettingRule):
+    """
+    A rule to allow all contacts of the user to do something
+
+    """
+
+    _type: "str" = field(default="userPrivacySettingRuleAllowContacts", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UserPrivacySettingRuleAllowBots(UserPrivacySettingRule):
+    """
+    A rule to allow all bots to do something
+
+    """
+
+    _type: "str" = field(default="userPrivacySettingRuleAllowBots", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UserPrivacySettingRuleAllowPremiumUsers(UserPrivacySettingRule):
+    """
+    A rule to allow all Premium Users to do something; currently, allowed only for userPrivacySettingAllowChatInvites
+
+    """
+
+    _type: "str" = field(default="userPrivacySettingRuleAllowPremiumUsers", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UserPrivacySettingRuleAllowUsers(UserPrivacySettingRule):
+    """
+    A rule to allow certain specified users to do something
+
+    :param user_ids: The user identifiers, total number of users in all rules must not exceed 1000
+    """
+
+    _type: "str" = field(default="userPrivacySettingRuleAllowUsers", init=False, repr=False)
+    user_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_ids": self.user_ids,
+        }
+
+@dataclass(slots=True)
+class UserPrivacySettingRuleAllowChatMembers(UserPrivacySettingRule):
+    """
+    A rule to allow all members of certain specified basic groups and supergroups to doing something
+
+    :param chat_ids: The chat identifiers, total number of chats in all rules must not exceed 20
+    """
+
+    _type: "str" = field(default="userPrivacySettingRuleAllowChatMembers", init=False, repr=False)
+    chat_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_ids": self.chat_ids,
+        }
+
+@dataclass(slots=True)
+class UserPrivacySettingRuleRestrictAll(UserPrivacySettingRule):
+    """
+    A rule to restrict all users from doing something
+
+    """
+
+    _type: "str" = field(default="userPrivacySettingRuleRestrictAll", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UserPrivacySettingRuleRestrictContacts(UserPrivacySettingRule):
+    """
+    A rule to restrict all contacts of the user from doing something
+
+    """
+
+    _type: "str" = field(default="userPrivacySettingRuleRestrictContacts", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UserPrivacySettingRuleRestrictBots(UserPrivacySettingRule):
+    """
+    A rule to restrict all bots from doing something
+
+    """
+
+    _type: "str" = field(default="userPrivacySettingRuleRestrictBots", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UserPrivacySettingRuleRestrictUsers(UserPrivacySettingRule):
+    """
+    A rule to restrict all specified users from doing something
+
+    :param user_ids: The user identifiers, total number of users in all rules must not exceed 1000
+    """
+
+    _type: "str" = field(default="userPrivacySettingRuleRestrictUsers", init=False, repr=False)
+    user_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_ids": self.user_ids,
+        }
+
+@dataclass(slots=True)
+class UserPrivacySettingRuleRestrictChatMembers(UserPrivacySettingRule):
+    """
+    A rule to restrict all members of specified basic groups and supergroups from doing something
+
+    :param chat_ids: The chat identifiers, total number of chats in all rules must not exceed 20
+    """
+
+    _type: "str" = field(default="userPrivacySettingRuleRestrictChatMembers", init=False, repr=False)
+    chat_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_ids": self.chat_ids,
+        }
+
+@dataclass(slots=True)
+class UserPrivacySettingRules(ObjectBase):
+    """
+    A list of privacy rules. Rules are matched in the specified order. The first matched rule defines the privacy setting for a given user. If no rule matches, the action is not allowed
+
+    :param rules: A list of rules
+    """
+
+    _type: "str" = field(default="userPrivacySettingRules", init=False, repr=False)
+    rules: "list[UserPrivacySettingRule] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "rules": _list_to_json(self.rules),
+        }
+
+@dataclass(slots=True)
+class UserPrivacySetting(ObjectBase):
+    """
+    Describes available user privacy settings
+
+    """
+
+    _type: "str" = field(default="UserPrivacySetting", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UserPrivacySettingShowStatus(UserPrivacySetting):
+    """
+    A privacy setting for managing whether the user's online status is visible
+
+    """
+
+    _type: "str" = field(default="userPrivacySettingShowStatus", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UserPrivacySettingShowProfilePhoto(UserPrivacySetting):
+    """
+    A privacy setting for managing whether the user's profile photo is visible
+
+    """
+
+    _type: "str" = field(default="userPrivacySettingShowProfilePhoto", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UserPrivacySettingShowLinkInForwardedMessages(UserPrivacySetting):
+    """
+    A privacy setting for managing whether a link to the user's account is included in forwarded messages
+
+    """
+
+    _type: "str" = field(default="userPrivacySettingShowLinkInForwardedMessages", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UserPrivacySettingShowPhoneNumber(UserPrivacySetting):
+    """
+    A privacy setting for managing whether the user's phone number is visible
+
+    """
+
+    _type: "str" = field(default="userPrivacySettingShowPhoneNumber", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UserPrivacySettingShowBio(UserPrivacySetting):
+    """
+    A privacy setting for managing whether the user's bio is visible
+
+    """
+
+    _type: "str" = field(default="userPrivacySettingShowBio", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UserPrivacySettingShowBirthdate(UserPrivacySetting):
+    """
+    A privacy setting for managing whether the user's birthdate is visible
+
+    """
+
+    _type: "str" = field(default="userPrivacySettingShowBirthdate", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UserPrivacySettingAllowChatInvites(UserPrivacySetting):
+    """
+    A privacy setting for managing whether the user can be invited to chats
+
+    """
+
+    _type: "str" = field(default="userPrivacySettingAllowChatInvites", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UserPrivacySettingAllowCalls(UserPrivacySetting):
+    """
+    A privacy setting for managing whether the user can be called
+
+    """
+
+    _type: "str" = field(default="userPrivacySettingAllowCalls", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UserPrivacySettingAllowPeerToPeerCalls(UserPrivacySetting):
+    """
+    A privacy setting for managing whether peer-to-peer connections can be used for calls
+
+    """
+
+    _type: "str" = field(default="userPrivacySettingAllowPeerToPeerCalls", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UserPrivacySettingAllowFindingByPhoneNumber(UserPrivacySetting):
+    """
+    A privacy setting for managing whether the user can be found by their phone number. Checked only if the phone number is not known to the other user. Can be set only to "Allow contacts" or "Allow all"
+
+    """
+
+    _type: "str" = field(default="userPrivacySettingAllowFindingByPhoneNumber", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UserPrivacySettingAllowPrivateVoiceAndVideoNoteMessages(UserPrivacySetting):
+    """
+    A privacy setting for managing whether the user can receive voice and video messages in private chats; for Telegram Premium users only
+
+    """
+
+    _type: "str" = field(default="userPrivacySettingAllowPrivateVoiceAndVideoNoteMessages", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UserPrivacySettingAutosaveGifts(UserPrivacySetting):
+    """
+    A privacy setting for managing whether received gifts are automatically shown on the user's profile page
+
+    """
+
+    _type: "str" = field(default="userPrivacySettingAutosaveGifts", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class UserPrivacySettingAllowUnpaidMessages(UserPrivacySetting):
+    """
+    A privacy setting for managing whether the user can receive messages without additional payment
+
+    """
+
+    _type: "str" = field(default="userPrivacySettingAllowUnpaidMessages", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReadDatePrivacySettings(ObjectBase):
+    """
+    Contains privacy settings for message read date in private chats. Read dates are always shown to the users that can see online status of the current user regardless of this setting
+
+    :param show_read_date: True, if message read date is shown to other users in private chats. If false and the current user isn't a Telegram Premium user, then they will not be able to see other's message read date
+    """
+
+    _type: "str" = field(default="readDatePrivacySettings", init=False, repr=False)
+    show_read_date: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "show_read_date": self.show_read_date,
+        }
+
+@dataclass(slots=True)
+class NewChatPrivacySettings(ObjectBase):
+    """
+    Contains privacy settings for chats with non-contacts
+
+    :param allow_new_chats_from_unknown_users: True, if non-contacts users are able to write first to the current user. Telegram Premium subscribers are able to write first regardless of this setting
+    :param incoming_paid_message_star_count: Number of Telegram Stars that must be paid for every incoming private message by non-contacts; 0-getOption("paid_message_star_count_max").
+     If positive, then allow_new_chats_from_unknown_users must be true. The current user will receive getOption("paid_message_earnings_per_mille") Telegram Stars for each 1000 Telegram Stars paid for message sending.
+     Can be positive, only if getOption("can_enable_paid_messages") is true
+    """
+
+    _type: "str" = field(default="newChatPrivacySettings", init=False, repr=False)
+    allow_new_chats_from_unknown_users: "bool" = False
+    incoming_paid_message_star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "allow_new_chats_from_unknown_users": self.allow_new_chats_from_unknown_users,
+            "incoming_paid_message_star_count": self.incoming_paid_message_star_count,
+        }
+
+@dataclass(slots=True)
+class CanSendMessageToUserResult(ObjectBase):
+    """
+    Describes result of canSendMessageToUser
+
+    """
+
+    _type: "str" = field(default="CanSendMessageToUserResult", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CanSendMessageToUserResultOk(CanSendMessageToUserResult):
+    """
+    The user can be messaged
+
+    """
+
+    _type: "str" = field(default="canSendMessageToUserResultOk", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CanSendMessageToUserResultUserHasPaidMessages(CanSendMessageToUserResult):
+    """
+    The user can be messaged, but the messages are paid
+
+    :param outgoing_paid_message_star_count: Number of Telegram Stars that must be paid by the current user for each sent message to the user
+    """
+
+    _type: "str" = field(default="canSendMessageToUserResultUserHasPaidMessages", init=False, repr=False)
+    outgoing_paid_message_star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "outgoing_paid_message_star_count": self.outgoing_paid_message_star_count,
+        }
+
+@dataclass(slots=True)
+class CanSendMessageToUserResultUserIsDeleted(CanSendMessageToUserResult):
+    """
+    The user can't be messaged, because they are deleted or unknown
+
+    """
+
+    _type: "str" = field(default="canSendMessageToUserResultUserIsDeleted", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class CanSendMessageToUserResultUserRestrictsNewChats(CanSendMessageToUserResult):
+    """
+    The user can't be messaged, because they restrict new chats with non-contacts
+
+    """
+
+    _type: "str" = field(default="canSendMessageToUserResultUserRestrictsNewChats", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
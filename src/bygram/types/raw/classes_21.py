@@ -0,0 +1,1709 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import FormattedText
+    from .classes_02 import ChatAdministratorRights
+    from .classes_06 import ReportOption
+    from .classes_08 import WebAppOpenMode
+    from .classes_16 import TargetChat
+    from .classes_23 import ProxyType
+
+@dataclass(slots=True)
+class AccountTtl(ObjectBase):
+    """
+    Contains information about the period of inactivity after which the current user's account will automatically be deleted
+
+    :param days: Number of days of inactivity before the account will be flagged for deletion; 30-730 days
+    """
+
+    _type: "str" = field(default="accountTtl", init=False, repr=False)
+    days: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "days": self.days,
+        }
+
+@dataclass(slots=True)
+class MessageAutoDeleteTime(ObjectBase):
+    """
+    Contains default auto-delete timer setting for new chats
+
+    :param time: Message auto-delete time, in seconds. If 0, then messages aren't deleted automatically
+    """
+
+    _type: "str" = field(default="messageAutoDeleteTime", init=False, repr=False)
+    time: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "time": self.time,
+        }
+
+@dataclass(slots=True)
+class SessionType(ObjectBase):
+    """
+    Represents the type of session
+
+    """
+
+    _type: "str" = field(default="SessionType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SessionTypeAndroid(SessionType):
+    """
+    The session is running on an Android device
+
+    """
+
+    _type: "str" = field(default="sessionTypeAndroid", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SessionTypeApple(SessionType):
+    """
+    The session is running on a generic Apple device
+
+    """
+
+    _type: "str" = field(default="sessionTypeApple", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SessionTypeBrave(SessionType):
+    """
+    The session is running on the Brave browser
+
+    """
+
+    _type: "str" = field(default="sessionTypeBrave", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SessionTypeChrome(SessionType):
+    """
+    The session is running on the Chrome browser
+
+    """
+
+    _type: "str" = field(default="sessionTypeChrome", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SessionTypeEdge(SessionType):
+    """
+    The session is running on the Edge browser
+
+    """
+
+    _type: "str" = field(default="sessionTypeEdge", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SessionTypeFirefox(SessionType):
+    """
+    The session is running on the Firefox browser
+
+    """
+
+    _type: "str" = field(default="sessionTypeFirefox", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SessionTypeIpad(SessionType):
+    """
+    The session is running on an iPad device
+
+    """
+
+    _type: "str" = field(default="sessionTypeIpad", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SessionTypeIphone(SessionType):
+    """
+    The session is running on an iPhone device
+
+    """
+
+    _type: "str" = field(default="sessionTypeIphone", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SessionTypeLinux(SessionType):
+    """
+    The session is running on a Linux device
+
+    """
+
+    _type: "str" = field(default="sessionTypeLinux", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SessionTypeMac(SessionType):
+    """
+    The session is running on a Mac device
+
+    """
+
+    _type: "str" = field(default="sessionTypeMac", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SessionTypeOpera(SessionType):
+    """
+    The session is running on the Opera browser
+
+    """
+
+    _type: "str" = field(default="sessionTypeOpera", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SessionTypeSafari(SessionType):
+    """
+    The session is running on the Safari browser
+
+    """
+
+    _type: "str" = field(default="sessionTypeSafari", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SessionTypeUbuntu(SessionType):
+    """
+    The session is running on an Ubuntu device
+
+    """
+
+    _type: "str" = field(default="sessionTypeUbuntu", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SessionTypeUnknown(SessionType):
+    """
+    The session is running on an unknown type of device
+
+    """
+
+    _type: "str" = field(default="sessionTypeUnknown", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SessionTypeVivaldi(SessionType):
+    """
+    The session is running on the Vivaldi browser
+
+    """
+
+    _type: "str" = field(default="sessionTypeVivaldi", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SessionTypeWindows(SessionType):
+    """
+    The session is running on a Windows device
+
+    """
+
+    _type: "str" = field(default="sessionTypeWindows", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SessionTypeXbox(SessionType):
+    """
+    The session is running on an Xbox console
+
+    """
+
+    _type: "str" = field(default="sessionTypeXbox", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class Session(ObjectBase):
+    """
+    Contains information about one session in a Telegram application used by the current user. Sessions must be shown to the user in the returned order
+
+    :param id: Session identifier
+    :param is_current: True, if this session is the current session
+    :param is_password_pending: True, if a 2-step verification password is needed to complete authorization of the session
+    :param is_unconfirmed: True, if the session wasn't confirmed from another session
+    :param can_accept_secret_chats: True, if incoming secret chats can be accepted by the session
+    :param can_accept_calls: True, if incoming calls can be accepted by the session
+    :param type: Session type based on the system and application version, which can be used to display a corresponding icon
+    :param api_id: Telegram API identifier, as provided by the application
+    :param application_name: Name of the application, as provided by the application
+    :param application_version: The version of the application, as provided by the application
+    :param is_official_application: True, if the application is an official application or uses the api_id of an official application
+    :param device_model: Model of the device the application has been run or is running on, as provided by the application
+    :param platform: Operating system the application has been run or is running on, as provided by the application
+    :param system_version: Version of the operating system the application has been run or is running on, as provided by the application
+    :param log_in_date: Point in time (Unix timestamp) when the user has logged in
+    :param last_active_date: Point in time (Unix timestamp) when the session was last used
+    :param ip_address: IP address from which the session was created, in human-readable format
+    :param location: A human-readable description of the location from which the session was created, based on the IP address
+    """
+
+    _type: "str" = field(default="session", init=False, repr=False)
+    id: "int" = 0
+    is_current: "bool" = False
+    is_password_pending: "bool" = False
+    is_unconfirmed: "bool" = False
+    can_accept_secret_chats: "bool" = False
+    can_accept_calls: "bool" = False
+    type: "SessionType | None" = None
+    api_id: "int" = 0
+    application_name: "str" = ""
+    application_version: "str" = ""
+    is_official_application: "bool" = False
+    device_model: "str" = ""
+    platform: "str" = ""
+    system_version: "str" = ""
+    log_in_date: "int" = 0
+    last_active_date: "int" = 0
+    ip_address: "str" = ""
+    location: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "is_current": self.is_current,
+            "is_password_pending": self.is_password_pending,
+            "is_unconfirmed": self.is_unconfirmed,
+            "can_accept_secret_chats": self.can_accept_secret_chats,
+            "can_accept_calls": self.can_accept_calls,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "api_id": self.api_id,
+            "application_name": self.application_name,
+            "application_version": self.application_version,
+            "is_official_application": self.is_official_application,
+            "device_model": self.device_model,
+            "platform": self.platform,
+            "system_version": self.system_version,
+            "log_in_date": self.log_in_date,
+            "last_active_date": self.last_active_date,
+            "ip_address": self.ip_address,
+            "location": self.location,
+        }
+
+@dataclass(slots=True)
+class Sessions(ObjectBase):
+    """
+    Contains a list of sessions
+
+    :param sessions: List of sessions
+    :param inactive_session_ttl_days: Number of days of inactivity before sessions will automatically be terminated; 1-366 days
+    """
+
+    _type: "str" = field(default="sessions", init=False, repr=False)
+    sessions: "list[Session] | None" = None
+    inactive_session_ttl_days: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sessions": _list_to_json(self.sessions),
+            "inactive_session_ttl_days": self.inactive_session_ttl_days,
+        }
+
+@dataclass(slots=True)
+class UnconfirmedSession(ObjectBase):
+    """
+    Contains information about an unconfirmed session
+
+    :param id: Session identifier
+    :param log_in_date: Point in time (Unix timestamp) when the user has logged in
+    :param device_model: Model of the device that was used for the session creation, as provided by the application
+    :param location: A human-readable description of the location from which the session was created, based on the IP address
+    """
+
+    _type: "str" = field(default="unconfirmedSession", init=False, repr=False)
+    id: "int" = 0
+    log_in_date: "int" = 0
+    device_model: "str" = ""
+    location: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "log_in_date": self.log_in_date,
+            "device_model": self.device_model,
+            "location": self.location,
+        }
+
+@dataclass(slots=True)
+class ConnectedWebsite(ObjectBase):
+    """
+    Contains information about one website the current user is logged in with Telegram
+
+    :param id: Website identifier
+    :param domain_name: The domain name of the website
+    :param bot_user_id: User identifier of a bot linked with the website
+    :param browser: The version of a browser used to log in
+    :param platform: Operating system the browser is running on
+    :param log_in_date: Point in time (Unix timestamp) when the user was logged in
+    :param last_active_date: Point in time (Unix timestamp) when obtained authorization was last used
+    :param ip_address: IP address from which the user was logged in, in human-readable format
+    :param location: Human-readable description of a country and a region from which the user was logged in, based on the IP address
+    """
+
+    _type: "str" = field(default="connectedWebsite", init=False, repr=False)
+    id: "int" = 0
+    domain_name: "str" = ""
+    bot_user_id: "int" = 0
+    browser: "str" = ""
+    platform: "str" = ""
+    log_in_date: "int" = 0
+    last_active_date: "int" = 0
+    ip_address: "str" = ""
+    location: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "domain_name": self.domain_name,
+            "bot_user_id": self.bot_user_id,
+            "browser": self.browser,
+            "platform": self.platform,
+            "log_in_date": self.log_in_date,
+            "last_active_date": self.last_active_date,
+            "ip_address": self.ip_address,
+            "location": self.location,
+        }
+
+@dataclass(slots=True)
+class ConnectedWebsites(ObjectBase):
+    """
+    Contains a list of websites the current user is logged in with Telegram
+
+    :param websites: List of connected websites
+    """
+
+    _type: "str" = field(default="connectedWebsites", init=False, repr=False)
+    websites: "list[ConnectedWebsite] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "websites": _list_to_json(self.websites),
+        }
+
+@dataclass(slots=True)
+class ReportReason(ObjectBase):
+    """
+    Describes the reason why a chat is reported
+
+    """
+
+    _type: "str" = field(default="ReportReason", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReportReasonSpam(ReportReason):
+    """
+    The chat contains spam messages
+
+    """
+
+    _type: "str" = field(default="reportReasonSpam", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReportReasonViolence(ReportReason):
+    """
+    The chat promotes violence
+
+    """
+
+    _type: "str" = field(default="reportReasonViolence", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReportReasonPornography(ReportReason):
+    """
+    The chat contains pornographic messages
+
+    """
+
+    _type: "str" = field(default="reportReasonPornography", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReportReasonChildAbuse(ReportReason):
+    """
+    The chat has child abuse related content
+
+    """
+
+    _type: "str" = field(default="reportReasonChildAbuse", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReportReasonCopyright(ReportReason):
+    """
+    The chat contains copyrighted content
+
+    """
+
+    _type: "str" = field(default="reportReasonCopyright", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReportReasonUnrelatedLocation(ReportReason):
+    """
+    The location-based chat is unrelated to its stated location
+
+    """
+
+    _type: "str" = field(default="reportReasonUnrelatedLocation", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReportReasonFake(ReportReason):
+    """
+    The chat represents a fake account
+
+    """
+
+    _type: "str" = field(default="reportReasonFake", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReportReasonIllegalDrugs(ReportReason):
+    """
+    The chat has illegal drugs related content
+
+    """
+
+    _type: "str" = field(default="reportReasonIllegalDrugs", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReportReasonPersonalDetails(ReportReason):
+    """
+    The chat contains messages with personal details
+
+    """
+
+    _type: "str" = field(default="reportReasonPersonalDetails", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReportReasonCustom(ReportReason):
+    """
+    A custom reason provided by the user
+
+    """
+
+    _type: "str" = field(default="reportReasonCustom", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReportChatResult(ObjectBase):
+    """
+    Describes result of chat report
+
+    """
+
+    _type: "str" = field(default="ReportChatResult", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReportChatResultOk(ReportChatResult):
+    """
+    The chat was reported successfully
+
+    """
+
+    _type: "str" = field(default="reportChatResultOk", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReportChatResultOptionRequired(ReportChatResult):
+    """
+    The user must choose an option to report the chat and repeat request with the chosen option
+
+    :param title: Title for the option choice
+    :param options: List of available options
+    """
+
+    _type: "str" = field(default="reportChatResultOptionRequired", init=False, repr=False)
+    title: "str" = ""
+    options: "list[ReportOption] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "title": self.title,
+            "options": _list_to_json(self.options),
+        }
+
+@dataclass(slots=True)
+class ReportChatResultTextRequired(ReportChatResult):
+    """
+    The user must add additional text details to the report
+
+    :param option_id: Option identifier for the next reportChat request
+    :param is_optional: True, if the user can skip text adding
+    """
+
+    _type: "str" = field(default="reportChatResultTextRequired", init=False, repr=False)
+    option_id: "bytes" = b""
+    is_optional: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "option_id": _bytes_to_json(self.option_id),
+            "is_optional": self.is_optional,
+        }
+
+@dataclass(slots=True)
+class ReportChatResultMessagesRequired(ReportChatResult):
+    """
+    The user must choose messages to report and repeat the reportChat request with the chosen messages
+
+    """
+
+    _type: "str" = field(default="reportChatResultMessagesRequired", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReportStoryResult(ObjectBase):
+    """
+    Describes result of story report
+
+    """
+
+    _type: "str" = field(default="ReportStoryResult", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReportStoryResultOk(ReportStoryResult):
+    """
+    The story was reported successfully
+
+    """
+
+    _type: "str" = field(default="reportStoryResultOk", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ReportStoryResultOptionRequired(ReportStoryResult):
+    """
+    The user must choose an option to report the story and repeat request with the chosen option
+
+    :param title: Title for the option choice
+    :param options: List of available options
+    """
+
+    _type: "str" = field(default="reportStoryResultOptionRequired", init=False, repr=False)
+    title: "str" = ""
+    options: "list[ReportOption] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "title": self.title,
+            "options": _list_to_json(self.options),
+        }
+
+@dataclass(slots=True)
+class ReportStoryResultTextRequired(ReportStoryResult):
+    """
+    The user must add additional text details to the report
+
+    :param option_id: Option identifier for the next reportStory request
+    :param is_optional: True, if the user can skip text adding
+    """
+
+    _type: "str" = field(default="reportStoryResultTextRequired", init=False, repr=False)
+    option_id: "bytes" = b""
+    is_optional: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "option_id": _bytes_to_json(self.option_id),
+            "is_optional": self.is_optional,
+        }
+
+@dataclass(slots=True)
+class InternalLinkType(ObjectBase):
+    """
+    Describes an internal https://t.me or tg: link, which must be processed by the application in a special way
+
+    """
+
+    _type: "str" = field(default="InternalLinkType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeActiveSessions(InternalLinkType):
+    """
+    The link is a link to the Devices section of the application. Use getActiveSessions to get the list of active sessions and show them to the user
+
+    """
+
+    _type: "str" = field(default="internalLinkTypeActiveSessions", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeAttachmentMenuBot(InternalLinkType):
+    """
+    The link is a link to an attachment menu bot to be opened in the specified or a chosen chat. Process given target_chat to open the chat. Then, call searchPublicChat with the given bot username, check that the user is a bot and can be added to attachment menu. Then, use getAttachmentMenuBot to receive information about the bot.
+     If the bot isn't added to attachment menu, then show a disclaimer about Mini Apps being third-party applications, ask the user to accept their Terms of service and confirm adding the bot to side and attachment menu.
+     If the user accept the terms and confirms adding, then use toggleBotIsAddedToAttachmentMenu to add the bot.
+     If the attachment menu bot can't be used in the opened chat, show an error to the user. If the bot is added to attachment menu and can be used in the chat, then use openWebApp with the given URL
+
+    :param target_chat: Target chat to be opened
+    :param bot_username: Username of the bot
+    :param url: URL to be passed to openWebApp
+    """
+
+    _type: "str" = field(default="internalLinkTypeAttachmentMenuBot", init=False, repr=False)
+    target_chat: "TargetChat | None" = None
+    bot_username: "str" = ""
+    url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "target_chat": self.target_chat._to_json_dict() if self.target_chat is not None else None,
+            "bot_username": self.bot_username,
+            "url": self.url,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeAuthenticationCode(InternalLinkType):
+    """
+    The link contains an authentication code. Call checkAuthenticationCode with the code if the current authorization state is authorizationStateWaitCode
+
+    :param code: The authentication code
+    """
+
+    _type: "str" = field(default="internalLinkTypeAuthenticationCode", init=False, repr=False)
+    code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "code": self.code,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeBackground(InternalLinkType):
+    """
+    The link is a link to a background. Call searchBackground with the given background name to process the link. If background is found and the user wants to apply it, then call setDefaultBackground
+
+    :param background_name: Name of the background
+    """
+
+    _type: "str" = field(default="internalLinkTypeBackground", init=False, repr=False)
+    background_name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "background_name": self.background_name,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeBotAddToChannel(InternalLinkType):
+    """
+    The link is a link to a Telegram bot, which is expected to be added to a channel chat as an administrator. Call searchPublicChat with the given bot username and check that the user is a bot, ask the current user to select a channel chat to add the bot to as an administrator. Then, call getChatMember to receive the current bot rights in the chat and if the bot already is an administrator,
+     check that the current user can edit its administrator rights and combine received rights with the requested administrator rights. Then, show confirmation box to the user, and call setChatMemberStatus with the chosen chat and confirmed rights
+
+    :param bot_username: Username of the bot
+    :param administrator_rights: Expected administrator rights for the bot
+    """
+
+    _type: "str" = field(default="internalLinkTypeBotAddToChannel", init=False, repr=False)
+    bot_username: "str" = ""
+    administrator_rights: "ChatAdministratorRights | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_username": self.bot_username,
+            "administrator_rights": self.administrator_rights._to_json_dict() if self.administrator_rights is not None else None,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeBotStart(InternalLinkType):
+    """
+    The link is a link to a chat with a Telegram bot. Call searchPublicChat with the given bot username, check that the user is a bot, show START button in the chat with the bot, and then call sendBotStartMessage with the given start parameter after the button is pressed
+
+    :param bot_username: Username of the bot
+    :param start_parameter: The parameter to be passed to sendBotStartMessage
+    :param autostart: True, if sendBotStartMessage must be called automatically without showing the START button
+    """
+
+    _type: "str" = field(default="internalLinkTypeBotStart", init=False, repr=False)
+    bot_username: "str" = ""
+    start_parameter: "str" = ""
+    autostart: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_username": self.bot_username,
+            "start_parameter": self.start_parameter,
+            "autostart": self.autostart,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeBotStartInGroup(InternalLinkType):
+    """
+    The link is a link to a Telegram bot, which is expected to be added to a group chat. Call searchPublicChat with the given bot username, check that the user is a bot and can be added to groups, ask the current user to select a basic group or a supergroup chat to add the bot to, taking into account that bots can be added to a public supergroup only by administrators of the supergroup.
+     If administrator rights are provided by the link, call getChatMember to receive the current bot rights in the chat and if the bot already is an administrator,
+     check that the current user can edit its administrator rights, combine received rights with the requested administrator rights, show confirmation box to the user,
+     and call setChatMemberStatus with the chosen chat and confirmed administrator rights. Before call to setChatMemberStatus it may be required to upgrade the chosen basic group chat to a supergroup chat.
+     Then, if start_parameter isn't empty, call sendBotStartMessage with the given start parameter and the chosen chat; otherwise, just send /start message with bot's username added to the chat
+
+    :param bot_username: Username of the bot
+    :param start_parameter: The parameter to be passed to sendBotStartMessage
+    :param administrator_rights: Expected administrator rights for the bot; may be null
+    """
+
+    _type: "str" = field(default="internalLinkTypeBotStartInGroup", init=False, repr=False)
+    bot_username: "str" = ""
+    start_parameter: "str" = ""
+    administrator_rights: "ChatAdministratorRights | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_username": self.bot_username,
+            "start_parameter": self.start_parameter,
+            "administrator_rights": self.administrator_rights._to_json_dict() if self.administrator_rights is not None else None,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeBusinessChat(InternalLinkType):
+    """
+    The link is a link to a business chat. Use getBusinessChatLinkInfo with the provided link name to get information about the link, then open received private chat and replace chat draft with the provided text
+
+    :param link_name: Name of the link
+    """
+
+    _type: "str" = field(default="internalLinkTypeBusinessChat", init=False, repr=False)
+    link_name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "link_name": self.link_name,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeBuyStars(InternalLinkType):
+    """
+    The link is a link to the Telegram Star purchase section of the application
+
+    :param star_count: The number of Telegram Stars that must be owned by the user
+    :param purpose: Purpose of Telegram Star purchase. Arbitrary string specified by the server, for example, "subs" if the Telegram Stars are required to extend channel subscriptions
+    """
+
+    _type: "str" = field(default="internalLinkTypeBuyStars", init=False, repr=False)
+    star_count: "int" = 0
+    purpose: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "star_count": self.star_count,
+            "purpose": self.purpose,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeChangePhoneNumber(InternalLinkType):
+    """
+    The link is a link to the change phone number section of the application
+
+    """
+
+    _type: "str" = field(default="internalLinkTypeChangePhoneNumber", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeChatAffiliateProgram(InternalLinkType):
+    """
+    The link is an affiliate program link. Call searchChatAffiliateProgram with the given username and referrer to process the link
+
+    :param username: Username to be passed to searchChatAffiliateProgram
+    :param referrer: Referrer to be passed to searchChatAffiliateProgram
+    """
+
+    _type: "str" = field(default="internalLinkTypeChatAffiliateProgram", init=False, repr=False)
+    username: "str" = ""
+    referrer: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "username": self.username,
+            "referrer": self.referrer,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeChatBoost(InternalLinkType):
+    """
+    The link is a link to boost a Telegram chat. Call getChatBoostLinkInfo with the given URL to process the link. If the chat is found, then call getChatBoostStatus and getAvailableChatBoostSlots to get the current boost status and check whether the chat can be boosted.
+     If the user wants to boost the chat and the chat can be boosted, then call boostChat
+
+    :param url: URL to be passed to getChatBoostLinkInfo
+    """
+
+    _type: "str" = field(default="internalLinkTypeChatBoost", init=False, repr=False)
+    url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeChatFolderInvite(InternalLinkType):
+    """
+    The link is an invite link to a chat folder. Call checkChatFolderInviteLink with the given invite link to process the link. If the link is valid and the user wants to join the chat folder, then call addChatFolderByInviteLink
+
+    :param invite_link: Internal representation of the invite link
+    """
+
+    _type: "str" = field(default="internalLinkTypeChatFolderInvite", init=False, repr=False)
+    invite_link: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "invite_link": self.invite_link,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeChatFolderSettings(InternalLinkType):
+    """
+    The link is a link to the folder section of the application settings
+
+    """
+
+    _type: "str" = field(default="internalLinkTypeChatFolderSettings", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeChatInvite(InternalLinkType):
+    """
+    The link is a chat invite link. Call checkChatInviteLink with the given invite link to process the link. If the link is valid and the user wants to join the chat, then call joinChatByInviteLink
+
+    :param invite_link: Internal representation of the invite link
+    """
+
+    _type: "str" = field(default="internalLinkTypeChatInvite", init=False, repr=False)
+    invite_link: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "invite_link": self.invite_link,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeDefaultMessageAutoDeleteTimerSettings(InternalLinkType):
+    """
+    The link is a link to the default message auto-delete timer settings section of the application settings
+
+    """
+
+    _type: "str" = field(default="internalLinkTypeDefaultMessageAutoDeleteTimerSettings", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeEditProfileSettings(InternalLinkType):
+    """
+    The link is a link to the edit profile section of the application settings
+
+    """
+
+    _type: "str" = field(default="internalLinkTypeEditProfileSettings", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeGame(InternalLinkType):
+    """
+    The link is a link to a game. Call searchPublicChat with the given bot username, check that the user is a bot, ask the current user to select a chat to send the game, and then call sendMessage with inputMessageGame
+
+    :param bot_username: Username of the bot that owns the game
+    :param game_short_name: Short name of the game
+    """
+
+    _type: "str" = field(default="internalLinkTypeGame", init=False, repr=False)
+    bot_username: "str" = ""
+    game_short_name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_username": self.bot_username,
+            "game_short_name": self.game_short_name,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeGroupCall(InternalLinkType):
+    """
+    The link is a link to a group call that isn't bound to a chat. Use getGroupCallParticipants to get the list of group call participants and show them on the join group call screen. Call joinGroupCall with the given invite_link to join the call
+
+    :param invite_link: Internal representation of the invite link
+    """
+
+    _type: "str" = field(default="internalLinkTypeGroupCall", init=False, repr=False)
+    invite_link: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "invite_link": self.invite_link,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeInstantView(InternalLinkType):
+    """
+    The link must be opened in an Instant View. Call getWebPageInstantView with the given URL to process the link. If Instant View is found, then show it, otherwise, open the fallback URL in an external browser
+
+    :param url: URL to be passed to getWebPageInstantView
+    :param fallback_url: An URL to open if getWebPageInstantView fails
+    """
+
+    _type: "str" = field(default="internalLinkTypeInstantView", init=False, repr=False)
+    url: "str" = ""
+    fallback_url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+            "fallback_url": self.fallback_url,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeInvoice(InternalLinkType):
+    """
+    The link is a link to an invoice. Call getPaymentForm with the given invoice name to process the link
+
+    :param invoice_name: Name of the invoice
+    """
+
+    _type: "str" = field(default="internalLinkTypeInvoice", init=False, repr=False)
+    invoice_name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "invoice_name": self.invoice_name,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeLanguagePack(InternalLinkType):
+    """
+    The link is a link to a language pack. Call getLanguagePackInfo with the given language pack identifier to process the link. If the language pack is found and the user wants to apply it, then call setOption for the option "language_pack_id"
+
+    :param language_pack_id: Language pack identifier
+    """
+
+    _type: "str" = field(default="internalLinkTypeLanguagePack", init=False, repr=False)
+    language_pack_id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "language_pack_id": self.language_pack_id,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeLanguageSettings(InternalLinkType):
+    """
+    The link is a link to the language section of the application settings
+
+    """
+
+    _type: "str" = field(default="internalLinkTypeLanguageSettings", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeMainWebApp(InternalLinkType):
+    """
+    The link is a link to the main Web App of a bot. Call searchPublicChat with the given bot username, check that the user is a bot and has the main Web App. If the bot can be added to attachment menu, then use getAttachmentMenuBot to receive information about the bot, then if the bot isn't added to side menu,
+     show a disclaimer about Mini Apps being third-party applications, ask the user to accept their Terms of service and confirm adding the bot to side and attachment menu,
+     then if the user accepts the terms and confirms adding, use toggleBotIsAddedToAttachmentMenu to add the bot.
+     Then, use getMainWebApp with the given start parameter and mode and open the returned URL as a Web App
+
+    :param bot_username: Username of the bot
+    :param start_parameter: Start parameter to be passed to getMainWebApp
+    :param mode: The mode to be passed to getMainWebApp
+    """
+
+    _type: "str" = field(default="internalLinkTypeMainWebApp", init=False, repr=False)
+    bot_username: "str" = ""
+    start_parameter: "str" = ""
+    mode: "WebAppOpenMode | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_username": self.bot_username,
+            "start_parameter": self.start_parameter,
+            "mode": self.mode._to_json_dict() if self.mode is not None else None,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeMessage(InternalLinkType):
+    """
+    The link is a link to a Telegram message or a forum topic. Call getMessageLinkInfo with the given URL to process the link, and then open received forum topic or chat and show the message there
+
+    :param url: URL to be passed to getMessageLinkInfo
+    """
+
+    _type: "str" = field(default="internalLinkTypeMessage", init=False, repr=False)
+    url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeMessageDraft(InternalLinkType):
+    """
+    The link contains a message draft text. A share screen needs to be shown to the user, then the chosen chat must be opened and the text is added to the input field
+
+    :param text: Message draft text
+    :param contains_link: True, if the first line of the text contains a link. If true, the input field needs to be focused and the text after the link must be selected
+    """
+
+    _type: "str" = field(default="internalLinkTypeMessageDraft", init=False, repr=False)
+    text: "FormattedText | None" = None
+    contains_link: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "contains_link": self.contains_link,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeMyStars(InternalLinkType):
+    """
+    The link is a link to the screen with information about Telegram Star balance and transactions of the current user
+
+    """
+
+    _type: "str" = field(default="internalLinkTypeMyStars", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeMyToncoins(InternalLinkType):
+    """
+    The link is a link to the screen with information about Toncoin balance and transactions of the current user
+
+    """
+
+    _type: "str" = field(default="internalLinkTypeMyToncoins", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypePassportDataRequest(InternalLinkType):
+    """
+    The link contains a request of Telegram passport data. Call getPassportAuthorizationForm with the given parameters to process the link if the link was received from outside of the application; otherwise, ignore it
+
+    :param bot_user_id: User identifier of the service's bot; the corresponding user may be unknown yet
+    :param scope: Telegram Passport element types requested by the service
+    :param public_key: Service's public key
+    :param nonce: Unique request identifier provided by the service
+    :param callback_url: An HTTP URL to open once the request is finished, canceled, or failed with the parameters tg_passport=success, tg_passport=cancel, or tg_passport=error&error=... respectively.
+     If empty, then onActivityResult method must be used to return response on Android, or the link tgbot{bot_user_id}://passport/success or tgbot{bot_user_id}://passport/cancel must be opened otherwise
+    """
+
+    _type: "str" = field(default="internalLinkTypePassportDataRequest", init=False, repr=False)
+    bot_user_id: "int" = 0
+    scope: "str" = ""
+    public_key: "str" = ""
+    nonce: "str" = ""
+    callback_url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "scope": self.scope,
+            "public_key": self.public_key,
+            "nonce": self.nonce,
+            "callback_url": self.callback_url,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypePhoneNumberConfirmation(InternalLinkType):
+    """
+    The link can be used to confirm ownership of a phone number to prevent account deletion. Call sendPhoneNumberCode with the given phone number and with phoneNumberCodeTypeConfirmOwnership with the given hash to process the link. If succeeded, call checkPhoneNumberCode to check entered by the user code, or resendPhoneNumberCode to resend it
+
+    :param hash: Hash value from the link
+    :param phone_number: Phone number value from the link
+    """
+
+    _type: "str" = field(default="internalLinkTypePhoneNumberConfirmation", init=False, repr=False)
+    hash: "str" = ""
+    phone_number: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "hash": self.hash,
+            "phone_number": self.phone_number,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypePremiumFeatures(InternalLinkType):
+    """
+    The link is a link to the Premium features screen of the application from which the user can subscribe to Telegram Premium. Call getPremiumFeatures with the given referrer to process the link
+
+    :param referrer: Referrer specified in the link
+    """
+
+    _type: "str" = field(default="internalLinkTypePremiumFeatures", init=False, repr=False)
+    referrer: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "referrer": self.referrer,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypePremiumGift(InternalLinkType):
+    """
+    The link is a link to the screen for gifting Telegram Premium subscriptions to friends via inputInvoiceTelegram with telegramPaymentPurposePremiumGift payments or in-store purchases
+
+    :param referrer: Referrer specified in the link
+    """
+
+    _type: "str" = field(default="internalLinkTypePremiumGift", init=False, repr=False)
+    referrer: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "referrer": self.referrer,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypePremiumGiftCode(InternalLinkType):
+    """
+    The link is a link with a Telegram Premium gift code. Call checkPremiumGiftCode with the given code to process the link. If the code is valid and the user wants to apply it, then call applyPremiumGiftCode
+
+    :param code: The Telegram Premium gift code
+    """
+
+    _type: "str" = field(default="internalLinkTypePremiumGiftCode", init=False, repr=False)
+    code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "code": self.code,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypePrivacyAndSecuritySettings(InternalLinkType):
+    """
+    The link is a link to the privacy and security section of the application settings
+
+    """
+
+    _type: "str" = field(default="internalLinkTypePrivacyAndSecuritySettings", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeProxy(InternalLinkType):
+    """
+    The link is a link to a proxy. Call addProxy with the given parameters to process the link and add the proxy
+
+    :param server: Proxy server domain or IP address
+    :param port: Proxy server port
+    :param type: Type of the proxy
+    """
+
+    _type: "str" = field(default="internalLinkTypeProxy", init=False, repr=False)
+    server: "str" = ""
+    port: "int" = 0
+    type: "ProxyType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "server": self.server,
+            "port": self.port,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypePublicChat(InternalLinkType):
+    """
+    The link is a link to a chat by its username. Call searchPublicChat with the given chat username to process the link. If the chat is found, open its profile information screen or the chat itself.
+     If draft text isn't empty and the chat is a private chat with a regular user, then put the draft text in the input field
+
+    :param chat_username: Username of the chat
+    :param draft_text: Draft text for message to send in the chat
+    :param open_profile: True, if chat profile information screen must be opened; otherwise, the chat itself must be opened
+    """
+
+    _type: "str" = field(default="internalLinkTypePublicChat", init=False, repr=False)
+    chat_username: "str" = ""
+    draft_text: "str" = ""
+    open_profile: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_username": self.chat_username,
+            "draft_text": self.draft_text,
+            "open_profile": self.open_profile,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeQrCodeAuthentication(InternalLinkType):
+    """
+    The link can be used to login the current user on another device, but it must be scanned from QR-code using in-app camera. An alert similar to "This code can be used to allow someone to log in to your Telegram account. To confirm Telegram login, please go to Settings > Devices > Scan QR and scan the code" needs to be shown
+
+    """
+
+    _type: "str" = field(default="internalLinkTypeQrCodeAuthentication", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeRestorePurchases(InternalLinkType):
+    """
+    The link forces restore of App Store purchases when opened. For official iOS application only
+
+    """
+
+    _type: "str" = field(default="internalLinkTypeRestorePurchases", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeSettings(InternalLinkType):
+    """
+    The link is a link to application settings
+
+    """
+
+    _type: "str" = field(default="internalLinkTypeSettings", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeStickerSet(InternalLinkType):
+    """
+    The link is a link to a sticker set. Call searchStickerSet with the given sticker set name to process the link and show the sticker set. If the sticker set is found and the user wants to add it, then call changeStickerSet
+
+    :param sticker_set_name: Name of the sticker set
+    :param expect_custom_emoji: True, if the sticker set is expected to contain custom emoji
+    """
+
+    _type: "str" = field(default="internalLinkTypeStickerSet", init=False, repr=False)
+    sticker_set_name: "str" = ""
+    expect_custom_emoji: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker_set_name": self.sticker_set_name,
+            "expect_custom_emoji": self.expect_custom_emoji,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeStory(InternalLinkType):
+    """
+    The link is a link to a story. Call searchPublicChat with the given poster username, then call getStory with the received chat identifier and the given story identifier, then show the story if received
+
+    :param story_poster_username: Username of the poster of the story
+    :param story_id: Story identifier
+    """
+
+    _type: "str" = field(default="internalLinkTypeStory", init=False, repr=False)
+    story_poster_username: "str" = ""
+    story_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_poster_username": self.story_poster_username,
+            "story_id": self.story_id,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeTheme(InternalLinkType):
+    """
+    The link is a link to a cloud theme. TDLib has no theme support yet
+
+    :param theme_name: Name of the theme
+    """
+
+    _type: "str" = field(default="internalLinkTypeTheme", init=False, repr=False)
+    theme_name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "theme_name": self.theme_name,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeThemeSettings(InternalLinkType):
+    """
+    The link is a link to the theme section of the application settings
+
+    """
+
+    _type: "str" = field(default="internalLinkTypeThemeSettings", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeUnknownDeepLink(InternalLinkType):
+    """
+    The link is an unknown tg: link. Call getDeepLinkInfo to process the link
+
+    :param link: Link to be passed to getDeepLinkInfo
+    """
+
+    _type: "str" = field(default="internalLinkTypeUnknownDeepLink", init=False, repr=False)
+    link: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "link": self.link,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeUnsupportedProxy(InternalLinkType):
+    """
+    The link is a link to an unsupported proxy. An alert can be shown to the user
+
+    """
+
+    _type: "str" = field(default="internalLinkTypeUnsupportedProxy", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeUpgradedGift(InternalLinkType):
+    """
+    The link is a link to an upgraded gift. Call getUpgradedGift with the given name to process the link
+
+    :param name: Name of the unique gift
+    """
+
+    _type: "str" = field(default="internalLinkTypeUpgradedGift", init=False, repr=False)
+    name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeUserPhoneNumber(InternalLinkType):
+    """
+    The link is a link to a user by its phone number. Call searchUserByPhoneNumber with the given phone number to process the link. If the user is found, then call createPrivateChat and open user's profile information screen or the chat itself. If draft text isn't empty, then put the draft text in the input field
+
+    :param phone_number: Phone number of the user
+    :param draft_text: Draft text for message to send in the chat
+    :param open_profile: True, if user's profile information screen must be opened; otherwise, the chat itself must be opened
+    """
+
+    _type: "str" = field(default="internalLinkTypeUserPhoneNumber", init=False, repr=False)
+    phone_number: "str" = ""
+    draft_text: "str" = ""
+    open_profile: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "phone_number": self.phone_number,
+            "draft_text": self.draft_text,
+            "open_profile": self.open_profile,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeUserToken(InternalLinkType):
+    """
+    The link is a link to a user by a temporary token. Call searchUserByToken with the given token to process the link. If the user is found, then call createPrivateChat and open the chat
+
+    :param token: The token
+    """
+
+    _type: "str" = field(default="internalLinkTypeUserToken", init=False, repr=False)
+    token: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "token": self.token,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeVideoChat(InternalLinkType):
+    """
+    The link is a link to a video chat. Call searchPublicChat with the given chat username, and then joinVideoChat with the given invite hash to process the link
+
+    :param chat_username: Username of the chat with the video chat
+    :param invite_hash: If non-empty, invite hash to be used to join the video chat without being muted by administrators
+    :param is_live_stream: True, if the video chat is expected to be a live stream in a channel or a broadcast group
+    """
+
+    _type: "str" = field(default="internalLinkTypeVideoChat", init=False, repr=False)
+    chat_username: "str" = ""
+    invite_hash: "str" = ""
+    is_live_stream: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_username": self.chat_username,
+            "invite_hash": self.invite_hash,
+            "is_live_stream": self.is_live_stream,
+        }
+
+@dataclass(slots=True)
+class InternalLinkTypeWebApp(InternalLinkType):
+    """
+    The link is a link to a Web App. Call searchPublicChat with the given bot username, check that the user is a bot. If the bot is restricted for the current user, then show an error message. Otherwise, call searchWebApp with the received bot and the given web_app_short_name. Process received foundWebApp by showing a confirmation dialog if needed.
+     If the bot can be added to attachment or side menu, but isn't added yet, then show a disclaimer about Mini Apps being third-party applications instead of the dialog
+     and ask the user to accept their Terms of service. If the user accept the terms and confirms adding, then use toggleBotIsAddedToAttachmentMenu to add the bot.
+     Then, call getWebAppLinkUrl and open the returned URL as a Web App
+
+    :param bot_username: Username of the bot that owns the Web App
+    :param web_app_short_name: Short name of the Web App
+    :param start_parameter: Start parameter to be passed to getWebAppLinkUrl
+    :param mode: The mode in which the Web App must be opened
+    """
+
+    _type: "str" = field(default="internalLinkTypeWebApp", init=False, repr=False)
+    bot_username: "str" = ""
+    web_app_short_name: "str" = ""
+    start_parameter: "str" = ""
+    mode: "WebAppOpenMode | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_username": self.bot_username,
+            "web_app_short_name": self.web_app_short_name,
+            "start_parameter": self.start_parameter,
+            "mode": self.mode._to_json_dict() if self.mode is not None else None,
+        }
+
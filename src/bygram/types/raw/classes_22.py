@@ -0,0 +1,1181 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_06 import Message
+
+@dataclass(slots=True)
+class MessageLink(ObjectBase):
+    """
+    Contains an HTTPS link to a message in a supergroup or channel, or a forum topic
+
+    :param link: The link
+    :param is_public: True, if the link will work for non-members of the chat
+    """
+
+    _type: "str" = field(default="messageLink", init=False, repr=False)
+    link: "str" = ""
+    is_public: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "link": self.link,
+            "is_public": self.is_public,
+        }
+
+@dataclass(slots=True)
+class MessageLinkInfo(ObjectBase):
+    """
+    Contains information about a link to a message or a forum topic in a chat
+
+    :param is_public: True, if the link is a public link for a message or a forum topic in a chat
+    :param chat_id: If found, identifier of the chat to which the link points, 0 otherwise
+    :param message_thread_id: If found, identifier of the message thread in which to open the message, or a forum topic to open if the message is missing
+    :param message: If found, the linked message; may be null
+    :param media_timestamp: Timestamp from which the video/audio/video note/voice note/story playing must start, in seconds; 0 if not specified. The media can be in the message content or in its link preview
+    :param for_album: True, if the whole media album to which the message belongs is linked
+    """
+
+    _type: "str" = field(default="messageLinkInfo", init=False, repr=False)
+    is_public: "bool" = False
+    chat_id: "int" = 0
+    message_thread_id: "int" = 0
+    message: "Message | None" = None
+    media_timestamp: "int" = 0
+    for_album: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_public": self.is_public,
+            "chat_id": self.chat_id,
+            "message_thread_id": self.message_thread_id,
+            "message": self.message._to_json_dict() if self.message is not None else None,
+            "media_timestamp": self.media_timestamp,
+            "for_album": self.for_album,
+        }
+
+@dataclass(slots=True)
+class ChatBoostLink(ObjectBase):
+    """
+    Contains an HTTPS link to boost a chat
+
+    :param link: The link
+    :param is_public: True, if the link will work for non-members of the chat
+    """
+
+    _type: "str" = field(default="chatBoostLink", init=False, repr=False)
+    link: "str" = ""
+    is_public: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "link": self.link,
+            "is_public": self.is_public,
+        }
+
+@dataclass(slots=True)
+class ChatBoostLinkInfo(ObjectBase):
+    """
+    Contains information about a link to boost a chat
+
+    :param is_public: True, if the link will work for non-members of the chat
+    :param chat_id: Identifier of the chat to which the link points; 0 if the chat isn't found
+    """
+
+    _type: "str" = field(default="chatBoostLinkInfo", init=False, repr=False)
+    is_public: "bool" = False
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_public": self.is_public,
+            "chat_id": self.chat_id,
+        }
+
+@dataclass(slots=True)
+class BlockList(ObjectBase):
+    """
+    Describes type of block list
+
+    """
+
+    _type: "str" = field(default="BlockList", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class BlockListMain(BlockList):
+    """
+    The main block list that disallows writing messages to the current user, receiving their status and photo, viewing of stories, and some other actions
+
+    """
+
+    _type: "str" = field(default="blockListMain", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class BlockListStories(BlockList):
+    """
+    The block list that disallows viewing of stories of the current user
+
+    """
+
+    _type: "str" = field(default="blockListStories", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FileType(ObjectBase):
+    """
+    Represents the type of file
+
+    """
+
+    _type: "str" = field(default="FileType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FileTypeNone(FileType):
+    """
+    The data is not a file
+
+    """
+
+    _type: "str" = field(default="fileTypeNone", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FileTypeAnimation(FileType):
+    """
+    The file is an animation
+
+    """
+
+    _type: "str" = field(default="fileTypeAnimation", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FileTypeAudio(FileType):
+    """
+    The file is an audio file
+
+    """
+
+    _type: "str" = field(default="fileTypeAudio", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FileTypeDocument(FileType):
+    """
+    The file is a document
+
+    """
+
+    _type: "str" = field(default="fileTypeDocument", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FileTypeNotificationSound(FileType):
+    """
+    The file is a notification sound
+
+    """
+
+    _type: "str" = field(default="fileTypeNotificationSound", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FileTypePhoto(FileType):
+    """
+    The file is a photo
+
+    """
+
+    _type: "str" = field(default="fileTypePhoto", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FileTypePhotoStory(FileType):
+    """
+    The file is a photo published as a story
+
+    """
+
+    _type: "str" = field(default="fileTypePhotoStory", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FileTypeProfilePhoto(FileType):
+    """
+    The file is a profile photo
+
+    """
+
+    _type: "str" = field(default="fileTypeProfilePhoto", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FileTypeSecret(FileType):
+    """
+    The file was sent to a secret chat (the file type is not known to the server)
+
+    """
+
+    _type: "str" = field(default="fileTypeSecret", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FileTypeSecretThumbnail(FileType):
+    """
+    The file is a thumbnail of a file from a secret chat
+
+    """
+
+    _type: "str" = field(default="fileTypeSecretThumbnail", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FileTypeSecure(FileType):
+    """
+    The file is a file from Secure storage used for storing Telegram Passport files
+
+    """
+
+    _type: "str" = field(default="fileTypeSecure", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FileTypeSelfDestructingPhoto(FileType):
+    """
+    The file is a self-destructing photo in a private chat
+
+    """
+
+    _type: "str" = field(default="fileTypeSelfDestructingPhoto", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FileTypeSelfDestructingVideo(FileType):
+    """
+    The file is a self-destructing video in a private chat
+
+    """
+
+    _type: "str" = field(default="fileTypeSelfDestructingVideo", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FileTypeSelfDestructingVideoNote(FileType):
+    """
+    The file is a self-destructing video note in a private chat
+
+    """
+
+    _type: "str" = field(default="fileTypeSelfDestructingVideoNote", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FileTypeSelfDestructingVoiceNote(FileType):
+    """
+    The file is a self-destructing voice note in a private chat
+
+    """
+
+    _type: "str" = field(default="fileTypeSelfDestructingVoiceNote", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FileTypeSticker(FileType):
+    """
+    The file is a sticker
+
+    """
+
+    _type: "str" = field(default="fileTypeSticker", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FileTypeThumbnail(FileType):
+    """
+    The file is a thumbnail of another file
+
+    """
+
+    _type: "str" = field(default="fileTypeThumbnail", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FileTypeUnknown(FileType):
+    """
+    The file type is not yet known
+
+    """
+
+    _type: "str" = field(default="fileTypeUnknown", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FileTypeVideo(FileType):
+    """
+    The file is a video
+
+    """
+
+    _type: "str" = field(default="fileTypeVideo", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FileTypeVideoNote(FileType):
+    """
+    The file is a video note
+
+    """
+
+    _type: "str" = field(default="fileTypeVideoNote", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FileTypeVideoStory(FileType):
+    """
+    The file is a video published as a story
+
+    """
+
+    _type: "str" = field(default="fileTypeVideoStory", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FileTypeVoiceNote(FileType):
+    """
+    The file is a voice note
+
+    """
+
+    _type: "str" = field(default="fileTypeVoiceNote", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class FileTypeWallpaper(FileType):
+    """
+    The file is a wallpaper or a background pattern
+
+    """
+
+    _type: "str" = field(default="fileTypeWallpaper", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StorageStatisticsByFileType(ObjectBase):
+    """
+    Contains the storage usage statistics for a specific file type
+
+    :param file_type: File type
+    :param size: Total size of the files, in bytes
+    :param count: Total number of files
+    """
+
+    _type: "str" = field(default="storageStatisticsByFileType", init=False, repr=False)
+    file_type: "FileType | None" = None
+    size: "int" = 0
+    count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_type": self.file_type._to_json_dict() if self.file_type is not None else None,
+            "size": self.size,
+            "count": self.count,
+        }
+
+@dataclass(slots=True)
+class StorageStatisticsByChat(ObjectBase):
+    """
+    Contains the storage usage statistics for a specific chat
+
+    :param chat_id: Chat identifier; 0 if none
+    :param size: Total size of the files in the chat, in bytes
+    :param count: Total number of files in the chat
+    :param by_file_type: Statistics split by file types
+    """
+
+    _type: "str" = field(default="storageStatisticsByChat", init=False, repr=False)
+    chat_id: "int" = 0
+    size: "int" = 0
+    count: "int" = 0
+    by_file_type: "list[StorageStatisticsByFileType] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "size": self.size,
+            "count": self.count,
+            "by_file_type": _list_to_json(self.by_file_type),
+        }
+
+@dataclass(slots=True)
+class StorageStatistics(ObjectBase):
+    """
+    Contains the exact storage usage statistics split by chats and file type
+
+    :param size: Total size of files, in bytes
+    :param count: Total number of files
+    :param by_chat: Statistics split by chats
+    """
+
+    _type: "str" = field(default="storageStatistics", init=False, repr=False)
+    size: "int" = 0
+    count: "int" = 0
+    by_chat: "list[StorageStatisticsByChat] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "size": self.size,
+            "count": self.count,
+            "by_chat": _list_to_json(self.by_chat),
+        }
+
+@dataclass(slots=True)
+class StorageStatisticsFast(ObjectBase):
+    """
+    Contains approximate storage usage statistics, excluding files of unknown file type
+
+    :param files_size: Approximate total size of files, in bytes
+    :param file_count: Approximate number of files
+    :param database_size: Size of the database
+    :param language_pack_database_size: Size of the language pack database
+    :param log_size: Size of the TDLib internal log
+    """
+
+    _type: "str" = field(default="storageStatisticsFast", init=False, repr=False)
+    files_size: "int" = 0
+    file_count: "int" = 0
+    database_size: "int" = 0
+    language_pack_database_size: "int" = 0
+    log_size: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "files_size": self.files_size,
+            "file_count": self.file_count,
+            "database_size": self.database_size,
+            "language_pack_database_size": self.language_pack_database_size,
+            "log_size": self.log_size,
+        }
+
+@dataclass(slots=True)
+class DatabaseStatistics(ObjectBase):
+    """
+    Contains database statistics
+
+    :param statistics: Database statistics in an unspecified human-readable format
+    """
+
+    _type: "str" = field(default="databaseStatistics", init=False, repr=False)
+    statistics: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "statistics": self.statistics,
+        }
+
+@dataclass(slots=True)
+class NetworkType(ObjectBase):
+    """
+    Represents the type of network
+
+    """
+
+    _type: "str" = field(default="NetworkType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class NetworkTypeNone(NetworkType):
+    """
+    The network is not available
+
+    """
+
+    _type: "str" = field(default="networkTypeNone", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class NetworkTypeMobile(NetworkType):
+    """
+    A mobile network
+
+    """
+
+    _type: "str" = field(default="networkTypeMobile", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class NetworkTypeMobileRoaming(NetworkType):
+    """
+    A mobile roaming network
+
+    """
+
+    _type: "str" = field(default="networkTypeMobileRoaming", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class NetworkTypeWiFi(NetworkType):
+    """
+    A Wi-Fi network
+
+    """
+
+    _type: "str" = field(default="networkTypeWiFi", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class NetworkTypeOther(NetworkType):
+    """
+    A different network type (e.g., Ethernet network)
+
+    """
+
+    _type: "str" = field(default="networkTypeOther", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class NetworkStatisticsEntry(ObjectBase):
+    """
+    Contains statistics about network usage
+
+    """
+
+    _type: "str" = field(default="NetworkStatisticsEntry", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class NetworkStatisticsEntryFile(NetworkStatisticsEntry):
+    """
+    Contains information about the total amount of data that was used to send and receive files
+
+    :param file_type: Type of the file the data is part of; pass null if the data isn't related to files
+    :param network_type: Type of the network the data was sent through. Call setNetworkType to maintain the actual network type
+    :param sent_bytes: Total number of bytes sent
+    :param received_bytes: Total number of bytes received
+    """
+
+    _type: "str" = field(default="networkStatisticsEntryFile", init=False, repr=False)
+    file_type: "FileType | None" = None
+    network_type: "NetworkType | None" = None
+    sent_bytes: "int" = 0
+    received_bytes: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_type": self.file_type._to_json_dict() if self.file_type is not None else None,
+            "network_type": self.network_type._to_json_dict() if self.network_type is not None else None,
+            "sent_bytes": self.sent_bytes,
+            "received_bytes": self.received_bytes,
+        }
+
+@dataclass(slots=True)
+class NetworkStatisticsEntryCall(NetworkStatisticsEntry):
+    """
+    Contains information about the total amount of data that was used for calls
+
+    :param network_type: Type of the network the data was sent through. Call setNetworkType to maintain the actual network type
+    :param sent_bytes: Total number of bytes sent
+    :param received_bytes: Total number of bytes received
+    :param duration: Total call duration, in seconds
+    """
+
+    _type: "str" = field(default="networkStatisticsEntryCall", init=False, repr=False)
+    network_type: "NetworkType | None" = None
+    sent_bytes: "int" = 0
+    received_bytes: "int" = 0
+    duration: "float" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "network_type": self.network_type._to_json_dict() if self.network_type is not None else None,
+            "sent_bytes": self.sent_bytes,
+            "received_bytes": self.received_bytes,
+            "duration": self.duration,
+        }
+
+@dataclass(slots=True)
+class NetworkStatistics(ObjectBase):
+    """
+    A full list of available network statistic entries
+
+    :param since_date: Point in time (Unix timestamp) from which the statistics are collected
+    :param entries: Network statistics entries
+    """
+
+    _type: "str" = field(default="networkStatistics", init=False, repr=False)
+    since_date: "int" = 0
+    entries: "list[NetworkStatisticsEntry] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "since_date": self.since_date,
+            "entries": _list_to_json(self.entries),
+        }
+
+@dataclass(slots=True)
+class AutoDownloadSettings(ObjectBase):
+    """
+    Contains auto-download settings
+
+    :param is_auto_download_enabled: True, if the auto-download is enabled
+    :param max_photo_file_size: The maximum size of a photo file to be auto-downloaded, in bytes
+    :param max_video_file_size: The maximum size of a video file to be auto-downloaded, in bytes
+    :param max_other_file_size: The maximum size of other file types to be auto-downloaded, in bytes
+    :param video_upload_bitrate: The maximum suggested bitrate for uploaded videos, in kbit/s
+    :param preload_large_videos: True, if the beginning of video files needs to be preloaded for instant playback
+    :param preload_next_audio: True, if the next audio track needs to be preloaded while the user is listening to an audio file
+    :param preload_stories: True, if stories needs to be preloaded
+    :param use_less_data_for_calls: True, if "use less data for calls" option needs to be enabled
+    """
+
+    _type: "str" = field(default="autoDownloadSettings", init=False, repr=False)
+    is_auto_download_enabled: "bool" = False
+    max_photo_file_size: "int" = 0
+    max_video_file_size: "int" = 0
+    max_other_file_size: "int" = 0
+    video_upload_bitrate: "int" = 0
+    preload_large_videos: "bool" = False
+    preload_next_audio: "bool" = False
+    preload_stories: "bool" = False
+    use_less_data_for_calls: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_auto_download_enabled": self.is_auto_download_enabled,
+            "max_photo_file_size": self.max_photo_file_size,
+            "max_video_file_size": self.max_video_file_size,
+            "max_other_file_size": self.max_other_file_size,
+            "video_upload_bitrate": self.video_upload_bitrate,
+            "preload_large_videos": self.preload_large_videos,
+            "preload_next_audio": self.preload_next_audio,
+            "preload_stories": self.preload_stories,
+            "use_less_data_for_calls": self.use_less_data_for_calls,
+        }
+
+@dataclass(slots=True)
+class AutoDownloadSettingsPresets(ObjectBase):
+    """
+    Contains auto-download settings presets for the current user
+
+    :param low: Preset with lowest settings; expected to be used by default when roaming
+    :param medium: Preset with medium settings; expected to be used by default when using mobile data
+    :param high: Preset with highest settings; expected to be used by default when connected on Wi-Fi
+    """
+
+    _type: "str" = field(default="autoDownloadSettingsPresets", init=False, repr=False)
+    low: "AutoDownloadSettings | None" = None
+    medium: "AutoDownloadSettings | None" = None
+    high: "AutoDownloadSettings | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "low": self.low._to_json_dict() if self.low is not None else None,
+            "medium": self.medium._to_json_dict() if self.medium is not None else None,
+            "high": self.high._to_json_dict() if self.high is not None else None,
+        }
+
+@dataclass(slots=True)
+class AutosaveSettingsScope(ObjectBase):
+    """
+    Describes scope of autosave settings
+
+    """
+
+    _type: "str" = field(default="AutosaveSettingsScope", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class AutosaveSettingsScopePrivateChats(AutosaveSettingsScope):
+    """
+    Autosave settings applied to all private chats without chat-specific settings
+
+    """
+
+    _type: "str" = field(default="autosaveSettingsScopePrivateChats", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class AutosaveSettingsScopeGroupChats(AutosaveSettingsScope):
+    """
+    Autosave settings applied to all basic group and supergroup chats without chat-specific settings
+
+    """
+
+    _type: "str" = field(default="autosaveSettingsScopeGroupChats", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class AutosaveSettingsScopeChannelChats(AutosaveSettingsScope):
+    """
+    Autosave settings applied to all channel chats without chat-specific settings
+
+    """
+
+    _type: "str" = field(default="autosaveSettingsScopeChannelChats", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class AutosaveSettingsScopeChat(AutosaveSettingsScope):
+    """
+    Autosave settings applied to a chat
+
+    :param chat_id: Chat identifier
+    """
+
+    _type: "str" = field(default="autosaveSettingsScopeChat", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+@dataclass(slots=True)
+class ScopeAutosaveSettings(ObjectBase):
+    """
+    Contains autosave settings for an autosave settings scope
+
+    :param autosave_photos: True, if photo autosave is enabled
+    :param autosave_videos: True, if video autosave is enabled
+    :param max_video_file_size: The maximum size of a video file to be autosaved, in bytes; 512 KB - 4000 MB
+    """
+
+    _type: "str" = field(default="scopeAutosaveSettings", init=False, repr=False)
+    autosave_photos: "bool" = False
+    autosave_videos: "bool" = False
+    max_video_file_size: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "autosave_photos": self.autosave_photos,
+            "autosave_videos": self.autosave_videos,
+            "max_video_file_size": self.max_video_file_size,
+        }
+
+@dataclass(slots=True)
+class AutosaveSettingsException(ObjectBase):
+    """
+    Contains autosave settings for a chat, which overrides default settings for the corresponding scope
+
+    :param chat_id: Chat identifier
+    :param settings: Autosave settings for the chat
+    """
+
+    _type: "str" = field(default="autosaveSettingsException", init=False, repr=False)
+    chat_id: "int" = 0
+    settings: "ScopeAutosaveSettings | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "settings": self.settings._to_json_dict() if self.settings is not None else None,
+        }
+
+@dataclass(slots=True)
+class AutosaveSettings(ObjectBase):
+    """
+    Describes autosave settings
+
+    :param private_chat_settings: Default autosave settings for private chats
+    :param group_settings: Default autosave settings for basic group and supergroup chats
+    :param channel_settings: Default autosave settings for channel chats
+    :param exceptions: Autosave settings for specific chats
+    """
+
+    _type: "str" = field(default="autosaveSettings", init=False, repr=False)
+    private_chat_settings: "ScopeAutosaveSettings | None" = None
+    group_settings: "ScopeAutosaveSettings | None" = None
+    channel_settings: "ScopeAutosaveSettings | None" = None
+    exceptions: "list[AutosaveSettingsException] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "private_chat_settings": self.private_chat_settings._to_json_dict() if self.private_chat_settings is not None else None,
+            "group_settings": self.group_settings._to_json_dict() if self.group_settings is not None else None,
+            "channel_settings": self.channel_settings._to_json_dict() if self.channel_settings is not None else None,
+            "exceptions": _list_to_json(self.exceptions),
+        }
+
+@dataclass(slots=True)
+class ConnectionState(ObjectBase):
+    """
+    Describes the current state of the connection to Telegram servers
+
+    """
+
+    _type: "str" = field(default="ConnectionState", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ConnectionStateWaitingForNetwork(ConnectionState):
+    """
+    Waiting for the network to become available. Use setNetworkType to change the available network type
+
+    """
+
+    _type: "str" = field(default="connectionStateWaitingForNetwork", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ConnectionStateConnectingToProxy(ConnectionState):
+    """
+    Establishing a connection with a proxy server
+
+    """
+
+    _type: "str" = field(default="connectionStateConnectingToProxy", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ConnectionStateConnecting(ConnectionState):
+    """
+    Establishing a connection to the Telegram servers
+
+    """
+
+    _type: "str" = field(default="connectionStateConnecting", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ConnectionStateUpdating(ConnectionState):
+    """
+    Downloading data expected to be received while the application was offline
+
+    """
+
+    _type: "str" = field(default="connectionStateUpdating", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ConnectionStateReady(ConnectionState):
+    """
+    There is a working connection to the Telegram servers
+
+    """
+
+    _type: "str" = field(default="connectionStateReady", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TopChatCategory(ObjectBase):
+    """
+    Represents the categories of chats for which a list of frequently used chats can be retrieved
+
+    """
+
+    _type: "str" = field(default="TopChatCategory", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TopChatCategoryUsers(TopChatCategory):
+    """
+    A category containing frequently used private chats with non-bot users
+
+    """
+
+    _type: "str" = field(default="topChatCategoryUsers", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TopChatCategoryBots(TopChatCategory):
+    """
+    A category containing frequently used private chats with bot users
+
+    """
+
+    _type: "str" = field(default="topChatCategoryBots", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TopChatCategoryGroups(TopChatCategory):
+    """
+    A category containing frequently used basic groups and supergroups
+
+    """
+
+    _type: "str" = field(default="topChatCategoryGroups", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TopChatCategoryChannels(TopChatCategory):
+    """
+    A category containing frequently used channels
+
+    """
+
+    _type: "str" = field(default="topChatCategoryChannels", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TopChatCategoryInlineBots(TopChatCategory):
+    """
+    A category containing frequently used chats with inline bots sorted by their usage in inline mode
+
+    """
+
+    _type: "str" = field(default="topChatCategoryInlineBots", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TopChatCategoryWebAppBots(TopChatCategory):
+    """
+    A category containing frequently used chats with bots, which Web Apps were opened
+
+    """
+
+    _type: "str" = field(default="topChatCategoryWebAppBots", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TopChatCategoryCalls(TopChatCategory):
+    """
+    A category containing frequently used chats used for calls
+
+    """
+
+    _type: "str" = field(default="topChatCategoryCalls", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TopChatCategoryForwardChats(TopChatCategory):
+    """
+    A category containing frequently used chats used to forward messages
+
+    """
+
+    _type: "str" = field(default="topChatCategoryForwardChats", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
@@ -0,0 +1,1297 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import FormattedText, InputFile
+    from .classes_01 import MaskPosition, StickerFormat
+    from .classes_05 import ChatInviteLinkInfo
+
+@dataclass(slots=True)
+class FoundPosition(ObjectBase):
+    """
+    Contains 0-based match position
+
+    :param position: The position of the match
+    """
+
+    _type: "str" = field(default="foundPosition", init=False, repr=False)
+    position: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "position": self.position,
+        }
+
+@dataclass(slots=True)
+class FoundPositions(ObjectBase):
+    """
+    Contains 0-based positions of matched objects
+
+    :param total_count: Total number of matched objects
+    :param positions: The positions of the matched objects
+    """
+
+    _type: "str" = field(default="foundPositions", init=False, repr=False)
+    total_count: "int" = 0
+    positions: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_count": self.total_count,
+            "positions": self.positions,
+        }
+
+@dataclass(slots=True)
+class TMeUrlType(ObjectBase):
+    """
+    Describes the type of URL linking to an internal Telegram entity
+
+    """
+
+    _type: "str" = field(default="TMeUrlType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TMeUrlTypeUser(TMeUrlType):
+    """
+    A URL linking to a user
+
+    :param user_id: Identifier of the user
+    """
+
+    _type: "str" = field(default="tMeUrlTypeUser", init=False, repr=False)
+    user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+        }
+
+@dataclass(slots=True)
+class TMeUrlTypeSupergroup(TMeUrlType):
+    """
+    A URL linking to a public supergroup or channel
+
+    :param supergroup_id: Identifier of the supergroup or channel
+    """
+
+    _type: "str" = field(default="tMeUrlTypeSupergroup", init=False, repr=False)
+    supergroup_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+        }
+
+@dataclass(slots=True)
+class TMeUrlTypeChatInvite(TMeUrlType):
+    """
+    A chat invite link
+
+    :param info: Information about the chat invite link
+    """
+
+    _type: "str" = field(default="tMeUrlTypeChatInvite", init=False, repr=False)
+    info: "ChatInviteLinkInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "info": self.info._to_json_dict() if self.info is not None else None,
+        }
+
+@dataclass(slots=True)
+class TMeUrlTypeStickerSet(TMeUrlType):
+    """
+    A URL linking to a sticker set
+
+    :param sticker_set_id: Identifier of the sticker set
+    """
+
+    _type: "str" = field(default="tMeUrlTypeStickerSet", init=False, repr=False)
+    sticker_set_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker_set_id": self.sticker_set_id,
+        }
+
+@dataclass(slots=True)
+class TMeUrl(ObjectBase):
+    """
+    Represents a URL linking to an internal Telegram entity
+
+    :param url: URL
+    :param type: Type of the URL
+    """
+
+    _type: "str" = field(default="tMeUrl", init=False, repr=False)
+    url: "str" = ""
+    type: "TMeUrlType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+@dataclass(slots=True)
+class TMeUrls(ObjectBase):
+    """
+    Contains a list of t.me URLs
+
+    :param urls: List of URLs
+    """
+
+    _type: "str" = field(default="tMeUrls", init=False, repr=False)
+    urls: "list[TMeUrl] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "urls": _list_to_json(self.urls),
+        }
+
+@dataclass(slots=True)
+class SuggestedAction(ObjectBase):
+    """
+    Describes an action suggested to the current user
+
+    """
+
+    _type: "str" = field(default="SuggestedAction", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SuggestedActionEnableArchiveAndMuteNewChats(SuggestedAction):
+    """
+    Suggests the user to enable archive_and_mute_new_chats_from_unknown_users setting in archiveChatListSettings
+
+    """
+
+    _type: "str" = field(default="suggestedActionEnableArchiveAndMuteNewChats", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SuggestedActionCheckPassword(SuggestedAction):
+    """
+    Suggests the user to check whether they still remember their 2-step verification password
+
+    """
+
+    _type: "str" = field(default="suggestedActionCheckPassword", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SuggestedActionCheckPhoneNumber(SuggestedAction):
+    """
+    Suggests the user to check whether authorization phone number is correct and change the phone number if it is inaccessible
+
+    """
+
+    _type: "str" = field(default="suggestedActionCheckPhoneNumber", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SuggestedActionViewChecksHint(SuggestedAction):
+    """
+    Suggests the user to view a hint about the meaning of one and two check marks on sent messages
+
+    """
+
+    _type: "str" = field(default="suggestedActionViewChecksHint", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SuggestedActionConvertToBroadcastGroup(SuggestedAction):
+    """
+    Suggests the user to convert specified supergroup to a broadcast group
+
+    :param supergroup_id: Supergroup identifier
+    """
+
+    _type: "str" = field(default="suggestedActionConvertToBroadcastGroup", init=False, repr=False)
+    supergroup_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+        }
+
+@dataclass(slots=True)
+class SuggestedActionSetPassword(SuggestedAction):
+    """
+    Suggests the user to set a 2-step verification password to be able to log in again
+
+    :param authorization_delay: The number of days to pass between consecutive authorizations if the user declines to set password; if 0, then the user is advised to set the password for security reasons
+    """
+
+    _type: "str" = field(default="suggestedActionSetPassword", init=False, repr=False)
+    authorization_delay: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "authorization_delay": self.authorization_delay,
+        }
+
+@dataclass(slots=True)
+class SuggestedActionUpgradePremium(SuggestedAction):
+    """
+    Suggests the user to upgrade the Premium subscription from monthly payments to annual payments
+
+    """
+
+    _type: "str" = field(default="suggestedActionUpgradePremium", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SuggestedActionRestorePremium(SuggestedAction):
+    """
+    Suggests the user to restore a recently expired Premium subscription
+
+    """
+
+    _type: "str" = field(default="suggestedActionRestorePremium", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SuggestedActionSubscribeToAnnualPremium(SuggestedAction):
+    """
+    Suggests the user to subscribe to the Premium subscription with annual payments
+
+    """
+
+    _type: "str" = field(default="suggestedActionSubscribeToAnnualPremium", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SuggestedActionGiftPremiumForChristmas(SuggestedAction):
+    """
+    Suggests the user to gift Telegram Premium to friends for Christmas
+
+    """
+
+    _type: "str" = field(default="suggestedActionGiftPremiumForChristmas", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SuggestedActionSetBirthdate(SuggestedAction):
+    """
+    Suggests the user to set birthdate
+
+    """
+
+    _type: "str" = field(default="suggestedActionSetBirthdate", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SuggestedActionSetProfilePhoto(SuggestedAction):
+    """
+    Suggests the user to set profile photo
+
+    """
+
+    _type: "str" = field(default="suggestedActionSetProfilePhoto", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SuggestedActionExtendPremium(SuggestedAction):
+    """
+    Suggests the user to extend their expiring Telegram Premium subscription
+
+    :param manage_premium_subscription_url: A URL for managing Telegram Premium subscription
+    """
+
+    _type: "str" = field(default="suggestedActionExtendPremium", init=False, repr=False)
+    manage_premium_subscription_url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "manage_premium_subscription_url": self.manage_premium_subscription_url,
+        }
+
+@dataclass(slots=True)
+class SuggestedActionExtendStarSubscriptions(SuggestedAction):
+    """
+    Suggests the user to extend their expiring Telegram Star subscriptions. Call getStarSubscriptions with only_expiring == true to get the number of expiring subscriptions and the number of required to buy Telegram Stars
+
+    """
+
+    _type: "str" = field(default="suggestedActionExtendStarSubscriptions", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class SuggestedActionCustom(SuggestedAction):
+    """
+    A custom suggestion to be shown at the top of the chat list
+
+    :param name: Unique name of the suggestion
+    :param title: Title of the suggestion
+    :param description: A custom suggestion to be shown at the top of the chat list
+    :param url: The link to open when the suggestion is clicked
+    """
+
+    _type: "str" = field(default="suggestedActionCustom", init=False, repr=False)
+    name: "str" = ""
+    title: "FormattedText | None" = None
+    description: "FormattedText | None" = None
+    url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name,
+            "title": self.title._to_json_dict() if self.title is not None else None,
+            "description": self.description._to_json_dict() if self.description is not None else None,
+            "url": self.url,
+        }
+
+@dataclass(slots=True)
+class Count(ObjectBase):
+    """
+    Contains a counter
+
+    :param count: Count
+    """
+
+    _type: "str" = field(default="count", init=False, repr=False)
+    count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "count": self.count,
+        }
+
+@dataclass(slots=True)
+class Text(ObjectBase):
+    """
+    Contains some text
+
+    :param text: Text
+    """
+
+    _type: "str" = field(default="text", init=False, repr=False)
+    text: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text,
+        }
+
+@dataclass(slots=True)
+class Data(ObjectBase):
+    """
+    Contains some binary data
+
+    :param data: Data
+    """
+
+    _type: "str" = field(default="data", init=False, repr=False)
+    data: "bytes" = b""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "data": _bytes_to_json(self.data),
+        }
+
+@dataclass(slots=True)
+class Seconds(ObjectBase):
+    """
+    Contains a value representing a number of seconds
+
+    :param seconds: Number of seconds
+    """
+
+    _type: "str" = field(default="seconds", init=False, repr=False)
+    seconds: "float" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "seconds": self.seconds,
+        }
+
+@dataclass(slots=True)
+class FileDownloadedPrefixSize(ObjectBase):
+    """
+    Contains size of downloaded prefix of a file
+
+    :param size: The prefix size, in bytes
+    """
+
+    _type: "str" = field(default="fileDownloadedPrefixSize", init=False, repr=False)
+    size: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "size": self.size,
+        }
+
+@dataclass(slots=True)
+class StarCount(ObjectBase):
+    """
+    Contains a number of Telegram Stars
+
+    :param star_count: Number of Telegram Stars
+    """
+
+    _type: "str" = field(default="starCount", init=False, repr=False)
+    star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "star_count": self.star_count,
+        }
+
+@dataclass(slots=True)
+class DeepLinkInfo(ObjectBase):
+    """
+    Contains information about a tg: deep link
+
+    :param text: Text to be shown to the user
+    :param need_update_application: True, if the user must be asked to update the application
+    """
+
+    _type: "str" = field(default="deepLinkInfo", init=False, repr=False)
+    text: "FormattedText | None" = None
+    need_update_application: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "need_update_application": self.need_update_application,
+        }
+
+@dataclass(slots=True)
+class TextParseMode(ObjectBase):
+    """
+    Describes the way the text needs to be parsed for text entities
+
+    """
+
+    _type: "str" = field(default="TextParseMode", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class TextParseModeMarkdown(TextParseMode):
+    """
+    The text uses Markdown-style formatting
+
+    :param version: Version of the parser: 0 or 1 - Telegram Bot API "Markdown" parse mode, 2 - Telegram Bot API "MarkdownV2" parse mode
+    """
+
+    _type: "str" = field(default="textParseModeMarkdown", init=False, repr=False)
+    version: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "version": self.version,
+        }
+
+@dataclass(slots=True)
+class TextParseModeHTML(TextParseMode):
+    """
+    The text uses HTML-style formatting. The same as Telegram Bot API "HTML" parse mode
+
+    """
+
+    _type: "str" = field(default="textParseModeHTML", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ProxyType(ObjectBase):
+    """
+    Describes the type of proxy server
+
+    """
+
+    _type: "str" = field(default="ProxyType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ProxyTypeSocks5(ProxyType):
+    """
+    A SOCKS5 proxy server
+
+    :param username: Username for logging in; may be empty
+    :param password: Password for logging in; may be empty
+    """
+
+    _type: "str" = field(default="proxyTypeSocks5", init=False, repr=False)
+    username: "str" = ""
+    password: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "username": self.username,
+            "password": self.password,
+        }
+
+@dataclass(slots=True)
+class ProxyTypeHttp(ProxyType):
+    """
+    A HTTP transparent proxy server
+
+    :param username: Username for logging in; may be empty
+    :param password: Password for logging in; may be empty
+    :param http_only: Pass true if the proxy supports only HTTP requests and doesn't support transparent TCP connections via HTTP CONNECT method
+    """
+
+    _type: "str" = field(default="proxyTypeHttp", init=False, repr=False)
+    username: "str" = ""
+    password: "str" = ""
+    http_only: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "username": self.username,
+            "password": self.password,
+            "http_only": self.http_only,
+        }
+
+@dataclass(slots=True)
+class ProxyTypeMtproto(ProxyType):
+    """
+    An MTProto proxy server
+
+    :param secret: The proxy's secret in hexadecimal encoding
+    """
+
+    _type: "str" = field(default="proxyTypeMtproto", init=False, repr=False)
+    secret: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "secret": self.secret,
+        }
+
+@dataclass(slots=True)
+class Proxy(ObjectBase):
+    """
+    Contains information about a proxy server
+
+    :param id: Unique identifier of the proxy
+    :param server: Proxy server domain or IP address
+    :param port: Proxy server port
+    :param last_used_date: Point in time (Unix timestamp) when the proxy was last used; 0 if never
+    :param is_enabled: True, if the proxy is enabled now
+    :param type: Type of the proxy
+    """
+
+    _type: "str" = field(default="proxy", init=False, repr=False)
+    id: "int" = 0
+    server: "str" = ""
+    port: "int" = 0
+    last_used_date: "int" = 0
+    is_enabled: "bool" = False
+    type: "ProxyType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "server": self.server,
+            "port": self.port,
+            "last_used_date": self.last_used_date,
+            "is_enabled": self.is_enabled,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+@dataclass(slots=True)
+class Proxies(ObjectBase):
+    """
+    Represents a list of proxy servers
+
+    :param proxies: List of proxy servers
+    """
+
+    _type: "str" = field(default="proxies", init=False, repr=False)
+    proxies: "list[Proxy] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "proxies": _list_to_json(self.proxies),
+        }
+
+@dataclass(slots=True)
+class InputSticker(ObjectBase):
+    """
+    A sticker to be added to a sticker set
+
+    :param sticker: File with the sticker; must fit in a 512x512 square. For WEBP stickers the file must be in WEBP or PNG format, which will be converted to WEBP server-side.
+     See https://core.telegram.org/animated_stickers#technical-requirements for technical requirements
+    :param format: Format of the sticker
+    :param emojis: String with 1-20 emoji corresponding to the sticker
+    :param mask_position: Position where the mask is placed; pass null if not specified
+    :param keywords: List of up to 20 keywords with total length up to 64 characters, which can be used to find the sticker
+    """
+
+    _type: "str" = field(default="inputSticker", init=False, repr=False)
+    sticker: "InputFile | None" = None
+    format: "StickerFormat | None" = None
+    emojis: "str" = ""
+    mask_position: "MaskPosition | None" = None
+    keywords: "list[str] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+            "format": self.format._to_json_dict() if self.format is not None else None,
+            "emojis": self.emojis,
+            "mask_position": self.mask_position._to_json_dict() if self.mask_position is not None else None,
+            "keywords": self.keywords,
+        }
+
+@dataclass(slots=True)
+class DateRange(ObjectBase):
+    """
+    Represents a date range
+
+    :param start_date: Point in time (Unix timestamp) at which the date range begins
+    :param end_date: Point in time (Unix timestamp) at which the date range ends
+    """
+
+    _type: "str" = field(default="dateRange", init=False, repr=False)
+    start_date: "int" = 0
+    end_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+        }
+
+@dataclass(slots=True)
+class StatisticalValue(ObjectBase):
+    """
+    A value with information about its recent changes
+
+    :param value: The current value
+    :param previous_value: The value for the previous day
+    :param growth_rate_percentage: The growth rate of the value, as a percentage
+    """
+
+    _type: "str" = field(default="statisticalValue", init=False, repr=False)
+    value: "float" = 0
+    previous_value: "float" = 0
+    growth_rate_percentage: "float" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "value": self.value,
+            "previous_value": self.previous_value,
+            "growth_rate_percentage": self.growth_rate_percentage,
+        }
+
+@dataclass(slots=True)
+class StatisticalGraph(ObjectBase):
+    """
+    Describes a statistical graph
+
+    """
+
+    _type: "str" = field(default="StatisticalGraph", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class StatisticalGraphData(StatisticalGraph):
+    """
+    A graph data
+
+    :param json_data: Graph data in JSON format
+    :param zoom_token: If non-empty, a token which can be used to receive a zoomed in graph
+    """
+
+    _type: "str" = field(default="statisticalGraphData", init=False, repr=False)
+    json_data: "str" = ""
+    zoom_token: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "json_data": self.json_data,
+            "zoom_token": self.zoom_token,
+        }
+
+@dataclass(slots=True)
+class StatisticalGraphAsync(StatisticalGraph):
+    """
+    The graph data to be asynchronously loaded through getStatisticalGraph
+
+    :param token: The token to use for data loading
+    """
+
+    _type: "str" = field(default="statisticalGraphAsync", init=False, repr=False)
+    token: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "token": self.token,
+        }
+
+@dataclass(slots=True)
+class StatisticalGraphError(StatisticalGraph):
+    """
+    An error message to be shown to the user instead of the graph
+
+    :param error_message: The error message
+    """
+
+    _type: "str" = field(default="statisticalGraphError", init=False, repr=False)
+    error_message: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "error_message": self.error_message,
+        }
+
+@dataclass(slots=True)
+class ChatStatisticsObjectType(ObjectBase):
+    """
+    Describes type of object, for which statistics are provided
+
+    """
+
+    _type: "str" = field(default="ChatStatisticsObjectType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatStatisticsObjectTypeMessage(ChatStatisticsObjectType):
+    """
+    Describes a message sent in the chat
+
+    :param message_id: Message identifier
+    """
+
+    _type: "str" = field(default="chatStatisticsObjectTypeMessage", init=False, repr=False)
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "message_id": self.message_id,
+        }
+
+@dataclass(slots=True)
+class ChatStatisticsObjectTypeStory(ChatStatisticsObjectType):
+    """
+    Describes a story posted on behalf of the chat
+
+    :param story_id: Story identifier
+    """
+
+    _type: "str" = field(default="chatStatisticsObjectTypeStory", init=False, repr=False)
+    story_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_id": self.story_id,
+        }
+
+@dataclass(slots=True)
+class ChatStatisticsInteractionInfo(ObjectBase):
+    """
+    Contains statistics about interactions with a message sent in the chat or a story posted on behalf of the chat
+
+    :param object_type: Type of the object
+    :param view_count: Number of times the object was viewed
+    :param forward_count: Number of times the object was forwarded
+    :param reaction_count: Number of times reactions were added to the object
+    """
+
+    _type: "str" = field(default="chatStatisticsInteractionInfo", init=False, repr=False)
+    object_type: "ChatStatisticsObjectType | None" = None
+    view_count: "int" = 0
+    forward_count: "int" = 0
+    reaction_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "object_type": self.object_type._to_json_dict() if self.object_type is not None else None,
+            "view_count": self.view_count,
+            "forward_count": self.forward_count,
+            "reaction_count": self.reaction_count,
+        }
+
+@dataclass(slots=True)
+class ChatStatisticsMessageSenderInfo(ObjectBase):
+    """
+    Contains statistics about messages sent by a user
+
+    :param user_id: User identifier
+    :param sent_message_count: Number of sent messages
+    :param average_character_count: Average number of characters in sent messages; 0 if unknown
+    """
+
+    _type: "str" = field(default="chatStatisticsMessageSenderInfo", init=False, repr=False)
+    user_id: "int" = 0
+    sent_message_count: "int" = 0
+    average_character_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "sent_message_count": self.sent_message_count,
+            "average_character_count": self.average_character_count,
+        }
+
+@dataclass(slots=True)
+class ChatStatisticsAdministratorActionsInfo(ObjectBase):
+    """
+    Contains statistics about administrator actions done by a user
+
+    :param user_id: Administrator user identifier
+    :param deleted_message_count: Number of messages deleted by the administrator
+    :param banned_user_count: Number of users banned by the administrator
+    :param restricted_user_count: Number of users restricted by the administrator
+    """
+
+    _type: "str" = field(default="chatStatisticsAdministratorActionsInfo", init=False, repr=False)
+    user_id: "int" = 0
+    deleted_message_count: "int" = 0
+    banned_user_count: "int" = 0
+    restricted_user_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "deleted_message_count": self.deleted_message_count,
+            "banned_user_count": self.banned_user_count,
+            "restricted_user_count": self.restricted_user_count,
+        }
+
+@dataclass(slots=True)
+class ChatStatisticsInviterInfo(ObjectBase):
+    """
+    Contains statistics about number of new members invited by a user
+
+    :param user_id: User identifier
+    :param added_member_count: Number of new members invited by the user
+    """
+
+    _type: "str" = field(default="chatStatisticsInviterInfo", init=False, repr=False)
+    user_id: "int" = 0
+    added_member_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "added_member_count": self.added_member_count,
+        }
+
+@dataclass(slots=True)
+class ChatStatistics(ObjectBase):
+    """
+    Contains a detailed statistics about a chat
+
+    """
+
+    _type: "str" = field(default="ChatStatistics", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatStatisticsSupergroup(ChatStatistics):
+    """
+    A detailed statistics about a supergroup chat
+
+    :param period: A period to which the statistics applies
+    :param member_count: Number of members in the chat
+    :param message_count: Number of messages sent to the chat
+    :param viewer_count: Number of users who viewed messages in the chat
+    :param sender_count: Number of users who sent messages to the chat
+    :param member_count_graph: A graph containing number of members in the chat
+    :param join_graph: A graph containing number of members joined and left the chat
+    :param join_by_source_graph: A graph containing number of new member joins per source
+    :param language_graph: A graph containing distribution of active users per language
+    :param message_content_graph: A graph containing distribution of sent messages by content type
+    :param action_graph: A graph containing number of different actions in the chat
+    :param day_graph: A graph containing distribution of message views per hour
+    :param week_graph: A graph containing distribution of message views per day of week
+    :param top_senders: List of users sent most messages in the last week
+    :param top_administrators: List of most active administrators in the last week
+    :param top_inviters: List of most active inviters of new members in the last week
+    """
+
+    _type: "str" = field(default="chatStatisticsSupergroup", init=False, repr=False)
+    period: "DateRange | None" = None
+    member_count: "StatisticalValue | None" = None
+    message_count: "StatisticalValue | None" = None
+    viewer_count: "StatisticalValue | None" = None
+    sender_count: "StatisticalValue | None" = None
+    member_count_graph: "StatisticalGraph | None" = None
+    join_graph: "StatisticalGraph | None" = None
+    join_by_source_graph: "StatisticalGraph | None" = None
+    language_graph: "StatisticalGraph | None" = None
+    message_content_graph: "StatisticalGraph | None" = None
+    action_graph: "StatisticalGraph | None" = None
+    day_graph: "StatisticalGraph | None" = None
+    week_graph: "StatisticalGraph | None" = None
+    top_senders: "list[ChatStatisticsMessageSenderInfo] | None" = None
+    top_administrators: "list[ChatStatisticsAdministratorActionsInfo] | None" = None
+    top_inviters: "list[ChatStatisticsInviterInfo] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "period": self.period._to_json_dict() if self.period is not None else None,
+            "member_count": self.member_count._to_json_dict() if self.member_count is not None else None,
+            "message_count": self.message_count._to_json_dict() if self.message_count is not None else None,
+            "viewer_count": self.viewer_count._to_json_dict() if self.viewer_count is not None else None,
+            "sender_count": self.sender_count._to_json_dict() if self.sender_count is not None else None,
+            "member_count_graph": self.member_count_graph._to_json_dict() if self.member_count_graph is not None else None,
+            "join_graph": self.join_graph._to_json_dict() if self.join_graph is not None else None,
+            "join_by_source_graph": self.join_by_source_graph._to_json_dict() if self.join_by_source_graph is not None else None,
+            "language_graph": self.language_graph._to_json_dict() if self.language_graph is not None else None,
+            "message_content_graph": self.message_content_graph._to_json_dict() if self.message_content_graph is not None else None,
+            "action_graph": self.action_graph._to_json_dict() if self.action_graph is not None else None,
+            "day_graph": self.day_graph._to_json_dict() if self.day_graph is not None else None,
+            "week_graph": self.week_graph._to_json_dict() if self.week_graph is not None else None,
+            "top_senders": _list_to_json(self.top_senders),
+            "top_administrators": _list_to_json(self.top_administrators),
+            "top_inviters": _list_to_json(self.top_inviters),
+        }
+
+@dataclass(slots=True)
+class ChatStatisticsChannel(ChatStatistics):
+    """
+    A detailed statistics about a channel chat
+
+    :param period: A period to which the statistics applies
+    :param member_count: Number of members in the chat
+    :param mean_message_view_count: Mean number of times the recently sent messages were viewed
+    :param mean_message_share_count: Mean number of times the recently sent messages were shared
+    :param mean_message_reaction_count: Mean number of times reactions were added to the recently sent messages
+    :param mean_story_view_count: Mean number of times the recently posted stories were viewed
+    :param mean_story_share_count: Mean number of times the recently posted stories were shared
+    :param mean_story_reaction_count: Mean number of times reactions were added to the recently posted stories
+    :param enabled_notifications_percentage: A percentage of users with enabled notifications for the chat; 0-100
+    :param member_count_graph: A graph containing number of members in the chat
+    :param join_graph: A graph containing number of members joined and left the chat
+    :param mute_graph: A graph containing number of members muted and unmuted the chat
+    :param view_count_by_hour_graph: A graph containing number of message views in a given hour in the last two weeks
+    :param view_count_by_source_graph: A graph containing number of message views per source
+    :param join_by_source_graph: A graph containing number of new member joins per source
+    :param language_graph: A graph containing number of users viewed chat messages per language
+    :param message_interaction_graph: A graph containing number of chat message views and shares
+    :param message_reaction_graph: A graph containing number of reactions on messages
+    :param story_interaction_graph: A graph containing number of story views and shares
+    :param story_reaction_graph: A graph containing number of reactions on stories
+    :param instant_view_interaction_graph: A graph containing number of views of associated with the chat instant views
+    :param recent_interactions: Detailed statistics about number of views and shares of recently sent messages and posted stories
+    """
+
+    _type: "str" = field(default="chatStatisticsChannel", init=False, repr=False)
+    period: "DateRange | None" = None
+    member_count: "StatisticalValue | None" = None
+    mean_message_view_count: "StatisticalValue | None" = None
+    mean_message_share_count: "StatisticalValue | None" = None
+    mean_message_reaction_count: "StatisticalValue | None" = None
+    mean_story_view_count: "StatisticalValue | None" = None
+    mean_story_share_count: "StatisticalValue | None" = None
+    mean_story_reaction_count: "StatisticalValue | None" = None
+    enabled_notifications_percentage: "float" = 0
+    member_count_graph: "StatisticalGraph | None" = None
+    join_graph: "StatisticalGraph | None" = None
+    mute_graph: "StatisticalGraph | None" = None
+    view_count_by_hour_graph: "StatisticalGraph | None" = None
+    view_count_by_source_graph: "StatisticalGraph | None" = None
+    join_by_source_graph: "StatisticalGraph | None" = None
+    language_graph: "StatisticalGraph | None" = None
+    message_interaction_graph: "StatisticalGraph | None" = None
+    message_reaction_graph: "StatisticalGraph | None" = None
+    story_interaction_graph: "StatisticalGraph | None" = None
+    story_reaction_graph: "StatisticalGraph | None" = None
+    instant_view_interaction_graph: "StatisticalGraph | None" = None
+    recent_interactions: "list[ChatStatisticsInteractionInfo] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "period": self.period._to_json_dict() if self.period is not None else None,
+            "member_count": self.member_count._to_json_dict() if self.member_count is not None else None,
+            "mean_message_view_count": self.mean_message_view_count._to_json_dict() if self.mean_message_view_count is not None else None,
+            "mean_message_share_count": self.mean_message_share_count._to_json_dict() if self.mean_message_share_count is not None else None,
+            "mean_message_reaction_count": self.mean_message_reaction_count._to_json_dict() if self.mean_message_reaction_count is not None else None,
+            "mean_story_view_count": self.mean_story_view_count._to_json_dict() if self.mean_story_view_count is not None else None,
+            "mean_story_share_count": self.mean_story_share_count._to_json_dict() if self.mean_story_share_count is not None else None,
+            "mean_story_reaction_count": self.mean_story_reaction_count._to_json_dict() if self.mean_story_reaction_count is not None else None,
+            "enabled_notifications_percentage": self.enabled_notifications_percentage,
+            "member_count_graph": self.member_count_graph._to_json_dict() if self.member_count_graph is not None else None,
+            "join_graph": self.join_graph._to_json_dict() if self.join_graph is not None else None,
+            "mute_graph": self.mute_graph._to_json_dict() if self.mute_graph is not None else None,
+            "view_count_by_hour_graph": self.view_count_by_hour_graph._to_json_dict() if self.view_count_by_hour_graph is not None else None,
+            "view_count_by_source_graph": self.view_count_by_source_graph._to_json_dict() if self.view_count_by_source_graph is not None else None,
+            "join_by_source_graph": self.join_by_source_graph._to_json_dict() if self.join_by_source_graph is not None else None,
+            "language_graph": self.language_graph._to_json_dict() if self.language_graph is not None else None,
+            "message_interaction_graph": self.message_interaction_graph._to_json_dict() if self.message_interaction_graph is not None else None,
+            "message_reaction_graph": self.message_reaction_graph._to_json_dict() if self.message_reaction_graph is not None else None,
+            "story_interaction_graph": self.story_interaction_graph._to_json_dict() if self.story_interaction_graph is not None else None,
+            "story_reaction_graph": self.story_reaction_graph._to_json_dict() if self.story_reaction_graph is not None else None,
+            "instant_view_interaction_graph": self.instant_view_interaction_graph._to_json_dict() if self.instant_view_interaction_graph is not None else None,
+            "recent_interactions": _list_to_json(self.recent_interactions),
+        }
+
+@dataclass(slots=True)
+class ChatRevenueAmount(ObjectBase):
+    """
+    Contains information about revenue earned from sponsored messages in a chat
+
+    :param cryptocurrency: Cryptocurrency in which revenue is calculated
+    :param total_amount: Total amount of the cryptocurrency earned, in the smallest units of the cryptocurrency
+    :param balance_amount: Amount of the cryptocurrency that isn't withdrawn yet, in the smallest units of the cryptocurrency
+    :param available_amount: Amount of the cryptocurrency available for withdrawal, in the smallest units of the cryptocurrency
+    :param withdrawal_enabled: True, if Telegram Stars can be withdrawn now or later
+    """
+
+    _type: "str" = field(default="chatRevenueAmount", init=False, repr=False)
+    cryptocurrency: "str" = ""
+    total_amount: "int" = 0
+    balance_amount: "int" = 0
+    available_amount: "int" = 0
+    withdrawal_enabled: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "cryptocurrency": self.cryptocurrency,
+            "total_amount": self.total_amount,
+            "balance_amount": self.balance_amount,
+            "available_amount": self.available_amount,
+            "withdrawal_enabled": self.withdrawal_enabled,
+        }
+
+@dataclass(slots=True)
+class ChatRevenueStatistics(ObjectBase):
+    """
+    A detailed statistics about revenue earned from sponsored messages in a chat
+
+    :param revenue_by_hour_graph: A graph containing amount of revenue in a given hour
+    :param revenue_graph: A graph containing amount of revenue
+    :param revenue_amount: Amount of earned revenue
+    :param usd_rate: Current conversion rate of the cryptocurrency in which revenue is calculated to USD
+    """
+
+    _type: "str" = field(default="chatRevenueStatistics", init=False, repr=False)
+    revenue_by_hour_graph: "StatisticalGraph | None" = None
+    revenue_graph: "StatisticalGraph | None" = None
+    revenue_amount: "ChatRevenueAmount | None" = None
+    usd_rate: "float" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "revenue_by_hour_graph": self.revenue_by_hour_graph._to_json_dict() if self.revenue_by_hour_graph is not None else None,
+            "revenue_graph": self.revenue_graph._to_json_dict() if self.revenue_graph is not None else None,
+            "revenue_amount": self.revenue_amount._to_json_dict() if self.revenue_amount is not None else None,
+            "usd_rate": self.usd_rate,
+        }
+
+@dataclass(slots=True)
+class MessageStatistics(ObjectBase):
+    """
+    A detailed statistics about a message
+
+    :param message_interaction_graph: A graph containing number of message views and shares
+    :param message_reaction_graph: A graph containing number of message reactions
+    """
+
+    _type: "str" = field(default="messageStatistics", init=False, repr=False)
+    message_interaction_graph: "StatisticalGraph | None" = None
+    message_reaction_graph: "StatisticalGraph | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "message_interaction_graph": self.message_interaction_graph._to_json_dict() if self.message_interaction_graph is not None else None,
+            "message_reaction_graph": self.message_reaction_graph._to_json_dict() if self.message_reaction_graph is not None else None,
+        }
+
+@dataclass(slots=True)
+class StoryStatistics(ObjectBase):
+    """
+    A detailed statistics about a story
+
+    :param story_interaction_graph: A graph containing number of story views and shares
+    :param story_reaction_graph: A graph containing number of story reactions
+    """
+
+    _type: "str" = field(default="storyStatistics", init=False, repr=False)
+    story_interaction_graph: "StatisticalGraph | None" = None
+    story_reaction_graph: "StatisticalGraph | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_interaction_graph": self.story_interaction_graph._to_json_dict() if self.story_interaction_graph is not None else None,
+            "story_reaction_graph": self.story_reaction_graph._to_json_dict() if self.story_reaction_graph is not None else None,
+        }
+
+@dataclass(slots=True)
+class RevenueWithdrawalState(ObjectBase):
+    """
+    Describes state of a revenue withdrawal
+
+    """
+
+    _type: "str" = field(default="RevenueWithdrawalState", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class RevenueWithdrawalStatePending(RevenueWithdrawalState):
+    """
+    Withdrawal is pending
+
+    """
+
+    _type: "str" = field(default="revenueWithdrawalStatePending", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class RevenueWithdrawalStateSucceeded(RevenueWithdrawalState):
+    """
+    Withdrawal succeeded
+
+    :param date: Point in time (Unix timestamp) when the withdrawal was completed
+    :param url: The URL where the withdrawal transaction can be viewed
+    """
+
+    _type: "str" = field(default="revenueWithdrawalStateSucceeded", init=False, repr=False)
+    date: "int" = 0
+    url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "date": self.date,
+            "url": self.url,
+        }
+
+@dataclass(slots=True)
+class RevenueWithdrawalStateFailed(RevenueWithdrawalState):
+    """
+    Withdrawal failed
+
+    """
+
+    _type: "str" = field(default="revenueWithdrawalStateFailed", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
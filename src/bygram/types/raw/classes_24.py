@@ -0,0 +1,3871 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import AuthorizationState, Error, File, TermsOfService
+    from .classes_01 import Background, ChatBackground, ChatPhotoInfo, Location, Poll, Sticker, StickerType
+    from .classes_02 import ChatPermissions, CloseBirthdayUser, StarAmount, SuggestedPostInfo
+    from .classes_04 import AccentColor, ChatInviteLink, ChatMember, EmojiStatus, ProfileAccentColor, User, UserFullInfo
+    from .classes_05 import BasicGroup, BasicGroupFullInfo, ChatJoinRequest, ChatJoinRequestsInfo, MessageInteractionInfo, MessageReaction, MessageSender, MessageTopic, PaidReactionType, ReactionType, SecretChat, Supergroup, SupergroupFullInfo, UnreadReaction
+    from .classes_06 import BusinessMessage, ChatNotificationSettings, DownloadedFileCounts, FactCheck, FileDownload, Message, NotificationSettingsScope, ReactionNotificationSettings, ScopeNotificationSettings
+    from .classes_07 import BusinessBotManageBar, Chat, ChatActionBar, ChatAvailableReactions, ChatFolderInfo, ChatList, ChatPosition, ChatType, DraftMessage, SavedMessagesTags, VideoChat
+    from .classes_08 import DirectMessagesChatTopic, ForumTopicInfo, ReplyMarkup, SavedMessagesTopic
+    from .classes_09 import Address, OrderInfo
+    from .classes_11 import MessageContent
+    from .classes_13 import ChatAction, StickerSet, TrendingStickerSets, UserStatus
+    from .classes_14 import ChatActiveStories, ChatBoost, QuickReplyMessage, QuickReplyShortcut, Story, StoryList
+    from .classes_15 import Call, GroupCall, GroupCallParticipant
+    from .classes_16 import AttachmentMenuBot, BusinessConnection, CallbackQueryPayload
+    from .classes_17 import LanguagePackString
+    from .classes_19 import CanPostStoryResult, ChatTheme
+    from .classes_20 import Notification, NotificationGroup, NotificationGroupType, OptionValue, UserPrivacySetting, UserPrivacySettingRules
+    from .classes_21 import UnconfirmedSession
+    from .classes_22 import AutosaveSettingsScope, BlockList, ConnectionState, ScopeAutosaveSettings
+    from .classes_23 import ChatRevenueAmount, RevenueWithdrawalState, StatisticalGraph, SuggestedAction
+
+@dataclass(slots=True)
+class ChatRevenueTransactionType(ObjectBase):
+    """
+    Describes type of transaction for revenue earned from sponsored messages in a chat
+
+    """
+
+    _type: "str" = field(default="ChatRevenueTransactionType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatRevenueTransactionTypeUnsupported(ChatRevenueTransactionType):
+    """
+    Describes an unsupported transaction
+
+    """
+
+    _type: "str" = field(default="chatRevenueTransactionTypeUnsupported", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class ChatRevenueTransactionTypeSponsoredMessageEarnings(ChatRevenueTransactionType):
+    """
+    Describes earnings from sponsored messages in a chat in some time frame
+
+    :param start_date: Point in time (Unix timestamp) when the earnings started
+    :param end_date: Point in time (Unix timestamp) when the earnings ended
+    """
+
+    _type: "str" = field(default="chatRevenueTransactionTypeSponsoredMessageEarnings", init=False, repr=False)
+    start_date: "int" = 0
+    end_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+        }
+
+@dataclass(slots=True)
+class ChatRevenueTransactionTypeSuggestedPostEarnings(ChatRevenueTransactionType):
+    """
+    Describes earnings from a published suggested post
+
+    :param user_id: Identifier of the user that paid for the suggested post
+    """
+
+    _type: "str" = field(default="chatRevenueTransactionTypeSuggestedPostEarnings", init=False, repr=False)
+    user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+        }
+
+@dataclass(slots=True)
+class ChatRevenueTransactionTypeFragmentWithdrawal(ChatRevenueTransactionType):
+    """
+    Describes a withdrawal of earnings through Fragment
+
+    :param withdrawal_date: Point in time (Unix timestamp) when the earnings withdrawal started
+    :param state: State of the withdrawal
+    """
+
+    _type: "str" = field(default="chatRevenueTransactionTypeFragmentWithdrawal", init=False, repr=False)
+    withdrawal_date: "int" = 0
+    state: "RevenueWithdrawalState | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "withdrawal_date": self.withdrawal_date,
+            "state": self.state._to_json_dict() if self.state is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatRevenueTransactionTypeFragmentRefund(ChatRevenueTransactionType):
+    """
+    Describes a refund for failed withdrawal of earnings through Fragment
+
+    :param refund_date: Point in time (Unix timestamp) when the transaction was refunded
+    """
+
+    _type: "str" = field(default="chatRevenueTransactionTypeFragmentRefund", init=False, repr=False)
+    refund_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "refund_date": self.refund_date,
+        }
+
+@dataclass(slots=True)
+class ChatRevenueTransaction(ObjectBase):
+    """
+    Contains a chat revenue transactions
+
+    :param cryptocurrency: Cryptocurrency in which revenue is calculated
+    :param cryptocurrency_amount: The withdrawn amount, in the smallest units of the cryptocurrency
+    :param type: Type of the transaction
+    """
+
+    _type: "str" = field(default="chatRevenueTransaction", init=False, repr=False)
+    cryptocurrency: "str" = ""
+    cryptocurrency_amount: "int" = 0
+    type: "ChatRevenueTransactionType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "cryptocurrency": self.cryptocurrency,
+            "cryptocurrency_amount": self.cryptocurrency_amount,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+@dataclass(slots=True)
+class ChatRevenueTransactions(ObjectBase):
+    """
+    Contains a list of chat revenue transactions
+
+    :param ton_amount: The amount of owned Toncoins; in the smallest units of the cryptocurrency
+    :param transactions: List of transactions
+    :param next_offset: The offset for the next request. If empty, then there are no more results
+    """
+
+    _type: "str" = field(default="chatRevenueTransactions", init=False, repr=False)
+    ton_amount: "int" = 0
+    transactions: "list[ChatRevenueTransaction] | None" = None
+    next_offset: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "ton_amount": self.ton_amount,
+            "transactions": _list_to_json(self.transactions),
+            "next_offset": self.next_offset,
+        }
+
+@dataclass(slots=True)
+class StarRevenueStatus(ObjectBase):
+    """
+    Contains information about Telegram Stars earned by a bot or a chat
+
+    :param total_amount: Total amount of Telegram Stars earned
+    :param current_amount: The amount of Telegram Stars that aren't withdrawn yet
+    :param available_amount: The amount of Telegram Stars that are available for withdrawal
+    :param withdrawal_enabled: True, if Telegram Stars can be withdrawn now or later
+    :param next_withdrawal_in: Time left before the next withdrawal can be started, in seconds; 0 if withdrawal can be started now
+    """
+
+    _type: "str" = field(default="starRevenueStatus", init=False, repr=False)
+    total_amount: "StarAmount | None" = None
+    current_amount: "StarAmount | None" = None
+    available_amount: "StarAmount | None" = None
+    withdrawal_enabled: "bool" = False
+    next_withdrawal_in: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_amount": self.total_amount._to_json_dict() if self.total_amount is not None else None,
+            "current_amount": self.current_amount._to_json_dict() if self.current_amount is not None else None,
+            "available_amount": self.available_amount._to_json_dict() if self.available_amount is not None else None,
+            "withdrawal_enabled": self.withdrawal_enabled,
+            "next_withdrawal_in": self.next_withdrawal_in,
+        }
+
+@dataclass(slots=True)
+class StarRevenueStatistics(ObjectBase):
+    """
+    A detailed statistics about Telegram Stars earned by a bot or a chat
+
+    :param revenue_by_day_graph: A graph containing amount of revenue in a given day
+    :param status: Telegram Star revenue status
+    :param usd_rate: Current conversion rate of a Telegram Star to USD
+    """
+
+    _type: "str" = field(default="starRevenueStatistics", init=False, repr=False)
+    revenue_by_day_graph: "StatisticalGraph | None" = None
+    status: "StarRevenueStatus | None" = None
+    usd_rate: "float" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "revenue_by_day_graph": self.revenue_by_day_graph._to_json_dict() if self.revenue_by_day_graph is not None else None,
+            "status": self.status._to_json_dict() if self.status is not None else None,
+            "usd_rate": self.usd_rate,
+        }
+
+@dataclass(slots=True)
+class Point(ObjectBase):
+    """
+    A point on a Cartesian plane
+
+    :param x: The point's first coordinate
+    :param y: The point's second coordinate
+    """
+
+    _type: "str" = field(default="point", init=False, repr=False)
+    x: "float" = 0
+    y: "float" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "x": self.x,
+            "y": self.y,
+        }
+
+@dataclass(slots=True)
+class VectorPathCommand(ObjectBase):
+    """
+    Represents a vector path command
+
+    """
+
+    _type: "str" = field(default="VectorPathCommand", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class VectorPathCommandLine(VectorPathCommand):
+    """
+    A straight line to a given point
+
+    :param end_point: The end point of the straight line
+    """
+
+    _type: "str" = field(default="vectorPathCommandLine", init=False, repr=False)
+    end_point: "Point | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "end_point": self.end_point._to_json_dict() if self.end_point is not None else None,
+        }
+
+@dataclass(slots=True)
+class VectorPathCommandCubicBezierCurve(VectorPathCommand):
+    """
+    A cubic Bézier curve to a given point
+
+    :param start_control_point: The start control point of the curve
+    :param end_control_point: The end control point of the curve
+    :param end_point: The end point of the curve
+    """
+
+    _type: "str" = field(default="vectorPathCommandCubicBezierCurve", init=False, repr=False)
+    start_control_point: "Point | None" = None
+    end_control_point: "Point | None" = None
+    end_point: "Point | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "start_control_point": self.start_control_point._to_json_dict() if self.start_control_point is not None else None,
+            "end_control_point": self.end_control_point._to_json_dict() if self.end_control_point is not None else None,
+            "end_point": self.end_point._to_json_dict() if self.end_point is not None else None,
+        }
+
+@dataclass(slots=True)
+class BotCommandScope(ObjectBase):
+    """
+    Represents the scope to which bot commands are relevant
+
+    """
+
+    _type: "str" = field(default="BotCommandScope", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class BotCommandScopeDefault(BotCommandScope):
+    """
+    A scope covering all users
+
+    """
+
+    _type: "str" = field(default="botCommandScopeDefault", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class BotCommandScopeAllPrivateChats(BotCommandScope):
+    """
+    A scope covering all private chats
+
+    """
+
+    _type: "str" = field(default="botCommandScopeAllPrivateChats", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class BotCommandScopeAllGroupChats(BotCommandScope):
+    """
+    A scope covering all group and supergroup chats
+
+    """
+
+    _type: "str" = field(default="botCommandScopeAllGroupChats", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class BotCommandScopeAllChatAdministrators(BotCommandScope):
+    """
+    A scope covering all group and supergroup chat administrators
+
+    """
+
+    _type: "str" = field(default="botCommandScopeAllChatAdministrators", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class BotCommandScopeChat(BotCommandScope):
+    """
+    A scope covering all members of a chat
+
+    :param chat_id: Chat identifier
+    """
+
+    _type: "str" = field(default="botCommandScopeChat", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+@dataclass(slots=True)
+class BotCommandScopeChatAdministrators(BotCommandScope):
+    """
+    A scope covering all administrators of a chat
+
+    :param chat_id: Chat identifier
+    """
+
+    _type: "str" = field(default="botCommandScopeChatAdministrators", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+@dataclass(slots=True)
+class BotCommandScopeChatMember(BotCommandScope):
+    """
+    A scope covering a member of a chat
+
+    :param chat_id: Chat identifier
+    :param user_id: User identifier
+    """
+
+    _type: "str" = field(default="botCommandScopeChatMember", init=False, repr=False)
+    chat_id: "int" = 0
+    user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "user_id": self.user_id,
+        }
+
+@dataclass(slots=True)
+class PhoneNumberCodeType(ObjectBase):
+    """
+    Describes type of the request for which a code is sent to a phone number
+
+    """
+
+    _type: "str" = field(default="PhoneNumberCodeType", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PhoneNumberCodeTypeChange(PhoneNumberCodeType):
+    """
+    Checks ownership of a new phone number to change the user's authentication phone number; for official Android and iOS applications only
+
+    """
+
+    _type: "str" = field(default="phoneNumberCodeTypeChange", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PhoneNumberCodeTypeVerify(PhoneNumberCodeType):
+    """
+    Verifies ownership of a phone number to be added to the user's Telegram Passport
+
+    """
+
+    _type: "str" = field(default="phoneNumberCodeTypeVerify", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class PhoneNumberCodeTypeConfirmOwnership(PhoneNumberCodeType):
+    """
+    Confirms ownership of a phone number to prevent account deletion while handling links of the type internalLinkTypePhoneNumberConfirmation
+
+    :param hash: Hash value from the link
+    """
+
+    _type: "str" = field(default="phoneNumberCodeTypeConfirmOwnership", init=False, repr=False)
+    hash: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "hash": self.hash,
+        }
+
+@dataclass(slots=True)
+class UpdateAuthorizationState(Update):
+    """
+    The user authorization state has changed
+
+    :param authorization_state: New authorization state
+    """
+
+    _type: "str" = field(default="updateAuthorizationState", init=False, repr=False)
+    authorization_state: "AuthorizationState | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "authorization_state": self.authorization_state._to_json_dict() if self.authorization_state is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateNewMessage(Update):
+    """
+    A new message was received; can also be an outgoing message
+
+    :param message: The new message
+    """
+
+    _type: "str" = field(default="updateNewMessage", init=False, repr=False)
+    message: "Message | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "message": self.message._to_json_dict() if self.message is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateMessageSendAcknowledged(Update):
+    """
+    A request to send a message has reached the Telegram server. This doesn't mean that the message will be sent successfully. This update is sent only if the option "use_quick_ack" is set to true. This update may be sent multiple times for the same message
+
+    :param chat_id: The chat identifier of the sent message
+    :param message_id: A temporary message identifier
+    """
+
+    _type: "str" = field(default="updateMessageSendAcknowledged", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+@dataclass(slots=True)
+class UpdateMessageSendSucceeded(Update):
+    """
+    A message has been successfully sent
+
+    :param message: The sent message. Almost any field of the new message can be different from the corresponding field of the original message.
+     For example, the field scheduling_state may change, making the message scheduled, or non-scheduled
+    :param old_message_id: The previous temporary message identifier
+    """
+
+    _type: "str" = field(default="updateMessageSendSucceeded", init=False, repr=False)
+    message: "Message | None" = None
+    old_message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "message": self.message._to_json_dict() if self.message is not None else None,
+            "old_message_id": self.old_message_id,
+        }
+
+@dataclass(slots=True)
+class UpdateMessageSendFailed(Update):
+    """
+    A message failed to send. Be aware that some messages being sent can be irrecoverably deleted, in which case updateDeleteMessages will be received instead of this update
+
+    :param message: The failed to send message
+    :param old_message_id: The previous temporary message identifier
+    :param error: The cause of the message sending failure
+    """
+
+    _type: "str" = field(default="updateMessageSendFailed", init=False, repr=False)
+    message: "Message | None" = None
+    old_message_id: "int" = 0
+    error: "Error | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "message": self.message._to_json_dict() if self.message is not None else None,
+            "old_message_id": self.old_message_id,
+            "error": self.error._to_json_dict() if self.error is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateMessageContent(Update):
+    """
+    The message content has changed
+
+    :param chat_id: Chat identifier
+    :param message_id: Message identifier
+    :param new_content: New message content
+    """
+
+    _type: "str" = field(default="updateMessageContent", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    new_content: "MessageContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "new_content": self.new_content._to_json_dict() if self.new_content is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateMessageEdited(Update):
+    """
+    A message was edited. Changes in the message content will come in a separate updateMessageContent
+
+    :param chat_id: Chat identifier
+    :param message_id: Message identifier
+    :param edit_date: Point in time (Unix timestamp) when the message was edited
+    :param reply_markup: New message reply markup; may be null
+    """
+
+    _type: "str" = field(default="updateMessageEdited", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    edit_date: "int" = 0
+    reply_markup: "ReplyMarkup | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "edit_date": self.edit_date,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateMessageIsPinned(Update):
+    """
+    The message pinned state was changed
+
+    :param chat_id: Chat identifier
+    :param message_id: The message identifier
+    :param is_pinned: True, if the message is pinned
+    """
+
+    _type: "str" = field(default="updateMessageIsPinned", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    is_pinned: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "is_pinned": self.is_pinned,
+        }
+
+@dataclass(slots=True)
+class UpdateMessageInteractionInfo(Update):
+    """
+    The information about interactions with a message has changed
+
+    :param chat_id: Chat identifier
+    :param message_id: Message identifier
+    :param interaction_info: New information about interactions with the message; may be null
+    """
+
+    _type: "str" = field(default="updateMessageInteractionInfo", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    interaction_info: "MessageInteractionInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "interaction_info": self.interaction_info._to_json_dict() if self.interaction_info is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateMessageContentOpened(Update):
+    """
+    The message content was opened. Updates voice note messages to "listened", video note messages to "viewed" and starts the self-destruct timer
+
+    :param chat_id: Chat identifier
+    :param message_id: Message identifier
+    """
+
+    _type: "str" = field(default="updateMessageContentOpened", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+@dataclass(slots=True)
+class UpdateMessageMentionRead(Update):
+    """
+    A message with an unread mention was read
+
+    :param chat_id: Chat identifier
+    :param message_id: Message identifier
+    :param unread_mention_count: The new number of unread mention messages left in the chat
+    """
+
+    _type: "str" = field(default="updateMessageMentionRead", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    unread_mention_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "unread_mention_count": self.unread_mention_count,
+        }
+
+@dataclass(slots=True)
+class UpdateMessageUnreadReactions(Update):
+    """
+    The list of unread reactions added to a message was changed
+
+    :param chat_id: Chat identifier
+    :param message_id: Message identifier
+    :param unread_reactions: The new list of unread reactions
+    :param unread_reaction_count: The new number of messages with unread reactions left in the chat
+    """
+
+    _type: "str" = field(default="updateMessageUnreadReactions", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    unread_reactions: "list[UnreadReaction] | None" = None
+    unread_reaction_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "unread_reactions": _list_to_json(self.unread_reactions),
+            "unread_reaction_count": self.unread_reaction_count,
+        }
+
+@dataclass(slots=True)
+class UpdateMessageFactCheck(Update):
+    """
+    A fact-check added to a message was changed
+
+    :param chat_id: Chat identifier
+    :param message_id: Message identifier
+    :param fact_check: The new fact-check
+    """
+
+    _type: "str" = field(default="updateMessageFactCheck", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    fact_check: "FactCheck | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "fact_check": self.fact_check._to_json_dict() if self.fact_check is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateMessageSuggestedPostInfo(Update):
+    """
+    Information about suggested post of a message was changed
+
+    :param chat_id: Chat identifier
+    :param message_id: Message identifier
+    :param suggested_post_info: The new information about the suggested post
+    """
+
+    _type: "str" = field(default="updateMessageSuggestedPostInfo", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    suggested_post_info: "SuggestedPostInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "suggested_post_info": self.suggested_post_info._to_json_dict() if self.suggested_post_info is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateMessageLiveLocationViewed(Update):
+    """
+    A message with a live location was viewed. When the update is received, the application is expected to update the live location
+
+    :param chat_id: Identifier of the chat with the live location message
+    :param message_id: Identifier of the message with live location
+    """
+
+    _type: "str" = field(default="updateMessageLiveLocationViewed", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+@dataclass(slots=True)
+class UpdateVideoPublished(Update):
+    """
+    An automatically scheduled message with video has been successfully sent after conversion
+
+    :param chat_id: Identifier of the chat with the message
+    :param message_id: Identifier of the sent message
+    """
+
+    _type: "str" = field(default="updateVideoPublished", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+@dataclass(slots=True)
+class UpdateNewChat(Update):
+    """
+    A new chat has been loaded/created. This update is guaranteed to come before the chat identifier is returned to the application. The chat field changes will be reported through separate updates
+
+    :param chat: The chat
+    """
+
+    _type: "str" = field(default="updateNewChat", init=False, repr=False)
+    chat: "Chat | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat": self.chat._to_json_dict() if self.chat is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateChatTitle(Update):
+    """
+    The title of a chat was changed
+
+    :param chat_id: Chat identifier
+    :param title: The new chat title
+    """
+
+    _type: "str" = field(default="updateChatTitle", init=False, repr=False)
+    chat_id: "int" = 0
+    title: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "title": self.title,
+        }
+
+@dataclass(slots=True)
+class UpdateChatPhoto(Update):
+    """
+    A chat photo was changed
+
+    :param chat_id: Chat identifier
+    :param photo: The new chat photo; may be null
+    """
+
+    _type: "str" = field(default="updateChatPhoto", init=False, repr=False)
+    chat_id: "int" = 0
+    photo: "ChatPhotoInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateChatAccentColors(Update):
+    """
+    Chat accent colors have changed
+
+    :param chat_id: Chat identifier
+    :param accent_color_id: The new chat accent color identifier
+    :param background_custom_emoji_id: The new identifier of a custom emoji to be shown on the reply header and link preview background; 0 if none
+    :param profile_accent_color_id: The new chat profile accent color identifier; -1 if none
+    :param profile_background_custom_emoji_id: The new identifier of a custom emoji to be shown on the profile background; 0 if none
+    """
+
+    _type: "str" = field(default="updateChatAccentColors", init=False, repr=False)
+    chat_id: "int" = 0
+    accent_color_id: "int" = 0
+    background_custom_emoji_id: "int" = 0
+    profile_accent_color_id: "int" = 0
+    profile_background_custom_emoji_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "accent_color_id": self.accent_color_id,
+            "background_custom_emoji_id": self.background_custom_emoji_id,
+            "profile_accent_color_id": self.profile_accent_color_id,
+            "profile_background_custom_emoji_id": self.profile_background_custom_emoji_id,
+        }
+
+@dataclass(slots=True)
+class UpdateChatPermissions(Update):
+    """
+    Chat permissions were changed
+
+    :param chat_id: Chat identifier
+    :param permissions: The new chat permissions
+    """
+
+    _type: "str" = field(default="updateChatPermissions", init=False, repr=False)
+    chat_id: "int" = 0
+    permissions: "ChatPermissions | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "permissions": self.permissions._to_json_dict() if self.permissions is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateChatLastMessage(Update):
+    """
+    The last message of a chat was changed
+
+    :param chat_id: Chat identifier
+    :param last_message: The new last message in the chat; may be null if the last message became unknown. While the last message is unknown, new messages can be added to the chat without corresponding updateNewMessage update
+    :param positions: The new chat positions in the chat lists
+    """
+
+    _type: "str" = field(default="updateChatLastMessage", init=False, repr=False)
+    chat_id: "int" = 0
+    last_message: "Message | None" = None
+    positions: "list[ChatPosition] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "last_message": self.last_message._to_json_dict() if self.last_message is not None else None,
+            "positions": _list_to_json(self.positions),
+        }
+
+@dataclass(slots=True)
+class UpdateChatPosition(Update):
+    """
+    The position of a chat in a chat list has changed. An updateChatLastMessage or updateChatDraftMessage update might be sent instead of the update
+
+    :param chat_id: Chat identifier
+    :param position: New chat position. If new order is 0, then the chat needs to be removed from the list
+    """
+
+    _type: "str" = field(default="updateChatPosition", init=False, repr=False)
+    chat_id: "int" = 0
+    position: "ChatPosition | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "position": self.position._to_json_dict() if self.position is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateChatAddedToList(Update):
+    """
+    A chat was added to a chat list
+
+    :param chat_id: Chat identifier
+    :param chat_list: The chat list to which the chat was added
+    """
+
+    _type: "str" = field(default="updateChatAddedToList", init=False, repr=False)
+    chat_id: "int" = 0
+    chat_list: "ChatList | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "chat_list": self.chat_list._to_json_dict() if self.chat_list is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateChatRemovedFromList(Update):
+    """
+    A chat was removed from a chat list
+
+    :param chat_id: Chat identifier
+    :param chat_list: The chat list from which the chat was removed
+    """
+
+    _type: "str" = field(default="updateChatRemovedFromList", init=False, repr=False)
+    chat_id: "int" = 0
+    chat_list: "ChatList | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "chat_list": self.chat_list._to_json_dict() if self.chat_list is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateChatReadInbox(Update):
+    """
+    Incoming messages were read or the number of unread messages has been changed
+
+    :param chat_id: Chat identifier
+    :param last_read_inbox_message_id: Identifier of the last read incoming message
+    :param unread_count: The number of unread messages left in the chat
+    """
+
+    _type: "str" = field(default="updateChatReadInbox", init=False, repr=False)
+    chat_id: "int" = 0
+    last_read_inbox_message_id: "int" = 0
+    unread_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "last_read_inbox_message_id": self.last_read_inbox_message_id,
+            "unread_count": self.unread_count,
+        }
+
+@dataclass(slots=True)
+class UpdateChatReadOutbox(Update):
+    """
+    Outgoing messages were read
+
+    :param chat_id: Chat identifier
+    :param last_read_outbox_message_id: Identifier of last read outgoing message
+    """
+
+    _type: "str" = field(default="updateChatReadOutbox", init=False, repr=False)
+    chat_id: "int" = 0
+    last_read_outbox_message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "last_read_outbox_message_id": self.last_read_outbox_message_id,
+        }
+
+@dataclass(slots=True)
+class UpdateChatActionBar(Update):
+    """
+    The chat action bar was changed
+
+    :param chat_id: Chat identifier
+    :param action_bar: The new value of the action bar; may be null
+    """
+
+    _type: "str" = field(default="updateChatActionBar", init=False, repr=False)
+    chat_id: "int" = 0
+    action_bar: "ChatActionBar | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "action_bar": self.action_bar._to_json_dict() if self.action_bar is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateChatBusinessBotManageBar(Update):
+    """
+    The bar for managing business bot was changed in a chat
+
+    :param chat_id: Chat identifier
+    :param business_bot_manage_bar: The new value of the business bot manage bar; may be null
+    """
+
+    _type: "str" = field(default="updateChatBusinessBotManageBar", init=False, repr=False)
+    chat_id: "int" = 0
+    business_bot_manage_bar: "BusinessBotManageBar | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "business_bot_manage_bar": self.business_bot_manage_bar._to_json_dict() if self.business_bot_manage_bar is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateChatAvailableReactions(Update):
+    """
+    The chat available reactions were changed
+
+    :param chat_id: Chat identifier
+    :param available_reactions: The new reactions, available in the chat
+    """
+
+    _type: "str" = field(default="updateChatAvailableReactions", init=False, repr=False)
+    chat_id: "int" = 0
+    available_reactions: "ChatAvailableReactions | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "available_reactions": self.available_reactions._to_json_dict() if self.available_reactions is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateChatDraftMessage(Update):
+    """
+    A chat draft has changed. Be aware that the update may come in the currently opened chat but with old content of the draft. If the user has changed the content of the draft, this update mustn't be applied
+
+    :param chat_id: Chat identifier
+    :param draft_message: The new draft message; may be null if none
+    :param positions: The new chat positions in the chat lists
+    """
+
+    _type: "str" = field(default="updateChatDraftMessage", init=False, repr=False)
+    chat_id: "int" = 0
+    draft_message: "DraftMessage | None" = None
+    positions: "list[ChatPosition] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "draft_message": self.draft_message._to_json_dict() if self.draft_message is not None else None,
+            "positions": _list_to_json(self.positions),
+        }
+
+@dataclass(slots=True)
+class UpdateChatEmojiStatus(Update):
+    """
+    Chat emoji status has changed
+
+    :param chat_id: Chat identifier
+    :param emoji_status: The new chat emoji status; may be null
+    """
+
+    _type: "str" = field(default="updateChatEmojiStatus", init=False, repr=False)
+    chat_id: "int" = 0
+    emoji_status: "EmojiStatus | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "emoji_status": self.emoji_status._to_json_dict() if self.emoji_status is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateChatMessageSender(Update):
+    """
+    The message sender that is selected to send messages in a chat has changed
+
+    :param chat_id: Chat identifier
+    :param message_sender_id: New value of message_sender_id; may be null if the user can't change message sender
+    """
+
+    _type: "str" = field(default="updateChatMessageSender", init=False, repr=False)
+    chat_id: "int" = 0
+    message_sender_id: "MessageSender | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_sender_id": self.message_sender_id._to_json_dict() if self.message_sender_id is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateChatMessageAutoDeleteTime(Update):
+    """
+    The message auto-delete or self-destruct timer setting for a chat was changed
+
+    :param chat_id: Chat identifier
+    :param message_auto_delete_time: New value of message_auto_delete_time
+    """
+
+    _type: "str" = field(default="updateChatMessageAutoDeleteTime", init=False, repr=False)
+    chat_id: "int" = 0
+    message_auto_delete_time: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_auto_delete_time": self.message_auto_delete_time,
+        }
+
+@dataclass(slots=True)
+class UpdateChatNotificationSettings(Update):
+    """
+    Notification settings for a chat were changed
+
+    :param chat_id: Chat identifier
+    :param notification_settings: The new notification settings
+    """
+
+    _type: "str" = field(default="updateChatNotificationSettings", init=False, repr=False)
+    chat_id: "int" = 0
+    notification_settings: "ChatNotificationSettings | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "notification_settings": self.notification_settings._to_json_dict() if self.notification_settings is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateChatPendingJoinRequests(Update):
+    """
+    The chat pending join requests were changed
+
+    :param chat_id: Chat identifier
+    :param pending_join_requests: The new data about pending join requests; may be null
+    """
+
+    _type: "str" = field(default="updateChatPendingJoinRequests", init=False, repr=False)
+    chat_id: "int" = 0
+    pending_join_requests: "ChatJoinRequestsInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "pending_join_requests": self.pending_join_requests._to_json_dict() if self.pending_join_requests is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateChatReplyMarkup(Update):
+    """
+    The default chat reply markup was changed. Can occur because new messages with reply markup were received or because an old reply markup was hidden by the user
+
+    :param chat_id: Chat identifier
+    :param reply_markup_message_id: Identifier of the message from which reply markup needs to be used; 0 if there is no default custom reply markup in the chat
+    """
+
+    _type: "str" = field(default="updateChatReplyMarkup", init=False, repr=False)
+    chat_id: "int" = 0
+    reply_markup_message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "reply_markup_message_id": self.reply_markup_message_id,
+        }
+
+@dataclass(slots=True)
+class UpdateChatBackground(Update):
+    """
+    The chat background was changed
+
+    :param chat_id: Chat identifier
+    :param background: The new chat background; may be null if background was reset to default
+    """
+
+    _type: "str" = field(default="updateChatBackground", init=False, repr=False)
+    chat_id: "int" = 0
+    background: "ChatBackground | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "background": self.background._to_json_dict() if self.background is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateChatTheme(Update):
+    """
+    The chat theme was changed
+
+    :param chat_id: Chat identifier
+    :param theme_name: The new name of the chat theme; may be empty if theme was reset to default
+    """
+
+    _type: "str" = field(default="updateChatTheme", init=False, repr=False)
+    chat_id: "int" = 0
+    theme_name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "theme_name": self.theme_name,
+        }
+
+@dataclass(slots=True)
+class UpdateChatUnreadMentionCount(Update):
+    """
+    The chat unread_mention_count has changed
+
+    :param chat_id: Chat identifier
+    :param unread_mention_count: The number of unread mention messages left in the chat
+    """
+
+    _type: "str" = field(default="updateChatUnreadMentionCount", init=False, repr=False)
+    chat_id: "int" = 0
+    unread_mention_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "unread_mention_count": self.unread_mention_count,
+        }
+
+@dataclass(slots=True)
+class UpdateChatUnreadReactionCount(Update):
+    """
+    The chat unread_reaction_count has changed
+
+    :param chat_id: Chat identifier
+    :param unread_reaction_count: The number of messages with unread reactions left in the chat
+    """
+
+    _type: "str" = field(default="updateChatUnreadReactionCount", init=False, repr=False)
+    chat_id: "int" = 0
+    unread_reaction_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "unread_reaction_count": self.unread_reaction_count,
+        }
+
+@dataclass(slots=True)
+class UpdateChatVideoChat(Update):
+    """
+    A chat video chat state has changed
+
+    :param chat_id: Chat identifier
+    :param video_chat: New value of video_chat
+    """
+
+    _type: "str" = field(default="updateChatVideoChat", init=False, repr=False)
+    chat_id: "int" = 0
+    video_chat: "VideoChat | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "video_chat": self.video_chat._to_json_dict() if self.video_chat is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateChatDefaultDisableNotification(Update):
+    """
+    The value of the default disable_notification parameter, used when a message is sent to the chat, was changed
+
+    :param chat_id: Chat identifier
+    :param default_disable_notification: The new default_disable_notification value
+    """
+
+    _type: "str" = field(default="updateChatDefaultDisableNotification", init=False, repr=False)
+    chat_id: "int" = 0
+    default_disable_notification: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "default_disable_notification": self.default_disable_notification,
+        }
+
+@dataclass(slots=True)
+class UpdateChatHasProtectedContent(Update):
+    """
+    A chat content was allowed or restricted for saving
+
+    :param chat_id: Chat identifier
+    :param has_protected_content: New value of has_protected_content
+    """
+
+    _type: "str" = field(default="updateChatHasProtectedContent", init=False, repr=False)
+    chat_id: "int" = 0
+    has_protected_content: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "has_protected_content": self.has_protected_content,
+        }
+
+@dataclass(slots=True)
+class UpdateChatIsTranslatable(Update):
+    """
+    Translation of chat messages was enabled or disabled
+
+    :param chat_id: Chat identifier
+    :param is_translatable: New value of is_translatable
+    """
+
+    _type: "str" = field(default="updateChatIsTranslatable", init=False, repr=False)
+    chat_id: "int" = 0
+    is_translatable: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "is_translatable": self.is_translatable,
+        }
+
+@dataclass(slots=True)
+class UpdateChatIsMarkedAsUnread(Update):
+    """
+    A chat was marked as unread or was read
+
+    :param chat_id: Chat identifier
+    :param is_marked_as_unread: New value of is_marked_as_unread
+    """
+
+    _type: "str" = field(default="updateChatIsMarkedAsUnread", init=False, repr=False)
+    chat_id: "int" = 0
+    is_marked_as_unread: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "is_marked_as_unread": self.is_marked_as_unread,
+        }
+
+@dataclass(slots=True)
+class UpdateChatViewAsTopics(Update):
+    """
+    A chat default appearance has changed
+
+    :param chat_id: Chat identifier
+    :param view_as_topics: New value of view_as_topics
+    """
+
+    _type: "str" = field(default="updateChatViewAsTopics", init=False, repr=False)
+    chat_id: "int" = 0
+    view_as_topics: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "view_as_topics": self.view_as_topics,
+        }
+
+@dataclass(slots=True)
+class UpdateChatBlockList(Update):
+    """
+    A chat was blocked or unblocked
+
+    :param chat_id: Chat identifier
+    :param block_list: Block list to which the chat is added; may be null if none
+    """
+
+    _type: "str" = field(default="updateChatBlockList", init=False, repr=False)
+    chat_id: "int" = 0
+    block_list: "BlockList | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "block_list": self.block_list._to_json_dict() if self.block_list is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateChatHasScheduledMessages(Update):
+    """
+    A chat's has_scheduled_messages field has changed
+
+    :param chat_id: Chat identifier
+    :param has_scheduled_messages: New value of has_scheduled_messages
+    """
+
+    _type: "str" = field(default="updateChatHasScheduledMessages", init=False, repr=False)
+    chat_id: "int" = 0
+    has_scheduled_messages: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "has_scheduled_messages": self.has_scheduled_messages,
+        }
+
+@dataclass(slots=True)
+class UpdateChatFolders(Update):
+    """
+    The list of chat folders or a chat folder has changed
+
+    :param chat_folders: The new list of chat folders
+    :param main_chat_list_position: Position of the main chat list among chat folders, 0-based
+    :param are_tags_enabled: True, if folder tags are enabled
+    """
+
+    _type: "str" = field(default="updateChatFolders", init=False, repr=False)
+    chat_folders: "list[ChatFolderInfo] | None" = None
+    main_chat_list_position: "int" = 0
+    are_tags_enabled: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_folders": _list_to_json(self.chat_folders),
+            "main_chat_list_position": self.main_chat_list_position,
+            "are_tags_enabled": self.are_tags_enabled,
+        }
+
+@dataclass(slots=True)
+class UpdateChatOnlineMemberCount(Update):
+    """
+    The number of online group members has changed. This update with non-zero number of online group members is sent only for currently opened chats. There is no guarantee that it is sent just after the number of online users has changed
+
+    :param chat_id: Identifier of the chat
+    :param online_member_count: New number of online members in the chat, or 0 if unknown
+    """
+
+    _type: "str" = field(default="updateChatOnlineMemberCount", init=False, repr=False)
+    chat_id: "int" = 0
+    online_member_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "online_member_count": self.online_member_count,
+        }
+
+@dataclass(slots=True)
+class UpdateSavedMessagesTopic(Update):
+    """
+    Basic information about a Saved Messages topic has changed. This update is guaranteed to come before the topic identifier is returned to the application
+
+    :param topic: New data about the topic
+    """
+
+    _type: "str" = field(default="updateSavedMessagesTopic", init=False, repr=False)
+    topic: "SavedMessagesTopic | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "topic": self.topic._to_json_dict() if self.topic is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateSavedMessagesTopicCount(Update):
+    """
+    Number of Saved Messages topics has changed
+
+    :param topic_count: Approximate total number of Saved Messages topics
+    """
+
+    _type: "str" = field(default="updateSavedMessagesTopicCount", init=False, repr=False)
+    topic_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "topic_count": self.topic_count,
+        }
+
+@dataclass(slots=True)
+class UpdateDirectMessagesChatTopic(Update):
+    """
+    Basic information about a topic in a channel direct messages chat administered by the current user has changed. This update is guaranteed to come before the topic identifier is returned to the application
+
+    :param topic: New data about the topic
+    """
+
+    _type: "str" = field(default="updateDirectMessagesChatTopic", init=False, repr=False)
+    topic: "DirectMessagesChatTopic | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "topic": self.topic._to_json_dict() if self.topic is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateTopicMessageCount(Update):
+    """
+    Number of messages in a topic has changed; for Saved Messages and channel direct messages chat topics only
+
+    :param chat_id: Identifier of the chat in topic of which the number of messages has changed
+    :param topic_id: Identifier of the topic
+    :param message_count: Approximate number of messages in the topics
+    """
+
+    _type: "str" = field(default="updateTopicMessageCount", init=False, repr=False)
+    chat_id: "int" = 0
+    topic_id: "MessageTopic | None" = None
+    message_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "topic_id": self.topic_id._to_json_dict() if self.topic_id is not None else None,
+            "message_count": self.message_count,
+        }
+
+@dataclass(slots=True)
+class UpdateQuickReplyShortcut(Update):
+    """
+    Basic information about a quick reply shortcut has changed. This update is guaranteed to come before the quick shortcut name is returned to the application
+
+    :param shortcut: New data about the shortcut
+    """
+
+    _type: "str" = field(default="updateQuickReplyShortcut", init=False, repr=False)
+    shortcut: "QuickReplyShortcut | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "shortcut": self.shortcut._to_json_dict() if self.shortcut is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateQuickReplyShortcutDeleted(Update):
+    """
+    A quick reply shortcut and all its messages were deleted
+
+    :param shortcut_id: The identifier of the deleted shortcut
+    """
+
+    _type: "str" = field(default="updateQuickReplyShortcutDeleted", init=False, repr=False)
+    shortcut_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "shortcut_id": self.shortcut_id,
+        }
+
+@dataclass(slots=True)
+class UpdateQuickReplyShortcuts(Update):
+    """
+    The list of quick reply shortcuts has changed
+
+    :param shortcut_ids: The new list of identifiers of quick reply shortcuts
+    """
+
+    _type: "str" = field(default="updateQuickReplyShortcuts", init=False, repr=False)
+    shortcut_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "shortcut_ids": self.shortcut_ids,
+        }
+
+@dataclass(slots=True)
+class UpdateQuickReplyShortcutMessages(Update):
+    """
+    The list of quick reply shortcut messages has changed
+
+    :param shortcut_id: The identifier of the shortcut
+    :param messages: The new list of quick reply messages for the shortcut in order from the first to the last sent
+    """
+
+    _type: "str" = field(default="updateQuickReplyShortcutMessages", init=False, repr=False)
+    shortcut_id: "int" = 0
+    messages: "list[QuickReplyMessage] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "shortcut_id": self.shortcut_id,
+            "messages": _list_to_json(self.messages),
+        }
+
+@dataclass(slots=True)
+class UpdateForumTopicInfo(Update):
+    """
+    Basic information about a topic in a forum chat was changed
+
+    :param info: New information about the topic
+    """
+
+    _type: "str" = field(default="updateForumTopicInfo", init=False, repr=False)
+    info: "ForumTopicInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "info": self.info._to_json_dict() if self.info is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateForumTopic(Update):
+    """
+    Information about a topic in a forum chat was changed
+
+    :param chat_id: Chat identifier
+    :param message_thread_id: Message thread identifier of the topic
+    :param is_pinned: True, if the topic is pinned in the topic list
+    :param last_read_inbox_message_id: Identifier of the last read incoming message
+    :param last_read_outbox_message_id: Identifier of the last read outgoing message
+    :param unread_mention_count: Number of unread messages with a mention/reply in the topic
+    :param unread_reaction_count: Number of messages with unread reactions in the topic
+    :param notification_settings: Notification settings for the topic
+    """
+
+    _type: "str" = field(default="updateForumTopic", init=False, repr=False)
+    chat_id: "int" = 0
+    message_thread_id: "int" = 0
+    is_pinned: "bool" = False
+    last_read_inbox_message_id: "int" = 0
+    last_read_outbox_message_id: "int" = 0
+    unread_mention_count: "int" = 0
+    unread_reaction_count: "int" = 0
+    notification_settings: "ChatNotificationSettings | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_thread_id": self.message_thread_id,
+            "is_pinned": self.is_pinned,
+            "last_read_inbox_message_id": self.last_read_inbox_message_id,
+            "last_read_outbox_message_id": self.last_read_outbox_message_id,
+            "unread_mention_count": self.unread_mention_count,
+            "unread_reaction_count": self.unread_reaction_count,
+            "notification_settings": self.notification_settings._to_json_dict() if self.notification_settings is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateScopeNotificationSettings(Update):
+    """
+    Notification settings for some type of chats were updated
+
+    :param scope: Types of chats for which notification settings were updated
+    :param notification_settings: The new notification settings
+    """
+
+    _type: "str" = field(default="updateScopeNotificationSettings", init=False, repr=False)
+    scope: "NotificationSettingsScope | None" = None
+    notification_settings: "ScopeNotificationSettings | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "scope": self.scope._to_json_dict() if self.scope is not None else None,
+            "notification_settings": self.notification_settings._to_json_dict() if self.notification_settings is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateReactionNotificationSettings(Update):
+    """
+    Notification settings for reactions were updated
+
+    :param notification_settings: The new notification settings
+    """
+
+    _type: "str" = field(default="updateReactionNotificationSettings", init=False, repr=False)
+    notification_settings: "ReactionNotificationSettings | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "notification_settings": self.notification_settings._to_json_dict() if self.notification_settings is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateNotification(Update):
+    """
+    A notification was changed
+
+    :param notification_group_id: Unique notification group identifier
+    :param notification: Changed notification
+    """
+
+    _type: "str" = field(default="updateNotification", init=False, repr=False)
+    notification_group_id: "int" = 0
+    notification: "Notification | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "notification_group_id": self.notification_group_id,
+            "notification": self.notification._to_json_dict() if self.notification is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateNotificationGroup(Update):
+    """
+    A list of active notifications in a notification group has changed
+
+    :param notification_group_id: Unique notification group identifier
+    :param type: New type of the notification group
+    :param chat_id: Identifier of a chat to which all notifications in the group belong
+    :param notification_settings_chat_id: Chat identifier, which notification settings must be applied to the added notifications
+    :param notification_sound_id: Identifier of the notification sound to be played; 0 if sound is disabled
+    :param total_count: Total number of unread notifications in the group, can be bigger than number of active notifications
+    :param added_notifications: List of added group notifications, sorted by notification identifier
+    :param removed_notification_ids: Identifiers of removed group notifications, sorted by notification identifier
+    """
+
+    _type: "str" = field(default="updateNotificationGroup", init=False, repr=False)
+    notification_group_id: "int" = 0
+    type: "NotificationGroupType | None" = None
+    chat_id: "int" = 0
+    notification_settings_chat_id: "int" = 0
+    notification_sound_id: "int" = 0
+    total_count: "int" = 0
+    added_notifications: "list[Notification] | None" = None
+    removed_notification_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "notification_group_id": self.notification_group_id,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "chat_id": self.chat_id,
+            "notification_settings_chat_id": self.notification_settings_chat_id,
+            "notification_sound_id": self.notification_sound_id,
+            "total_count": self.total_count,
+            "added_notifications": _list_to_json(self.added_notifications),
+            "removed_notification_ids": self.removed_notification_ids,
+        }
+
+@dataclass(slots=True)
+class UpdateActiveNotifications(Update):
+    """
+    Contains active notifications that were shown on previous application launches. This update is sent only if the message database is used. In that case it comes once before any updateNotification and updateNotificationGroup update
+
+    :param groups: Lists of active notification groups
+    """
+
+    _type: "str" = field(default="updateActiveNotifications", init=False, repr=False)
+    groups: "list[NotificationGroup] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "groups": _list_to_json(self.groups),
+        }
+
+@dataclass(slots=True)
+class UpdateHavePendingNotifications(Update):
+    """
+    Describes whether there are some pending notification updates. Can be used to prevent application from killing, while there are some pending notifications
+
+    :param have_delayed_notifications: True, if there are some delayed notification updates, which will be sent soon
+    :param have_unreceived_notifications: True, if there can be some yet unreceived notifications, which are being fetched from the server
+    """
+
+    _type: "str" = field(default="updateHavePendingNotifications", init=False, repr=False)
+    have_delayed_notifications: "bool" = False
+    have_unreceived_notifications: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "have_delayed_notifications": self.have_delayed_notifications,
+            "have_unreceived_notifications": self.have_unreceived_notifications,
+        }
+
+@dataclass(slots=True)
+class UpdateDeleteMessages(Update):
+    """
+    Some messages were deleted
+
+    :param chat_id: Chat identifier
+    :param message_ids: Identifiers of the deleted messages
+    :param is_permanent: True, if the messages are permanently deleted by a user (as opposed to just becoming inaccessible)
+    :param from_cache: True, if the messages are deleted only from the cache and can possibly be retrieved again in the future
+    """
+
+    _type: "str" = field(default="updateDeleteMessages", init=False, repr=False)
+    chat_id: "int" = 0
+    message_ids: "list[int] | None" = None
+    is_permanent: "bool" = False
+    from_cache: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_ids": self.message_ids,
+            "is_permanent": self.is_permanent,
+            "from_cache": self.from_cache,
+        }
+
+@dataclass(slots=True)
+class UpdateChatAction(Update):
+    """
+    A message sender activity in the chat has changed
+
+    :param chat_id: Chat identifier
+    :param message_thread_id: If not 0, the message thread identifier in which the action was performed
+    :param sender_id: Identifier of a message sender performing the action
+    :param action: The action
+    """
+
+    _type: "str" = field(default="updateChatAction", init=False, repr=False)
+    chat_id: "int" = 0
+    message_thread_id: "int" = 0
+    sender_id: "MessageSender | None" = None
+    action: "ChatAction | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_thread_id": self.message_thread_id,
+            "sender_id": self.sender_id._to_json_dict() if self.sender_id is not None else None,
+            "action": self.action._to_json_dict() if self.action is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateUserStatus(Update):
+    """
+    The user went online or offline
+
+    :param user_id: User identifier
+    :param status: New status of the user
+    """
+
+    _type: "str" = field(default="updateUserStatus", init=False, repr=False)
+    user_id: "int" = 0
+    status: "UserStatus | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "status": self.status._to_json_dict() if self.status is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateUser(Update):
+    """
+    Some data of a user has changed. This update is guaranteed to come before the user identifier is returned to the application
+
+    :param user: New data about the user
+    """
+
+    _type: "str" = field(default="updateUser", init=False, repr=False)
+    user: "User | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user": self.user._to_json_dict() if self.user is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateBasicGroup(Update):
+    """
+    Some data of a basic group has changed. This update is guaranteed to come before the basic group identifier is returned to the application
+
+    :param basic_group: New data about the group
+    """
+
+    _type: "str" = field(default="updateBasicGroup", init=False, repr=False)
+    basic_group: "BasicGroup | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "basic_group": self.basic_group._to_json_dict() if self.basic_group is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateSupergroup(Update):
+    """
+    Some data of a supergroup or a channel has changed. This update is guaranteed to come before the supergroup identifier is returned to the application
+
+    :param supergroup: New data about the supergroup
+    """
+
+    _type: "str" = field(default="updateSupergroup", init=False, repr=False)
+    supergroup: "Supergroup | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup": self.supergroup._to_json_dict() if self.supergroup is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateSecretChat(Update):
+    """
+    Some data of a secret chat has changed. This update is guaranteed to come before the secret chat identifier is returned to the application
+
+    :param secret_chat: New data about the secret chat
+    """
+
+    _type: "str" = field(default="updateSecretChat", init=False, repr=False)
+    secret_chat: "SecretChat | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "secret_chat": self.secret_chat._to_json_dict() if self.secret_chat is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateUserFullInfo(Update):
+    """
+    Some data in userFullInfo has been changed
+
+    :param user_id: User identifier
+    :param user_full_info: New full information about the user
+    """
+
+    _type: "str" = field(default="updateUserFullInfo", init=False, repr=False)
+    user_id: "int" = 0
+    user_full_info: "UserFullInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "user_full_info": self.user_full_info._to_json_dict() if self.user_full_info is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateBasicGroupFullInfo(Update):
+    """
+    Some data in basicGroupFullInfo has been changed
+
+    :param basic_group_id: Identifier of a basic group
+    :param basic_group_full_info: New full information about the group
+    """
+
+    _type: "str" = field(default="updateBasicGroupFullInfo", init=False, repr=False)
+    basic_group_id: "int" = 0
+    basic_group_full_info: "BasicGroupFullInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "basic_group_id": self.basic_group_id,
+            "basic_group_full_info": self.basic_group_full_info._to_json_dict() if self.basic_group_full_info is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateSupergroupFullInfo(Update):
+    """
+    Some data in supergroupFullInfo has been changed
+
+    :param supergroup_id: Identifier of the supergroup or channel
+    :param supergroup_full_info: New full information about the supergroup
+    """
+
+    _type: "str" = field(default="updateSupergroupFullInfo", init=False, repr=False)
+    supergroup_id: "int" = 0
+    supergroup_full_info: "SupergroupFullInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+            "supergroup_full_info": self.supergroup_full_info._to_json_dict() if self.supergroup_full_info is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateServiceNotification(Update):
+    """
+    A service notification from the server was received. Upon receiving this the application must show a popup with the content of the notification
+
+    :param type: Notification type. If type begins with "AUTH_KEY_DROP_", then two buttons "Cancel" and "Log out" must be shown under notification; if user presses the second, all local data must be destroyed using Destroy method
+    :param content: Notification content
+    """
+
+    _type: "str" = field(default="updateServiceNotification", init=False, repr=False)
+    type: "str" = ""
+    content: "MessageContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "type": self.type,
+            "content": self.content._to_json_dict() if self.content is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateFile(Update):
+    """
+    Information about a file was updated
+
+    :param file: New data about the file
+    """
+
+    _type: "str" = field(default="updateFile", init=False, repr=False)
+    file: "File | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file": self.file._to_json_dict() if self.file is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateFileGenerationStart(Update):
+    """
+    The file generation process needs to be started by the application. Use setFileGenerationProgress and finishFileGeneration to generate the file
+
+    :param generation_id: Unique identifier for the generation process
+    :param original_path: The original path specified by the application in inputFileGenerated
+    :param destination_path: The path to a file that must be created and where the new file must be generated by the application.
+     If the application has no access to the path, it can use writeGeneratedFilePart to generate the file
+    :param conversion: If the conversion is "#url#" than original_path contains an HTTP/HTTPS URL of a file that must be downloaded by the application.
+     Otherwise, this is the conversion specified by the application in inputFileGenerated
+    """
+
+    _type: "str" = field(default="updateFileGenerationStart", init=False, repr=False)
+    generation_id: "int" = 0
+    original_path: "str" = ""
+    destination_path: "str" = ""
+    conversion: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "generation_id": self.generation_id,
+            "original_path": self.original_path,
+            "destination_path": self.destination_path,
+            "conversion": self.conversion,
+        }
+
+@dataclass(slots=True)
+class UpdateFileGenerationStop(Update):
+    """
+    File generation is no longer needed
+
+    :param generation_id: Unique identifier for the generation process
+    """
+
+    _type: "str" = field(default="updateFileGenerationStop", init=False, repr=False)
+    generation_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "generation_id": self.generation_id,
+        }
+
+@dataclass(slots=True)
+class UpdateFileDownloads(Update):
+    """
+    The state of the file download list has changed
+
+    :param total_size: Total size of files in the file download list, in bytes
+    :param total_count: Total number of files in the file download list
+    :param downloaded_size: Total downloaded size of files in the file download list, in bytes
+    """
+
+    _type: "str" = field(default="updateFileDownloads", init=False, repr=False)
+    total_size: "int" = 0
+    total_count: "int" = 0
+    downloaded_size: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "total_size": self.total_size,
+            "total_count": self.total_count,
+            "downloaded_size": self.downloaded_size,
+        }
+
+@dataclass(slots=True)
+class UpdateFileAddedToDownloads(Update):
+    """
+    A file was added to the file download list. This update is sent only after file download list is loaded for the first time
+
+    :param file_download: The added file download
+    :param counts: New number of being downloaded and recently downloaded files found
+    """
+
+    _type: "str" = field(default="updateFileAddedToDownloads", init=False, repr=False)
+    file_download: "FileDownload | None" = None
+    counts: "DownloadedFileCounts | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_download": self.file_download._to_json_dict() if self.file_download is not None else None,
+            "counts": self.counts._to_json_dict() if self.counts is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateFileDownload(Update):
+    """
+    A file download was changed. This update is sent only after file download list is loaded for the first time
+
+    :param file_id: File identifier
+    :param complete_date: Point in time (Unix timestamp) when the file downloading was completed; 0 if the file downloading isn't completed
+    :param is_paused: True, if downloading of the file is paused
+    :param counts: New number of being downloaded and recently downloaded files found
+    """
+
+    _type: "str" = field(default="updateFileDownload", init=False, repr=False)
+    file_id: "int" = 0
+    complete_date: "int" = 0
+    is_paused: "bool" = False
+    counts: "DownloadedFileCounts | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_id": self.file_id,
+            "complete_date": self.complete_date,
+            "is_paused": self.is_paused,
+            "counts": self.counts._to_json_dict() if self.counts is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateFileRemovedFromDownloads(Update):
+    """
+    A file was removed from the file download list. This update is sent only after file download list is loaded for the first time
+
+    :param file_id: File identifier
+    :param counts: New number of being downloaded and recently downloaded files found
+    """
+
+    _type: "str" = field(default="updateFileRemovedFromDownloads", init=False, repr=False)
+    file_id: "int" = 0
+    counts: "DownloadedFileCounts | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_id": self.file_id,
+            "counts": self.counts._to_json_dict() if self.counts is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateApplicationVerificationRequired(Update):
+    """
+    A request can't be completed unless application verification is performed; for official mobile applications only. The method setApplicationVerificationToken must be called once the verification is completed or failed
+
+    :param verification_id: Unique identifier for the verification process
+    :param nonce: Unique base64url-encoded nonce for the classic Play Integrity verification (https://developer.android.com/google/play/integrity/classic) for Android,
+     or a unique string to compare with verify_nonce field from a push notification for iOS
+    :param cloud_project_number: Cloud project number to pass to the Play Integrity API on Android
+    """
+
+    _type: "str" = field(default="updateApplicationVerificationRequired", init=False, repr=False)
+    verification_id: "int" = 0
+    nonce: "str" = ""
+    cloud_project_number: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "verification_id": self.verification_id,
+            "nonce": self.nonce,
+            "cloud_project_number": self.cloud_project_number,
+        }
+
+@dataclass(slots=True)
+class UpdateApplicationRecaptchaVerificationRequired(Update):
+    """
+    A request can't be completed unless reCAPTCHA verification is performed; for official mobile applications only. The method setApplicationVerificationToken must be called once the verification is completed or failed
+
+    :param verification_id: Unique identifier for the verification process
+    :param action: The action for the check
+    :param recaptcha_key_id: Identifier of the reCAPTCHA key
+    """
+
+    _type: "str" = field(default="updateApplicationRecaptchaVerificationRequired", init=False, repr=False)
+    verification_id: "int" = 0
+    action: "str" = ""
+    recaptcha_key_id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "verification_id": self.verification_id,
+            "action": self.action,
+            "recaptcha_key_id": self.recaptcha_key_id,
+        }
+
+@dataclass(slots=True)
+class UpdateCall(Update):
+    """
+    New call was created or information about a call was updated
+
+    :param call: New data about a call
+    """
+
+    _type: "str" = field(default="updateCall", init=False, repr=False)
+    call: "Call | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "call": self.call._to_json_dict() if self.call is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateGroupCall(Update):
+    """
+    Information about a group call was updated
+
+    :param group_call: New data about the group call
+    """
+
+    _type: "str" = field(default="updateGroupCall", init=False, repr=False)
+    group_call: "GroupCall | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call": self.group_call._to_json_dict() if self.group_call is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateGroupCallParticipant(Update):
+    """
+    Information about a group call participant was changed. The updates are sent only after the group call is received through getGroupCall and only if the call is joined or being joined
+
+    :param group_call_id: Identifier of the group call
+    :param participant: New data about the participant
+    """
+
+    _type: "str" = field(default="updateGroupCallParticipant", init=False, repr=False)
+    group_call_id: "int" = 0
+    participant: "GroupCallParticipant | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "participant": self.participant._to_json_dict() if self.participant is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateGroupCallParticipants(Update):
+    """
+    The list of group call participants that can send and receive encrypted call data has changed; for group calls not bound to a chat only
+
+    :param group_call_id: Identifier of the group call
+    :param participant_user_ids: New list of group call participant user identifiers. The identifiers may be invalid or the corresponding users may be unknown.
+     The participants must be shown in the list of group call participants even if there is no information about them
+    """
+
+    _type: "str" = field(default="updateGroupCallParticipants", init=False, repr=False)
+    group_call_id: "int" = 0
+    participant_user_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "participant_user_ids": self.participant_user_ids,
+        }
+
+@dataclass(slots=True)
+class UpdateGroupCallVerificationState(Update):
+    """
+    The verification state of an encrypted group call has changed; for group calls not bound to a chat only
+
+    :param group_call_id: Identifier of the group call
+    :param generation: The call state generation to which the emoji corresponds. If generation is different for two users, then their emoji may be also different
+    :param emojis: Group call state fingerprint represented as 4 emoji; may be empty if the state isn't verified yet
+    """
+
+    _type: "str" = field(default="updateGroupCallVerificationState", init=False, repr=False)
+    group_call_id: "int" = 0
+    generation: "int" = 0
+    emojis: "list[str] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "generation": self.generation,
+            "emojis": self.emojis,
+        }
+
+@dataclass(slots=True)
+class UpdateNewCallSignalingData(Update):
+    """
+    New call signaling data arrived
+
+    :param call_id: The call identifier
+    :param data: The data
+    """
+
+    _type: "str" = field(default="updateNewCallSignalingData", init=False, repr=False)
+    call_id: "int" = 0
+    data: "bytes" = b""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "call_id": self.call_id,
+            "data": _bytes_to_json(self.data),
+        }
+
+@dataclass(slots=True)
+class UpdateUserPrivacySettingRules(Update):
+    """
+    Some privacy setting rules have been changed
+
+    :param setting: The privacy setting
+    :param rules: New privacy rules
+    """
+
+    _type: "str" = field(default="updateUserPrivacySettingRules", init=False, repr=False)
+    setting: "UserPrivacySetting | None" = None
+    rules: "UserPrivacySettingRules | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "setting": self.setting._to_json_dict() if self.setting is not None else None,
+            "rules": self.rules._to_json_dict() if self.rules is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateUnreadMessageCount(Update):
+    """
+    Number of unread messages in a chat list has changed. This update is sent only if the message database is used
+
+    :param chat_list: The chat list with changed number of unread messages
+    :param unread_count: Total number of unread messages
+    :param unread_unmuted_count: Total number of unread messages in unmuted chats
+    """
+
+    _type: "str" = field(default="updateUnreadMessageCount", init=False, repr=False)
+    chat_list: "ChatList | None" = None
+    unread_count: "int" = 0
+    unread_unmuted_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_list": self.chat_list._to_json_dict() if self.chat_list is not None else None,
+            "unread_count": self.unread_count,
+            "unread_unmuted_count": self.unread_unmuted_count,
+        }
+
+@dataclass(slots=True)
+class UpdateUnreadChatCount(Update):
+    """
+    Number of unread chats, i.e. with unread messages or marked as unread, has changed. This update is sent only if the message database is used
+
+    :param chat_list: The chat list with changed number of unread messages
+    :param total_count: Approximate total number of chats in the chat list
+    :param unread_count: Total number of unread chats
+    :param unread_unmuted_count: Total number of unread unmuted chats
+    :param marked_as_unread_count: Total number of chats marked as unread
+    :param marked_as_unread_unmuted_count: Total number of unmuted chats marked as unread
+    """
+
+    _type: "str" = field(default="updateUnreadChatCount", init=False, repr=False)
+    chat_list: "ChatList | None" = None
+    total_count: "int" = 0
+    unread_count: "int" = 0
+    unread_unmuted_count: "int" = 0
+    marked_as_unread_count: "int" = 0
+    marked_as_unread_unmuted_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_list": self.chat_list._to_json_dict() if self.chat_list is not None else None,
+            "total_count": self.total_count,
+            "unread_count": self.unread_count,
+            "unread_unmuted_count": self.unread_unmuted_count,
+            "marked_as_unread_count": self.marked_as_unread_count,
+            "marked_as_unread_unmuted_count": self.marked_as_unread_unmuted_count,
+        }
+
+@dataclass(slots=True)
+class UpdateStory(Update):
+    """
+    A story was changed
+
+    :param story: The new information about the story
+    """
+
+    _type: "str" = field(default="updateStory", init=False, repr=False)
+    story: "Story | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story": self.story._to_json_dict() if self.story is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateStoryDeleted(Update):
+    """
+    A story became inaccessible
+
+    :param story_poster_chat_id: Identifier of the chat that posted the story
+    :param story_id: Story identifier
+    """
+
+    _type: "str" = field(default="updateStoryDeleted", init=False, repr=False)
+    story_poster_chat_id: "int" = 0
+    story_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_poster_chat_id": self.story_poster_chat_id,
+            "story_id": self.story_id,
+        }
+
+@dataclass(slots=True)
+class UpdateStoryPostSucceeded(Update):
+    """
+    A story has been successfully posted
+
+    :param story: The posted story
+    :param old_story_id: The previous temporary story identifier
+    """
+
+    _type: "str" = field(default="updateStoryPostSucceeded", init=False, repr=False)
+    story: "Story | None" = None
+    old_story_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story": self.story._to_json_dict() if self.story is not None else None,
+            "old_story_id": self.old_story_id,
+        }
+
+@dataclass(slots=True)
+class UpdateStoryPostFailed(Update):
+    """
+    A story failed to post. If the story posting is canceled, then updateStoryDeleted will be received instead of this update
+
+    :param story: The failed to post story
+    :param error: The cause of the story posting failure
+    :param error_type: Type of the error; may be null if unknown
+    """
+
+    _type: "str" = field(default="updateStoryPostFailed", init=False, repr=False)
+    story: "Story | None" = None
+    error: "Error | None" = None
+    error_type: "CanPostStoryResult | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story": self.story._to_json_dict() if self.story is not None else None,
+            "error": self.error._to_json_dict() if self.error is not None else None,
+            "error_type": self.error_type._to_json_dict() if self.error_type is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateChatActiveStories(Update):
+    """
+    The list of active stories posted by a specific chat has changed
+
+    :param active_stories: The new list of active stories
+    """
+
+    _type: "str" = field(default="updateChatActiveStories", init=False, repr=False)
+    active_stories: "ChatActiveStories | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "active_stories": self.active_stories._to_json_dict() if self.active_stories is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateStoryListChatCount(Update):
+    """
+    Number of chats in a story list has changed
+
+    :param story_list: The story list
+    :param chat_count: Approximate total number of chats with active stories in the list
+    """
+
+    _type: "str" = field(default="updateStoryListChatCount", init=False, repr=False)
+    story_list: "StoryList | None" = None
+    chat_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_list": self.story_list._to_json_dict() if self.story_list is not None else None,
+            "chat_count": self.chat_count,
+        }
+
+@dataclass(slots=True)
+class UpdateStoryStealthMode(Update):
+    """
+    Story stealth mode settings have changed
+
+    :param active_until_date: Point in time (Unix timestamp) until stealth mode is active; 0 if it is disabled
+    :param cooldown_until_date: Point in time (Unix timestamp) when stealth mode can be enabled again; 0 if there is no active cooldown
+    """
+
+    _type: "str" = field(default="updateStoryStealthMode", init=False, repr=False)
+    active_until_date: "int" = 0
+    cooldown_until_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "active_until_date": self.active_until_date,
+            "cooldown_until_date": self.cooldown_until_date,
+        }
+
+@dataclass(slots=True)
+class UpdateOption(Update):
+    """
+    An option changed its value
+
+    :param name: The option name
+    :param value: The new option value
+    """
+
+    _type: "str" = field(default="updateOption", init=False, repr=False)
+    name: "str" = ""
+    value: "OptionValue | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name,
+            "value": self.value._to_json_dict() if self.value is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateStickerSet(Update):
+    """
+    A sticker set has changed
+
+    :param sticker_set: The sticker set
+    """
+
+    _type: "str" = field(default="updateStickerSet", init=False, repr=False)
+    sticker_set: "StickerSet | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker_set": self.sticker_set._to_json_dict() if self.sticker_set is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateInstalledStickerSets(Update):
+    """
+    The list of installed sticker sets was updated
+
+    :param sticker_type: Type of the affected stickers
+    :param sticker_set_ids: The new list of installed ordinary sticker sets
+    """
+
+    _type: "str" = field(default="updateInstalledStickerSets", init=False, repr=False)
+    sticker_type: "StickerType | None" = None
+    sticker_set_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker_type": self.sticker_type._to_json_dict() if self.sticker_type is not None else None,
+            "sticker_set_ids": self.sticker_set_ids,
+        }
+
+@dataclass(slots=True)
+class UpdateTrendingStickerSets(Update):
+    """
+    The list of trending sticker sets was updated or some of them were viewed
+
+    :param sticker_type: Type of the affected stickers
+    :param sticker_sets: The prefix of the list of trending sticker sets with the newest trending sticker sets
+    """
+
+    _type: "str" = field(default="updateTrendingStickerSets", init=False, repr=False)
+    sticker_type: "StickerType | None" = None
+    sticker_sets: "TrendingStickerSets | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker_type": self.sticker_type._to_json_dict() if self.sticker_type is not None else None,
+            "sticker_sets": self.sticker_sets._to_json_dict() if self.sticker_sets is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateRecentStickers(Update):
+    """
+    The list of recently used stickers was updated
+
+    :param is_attached: True, if the list of stickers attached to photo or video files was updated; otherwise, the list of sent stickers is updated
+    :param sticker_ids: The new list of file identifiers of recently used stickers
+    """
+
+    _type: "str" = field(default="updateRecentStickers", init=False, repr=False)
+    is_attached: "bool" = False
+    sticker_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_attached": self.is_attached,
+            "sticker_ids": self.sticker_ids,
+        }
+
+@dataclass(slots=True)
+class UpdateFavoriteStickers(Update):
+    """
+    The list of favorite stickers was updated
+
+    :param sticker_ids: The new list of file identifiers of favorite stickers
+    """
+
+    _type: "str" = field(default="updateFavoriteStickers", init=False, repr=False)
+    sticker_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker_ids": self.sticker_ids,
+        }
+
+@dataclass(slots=True)
+class UpdateSavedAnimations(Update):
+    """
+    The list of saved animations was updated
+
+    :param animation_ids: The new list of file identifiers of saved animations
+    """
+
+    _type: "str" = field(default="updateSavedAnimations", init=False, repr=False)
+    animation_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "animation_ids": self.animation_ids,
+        }
+
+@dataclass(slots=True)
+class UpdateSavedNotificationSounds(Update):
+    """
+    The list of saved notification sounds was updated. This update may not be sent until information about a notification sound was requested for the first time
+
+    :param notification_sound_ids: The new list of identifiers of saved notification sounds
+    """
+
+    _type: "str" = field(default="updateSavedNotificationSounds", init=False, repr=False)
+    notification_sound_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "notification_sound_ids": self.notification_sound_ids,
+        }
+
+@dataclass(slots=True)
+class UpdateDefaultBackground(Update):
+    """
+    The default background has changed
+
+    :param for_dark_theme: True, if default background for dark theme has changed
+    :param background: The new default background; may be null
+    """
+
+    _type: "str" = field(default="updateDefaultBackground", init=False, repr=False)
+    for_dark_theme: "bool" = False
+    background: "Background | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "for_dark_theme": self.for_dark_theme,
+            "background": self.background._to_json_dict() if self.background is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateChatThemes(Update):
+    """
+    The list of available chat themes has changed
+
+    :param chat_themes: The new list of chat themes
+    """
+
+    _type: "str" = field(default="updateChatThemes", init=False, repr=False)
+    chat_themes: "list[ChatTheme] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_themes": _list_to_json(self.chat_themes),
+        }
+
+@dataclass(slots=True)
+class UpdateAccentColors(Update):
+    """
+    The list of supported accent colors has changed
+
+    :param colors: Information about supported colors; colors with identifiers 0 (red), 1 (orange), 2 (purple/violet), 3 (green), 4 (cyan), 5 (blue), 6 (pink) must always be supported
+     and aren't included in the list. The exact colors for the accent colors with identifiers 0-6 must be taken from the app theme
+    :param available_accent_color_ids: The list of accent color identifiers, which can be set through setAccentColor and setChatAccentColor. The colors must be shown in the specified order
+    """
+
+    _type: "str" = field(default="updateAccentColors", init=False, repr=False)
+    colors: "list[AccentColor] | None" = None
+    available_accent_color_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "colors": _list_to_json(self.colors),
+            "available_accent_color_ids": self.available_accent_color_ids,
+        }
+
+@dataclass(slots=True)
+class UpdateProfileAccentColors(Update):
+    """
+    The list of supported accent colors for user profiles has changed
+
+    :param colors: Information about supported colors
+    :param available_accent_color_ids: The list of accent color identifiers, which can be set through setProfileAccentColor and setChatProfileAccentColor. The colors must be shown in the specified order
+    """
+
+    _type: "str" = field(default="updateProfileAccentColors", init=False, repr=False)
+    colors: "list[ProfileAccentColor] | None" = None
+    available_accent_color_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "colors": _list_to_json(self.colors),
+            "available_accent_color_ids": self.available_accent_color_ids,
+        }
+
+@dataclass(slots=True)
+class UpdateLanguagePackStrings(Update):
+    """
+    Some language pack strings have been updated
+
+    :param localization_target: Localization target to which the language pack belongs
+    :param language_pack_id: Identifier of the updated language pack
+    :param strings: List of changed language pack strings; empty if all strings have changed
+    """
+
+    _type: "str" = field(default="updateLanguagePackStrings", init=False, repr=False)
+    localization_target: "str" = ""
+    language_pack_id: "str" = ""
+    strings: "list[LanguagePackString] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "localization_target": self.localization_target,
+            "language_pack_id": self.language_pack_id,
+            "strings": _list_to_json(self.strings),
+        }
+
+@dataclass(slots=True)
+class UpdateConnectionState(Update):
+    """
+    The connection state has changed. This update must be used only to show a human-readable description of the connection state
+
+    :param state: The new connection state
+    """
+
+    _type: "str" = field(default="updateConnectionState", init=False, repr=False)
+    state: "ConnectionState | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "state": self.state._to_json_dict() if self.state is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateFreezeState(Update):
+    """
+    The freeze state of the current user's account has changed
+
+    :param is_frozen: True, if the account is frozen
+    :param freezing_date: Point in time (Unix timestamp) when the account was frozen; 0 if the account isn't frozen
+    :param deletion_date: Point in time (Unix timestamp) when the account will be deleted and can't be unfrozen; 0 if the account isn't frozen
+    :param appeal_link: The link to open to send an appeal to unfreeze the account
+    """
+
+    _type: "str" = field(default="updateFreezeState", init=False, repr=False)
+    is_frozen: "bool" = False
+    freezing_date: "int" = 0
+    deletion_date: "int" = 0
+    appeal_link: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_frozen": self.is_frozen,
+            "freezing_date": self.freezing_date,
+            "deletion_date": self.deletion_date,
+            "appeal_link": self.appeal_link,
+        }
+
+@dataclass(slots=True)
+class UpdateTermsOfService(Update):
+    """
+    New terms of service must be accepted by the user. If the terms of service are declined, then the deleteAccount method must be called with the reason "Decline ToS update"
+
+    :param terms_of_service_id: Identifier of the terms of service
+    :param terms_of_service: The new terms of service
+    """
+
+    _type: "str" = field(default="updateTermsOfService", init=False, repr=False)
+    terms_of_service_id: "str" = ""
+    terms_of_service: "TermsOfService | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "terms_of_service_id": self.terms_of_service_id,
+            "terms_of_service": self.terms_of_service._to_json_dict() if self.terms_of_service is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateUnconfirmedSession(Update):
+    """
+    The first unconfirmed session has changed
+
+    :param session: The unconfirmed session; may be null if none
+    """
+
+    _type: "str" = field(default="updateUnconfirmedSession", init=False, repr=False)
+    session: "UnconfirmedSession | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "session": self.session._to_json_dict() if self.session is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateAttachmentMenuBots(Update):
+    """
+    The list of bots added to attachment or side menu has changed
+
+    :param bots: The new list of bots. The bots must not be shown on scheduled messages screen
+    """
+
+    _type: "str" = field(default="updateAttachmentMenuBots", init=False, repr=False)
+    bots: "list[AttachmentMenuBot] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bots": _list_to_json(self.bots),
+        }
+
+@dataclass(slots=True)
+class UpdateWebAppMessageSent(Update):
+    """
+    A message was sent by an opened Web App, so the Web App needs to be closed
+
+    :param web_app_launch_id: Identifier of Web App launch
+    """
+
+    _type: "str" = field(default="updateWebAppMessageSent", init=False, repr=False)
+    web_app_launch_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "web_app_launch_id": self.web_app_launch_id,
+        }
+
+@dataclass(slots=True)
+class UpdateActiveEmojiReactions(Update):
+    """
+    The list of active emoji reactions has changed
+
+    :param emojis: The new list of active emoji reactions
+    """
+
+    _type: "str" = field(default="updateActiveEmojiReactions", init=False, repr=False)
+    emojis: "list[str] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "emojis": self.emojis,
+        }
+
+@dataclass(slots=True)
+class UpdateAvailableMessageEffects(Update):
+    """
+    The list of available message effects has changed
+
+    :param reaction_effect_ids: The new list of available message effects from emoji reactions
+    :param sticker_effect_ids: The new list of available message effects from Premium stickers
+    """
+
+    _type: "str" = field(default="updateAvailableMessageEffects", init=False, repr=False)
+    reaction_effect_ids: "list[int] | None" = None
+    sticker_effect_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "reaction_effect_ids": self.reaction_effect_ids,
+            "sticker_effect_ids": self.sticker_effect_ids,
+        }
+
+@dataclass(slots=True)
+class UpdateDefaultReactionType(Update):
+    """
+    The type of default reaction has changed
+
+    :param reaction_type: The new type of the default reaction
+    """
+
+    _type: "str" = field(default="updateDefaultReactionType", init=False, repr=False)
+    reaction_type: "ReactionType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "reaction_type": self.reaction_type._to_json_dict() if self.reaction_type is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateDefaultPaidReactionType(Update):
+    """
+    The type of default paid reaction has changed
+
+    :param type: The new type of the default paid reaction
+    """
+
+    _type: "str" = field(default="updateDefaultPaidReactionType", init=False, repr=False)
+    type: "PaidReactionType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateSavedMessagesTags(Update):
+    """
+    Tags used in Saved Messages or a Saved Messages topic have changed
+
+    :param saved_messages_topic_id: Identifier of Saved Messages topic which tags were changed; 0 if tags for the whole chat has changed
+    :param tags: The new tags
+    """
+
+    _type: "str" = field(default="updateSavedMessagesTags", init=False, repr=False)
+    saved_messages_topic_id: "int" = 0
+    tags: "SavedMessagesTags | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "saved_messages_topic_id": self.saved_messages_topic_id,
+            "tags": self.tags._to_json_dict() if self.tags is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateActiveLiveLocationMessages(Update):
+    """
+    The list of messages with active live location that need to be updated by the application has changed. The list is persistent across application restarts only if the message database is used
+
+    :param messages: The list of messages with active live locations
+    """
+
+    _type: "str" = field(default="updateActiveLiveLocationMessages", init=False, repr=False)
+    messages: "list[Message] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "messages": _list_to_json(self.messages),
+        }
+
+@dataclass(slots=True)
+class UpdateOwnedStarCount(Update):
+    """
+    The number of Telegram Stars owned by the current user has changed
+
+    :param star_amount: The new amount of owned Telegram Stars
+    """
+
+    _type: "str" = field(default="updateOwnedStarCount", init=False, repr=False)
+    star_amount: "StarAmount | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "star_amount": self.star_amount._to_json_dict() if self.star_amount is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateOwnedTonCount(Update):
+    """
+    The number of Toncoins owned by the current user has changed
+
+    :param ton_amount: The new amount of owned Toncoins; in the smallest units of the cryptocurrency
+    """
+
+    _type: "str" = field(default="updateOwnedTonCount", init=False, repr=False)
+    ton_amount: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "ton_amount": self.ton_amount,
+        }
+
+@dataclass(slots=True)
+class UpdateChatRevenueAmount(Update):
+    """
+    The revenue earned from sponsored messages in a chat has changed. If chat revenue screen is opened, then getChatRevenueTransactions may be called to fetch new transactions
+
+    :param chat_id: Identifier of the chat
+    :param revenue_amount: New amount of earned revenue
+    """
+
+    _type: "str" = field(default="updateChatRevenueAmount", init=False, repr=False)
+    chat_id: "int" = 0
+    revenue_amount: "ChatRevenueAmount | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "revenue_amount": self.revenue_amount._to_json_dict() if self.revenue_amount is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateStarRevenueStatus(Update):
+    """
+    The Telegram Star revenue earned by a bot or a chat has changed. If Telegram Star transaction screen of the chat is opened, then getStarTransactions may be called to fetch new transactions
+
+    :param owner_id: Identifier of the owner of the Telegram Stars
+    :param status: New Telegram Star revenue status
+    """
+
+    _type: "str" = field(default="updateStarRevenueStatus", init=False, repr=False)
+    owner_id: "MessageSender | None" = None
+    status: "StarRevenueStatus | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "owner_id": self.owner_id._to_json_dict() if self.owner_id is not None else None,
+            "status": self.status._to_json_dict() if self.status is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateSpeechRecognitionTrial(Update):
+    """
+    The parameters of speech recognition without Telegram Premium subscription has changed
+
+    :param max_media_duration: The maximum allowed duration of media for speech recognition without Telegram Premium subscription, in seconds
+    :param weekly_count: The total number of allowed speech recognitions per week; 0 if none
+    :param left_count: Number of left speech recognition attempts this week
+    :param next_reset_date: Point in time (Unix timestamp) when the weekly number of tries will reset; 0 if unknown
+    """
+
+    _type: "str" = field(default="updateSpeechRecognitionTrial", init=False, repr=False)
+    max_media_duration: "int" = 0
+    weekly_count: "int" = 0
+    left_count: "int" = 0
+    next_reset_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "max_media_duration": self.max_media_duration,
+            "weekly_count": self.weekly_count,
+            "left_count": self.left_count,
+            "next_reset_date": self.next_reset_date,
+        }
+
+@dataclass(slots=True)
+class UpdateDiceEmojis(Update):
+    """
+    The list of supported dice emojis has changed
+
+    :param emojis: The new list of supported dice emojis
+    """
+
+    _type: "str" = field(default="updateDiceEmojis", init=False, repr=False)
+    emojis: "list[str] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "emojis": self.emojis,
+        }
+
+@dataclass(slots=True)
+class UpdateAnimatedEmojiMessageClicked(Update):
+    """
+    Some animated emoji message was clicked and a big animated sticker must be played if the message is visible on the screen. chatActionWatchingAnimations with the text of the message needs to be sent if the sticker is played
+
+    :param chat_id: Chat identifier
+    :param message_id: Message identifier
+    :param sticker: The animated sticker to be played
+    """
+
+    _type: "str" = field(default="updateAnimatedEmojiMessageClicked", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    sticker: "Sticker | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateAnimationSearchParameters(Update):
+    """
+    The parameters of animation search through getOption("animation_search_bot_username") bot has changed
+
+    :param provider: Name of the animation search provider
+    :param emojis: The new list of emojis suggested for searching
+    """
+
+    _type: "str" = field(default="updateAnimationSearchParameters", init=False, repr=False)
+    provider: "str" = ""
+    emojis: "list[str] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "provider": self.provider,
+            "emojis": self.emojis,
+        }
+
+@dataclass(slots=True)
+class UpdateSuggestedActions(Update):
+    """
+    The list of suggested to the user actions has changed
+
+    :param added_actions: Added suggested actions
+    :param removed_actions: Removed suggested actions
+    """
+
+    _type: "str" = field(default="updateSuggestedActions", init=False, repr=False)
+    added_actions: "list[SuggestedAction] | None" = None
+    removed_actions: "list[SuggestedAction] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "added_actions": _list_to_json(self.added_actions),
+            "removed_actions": _list_to_json(self.removed_actions),
+        }
+
+@dataclass(slots=True)
+class UpdateSpeedLimitNotification(Update):
+    """
+    Download or upload file speed for the user was limited, but it can be restored by subscription to Telegram Premium. The notification can be postponed until a being downloaded or uploaded file is visible to the user. Use getOption("premium_download_speedup") or getOption("premium_upload_speedup") to get expected speedup after subscription to Telegram Premium
+
+    :param is_upload: True, if upload speed was limited; false, if download speed was limited
+    """
+
+    _type: "str" = field(default="updateSpeedLimitNotification", init=False, repr=False)
+    is_upload: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_upload": self.is_upload,
+        }
+
+@dataclass(slots=True)
+class UpdateContactCloseBirthdays(Update):
+    """
+    The list of contacts that had birthdays recently or will have birthday soon has changed
+
+    :param close_birthday_users: List of contact users with close birthday
+    """
+
+    _type: "str" = field(default="updateContactCloseBirthdays", init=False, repr=False)
+    close_birthday_users: "list[CloseBirthdayUser] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "close_birthday_users": _list_to_json(self.close_birthday_users),
+        }
+
+@dataclass(slots=True)
+class UpdateAutosaveSettings(Update):
+    """
+    Autosave settings for some type of chats were updated
+
+    :param scope: Type of chats for which autosave settings were updated
+    :param settings: The new autosave settings; may be null if the settings are reset to default
+    """
+
+    _type: "str" = field(default="updateAutosaveSettings", init=False, repr=False)
+    scope: "AutosaveSettingsScope | None" = None
+    settings: "ScopeAutosaveSettings | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "scope": self.scope._to_json_dict() if self.scope is not None else None,
+            "settings": self.settings._to_json_dict() if self.settings is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateBusinessConnection(Update):
+    """
+    A business connection has changed; for bots only
+
+    :param connection: New data about the connection
+    """
+
+    _type: "str" = field(default="updateBusinessConnection", init=False, repr=False)
+    connection: "BusinessConnection | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "connection": self.connection._to_json_dict() if self.connection is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateNewBusinessMessage(Update):
+    """
+    A new message was added to a business account; for bots only
+
+    :param connection_id: Unique identifier of the business connection
+    :param message: The new message
+    """
+
+    _type: "str" = field(default="updateNewBusinessMessage", init=False, repr=False)
+    connection_id: "str" = ""
+    message: "BusinessMessage | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "connection_id": self.connection_id,
+            "message": self.message._to_json_dict() if self.message is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateBusinessMessageEdited(Update):
+    """
+    A message in a business account was edited; for bots only
+
+    :param connection_id: Unique identifier of the business connection
+    :param message: The edited message
+    """
+
+    _type: "str" = field(default="updateBusinessMessageEdited", init=False, repr=False)
+    connection_id: "str" = ""
+    message: "BusinessMessage | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "connection_id": self.connection_id,
+            "message": self.message._to_json_dict() if self.message is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateBusinessMessagesDeleted(Update):
+    """
+    Messages in a business account were deleted; for bots only
+
+    :param connection_id: Unique identifier of the business connection
+    :param chat_id: Identifier of a chat in the business account in which messages were deleted
+    :param message_ids: Unique message identifiers of the deleted messages
+    """
+
+    _type: "str" = field(default="updateBusinessMessagesDeleted", init=False, repr=False)
+    connection_id: "str" = ""
+    chat_id: "int" = 0
+    message_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "connection_id": self.connection_id,
+            "chat_id": self.chat_id,
+            "message_ids": self.message_ids,
+        }
+
+@dataclass(slots=True)
+class UpdateNewInlineQuery(Update):
+    """
+    A new incoming inline query; for bots only
+
+    :param id: Unique query identifier
+    :param sender_user_id: Identifier of the user who sent the query
+    :param user_location: User location; may be null
+    :param chat_type: The type of the chat from which the query originated; may be null if unknown
+    :param query: Text of the query
+    :param offset: Offset of the first entry to return
+    """
+
+    _type: "str" = field(default="updateNewInlineQuery", init=False, repr=False)
+    id: "int" = 0
+    sender_user_id: "int" = 0
+    user_location: "Location | None" = None
+    chat_type: "ChatType | None" = None
+    query: "str" = ""
+    offset: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "sender_user_id": self.sender_user_id,
+            "user_location": self.user_location._to_json_dict() if self.user_location is not None else None,
+            "chat_type": self.chat_type._to_json_dict() if self.chat_type is not None else None,
+            "query": self.query,
+            "offset": self.offset,
+        }
+
+@dataclass(slots=True)
+class UpdateNewChosenInlineResult(Update):
+    """
+    The user has chosen a result of an inline query; for bots only
+
+    :param sender_user_id: Identifier of the user who sent the query
+    :param user_location: User location; may be null
+    :param query: Text of the query
+    :param result_id: Identifier of the chosen result
+    :param inline_message_id: Identifier of the sent inline message, if known
+    """
+
+    _type: "str" = field(default="updateNewChosenInlineResult", init=False, repr=False)
+    sender_user_id: "int" = 0
+    user_location: "Location | None" = None
+    query: "str" = ""
+    result_id: "str" = ""
+    inline_message_id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sender_user_id": self.sender_user_id,
+            "user_location": self.user_location._to_json_dict() if self.user_location is not None else None,
+            "query": self.query,
+            "result_id": self.result_id,
+            "inline_message_id": self.inline_message_id,
+        }
+
+@dataclass(slots=True)
+class UpdateNewCallbackQuery(Update):
+    """
+    A new incoming callback query; for bots only
+
+    :param id: Unique query identifier
+    :param sender_user_id: Identifier of the user who sent the query
+    :param chat_id: Identifier of the chat where the query was sent
+    :param message_id: Identifier of the message from which the query originated
+    :param chat_instance: Identifier that uniquely corresponds to the chat to which the message was sent
+    :param payload: Query payload
+    """
+
+    _type: "str" = field(default="updateNewCallbackQuery", init=False, repr=False)
+    id: "int" = 0
+    sender_user_id: "int" = 0
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    chat_instance: "int" = 0
+    payload: "CallbackQueryPayload | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "sender_user_id": self.sender_user_id,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "chat_instance": self.chat_instance,
+            "payload": self.payload._to_json_dict() if self.payload is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateNewInlineCallbackQuery(Update):
+    """
+    A new incoming callback query from a message sent via a bot; for bots only
+
+    :param id: Unique query identifier
+    :param sender_user_id: Identifier of the user who sent the query
+    :param inline_message_id: Identifier of the inline message from which the query originated
+    :param chat_instance: An identifier uniquely corresponding to the chat a message was sent to
+    :param payload: Query payload
+    """
+
+    _type: "str" = field(default="updateNewInlineCallbackQuery", init=False, repr=False)
+    id: "int" = 0
+    sender_user_id: "int" = 0
+    inline_message_id: "str" = ""
+    chat_instance: "int" = 0
+    payload: "CallbackQueryPayload | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "sender_user_id": self.sender_user_id,
+            "inline_message_id": self.inline_message_id,
+            "chat_instance": self.chat_instance,
+            "payload": self.payload._to_json_dict() if self.payload is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateNewBusinessCallbackQuery(Update):
+    """
+    A new incoming callback query from a business message; for bots only
+
+    :param id: Unique query identifier
+    :param sender_user_id: Identifier of the user who sent the query
+    :param connection_id: Unique identifier of the business connection
+    :param message: The message from the business account from which the query originated
+    :param chat_instance: An identifier uniquely corresponding to the chat a message was sent to
+    :param payload: Query payload
+    """
+
+    _type: "str" = field(default="updateNewBusinessCallbackQuery", init=False, repr=False)
+    id: "int" = 0
+    sender_user_id: "int" = 0
+    connection_id: "str" = ""
+    message: "BusinessMessage | None" = None
+    chat_instance: "int" = 0
+    payload: "CallbackQueryPayload | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "sender_user_id": self.sender_user_id,
+            "connection_id": self.connection_id,
+            "message": self.message._to_json_dict() if self.message is not None else None,
+            "chat_instance": self.chat_instance,
+            "payload": self.payload._to_json_dict() if self.payload is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateNewShippingQuery(Update):
+    """
+    A new incoming shipping query; for bots only. Only for invoices with flexible price
+
+    :param id: Unique query identifier
+    :param sender_user_id: Identifier of the user who sent the query
+    :param invoice_payload: Invoice payload
+    :param shipping_address: User shipping address
+    """
+
+    _type: "str" = field(default="updateNewShippingQuery", init=False, repr=False)
+    id: "int" = 0
+    sender_user_id: "int" = 0
+    invoice_payload: "str" = ""
+    shipping_address: "Address | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "sender_user_id": self.sender_user_id,
+            "invoice_payload": self.invoice_payload,
+            "shipping_address": self.shipping_address._to_json_dict() if self.shipping_address is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateNewPreCheckoutQuery(Update):
+    """
+    A new incoming pre-checkout query; for bots only. Contains full information about a checkout
+
+    :param id: Unique query identifier
+    :param sender_user_id: Identifier of the user who sent the query
+    :param currency: Currency for the product price
+    :param total_amount: Total price for the product, in the smallest units of the currency
+    :param invoice_payload: Invoice payload
+    :param shipping_option_id: Identifier of a shipping option chosen by the user; may be empty if not applicable
+    :param order_info: Information about the order; may be null
+    """
+
+    _type: "str" = field(default="updateNewPreCheckoutQuery", init=False, repr=False)
+    id: "int" = 0
+    sender_user_id: "int" = 0
+    currency: "str" = ""
+    total_amount: "int" = 0
+    invoice_payload: "bytes" = b""
+    shipping_option_id: "str" = ""
+    order_info: "OrderInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "sender_user_id": self.sender_user_id,
+            "currency": self.currency,
+            "total_amount": self.total_amount,
+            "invoice_payload": _bytes_to_json(self.invoice_payload),
+            "shipping_option_id": self.shipping_option_id,
+            "order_info": self.order_info._to_json_dict() if self.order_info is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateNewCustomEvent(Update):
+    """
+    A new incoming event; for bots only
+
+    :param event: A JSON-serialized event
+    """
+
+    _type: "str" = field(default="updateNewCustomEvent", init=False, repr=False)
+    event: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "event": self.event,
+        }
+
+@dataclass(slots=True)
+class UpdateNewCustomQuery(Update):
+    """
+    A new incoming query; for bots only
+
+    :param id: The query identifier
+    :param data: JSON-serialized query data
+    :param timeout: Query timeout
+    """
+
+    _type: "str" = field(default="updateNewCustomQuery", init=False, repr=False)
+    id: "int" = 0
+    data: "str" = ""
+    timeout: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "id": self.id,
+            "data": self.data,
+            "timeout": self.timeout,
+        }
+
+@dataclass(slots=True)
+class UpdatePoll(Update):
+    """
+    A poll was updated; for bots only
+
+    :param poll: New data about the poll
+    """
+
+    _type: "str" = field(default="updatePoll", init=False, repr=False)
+    poll: "Poll | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "poll": self.poll._to_json_dict() if self.poll is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdatePollAnswer(Update):
+    """
+    A user changed the answer to a poll; for bots only
+
+    :param poll_id: Unique poll identifier
+    :param voter_id: Identifier of the message sender that changed the answer to the poll
+    :param option_ids: 0-based identifiers of answer options, chosen by the user
+    """
+
+    _type: "str" = field(default="updatePollAnswer", init=False, repr=False)
+    poll_id: "int" = 0
+    voter_id: "MessageSender | None" = None
+    option_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "poll_id": self.poll_id,
+            "voter_id": self.voter_id._to_json_dict() if self.voter_id is not None else None,
+            "option_ids": self.option_ids,
+        }
+
+@dataclass(slots=True)
+class UpdateChatMember(Update):
+    """
+    User rights changed in a chat; for bots only
+
+    :param chat_id: Chat identifier
+    :param actor_user_id: Identifier of the user, changing the rights
+    :param date: Point in time (Unix timestamp) when the user rights were changed
+    :param invite_link: If user has joined the chat using an invite link, the invite link; may be null
+    :param via_join_request: True, if the user has joined the chat after sending a join request and being approved by an administrator
+    :param via_chat_folder_invite_link: True, if the user has joined the chat using an invite link for a chat folder
+    :param old_chat_member: Previous chat member
+    :param new_chat_member: New chat member
+    """
+
+    _type: "str" = field(default="updateChatMember", init=False, repr=False)
+    chat_id: "int" = 0
+    actor_user_id: "int" = 0
+    date: "int" = 0
+    invite_link: "ChatInviteLink | None" = None
+    via_join_request: "bool" = False
+    via_chat_folder_invite_link: "bool" = False
+    old_chat_member: "ChatMember | None" = None
+    new_chat_member: "ChatMember | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "actor_user_id": self.actor_user_id,
+            "date": self.date,
+            "invite_link": self.invite_link._to_json_dict() if self.invite_link is not None else None,
+            "via_join_request": self.via_join_request,
+            "via_chat_folder_invite_link": self.via_chat_folder_invite_link,
+            "old_chat_member": self.old_chat_member._to_json_dict() if self.old_chat_member is not None else None,
+            "new_chat_member": self.new_chat_member._to_json_dict() if self.new_chat_member is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateNewChatJoinRequest(Update):
+    """
+    A user sent a join request to a chat; for bots only
+
+    :param chat_id: Chat identifier
+    :param request: Join request
+    :param user_chat_id: Chat identifier of the private chat with the user
+    :param invite_link: The invite link, which was used to send join request; may be null
+    """
+
+    _type: "str" = field(default="updateNewChatJoinRequest", init=False, repr=False)
+    chat_id: "int" = 0
+    request: "ChatJoinRequest | None" = None
+    user_chat_id: "int" = 0
+    invite_link: "ChatInviteLink | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "request": self.request._to_json_dict() if self.request is not None else None,
+            "user_chat_id": self.user_chat_id,
+            "invite_link": self.invite_link._to_json_dict() if self.invite_link is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateChatBoost(Update):
+    """
+    A chat boost has changed; for bots only
+
+    :param chat_id: Chat identifier
+    :param boost: New information about the boost
+    """
+
+    _type: "str" = field(default="updateChatBoost", init=False, repr=False)
+    chat_id: "int" = 0
+    boost: "ChatBoost | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "boost": self.boost._to_json_dict() if self.boost is not None else None,
+        }
+
+@dataclass(slots=True)
+class UpdateMessageReaction(Update):
+    """
+    User changed its reactions on a message with public reactions; for bots only
+
+    :param chat_id: Chat identifier
+    :param message_id: Message identifier
+    :param actor_id: Identifier of the user or chat that changed reactions
+    :param date: Point in time (Unix timestamp) when the reactions were changed
+    :param old_reaction_types: Old list of chosen reactions
+    :param new_reaction_types: New list of chosen reactions
+    """
+
+    _type: "str" = field(default="updateMessageReaction", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    actor_id: "MessageSender | None" = None
+    date: "int" = 0
+    old_reaction_types: "list[ReactionType] | None" = None
+    new_reaction_types: "list[ReactionType] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "actor_id": self.actor_id._to_json_dict() if self.actor_id is not None else None,
+            "date": self.date,
+            "old_reaction_types": _list_to_json(self.old_reaction_types),
+            "new_reaction_types": _list_to_json(self.new_reaction_types),
+        }
+
+@dataclass(slots=True)
+class UpdateMessageReactions(Update):
+    """
+    Reactions added to a message with anonymous reactions have changed; for bots only
+
+    :param chat_id: Chat identifier
+    :param message_id: Message identifier
+    :param date: Point in time (Unix timestamp) when the reactions were changed
+    :param reactions: The list of reactions added to the message
+    """
+
+    _type: "str" = field(default="updateMessageReactions", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    date: "int" = 0
+    reactions: "list[MessageReaction] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "date": self.date,
+            "reactions": _list_to_json(self.reactions),
+        }
+
+@dataclass(slots=True)
+class UpdatePaidMediaPurchased(Update):
+    """
+    Paid media were purchased by a user; for bots only
+
+    :param user_id: User identifier
+    :param payload: Bot-specified payload for the paid media
+    """
+
+    _type: "str" = field(default="updatePaidMediaPurchased", init=False, repr=False)
+    user_id: "int" = 0
+    payload: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "payload": self.payload,
+        }
+
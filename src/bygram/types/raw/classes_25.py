@@ -0,0 +1,265 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import FormattedText
+
+@dataclass(slots=True)
+class Updates(ObjectBase):
+    """
+    Contains a list of updates
+
+    :param updates: List of updates
+    """
+
+    _type: "str" = field(default="updates", init=False, repr=False)
+    updates: "list[Update] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "updates": _list_to_json(self.updates),
+        }
+
+@dataclass(slots=True)
+class LogStream(ObjectBase):
+    """
+    Describes a stream to which TDLib internal log is written
+
+    """
+
+    _type: "str" = field(default="LogStream", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class LogStreamDefault(LogStream):
+    """
+    The log is written to stderr or an OS specific log
+
+    """
+
+    _type: "str" = field(default="logStreamDefault", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class LogStreamFile(LogStream):
+    """
+    The log is written to a file
+
+    :param path: Path to the file to where the internal TDLib log will be written
+    :param max_file_size: The maximum size of the file to where the internal TDLib log is written before the file will automatically be rotated, in bytes
+    :param redirect_stderr: Pass true to additionally redirect stderr to the log file. Ignored on Windows
+    """
+
+    _type: "str" = field(default="logStreamFile", init=False, repr=False)
+    path: "str" = ""
+    max_file_size: "int" = 0
+    redirect_stderr: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "path": self.path,
+            "max_file_size": self.max_file_size,
+            "redirect_stderr": self.redirect_stderr,
+        }
+
+@dataclass(slots=True)
+class LogStreamEmpty(LogStream):
+    """
+    The log is written nowhere
+
+    """
+
+    _type: "str" = field(default="logStreamEmpty", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+@dataclass(slots=True)
+class LogVerbosityLevel(ObjectBase):
+    """
+    Contains a TDLib internal log verbosity level
+
+    :param verbosity_level: Log verbosity level
+    """
+
+    _type: "str" = field(default="logVerbosityLevel", init=False, repr=False)
+    verbosity_level: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "verbosity_level": self.verbosity_level,
+        }
+
+@dataclass(slots=True)
+class LogTags(ObjectBase):
+    """
+    Contains a list of available TDLib internal log tags
+
+    :param tags: List of log tags
+    """
+
+    _type: "str" = field(default="logTags", init=False, repr=False)
+    tags: "list[str] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "tags": self.tags,
+        }
+
+@dataclass(slots=True)
+class UserSupportInfo(ObjectBase):
+    """
+    Contains custom information about the user
+
+    :param message: Information message
+    :param author: Information author
+    :param date: Information change date
+    """
+
+    _type: "str" = field(default="userSupportInfo", init=False, repr=False)
+    message: "FormattedText | None" = None
+    author: "str" = ""
+    date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "message": self.message._to_json_dict() if self.message is not None else None,
+            "author": self.author,
+            "date": self.date,
+        }
+
+@dataclass(slots=True)
+class TestInt(ObjectBase):
+    """
+    A simple object containing a number; for testing only
+
+    :param value: Number
+    """
+
+    _type: "str" = field(default="testInt", init=False, repr=False)
+    value: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "value": self.value,
+        }
+
+@dataclass(slots=True)
+class TestString(ObjectBase):
+    """
+    A simple object containing a string; for testing only
+
+    :param value: String
+    """
+
+    _type: "str" = field(default="testString", init=False, repr=False)
+    value: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "value": self.value,
+        }
+
+@dataclass(slots=True)
+class TestBytes(ObjectBase):
+    """
+    A simple object containing a sequence of bytes; for testing only
+
+    :param value: Bytes
+    """
+
+    _type: "str" = field(default="testBytes", init=False, repr=False)
+    value: "bytes" = b""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "value": _bytes_to_json(self.value),
+        }
+
+@dataclass(slots=True)
+class TestVectorInt(ObjectBase):
+    """
+    A simple object containing a vector of numbers; for testing only
+
+    :param value: Vector of numbers
+    """
+
+    _type: "str" = field(default="testVectorInt", init=False, repr=False)
+    value: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "value": self.value,
+        }
+
+@dataclass(slots=True)
+class TestVectorIntObject(ObjectBase):
+    """
+    A simple object containing a vector of objects that hold a number; for testing only
+
+    :param value: Vector of objects
+    """
+
+    _type: "str" = field(default="testVectorIntObject", init=False, repr=False)
+    value: "list[TestInt] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "value": _list_to_json(self.value),
+        }
+
+@dataclass(slots=True)
+class TestVectorString(ObjectBase):
+    """
+    A simple object containing a vector of strings; for testing only
+
+    :param value: Vector of strings
+    """
+
+    _type: "str" = field(default="testVectorString", init=False, repr=False)
+    value: "list[str] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "value": self.value,
+        }
+
+@dataclass(slots=True)
+class TestVectorStringObject(ObjectBase):
+    """
+    A simple object containing a vector of objects that hold a string; for testing only
+
+    :param value: Vector of objects
+    """
+
+    _type: "str" = field(default="testVectorStringObject", init=False, repr=False)
+    value: "list[TestString] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "value": _list_to_json(self.value),
+        }
+
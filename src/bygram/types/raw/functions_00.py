@@ -0,0 +1,1384 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import AuthorizationState, EmailAddressAuthentication, EmailAddressAuthenticationCodeInfo, File, Ok, PasswordState, RecoveryEmailAddress, TemporaryPasswordState
+    from .classes_04 import User, UserFullInfo
+    from .classes_05 import BasicGroup, BasicGroupFullInfo, MessageReadDate, MessageViewers, SecretChat, Supergroup, SupergroupFullInfo
+    from .classes_06 import Message, Messages
+    from .classes_07 import Chat
+    from .classes_08 import MessageThreadInfo
+    from .classes_12 import MessageProperties
+    from .classes_14 import ResendCodeReason
+    from .classes_15 import PhoneNumberAuthenticationSettings
+    from .classes_18 import StoreTransaction
+    from .classes_19 import ResetPasswordResult
+    from .classes_21 import Session
+    from .classes_22 import FileType
+    from .classes_25 import Updates
+
+
+@dataclass(slots=True)
+class GetAuthorizationState(Function["AuthorizationState"]):
+    """
+    Returns the current authorization state. This is an offline method. For informational purposes only. Use updateAuthorizationState instead to maintain the current authorization state. Can be called before initialization
+
+    :return: :class:`AuthorizationState`
+    """
+
+    _type: "str" = field(default="getAuthorizationState", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class SetTdlibParameters(Function["Ok"]):
+    """
+    Sets the parameters for TDLib initialization. Works only when the current authorization state is authorizationStateWaitTdlibParameters
+
+    :param use_test_dc: Pass true to use Telegram test environment instead of the production environment
+    :param database_directory: The path to the directory for the persistent database; if empty, the current working directory will be used
+    :param files_directory: The path to the directory for storing files; if empty, database_directory will be used
+    :param database_encryption_key: Encryption key for the database. If the encryption key is invalid, then an error with code 401 will be returned
+    :param use_file_database: Pass true to keep information about downloaded and uploaded files between application restarts
+    :param use_chat_info_database: Pass true to keep cache of users, basic groups, supergroups, channels and secret chats between restarts. Implies use_file_database
+    :param use_message_database: Pass true to keep cache of chats and messages between restarts. Implies use_chat_info_database
+    :param use_secret_chats: Pass true to enable support for secret chats
+    :param api_id: Application identifier for Telegram API access, which can be obtained at https://my.telegram.org
+    :param api_hash: Application identifier hash for Telegram API access, which can be obtained at https://my.telegram.org
+    :param system_language_code: IETF language tag of the user's operating system language; must be non-empty
+    :param device_model: Model of the device the application is being run on; must be non-empty
+    :param system_version: Version of the operating system the application is being run on. If empty, the version is automatically detected by TDLib
+    :param application_version: Application version; must be non-empty
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setTdlibParameters", init=False, repr=False)
+    use_test_dc: "bool" = False
+    database_directory: "str" = ""
+    files_directory: "str" = ""
+    database_encryption_key: "bytes" = b""
+    use_file_database: "bool" = False
+    use_chat_info_database: "bool" = False
+    use_message_database: "bool" = False
+    use_secret_chats: "bool" = False
+    api_id: "int" = 0
+    api_hash: "str" = ""
+    system_language_code: "str" = ""
+    device_model: "str" = ""
+    system_version: "str" = ""
+    application_version: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "use_test_dc": self.use_test_dc,
+            "database_directory": self.database_directory,
+            "files_directory": self.files_directory,
+            "database_encryption_key": _bytes_to_json(self.database_encryption_key),
+            "use_file_database": self.use_file_database,
+            "use_chat_info_database": self.use_chat_info_database,
+            "use_message_database": self.use_message_database,
+            "use_secret_chats": self.use_secret_chats,
+            "api_id": self.api_id,
+            "api_hash": self.api_hash,
+            "system_language_code": self.system_language_code,
+            "device_model": self.device_model,
+            "system_version": self.system_version,
+            "application_version": self.application_version,
+        }
+
+
+
+@dataclass(slots=True)
+class SetAuthenticationPhoneNumber(Function["Ok"]):
+    """
+    Sets the phone number of the user and sends an authentication code to the user. Works only when the current authorization state is authorizationStateWaitPhoneNumber, or if there is no pending authentication query and the current authorization state is authorizationStateWaitPremiumPurchase, authorizationStateWaitEmailAddress,
+     authorizationStateWaitEmailCode, authorizationStateWaitCode, authorizationStateWaitRegistration, or authorizationStateWaitPassword
+
+    :param phone_number: The phone number of the user, in international format
+    :param settings: Settings for the authentication of the user's phone number; pass null to use default settings
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setAuthenticationPhoneNumber", init=False, repr=False)
+    phone_number: "str" = ""
+    settings: "PhoneNumberAuthenticationSettings | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "phone_number": self.phone_number,
+            "settings": self.settings._to_json_dict() if self.settings is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class CheckAuthenticationPremiumPurchase(Function["Ok"]):
+    """
+    Checks whether an in-store purchase of Telegram Premium is possible before authorization. Works only when the current authorization state is authorizationStateWaitPremiumPurchase
+
+    :param currency: ISO 4217 currency code of the payment currency
+    :param amount: Paid amount, in the smallest units of the currency
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="checkAuthenticationPremiumPurchase", init=False, repr=False)
+    currency: "str" = ""
+    amount: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "currency": self.currency,
+            "amount": self.amount,
+        }
+
+
+
+@dataclass(slots=True)
+class SetAuthenticationPremiumPurchaseTransaction(Function["Ok"]):
+    """
+    Informs server about an in-store purchase of Telegram Premium before authorization. Works only when the current authorization state is authorizationStateWaitPremiumPurchase
+
+    :param transaction: Information about the transaction
+    :param is_restore: Pass true if this is a restore of a Telegram Premium purchase; only for App Store
+    :param currency: ISO 4217 currency code of the payment currency
+    :param amount: Paid amount, in the smallest units of the currency
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setAuthenticationPremiumPurchaseTransaction", init=False, repr=False)
+    transaction: "StoreTransaction | None" = None
+    is_restore: "bool" = False
+    currency: "str" = ""
+    amount: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "transaction": self.transaction._to_json_dict() if self.transaction is not None else None,
+            "is_restore": self.is_restore,
+            "currency": self.currency,
+            "amount": self.amount,
+        }
+
+
+
+@dataclass(slots=True)
+class SetAuthenticationEmailAddress(Function["Ok"]):
+    """
+    Sets the email address of the user and sends an authentication code to the email address. Works only when the current authorization state is authorizationStateWaitEmailAddress
+
+    :param email_address: The email address of the user
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setAuthenticationEmailAddress", init=False, repr=False)
+    email_address: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "email_address": self.email_address,
+        }
+
+
+
+@dataclass(slots=True)
+class ResendAuthenticationCode(Function["Ok"]):
+    """
+    Resends an authentication code to the user. Works only when the current authorization state is authorizationStateWaitCode, the next_code_type of the result is not null and the server-specified timeout has passed, or when the current authorization state is authorizationStateWaitEmailCode
+
+    :param reason: Reason of code resending; pass null if unknown
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="resendAuthenticationCode", init=False, repr=False)
+    reason: "ResendCodeReason | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "reason": self.reason._to_json_dict() if self.reason is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class CheckAuthenticationEmailCode(Function["Ok"]):
+    """
+    Checks the authentication of an email address. Works only when the current authorization state is authorizationStateWaitEmailCode
+
+    :param code: Email address authentication to check
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="checkAuthenticationEmailCode", init=False, repr=False)
+    code: "EmailAddressAuthentication | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "code": self.code._to_json_dict() if self.code is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class CheckAuthenticationCode(Function["Ok"]):
+    """
+    Checks the authentication code. Works only when the current authorization state is authorizationStateWaitCode
+
+    :param code: Authentication code to check
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="checkAuthenticationCode", init=False, repr=False)
+    code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "code": self.code,
+        }
+
+
+
+@dataclass(slots=True)
+class RequestQrCodeAuthentication(Function["Ok"]):
+    """
+    Requests QR code authentication by scanning a QR code on another logged in device. Works only when the current authorization state is authorizationStateWaitPhoneNumber, or if there is no pending authentication query and the current authorization state is authorizationStateWaitPremiumPurchase, authorizationStateWaitEmailAddress,
+     authorizationStateWaitEmailCode, authorizationStateWaitCode, authorizationStateWaitRegistration, or authorizationStateWaitPassword
+
+    :param other_user_ids: List of user identifiers of other users currently using the application
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="requestQrCodeAuthentication", init=False, repr=False)
+    other_user_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "other_user_ids": self.other_user_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class RegisterUser(Function["Ok"]):
+    """
+    Finishes user registration. Works only when the current authorization state is authorizationStateWaitRegistration
+
+    :param first_name: The first name of the user; 1-64 characters
+    :param last_name: The last name of the user; 0-64 characters
+    :param disable_notification: Pass true to disable notification about the current user joining Telegram for other users that added them to contact list
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="registerUser", init=False, repr=False)
+    first_name: "str" = ""
+    last_name: "str" = ""
+    disable_notification: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+            "disable_notification": self.disable_notification,
+        }
+
+
+
+@dataclass(slots=True)
+class ResetAuthenticationEmailAddress(Function["Ok"]):
+    """
+    Resets the login email address. May return an error with a message "TASK_ALREADY_EXISTS" if reset is still pending. Works only when the current authorization state is authorizationStateWaitEmailCode and authorization_state.can_reset_email_address == true
+
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="resetAuthenticationEmailAddress", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class CheckAuthenticationPassword(Function["Ok"]):
+    """
+    Checks the 2-step verification password for correctness. Works only when the current authorization state is authorizationStateWaitPassword
+
+    :param password: The 2-step verification password to check
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="checkAuthenticationPassword", init=False, repr=False)
+    password: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "password": self.password,
+        }
+
+
+
+@dataclass(slots=True)
+class RequestAuthenticationPasswordRecovery(Function["Ok"]):
+    """
+    Requests to send a 2-step verification password recovery code to an email address that was previously set up. Works only when the current authorization state is authorizationStateWaitPassword
+
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="requestAuthenticationPasswordRecovery", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class CheckAuthenticationPasswordRecoveryCode(Function["Ok"]):
+    """
+    Checks whether a 2-step verification password recovery code sent to an email address is valid. Works only when the current authorization state is authorizationStateWaitPassword
+
+    :param recovery_code: Recovery code to check
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="checkAuthenticationPasswordRecoveryCode", init=False, repr=False)
+    recovery_code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "recovery_code": self.recovery_code,
+        }
+
+
+
+@dataclass(slots=True)
+class RecoverAuthenticationPassword(Function["Ok"]):
+    """
+    Recovers the 2-step verification password with a password recovery code sent to an email address that was previously set up. Works only when the current authorization state is authorizationStateWaitPassword
+
+    :param recovery_code: Recovery code to check
+    :param new_password: New 2-step verification password of the user; may be empty to remove the password
+    :param new_hint: New password hint; may be empty
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="recoverAuthenticationPassword", init=False, repr=False)
+    recovery_code: "str" = ""
+    new_password: "str" = ""
+    new_hint: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "recovery_code": self.recovery_code,
+            "new_password": self.new_password,
+            "new_hint": self.new_hint,
+        }
+
+
+
+@dataclass(slots=True)
+class SendAuthenticationFirebaseSms(Function["Ok"]):
+    """
+    Sends Firebase Authentication SMS to the phone number of the user. Works only when the current authorization state is authorizationStateWaitCode and the server returned code of the type authenticationCodeTypeFirebaseAndroid or authenticationCodeTypeFirebaseIos
+
+    :param token: Play Integrity API or SafetyNet Attestation API token for the Android application, or secret from push notification for the iOS application
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="sendAuthenticationFirebaseSms", init=False, repr=False)
+    token: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "token": self.token,
+        }
+
+
+
+@dataclass(slots=True)
+class ReportAuthenticationCodeMissing(Function["Ok"]):
+    """
+    Reports that authentication code wasn't delivered via SMS; for official mobile applications only. Works only when the current authorization state is authorizationStateWaitCode
+
+    :param mobile_network_code: Current mobile network code
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="reportAuthenticationCodeMissing", init=False, repr=False)
+    mobile_network_code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "mobile_network_code": self.mobile_network_code,
+        }
+
+
+
+@dataclass(slots=True)
+class CheckAuthenticationBotToken(Function["Ok"]):
+    """
+    Checks the authentication token of a bot; to log in as a bot. Works only when the current authorization state is authorizationStateWaitPhoneNumber. Can be used instead of setAuthenticationPhoneNumber and checkAuthenticationCode to log in
+
+    :param token: The bot token
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="checkAuthenticationBotToken", init=False, repr=False)
+    token: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "token": self.token,
+        }
+
+
+
+@dataclass(slots=True)
+class LogOut(Function["Ok"]):
+    """
+    Closes the TDLib instance after a proper logout. Requires an available network connection. All local data will be destroyed. After the logout completes, updateAuthorizationState with authorizationStateClosed will be sent
+
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="logOut", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class Close(Function["Ok"]):
+    """
+    Closes the TDLib instance. All databases will be flushed to disk and properly closed. After the close completes, updateAuthorizationState with authorizationStateClosed will be sent. Can be called before initialization
+
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="close", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class Destroy(Function["Ok"]):
+    """
+    Closes the TDLib instance, destroying all local data without a proper logout. The current user session will remain in the list of all active sessions. All local data will be destroyed. After the destruction completes updateAuthorizationState with authorizationStateClosed will be sent. Can be called before authorization
+
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="destroy", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class ConfirmQrCodeAuthentication(Function["Session"]):
+    """
+    Confirms QR code authentication on another device. Returns created session on success
+
+    :param link: A link from a QR code. The link must be scanned by the in-app camera
+    :return: :class:`Session`
+    """
+
+    _type: "str" = field(default="confirmQrCodeAuthentication", init=False, repr=False)
+    link: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "link": self.link,
+        }
+
+
+
+@dataclass(slots=True)
+class GetCurrentState(Function["Updates"]):
+    """
+    Returns all updates needed to restore current TDLib state, i.e. all actual updateAuthorizationState/updateUser/updateNewChat and others. This is especially useful if TDLib is run in a separate process. Can be called before initialization
+
+    :return: :class:`Updates`
+    """
+
+    _type: "str" = field(default="getCurrentState", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class SetDatabaseEncryptionKey(Function["Ok"]):
+    """
+    Changes the database encryption key. Usually the encryption key is never changed and is stored in some OS keychain
+
+    :param new_encryption_key: New encryption key
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setDatabaseEncryptionKey", init=False, repr=False)
+    new_encryption_key: "bytes" = b""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "new_encryption_key": _bytes_to_json(self.new_encryption_key),
+        }
+
+
+
+@dataclass(slots=True)
+class GetPasswordState(Function["PasswordState"]):
+    """
+    Returns the current state of 2-step verification
+
+    :return: :class:`PasswordState`
+    """
+
+    _type: "str" = field(default="getPasswordState", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class SetPassword(Function["PasswordState"]):
+    """
+    Changes the 2-step verification password for the current user. If a new recovery email address is specified, then the change will not be applied until the new recovery email address is confirmed
+
+    :param old_password: Previous 2-step verification password of the user
+    :param new_password: New 2-step verification password of the user; may be empty to remove the password
+    :param new_hint: New password hint; may be empty
+    :param set_recovery_email_address: Pass true to change also the recovery email address
+    :param new_recovery_email_address: New recovery email address; may be empty
+    :return: :class:`PasswordState`
+    """
+
+    _type: "str" = field(default="setPassword", init=False, repr=False)
+    old_password: "str" = ""
+    new_password: "str" = ""
+    new_hint: "str" = ""
+    set_recovery_email_address: "bool" = False
+    new_recovery_email_address: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "old_password": self.old_password,
+            "new_password": self.new_password,
+            "new_hint": self.new_hint,
+            "set_recovery_email_address": self.set_recovery_email_address,
+            "new_recovery_email_address": self.new_recovery_email_address,
+        }
+
+
+
+@dataclass(slots=True)
+class SetLoginEmailAddress(Function["EmailAddressAuthenticationCodeInfo"]):
+    """
+    Changes the login email address of the user. The email address can be changed only if the current user already has login email and passwordState.login_email_address_pattern is non-empty. The change will not be applied until the new login email address is confirmed with checkLoginEmailAddressCode. To use Apple ID/Google ID instead of an email address, call checkLoginEmailAddressCode directly
+
+    :param new_login_email_address: New login email address
+    :return: :class:`EmailAddressAuthenticationCodeInfo`
+    """
+
+    _type: "str" = field(default="setLoginEmailAddress", init=False, repr=False)
+    new_login_email_address: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "new_login_email_address": self.new_login_email_address,
+        }
+
+
+
+@dataclass(slots=True)
+class ResendLoginEmailAddressCode(Function["EmailAddressAuthenticationCodeInfo"]):
+    """
+    Resends the login email address verification code
+
+    :return: :class:`EmailAddressAuthenticationCodeInfo`
+    """
+
+    _type: "str" = field(default="resendLoginEmailAddressCode", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class CheckLoginEmailAddressCode(Function["Ok"]):
+    """
+    Checks the login email address authentication
+
+    :param code: Email address authentication to check
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="checkLoginEmailAddressCode", init=False, repr=False)
+    code: "EmailAddressAuthentication | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "code": self.code._to_json_dict() if self.code is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetRecoveryEmailAddress(Function["RecoveryEmailAddress"]):
+    """
+    Returns a 2-step verification recovery email address that was previously set up. This method can be used to verify a password provided by the user
+
+    :param password: The 2-step verification password for the current user
+    :return: :class:`RecoveryEmailAddress`
+    """
+
+    _type: "str" = field(default="getRecoveryEmailAddress", init=False, repr=False)
+    password: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "password": self.password,
+        }
+
+
+
+@dataclass(slots=True)
+class SetRecoveryEmailAddress(Function["PasswordState"]):
+    """
+    Changes the 2-step verification recovery email address of the user. If a new recovery email address is specified, then the change will not be applied until the new recovery email address is confirmed. If new_recovery_email_address is the same as the email address that is currently set up, this call succeeds immediately and aborts all other requests waiting for an email confirmation
+
+    :param password: The 2-step verification password of the current user
+    :param new_recovery_email_address: New recovery email address
+    :return: :class:`PasswordState`
+    """
+
+    _type: "str" = field(default="setRecoveryEmailAddress", init=False, repr=False)
+    password: "str" = ""
+    new_recovery_email_address: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "password": self.password,
+            "new_recovery_email_address": self.new_recovery_email_address,
+        }
+
+
+
+@dataclass(slots=True)
+class CheckRecoveryEmailAddressCode(Function["PasswordState"]):
+    """
+    Checks the 2-step verification recovery email address verification code
+
+    :param code: Verification code to check
+    :return: :class:`PasswordState`
+    """
+
+    _type: "str" = field(default="checkRecoveryEmailAddressCode", init=False, repr=False)
+    code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "code": self.code,
+        }
+
+
+
+@dataclass(slots=True)
+class ResendRecoveryEmailAddressCode(Function["PasswordState"]):
+    """
+    Resends the 2-step verification recovery email address verification code
+
+    :return: :class:`PasswordState`
+    """
+
+    _type: "str" = field(default="resendRecoveryEmailAddressCode", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class CancelRecoveryEmailAddressVerification(Function["PasswordState"]):
+    """
+    Cancels verification of the 2-step verification recovery email address
+
+    :return: :class:`PasswordState`
+    """
+
+    _type: "str" = field(default="cancelRecoveryEmailAddressVerification", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class RequestPasswordRecovery(Function["EmailAddressAuthenticationCodeInfo"]):
+    """
+    Requests to send a 2-step verification password recovery code to an email address that was previously set up
+
+    :return: :class:`EmailAddressAuthenticationCodeInfo`
+    """
+
+    _type: "str" = field(default="requestPasswordRecovery", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class CheckPasswordRecoveryCode(Function["Ok"]):
+    """
+    Checks whether a 2-step verification password recovery code sent to an email address is valid
+
+    :param recovery_code: Recovery code to check
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="checkPasswordRecoveryCode", init=False, repr=False)
+    recovery_code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "recovery_code": self.recovery_code,
+        }
+
+
+
+@dataclass(slots=True)
+class RecoverPassword(Function["PasswordState"]):
+    """
+    Recovers the 2-step verification password using a recovery code sent to an email address that was previously set up
+
+    :param recovery_code: Recovery code to check
+    :param new_password: New 2-step verification password of the user; may be empty to remove the password
+    :param new_hint: New password hint; may be empty
+    :return: :class:`PasswordState`
+    """
+
+    _type: "str" = field(default="recoverPassword", init=False, repr=False)
+    recovery_code: "str" = ""
+    new_password: "str" = ""
+    new_hint: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "recovery_code": self.recovery_code,
+            "new_password": self.new_password,
+            "new_hint": self.new_hint,
+        }
+
+
+
+@dataclass(slots=True)
+class ResetPassword(Function["ResetPasswordResult"]):
+    """
+    Removes 2-step verification password without previous password and access to recovery email address. The password can't be reset immediately and the request needs to be repeated after the specified time
+
+    :return: :class:`ResetPasswordResult`
+    """
+
+    _type: "str" = field(default="resetPassword", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class CancelPasswordReset(Function["Ok"]):
+    """
+    Cancels reset of 2-step verification password. The method can be called if passwordState.pending_reset_date > 0
+
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="cancelPasswordReset", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class CreateTemporaryPassword(Function["TemporaryPasswordState"]):
+    """
+    Creates a new temporary password for processing payments
+
+    :param password: The 2-step verification password of the current user
+    :param valid_for: Time during which the temporary password will be valid, in seconds; must be between 60 and 86400
+    :return: :class:`TemporaryPasswordState`
+    """
+
+    _type: "str" = field(default="createTemporaryPassword", init=False, repr=False)
+    password: "str" = ""
+    valid_for: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "password": self.password,
+            "valid_for": self.valid_for,
+        }
+
+
+
+@dataclass(slots=True)
+class GetTemporaryPasswordState(Function["TemporaryPasswordState"]):
+    """
+    Returns information about the current temporary password
+
+    :return: :class:`TemporaryPasswordState`
+    """
+
+    _type: "str" = field(default="getTemporaryPasswordState", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetMe(Function["User"]):
+    """
+    Returns the current user
+
+    :return: :class:`User`
+    """
+
+    _type: "str" = field(default="getMe", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetUser(Function["User"]):
+    """
+    Returns information about a user by their identifier. This is an offline method if the current user is not a bot
+
+    :param user_id: User identifier
+    :return: :class:`User`
+    """
+
+    _type: "str" = field(default="getUser", init=False, repr=False)
+    user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetUserFullInfo(Function["UserFullInfo"]):
+    """
+    Returns full information about a user by their identifier
+
+    :param user_id: User identifier
+    :return: :class:`UserFullInfo`
+    """
+
+    _type: "str" = field(default="getUserFullInfo", init=False, repr=False)
+    user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetBasicGroup(Function["BasicGroup"]):
+    """
+    Returns information about a basic group by its identifier. This is an offline method if the current user is not a bot
+
+    :param basic_group_id: Basic group identifier
+    :return: :class:`BasicGroup`
+    """
+
+    _type: "str" = field(default="getBasicGroup", init=False, repr=False)
+    basic_group_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "basic_group_id": self.basic_group_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetBasicGroupFullInfo(Function["BasicGroupFullInfo"]):
+    """
+    Returns full information about a basic group by its identifier
+
+    :param basic_group_id: Basic group identifier
+    :return: :class:`BasicGroupFullInfo`
+    """
+
+    _type: "str" = field(default="getBasicGroupFullInfo", init=False, repr=False)
+    basic_group_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "basic_group_id": self.basic_group_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetSupergroup(Function["Supergroup"]):
+    """
+    Returns information about a supergroup or a channel by its identifier. This is an offline method if the current user is not a bot
+
+    :param supergroup_id: Supergroup or channel identifier
+    :return: :class:`Supergroup`
+    """
+
+    _type: "str" = field(default="getSupergroup", init=False, repr=False)
+    supergroup_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetSupergroupFullInfo(Function["SupergroupFullInfo"]):
+    """
+    Returns full information about a supergroup or a channel by its identifier, cached for up to 1 minute
+
+    :param supergroup_id: Supergroup or channel identifier
+    :return: :class:`SupergroupFullInfo`
+    """
+
+    _type: "str" = field(default="getSupergroupFullInfo", init=False, repr=False)
+    supergroup_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetSecretChat(Function["SecretChat"]):
+    """
+    Returns information about a secret chat by its identifier. This is an offline method
+
+    :param secret_chat_id: Secret chat identifier
+    :return: :class:`SecretChat`
+    """
+
+    _type: "str" = field(default="getSecretChat", init=False, repr=False)
+    secret_chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "secret_chat_id": self.secret_chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChat(Function["Chat"]):
+    """
+    Returns information about a chat by its identifier. This is an offline method if the current user is not a bot
+
+    :param chat_id: Chat identifier
+    :return: :class:`Chat`
+    """
+
+    _type: "str" = field(default="getChat", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetMessage(Function["Message"]):
+    """
+    Returns information about a message. Returns a 404 error if the message doesn't exist
+
+    :param chat_id: Identifier of the chat the message belongs to
+    :param message_id: Identifier of the message to get
+    :return: :class:`Message`
+    """
+
+    _type: "str" = field(default="getMessage", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetMessageLocally(Function["Message"]):
+    """
+    Returns information about a message, if it is available without sending network request. Returns a 404 error if message isn't available locally. This is an offline method
+
+    :param chat_id: Identifier of the chat the message belongs to
+    :param message_id: Identifier of the message to get
+    :return: :class:`Message`
+    """
+
+    _type: "str" = field(default="getMessageLocally", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetRepliedMessage(Function["Message"]):
+    """
+    Returns information about a non-bundled message that is replied by a given message. Also, returns the pinned message for messagePinMessage, the game message for messageGameScore, the invoice message for messagePaymentSuccessful, the message with a previously set same background for messageChatSetBackground,
+     the giveaway message for messageGiveawayCompleted, the checklist message for messageChecklistTasksDone, messageChecklistTasksAdded, the message with suggested post information
+     for messageSuggestedPostApprovalFailed, messageSuggestedPostApproved, messageSuggestedPostDeclined, messageSuggestedPostPaid, messageSuggestedPostRefunded,
+     the message with the regular gift that was upgraded for messageUpgradedGift with origin of the type upgradedGiftOriginUpgrade,
+     and the topic creation message for topic messages without non-bundled replied message. Returns a 404 error if the message doesn't exist
+
+    :param chat_id: Identifier of the chat the message belongs to
+    :param message_id: Identifier of the reply message
+    :return: :class:`Message`
+    """
+
+    _type: "str" = field(default="getRepliedMessage", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatPinnedMessage(Function["Message"]):
+    """
+    Returns information about a newest pinned message in the chat. Returns a 404 error if the message doesn't exist
+
+    :param chat_id: Identifier of the chat the message belongs to
+    :return: :class:`Message`
+    """
+
+    _type: "str" = field(default="getChatPinnedMessage", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetCallbackQueryMessage(Function["Message"]):
+    """
+    Returns information about a message with the callback button that originated a callback query; for bots only
+
+    :param chat_id: Identifier of the chat the message belongs to
+    :param message_id: Message identifier
+    :param callback_query_id: Identifier of the callback query
+    :return: :class:`Message`
+    """
+
+    _type: "str" = field(default="getCallbackQueryMessage", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    callback_query_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "callback_query_id": self.callback_query_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetMessages(Function["Messages"]):
+    """
+    Returns information about messages. If a message is not found, returns null on the corresponding position of the result
+
+    :param chat_id: Identifier of the chat the messages belong to
+    :param message_ids: Identifiers of the messages to get
+    :return: :class:`Messages`
+    """
+
+    _type: "str" = field(default="getMessages", init=False, repr=False)
+    chat_id: "int" = 0
+    message_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_ids": self.message_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class GetMessageProperties(Function["MessageProperties"]):
+    """
+    Returns properties of a message. This is an offline method
+
+    :param chat_id: Chat identifier
+    :param message_id: Identifier of the message
+    :return: :class:`MessageProperties`
+    """
+
+    _type: "str" = field(default="getMessageProperties", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetMessageThread(Function["MessageThreadInfo"]):
+    """
+    Returns information about a message thread. Can be used only if messageProperties.can_get_message_thread == true
+
+    :param chat_id: Chat identifier
+    :param message_id: Identifier of the message
+    :return: :class:`MessageThreadInfo`
+    """
+
+    _type: "str" = field(default="getMessageThread", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetMessageReadDate(Function["MessageReadDate"]):
+    """
+    Returns read date of a recent outgoing message in a private chat. The method can be called if messageProperties.can_get_read_date == true
+
+    :param chat_id: Chat identifier
+    :param message_id: Identifier of the message
+    :return: :class:`MessageReadDate`
+    """
+
+    _type: "str" = field(default="getMessageReadDate", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetMessageViewers(Function["MessageViewers"]):
+    """
+    Returns viewers of a recent outgoing message in a basic group or a supergroup chat. For video notes and voice notes only users, opened content of the message, are returned. The method can be called if messageProperties.can_get_viewers == true
+
+    :param chat_id: Chat identifier
+    :param message_id: Identifier of the message
+    :return: :class:`MessageViewers`
+    """
+
+    _type: "str" = field(default="getMessageViewers", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetMessageAuthor(Function["User"]):
+    """
+    Returns information about actual author of a message sent on behalf of a channel. The method can be called if messageProperties.can_get_author == true
+
+    :param chat_id: Chat identifier
+    :param message_id: Identifier of the message
+    :return: :class:`User`
+    """
+
+    _type: "str" = field(default="getMessageAuthor", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetFile(Function["File"]):
+    """
+    Returns information about a file. This is an offline method
+
+    :param file_id: Identifier of the file to get
+    :return: :class:`File`
+    """
+
+    _type: "str" = field(default="getFile", init=False, repr=False)
+    file_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_id": self.file_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetRemoteFile(Function["File"]):
+    """
+    Returns information about a file by its remote identifier. This is an offline method. Can be used to register a URL as a file for further uploading, or sending as a message. Even the request succeeds, the file can be used only if it is still accessible to the user. For example, if the file is from a message, then the message must be not deleted and accessible to the user. If the file database is disabled, then the corresponding object with the file must be preloaded by the application
+
+    :param remote_file_id: Remote identifier of the file to get
+    :param file_type: File type; pass null if unknown
+    :return: :class:`File`
+    """
+
+    _type: "str" = field(default="getRemoteFile", init=False, repr=False)
+    remote_file_id: "str" = ""
+    file_type: "FileType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "remote_file_id": self.remote_file_id,
+            "file_type": self.file_type._to_json_dict() if self.file_type is not None else None,
+        }
+
+
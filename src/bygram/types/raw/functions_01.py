@@ -0,0 +1,1562 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import Ok
+    from .classes_04 import Users
+    from .classes_05 import MessageSender, MessageTopic, ReactionType
+    from .classes_06 import FoundChatMessages, FoundMessages, Message, Messages
+    from .classes_07 import Chat, ChatList, Chats, DraftMessage, PublicChatType
+    from .classes_08 import DirectMessagesChatTopic
+    from .classes_09 import LocationAddress
+    from .classes_12 import SearchMessagesFilter
+    from .classes_13 import SearchMessagesChatTypeFilter
+    from .classes_14 import FoundStories
+    from .classes_19 import CheckChatUsernameResult, Hashtags
+    from .classes_22 import TopChatCategory
+    from .classes_23 import Count, StarCount
+
+
+@dataclass(slots=True)
+class LoadChats(Function["Ok"]):
+    """
+    Loads more chats from a chat list. The loaded chats and their positions in the chat list will be sent through updates. Chats are sorted by the pair (chat.position.order, chat.id) in descending order. Returns a 404 error if all chats have been loaded
+
+    :param chat_list: The chat list in which to load chats; pass null to load chats from the main chat list
+    :param limit: The maximum number of chats to be loaded. For optimal performance, the number of loaded chats is chosen by TDLib and can be smaller than the specified limit, even if the end of the list is not reached
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="loadChats", init=False, repr=False)
+    chat_list: "ChatList | None" = None
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_list": self.chat_list._to_json_dict() if self.chat_list is not None else None,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChats(Function["Chats"]):
+    """
+    Returns an ordered list of chats from the beginning of a chat list. For informational purposes only. Use loadChats and updates processing instead to maintain chat lists in a consistent state
+
+    :param chat_list: The chat list in which to return chats; pass null to get chats from the main chat list
+    :param limit: The maximum number of chats to be returned
+    :return: :class:`Chats`
+    """
+
+    _type: "str" = field(default="getChats", init=False, repr=False)
+    chat_list: "ChatList | None" = None
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_list": self.chat_list._to_json_dict() if self.chat_list is not None else None,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchPublicChat(Function["Chat"]):
+    """
+    Searches a public chat by its username. Currently, only private chats, supergroups and channels can be public. Returns the chat if found; otherwise, an error is returned
+
+    :param username: Username to be resolved
+    :return: :class:`Chat`
+    """
+
+    _type: "str" = field(default="searchPublicChat", init=False, repr=False)
+    username: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "username": self.username,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchPublicChats(Function["Chats"]):
+    """
+    Searches public chats by looking for specified query in their username and title. Currently, only private chats, supergroups and channels can be public. Returns a meaningful number of results. Excludes private chats with contacts and chats from the chat list from the results
+
+    :param query: Query to search for
+    :return: :class:`Chats`
+    """
+
+    _type: "str" = field(default="searchPublicChats", init=False, repr=False)
+    query: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "query": self.query,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchChats(Function["Chats"]):
+    """
+    Searches for the specified query in the title and username of already known chats. This is an offline method. Returns chats in the order seen in the main chat list
+
+    :param query: Query to search for. If the query is empty, returns up to 50 recently found chats
+    :param limit: The maximum number of chats to be returned
+    :return: :class:`Chats`
+    """
+
+    _type: "str" = field(default="searchChats", init=False, repr=False)
+    query: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "query": self.query,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchChatsOnServer(Function["Chats"]):
+    """
+    Searches for the specified query in the title and username of already known chats via request to the server. Returns chats in the order seen in the main chat list
+
+    :param query: Query to search for
+    :param limit: The maximum number of chats to be returned
+    :return: :class:`Chats`
+    """
+
+    _type: "str" = field(default="searchChatsOnServer", init=False, repr=False)
+    query: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "query": self.query,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class GetRecommendedChats(Function["Chats"]):
+    """
+    Returns a list of channel chats recommended to the current user
+
+    :return: :class:`Chats`
+    """
+
+    _type: "str" = field(default="getRecommendedChats", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatSimilarChats(Function["Chats"]):
+    """
+    Returns a list of chats similar to the given chat
+
+    :param chat_id: Identifier of the target chat; must be an identifier of a channel chat
+    :return: :class:`Chats`
+    """
+
+    _type: "str" = field(default="getChatSimilarChats", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatSimilarChatCount(Function["Count"]):
+    """
+    Returns approximate number of chats similar to the given chat
+
+    :param chat_id: Identifier of the target chat; must be an identifier of a channel chat
+    :param return_local: Pass true to get the number of chats without sending network requests, or -1 if the number of chats is unknown locally
+    :return: :class:`Count`
+    """
+
+    _type: "str" = field(default="getChatSimilarChatCount", init=False, repr=False)
+    chat_id: "int" = 0
+    return_local: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "return_local": self.return_local,
+        }
+
+
+
+@dataclass(slots=True)
+class OpenChatSimilarChat(Function["Ok"]):
+    """
+    Informs TDLib that a chat was opened from the list of similar chats. The method is independent of openChat and closeChat methods
+
+    :param chat_id: Identifier of the original chat, which similar chats were requested
+    :param opened_chat_id: Identifier of the opened chat
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="openChatSimilarChat", init=False, repr=False)
+    chat_id: "int" = 0
+    opened_chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "opened_chat_id": self.opened_chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetBotSimilarBots(Function["Users"]):
+    """
+    Returns a list of bots similar to the given bot
+
+    :param bot_user_id: User identifier of the target bot
+    :return: :class:`Users`
+    """
+
+    _type: "str" = field(default="getBotSimilarBots", init=False, repr=False)
+    bot_user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetBotSimilarBotCount(Function["Count"]):
+    """
+    Returns approximate number of bots similar to the given bot
+
+    :param bot_user_id: User identifier of the target bot
+    :param return_local: Pass true to get the number of bots without sending network requests, or -1 if the number of bots is unknown locally
+    :return: :class:`Count`
+    """
+
+    _type: "str" = field(default="getBotSimilarBotCount", init=False, repr=False)
+    bot_user_id: "int" = 0
+    return_local: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "return_local": self.return_local,
+        }
+
+
+
+@dataclass(slots=True)
+class OpenBotSimilarBot(Function["Ok"]):
+    """
+    Informs TDLib that a bot was opened from the list of similar bots
+
+    :param bot_user_id: Identifier of the original bot, which similar bots were requested
+    :param opened_bot_user_id: Identifier of the opened bot
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="openBotSimilarBot", init=False, repr=False)
+    bot_user_id: "int" = 0
+    opened_bot_user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "opened_bot_user_id": self.opened_bot_user_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetTopChats(Function["Chats"]):
+    """
+    Returns a list of frequently used chats
+
+    :param category: Category of chats to be returned
+    :param limit: The maximum number of chats to be returned; up to 30
+    :return: :class:`Chats`
+    """
+
+    _type: "str" = field(default="getTopChats", init=False, repr=False)
+    category: "TopChatCategory | None" = None
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "category": self.category._to_json_dict() if self.category is not None else None,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class RemoveTopChat(Function["Ok"]):
+    """
+    Removes a chat from the list of frequently used chats. Supported only if the chat info database is enabled
+
+    :param category: Category of frequently used chats
+    :param chat_id: Chat identifier
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="removeTopChat", init=False, repr=False)
+    category: "TopChatCategory | None" = None
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "category": self.category._to_json_dict() if self.category is not None else None,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchRecentlyFoundChats(Function["Chats"]):
+    """
+    Searches for the specified query in the title and username of up to 50 recently found chats. This is an offline method
+
+    :param query: Query to search for
+    :param limit: The maximum number of chats to be returned
+    :return: :class:`Chats`
+    """
+
+    _type: "str" = field(default="searchRecentlyFoundChats", init=False, repr=False)
+    query: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "query": self.query,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class AddRecentlyFoundChat(Function["Ok"]):
+    """
+    Adds a chat to the list of recently found chats. The chat is added to the beginning of the list. If the chat is already in the list, it will be removed from the list first
+
+    :param chat_id: Identifier of the chat to add
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="addRecentlyFoundChat", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class RemoveRecentlyFoundChat(Function["Ok"]):
+    """
+    Removes a chat from the list of recently found chats
+
+    :param chat_id: Identifier of the chat to be removed
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="removeRecentlyFoundChat", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ClearRecentlyFoundChats(Function["Ok"]):
+    """
+    Clears the list of recently found chats
+
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="clearRecentlyFoundChats", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetRecentlyOpenedChats(Function["Chats"]):
+    """
+    Returns recently opened chats. This is an offline method. Returns chats in the order of last opening
+
+    :param limit: The maximum number of chats to be returned
+    :return: :class:`Chats`
+    """
+
+    _type: "str" = field(default="getRecentlyOpenedChats", init=False, repr=False)
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class CheckChatUsername(Function["CheckChatUsernameResult"]):
+    """
+    Checks whether a username can be set for a chat
+
+    :param chat_id: Chat identifier; must be identifier of a supergroup chat, or a channel chat, or a private chat with self, or 0 if the chat is being created
+    :param username: Username to be checked
+    :return: :class:`CheckChatUsernameResult`
+    """
+
+    _type: "str" = field(default="checkChatUsername", init=False, repr=False)
+    chat_id: "int" = 0
+    username: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "username": self.username,
+        }
+
+
+
+@dataclass(slots=True)
+class GetCreatedPublicChats(Function["Chats"]):
+    """
+    Returns a list of public chats of the specified type, owned by the user
+
+    :param type: Type of the public chats to return
+    :return: :class:`Chats`
+    """
+
+    _type: "str" = field(default="getCreatedPublicChats", init=False, repr=False)
+    type: "PublicChatType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class CheckCreatedPublicChatsLimit(Function["Ok"]):
+    """
+    Checks whether the maximum number of owned public chats has been reached. Returns corresponding error if the limit was reached. The limit can be increased with Telegram Premium
+
+    :param type: Type of the public chats, for which to check the limit
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="checkCreatedPublicChatsLimit", init=False, repr=False)
+    type: "PublicChatType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetSuitableDiscussionChats(Function["Chats"]):
+    """
+    Returns a list of basic group and supergroup chats, which can be used as a discussion group for a channel. Returned basic group chats must be first upgraded to supergroups before they can be set as a discussion group. To set a returned supergroup as a discussion group, access to its old messages must be enabled using toggleSupergroupIsAllHistoryAvailable first
+
+    :return: :class:`Chats`
+    """
+
+    _type: "str" = field(default="getSuitableDiscussionChats", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetInactiveSupergroupChats(Function["Chats"]):
+    """
+    Returns a list of recently inactive supergroups and channels. Can be used when user reaches limit on the number of joined supergroups and channels and receives the error "CHANNELS_TOO_MUCH". Also, the limit can be increased with Telegram Premium
+
+    :return: :class:`Chats`
+    """
+
+    _type: "str" = field(default="getInactiveSupergroupChats", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetSuitablePersonalChats(Function["Chats"]):
+    """
+    Returns a list of channel chats, which can be used as a personal chat
+
+    :return: :class:`Chats`
+    """
+
+    _type: "str" = field(default="getSuitablePersonalChats", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class LoadDirectMessagesChatTopics(Function["Ok"]):
+    """
+    Loads more topics in a channel direct messages chat administered by the current user. The loaded topics will be sent through updateDirectMessagesChatTopic. Topics are sorted by their topic.order in descending order. Returns a 404 error if all topics have been loaded
+
+    :param chat_id: Chat identifier of the channel direct messages chat
+    :param limit: The maximum number of topics to be loaded. For optimal performance, the number of loaded topics is chosen by TDLib and can be smaller than the specified limit, even if the end of the list is not reached
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="loadDirectMessagesChatTopics", init=False, repr=False)
+    chat_id: "int" = 0
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class GetDirectMessagesChatTopic(Function["DirectMessagesChatTopic"]):
+    """
+    Returns information about the topic in a channel direct messages chat administered by the current user
+
+    :param chat_id: Chat identifier of the channel direct messages chat
+    :param topic_id: Identifier of the topic to get
+    :return: :class:`DirectMessagesChatTopic`
+    """
+
+    _type: "str" = field(default="getDirectMessagesChatTopic", init=False, repr=False)
+    chat_id: "int" = 0
+    topic_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "topic_id": self.topic_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetDirectMessagesChatTopicHistory(Function["Messages"]):
+    """
+    Returns messages in the topic in a channel direct messages chat administered by the current user. The messages are returned in reverse chronological order (i.e., in order of decreasing message_id)
+
+    :param chat_id: Chat identifier of the channel direct messages chat
+    :param topic_id: Identifier of the topic which messages will be fetched
+    :param from_message_id: Identifier of the message starting from which messages must be fetched; use 0 to get results from the last message
+    :param offset: Specify 0 to get results from exactly the message from_message_id or a negative offset up to 99 to get additionally some newer messages
+    :param limit: The maximum number of messages to be returned; must be positive and can't be greater than 100. If the offset is negative, the limit must be greater than or equal to -offset.
+     For optimal performance, the number of returned messages is chosen by TDLib and can be smaller than the specified limit
+    :return: :class:`Messages`
+    """
+
+    _type: "str" = field(default="getDirectMessagesChatTopicHistory", init=False, repr=False)
+    chat_id: "int" = 0
+    topic_id: "int" = 0
+    from_message_id: "int" = 0
+    offset: "int" = 0
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "topic_id": self.topic_id,
+            "from_message_id": self.from_message_id,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class GetDirectMessagesChatTopicMessageByDate(Function["Message"]):
+    """
+    Returns the last message sent in the topic in a channel direct messages chat administered by the current user no later than the specified date
+
+    :param chat_id: Chat identifier of the channel direct messages chat
+    :param topic_id: Identifier of the topic which messages will be fetched
+    :param date: Point in time (Unix timestamp) relative to which to search for messages
+    :return: :class:`Message`
+    """
+
+    _type: "str" = field(default="getDirectMessagesChatTopicMessageByDate", init=False, repr=False)
+    chat_id: "int" = 0
+    topic_id: "int" = 0
+    date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "topic_id": self.topic_id,
+            "date": self.date,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteDirectMessagesChatTopicHistory(Function["Ok"]):
+    """
+    Deletes all messages in the topic in a channel direct messages chat administered by the current user
+
+    :param chat_id: Chat identifier of the channel direct messages chat
+    :param topic_id: Identifier of the topic which messages will be deleted
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteDirectMessagesChatTopicHistory", init=False, repr=False)
+    chat_id: "int" = 0
+    topic_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "topic_id": self.topic_id,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteDirectMessagesChatTopicMessagesByDate(Function["Ok"]):
+    """
+    Deletes all messages between the specified dates in the topic in a channel direct messages chat administered by the current user. Messages sent in the last 30 seconds will not be deleted
+
+    :param chat_id: Chat identifier of the channel direct messages chat
+    :param topic_id: Identifier of the topic which messages will be deleted
+    :param min_date: The minimum date of the messages to delete
+    :param max_date: The maximum date of the messages to delete
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteDirectMessagesChatTopicMessagesByDate", init=False, repr=False)
+    chat_id: "int" = 0
+    topic_id: "int" = 0
+    min_date: "int" = 0
+    max_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "topic_id": self.topic_id,
+            "min_date": self.min_date,
+            "max_date": self.max_date,
+        }
+
+
+
+@dataclass(slots=True)
+class SetDirectMessagesChatTopicIsMarkedAsUnread(Function["Ok"]):
+    """
+    Changes the marked as unread state of the topic in a channel direct messages chat administered by the current user
+
+    :param chat_id: Chat identifier of the channel direct messages chat
+    :param topic_id: Topic identifier
+    :param is_marked_as_unread: New value of is_marked_as_unread
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setDirectMessagesChatTopicIsMarkedAsUnread", init=False, repr=False)
+    chat_id: "int" = 0
+    topic_id: "int" = 0
+    is_marked_as_unread: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "topic_id": self.topic_id,
+            "is_marked_as_unread": self.is_marked_as_unread,
+        }
+
+
+
+@dataclass(slots=True)
+class SetDirectMessagesChatTopicDraftMessage(Function["Ok"]):
+    """
+    Changes the draft message in the topic in a channel direct messages chat administered by the current user
+
+    :param chat_id: Chat identifier
+    :param topic_id: Topic identifier
+    :param draft_message: New draft message; pass null to remove the draft. All files in draft message content must be of the type inputFileLocal. Media thumbnails and captions are ignored
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setDirectMessagesChatTopicDraftMessage", init=False, repr=False)
+    chat_id: "int" = 0
+    topic_id: "int" = 0
+    draft_message: "DraftMessage | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "topic_id": self.topic_id,
+            "draft_message": self.draft_message._to_json_dict() if self.draft_message is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class UnpinAllDirectMessagesChatTopicMessages(Function["Ok"]):
+    """
+    Removes all pinned messages from the topic in a channel direct messages chat administered by the current user
+
+    :param chat_id: Identifier of the chat
+    :param topic_id: Topic identifier
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="unpinAllDirectMessagesChatTopicMessages", init=False, repr=False)
+    chat_id: "int" = 0
+    topic_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "topic_id": self.topic_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ReadAllDirectMessagesChatTopicReactions(Function["Ok"]):
+    """
+    Removes all unread reactions in the topic in a channel direct messages chat administered by the current user
+
+    :param chat_id: Identifier of the chat
+    :param topic_id: Topic identifier
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="readAllDirectMessagesChatTopicReactions", init=False, repr=False)
+    chat_id: "int" = 0
+    topic_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "topic_id": self.topic_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetDirectMessagesChatTopicRevenue(Function["StarCount"]):
+    """
+    Returns the total number of Telegram Stars received by the channel chat for direct messages from the given topic
+
+    :param chat_id: Chat identifier of the channel direct messages chat administered by the current user
+    :param topic_id: Identifier of the topic
+    :return: :class:`StarCount`
+    """
+
+    _type: "str" = field(default="getDirectMessagesChatTopicRevenue", init=False, repr=False)
+    chat_id: "int" = 0
+    topic_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "topic_id": self.topic_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleDirectMessagesChatTopicCanSendUnpaidMessages(Function["Ok"]):
+    """
+    Allows to send unpaid messages to the given topic of the channel direct messages chat administered by the current user
+
+    :param chat_id: Chat identifier
+    :param topic_id: Identifier of the topic
+    :param can_send_unpaid_messages: Pass true to allow unpaid messages; pass false to disallow unpaid messages
+    :param refund_payments: Pass true to refund the user previously paid messages
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleDirectMessagesChatTopicCanSendUnpaidMessages", init=False, repr=False)
+    chat_id: "int" = 0
+    topic_id: "int" = 0
+    can_send_unpaid_messages: "bool" = False
+    refund_payments: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "topic_id": self.topic_id,
+            "can_send_unpaid_messages": self.can_send_unpaid_messages,
+            "refund_payments": self.refund_payments,
+        }
+
+
+
+@dataclass(slots=True)
+class LoadSavedMessagesTopics(Function["Ok"]):
+    """
+    Loads more Saved Messages topics. The loaded topics will be sent through updateSavedMessagesTopic. Topics are sorted by their topic.order in descending order. Returns a 404 error if all topics have been loaded
+
+    :param limit: The maximum number of topics to be loaded. For optimal performance, the number of loaded topics is chosen by TDLib and can be smaller than the specified limit, even if the end of the list is not reached
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="loadSavedMessagesTopics", init=False, repr=False)
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class GetSavedMessagesTopicHistory(Function["Messages"]):
+    """
+    Returns messages in a Saved Messages topic. The messages are returned in reverse chronological order (i.e., in order of decreasing message_id)
+
+    :param saved_messages_topic_id: Identifier of Saved Messages topic which messages will be fetched
+    :param from_message_id: Identifier of the message starting from which messages must be fetched; use 0 to get results from the last message
+    :param offset: Specify 0 to get results from exactly the message from_message_id or a negative offset up to 99 to get additionally some newer messages
+    :param limit: The maximum number of messages to be returned; must be positive and can't be greater than 100. If the offset is negative, the limit must be greater than or equal to -offset.
+     For optimal performance, the number of returned messages is chosen by TDLib and can be smaller than the specified limit
+    :return: :class:`Messages`
+    """
+
+    _type: "str" = field(default="getSavedMessagesTopicHistory", init=False, repr=False)
+    saved_messages_topic_id: "int" = 0
+    from_message_id: "int" = 0
+    offset: "int" = 0
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "saved_messages_topic_id": self.saved_messages_topic_id,
+            "from_message_id": self.from_message_id,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class GetSavedMessagesTopicMessageByDate(Function["Message"]):
+    """
+    Returns the last message sent in a Saved Messages topic no later than the specified date
+
+    :param saved_messages_topic_id: Identifier of Saved Messages topic which message will be returned
+    :param date: Point in time (Unix timestamp) relative to which to search for messages
+    :return: :class:`Message`
+    """
+
+    _type: "str" = field(default="getSavedMessagesTopicMessageByDate", init=False, repr=False)
+    saved_messages_topic_id: "int" = 0
+    date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "saved_messages_topic_id": self.saved_messages_topic_id,
+            "date": self.date,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteSavedMessagesTopicHistory(Function["Ok"]):
+    """
+    Deletes all messages in a Saved Messages topic
+
+    :param saved_messages_topic_id: Identifier of Saved Messages topic which messages will be deleted
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteSavedMessagesTopicHistory", init=False, repr=False)
+    saved_messages_topic_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "saved_messages_topic_id": self.saved_messages_topic_id,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteSavedMessagesTopicMessagesByDate(Function["Ok"]):
+    """
+    Deletes all messages between the specified dates in a Saved Messages topic. Messages sent in the last 30 seconds will not be deleted
+
+    :param saved_messages_topic_id: Identifier of Saved Messages topic which messages will be deleted
+    :param min_date: The minimum date of the messages to delete
+    :param max_date: The maximum date of the messages to delete
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteSavedMessagesTopicMessagesByDate", init=False, repr=False)
+    saved_messages_topic_id: "int" = 0
+    min_date: "int" = 0
+    max_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "saved_messages_topic_id": self.saved_messages_topic_id,
+            "min_date": self.min_date,
+            "max_date": self.max_date,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleSavedMessagesTopicIsPinned(Function["Ok"]):
+    """
+    Changes the pinned state of a Saved Messages topic. There can be up to getOption("pinned_saved_messages_topic_count_max") pinned topics. The limit can be increased with Telegram Premium
+
+    :param saved_messages_topic_id: Identifier of Saved Messages topic to pin or unpin
+    :param is_pinned: Pass true to pin the topic; pass false to unpin it
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleSavedMessagesTopicIsPinned", init=False, repr=False)
+    saved_messages_topic_id: "int" = 0
+    is_pinned: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "saved_messages_topic_id": self.saved_messages_topic_id,
+            "is_pinned": self.is_pinned,
+        }
+
+
+
+@dataclass(slots=True)
+class SetPinnedSavedMessagesTopics(Function["Ok"]):
+    """
+    Changes the order of pinned Saved Messages topics
+
+    :param saved_messages_topic_ids: Identifiers of the new pinned Saved Messages topics
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setPinnedSavedMessagesTopics", init=False, repr=False)
+    saved_messages_topic_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "saved_messages_topic_ids": self.saved_messages_topic_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class GetGroupsInCommon(Function["Chats"]):
+    """
+    Returns a list of common group chats with a given user. Chats are sorted by their type and creation date
+
+    :param user_id: User identifier
+    :param offset_chat_id: Chat identifier starting from which to return chats; use 0 for the first request
+    :param limit: The maximum number of chats to be returned; up to 100
+    :return: :class:`Chats`
+    """
+
+    _type: "str" = field(default="getGroupsInCommon", init=False, repr=False)
+    user_id: "int" = 0
+    offset_chat_id: "int" = 0
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "offset_chat_id": self.offset_chat_id,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatHistory(Function["Messages"]):
+    """
+    Returns messages in a chat. The messages are returned in reverse chronological order (i.e., in order of decreasing message_id). For optimal performance, the number of returned messages is chosen by TDLib. This is an offline method if only_local is true
+
+    :param chat_id: Chat identifier
+    :param from_message_id: Identifier of the message starting from which history must be fetched; use 0 to get results from the last message
+    :param offset: Specify 0 to get results from exactly the message from_message_id or a negative offset up to 99 to get additionally some newer messages
+    :param limit: The maximum number of messages to be returned; must be positive and can't be greater than 100. If the offset is negative, the limit must be greater than or equal to -offset.
+     For optimal performance, the number of returned messages is chosen by TDLib and can be smaller than the specified limit
+    :param only_local: Pass true to get only messages that are available without sending network requests
+    :return: :class:`Messages`
+    """
+
+    _type: "str" = field(default="getChatHistory", init=False, repr=False)
+    chat_id: "int" = 0
+    from_message_id: "int" = 0
+    offset: "int" = 0
+    limit: "int" = 0
+    only_local: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "from_message_id": self.from_message_id,
+            "offset": self.offset,
+            "limit": self.limit,
+            "only_local": self.only_local,
+        }
+
+
+
+@dataclass(slots=True)
+class GetMessageThreadHistory(Function["Messages"]):
+    """
+    Returns messages in a message thread of a message. Can be used only if messageProperties.can_get_message_thread == true. Message thread of a channel message is in the channel's linked supergroup. The messages are returned in reverse chronological order (i.e., in order of decreasing message_id). For optimal performance, the number of returned messages is chosen by TDLib
+
+    :param chat_id: Chat identifier
+    :param message_id: Message identifier, which thread history needs to be returned
+    :param from_message_id: Identifier of the message starting from which history must be fetched; use 0 to get results from the last message
+    :param offset: Specify 0 to get results from exactly the message from_message_id or a negative offset up to 99 to get additionally some newer messages
+    :param limit: The maximum number of messages to be returned; must be positive and can't be greater than 100. If the offset is negative, the limit must be greater than or equal to -offset.
+     For optimal performance, the number of returned messages is chosen by TDLib and can be smaller than the specified limit
+    :return: :class:`Messages`
+    """
+
+    _type: "str" = field(default="getMessageThreadHistory", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    from_message_id: "int" = 0
+    offset: "int" = 0
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "from_message_id": self.from_message_id,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteChatHistory(Function["Ok"]):
+    """
+    Deletes all messages in the chat. Use chat.can_be_deleted_only_for_self and chat.can_be_deleted_for_all_users fields to find whether and how the method can be applied to the chat
+
+    :param chat_id: Chat identifier
+    :param remove_from_chat_list: Pass true to remove the chat from all chat lists
+    :param revoke: Pass true to delete chat history for all users
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteChatHistory", init=False, repr=False)
+    chat_id: "int" = 0
+    remove_from_chat_list: "bool" = False
+    revoke: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "remove_from_chat_list": self.remove_from_chat_list,
+            "revoke": self.revoke,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteChat(Function["Ok"]):
+    """
+    Deletes a chat along with all messages in the corresponding chat for all chat members. For group chats this will release the usernames and remove all members. Use the field chat.can_be_deleted_for_all_users to find whether the method can be applied to the chat
+
+    :param chat_id: Chat identifier
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteChat", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchChatMessages(Function["FoundChatMessages"]):
+    """
+    Searches for messages with given words in the chat. Returns the results in reverse chronological order, i.e. in order of decreasing message_id. Cannot be used in secret chats with a non-empty query (searchSecretMessages must be used instead), or without an enabled message database. For optimal performance, the number of returned messages is chosen by TDLib and can be smaller than the specified limit.
+     A combination of query, sender_id, filter and topic_id search criteria is expected to be supported, only if it is required for Telegram official application implementation
+
+    :param chat_id: Identifier of the chat in which to search messages
+    :param topic_id: Pass topic identifier to search messages only in specific topic; pass null to search for messages in all topics
+    :param query: Query to search for
+    :param sender_id: Identifier of the sender of messages to search for; pass null to search for messages from any sender. Not supported in secret chats
+    :param from_message_id: Identifier of the message starting from which history must be fetched; use 0 to get results from the last message
+    :param offset: Specify 0 to get results from exactly the message from_message_id or a negative offset to get the specified message and some newer messages
+    :param limit: The maximum number of messages to be returned; must be positive and can't be greater than 100. If the offset is negative, the limit must be greater than -offset.
+     For optimal performance, the number of returned messages is chosen by TDLib and can be smaller than the specified limit
+    :param filter: Additional filter for messages to search; pass null to search for all messages
+    :return: :class:`FoundChatMessages`
+    """
+
+    _type: "str" = field(default="searchChatMessages", init=False, repr=False)
+    chat_id: "int" = 0
+    topic_id: "MessageTopic | None" = None
+    query: "str" = ""
+    sender_id: "MessageSender | None" = None
+    from_message_id: "int" = 0
+    offset: "int" = 0
+    limit: "int" = 0
+    filter: "SearchMessagesFilter | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "topic_id": self.topic_id._to_json_dict() if self.topic_id is not None else None,
+            "query": self.query,
+            "sender_id": self.sender_id._to_json_dict() if self.sender_id is not None else None,
+            "from_message_id": self.from_message_id,
+            "offset": self.offset,
+            "limit": self.limit,
+            "filter": self.filter._to_json_dict() if self.filter is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchMessages(Function["FoundMessages"]):
+    """
+    Searches for messages in all chats except secret chats. Returns the results in reverse chronological order (i.e., in order of decreasing (date, chat_id, message_id)). For optimal performance, the number of returned messages is chosen by TDLib and can be smaller than the specified limit
+
+    :param chat_list: Chat list in which to search messages; pass null to search in all chats regardless of their chat list. Only Main and Archive chat lists are supported
+    :param query: Query to search for
+    :param offset: Offset of the first entry to return as received from the previous request; use empty string to get the first chunk of results
+    :param limit: The maximum number of messages to be returned; up to 100. For optimal performance, the number of returned messages is chosen by TDLib and can be smaller than the specified limit
+    :param filter: Additional filter for messages to search; pass null to search for all messages. Filters searchMessagesFilterMention, searchMessagesFilterUnreadMention, searchMessagesFilterUnreadReaction, searchMessagesFilterFailedToSend, and searchMessagesFilterPinned are unsupported in this function
+    :param chat_type_filter: Additional filter for type of the chat of the searched messages; pass null to search for messages in all chats
+    :param min_date: If not 0, the minimum date of the messages to return
+    :param max_date: If not 0, the maximum date of the messages to return
+    :return: :class:`FoundMessages`
+    """
+
+    _type: "str" = field(default="searchMessages", init=False, repr=False)
+    chat_list: "ChatList | None" = None
+    query: "str" = ""
+    offset: "str" = ""
+    limit: "int" = 0
+    filter: "SearchMessagesFilter | None" = None
+    chat_type_filter: "SearchMessagesChatTypeFilter | None" = None
+    min_date: "int" = 0
+    max_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_list": self.chat_list._to_json_dict() if self.chat_list is not None else None,
+            "query": self.query,
+            "offset": self.offset,
+            "limit": self.limit,
+            "filter": self.filter._to_json_dict() if self.filter is not None else None,
+            "chat_type_filter": self.chat_type_filter._to_json_dict() if self.chat_type_filter is not None else None,
+            "min_date": self.min_date,
+            "max_date": self.max_date,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchSecretMessages(Function["FoundMessages"]):
+    """
+    Searches for messages in secret chats. Returns the results in reverse chronological order. For optimal performance, the number of returned messages is chosen by TDLib
+
+    :param chat_id: Identifier of the chat in which to search. Specify 0 to search in all secret chats
+    :param query: Query to search for. If empty, searchChatMessages must be used instead
+    :param offset: Offset of the first entry to return as received from the previous request; use empty string to get the first chunk of results
+    :param limit: The maximum number of messages to be returned; up to 100. For optimal performance, the number of returned messages is chosen by TDLib and can be smaller than the specified limit
+    :param filter: Additional filter for messages to search; pass null to search for all messages
+    :return: :class:`FoundMessages`
+    """
+
+    _type: "str" = field(default="searchSecretMessages", init=False, repr=False)
+    chat_id: "int" = 0
+    query: "str" = ""
+    offset: "str" = ""
+    limit: "int" = 0
+    filter: "SearchMessagesFilter | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "query": self.query,
+            "offset": self.offset,
+            "limit": self.limit,
+            "filter": self.filter._to_json_dict() if self.filter is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchSavedMessages(Function["FoundChatMessages"]):
+    """
+    Searches for messages tagged by the given reaction and with the given words in the Saved Messages chat; for Telegram Premium users only. Returns the results in reverse chronological order, i.e. in order of decreasing message_id.
+     For optimal performance, the number of returned messages is chosen by TDLib and can be smaller than the specified limit
+
+    :param saved_messages_topic_id: If not 0, only messages in the specified Saved Messages topic will be considered; pass 0 to consider all messages
+    :param tag: Tag to search for; pass null to return all suitable messages
+    :param query: Query to search for
+    :param from_message_id: Identifier of the message starting from which messages must be fetched; use 0 to get results from the last message
+    :param offset: Specify 0 to get results from exactly the message from_message_id or a negative offset to get the specified message and some newer messages
+    :param limit: The maximum number of messages to be returned; must be positive and can't be greater than 100. If the offset is negative, the limit must be greater than -offset.
+     For optimal performance, the number of returned messages is chosen by TDLib and can be smaller than the specified limit
+    :return: :class:`FoundChatMessages`
+    """
+
+    _type: "str" = field(default="searchSavedMessages", init=False, repr=False)
+    saved_messages_topic_id: "int" = 0
+    tag: "ReactionType | None" = None
+    query: "str" = ""
+    from_message_id: "int" = 0
+    offset: "int" = 0
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "saved_messages_topic_id": self.saved_messages_topic_id,
+            "tag": self.tag._to_json_dict() if self.tag is not None else None,
+            "query": self.query,
+            "from_message_id": self.from_message_id,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchCallMessages(Function["FoundMessages"]):
+    """
+    Searches for call and group call messages. Returns the results in reverse chronological order (i.e., in order of decreasing message_id). For optimal performance, the number of returned messages is chosen by TDLib
+
+    :param offset: Offset of the first entry to return as received from the previous request; use empty string to get the first chunk of results
+    :param limit: The maximum number of messages to be returned; up to 100. For optimal performance, the number of returned messages is chosen by TDLib and can be smaller than the specified limit
+    :param only_missed: Pass true to search only for messages with missed/declined calls
+    :return: :class:`FoundMessages`
+    """
+
+    _type: "str" = field(default="searchCallMessages", init=False, repr=False)
+    offset: "str" = ""
+    limit: "int" = 0
+    only_missed: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "offset": self.offset,
+            "limit": self.limit,
+            "only_missed": self.only_missed,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchOutgoingDocumentMessages(Function["FoundMessages"]):
+    """
+    Searches for outgoing messages with content of the type messageDocument in all chats except secret chats. Returns the results in reverse chronological order
+
+    :param query: Query to search for in document file name and message caption
+    :param limit: The maximum number of messages to be returned; up to 100
+    :return: :class:`FoundMessages`
+    """
+
+    _type: "str" = field(default="searchOutgoingDocumentMessages", init=False, repr=False)
+    query: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "query": self.query,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchPublicMessagesByTag(Function["FoundMessages"]):
+    """
+    Searches for public channel posts containing the given hashtag or cashtag. For optimal performance, the number of returned messages is chosen by TDLib and can be smaller than the specified limit
+
+    :param tag: Hashtag or cashtag to search for
+    :param offset: Offset of the first entry to return as received from the previous request; use empty string to get the first chunk of results
+    :param limit: The maximum number of messages to be returned; up to 100. For optimal performance, the number of returned messages is chosen by TDLib and can be smaller than the specified limit
+    :return: :class:`FoundMessages`
+    """
+
+    _type: "str" = field(default="searchPublicMessagesByTag", init=False, repr=False)
+    tag: "str" = ""
+    offset: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "tag": self.tag,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchPublicStoriesByTag(Function["FoundStories"]):
+    """
+    Searches for public stories containing the given hashtag or cashtag. For optimal performance, the number of returned stories is chosen by TDLib and can be smaller than the specified limit
+
+    :param story_poster_chat_id: Identifier of the chat that posted the stories to search for; pass 0 to search stories in all chats
+    :param tag: Hashtag or cashtag to search for
+    :param offset: Offset of the first entry to return as received from the previous request; use empty string to get the first chunk of results
+    :param limit: The maximum number of stories to be returned; up to 100. For optimal performance, the number of returned stories is chosen by TDLib and can be smaller than the specified limit
+    :return: :class:`FoundStories`
+    """
+
+    _type: "str" = field(default="searchPublicStoriesByTag", init=False, repr=False)
+    story_poster_chat_id: "int" = 0
+    tag: "str" = ""
+    offset: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_poster_chat_id": self.story_poster_chat_id,
+            "tag": self.tag,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchPublicStoriesByLocation(Function["FoundStories"]):
+    """
+    Searches for public stories by the given address location. For optimal performance, the number of returned stories is chosen by TDLib and can be smaller than the specified limit
+
+    :param address: Address of the location
+    :param offset: Offset of the first entry to return as received from the previous request; use empty string to get the first chunk of results
+    :param limit: The maximum number of stories to be returned; up to 100. For optimal performance, the number of returned stories is chosen by TDLib and can be smaller than the specified limit
+    :return: :class:`FoundStories`
+    """
+
+    _type: "str" = field(default="searchPublicStoriesByLocation", init=False, repr=False)
+    address: "LocationAddress | None" = None
+    offset: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "address": self.address._to_json_dict() if self.address is not None else None,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchPublicStoriesByVenue(Function["FoundStories"]):
+    """
+    Searches for public stories from the given venue. For optimal performance, the number of returned stories is chosen by TDLib and can be smaller than the specified limit
+
+    :param venue_provider: Provider of the venue
+    :param venue_id: Identifier of the venue in the provider database
+    :param offset: Offset of the first entry to return as received from the previous request; use empty string to get the first chunk of results
+    :param limit: The maximum number of stories to be returned; up to 100. For optimal performance, the number of returned stories is chosen by TDLib and can be smaller than the specified limit
+    :return: :class:`FoundStories`
+    """
+
+    _type: "str" = field(default="searchPublicStoriesByVenue", init=False, repr=False)
+    venue_provider: "str" = ""
+    venue_id: "str" = ""
+    offset: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "venue_provider": self.venue_provider,
+            "venue_id": self.venue_id,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class GetSearchedForTags(Function["Hashtags"]):
+    """
+    Returns recently searched for hashtags or cashtags by their prefix
+
+    :param tag_prefix: Prefix of hashtags or cashtags to return
+    :param limit: The maximum number of items to be returned
+    :return: :class:`Hashtags`
+    """
+
+    _type: "str" = field(default="getSearchedForTags", init=False, repr=False)
+    tag_prefix: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "tag_prefix": self.tag_prefix,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class RemoveSearchedForTag(Function["Ok"]):
+    """
+    Removes a hashtag or a cashtag from the list of recently searched for hashtags or cashtags
+
+    :param tag: Hashtag or cashtag to delete
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="removeSearchedForTag", init=False, repr=False)
+    tag: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "tag": self.tag,
+        }
+
+
+
+@dataclass(slots=True)
+class ClearSearchedForTags(Function["Ok"]):
+    """
+    Clears the list of recently searched for hashtags or cashtags
+
+    :param clear_cashtags: Pass true to clear the list of recently searched for cashtags; otherwise, the list of recently searched for hashtags will be cleared
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="clearSearchedForTags", init=False, repr=False)
+    clear_cashtags: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "clear_cashtags": self.clear_cashtags,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteAllCallMessages(Function["Ok"]):
+    """
+    Deletes all call messages
+
+    :param revoke: Pass true to delete the messages for all users
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteAllCallMessages", init=False, repr=False)
+    revoke: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "revoke": self.revoke,
+        }
+
+
@@ -0,0 +1,1792 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import FormattedText, Ok
+    from .classes_01 import InputChecklist, Location
+    from .classes_05 import ChatMessageSenders, MessageSender, MessageTopic
+    from .classes_06 import BusinessMessage, BusinessMessages, InputMessageReplyTo, InputTextQuote, Message, MessageCalendar, MessagePositions, Messages, ReportSponsoredResult, SponsoredChats, SponsoredMessages, VideoMessageAdvertisements
+    from .classes_08 import ReplyMarkup
+    from .classes_12 import InputMessageContent, MessageSchedulingState, MessageSendOptions, SearchMessagesFilter
+    from .classes_22 import MessageLink, MessageLinkInfo
+    from .classes_23 import Count, Text
+
+
+@dataclass(slots=True)
+class SearchChatRecentLocationMessages(Function["Messages"]):
+    """
+    Returns information about the recent locations of chat members that were sent to the chat. Returns up to 1 location message per user
+
+    :param chat_id: Chat identifier
+    :param limit: The maximum number of messages to be returned
+    :return: :class:`Messages`
+    """
+
+    _type: "str" = field(default="searchChatRecentLocationMessages", init=False, repr=False)
+    chat_id: "int" = 0
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatMessageByDate(Function["Message"]):
+    """
+    Returns the last message sent in a chat no later than the specified date. Returns a 404 error if such message doesn't exist
+
+    :param chat_id: Chat identifier
+    :param date: Point in time (Unix timestamp) relative to which to search for messages
+    :return: :class:`Message`
+    """
+
+    _type: "str" = field(default="getChatMessageByDate", init=False, repr=False)
+    chat_id: "int" = 0
+    date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "date": self.date,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatSparseMessagePositions(Function["MessagePositions"]):
+    """
+    Returns sparse positions of messages of the specified type in the chat to be used for shared media scroll implementation. Returns the results in reverse chronological order (i.e., in order of decreasing message_id). Cannot be used in secret chats or with searchMessagesFilterFailedToSend filter without an enabled message database
+
+    :param chat_id: Identifier of the chat in which to return information about message positions
+    :param filter: Filter for message content. Filters searchMessagesFilterEmpty, searchMessagesFilterMention, searchMessagesFilterUnreadMention, and searchMessagesFilterUnreadReaction are unsupported in this function
+    :param from_message_id: The message identifier from which to return information about message positions
+    :param limit: The expected number of message positions to be returned; 50-2000. A smaller number of positions can be returned, if there are not enough appropriate messages
+    :param saved_messages_topic_id: If not 0, only messages in the specified Saved Messages topic will be considered; pass 0 to consider all messages, or for chats other than Saved Messages
+    :return: :class:`MessagePositions`
+    """
+
+    _type: "str" = field(default="getChatSparseMessagePositions", init=False, repr=False)
+    chat_id: "int" = 0
+    filter: "SearchMessagesFilter | None" = None
+    from_message_id: "int" = 0
+    limit: "int" = 0
+    saved_messages_topic_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "filter": self.filter._to_json_dict() if self.filter is not None else None,
+            "from_message_id": self.from_message_id,
+            "limit": self.limit,
+            "saved_messages_topic_id": self.saved_messages_topic_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatMessageCalendar(Function["MessageCalendar"]):
+    """
+    Returns information about the next messages of the specified type in the chat split by days. Returns the results in reverse chronological order. Can return partial result for the last returned day. Behavior of this method depends on the value of the option "utc_time_offset"
+
+    :param chat_id: Identifier of the chat in which to return information about messages
+    :param topic_id: Pass topic identifier to get the result only in specific topic; pass null to get the result in all topics; forum topics aren't supported
+    :param filter: Filter for message content. Filters searchMessagesFilterEmpty, searchMessagesFilterMention, searchMessagesFilterUnreadMention, and searchMessagesFilterUnreadReaction are unsupported in this function
+    :param from_message_id: The message identifier from which to return information about messages; use 0 to get results from the last message
+    :return: :class:`MessageCalendar`
+    """
+
+    _type: "str" = field(default="getChatMessageCalendar", init=False, repr=False)
+    chat_id: "int" = 0
+    topic_id: "MessageTopic | None" = None
+    filter: "SearchMessagesFilter | None" = None
+    from_message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "topic_id": self.topic_id._to_json_dict() if self.topic_id is not None else None,
+            "filter": self.filter._to_json_dict() if self.filter is not None else None,
+            "from_message_id": self.from_message_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatMessageCount(Function["Count"]):
+    """
+    Returns approximate number of messages of the specified type in the chat or its topic
+
+    :param chat_id: Identifier of the chat in which to count messages
+    :param topic_id: Pass topic identifier to get number of messages only in specific topic; pass null to get number of messages in all topics
+    :param filter: Filter for message content; searchMessagesFilterEmpty is unsupported in this function
+    :param return_local: Pass true to get the number of messages without sending network requests, or -1 if the number of messages is unknown locally
+    :return: :class:`Count`
+    """
+
+    _type: "str" = field(default="getChatMessageCount", init=False, repr=False)
+    chat_id: "int" = 0
+    topic_id: "MessageTopic | None" = None
+    filter: "SearchMessagesFilter | None" = None
+    return_local: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "topic_id": self.topic_id._to_json_dict() if self.topic_id is not None else None,
+            "filter": self.filter._to_json_dict() if self.filter is not None else None,
+            "return_local": self.return_local,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatMessagePosition(Function["Count"]):
+    """
+    Returns approximate 1-based position of a message among messages, which can be found by the specified filter in the chat and topic. Cannot be used in secret chats
+
+    :param chat_id: Identifier of the chat in which to find message position
+    :param topic_id: Pass topic identifier to get position among messages only in specific topic; pass null to get position among all chat messages
+    :param filter: Filter for message content; searchMessagesFilterEmpty, searchMessagesFilterUnreadMention, searchMessagesFilterUnreadReaction, and searchMessagesFilterFailedToSend are unsupported in this function
+    :param message_id: Message identifier
+    :return: :class:`Count`
+    """
+
+    _type: "str" = field(default="getChatMessagePosition", init=False, repr=False)
+    chat_id: "int" = 0
+    topic_id: "MessageTopic | None" = None
+    filter: "SearchMessagesFilter | None" = None
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "topic_id": self.topic_id._to_json_dict() if self.topic_id is not None else None,
+            "filter": self.filter._to_json_dict() if self.filter is not None else None,
+            "message_id": self.message_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatScheduledMessages(Function["Messages"]):
+    """
+    Returns all scheduled messages in a chat. The messages are returned in reverse chronological order (i.e., in order of decreasing message_id)
+
+    :param chat_id: Chat identifier
+    :return: :class:`Messages`
+    """
+
+    _type: "str" = field(default="getChatScheduledMessages", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatSponsoredMessages(Function["SponsoredMessages"]):
+    """
+    Returns sponsored messages to be shown in a chat; for channel chats and chats with bots only
+
+    :param chat_id: Identifier of the chat
+    :return: :class:`SponsoredMessages`
+    """
+
+    _type: "str" = field(default="getChatSponsoredMessages", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ClickChatSponsoredMessage(Function["Ok"]):
+    """
+    Informs TDLib that the user opened the sponsored chat via the button, the name, the chat photo, a mention in the sponsored message text, or the media in the sponsored message
+
+    :param chat_id: Chat identifier of the sponsored message
+    :param message_id: Identifier of the sponsored message
+    :param is_media_click: Pass true if the media was clicked in the sponsored message
+    :param from_fullscreen: Pass true if the user expanded the video from the sponsored message fullscreen before the click
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="clickChatSponsoredMessage", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    is_media_click: "bool" = False
+    from_fullscreen: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "is_media_click": self.is_media_click,
+            "from_fullscreen": self.from_fullscreen,
+        }
+
+
+
+@dataclass(slots=True)
+class ReportChatSponsoredMessage(Function["ReportSponsoredResult"]):
+    """
+    Reports a sponsored message to Telegram moderators
+
+    :param chat_id: Chat identifier of the sponsored message
+    :param message_id: Identifier of the sponsored message
+    :param option_id: Option identifier chosen by the user; leave empty for the initial request
+    :return: :class:`ReportSponsoredResult`
+    """
+
+    _type: "str" = field(default="reportChatSponsoredMessage", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    option_id: "bytes" = b""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "option_id": _bytes_to_json(self.option_id),
+        }
+
+
+
+@dataclass(slots=True)
+class GetSearchSponsoredChats(Function["SponsoredChats"]):
+    """
+    Returns sponsored chats to be shown in the search results
+
+    :param query: Query the user searches for
+    :return: :class:`SponsoredChats`
+    """
+
+    _type: "str" = field(default="getSearchSponsoredChats", init=False, repr=False)
+    query: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "query": self.query,
+        }
+
+
+
+@dataclass(slots=True)
+class ViewSponsoredChat(Function["Ok"]):
+    """
+    Informs TDLib that the user fully viewed a sponsored chat
+
+    :param sponsored_chat_unique_id: Unique identifier of the sponsored chat
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="viewSponsoredChat", init=False, repr=False)
+    sponsored_chat_unique_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sponsored_chat_unique_id": self.sponsored_chat_unique_id,
+        }
+
+
+
+@dataclass(slots=True)
+class OpenSponsoredChat(Function["Ok"]):
+    """
+    Informs TDLib that the user opened a sponsored chat
+
+    :param sponsored_chat_unique_id: Unique identifier of the sponsored chat
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="openSponsoredChat", init=False, repr=False)
+    sponsored_chat_unique_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sponsored_chat_unique_id": self.sponsored_chat_unique_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ReportSponsoredChat(Function["ReportSponsoredResult"]):
+    """
+    Reports a sponsored chat to Telegram moderators
+
+    :param sponsored_chat_unique_id: Unique identifier of the sponsored chat
+    :param option_id: Option identifier chosen by the user; leave empty for the initial request
+    :return: :class:`ReportSponsoredResult`
+    """
+
+    _type: "str" = field(default="reportSponsoredChat", init=False, repr=False)
+    sponsored_chat_unique_id: "int" = 0
+    option_id: "bytes" = b""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sponsored_chat_unique_id": self.sponsored_chat_unique_id,
+            "option_id": _bytes_to_json(self.option_id),
+        }
+
+
+
+@dataclass(slots=True)
+class GetVideoMessageAdvertisements(Function["VideoMessageAdvertisements"]):
+    """
+    Returns advertisements to be shown while a video from a message is watched. Available only if messageProperties.can_get_video_advertisements
+
+    :param chat_id: Identifier of the chat with the message
+    :param message_id: Identifier of the message
+    :return: :class:`VideoMessageAdvertisements`
+    """
+
+    _type: "str" = field(default="getVideoMessageAdvertisements", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ViewVideoMessageAdvertisement(Function["Ok"]):
+    """
+    Informs TDLib that the user viewed a video message advertisement
+
+    :param advertisement_unique_id: Unique identifier of the advertisement
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="viewVideoMessageAdvertisement", init=False, repr=False)
+    advertisement_unique_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "advertisement_unique_id": self.advertisement_unique_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ClickVideoMessageAdvertisement(Function["Ok"]):
+    """
+    Informs TDLib that the user clicked a video message advertisement
+
+    :param advertisement_unique_id: Unique identifier of the advertisement
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="clickVideoMessageAdvertisement", init=False, repr=False)
+    advertisement_unique_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "advertisement_unique_id": self.advertisement_unique_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ReportVideoMessageAdvertisement(Function["ReportSponsoredResult"]):
+    """
+    Reports a video message advertisement to Telegram moderators
+
+    :param advertisement_unique_id: Unique identifier of the advertisement
+    :param option_id: Option identifier chosen by the user; leave empty for the initial request
+    :return: :class:`ReportSponsoredResult`
+    """
+
+    _type: "str" = field(default="reportVideoMessageAdvertisement", init=False, repr=False)
+    advertisement_unique_id: "int" = 0
+    option_id: "bytes" = b""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "advertisement_unique_id": self.advertisement_unique_id,
+            "option_id": _bytes_to_json(self.option_id),
+        }
+
+
+
+@dataclass(slots=True)
+class RemoveNotification(Function["Ok"]):
+    """
+    Removes an active notification from notification list. Needs to be called only if the notification is removed by the current user
+
+    :param notification_group_id: Identifier of notification group to which the notification belongs
+    :param notification_id: Identifier of removed notification
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="removeNotification", init=False, repr=False)
+    notification_group_id: "int" = 0
+    notification_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "notification_group_id": self.notification_group_id,
+            "notification_id": self.notification_id,
+        }
+
+
+
+@dataclass(slots=True)
+class RemoveNotificationGroup(Function["Ok"]):
+    """
+    Removes a group of active notifications. Needs to be called only if the notification group is removed by the current user
+
+    :param notification_group_id: Notification group identifier
+    :param max_notification_id: The maximum identifier of removed notifications
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="removeNotificationGroup", init=False, repr=False)
+    notification_group_id: "int" = 0
+    max_notification_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "notification_group_id": self.notification_group_id,
+            "max_notification_id": self.max_notification_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetMessageLink(Function["MessageLink"]):
+    """
+    Returns an HTTPS link to a message in a chat. Available only if messageProperties.can_get_link, or if messageProperties.can_get_media_timestamp_links and a media timestamp link is generated. This is an offline method
+
+    :param chat_id: Identifier of the chat to which the message belongs
+    :param message_id: Identifier of the message
+    :param media_timestamp: If not 0, timestamp from which the video/audio/video note/voice note/story playing must start, in seconds. The media can be in the message content or in its link preview
+    :param for_album: Pass true to create a link for the whole media album
+    :param in_message_thread: Pass true to create a link to the message as a channel post comment, in a message thread, or a forum topic
+    :return: :class:`MessageLink`
+    """
+
+    _type: "str" = field(default="getMessageLink", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    media_timestamp: "int" = 0
+    for_album: "bool" = False
+    in_message_thread: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "media_timestamp": self.media_timestamp,
+            "for_album": self.for_album,
+            "in_message_thread": self.in_message_thread,
+        }
+
+
+
+@dataclass(slots=True)
+class GetMessageEmbeddingCode(Function["Text"]):
+    """
+    Returns an HTML code for embedding the message. Available only if messageProperties.can_get_embedding_code
+
+    :param chat_id: Identifier of the chat to which the message belongs
+    :param message_id: Identifier of the message
+    :param for_album: Pass true to return an HTML code for embedding of the whole media album
+    :return: :class:`Text`
+    """
+
+    _type: "str" = field(default="getMessageEmbeddingCode", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    for_album: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "for_album": self.for_album,
+        }
+
+
+
+@dataclass(slots=True)
+class GetMessageLinkInfo(Function["MessageLinkInfo"]):
+    """
+    Returns information about a public or private message link. Can be called for any internal link of the type internalLinkTypeMessage
+
+    :param url: The message link
+    :return: :class:`MessageLinkInfo`
+    """
+
+    _type: "str" = field(default="getMessageLinkInfo", init=False, repr=False)
+    url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+        }
+
+
+
+@dataclass(slots=True)
+class TranslateText(Function["FormattedText"]):
+    """
+    Translates a text to the given language. If the current user is a Telegram Premium user, then text formatting is preserved
+
+    :param text: Text to translate
+    :param to_language_code: Language code of the language to which the message is translated. Must be one of
+     "af", "sq", "am", "ar", "hy", "az", "eu", "be", "bn", "bs", "bg", "ca", "ceb", "zh-CN", "zh", "zh-Hans", "zh-TW", "zh-Hant", "co", "hr", "cs", "da", "nl", "en", "eo", "et",
+     "fi", "fr", "fy", "gl", "ka", "de", "el", "gu", "ht", "ha", "haw", "he", "iw", "hi", "hmn", "hu", "is", "ig", "id", "in", "ga", "it", "ja", "jv", "kn", "kk", "km", "rw", "ko",
+     "ku", "ky", "lo", "la", "lv", "lt", "lb", "mk", "mg", "ms", "ml", "mt", "mi", "mr", "mn", "my", "ne", "no", "ny", "or", "ps", "fa", "pl", "pt", "pa", "ro", "ru", "sm", "gd", "sr",
+     "st", "sn", "sd", "si", "sk", "sl", "so", "es", "su", "sw", "sv", "tl", "tg", "ta", "tt", "te", "th", "tr", "tk", "uk", "ur", "ug", "uz", "vi", "cy", "xh", "yi", "ji", "yo", "zu"
+    :return: :class:`FormattedText`
+    """
+
+    _type: "str" = field(default="translateText", init=False, repr=False)
+    text: "FormattedText | None" = None
+    to_language_code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "to_language_code": self.to_language_code,
+        }
+
+
+
+@dataclass(slots=True)
+class TranslateMessageText(Function["FormattedText"]):
+    """
+    Extracts text or caption of the given message and translates it to the given language. If the current user is a Telegram Premium user, then text formatting is preserved
+
+    :param chat_id: Identifier of the chat to which the message belongs
+    :param message_id: Identifier of the message
+    :param to_language_code: Language code of the language to which the message is translated. Must be one of
+     "af", "sq", "am", "ar", "hy", "az", "eu", "be", "bn", "bs", "bg", "ca", "ceb", "zh-CN", "zh", "zh-Hans", "zh-TW", "zh-Hant", "co", "hr", "cs", "da", "nl", "en", "eo", "et",
+     "fi", "fr", "fy", "gl", "ka", "de", "el", "gu", "ht", "ha", "haw", "he", "iw", "hi", "hmn", "hu", "is", "ig", "id", "in", "ga", "it", "ja", "jv", "kn", "kk", "km", "rw", "ko",
+     "ku", "ky", "lo", "la", "lv", "lt", "lb", "mk", "mg", "ms", "ml", "mt", "mi", "mr", "mn", "my", "ne", "no", "ny", "or", "ps", "fa", "pl", "pt", "pa", "ro", "ru", "sm", "gd", "sr",
+     "st", "sn", "sd", "si", "sk", "sl", "so", "es", "su", "sw", "sv", "tl", "tg", "ta", "tt", "te", "th", "tr", "tk", "uk", "ur", "ug", "uz", "vi", "cy", "xh", "yi", "ji", "yo", "zu"
+    :return: :class:`FormattedText`
+    """
+
+    _type: "str" = field(default="translateMessageText", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    to_language_code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "to_language_code": self.to_language_code,
+        }
+
+
+
+@dataclass(slots=True)
+class RecognizeSpeech(Function["Ok"]):
+    """
+    Recognizes speech in a video note or a voice note message
+
+    :param chat_id: Identifier of the chat to which the message belongs
+    :param message_id: Identifier of the message. Use messageProperties.can_recognize_speech to check whether the message is suitable
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="recognizeSpeech", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+
+
+@dataclass(slots=True)
+class RateSpeechRecognition(Function["Ok"]):
+    """
+    Rates recognized speech in a video note or a voice note message
+
+    :param chat_id: Identifier of the chat to which the message belongs
+    :param message_id: Identifier of the message
+    :param is_good: Pass true if the speech recognition is good
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="rateSpeechRecognition", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    is_good: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "is_good": self.is_good,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatAvailableMessageSenders(Function["ChatMessageSenders"]):
+    """
+    Returns the list of message sender identifiers, which can be used to send messages in a chat
+
+    :param chat_id: Chat identifier
+    :return: :class:`ChatMessageSenders`
+    """
+
+    _type: "str" = field(default="getChatAvailableMessageSenders", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SetChatMessageSender(Function["Ok"]):
+    """
+    Selects a message sender to send messages in a chat
+
+    :param chat_id: Chat identifier
+    :param message_sender_id: New message sender for the chat
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setChatMessageSender", init=False, repr=False)
+    chat_id: "int" = 0
+    message_sender_id: "MessageSender | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_sender_id": self.message_sender_id._to_json_dict() if self.message_sender_id is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SendMessage(Function["Message"]):
+    """
+    Sends a message. Returns the sent message
+
+    :param chat_id: Target chat
+    :param message_thread_id: If not 0, the message thread identifier in which the message will be sent
+    :param reply_to: Information about the message or story to be replied; pass null if none
+    :param options: Options to be used to send the message; pass null to use default options
+    :param reply_markup: Markup for replying to the message; pass null if none; for bots only
+    :param input_message_content: The content of the message to be sent
+    :return: :class:`Message`
+    """
+
+    _type: "str" = field(default="sendMessage", init=False, repr=False)
+    chat_id: "int" = 0
+    message_thread_id: "int" = 0
+    reply_to: "InputMessageReplyTo | None" = None
+    options: "MessageSendOptions | None" = None
+    reply_markup: "ReplyMarkup | None" = None
+    input_message_content: "InputMessageContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_thread_id": self.message_thread_id,
+            "reply_to": self.reply_to._to_json_dict() if self.reply_to is not None else None,
+            "options": self.options._to_json_dict() if self.options is not None else None,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+            "input_message_content": self.input_message_content._to_json_dict() if self.input_message_content is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SendMessageAlbum(Function["Messages"]):
+    """
+    Sends 2-10 messages grouped together into an album. Currently, only audio, document, photo and video messages can be grouped into an album. Documents and audio files can be only grouped in an album with messages of the same type. Returns sent messages
+
+    :param chat_id: Target chat
+    :param message_thread_id: If not 0, the message thread identifier in which the messages will be sent
+    :param reply_to: Information about the message or story to be replied; pass null if none
+    :param options: Options to be used to send the messages; pass null to use default options
+    :param input_message_contents: Contents of messages to be sent. At most 10 messages can be added to an album. All messages must have the same value of show_caption_above_media
+    :return: :class:`Messages`
+    """
+
+    _type: "str" = field(default="sendMessageAlbum", init=False, repr=False)
+    chat_id: "int" = 0
+    message_thread_id: "int" = 0
+    reply_to: "InputMessageReplyTo | None" = None
+    options: "MessageSendOptions | None" = None
+    input_message_contents: "list[InputMessageContent] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_thread_id": self.message_thread_id,
+            "reply_to": self.reply_to._to_json_dict() if self.reply_to is not None else None,
+            "options": self.options._to_json_dict() if self.options is not None else None,
+            "input_message_contents": _list_to_json(self.input_message_contents),
+        }
+
+
+
+@dataclass(slots=True)
+class SendBotStartMessage(Function["Message"]):
+    """
+    Invites a bot to a chat (if it is not yet a member) and sends it the /start command; requires can_invite_users member right. Bots can't be invited to a private chat other than the chat with the bot. Bots can't be invited to channels (although they can be added as admins) and secret chats. Returns the sent message
+
+    :param bot_user_id: Identifier of the bot
+    :param chat_id: Identifier of the target chat
+    :param parameter: A hidden parameter sent to the bot for deep linking purposes (https://core.telegram.org/bots#deep-linking)
+    :return: :class:`Message`
+    """
+
+    _type: "str" = field(default="sendBotStartMessage", init=False, repr=False)
+    bot_user_id: "int" = 0
+    chat_id: "int" = 0
+    parameter: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "chat_id": self.chat_id,
+            "parameter": self.parameter,
+        }
+
+
+
+@dataclass(slots=True)
+class SendInlineQueryResultMessage(Function["Message"]):
+    """
+    Sends the result of an inline query as a message. Returns the sent message. Always clears a chat draft message
+
+    :param chat_id: Target chat
+    :param message_thread_id: If not 0, the message thread identifier in which the message will be sent
+    :param reply_to: Information about the message or story to be replied; pass null if none
+    :param options: Options to be used to send the message; pass null to use default options
+    :param query_id: Identifier of the inline query
+    :param result_id: Identifier of the inline query result
+    :param hide_via_bot: Pass true to hide the bot, via which the message is sent. Can be used only for bots getOption("animation_search_bot_username"), getOption("photo_search_bot_username"), and getOption("venue_search_bot_username")
+    :return: :class:`Message`
+    """
+
+    _type: "str" = field(default="sendInlineQueryResultMessage", init=False, repr=False)
+    chat_id: "int" = 0
+    message_thread_id: "int" = 0
+    reply_to: "InputMessageReplyTo | None" = None
+    options: "MessageSendOptions | None" = None
+    query_id: "int" = 0
+    result_id: "str" = ""
+    hide_via_bot: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_thread_id": self.message_thread_id,
+            "reply_to": self.reply_to._to_json_dict() if self.reply_to is not None else None,
+            "options": self.options._to_json_dict() if self.options is not None else None,
+            "query_id": self.query_id,
+            "result_id": self.result_id,
+            "hide_via_bot": self.hide_via_bot,
+        }
+
+
+
+@dataclass(slots=True)
+class ForwardMessages(Function["Messages"]):
+    """
+    Forwards previously sent messages. Returns the forwarded messages in the same order as the message identifiers passed in message_ids. If a message can't be forwarded, null will be returned instead of the message
+
+    :param chat_id: Identifier of the chat to which to forward messages
+    :param message_thread_id: If not 0, the message thread identifier in which the message will be sent; for forum threads only
+    :param from_chat_id: Identifier of the chat from which to forward messages
+    :param message_ids: Identifiers of the messages to forward. Message identifiers must be in a strictly increasing order. At most 100 messages can be forwarded simultaneously. A message can be forwarded only if messageProperties.can_be_forwarded
+    :param options: Options to be used to send the messages; pass null to use default options
+    :param send_copy: Pass true to copy content of the messages without reference to the original sender. Always true if the messages are forwarded to a secret chat or are local.
+     Use messageProperties.can_be_copied and messageProperties.can_be_copied_to_secret_chat to check whether the message is suitable
+    :param remove_caption: Pass true to remove media captions of message copies. Ignored if send_copy is false
+    :return: :class:`Messages`
+    """
+
+    _type: "str" = field(default="forwardMessages", init=False, repr=False)
+    chat_id: "int" = 0
+    message_thread_id: "int" = 0
+    from_chat_id: "int" = 0
+    message_ids: "list[int] | None" = None
+    options: "MessageSendOptions | None" = None
+    send_copy: "bool" = False
+    remove_caption: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_thread_id": self.message_thread_id,
+            "from_chat_id": self.from_chat_id,
+            "message_ids": self.message_ids,
+            "options": self.options._to_json_dict() if self.options is not None else None,
+            "send_copy": self.send_copy,
+            "remove_caption": self.remove_caption,
+        }
+
+
+
+@dataclass(slots=True)
+class SendQuickReplyShortcutMessages(Function["Messages"]):
+    """
+    Sends messages from a quick reply shortcut. Requires Telegram Business subscription. Can't be used to send paid messages
+
+    :param chat_id: Identifier of the chat to which to send messages. The chat must be a private chat with a regular user
+    :param shortcut_id: Unique identifier of the quick reply shortcut
+    :param sending_id: Non-persistent identifier, which will be returned back in messageSendingStatePending object and can be used to match sent messages and corresponding updateNewMessage updates
+    :return: :class:`Messages`
+    """
+
+    _type: "str" = field(default="sendQuickReplyShortcutMessages", init=False, repr=False)
+    chat_id: "int" = 0
+    shortcut_id: "int" = 0
+    sending_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "shortcut_id": self.shortcut_id,
+            "sending_id": self.sending_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ResendMessages(Function["Messages"]):
+    """
+    Resends messages which failed to send. Can be called only for messages for which messageSendingStateFailed.can_retry is true and after specified in messageSendingStateFailed.retry_after time passed. If a message is re-sent, the corresponding failed to send message is deleted. Returns the sent messages in the same order as the message identifiers passed in message_ids. If a message can't be re-sent, null will be returned instead of the message
+
+    :param chat_id: Identifier of the chat to send messages
+    :param message_ids: Identifiers of the messages to resend. Message identifiers must be in a strictly increasing order
+    :param quote: New manually chosen quote from the message to be replied; pass null if none. Ignored if more than one message is re-sent, or if messageSendingStateFailed.need_another_reply_quote == false
+    :param paid_message_star_count: The number of Telegram Stars the user agreed to pay to send the messages. Ignored if messageSendingStateFailed.required_paid_message_star_count == 0
+    :return: :class:`Messages`
+    """
+
+    _type: "str" = field(default="resendMessages", init=False, repr=False)
+    chat_id: "int" = 0
+    message_ids: "list[int] | None" = None
+    quote: "InputTextQuote | None" = None
+    paid_message_star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_ids": self.message_ids,
+            "quote": self.quote._to_json_dict() if self.quote is not None else None,
+            "paid_message_star_count": self.paid_message_star_count,
+        }
+
+
+
+@dataclass(slots=True)
+class AddLocalMessage(Function["Message"]):
+    """
+    Adds a local message to a chat. The message is persistent across application restarts only if the message database is used. Returns the added message
+
+    :param chat_id: Target chat; channel direct messages chats aren't supported
+    :param sender_id: Identifier of the sender of the message
+    :param reply_to: Information about the message or story to be replied; pass null if none
+    :param disable_notification: Pass true to disable notification for the message
+    :param input_message_content: The content of the message to be added
+    :return: :class:`Message`
+    """
+
+    _type: "str" = field(default="addLocalMessage", init=False, repr=False)
+    chat_id: "int" = 0
+    sender_id: "MessageSender | None" = None
+    reply_to: "InputMessageReplyTo | None" = None
+    disable_notification: "bool" = False
+    input_message_content: "InputMessageContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "sender_id": self.sender_id._to_json_dict() if self.sender_id is not None else None,
+            "reply_to": self.reply_to._to_json_dict() if self.reply_to is not None else None,
+            "disable_notification": self.disable_notification,
+            "input_message_content": self.input_message_content._to_json_dict() if self.input_message_content is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteMessages(Function["Ok"]):
+    """
+    Deletes messages
+
+    :param chat_id: Chat identifier
+    :param message_ids: Identifiers of the messages to be deleted. Use messageProperties.can_be_deleted_only_for_self and messageProperties.can_be_deleted_for_all_users to get suitable messages
+    :param revoke: Pass true to delete messages for all chat members. Always true for supergroups, channels and secret chats
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteMessages", init=False, repr=False)
+    chat_id: "int" = 0
+    message_ids: "list[int] | None" = None
+    revoke: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_ids": self.message_ids,
+            "revoke": self.revoke,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteChatMessagesBySender(Function["Ok"]):
+    """
+    Deletes all messages sent by the specified message sender in a chat. Supported only for supergroups; requires can_delete_messages administrator right
+
+    :param chat_id: Chat identifier
+    :param sender_id: Identifier of the sender of messages to delete
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteChatMessagesBySender", init=False, repr=False)
+    chat_id: "int" = 0
+    sender_id: "MessageSender | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "sender_id": self.sender_id._to_json_dict() if self.sender_id is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteChatMessagesByDate(Function["Ok"]):
+    """
+    Deletes all messages between the specified dates in a chat. Supported only for private chats and basic groups. Messages sent in the last 30 seconds will not be deleted
+
+    :param chat_id: Chat identifier
+    :param min_date: The minimum date of the messages to delete
+    :param max_date: The maximum date of the messages to delete
+    :param revoke: Pass true to delete chat messages for all users; private chats only
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteChatMessagesByDate", init=False, repr=False)
+    chat_id: "int" = 0
+    min_date: "int" = 0
+    max_date: "int" = 0
+    revoke: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "min_date": self.min_date,
+            "max_date": self.max_date,
+            "revoke": self.revoke,
+        }
+
+
+
+@dataclass(slots=True)
+class EditMessageText(Function["Message"]):
+    """
+    Edits the text of a message (or a text of a game message). Returns the edited message after the edit is completed on the server side
+
+    :param chat_id: The chat the message belongs to
+    :param message_id: Identifier of the message. Use messageProperties.can_be_edited to check whether the message can be edited
+    :param reply_markup: The new message reply markup; pass null if none; for bots only
+    :param input_message_content: New text content of the message. Must be of type inputMessageText
+    :return: :class:`Message`
+    """
+
+    _type: "str" = field(default="editMessageText", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    reply_markup: "ReplyMarkup | None" = None
+    input_message_content: "InputMessageContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+            "input_message_content": self.input_message_content._to_json_dict() if self.input_message_content is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class EditMessageLiveLocation(Function["Message"]):
+    """
+    Edits the message content of a live location. Messages can be edited for a limited period of time specified in the live location. Returns the edited message after the edit is completed on the server side
+
+    :param chat_id: The chat the message belongs to
+    :param message_id: Identifier of the message. Use messageProperties.can_be_edited to check whether the message can be edited
+    :param reply_markup: The new message reply markup; pass null if none; for bots only
+    :param location: New location content of the message; pass null to stop sharing the live location
+    :param live_period: New time relative to the message send date, for which the location can be updated, in seconds. If 0x7FFFFFFF specified, then the location can be updated forever.
+     Otherwise, must not exceed the current live_period by more than a day, and the live location expiration date must remain in the next 90 days. Pass 0 to keep the current live_period
+    :param heading: The new direction in which the location moves, in degrees; 1-360. Pass 0 if unknown
+    :param proximity_alert_radius: The new maximum distance for proximity alerts, in meters (0-100000). Pass 0 if the notification is disabled
+    :return: :class:`Message`
+    """
+
+    _type: "str" = field(default="editMessageLiveLocation", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    reply_markup: "ReplyMarkup | None" = None
+    location: "Location | None" = None
+    live_period: "int" = 0
+    heading: "int" = 0
+    proximity_alert_radius: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+            "location": self.location._to_json_dict() if self.location is not None else None,
+            "live_period": self.live_period,
+            "heading": self.heading,
+            "proximity_alert_radius": self.proximity_alert_radius,
+        }
+
+
+
+@dataclass(slots=True)
+class EditMessageChecklist(Function["Message"]):
+    """
+    Edits the message content of a checklist. Returns the edited message after the edit is completed on the server side
+
+    :param chat_id: The chat the message belongs to
+    :param message_id: Identifier of the message. Use messageProperties.can_be_edited to check whether the message can be edited
+    :param reply_markup: The new message reply markup; pass null if none; for bots only
+    :param checklist: The new checklist. If some tasks were completed, this information will be kept
+    :return: :class:`Message`
+    """
+
+    _type: "str" = field(default="editMessageChecklist", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    reply_markup: "ReplyMarkup | None" = None
+    checklist: "InputChecklist | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+            "checklist": self.checklist._to_json_dict() if self.checklist is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class EditMessageMedia(Function["Message"]):
+    """
+    Edits the media content of a message, including message caption. If only the caption needs to be edited, use editMessageCaption instead. The type of message content in an album can't be changed with exception of replacing a photo with a video or vice versa. Returns the edited message after the edit is completed on the server side
+
+    :param chat_id: The chat the message belongs to
+    :param message_id: Identifier of the message. Use messageProperties.can_edit_media to check whether the message can be edited
+    :param reply_markup: The new message reply markup; pass null if none; for bots only
+    :param input_message_content: New content of the message. Must be one of the following types: inputMessageAnimation, inputMessageAudio, inputMessageDocument, inputMessagePhoto or inputMessageVideo
+    :return: :class:`Message`
+    """
+
+    _type: "str" = field(default="editMessageMedia", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    reply_markup: "ReplyMarkup | None" = None
+    input_message_content: "InputMessageContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+            "input_message_content": self.input_message_content._to_json_dict() if self.input_message_content is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class EditMessageCaption(Function["Message"]):
+    """
+    Edits the message content caption. Returns the edited message after the edit is completed on the server side
+
+    :param chat_id: The chat the message belongs to
+    :param message_id: Identifier of the message. Use messageProperties.can_be_edited to check whether the message can be edited
+    :param reply_markup: The new message reply markup; pass null if none; for bots only
+    :param caption: New message content caption; 0-getOption("message_caption_length_max") characters; pass null to remove caption
+    :param show_caption_above_media: Pass true to show the caption above the media; otherwise, the caption will be shown below the media. May be true only for animation, photo, and video messages
+    :return: :class:`Message`
+    """
+
+    _type: "str" = field(default="editMessageCaption", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    reply_markup: "ReplyMarkup | None" = None
+    caption: "FormattedText | None" = None
+    show_caption_above_media: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+            "show_caption_above_media": self.show_caption_above_media,
+        }
+
+
+
+@dataclass(slots=True)
+class EditMessageReplyMarkup(Function["Message"]):
+    """
+    Edits the message reply markup; for bots only. Returns the edited message after the edit is completed on the server side
+
+    :param chat_id: The chat the message belongs to
+    :param message_id: Identifier of the message. Use messageProperties.can_be_edited to check whether the message can be edited
+    :param reply_markup: The new message reply markup; pass null if none
+    :return: :class:`Message`
+    """
+
+    _type: "str" = field(default="editMessageReplyMarkup", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    reply_markup: "ReplyMarkup | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class EditInlineMessageText(Function["Ok"]):
+    """
+    Edits the text of an inline text or game message sent via a bot; for bots only
+
+    :param inline_message_id: Inline message identifier
+    :param reply_markup: The new message reply markup; pass null if none
+    :param input_message_content: New text content of the message. Must be of type inputMessageText
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="editInlineMessageText", init=False, repr=False)
+    inline_message_id: "str" = ""
+    reply_markup: "ReplyMarkup | None" = None
+    input_message_content: "InputMessageContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "inline_message_id": self.inline_message_id,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+            "input_message_content": self.input_message_content._to_json_dict() if self.input_message_content is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class EditInlineMessageLiveLocation(Function["Ok"]):
+    """
+    Edits the content of a live location in an inline message sent via a bot; for bots only
+
+    :param inline_message_id: Inline message identifier
+    :param reply_markup: The new message reply markup; pass null if none
+    :param location: New location content of the message; pass null to stop sharing the live location
+    :param live_period: New time relative to the message send date, for which the location can be updated, in seconds. If 0x7FFFFFFF specified, then the location can be updated forever.
+     Otherwise, must not exceed the current live_period by more than a day, and the live location expiration date must remain in the next 90 days. Pass 0 to keep the current live_period
+    :param heading: The new direction in which the location moves, in degrees; 1-360. Pass 0 if unknown
+    :param proximity_alert_radius: The new maximum distance for proximity alerts, in meters (0-100000). Pass 0 if the notification is disabled
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="editInlineMessageLiveLocation", init=False, repr=False)
+    inline_message_id: "str" = ""
+    reply_markup: "ReplyMarkup | None" = None
+    location: "Location | None" = None
+    live_period: "int" = 0
+    heading: "int" = 0
+    proximity_alert_radius: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "inline_message_id": self.inline_message_id,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+            "location": self.location._to_json_dict() if self.location is not None else None,
+            "live_period": self.live_period,
+            "heading": self.heading,
+            "proximity_alert_radius": self.proximity_alert_radius,
+        }
+
+
+
+@dataclass(slots=True)
+class EditInlineMessageMedia(Function["Ok"]):
+    """
+    Edits the media content of a message with a text, an animation, an audio, a document, a photo or a video in an inline message sent via a bot; for bots only
+
+    :param inline_message_id: Inline message identifier
+    :param reply_markup: The new message reply markup; pass null if none; for bots only
+    :param input_message_content: New content of the message. Must be one of the following types: inputMessageAnimation, inputMessageAudio, inputMessageDocument, inputMessagePhoto or inputMessageVideo
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="editInlineMessageMedia", init=False, repr=False)
+    inline_message_id: "str" = ""
+    reply_markup: "ReplyMarkup | None" = None
+    input_message_content: "InputMessageContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "inline_message_id": self.inline_message_id,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+            "input_message_content": self.input_message_content._to_json_dict() if self.input_message_content is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class EditInlineMessageCaption(Function["Ok"]):
+    """
+    Edits the caption of an inline message sent via a bot; for bots only
+
+    :param inline_message_id: Inline message identifier
+    :param reply_markup: The new message reply markup; pass null if none
+    :param caption: New message content caption; pass null to remove caption; 0-getOption("message_caption_length_max") characters
+    :param show_caption_above_media: Pass true to show the caption above the media; otherwise, the caption will be shown below the media. May be true only for animation, photo, and video messages
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="editInlineMessageCaption", init=False, repr=False)
+    inline_message_id: "str" = ""
+    reply_markup: "ReplyMarkup | None" = None
+    caption: "FormattedText | None" = None
+    show_caption_above_media: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "inline_message_id": self.inline_message_id,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+            "show_caption_above_media": self.show_caption_above_media,
+        }
+
+
+
+@dataclass(slots=True)
+class EditInlineMessageReplyMarkup(Function["Ok"]):
+    """
+    Edits the reply markup of an inline message sent via a bot; for bots only
+
+    :param inline_message_id: Inline message identifier
+    :param reply_markup: The new message reply markup; pass null if none
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="editInlineMessageReplyMarkup", init=False, repr=False)
+    inline_message_id: "str" = ""
+    reply_markup: "ReplyMarkup | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "inline_message_id": self.inline_message_id,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class EditMessageSchedulingState(Function["Ok"]):
+    """
+    Edits the time when a scheduled message will be sent. Scheduling state of all messages in the same album or forwarded together with the message will be also changed
+
+    :param chat_id: The chat the message belongs to
+    :param message_id: Identifier of the message. Use messageProperties.can_edit_scheduling_state to check whether the message is suitable
+    :param scheduling_state: The new message scheduling state; pass null to send the message immediately. Must be null for messages in the state messageSchedulingStateSendWhenVideoProcessed
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="editMessageSchedulingState", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    scheduling_state: "MessageSchedulingState | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "scheduling_state": self.scheduling_state._to_json_dict() if self.scheduling_state is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SetMessageFactCheck(Function["Ok"]):
+    """
+    Changes the fact-check of a message. Can be only used if messageProperties.can_set_fact_check == true
+
+    :param chat_id: The channel chat the message belongs to
+    :param message_id: Identifier of the message
+    :param text: New text of the fact-check; 0-getOption("fact_check_length_max") characters; pass null to remove it. Only Bold, Italic, and TextUrl entities with https://t.me/ links are supported
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setMessageFactCheck", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    text: "FormattedText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SendBusinessMessage(Function["BusinessMessage"]):
+    """
+    Sends a message on behalf of a business account; for bots only. Returns the message after it was sent
+
+    :param business_connection_id: Unique identifier of business connection on behalf of which to send the request
+    :param chat_id: Target chat
+    :param reply_to: Information about the message to be replied; pass null if none
+    :param disable_notification: Pass true to disable notification for the message
+    :param protect_content: Pass true if the content of the message must be protected from forwarding and saving
+    :param effect_id: Identifier of the effect to apply to the message
+    :param reply_markup: Markup for replying to the message; pass null if none
+    :param input_message_content: The content of the message to be sent
+    :return: :class:`BusinessMessage`
+    """
+
+    _type: "str" = field(default="sendBusinessMessage", init=False, repr=False)
+    business_connection_id: "str" = ""
+    chat_id: "int" = 0
+    reply_to: "InputMessageReplyTo | None" = None
+    disable_notification: "bool" = False
+    protect_content: "bool" = False
+    effect_id: "int" = 0
+    reply_markup: "ReplyMarkup | None" = None
+    input_message_content: "InputMessageContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "business_connection_id": self.business_connection_id,
+            "chat_id": self.chat_id,
+            "reply_to": self.reply_to._to_json_dict() if self.reply_to is not None else None,
+            "disable_notification": self.disable_notification,
+            "protect_content": self.protect_content,
+            "effect_id": self.effect_id,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+            "input_message_content": self.input_message_content._to_json_dict() if self.input_message_content is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SendBusinessMessageAlbum(Function["BusinessMessages"]):
+    """
+    Sends 2-10 messages grouped together into an album on behalf of a business account; for bots only. Currently, only audio, document, photo and video messages can be grouped into an album. Documents and audio files can be only grouped in an album with messages of the same type. Returns sent messages
+
+    :param business_connection_id: Unique identifier of business connection on behalf of which to send the request
+    :param chat_id: Target chat
+    :param reply_to: Information about the message to be replied; pass null if none
+    :param disable_notification: Pass true to disable notification for the message
+    :param protect_content: Pass true if the content of the message must be protected from forwarding and saving
+    :param effect_id: Identifier of the effect to apply to the message
+    :param input_message_contents: Contents of messages to be sent. At most 10 messages can be added to an album. All messages must have the same value of show_caption_above_media
+    :return: :class:`BusinessMessages`
+    """
+
+    _type: "str" = field(default="sendBusinessMessageAlbum", init=False, repr=False)
+    business_connection_id: "str" = ""
+    chat_id: "int" = 0
+    reply_to: "InputMessageReplyTo | None" = None
+    disable_notification: "bool" = False
+    protect_content: "bool" = False
+    effect_id: "int" = 0
+    input_message_contents: "list[InputMessageContent] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "business_connection_id": self.business_connection_id,
+            "chat_id": self.chat_id,
+            "reply_to": self.reply_to._to_json_dict() if self.reply_to is not None else None,
+            "disable_notification": self.disable_notification,
+            "protect_content": self.protect_content,
+            "effect_id": self.effect_id,
+            "input_message_contents": _list_to_json(self.input_message_contents),
+        }
+
+
+
+@dataclass(slots=True)
+class EditBusinessMessageText(Function["BusinessMessage"]):
+    """
+    Edits the text of a text or game message sent on behalf of a business account; for bots only
+
+    :param business_connection_id: Unique identifier of business connection on behalf of which the message was sent
+    :param chat_id: The chat the message belongs to
+    :param message_id: Identifier of the message
+    :param reply_markup: The new message reply markup; pass null if none
+    :param input_message_content: New text content of the message. Must be of type inputMessageText
+    :return: :class:`BusinessMessage`
+    """
+
+    _type: "str" = field(default="editBusinessMessageText", init=False, repr=False)
+    business_connection_id: "str" = ""
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    reply_markup: "ReplyMarkup | None" = None
+    input_message_content: "InputMessageContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "business_connection_id": self.business_connection_id,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+            "input_message_content": self.input_message_content._to_json_dict() if self.input_message_content is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class EditBusinessMessageLiveLocation(Function["BusinessMessage"]):
+    """
+    Edits the content of a live location in a message sent on behalf of a business account; for bots only
+
+    :param business_connection_id: Unique identifier of business connection on behalf of which the message was sent
+    :param chat_id: The chat the message belongs to
+    :param message_id: Identifier of the message
+    :param reply_markup: The new message reply markup; pass null if none
+    :param location: New location content of the message; pass null to stop sharing the live location
+    :param live_period: New time relative to the message send date, for which the location can be updated, in seconds. If 0x7FFFFFFF specified, then the location can be updated forever.
+     Otherwise, must not exceed the current live_period by more than a day, and the live location expiration date must remain in the next 90 days. Pass 0 to keep the current live_period
+    :param heading: The new direction in which the location moves, in degrees; 1-360. Pass 0 if unknown
+    :param proximity_alert_radius: The new maximum distance for proximity alerts, in meters (0-100000). Pass 0 if the notification is disabled
+    :return: :class:`BusinessMessage`
+    """
+
+    _type: "str" = field(default="editBusinessMessageLiveLocation", init=False, repr=False)
+    business_connection_id: "str" = ""
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    reply_markup: "ReplyMarkup | None" = None
+    location: "Location | None" = None
+    live_period: "int" = 0
+    heading: "int" = 0
+    proximity_alert_radius: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "business_connection_id": self.business_connection_id,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+            "location": self.location._to_json_dict() if self.location is not None else None,
+            "live_period": self.live_period,
+            "heading": self.heading,
+            "proximity_alert_radius": self.proximity_alert_radius,
+        }
+
+
+
+@dataclass(slots=True)
+class EditBusinessMessageChecklist(Function["BusinessMessage"]):
+    """
+    Edits the content of a checklist in a message sent on behalf of a business account; for bots only
+
+    :param business_connection_id: Unique identifier of business connection on behalf of which the message was sent
+    :param chat_id: The chat the message belongs to
+    :param message_id: Identifier of the message
+    :param reply_markup: The new message reply markup; pass null if none
+    :param checklist: The new checklist. If some tasks were completed, this information will be kept
+    :return: :class:`BusinessMessage`
+    """
+
+    _type: "str" = field(default="editBusinessMessageChecklist", init=False, repr=False)
+    business_connection_id: "str" = ""
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    reply_markup: "ReplyMarkup | None" = None
+    checklist: "InputChecklist | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "business_connection_id": self.business_connection_id,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+            "checklist": self.checklist._to_json_dict() if self.checklist is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class EditBusinessMessageMedia(Function["BusinessMessage"]):
+    """
+    Edits the media content of a message with a text, an animation, an audio, a document, a photo or a video in a message sent on behalf of a business account; for bots only
+
+    :param business_connection_id: Unique identifier of business connection on behalf of which the message was sent
+    :param chat_id: The chat the message belongs to
+    :param message_id: Identifier of the message
+    :param reply_markup: The new message reply markup; pass null if none; for bots only
+    :param input_message_content: New content of the message. Must be one of the following types: inputMessageAnimation, inputMessageAudio, inputMessageDocument, inputMessagePhoto or inputMessageVideo
+    :return: :class:`BusinessMessage`
+    """
+
+    _type: "str" = field(default="editBusinessMessageMedia", init=False, repr=False)
+    business_connection_id: "str" = ""
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    reply_markup: "ReplyMarkup | None" = None
+    input_message_content: "InputMessageContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "business_connection_id": self.business_connection_id,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+            "input_message_content": self.input_message_content._to_json_dict() if self.input_message_content is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class EditBusinessMessageCaption(Function["BusinessMessage"]):
+    """
+    Edits the caption of a message sent on behalf of a business account; for bots only
+
+    :param business_connection_id: Unique identifier of business connection on behalf of which the message was sent
+    :param chat_id: The chat the message belongs to
+    :param message_id: Identifier of the message
+    :param reply_markup: The new message reply markup; pass null if none
+    :param caption: New message content caption; pass null to remove caption; 0-getOption("message_caption_length_max") characters
+    :param show_caption_above_media: Pass true to show the caption above the media; otherwise, the caption will be shown below the media. May be true only for animation, photo, and video messages
+    :return: :class:`BusinessMessage`
+    """
+
+    _type: "str" = field(default="editBusinessMessageCaption", init=False, repr=False)
+    business_connection_id: "str" = ""
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    reply_markup: "ReplyMarkup | None" = None
+    caption: "FormattedText | None" = None
+    show_caption_above_media: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "business_connection_id": self.business_connection_id,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+            "show_caption_above_media": self.show_caption_above_media,
+        }
+
+
+
+@dataclass(slots=True)
+class EditBusinessMessageReplyMarkup(Function["BusinessMessage"]):
+    """
+    Edits the reply markup of a message sent on behalf of a business account; for bots only
+
+    :param business_connection_id: Unique identifier of business connection on behalf of which the message was sent
+    :param chat_id: The chat the message belongs to
+    :param message_id: Identifier of the message
+    :param reply_markup: The new message reply markup; pass null if none
+    :return: :class:`BusinessMessage`
+    """
+
+    _type: "str" = field(default="editBusinessMessageReplyMarkup", init=False, repr=False)
+    business_connection_id: "str" = ""
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    reply_markup: "ReplyMarkup | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "business_connection_id": self.business_connection_id,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class StopBusinessPoll(Function["BusinessMessage"]):
+    """
+    Stops a poll sent on behalf of a business account; for bots only
+
+    :param business_connection_id: Unique identifier of business connection on behalf of which the message with the poll was sent
+    :param chat_id: The chat the message belongs to
+    :param message_id: Identifier of the message containing the poll
+    :param reply_markup: The new message reply markup; pass null if none
+    :return: :class:`BusinessMessage`
+    """
+
+    _type: "str" = field(default="stopBusinessPoll", init=False, repr=False)
+    business_connection_id: "str" = ""
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    reply_markup: "ReplyMarkup | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "business_connection_id": self.business_connection_id,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SetBusinessMessageIsPinned(Function["Ok"]):
+    """
+    Pins or unpins a message sent on behalf of a business account; for bots only
+
+    :param business_connection_id: Unique identifier of business connection on behalf of which the message was sent
+    :param chat_id: The chat the message belongs to
+    :param message_id: Identifier of the message
+    :param is_pinned: Pass true to pin the message, pass false to unpin it
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setBusinessMessageIsPinned", init=False, repr=False)
+    business_connection_id: "str" = ""
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    is_pinned: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "business_connection_id": self.business_connection_id,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "is_pinned": self.is_pinned,
+        }
+
+
+
+@dataclass(slots=True)
+class ReadBusinessMessage(Function["Ok"]):
+    """
+    Reads a message on behalf of a business account; for bots only
+
+    :param business_connection_id: Unique identifier of business connection through which the message was received
+    :param chat_id: The chat the message belongs to
+    :param message_id: Identifier of the message
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="readBusinessMessage", init=False, repr=False)
+    business_connection_id: "str" = ""
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "business_connection_id": self.business_connection_id,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+
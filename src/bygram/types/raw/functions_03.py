@@ -0,0 +1,1527 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import FormattedText, Ok, TextEntities
+    from .classes_02 import InputChatPhoto, StarAmount
+    from .classes_03 import GiftSettings
+    from .classes_05 import MessageSenders, PaidReactionType, ReactionType
+    from .classes_06 import ChatNotificationSettings, MessageEffect
+    from .classes_07 import SavedMessagesTags
+    from .classes_08 import ForumTopic, ForumTopicIcon, ForumTopicInfo, ForumTopics, ThemeParameters
+    from .classes_12 import InputMessageContent
+    from .classes_13 import Stickers
+    from .classes_14 import InputStoryAreas, InputStoryContent, QuickReplyMessage, QuickReplyMessages, Story
+    from .classes_15 import AddedReactions, AvailableReactions, EmojiReaction
+    from .classes_17 import LanguagePackStringValue
+    from .classes_20 import JsonValue, StoryPrivacySettings
+    from .classes_22 import MessageLink
+    from .classes_23 import FoundPosition, Text, TextParseMode
+
+
+@dataclass(slots=True)
+class DeleteBusinessMessages(Function["Ok"]):
+    """
+    Deletes messages on behalf of a business account; for bots only
+
+    :param business_connection_id: Unique identifier of business connection through which the messages were received
+    :param message_ids: Identifier of the messages
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteBusinessMessages", init=False, repr=False)
+    business_connection_id: "str" = ""
+    message_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "business_connection_id": self.business_connection_id,
+            "message_ids": self.message_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class EditBusinessStory(Function["Story"]):
+    """
+    Changes a story posted by the bot on behalf of a business account; for bots only
+
+    :param story_poster_chat_id: Identifier of the chat that posted the story
+    :param story_id: Identifier of the story to edit
+    :param content: New content of the story
+    :param areas: New clickable rectangle areas to be shown on the story media
+    :param caption: New story caption
+    :param privacy_settings: The new privacy settings for the story
+    :return: :class:`Story`
+    """
+
+    _type: "str" = field(default="editBusinessStory", init=False, repr=False)
+    story_poster_chat_id: "int" = 0
+    story_id: "int" = 0
+    content: "InputStoryContent | None" = None
+    areas: "InputStoryAreas | None" = None
+    caption: "FormattedText | None" = None
+    privacy_settings: "StoryPrivacySettings | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_poster_chat_id": self.story_poster_chat_id,
+            "story_id": self.story_id,
+            "content": self.content._to_json_dict() if self.content is not None else None,
+            "areas": self.areas._to_json_dict() if self.areas is not None else None,
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+            "privacy_settings": self.privacy_settings._to_json_dict() if self.privacy_settings is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteBusinessStory(Function["Ok"]):
+    """
+    Deletes a story posted by the bot on behalf of a business account; for bots only
+
+    :param business_connection_id: Unique identifier of business connection
+    :param story_id: Identifier of the story to delete
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteBusinessStory", init=False, repr=False)
+    business_connection_id: "str" = ""
+    story_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "business_connection_id": self.business_connection_id,
+            "story_id": self.story_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SetBusinessAccountName(Function["Ok"]):
+    """
+    Changes the first and last name of a business account; for bots only
+
+    :param business_connection_id: Unique identifier of business connection
+    :param first_name: The new value of the first name for the business account; 1-64 characters
+    :param last_name: The new value of the optional last name for the business account; 0-64 characters
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setBusinessAccountName", init=False, repr=False)
+    business_connection_id: "str" = ""
+    first_name: "str" = ""
+    last_name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "business_connection_id": self.business_connection_id,
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+        }
+
+
+
+@dataclass(slots=True)
+class SetBusinessAccountBio(Function["Ok"]):
+    """
+    Changes the bio of a business account; for bots only
+
+    :param business_connection_id: Unique identifier of business connection
+    :param bio: The new value of the bio; 0-getOption("bio_length_max") characters without line feeds
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setBusinessAccountBio", init=False, repr=False)
+    business_connection_id: "str" = ""
+    bio: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "business_connection_id": self.business_connection_id,
+            "bio": self.bio,
+        }
+
+
+
+@dataclass(slots=True)
+class SetBusinessAccountProfilePhoto(Function["Ok"]):
+    """
+    Changes a profile photo of a business account; for bots only
+
+    :param business_connection_id: Unique identifier of business connection
+    :param photo: Profile photo to set; pass null to remove the photo
+    :param is_public: Pass true to set the public photo, which will be visible even if the main photo is hidden by privacy settings
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setBusinessAccountProfilePhoto", init=False, repr=False)
+    business_connection_id: "str" = ""
+    photo: "InputChatPhoto | None" = None
+    is_public: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "business_connection_id": self.business_connection_id,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+            "is_public": self.is_public,
+        }
+
+
+
+@dataclass(slots=True)
+class SetBusinessAccountUsername(Function["Ok"]):
+    """
+    Changes the editable username of a business account; for bots only
+
+    :param business_connection_id: Unique identifier of business connection
+    :param username: The new value of the username
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setBusinessAccountUsername", init=False, repr=False)
+    business_connection_id: "str" = ""
+    username: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "business_connection_id": self.business_connection_id,
+            "username": self.username,
+        }
+
+
+
+@dataclass(slots=True)
+class SetBusinessAccountGiftSettings(Function["Ok"]):
+    """
+    Changes settings for gift receiving of a business account; for bots only
+
+    :param business_connection_id: Unique identifier of business connection
+    :param settings: The new settings
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setBusinessAccountGiftSettings", init=False, repr=False)
+    business_connection_id: "str" = ""
+    settings: "GiftSettings | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "business_connection_id": self.business_connection_id,
+            "settings": self.settings._to_json_dict() if self.settings is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetBusinessAccountStarAmount(Function["StarAmount"]):
+    """
+    Returns the amount of Telegram Stars owned by a business account; for bots only
+
+    :param business_connection_id: Unique identifier of business connection
+    :return: :class:`StarAmount`
+    """
+
+    _type: "str" = field(default="getBusinessAccountStarAmount", init=False, repr=False)
+    business_connection_id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "business_connection_id": self.business_connection_id,
+        }
+
+
+
+@dataclass(slots=True)
+class TransferBusinessAccountStars(Function["Ok"]):
+    """
+    Transfer Telegram Stars from the business account to the business bot; for bots only
+
+    :param business_connection_id: Unique identifier of business connection
+    :param star_count: Number of Telegram Stars to transfer
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="transferBusinessAccountStars", init=False, repr=False)
+    business_connection_id: "str" = ""
+    star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "business_connection_id": self.business_connection_id,
+            "star_count": self.star_count,
+        }
+
+
+
+@dataclass(slots=True)
+class CheckQuickReplyShortcutName(Function["Ok"]):
+    """
+    Checks validness of a name for a quick reply shortcut. Can be called synchronously
+
+    :param name: The name of the shortcut; 1-32 characters
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="checkQuickReplyShortcutName", init=False, repr=False)
+    name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name,
+        }
+
+
+
+@dataclass(slots=True)
+class LoadQuickReplyShortcuts(Function["Ok"]):
+    """
+    Loads quick reply shortcuts created by the current user. The loaded data will be sent through updateQuickReplyShortcut and updateQuickReplyShortcuts
+
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="loadQuickReplyShortcuts", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class SetQuickReplyShortcutName(Function["Ok"]):
+    """
+    Changes name of a quick reply shortcut
+
+    :param shortcut_id: Unique identifier of the quick reply shortcut
+    :param name: New name for the shortcut. Use checkQuickReplyShortcutName to check its validness
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setQuickReplyShortcutName", init=False, repr=False)
+    shortcut_id: "int" = 0
+    name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "shortcut_id": self.shortcut_id,
+            "name": self.name,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteQuickReplyShortcut(Function["Ok"]):
+    """
+    Deletes a quick reply shortcut
+
+    :param shortcut_id: Unique identifier of the quick reply shortcut
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteQuickReplyShortcut", init=False, repr=False)
+    shortcut_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "shortcut_id": self.shortcut_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ReorderQuickReplyShortcuts(Function["Ok"]):
+    """
+    Changes the order of quick reply shortcuts
+
+    :param shortcut_ids: The new order of quick reply shortcuts
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="reorderQuickReplyShortcuts", init=False, repr=False)
+    shortcut_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "shortcut_ids": self.shortcut_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class LoadQuickReplyShortcutMessages(Function["Ok"]):
+    """
+    Loads quick reply messages that can be sent by a given quick reply shortcut. The loaded messages will be sent through updateQuickReplyShortcutMessages
+
+    :param shortcut_id: Unique identifier of the quick reply shortcut
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="loadQuickReplyShortcutMessages", init=False, repr=False)
+    shortcut_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "shortcut_id": self.shortcut_id,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteQuickReplyShortcutMessages(Function["Ok"]):
+    """
+    Deletes specified quick reply messages
+
+    :param shortcut_id: Unique identifier of the quick reply shortcut to which the messages belong
+    :param message_ids: Unique identifiers of the messages
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteQuickReplyShortcutMessages", init=False, repr=False)
+    shortcut_id: "int" = 0
+    message_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "shortcut_id": self.shortcut_id,
+            "message_ids": self.message_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class AddQuickReplyShortcutMessage(Function["QuickReplyMessage"]):
+    """
+    Adds a message to a quick reply shortcut. If shortcut doesn't exist and there are less than getOption("quick_reply_shortcut_count_max") shortcuts, then a new shortcut is created. The shortcut must not contain more than getOption("quick_reply_shortcut_message_count_max") messages after adding the new message. Returns the added message
+
+    :param shortcut_name: Name of the target shortcut
+    :param reply_to_message_id: Identifier of a quick reply message in the same shortcut to be replied; pass 0 if none
+    :param input_message_content: The content of the message to be added; inputMessagePaidMedia, inputMessageForwarded and inputMessageLocation with live_period aren't supported
+    :return: :class:`QuickReplyMessage`
+    """
+
+    _type: "str" = field(default="addQuickReplyShortcutMessage", init=False, repr=False)
+    shortcut_name: "str" = ""
+    reply_to_message_id: "int" = 0
+    input_message_content: "InputMessageContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "shortcut_name": self.shortcut_name,
+            "reply_to_message_id": self.reply_to_message_id,
+            "input_message_content": self.input_message_content._to_json_dict() if self.input_message_content is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class AddQuickReplyShortcutInlineQueryResultMessage(Function["QuickReplyMessage"]):
+    """
+    Adds a message to a quick reply shortcut via inline bot. If shortcut doesn't exist and there are less than getOption("quick_reply_shortcut_count_max") shortcuts, then a new shortcut is created. The shortcut must not contain more than getOption("quick_reply_shortcut_message_count_max") messages after adding the new message. Returns the added message
+
+    :param shortcut_name: Name of the target shortcut
+    :param reply_to_message_id: Identifier of a quick reply message in the same shortcut to be replied; pass 0 if none
+    :param query_id: Identifier of the inline query
+    :param result_id: Identifier of the inline query result
+    :param hide_via_bot: Pass true to hide the bot, via which the message is sent. Can be used only for bots getOption("animation_search_bot_username"), getOption("photo_search_bot_username"), and getOption("venue_search_bot_username")
+    :return: :class:`QuickReplyMessage`
+    """
+
+    _type: "str" = field(default="addQuickReplyShortcutInlineQueryResultMessage", init=False, repr=False)
+    shortcut_name: "str" = ""
+    reply_to_message_id: "int" = 0
+    query_id: "int" = 0
+    result_id: "str" = ""
+    hide_via_bot: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "shortcut_name": self.shortcut_name,
+            "reply_to_message_id": self.reply_to_message_id,
+            "query_id": self.query_id,
+            "result_id": self.result_id,
+            "hide_via_bot": self.hide_via_bot,
+        }
+
+
+
+@dataclass(slots=True)
+class AddQuickReplyShortcutMessageAlbum(Function["QuickReplyMessages"]):
+    """
+    Adds 2-10 messages grouped together into an album to a quick reply shortcut. Currently, only audio, document, photo and video messages can be grouped into an album. Documents and audio files can be only grouped in an album with messages of the same type. Returns sent messages
+
+    :param shortcut_name: Name of the target shortcut
+    :param reply_to_message_id: Identifier of a quick reply message in the same shortcut to be replied; pass 0 if none
+    :param input_message_contents: Contents of messages to be sent. At most 10 messages can be added to an album. All messages must have the same value of show_caption_above_media
+    :return: :class:`QuickReplyMessages`
+    """
+
+    _type: "str" = field(default="addQuickReplyShortcutMessageAlbum", init=False, repr=False)
+    shortcut_name: "str" = ""
+    reply_to_message_id: "int" = 0
+    input_message_contents: "list[InputMessageContent] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "shortcut_name": self.shortcut_name,
+            "reply_to_message_id": self.reply_to_message_id,
+            "input_message_contents": _list_to_json(self.input_message_contents),
+        }
+
+
+
+@dataclass(slots=True)
+class ReaddQuickReplyShortcutMessages(Function["QuickReplyMessages"]):
+    """
+    Readds quick reply messages which failed to add. Can be called only for messages for which messageSendingStateFailed.can_retry is true and after specified in messageSendingStateFailed.retry_after time passed. If a message is readded, the corresponding failed to send message is deleted. Returns the sent messages in the same order as the message identifiers passed in message_ids. If a message can't be readded, null will be returned instead of the message
+
+    :param shortcut_name: Name of the target shortcut
+    :param message_ids: Identifiers of the quick reply messages to readd. Message identifiers must be in a strictly increasing order
+    :return: :class:`QuickReplyMessages`
+    """
+
+    _type: "str" = field(default="readdQuickReplyShortcutMessages", init=False, repr=False)
+    shortcut_name: "str" = ""
+    message_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "shortcut_name": self.shortcut_name,
+            "message_ids": self.message_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class EditQuickReplyMessage(Function["Ok"]):
+    """
+    Asynchronously edits the text, media or caption of a quick reply message. Use quickReplyMessage.can_be_edited to check whether a message can be edited. Media message can be edited only to a media message. Checklist messages can be edited only to a checklist message.
+     The type of message content in an album can't be changed with exception of replacing a photo with a video or vice versa
+
+    :param shortcut_id: Unique identifier of the quick reply shortcut with the message
+    :param message_id: Identifier of the message
+    :param input_message_content: New content of the message. Must be one of the following types: inputMessageAnimation, inputMessageAudio, inputMessageChecklist, inputMessageDocument, inputMessagePhoto, inputMessageText, or inputMessageVideo
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="editQuickReplyMessage", init=False, repr=False)
+    shortcut_id: "int" = 0
+    message_id: "int" = 0
+    input_message_content: "InputMessageContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "shortcut_id": self.shortcut_id,
+            "message_id": self.message_id,
+            "input_message_content": self.input_message_content._to_json_dict() if self.input_message_content is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetForumTopicDefaultIcons(Function["Stickers"]):
+    """
+    Returns the list of custom emoji, which can be used as forum topic icon by all users
+
+    :return: :class:`Stickers`
+    """
+
+    _type: "str" = field(default="getForumTopicDefaultIcons", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class CreateForumTopic(Function["ForumTopicInfo"]):
+    """
+    Creates a topic in a forum supergroup chat; requires can_manage_topics administrator or can_create_topics member right in the supergroup
+
+    :param chat_id: Identifier of the chat
+    :param name: Name of the topic; 1-128 characters
+    :param icon: Icon of the topic. Icon color must be one of 0x6FB9F0, 0xFFD67E, 0xCB86DB, 0x8EEE98, 0xFF93B2, or 0xFB6F5F. Telegram Premium users can use any custom emoji as topic icon, other users can use only a custom emoji returned by getForumTopicDefaultIcons
+    :return: :class:`ForumTopicInfo`
+    """
+
+    _type: "str" = field(default="createForumTopic", init=False, repr=False)
+    chat_id: "int" = 0
+    name: "str" = ""
+    icon: "ForumTopicIcon | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "name": self.name,
+            "icon": self.icon._to_json_dict() if self.icon is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class EditForumTopic(Function["Ok"]):
+    """
+    Edits title and icon of a topic in a forum supergroup chat; requires can_manage_topics administrator right in the supergroup unless the user is creator of the topic
+
+    :param chat_id: Identifier of the chat
+    :param message_thread_id: Message thread identifier of the forum topic
+    :param name: New name of the topic; 0-128 characters. If empty, the previous topic name is kept
+    :param edit_icon_custom_emoji: Pass true to edit the icon of the topic. Icon of the General topic can't be edited
+    :param icon_custom_emoji_id: Identifier of the new custom emoji for topic icon; pass 0 to remove the custom emoji. Ignored if edit_icon_custom_emoji is false. Telegram Premium users can use any custom emoji, other users can use only a custom emoji returned by getForumTopicDefaultIcons
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="editForumTopic", init=False, repr=False)
+    chat_id: "int" = 0
+    message_thread_id: "int" = 0
+    name: "str" = ""
+    edit_icon_custom_emoji: "bool" = False
+    icon_custom_emoji_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_thread_id": self.message_thread_id,
+            "name": self.name,
+            "edit_icon_custom_emoji": self.edit_icon_custom_emoji,
+            "icon_custom_emoji_id": self.icon_custom_emoji_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetForumTopic(Function["ForumTopic"]):
+    """
+    Returns information about a forum topic
+
+    :param chat_id: Identifier of the chat
+    :param message_thread_id: Message thread identifier of the forum topic
+    :return: :class:`ForumTopic`
+    """
+
+    _type: "str" = field(default="getForumTopic", init=False, repr=False)
+    chat_id: "int" = 0
+    message_thread_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_thread_id": self.message_thread_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetForumTopicLink(Function["MessageLink"]):
+    """
+    Returns an HTTPS link to a topic in a forum chat. This is an offline method
+
+    :param chat_id: Identifier of the chat
+    :param message_thread_id: Message thread identifier of the forum topic
+    :return: :class:`MessageLink`
+    """
+
+    _type: "str" = field(default="getForumTopicLink", init=False, repr=False)
+    chat_id: "int" = 0
+    message_thread_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_thread_id": self.message_thread_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetForumTopics(Function["ForumTopics"]):
+    """
+    Returns found forum topics in a forum chat. This is a temporary method for getting information about topic list from the server
+
+    :param chat_id: Identifier of the forum chat
+    :param query: Query to search for in the forum topic's name
+    :param offset_date: The date starting from which the results need to be fetched. Use 0 or any date in the future to get results from the last topic
+    :param offset_message_id: The message identifier of the last message in the last found topic, or 0 for the first request
+    :param offset_message_thread_id: The message thread identifier of the last found topic, or 0 for the first request
+    :param limit: The maximum number of forum topics to be returned; up to 100. For optimal performance, the number of returned forum topics is chosen by TDLib and can be smaller than the specified limit
+    :return: :class:`ForumTopics`
+    """
+
+    _type: "str" = field(default="getForumTopics", init=False, repr=False)
+    chat_id: "int" = 0
+    query: "str" = ""
+    offset_date: "int" = 0
+    offset_message_id: "int" = 0
+    offset_message_thread_id: "int" = 0
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "query": self.query,
+            "offset_date": self.offset_date,
+            "offset_message_id": self.offset_message_id,
+            "offset_message_thread_id": self.offset_message_thread_id,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class SetForumTopicNotificationSettings(Function["Ok"]):
+    """
+    Changes the notification settings of a forum topic
+
+    :param chat_id: Chat identifier
+    :param message_thread_id: Message thread identifier of the forum topic
+    :param notification_settings: New notification settings for the forum topic. If the topic is muted for more than 366 days, it is considered to be muted forever
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setForumTopicNotificationSettings", init=False, repr=False)
+    chat_id: "int" = 0
+    message_thread_id: "int" = 0
+    notification_settings: "ChatNotificationSettings | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_thread_id": self.message_thread_id,
+            "notification_settings": self.notification_settings._to_json_dict() if self.notification_settings is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleForumTopicIsClosed(Function["Ok"]):
+    """
+    Toggles whether a topic is closed in a forum supergroup chat; requires can_manage_topics administrator right in the supergroup unless the user is creator of the topic
+
+    :param chat_id: Identifier of the chat
+    :param message_thread_id: Message thread identifier of the forum topic
+    :param is_closed: Pass true to close the topic; pass false to reopen it
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleForumTopicIsClosed", init=False, repr=False)
+    chat_id: "int" = 0
+    message_thread_id: "int" = 0
+    is_closed: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_thread_id": self.message_thread_id,
+            "is_closed": self.is_closed,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleGeneralForumTopicIsHidden(Function["Ok"]):
+    """
+    Toggles whether a General topic is hidden in a forum supergroup chat; requires can_manage_topics administrator right in the supergroup
+
+    :param chat_id: Identifier of the chat
+    :param is_hidden: Pass true to hide and close the General topic; pass false to unhide it
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleGeneralForumTopicIsHidden", init=False, repr=False)
+    chat_id: "int" = 0
+    is_hidden: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "is_hidden": self.is_hidden,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleForumTopicIsPinned(Function["Ok"]):
+    """
+    Changes the pinned state of a forum topic; requires can_manage_topics administrator right in the supergroup. There can be up to getOption("pinned_forum_topic_count_max") pinned forum topics
+
+    :param chat_id: Chat identifier
+    :param message_thread_id: Message thread identifier of the forum topic
+    :param is_pinned: Pass true to pin the topic; pass false to unpin it
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleForumTopicIsPinned", init=False, repr=False)
+    chat_id: "int" = 0
+    message_thread_id: "int" = 0
+    is_pinned: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_thread_id": self.message_thread_id,
+            "is_pinned": self.is_pinned,
+        }
+
+
+
+@dataclass(slots=True)
+class SetPinnedForumTopics(Function["Ok"]):
+    """
+    Changes the order of pinned forum topics; requires can_manage_topics administrator right in the supergroup
+
+    :param chat_id: Chat identifier
+    :param message_thread_ids: The new list of pinned forum topics
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setPinnedForumTopics", init=False, repr=False)
+    chat_id: "int" = 0
+    message_thread_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_thread_ids": self.message_thread_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteForumTopic(Function["Ok"]):
+    """
+    Deletes all messages in a forum topic; requires can_delete_messages administrator right in the supergroup unless the user is creator of the topic, the topic has no messages from other users and has at most 11 messages
+
+    :param chat_id: Identifier of the chat
+    :param message_thread_id: Message thread identifier of the forum topic
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteForumTopic", init=False, repr=False)
+    chat_id: "int" = 0
+    message_thread_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_thread_id": self.message_thread_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetEmojiReaction(Function["EmojiReaction"]):
+    """
+    Returns information about an emoji reaction. Returns a 404 error if the reaction is not found
+
+    :param emoji: Text representation of the reaction
+    :return: :class:`EmojiReaction`
+    """
+
+    _type: "str" = field(default="getEmojiReaction", init=False, repr=False)
+    emoji: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "emoji": self.emoji,
+        }
+
+
+
+@dataclass(slots=True)
+class GetCustomEmojiReactionAnimations(Function["Stickers"]):
+    """
+    Returns TGS stickers with generic animations for custom emoji reactions
+
+    :return: :class:`Stickers`
+    """
+
+    _type: "str" = field(default="getCustomEmojiReactionAnimations", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetMessageAvailableReactions(Function["AvailableReactions"]):
+    """
+    Returns reactions, which can be added to a message. The list can change after updateActiveEmojiReactions, updateChatAvailableReactions for the chat, or updateMessageInteractionInfo for the message
+
+    :param chat_id: Identifier of the chat to which the message belongs
+    :param message_id: Identifier of the message
+    :param row_size: Number of reaction per row, 5-25
+    :return: :class:`AvailableReactions`
+    """
+
+    _type: "str" = field(default="getMessageAvailableReactions", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    row_size: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "row_size": self.row_size,
+        }
+
+
+
+@dataclass(slots=True)
+class ClearRecentReactions(Function["Ok"]):
+    """
+    Clears the list of recently used reactions
+
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="clearRecentReactions", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class AddMessageReaction(Function["Ok"]):
+    """
+    Adds a reaction or a tag to a message. Use getMessageAvailableReactions to receive the list of available reactions for the message
+
+    :param chat_id: Identifier of the chat to which the message belongs
+    :param message_id: Identifier of the message
+    :param reaction_type: Type of the reaction to add. Use addPendingPaidMessageReaction instead to add the paid reaction
+    :param is_big: Pass true if the reaction is added with a big animation
+    :param update_recent_reactions: Pass true if the reaction needs to be added to recent reactions; tags are never added to the list of recent reactions
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="addMessageReaction", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    reaction_type: "ReactionType | None" = None
+    is_big: "bool" = False
+    update_recent_reactions: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "reaction_type": self.reaction_type._to_json_dict() if self.reaction_type is not None else None,
+            "is_big": self.is_big,
+            "update_recent_reactions": self.update_recent_reactions,
+        }
+
+
+
+@dataclass(slots=True)
+class RemoveMessageReaction(Function["Ok"]):
+    """
+    Removes a reaction from a message. A chosen reaction can always be removed
+
+    :param chat_id: Identifier of the chat to which the message belongs
+    :param message_id: Identifier of the message
+    :param reaction_type: Type of the reaction to remove. The paid reaction can't be removed
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="removeMessageReaction", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    reaction_type: "ReactionType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "reaction_type": self.reaction_type._to_json_dict() if self.reaction_type is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatAvailablePaidMessageReactionSenders(Function["MessageSenders"]):
+    """
+    Returns the list of message sender identifiers, which can be used to send a paid reaction in a chat
+
+    :param chat_id: Chat identifier
+    :return: :class:`MessageSenders`
+    """
+
+    _type: "str" = field(default="getChatAvailablePaidMessageReactionSenders", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class AddPendingPaidMessageReaction(Function["Ok"]):
+    """
+    Adds the paid message reaction to a message. Use getMessageAvailableReactions to check whether the reaction is available for the message
+
+    :param chat_id: Identifier of the chat to which the message belongs
+    :param message_id: Identifier of the message
+    :param star_count: Number of Telegram Stars to be used for the reaction. The total number of pending paid reactions must not exceed getOption("paid_reaction_star_count_max")
+    :param type: Type of the paid reaction; pass null if the user didn't choose reaction type explicitly, for example, the reaction is set from the message bubble
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="addPendingPaidMessageReaction", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    star_count: "int" = 0
+    type: "PaidReactionType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "star_count": self.star_count,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class CommitPendingPaidMessageReactions(Function["Ok"]):
+    """
+    Applies all pending paid reactions on a message
+
+    :param chat_id: Identifier of the chat to which the message belongs
+    :param message_id: Identifier of the message
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="commitPendingPaidMessageReactions", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+
+
+@dataclass(slots=True)
+class RemovePendingPaidMessageReactions(Function["Ok"]):
+    """
+    Removes all pending paid reactions on a message
+
+    :param chat_id: Identifier of the chat to which the message belongs
+    :param message_id: Identifier of the message
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="removePendingPaidMessageReactions", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SetPaidMessageReactionType(Function["Ok"]):
+    """
+    Changes type of paid message reaction of the current user on a message. The message must have paid reaction added by the current user
+
+    :param chat_id: Identifier of the chat to which the message belongs
+    :param message_id: Identifier of the message
+    :param type: New type of the paid reaction
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setPaidMessageReactionType", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    type: "PaidReactionType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SetMessageReactions(Function["Ok"]):
+    """
+    Sets reactions on a message; for bots only
+
+    :param chat_id: Identifier of the chat to which the message belongs
+    :param message_id: Identifier of the message
+    :param reaction_types: Types of the reaction to set; pass an empty list to remove the reactions
+    :param is_big: Pass true if the reactions are added with a big animation
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setMessageReactions", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    reaction_types: "list[ReactionType] | None" = None
+    is_big: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "reaction_types": _list_to_json(self.reaction_types),
+            "is_big": self.is_big,
+        }
+
+
+
+@dataclass(slots=True)
+class GetMessageAddedReactions(Function["AddedReactions"]):
+    """
+    Returns reactions added for a message, along with their sender
+
+    :param chat_id: Identifier of the chat to which the message belongs
+    :param message_id: Identifier of the message. Use message.interaction_info.reactions.can_get_added_reactions to check whether added reactions can be received for the message
+    :param reaction_type: Type of the reactions to return; pass null to return all added reactions; reactionTypePaid isn't supported
+    :param offset: Offset of the first entry to return as received from the previous request; use empty string to get the first chunk of results
+    :param limit: The maximum number of reactions to be returned; must be positive and can't be greater than 100
+    :return: :class:`AddedReactions`
+    """
+
+    _type: "str" = field(default="getMessageAddedReactions", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    reaction_type: "ReactionType | None" = None
+    offset: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "reaction_type": self.reaction_type._to_json_dict() if self.reaction_type is not None else None,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class SetDefaultReactionType(Function["Ok"]):
+    """
+    Changes type of default reaction for the current user
+
+    :param reaction_type: New type of the default reaction. The paid reaction can't be set as default
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setDefaultReactionType", init=False, repr=False)
+    reaction_type: "ReactionType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "reaction_type": self.reaction_type._to_json_dict() if self.reaction_type is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetSavedMessagesTags(Function["SavedMessagesTags"]):
+    """
+    Returns tags used in Saved Messages or a Saved Messages topic
+
+    :param saved_messages_topic_id: Identifier of Saved Messages topic which tags will be returned; pass 0 to get all Saved Messages tags
+    :return: :class:`SavedMessagesTags`
+    """
+
+    _type: "str" = field(default="getSavedMessagesTags", init=False, repr=False)
+    saved_messages_topic_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "saved_messages_topic_id": self.saved_messages_topic_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SetSavedMessagesTagLabel(Function["Ok"]):
+    """
+    Changes label of a Saved Messages tag; for Telegram Premium users only
+
+    :param tag: The tag which label will be changed
+    :param label: New label for the tag; 0-12 characters
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setSavedMessagesTagLabel", init=False, repr=False)
+    tag: "ReactionType | None" = None
+    label: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "tag": self.tag._to_json_dict() if self.tag is not None else None,
+            "label": self.label,
+        }
+
+
+
+@dataclass(slots=True)
+class GetMessageEffect(Function["MessageEffect"]):
+    """
+    Returns information about a message effect. Returns a 404 error if the effect is not found
+
+    :param effect_id: Unique identifier of the effect
+    :return: :class:`MessageEffect`
+    """
+
+    _type: "str" = field(default="getMessageEffect", init=False, repr=False)
+    effect_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "effect_id": self.effect_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchQuote(Function["FoundPosition"]):
+    """
+    Searches for a given quote in a text. Returns found quote start position in UTF-16 code units. Returns a 404 error if the quote is not found. Can be called synchronously
+
+    :param text: Text in which to search for the quote
+    :param quote: Quote to search for
+    :param quote_position: Approximate quote position in UTF-16 code units
+    :return: :class:`FoundPosition`
+    """
+
+    _type: "str" = field(default="searchQuote", init=False, repr=False)
+    text: "FormattedText | None" = None
+    quote: "FormattedText | None" = None
+    quote_position: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "quote": self.quote._to_json_dict() if self.quote is not None else None,
+            "quote_position": self.quote_position,
+        }
+
+
+
+@dataclass(slots=True)
+class GetTextEntities(Function["TextEntities"]):
+    """
+    Returns all entities (mentions, hashtags, cashtags, bot commands, bank card numbers, URLs, and email addresses) found in the text. Can be called synchronously
+
+    :param text: The text in which to look for entities
+    :return: :class:`TextEntities`
+    """
+
+    _type: "str" = field(default="getTextEntities", init=False, repr=False)
+    text: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text,
+        }
+
+
+
+@dataclass(slots=True)
+class ParseTextEntities(Function["FormattedText"]):
+    """
+    Parses Bold, Italic, Underline, Strikethrough, Spoiler, CustomEmoji, BlockQuote, ExpandableBlockQuote, Code, Pre, PreCode, TextUrl and MentionName entities from a marked-up text. Can be called synchronously
+
+    :param text: The text to parse
+    :param parse_mode: Text parse mode
+    :return: :class:`FormattedText`
+    """
+
+    _type: "str" = field(default="parseTextEntities", init=False, repr=False)
+    text: "str" = ""
+    parse_mode: "TextParseMode | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text,
+            "parse_mode": self.parse_mode._to_json_dict() if self.parse_mode is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class ParseMarkdown(Function["FormattedText"]):
+    """
+    Parses Markdown entities in a human-friendly format, ignoring markup errors. Can be called synchronously
+
+    :param text: The text to parse. For example, "__italic__ ~~strikethrough~~ ||spoiler|| **bold** `code` ```pre``` __[italic__ text_url](telegram.org) __italic**bold italic__bold**"
+    :return: :class:`FormattedText`
+    """
+
+    _type: "str" = field(default="parseMarkdown", init=False, repr=False)
+    text: "FormattedText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetMarkdownText(Function["FormattedText"]):
+    """
+    Replaces text entities with Markdown formatting in a human-friendly format. Entities that can't be represented in Markdown unambiguously are kept as is. Can be called synchronously
+
+    :param text: The text
+    :return: :class:`FormattedText`
+    """
+
+    _type: "str" = field(default="getMarkdownText", init=False, repr=False)
+    text: "FormattedText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetCountryFlagEmoji(Function["Text"]):
+    """
+    Returns an emoji for the given country. Returns an empty string on failure. Can be called synchronously
+
+    :param country_code: A two-letter ISO 3166-1 alpha-2 country code as received from getCountries
+    :return: :class:`Text`
+    """
+
+    _type: "str" = field(default="getCountryFlagEmoji", init=False, repr=False)
+    country_code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "country_code": self.country_code,
+        }
+
+
+
+@dataclass(slots=True)
+class GetFileMimeType(Function["Text"]):
+    """
+    Returns the MIME type of a file, guessed by its extension. Returns an empty string on failure. Can be called synchronously
+
+    :param file_name: The name of the file or path to the file
+    :return: :class:`Text`
+    """
+
+    _type: "str" = field(default="getFileMimeType", init=False, repr=False)
+    file_name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_name": self.file_name,
+        }
+
+
+
+@dataclass(slots=True)
+class GetFileExtension(Function["Text"]):
+    """
+    Returns the extension of a file, guessed by its MIME type. Returns an empty string on failure. Can be called synchronously
+
+    :param mime_type: The MIME type of the file
+    :return: :class:`Text`
+    """
+
+    _type: "str" = field(default="getFileExtension", init=False, repr=False)
+    mime_type: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "mime_type": self.mime_type,
+        }
+
+
+
+@dataclass(slots=True)
+class CleanFileName(Function["Text"]):
+    """
+    Removes potentially dangerous characters from the name of a file. Returns an empty string on failure. Can be called synchronously
+
+    :param file_name: File name or path to the file
+    :return: :class:`Text`
+    """
+
+    _type: "str" = field(default="cleanFileName", init=False, repr=False)
+    file_name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_name": self.file_name,
+        }
+
+
+
+@dataclass(slots=True)
+class GetLanguagePackString(Function["LanguagePackStringValue"]):
+    """
+    Returns a string stored in the local database from the specified localization target and language pack by its key. Returns a 404 error if the string is not found. Can be called synchronously
+
+    :param language_pack_database_path: Path to the language pack database in which strings are stored
+    :param localization_target: Localization target to which the language pack belongs
+    :param language_pack_id: Language pack identifier
+    :param key: Language pack key of the string to be returned
+    :return: :class:`LanguagePackStringValue`
+    """
+
+    _type: "str" = field(default="getLanguagePackString", init=False, repr=False)
+    language_pack_database_path: "str" = ""
+    localization_target: "str" = ""
+    language_pack_id: "str" = ""
+    key: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "language_pack_database_path": self.language_pack_database_path,
+            "localization_target": self.localization_target,
+            "language_pack_id": self.language_pack_id,
+            "key": self.key,
+        }
+
+
+
+@dataclass(slots=True)
+class GetJsonValue(Function["JsonValue"]):
+    """
+    Converts a JSON-serialized string to corresponding JsonValue object. Can be called synchronously
+
+    :param json: The JSON-serialized string
+    :return: :class:`JsonValue`
+    """
+
+    _type: "str" = field(default="getJsonValue", init=False, repr=False)
+    json: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "json": self.json,
+        }
+
+
+
+@dataclass(slots=True)
+class GetJsonString(Function["Text"]):
+    """
+    Converts a JsonValue object to corresponding JSON-serialized string. Can be called synchronously
+
+    :param json_value: The JsonValue object
+    :return: :class:`Text`
+    """
+
+    _type: "str" = field(default="getJsonString", init=False, repr=False)
+    json_value: "JsonValue | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "json_value": self.json_value._to_json_dict() if self.json_value is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetThemeParametersJsonString(Function["Text"]):
+    """
+    Converts a themeParameters object to corresponding JSON-serialized string. Can be called synchronously
+
+    :param theme: Theme parameters to convert to JSON
+    :return: :class:`Text`
+    """
+
+    _type: "str" = field(default="getThemeParametersJsonString", init=False, repr=False)
+    theme: "ThemeParameters | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "theme": self.theme._to_json_dict() if self.theme is not None else None,
+        }
+
+
@@ -0,0 +1,1624 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import Ok
+    from .classes_01 import ChatLocation, InputChecklistTask, Location, Outline, Sticker
+    from .classes_04 import FoundUsers
+    from .classes_05 import MessageSenders
+    from .classes_06 import InputMessageReplyTo, Message, MessageSource
+    from .classes_07 import Chat, ChatFolder, ChatFolderInfo, ChatList, ChatLists, CreatedBasicGroupChat
+    from .classes_08 import FoundWebApp, LoginUrlInfo, MainWebApp, ReplyMarkup, WebAppInfo, WebAppOpenParameters
+    from .classes_09 import ShippingOption
+    from .classes_13 import ChatAction
+    from .classes_16 import BusinessConnection, CallbackQueryAnswer, CallbackQueryPayload, GameHighScores, HttpUrl, InlineQueryResults, InlineQueryResultsButton, InputInlineQueryResult, PreparedInlineMessage, PreparedInlineMessageId, SentWebAppMessage, TargetChatTypes
+    from .classes_21 import InternalLinkType
+    from .classes_23 import SuggestedAction
+
+
+@dataclass(slots=True)
+class SetPollAnswer(Function["Ok"]):
+    """
+    Changes the user answer to a poll. A poll in quiz mode can be answered only once
+
+    :param chat_id: Identifier of the chat to which the poll belongs
+    :param message_id: Identifier of the message containing the poll
+    :param option_ids: 0-based identifiers of answer options, chosen by the user. User can choose more than 1 answer option only is the poll allows multiple answers
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setPollAnswer", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    option_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "option_ids": self.option_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class GetPollVoters(Function["MessageSenders"]):
+    """
+    Returns message senders voted for the specified option in a non-anonymous polls. For optimal performance, the number of returned users is chosen by TDLib
+
+    :param chat_id: Identifier of the chat to which the poll belongs
+    :param message_id: Identifier of the message containing the poll
+    :param option_id: 0-based identifier of the answer option
+    :param offset: Number of voters to skip in the result; must be non-negative
+    :param limit: The maximum number of voters to be returned; must be positive and can't be greater than 50. For optimal performance, the number of returned voters is chosen by TDLib and can be smaller than the specified limit, even if the end of the voter list has not been reached
+    :return: :class:`MessageSenders`
+    """
+
+    _type: "str" = field(default="getPollVoters", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    option_id: "int" = 0
+    offset: "int" = 0
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "option_id": self.option_id,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class StopPoll(Function["Ok"]):
+    """
+    Stops a poll
+
+    :param chat_id: Identifier of the chat to which the poll belongs
+    :param message_id: Identifier of the message containing the poll. Use messageProperties.can_be_edited to check whether the poll can be stopped
+    :param reply_markup: The new message reply markup; pass null if none; for bots only
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="stopPoll", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    reply_markup: "ReplyMarkup | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "reply_markup": self.reply_markup._to_json_dict() if self.reply_markup is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class AddChecklistTasks(Function["Ok"]):
+    """
+    Adds tasks to a checklist in a message
+
+    :param chat_id: Identifier of the chat with the message
+    :param message_id: Identifier of the message containing the checklist. Use messageProperties.can_add_tasks to check whether the tasks can be added
+    :param tasks: List of added tasks
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="addChecklistTasks", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    tasks: "list[InputChecklistTask] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "tasks": _list_to_json(self.tasks),
+        }
+
+
+
+@dataclass(slots=True)
+class MarkChecklistTasksAsDone(Function["Ok"]):
+    """
+    Adds tasks of a checklist in a message as done or not done
+
+    :param chat_id: Identifier of the chat with the message
+    :param message_id: Identifier of the message containing the checklist. Use messageProperties.can_mark_tasks_as_done to check whether the tasks can be marked as done or not done
+    :param marked_as_done_task_ids: Identifiers of tasks that were marked as done
+    :param marked_as_not_done_task_ids: Identifiers of tasks that were marked as not done
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="markChecklistTasksAsDone", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    marked_as_done_task_ids: "list[int] | None" = None
+    marked_as_not_done_task_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "marked_as_done_task_ids": self.marked_as_done_task_ids,
+            "marked_as_not_done_task_ids": self.marked_as_not_done_task_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class HideSuggestedAction(Function["Ok"]):
+    """
+    Hides a suggested action
+
+    :param action: Suggested action to hide
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="hideSuggestedAction", init=False, repr=False)
+    action: "SuggestedAction | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "action": self.action._to_json_dict() if self.action is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class HideContactCloseBirthdays(Function["Ok"]):
+    """
+    Hides the list of contacts that have close birthdays for 24 hours
+
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="hideContactCloseBirthdays", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetBusinessConnection(Function["BusinessConnection"]):
+    """
+    Returns information about a business connection by its identifier; for bots only
+
+    :param connection_id: Identifier of the business connection to return
+    :return: :class:`BusinessConnection`
+    """
+
+    _type: "str" = field(default="getBusinessConnection", init=False, repr=False)
+    connection_id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "connection_id": self.connection_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetLoginUrlInfo(Function["LoginUrlInfo"]):
+    """
+    Returns information about a button of type inlineKeyboardButtonTypeLoginUrl. The method needs to be called when the user presses the button
+
+    :param chat_id: Chat identifier of the message with the button
+    :param message_id: Message identifier of the message with the button. The message must not be scheduled
+    :param button_id: Button identifier
+    :return: :class:`LoginUrlInfo`
+    """
+
+    _type: "str" = field(default="getLoginUrlInfo", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    button_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "button_id": self.button_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetLoginUrl(Function["HttpUrl"]):
+    """
+    Returns an HTTP URL which can be used to automatically authorize the user on a website after clicking an inline button of type inlineKeyboardButtonTypeLoginUrl. Use the method getLoginUrlInfo to find whether a prior user confirmation is needed. If an error is returned, then the button must be handled as an ordinary URL button
+
+    :param chat_id: Chat identifier of the message with the button
+    :param message_id: Message identifier of the message with the button
+    :param button_id: Button identifier
+    :param allow_write_access: Pass true to allow the bot to send messages to the current user
+    :return: :class:`HttpUrl`
+    """
+
+    _type: "str" = field(default="getLoginUrl", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    button_id: "int" = 0
+    allow_write_access: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "button_id": self.button_id,
+            "allow_write_access": self.allow_write_access,
+        }
+
+
+
+@dataclass(slots=True)
+class ShareUsersWithBot(Function["Ok"]):
+    """
+    Shares users after pressing a keyboardButtonTypeRequestUsers button with the bot
+
+    :param chat_id: Identifier of the chat with the bot
+    :param message_id: Identifier of the message with the button
+    :param button_id: Identifier of the button
+    :param shared_user_ids: Identifiers of the shared users
+    :param only_check: Pass true to check that the users can be shared by the button instead of actually sharing them
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="shareUsersWithBot", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    button_id: "int" = 0
+    shared_user_ids: "list[int] | None" = None
+    only_check: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "button_id": self.button_id,
+            "shared_user_ids": self.shared_user_ids,
+            "only_check": self.only_check,
+        }
+
+
+
+@dataclass(slots=True)
+class ShareChatWithBot(Function["Ok"]):
+    """
+    Shares a chat after pressing a keyboardButtonTypeRequestChat button with the bot
+
+    :param chat_id: Identifier of the chat with the bot
+    :param message_id: Identifier of the message with the button
+    :param button_id: Identifier of the button
+    :param shared_chat_id: Identifier of the shared chat
+    :param only_check: Pass true to check that the chat can be shared by the button instead of actually sharing it. Doesn't check bot_is_member and bot_administrator_rights restrictions.
+     If the bot must be a member, then all chats from getGroupsInCommon and all chats, where the user can add the bot, are suitable. In the latter case the bot will be automatically added to the chat.
+     If the bot must be an administrator, then all chats, where the bot already has requested rights or can be added to administrators by the user, are suitable. In the latter case the bot will be automatically granted requested rights
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="shareChatWithBot", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    button_id: "int" = 0
+    shared_chat_id: "int" = 0
+    only_check: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "button_id": self.button_id,
+            "shared_chat_id": self.shared_chat_id,
+            "only_check": self.only_check,
+        }
+
+
+
+@dataclass(slots=True)
+class GetInlineQueryResults(Function["InlineQueryResults"]):
+    """
+    Sends an inline query to a bot and returns its results. Returns an error with code 502 if the bot fails to answer the query before the query timeout expires
+
+    :param bot_user_id: Identifier of the target bot
+    :param chat_id: Identifier of the chat where the query was sent
+    :param user_location: Location of the user; pass null if unknown or the bot doesn't need user's location
+    :param query: Text of the query
+    :param offset: Offset of the first entry to return; use empty string to get the first chunk of results
+    :return: :class:`InlineQueryResults`
+    """
+
+    _type: "str" = field(default="getInlineQueryResults", init=False, repr=False)
+    bot_user_id: "int" = 0
+    chat_id: "int" = 0
+    user_location: "Location | None" = None
+    query: "str" = ""
+    offset: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "chat_id": self.chat_id,
+            "user_location": self.user_location._to_json_dict() if self.user_location is not None else None,
+            "query": self.query,
+            "offset": self.offset,
+        }
+
+
+
+@dataclass(slots=True)
+class AnswerInlineQuery(Function["Ok"]):
+    """
+    Sets the result of an inline query; for bots only
+
+    :param inline_query_id: Identifier of the inline query
+    :param is_personal: Pass true if results may be cached and returned only for the user that sent the query. By default, results may be returned to any user who sends the same query
+    :param button: Button to be shown above inline query results; pass null if none
+    :param results: The results of the query
+    :param cache_time: Allowed time to cache the results of the query, in seconds
+    :param next_offset: Offset for the next inline query; pass an empty string if there are no more results
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="answerInlineQuery", init=False, repr=False)
+    inline_query_id: "int" = 0
+    is_personal: "bool" = False
+    button: "InlineQueryResultsButton | None" = None
+    results: "list[InputInlineQueryResult] | None" = None
+    cache_time: "int" = 0
+    next_offset: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "inline_query_id": self.inline_query_id,
+            "is_personal": self.is_personal,
+            "button": self.button._to_json_dict() if self.button is not None else None,
+            "results": _list_to_json(self.results),
+            "cache_time": self.cache_time,
+            "next_offset": self.next_offset,
+        }
+
+
+
+@dataclass(slots=True)
+class SavePreparedInlineMessage(Function["PreparedInlineMessageId"]):
+    """
+    Saves an inline message to be sent by the given user; for bots only
+
+    :param user_id: Identifier of the user
+    :param result: The description of the message
+    :param chat_types: Types of the chats to which the message can be sent
+    :return: :class:`PreparedInlineMessageId`
+    """
+
+    _type: "str" = field(default="savePreparedInlineMessage", init=False, repr=False)
+    user_id: "int" = 0
+    result: "InputInlineQueryResult | None" = None
+    chat_types: "TargetChatTypes | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "result": self.result._to_json_dict() if self.result is not None else None,
+            "chat_types": self.chat_types._to_json_dict() if self.chat_types is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetPreparedInlineMessage(Function["PreparedInlineMessage"]):
+    """
+    Saves an inline message to be sent by the given user
+
+    :param bot_user_id: Identifier of the bot that created the message
+    :param prepared_message_id: Identifier of the prepared message
+    :return: :class:`PreparedInlineMessage`
+    """
+
+    _type: "str" = field(default="getPreparedInlineMessage", init=False, repr=False)
+    bot_user_id: "int" = 0
+    prepared_message_id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "prepared_message_id": self.prepared_message_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetGrossingWebAppBots(Function["FoundUsers"]):
+    """
+    Returns the most grossing Web App bots
+
+    :param offset: Offset of the first entry to return as received from the previous request; use empty string to get the first chunk of results
+    :param limit: The maximum number of bots to be returned; up to 100
+    :return: :class:`FoundUsers`
+    """
+
+    _type: "str" = field(default="getGrossingWebAppBots", init=False, repr=False)
+    offset: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchWebApp(Function["FoundWebApp"]):
+    """
+    Returns information about a Web App by its short name. Returns a 404 error if the Web App is not found
+
+    :param bot_user_id: Identifier of the target bot
+    :param web_app_short_name: Short name of the Web App
+    :return: :class:`FoundWebApp`
+    """
+
+    _type: "str" = field(default="searchWebApp", init=False, repr=False)
+    bot_user_id: "int" = 0
+    web_app_short_name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "web_app_short_name": self.web_app_short_name,
+        }
+
+
+
+@dataclass(slots=True)
+class GetWebAppPlaceholder(Function["Outline"]):
+    """
+    Returns a default placeholder for Web Apps of a bot. This is an offline method. Returns a 404 error if the placeholder isn't known
+
+    :param bot_user_id: Identifier of the target bot
+    :return: :class:`Outline`
+    """
+
+    _type: "str" = field(default="getWebAppPlaceholder", init=False, repr=False)
+    bot_user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetWebAppLinkUrl(Function["HttpUrl"]):
+    """
+    Returns an HTTPS URL of a Web App to open after a link of the type internalLinkTypeWebApp is clicked
+
+    :param chat_id: Identifier of the chat in which the link was clicked; pass 0 if none
+    :param bot_user_id: Identifier of the target bot
+    :param web_app_short_name: Short name of the Web App
+    :param start_parameter: Start parameter from internalLinkTypeWebApp
+    :param allow_write_access: Pass true if the current user allowed the bot to send them messages
+    :param parameters: Parameters to use to open the Web App
+    :return: :class:`HttpUrl`
+    """
+
+    _type: "str" = field(default="getWebAppLinkUrl", init=False, repr=False)
+    chat_id: "int" = 0
+    bot_user_id: "int" = 0
+    web_app_short_name: "str" = ""
+    start_parameter: "str" = ""
+    allow_write_access: "bool" = False
+    parameters: "WebAppOpenParameters | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "bot_user_id": self.bot_user_id,
+            "web_app_short_name": self.web_app_short_name,
+            "start_parameter": self.start_parameter,
+            "allow_write_access": self.allow_write_access,
+            "parameters": self.parameters._to_json_dict() if self.parameters is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetMainWebApp(Function["MainWebApp"]):
+    """
+    Returns information needed to open the main Web App of a bot
+
+    :param chat_id: Identifier of the chat in which the Web App is opened; pass 0 if none
+    :param bot_user_id: Identifier of the target bot. If the bot is restricted for the current user, then show an error instead of calling the method
+    :param start_parameter: Start parameter from internalLinkTypeMainWebApp
+    :param parameters: Parameters to use to open the Web App
+    :return: :class:`MainWebApp`
+    """
+
+    _type: "str" = field(default="getMainWebApp", init=False, repr=False)
+    chat_id: "int" = 0
+    bot_user_id: "int" = 0
+    start_parameter: "str" = ""
+    parameters: "WebAppOpenParameters | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "bot_user_id": self.bot_user_id,
+            "start_parameter": self.start_parameter,
+            "parameters": self.parameters._to_json_dict() if self.parameters is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetWebAppUrl(Function["HttpUrl"]):
+    """
+    Returns an HTTPS URL of a Web App to open from the side menu, a keyboardButtonTypeWebApp button, or an inlineQueryResultsButtonTypeWebApp button
+
+    :param bot_user_id: Identifier of the target bot. If the bot is restricted for the current user, then show an error instead of calling the method
+    :param url: The URL from a keyboardButtonTypeWebApp button, inlineQueryResultsButtonTypeWebApp button, or an empty string when the bot is opened from the side menu
+    :param parameters: Parameters to use to open the Web App
+    :return: :class:`HttpUrl`
+    """
+
+    _type: "str" = field(default="getWebAppUrl", init=False, repr=False)
+    bot_user_id: "int" = 0
+    url: "str" = ""
+    parameters: "WebAppOpenParameters | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "url": self.url,
+            "parameters": self.parameters._to_json_dict() if self.parameters is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SendWebAppData(Function["Ok"]):
+    """
+    Sends data received from a keyboardButtonTypeWebApp Web App to a bot
+
+    :param bot_user_id: Identifier of the target bot
+    :param button_text: Text of the keyboardButtonTypeWebApp button, which opened the Web App
+    :param data: The data
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="sendWebAppData", init=False, repr=False)
+    bot_user_id: "int" = 0
+    button_text: "str" = ""
+    data: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "button_text": self.button_text,
+            "data": self.data,
+        }
+
+
+
+@dataclass(slots=True)
+class OpenWebApp(Function["WebAppInfo"]):
+    """
+    Informs TDLib that a Web App is being opened from the attachment menu, a botMenuButton button, an internalLinkTypeAttachmentMenuBot link, or an inlineKeyboardButtonTypeWebApp button. For each bot, a confirmation alert about data sent to the bot must be shown once
+
+    :param chat_id: Identifier of the chat in which the Web App is opened. The Web App can't be opened in secret chats
+    :param bot_user_id: Identifier of the bot, providing the Web App. If the bot is restricted for the current user, then show an error instead of calling the method
+    :param url: The URL from an inlineKeyboardButtonTypeWebApp button, a botMenuButton button, an internalLinkTypeAttachmentMenuBot link, or an empty string otherwise
+    :param message_thread_id: If not 0, the message thread identifier to which the message will be sent
+    :param direct_messages_chat_topic_id: If not 0, unique identifier of the topic of channel direct messages chat to which the message will be sent
+    :param reply_to: Information about the message or story to be replied in the message sent by the Web App; pass null if none
+    :param parameters: Parameters to use to open the Web App
+    :return: :class:`WebAppInfo`
+    """
+
+    _type: "str" = field(default="openWebApp", init=False, repr=False)
+    chat_id: "int" = 0
+    bot_user_id: "int" = 0
+    url: "str" = ""
+    message_thread_id: "int" = 0
+    direct_messages_chat_topic_id: "int" = 0
+    reply_to: "InputMessageReplyTo | None" = None
+    parameters: "WebAppOpenParameters | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "bot_user_id": self.bot_user_id,
+            "url": self.url,
+            "message_thread_id": self.message_thread_id,
+            "direct_messages_chat_topic_id": self.direct_messages_chat_topic_id,
+            "reply_to": self.reply_to._to_json_dict() if self.reply_to is not None else None,
+            "parameters": self.parameters._to_json_dict() if self.parameters is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class CloseWebApp(Function["Ok"]):
+    """
+    Informs TDLib that a previously opened Web App was closed
+
+    :param web_app_launch_id: Identifier of Web App launch, received from openWebApp
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="closeWebApp", init=False, repr=False)
+    web_app_launch_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "web_app_launch_id": self.web_app_launch_id,
+        }
+
+
+
+@dataclass(slots=True)
+class AnswerWebAppQuery(Function["SentWebAppMessage"]):
+    """
+    Sets the result of interaction with a Web App and sends corresponding message on behalf of the user to the chat from which the query originated; for bots only
+
+    :param web_app_query_id: Identifier of the Web App query
+    :param result: The result of the query
+    :return: :class:`SentWebAppMessage`
+    """
+
+    _type: "str" = field(default="answerWebAppQuery", init=False, repr=False)
+    web_app_query_id: "str" = ""
+    result: "InputInlineQueryResult | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "web_app_query_id": self.web_app_query_id,
+            "result": self.result._to_json_dict() if self.result is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class CheckWebAppFileDownload(Function["Ok"]):
+    """
+    Checks whether a file can be downloaded and saved locally by Web App request
+
+    :param bot_user_id: Identifier of the bot, providing the Web App
+    :param file_name: Name of the file
+    :param url: URL of the file
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="checkWebAppFileDownload", init=False, repr=False)
+    bot_user_id: "int" = 0
+    file_name: "str" = ""
+    url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "file_name": self.file_name,
+            "url": self.url,
+        }
+
+
+
+@dataclass(slots=True)
+class GetCallbackQueryAnswer(Function["CallbackQueryAnswer"]):
+    """
+    Sends a callback query to a bot and returns an answer. Returns an error with code 502 if the bot fails to answer the query before the query timeout expires
+
+    :param chat_id: Identifier of the chat with the message
+    :param message_id: Identifier of the message from which the query originated. The message must not be scheduled
+    :param payload: Query payload
+    :return: :class:`CallbackQueryAnswer`
+    """
+
+    _type: "str" = field(default="getCallbackQueryAnswer", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    payload: "CallbackQueryPayload | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "payload": self.payload._to_json_dict() if self.payload is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class AnswerCallbackQuery(Function["Ok"]):
+    """
+    Sets the result of a callback query; for bots only
+
+    :param callback_query_id: Identifier of the callback query
+    :param text: Text of the answer
+    :param show_alert: Pass true to show an alert to the user instead of a toast notification
+    :param url: URL to be opened
+    :param cache_time: Time during which the result of the query can be cached, in seconds
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="answerCallbackQuery", init=False, repr=False)
+    callback_query_id: "int" = 0
+    text: "str" = ""
+    show_alert: "bool" = False
+    url: "str" = ""
+    cache_time: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "callback_query_id": self.callback_query_id,
+            "text": self.text,
+            "show_alert": self.show_alert,
+            "url": self.url,
+            "cache_time": self.cache_time,
+        }
+
+
+
+@dataclass(slots=True)
+class AnswerShippingQuery(Function["Ok"]):
+    """
+    Sets the result of a shipping query; for bots only
+
+    :param shipping_query_id: Identifier of the shipping query
+    :param shipping_options: Available shipping options
+    :param error_message: An error message, empty on success
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="answerShippingQuery", init=False, repr=False)
+    shipping_query_id: "int" = 0
+    shipping_options: "list[ShippingOption] | None" = None
+    error_message: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "shipping_query_id": self.shipping_query_id,
+            "shipping_options": _list_to_json(self.shipping_options),
+            "error_message": self.error_message,
+        }
+
+
+
+@dataclass(slots=True)
+class AnswerPreCheckoutQuery(Function["Ok"]):
+    """
+    Sets the result of a pre-checkout query; for bots only
+
+    :param pre_checkout_query_id: Identifier of the pre-checkout query
+    :param error_message: An error message, empty on success
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="answerPreCheckoutQuery", init=False, repr=False)
+    pre_checkout_query_id: "int" = 0
+    error_message: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "pre_checkout_query_id": self.pre_checkout_query_id,
+            "error_message": self.error_message,
+        }
+
+
+
+@dataclass(slots=True)
+class SetGameScore(Function["Message"]):
+    """
+    Updates the game score of the specified user in the game; for bots only
+
+    :param chat_id: The chat to which the message with the game belongs
+    :param message_id: Identifier of the message
+    :param edit_message: Pass true to edit the game message to include the current scoreboard
+    :param user_id: User identifier
+    :param score: The new score
+    :param force: Pass true to update the score even if it decreases. If the score is 0, the user will be deleted from the high score table
+    :return: :class:`Message`
+    """
+
+    _type: "str" = field(default="setGameScore", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    edit_message: "bool" = False
+    user_id: "int" = 0
+    score: "int" = 0
+    force: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "edit_message": self.edit_message,
+            "user_id": self.user_id,
+            "score": self.score,
+            "force": self.force,
+        }
+
+
+
+@dataclass(slots=True)
+class SetInlineGameScore(Function["Ok"]):
+    """
+    Updates the game score of the specified user in a game; for bots only
+
+    :param inline_message_id: Inline message identifier
+    :param edit_message: Pass true to edit the game message to include the current scoreboard
+    :param user_id: User identifier
+    :param score: The new score
+    :param force: Pass true to update the score even if it decreases. If the score is 0, the user will be deleted from the high score table
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setInlineGameScore", init=False, repr=False)
+    inline_message_id: "str" = ""
+    edit_message: "bool" = False
+    user_id: "int" = 0
+    score: "int" = 0
+    force: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "inline_message_id": self.inline_message_id,
+            "edit_message": self.edit_message,
+            "user_id": self.user_id,
+            "score": self.score,
+            "force": self.force,
+        }
+
+
+
+@dataclass(slots=True)
+class GetGameHighScores(Function["GameHighScores"]):
+    """
+    Returns the high scores for a game and some part of the high score table in the range of the specified user; for bots only
+
+    :param chat_id: The chat that contains the message with the game
+    :param message_id: Identifier of the message
+    :param user_id: User identifier
+    :return: :class:`GameHighScores`
+    """
+
+    _type: "str" = field(default="getGameHighScores", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "user_id": self.user_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetInlineGameHighScores(Function["GameHighScores"]):
+    """
+    Returns game high scores and some part of the high score table in the range of the specified user; for bots only
+
+    :param inline_message_id: Inline message identifier
+    :param user_id: User identifier
+    :return: :class:`GameHighScores`
+    """
+
+    _type: "str" = field(default="getInlineGameHighScores", init=False, repr=False)
+    inline_message_id: "str" = ""
+    user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "inline_message_id": self.inline_message_id,
+            "user_id": self.user_id,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteChatReplyMarkup(Function["Ok"]):
+    """
+    Deletes the default reply markup from a chat. Must be called after a one-time keyboard or a replyMarkupForceReply reply markup has been used. An updateChatReplyMarkup update will be sent if the reply markup is changed
+
+    :param chat_id: Chat identifier
+    :param message_id: The message identifier of the used keyboard
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteChatReplyMarkup", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SendChatAction(Function["Ok"]):
+    """
+    Sends a notification about user activity in a chat
+
+    :param chat_id: Chat identifier
+    :param message_thread_id: If not 0, the message thread identifier in which the action was performed
+    :param business_connection_id: Unique identifier of business connection on behalf of which to send the request; for bots only
+    :param action: The action description; pass null to cancel the currently active action
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="sendChatAction", init=False, repr=False)
+    chat_id: "int" = 0
+    message_thread_id: "int" = 0
+    business_connection_id: "str" = ""
+    action: "ChatAction | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_thread_id": self.message_thread_id,
+            "business_connection_id": self.business_connection_id,
+            "action": self.action._to_json_dict() if self.action is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class OpenChat(Function["Ok"]):
+    """
+    Informs TDLib that the chat is opened by the user. Many useful activities depend on the chat being opened or closed (e.g., in supergroups and channels all updates are received only for opened chats)
+
+    :param chat_id: Chat identifier
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="openChat", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class CloseChat(Function["Ok"]):
+    """
+    Informs TDLib that the chat is closed by the user. Many useful activities depend on the chat being opened or closed
+
+    :param chat_id: Chat identifier
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="closeChat", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ViewMessages(Function["Ok"]):
+    """
+    Informs TDLib that messages are being viewed by the user. Sponsored messages must be marked as viewed only when the entire text of the message is shown on the screen (excluding the button). Many useful activities depend on whether the messages are currently being viewed or not (e.g., marking messages as read, incrementing a view counter, updating a view counter, removing deleted messages in supergroups and channels)
+
+    :param chat_id: Chat identifier
+    :param message_ids: The identifiers of the messages being viewed
+    :param source: Source of the message view; pass null to guess the source based on chat open state
+    :param force_read: Pass true to mark as read the specified messages even if the chat is closed
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="viewMessages", init=False, repr=False)
+    chat_id: "int" = 0
+    message_ids: "list[int] | None" = None
+    source: "MessageSource | None" = None
+    force_read: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_ids": self.message_ids,
+            "source": self.source._to_json_dict() if self.source is not None else None,
+            "force_read": self.force_read,
+        }
+
+
+
+@dataclass(slots=True)
+class OpenMessageContent(Function["Ok"]):
+    """
+    Informs TDLib that the message content has been opened (e.g., the user has opened a photo, video, document, location or venue, or has listened to an audio file or voice note message). An updateMessageContentOpened update will be generated if something has changed
+
+    :param chat_id: Chat identifier of the message
+    :param message_id: Identifier of the message with the opened content
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="openMessageContent", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ClickAnimatedEmojiMessage(Function["Sticker"]):
+    """
+    Informs TDLib that a message with an animated emoji was clicked by the user. Returns a big animated sticker to be played or a 404 error if usual animation needs to be played
+
+    :param chat_id: Chat identifier of the message
+    :param message_id: Identifier of the clicked message
+    :return: :class:`Sticker`
+    """
+
+    _type: "str" = field(default="clickAnimatedEmojiMessage", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetInternalLink(Function["HttpUrl"]):
+    """
+    Returns an HTTPS or a tg: link with the given type. Can be called before authorization
+
+    :param type: Expected type of the link
+    :param is_http: Pass true to create an HTTPS link (only available for some link types); pass false to create a tg: link
+    :return: :class:`HttpUrl`
+    """
+
+    _type: "str" = field(default="getInternalLink", init=False, repr=False)
+    type: "InternalLinkType | None" = None
+    is_http: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "is_http": self.is_http,
+        }
+
+
+
+@dataclass(slots=True)
+class GetInternalLinkType(Function["InternalLinkType"]):
+    """
+    Returns information about the type of internal link. Returns a 404 error if the link is not internal. Can be called before authorization
+
+    :param link: The link
+    :return: :class:`InternalLinkType`
+    """
+
+    _type: "str" = field(default="getInternalLinkType", init=False, repr=False)
+    link: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "link": self.link,
+        }
+
+
+
+@dataclass(slots=True)
+class GetExternalLinkInfo(Function["LoginUrlInfo"]):
+    """
+    Returns information about an action to be done when the current user clicks an external link. Don't use this method for links from secret chats if link preview is disabled in secret chats
+
+    :param link: The link
+    :return: :class:`LoginUrlInfo`
+    """
+
+    _type: "str" = field(default="getExternalLinkInfo", init=False, repr=False)
+    link: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "link": self.link,
+        }
+
+
+
+@dataclass(slots=True)
+class GetExternalLink(Function["HttpUrl"]):
+    """
+    Returns an HTTP URL which can be used to automatically authorize the current user on a website after clicking an HTTP link. Use the method getExternalLinkInfo to find whether a prior user confirmation is needed
+
+    :param link: The HTTP link
+    :param allow_write_access: Pass true if the current user allowed the bot, returned in getExternalLinkInfo, to send them messages
+    :return: :class:`HttpUrl`
+    """
+
+    _type: "str" = field(default="getExternalLink", init=False, repr=False)
+    link: "str" = ""
+    allow_write_access: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "link": self.link,
+            "allow_write_access": self.allow_write_access,
+        }
+
+
+
+@dataclass(slots=True)
+class ReadAllChatMentions(Function["Ok"]):
+    """
+    Marks all mentions in a chat as read
+
+    :param chat_id: Chat identifier
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="readAllChatMentions", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ReadAllMessageThreadMentions(Function["Ok"]):
+    """
+    Marks all mentions in a forum topic as read
+
+    :param chat_id: Chat identifier
+    :param message_thread_id: Message thread identifier in which mentions are marked as read
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="readAllMessageThreadMentions", init=False, repr=False)
+    chat_id: "int" = 0
+    message_thread_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_thread_id": self.message_thread_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ReadAllChatReactions(Function["Ok"]):
+    """
+    Marks all reactions in a chat or a forum topic as read
+
+    :param chat_id: Chat identifier
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="readAllChatReactions", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ReadAllMessageThreadReactions(Function["Ok"]):
+    """
+    Marks all reactions in a forum topic as read
+
+    :param chat_id: Chat identifier
+    :param message_thread_id: Message thread identifier in which reactions are marked as read
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="readAllMessageThreadReactions", init=False, repr=False)
+    chat_id: "int" = 0
+    message_thread_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_thread_id": self.message_thread_id,
+        }
+
+
+
+@dataclass(slots=True)
+class CreatePrivateChat(Function["Chat"]):
+    """
+    Returns an existing chat corresponding to a given user
+
+    :param user_id: User identifier
+    :param force: Pass true to create the chat without a network request. In this case all information about the chat except its type, title and photo can be incorrect
+    :return: :class:`Chat`
+    """
+
+    _type: "str" = field(default="createPrivateChat", init=False, repr=False)
+    user_id: "int" = 0
+    force: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "force": self.force,
+        }
+
+
+
+@dataclass(slots=True)
+class CreateBasicGroupChat(Function["Chat"]):
+    """
+    Returns an existing chat corresponding to a known basic group
+
+    :param basic_group_id: Basic group identifier
+    :param force: Pass true to create the chat without a network request. In this case all information about the chat except its type, title and photo can be incorrect
+    :return: :class:`Chat`
+    """
+
+    _type: "str" = field(default="createBasicGroupChat", init=False, repr=False)
+    basic_group_id: "int" = 0
+    force: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "basic_group_id": self.basic_group_id,
+            "force": self.force,
+        }
+
+
+
+@dataclass(slots=True)
+class CreateSupergroupChat(Function["Chat"]):
+    """
+    Returns an existing chat corresponding to a known supergroup or channel
+
+    :param supergroup_id: Supergroup or channel identifier
+    :param force: Pass true to create the chat without a network request. In this case all information about the chat except its type, title and photo can be incorrect
+    :return: :class:`Chat`
+    """
+
+    _type: "str" = field(default="createSupergroupChat", init=False, repr=False)
+    supergroup_id: "int" = 0
+    force: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+            "force": self.force,
+        }
+
+
+
+@dataclass(slots=True)
+class CreateSecretChat(Function["Chat"]):
+    """
+    Returns an existing chat corresponding to a known secret chat
+
+    :param secret_chat_id: Secret chat identifier
+    :return: :class:`Chat`
+    """
+
+    _type: "str" = field(default="createSecretChat", init=False, repr=False)
+    secret_chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "secret_chat_id": self.secret_chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class CreateNewBasicGroupChat(Function["CreatedBasicGroupChat"]):
+    """
+    Creates a new basic group and sends a corresponding messageBasicGroupChatCreate. Returns information about the newly created chat
+
+    :param user_ids: Identifiers of users to be added to the basic group; may be empty to create a basic group without other members
+    :param title: Title of the new basic group; 1-128 characters
+    :param message_auto_delete_time: Message auto-delete time value, in seconds; must be from 0 up to 365 * 86400 and be divisible by 86400. If 0, then messages aren't deleted automatically
+    :return: :class:`CreatedBasicGroupChat`
+    """
+
+    _type: "str" = field(default="createNewBasicGroupChat", init=False, repr=False)
+    user_ids: "list[int] | None" = None
+    title: "str" = ""
+    message_auto_delete_time: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_ids": self.user_ids,
+            "title": self.title,
+            "message_auto_delete_time": self.message_auto_delete_time,
+        }
+
+
+
+@dataclass(slots=True)
+class CreateNewSupergroupChat(Function["Chat"]):
+    """
+    Creates a new supergroup or channel and sends a corresponding messageSupergroupChatCreate. Returns the newly created chat
+
+    :param title: Title of the new chat; 1-128 characters
+    :param is_forum: Pass true to create a forum supergroup chat
+    :param is_channel: Pass true to create a channel chat; ignored if a forum is created
+    :param description: Creates a new supergroup or channel and sends a corresponding messageSupergroupChatCreate. Returns the newly created chat
+    :param location: Chat location if a location-based supergroup is being created; pass null to create an ordinary supergroup chat
+    :param message_auto_delete_time: Message auto-delete time value, in seconds; must be from 0 up to 365 * 86400 and be divisible by 86400. If 0, then messages aren't deleted automatically
+    :param for_import: Pass true to create a supergroup for importing messages using importMessages
+    :return: :class:`Chat`
+    """
+
+    _type: "str" = field(default="createNewSupergroupChat", init=False, repr=False)
+    title: "str" = ""
+    is_forum: "bool" = False
+    is_channel: "bool" = False
+    description: "str" = ""
+    location: "ChatLocation | None" = None
+    message_auto_delete_time: "int" = 0
+    for_import: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "title": self.title,
+            "is_forum": self.is_forum,
+            "is_channel": self.is_channel,
+            "description": self.description,
+            "location": self.location._to_json_dict() if self.location is not None else None,
+            "message_auto_delete_time": self.message_auto_delete_time,
+            "for_import": self.for_import,
+        }
+
+
+
+@dataclass(slots=True)
+class CreateNewSecretChat(Function["Chat"]):
+    """
+    Creates a new secret chat. Returns the newly created chat
+
+    :param user_id: Identifier of the target user
+    :return: :class:`Chat`
+    """
+
+    _type: "str" = field(default="createNewSecretChat", init=False, repr=False)
+    user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+        }
+
+
+
+@dataclass(slots=True)
+class UpgradeBasicGroupChatToSupergroupChat(Function["Chat"]):
+    """
+    Creates a new supergroup from an existing basic group and sends a corresponding messageChatUpgradeTo and messageChatUpgradeFrom; requires owner privileges. Deactivates the original basic group
+
+    :param chat_id: Identifier of the chat to upgrade
+    :return: :class:`Chat`
+    """
+
+    _type: "str" = field(default="upgradeBasicGroupChatToSupergroupChat", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatListsToAddChat(Function["ChatLists"]):
+    """
+    Returns chat lists to which the chat can be added. This is an offline method
+
+    :param chat_id: Chat identifier
+    :return: :class:`ChatLists`
+    """
+
+    _type: "str" = field(default="getChatListsToAddChat", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class AddChatToList(Function["Ok"]):
+    """
+    Adds a chat to a chat list. A chat can't be simultaneously in Main and Archive chat lists, so it is automatically removed from another one if needed
+
+    :param chat_id: Chat identifier
+    :param chat_list: The chat list. Use getChatListsToAddChat to get suitable chat lists
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="addChatToList", init=False, repr=False)
+    chat_id: "int" = 0
+    chat_list: "ChatList | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "chat_list": self.chat_list._to_json_dict() if self.chat_list is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatFolder(Function["ChatFolder"]):
+    """
+    Returns information about a chat folder by its identifier
+
+    :param chat_folder_id: Chat folder identifier
+    :return: :class:`ChatFolder`
+    """
+
+    _type: "str" = field(default="getChatFolder", init=False, repr=False)
+    chat_folder_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_folder_id": self.chat_folder_id,
+        }
+
+
+
+@dataclass(slots=True)
+class CreateChatFolder(Function["ChatFolderInfo"]):
+    """
+    Creates new chat folder. Returns information about the created chat folder. There can be up to getOption("chat_folder_count_max") chat folders, but the limit can be increased with Telegram Premium
+
+    :param folder: The new chat folder
+    :return: :class:`ChatFolderInfo`
+    """
+
+    _type: "str" = field(default="createChatFolder", init=False, repr=False)
+    folder: "ChatFolder | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "folder": self.folder._to_json_dict() if self.folder is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class EditChatFolder(Function["ChatFolderInfo"]):
+    """
+    Edits existing chat folder. Returns information about the edited chat folder
+
+    :param chat_folder_id: Chat folder identifier
+    :param folder: The edited chat folder
+    :return: :class:`ChatFolderInfo`
+    """
+
+    _type: "str" = field(default="editChatFolder", init=False, repr=False)
+    chat_folder_id: "int" = 0
+    folder: "ChatFolder | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_folder_id": self.chat_folder_id,
+            "folder": self.folder._to_json_dict() if self.folder is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteChatFolder(Function["Ok"]):
+    """
+    Deletes existing chat folder
+
+    :param chat_folder_id: Chat folder identifier
+    :param leave_chat_ids: Identifiers of the chats to leave. The chats must be pinned or always included in the folder
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteChatFolder", init=False, repr=False)
+    chat_folder_id: "int" = 0
+    leave_chat_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_folder_id": self.chat_folder_id,
+            "leave_chat_ids": self.leave_chat_ids,
+        }
+
+
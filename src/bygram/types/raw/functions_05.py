@@ -0,0 +1,1474 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import InputFile, Ok
+    from .classes_01 import ChatLocation
+    from .classes_02 import ChatPermissions, InputChatPhoto
+    from .classes_04 import ChatAdministrators, ChatMember, ChatMemberStatus, ChatMembers, ChatMembersFilter, EmojiStatus
+    from .classes_05 import MessageSender
+    from .classes_06 import ChatNotificationSettings, NotificationSettingsScope, ScopeNotificationSettings
+    from .classes_07 import ArchiveChatListSettings, ChatAvailableReactions, ChatFolder, ChatFolderIcon, ChatFolderInviteLink, ChatFolderInviteLinkInfo, ChatFolderInviteLinks, Chats, DraftMessage, FailedToAddMembers, RecommendedChatFolders
+    from .classes_18 import BackgroundType, InputBackground
+    from .classes_19 import CanTransferOwnershipResult
+    from .classes_20 import NotificationSound, NotificationSounds
+    from .classes_23 import Count
+
+
+@dataclass(slots=True)
+class GetChatFolderChatsToLeave(Function["Chats"]):
+    """
+    Returns identifiers of pinned or always included chats from a chat folder, which are suggested to be left when the chat folder is deleted
+
+    :param chat_folder_id: Chat folder identifier
+    :return: :class:`Chats`
+    """
+
+    _type: "str" = field(default="getChatFolderChatsToLeave", init=False, repr=False)
+    chat_folder_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_folder_id": self.chat_folder_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatFolderChatCount(Function["Count"]):
+    """
+    Returns approximate number of chats in a being created chat folder. Main and archive chat lists must be fully preloaded for this function to work correctly
+
+    :param folder: The new chat folder
+    :return: :class:`Count`
+    """
+
+    _type: "str" = field(default="getChatFolderChatCount", init=False, repr=False)
+    folder: "ChatFolder | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "folder": self.folder._to_json_dict() if self.folder is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class ReorderChatFolders(Function["Ok"]):
+    """
+    Changes the order of chat folders
+
+    :param chat_folder_ids: Identifiers of chat folders in the new correct order
+    :param main_chat_list_position: Position of the main chat list among chat folders, 0-based. Can be non-zero only for Premium users
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="reorderChatFolders", init=False, repr=False)
+    chat_folder_ids: "list[int] | None" = None
+    main_chat_list_position: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_folder_ids": self.chat_folder_ids,
+            "main_chat_list_position": self.main_chat_list_position,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleChatFolderTags(Function["Ok"]):
+    """
+    Toggles whether chat folder tags are enabled
+
+    :param are_tags_enabled: Pass true to enable folder tags; pass false to disable them
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleChatFolderTags", init=False, repr=False)
+    are_tags_enabled: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "are_tags_enabled": self.are_tags_enabled,
+        }
+
+
+
+@dataclass(slots=True)
+class GetRecommendedChatFolders(Function["RecommendedChatFolders"]):
+    """
+    Returns recommended chat folders for the current user
+
+    :return: :class:`RecommendedChatFolders`
+    """
+
+    _type: "str" = field(default="getRecommendedChatFolders", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatFolderDefaultIconName(Function["ChatFolderIcon"]):
+    """
+    Returns default icon name for a folder. Can be called synchronously
+
+    :param folder: Chat folder
+    :return: :class:`ChatFolderIcon`
+    """
+
+    _type: "str" = field(default="getChatFolderDefaultIconName", init=False, repr=False)
+    folder: "ChatFolder | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "folder": self.folder._to_json_dict() if self.folder is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatsForChatFolderInviteLink(Function["Chats"]):
+    """
+    Returns identifiers of chats from a chat folder, suitable for adding to a chat folder invite link
+
+    :param chat_folder_id: Chat folder identifier
+    :return: :class:`Chats`
+    """
+
+    _type: "str" = field(default="getChatsForChatFolderInviteLink", init=False, repr=False)
+    chat_folder_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_folder_id": self.chat_folder_id,
+        }
+
+
+
+@dataclass(slots=True)
+class CreateChatFolderInviteLink(Function["ChatFolderInviteLink"]):
+    """
+    Creates a new invite link for a chat folder. A link can be created for a chat folder if it has only pinned and included chats
+
+    :param chat_folder_id: Chat folder identifier
+    :param name: Name of the link; 0-32 characters
+    :param chat_ids: Identifiers of chats to be accessible by the invite link. Use getChatsForChatFolderInviteLink to get suitable chats. Basic groups will be automatically converted to supergroups before link creation
+    :return: :class:`ChatFolderInviteLink`
+    """
+
+    _type: "str" = field(default="createChatFolderInviteLink", init=False, repr=False)
+    chat_folder_id: "int" = 0
+    name: "str" = ""
+    chat_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_folder_id": self.chat_folder_id,
+            "name": self.name,
+            "chat_ids": self.chat_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatFolderInviteLinks(Function["ChatFolderInviteLinks"]):
+    """
+    Returns invite links created by the current user for a shareable chat folder
+
+    :param chat_folder_id: Chat folder identifier
+    :return: :class:`ChatFolderInviteLinks`
+    """
+
+    _type: "str" = field(default="getChatFolderInviteLinks", init=False, repr=False)
+    chat_folder_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_folder_id": self.chat_folder_id,
+        }
+
+
+
+@dataclass(slots=True)
+class EditChatFolderInviteLink(Function["ChatFolderInviteLink"]):
+    """
+    Edits an invite link for a chat folder
+
+    :param chat_folder_id: Chat folder identifier
+    :param invite_link: Invite link to be edited
+    :param name: New name of the link; 0-32 characters
+    :param chat_ids: New identifiers of chats to be accessible by the invite link. Use getChatsForChatFolderInviteLink to get suitable chats. Basic groups will be automatically converted to supergroups before link editing
+    :return: :class:`ChatFolderInviteLink`
+    """
+
+    _type: "str" = field(default="editChatFolderInviteLink", init=False, repr=False)
+    chat_folder_id: "int" = 0
+    invite_link: "str" = ""
+    name: "str" = ""
+    chat_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_folder_id": self.chat_folder_id,
+            "invite_link": self.invite_link,
+            "name": self.name,
+            "chat_ids": self.chat_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteChatFolderInviteLink(Function["Ok"]):
+    """
+    Deletes an invite link for a chat folder
+
+    :param chat_folder_id: Chat folder identifier
+    :param invite_link: Invite link to be deleted
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteChatFolderInviteLink", init=False, repr=False)
+    chat_folder_id: "int" = 0
+    invite_link: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_folder_id": self.chat_folder_id,
+            "invite_link": self.invite_link,
+        }
+
+
+
+@dataclass(slots=True)
+class CheckChatFolderInviteLink(Function["ChatFolderInviteLinkInfo"]):
+    """
+    Checks the validity of an invite link for a chat folder and returns information about the corresponding chat folder
+
+    :param invite_link: Invite link to be checked
+    :return: :class:`ChatFolderInviteLinkInfo`
+    """
+
+    _type: "str" = field(default="checkChatFolderInviteLink", init=False, repr=False)
+    invite_link: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "invite_link": self.invite_link,
+        }
+
+
+
+@dataclass(slots=True)
+class AddChatFolderByInviteLink(Function["Ok"]):
+    """
+    Adds a chat folder by an invite link
+
+    :param invite_link: Invite link for the chat folder
+    :param chat_ids: Identifiers of the chats added to the chat folder. The chats are automatically joined if they aren't joined yet
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="addChatFolderByInviteLink", init=False, repr=False)
+    invite_link: "str" = ""
+    chat_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "invite_link": self.invite_link,
+            "chat_ids": self.chat_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatFolderNewChats(Function["Chats"]):
+    """
+    Returns new chats added to a shareable chat folder by its owner. The method must be called at most once in getOption("chat_folder_new_chats_update_period") for the given chat folder
+
+    :param chat_folder_id: Chat folder identifier
+    :return: :class:`Chats`
+    """
+
+    _type: "str" = field(default="getChatFolderNewChats", init=False, repr=False)
+    chat_folder_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_folder_id": self.chat_folder_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ProcessChatFolderNewChats(Function["Ok"]):
+    """
+    Process new chats added to a shareable chat folder by its owner
+
+    :param chat_folder_id: Chat folder identifier
+    :param added_chat_ids: Identifiers of the new chats, which are added to the chat folder. The chats are automatically joined if they aren't joined yet
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="processChatFolderNewChats", init=False, repr=False)
+    chat_folder_id: "int" = 0
+    added_chat_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_folder_id": self.chat_folder_id,
+            "added_chat_ids": self.added_chat_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class GetArchiveChatListSettings(Function["ArchiveChatListSettings"]):
+    """
+    Returns settings for automatic moving of chats to and from the Archive chat lists
+
+    :return: :class:`ArchiveChatListSettings`
+    """
+
+    _type: "str" = field(default="getArchiveChatListSettings", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class SetArchiveChatListSettings(Function["Ok"]):
+    """
+    Changes settings for automatic moving of chats to and from the Archive chat lists
+
+    :param settings: New settings
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setArchiveChatListSettings", init=False, repr=False)
+    settings: "ArchiveChatListSettings | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "settings": self.settings._to_json_dict() if self.settings is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SetChatTitle(Function["Ok"]):
+    """
+    Changes the chat title. Supported only for basic groups, supergroups and channels. Requires can_change_info member right
+
+    :param chat_id: Chat identifier
+    :param title: New title of the chat; 1-128 characters
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setChatTitle", init=False, repr=False)
+    chat_id: "int" = 0
+    title: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "title": self.title,
+        }
+
+
+
+@dataclass(slots=True)
+class SetChatPhoto(Function["Ok"]):
+    """
+    Changes the photo of a chat. Supported only for basic groups, supergroups and channels. Requires can_change_info member right
+
+    :param chat_id: Chat identifier
+    :param photo: New chat photo; pass null to delete the chat photo
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setChatPhoto", init=False, repr=False)
+    chat_id: "int" = 0
+    photo: "InputChatPhoto | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SetChatAccentColor(Function["Ok"]):
+    """
+    Changes accent color and background custom emoji of a channel chat. Requires can_change_info administrator right
+
+    :param chat_id: Chat identifier
+    :param accent_color_id: Identifier of the accent color to use. The chat must have at least accentColor.min_channel_chat_boost_level boost level to pass the corresponding color
+    :param background_custom_emoji_id: Identifier of a custom emoji to be shown on the reply header and link preview background; 0 if none. Use chatBoostLevelFeatures.can_set_background_custom_emoji to check whether a custom emoji can be set
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setChatAccentColor", init=False, repr=False)
+    chat_id: "int" = 0
+    accent_color_id: "int" = 0
+    background_custom_emoji_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "accent_color_id": self.accent_color_id,
+            "background_custom_emoji_id": self.background_custom_emoji_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SetChatProfileAccentColor(Function["Ok"]):
+    """
+    Changes accent color and background custom emoji for profile of a supergroup or channel chat. Requires can_change_info administrator right
+
+    :param chat_id: Chat identifier
+    :param profile_accent_color_id: Identifier of the accent color to use for profile; pass -1 if none. The chat must have at least profileAccentColor.min_supergroup_chat_boost_level for supergroups
+     or profileAccentColor.min_channel_chat_boost_level for channels boost level to pass the corresponding color
+    :param profile_background_custom_emoji_id: Identifier of a custom emoji to be shown on the chat's profile photo background; 0 if none. Use chatBoostLevelFeatures.can_set_profile_background_custom_emoji to check whether a custom emoji can be set
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setChatProfileAccentColor", init=False, repr=False)
+    chat_id: "int" = 0
+    profile_accent_color_id: "int" = 0
+    profile_background_custom_emoji_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "profile_accent_color_id": self.profile_accent_color_id,
+            "profile_background_custom_emoji_id": self.profile_background_custom_emoji_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SetChatMessageAutoDeleteTime(Function["Ok"]):
+    """
+    Changes the message auto-delete or self-destruct (for secret chats) time in a chat. Requires change_info administrator right in basic groups, supergroups and channels. Message auto-delete time can't be changed in a chat with the current user (Saved Messages) and the chat 777000 (Telegram).
+
+    :param chat_id: Chat identifier
+    :param message_auto_delete_time: New time value, in seconds; unless the chat is secret, it must be from 0 up to 365 * 86400 and be divisible by 86400. If 0, then messages aren't deleted automatically
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setChatMessageAutoDeleteTime", init=False, repr=False)
+    chat_id: "int" = 0
+    message_auto_delete_time: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_auto_delete_time": self.message_auto_delete_time,
+        }
+
+
+
+@dataclass(slots=True)
+class SetChatEmojiStatus(Function["Ok"]):
+    """
+    Changes the emoji status of a chat. Use chatBoostLevelFeatures.can_set_emoji_status to check whether an emoji status can be set. Requires can_change_info administrator right
+
+    :param chat_id: Chat identifier
+    :param emoji_status: New emoji status; pass null to remove emoji status
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setChatEmojiStatus", init=False, repr=False)
+    chat_id: "int" = 0
+    emoji_status: "EmojiStatus | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "emoji_status": self.emoji_status._to_json_dict() if self.emoji_status is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SetChatPermissions(Function["Ok"]):
+    """
+    Changes the chat members permissions. Supported only for basic groups and supergroups. Requires can_restrict_members administrator right
+
+    :param chat_id: Chat identifier
+    :param permissions: New non-administrator members permissions in the chat
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setChatPermissions", init=False, repr=False)
+    chat_id: "int" = 0
+    permissions: "ChatPermissions | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "permissions": self.permissions._to_json_dict() if self.permissions is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SetChatBackground(Function["Ok"]):
+    """
+    Sets the background in a specific chat. Supported only in private and secret chats with non-deleted users, and in chats with sufficient boost level and can_change_info administrator right
+
+    :param chat_id: Chat identifier
+    :param background: The input background to use; pass null to create a new filled or chat theme background
+    :param type: Background type; pass null to use default background type for the chosen background; backgroundTypeChatTheme isn't supported for private and secret chats.
+     Use chatBoostLevelFeatures.chat_theme_background_count and chatBoostLevelFeatures.can_set_custom_background to check whether the background type can be set in the boosted chat
+    :param dark_theme_dimming: Dimming of the background in dark themes, as a percentage; 0-100. Applied only to Wallpaper and Fill types of background
+    :param only_for_self: Pass true to set background only for self; pass false to set background for all chat users. Always false for backgrounds set in boosted chats. Background can be set for both users only by Telegram Premium users and if set background isn't of the type inputBackgroundPrevious
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setChatBackground", init=False, repr=False)
+    chat_id: "int" = 0
+    background: "InputBackground | None" = None
+    type: "BackgroundType | None" = None
+    dark_theme_dimming: "int" = 0
+    only_for_self: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "background": self.background._to_json_dict() if self.background is not None else None,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "dark_theme_dimming": self.dark_theme_dimming,
+            "only_for_self": self.only_for_self,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteChatBackground(Function["Ok"]):
+    """
+    Deletes background in a specific chat
+
+    :param chat_id: Chat identifier
+    :param restore_previous: Pass true to restore previously set background. Can be used only in private and secret chats with non-deleted users if userFullInfo.set_chat_background == true.
+     Supposed to be used from messageChatSetBackground messages with the currently set background that was set for both sides by the other user
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteChatBackground", init=False, repr=False)
+    chat_id: "int" = 0
+    restore_previous: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "restore_previous": self.restore_previous,
+        }
+
+
+
+@dataclass(slots=True)
+class SetChatTheme(Function["Ok"]):
+    """
+    Changes the chat theme. Supported only in private and secret chats
+
+    :param chat_id: Chat identifier
+    :param theme_name: Name of the new chat theme; pass an empty string to return the default theme
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setChatTheme", init=False, repr=False)
+    chat_id: "int" = 0
+    theme_name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "theme_name": self.theme_name,
+        }
+
+
+
+@dataclass(slots=True)
+class SetChatDraftMessage(Function["Ok"]):
+    """
+    Changes the draft message in a chat
+
+    :param chat_id: Chat identifier
+    :param message_thread_id: If not 0, the message thread identifier in which the draft was changed
+    :param draft_message: New draft message; pass null to remove the draft. All files in draft message content must be of the type inputFileLocal. Media thumbnails and captions are ignored
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setChatDraftMessage", init=False, repr=False)
+    chat_id: "int" = 0
+    message_thread_id: "int" = 0
+    draft_message: "DraftMessage | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_thread_id": self.message_thread_id,
+            "draft_message": self.draft_message._to_json_dict() if self.draft_message is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SetChatNotificationSettings(Function["Ok"]):
+    """
+    Changes the notification settings of a chat. Notification settings of a chat with the current user (Saved Messages) can't be changed
+
+    :param chat_id: Chat identifier
+    :param notification_settings: New notification settings for the chat. If the chat is muted for more than 366 days, it is considered to be muted forever
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setChatNotificationSettings", init=False, repr=False)
+    chat_id: "int" = 0
+    notification_settings: "ChatNotificationSettings | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "notification_settings": self.notification_settings._to_json_dict() if self.notification_settings is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleChatHasProtectedContent(Function["Ok"]):
+    """
+    Changes the ability of users to save, forward, or copy chat content. Supported only for basic groups, supergroups and channels. Requires owner privileges
+
+    :param chat_id: Chat identifier
+    :param has_protected_content: New value of has_protected_content
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleChatHasProtectedContent", init=False, repr=False)
+    chat_id: "int" = 0
+    has_protected_content: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "has_protected_content": self.has_protected_content,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleChatViewAsTopics(Function["Ok"]):
+    """
+    Changes the view_as_topics setting of a forum chat or Saved Messages
+
+    :param chat_id: Chat identifier
+    :param view_as_topics: New value of view_as_topics
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleChatViewAsTopics", init=False, repr=False)
+    chat_id: "int" = 0
+    view_as_topics: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "view_as_topics": self.view_as_topics,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleChatIsTranslatable(Function["Ok"]):
+    """
+    Changes the translatable state of a chat
+
+    :param chat_id: Chat identifier
+    :param is_translatable: New value of is_translatable
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleChatIsTranslatable", init=False, repr=False)
+    chat_id: "int" = 0
+    is_translatable: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "is_translatable": self.is_translatable,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleChatIsMarkedAsUnread(Function["Ok"]):
+    """
+    Changes the marked as unread state of a chat
+
+    :param chat_id: Chat identifier
+    :param is_marked_as_unread: New value of is_marked_as_unread
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleChatIsMarkedAsUnread", init=False, repr=False)
+    chat_id: "int" = 0
+    is_marked_as_unread: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "is_marked_as_unread": self.is_marked_as_unread,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleChatDefaultDisableNotification(Function["Ok"]):
+    """
+    Changes the value of the default disable_notification parameter, used when a message is sent to a chat
+
+    :param chat_id: Chat identifier
+    :param default_disable_notification: New value of default_disable_notification
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleChatDefaultDisableNotification", init=False, repr=False)
+    chat_id: "int" = 0
+    default_disable_notification: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "default_disable_notification": self.default_disable_notification,
+        }
+
+
+
+@dataclass(slots=True)
+class SetChatAvailableReactions(Function["Ok"]):
+    """
+    Changes reactions, available in a chat. Available for basic groups, supergroups, and channels. Requires can_change_info member right
+
+    :param chat_id: Identifier of the chat
+    :param available_reactions: Reactions available in the chat. All explicitly specified emoji reactions must be active. In channel chats up to the chat's boost level custom emoji reactions can be explicitly specified
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setChatAvailableReactions", init=False, repr=False)
+    chat_id: "int" = 0
+    available_reactions: "ChatAvailableReactions | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "available_reactions": self.available_reactions._to_json_dict() if self.available_reactions is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SetChatClientData(Function["Ok"]):
+    """
+    Changes application-specific data associated with a chat
+
+    :param chat_id: Chat identifier
+    :param client_data: New value of client_data
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setChatClientData", init=False, repr=False)
+    chat_id: "int" = 0
+    client_data: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "client_data": self.client_data,
+        }
+
+
+
+@dataclass(slots=True)
+class SetChatDescription(Function["Ok"]):
+    """
+    Changes information about a chat. Available for basic groups, supergroups, and channels. Requires can_change_info member right
+
+    :param chat_id: Identifier of the chat
+    :param description: Changes information about a chat. Available for basic groups, supergroups, and channels. Requires can_change_info member right
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setChatDescription", init=False, repr=False)
+    chat_id: "int" = 0
+    description: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "description": self.description,
+        }
+
+
+
+@dataclass(slots=True)
+class SetChatDiscussionGroup(Function["Ok"]):
+    """
+    Changes the discussion group of a channel chat; requires can_change_info administrator right in the channel if it is specified
+
+    :param chat_id: Identifier of the channel chat. Pass 0 to remove a link from the supergroup passed in the second argument to a linked channel chat (requires can_pin_messages member right in the supergroup)
+    :param discussion_chat_id: Identifier of a new channel's discussion group. Use 0 to remove the discussion group. Use the method getSuitableDiscussionChats to find all suitable groups.
+     Basic group chats must be first upgraded to supergroup chats. If new chat members don't have access to old messages in the supergroup, then toggleSupergroupIsAllHistoryAvailable must be used first to change that
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setChatDiscussionGroup", init=False, repr=False)
+    chat_id: "int" = 0
+    discussion_chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "discussion_chat_id": self.discussion_chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SetChatDirectMessagesGroup(Function["Ok"]):
+    """
+    Changes direct messages group settings for a channel chat; requires owner privileges in the chat
+
+    :param chat_id: Identifier of the channel chat
+    :param is_enabled: Pass true if the direct messages group is enabled for the channel chat; pass false otherwise
+    :param paid_message_star_count: The new number of Telegram Stars that must be paid for each message that is sent to the direct messages chat unless the sender is an administrator of the channel chat; 0-getOption("paid_message_star_count_max").
+     The channel will receive getOption("paid_message_earnings_per_mille") Telegram Stars for each 1000 Telegram Stars paid for message sending. Requires supergroupFullInfo.can_enable_paid_messages for positive amounts
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setChatDirectMessagesGroup", init=False, repr=False)
+    chat_id: "int" = 0
+    is_enabled: "bool" = False
+    paid_message_star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "is_enabled": self.is_enabled,
+            "paid_message_star_count": self.paid_message_star_count,
+        }
+
+
+
+@dataclass(slots=True)
+class SetChatLocation(Function["Ok"]):
+    """
+    Changes the location of a chat. Available only for some location-based supergroups, use supergroupFullInfo.can_set_location to check whether the method is allowed to use
+
+    :param chat_id: Chat identifier
+    :param location: New location for the chat; must be valid and not null
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setChatLocation", init=False, repr=False)
+    chat_id: "int" = 0
+    location: "ChatLocation | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "location": self.location._to_json_dict() if self.location is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SetChatSlowModeDelay(Function["Ok"]):
+    """
+    Changes the slow mode delay of a chat. Available only for supergroups; requires can_restrict_members right
+
+    :param chat_id: Chat identifier
+    :param slow_mode_delay: New slow mode delay for the chat, in seconds; must be one of 0, 10, 30, 60, 300, 900, 3600
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setChatSlowModeDelay", init=False, repr=False)
+    chat_id: "int" = 0
+    slow_mode_delay: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "slow_mode_delay": self.slow_mode_delay,
+        }
+
+
+
+@dataclass(slots=True)
+class PinChatMessage(Function["Ok"]):
+    """
+    Pins a message in a chat. A message can be pinned only if messageProperties.can_be_pinned
+
+    :param chat_id: Identifier of the chat
+    :param message_id: Identifier of the new pinned message
+    :param disable_notification: Pass true to disable notification about the pinned message. Notifications are always disabled in channels and private chats
+    :param only_for_self: Pass true to pin the message only for self; private chats only
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="pinChatMessage", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    disable_notification: "bool" = False
+    only_for_self: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "disable_notification": self.disable_notification,
+            "only_for_self": self.only_for_self,
+        }
+
+
+
+@dataclass(slots=True)
+class UnpinChatMessage(Function["Ok"]):
+    """
+    Removes a pinned message from a chat; requires can_pin_messages member right if the chat is a basic group or supergroup, or can_edit_messages administrator right if the chat is a channel
+
+    :param chat_id: Identifier of the chat
+    :param message_id: Identifier of the removed pinned message
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="unpinChatMessage", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+
+
+@dataclass(slots=True)
+class UnpinAllChatMessages(Function["Ok"]):
+    """
+    Removes all pinned messages from a chat; requires can_pin_messages member right if the chat is a basic group or supergroup, or can_edit_messages administrator right if the chat is a channel
+
+    :param chat_id: Identifier of the chat
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="unpinAllChatMessages", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class UnpinAllMessageThreadMessages(Function["Ok"]):
+    """
+    Removes all pinned messages from a forum topic; requires can_pin_messages member right in the supergroup
+
+    :param chat_id: Identifier of the chat
+    :param message_thread_id: Message thread identifier in which messages will be unpinned
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="unpinAllMessageThreadMessages", init=False, repr=False)
+    chat_id: "int" = 0
+    message_thread_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_thread_id": self.message_thread_id,
+        }
+
+
+
+@dataclass(slots=True)
+class JoinChat(Function["Ok"]):
+    """
+    Adds the current user as a new member to a chat. Private and secret chats can't be joined using this method. May return an error with a message "INVITE_REQUEST_SENT" if only a join request was created
+
+    :param chat_id: Chat identifier
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="joinChat", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class LeaveChat(Function["Ok"]):
+    """
+    Removes the current user from chat members. Private and secret chats can't be left using this method
+
+    :param chat_id: Chat identifier
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="leaveChat", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class AddChatMember(Function["FailedToAddMembers"]):
+    """
+    Adds a new member to a chat; requires can_invite_users member right. Members can't be added to private or secret chats. Returns information about members that weren't added
+
+    :param chat_id: Chat identifier
+    :param user_id: Identifier of the user
+    :param forward_limit: The number of earlier messages from the chat to be forwarded to the new member; up to 100. Ignored for supergroups and channels, or if the added user is a bot
+    :return: :class:`FailedToAddMembers`
+    """
+
+    _type: "str" = field(default="addChatMember", init=False, repr=False)
+    chat_id: "int" = 0
+    user_id: "int" = 0
+    forward_limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "user_id": self.user_id,
+            "forward_limit": self.forward_limit,
+        }
+
+
+
+@dataclass(slots=True)
+class AddChatMembers(Function["FailedToAddMembers"]):
+    """
+    Adds multiple new members to a chat; requires can_invite_users member right. Currently, this method is only available for supergroups and channels. This method can't be used to join a chat. Members can't be added to a channel if it has more than 200 members. Returns information about members that weren't added
+
+    :param chat_id: Chat identifier
+    :param user_ids: Identifiers of the users to be added to the chat. The maximum number of added users is 20 for supergroups and 100 for channels
+    :return: :class:`FailedToAddMembers`
+    """
+
+    _type: "str" = field(default="addChatMembers", init=False, repr=False)
+    chat_id: "int" = 0
+    user_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "user_ids": self.user_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class SetChatMemberStatus(Function["Ok"]):
+    """
+    Changes the status of a chat member; requires can_invite_users member right to add a chat member, can_promote_members administrator right to change administrator rights of the member, and can_restrict_members administrator right to change restrictions of a user. This function is currently not suitable for transferring chat ownership; use transferChatOwnership instead.
+     Use addChatMember or banChatMember if some additional parameters needs to be passed
+
+    :param chat_id: Chat identifier
+    :param member_id: Member identifier. Chats can be only banned and unbanned in supergroups and channels
+    :param status: The new status of the member in the chat
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setChatMemberStatus", init=False, repr=False)
+    chat_id: "int" = 0
+    member_id: "MessageSender | None" = None
+    status: "ChatMemberStatus | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "member_id": self.member_id._to_json_dict() if self.member_id is not None else None,
+            "status": self.status._to_json_dict() if self.status is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class BanChatMember(Function["Ok"]):
+    """
+    Bans a member in a chat; requires can_restrict_members administrator right. Members can't be banned in private or secret chats. In supergroups and channels, the user will not be able to return to the group on their own using invite links, etc., unless unbanned first
+
+    :param chat_id: Chat identifier
+    :param member_id: Member identifier
+    :param banned_until_date: Point in time (Unix timestamp) when the user will be unbanned; 0 if never. If the user is banned for more than 366 days or for less than 30 seconds from the current time, the user is considered to be banned forever. Ignored in basic groups and if a chat is banned
+    :param revoke_messages: Pass true to delete all messages in the chat for the user that is being removed. Always true for supergroups and channels
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="banChatMember", init=False, repr=False)
+    chat_id: "int" = 0
+    member_id: "MessageSender | None" = None
+    banned_until_date: "int" = 0
+    revoke_messages: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "member_id": self.member_id._to_json_dict() if self.member_id is not None else None,
+            "banned_until_date": self.banned_until_date,
+            "revoke_messages": self.revoke_messages,
+        }
+
+
+
+@dataclass(slots=True)
+class CanTransferOwnership(Function["CanTransferOwnershipResult"]):
+    """
+    Checks whether the current session can be used to transfer a chat ownership to another user
+
+    :return: :class:`CanTransferOwnershipResult`
+    """
+
+    _type: "str" = field(default="canTransferOwnership", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class TransferChatOwnership(Function["Ok"]):
+    """
+    Changes the owner of a chat; requires owner privileges in the chat. Use the method canTransferOwnership to check whether the ownership can be transferred from the current session. Available only for supergroups and channel chats
+
+    :param chat_id: Chat identifier
+    :param user_id: Identifier of the user to which transfer the ownership. The ownership can't be transferred to a bot or to a deleted user
+    :param password: The 2-step verification password of the current user
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="transferChatOwnership", init=False, repr=False)
+    chat_id: "int" = 0
+    user_id: "int" = 0
+    password: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "user_id": self.user_id,
+            "password": self.password,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatMember(Function["ChatMember"]):
+    """
+    Returns information about a single member of a chat
+
+    :param chat_id: Chat identifier
+    :param member_id: Member identifier
+    :return: :class:`ChatMember`
+    """
+
+    _type: "str" = field(default="getChatMember", init=False, repr=False)
+    chat_id: "int" = 0
+    member_id: "MessageSender | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "member_id": self.member_id._to_json_dict() if self.member_id is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchChatMembers(Function["ChatMembers"]):
+    """
+    Searches for a specified query in the first name, last name and usernames of the members of a specified chat. Requires administrator rights if the chat is a channel
+
+    :param chat_id: Chat identifier
+    :param query: Query to search for
+    :param limit: The maximum number of users to be returned; up to 200
+    :param filter: The type of users to search for; pass null to search among all chat members
+    :return: :class:`ChatMembers`
+    """
+
+    _type: "str" = field(default="searchChatMembers", init=False, repr=False)
+    chat_id: "int" = 0
+    query: "str" = ""
+    limit: "int" = 0
+    filter: "ChatMembersFilter | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "query": self.query,
+            "limit": self.limit,
+            "filter": self.filter._to_json_dict() if self.filter is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatAdministrators(Function["ChatAdministrators"]):
+    """
+    Returns a list of administrators of the chat with their custom titles
+
+    :param chat_id: Chat identifier
+    :return: :class:`ChatAdministrators`
+    """
+
+    _type: "str" = field(default="getChatAdministrators", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ClearAllDraftMessages(Function["Ok"]):
+    """
+    Clears message drafts in all chats
+
+    :param exclude_secret_chats: Pass true to keep local message drafts in secret chats
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="clearAllDraftMessages", init=False, repr=False)
+    exclude_secret_chats: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "exclude_secret_chats": self.exclude_secret_chats,
+        }
+
+
+
+@dataclass(slots=True)
+class GetSavedNotificationSound(Function["NotificationSounds"]):
+    """
+    Returns saved notification sound by its identifier. Returns a 404 error if there is no saved notification sound with the specified identifier
+
+    :param notification_sound_id: Identifier of the notification sound
+    :return: :class:`NotificationSounds`
+    """
+
+    _type: "str" = field(default="getSavedNotificationSound", init=False, repr=False)
+    notification_sound_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "notification_sound_id": self.notification_sound_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetSavedNotificationSounds(Function["NotificationSounds"]):
+    """
+    Returns the list of saved notification sounds. If a sound isn't in the list, then default sound needs to be used
+
+    :return: :class:`NotificationSounds`
+    """
+
+    _type: "str" = field(default="getSavedNotificationSounds", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class AddSavedNotificationSound(Function["NotificationSound"]):
+    """
+    Adds a new notification sound to the list of saved notification sounds. The new notification sound is added to the top of the list. If it is already in the list, its position isn't changed
+
+    :param sound: Notification sound file to add
+    :return: :class:`NotificationSound`
+    """
+
+    _type: "str" = field(default="addSavedNotificationSound", init=False, repr=False)
+    sound: "InputFile | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sound": self.sound._to_json_dict() if self.sound is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class RemoveSavedNotificationSound(Function["Ok"]):
+    """
+    Removes a notification sound from the list of saved notification sounds
+
+    :param notification_sound_id: Identifier of the notification sound
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="removeSavedNotificationSound", init=False, repr=False)
+    notification_sound_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "notification_sound_id": self.notification_sound_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatNotificationSettingsExceptions(Function["Chats"]):
+    """
+    Returns the list of chats with non-default notification settings for new messages
+
+    :param scope: If specified, only chats from the scope will be returned; pass null to return chats from all scopes
+    :param compare_sound: Pass true to include in the response chats with only non-default sound
+    :return: :class:`Chats`
+    """
+
+    _type: "str" = field(default="getChatNotificationSettingsExceptions", init=False, repr=False)
+    scope: "NotificationSettingsScope | None" = None
+    compare_sound: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "scope": self.scope._to_json_dict() if self.scope is not None else None,
+            "compare_sound": self.compare_sound,
+        }
+
+
+
+@dataclass(slots=True)
+class GetScopeNotificationSettings(Function["ScopeNotificationSettings"]):
+    """
+    Returns the notification settings for chats of a given type
+
+    :param scope: Types of chats for which to return the notification settings information
+    :return: :class:`ScopeNotificationSettings`
+    """
+
+    _type: "str" = field(default="getScopeNotificationSettings", init=False, repr=False)
+    scope: "NotificationSettingsScope | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "scope": self.scope._to_json_dict() if self.scope is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SetScopeNotificationSettings(Function["Ok"]):
+    """
+    Changes notification settings for chats of a given type
+
+    :param scope: Types of chats for which to change the notification settings
+    :param notification_settings: The new notification settings for the given scope
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setScopeNotificationSettings", init=False, repr=False)
+    scope: "NotificationSettingsScope | None" = None
+    notification_settings: "ScopeNotificationSettings | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "scope": self.scope._to_json_dict() if self.scope is not None else None,
+            "notification_settings": self.notification_settings._to_json_dict() if self.notification_settings is not None else None,
+        }
+
+
@@ -0,0 +1,1502 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import Error, File, FormattedText, InputFile, Ok
+    from .classes_01 import Location
+    from .classes_04 import EmojiStatusCustomEmojis, EmojiStatuses
+    from .classes_05 import ReactionType
+    from .classes_06 import ReactionNotificationSettings
+    from .classes_07 import ChatList, Chats
+    from .classes_13 import CurrentWeather
+    from .classes_14 import ChatActiveStories, ChatBoostFeatures, ChatBoostLevelFeatures, ChatBoostSlots, ChatBoostStatus, FoundChatBoosts, InputStoryAreas, InputStoryContent, PublicForwards, Stories, Story, StoryFullId, StoryInteractions, StoryList
+    from .classes_15 import AvailableReactions
+    from .classes_16 import AttachmentMenuBot
+    from .classes_19 import CanPostStoryResult
+    from .classes_20 import StoryPrivacySettings
+    from .classes_21 import ReportStoryResult
+    from .classes_22 import ChatBoostLink, ChatBoostLinkInfo, FileType
+    from .classes_23 import Data, FileDownloadedPrefixSize, Text
+
+
+@dataclass(slots=True)
+class SetReactionNotificationSettings(Function["Ok"]):
+    """
+    Changes notification settings for reactions
+
+    :param notification_settings: The new notification settings for reactions
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setReactionNotificationSettings", init=False, repr=False)
+    notification_settings: "ReactionNotificationSettings | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "notification_settings": self.notification_settings._to_json_dict() if self.notification_settings is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class ResetAllNotificationSettings(Function["Ok"]):
+    """
+    Resets all chat and scope notification settings to their default values. By default, all chats are unmuted and message previews are shown
+
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="resetAllNotificationSettings", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleChatIsPinned(Function["Ok"]):
+    """
+    Changes the pinned state of a chat. There can be up to getOption("pinned_chat_count_max")/getOption("pinned_archived_chat_count_max") pinned non-secret chats and the same number of secret chats in the main/archive chat list. The limit can be increased with Telegram Premium
+
+    :param chat_list: Chat list in which to change the pinned state of the chat
+    :param chat_id: Chat identifier
+    :param is_pinned: Pass true to pin the chat; pass false to unpin it
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleChatIsPinned", init=False, repr=False)
+    chat_list: "ChatList | None" = None
+    chat_id: "int" = 0
+    is_pinned: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_list": self.chat_list._to_json_dict() if self.chat_list is not None else None,
+            "chat_id": self.chat_id,
+            "is_pinned": self.is_pinned,
+        }
+
+
+
+@dataclass(slots=True)
+class SetPinnedChats(Function["Ok"]):
+    """
+    Changes the order of pinned chats
+
+    :param chat_list: Chat list in which to change the order of pinned chats
+    :param chat_ids: The new list of pinned chats
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setPinnedChats", init=False, repr=False)
+    chat_list: "ChatList | None" = None
+    chat_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_list": self.chat_list._to_json_dict() if self.chat_list is not None else None,
+            "chat_ids": self.chat_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class ReadChatList(Function["Ok"]):
+    """
+    Traverse all chats in a chat list and marks all messages in the chats as read
+
+    :param chat_list: Chat list in which to mark all chats as read
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="readChatList", init=False, repr=False)
+    chat_list: "ChatList | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_list": self.chat_list._to_json_dict() if self.chat_list is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetCurrentWeather(Function["CurrentWeather"]):
+    """
+    Returns the current weather in the given location
+
+    :param location: The location
+    :return: :class:`CurrentWeather`
+    """
+
+    _type: "str" = field(default="getCurrentWeather", init=False, repr=False)
+    location: "Location | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "location": self.location._to_json_dict() if self.location is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetStory(Function["Story"]):
+    """
+    Returns a story
+
+    :param story_poster_chat_id: Identifier of the chat that posted the story
+    :param story_id: Story identifier
+    :param only_local: Pass true to get only locally available information without sending network requests
+    :return: :class:`Story`
+    """
+
+    _type: "str" = field(default="getStory", init=False, repr=False)
+    story_poster_chat_id: "int" = 0
+    story_id: "int" = 0
+    only_local: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_poster_chat_id": self.story_poster_chat_id,
+            "story_id": self.story_id,
+            "only_local": self.only_local,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatsToPostStories(Function["Chats"]):
+    """
+    Returns supergroup and channel chats in which the current user has the right to post stories. The chats must be rechecked with canPostStory before actually trying to post a story there
+
+    :return: :class:`Chats`
+    """
+
+    _type: "str" = field(default="getChatsToPostStories", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class CanPostStory(Function["CanPostStoryResult"]):
+    """
+    Checks whether the current user can post a story on behalf of a chat; requires can_post_stories right for supergroup and channel chats
+
+    :param chat_id: Chat identifier. Pass Saved Messages chat identifier when posting a story on behalf of the current user
+    :return: :class:`CanPostStoryResult`
+    """
+
+    _type: "str" = field(default="canPostStory", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class PostStory(Function["Story"]):
+    """
+    Posts a new story on behalf of a chat; requires can_post_stories right for supergroup and channel chats. Returns a temporary story
+
+    :param chat_id: Identifier of the chat that will post the story. Pass Saved Messages chat identifier when posting a story on behalf of the current user
+    :param content: Content of the story
+    :param areas: Clickable rectangle areas to be shown on the story media; pass null if none
+    :param caption: Story caption; pass null to use an empty caption; 0-getOption("story_caption_length_max") characters; can have entities only if getOption("can_use_text_entities_in_story_caption")
+    :param privacy_settings: The privacy settings for the story; ignored for stories posted on behalf of supergroup and channel chats
+    :param active_period: Period after which the story is moved to archive, in seconds; must be one of 6 * 3600, 12 * 3600, 86400, or 2 * 86400 for Telegram Premium users, and 86400 otherwise
+    :param from_story_full_id: Full identifier of the original story, which content was used to create the story; pass null if the story isn't repost of another story
+    :param is_posted_to_chat_page: Pass true to keep the story accessible after expiration
+    :param protect_content: Pass true if the content of the story must be protected from forwarding and screenshotting
+    :return: :class:`Story`
+    """
+
+    _type: "str" = field(default="postStory", init=False, repr=False)
+    chat_id: "int" = 0
+    content: "InputStoryContent | None" = None
+    areas: "InputStoryAreas | None" = None
+    caption: "FormattedText | None" = None
+    privacy_settings: "StoryPrivacySettings | None" = None
+    active_period: "int" = 0
+    from_story_full_id: "StoryFullId | None" = None
+    is_posted_to_chat_page: "bool" = False
+    protect_content: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "content": self.content._to_json_dict() if self.content is not None else None,
+            "areas": self.areas._to_json_dict() if self.areas is not None else None,
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+            "privacy_settings": self.privacy_settings._to_json_dict() if self.privacy_settings is not None else None,
+            "active_period": self.active_period,
+            "from_story_full_id": self.from_story_full_id._to_json_dict() if self.from_story_full_id is not None else None,
+            "is_posted_to_chat_page": self.is_posted_to_chat_page,
+            "protect_content": self.protect_content,
+        }
+
+
+
+@dataclass(slots=True)
+class EditStory(Function["Ok"]):
+    """
+    Changes content and caption of a story. Can be called only if story.can_be_edited == true
+
+    :param story_poster_chat_id: Identifier of the chat that posted the story
+    :param story_id: Identifier of the story to edit
+    :param content: New content of the story; pass null to keep the current content
+    :param areas: New clickable rectangle areas to be shown on the story media; pass null to keep the current areas. Areas can't be edited if story content isn't changed
+    :param caption: New story caption; pass null to keep the current caption
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="editStory", init=False, repr=False)
+    story_poster_chat_id: "int" = 0
+    story_id: "int" = 0
+    content: "InputStoryContent | None" = None
+    areas: "InputStoryAreas | None" = None
+    caption: "FormattedText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_poster_chat_id": self.story_poster_chat_id,
+            "story_id": self.story_id,
+            "content": self.content._to_json_dict() if self.content is not None else None,
+            "areas": self.areas._to_json_dict() if self.areas is not None else None,
+            "caption": self.caption._to_json_dict() if self.caption is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class EditStoryCover(Function["Ok"]):
+    """
+    Changes cover of a video story. Can be called only if story.can_be_edited == true and the story isn't being edited now
+
+    :param story_poster_chat_id: Identifier of the chat that posted the story
+    :param story_id: Identifier of the story to edit
+    :param cover_frame_timestamp: New timestamp of the frame, which will be used as video thumbnail
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="editStoryCover", init=False, repr=False)
+    story_poster_chat_id: "int" = 0
+    story_id: "int" = 0
+    cover_frame_timestamp: "float" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_poster_chat_id": self.story_poster_chat_id,
+            "story_id": self.story_id,
+            "cover_frame_timestamp": self.cover_frame_timestamp,
+        }
+
+
+
+@dataclass(slots=True)
+class SetStoryPrivacySettings(Function["Ok"]):
+    """
+    Changes privacy settings of a story. The method can be called only for stories posted on behalf of the current user and if story.can_be_edited == true
+
+    :param story_id: Identifier of the story
+    :param privacy_settings: The new privacy settings for the story
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setStoryPrivacySettings", init=False, repr=False)
+    story_id: "int" = 0
+    privacy_settings: "StoryPrivacySettings | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_id": self.story_id,
+            "privacy_settings": self.privacy_settings._to_json_dict() if self.privacy_settings is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleStoryIsPostedToChatPage(Function["Ok"]):
+    """
+    Toggles whether a story is accessible after expiration. Can be called only if story.can_toggle_is_posted_to_chat_page == true
+
+    :param story_poster_chat_id: Identifier of the chat that posted the story
+    :param story_id: Identifier of the story
+    :param is_posted_to_chat_page: Pass true to make the story accessible after expiration; pass false to make it private
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleStoryIsPostedToChatPage", init=False, repr=False)
+    story_poster_chat_id: "int" = 0
+    story_id: "int" = 0
+    is_posted_to_chat_page: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_poster_chat_id": self.story_poster_chat_id,
+            "story_id": self.story_id,
+            "is_posted_to_chat_page": self.is_posted_to_chat_page,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteStory(Function["Ok"]):
+    """
+    Deletes a previously posted story. Can be called only if story.can_be_deleted == true
+
+    :param story_poster_chat_id: Identifier of the chat that posted the story
+    :param story_id: Identifier of the story to delete
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteStory", init=False, repr=False)
+    story_poster_chat_id: "int" = 0
+    story_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_poster_chat_id": self.story_poster_chat_id,
+            "story_id": self.story_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetStoryNotificationSettingsExceptions(Function["Chats"]):
+    """
+    Returns the list of chats with non-default notification settings for stories
+
+    :return: :class:`Chats`
+    """
+
+    _type: "str" = field(default="getStoryNotificationSettingsExceptions", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class LoadActiveStories(Function["Ok"]):
+    """
+    Loads more active stories from a story list. The loaded stories will be sent through updates. Active stories are sorted by the pair (active_stories.order, active_stories.story_poster_chat_id) in descending order. Returns a 404 error if all active stories have been loaded
+
+    :param story_list: The story list in which to load active stories
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="loadActiveStories", init=False, repr=False)
+    story_list: "StoryList | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_list": self.story_list._to_json_dict() if self.story_list is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SetChatActiveStoriesList(Function["Ok"]):
+    """
+    Changes story list in which stories from the chat are shown
+
+    :param chat_id: Identifier of the chat that posted stories
+    :param story_list: New list for active stories posted by the chat
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setChatActiveStoriesList", init=False, repr=False)
+    chat_id: "int" = 0
+    story_list: "StoryList | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "story_list": self.story_list._to_json_dict() if self.story_list is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatActiveStories(Function["ChatActiveStories"]):
+    """
+    Returns the list of active stories posted by the given chat
+
+    :param chat_id: Chat identifier
+    :return: :class:`ChatActiveStories`
+    """
+
+    _type: "str" = field(default="getChatActiveStories", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatPostedToChatPageStories(Function["Stories"]):
+    """
+    Returns the list of stories that posted by the given chat to its chat page. If from_story_id == 0, then pinned stories are returned first. Then, stories are returned in reverse chronological order (i.e., in order of decreasing story_id). For optimal performance, the number of returned stories is chosen by TDLib
+
+    :param chat_id: Chat identifier
+    :param from_story_id: Identifier of the story starting from which stories must be returned; use 0 to get results from pinned and the newest story
+    :param limit: The maximum number of stories to be returned.
+     For optimal performance, the number of returned stories is chosen by TDLib and can be smaller than the specified limit
+    :return: :class:`Stories`
+    """
+
+    _type: "str" = field(default="getChatPostedToChatPageStories", init=False, repr=False)
+    chat_id: "int" = 0
+    from_story_id: "int" = 0
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "from_story_id": self.from_story_id,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatArchivedStories(Function["Stories"]):
+    """
+    Returns the list of all stories posted by the given chat; requires can_edit_stories right in the chat. The stories are returned in reverse chronological order (i.e., in order of decreasing story_id). For optimal performance, the number of returned stories is chosen by TDLib
+
+    :param chat_id: Chat identifier
+    :param from_story_id: Identifier of the story starting from which stories must be returned; use 0 to get results from the last story
+    :param limit: The maximum number of stories to be returned.
+     For optimal performance, the number of returned stories is chosen by TDLib and can be smaller than the specified limit
+    :return: :class:`Stories`
+    """
+
+    _type: "str" = field(default="getChatArchivedStories", init=False, repr=False)
+    chat_id: "int" = 0
+    from_story_id: "int" = 0
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "from_story_id": self.from_story_id,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class SetChatPinnedStories(Function["Ok"]):
+    """
+    Changes the list of pinned stories on a chat page; requires can_edit_stories right in the chat
+
+    :param chat_id: Identifier of the chat that posted the stories
+    :param story_ids: New list of pinned stories. All stories must be posted to the chat page first. There can be up to getOption("pinned_story_count_max") pinned stories on a chat page
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setChatPinnedStories", init=False, repr=False)
+    chat_id: "int" = 0
+    story_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "story_ids": self.story_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class OpenStory(Function["Ok"]):
+    """
+    Informs TDLib that a story is opened and is being viewed by the user
+
+    :param story_poster_chat_id: The identifier of the chat that posted the opened story
+    :param story_id: The identifier of the story
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="openStory", init=False, repr=False)
+    story_poster_chat_id: "int" = 0
+    story_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_poster_chat_id": self.story_poster_chat_id,
+            "story_id": self.story_id,
+        }
+
+
+
+@dataclass(slots=True)
+class CloseStory(Function["Ok"]):
+    """
+    Informs TDLib that a story is closed by the user
+
+    :param story_poster_chat_id: The identifier of the poster of the story to close
+    :param story_id: The identifier of the story
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="closeStory", init=False, repr=False)
+    story_poster_chat_id: "int" = 0
+    story_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_poster_chat_id": self.story_poster_chat_id,
+            "story_id": self.story_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetStoryAvailableReactions(Function["AvailableReactions"]):
+    """
+    Returns reactions, which can be chosen for a story
+
+    :param row_size: Number of reaction per row, 5-25
+    :return: :class:`AvailableReactions`
+    """
+
+    _type: "str" = field(default="getStoryAvailableReactions", init=False, repr=False)
+    row_size: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "row_size": self.row_size,
+        }
+
+
+
+@dataclass(slots=True)
+class SetStoryReaction(Function["Ok"]):
+    """
+    Changes chosen reaction on a story that has already been sent
+
+    :param story_poster_chat_id: The identifier of the poster of the story
+    :param story_id: The identifier of the story
+    :param reaction_type: Type of the reaction to set; pass null to remove the reaction. Custom emoji reactions can be used only by Telegram Premium users. Paid reactions can't be set
+    :param update_recent_reactions: Pass true if the reaction needs to be added to recent reactions
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setStoryReaction", init=False, repr=False)
+    story_poster_chat_id: "int" = 0
+    story_id: "int" = 0
+    reaction_type: "ReactionType | None" = None
+    update_recent_reactions: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_poster_chat_id": self.story_poster_chat_id,
+            "story_id": self.story_id,
+            "reaction_type": self.reaction_type._to_json_dict() if self.reaction_type is not None else None,
+            "update_recent_reactions": self.update_recent_reactions,
+        }
+
+
+
+@dataclass(slots=True)
+class GetStoryInteractions(Function["StoryInteractions"]):
+    """
+    Returns interactions with a story. The method can be called only for stories posted on behalf of the current user
+
+    :param story_id: Story identifier
+    :param query: Query to search for in names, usernames and titles; may be empty to get all relevant interactions
+    :param only_contacts: Pass true to get only interactions by contacts; pass false to get all relevant interactions
+    :param prefer_forwards: Pass true to get forwards and reposts first, then reactions, then other views; pass false to get interactions sorted just by interaction date
+    :param prefer_with_reaction: Pass true to get interactions with reaction first; pass false to get interactions sorted just by interaction date. Ignored if prefer_forwards == true
+    :param offset: Offset of the first entry to return as received from the previous request; use empty string to get the first chunk of results
+    :param limit: The maximum number of story interactions to return
+    :return: :class:`StoryInteractions`
+    """
+
+    _type: "str" = field(default="getStoryInteractions", init=False, repr=False)
+    story_id: "int" = 0
+    query: "str" = ""
+    only_contacts: "bool" = False
+    prefer_forwards: "bool" = False
+    prefer_with_reaction: "bool" = False
+    offset: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_id": self.story_id,
+            "query": self.query,
+            "only_contacts": self.only_contacts,
+            "prefer_forwards": self.prefer_forwards,
+            "prefer_with_reaction": self.prefer_with_reaction,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatStoryInteractions(Function["StoryInteractions"]):
+    """
+    Returns interactions with a story posted in a chat. Can be used only if story is posted on behalf of a chat and the user is an administrator in the chat
+
+    :param story_poster_chat_id: The identifier of the poster of the story
+    :param story_id: Story identifier
+    :param reaction_type: Pass the default heart reaction or a suggested reaction type to receive only interactions with the specified reaction type; pass null to receive all interactions; reactionTypePaid isn't supported
+    :param prefer_forwards: Pass true to get forwards and reposts first, then reactions, then other views; pass false to get interactions sorted just by interaction date
+    :param offset: Offset of the first entry to return as received from the previous request; use empty string to get the first chunk of results
+    :param limit: The maximum number of story interactions to return
+    :return: :class:`StoryInteractions`
+    """
+
+    _type: "str" = field(default="getChatStoryInteractions", init=False, repr=False)
+    story_poster_chat_id: "int" = 0
+    story_id: "int" = 0
+    reaction_type: "ReactionType | None" = None
+    prefer_forwards: "bool" = False
+    offset: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_poster_chat_id": self.story_poster_chat_id,
+            "story_id": self.story_id,
+            "reaction_type": self.reaction_type._to_json_dict() if self.reaction_type is not None else None,
+            "prefer_forwards": self.prefer_forwards,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class ReportStory(Function["ReportStoryResult"]):
+    """
+    Reports a story to the Telegram moderators
+
+    :param story_poster_chat_id: The identifier of the poster of the story to report
+    :param story_id: The identifier of the story to report
+    :param option_id: Option identifier chosen by the user; leave empty for the initial request
+    :param text: Additional report details; 0-1024 characters; leave empty for the initial request
+    :return: :class:`ReportStoryResult`
+    """
+
+    _type: "str" = field(default="reportStory", init=False, repr=False)
+    story_poster_chat_id: "int" = 0
+    story_id: "int" = 0
+    option_id: "bytes" = b""
+    text: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_poster_chat_id": self.story_poster_chat_id,
+            "story_id": self.story_id,
+            "option_id": _bytes_to_json(self.option_id),
+            "text": self.text,
+        }
+
+
+
+@dataclass(slots=True)
+class ActivateStoryStealthMode(Function["Ok"]):
+    """
+    Activates stealth mode for stories, which hides all views of stories from the current user in the last "story_stealth_mode_past_period" seconds and for the next "story_stealth_mode_future_period" seconds; for Telegram Premium users only
+
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="activateStoryStealthMode", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetStoryPublicForwards(Function["PublicForwards"]):
+    """
+    Returns forwards of a story as a message to public chats and reposts by public channels. Can be used only if the story is posted on behalf of the current user or story.can_get_statistics == true. For optimal performance, the number of returned messages and stories is chosen by TDLib
+
+    :param story_poster_chat_id: The identifier of the poster of the story
+    :param story_id: The identifier of the story
+    :param offset: Offset of the first entry to return as received from the previous request; use empty string to get the first chunk of results
+    :param limit: The maximum number of messages and stories to be returned; must be positive and can't be greater than 100. For optimal performance, the number of returned objects is chosen by TDLib and can be smaller than the specified limit
+    :return: :class:`PublicForwards`
+    """
+
+    _type: "str" = field(default="getStoryPublicForwards", init=False, repr=False)
+    story_poster_chat_id: "int" = 0
+    story_id: "int" = 0
+    offset: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "story_poster_chat_id": self.story_poster_chat_id,
+            "story_id": self.story_id,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatBoostLevelFeatures(Function["ChatBoostLevelFeatures"]):
+    """
+    Returns the list of features available on the specific chat boost level. This is an offline method
+
+    :param is_channel: Pass true to get the list of features for channels; pass false to get the list of features for supergroups
+    :param level: Chat boost level
+    :return: :class:`ChatBoostLevelFeatures`
+    """
+
+    _type: "str" = field(default="getChatBoostLevelFeatures", init=False, repr=False)
+    is_channel: "bool" = False
+    level: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_channel": self.is_channel,
+            "level": self.level,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatBoostFeatures(Function["ChatBoostFeatures"]):
+    """
+    Returns the list of features available for different chat boost levels. This is an offline method
+
+    :param is_channel: Pass true to get the list of features for channels; pass false to get the list of features for supergroups
+    :return: :class:`ChatBoostFeatures`
+    """
+
+    _type: "str" = field(default="getChatBoostFeatures", init=False, repr=False)
+    is_channel: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_channel": self.is_channel,
+        }
+
+
+
+@dataclass(slots=True)
+class GetAvailableChatBoostSlots(Function["ChatBoostSlots"]):
+    """
+    Returns the list of available chat boost slots for the current user
+
+    :return: :class:`ChatBoostSlots`
+    """
+
+    _type: "str" = field(default="getAvailableChatBoostSlots", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatBoostStatus(Function["ChatBoostStatus"]):
+    """
+    Returns the current boost status for a supergroup or a channel chat
+
+    :param chat_id: Identifier of the chat
+    :return: :class:`ChatBoostStatus`
+    """
+
+    _type: "str" = field(default="getChatBoostStatus", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class BoostChat(Function["ChatBoostSlots"]):
+    """
+    Boosts a chat and returns the list of available chat boost slots for the current user after the boost
+
+    :param chat_id: Identifier of the chat
+    :param slot_ids: Identifiers of boost slots of the current user from which to apply boosts to the chat
+    :return: :class:`ChatBoostSlots`
+    """
+
+    _type: "str" = field(default="boostChat", init=False, repr=False)
+    chat_id: "int" = 0
+    slot_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "slot_ids": self.slot_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatBoostLink(Function["ChatBoostLink"]):
+    """
+    Returns an HTTPS link to boost the specified supergroup or channel chat
+
+    :param chat_id: Identifier of the chat
+    :return: :class:`ChatBoostLink`
+    """
+
+    _type: "str" = field(default="getChatBoostLink", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatBoostLinkInfo(Function["ChatBoostLinkInfo"]):
+    """
+    Returns information about a link to boost a chat. Can be called for any internal link of the type internalLinkTypeChatBoost
+
+    :param url: The link to boost a chat
+    :return: :class:`ChatBoostLinkInfo`
+    """
+
+    _type: "str" = field(default="getChatBoostLinkInfo", init=False, repr=False)
+    url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatBoosts(Function["FoundChatBoosts"]):
+    """
+    Returns the list of boosts applied to a chat; requires administrator rights in the chat
+
+    :param chat_id: Identifier of the chat
+    :param only_gift_codes: Pass true to receive only boosts received from gift codes and giveaways created by the chat
+    :param offset: Offset of the first entry to return as received from the previous request; use empty string to get the first chunk of results
+    :param limit: The maximum number of boosts to be returned; up to 100. For optimal performance, the number of returned boosts can be smaller than the specified limit
+    :return: :class:`FoundChatBoosts`
+    """
+
+    _type: "str" = field(default="getChatBoosts", init=False, repr=False)
+    chat_id: "int" = 0
+    only_gift_codes: "bool" = False
+    offset: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "only_gift_codes": self.only_gift_codes,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class GetUserChatBoosts(Function["FoundChatBoosts"]):
+    """
+    Returns the list of boosts applied to a chat by a given user; requires administrator rights in the chat; for bots only
+
+    :param chat_id: Identifier of the chat
+    :param user_id: Identifier of the user
+    :return: :class:`FoundChatBoosts`
+    """
+
+    _type: "str" = field(default="getUserChatBoosts", init=False, repr=False)
+    chat_id: "int" = 0
+    user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "user_id": self.user_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetAttachmentMenuBot(Function["AttachmentMenuBot"]):
+    """
+    Returns information about a bot that can be added to attachment or side menu
+
+    :param bot_user_id: Bot's user identifier
+    :return: :class:`AttachmentMenuBot`
+    """
+
+    _type: "str" = field(default="getAttachmentMenuBot", init=False, repr=False)
+    bot_user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleBotIsAddedToAttachmentMenu(Function["Ok"]):
+    """
+    Adds or removes a bot to attachment and side menu. Bot can be added to the menu, only if userTypeBot.can_be_added_to_attachment_menu == true
+
+    :param bot_user_id: Bot's user identifier
+    :param is_added: Pass true to add the bot to attachment menu; pass false to remove the bot from attachment menu
+    :param allow_write_access: Pass true if the current user allowed the bot to send them messages. Ignored if is_added is false
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleBotIsAddedToAttachmentMenu", init=False, repr=False)
+    bot_user_id: "int" = 0
+    is_added: "bool" = False
+    allow_write_access: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "is_added": self.is_added,
+            "allow_write_access": self.allow_write_access,
+        }
+
+
+
+@dataclass(slots=True)
+class GetThemedEmojiStatuses(Function["EmojiStatusCustomEmojis"]):
+    """
+    Returns up to 8 emoji statuses, which must be shown right after the default Premium Badge in the emoji status list for self status
+
+    :return: :class:`EmojiStatusCustomEmojis`
+    """
+
+    _type: "str" = field(default="getThemedEmojiStatuses", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetRecentEmojiStatuses(Function["EmojiStatuses"]):
+    """
+    Returns recent emoji statuses for self status
+
+    :return: :class:`EmojiStatuses`
+    """
+
+    _type: "str" = field(default="getRecentEmojiStatuses", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetUpgradedGiftEmojiStatuses(Function["EmojiStatuses"]):
+    """
+    Returns available upgraded gift emoji statuses for self status
+
+    :return: :class:`EmojiStatuses`
+    """
+
+    _type: "str" = field(default="getUpgradedGiftEmojiStatuses", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetDefaultEmojiStatuses(Function["EmojiStatusCustomEmojis"]):
+    """
+    Returns default emoji statuses for self status
+
+    :return: :class:`EmojiStatusCustomEmojis`
+    """
+
+    _type: "str" = field(default="getDefaultEmojiStatuses", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class ClearRecentEmojiStatuses(Function["Ok"]):
+    """
+    Clears the list of recently used emoji statuses for self status
+
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="clearRecentEmojiStatuses", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetThemedChatEmojiStatuses(Function["EmojiStatusCustomEmojis"]):
+    """
+    Returns up to 8 emoji statuses, which must be shown in the emoji status list for chats
+
+    :return: :class:`EmojiStatusCustomEmojis`
+    """
+
+    _type: "str" = field(default="getThemedChatEmojiStatuses", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetDefaultChatEmojiStatuses(Function["EmojiStatusCustomEmojis"]):
+    """
+    Returns default emoji statuses for chats
+
+    :return: :class:`EmojiStatusCustomEmojis`
+    """
+
+    _type: "str" = field(default="getDefaultChatEmojiStatuses", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetDisallowedChatEmojiStatuses(Function["EmojiStatusCustomEmojis"]):
+    """
+    Returns the list of emoji statuses, which can't be used as chat emoji status, even if they are from a sticker set with is_allowed_as_chat_emoji_status == true
+
+    :return: :class:`EmojiStatusCustomEmojis`
+    """
+
+    _type: "str" = field(default="getDisallowedChatEmojiStatuses", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class DownloadFile(Function["File"]):
+    """
+    Downloads a file from the cloud. Download progress and completion of the download will be notified through updateFile updates
+
+    :param file_id: Identifier of the file to download
+    :param priority: Priority of the download (1-32). The higher the priority, the earlier the file will be downloaded. If the priorities of two files are equal, then the last one for which downloadFile/addFileToDownloads was called will be downloaded first
+    :param offset: The starting position from which the file needs to be downloaded
+    :param limit: Number of bytes which need to be downloaded starting from the "offset" position before the download will automatically be canceled; use 0 to download without a limit
+    :param synchronous: Pass true to return response only after the file download has succeeded, has failed, has been canceled, or a new downloadFile request with different offset/limit parameters was sent; pass false to return file state immediately, just after the download has been started
+    :return: :class:`File`
+    """
+
+    _type: "str" = field(default="downloadFile", init=False, repr=False)
+    file_id: "int" = 0
+    priority: "int" = 0
+    offset: "int" = 0
+    limit: "int" = 0
+    synchronous: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_id": self.file_id,
+            "priority": self.priority,
+            "offset": self.offset,
+            "limit": self.limit,
+            "synchronous": self.synchronous,
+        }
+
+
+
+@dataclass(slots=True)
+class GetFileDownloadedPrefixSize(Function["FileDownloadedPrefixSize"]):
+    """
+    Returns file downloaded prefix size from a given offset, in bytes
+
+    :param file_id: Identifier of the file
+    :param offset: Offset from which downloaded prefix size needs to be calculated
+    :return: :class:`FileDownloadedPrefixSize`
+    """
+
+    _type: "str" = field(default="getFileDownloadedPrefixSize", init=False, repr=False)
+    file_id: "int" = 0
+    offset: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_id": self.file_id,
+            "offset": self.offset,
+        }
+
+
+
+@dataclass(slots=True)
+class CancelDownloadFile(Function["Ok"]):
+    """
+    Stops the downloading of a file. If a file has already been downloaded, does nothing
+
+    :param file_id: Identifier of a file to stop downloading
+    :param only_if_pending: Pass true to stop downloading only if it hasn't been started, i.e. request hasn't been sent to server
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="cancelDownloadFile", init=False, repr=False)
+    file_id: "int" = 0
+    only_if_pending: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_id": self.file_id,
+            "only_if_pending": self.only_if_pending,
+        }
+
+
+
+@dataclass(slots=True)
+class GetSuggestedFileName(Function["Text"]):
+    """
+    Returns suggested name for saving a file in a given directory
+
+    :param file_id: Identifier of the file
+    :param directory: Directory in which the file is expected to be saved
+    :return: :class:`Text`
+    """
+
+    _type: "str" = field(default="getSuggestedFileName", init=False, repr=False)
+    file_id: "int" = 0
+    directory: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_id": self.file_id,
+            "directory": self.directory,
+        }
+
+
+
+@dataclass(slots=True)
+class PreliminaryUploadFile(Function["File"]):
+    """
+    Preliminary uploads a file to the cloud before sending it in a message, which can be useful for uploading of being recorded voice and video notes. In all other cases there is no need to preliminary upload a file. Updates updateFile will be used to notify about upload progress.
+     The upload will not be completed until the file is sent in a message
+
+    :param file: File to upload
+    :param file_type: File type; pass null if unknown
+    :param priority: Priority of the upload (1-32). The higher the priority, the earlier the file will be uploaded. If the priorities of two files are equal, then the first one for which preliminaryUploadFile was called will be uploaded first
+    :return: :class:`File`
+    """
+
+    _type: "str" = field(default="preliminaryUploadFile", init=False, repr=False)
+    file: "InputFile | None" = None
+    file_type: "FileType | None" = None
+    priority: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file": self.file._to_json_dict() if self.file is not None else None,
+            "file_type": self.file_type._to_json_dict() if self.file_type is not None else None,
+            "priority": self.priority,
+        }
+
+
+
+@dataclass(slots=True)
+class CancelPreliminaryUploadFile(Function["Ok"]):
+    """
+    Stops the preliminary uploading of a file. Supported only for files uploaded by using preliminaryUploadFile
+
+    :param file_id: Identifier of the file to stop uploading
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="cancelPreliminaryUploadFile", init=False, repr=False)
+    file_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_id": self.file_id,
+        }
+
+
+
+@dataclass(slots=True)
+class WriteGeneratedFilePart(Function["Ok"]):
+    """
+    Writes a part of a generated file. This method is intended to be used only if the application has no direct access to TDLib's file system, because it is usually slower than a direct write to the destination file
+
+    :param generation_id: The identifier of the generation process
+    :param offset: The offset from which to write the data to the file
+    :param data: The data to write
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="writeGeneratedFilePart", init=False, repr=False)
+    generation_id: "int" = 0
+    offset: "int" = 0
+    data: "bytes" = b""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "generation_id": self.generation_id,
+            "offset": self.offset,
+            "data": _bytes_to_json(self.data),
+        }
+
+
+
+@dataclass(slots=True)
+class SetFileGenerationProgress(Function["Ok"]):
+    """
+    Informs TDLib on a file generation progress
+
+    :param generation_id: The identifier of the generation process
+    :param expected_size: Expected size of the generated file, in bytes; 0 if unknown
+    :param local_prefix_size: The number of bytes already generated
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setFileGenerationProgress", init=False, repr=False)
+    generation_id: "int" = 0
+    expected_size: "int" = 0
+    local_prefix_size: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "generation_id": self.generation_id,
+            "expected_size": self.expected_size,
+            "local_prefix_size": self.local_prefix_size,
+        }
+
+
+
+@dataclass(slots=True)
+class FinishFileGeneration(Function["Ok"]):
+    """
+    Finishes the file generation
+
+    :param generation_id: The identifier of the generation process
+    :param error: If passed, the file generation has failed and must be terminated; pass null if the file generation succeeded
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="finishFileGeneration", init=False, repr=False)
+    generation_id: "int" = 0
+    error: "Error | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "generation_id": self.generation_id,
+            "error": self.error._to_json_dict() if self.error is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class ReadFilePart(Function["Data"]):
+    """
+    Reads a part of a file from the TDLib file cache and returns read bytes. This method is intended to be used only if the application has no direct access to TDLib's file system, because it is usually slower than a direct read from the file
+
+    :param file_id: Identifier of the file. The file must be located in the TDLib file cache
+    :param offset: The offset from which to read the file
+    :param count: Number of bytes to read. An error will be returned if there are not enough bytes available in the file from the specified position. Pass 0 to read all available data from the specified position
+    :return: :class:`Data`
+    """
+
+    _type: "str" = field(default="readFilePart", init=False, repr=False)
+    file_id: "int" = 0
+    offset: "int" = 0
+    count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_id": self.file_id,
+            "offset": self.offset,
+            "count": self.count,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteFile(Function["Ok"]):
+    """
+    Deletes a file from the TDLib file cache
+
+    :param file_id: Identifier of the file to delete
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteFile", init=False, repr=False)
+    file_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_id": self.file_id,
+        }
+
+
+
+@dataclass(slots=True)
+class AddFileToDownloads(Function["File"]):
+    """
+    Adds a file from a message to the list of file downloads. Download progress and completion of the download will be notified through updateFile updates. If message database is used, the list of file downloads is persistent across application restarts. The downloading is independent of download using downloadFile, i.e. it continues if downloadFile is canceled or is used to download a part of the file
+
+    :param file_id: Identifier of the file to download
+    :param chat_id: Chat identifier of the message with the file
+    :param message_id: Message identifier
+    :param priority: Priority of the download (1-32). The higher the priority, the earlier the file will be downloaded. If the priorities of two files are equal, then the last one for which downloadFile/addFileToDownloads was called will be downloaded first
+    :return: :class:`File`
+    """
+
+    _type: "str" = field(default="addFileToDownloads", init=False, repr=False)
+    file_id: "int" = 0
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    priority: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_id": self.file_id,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "priority": self.priority,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleDownloadIsPaused(Function["Ok"]):
+    """
+    Changes pause state of a file in the file download list
+
+    :param file_id: Identifier of the downloaded file
+    :param is_paused: Pass true if the download is paused
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleDownloadIsPaused", init=False, repr=False)
+    file_id: "int" = 0
+    is_paused: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_id": self.file_id,
+            "is_paused": self.is_paused,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleAllDownloadsArePaused(Function["Ok"]):
+    """
+    Changes pause state of all files in the file download list
+
+    :param are_paused: Pass true to pause all downloads; pass false to unpause them
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleAllDownloadsArePaused", init=False, repr=False)
+    are_paused: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "are_paused": self.are_paused,
+        }
+
+
@@ -0,0 +1,1593 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import InputFile, Ok
+    from .classes_02 import StarSubscriptionPricing
+    from .classes_04 import ChatInviteLink
+    from .classes_05 import ChatInviteLinkCounts, ChatInviteLinkInfo, ChatInviteLinkMember, ChatInviteLinkMembers, ChatInviteLinks, ChatJoinRequest, ChatJoinRequests, MessageSender, MessageSenders
+    from .classes_06 import FoundFileDownloads, Message
+    from .classes_07 import Chat
+    from .classes_12 import MessageSendOptions
+    from .classes_14 import CallProtocol
+    from .classes_15 import CallId, CallProblem, GroupCall, GroupCallId, GroupCallInfo, GroupCallJoinParameters, InputGroupCall, InviteGroupCallParticipantResult, RtmpUrl
+    from .classes_16 import HttpUrl
+    from .classes_19 import MessageFileType
+    from .classes_23 import Text
+
+
+@dataclass(slots=True)
+class RemoveFileFromDownloads(Function["Ok"]):
+    """
+    Removes a file from the file download list
+
+    :param file_id: Identifier of the downloaded file
+    :param delete_from_cache: Pass true to delete the file from the TDLib file cache
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="removeFileFromDownloads", init=False, repr=False)
+    file_id: "int" = 0
+    delete_from_cache: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_id": self.file_id,
+            "delete_from_cache": self.delete_from_cache,
+        }
+
+
+
+@dataclass(slots=True)
+class RemoveAllFilesFromDownloads(Function["Ok"]):
+    """
+    Removes all files from the file download list
+
+    :param only_active: Pass true to remove only active downloads, including paused
+    :param only_completed: Pass true to remove only completed downloads
+    :param delete_from_cache: Pass true to delete the file from the TDLib file cache
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="removeAllFilesFromDownloads", init=False, repr=False)
+    only_active: "bool" = False
+    only_completed: "bool" = False
+    delete_from_cache: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "only_active": self.only_active,
+            "only_completed": self.only_completed,
+            "delete_from_cache": self.delete_from_cache,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchFileDownloads(Function["FoundFileDownloads"]):
+    """
+    Searches for files in the file download list or recently downloaded files from the list
+
+    :param query: Query to search for; may be empty to return all downloaded files
+    :param only_active: Pass true to search only for active downloads, including paused
+    :param only_completed: Pass true to search only for completed downloads
+    :param offset: Offset of the first entry to return as received from the previous request; use empty string to get the first chunk of results
+    :param limit: The maximum number of files to be returned
+    :return: :class:`FoundFileDownloads`
+    """
+
+    _type: "str" = field(default="searchFileDownloads", init=False, repr=False)
+    query: "str" = ""
+    only_active: "bool" = False
+    only_completed: "bool" = False
+    offset: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "query": self.query,
+            "only_active": self.only_active,
+            "only_completed": self.only_completed,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class SetApplicationVerificationToken(Function["Ok"]):
+    """
+    Application or reCAPTCHA verification has been completed. Can be called before authorization
+
+    :param verification_id: Unique identifier for the verification process as received from updateApplicationVerificationRequired or updateApplicationRecaptchaVerificationRequired
+    :param token: Play Integrity API token for the Android application, or secret from push notification for the iOS application for application verification, or reCAPTCHA token for reCAPTCHA verifications;
+     pass an empty string to abort verification and receive the error "VERIFICATION_FAILED" for the request
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setApplicationVerificationToken", init=False, repr=False)
+    verification_id: "int" = 0
+    token: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "verification_id": self.verification_id,
+            "token": self.token,
+        }
+
+
+
+@dataclass(slots=True)
+class GetMessageFileType(Function["MessageFileType"]):
+    """
+    Returns information about a file with messages exported from another application
+
+    :param message_file_head: Beginning of the message file; up to 100 first lines
+    :return: :class:`MessageFileType`
+    """
+
+    _type: "str" = field(default="getMessageFileType", init=False, repr=False)
+    message_file_head: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "message_file_head": self.message_file_head,
+        }
+
+
+
+@dataclass(slots=True)
+class GetMessageImportConfirmationText(Function["Text"]):
+    """
+    Returns a confirmation text to be shown to the user before starting message import
+
+    :param chat_id: Identifier of a chat to which the messages will be imported. It must be an identifier of a private chat with a mutual contact or an identifier of a supergroup chat with can_change_info member right
+    :return: :class:`Text`
+    """
+
+    _type: "str" = field(default="getMessageImportConfirmationText", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ImportMessages(Function["Ok"]):
+    """
+    Imports messages exported from another app
+
+    :param chat_id: Identifier of a chat to which the messages will be imported. It must be an identifier of a private chat with a mutual contact or an identifier of a supergroup chat with can_change_info member right
+    :param message_file: File with messages to import. Only inputFileLocal and inputFileGenerated are supported. The file must not be previously uploaded
+    :param attached_files: Files used in the imported messages. Only inputFileLocal and inputFileGenerated are supported. The files must not be previously uploaded
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="importMessages", init=False, repr=False)
+    chat_id: "int" = 0
+    message_file: "InputFile | None" = None
+    attached_files: "list[InputFile] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_file": self.message_file._to_json_dict() if self.message_file is not None else None,
+            "attached_files": _list_to_json(self.attached_files),
+        }
+
+
+
+@dataclass(slots=True)
+class ReplacePrimaryChatInviteLink(Function["ChatInviteLink"]):
+    """
+    Replaces current primary invite link for a chat with a new primary invite link. Available for basic groups, supergroups, and channels. Requires administrator privileges and can_invite_users right
+
+    :param chat_id: Chat identifier
+    :return: :class:`ChatInviteLink`
+    """
+
+    _type: "str" = field(default="replacePrimaryChatInviteLink", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class CreateChatInviteLink(Function["ChatInviteLink"]):
+    """
+    Creates a new invite link for a chat. Available for basic groups, supergroups, and channels. Requires administrator privileges and can_invite_users right in the chat
+
+    :param chat_id: Chat identifier
+    :param name: Invite link name; 0-32 characters
+    :param expiration_date: Point in time (Unix timestamp) when the link will expire; pass 0 if never
+    :param member_limit: The maximum number of chat members that can join the chat via the link simultaneously; 0-99999; pass 0 if not limited
+    :param creates_join_request: Pass true if users joining the chat via the link need to be approved by chat administrators. In this case, member_limit must be 0
+    :return: :class:`ChatInviteLink`
+    """
+
+    _type: "str" = field(default="createChatInviteLink", init=False, repr=False)
+    chat_id: "int" = 0
+    name: "str" = ""
+    expiration_date: "int" = 0
+    member_limit: "int" = 0
+    creates_join_request: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "name": self.name,
+            "expiration_date": self.expiration_date,
+            "member_limit": self.member_limit,
+            "creates_join_request": self.creates_join_request,
+        }
+
+
+
+@dataclass(slots=True)
+class CreateChatSubscriptionInviteLink(Function["ChatInviteLink"]):
+    """
+    Creates a new subscription invite link for a channel chat. Requires can_invite_users right in the chat
+
+    :param chat_id: Chat identifier
+    :param name: Invite link name; 0-32 characters
+    :param subscription_pricing: Information about subscription plan that will be applied to the users joining the chat via the link.
+     Subscription period must be 2592000 in production environment, and 60 or 300 if Telegram test environment is used
+    :return: :class:`ChatInviteLink`
+    """
+
+    _type: "str" = field(default="createChatSubscriptionInviteLink", init=False, repr=False)
+    chat_id: "int" = 0
+    name: "str" = ""
+    subscription_pricing: "StarSubscriptionPricing | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "name": self.name,
+            "subscription_pricing": self.subscription_pricing._to_json_dict() if self.subscription_pricing is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class EditChatInviteLink(Function["ChatInviteLink"]):
+    """
+    Edits a non-primary invite link for a chat. Available for basic groups, supergroups, and channels. If the link creates a subscription, then expiration_date, member_limit and creates_join_request must not be used.
+     Requires administrator privileges and can_invite_users right in the chat for own links and owner privileges for other links
+
+    :param chat_id: Chat identifier
+    :param invite_link: Invite link to be edited
+    :param name: Invite link name; 0-32 characters
+    :param expiration_date: Point in time (Unix timestamp) when the link will expire; pass 0 if never
+    :param member_limit: The maximum number of chat members that can join the chat via the link simultaneously; 0-99999; pass 0 if not limited
+    :param creates_join_request: Pass true if users joining the chat via the link need to be approved by chat administrators. In this case, member_limit must be 0
+    :return: :class:`ChatInviteLink`
+    """
+
+    _type: "str" = field(default="editChatInviteLink", init=False, repr=False)
+    chat_id: "int" = 0
+    invite_link: "str" = ""
+    name: "str" = ""
+    expiration_date: "int" = 0
+    member_limit: "int" = 0
+    creates_join_request: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "invite_link": self.invite_link,
+            "name": self.name,
+            "expiration_date": self.expiration_date,
+            "member_limit": self.member_limit,
+            "creates_join_request": self.creates_join_request,
+        }
+
+
+
+@dataclass(slots=True)
+class EditChatSubscriptionInviteLink(Function["ChatInviteLink"]):
+    """
+    Edits a subscription invite link for a channel chat. Requires can_invite_users right in the chat for own links and owner privileges for other links
+
+    :param chat_id: Chat identifier
+    :param invite_link: Invite link to be edited
+    :param name: Invite link name; 0-32 characters
+    :return: :class:`ChatInviteLink`
+    """
+
+    _type: "str" = field(default="editChatSubscriptionInviteLink", init=False, repr=False)
+    chat_id: "int" = 0
+    invite_link: "str" = ""
+    name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "invite_link": self.invite_link,
+            "name": self.name,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatInviteLink(Function["ChatInviteLink"]):
+    """
+    Returns information about an invite link. Requires administrator privileges and can_invite_users right in the chat to get own links and owner privileges to get other links
+
+    :param chat_id: Chat identifier
+    :param invite_link: Invite link to get
+    :return: :class:`ChatInviteLink`
+    """
+
+    _type: "str" = field(default="getChatInviteLink", init=False, repr=False)
+    chat_id: "int" = 0
+    invite_link: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "invite_link": self.invite_link,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatInviteLinkCounts(Function["ChatInviteLinkCounts"]):
+    """
+    Returns the list of chat administrators with number of their invite links. Requires owner privileges in the chat
+
+    :param chat_id: Chat identifier
+    :return: :class:`ChatInviteLinkCounts`
+    """
+
+    _type: "str" = field(default="getChatInviteLinkCounts", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatInviteLinks(Function["ChatInviteLinks"]):
+    """
+    Returns invite links for a chat created by specified administrator. Requires administrator privileges and can_invite_users right in the chat to get own links and owner privileges to get other links
+
+    :param chat_id: Chat identifier
+    :param creator_user_id: User identifier of a chat administrator. Must be an identifier of the current user for non-owner
+    :param is_revoked: Pass true if revoked links needs to be returned instead of active or expired
+    :param offset_date: Creation date of an invite link starting after which to return invite links; use 0 to get results from the beginning
+    :param offset_invite_link: Invite link starting after which to return invite links; use empty string to get results from the beginning
+    :param limit: The maximum number of invite links to return; up to 100
+    :return: :class:`ChatInviteLinks`
+    """
+
+    _type: "str" = field(default="getChatInviteLinks", init=False, repr=False)
+    chat_id: "int" = 0
+    creator_user_id: "int" = 0
+    is_revoked: "bool" = False
+    offset_date: "int" = 0
+    offset_invite_link: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "creator_user_id": self.creator_user_id,
+            "is_revoked": self.is_revoked,
+            "offset_date": self.offset_date,
+            "offset_invite_link": self.offset_invite_link,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatInviteLinkMembers(Function["ChatInviteLinkMembers"]):
+    """
+    Returns chat members joined a chat via an invite link. Requires administrator privileges and can_invite_users right in the chat for own links and owner privileges for other links
+
+    :param chat_id: Chat identifier
+    :param invite_link: Invite link for which to return chat members
+    :param only_with_expired_subscription: Pass true if the link is a subscription link and only members with expired subscription must be returned
+    :param offset_member: A chat member from which to return next chat members; pass null to get results from the beginning
+    :param limit: The maximum number of chat members to return; up to 100
+    :return: :class:`ChatInviteLinkMembers`
+    """
+
+    _type: "str" = field(default="getChatInviteLinkMembers", init=False, repr=False)
+    chat_id: "int" = 0
+    invite_link: "str" = ""
+    only_with_expired_subscription: "bool" = False
+    offset_member: "ChatInviteLinkMember | None" = None
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "invite_link": self.invite_link,
+            "only_with_expired_subscription": self.only_with_expired_subscription,
+            "offset_member": self.offset_member._to_json_dict() if self.offset_member is not None else None,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class RevokeChatInviteLink(Function["ChatInviteLinks"]):
+    """
+    Revokes invite link for a chat. Available for basic groups, supergroups, and channels. Requires administrator privileges and can_invite_users right in the chat for own links and owner privileges for other links. If a primary link is revoked, then additionally to the revoked link returns new primary link
+
+    :param chat_id: Chat identifier
+    :param invite_link: Invite link to be revoked
+    :return: :class:`ChatInviteLinks`
+    """
+
+    _type: "str" = field(default="revokeChatInviteLink", init=False, repr=False)
+    chat_id: "int" = 0
+    invite_link: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "invite_link": self.invite_link,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteRevokedChatInviteLink(Function["Ok"]):
+    """
+    Deletes revoked chat invite links. Requires administrator privileges and can_invite_users right in the chat for own links and owner privileges for other links
+
+    :param chat_id: Chat identifier
+    :param invite_link: Invite link to revoke
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteRevokedChatInviteLink", init=False, repr=False)
+    chat_id: "int" = 0
+    invite_link: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "invite_link": self.invite_link,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteAllRevokedChatInviteLinks(Function["Ok"]):
+    """
+    Deletes all revoked chat invite links created by a given chat administrator. Requires administrator privileges and can_invite_users right in the chat for own links and owner privileges for other links
+
+    :param chat_id: Chat identifier
+    :param creator_user_id: User identifier of a chat administrator, which links will be deleted. Must be an identifier of the current user for non-owner
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteAllRevokedChatInviteLinks", init=False, repr=False)
+    chat_id: "int" = 0
+    creator_user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "creator_user_id": self.creator_user_id,
+        }
+
+
+
+@dataclass(slots=True)
+class CheckChatInviteLink(Function["ChatInviteLinkInfo"]):
+    """
+    Checks the validity of an invite link for a chat and returns information about the corresponding chat
+
+    :param invite_link: Invite link to be checked
+    :return: :class:`ChatInviteLinkInfo`
+    """
+
+    _type: "str" = field(default="checkChatInviteLink", init=False, repr=False)
+    invite_link: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "invite_link": self.invite_link,
+        }
+
+
+
+@dataclass(slots=True)
+class JoinChatByInviteLink(Function["Chat"]):
+    """
+    Uses an invite link to add the current user to the chat if possible. May return an error with a message "INVITE_REQUEST_SENT" if only a join request was created
+
+    :param invite_link: Invite link to use
+    :return: :class:`Chat`
+    """
+
+    _type: "str" = field(default="joinChatByInviteLink", init=False, repr=False)
+    invite_link: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "invite_link": self.invite_link,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatJoinRequests(Function["ChatJoinRequests"]):
+    """
+    Returns pending join requests in a chat
+
+    :param chat_id: Chat identifier
+    :param invite_link: Invite link for which to return join requests. If empty, all join requests will be returned. Requires administrator privileges and can_invite_users right in the chat for own links and owner privileges for other links
+    :param query: A query to search for in the first names, last names and usernames of the users to return
+    :param offset_request: A chat join request from which to return next requests; pass null to get results from the beginning
+    :param limit: The maximum number of requests to join the chat to return
+    :return: :class:`ChatJoinRequests`
+    """
+
+    _type: "str" = field(default="getChatJoinRequests", init=False, repr=False)
+    chat_id: "int" = 0
+    invite_link: "str" = ""
+    query: "str" = ""
+    offset_request: "ChatJoinRequest | None" = None
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "invite_link": self.invite_link,
+            "query": self.query,
+            "offset_request": self.offset_request._to_json_dict() if self.offset_request is not None else None,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class ProcessChatJoinRequest(Function["Ok"]):
+    """
+    Handles a pending join request in a chat
+
+    :param chat_id: Chat identifier
+    :param user_id: Identifier of the user that sent the request
+    :param approve: Pass true to approve the request; pass false to decline it
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="processChatJoinRequest", init=False, repr=False)
+    chat_id: "int" = 0
+    user_id: "int" = 0
+    approve: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "user_id": self.user_id,
+            "approve": self.approve,
+        }
+
+
+
+@dataclass(slots=True)
+class ProcessChatJoinRequests(Function["Ok"]):
+    """
+    Handles all pending join requests for a given link in a chat
+
+    :param chat_id: Chat identifier
+    :param invite_link: Invite link for which to process join requests. If empty, all join requests will be processed. Requires administrator privileges and can_invite_users right in the chat for own links and owner privileges for other links
+    :param approve: Pass true to approve all requests; pass false to decline them
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="processChatJoinRequests", init=False, repr=False)
+    chat_id: "int" = 0
+    invite_link: "str" = ""
+    approve: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "invite_link": self.invite_link,
+            "approve": self.approve,
+        }
+
+
+
+@dataclass(slots=True)
+class ApproveSuggestedPost(Function["Ok"]):
+    """
+    Approves a suggested post in a channel direct messages chat
+
+    :param chat_id: Chat identifier of the channel direct messages chat
+    :param message_id: Identifier of the message with the suggested post. Use messageProperties.can_be_approved to check whether the suggested post can be approved
+    :param send_date: Point in time (Unix timestamp) when the post is expected to be published; pass 0 if the date has already been chosen
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="approveSuggestedPost", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    send_date: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "send_date": self.send_date,
+        }
+
+
+
+@dataclass(slots=True)
+class DeclineSuggestedPost(Function["Ok"]):
+    """
+    Declines a suggested post in a channel direct messages chat
+
+    :param chat_id: Chat identifier of the channel direct messages chat
+    :param message_id: Identifier of the message with the suggested post. Use messageProperties.can_be_declined to check whether the suggested post can be declined
+    :param comment: Comment for the creator of the suggested post; 0-128 characters
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="declineSuggestedPost", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    comment: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "comment": self.comment,
+        }
+
+
+
+@dataclass(slots=True)
+class AddOffer(Function["Message"]):
+    """
+    Sent a suggested post based on a previously sent message in a channel direct messages chat. Can be also used to suggest price or time change for an existing suggested post. Returns the sent message
+
+    :param chat_id: Identifier of the channel direct messages chat
+    :param message_id: Identifier of the message in the chat which will be sent as suggested post. Use messageProperties.can_add_offer to check whether an offer can be added
+     or messageProperties.can_edit_suggested_post_info to check whether price or time of sending of the post can be changed
+    :param options: Options to be used to send the message. New information about the suggested post must always be specified
+    :return: :class:`Message`
+    """
+
+    _type: "str" = field(default="addOffer", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    options: "MessageSendOptions | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "options": self.options._to_json_dict() if self.options is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class CreateCall(Function["CallId"]):
+    """
+    Creates a new call
+
+    :param user_id: Identifier of the user to be called
+    :param protocol: The call protocols supported by the application
+    :param is_video: Pass true to create a video call
+    :return: :class:`CallId`
+    """
+
+    _type: "str" = field(default="createCall", init=False, repr=False)
+    user_id: "int" = 0
+    protocol: "CallProtocol | None" = None
+    is_video: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "protocol": self.protocol._to_json_dict() if self.protocol is not None else None,
+            "is_video": self.is_video,
+        }
+
+
+
+@dataclass(slots=True)
+class AcceptCall(Function["Ok"]):
+    """
+    Accepts an incoming call
+
+    :param call_id: Call identifier
+    :param protocol: The call protocols supported by the application
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="acceptCall", init=False, repr=False)
+    call_id: "int" = 0
+    protocol: "CallProtocol | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "call_id": self.call_id,
+            "protocol": self.protocol._to_json_dict() if self.protocol is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SendCallSignalingData(Function["Ok"]):
+    """
+    Sends call signaling data
+
+    :param call_id: Call identifier
+    :param data: The data
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="sendCallSignalingData", init=False, repr=False)
+    call_id: "int" = 0
+    data: "bytes" = b""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "call_id": self.call_id,
+            "data": _bytes_to_json(self.data),
+        }
+
+
+
+@dataclass(slots=True)
+class DiscardCall(Function["Ok"]):
+    """
+    Discards a call
+
+    :param call_id: Call identifier
+    :param is_disconnected: Pass true if the user was disconnected
+    :param invite_link: If the call was upgraded to a group call, pass invite link to the group call
+    :param duration: The call duration, in seconds
+    :param is_video: Pass true if the call was a video call
+    :param connection_id: Identifier of the connection used during the call
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="discardCall", init=False, repr=False)
+    call_id: "int" = 0
+    is_disconnected: "bool" = False
+    invite_link: "str" = ""
+    duration: "int" = 0
+    is_video: "bool" = False
+    connection_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "call_id": self.call_id,
+            "is_disconnected": self.is_disconnected,
+            "invite_link": self.invite_link,
+            "duration": self.duration,
+            "is_video": self.is_video,
+            "connection_id": self.connection_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SendCallRating(Function["Ok"]):
+    """
+    Sends a call rating
+
+    :param call_id: Call identifier
+    :param rating: Call rating; 1-5
+    :param comment: An optional user comment if the rating is less than 5
+    :param problems: List of the exact types of problems with the call, specified by the user
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="sendCallRating", init=False, repr=False)
+    call_id: "int" = 0
+    rating: "int" = 0
+    comment: "str" = ""
+    problems: "list[CallProblem] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "call_id": self.call_id,
+            "rating": self.rating,
+            "comment": self.comment,
+            "problems": _list_to_json(self.problems),
+        }
+
+
+
+@dataclass(slots=True)
+class SendCallDebugInformation(Function["Ok"]):
+    """
+    Sends debug information for a call to Telegram servers
+
+    :param call_id: Call identifier
+    :param debug_information: Debug information in application-specific format
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="sendCallDebugInformation", init=False, repr=False)
+    call_id: "int" = 0
+    debug_information: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "call_id": self.call_id,
+            "debug_information": self.debug_information,
+        }
+
+
+
+@dataclass(slots=True)
+class SendCallLog(Function["Ok"]):
+    """
+    Sends log file for a call to Telegram servers
+
+    :param call_id: Call identifier
+    :param log_file: Call log file. Only inputFileLocal and inputFileGenerated are supported
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="sendCallLog", init=False, repr=False)
+    call_id: "int" = 0
+    log_file: "InputFile | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "call_id": self.call_id,
+            "log_file": self.log_file._to_json_dict() if self.log_file is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetVideoChatAvailableParticipants(Function["MessageSenders"]):
+    """
+    Returns the list of participant identifiers, on whose behalf a video chat in the chat can be joined
+
+    :param chat_id: Chat identifier
+    :return: :class:`MessageSenders`
+    """
+
+    _type: "str" = field(default="getVideoChatAvailableParticipants", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SetVideoChatDefaultParticipant(Function["Ok"]):
+    """
+    Changes default participant identifier, on whose behalf a video chat in the chat will be joined
+
+    :param chat_id: Chat identifier
+    :param default_participant_id: Default group call participant identifier to join the video chats
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setVideoChatDefaultParticipant", init=False, repr=False)
+    chat_id: "int" = 0
+    default_participant_id: "MessageSender | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "default_participant_id": self.default_participant_id._to_json_dict() if self.default_participant_id is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class CreateVideoChat(Function["GroupCallId"]):
+    """
+    Creates a video chat (a group call bound to a chat). Available only for basic groups, supergroups and channels; requires can_manage_video_chats administrator right
+
+    :param chat_id: Identifier of a chat in which the video chat will be created
+    :param title: Group call title; if empty, chat title will be used
+    :param start_date: Point in time (Unix timestamp) when the group call is expected to be started by an administrator; 0 to start the video chat immediately. The date must be at least 10 seconds and at most 8 days in the future
+    :param is_rtmp_stream: Pass true to create an RTMP stream instead of an ordinary video chat
+    :return: :class:`GroupCallId`
+    """
+
+    _type: "str" = field(default="createVideoChat", init=False, repr=False)
+    chat_id: "int" = 0
+    title: "str" = ""
+    start_date: "int" = 0
+    is_rtmp_stream: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "title": self.title,
+            "start_date": self.start_date,
+            "is_rtmp_stream": self.is_rtmp_stream,
+        }
+
+
+
+@dataclass(slots=True)
+class CreateGroupCall(Function["GroupCallInfo"]):
+    """
+    Creates a new group call that isn't bound to a chat
+
+    :param join_parameters: Parameters to join the call; pass null to only create call link without joining the call
+    :return: :class:`GroupCallInfo`
+    """
+
+    _type: "str" = field(default="createGroupCall", init=False, repr=False)
+    join_parameters: "GroupCallJoinParameters | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "join_parameters": self.join_parameters._to_json_dict() if self.join_parameters is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetVideoChatRtmpUrl(Function["RtmpUrl"]):
+    """
+    Returns RTMP URL for streaming to the video chat of a chat; requires can_manage_video_chats administrator right
+
+    :param chat_id: Chat identifier
+    :return: :class:`RtmpUrl`
+    """
+
+    _type: "str" = field(default="getVideoChatRtmpUrl", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ReplaceVideoChatRtmpUrl(Function["RtmpUrl"]):
+    """
+    Replaces the current RTMP URL for streaming to the video chat of a chat; requires owner privileges in the chat
+
+    :param chat_id: Chat identifier
+    :return: :class:`RtmpUrl`
+    """
+
+    _type: "str" = field(default="replaceVideoChatRtmpUrl", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetGroupCall(Function["GroupCall"]):
+    """
+    Returns information about a group call
+
+    :param group_call_id: Group call identifier
+    :return: :class:`GroupCall`
+    """
+
+    _type: "str" = field(default="getGroupCall", init=False, repr=False)
+    group_call_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+        }
+
+
+
+@dataclass(slots=True)
+class StartScheduledVideoChat(Function["Ok"]):
+    """
+    Starts a scheduled video chat
+
+    :param group_call_id: Group call identifier of the video chat
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="startScheduledVideoChat", init=False, repr=False)
+    group_call_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleVideoChatEnabledStartNotification(Function["Ok"]):
+    """
+    Toggles whether the current user will receive a notification when the video chat starts; for scheduled video chats only
+
+    :param group_call_id: Group call identifier
+    :param enabled_start_notification: New value of the enabled_start_notification setting
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleVideoChatEnabledStartNotification", init=False, repr=False)
+    group_call_id: "int" = 0
+    enabled_start_notification: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "enabled_start_notification": self.enabled_start_notification,
+        }
+
+
+
+@dataclass(slots=True)
+class JoinGroupCall(Function["GroupCallInfo"]):
+    """
+    Joins a group call that is not bound to a chat
+
+    :param input_group_call: The group call to join
+    :param join_parameters: Parameters to join the call
+    :return: :class:`GroupCallInfo`
+    """
+
+    _type: "str" = field(default="joinGroupCall", init=False, repr=False)
+    input_group_call: "InputGroupCall | None" = None
+    join_parameters: "GroupCallJoinParameters | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "input_group_call": self.input_group_call._to_json_dict() if self.input_group_call is not None else None,
+            "join_parameters": self.join_parameters._to_json_dict() if self.join_parameters is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class JoinVideoChat(Function["Text"]):
+    """
+    Joins an active video chat. Returns join response payload for tgcalls
+
+    :param group_call_id: Group call identifier
+    :param participant_id: Identifier of a group call participant, which will be used to join the call; pass null to join as self; video chats only
+    :param join_parameters: Parameters to join the call
+    :param invite_hash: Invite hash as received from internalLinkTypeVideoChat
+    :return: :class:`Text`
+    """
+
+    _type: "str" = field(default="joinVideoChat", init=False, repr=False)
+    group_call_id: "int" = 0
+    participant_id: "MessageSender | None" = None
+    join_parameters: "GroupCallJoinParameters | None" = None
+    invite_hash: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "participant_id": self.participant_id._to_json_dict() if self.participant_id is not None else None,
+            "join_parameters": self.join_parameters._to_json_dict() if self.join_parameters is not None else None,
+            "invite_hash": self.invite_hash,
+        }
+
+
+
+@dataclass(slots=True)
+class StartGroupCallScreenSharing(Function["Text"]):
+    """
+    Starts screen sharing in a joined group call. Returns join response payload for tgcalls
+
+    :param group_call_id: Group call identifier
+    :param audio_source_id: Screen sharing audio channel synchronization source identifier; received from tgcalls
+    :param payload: Group call join payload; received from tgcalls
+    :return: :class:`Text`
+    """
+
+    _type: "str" = field(default="startGroupCallScreenSharing", init=False, repr=False)
+    group_call_id: "int" = 0
+    audio_source_id: "int" = 0
+    payload: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "audio_source_id": self.audio_source_id,
+            "payload": self.payload,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleGroupCallScreenSharingIsPaused(Function["Ok"]):
+    """
+    Pauses or unpauses screen sharing in a joined group call
+
+    :param group_call_id: Group call identifier
+    :param is_paused: Pass true to pause screen sharing; pass false to unpause it
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleGroupCallScreenSharingIsPaused", init=False, repr=False)
+    group_call_id: "int" = 0
+    is_paused: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "is_paused": self.is_paused,
+        }
+
+
+
+@dataclass(slots=True)
+class EndGroupCallScreenSharing(Function["Ok"]):
+    """
+    Ends screen sharing in a joined group call
+
+    :param group_call_id: Group call identifier
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="endGroupCallScreenSharing", init=False, repr=False)
+    group_call_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SetVideoChatTitle(Function["Ok"]):
+    """
+    Sets title of a video chat; requires groupCall.can_be_managed right
+
+    :param group_call_id: Group call identifier
+    :param title: New group call title; 1-64 characters
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setVideoChatTitle", init=False, repr=False)
+    group_call_id: "int" = 0
+    title: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "title": self.title,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleVideoChatMuteNewParticipants(Function["Ok"]):
+    """
+    Toggles whether new participants of a video chat can be unmuted only by administrators of the video chat. Requires groupCall.can_toggle_mute_new_participants right
+
+    :param group_call_id: Group call identifier
+    :param mute_new_participants: New value of the mute_new_participants setting
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleVideoChatMuteNewParticipants", init=False, repr=False)
+    group_call_id: "int" = 0
+    mute_new_participants: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "mute_new_participants": self.mute_new_participants,
+        }
+
+
+
+@dataclass(slots=True)
+class InviteGroupCallParticipant(Function["InviteGroupCallParticipantResult"]):
+    """
+    Invites a user to an active group call; for group calls not bound to a chat only. Sends a service message of the type messageGroupCall. The group call can have at most getOption("group_call_participant_count_max") participants
+
+    :param group_call_id: Group call identifier
+    :param user_id: User identifier
+    :param is_video: Pass true if the group call is a video call
+    :return: :class:`InviteGroupCallParticipantResult`
+    """
+
+    _type: "str" = field(default="inviteGroupCallParticipant", init=False, repr=False)
+    group_call_id: "int" = 0
+    user_id: "int" = 0
+    is_video: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "user_id": self.user_id,
+            "is_video": self.is_video,
+        }
+
+
+
+@dataclass(slots=True)
+class DeclineGroupCallInvitation(Function["Ok"]):
+    """
+    Declines an invitation to an active group call via messageGroupCall. Can be called both by the sender and the receiver of the invitation
+
+    :param chat_id: Identifier of the chat with the message
+    :param message_id: Identifier of the message of the type messageGroupCall
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="declineGroupCallInvitation", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+
+
+@dataclass(slots=True)
+class BanGroupCallParticipants(Function["Ok"]):
+    """
+    Bans users from a group call not bound to a chat; requires groupCall.is_owned. Only the owner of the group call can invite the banned users back
+
+    :param group_call_id: Group call identifier
+    :param user_ids: Identifiers of group call participants to ban; identifiers of unknown users from the update updateGroupCallParticipants can be also passed to the method
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="banGroupCallParticipants", init=False, repr=False)
+    group_call_id: "int" = 0
+    user_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "user_ids": self.user_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class InviteVideoChatParticipants(Function["Ok"]):
+    """
+    Invites users to an active video chat. Sends a service message of the type messageInviteVideoChatParticipants to the chat bound to the group call
+
+    :param group_call_id: Group call identifier
+    :param user_ids: User identifiers. At most 10 users can be invited simultaneously
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="inviteVideoChatParticipants", init=False, repr=False)
+    group_call_id: "int" = 0
+    user_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "user_ids": self.user_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class GetVideoChatInviteLink(Function["HttpUrl"]):
+    """
+    Returns invite link to a video chat in a public chat
+
+    :param group_call_id: Group call identifier
+    :param can_self_unmute: Pass true if the invite link needs to contain an invite hash, passing which to joinVideoChat would allow the invited user to unmute themselves. Requires groupCall.can_be_managed right
+    :return: :class:`HttpUrl`
+    """
+
+    _type: "str" = field(default="getVideoChatInviteLink", init=False, repr=False)
+    group_call_id: "int" = 0
+    can_self_unmute: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "can_self_unmute": self.can_self_unmute,
+        }
+
+
+
+@dataclass(slots=True)
+class RevokeGroupCallInviteLink(Function["Ok"]):
+    """
+    Revokes invite link for a group call. Requires groupCall.can_be_managed right for video chats or groupCall.is_owned otherwise
+
+    :param group_call_id: Group call identifier
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="revokeGroupCallInviteLink", init=False, repr=False)
+    group_call_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+        }
+
+
+
+@dataclass(slots=True)
+class StartGroupCallRecording(Function["Ok"]):
+    """
+    Starts recording of an active group call; for video chats only. Requires groupCall.can_be_managed right
+
+    :param group_call_id: Group call identifier
+    :param title: Group call recording title; 0-64 characters
+    :param record_video: Pass true to record a video file instead of an audio file
+    :param use_portrait_orientation: Pass true to use portrait orientation for video instead of landscape one
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="startGroupCallRecording", init=False, repr=False)
+    group_call_id: "int" = 0
+    title: "str" = ""
+    record_video: "bool" = False
+    use_portrait_orientation: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "title": self.title,
+            "record_video": self.record_video,
+            "use_portrait_orientation": self.use_portrait_orientation,
+        }
+
+
+
+@dataclass(slots=True)
+class EndGroupCallRecording(Function["Ok"]):
+    """
+    Ends recording of an active group call; for video chats only. Requires groupCall.can_be_managed right
+
+    :param group_call_id: Group call identifier
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="endGroupCallRecording", init=False, repr=False)
+    group_call_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleGroupCallIsMyVideoPaused(Function["Ok"]):
+    """
+    Toggles whether current user's video is paused
+
+    :param group_call_id: Group call identifier
+    :param is_my_video_paused: Pass true if the current user's video is paused
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleGroupCallIsMyVideoPaused", init=False, repr=False)
+    group_call_id: "int" = 0
+    is_my_video_paused: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "is_my_video_paused": self.is_my_video_paused,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleGroupCallIsMyVideoEnabled(Function["Ok"]):
+    """
+    Toggles whether current user's video is enabled
+
+    :param group_call_id: Group call identifier
+    :param is_my_video_enabled: Pass true if the current user's video is enabled
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleGroupCallIsMyVideoEnabled", init=False, repr=False)
+    group_call_id: "int" = 0
+    is_my_video_enabled: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "is_my_video_enabled": self.is_my_video_enabled,
+        }
+
+
+
+@dataclass(slots=True)
+class SetGroupCallParticipantIsSpeaking(Function["MessageSender"]):
+    """
+    Informs TDLib that speaking state of a participant of an active group call has changed. Returns identifier of the participant if it is found
+
+    :param group_call_id: Group call identifier
+    :param audio_source: Group call participant's synchronization audio source identifier, or 0 for the current user
+    :param is_speaking: Pass true if the user is speaking
+    :return: :class:`MessageSender`
+    """
+
+    _type: "str" = field(default="setGroupCallParticipantIsSpeaking", init=False, repr=False)
+    group_call_id: "int" = 0
+    audio_source: "int" = 0
+    is_speaking: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "audio_source": self.audio_source,
+            "is_speaking": self.is_speaking,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleGroupCallParticipantIsMuted(Function["Ok"]):
+    """
+    Toggles whether a participant of an active group call is muted, unmuted, or allowed to unmute themselves
+
+    :param group_call_id: Group call identifier
+    :param participant_id: Participant identifier
+    :param is_muted: Pass true to mute the user; pass false to unmute them
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleGroupCallParticipantIsMuted", init=False, repr=False)
+    group_call_id: "int" = 0
+    participant_id: "MessageSender | None" = None
+    is_muted: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "participant_id": self.participant_id._to_json_dict() if self.participant_id is not None else None,
+            "is_muted": self.is_muted,
+        }
+
+
+
+@dataclass(slots=True)
+class SetGroupCallParticipantVolumeLevel(Function["Ok"]):
+    """
+    Changes volume level of a participant of an active group call. If the current user can manage the group call or is the owner of the group call, then the participant's volume level will be changed for all users with the default volume level
+
+    :param group_call_id: Group call identifier
+    :param participant_id: Participant identifier
+    :param volume_level: New participant's volume level; 1-20000 in hundreds of percents
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setGroupCallParticipantVolumeLevel", init=False, repr=False)
+    group_call_id: "int" = 0
+    participant_id: "MessageSender | None" = None
+    volume_level: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "participant_id": self.participant_id._to_json_dict() if self.participant_id is not None else None,
+            "volume_level": self.volume_level,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleGroupCallParticipantIsHandRaised(Function["Ok"]):
+    """
+    Toggles whether a group call participant hand is rased; for video chats only
+
+    :param group_call_id: Group call identifier
+    :param participant_id: Participant identifier
+    :param is_hand_raised: Pass true if the user's hand needs to be raised. Only self hand can be raised. Requires groupCall.can_be_managed right to lower other's hand
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleGroupCallParticipantIsHandRaised", init=False, repr=False)
+    group_call_id: "int" = 0
+    participant_id: "MessageSender | None" = None
+    is_hand_raised: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "participant_id": self.participant_id._to_json_dict() if self.participant_id is not None else None,
+            "is_hand_raised": self.is_hand_raised,
+        }
+
+
@@ -0,0 +1,1432 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import InputFile, Ok
+    from .classes_01 import AnimatedEmoji, Contact, Outline, StickerType
+    from .classes_02 import ChatPhotos, InputChatPhoto
+    from .classes_04 import EmojiStatus, User, Users
+    from .classes_05 import MessageSender, MessageSenders
+    from .classes_13 import EmojiCategories, EmojiCategoryType, EmojiKeywords, Emojis, StickerSet, StickerSets, Stickers, TrendingStickerSets
+    from .classes_15 import Animations, GroupCallDataChannel, GroupCallParticipants, GroupCallVideoQuality, ImportedContacts, InputGroupCall, VideoChatStreams
+    from .classes_16 import HttpUrl
+    from .classes_22 import BlockList
+    from .classes_23 import Count, Data, Text
+
+
+@dataclass(slots=True)
+class GetGroupCallParticipants(Function["GroupCallParticipants"]):
+    """
+    Returns information about participants of a non-joined group call that is not bound to a chat
+
+    :param input_group_call: The group call which participants will be returned
+    :param limit: The maximum number of participants to return; must be positive
+    :return: :class:`GroupCallParticipants`
+    """
+
+    _type: "str" = field(default="getGroupCallParticipants", init=False, repr=False)
+    input_group_call: "InputGroupCall | None" = None
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "input_group_call": self.input_group_call._to_json_dict() if self.input_group_call is not None else None,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class LoadGroupCallParticipants(Function["Ok"]):
+    """
+    Loads more participants of a group call. The loaded participants will be received through updates. Use the field groupCall.loaded_all_participants to check whether all participants have already been loaded
+
+    :param group_call_id: Group call identifier. The group call must be previously received through getGroupCall and must be joined or being joined
+    :param limit: The maximum number of participants to load; up to 100
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="loadGroupCallParticipants", init=False, repr=False)
+    group_call_id: "int" = 0
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class LeaveGroupCall(Function["Ok"]):
+    """
+    Leaves a group call
+
+    :param group_call_id: Group call identifier
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="leaveGroupCall", init=False, repr=False)
+    group_call_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+        }
+
+
+
+@dataclass(slots=True)
+class EndGroupCall(Function["Ok"]):
+    """
+    Ends a group call. Requires groupCall.can_be_managed right for video chats or groupCall.is_owned otherwise
+
+    :param group_call_id: Group call identifier
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="endGroupCall", init=False, repr=False)
+    group_call_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetVideoChatStreams(Function["VideoChatStreams"]):
+    """
+    Returns information about available video chat streams
+
+    :param group_call_id: Group call identifier
+    :return: :class:`VideoChatStreams`
+    """
+
+    _type: "str" = field(default="getVideoChatStreams", init=False, repr=False)
+    group_call_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetVideoChatStreamSegment(Function["Data"]):
+    """
+    Returns a file with a segment of a video chat stream in a modified OGG format for audio or MPEG-4 format for video
+
+    :param group_call_id: Group call identifier
+    :param time_offset: Point in time when the stream segment begins; Unix timestamp in milliseconds
+    :param scale: Segment duration scale; 0-1. Segment's duration is 1000/(2**scale) milliseconds
+    :param channel_id: Identifier of an audio/video channel to get as received from tgcalls
+    :param video_quality: Video quality as received from tgcalls; pass null to get the worst available quality
+    :return: :class:`Data`
+    """
+
+    _type: "str" = field(default="getVideoChatStreamSegment", init=False, repr=False)
+    group_call_id: "int" = 0
+    time_offset: "int" = 0
+    scale: "int" = 0
+    channel_id: "int" = 0
+    video_quality: "GroupCallVideoQuality | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "time_offset": self.time_offset,
+            "scale": self.scale,
+            "channel_id": self.channel_id,
+            "video_quality": self.video_quality._to_json_dict() if self.video_quality is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class EncryptGroupCallData(Function["Data"]):
+    """
+    Encrypts group call data before sending them over network using tgcalls
+
+    :param group_call_id: Group call identifier. The call must not be a video chat
+    :param data_channel: Data channel for which data is encrypted
+    :param data: Data to encrypt
+    :param unencrypted_prefix_size: Size of data prefix that must be kept unencrypted
+    :return: :class:`Data`
+    """
+
+    _type: "str" = field(default="encryptGroupCallData", init=False, repr=False)
+    group_call_id: "int" = 0
+    data_channel: "GroupCallDataChannel | None" = None
+    data: "bytes" = b""
+    unencrypted_prefix_size: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "data_channel": self.data_channel._to_json_dict() if self.data_channel is not None else None,
+            "data": _bytes_to_json(self.data),
+            "unencrypted_prefix_size": self.unencrypted_prefix_size,
+        }
+
+
+
+@dataclass(slots=True)
+class DecryptGroupCallData(Function["Data"]):
+    """
+    Decrypts group call data received by tgcalls
+
+    :param group_call_id: Group call identifier. The call must not be a video chat
+    :param participant_id: Identifier of the group call participant, which sent the data
+    :param data_channel: Data channel for which data was encrypted; pass null if unknown
+    :param data: Data to decrypt
+    :return: :class:`Data`
+    """
+
+    _type: "str" = field(default="decryptGroupCallData", init=False, repr=False)
+    group_call_id: "int" = 0
+    participant_id: "MessageSender | None" = None
+    data_channel: "GroupCallDataChannel | None" = None
+    data: "bytes" = b""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "group_call_id": self.group_call_id,
+            "participant_id": self.participant_id._to_json_dict() if self.participant_id is not None else None,
+            "data_channel": self.data_channel._to_json_dict() if self.data_channel is not None else None,
+            "data": _bytes_to_json(self.data),
+        }
+
+
+
+@dataclass(slots=True)
+class SetMessageSenderBlockList(Function["Ok"]):
+    """
+    Changes the block list of a message sender. Currently, only users and supergroup chats can be blocked
+
+    :param sender_id: Identifier of a message sender to block/unblock
+    :param block_list: New block list for the message sender; pass null to unblock the message sender
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setMessageSenderBlockList", init=False, repr=False)
+    sender_id: "MessageSender | None" = None
+    block_list: "BlockList | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sender_id": self.sender_id._to_json_dict() if self.sender_id is not None else None,
+            "block_list": self.block_list._to_json_dict() if self.block_list is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class BlockMessageSenderFromReplies(Function["Ok"]):
+    """
+    Blocks an original sender of a message in the Replies chat
+
+    :param message_id: The identifier of an incoming message in the Replies chat
+    :param delete_message: Pass true to delete the message
+    :param delete_all_messages: Pass true to delete all messages from the same sender
+    :param report_spam: Pass true to report the sender to the Telegram moderators
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="blockMessageSenderFromReplies", init=False, repr=False)
+    message_id: "int" = 0
+    delete_message: "bool" = False
+    delete_all_messages: "bool" = False
+    report_spam: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "message_id": self.message_id,
+            "delete_message": self.delete_message,
+            "delete_all_messages": self.delete_all_messages,
+            "report_spam": self.report_spam,
+        }
+
+
+
+@dataclass(slots=True)
+class GetBlockedMessageSenders(Function["MessageSenders"]):
+    """
+    Returns users and chats that were blocked by the current user
+
+    :param block_list: Block list from which to return users
+    :param offset: Number of users and chats to skip in the result; must be non-negative
+    :param limit: The maximum number of users and chats to return; up to 100
+    :return: :class:`MessageSenders`
+    """
+
+    _type: "str" = field(default="getBlockedMessageSenders", init=False, repr=False)
+    block_list: "BlockList | None" = None
+    offset: "int" = 0
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "block_list": self.block_list._to_json_dict() if self.block_list is not None else None,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class AddContact(Function["Ok"]):
+    """
+    Adds a user to the contact list or edits an existing contact by their user identifier
+
+    :param contact: The contact to add or edit; phone number may be empty and needs to be specified only if known, vCard is ignored
+    :param share_phone_number: Pass true to share the current user's phone number with the new contact. A corresponding rule to userPrivacySettingShowPhoneNumber will be added if needed.
+     Use the field userFullInfo.need_phone_number_privacy_exception to check whether the current user needs to be asked to share their phone number
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="addContact", init=False, repr=False)
+    contact: "Contact | None" = None
+    share_phone_number: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "contact": self.contact._to_json_dict() if self.contact is not None else None,
+            "share_phone_number": self.share_phone_number,
+        }
+
+
+
+@dataclass(slots=True)
+class ImportContacts(Function["ImportedContacts"]):
+    """
+    Adds new contacts or edits existing contacts by their phone numbers; contacts' user identifiers are ignored
+
+    :param contacts: The list of contacts to import or edit; contacts' vCard are ignored and are not imported
+    :return: :class:`ImportedContacts`
+    """
+
+    _type: "str" = field(default="importContacts", init=False, repr=False)
+    contacts: "list[Contact] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "contacts": _list_to_json(self.contacts),
+        }
+
+
+
+@dataclass(slots=True)
+class GetContacts(Function["Users"]):
+    """
+    Returns all contacts of the user
+
+    :return: :class:`Users`
+    """
+
+    _type: "str" = field(default="getContacts", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchContacts(Function["Users"]):
+    """
+    Searches for the specified query in the first names, last names and usernames of the known user contacts
+
+    :param query: Query to search for; may be empty to return all contacts
+    :param limit: The maximum number of users to be returned
+    :return: :class:`Users`
+    """
+
+    _type: "str" = field(default="searchContacts", init=False, repr=False)
+    query: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "query": self.query,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class RemoveContacts(Function["Ok"]):
+    """
+    Removes users from the contact list
+
+    :param user_ids: Identifiers of users to be deleted
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="removeContacts", init=False, repr=False)
+    user_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_ids": self.user_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class GetImportedContactCount(Function["Count"]):
+    """
+    Returns the total number of imported contacts
+
+    :return: :class:`Count`
+    """
+
+    _type: "str" = field(default="getImportedContactCount", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class ChangeImportedContacts(Function["ImportedContacts"]):
+    """
+    Changes imported contacts using the list of contacts saved on the device. Imports newly added contacts and, if at least the file database is enabled, deletes recently deleted contacts. Query result depends on the result of the previous query, so only one query is possible at the same time
+
+    :param contacts: The new list of contacts, contact's vCard are ignored and are not imported
+    :return: :class:`ImportedContacts`
+    """
+
+    _type: "str" = field(default="changeImportedContacts", init=False, repr=False)
+    contacts: "list[Contact] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "contacts": _list_to_json(self.contacts),
+        }
+
+
+
+@dataclass(slots=True)
+class ClearImportedContacts(Function["Ok"]):
+    """
+    Clears all imported contacts, contact list remains unchanged
+
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="clearImportedContacts", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class SetCloseFriends(Function["Ok"]):
+    """
+    Changes the list of close friends of the current user
+
+    :param user_ids: User identifiers of close friends; the users must be contacts of the current user
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setCloseFriends", init=False, repr=False)
+    user_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_ids": self.user_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class GetCloseFriends(Function["Users"]):
+    """
+    Returns all close friends of the current user
+
+    :return: :class:`Users`
+    """
+
+    _type: "str" = field(default="getCloseFriends", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class SetUserPersonalProfilePhoto(Function["Ok"]):
+    """
+    Changes a personal profile photo of a contact user
+
+    :param user_id: User identifier
+    :param photo: Profile photo to set; pass null to delete the photo; inputChatPhotoPrevious isn't supported in this function
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setUserPersonalProfilePhoto", init=False, repr=False)
+    user_id: "int" = 0
+    photo: "InputChatPhoto | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SuggestUserProfilePhoto(Function["Ok"]):
+    """
+    Suggests a profile photo to another regular user with common messages and allowing non-paid messages
+
+    :param user_id: User identifier
+    :param photo: Profile photo to suggest; inputChatPhotoPrevious isn't supported in this function
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="suggestUserProfilePhoto", init=False, repr=False)
+    user_id: "int" = 0
+    photo: "InputChatPhoto | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleBotCanManageEmojiStatus(Function["Ok"]):
+    """
+    Toggles whether the bot can manage emoji status of the current user
+
+    :param bot_user_id: User identifier of the bot
+    :param can_manage_emoji_status: Pass true if the bot is allowed to change emoji status of the user; pass false otherwise
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleBotCanManageEmojiStatus", init=False, repr=False)
+    bot_user_id: "int" = 0
+    can_manage_emoji_status: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "can_manage_emoji_status": self.can_manage_emoji_status,
+        }
+
+
+
+@dataclass(slots=True)
+class SetUserEmojiStatus(Function["Ok"]):
+    """
+    Changes the emoji status of a user; for bots only
+
+    :param user_id: Identifier of the user
+    :param emoji_status: New emoji status; pass null to switch to the default badge
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setUserEmojiStatus", init=False, repr=False)
+    user_id: "int" = 0
+    emoji_status: "EmojiStatus | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "emoji_status": self.emoji_status._to_json_dict() if self.emoji_status is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchUserByPhoneNumber(Function["User"]):
+    """
+    Searches a user by their phone number. Returns a 404 error if the user can't be found
+
+    :param phone_number: Phone number to search for
+    :param only_local: Pass true to get only locally available information without sending network requests
+    :return: :class:`User`
+    """
+
+    _type: "str" = field(default="searchUserByPhoneNumber", init=False, repr=False)
+    phone_number: "str" = ""
+    only_local: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "phone_number": self.phone_number,
+            "only_local": self.only_local,
+        }
+
+
+
+@dataclass(slots=True)
+class SharePhoneNumber(Function["Ok"]):
+    """
+    Shares the phone number of the current user with a mutual contact. Supposed to be called when the user clicks on chatActionBarSharePhoneNumber
+
+    :param user_id: Identifier of the user with whom to share the phone number. The user must be a mutual contact
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="sharePhoneNumber", init=False, repr=False)
+    user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetUserProfilePhotos(Function["ChatPhotos"]):
+    """
+    Returns the profile photos of a user. Personal and public photo aren't returned
+
+    :param user_id: User identifier
+    :param offset: The number of photos to skip; must be non-negative
+    :param limit: The maximum number of photos to be returned; up to 100
+    :return: :class:`ChatPhotos`
+    """
+
+    _type: "str" = field(default="getUserProfilePhotos", init=False, repr=False)
+    user_id: "int" = 0
+    offset: "int" = 0
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class GetStickerOutline(Function["Outline"]):
+    """
+    Returns outline of a sticker. This is an offline method. Returns a 404 error if the outline isn't known
+
+    :param sticker_file_id: File identifier of the sticker
+    :param for_animated_emoji: Pass true to get the outline scaled for animated emoji
+    :param for_clicked_animated_emoji_message: Pass true to get the outline scaled for clicked animated emoji message
+    :return: :class:`Outline`
+    """
+
+    _type: "str" = field(default="getStickerOutline", init=False, repr=False)
+    sticker_file_id: "int" = 0
+    for_animated_emoji: "bool" = False
+    for_clicked_animated_emoji_message: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker_file_id": self.sticker_file_id,
+            "for_animated_emoji": self.for_animated_emoji,
+            "for_clicked_animated_emoji_message": self.for_clicked_animated_emoji_message,
+        }
+
+
+
+@dataclass(slots=True)
+class GetStickers(Function["Stickers"]):
+    """
+    Returns stickers from the installed sticker sets that correspond to any of the given emoji or can be found by sticker-specific keywords. If the query is non-empty, then favorite, recently used or trending stickers may also be returned
+
+    :param sticker_type: Type of the stickers to return
+    :param query: Search query; a space-separated list of emojis or a keyword prefix. If empty, returns all known installed stickers
+    :param limit: The maximum number of stickers to be returned
+    :param chat_id: Chat identifier for which to return stickers. Available custom emoji stickers may be different for different chats
+    :return: :class:`Stickers`
+    """
+
+    _type: "str" = field(default="getStickers", init=False, repr=False)
+    sticker_type: "StickerType | None" = None
+    query: "str" = ""
+    limit: "int" = 0
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker_type": self.sticker_type._to_json_dict() if self.sticker_type is not None else None,
+            "query": self.query,
+            "limit": self.limit,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetAllStickerEmojis(Function["Emojis"]):
+    """
+    Returns unique emoji that correspond to stickers to be found by the getStickers(sticker_type, query, 1000000, chat_id)
+
+    :param sticker_type: Type of the stickers to search for
+    :param query: Search query
+    :param chat_id: Chat identifier for which to find stickers
+    :param return_only_main_emoji: Pass true if only main emoji for each found sticker must be included in the result
+    :return: :class:`Emojis`
+    """
+
+    _type: "str" = field(default="getAllStickerEmojis", init=False, repr=False)
+    sticker_type: "StickerType | None" = None
+    query: "str" = ""
+    chat_id: "int" = 0
+    return_only_main_emoji: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker_type": self.sticker_type._to_json_dict() if self.sticker_type is not None else None,
+            "query": self.query,
+            "chat_id": self.chat_id,
+            "return_only_main_emoji": self.return_only_main_emoji,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchStickers(Function["Stickers"]):
+    """
+    Searches for stickers from public sticker sets that correspond to any of the given emoji
+
+    :param sticker_type: Type of the stickers to return
+    :param emojis: Space-separated list of emojis to search for
+    :param query: Query to search for; may be empty to search for emoji only
+    :param input_language_codes: List of possible IETF language tags of the user's input language; may be empty if unknown
+    :param offset: The offset from which to return the stickers; must be non-negative
+    :param limit: The maximum number of stickers to be returned; 0-100
+    :return: :class:`Stickers`
+    """
+
+    _type: "str" = field(default="searchStickers", init=False, repr=False)
+    sticker_type: "StickerType | None" = None
+    emojis: "str" = ""
+    query: "str" = ""
+    input_language_codes: "list[str] | None" = None
+    offset: "int" = 0
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker_type": self.sticker_type._to_json_dict() if self.sticker_type is not None else None,
+            "emojis": self.emojis,
+            "query": self.query,
+            "input_language_codes": self.input_language_codes,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class GetGreetingStickers(Function["Stickers"]):
+    """
+    Returns greeting stickers from regular sticker sets that can be used for the start page of other users
+
+    :return: :class:`Stickers`
+    """
+
+    _type: "str" = field(default="getGreetingStickers", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetPremiumStickers(Function["Stickers"]):
+    """
+    Returns premium stickers from regular sticker sets
+
+    :param limit: The maximum number of stickers to be returned; 0-100
+    :return: :class:`Stickers`
+    """
+
+    _type: "str" = field(default="getPremiumStickers", init=False, repr=False)
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class GetInstalledStickerSets(Function["StickerSets"]):
+    """
+    Returns a list of installed sticker sets
+
+    :param sticker_type: Type of the sticker sets to return
+    :return: :class:`StickerSets`
+    """
+
+    _type: "str" = field(default="getInstalledStickerSets", init=False, repr=False)
+    sticker_type: "StickerType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker_type": self.sticker_type._to_json_dict() if self.sticker_type is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetArchivedStickerSets(Function["StickerSets"]):
+    """
+    Returns a list of archived sticker sets
+
+    :param sticker_type: Type of the sticker sets to return
+    :param offset_sticker_set_id: Identifier of the sticker set from which to return the result; use 0 to get results from the beginning
+    :param limit: The maximum number of sticker sets to return; up to 100
+    :return: :class:`StickerSets`
+    """
+
+    _type: "str" = field(default="getArchivedStickerSets", init=False, repr=False)
+    sticker_type: "StickerType | None" = None
+    offset_sticker_set_id: "int" = 0
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker_type": self.sticker_type._to_json_dict() if self.sticker_type is not None else None,
+            "offset_sticker_set_id": self.offset_sticker_set_id,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class GetTrendingStickerSets(Function["TrendingStickerSets"]):
+    """
+    Returns a list of trending sticker sets. For optimal performance, the number of returned sticker sets is chosen by TDLib
+
+    :param sticker_type: Type of the sticker sets to return
+    :param offset: The offset from which to return the sticker sets; must be non-negative
+    :param limit: The maximum number of sticker sets to be returned; up to 100. For optimal performance, the number of returned sticker sets is chosen by TDLib and can be smaller than the specified limit, even if the end of the list has not been reached
+    :return: :class:`TrendingStickerSets`
+    """
+
+    _type: "str" = field(default="getTrendingStickerSets", init=False, repr=False)
+    sticker_type: "StickerType | None" = None
+    offset: "int" = 0
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker_type": self.sticker_type._to_json_dict() if self.sticker_type is not None else None,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class GetAttachedStickerSets(Function["StickerSets"]):
+    """
+    Returns a list of sticker sets attached to a file, including regular, mask, and emoji sticker sets. Currently, only animations, photos, and videos can have attached sticker sets
+
+    :param file_id: File identifier
+    :return: :class:`StickerSets`
+    """
+
+    _type: "str" = field(default="getAttachedStickerSets", init=False, repr=False)
+    file_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "file_id": self.file_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetStickerSet(Function["StickerSet"]):
+    """
+    Returns information about a sticker set by its identifier
+
+    :param set_id: Identifier of the sticker set
+    :return: :class:`StickerSet`
+    """
+
+    _type: "str" = field(default="getStickerSet", init=False, repr=False)
+    set_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "set_id": self.set_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetStickerSetName(Function["Text"]):
+    """
+    Returns name of a sticker set by its identifier
+
+    :param set_id: Identifier of the sticker set
+    :return: :class:`Text`
+    """
+
+    _type: "str" = field(default="getStickerSetName", init=False, repr=False)
+    set_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "set_id": self.set_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchStickerSet(Function["StickerSet"]):
+    """
+    Searches for a sticker set by its name
+
+    :param name: Name of the sticker set
+    :param ignore_cache: Pass true to ignore local cache of sticker sets and always send a network request
+    :return: :class:`StickerSet`
+    """
+
+    _type: "str" = field(default="searchStickerSet", init=False, repr=False)
+    name: "str" = ""
+    ignore_cache: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name,
+            "ignore_cache": self.ignore_cache,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchInstalledStickerSets(Function["StickerSets"]):
+    """
+    Searches for installed sticker sets by looking for specified query in their title and name
+
+    :param sticker_type: Type of the sticker sets to search for
+    :param query: Query to search for
+    :param limit: The maximum number of sticker sets to return
+    :return: :class:`StickerSets`
+    """
+
+    _type: "str" = field(default="searchInstalledStickerSets", init=False, repr=False)
+    sticker_type: "StickerType | None" = None
+    query: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker_type": self.sticker_type._to_json_dict() if self.sticker_type is not None else None,
+            "query": self.query,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchStickerSets(Function["StickerSets"]):
+    """
+    Searches for sticker sets by looking for specified query in their title and name. Excludes installed sticker sets from the results
+
+    :param sticker_type: Type of the sticker sets to return
+    :param query: Query to search for
+    :return: :class:`StickerSets`
+    """
+
+    _type: "str" = field(default="searchStickerSets", init=False, repr=False)
+    sticker_type: "StickerType | None" = None
+    query: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker_type": self.sticker_type._to_json_dict() if self.sticker_type is not None else None,
+            "query": self.query,
+        }
+
+
+
+@dataclass(slots=True)
+class ChangeStickerSet(Function["Ok"]):
+    """
+    Installs/uninstalls or activates/archives a sticker set
+
+    :param set_id: Identifier of the sticker set
+    :param is_installed: The new value of is_installed
+    :param is_archived: The new value of is_archived. A sticker set can't be installed and archived simultaneously
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="changeStickerSet", init=False, repr=False)
+    set_id: "int" = 0
+    is_installed: "bool" = False
+    is_archived: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "set_id": self.set_id,
+            "is_installed": self.is_installed,
+            "is_archived": self.is_archived,
+        }
+
+
+
+@dataclass(slots=True)
+class ViewTrendingStickerSets(Function["Ok"]):
+    """
+    Informs the server that some trending sticker sets have been viewed by the user
+
+    :param sticker_set_ids: Identifiers of viewed trending sticker sets
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="viewTrendingStickerSets", init=False, repr=False)
+    sticker_set_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker_set_ids": self.sticker_set_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class ReorderInstalledStickerSets(Function["Ok"]):
+    """
+    Changes the order of installed sticker sets
+
+    :param sticker_type: Type of the sticker sets to reorder
+    :param sticker_set_ids: Identifiers of installed sticker sets in the new correct order
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="reorderInstalledStickerSets", init=False, repr=False)
+    sticker_type: "StickerType | None" = None
+    sticker_set_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker_type": self.sticker_type._to_json_dict() if self.sticker_type is not None else None,
+            "sticker_set_ids": self.sticker_set_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class GetRecentStickers(Function["Stickers"]):
+    """
+    Returns a list of recently used stickers
+
+    :param is_attached: Pass true to return stickers and masks that were recently attached to photos or video files; pass false to return recently sent stickers
+    :return: :class:`Stickers`
+    """
+
+    _type: "str" = field(default="getRecentStickers", init=False, repr=False)
+    is_attached: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_attached": self.is_attached,
+        }
+
+
+
+@dataclass(slots=True)
+class AddRecentSticker(Function["Stickers"]):
+    """
+    Manually adds a new sticker to the list of recently used stickers. The new sticker is added to the top of the list. If the sticker was already in the list, it is removed from the list first. Only stickers belonging to a sticker set or in WEBP or WEBM format can be added to this list. Emoji stickers can't be added to recent stickers
+
+    :param is_attached: Pass true to add the sticker to the list of stickers recently attached to photo or video files; pass false to add the sticker to the list of recently sent stickers
+    :param sticker: Sticker file to add
+    :return: :class:`Stickers`
+    """
+
+    _type: "str" = field(default="addRecentSticker", init=False, repr=False)
+    is_attached: "bool" = False
+    sticker: "InputFile | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_attached": self.is_attached,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class RemoveRecentSticker(Function["Ok"]):
+    """
+    Removes a sticker from the list of recently used stickers
+
+    :param is_attached: Pass true to remove the sticker from the list of stickers recently attached to photo or video files; pass false to remove the sticker from the list of recently sent stickers
+    :param sticker: Sticker file to delete
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="removeRecentSticker", init=False, repr=False)
+    is_attached: "bool" = False
+    sticker: "InputFile | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_attached": self.is_attached,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class ClearRecentStickers(Function["Ok"]):
+    """
+    Clears the list of recently used stickers
+
+    :param is_attached: Pass true to clear the list of stickers recently attached to photo or video files; pass false to clear the list of recently sent stickers
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="clearRecentStickers", init=False, repr=False)
+    is_attached: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "is_attached": self.is_attached,
+        }
+
+
+
+@dataclass(slots=True)
+class GetFavoriteStickers(Function["Stickers"]):
+    """
+    Returns favorite stickers
+
+    :return: :class:`Stickers`
+    """
+
+    _type: "str" = field(default="getFavoriteStickers", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class AddFavoriteSticker(Function["Ok"]):
+    """
+    Adds a new sticker to the list of favorite stickers. The new sticker is added to the top of the list. If the sticker was already in the list, it is removed from the list first. Only stickers belonging to a sticker set or in WEBP or WEBM format can be added to this list. Emoji stickers can't be added to favorite stickers
+
+    :param sticker: Sticker file to add
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="addFavoriteSticker", init=False, repr=False)
+    sticker: "InputFile | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class RemoveFavoriteSticker(Function["Ok"]):
+    """
+    Removes a sticker from the list of favorite stickers
+
+    :param sticker: Sticker file to delete from the list
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="removeFavoriteSticker", init=False, repr=False)
+    sticker: "InputFile | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetStickerEmojis(Function["Emojis"]):
+    """
+    Returns emoji corresponding to a sticker. The list is only for informational purposes, because a sticker is always sent with a fixed emoji from the corresponding Sticker object
+
+    :param sticker: Sticker file identifier
+    :return: :class:`Emojis`
+    """
+
+    _type: "str" = field(default="getStickerEmojis", init=False, repr=False)
+    sticker: "InputFile | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchEmojis(Function["EmojiKeywords"]):
+    """
+    Searches for emojis by keywords. Supported only if the file database is enabled. Order of results is unspecified
+
+    :param text: Text to search for
+    :param input_language_codes: List of possible IETF language tags of the user's input language; may be empty if unknown
+    :return: :class:`EmojiKeywords`
+    """
+
+    _type: "str" = field(default="searchEmojis", init=False, repr=False)
+    text: "str" = ""
+    input_language_codes: "list[str] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text,
+            "input_language_codes": self.input_language_codes,
+        }
+
+
+
+@dataclass(slots=True)
+class GetKeywordEmojis(Function["Emojis"]):
+    """
+    Return emojis matching the keyword. Supported only if the file database is enabled. Order of results is unspecified
+
+    :param text: Text to search for
+    :param input_language_codes: List of possible IETF language tags of the user's input language; may be empty if unknown
+    :return: :class:`Emojis`
+    """
+
+    _type: "str" = field(default="getKeywordEmojis", init=False, repr=False)
+    text: "str" = ""
+    input_language_codes: "list[str] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text,
+            "input_language_codes": self.input_language_codes,
+        }
+
+
+
+@dataclass(slots=True)
+class GetEmojiCategories(Function["EmojiCategories"]):
+    """
+    Returns available emoji categories
+
+    :param type: Type of emoji categories to return; pass null to get default emoji categories
+    :return: :class:`EmojiCategories`
+    """
+
+    _type: "str" = field(default="getEmojiCategories", init=False, repr=False)
+    type: "EmojiCategoryType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetAnimatedEmoji(Function["AnimatedEmoji"]):
+    """
+    Returns an animated emoji corresponding to a given emoji. Returns a 404 error if the emoji has no animated emoji
+
+    :param emoji: The emoji
+    :return: :class:`AnimatedEmoji`
+    """
+
+    _type: "str" = field(default="getAnimatedEmoji", init=False, repr=False)
+    emoji: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "emoji": self.emoji,
+        }
+
+
+
+@dataclass(slots=True)
+class GetEmojiSuggestionsUrl(Function["HttpUrl"]):
+    """
+    Returns an HTTP URL which can be used to automatically log in to the translation platform and suggest new emoji replacements. The URL will be valid for 30 seconds after generation
+
+    :param language_code: Language code for which the emoji replacements will be suggested
+    :return: :class:`HttpUrl`
+    """
+
+    _type: "str" = field(default="getEmojiSuggestionsUrl", init=False, repr=False)
+    language_code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "language_code": self.language_code,
+        }
+
+
+
+@dataclass(slots=True)
+class GetCustomEmojiStickers(Function["Stickers"]):
+    """
+    Returns the list of custom emoji stickers by their identifiers. Stickers are returned in arbitrary order. Only found stickers are returned
+
+    :param custom_emoji_ids: Identifiers of custom emoji stickers. At most 200 custom emoji stickers can be received simultaneously
+    :return: :class:`Stickers`
+    """
+
+    _type: "str" = field(default="getCustomEmojiStickers", init=False, repr=False)
+    custom_emoji_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "custom_emoji_ids": self.custom_emoji_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class GetDefaultChatPhotoCustomEmojiStickers(Function["Stickers"]):
+    """
+    Returns default list of custom emoji stickers for placing on a chat photo
+
+    :return: :class:`Stickers`
+    """
+
+    _type: "str" = field(default="getDefaultChatPhotoCustomEmojiStickers", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetDefaultProfilePhotoCustomEmojiStickers(Function["Stickers"]):
+    """
+    Returns default list of custom emoji stickers for placing on a profile photo
+
+    :return: :class:`Stickers`
+    """
+
+    _type: "str" = field(default="getDefaultProfilePhotoCustomEmojiStickers", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetDefaultBackgroundCustomEmojiStickers(Function["Stickers"]):
+    """
+    Returns default list of custom emoji stickers for reply background
+
+    :return: :class:`Stickers`
+    """
+
+    _type: "str" = field(default="getDefaultBackgroundCustomEmojiStickers", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetSavedAnimations(Function["Animations"]):
+    """
+    Returns saved animations
+
+    :return: :class:`Animations`
+    """
+
+    _type: "str" = field(default="getSavedAnimations", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
@@ -0,0 +1,1392 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import AuthenticationCodeInfo, FormattedText, InputFile, Ok
+    from .classes_01 import Birthdate, BotCommand, BotCommands, BotMenuButton
+    from .classes_02 import BusinessAwayMessageSettings, BusinessChatLink, BusinessChatLinkInfo, BusinessChatLinks, BusinessConnectedBot, BusinessGreetingMessageSettings, BusinessLocation, BusinessOpeningHours, ChatAdministratorRights, InputBusinessChatLink, InputBusinessStartPage, InputChatPhoto
+    from .classes_04 import EmojiStatus, User, Users
+    from .classes_08 import LinkPreviewOptions
+    from .classes_09 import LinkPreview, WebPageInstantView
+    from .classes_14 import BotMediaPreview, BotMediaPreviewInfo, BotMediaPreviews, InputStoryContent, ResendCodeReason
+    from .classes_15 import PhoneNumberAuthenticationSettings
+    from .classes_16 import CustomRequestResult, UserLink
+    from .classes_19 import Hashtags
+    from .classes_23 import Text
+    from .classes_24 import BotCommandScope, PhoneNumberCodeType
+
+
+@dataclass(slots=True)
+class AddSavedAnimation(Function["Ok"]):
+    """
+    Manually adds a new animation to the list of saved animations. The new animation is added to the beginning of the list. If the animation was already in the list, it is removed first. Only non-secret video animations with MIME type "video/mp4" can be added to the list
+
+    :param animation: The animation file to be added. Only animations known to the server (i.e., successfully sent via a message) can be added to the list
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="addSavedAnimation", init=False, repr=False)
+    animation: "InputFile | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "animation": self.animation._to_json_dict() if self.animation is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class RemoveSavedAnimation(Function["Ok"]):
+    """
+    Removes an animation from the list of saved animations
+
+    :param animation: Animation file to be removed
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="removeSavedAnimation", init=False, repr=False)
+    animation: "InputFile | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "animation": self.animation._to_json_dict() if self.animation is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetRecentInlineBots(Function["Users"]):
+    """
+    Returns up to 20 recently used inline bots in the order of their last usage
+
+    :return: :class:`Users`
+    """
+
+    _type: "str" = field(default="getRecentInlineBots", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetOwnedBots(Function["Users"]):
+    """
+    Returns the list of bots owned by the current user
+
+    :return: :class:`Users`
+    """
+
+    _type: "str" = field(default="getOwnedBots", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchHashtags(Function["Hashtags"]):
+    """
+    Searches for recently used hashtags by their prefix
+
+    :param prefix: Hashtag prefix to search for
+    :param limit: The maximum number of hashtags to be returned
+    :return: :class:`Hashtags`
+    """
+
+    _type: "str" = field(default="searchHashtags", init=False, repr=False)
+    prefix: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "prefix": self.prefix,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class RemoveRecentHashtag(Function["Ok"]):
+    """
+    Removes a hashtag from the list of recently used hashtags
+
+    :param hashtag: Hashtag to delete
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="removeRecentHashtag", init=False, repr=False)
+    hashtag: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "hashtag": self.hashtag,
+        }
+
+
+
+@dataclass(slots=True)
+class GetLinkPreview(Function["LinkPreview"]):
+    """
+    Returns a link preview by the text of a message. Do not call this function too often. Returns a 404 error if the text has no link preview
+
+    :param text: Message text with formatting
+    :param link_preview_options: Options to be used for generation of the link preview; pass null to use default link preview options
+    :return: :class:`LinkPreview`
+    """
+
+    _type: "str" = field(default="getLinkPreview", init=False, repr=False)
+    text: "FormattedText | None" = None
+    link_preview_options: "LinkPreviewOptions | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "link_preview_options": self.link_preview_options._to_json_dict() if self.link_preview_options is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetWebPageInstantView(Function["WebPageInstantView"]):
+    """
+    Returns an instant view version of a web page if available. This is an offline method if only_local is true. Returns a 404 error if the web page has no instant view page
+
+    :param url: The web page URL
+    :param only_local: Pass true to get only locally available information without sending network requests
+    :return: :class:`WebPageInstantView`
+    """
+
+    _type: "str" = field(default="getWebPageInstantView", init=False, repr=False)
+    url: "str" = ""
+    only_local: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "url": self.url,
+            "only_local": self.only_local,
+        }
+
+
+
+@dataclass(slots=True)
+class SetProfilePhoto(Function["Ok"]):
+    """
+    Changes a profile photo for the current user
+
+    :param photo: Profile photo to set
+    :param is_public: Pass true to set the public photo, which will be visible even if the main photo is hidden by privacy settings
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setProfilePhoto", init=False, repr=False)
+    photo: "InputChatPhoto | None" = None
+    is_public: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+            "is_public": self.is_public,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteProfilePhoto(Function["Ok"]):
+    """
+    Deletes a profile photo
+
+    :param profile_photo_id: Identifier of the profile photo to delete
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteProfilePhoto", init=False, repr=False)
+    profile_photo_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "profile_photo_id": self.profile_photo_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SetAccentColor(Function["Ok"]):
+    """
+    Changes accent color and background custom emoji for the current user; for Telegram Premium users only
+
+    :param accent_color_id: Identifier of the accent color to use
+    :param background_custom_emoji_id: Identifier of a custom emoji to be shown on the reply header and link preview background; 0 if none
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setAccentColor", init=False, repr=False)
+    accent_color_id: "int" = 0
+    background_custom_emoji_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "accent_color_id": self.accent_color_id,
+            "background_custom_emoji_id": self.background_custom_emoji_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SetProfileAccentColor(Function["Ok"]):
+    """
+    Changes accent color and background custom emoji for profile of the current user; for Telegram Premium users only
+
+    :param profile_accent_color_id: Identifier of the accent color to use for profile; pass -1 if none
+    :param profile_background_custom_emoji_id: Identifier of a custom emoji to be shown on the user's profile photo background; 0 if none
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setProfileAccentColor", init=False, repr=False)
+    profile_accent_color_id: "int" = 0
+    profile_background_custom_emoji_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "profile_accent_color_id": self.profile_accent_color_id,
+            "profile_background_custom_emoji_id": self.profile_background_custom_emoji_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SetName(Function["Ok"]):
+    """
+    Changes the first and last name of the current user
+
+    :param first_name: The new value of the first name for the current user; 1-64 characters
+    :param last_name: The new value of the optional last name for the current user; 0-64 characters
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setName", init=False, repr=False)
+    first_name: "str" = ""
+    last_name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+        }
+
+
+
+@dataclass(slots=True)
+class SetBio(Function["Ok"]):
+    """
+    Changes the bio of the current user
+
+    :param bio: The new value of the user bio; 0-getOption("bio_length_max") characters without line feeds
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setBio", init=False, repr=False)
+    bio: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bio": self.bio,
+        }
+
+
+
+@dataclass(slots=True)
+class SetUsername(Function["Ok"]):
+    """
+    Changes the editable username of the current user
+
+    :param username: The new value of the username. Use an empty string to remove the username. The username can't be completely removed if there is another active or disabled username
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setUsername", init=False, repr=False)
+    username: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "username": self.username,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleUsernameIsActive(Function["Ok"]):
+    """
+    Changes active state for a username of the current user. The editable username can't be disabled. May return an error with a message "USERNAMES_ACTIVE_TOO_MUCH" if the maximum number of active usernames has been reached
+
+    :param username: The username to change
+    :param is_active: Pass true to activate the username; pass false to disable it
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleUsernameIsActive", init=False, repr=False)
+    username: "str" = ""
+    is_active: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "username": self.username,
+            "is_active": self.is_active,
+        }
+
+
+
+@dataclass(slots=True)
+class ReorderActiveUsernames(Function["Ok"]):
+    """
+    Changes order of active usernames of the current user
+
+    :param usernames: The new order of active usernames. All currently active usernames must be specified
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="reorderActiveUsernames", init=False, repr=False)
+    usernames: "list[str] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "usernames": self.usernames,
+        }
+
+
+
+@dataclass(slots=True)
+class SetBirthdate(Function["Ok"]):
+    """
+    Changes the birthdate of the current user
+
+    :param birthdate: The new value of the current user's birthdate; pass null to remove the birthdate
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setBirthdate", init=False, repr=False)
+    birthdate: "Birthdate | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "birthdate": self.birthdate._to_json_dict() if self.birthdate is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SetPersonalChat(Function["Ok"]):
+    """
+    Changes the personal chat of the current user
+
+    :param chat_id: Identifier of the new personal chat; pass 0 to remove the chat. Use getSuitablePersonalChats to get suitable chats
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setPersonalChat", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SetEmojiStatus(Function["Ok"]):
+    """
+    Changes the emoji status of the current user; for Telegram Premium users only
+
+    :param emoji_status: New emoji status; pass null to switch to the default badge
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setEmojiStatus", init=False, repr=False)
+    emoji_status: "EmojiStatus | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "emoji_status": self.emoji_status._to_json_dict() if self.emoji_status is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleHasSponsoredMessagesEnabled(Function["Ok"]):
+    """
+    Toggles whether the current user has sponsored messages enabled. The setting has no effect for users without Telegram Premium for which sponsored messages are always enabled
+
+    :param has_sponsored_messages_enabled: Pass true to enable sponsored messages for the current user; false to disable them
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleHasSponsoredMessagesEnabled", init=False, repr=False)
+    has_sponsored_messages_enabled: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "has_sponsored_messages_enabled": self.has_sponsored_messages_enabled,
+        }
+
+
+
+@dataclass(slots=True)
+class SetBusinessLocation(Function["Ok"]):
+    """
+    Changes the business location of the current user. Requires Telegram Business subscription
+
+    :param location: The new location of the business; pass null to remove the location
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setBusinessLocation", init=False, repr=False)
+    location: "BusinessLocation | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "location": self.location._to_json_dict() if self.location is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SetBusinessOpeningHours(Function["Ok"]):
+    """
+    Changes the business opening hours of the current user. Requires Telegram Business subscription
+
+    :param opening_hours: The new opening hours of the business; pass null to remove the opening hours; up to 28 time intervals can be specified
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setBusinessOpeningHours", init=False, repr=False)
+    opening_hours: "BusinessOpeningHours | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "opening_hours": self.opening_hours._to_json_dict() if self.opening_hours is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SetBusinessGreetingMessageSettings(Function["Ok"]):
+    """
+    Changes the business greeting message settings of the current user. Requires Telegram Business subscription
+
+    :param greeting_message_settings: The new settings for the greeting message of the business; pass null to disable the greeting message
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setBusinessGreetingMessageSettings", init=False, repr=False)
+    greeting_message_settings: "BusinessGreetingMessageSettings | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "greeting_message_settings": self.greeting_message_settings._to_json_dict() if self.greeting_message_settings is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SetBusinessAwayMessageSettings(Function["Ok"]):
+    """
+    Changes the business away message settings of the current user. Requires Telegram Business subscription
+
+    :param away_message_settings: The new settings for the away message of the business; pass null to disable the away message
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setBusinessAwayMessageSettings", init=False, repr=False)
+    away_message_settings: "BusinessAwayMessageSettings | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "away_message_settings": self.away_message_settings._to_json_dict() if self.away_message_settings is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SetBusinessStartPage(Function["Ok"]):
+    """
+    Changes the business start page of the current user. Requires Telegram Business subscription
+
+    :param start_page: The new start page of the business; pass null to remove custom start page
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setBusinessStartPage", init=False, repr=False)
+    start_page: "InputBusinessStartPage | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "start_page": self.start_page._to_json_dict() if self.start_page is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SendPhoneNumberCode(Function["AuthenticationCodeInfo"]):
+    """
+    Sends a code to the specified phone number. Aborts previous phone number verification if there was one. On success, returns information about the sent code
+
+    :param phone_number: The phone number, in international format
+    :param settings: Settings for the authentication of the user's phone number; pass null to use default settings
+    :param type: Type of the request for which the code is sent
+    :return: :class:`AuthenticationCodeInfo`
+    """
+
+    _type: "str" = field(default="sendPhoneNumberCode", init=False, repr=False)
+    phone_number: "str" = ""
+    settings: "PhoneNumberAuthenticationSettings | None" = None
+    type: "PhoneNumberCodeType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "phone_number": self.phone_number,
+            "settings": self.settings._to_json_dict() if self.settings is not None else None,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SendPhoneNumberFirebaseSms(Function["Ok"]):
+    """
+    Sends Firebase Authentication SMS to the specified phone number. Works only when received a code of the type authenticationCodeTypeFirebaseAndroid or authenticationCodeTypeFirebaseIos
+
+    :param token: Play Integrity API or SafetyNet Attestation API token for the Android application, or secret from push notification for the iOS application
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="sendPhoneNumberFirebaseSms", init=False, repr=False)
+    token: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "token": self.token,
+        }
+
+
+
+@dataclass(slots=True)
+class ReportPhoneNumberCodeMissing(Function["Ok"]):
+    """
+    Reports that authentication code wasn't delivered via SMS to the specified phone number; for official mobile applications only
+
+    :param mobile_network_code: Current mobile network code
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="reportPhoneNumberCodeMissing", init=False, repr=False)
+    mobile_network_code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "mobile_network_code": self.mobile_network_code,
+        }
+
+
+
+@dataclass(slots=True)
+class ResendPhoneNumberCode(Function["AuthenticationCodeInfo"]):
+    """
+    Resends the authentication code sent to a phone number. Works only if the previously received authenticationCodeInfo next_code_type was not null and the server-specified timeout has passed
+
+    :param reason: Reason of code resending; pass null if unknown
+    :return: :class:`AuthenticationCodeInfo`
+    """
+
+    _type: "str" = field(default="resendPhoneNumberCode", init=False, repr=False)
+    reason: "ResendCodeReason | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "reason": self.reason._to_json_dict() if self.reason is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class CheckPhoneNumberCode(Function["Ok"]):
+    """
+    Check the authentication code and completes the request for which the code was sent if appropriate
+
+    :param code: Authentication code to check
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="checkPhoneNumberCode", init=False, repr=False)
+    code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "code": self.code,
+        }
+
+
+
+@dataclass(slots=True)
+class GetBusinessConnectedBot(Function["BusinessConnectedBot"]):
+    """
+    Returns the business bot that is connected to the current user account. Returns a 404 error if there is no connected bot
+
+    :return: :class:`BusinessConnectedBot`
+    """
+
+    _type: "str" = field(default="getBusinessConnectedBot", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class SetBusinessConnectedBot(Function["Ok"]):
+    """
+    Adds or changes business bot that is connected to the current user account
+
+    :param bot: Connection settings for the bot
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setBusinessConnectedBot", init=False, repr=False)
+    bot: "BusinessConnectedBot | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot": self.bot._to_json_dict() if self.bot is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteBusinessConnectedBot(Function["Ok"]):
+    """
+    Deletes the business bot that is connected to the current user account
+
+    :param bot_user_id: Unique user identifier for the bot
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteBusinessConnectedBot", init=False, repr=False)
+    bot_user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleBusinessConnectedBotChatIsPaused(Function["Ok"]):
+    """
+    Pauses or resumes the connected business bot in a specific chat
+
+    :param chat_id: Chat identifier
+    :param is_paused: Pass true to pause the connected bot in the chat; pass false to resume the bot
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleBusinessConnectedBotChatIsPaused", init=False, repr=False)
+    chat_id: "int" = 0
+    is_paused: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "is_paused": self.is_paused,
+        }
+
+
+
+@dataclass(slots=True)
+class RemoveBusinessConnectedBotFromChat(Function["Ok"]):
+    """
+    Removes the connected business bot from a specific chat by adding the chat to businessRecipients.excluded_chat_ids
+
+    :param chat_id: Chat identifier
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="removeBusinessConnectedBotFromChat", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetBusinessChatLinks(Function["BusinessChatLinks"]):
+    """
+    Returns business chat links created for the current account
+
+    :return: :class:`BusinessChatLinks`
+    """
+
+    _type: "str" = field(default="getBusinessChatLinks", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class CreateBusinessChatLink(Function["BusinessChatLink"]):
+    """
+    Creates a business chat link for the current account. Requires Telegram Business subscription. There can be up to getOption("business_chat_link_count_max") links created. Returns the created link
+
+    :param link_info: Information about the link to create
+    :return: :class:`BusinessChatLink`
+    """
+
+    _type: "str" = field(default="createBusinessChatLink", init=False, repr=False)
+    link_info: "InputBusinessChatLink | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "link_info": self.link_info._to_json_dict() if self.link_info is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class EditBusinessChatLink(Function["BusinessChatLink"]):
+    """
+    Edits a business chat link of the current account. Requires Telegram Business subscription. Returns the edited link
+
+    :param link: The link to edit
+    :param link_info: New description of the link
+    :return: :class:`BusinessChatLink`
+    """
+
+    _type: "str" = field(default="editBusinessChatLink", init=False, repr=False)
+    link: "str" = ""
+    link_info: "InputBusinessChatLink | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "link": self.link,
+            "link_info": self.link_info._to_json_dict() if self.link_info is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteBusinessChatLink(Function["Ok"]):
+    """
+    Deletes a business chat link of the current account
+
+    :param link: The link to delete
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteBusinessChatLink", init=False, repr=False)
+    link: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "link": self.link,
+        }
+
+
+
+@dataclass(slots=True)
+class GetBusinessChatLinkInfo(Function["BusinessChatLinkInfo"]):
+    """
+    Returns information about a business chat link
+
+    :param link_name: Name of the link
+    :return: :class:`BusinessChatLinkInfo`
+    """
+
+    _type: "str" = field(default="getBusinessChatLinkInfo", init=False, repr=False)
+    link_name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "link_name": self.link_name,
+        }
+
+
+
+@dataclass(slots=True)
+class GetUserLink(Function["UserLink"]):
+    """
+    Returns an HTTPS link, which can be used to get information about the current user
+
+    :return: :class:`UserLink`
+    """
+
+    _type: "str" = field(default="getUserLink", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchUserByToken(Function["User"]):
+    """
+    Searches a user by a token from the user's link
+
+    :param token: Token to search for
+    :return: :class:`User`
+    """
+
+    _type: "str" = field(default="searchUserByToken", init=False, repr=False)
+    token: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "token": self.token,
+        }
+
+
+
+@dataclass(slots=True)
+class SetCommands(Function["Ok"]):
+    """
+    Sets the list of commands supported by the bot for the given user scope and language; for bots only
+
+    :param scope: The scope to which the commands are relevant; pass null to change commands in the default bot command scope
+    :param language_code: A two-letter ISO 639-1 language code. If empty, the commands will be applied to all users from the given scope, for which language there are no dedicated commands
+    :param commands: List of the bot's commands
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setCommands", init=False, repr=False)
+    scope: "BotCommandScope | None" = None
+    language_code: "str" = ""
+    commands: "list[BotCommand] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "scope": self.scope._to_json_dict() if self.scope is not None else None,
+            "language_code": self.language_code,
+            "commands": _list_to_json(self.commands),
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteCommands(Function["Ok"]):
+    """
+    Deletes commands supported by the bot for the given user scope and language; for bots only
+
+    :param scope: The scope to which the commands are relevant; pass null to delete commands in the default bot command scope
+    :param language_code: A two-letter ISO 639-1 language code or an empty string
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteCommands", init=False, repr=False)
+    scope: "BotCommandScope | None" = None
+    language_code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "scope": self.scope._to_json_dict() if self.scope is not None else None,
+            "language_code": self.language_code,
+        }
+
+
+
+@dataclass(slots=True)
+class GetCommands(Function["BotCommands"]):
+    """
+    Returns the list of commands supported by the bot for the given user scope and language; for bots only
+
+    :param scope: The scope to which the commands are relevant; pass null to get commands in the default bot command scope
+    :param language_code: A two-letter ISO 639-1 language code or an empty string
+    :return: :class:`BotCommands`
+    """
+
+    _type: "str" = field(default="getCommands", init=False, repr=False)
+    scope: "BotCommandScope | None" = None
+    language_code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "scope": self.scope._to_json_dict() if self.scope is not None else None,
+            "language_code": self.language_code,
+        }
+
+
+
+@dataclass(slots=True)
+class SetMenuButton(Function["Ok"]):
+    """
+    Sets menu button for the given user or for all users; for bots only
+
+    :param user_id: Identifier of the user or 0 to set menu button for all users
+    :param menu_button: New menu button
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setMenuButton", init=False, repr=False)
+    user_id: "int" = 0
+    menu_button: "BotMenuButton | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "menu_button": self.menu_button._to_json_dict() if self.menu_button is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetMenuButton(Function["BotMenuButton"]):
+    """
+    Returns menu button set by the bot for the given user; for bots only
+
+    :param user_id: Identifier of the user or 0 to get the default menu button
+    :return: :class:`BotMenuButton`
+    """
+
+    _type: "str" = field(default="getMenuButton", init=False, repr=False)
+    user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SetDefaultGroupAdministratorRights(Function["Ok"]):
+    """
+    Sets default administrator rights for adding the bot to basic group and supergroup chats; for bots only
+
+    :param default_group_administrator_rights: Default administrator rights for adding the bot to basic group and supergroup chats; pass null to remove default rights
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setDefaultGroupAdministratorRights", init=False, repr=False)
+    default_group_administrator_rights: "ChatAdministratorRights | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "default_group_administrator_rights": self.default_group_administrator_rights._to_json_dict() if self.default_group_administrator_rights is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SetDefaultChannelAdministratorRights(Function["Ok"]):
+    """
+    Sets default administrator rights for adding the bot to channel chats; for bots only
+
+    :param default_channel_administrator_rights: Default administrator rights for adding the bot to channels; pass null to remove default rights
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setDefaultChannelAdministratorRights", init=False, repr=False)
+    default_channel_administrator_rights: "ChatAdministratorRights | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "default_channel_administrator_rights": self.default_channel_administrator_rights._to_json_dict() if self.default_channel_administrator_rights is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class CanBotSendMessages(Function["Ok"]):
+    """
+    Checks whether the specified bot can send messages to the user. Returns a 404 error if can't and the access can be granted by call to allowBotToSendMessages
+
+    :param bot_user_id: Identifier of the target bot
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="canBotSendMessages", init=False, repr=False)
+    bot_user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+        }
+
+
+
+@dataclass(slots=True)
+class AllowBotToSendMessages(Function["Ok"]):
+    """
+    Allows the specified bot to send messages to the user
+
+    :param bot_user_id: Identifier of the target bot
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="allowBotToSendMessages", init=False, repr=False)
+    bot_user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SendWebAppCustomRequest(Function["CustomRequestResult"]):
+    """
+    Sends a custom request from a Web App
+
+    :param bot_user_id: Identifier of the bot
+    :param method: The method name
+    :param parameters: JSON-serialized method parameters
+    :return: :class:`CustomRequestResult`
+    """
+
+    _type: "str" = field(default="sendWebAppCustomRequest", init=False, repr=False)
+    bot_user_id: "int" = 0
+    method: "str" = ""
+    parameters: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "method": self.method,
+            "parameters": self.parameters,
+        }
+
+
+
+@dataclass(slots=True)
+class GetBotMediaPreviews(Function["BotMediaPreviews"]):
+    """
+    Returns the list of media previews of a bot
+
+    :param bot_user_id: Identifier of the target bot. The bot must have the main Web App
+    :return: :class:`BotMediaPreviews`
+    """
+
+    _type: "str" = field(default="getBotMediaPreviews", init=False, repr=False)
+    bot_user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetBotMediaPreviewInfo(Function["BotMediaPreviewInfo"]):
+    """
+    Returns the list of media previews for the given language and the list of languages for which the bot has dedicated previews
+
+    :param bot_user_id: Identifier of the target bot. The bot must be owned and must have the main Web App
+    :param language_code: A two-letter ISO 639-1 language code for which to get previews. If empty, then default previews are returned
+    :return: :class:`BotMediaPreviewInfo`
+    """
+
+    _type: "str" = field(default="getBotMediaPreviewInfo", init=False, repr=False)
+    bot_user_id: "int" = 0
+    language_code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "language_code": self.language_code,
+        }
+
+
+
+@dataclass(slots=True)
+class AddBotMediaPreview(Function["BotMediaPreview"]):
+    """
+    Adds a new media preview to the beginning of the list of media previews of a bot. Returns the added preview after addition is completed server-side. The total number of previews must not exceed getOption("bot_media_preview_count_max") for the given language
+
+    :param bot_user_id: Identifier of the target bot. The bot must be owned and must have the main Web App
+    :param language_code: A two-letter ISO 639-1 language code for which preview is added. If empty, then the preview will be shown to all users for whose languages there are no dedicated previews.
+     If non-empty, then there must be an official language pack of the same name, which is returned by getLocalizationTargetInfo
+    :param content: Content of the added preview
+    :return: :class:`BotMediaPreview`
+    """
+
+    _type: "str" = field(default="addBotMediaPreview", init=False, repr=False)
+    bot_user_id: "int" = 0
+    language_code: "str" = ""
+    content: "InputStoryContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "language_code": self.language_code,
+            "content": self.content._to_json_dict() if self.content is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class EditBotMediaPreview(Function["BotMediaPreview"]):
+    """
+    Replaces media preview in the list of media previews of a bot. Returns the new preview after edit is completed server-side
+
+    :param bot_user_id: Identifier of the target bot. The bot must be owned and must have the main Web App
+    :param language_code: Language code of the media preview to edit
+    :param file_id: File identifier of the media to replace
+    :param content: Content of the new preview
+    :return: :class:`BotMediaPreview`
+    """
+
+    _type: "str" = field(default="editBotMediaPreview", init=False, repr=False)
+    bot_user_id: "int" = 0
+    language_code: "str" = ""
+    file_id: "int" = 0
+    content: "InputStoryContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "language_code": self.language_code,
+            "file_id": self.file_id,
+            "content": self.content._to_json_dict() if self.content is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class ReorderBotMediaPreviews(Function["Ok"]):
+    """
+    Changes order of media previews in the list of media previews of a bot
+
+    :param bot_user_id: Identifier of the target bot. The bot must be owned and must have the main Web App
+    :param language_code: Language code of the media previews to reorder
+    :param file_ids: File identifiers of the media in the new order
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="reorderBotMediaPreviews", init=False, repr=False)
+    bot_user_id: "int" = 0
+    language_code: "str" = ""
+    file_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "language_code": self.language_code,
+            "file_ids": self.file_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteBotMediaPreviews(Function["Ok"]):
+    """
+    Delete media previews from the list of media previews of a bot
+
+    :param bot_user_id: Identifier of the target bot. The bot must be owned and must have the main Web App
+    :param language_code: Language code of the media previews to delete
+    :param file_ids: File identifiers of the media to delete
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteBotMediaPreviews", init=False, repr=False)
+    bot_user_id: "int" = 0
+    language_code: "str" = ""
+    file_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "language_code": self.language_code,
+            "file_ids": self.file_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class SetBotName(Function["Ok"]):
+    """
+    Sets the name of a bot. Can be called only if userTypeBot.can_be_edited == true
+
+    :param bot_user_id: Identifier of the target bot
+    :param language_code: A two-letter ISO 639-1 language code. If empty, the name will be shown to all users for whose languages there is no dedicated name
+    :param name: New bot's name on the specified language; 0-64 characters; must be non-empty if language code is empty
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setBotName", init=False, repr=False)
+    bot_user_id: "int" = 0
+    language_code: "str" = ""
+    name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "language_code": self.language_code,
+            "name": self.name,
+        }
+
+
+
+@dataclass(slots=True)
+class GetBotName(Function["Text"]):
+    """
+    Returns the name of a bot in the given language. Can be called only if userTypeBot.can_be_edited == true
+
+    :param bot_user_id: Identifier of the target bot
+    :param language_code: A two-letter ISO 639-1 language code or an empty string
+    :return: :class:`Text`
+    """
+
+    _type: "str" = field(default="getBotName", init=False, repr=False)
+    bot_user_id: "int" = 0
+    language_code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "language_code": self.language_code,
+        }
+
+
+
+@dataclass(slots=True)
+class SetBotProfilePhoto(Function["Ok"]):
+    """
+    Changes a profile photo for a bot
+
+    :param bot_user_id: Identifier of the target bot
+    :param photo: Profile photo to set; pass null to delete the chat photo
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setBotProfilePhoto", init=False, repr=False)
+    bot_user_id: "int" = 0
+    photo: "InputChatPhoto | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "photo": self.photo._to_json_dict() if self.photo is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleBotUsernameIsActive(Function["Ok"]):
+    """
+    Changes active state for a username of a bot. The editable username can't be disabled. May return an error with a message "USERNAMES_ACTIVE_TOO_MUCH" if the maximum number of active usernames has been reached. Can be called only if userTypeBot.can_be_edited == true
+
+    :param bot_user_id: Identifier of the target bot
+    :param username: The username to change
+    :param is_active: Pass true to activate the username; pass false to disable it
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleBotUsernameIsActive", init=False, repr=False)
+    bot_user_id: "int" = 0
+    username: "str" = ""
+    is_active: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "username": self.username,
+            "is_active": self.is_active,
+        }
+
+
+
+@dataclass(slots=True)
+class ReorderBotActiveUsernames(Function["Ok"]):
+    """
+    Changes order of active usernames of a bot. Can be called only if userTypeBot.can_be_edited == true
+
+    :param bot_user_id: Identifier of the target bot
+    :param usernames: The new order of active usernames. All currently active usernames must be specified
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="reorderBotActiveUsernames", init=False, repr=False)
+    bot_user_id: "int" = 0
+    usernames: "list[str] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "usernames": self.usernames,
+        }
+
+
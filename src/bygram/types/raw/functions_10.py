@@ -0,0 +1,1516 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import FormattedText, Ok
+    from .classes_03 import AvailableGifts, GiftForResaleOrder, GiftSettings, GiftUpgradePreview, GiftsForResale, ReceivedGift, ReceivedGifts, UpgradeGiftResult, UpgradedGift, UpgradedGiftAttributeId
+    from .classes_04 import ChatMembers, SupergroupMembersFilter
+    from .classes_05 import MessageSender
+    from .classes_08 import ThemeParameters
+    from .classes_09 import InputCredentials, OrderInfo
+    from .classes_10 import InputInvoice, PaymentForm, PaymentReceipt, PaymentResult, ValidatedOrderInfo
+    from .classes_12 import InputMessageContent
+    from .classes_16 import HttpUrl
+    from .classes_17 import ChatEventLogFilters, ChatEvents
+    from .classes_19 import TimeZones
+    from .classes_21 import ConnectedWebsites, Sessions
+    from .classes_23 import Text
+
+
+@dataclass(slots=True)
+class SetBotInfoDescription(Function["Ok"]):
+    """
+    Sets the text shown in the chat with a bot if the chat is empty. Can be called only if userTypeBot.can_be_edited == true
+
+    :param bot_user_id: Identifier of the target bot
+    :param language_code: A two-letter ISO 639-1 language code. If empty, the description will be shown to all users for whose languages there is no dedicated description
+    :param description: Sets the text shown in the chat with a bot if the chat is empty. Can be called only if userTypeBot.can_be_edited == true
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setBotInfoDescription", init=False, repr=False)
+    bot_user_id: "int" = 0
+    language_code: "str" = ""
+    description: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "language_code": self.language_code,
+            "description": self.description,
+        }
+
+
+
+@dataclass(slots=True)
+class GetBotInfoDescription(Function["Text"]):
+    """
+    Returns the text shown in the chat with a bot if the chat is empty in the given language. Can be called only if userTypeBot.can_be_edited == true
+
+    :param bot_user_id: Identifier of the target bot
+    :param language_code: A two-letter ISO 639-1 language code or an empty string
+    :return: :class:`Text`
+    """
+
+    _type: "str" = field(default="getBotInfoDescription", init=False, repr=False)
+    bot_user_id: "int" = 0
+    language_code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "language_code": self.language_code,
+        }
+
+
+
+@dataclass(slots=True)
+class SetBotInfoShortDescription(Function["Ok"]):
+    """
+    Sets the text shown on a bot's profile page and sent together with the link when users share the bot. Can be called only if userTypeBot.can_be_edited == true
+
+    :param bot_user_id: Identifier of the target bot
+    :param language_code: A two-letter ISO 639-1 language code. If empty, the short description will be shown to all users for whose languages there is no dedicated description
+    :param short_description: New bot's short description on the specified language
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setBotInfoShortDescription", init=False, repr=False)
+    bot_user_id: "int" = 0
+    language_code: "str" = ""
+    short_description: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "language_code": self.language_code,
+            "short_description": self.short_description,
+        }
+
+
+
+@dataclass(slots=True)
+class GetBotInfoShortDescription(Function["Text"]):
+    """
+    Returns the text shown on a bot's profile page and sent together with the link when users share the bot in the given language. Can be called only if userTypeBot.can_be_edited == true
+
+    :param bot_user_id: Identifier of the target bot
+    :param language_code: A two-letter ISO 639-1 language code or an empty string
+    :return: :class:`Text`
+    """
+
+    _type: "str" = field(default="getBotInfoShortDescription", init=False, repr=False)
+    bot_user_id: "int" = 0
+    language_code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "language_code": self.language_code,
+        }
+
+
+
+@dataclass(slots=True)
+class SetMessageSenderBotVerification(Function["Ok"]):
+    """
+    Changes the verification status of a user or a chat by an owned bot
+
+    :param bot_user_id: Identifier of the owned bot, which will verify the user or the chat
+    :param verified_id: Identifier of the user or the supergroup or channel chat, which will be verified by the bot
+    :param custom_description: Custom description of verification reason; 0-getOption("bot_verification_custom_description_length_max").
+     If empty, then "was verified by organization "organization_name"" will be used as description. Can be specified only if the bot is allowed to provide custom description
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setMessageSenderBotVerification", init=False, repr=False)
+    bot_user_id: "int" = 0
+    verified_id: "MessageSender | None" = None
+    custom_description: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "verified_id": self.verified_id._to_json_dict() if self.verified_id is not None else None,
+            "custom_description": self.custom_description,
+        }
+
+
+
+@dataclass(slots=True)
+class RemoveMessageSenderBotVerification(Function["Ok"]):
+    """
+    Removes the verification status of a user or a chat by an owned bot
+
+    :param bot_user_id: Identifier of the owned bot, which verified the user or the chat
+    :param verified_id: Identifier of the user or the supergroup or channel chat, which verification is removed
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="removeMessageSenderBotVerification", init=False, repr=False)
+    bot_user_id: "int" = 0
+    verified_id: "MessageSender | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "verified_id": self.verified_id._to_json_dict() if self.verified_id is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetActiveSessions(Function["Sessions"]):
+    """
+    Returns all active sessions of the current user
+
+    :return: :class:`Sessions`
+    """
+
+    _type: "str" = field(default="getActiveSessions", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class TerminateSession(Function["Ok"]):
+    """
+    Terminates a session of the current user
+
+    :param session_id: Session identifier
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="terminateSession", init=False, repr=False)
+    session_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "session_id": self.session_id,
+        }
+
+
+
+@dataclass(slots=True)
+class TerminateAllOtherSessions(Function["Ok"]):
+    """
+    Terminates all other sessions of the current user
+
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="terminateAllOtherSessions", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class ConfirmSession(Function["Ok"]):
+    """
+    Confirms an unconfirmed session of the current user from another device
+
+    :param session_id: Session identifier
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="confirmSession", init=False, repr=False)
+    session_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "session_id": self.session_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleSessionCanAcceptCalls(Function["Ok"]):
+    """
+    Toggles whether a session can accept incoming calls
+
+    :param session_id: Session identifier
+    :param can_accept_calls: Pass true to allow accepting incoming calls by the session; pass false otherwise
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleSessionCanAcceptCalls", init=False, repr=False)
+    session_id: "int" = 0
+    can_accept_calls: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "session_id": self.session_id,
+            "can_accept_calls": self.can_accept_calls,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleSessionCanAcceptSecretChats(Function["Ok"]):
+    """
+    Toggles whether a session can accept incoming secret chats
+
+    :param session_id: Session identifier
+    :param can_accept_secret_chats: Pass true to allow accepting secret chats by the session; pass false otherwise
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleSessionCanAcceptSecretChats", init=False, repr=False)
+    session_id: "int" = 0
+    can_accept_secret_chats: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "session_id": self.session_id,
+            "can_accept_secret_chats": self.can_accept_secret_chats,
+        }
+
+
+
+@dataclass(slots=True)
+class SetInactiveSessionTtl(Function["Ok"]):
+    """
+    Changes the period of inactivity after which sessions will automatically be terminated
+
+    :param inactive_session_ttl_days: New number of days of inactivity before sessions will be automatically terminated; 1-366 days
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setInactiveSessionTtl", init=False, repr=False)
+    inactive_session_ttl_days: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "inactive_session_ttl_days": self.inactive_session_ttl_days,
+        }
+
+
+
+@dataclass(slots=True)
+class GetConnectedWebsites(Function["ConnectedWebsites"]):
+    """
+    Returns all website where the current user used Telegram to log in
+
+    :return: :class:`ConnectedWebsites`
+    """
+
+    _type: "str" = field(default="getConnectedWebsites", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class DisconnectWebsite(Function["Ok"]):
+    """
+    Disconnects website from the current user's Telegram account
+
+    :param website_id: Website identifier
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="disconnectWebsite", init=False, repr=False)
+    website_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "website_id": self.website_id,
+        }
+
+
+
+@dataclass(slots=True)
+class DisconnectAllWebsites(Function["Ok"]):
+    """
+    Disconnects all websites from the current user's Telegram account
+
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="disconnectAllWebsites", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class SetSupergroupUsername(Function["Ok"]):
+    """
+    Changes the editable username of a supergroup or channel, requires owner privileges in the supergroup or channel
+
+    :param supergroup_id: Identifier of the supergroup or channel
+    :param username: New value of the username. Use an empty string to remove the username. The username can't be completely removed if there is another active or disabled username
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setSupergroupUsername", init=False, repr=False)
+    supergroup_id: "int" = 0
+    username: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+            "username": self.username,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleSupergroupUsernameIsActive(Function["Ok"]):
+    """
+    Changes active state for a username of a supergroup or channel, requires owner privileges in the supergroup or channel. The editable username can't be disabled. May return an error with a message "USERNAMES_ACTIVE_TOO_MUCH" if the maximum number of active usernames has been reached
+
+    :param supergroup_id: Identifier of the supergroup or channel
+    :param username: The username to change
+    :param is_active: Pass true to activate the username; pass false to disable it
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleSupergroupUsernameIsActive", init=False, repr=False)
+    supergroup_id: "int" = 0
+    username: "str" = ""
+    is_active: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+            "username": self.username,
+            "is_active": self.is_active,
+        }
+
+
+
+@dataclass(slots=True)
+class DisableAllSupergroupUsernames(Function["Ok"]):
+    """
+    Disables all active non-editable usernames of a supergroup or channel, requires owner privileges in the supergroup or channel
+
+    :param supergroup_id: Identifier of the supergroup or channel
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="disableAllSupergroupUsernames", init=False, repr=False)
+    supergroup_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ReorderSupergroupActiveUsernames(Function["Ok"]):
+    """
+    Changes order of active usernames of a supergroup or channel, requires owner privileges in the supergroup or channel
+
+    :param supergroup_id: Identifier of the supergroup or channel
+    :param usernames: The new order of active usernames. All currently active usernames must be specified
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="reorderSupergroupActiveUsernames", init=False, repr=False)
+    supergroup_id: "int" = 0
+    usernames: "list[str] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+            "usernames": self.usernames,
+        }
+
+
+
+@dataclass(slots=True)
+class SetSupergroupStickerSet(Function["Ok"]):
+    """
+    Changes the sticker set of a supergroup; requires can_change_info administrator right
+
+    :param supergroup_id: Identifier of the supergroup
+    :param sticker_set_id: New value of the supergroup sticker set identifier. Use 0 to remove the supergroup sticker set
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setSupergroupStickerSet", init=False, repr=False)
+    supergroup_id: "int" = 0
+    sticker_set_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+            "sticker_set_id": self.sticker_set_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SetSupergroupCustomEmojiStickerSet(Function["Ok"]):
+    """
+    Changes the custom emoji sticker set of a supergroup; requires can_change_info administrator right. The chat must have at least chatBoostFeatures.min_custom_emoji_sticker_set_boost_level boost level to pass the corresponding color
+
+    :param supergroup_id: Identifier of the supergroup
+    :param custom_emoji_sticker_set_id: New value of the custom emoji sticker set identifier for the supergroup. Use 0 to remove the custom emoji sticker set in the supergroup
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setSupergroupCustomEmojiStickerSet", init=False, repr=False)
+    supergroup_id: "int" = 0
+    custom_emoji_sticker_set_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+            "custom_emoji_sticker_set_id": self.custom_emoji_sticker_set_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SetSupergroupUnrestrictBoostCount(Function["Ok"]):
+    """
+    Changes the number of times the supergroup must be boosted by a user to ignore slow mode and chat permission restrictions; requires can_restrict_members administrator right
+
+    :param supergroup_id: Identifier of the supergroup
+    :param unrestrict_boost_count: New value of the unrestrict_boost_count supergroup setting; 0-8. Use 0 to remove the setting
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setSupergroupUnrestrictBoostCount", init=False, repr=False)
+    supergroup_id: "int" = 0
+    unrestrict_boost_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+            "unrestrict_boost_count": self.unrestrict_boost_count,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleSupergroupSignMessages(Function["Ok"]):
+    """
+    Toggles whether sender signature or link to the account is added to sent messages in a channel; requires can_change_info member right
+
+    :param supergroup_id: Identifier of the channel
+    :param sign_messages: New value of sign_messages
+    :param show_message_sender: New value of show_message_sender
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleSupergroupSignMessages", init=False, repr=False)
+    supergroup_id: "int" = 0
+    sign_messages: "bool" = False
+    show_message_sender: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+            "sign_messages": self.sign_messages,
+            "show_message_sender": self.show_message_sender,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleSupergroupJoinToSendMessages(Function["Ok"]):
+    """
+    Toggles whether joining is mandatory to send messages to a discussion supergroup; requires can_restrict_members administrator right
+
+    :param supergroup_id: Identifier of the supergroup that isn't a broadcast group
+    :param join_to_send_messages: New value of join_to_send_messages
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleSupergroupJoinToSendMessages", init=False, repr=False)
+    supergroup_id: "int" = 0
+    join_to_send_messages: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+            "join_to_send_messages": self.join_to_send_messages,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleSupergroupJoinByRequest(Function["Ok"]):
+    """
+    Toggles whether all users directly joining the supergroup need to be approved by supergroup administrators; requires can_restrict_members administrator right
+
+    :param supergroup_id: Identifier of the supergroup that isn't a broadcast group
+    :param join_by_request: New value of join_by_request
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleSupergroupJoinByRequest", init=False, repr=False)
+    supergroup_id: "int" = 0
+    join_by_request: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+            "join_by_request": self.join_by_request,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleSupergroupIsAllHistoryAvailable(Function["Ok"]):
+    """
+    Toggles whether the message history of a supergroup is available to new members; requires can_change_info member right
+
+    :param supergroup_id: The identifier of the supergroup
+    :param is_all_history_available: The new value of is_all_history_available
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleSupergroupIsAllHistoryAvailable", init=False, repr=False)
+    supergroup_id: "int" = 0
+    is_all_history_available: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+            "is_all_history_available": self.is_all_history_available,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleSupergroupCanHaveSponsoredMessages(Function["Ok"]):
+    """
+    Toggles whether sponsored messages are shown in the channel chat; requires owner privileges in the channel. The chat must have at least chatBoostFeatures.min_sponsored_message_disable_boost_level boost level to disable sponsored messages
+
+    :param supergroup_id: The identifier of the channel
+    :param can_have_sponsored_messages: The new value of can_have_sponsored_messages
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleSupergroupCanHaveSponsoredMessages", init=False, repr=False)
+    supergroup_id: "int" = 0
+    can_have_sponsored_messages: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+            "can_have_sponsored_messages": self.can_have_sponsored_messages,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleSupergroupHasAutomaticTranslation(Function["Ok"]):
+    """
+    Toggles whether messages are automatically translated in the channel chat; requires can_change_info administrator right in the channel. The chat must have at least chatBoostFeatures.min_automatic_translation_boost_level boost level to enable automatic translation
+
+    :param supergroup_id: The identifier of the channel
+    :param has_automatic_translation: The new value of has_automatic_translation
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleSupergroupHasAutomaticTranslation", init=False, repr=False)
+    supergroup_id: "int" = 0
+    has_automatic_translation: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+            "has_automatic_translation": self.has_automatic_translation,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleSupergroupHasHiddenMembers(Function["Ok"]):
+    """
+    Toggles whether non-administrators can receive only administrators and bots using getSupergroupMembers or searchChatMembers. Can be called only if supergroupFullInfo.can_hide_members == true
+
+    :param supergroup_id: Identifier of the supergroup
+    :param has_hidden_members: New value of has_hidden_members
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleSupergroupHasHiddenMembers", init=False, repr=False)
+    supergroup_id: "int" = 0
+    has_hidden_members: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+            "has_hidden_members": self.has_hidden_members,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleSupergroupHasAggressiveAntiSpamEnabled(Function["Ok"]):
+    """
+    Toggles whether aggressive anti-spam checks are enabled in the supergroup. Can be called only if supergroupFullInfo.can_toggle_aggressive_anti_spam == true
+
+    :param supergroup_id: The identifier of the supergroup, which isn't a broadcast group
+    :param has_aggressive_anti_spam_enabled: The new value of has_aggressive_anti_spam_enabled
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleSupergroupHasAggressiveAntiSpamEnabled", init=False, repr=False)
+    supergroup_id: "int" = 0
+    has_aggressive_anti_spam_enabled: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+            "has_aggressive_anti_spam_enabled": self.has_aggressive_anti_spam_enabled,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleSupergroupIsForum(Function["Ok"]):
+    """
+    Toggles whether the supergroup is a forum; requires owner privileges in the supergroup. Discussion supergroups can't be converted to forums
+
+    :param supergroup_id: Identifier of the supergroup
+    :param is_forum: New value of is_forum
+    :param has_forum_tabs: New value of has_forum_tabs; ignored if is_forum is false
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleSupergroupIsForum", init=False, repr=False)
+    supergroup_id: "int" = 0
+    is_forum: "bool" = False
+    has_forum_tabs: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+            "is_forum": self.is_forum,
+            "has_forum_tabs": self.has_forum_tabs,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleSupergroupIsBroadcastGroup(Function["Ok"]):
+    """
+    Upgrades supergroup to a broadcast group; requires owner privileges in the supergroup
+
+    :param supergroup_id: Identifier of the supergroup
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleSupergroupIsBroadcastGroup", init=False, repr=False)
+    supergroup_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ReportSupergroupSpam(Function["Ok"]):
+    """
+    Reports messages in a supergroup as spam; requires administrator rights in the supergroup
+
+    :param supergroup_id: Supergroup identifier
+    :param message_ids: Identifiers of messages to report. Use messageProperties.can_report_supergroup_spam to check whether the message can be reported
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="reportSupergroupSpam", init=False, repr=False)
+    supergroup_id: "int" = 0
+    message_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+            "message_ids": self.message_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class ReportSupergroupAntiSpamFalsePositive(Function["Ok"]):
+    """
+    Reports a false deletion of a message by aggressive anti-spam checks; requires administrator rights in the supergroup. Can be called only for messages from chatEventMessageDeleted with can_report_anti_spam_false_positive == true
+
+    :param supergroup_id: Supergroup identifier
+    :param message_id: Identifier of the erroneously deleted message from chatEventMessageDeleted
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="reportSupergroupAntiSpamFalsePositive", init=False, repr=False)
+    supergroup_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+            "message_id": self.message_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetSupergroupMembers(Function["ChatMembers"]):
+    """
+    Returns information about members or banned users in a supergroup or channel. Can be used only if supergroupFullInfo.can_get_members == true; additionally, administrator privileges may be required for some filters
+
+    :param supergroup_id: Identifier of the supergroup or channel
+    :param filter: The type of users to return; pass null to use supergroupMembersFilterRecent
+    :param offset: Number of users to skip
+    :param limit: The maximum number of users to be returned; up to 200
+    :return: :class:`ChatMembers`
+    """
+
+    _type: "str" = field(default="getSupergroupMembers", init=False, repr=False)
+    supergroup_id: "int" = 0
+    filter: "SupergroupMembersFilter | None" = None
+    offset: "int" = 0
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "supergroup_id": self.supergroup_id,
+            "filter": self.filter._to_json_dict() if self.filter is not None else None,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class CloseSecretChat(Function["Ok"]):
+    """
+    Closes a secret chat, effectively transferring its state to secretChatStateClosed
+
+    :param secret_chat_id: Secret chat identifier
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="closeSecretChat", init=False, repr=False)
+    secret_chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "secret_chat_id": self.secret_chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatEventLog(Function["ChatEvents"]):
+    """
+    Returns a list of service actions taken by chat members and administrators in the last 48 hours. Available only for supergroups and channels. Requires administrator rights. Returns results in reverse chronological order (i.e., in order of decreasing event_id)
+
+    :param chat_id: Chat identifier
+    :param query: Search query by which to filter events
+    :param from_event_id: Identifier of an event from which to return results. Use 0 to get results from the latest events
+    :param limit: The maximum number of events to return; up to 100
+    :param filters: The types of events to return; pass null to get chat events of all types
+    :param user_ids: User identifiers by which to filter events. By default, events relating to all users will be returned
+    :return: :class:`ChatEvents`
+    """
+
+    _type: "str" = field(default="getChatEventLog", init=False, repr=False)
+    chat_id: "int" = 0
+    query: "str" = ""
+    from_event_id: "int" = 0
+    limit: "int" = 0
+    filters: "ChatEventLogFilters | None" = None
+    user_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "query": self.query,
+            "from_event_id": self.from_event_id,
+            "limit": self.limit,
+            "filters": self.filters._to_json_dict() if self.filters is not None else None,
+            "user_ids": self.user_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class GetTimeZones(Function["TimeZones"]):
+    """
+    Returns the list of supported time zones
+
+    :return: :class:`TimeZones`
+    """
+
+    _type: "str" = field(default="getTimeZones", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetPaymentForm(Function["PaymentForm"]):
+    """
+    Returns an invoice payment form. This method must be called when the user presses inline button of the type inlineKeyboardButtonTypeBuy, or wants to buy access to media in a messagePaidMedia message
+
+    :param input_invoice: The invoice
+    :param theme: Preferred payment form theme; pass null to use the default theme
+    :return: :class:`PaymentForm`
+    """
+
+    _type: "str" = field(default="getPaymentForm", init=False, repr=False)
+    input_invoice: "InputInvoice | None" = None
+    theme: "ThemeParameters | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "input_invoice": self.input_invoice._to_json_dict() if self.input_invoice is not None else None,
+            "theme": self.theme._to_json_dict() if self.theme is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class ValidateOrderInfo(Function["ValidatedOrderInfo"]):
+    """
+    Validates the order information provided by a user and returns the available shipping options for a flexible invoice
+
+    :param input_invoice: The invoice
+    :param order_info: The order information, provided by the user; pass null if empty
+    :param allow_save: Pass true to save the order information
+    :return: :class:`ValidatedOrderInfo`
+    """
+
+    _type: "str" = field(default="validateOrderInfo", init=False, repr=False)
+    input_invoice: "InputInvoice | None" = None
+    order_info: "OrderInfo | None" = None
+    allow_save: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "input_invoice": self.input_invoice._to_json_dict() if self.input_invoice is not None else None,
+            "order_info": self.order_info._to_json_dict() if self.order_info is not None else None,
+            "allow_save": self.allow_save,
+        }
+
+
+
+@dataclass(slots=True)
+class SendPaymentForm(Function["PaymentResult"]):
+    """
+    Sends a filled-out payment form to the bot for final verification
+
+    :param input_invoice: The invoice
+    :param payment_form_id: Payment form identifier returned by getPaymentForm
+    :param order_info_id: Identifier returned by validateOrderInfo, or an empty string
+    :param shipping_option_id: Identifier of a chosen shipping option, if applicable
+    :param credentials: The credentials chosen by user for payment; pass null for a payment in Telegram Stars
+    :param tip_amount: Chosen by the user amount of tip in the smallest units of the currency
+    :return: :class:`PaymentResult`
+    """
+
+    _type: "str" = field(default="sendPaymentForm", init=False, repr=False)
+    input_invoice: "InputInvoice | None" = None
+    payment_form_id: "int" = 0
+    order_info_id: "str" = ""
+    shipping_option_id: "str" = ""
+    credentials: "InputCredentials | None" = None
+    tip_amount: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "input_invoice": self.input_invoice._to_json_dict() if self.input_invoice is not None else None,
+            "payment_form_id": self.payment_form_id,
+            "order_info_id": self.order_info_id,
+            "shipping_option_id": self.shipping_option_id,
+            "credentials": self.credentials._to_json_dict() if self.credentials is not None else None,
+            "tip_amount": self.tip_amount,
+        }
+
+
+
+@dataclass(slots=True)
+class GetPaymentReceipt(Function["PaymentReceipt"]):
+    """
+    Returns information about a successful payment
+
+    :param chat_id: Chat identifier of the messagePaymentSuccessful message
+    :param message_id: Message identifier
+    :return: :class:`PaymentReceipt`
+    """
+
+    _type: "str" = field(default="getPaymentReceipt", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetSavedOrderInfo(Function["OrderInfo"]):
+    """
+    Returns saved order information. Returns a 404 error if there is no saved order information
+
+    :return: :class:`OrderInfo`
+    """
+
+    _type: "str" = field(default="getSavedOrderInfo", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteSavedOrderInfo(Function["Ok"]):
+    """
+    Deletes saved order information
+
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteSavedOrderInfo", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteSavedCredentials(Function["Ok"]):
+    """
+    Deletes saved credentials for all payment provider bots
+
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteSavedCredentials", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class SetGiftSettings(Function["Ok"]):
+    """
+    Changes settings for gift receiving for the current user
+
+    :param settings: The new settings
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setGiftSettings", init=False, repr=False)
+    settings: "GiftSettings | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "settings": self.settings._to_json_dict() if self.settings is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetAvailableGifts(Function["AvailableGifts"]):
+    """
+    Returns gifts that can be sent to other users and channel chats
+
+    :return: :class:`AvailableGifts`
+    """
+
+    _type: "str" = field(default="getAvailableGifts", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class SendGift(Function["Ok"]):
+    """
+    Sends a gift to another user or channel chat. May return an error with a message "STARGIFT_USAGE_LIMITED" if the gift was sold out
+
+    :param gift_id: Identifier of the gift to send
+    :param owner_id: Identifier of the user or the channel chat that will receive the gift
+    :param text: Text to show along with the gift; 0-getOption("gift_text_length_max") characters. Only Bold, Italic, Underline, Strikethrough, Spoiler, and CustomEmoji entities are allowed.
+     Must be empty if the receiver enabled paid messages
+    :param is_private: Pass true to show gift text and sender only to the gift receiver; otherwise, everyone will be able to see them
+    :param pay_for_upgrade: Pass true to additionally pay for the gift upgrade and allow the receiver to upgrade it for free
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="sendGift", init=False, repr=False)
+    gift_id: "int" = 0
+    owner_id: "MessageSender | None" = None
+    text: "FormattedText | None" = None
+    is_private: "bool" = False
+    pay_for_upgrade: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "gift_id": self.gift_id,
+            "owner_id": self.owner_id._to_json_dict() if self.owner_id is not None else None,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+            "is_private": self.is_private,
+            "pay_for_upgrade": self.pay_for_upgrade,
+        }
+
+
+
+@dataclass(slots=True)
+class SellGift(Function["Ok"]):
+    """
+    Sells a gift for Telegram Stars; requires owner privileges for gifts owned by a chat
+
+    :param business_connection_id: Unique identifier of business connection on behalf of which to send the request; for bots only
+    :param received_gift_id: Identifier of the gift
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="sellGift", init=False, repr=False)
+    business_connection_id: "str" = ""
+    received_gift_id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "business_connection_id": self.business_connection_id,
+            "received_gift_id": self.received_gift_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleGiftIsSaved(Function["Ok"]):
+    """
+    Toggles whether a gift is shown on the current user's or the channel's profile page; requires can_post_messages administrator right in the channel chat
+
+    :param received_gift_id: Identifier of the gift
+    :param is_saved: Pass true to display the gift on the user's or the channel's profile page; pass false to remove it from the profile page
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleGiftIsSaved", init=False, repr=False)
+    received_gift_id: "str" = ""
+    is_saved: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "received_gift_id": self.received_gift_id,
+            "is_saved": self.is_saved,
+        }
+
+
+
+@dataclass(slots=True)
+class SetPinnedGifts(Function["Ok"]):
+    """
+    Changes the list of pinned gifts on the current user's or the channel's profile page; requires can_post_messages administrator right in the channel chat
+
+    :param owner_id: Identifier of the user or the channel chat that received the gifts
+    :param received_gift_ids: New list of pinned gifts. All gifts must be upgraded and saved on the profile page first. There can be up to getOption("pinned_gift_count_max") pinned gifts
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setPinnedGifts", init=False, repr=False)
+    owner_id: "MessageSender | None" = None
+    received_gift_ids: "list[str] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "owner_id": self.owner_id._to_json_dict() if self.owner_id is not None else None,
+            "received_gift_ids": self.received_gift_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class ToggleChatGiftNotifications(Function["Ok"]):
+    """
+    Toggles whether notifications for new gifts received by a channel chat are sent to the current user; requires can_post_messages administrator right in the chat
+
+    :param chat_id: Identifier of the channel chat
+    :param are_enabled: Pass true to enable notifications about new gifts owned by the channel chat; pass false to disable the notifications
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="toggleChatGiftNotifications", init=False, repr=False)
+    chat_id: "int" = 0
+    are_enabled: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "are_enabled": self.are_enabled,
+        }
+
+
+
+@dataclass(slots=True)
+class GetGiftUpgradePreview(Function["GiftUpgradePreview"]):
+    """
+    Returns examples of possible upgraded gifts for a regular gift
+
+    :param gift_id: Identifier of the gift
+    :return: :class:`GiftUpgradePreview`
+    """
+
+    _type: "str" = field(default="getGiftUpgradePreview", init=False, repr=False)
+    gift_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "gift_id": self.gift_id,
+        }
+
+
+
+@dataclass(slots=True)
+class UpgradeGift(Function["UpgradeGiftResult"]):
+    """
+    Upgrades a regular gift
+
+    :param business_connection_id: Unique identifier of business connection on behalf of which to send the request; for bots only
+    :param received_gift_id: Identifier of the gift
+    :param keep_original_details: Pass true to keep the original gift text, sender and receiver in the upgraded gift
+    :param star_count: The amount of Telegram Stars required to pay for the upgrade. It the gift has prepaid_upgrade_star_count > 0, then pass 0, otherwise, pass gift.upgrade_star_count
+    :return: :class:`UpgradeGiftResult`
+    """
+
+    _type: "str" = field(default="upgradeGift", init=False, repr=False)
+    business_connection_id: "str" = ""
+    received_gift_id: "str" = ""
+    keep_original_details: "bool" = False
+    star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "business_connection_id": self.business_connection_id,
+            "received_gift_id": self.received_gift_id,
+            "keep_original_details": self.keep_original_details,
+            "star_count": self.star_count,
+        }
+
+
+
+@dataclass(slots=True)
+class TransferGift(Function["Ok"]):
+    """
+    Sends an upgraded gift to another user or a channel chat
+
+    :param business_connection_id: Unique identifier of business connection on behalf of which to send the request; for bots only
+    :param received_gift_id: Identifier of the gift
+    :param new_owner_id: Identifier of the user or the channel chat that will receive the gift
+    :param star_count: The amount of Telegram Stars required to pay for the transfer
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="transferGift", init=False, repr=False)
+    business_connection_id: "str" = ""
+    received_gift_id: "str" = ""
+    new_owner_id: "MessageSender | None" = None
+    star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "business_connection_id": self.business_connection_id,
+            "received_gift_id": self.received_gift_id,
+            "new_owner_id": self.new_owner_id._to_json_dict() if self.new_owner_id is not None else None,
+            "star_count": self.star_count,
+        }
+
+
+
+@dataclass(slots=True)
+class SendResoldGift(Function["Ok"]):
+    """
+    Sends an upgraded gift that is available for resale to another user or channel chat; gifts already owned by the current user must be transferred using transferGift and can't be passed to the method
+
+    :param gift_name: Name of the upgraded gift to send
+    :param owner_id: Identifier of the user or the channel chat that will receive the gift
+    :param star_count: The amount of Telegram Stars required to pay for the gift
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="sendResoldGift", init=False, repr=False)
+    gift_name: "str" = ""
+    owner_id: "MessageSender | None" = None
+    star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "gift_name": self.gift_name,
+            "owner_id": self.owner_id._to_json_dict() if self.owner_id is not None else None,
+            "star_count": self.star_count,
+        }
+
+
+
+@dataclass(slots=True)
+class GetReceivedGifts(Function["ReceivedGifts"]):
+    """
+    Returns gifts received by the given user or chat
+
+    :param business_connection_id: Unique identifier of business connection on behalf of which to send the request; for bots only
+    :param owner_id: Identifier of the gift receiver
+    :param exclude_unsaved: Pass true to exclude gifts that aren't saved to the chat's profile page. Always true for gifts received by other users and channel chats without can_post_messages administrator right
+    :param exclude_saved: Pass true to exclude gifts that are saved to the chat's profile page. Always false for gifts received by other users and channel chats without can_post_messages administrator right
+    :param exclude_unlimited: Pass true to exclude gifts that can be purchased unlimited number of times
+    :param exclude_limited: Pass true to exclude gifts that can be purchased limited number of times
+    :param exclude_upgraded: Pass true to exclude upgraded gifts
+    :param sort_by_price: Pass true to sort results by gift price instead of send date
+    :param offset: Offset of the first entry to return as received from the previous request; use empty string to get the first chunk of results
+    :param limit: The maximum number of gifts to be returned; must be positive and can't be greater than 100. For optimal performance, the number of returned objects is chosen by TDLib and can be smaller than the specified limit
+    :return: :class:`ReceivedGifts`
+    """
+
+    _type: "str" = field(default="getReceivedGifts", init=False, repr=False)
+    business_connection_id: "str" = ""
+    owner_id: "MessageSender | None" = None
+    exclude_unsaved: "bool" = False
+    exclude_saved: "bool" = False
+    exclude_unlimited: "bool" = False
+    exclude_limited: "bool" = False
+    exclude_upgraded: "bool" = False
+    sort_by_price: "bool" = False
+    offset: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "business_connection_id": self.business_connection_id,
+            "owner_id": self.owner_id._to_json_dict() if self.owner_id is not None else None,
+            "exclude_unsaved": self.exclude_unsaved,
+            "exclude_saved": self.exclude_saved,
+            "exclude_unlimited": self.exclude_unlimited,
+            "exclude_limited": self.exclude_limited,
+            "exclude_upgraded": self.exclude_upgraded,
+            "sort_by_price": self.sort_by_price,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class GetReceivedGift(Function["ReceivedGift"]):
+    """
+    Returns information about a received gift
+
+    :param received_gift_id: Identifier of the gift
+    :return: :class:`ReceivedGift`
+    """
+
+    _type: "str" = field(default="getReceivedGift", init=False, repr=False)
+    received_gift_id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "received_gift_id": self.received_gift_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetUpgradedGift(Function["UpgradedGift"]):
+    """
+    Returns information about an upgraded gift by its name
+
+    :param name: Unique name of the upgraded gift
+    :return: :class:`UpgradedGift`
+    """
+
+    _type: "str" = field(default="getUpgradedGift", init=False, repr=False)
+    name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name,
+        }
+
+
+
+@dataclass(slots=True)
+class GetUpgradedGiftWithdrawalUrl(Function["HttpUrl"]):
+    """
+    Returns a URL for upgraded gift withdrawal in the TON blockchain as an NFT; requires owner privileges for gifts owned by a chat
+
+    :param received_gift_id: Identifier of the gift
+    :param password: The 2-step verification password of the current user
+    :return: :class:`HttpUrl`
+    """
+
+    _type: "str" = field(default="getUpgradedGiftWithdrawalUrl", init=False, repr=False)
+    received_gift_id: "str" = ""
+    password: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "received_gift_id": self.received_gift_id,
+            "password": self.password,
+        }
+
+
+
+@dataclass(slots=True)
+class SetGiftResalePrice(Function["Ok"]):
+    """
+    Changes resale price of a unique gift owned by the current user
+
+    :param received_gift_id: Identifier of the unique gift
+    :param resale_star_count: The new price for the unique gift; 0 or getOption("gift_resale_star_count_min")-getOption("gift_resale_star_count_max"). Pass 0 to disallow gift resale.
+     The current user will receive getOption("gift_resale_earnings_per_mille") Telegram Stars for each 1000 Telegram Stars paid for the gift
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setGiftResalePrice", init=False, repr=False)
+    received_gift_id: "str" = ""
+    resale_star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "received_gift_id": self.received_gift_id,
+            "resale_star_count": self.resale_star_count,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchGiftsForResale(Function["GiftsForResale"]):
+    """
+    Returns upgraded gifts that can be bought from other owners using sendResoldGift
+
+    :param gift_id: Identifier of the regular gift that was upgraded to a unique gift
+    :param order: Order in which the results will be sorted
+    :param attributes: Attributes used to filter received gifts. If multiple attributes of the same type are specified, then all of them are allowed.
+     If none attributes of specific type are specified, then all values for this attribute type are allowed
+    :param offset: Offset of the first entry to return as received from the previous request with the same order and attributes; use empty string to get the first chunk of results
+    :param limit: The maximum number of gifts to return
+    :return: :class:`GiftsForResale`
+    """
+
+    _type: "str" = field(default="searchGiftsForResale", init=False, repr=False)
+    gift_id: "int" = 0
+    order: "GiftForResaleOrder | None" = None
+    attributes: "list[UpgradedGiftAttributeId] | None" = None
+    offset: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "gift_id": self.gift_id,
+            "order": self.order._to_json_dict() if self.order is not None else None,
+            "attributes": _list_to_json(self.attributes),
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class CreateInvoiceLink(Function["HttpUrl"]):
+    """
+    Creates a link for the given invoice; for bots only
+
+    :param business_connection_id: Unique identifier of business connection on behalf of which to send the request
+    :param invoice: Information about the invoice of the type inputMessageInvoice
+    :return: :class:`HttpUrl`
+    """
+
+    _type: "str" = field(default="createInvoiceLink", init=False, repr=False)
+    business_connection_id: "str" = ""
+    invoice: "InputMessageContent | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "business_connection_id": self.business_connection_id,
+            "invoice": self.invoice._to_json_dict() if self.invoice is not None else None,
+        }
+
+
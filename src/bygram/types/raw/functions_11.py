@@ -0,0 +1,1418 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import Ok
+    from .classes_01 import Background, Backgrounds
+    from .classes_03 import TransactionDirection
+    from .classes_04 import TonTransactions, User
+    from .classes_05 import MessageSender
+    from .classes_14 import PublicForwards
+    from .classes_16 import HttpUrl
+    from .classes_17 import LanguagePackInfo, LanguagePackString, LanguagePackStrings, LocalizationTargetInfo
+    from .classes_18 import BackgroundType, DeviceToken, InputBackground, PushReceiverId
+    from .classes_20 import CanSendMessageToUserResult, NewChatPrivacySettings, OptionValue, ReadDatePrivacySettings, UserPrivacySetting, UserPrivacySettingRules
+    from .classes_21 import AccountTtl, MessageAutoDeleteTime, ReportChatResult, ReportReason
+    from .classes_22 import AutoDownloadSettingsPresets, DatabaseStatistics, FileType, NetworkStatistics, NetworkStatisticsEntry, NetworkType, StorageStatistics, StorageStatisticsFast
+    from .classes_23 import ChatRevenueStatistics, ChatStatistics, MessageStatistics, StarCount, StatisticalGraph, StoryStatistics, TMeUrls
+    from .classes_24 import ChatRevenueTransactions, StarRevenueStatistics
+
+
+@dataclass(slots=True)
+class RefundStarPayment(Function["Ok"]):
+    """
+    Refunds a previously done payment in Telegram Stars; for bots only
+
+    :param user_id: Identifier of the user that did the payment
+    :param telegram_payment_charge_id: Telegram payment identifier
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="refundStarPayment", init=False, repr=False)
+    user_id: "int" = 0
+    telegram_payment_charge_id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "telegram_payment_charge_id": self.telegram_payment_charge_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetSupportUser(Function["User"]):
+    """
+    Returns a user that can be contacted to get support
+
+    :return: :class:`User`
+    """
+
+    _type: "str" = field(default="getSupportUser", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetBackgroundUrl(Function["HttpUrl"]):
+    """
+    Constructs a persistent HTTP URL for a background
+
+    :param name: Background name
+    :param type: Background type; backgroundTypeChatTheme isn't supported
+    :return: :class:`HttpUrl`
+    """
+
+    _type: "str" = field(default="getBackgroundUrl", init=False, repr=False)
+    name: "str" = ""
+    type: "BackgroundType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchBackground(Function["Background"]):
+    """
+    Searches for a background by its name
+
+    :param name: The name of the background
+    :return: :class:`Background`
+    """
+
+    _type: "str" = field(default="searchBackground", init=False, repr=False)
+    name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name,
+        }
+
+
+
+@dataclass(slots=True)
+class SetDefaultBackground(Function["Background"]):
+    """
+    Sets default background for chats; adds the background to the list of installed backgrounds
+
+    :param background: The input background to use; pass null to create a new filled background
+    :param type: Background type; pass null to use the default type of the remote background; backgroundTypeChatTheme isn't supported
+    :param for_dark_theme: Pass true if the background is set for a dark theme
+    :return: :class:`Background`
+    """
+
+    _type: "str" = field(default="setDefaultBackground", init=False, repr=False)
+    background: "InputBackground | None" = None
+    type: "BackgroundType | None" = None
+    for_dark_theme: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "background": self.background._to_json_dict() if self.background is not None else None,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "for_dark_theme": self.for_dark_theme,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteDefaultBackground(Function["Ok"]):
+    """
+    Deletes default background for chats
+
+    :param for_dark_theme: Pass true if the background is deleted for a dark theme
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteDefaultBackground", init=False, repr=False)
+    for_dark_theme: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "for_dark_theme": self.for_dark_theme,
+        }
+
+
+
+@dataclass(slots=True)
+class GetInstalledBackgrounds(Function["Backgrounds"]):
+    """
+    Returns backgrounds installed by the user
+
+    :param for_dark_theme: Pass true to order returned backgrounds for a dark theme
+    :return: :class:`Backgrounds`
+    """
+
+    _type: "str" = field(default="getInstalledBackgrounds", init=False, repr=False)
+    for_dark_theme: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "for_dark_theme": self.for_dark_theme,
+        }
+
+
+
+@dataclass(slots=True)
+class RemoveInstalledBackground(Function["Ok"]):
+    """
+    Removes background from the list of installed backgrounds
+
+    :param background_id: The background identifier
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="removeInstalledBackground", init=False, repr=False)
+    background_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "background_id": self.background_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ResetInstalledBackgrounds(Function["Ok"]):
+    """
+    Resets list of installed backgrounds to its default value
+
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="resetInstalledBackgrounds", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetLocalizationTargetInfo(Function["LocalizationTargetInfo"]):
+    """
+    Returns information about the current localization target. This is an offline method if only_local is true. Can be called before authorization
+
+    :param only_local: Pass true to get only locally available information without sending network requests
+    :return: :class:`LocalizationTargetInfo`
+    """
+
+    _type: "str" = field(default="getLocalizationTargetInfo", init=False, repr=False)
+    only_local: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "only_local": self.only_local,
+        }
+
+
+
+@dataclass(slots=True)
+class GetLanguagePackInfo(Function["LanguagePackInfo"]):
+    """
+    Returns information about a language pack. Returned language pack identifier may be different from a provided one. Can be called before authorization
+
+    :param language_pack_id: Language pack identifier
+    :return: :class:`LanguagePackInfo`
+    """
+
+    _type: "str" = field(default="getLanguagePackInfo", init=False, repr=False)
+    language_pack_id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "language_pack_id": self.language_pack_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetLanguagePackStrings(Function["LanguagePackStrings"]):
+    """
+    Returns strings from a language pack in the current localization target by their keys. Can be called before authorization
+
+    :param language_pack_id: Language pack identifier of the strings to be returned
+    :param keys: Language pack keys of the strings to be returned; leave empty to request all available strings
+    :return: :class:`LanguagePackStrings`
+    """
+
+    _type: "str" = field(default="getLanguagePackStrings", init=False, repr=False)
+    language_pack_id: "str" = ""
+    keys: "list[str] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "language_pack_id": self.language_pack_id,
+            "keys": self.keys,
+        }
+
+
+
+@dataclass(slots=True)
+class SynchronizeLanguagePack(Function["Ok"]):
+    """
+    Fetches the latest versions of all strings from a language pack in the current localization target from the server. This method doesn't need to be called explicitly for the current used/base language packs. Can be called before authorization
+
+    :param language_pack_id: Language pack identifier
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="synchronizeLanguagePack", init=False, repr=False)
+    language_pack_id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "language_pack_id": self.language_pack_id,
+        }
+
+
+
+@dataclass(slots=True)
+class AddCustomServerLanguagePack(Function["Ok"]):
+    """
+    Adds a custom server language pack to the list of installed language packs in current localization target. Can be called before authorization
+
+    :param language_pack_id: Identifier of a language pack to be added
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="addCustomServerLanguagePack", init=False, repr=False)
+    language_pack_id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "language_pack_id": self.language_pack_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SetCustomLanguagePack(Function["Ok"]):
+    """
+    Adds or changes a custom local language pack to the current localization target
+
+    :param info: Information about the language pack. Language pack identifier must start with 'X', consist only of English letters, digits and hyphens, and must not exceed 64 characters. Can be called before authorization
+    :param strings: Strings of the new language pack
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setCustomLanguagePack", init=False, repr=False)
+    info: "LanguagePackInfo | None" = None
+    strings: "list[LanguagePackString] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "info": self.info._to_json_dict() if self.info is not None else None,
+            "strings": _list_to_json(self.strings),
+        }
+
+
+
+@dataclass(slots=True)
+class EditCustomLanguagePackInfo(Function["Ok"]):
+    """
+    Edits information about a custom local language pack in the current localization target. Can be called before authorization
+
+    :param info: New information about the custom local language pack
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="editCustomLanguagePackInfo", init=False, repr=False)
+    info: "LanguagePackInfo | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "info": self.info._to_json_dict() if self.info is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SetCustomLanguagePackString(Function["Ok"]):
+    """
+    Adds, edits or deletes a string in a custom local language pack. Can be called before authorization
+
+    :param language_pack_id: Identifier of a previously added custom local language pack in the current localization target
+    :param new_string: New language pack string
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setCustomLanguagePackString", init=False, repr=False)
+    language_pack_id: "str" = ""
+    new_string: "LanguagePackString | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "language_pack_id": self.language_pack_id,
+            "new_string": self.new_string._to_json_dict() if self.new_string is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteLanguagePack(Function["Ok"]):
+    """
+    Deletes all information about a language pack in the current localization target. The language pack which is currently in use (including base language pack) or is being synchronized can't be deleted. Can be called before authorization
+
+    :param language_pack_id: Identifier of the language pack to delete
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteLanguagePack", init=False, repr=False)
+    language_pack_id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "language_pack_id": self.language_pack_id,
+        }
+
+
+
+@dataclass(slots=True)
+class RegisterDevice(Function["PushReceiverId"]):
+    """
+    Registers the currently used device for receiving push notifications. Returns a globally unique identifier of the push notification subscription
+
+    :param device_token: Device token
+    :param other_user_ids: List of user identifiers of other users currently using the application
+    :return: :class:`PushReceiverId`
+    """
+
+    _type: "str" = field(default="registerDevice", init=False, repr=False)
+    device_token: "DeviceToken | None" = None
+    other_user_ids: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "device_token": self.device_token._to_json_dict() if self.device_token is not None else None,
+            "other_user_ids": self.other_user_ids,
+        }
+
+
+
+@dataclass(slots=True)
+class ProcessPushNotification(Function["Ok"]):
+    """
+    Handles a push notification. Returns error with code 406 if the push notification is not supported and connection to the server is required to fetch new data. Can be called before authorization
+
+    :param payload: JSON-encoded push notification payload with all fields sent by the server, and "google.sent_time" and "google.notification.sound" fields added
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="processPushNotification", init=False, repr=False)
+    payload: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "payload": self.payload,
+        }
+
+
+
+@dataclass(slots=True)
+class GetPushReceiverId(Function["PushReceiverId"]):
+    """
+    Returns a globally unique push notification subscription identifier for identification of an account, which has received a push notification. Can be called synchronously
+
+    :param payload: JSON-encoded push notification payload
+    :return: :class:`PushReceiverId`
+    """
+
+    _type: "str" = field(default="getPushReceiverId", init=False, repr=False)
+    payload: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "payload": self.payload,
+        }
+
+
+
+@dataclass(slots=True)
+class GetRecentlyVisitedTMeUrls(Function["TMeUrls"]):
+    """
+    Returns t.me URLs recently visited by a newly registered user
+
+    :param referrer: Google Play referrer to identify the user
+    :return: :class:`TMeUrls`
+    """
+
+    _type: "str" = field(default="getRecentlyVisitedTMeUrls", init=False, repr=False)
+    referrer: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "referrer": self.referrer,
+        }
+
+
+
+@dataclass(slots=True)
+class SetUserPrivacySettingRules(Function["Ok"]):
+    """
+    Changes user privacy settings
+
+    :param setting: The privacy setting
+    :param rules: The new privacy rules
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setUserPrivacySettingRules", init=False, repr=False)
+    setting: "UserPrivacySetting | None" = None
+    rules: "UserPrivacySettingRules | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "setting": self.setting._to_json_dict() if self.setting is not None else None,
+            "rules": self.rules._to_json_dict() if self.rules is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetUserPrivacySettingRules(Function["UserPrivacySettingRules"]):
+    """
+    Returns the current privacy settings
+
+    :param setting: The privacy setting
+    :return: :class:`UserPrivacySettingRules`
+    """
+
+    _type: "str" = field(default="getUserPrivacySettingRules", init=False, repr=False)
+    setting: "UserPrivacySetting | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "setting": self.setting._to_json_dict() if self.setting is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SetReadDatePrivacySettings(Function["Ok"]):
+    """
+    Changes privacy settings for message read date
+
+    :param settings: New settings
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setReadDatePrivacySettings", init=False, repr=False)
+    settings: "ReadDatePrivacySettings | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "settings": self.settings._to_json_dict() if self.settings is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetReadDatePrivacySettings(Function["ReadDatePrivacySettings"]):
+    """
+    Returns privacy settings for message read date
+
+    :return: :class:`ReadDatePrivacySettings`
+    """
+
+    _type: "str" = field(default="getReadDatePrivacySettings", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class SetNewChatPrivacySettings(Function["Ok"]):
+    """
+    Changes privacy settings for new chat creation; can be used only if getOption("can_set_new_chat_privacy_settings")
+
+    :param settings: New settings
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setNewChatPrivacySettings", init=False, repr=False)
+    settings: "NewChatPrivacySettings | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "settings": self.settings._to_json_dict() if self.settings is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetNewChatPrivacySettings(Function["NewChatPrivacySettings"]):
+    """
+    Returns privacy settings for new chat creation
+
+    :return: :class:`NewChatPrivacySettings`
+    """
+
+    _type: "str" = field(default="getNewChatPrivacySettings", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetPaidMessageRevenue(Function["StarCount"]):
+    """
+    Returns the total number of Telegram Stars received by the current user for paid messages from the given user
+
+    :param user_id: Identifier of the user
+    :return: :class:`StarCount`
+    """
+
+    _type: "str" = field(default="getPaidMessageRevenue", init=False, repr=False)
+    user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+        }
+
+
+
+@dataclass(slots=True)
+class AllowUnpaidMessagesFromUser(Function["Ok"]):
+    """
+    Allows the specified user to send unpaid private messages to the current user by adding a rule to userPrivacySettingAllowUnpaidMessages
+
+    :param user_id: Identifier of the user
+    :param refund_payments: Pass true to refund the user previously paid messages
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="allowUnpaidMessagesFromUser", init=False, repr=False)
+    user_id: "int" = 0
+    refund_payments: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "refund_payments": self.refund_payments,
+        }
+
+
+
+@dataclass(slots=True)
+class SetChatPaidMessageStarCount(Function["Ok"]):
+    """
+    Changes the amount of Telegram Stars that must be paid to send a message to a supergroup chat; requires can_restrict_members administrator right and supergroupFullInfo.can_enable_paid_messages
+
+    :param chat_id: Identifier of the supergroup chat
+    :param paid_message_star_count: The new number of Telegram Stars that must be paid for each message that is sent to the supergroup chat unless the sender is an administrator of the chat; 0-getOption("paid_message_star_count_max").
+     The supergroup will receive getOption("paid_message_earnings_per_mille") Telegram Stars for each 1000 Telegram Stars paid for message sending
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setChatPaidMessageStarCount", init=False, repr=False)
+    chat_id: "int" = 0
+    paid_message_star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "paid_message_star_count": self.paid_message_star_count,
+        }
+
+
+
+@dataclass(slots=True)
+class CanSendMessageToUser(Function["CanSendMessageToUserResult"]):
+    """
+    Check whether the current user can message another user or try to create a chat with them
+
+    :param user_id: Identifier of the other user
+    :param only_local: Pass true to get only locally available information without sending network requests
+    :return: :class:`CanSendMessageToUserResult`
+    """
+
+    _type: "str" = field(default="canSendMessageToUser", init=False, repr=False)
+    user_id: "int" = 0
+    only_local: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "only_local": self.only_local,
+        }
+
+
+
+@dataclass(slots=True)
+class GetOption(Function["OptionValue"]):
+    """
+    Returns the value of an option by its name. (Check the list of available options on https://core.telegram.org/tdlib/options.) Can be called before authorization. Can be called synchronously for options "version" and "commit_hash"
+
+    :param name: The name of the option
+    :return: :class:`OptionValue`
+    """
+
+    _type: "str" = field(default="getOption", init=False, repr=False)
+    name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name,
+        }
+
+
+
+@dataclass(slots=True)
+class SetOption(Function["Ok"]):
+    """
+    Sets the value of an option. (Check the list of available options on https://core.telegram.org/tdlib/options.) Only writable options can be set. Can be called before authorization
+
+    :param name: The name of the option
+    :param value: The new value of the option; pass null to reset option value to a default value
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setOption", init=False, repr=False)
+    name: "str" = ""
+    value: "OptionValue | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name,
+            "value": self.value._to_json_dict() if self.value is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SetAccountTtl(Function["Ok"]):
+    """
+    Changes the period of inactivity after which the account of the current user will automatically be deleted
+
+    :param ttl: New account TTL
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setAccountTtl", init=False, repr=False)
+    ttl: "AccountTtl | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "ttl": self.ttl._to_json_dict() if self.ttl is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetAccountTtl(Function["AccountTtl"]):
+    """
+    Returns the period of inactivity after which the account of the current user will automatically be deleted
+
+    :return: :class:`AccountTtl`
+    """
+
+    _type: "str" = field(default="getAccountTtl", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteAccount(Function["Ok"]):
+    """
+    Deletes the account of the current user, deleting all information associated with the user from the server. The phone number of the account can be used to create a new account. Can be called before authorization when the current authorization state is authorizationStateWaitPassword
+
+    :param reason: The reason why the account was deleted; optional
+    :param password: The 2-step verification password of the current user. If the current user isn't authorized, then an empty string can be passed and account deletion can be canceled within one week
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteAccount", init=False, repr=False)
+    reason: "str" = ""
+    password: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "reason": self.reason,
+            "password": self.password,
+        }
+
+
+
+@dataclass(slots=True)
+class SetDefaultMessageAutoDeleteTime(Function["Ok"]):
+    """
+    Changes the default message auto-delete time for new chats
+
+    :param message_auto_delete_time: New default message auto-delete time; must be from 0 up to 365 * 86400 and be divisible by 86400. If 0, then messages aren't deleted automatically
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setDefaultMessageAutoDeleteTime", init=False, repr=False)
+    message_auto_delete_time: "MessageAutoDeleteTime | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "message_auto_delete_time": self.message_auto_delete_time._to_json_dict() if self.message_auto_delete_time is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetDefaultMessageAutoDeleteTime(Function["MessageAutoDeleteTime"]):
+    """
+    Returns default message auto-delete time setting for new chats
+
+    :return: :class:`MessageAutoDeleteTime`
+    """
+
+    _type: "str" = field(default="getDefaultMessageAutoDeleteTime", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class RemoveChatActionBar(Function["Ok"]):
+    """
+    Removes a chat action bar without any other action
+
+    :param chat_id: Chat identifier
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="removeChatActionBar", init=False, repr=False)
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class ReportChat(Function["ReportChatResult"]):
+    """
+    Reports a chat to the Telegram moderators. A chat can be reported only from the chat action bar, or if chat.can_be_reported
+
+    :param chat_id: Chat identifier
+    :param option_id: Option identifier chosen by the user; leave empty for the initial request
+    :param message_ids: Identifiers of reported messages. Use messageProperties.can_report_chat to check whether the message can be reported
+    :param text: Additional report details if asked by the server; 0-1024 characters; leave empty for the initial request
+    :return: :class:`ReportChatResult`
+    """
+
+    _type: "str" = field(default="reportChat", init=False, repr=False)
+    chat_id: "int" = 0
+    option_id: "bytes" = b""
+    message_ids: "list[int] | None" = None
+    text: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "option_id": _bytes_to_json(self.option_id),
+            "message_ids": self.message_ids,
+            "text": self.text,
+        }
+
+
+
+@dataclass(slots=True)
+class ReportChatPhoto(Function["Ok"]):
+    """
+    Reports a chat photo to the Telegram moderators. A chat photo can be reported only if chat.can_be_reported
+
+    :param chat_id: Chat identifier
+    :param file_id: Identifier of the photo to report. Only full photos from chatPhoto can be reported
+    :param reason: The reason for reporting the chat photo
+    :param text: Additional report details; 0-1024 characters
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="reportChatPhoto", init=False, repr=False)
+    chat_id: "int" = 0
+    file_id: "int" = 0
+    reason: "ReportReason | None" = None
+    text: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "file_id": self.file_id,
+            "reason": self.reason._to_json_dict() if self.reason is not None else None,
+            "text": self.text,
+        }
+
+
+
+@dataclass(slots=True)
+class ReportMessageReactions(Function["Ok"]):
+    """
+    Reports reactions set on a message to the Telegram moderators. Reactions on a message can be reported only if messageProperties.can_report_reactions
+
+    :param chat_id: Chat identifier
+    :param message_id: Message identifier
+    :param sender_id: Identifier of the sender, which added the reaction
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="reportMessageReactions", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    sender_id: "MessageSender | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "sender_id": self.sender_id._to_json_dict() if self.sender_id is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatRevenueStatistics(Function["ChatRevenueStatistics"]):
+    """
+    Returns detailed revenue statistics about a chat. Currently, this method can be used only for channels if supergroupFullInfo.can_get_revenue_statistics == true or bots if userFullInfo.bot_info.can_get_revenue_statistics == true
+
+    :param chat_id: Chat identifier
+    :param is_dark: Pass true if a dark theme is used by the application
+    :return: :class:`ChatRevenueStatistics`
+    """
+
+    _type: "str" = field(default="getChatRevenueStatistics", init=False, repr=False)
+    chat_id: "int" = 0
+    is_dark: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "is_dark": self.is_dark,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatRevenueWithdrawalUrl(Function["HttpUrl"]):
+    """
+    Returns a URL for chat revenue withdrawal; requires owner privileges in the channel chat or the bot. Currently, this method can be used only if getOption("can_withdraw_chat_revenue") for channels with supergroupFullInfo.can_get_revenue_statistics == true or bots with userFullInfo.bot_info.can_get_revenue_statistics == true
+
+    :param chat_id: Chat identifier
+    :param password: The 2-step verification password of the current user
+    :return: :class:`HttpUrl`
+    """
+
+    _type: "str" = field(default="getChatRevenueWithdrawalUrl", init=False, repr=False)
+    chat_id: "int" = 0
+    password: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "password": self.password,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatRevenueTransactions(Function["ChatRevenueTransactions"]):
+    """
+    Returns the list of revenue transactions for a chat. Currently, this method can be used only for channels if supergroupFullInfo.can_get_revenue_statistics == true or bots if userFullInfo.bot_info.can_get_revenue_statistics == true
+
+    :param chat_id: Chat identifier
+    :param offset: Offset of the first transaction to return as received from the previous request; use empty string to get the first chunk of results
+    :param limit: The maximum number of transactions to be returned; up to 100
+    :return: :class:`ChatRevenueTransactions`
+    """
+
+    _type: "str" = field(default="getChatRevenueTransactions", init=False, repr=False)
+    chat_id: "int" = 0
+    offset: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class GetTonTransactions(Function["TonTransactions"]):
+    """
+    Returns the list of Toncoin transactions of the current user
+
+    :param direction: Direction of the transactions to receive; pass null to get all transactions
+    :param offset: Offset of the first transaction to return as received from the previous request; use empty string to get the first chunk of results
+    :param limit: The maximum number of transactions to return
+    :return: :class:`TonTransactions`
+    """
+
+    _type: "str" = field(default="getTonTransactions", init=False, repr=False)
+    direction: "TransactionDirection | None" = None
+    offset: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "direction": self.direction._to_json_dict() if self.direction is not None else None,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class GetStarRevenueStatistics(Function["StarRevenueStatistics"]):
+    """
+    Returns detailed Telegram Star revenue statistics
+
+    :param owner_id: Identifier of the owner of the Telegram Stars; can be identifier of the current user, an owned bot, or a supergroup or a channel chat with supergroupFullInfo.can_get_star_revenue_statistics == true
+    :param is_dark: Pass true if a dark theme is used by the application
+    :return: :class:`StarRevenueStatistics`
+    """
+
+    _type: "str" = field(default="getStarRevenueStatistics", init=False, repr=False)
+    owner_id: "MessageSender | None" = None
+    is_dark: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "owner_id": self.owner_id._to_json_dict() if self.owner_id is not None else None,
+            "is_dark": self.is_dark,
+        }
+
+
+
+@dataclass(slots=True)
+class GetStarWithdrawalUrl(Function["HttpUrl"]):
+    """
+    Returns a URL for Telegram Star withdrawal
+
+    :param owner_id: Identifier of the owner of the Telegram Stars; can be identifier of the current user, an owned bot, or an owned supergroup or channel chat
+    :param star_count: The number of Telegram Stars to withdraw; must be between getOption("star_withdrawal_count_min") and getOption("star_withdrawal_count_max")
+    :param password: The 2-step verification password of the current user
+    :return: :class:`HttpUrl`
+    """
+
+    _type: "str" = field(default="getStarWithdrawalUrl", init=False, repr=False)
+    owner_id: "MessageSender | None" = None
+    star_count: "int" = 0
+    password: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "owner_id": self.owner_id._to_json_dict() if self.owner_id is not None else None,
+            "star_count": self.star_count,
+            "password": self.password,
+        }
+
+
+
+@dataclass(slots=True)
+class GetStarAdAccountUrl(Function["HttpUrl"]):
+    """
+    Returns a URL for a Telegram Ad platform account that can be used to set up advertisements for the chat paid in the owned Telegram Stars
+
+    :param owner_id: Identifier of the owner of the Telegram Stars; can be identifier of an owned bot, or identifier of an owned channel chat
+    :return: :class:`HttpUrl`
+    """
+
+    _type: "str" = field(default="getStarAdAccountUrl", init=False, repr=False)
+    owner_id: "MessageSender | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "owner_id": self.owner_id._to_json_dict() if self.owner_id is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetChatStatistics(Function["ChatStatistics"]):
+    """
+    Returns detailed statistics about a chat. Currently, this method can be used only for supergroups and channels. Can be used only if supergroupFullInfo.can_get_statistics == true
+
+    :param chat_id: Chat identifier
+    :param is_dark: Pass true if a dark theme is used by the application
+    :return: :class:`ChatStatistics`
+    """
+
+    _type: "str" = field(default="getChatStatistics", init=False, repr=False)
+    chat_id: "int" = 0
+    is_dark: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "is_dark": self.is_dark,
+        }
+
+
+
+@dataclass(slots=True)
+class GetMessageStatistics(Function["MessageStatistics"]):
+    """
+    Returns detailed statistics about a message. Can be used only if messageProperties.can_get_statistics == true
+
+    :param chat_id: Chat identifier
+    :param message_id: Message identifier
+    :param is_dark: Pass true if a dark theme is used by the application
+    :return: :class:`MessageStatistics`
+    """
+
+    _type: "str" = field(default="getMessageStatistics", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    is_dark: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "is_dark": self.is_dark,
+        }
+
+
+
+@dataclass(slots=True)
+class GetMessagePublicForwards(Function["PublicForwards"]):
+    """
+    Returns forwarded copies of a channel message to different public channels and public reposts as a story. Can be used only if messageProperties.can_get_statistics == true. For optimal performance, the number of returned messages and stories is chosen by TDLib
+
+    :param chat_id: Chat identifier of the message
+    :param message_id: Message identifier
+    :param offset: Offset of the first entry to return as received from the previous request; use empty string to get the first chunk of results
+    :param limit: The maximum number of messages and stories to be returned; must be positive and can't be greater than 100. For optimal performance, the number of returned objects is chosen by TDLib and can be smaller than the specified limit
+    :return: :class:`PublicForwards`
+    """
+
+    _type: "str" = field(default="getMessagePublicForwards", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+    offset: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class GetStoryStatistics(Function["StoryStatistics"]):
+    """
+    Returns detailed statistics about a story. Can be used only if story.can_get_statistics == true
+
+    :param chat_id: Chat identifier
+    :param story_id: Story identifier
+    :param is_dark: Pass true if a dark theme is used by the application
+    :return: :class:`StoryStatistics`
+    """
+
+    _type: "str" = field(default="getStoryStatistics", init=False, repr=False)
+    chat_id: "int" = 0
+    story_id: "int" = 0
+    is_dark: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "story_id": self.story_id,
+            "is_dark": self.is_dark,
+        }
+
+
+
+@dataclass(slots=True)
+class GetStatisticalGraph(Function["StatisticalGraph"]):
+    """
+    Loads an asynchronous or a zoomed in statistical graph
+
+    :param chat_id: Chat identifier
+    :param token: The token for graph loading
+    :param x: X-value for zoomed in graph or 0 otherwise
+    :return: :class:`StatisticalGraph`
+    """
+
+    _type: "str" = field(default="getStatisticalGraph", init=False, repr=False)
+    chat_id: "int" = 0
+    token: "str" = ""
+    x: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "token": self.token,
+            "x": self.x,
+        }
+
+
+
+@dataclass(slots=True)
+class GetStorageStatistics(Function["StorageStatistics"]):
+    """
+    Returns storage usage statistics. Can be called before authorization
+
+    :param chat_limit: The maximum number of chats with the largest storage usage for which separate statistics need to be returned. All other chats will be grouped in entries with chat_id == 0. If the chat info database is not used, the chat_limit is ignored and is always set to 0
+    :return: :class:`StorageStatistics`
+    """
+
+    _type: "str" = field(default="getStorageStatistics", init=False, repr=False)
+    chat_limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_limit": self.chat_limit,
+        }
+
+
+
+@dataclass(slots=True)
+class GetStorageStatisticsFast(Function["StorageStatisticsFast"]):
+    """
+    Quickly returns approximate storage usage statistics. Can be called before authorization
+
+    :return: :class:`StorageStatisticsFast`
+    """
+
+    _type: "str" = field(default="getStorageStatisticsFast", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetDatabaseStatistics(Function["DatabaseStatistics"]):
+    """
+    Returns database statistics
+
+    :return: :class:`DatabaseStatistics`
+    """
+
+    _type: "str" = field(default="getDatabaseStatistics", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class OptimizeStorage(Function["StorageStatistics"]):
+    """
+    Optimizes storage usage, i.e. deletes some files and returns new storage usage statistics. Secret thumbnails can't be deleted
+
+    :param size: Limit on the total size of files after deletion, in bytes. Pass -1 to use the default limit
+    :param ttl: Limit on the time that has passed since the last time a file was accessed (or creation time for some filesystems). Pass -1 to use the default limit
+    :param count: Limit on the total number of files after deletion. Pass -1 to use the default limit
+    :param immunity_delay: The amount of time after the creation of a file during which it can't be deleted, in seconds. Pass -1 to use the default value
+    :param file_types: If non-empty, only files with the given types are considered. By default, all types except thumbnails, profile photos, stickers and wallpapers are deleted
+    :param chat_ids: If non-empty, only files from the given chats are considered. Use 0 as chat identifier to delete files not belonging to any chat (e.g., profile photos)
+    :param exclude_chat_ids: If non-empty, files from the given chats are excluded. Use 0 as chat identifier to exclude all files not belonging to any chat (e.g., profile photos)
+    :param return_deleted_file_statistics: Pass true if statistics about the files that were deleted must be returned instead of the whole storage usage statistics. Affects only returned statistics
+    :param chat_limit: Same as in getStorageStatistics. Affects only returned statistics
+    :return: :class:`StorageStatistics`
+    """
+
+    _type: "str" = field(default="optimizeStorage", init=False, repr=False)
+    size: "int" = 0
+    ttl: "int" = 0
+    count: "int" = 0
+    immunity_delay: "int" = 0
+    file_types: "list[FileType] | None" = None
+    chat_ids: "list[int] | None" = None
+    exclude_chat_ids: "list[int] | None" = None
+    return_deleted_file_statistics: "bool" = False
+    chat_limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "size": self.size,
+            "ttl": self.ttl,
+            "count": self.count,
+            "immunity_delay": self.immunity_delay,
+            "file_types": _list_to_json(self.file_types),
+            "chat_ids": self.chat_ids,
+            "exclude_chat_ids": self.exclude_chat_ids,
+            "return_deleted_file_statistics": self.return_deleted_file_statistics,
+            "chat_limit": self.chat_limit,
+        }
+
+
+
+@dataclass(slots=True)
+class SetNetworkType(Function["Ok"]):
+    """
+    Sets the current network type. Can be called before authorization. Calling this method forces all network connections to reopen, mitigating the delay in switching between different networks, so it must be called whenever the network is changed, even if the network type remains the same. Network type is used to check whether the library can use the network at all and also for collecting detailed network data usage statistics
+
+    :param type: The new network type; pass null to set network type to networkTypeOther
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setNetworkType", init=False, repr=False)
+    type: "NetworkType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetNetworkStatistics(Function["NetworkStatistics"]):
+    """
+    Returns network data usage statistics. Can be called before authorization
+
+    :param only_current: Pass true to get statistics only for the current library launch
+    :return: :class:`NetworkStatistics`
+    """
+
+    _type: "str" = field(default="getNetworkStatistics", init=False, repr=False)
+    only_current: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "only_current": self.only_current,
+        }
+
+
+
+@dataclass(slots=True)
+class AddNetworkStatistics(Function["Ok"]):
+    """
+    Adds the specified data to data usage statistics. Can be called before authorization
+
+    :param entry: The network statistics entry with the data to be added to statistics
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="addNetworkStatistics", init=False, repr=False)
+    entry: "NetworkStatisticsEntry | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "entry": self.entry._to_json_dict() if self.entry is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class ResetNetworkStatistics(Function["Ok"]):
+    """
+    Resets all network data usage statistics to zero. Can be called before authorization
+
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="resetNetworkStatistics", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetAutoDownloadSettingsPresets(Function["AutoDownloadSettingsPresets"]):
+    """
+    Returns auto-download settings presets for the current user
+
+    :return: :class:`AutoDownloadSettingsPresets`
+    """
+
+    _type: "str" = field(default="getAutoDownloadSettingsPresets", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
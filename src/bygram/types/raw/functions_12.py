@@ -0,0 +1,1465 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import EmailAddressAuthenticationCodeInfo, File, FormattedText, InputFile, Ok
+    from .classes_01 import Location, MaskPosition, Sticker, StickerFormat, StickerType
+    from .classes_02 import AffiliateProgramParameters, AffiliateProgramSortOrder, AffiliateType, StarSubscriptions
+    from .classes_03 import ConnectedAffiliateProgram, FoundAffiliatePrograms, PremiumGiftCodeInfo, PremiumGiftPaymentOptions, PremiumGiveawayPaymentOptions, StarGiveawayPaymentOptions, StarPaymentOptions, TransactionDirection
+    from .classes_04 import GiveawayInfo, StarTransactions
+    from .classes_05 import MessageSender
+    from .classes_07 import Chat
+    from .classes_09 import BankCardInfo
+    from .classes_10 import GiveawayParameters, InputPassportElement, PassportElement, PassportElementType
+    from .classes_11 import InputPassportElementError, PassportAuthorizationForm, PassportElements, PassportElementsWithErrors
+    from .classes_13 import StickerSet, StickerSets, Stickers
+    from .classes_17 import PremiumFeature, PremiumLimitType
+    from .classes_18 import PremiumFeatures, PremiumLimit, PremiumSource, PremiumState, StorePaymentPurpose, StoreTransaction
+    from .classes_19 import CheckStickerSetNameResult
+    from .classes_22 import AutoDownloadSettings, AutosaveSettings, AutosaveSettingsScope, NetworkType, ScopeAutosaveSettings
+    from .classes_23 import InputSticker, Text
+
+
+@dataclass(slots=True)
+class SetAutoDownloadSettings(Function["Ok"]):
+    """
+    Sets auto-download settings
+
+    :param settings: New user auto-download settings
+    :param type: Type of the network for which the new settings are relevant
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setAutoDownloadSettings", init=False, repr=False)
+    settings: "AutoDownloadSettings | None" = None
+    type: "NetworkType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "settings": self.settings._to_json_dict() if self.settings is not None else None,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetAutosaveSettings(Function["AutosaveSettings"]):
+    """
+    Returns autosave settings for the current user
+
+    :return: :class:`AutosaveSettings`
+    """
+
+    _type: "str" = field(default="getAutosaveSettings", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class SetAutosaveSettings(Function["Ok"]):
+    """
+    Sets autosave settings for the given scope. The method is guaranteed to work only after at least one call to getAutosaveSettings
+
+    :param scope: Autosave settings scope
+    :param settings: New autosave settings for the scope; pass null to set autosave settings to default
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setAutosaveSettings", init=False, repr=False)
+    scope: "AutosaveSettingsScope | None" = None
+    settings: "ScopeAutosaveSettings | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "scope": self.scope._to_json_dict() if self.scope is not None else None,
+            "settings": self.settings._to_json_dict() if self.settings is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class ClearAutosaveSettingsExceptions(Function["Ok"]):
+    """
+    Clears the list of all autosave settings exceptions. The method is guaranteed to work only after at least one call to getAutosaveSettings
+
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="clearAutosaveSettingsExceptions", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetBankCardInfo(Function["BankCardInfo"]):
+    """
+    Returns information about a bank card
+
+    :param bank_card_number: The bank card number
+    :return: :class:`BankCardInfo`
+    """
+
+    _type: "str" = field(default="getBankCardInfo", init=False, repr=False)
+    bank_card_number: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bank_card_number": self.bank_card_number,
+        }
+
+
+
+@dataclass(slots=True)
+class GetPassportElement(Function["PassportElement"]):
+    """
+    Returns one of the available Telegram Passport elements
+
+    :param type: Telegram Passport element type
+    :param password: The 2-step verification password of the current user
+    :return: :class:`PassportElement`
+    """
+
+    _type: "str" = field(default="getPassportElement", init=False, repr=False)
+    type: "PassportElementType | None" = None
+    password: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "password": self.password,
+        }
+
+
+
+@dataclass(slots=True)
+class GetAllPassportElements(Function["PassportElements"]):
+    """
+    Returns all available Telegram Passport elements
+
+    :param password: The 2-step verification password of the current user
+    :return: :class:`PassportElements`
+    """
+
+    _type: "str" = field(default="getAllPassportElements", init=False, repr=False)
+    password: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "password": self.password,
+        }
+
+
+
+@dataclass(slots=True)
+class SetPassportElement(Function["PassportElement"]):
+    """
+    Adds an element to the user's Telegram Passport. May return an error with a message "PHONE_VERIFICATION_NEEDED" or "EMAIL_VERIFICATION_NEEDED" if the chosen phone number or the chosen email address must be verified first
+
+    :param element: Input Telegram Passport element
+    :param password: The 2-step verification password of the current user
+    :return: :class:`PassportElement`
+    """
+
+    _type: "str" = field(default="setPassportElement", init=False, repr=False)
+    element: "InputPassportElement | None" = None
+    password: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "element": self.element._to_json_dict() if self.element is not None else None,
+            "password": self.password,
+        }
+
+
+
+@dataclass(slots=True)
+class DeletePassportElement(Function["Ok"]):
+    """
+    Deletes a Telegram Passport element
+
+    :param type: Element type
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deletePassportElement", init=False, repr=False)
+    type: "PassportElementType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SetPassportElementErrors(Function["Ok"]):
+    """
+    Informs the user that some of the elements in their Telegram Passport contain errors; for bots only. The user will not be able to resend the elements, until the errors are fixed
+
+    :param user_id: User identifier
+    :param errors: The errors
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setPassportElementErrors", init=False, repr=False)
+    user_id: "int" = 0
+    errors: "list[InputPassportElementError] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "errors": _list_to_json(self.errors),
+        }
+
+
+
+@dataclass(slots=True)
+class GetPreferredCountryLanguage(Function["Text"]):
+    """
+    Returns an IETF language tag of the language preferred in the country, which must be used to fill native fields in Telegram Passport personal details. Returns a 404 error if unknown
+
+    :param country_code: A two-letter ISO 3166-1 alpha-2 country code
+    :return: :class:`Text`
+    """
+
+    _type: "str" = field(default="getPreferredCountryLanguage", init=False, repr=False)
+    country_code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "country_code": self.country_code,
+        }
+
+
+
+@dataclass(slots=True)
+class SendEmailAddressVerificationCode(Function["EmailAddressAuthenticationCodeInfo"]):
+    """
+    Sends a code to verify an email address to be added to a user's Telegram Passport
+
+    :param email_address: Email address
+    :return: :class:`EmailAddressAuthenticationCodeInfo`
+    """
+
+    _type: "str" = field(default="sendEmailAddressVerificationCode", init=False, repr=False)
+    email_address: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "email_address": self.email_address,
+        }
+
+
+
+@dataclass(slots=True)
+class ResendEmailAddressVerificationCode(Function["EmailAddressAuthenticationCodeInfo"]):
+    """
+    Resends the code to verify an email address to be added to a user's Telegram Passport
+
+    :return: :class:`EmailAddressAuthenticationCodeInfo`
+    """
+
+    _type: "str" = field(default="resendEmailAddressVerificationCode", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class CheckEmailAddressVerificationCode(Function["Ok"]):
+    """
+    Checks the email address verification code for Telegram Passport
+
+    :param code: Verification code to check
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="checkEmailAddressVerificationCode", init=False, repr=False)
+    code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "code": self.code,
+        }
+
+
+
+@dataclass(slots=True)
+class GetPassportAuthorizationForm(Function["PassportAuthorizationForm"]):
+    """
+    Returns a Telegram Passport authorization form for sharing data with a service
+
+    :param bot_user_id: User identifier of the service's bot
+    :param scope: Telegram Passport element types requested by the service
+    :param public_key: Service's public key
+    :param nonce: Unique request identifier provided by the service
+    :return: :class:`PassportAuthorizationForm`
+    """
+
+    _type: "str" = field(default="getPassportAuthorizationForm", init=False, repr=False)
+    bot_user_id: "int" = 0
+    scope: "str" = ""
+    public_key: "str" = ""
+    nonce: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "bot_user_id": self.bot_user_id,
+            "scope": self.scope,
+            "public_key": self.public_key,
+            "nonce": self.nonce,
+        }
+
+
+
+@dataclass(slots=True)
+class GetPassportAuthorizationFormAvailableElements(Function["PassportElementsWithErrors"]):
+    """
+    Returns already available Telegram Passport elements suitable for completing a Telegram Passport authorization form. Result can be received only once for each authorization form
+
+    :param authorization_form_id: Authorization form identifier
+    :param password: The 2-step verification password of the current user
+    :return: :class:`PassportElementsWithErrors`
+    """
+
+    _type: "str" = field(default="getPassportAuthorizationFormAvailableElements", init=False, repr=False)
+    authorization_form_id: "int" = 0
+    password: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "authorization_form_id": self.authorization_form_id,
+            "password": self.password,
+        }
+
+
+
+@dataclass(slots=True)
+class SendPassportAuthorizationForm(Function["Ok"]):
+    """
+    Sends a Telegram Passport authorization form, effectively sharing data with the service. This method must be called after getPassportAuthorizationFormAvailableElements if some previously available elements are going to be reused
+
+    :param authorization_form_id: Authorization form identifier
+    :param types: Types of Telegram Passport elements chosen by user to complete the authorization form
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="sendPassportAuthorizationForm", init=False, repr=False)
+    authorization_form_id: "int" = 0
+    types: "list[PassportElementType] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "authorization_form_id": self.authorization_form_id,
+            "types": _list_to_json(self.types),
+        }
+
+
+
+@dataclass(slots=True)
+class SetBotUpdatesStatus(Function["Ok"]):
+    """
+    Informs the server about the number of pending bot updates if they haven't been processed for a long time; for bots only
+
+    :param pending_update_count: The number of pending updates
+    :param error_message: The last error message
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setBotUpdatesStatus", init=False, repr=False)
+    pending_update_count: "int" = 0
+    error_message: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "pending_update_count": self.pending_update_count,
+            "error_message": self.error_message,
+        }
+
+
+
+@dataclass(slots=True)
+class UploadStickerFile(Function["File"]):
+    """
+    Uploads a file with a sticker; returns the uploaded file
+
+    :param user_id: Sticker file owner; ignored for regular users
+    :param sticker_format: Sticker format
+    :param sticker: File file to upload; must fit in a 512x512 square. For WEBP stickers the file must be in WEBP or PNG format, which will be converted to WEBP server-side.
+     See https://core.telegram.org/animated_stickers#technical-requirements for technical requirements
+    :return: :class:`File`
+    """
+
+    _type: "str" = field(default="uploadStickerFile", init=False, repr=False)
+    user_id: "int" = 0
+    sticker_format: "StickerFormat | None" = None
+    sticker: "InputFile | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "sticker_format": self.sticker_format._to_json_dict() if self.sticker_format is not None else None,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetSuggestedStickerSetName(Function["Text"]):
+    """
+    Returns a suggested name for a new sticker set with a given title
+
+    :param title: Sticker set title; 1-64 characters
+    :return: :class:`Text`
+    """
+
+    _type: "str" = field(default="getSuggestedStickerSetName", init=False, repr=False)
+    title: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "title": self.title,
+        }
+
+
+
+@dataclass(slots=True)
+class CheckStickerSetName(Function["CheckStickerSetNameResult"]):
+    """
+    Checks whether a name can be used for a new sticker set
+
+    :param name: Name to be checked
+    :return: :class:`CheckStickerSetNameResult`
+    """
+
+    _type: "str" = field(default="checkStickerSetName", init=False, repr=False)
+    name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name,
+        }
+
+
+
+@dataclass(slots=True)
+class CreateNewStickerSet(Function["StickerSet"]):
+    """
+    Creates a new sticker set. Returns the newly created sticker set
+
+    :param user_id: Sticker set owner; ignored for regular users
+    :param title: Sticker set title; 1-64 characters
+    :param name: Sticker set name. Can contain only English letters, digits and underscores. Must end with *"_by_<bot username>"* (*<bot_username>* is case insensitive) for bots; 0-64 characters.
+     If empty, then the name returned by getSuggestedStickerSetName will be used automatically
+    :param sticker_type: Type of the stickers in the set
+    :param needs_repainting: Pass true if stickers in the sticker set must be repainted; for custom emoji sticker sets only
+    :param stickers: List of stickers to be added to the set; 1-200 stickers for custom emoji sticker sets, and 1-120 stickers otherwise. For TGS stickers, uploadStickerFile must be used before the sticker is shown
+    :param source: Source of the sticker set; may be empty if unknown
+    :return: :class:`StickerSet`
+    """
+
+    _type: "str" = field(default="createNewStickerSet", init=False, repr=False)
+    user_id: "int" = 0
+    title: "str" = ""
+    name: "str" = ""
+    sticker_type: "StickerType | None" = None
+    needs_repainting: "bool" = False
+    stickers: "list[InputSticker] | None" = None
+    source: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "title": self.title,
+            "name": self.name,
+            "sticker_type": self.sticker_type._to_json_dict() if self.sticker_type is not None else None,
+            "needs_repainting": self.needs_repainting,
+            "stickers": _list_to_json(self.stickers),
+            "source": self.source,
+        }
+
+
+
+@dataclass(slots=True)
+class AddStickerToSet(Function["Ok"]):
+    """
+    Adds a new sticker to a set
+
+    :param user_id: Sticker set owner; ignored for regular users
+    :param name: Sticker set name. The sticker set must be owned by the current user, and contain less than 200 stickers for custom emoji sticker sets and less than 120 otherwise
+    :param sticker: Sticker to add to the set
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="addStickerToSet", init=False, repr=False)
+    user_id: "int" = 0
+    name: "str" = ""
+    sticker: "InputSticker | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "name": self.name,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class ReplaceStickerInSet(Function["Ok"]):
+    """
+    Replaces existing sticker in a set. The function is equivalent to removeStickerFromSet, then addStickerToSet, then setStickerPositionInSet
+
+    :param user_id: Sticker set owner; ignored for regular users
+    :param name: Sticker set name. The sticker set must be owned by the current user
+    :param old_sticker: Sticker to remove from the set
+    :param new_sticker: Sticker to add to the set
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="replaceStickerInSet", init=False, repr=False)
+    user_id: "int" = 0
+    name: "str" = ""
+    old_sticker: "InputFile | None" = None
+    new_sticker: "InputSticker | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "name": self.name,
+            "old_sticker": self.old_sticker._to_json_dict() if self.old_sticker is not None else None,
+            "new_sticker": self.new_sticker._to_json_dict() if self.new_sticker is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SetStickerSetThumbnail(Function["Ok"]):
+    """
+    Sets a sticker set thumbnail
+
+    :param user_id: Sticker set owner; ignored for regular users
+    :param name: Sticker set name. The sticker set must be owned by the current user
+    :param thumbnail: Thumbnail to set; pass null to remove the sticker set thumbnail
+    :param format: Format of the thumbnail; pass null if thumbnail is removed
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setStickerSetThumbnail", init=False, repr=False)
+    user_id: "int" = 0
+    name: "str" = ""
+    thumbnail: "InputFile | None" = None
+    format: "StickerFormat | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "name": self.name,
+            "thumbnail": self.thumbnail._to_json_dict() if self.thumbnail is not None else None,
+            "format": self.format._to_json_dict() if self.format is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SetCustomEmojiStickerSetThumbnail(Function["Ok"]):
+    """
+    Sets a custom emoji sticker set thumbnail
+
+    :param name: Sticker set name. The sticker set must be owned by the current user
+    :param custom_emoji_id: Identifier of the custom emoji from the sticker set, which will be set as sticker set thumbnail; pass 0 to remove the sticker set thumbnail
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setCustomEmojiStickerSetThumbnail", init=False, repr=False)
+    name: "str" = ""
+    custom_emoji_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name,
+            "custom_emoji_id": self.custom_emoji_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SetStickerSetTitle(Function["Ok"]):
+    """
+    Sets a sticker set title
+
+    :param name: Sticker set name. The sticker set must be owned by the current user
+    :param title: New sticker set title
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setStickerSetTitle", init=False, repr=False)
+    name: "str" = ""
+    title: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name,
+            "title": self.title,
+        }
+
+
+
+@dataclass(slots=True)
+class DeleteStickerSet(Function["Ok"]):
+    """
+    Completely deletes a sticker set
+
+    :param name: Sticker set name. The sticker set must be owned by the current user
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="deleteStickerSet", init=False, repr=False)
+    name: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "name": self.name,
+        }
+
+
+
+@dataclass(slots=True)
+class SetStickerPositionInSet(Function["Ok"]):
+    """
+    Changes the position of a sticker in the set to which it belongs. The sticker set must be owned by the current user
+
+    :param sticker: Sticker
+    :param position: New position of the sticker in the set, 0-based
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setStickerPositionInSet", init=False, repr=False)
+    sticker: "InputFile | None" = None
+    position: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+            "position": self.position,
+        }
+
+
+
+@dataclass(slots=True)
+class RemoveStickerFromSet(Function["Ok"]):
+    """
+    Removes a sticker from the set to which it belongs. The sticker set must be owned by the current user
+
+    :param sticker: Sticker to remove from the set
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="removeStickerFromSet", init=False, repr=False)
+    sticker: "InputFile | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SetStickerEmojis(Function["Ok"]):
+    """
+    Changes the list of emojis corresponding to a sticker. The sticker must belong to a regular or custom emoji sticker set that is owned by the current user
+
+    :param sticker: Sticker
+    :param emojis: New string with 1-20 emoji corresponding to the sticker
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setStickerEmojis", init=False, repr=False)
+    sticker: "InputFile | None" = None
+    emojis: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+            "emojis": self.emojis,
+        }
+
+
+
+@dataclass(slots=True)
+class SetStickerKeywords(Function["Ok"]):
+    """
+    Changes the list of keywords of a sticker. The sticker must belong to a regular or custom emoji sticker set that is owned by the current user
+
+    :param sticker: Sticker
+    :param keywords: List of up to 20 keywords with total length up to 64 characters, which can be used to find the sticker
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setStickerKeywords", init=False, repr=False)
+    sticker: "InputFile | None" = None
+    keywords: "list[str] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+            "keywords": self.keywords,
+        }
+
+
+
+@dataclass(slots=True)
+class SetStickerMaskPosition(Function["Ok"]):
+    """
+    Changes the mask position of a mask sticker. The sticker must belong to a mask sticker set that is owned by the current user
+
+    :param sticker: Sticker
+    :param mask_position: Position where the mask is placed; pass null to remove mask position
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setStickerMaskPosition", init=False, repr=False)
+    sticker: "InputFile | None" = None
+    mask_position: "MaskPosition | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "sticker": self.sticker._to_json_dict() if self.sticker is not None else None,
+            "mask_position": self.mask_position._to_json_dict() if self.mask_position is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetOwnedStickerSets(Function["StickerSets"]):
+    """
+    Returns sticker sets owned by the current user
+
+    :param offset_sticker_set_id: Identifier of the sticker set from which to return owned sticker sets; use 0 to get results from the beginning
+    :param limit: The maximum number of sticker sets to be returned; must be positive and can't be greater than 100. For optimal performance, the number of returned objects is chosen by TDLib and can be smaller than the specified limit
+    :return: :class:`StickerSets`
+    """
+
+    _type: "str" = field(default="getOwnedStickerSets", init=False, repr=False)
+    offset_sticker_set_id: "int" = 0
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "offset_sticker_set_id": self.offset_sticker_set_id,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class GetMapThumbnailFile(Function["File"]):
+    """
+    Returns information about a file with a map thumbnail in PNG format. Only map thumbnail files with size less than 1MB can be downloaded
+
+    :param location: Location of the map center
+    :param zoom: Map zoom level; 13-20
+    :param width: Map width in pixels before applying scale; 16-1024
+    :param height: Map height in pixels before applying scale; 16-1024
+    :param scale: Map scale; 1-3
+    :param chat_id: Identifier of a chat in which the thumbnail will be shown. Use 0 if unknown
+    :return: :class:`File`
+    """
+
+    _type: "str" = field(default="getMapThumbnailFile", init=False, repr=False)
+    location: "Location | None" = None
+    zoom: "int" = 0
+    width: "int" = 0
+    height: "int" = 0
+    scale: "int" = 0
+    chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "location": self.location._to_json_dict() if self.location is not None else None,
+            "zoom": self.zoom,
+            "width": self.width,
+            "height": self.height,
+            "scale": self.scale,
+            "chat_id": self.chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetPremiumLimit(Function["PremiumLimit"]):
+    """
+    Returns information about a limit, increased for Premium users. Returns a 404 error if the limit is unknown
+
+    :param limit_type: Type of the limit
+    :return: :class:`PremiumLimit`
+    """
+
+    _type: "str" = field(default="getPremiumLimit", init=False, repr=False)
+    limit_type: "PremiumLimitType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "limit_type": self.limit_type._to_json_dict() if self.limit_type is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetPremiumFeatures(Function["PremiumFeatures"]):
+    """
+    Returns information about features, available to Premium users
+
+    :param source: Source of the request; pass null if the method is called from some non-standard source
+    :return: :class:`PremiumFeatures`
+    """
+
+    _type: "str" = field(default="getPremiumFeatures", init=False, repr=False)
+    source: "PremiumSource | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "source": self.source._to_json_dict() if self.source is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetPremiumStickerExamples(Function["Stickers"]):
+    """
+    Returns examples of premium stickers for demonstration purposes
+
+    :return: :class:`Stickers`
+    """
+
+    _type: "str" = field(default="getPremiumStickerExamples", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetPremiumInfoSticker(Function["Sticker"]):
+    """
+    Returns the sticker to be used as representation of the Telegram Premium subscription
+
+    :param month_count: Number of months the Telegram Premium subscription will be active
+    :return: :class:`Sticker`
+    """
+
+    _type: "str" = field(default="getPremiumInfoSticker", init=False, repr=False)
+    month_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "month_count": self.month_count,
+        }
+
+
+
+@dataclass(slots=True)
+class ViewPremiumFeature(Function["Ok"]):
+    """
+    Informs TDLib that the user viewed detailed information about a Premium feature on the Premium features screen
+
+    :param feature: The viewed premium feature
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="viewPremiumFeature", init=False, repr=False)
+    feature: "PremiumFeature | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "feature": self.feature._to_json_dict() if self.feature is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class ClickPremiumSubscriptionButton(Function["Ok"]):
+    """
+    Informs TDLib that the user clicked Premium subscription button on the Premium features screen
+
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="clickPremiumSubscriptionButton", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetPremiumState(Function["PremiumState"]):
+    """
+    Returns state of Telegram Premium subscription and promotion videos for Premium features
+
+    :return: :class:`PremiumState`
+    """
+
+    _type: "str" = field(default="getPremiumState", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetPremiumGiftPaymentOptions(Function["PremiumGiftPaymentOptions"]):
+    """
+    Returns available options for gifting Telegram Premium to a user
+
+    :return: :class:`PremiumGiftPaymentOptions`
+    """
+
+    _type: "str" = field(default="getPremiumGiftPaymentOptions", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetPremiumGiveawayPaymentOptions(Function["PremiumGiveawayPaymentOptions"]):
+    """
+    Returns available options for creating of Telegram Premium giveaway or manual distribution of Telegram Premium among chat members
+
+    :param boosted_chat_id: Identifier of the supergroup or channel chat, which will be automatically boosted by receivers of the gift codes and which is administered by the user
+    :return: :class:`PremiumGiveawayPaymentOptions`
+    """
+
+    _type: "str" = field(default="getPremiumGiveawayPaymentOptions", init=False, repr=False)
+    boosted_chat_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "boosted_chat_id": self.boosted_chat_id,
+        }
+
+
+
+@dataclass(slots=True)
+class CheckPremiumGiftCode(Function["PremiumGiftCodeInfo"]):
+    """
+    Return information about a Telegram Premium gift code
+
+    :param code: The code to check
+    :return: :class:`PremiumGiftCodeInfo`
+    """
+
+    _type: "str" = field(default="checkPremiumGiftCode", init=False, repr=False)
+    code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "code": self.code,
+        }
+
+
+
+@dataclass(slots=True)
+class ApplyPremiumGiftCode(Function["Ok"]):
+    """
+    Applies a Telegram Premium gift code
+
+    :param code: The code to apply
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="applyPremiumGiftCode", init=False, repr=False)
+    code: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "code": self.code,
+        }
+
+
+
+@dataclass(slots=True)
+class GiftPremiumWithStars(Function["Ok"]):
+    """
+    Allows to buy a Telegram Premium subscription for another user with payment in Telegram Stars; for bots only
+
+    :param user_id: Identifier of the user which will receive Telegram Premium
+    :param star_count: The number of Telegram Stars to pay for subscription
+    :param month_count: Number of months the Telegram Premium subscription will be active for the user
+    :param text: Text to show to the user receiving Telegram Premium; 0-getOption("gift_text_length_max") characters. Only Bold, Italic, Underline, Strikethrough, Spoiler, and CustomEmoji entities are allowed
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="giftPremiumWithStars", init=False, repr=False)
+    user_id: "int" = 0
+    star_count: "int" = 0
+    month_count: "int" = 0
+    text: "FormattedText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "star_count": self.star_count,
+            "month_count": self.month_count,
+            "text": self.text._to_json_dict() if self.text is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class LaunchPrepaidGiveaway(Function["Ok"]):
+    """
+    Launches a prepaid giveaway
+
+    :param giveaway_id: Unique identifier of the prepaid giveaway
+    :param parameters: Giveaway parameters
+    :param winner_count: The number of users to receive giveaway prize
+    :param star_count: The number of Telegram Stars to be distributed through the giveaway; pass 0 for Telegram Premium giveaways
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="launchPrepaidGiveaway", init=False, repr=False)
+    giveaway_id: "int" = 0
+    parameters: "GiveawayParameters | None" = None
+    winner_count: "int" = 0
+    star_count: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "giveaway_id": self.giveaway_id,
+            "parameters": self.parameters._to_json_dict() if self.parameters is not None else None,
+            "winner_count": self.winner_count,
+            "star_count": self.star_count,
+        }
+
+
+
+@dataclass(slots=True)
+class GetGiveawayInfo(Function["GiveawayInfo"]):
+    """
+    Returns information about a giveaway
+
+    :param chat_id: Identifier of the channel chat which started the giveaway
+    :param message_id: Identifier of the giveaway or a giveaway winners message in the chat
+    :return: :class:`GiveawayInfo`
+    """
+
+    _type: "str" = field(default="getGiveawayInfo", init=False, repr=False)
+    chat_id: "int" = 0
+    message_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "message_id": self.message_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetStarPaymentOptions(Function["StarPaymentOptions"]):
+    """
+    Returns available options for Telegram Stars purchase
+
+    :return: :class:`StarPaymentOptions`
+    """
+
+    _type: "str" = field(default="getStarPaymentOptions", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetStarGiftPaymentOptions(Function["StarPaymentOptions"]):
+    """
+    Returns available options for Telegram Stars gifting
+
+    :param user_id: Identifier of the user that will receive Telegram Stars; pass 0 to get options for an unspecified user
+    :return: :class:`StarPaymentOptions`
+    """
+
+    _type: "str" = field(default="getStarGiftPaymentOptions", init=False, repr=False)
+    user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetStarGiveawayPaymentOptions(Function["StarGiveawayPaymentOptions"]):
+    """
+    Returns available options for Telegram Star giveaway creation
+
+    :return: :class:`StarGiveawayPaymentOptions`
+    """
+
+    _type: "str" = field(default="getStarGiveawayPaymentOptions", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetStarTransactions(Function["StarTransactions"]):
+    """
+    Returns the list of Telegram Star transactions for the specified owner
+
+    :param owner_id: Identifier of the owner of the Telegram Stars; can be the identifier of the current user, identifier of an owned bot,
+     or identifier of a supergroup or a channel chat with supergroupFullInfo.can_get_star_revenue_statistics == true
+    :param subscription_id: If non-empty, only transactions related to the Star Subscription will be returned
+    :param direction: Direction of the transactions to receive; pass null to get all transactions
+    :param offset: Offset of the first transaction to return as received from the previous request; use empty string to get the first chunk of results
+    :param limit: The maximum number of transactions to return
+    :return: :class:`StarTransactions`
+    """
+
+    _type: "str" = field(default="getStarTransactions", init=False, repr=False)
+    owner_id: "MessageSender | None" = None
+    subscription_id: "str" = ""
+    direction: "TransactionDirection | None" = None
+    offset: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "owner_id": self.owner_id._to_json_dict() if self.owner_id is not None else None,
+            "subscription_id": self.subscription_id,
+            "direction": self.direction._to_json_dict() if self.direction is not None else None,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class GetStarSubscriptions(Function["StarSubscriptions"]):
+    """
+    Returns the list of Telegram Star subscriptions for the current user
+
+    :param only_expiring: Pass true to receive only expiring subscriptions for which there are no enough Telegram Stars to extend
+    :param offset: Offset of the first subscription to return as received from the previous request; use empty string to get the first chunk of results
+    :return: :class:`StarSubscriptions`
+    """
+
+    _type: "str" = field(default="getStarSubscriptions", init=False, repr=False)
+    only_expiring: "bool" = False
+    offset: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "only_expiring": self.only_expiring,
+            "offset": self.offset,
+        }
+
+
+
+@dataclass(slots=True)
+class CanPurchaseFromStore(Function["Ok"]):
+    """
+    Checks whether an in-store purchase is possible. Must be called before any in-store purchase. For official applications only
+
+    :param purpose: Transaction purpose
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="canPurchaseFromStore", init=False, repr=False)
+    purpose: "StorePaymentPurpose | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "purpose": self.purpose._to_json_dict() if self.purpose is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class AssignStoreTransaction(Function["Ok"]):
+    """
+    Informs server about an in-store purchase. For official applications only
+
+    :param transaction: Information about the transaction
+    :param purpose: Transaction purpose
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="assignStoreTransaction", init=False, repr=False)
+    transaction: "StoreTransaction | None" = None
+    purpose: "StorePaymentPurpose | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "transaction": self.transaction._to_json_dict() if self.transaction is not None else None,
+            "purpose": self.purpose._to_json_dict() if self.purpose is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class EditStarSubscription(Function["Ok"]):
+    """
+    Cancels or re-enables Telegram Star subscription
+
+    :param subscription_id: Identifier of the subscription to change
+    :param is_canceled: New value of is_canceled
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="editStarSubscription", init=False, repr=False)
+    subscription_id: "str" = ""
+    is_canceled: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "subscription_id": self.subscription_id,
+            "is_canceled": self.is_canceled,
+        }
+
+
+
+@dataclass(slots=True)
+class EditUserStarSubscription(Function["Ok"]):
+    """
+    Cancels or re-enables Telegram Star subscription for a user; for bots only
+
+    :param user_id: User identifier
+    :param telegram_payment_charge_id: Telegram payment identifier of the subscription
+    :param is_canceled: Pass true to cancel the subscription; pass false to allow the user to enable it
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="editUserStarSubscription", init=False, repr=False)
+    user_id: "int" = 0
+    telegram_payment_charge_id: "str" = ""
+    is_canceled: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "telegram_payment_charge_id": self.telegram_payment_charge_id,
+            "is_canceled": self.is_canceled,
+        }
+
+
+
+@dataclass(slots=True)
+class ReuseStarSubscription(Function["Ok"]):
+    """
+    Reuses an active Telegram Star subscription to a channel chat and joins the chat again
+
+    :param subscription_id: Identifier of the subscription
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="reuseStarSubscription", init=False, repr=False)
+    subscription_id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "subscription_id": self.subscription_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SetChatAffiliateProgram(Function["Ok"]):
+    """
+    Changes affiliate program for a bot
+
+    :param chat_id: Identifier of the chat with an owned bot for which affiliate program is changed
+    :param parameters: Parameters of the affiliate program; pass null to close the currently active program. If there is an active program, then commission and program duration can only be increased.
+     If the active program is scheduled to be closed, then it can't be changed anymore
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setChatAffiliateProgram", init=False, repr=False)
+    chat_id: "int" = 0
+    parameters: "AffiliateProgramParameters | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "chat_id": self.chat_id,
+            "parameters": self.parameters._to_json_dict() if self.parameters is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchChatAffiliateProgram(Function["Chat"]):
+    """
+    Searches a chat with an affiliate program. Returns the chat if found and the program is active
+
+    :param username: Username of the chat
+    :param referrer: The referrer from an internalLinkTypeChatAffiliateProgram link
+    :return: :class:`Chat`
+    """
+
+    _type: "str" = field(default="searchChatAffiliateProgram", init=False, repr=False)
+    username: "str" = ""
+    referrer: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "username": self.username,
+            "referrer": self.referrer,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchAffiliatePrograms(Function["FoundAffiliatePrograms"]):
+    """
+    Searches affiliate programs that can be connected to the given affiliate
+
+    :param affiliate: The affiliate for which affiliate programs are searched for
+    :param sort_order: Sort order for the results
+    :param offset: Offset of the first affiliate program to return as received from the previous request; use empty string to get the first chunk of results
+    :param limit: The maximum number of affiliate programs to return
+    :return: :class:`FoundAffiliatePrograms`
+    """
+
+    _type: "str" = field(default="searchAffiliatePrograms", init=False, repr=False)
+    affiliate: "AffiliateType | None" = None
+    sort_order: "AffiliateProgramSortOrder | None" = None
+    offset: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "affiliate": self.affiliate._to_json_dict() if self.affiliate is not None else None,
+            "sort_order": self.sort_order._to_json_dict() if self.sort_order is not None else None,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class ConnectAffiliateProgram(Function["ConnectedAffiliateProgram"]):
+    """
+    Connects an affiliate program to the given affiliate. Returns information about the connected affiliate program
+
+    :param affiliate: The affiliate to which the affiliate program will be connected
+    :param bot_user_id: Identifier of the bot, which affiliate program is connected
+    :return: :class:`ConnectedAffiliateProgram`
+    """
+
+    _type: "str" = field(default="connectAffiliateProgram", init=False, repr=False)
+    affiliate: "AffiliateType | None" = None
+    bot_user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "affiliate": self.affiliate._to_json_dict() if self.affiliate is not None else None,
+            "bot_user_id": self.bot_user_id,
+        }
+
+
+
+@dataclass(slots=True)
+class DisconnectAffiliateProgram(Function["ConnectedAffiliateProgram"]):
+    """
+    Disconnects an affiliate program from the given affiliate and immediately deactivates its referral link. Returns updated information about the disconnected affiliate program
+
+    :param affiliate: The affiliate to which the affiliate program is connected
+    :param url: The referral link of the affiliate program
+    :return: :class:`ConnectedAffiliateProgram`
+    """
+
+    _type: "str" = field(default="disconnectAffiliateProgram", init=False, repr=False)
+    affiliate: "AffiliateType | None" = None
+    url: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "affiliate": self.affiliate._to_json_dict() if self.affiliate is not None else None,
+            "url": self.url,
+        }
+
+
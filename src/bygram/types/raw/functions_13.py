@@ -0,0 +1,1030 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..base import ObjectBase, Function, Update, _bytes_to_json, _list_to_json
+
+if TYPE_CHECKING:
+    from .classes_00 import Error, FormattedText, Ok
+    from .classes_02 import AffiliateType
+    from .classes_03 import ConnectedAffiliateProgram, ConnectedAffiliatePrograms
+    from .classes_09 import CollectibleItemInfo, CollectibleItemType, Countries, PhoneNumberInfo
+    from .classes_16 import CustomRequestResult, HttpUrl
+    from .classes_17 import BusinessFeature
+    from .classes_18 import BusinessFeatures
+    from .classes_20 import JsonValue
+    from .classes_23 import DeepLinkInfo, FoundPositions, Proxies, Proxy, ProxyType, Seconds, Text
+    from .classes_25 import LogStream, LogTags, LogVerbosityLevel, TestBytes, TestInt, TestString, TestVectorInt, TestVectorIntObject, TestVectorString, TestVectorStringObject, UserSupportInfo
+
+
+@dataclass(slots=True)
+class GetConnectedAffiliateProgram(Function["ConnectedAffiliateProgram"]):
+    """
+    Returns an affiliate program that were connected to the given affiliate by identifier of the bot that created the program
+
+    :param affiliate: The affiliate to which the affiliate program will be connected
+    :param bot_user_id: Identifier of the bot that created the program
+    :return: :class:`ConnectedAffiliateProgram`
+    """
+
+    _type: "str" = field(default="getConnectedAffiliateProgram", init=False, repr=False)
+    affiliate: "AffiliateType | None" = None
+    bot_user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "affiliate": self.affiliate._to_json_dict() if self.affiliate is not None else None,
+            "bot_user_id": self.bot_user_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetConnectedAffiliatePrograms(Function["ConnectedAffiliatePrograms"]):
+    """
+    Returns affiliate programs that were connected to the given affiliate
+
+    :param affiliate: The affiliate to which the affiliate program were connected
+    :param offset: Offset of the first affiliate program to return as received from the previous request; use empty string to get the first chunk of results
+    :param limit: The maximum number of affiliate programs to return
+    :return: :class:`ConnectedAffiliatePrograms`
+    """
+
+    _type: "str" = field(default="getConnectedAffiliatePrograms", init=False, repr=False)
+    affiliate: "AffiliateType | None" = None
+    offset: "str" = ""
+    limit: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "affiliate": self.affiliate._to_json_dict() if self.affiliate is not None else None,
+            "offset": self.offset,
+            "limit": self.limit,
+        }
+
+
+
+@dataclass(slots=True)
+class GetBusinessFeatures(Function["BusinessFeatures"]):
+    """
+    Returns information about features, available to Business users
+
+    :param source: Source of the request; pass null if the method is called from settings or some non-standard source
+    :return: :class:`BusinessFeatures`
+    """
+
+    _type: "str" = field(default="getBusinessFeatures", init=False, repr=False)
+    source: "BusinessFeature | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "source": self.source._to_json_dict() if self.source is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class AcceptTermsOfService(Function["Ok"]):
+    """
+    Accepts Telegram terms of services
+
+    :param terms_of_service_id: Terms of service identifier
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="acceptTermsOfService", init=False, repr=False)
+    terms_of_service_id: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "terms_of_service_id": self.terms_of_service_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SearchStringsByPrefix(Function["FoundPositions"]):
+    """
+    Searches specified query by word prefixes in the provided strings. Returns 0-based positions of strings that matched. Can be called synchronously
+
+    :param strings: The strings to search in for the query
+    :param query: Query to search for
+    :param limit: The maximum number of objects to return
+    :param return_none_for_empty_query: Pass true to receive no results for an empty query
+    :return: :class:`FoundPositions`
+    """
+
+    _type: "str" = field(default="searchStringsByPrefix", init=False, repr=False)
+    strings: "list[str] | None" = None
+    query: "str" = ""
+    limit: "int" = 0
+    return_none_for_empty_query: "bool" = False
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "strings": self.strings,
+            "query": self.query,
+            "limit": self.limit,
+            "return_none_for_empty_query": self.return_none_for_empty_query,
+        }
+
+
+
+@dataclass(slots=True)
+class SendCustomRequest(Function["CustomRequestResult"]):
+    """
+    Sends a custom request; for bots only
+
+    :param method: The method name
+    :param parameters: JSON-serialized method parameters
+    :return: :class:`CustomRequestResult`
+    """
+
+    _type: "str" = field(default="sendCustomRequest", init=False, repr=False)
+    method: "str" = ""
+    parameters: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "method": self.method,
+            "parameters": self.parameters,
+        }
+
+
+
+@dataclass(slots=True)
+class AnswerCustomQuery(Function["Ok"]):
+    """
+    Answers a custom query; for bots only
+
+    :param custom_query_id: Identifier of a custom query
+    :param data: JSON-serialized answer to the query
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="answerCustomQuery", init=False, repr=False)
+    custom_query_id: "int" = 0
+    data: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "custom_query_id": self.custom_query_id,
+            "data": self.data,
+        }
+
+
+
+@dataclass(slots=True)
+class SetAlarm(Function["Ok"]):
+    """
+    Succeeds after a specified amount of time has passed. Can be called before initialization
+
+    :param seconds: Number of seconds before the function returns
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setAlarm", init=False, repr=False)
+    seconds: "float" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "seconds": self.seconds,
+        }
+
+
+
+@dataclass(slots=True)
+class GetCountries(Function["Countries"]):
+    """
+    Returns information about existing countries. Can be called before authorization
+
+    :return: :class:`Countries`
+    """
+
+    _type: "str" = field(default="getCountries", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetCountryCode(Function["Text"]):
+    """
+    Uses the current IP address to find the current country. Returns two-letter ISO 3166-1 alpha-2 country code. Can be called before authorization
+
+    :return: :class:`Text`
+    """
+
+    _type: "str" = field(default="getCountryCode", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetPhoneNumberInfo(Function["PhoneNumberInfo"]):
+    """
+    Returns information about a phone number by its prefix. Can be called before authorization
+
+    :param phone_number_prefix: The phone number prefix
+    :return: :class:`PhoneNumberInfo`
+    """
+
+    _type: "str" = field(default="getPhoneNumberInfo", init=False, repr=False)
+    phone_number_prefix: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "phone_number_prefix": self.phone_number_prefix,
+        }
+
+
+
+@dataclass(slots=True)
+class GetPhoneNumberInfoSync(Function["PhoneNumberInfo"]):
+    """
+    Returns information about a phone number by its prefix synchronously. getCountries must be called at least once after changing localization to the specified language if properly localized country information is expected. Can be called synchronously
+
+    :param language_code: A two-letter ISO 639-1 language code for country information localization
+    :param phone_number_prefix: The phone number prefix
+    :return: :class:`PhoneNumberInfo`
+    """
+
+    _type: "str" = field(default="getPhoneNumberInfoSync", init=False, repr=False)
+    language_code: "str" = ""
+    phone_number_prefix: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "language_code": self.language_code,
+            "phone_number_prefix": self.phone_number_prefix,
+        }
+
+
+
+@dataclass(slots=True)
+class GetCollectibleItemInfo(Function["CollectibleItemInfo"]):
+    """
+    Returns information about a given collectible item that was purchased at https://fragment.com
+
+    :param type: Type of the collectible item. The item must be used by a user and must be visible to the current user
+    :return: :class:`CollectibleItemInfo`
+    """
+
+    _type: "str" = field(default="getCollectibleItemInfo", init=False, repr=False)
+    type: "CollectibleItemType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetDeepLinkInfo(Function["DeepLinkInfo"]):
+    """
+    Returns information about a tg:// deep link. Use "tg://need_update_for_some_feature" or "tg:some_unsupported_feature" for testing. Returns a 404 error for unknown links. Can be called before authorization
+
+    :param link: The link
+    :return: :class:`DeepLinkInfo`
+    """
+
+    _type: "str" = field(default="getDeepLinkInfo", init=False, repr=False)
+    link: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "link": self.link,
+        }
+
+
+
+@dataclass(slots=True)
+class GetApplicationConfig(Function["JsonValue"]):
+    """
+    Returns application config, provided by the server. Can be called before authorization
+
+    :return: :class:`JsonValue`
+    """
+
+    _type: "str" = field(default="getApplicationConfig", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class SaveApplicationLogEvent(Function["Ok"]):
+    """
+    Saves application log event on the server. Can be called before authorization
+
+    :param type: Event type
+    :param chat_id: Optional chat identifier, associated with the event
+    :param data: The log event data
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="saveApplicationLogEvent", init=False, repr=False)
+    type: "str" = ""
+    chat_id: "int" = 0
+    data: "JsonValue | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "type": self.type,
+            "chat_id": self.chat_id,
+            "data": self.data._to_json_dict() if self.data is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetApplicationDownloadLink(Function["HttpUrl"]):
+    """
+    Returns the link for downloading official Telegram application to be used when the current user invites friends to Telegram
+
+    :return: :class:`HttpUrl`
+    """
+
+    _type: "str" = field(default="getApplicationDownloadLink", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class AddProxy(Function["Proxy"]):
+    """
+    Adds a proxy server for network requests. Can be called before authorization
+
+    :param server: Proxy server domain or IP address
+    :param port: Proxy server port
+    :param enable: Pass true to immediately enable the proxy
+    :param type: Proxy type
+    :return: :class:`Proxy`
+    """
+
+    _type: "str" = field(default="addProxy", init=False, repr=False)
+    server: "str" = ""
+    port: "int" = 0
+    enable: "bool" = False
+    type: "ProxyType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "server": self.server,
+            "port": self.port,
+            "enable": self.enable,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class EditProxy(Function["Proxy"]):
+    """
+    Edits an existing proxy server for network requests. Can be called before authorization
+
+    :param proxy_id: Proxy identifier
+    :param server: Proxy server domain or IP address
+    :param port: Proxy server port
+    :param enable: Pass true to immediately enable the proxy
+    :param type: Proxy type
+    :return: :class:`Proxy`
+    """
+
+    _type: "str" = field(default="editProxy", init=False, repr=False)
+    proxy_id: "int" = 0
+    server: "str" = ""
+    port: "int" = 0
+    enable: "bool" = False
+    type: "ProxyType | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "proxy_id": self.proxy_id,
+            "server": self.server,
+            "port": self.port,
+            "enable": self.enable,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class EnableProxy(Function["Ok"]):
+    """
+    Enables a proxy. Only one proxy can be enabled at a time. Can be called before authorization
+
+    :param proxy_id: Proxy identifier
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="enableProxy", init=False, repr=False)
+    proxy_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "proxy_id": self.proxy_id,
+        }
+
+
+
+@dataclass(slots=True)
+class DisableProxy(Function["Ok"]):
+    """
+    Disables the currently enabled proxy. Can be called before authorization
+
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="disableProxy", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class RemoveProxy(Function["Ok"]):
+    """
+    Removes a proxy server. Can be called before authorization
+
+    :param proxy_id: Proxy identifier
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="removeProxy", init=False, repr=False)
+    proxy_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "proxy_id": self.proxy_id,
+        }
+
+
+
+@dataclass(slots=True)
+class GetProxies(Function["Proxies"]):
+    """
+    Returns the list of proxies that are currently set up. Can be called before authorization
+
+    :return: :class:`Proxies`
+    """
+
+    _type: "str" = field(default="getProxies", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetProxyLink(Function["HttpUrl"]):
+    """
+    Returns an HTTPS link, which can be used to add a proxy. Available only for SOCKS5 and MTProto proxies. Can be called before authorization
+
+    :param proxy_id: Proxy identifier
+    :return: :class:`HttpUrl`
+    """
+
+    _type: "str" = field(default="getProxyLink", init=False, repr=False)
+    proxy_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "proxy_id": self.proxy_id,
+        }
+
+
+
+@dataclass(slots=True)
+class PingProxy(Function["Seconds"]):
+    """
+    Computes time needed to receive a response from a Telegram server through a proxy. Can be called before authorization
+
+    :param proxy_id: Proxy identifier. Use 0 to ping a Telegram server without a proxy
+    :return: :class:`Seconds`
+    """
+
+    _type: "str" = field(default="pingProxy", init=False, repr=False)
+    proxy_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "proxy_id": self.proxy_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SetLogStream(Function["Ok"]):
+    """
+    Sets new log stream for internal logging of TDLib. Can be called synchronously
+
+    :param log_stream: New log stream
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setLogStream", init=False, repr=False)
+    log_stream: "LogStream | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "log_stream": self.log_stream._to_json_dict() if self.log_stream is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetLogStream(Function["LogStream"]):
+    """
+    Returns information about currently used log stream for internal logging of TDLib. Can be called synchronously
+
+    :return: :class:`LogStream`
+    """
+
+    _type: "str" = field(default="getLogStream", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class SetLogVerbosityLevel(Function["Ok"]):
+    """
+    Sets the verbosity level of the internal logging of TDLib. Can be called synchronously
+
+    :param new_verbosity_level: New value of the verbosity level for logging. Value 0 corresponds to fatal errors, value 1 corresponds to errors, value 2 corresponds to warnings and debug warnings,
+     value 3 corresponds to informational, value 4 corresponds to debug, value 5 corresponds to verbose debug, value greater than 5 and up to 1023 can be used to enable even more logging
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setLogVerbosityLevel", init=False, repr=False)
+    new_verbosity_level: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "new_verbosity_level": self.new_verbosity_level,
+        }
+
+
+
+@dataclass(slots=True)
+class GetLogVerbosityLevel(Function["LogVerbosityLevel"]):
+    """
+    Returns current verbosity level of the internal logging of TDLib. Can be called synchronously
+
+    :return: :class:`LogVerbosityLevel`
+    """
+
+    _type: "str" = field(default="getLogVerbosityLevel", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class GetLogTags(Function["LogTags"]):
+    """
+    Returns the list of available TDLib internal log tags, for example, ["actor", "binlog", "connections", "notifications", "proxy"]. Can be called synchronously
+
+    :return: :class:`LogTags`
+    """
+
+    _type: "str" = field(default="getLogTags", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class SetLogTagVerbosityLevel(Function["Ok"]):
+    """
+    Sets the verbosity level for a specified TDLib internal log tag. Can be called synchronously
+
+    :param tag: Logging tag to change verbosity level
+    :param new_verbosity_level: New verbosity level; 1-1024
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="setLogTagVerbosityLevel", init=False, repr=False)
+    tag: "str" = ""
+    new_verbosity_level: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "tag": self.tag,
+            "new_verbosity_level": self.new_verbosity_level,
+        }
+
+
+
+@dataclass(slots=True)
+class GetLogTagVerbosityLevel(Function["LogVerbosityLevel"]):
+    """
+    Returns current verbosity level for a specified TDLib internal log tag. Can be called synchronously
+
+    :param tag: Logging tag to change verbosity level
+    :return: :class:`LogVerbosityLevel`
+    """
+
+    _type: "str" = field(default="getLogTagVerbosityLevel", init=False, repr=False)
+    tag: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "tag": self.tag,
+        }
+
+
+
+@dataclass(slots=True)
+class AddLogMessage(Function["Ok"]):
+    """
+    Adds a message to TDLib internal log. Can be called synchronously
+
+    :param verbosity_level: The minimum verbosity level needed for the message to be logged; 0-1023
+    :param text: Text of a message to log
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="addLogMessage", init=False, repr=False)
+    verbosity_level: "int" = 0
+    text: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "verbosity_level": self.verbosity_level,
+            "text": self.text,
+        }
+
+
+
+@dataclass(slots=True)
+class GetUserSupportInfo(Function["UserSupportInfo"]):
+    """
+    Returns support information for the given user; for Telegram support only
+
+    :param user_id: User identifier
+    :return: :class:`UserSupportInfo`
+    """
+
+    _type: "str" = field(default="getUserSupportInfo", init=False, repr=False)
+    user_id: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+        }
+
+
+
+@dataclass(slots=True)
+class SetUserSupportInfo(Function["UserSupportInfo"]):
+    """
+    Sets support information for the given user; for Telegram support only
+
+    :param user_id: User identifier
+    :param message: New information message
+    :return: :class:`UserSupportInfo`
+    """
+
+    _type: "str" = field(default="setUserSupportInfo", init=False, repr=False)
+    user_id: "int" = 0
+    message: "FormattedText | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "user_id": self.user_id,
+            "message": self.message._to_json_dict() if self.message is not None else None,
+        }
+
+
+
+@dataclass(slots=True)
+class GetSupportName(Function["Text"]):
+    """
+    Returns localized name of the Telegram support user; for Telegram support only
+
+    :return: :class:`Text`
+    """
+
+    _type: "str" = field(default="getSupportName", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class TestCallEmpty(Function["Ok"]):
+    """
+    Does nothing; for testing only. This is an offline method. Can be called before authorization
+
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="testCallEmpty", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class TestCallString(Function["TestString"]):
+    """
+    Returns the received string; for testing only. This is an offline method. Can be called before authorization
+
+    :param x: String to return
+    :return: :class:`TestString`
+    """
+
+    _type: "str" = field(default="testCallString", init=False, repr=False)
+    x: "str" = ""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "x": self.x,
+        }
+
+
+
+@dataclass(slots=True)
+class TestCallBytes(Function["TestBytes"]):
+    """
+    Returns the received bytes; for testing only. This is an offline method. Can be called before authorization
+
+    :param x: Bytes to return
+    :return: :class:`TestBytes`
+    """
+
+    _type: "str" = field(default="testCallBytes", init=False, repr=False)
+    x: "bytes" = b""
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "x": _bytes_to_json(self.x),
+        }
+
+
+
+@dataclass(slots=True)
+class TestCallVectorInt(Function["TestVectorInt"]):
+    """
+    Returns the received vector of numbers; for testing only. This is an offline method. Can be called before authorization
+
+    :param x: Vector of numbers to return
+    :return: :class:`TestVectorInt`
+    """
+
+    _type: "str" = field(default="testCallVectorInt", init=False, repr=False)
+    x: "list[int] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "x": self.x,
+        }
+
+
+
+@dataclass(slots=True)
+class TestCallVectorIntObject(Function["TestVectorIntObject"]):
+    """
+    Returns the received vector of objects containing a number; for testing only. This is an offline method. Can be called before authorization
+
+    :param x: Vector of objects to return
+    :return: :class:`TestVectorIntObject`
+    """
+
+    _type: "str" = field(default="testCallVectorIntObject", init=False, repr=False)
+    x: "list[TestInt] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "x": _list_to_json(self.x),
+        }
+
+
+
+@dataclass(slots=True)
+class TestCallVectorString(Function["TestVectorString"]):
+    """
+    Returns the received vector of strings; for testing only. This is an offline method. Can be called before authorization
+
+    :param x: Vector of strings to return
+    :return: :class:`TestVectorString`
+    """
+
+    _type: "str" = field(default="testCallVectorString", init=False, repr=False)
+    x: "list[str] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "x": self.x,
+        }
+
+
+
+@dataclass(slots=True)
+class TestCallVectorStringObject(Function["TestVectorStringObject"]):
+    """
+    Returns the received vector of objects containing a string; for testing only. This is an offline method. Can be called before authorization
+
+    :param x: Vector of objects to return
+    :return: :class:`TestVectorStringObject`
+    """
+
+    _type: "str" = field(default="testCallVectorStringObject", init=False, repr=False)
+    x: "list[TestString] | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "x": _list_to_json(self.x),
+        }
+
+
+
+@dataclass(slots=True)
+class TestSquareInt(Function["TestInt"]):
+    """
+    Returns the squared received number; for testing only. This is an offline method. Can be called before authorization
+
+    :param x: Number to square
+    :return: :class:`TestInt`
+    """
+
+    _type: "str" = field(default="testSquareInt", init=False, repr=False)
+    x: "int" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "x": self.x,
+        }
+
+
+
+@dataclass(slots=True)
+class TestNetwork(Function["Ok"]):
+    """
+    Sends a simple network request to the Telegram servers; for testing only. Can be called before authorization
+
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="testNetwork", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class TestProxy(Function["Ok"]):
+    """
+    Sends a simple network request to the Telegram servers via proxy; for testing only. Can be called before authorization
+
+    :param server: Proxy server domain or IP address
+    :param port: Proxy server port
+    :param type: Proxy type
+    :param dc_id: Identifier of a datacenter with which to test connection
+    :param timeout: The maximum overall timeout for the request
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="testProxy", init=False, repr=False)
+    server: "str" = ""
+    port: "int" = 0
+    type: "ProxyType | None" = None
+    dc_id: "int" = 0
+    timeout: "float" = 0
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "server": self.server,
+            "port": self.port,
+            "type": self.type._to_json_dict() if self.type is not None else None,
+            "dc_id": self.dc_id,
+            "timeout": self.timeout,
+        }
+
+
+
+@dataclass(slots=True)
+class TestGetDifference(Function["Ok"]):
+    """
+    Forces an updates.getDifference call to the Telegram servers; for testing only
+
+    :return: :class:`Ok`
+    """
+
+    _type: "str" = field(default="testGetDifference", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class TestUseUpdate(Function["Update"]):
+    """
+    Does nothing and ensures that the Update object is used; for testing only. This is an offline method. Can be called before authorization
+
+    :return: :class:`Update`
+    """
+
+    _type: "str" = field(default="testUseUpdate", init=False, repr=False)
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+        }
+
+
+
+@dataclass(slots=True)
+class TestReturnError(Function["Error"]):
+    """
+    Returns the specified error and ensures that the Error object is used; for testing only. Can be called synchronously
+
+    :param error: The error to be returned
+    :return: :class:`Error`
+    """
+
+    _type: "str" = field(default="testReturnError", init=False, repr=False)
+    error: "Error | None" = None
+
+    def _to_json_dict(self) -> dict:
+        return {
+            "@type": self._type,
+            "error": self.error._to_json_dict() if self.error is not None else None,
+        }
+
+
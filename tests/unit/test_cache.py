@@ -0,0 +1,223 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from bygram.cache import CachePolicy, EntityCache, ResponseCache
+from bygram.client_manager import Client
+from bygram.exceptions import TdlibException
+from bygram.executor import Executor
+from bygram.core.serializer import deserialize_object_lazy, serialize_object
+from bygram.routing.dispatcher import Dispatcher
+from bygram.routing.middlewares import EntityCacheMiddleware, MiddlewareBase
+from bygram.types import raw
+
+
+def test_users_and_groups():
+    cache = EntityCache()
+    assert cache.user(1) is None
+
+    user = raw.User(id=1, first_name="Alice", status=raw.UserStatusEmpty())
+    assert cache.apply(raw.UpdateUser(user))
+    cache.apply(raw.UpdateUserStatus(1, raw.UserStatusOnline(expires=10)))
+    assert cache.user(1) is user
+    assert user.status == raw.UserStatusOnline(expires=10)
+
+    supergroup = raw.Supergroup(id=2)
+    cache.apply(raw.UpdateSupergroup(supergroup))
+    full_info = raw.SupergroupFullInfo(member_count=3)
+    cache.apply(raw.UpdateSupergroupFullInfo(2, full_info))
+    assert cache.supergroup(2) is supergroup
+    assert cache.supergroup_full_info(2) is full_info
+
+    assert not cache.apply(raw.UpdateNewMessage(raw.Message()))
+
+
+def test_chat_updates():
+    cache = EntityCache()
+    cache.apply(raw.UpdateChatTitle(1, "Unknown chat"))
+    assert cache.chat(1) is None
+
+    chat = raw.Chat(id=1, title="Old", positions=[], chat_lists=[])
+    cache.apply(raw.UpdateNewChat(chat))
+    cache.apply(raw.UpdateChatTitle(1, "New"))
+    cache.apply(raw.UpdateChatReadInbox(1, last_read_inbox_message_id=5, unread_count=2))
+    assert cache.chat(1) is chat
+    assert (chat.title, chat.last_read_inbox_message_id, chat.unread_count) == (
+        "New",
+        5,
+        2,
+    )
+
+    main, archive = raw.ChatListMain(), raw.ChatListArchive()
+    cache.apply(raw.UpdateChatPosition(1, raw.ChatPosition(list_=main, order=10)))
+    cache.apply(raw.UpdateChatPosition(1, raw.ChatPosition(list_=archive, order=5)))
+    cache.apply(raw.UpdateChatPosition(1, raw.ChatPosition(list_=main, order=0)))
+    assert chat.positions == [raw.ChatPosition(list_=archive, order=5)]
+
+    cache.apply(raw.UpdateChatAddedToList(1, main))
+    cache.apply(raw.UpdateChatAddedToList(1, main))
+    assert chat.chat_lists == [main]
+    cache.apply(raw.UpdateChatRemovedFromList(1, main))
+    assert chat.chat_lists == []
+
+
+def test_lazy_chat_keeps_updates():
+    cache = EntityCache()
+    update = deserialize_object_lazy(
+        serialize_object(raw.UpdateNewChat(raw.Chat(id=1, title="Old")))
+    ).obj
+    cache.apply(update)
+    cache.apply(raw.UpdateChatTitle(1, "New"))
+    assert cache.chat(1).title == "New"  # type: ignore
+
+
+class FakeClientMiddleware(MiddlewareBase):
+    def __init__(self, client) -> None:
+        self.client = client
+
+    async def __call__(self, update, data, next_handler):
+        data["client"] = self.client
+        return await next_handler(update, data)
+
+
+async def test_middleware():
+    client = SimpleNamespace(cache=EntityCache())
+    dp = Dispatcher()
+    dp.add_middleware(EntityCacheMiddleware())
+    dp.add_middleware(FakeClientMiddleware(client))
+
+    titles = []
+
+    async def callback(update: raw.UpdateChatTitle, client):
+        titles.append(client.cache.chat(update.chat_id).title)
+
+    dp.add_handler(raw.UpdateChatTitle, callback, [])
+    await dp.feed_update(raw.UpdateNewChat(raw.Chat(id=1, title="Old")), 1)
+    await dp.feed_update(raw.UpdateChatTitle(1, "New"), 1)
+
+    assert titles == ["New"]
+    assert "updateNewChat" in dp.handled_update_types  # type: ignore
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def counting_execute(responses: dict):
+    calls = []
+
+    async def execute(function):
+        calls.append(function)
+        return responses[function.user_id]
+
+    return execute, calls
+
+
+async def test_response_cache_ttl():
+    clock = FakeClock()
+    cache = ResponseCache({raw.GetUserFullInfo: CachePolicy(ttl=10)}, clock=clock)
+    info = raw.UserFullInfo(bio=raw.FormattedText("Bio", []))
+    execute, calls = counting_execute({1: info})
+
+    assert await cache.fetch(raw.GetUserFullInfo(1), execute) is info
+    assert await cache.fetch(raw.GetUserFullInfo(1), execute) is info
+    clock.now = 10
+    await cache.fetch(raw.GetUserFullInfo(1), execute)
+    assert len(calls) == 2
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.expirations) == (1, 2, 1)
+
+
+async def test_response_cache_lru():
+    cache = ResponseCache({raw.GetUserFullInfo: CachePolicy(max_entries=2)})
+    execute, calls = counting_execute({i: raw.UserFullInfo() for i in range(3)})
+
+    for user_id in (0, 1, 0, 2, 0, 1):
+        await cache.fetch(raw.GetUserFullInfo(user_id), execute)
+    assert [f.user_id for f in calls] == [0, 1, 2, 1]
+    assert cache.stats(raw.GetUserFullInfo).evictions == 2
+
+
+async def test_response_cache_max_bytes():
+    info = raw.UserFullInfo(bio=raw.FormattedText("x" * 100, []))
+    # Room for two responses
+    cache = ResponseCache({raw.GetUserFullInfo: CachePolicy(max_bytes=2000)})
+    execute, calls = counting_execute({i: info for i in range(3)})
+
+    for user_id in (0, 1, 2, 0):
+        await cache.fetch(raw.GetUserFullInfo(user_id), execute)
+    assert len(calls) == 4
+    assert cache.stats().evictions == 2
+
+    # Responses larger than the limit are not cached
+    cache = ResponseCache({raw.GetUserFullInfo: CachePolicy(max_bytes=100)})
+    for _ in range(2):
+        await cache.fetch(raw.GetUserFullInfo(0), execute)
+    assert len(calls) == 6
+
+
+async def test_response_cache_key_with_nested_object():
+    cache = ResponseCache({raw.GetChatMember: CachePolicy()})
+    calls = []
+
+    async def execute(function):
+        calls.append(function)
+        return raw.ChatMember(member_id=function.member_id)
+
+    for user_id in (1, 1, 2):
+        await cache.fetch(raw.GetChatMember(10, raw.MessageSenderUser(user_id)), execute)
+    assert len(calls) == 2
+
+    update = raw.UpdateChatMember(
+        chat_id=10, new_chat_member=raw.ChatMember(member_id=raw.MessageSenderUser(1))
+    )
+    assert cache.invalidate(update)
+    await cache.fetch(raw.GetChatMember(10, raw.MessageSenderUser(1)), execute)
+    assert len(calls) == 3
+
+
+async def test_response_cache_invalidation_during_request():
+    cache = ResponseCache({raw.GetSupergroupFullInfo: CachePolicy()})
+    calls = []
+
+    async def execute(function):
+        calls.append(function)
+        cache.invalidate(raw.UpdateSupergroupFullInfo(function.supergroup_id))
+        return raw.SupergroupFullInfo()
+
+    await cache.fetch(raw.GetSupergroupFullInfo(1), execute)
+    await cache.fetch(raw.GetSupergroupFullInfo(1), execute)
+    assert len(calls) == 2
+    assert not cache.invalidate(raw.UpdateNewMessage(raw.Message()))
+
+
+async def test_client_response_cache():
+    sent = []
+    executor = Executor(lambda *args: sent.append(args), asyncio.get_event_loop())
+    client = Client(1, executor, ResponseCache({raw.GetOption: CachePolicy()}))
+
+    task = asyncio.create_task(client.execute(raw.GetOption("version")))
+    await asyncio.sleep(0)
+    executor.resolve_response(raw.OptionValueString("1.8"), sent[0][2])
+    assert await task == raw.OptionValueString("1.8")
+    assert await client.execute(raw.GetOption("version")) == raw.OptionValueString(
+        "1.8"
+    )
+    assert len(sent) == 1
+
+    # Errors are not cached
+    task = asyncio.create_task(client.execute(raw.GetOption("unknown")))
+    await asyncio.sleep(0)
+    executor.resolve_response(raw.Error(400, "Bad request"), sent[1][2])
+    with pytest.raises(TdlibException):
+        await task
+    task = asyncio.create_task(client.execute(raw.GetOption("unknown"), timeout=0.01))
+    with pytest.raises(TimeoutError):
+        await task
+    assert len(sent) == 3
@@ -1,4 +1,6 @@
-from bygram.dispatcher import Dispatcher
+from bygram.routing.dispatcher import Dispatcher, Router
+from bygram.routing.middlewares import ClientManagerMiddleware, MiddlewareBase
+from bygram.types import raw
 from bygram.types.base import Update
 
 
@@ -43,3 +45,152 @@ async def test_di():
     assert called
     assert client_id_ == 1
     assert channel_id_ == "Test"
+
+
+async def test_di_keyword_only_and_defaults():
+    dp = Dispatcher()
+    dp["channel_id"] = "Test"
+    received = {}
+
+    async def callback(upd: FakeUpdate, *, client_id: int, missing: str = "default"):
+        received.update(client_id=client_id, missing=missing)
+
+    dp.add_handler(FakeUpdate, callback, [])
+    await dp.feed_update(FakeUpdate(), 1)
+
+    assert received == {"client_id": 1, "missing": "default"}
+
+
+async def test_di_var_keyword():
+    dp = Dispatcher()
+    dp["channel_id"] = "Test"
+    received = {}
+
+    async def callback(upd: FakeUpdate, **kwargs):
+        received.update(kwargs)
+
+    dp.add_handler(FakeUpdate, callback, [])
+    await dp.feed_update(FakeUpdate(), 1)
+
+    assert received == {"client_id": 1, "channel_id": "Test"}
+
+
+async def test_filter_di():
+    dp = Dispatcher()
+    called = False
+
+    async def only_client_2(upd: FakeUpdate, client_id: int):
+        return client_id == 2
+
+    async def callback(upd: FakeUpdate):
+        nonlocal called
+        called = True
+
+    dp.add_handler(FakeUpdate, callback, [only_client_2])  # type: ignore
+    await dp.feed_update(FakeUpdate(), 1)
+    assert not called
+
+    await dp.feed_update(FakeUpdate(), 2)
+    assert called
+
+
+async def test_middleware_added_after_update():
+    dp = Dispatcher()
+    calls = []
+
+    class Middleware(MiddlewareBase):
+        async def __call__(self, update, data, next_handler):
+            calls.append("middleware")
+            return await next_handler(update, data)
+
+    async def callback(upd: FakeUpdate):
+        calls.append("handler")
+
+    dp.add_handler(FakeUpdate, callback, [])
+    await dp.feed_update(FakeUpdate(), 1)
+    dp.add_middleware(Middleware())
+    await dp.feed_update(FakeUpdate(), 1)
+
+    assert calls == ["handler", "middleware", "handler"]
+
+
+async def test_router_data_is_isolated():
+    dp = Dispatcher()
+    first, second = Router(), Router()
+    dp.include_routers(first, second)
+    received = []
+
+    async def set_flag(upd: FakeUpdate):
+        return {"flag": True}
+
+    async def callback(upd: FakeUpdate, flag: bool = False):
+        received.append(flag)
+
+    for router in (dp, first, second):
+        router.add_handler(FakeUpdate, callback, [])
+    first.add_handler(FakeUpdate, callback, [set_flag])  # type: ignore
+    await dp.feed_update(FakeUpdate(), 1)
+
+    assert received == [False, False, True, False]
+
+
+async def test_handler_for_base_class():
+    dp = Dispatcher()
+    received = []
+
+    async def callback(upd: Update):
+        received.append(upd)
+
+    dp.add_handler(Update, callback, [])
+    update = FakeUpdate()
+    await dp.feed_update(update, 1)
+
+    assert received == [update]
+
+
+async def test_uninterested_router_is_skipped():
+    dp = Dispatcher()
+    parent, child, other = Router(), Router(), Router()
+    dp.include_routers(parent, other)
+    calls = []
+
+    class Middleware(MiddlewareBase):
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+        async def __call__(self, update, data, next_handler):
+            calls.append(self.name)
+            return await next_handler(update, data)
+
+    async def callback(upd: FakeUpdate):
+        calls.append("handler")
+
+    parent.add_middleware(Middleware("parent"))
+    other.add_middleware(Middleware("other"))
+    await dp.feed_update(FakeUpdate(), 1)
+    assert calls == []
+
+    # Handlers added to a nested router later are found through the parent
+    parent.include_router(child)
+    child.add_handler(FakeUpdate, callback, [])
+    await dp.feed_update(FakeUpdate(), 1)
+    assert calls == ["parent", "handler"]
+
+
+def test_handled_update_types():
+    dp = Dispatcher()
+    router = Router()
+    dp.include_router(router)
+    assert dp.handled_update_types == frozenset()
+
+    async def callback(upd: Update):
+        pass
+
+    router.add_handler(raw.UpdateNewMessage, callback, [])
+    assert dp.handled_update_types == {"updateNewMessage"}
+
+    dp.add_middleware(ClientManagerMiddleware(None))  # type: ignore
+    assert dp.handled_update_types == {"updateNewMessage", "updateAuthorizationState"}
+
+    router.add_handler(Update, callback, [])
+    assert dp.handled_update_types is None
@@ -0,0 +1,185 @@
+import asyncio
+
+import pytest
+
+from bygram.downloads import DownloadManager
+from bygram.exceptions import TdlibException
+from bygram.types import raw
+
+
+class FakeFiles:
+    # Downloads finish when complete() is called
+    def __init__(self, sizes: dict[int, int] | None = None) -> None:
+        self.sizes = sizes or {}
+        self.requests: list = []
+        self.downloads: dict[int, asyncio.Future] = {}
+
+    async def execute(self, function, timeout: float = 30):
+        self.requests.append(function)
+        if isinstance(function, raw.GetFile):
+            size = self.sizes.get(function.file_id, 0)
+            return raw.File(id=function.file_id, size=size)
+        if isinstance(function, raw.CancelDownloadFile):
+            self.complete(function.file_id, raw.Error(400, "Download canceled"))
+            return raw.Ok()
+        assert isinstance(function, raw.DownloadFile) and function.synchronous
+        future = asyncio.get_running_loop().create_future()
+        self.downloads[function.file_id] = future
+        return await future
+
+    def started(self) -> list[int]:
+        return [r.file_id for r in self.requests if isinstance(r, raw.DownloadFile)]
+
+    def complete(self, file_id: int, result=None):
+        future = self.downloads.pop(file_id)
+        if future.done():
+            return
+        if isinstance(result, raw.Error):
+            future.set_exception(TdlibException(result.code, result.message))
+        else:
+            future.set_result(result or raw.File(id=file_id))
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_slots_and_priorities():
+    files = FakeFiles()
+    manager = DownloadManager(files.execute, max_concurrent=2)
+    futures = {
+        file_id: manager.download(file_id, priority)
+        for file_id, priority in ((1, 1), (2, 1), (3, 1), (4, 10))
+    }
+    await settle()
+    assert files.started() == [1, 2]
+    assert manager.active == 2
+
+    files.complete(1)
+    assert await futures[1] == raw.File(id=1)
+    await settle()
+    assert files.started() == [1, 2, 4]
+
+    for file_id in (2, 4, 3):
+        files.complete(file_id)
+        await futures[file_id]
+        await settle()
+    assert files.started() == [1, 2, 4, 3]
+
+
+async def test_same_file_is_downloaded_once():
+    files = FakeFiles()
+    manager = DownloadManager(files.execute)
+    first = manager.download(1)
+    second = manager.download(1, priority=5)
+    await settle()
+    files.complete(1)
+
+    assert await first is await second
+    assert files.started() == [1]
+
+
+async def test_cancelled_waiter_does_not_cancel_download():
+    files = FakeFiles()
+    manager = DownloadManager(files.execute)
+    first = manager.download(1)
+    second = manager.download(1)
+    first.cancel()
+    await settle()
+    files.complete(1)
+    assert await second == raw.File(id=1)
+
+
+async def test_progress():
+    files = FakeFiles()
+    manager = DownloadManager(files.execute)
+    future = manager.download(1)
+    await settle()
+
+    progress = raw.File(id=1, local=raw.LocalFile(downloaded_size=10))
+    assert manager.apply(raw.UpdateFile(progress))
+    assert not manager.apply(raw.UpdateFile(raw.File(id=2)))
+    assert manager.progress(1) is progress
+
+    files.complete(1)
+    await future
+    assert manager.progress(1) is None
+
+
+async def test_error():
+    files = FakeFiles()
+    manager = DownloadManager(files.execute)
+    future = manager.download(1)
+    await settle()
+    files.complete(1, raw.Error(400, "File not found"))
+    with pytest.raises(TdlibException):
+        await future
+    assert manager.active == 0
+
+
+async def test_timeout_restarts_on_progress():
+    files = FakeFiles()
+    manager = DownloadManager(files.execute, timeout=0.05)
+    future = manager.download(1)
+    for _ in range(3):
+        await asyncio.sleep(0.03)
+        assert manager.apply(raw.UpdateFile(raw.File(id=1)))
+    assert not future.done()
+
+    with pytest.raises(TimeoutError):
+        await future
+    await settle()
+    assert isinstance(files.requests[-1], raw.CancelDownloadFile)
+    assert manager.active == 0
+
+
+async def test_release_cancels_download():
+    files = FakeFiles()
+    manager = DownloadManager(files.execute, max_concurrent=1)
+    manager.download(1)
+    queued = manager.download(2)
+    await settle()
+
+    manager.release(2)
+    manager.release(1)
+    await settle()
+    assert isinstance(files.requests[-1], raw.CancelDownloadFile)
+    assert queued.cancelled()
+    assert files.started() == [1]
+    assert manager.active == 0
+
+
+async def test_pending_bytes_backpressure():
+    files = FakeFiles({1: 60, 2: 60, 3: 30})
+    manager = DownloadManager(files.execute, max_concurrent=3, max_pending_bytes=100)
+    futures = [manager.download(file_id) for file_id in (1, 2, 3)]
+    await settle()
+    # The second file doesn't fit until the first one is released
+    assert files.started() == [1, 3]
+    assert manager.pending_bytes == 90
+
+    files.complete(1)
+    await futures[0]
+    await settle()
+    assert files.started() == [1, 3]
+
+    manager.release(1)
+    await settle()
+    assert files.started() == [1, 3, 2]
+    assert manager.pending_bytes == 90
+
+
+async def test_downloaded_releases_file():
+    files = FakeFiles({1: 60})
+    manager = DownloadManager(files.execute, max_pending_bytes=100)
+
+    async def complete():
+        await settle()
+        files.complete(1)
+
+    asyncio.create_task(complete())
+    async with manager.downloaded(1) as file:
+        assert file == raw.File(id=1)
+        assert manager.pending_bytes == 60
+    assert manager.pending_bytes == 0
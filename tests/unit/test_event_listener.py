@@ -1,14 +1,16 @@
 import asyncio
+import json
 import time
 
 import pytest
 
+from bygram.core import serializer
 from bygram.core.listener import EventListener
 from bygram.core.types import DeserializedObject
 from bygram.types.base import ObjectBase
 
 
-def fake_receive_func(events: list[DeserializedObject] | None = None):
+def fake_receive_func(events: list[DeserializedObject] | list[bytes] | None = None):
     if events is None:
         events = []
 
@@ -20,10 +22,14 @@ def fake_receive_func(events: list[DeserializedObject] | None = None):
     return receive
 
 
-def create_event_listener(*events: DeserializedObject, timeout: float = 60):
+def create_event_listener(
+    *events: DeserializedObject, timeout: float = 60, batch_size: int = 1
+):
     loop = asyncio.get_event_loop()
     fake_receive = fake_receive_func(list(events))
-    return EventListener(loop, receive=fake_receive, timeout=timeout)
+    return EventListener(
+        loop, receive=fake_receive, timeout=timeout, batch_size=batch_size
+    )
 
 
 async def test_event():
@@ -43,3 +49,75 @@ async def test_event_timeout():
     with pytest.raises(TimeoutError):
         async with asyncio.timeout(1):
             await event_listener.wait_for_event()
+
+
+async def test_batched_events():
+    events = [DeserializedObject(ObjectBase(), i) for i in range(10)]
+    event_listener = create_event_listener(*events, timeout=0.1, batch_size=3)
+    async with asyncio.timeout(1):
+        income_events = [await event_listener.wait_for_event() for _ in events]
+
+    assert income_events == events
+    event_listener.shutdown()
+
+
+async def test_batched_event_timeout():
+    event_listener = create_event_listener(timeout=0.1, batch_size=3)
+    with pytest.raises(TimeoutError):
+        async with asyncio.timeout(1):
+            await event_listener.wait_for_event()
+    event_listener.shutdown()
+
+
+def fake_decode(raw: bytes) -> DeserializedObject:
+    data = json.loads(raw)
+    return DeserializedObject(ObjectBase(), data["@client_id"], data["n"])
+
+
+@pytest.mark.parametrize("batch_size", [1, 4])
+async def test_decode_pool_keeps_client_order(batch_size: int):
+    raw_events = [
+        json.dumps({"n": i, "@client_id": i % 3}).encode() for i in range(30)
+    ]
+    loop = asyncio.get_event_loop()
+    event_listener = EventListener(
+        loop,
+        receive=fake_receive_func(list(raw_events)),
+        timeout=0.1,
+        batch_size=batch_size,
+        decode=fake_decode,
+        decode_workers=2,
+        peek_client_id=serializer.peek_client_id,
+    )
+    async with asyncio.timeout(1):
+        events = [await event_listener.wait_for_event() for _ in raw_events]
+
+    for client_id in range(3):
+        numbers = [e.extra for e in events if e.client_id == client_id]
+        assert numbers == list(range(client_id, 30, 3))
+
+    stats = event_listener.decode_stats()
+    assert stats and stats.decoded == 30
+    event_listener.shutdown()
+
+
+@pytest.mark.parametrize("batch_size", [1, 4])
+async def test_responses_bypass_updates_queue(batch_size: int):
+    update = DeserializedObject(ObjectBase())
+    response = DeserializedObject(ObjectBase(), extra=1)
+    responses = []
+    loop = asyncio.get_event_loop()
+    event_listener = EventListener(
+        loop,
+        receive=fake_receive_func([update, response]),
+        timeout=0.1,
+        batch_size=batch_size,
+        on_response=lambda obj, extra: responses.append((obj, extra)),
+    )
+    async with asyncio.timeout(1):
+        assert await event_listener.wait_for_event() == update
+        while not responses:
+            await asyncio.sleep(0.01)
+
+    assert responses == [(response.obj, 1)]
+    event_listener.shutdown()
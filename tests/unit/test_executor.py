@@ -0,0 +1,245 @@
+import asyncio
+
+import pytest
+
+from bygram.exceptions import TdlibException
+from bygram.executor import Executor
+from bygram.types import raw
+from bygram.types.base import Function
+from bygram.types.raw import Ok
+
+
+async def test_resolve_response():
+    sent = []
+    executor = Executor(lambda *args: sent.append(args), asyncio.get_event_loop())
+    task = asyncio.create_task(executor.execute(1, raw.TestCallEmpty(), timeout=1))
+    await asyncio.sleep(0)
+
+    _, _, extra = sent[0]
+    executor.resolve_response(Ok(), extra)
+    assert await task == Ok()
+
+
+async def test_resolve_response_after_timeout():
+    sent = []
+    executor = Executor(lambda *args: sent.append(args), asyncio.get_event_loop())
+    with pytest.raises(TimeoutError):
+        await executor.execute(1, raw.TestCallEmpty(), timeout=0.01)
+
+    executor.resolve_response(Ok(), sent[0][2])
+
+
+async def test_execute_many():
+    sent = []
+    executor = Executor(lambda *args: sent.append(args), asyncio.get_event_loop())
+    functions = [raw.TestSquareInt(i) for i in range(3)]
+    task = asyncio.create_task(executor.execute_many(1, functions, timeout=0.1))
+    await asyncio.sleep(0)
+
+    assert [function for _, function, _ in sent] == functions
+    extras = [extra for _, _, extra in sent]
+    executor.resolve_response(raw.TestInt(4), extras[2])
+    executor.resolve_response(raw.Error(400, "Bad request"), extras[0])
+
+    first, second, third = await task
+    assert isinstance(first, TdlibException)
+    assert isinstance(second, TimeoutError)
+    assert third == raw.TestInt(4)
+
+
+async def test_execute_as_completed():
+    sent = []
+    executor = Executor(lambda *args: sent.append(args), asyncio.get_event_loop())
+    functions = [raw.TestSquareInt(i) for i in range(3)]
+    results = executor.execute_as_completed(1, functions, timeout=0.1)
+
+    async def take_first():
+        return await anext(results)
+
+    first = asyncio.create_task(take_first())
+    await asyncio.sleep(0)
+
+    extras = [extra for _, _, extra in sent]
+    executor.resolve_response(raw.TestInt(4), extras[2])
+    assert await first == (2, raw.TestInt(4))
+
+    executor.resolve_response(raw.TestInt(0), extras[0])
+    rest = [item async for item in results]
+    assert rest[0] == (0, raw.TestInt(0))
+    assert rest[1][0] == 1 and isinstance(rest[1][1], TimeoutError)
+
+
+async def test_timed_out_requests_are_forgotten():
+    executor = Executor(lambda *args: None, asyncio.get_event_loop())
+    with pytest.raises(TimeoutError):
+        await executor.execute(1, raw.TestCallEmpty(), timeout=0.01)
+    await executor.execute_many(1, [raw.TestCallEmpty()] * 3, timeout=0.01)
+    async for _ in executor.execute_as_completed(1, [raw.TestCallEmpty()], 0.01):
+        pass
+    await asyncio.sleep(0)
+
+    assert executor._waiting_response == {}
+    assert executor.in_flight() == 0
+
+
+async def test_cancelled_request_is_forgotten():
+    executor = Executor(lambda *args: None, asyncio.get_event_loop())
+    task = asyncio.create_task(executor.execute(1, raw.TestCallEmpty(), timeout=1))
+    await asyncio.sleep(0)
+    assert executor.in_flight(1) == 1
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.sleep(0)
+    assert executor._waiting_response == {}
+    assert executor.in_flight(1) == 0
+
+
+@pytest.mark.parametrize("max_in_flight", [None, 10])
+async def test_failed_batch_send_is_forgotten(max_in_flight):
+    sent = []
+
+    def send(*args):
+        if len(sent) == 2:
+            raise OSError("Send failed")
+        sent.append(args)
+
+    executor = Executor(
+        send, asyncio.get_event_loop(), max_in_flight_per_client=max_in_flight
+    )
+    with pytest.raises(OSError):
+        await executor.execute_many(1, [raw.TestCallEmpty()] * 4, timeout=1)
+
+    assert len(sent) == 2
+    assert executor._waiting_response == {}
+    assert executor.in_flight(1) == 0
+
+
+async def test_late_response_is_not_lost(caplog):
+    sent = []
+    executor = Executor(lambda *args: sent.append(args), asyncio.get_event_loop())
+    with pytest.raises(TimeoutError):
+        await executor.execute(1, raw.TestCallEmpty(), timeout=0.01)
+
+    with caplog.at_level("WARNING"):
+        executor.resolve_response(Ok(), sent[0][2])
+        executor.resolve_response(Ok(), "unknown")
+    assert [r.getMessage().startswith("Can't find waiter") for r in caplog.records] == [
+        True
+    ]
+
+
+async def test_max_in_flight_per_client():
+    sent = []
+    executor = Executor(
+        lambda *args: sent.append(args),
+        asyncio.get_event_loop(),
+        max_in_flight_per_client=2,
+    )
+    tasks = [
+        asyncio.create_task(executor.execute(1, raw.TestCallEmpty(), timeout=1))
+        for _ in range(3)
+    ]
+    other = asyncio.create_task(executor.execute(2, raw.TestCallEmpty(), timeout=1))
+    await asyncio.sleep(0)
+    assert [client_id for client_id, _, _ in sent] == [1, 1, 2]
+    assert executor.in_flight() == 3
+    assert executor.in_flight(1) == 2
+
+    executor.resolve_response(Ok(), sent[0][2])
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert len(sent) == 4 and sent[3][0] == 1
+
+    for _, _, extra in sent[1:]:
+        executor.resolve_response(Ok(), extra)
+    assert await asyncio.gather(*tasks, other) == [Ok()] * 4
+    await asyncio.sleep(0)
+    assert executor.in_flight() == 0
+
+
+async def test_execute_many_waits_for_capacity():
+    sent = []
+    executor = Executor(
+        lambda *args: sent.append(args),
+        asyncio.get_event_loop(),
+        max_in_flight_per_client=1,
+    )
+    functions = [raw.TestSquareInt(i) for i in range(2)]
+    task = asyncio.create_task(executor.execute_many(1, functions, timeout=0.05))
+    await asyncio.sleep(0)
+    assert len(sent) == 1
+
+    executor.resolve_response(raw.TestInt(0), sent[0][2])
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert len(sent) == 2
+
+    first, second = await task
+    assert first == raw.TestInt(0)
+    assert isinstance(second, TimeoutError)
+
+
+async def test_coalesce_identical_requests():
+    sent = []
+    executor = Executor(
+        lambda *args: sent.append(args), asyncio.get_event_loop(), coalesce=True
+    )
+    functions: list[Function] = [
+        raw.GetChat(10),
+        raw.GetChat(10),
+        raw.GetChat(20),
+        raw.TestSquareInt(3),
+        raw.TestSquareInt(3),
+    ]
+    tasks = [
+        asyncio.create_task(executor.execute(1, function, timeout=1))
+        for function in functions
+    ]
+    await asyncio.sleep(0)
+    assert [function for _, function, _ in sent] == [
+        raw.GetChat(10),
+        raw.GetChat(20),
+        raw.TestSquareInt(3),
+        raw.TestSquareInt(3),
+    ]
+
+    chat = raw.Chat(id=10)
+    executor.resolve_response(chat, sent[0][2])
+    first, second = await asyncio.gather(*tasks[:2])
+    assert first is chat and second is chat
+
+    for task in tasks[2:]:
+        task.cancel()
+    await asyncio.gather(*tasks[2:], return_exceptions=True)
+    assert executor.in_flight() == 0
+
+
+async def test_coalesced_waiter_timeout_does_not_cancel_others():
+    sent = []
+    executor = Executor(
+        lambda *args: sent.append(args), asyncio.get_event_loop(), coalesce=True
+    )
+    long = asyncio.create_task(executor.execute(1, raw.GetUser(1), timeout=1))
+    await asyncio.sleep(0)
+    with pytest.raises(TimeoutError):
+        await executor.execute(1, raw.GetUser(1), timeout=0.01)
+
+    assert len(sent) == 1
+    executor.resolve_response(raw.Error(400, "Bad request"), sent[0][2])
+    with pytest.raises(TdlibException):
+        await long
+    assert executor.in_flight() == 0
+    assert executor._shared_requests == {}
+
+
+async def test_coalesce_is_opt_in():
+    sent = []
+    executor = Executor(lambda *args: sent.append(args), asyncio.get_event_loop())
+    tasks = [
+        asyncio.create_task(executor.execute(1, raw.GetChat(10), timeout=0.01))
+        for _ in range(2)
+    ]
+    await asyncio.gather(*tasks, return_exceptions=True)
+    assert len(sent) == 2
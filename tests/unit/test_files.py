@@ -0,0 +1,85 @@
+import asyncio
+import base64
+import os
+from unittest import mock
+
+import pytest
+
+from bygram.files import open_file, open_local_file
+from bygram.types import raw
+
+CONTENT = bytes(range(256)) * 40
+
+
+def fake_execute(file: raw.File, requests: list):
+    async def execute(function):
+        requests.append(function)
+        if isinstance(function, raw.GetFile):
+            return file
+        assert isinstance(function, raw.ReadFilePart)
+        await asyncio.sleep(0)
+        data = CONTENT[function.offset : function.offset + function.count]
+        # Like a decoded response of TDLib
+        return raw.Data(base64.b64encode(data).decode())  # type: ignore
+
+    return execute
+
+
+async def test_read_local_file(tmp_path):
+    path = tmp_path / "file"
+    path.write_bytes(CONTENT)
+    file = raw.File(
+        id=1,
+        size=len(CONTENT),
+        local=raw.LocalFile(path=str(path), is_downloading_completed=True),
+    )
+    requests = []
+    reader = await open_file(fake_execute(file, requests), 1, chunk_size=1000)
+    async with reader:
+        assert b"".join([chunk async for chunk in reader]) == CONTENT
+
+        reader.seek(-10, os.SEEK_END)
+        assert await reader.read() == CONTENT[-10:]
+        reader.seek(995)
+        assert await reader.read(10) == CONTENT[995:1005]
+        assert reader.tell() == 1005
+    assert [type(r) for r in requests] == [raw.GetFile]
+
+    with pytest.raises(ValueError):
+        await reader.read()
+
+
+def test_local_file_is_closed_on_error(tmp_path):
+    path = tmp_path / "file"
+    path.write_bytes(CONTENT)
+    file = raw.File(id=1, local=raw.LocalFile(path=str(path)))
+    with (
+        mock.patch("os.fstat", side_effect=OSError("fstat failed")),
+        mock.patch("os.close", wraps=os.close) as close,
+    ):
+        with pytest.raises(OSError):
+            open_local_file(file)
+    close.assert_called_once()
+
+
+async def test_read_file_part():
+    file = raw.File(
+        id=1,
+        size=len(CONTENT),
+        local=raw.LocalFile(downloaded_prefix_size=5000),
+    )
+    requests = []
+    reader = await open_file(
+        fake_execute(file, requests), 1, chunk_size=1000, read_ahead=2
+    )
+    assert reader.size == 5000
+
+    assert await reader.read(10) == CONTENT[:10]
+    # The current chunk and two chunks ahead
+    assert [r.offset for r in requests[1:]] == [0, 1000, 2000]
+
+    reader.seek(4500)
+    assert await reader.read() == CONTENT[4500:5000]
+    assert len(reader._chunks) == 1
+    assert await reader.read() == b""
+    await reader.close()
@@ -0,0 +1,84 @@
+from bygram.routing import (
+    ChatIdFilter,
+    ContentTypeFilter,
+    Dispatcher,
+    SenderFilter,
+    TextFilter,
+)
+from bygram.types import raw
+
+
+def new_message(chat_id: int, text: str = "", user_id: int = 1) -> raw.UpdateNewMessage:
+    content = raw.MessageText(text=raw.FormattedText(text=text, entities=[]))
+    message = raw.Message(
+        id=1,
+        chat_id=chat_id,
+        sender_id=raw.MessageSenderUser(user_id=user_id),
+        content=content,
+    )
+    return raw.UpdateNewMessage(message)
+
+
+def record(calls: list, name: str):
+    async def callback(update: raw.UpdateNewMessage):
+        calls.append(name)
+
+    return callback
+
+
+async def test_chat_id_filter():
+    dp = Dispatcher()
+    calls = []
+    dp.add_handler(raw.UpdateNewMessage, record(calls, "any"), [])
+    dp.add_handler(raw.UpdateNewMessage, record(calls, "1"), [ChatIdFilter(1)])
+    dp.add_handler(raw.UpdateNewMessage, record(calls, "1,2"), [ChatIdFilter(1, 2)])
+    dp.add_handler(raw.UpdateNewMessage, record(calls, "3"), [ChatIdFilter(3)])
+
+    await dp.feed_update(new_message(1), 1)
+    assert calls == ["any", "1", "1,2"]
+
+    calls.clear()
+    await dp.feed_update(new_message(2), 1)
+    assert calls == ["any", "1,2"]
+
+
+async def test_combined_filters():
+    dp = Dispatcher()
+    calls = []
+    filters = [
+        SenderFilter(10),
+        ChatIdFilter(1),
+        ContentTypeFilter(raw.MessageText),
+        TextFilter(r"^/start"),
+    ]
+    dp.add_handler(raw.UpdateNewMessage, record(calls, "start"), filters)  # type: ignore
+    dp.add_handler(
+        raw.UpdateNewMessage,
+        record(calls, "photo"),
+        [ContentTypeFilter(raw.MessagePhoto)],
+    )
+
+    await dp.feed_update(new_message(1, "/start", user_id=10), 1)
+    await dp.feed_update(new_message(1, "/start", user_id=11), 1)
+    await dp.feed_update(new_message(2, "/start", user_id=10), 1)
+    await dp.feed_update(new_message(1, "hello", user_id=10), 1)
+
+    assert calls == ["start"]
+
+
+async def test_fallback_filter():
+    dp = Dispatcher()
+    calls = []
+
+    async def only_client_2(update: raw.UpdateNewMessage, client_id: int):
+        return client_id == 2
+
+    dp.add_handler(
+        raw.UpdateNewMessage,
+        record(calls, "handler"),
+        [ChatIdFilter(1), only_client_2],  # type: ignore
+    )
+    await dp.feed_update(new_message(1), 1)
+    await dp.feed_update(new_message(1), 2)
+
+    assert calls == ["handler"]
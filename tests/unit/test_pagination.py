@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+
+from bygram.exceptions import TdlibException
+from bygram.pagination import (
+    iter_chats,
+    iter_history,
+    iter_search_chat_messages,
+    iter_search_messages,
+)
+from bygram.types import raw
+
+
+class FakeHistory:
+    # Messages with ids from count down to 1, like TDLib returns them: from
+    # from_message_id inclusive, only the last message for the first request
+    def __init__(self, count: int) -> None:
+        self.ids = list(range(count, 0, -1))
+        self.requests: list[raw.GetChatHistory] = []
+
+    async def execute(self, function: raw.GetChatHistory) -> raw.Messages:
+        self.requests.append(function)
+        await asyncio.sleep(0)
+        if function.from_message_id == 0:
+            ids = self.ids[:1]
+        else:
+            ids = [i for i in self.ids if i <= function.from_message_id]
+        messages = [raw.Message(id=i) for i in ids[: function.limit]]
+        return raw.Messages(total_count=len(self.ids), messages=messages)
+
+
+@pytest.mark.parametrize("read_ahead", [0, 1, 3])
+async def test_iter_history(read_ahead: int):
+    history = FakeHistory(25)
+    messages = iter_history(history.execute, 1, page_size=10, read_ahead=read_ahead)
+    messages = [m async for m in messages]
+    assert [m.id for m in messages] == list(range(25, 0, -1))
+
+
+async def test_iter_history_limit():
+    history = FakeHistory(25)
+    messages = [m async for m in iter_history(history.execute, 1, limit=12, page_size=10)]
+    assert [m.id for m in messages] == list(range(25, 13, -1))
+    assert [r.limit for r in history.requests] == [10, 11, 2]
+
+
+async def test_iter_history_from_message():
+    history = FakeHistory(25)
+    messages = [
+        m async for m in iter_history(history.execute, 1, limit=3, from_message_id=5)
+    ]
+    assert [m.id for m in messages] == [5, 4, 3]
+
+
+async def test_read_ahead():
+    history = FakeHistory(100)
+    messages = iter_history(history.execute, 1, page_size=10, read_ahead=2)
+    await anext(messages)
+    for _ in range(10):
+        await asyncio.sleep(0)
+    # The consumed page, two pages in the queue and one waiting for room
+    assert len(history.requests) == 4
+    await messages.aclose()
+
+
+async def test_error_is_raised():
+    async def execute(function):
+        if function.offset:
+            raise TdlibException(400, "Bad request")
+        return raw.FoundMessages(1, [raw.Message(id=1)], next_offset="next")
+
+    messages = iter_search_messages(execute, raw.SearchMessages(query="q"))
+    assert (await anext(messages)).id == 1
+    with pytest.raises(TdlibException):
+        await anext(messages)
+
+
+async def test_iter_search_messages():
+    requests = []
+
+    async def execute(function: raw.SearchMessages):
+        requests.append(function)
+        page = int(function.offset or 0)
+        messages = [raw.Message(id=page * 10 + i) for i in range(function.limit)]
+        next_offset = str(page + 1) if page < 2 else ""
+        return raw.FoundMessages(30, messages, next_offset=next_offset)
+
+    search = raw.SearchMessages(query="q", limit=10)
+    messages = [m async for m in iter_search_messages(execute, search)]
+    assert len(messages) == 30
+    assert {r.query for r in requests} == {"q"}
+
+
+async def test_iter_search_chat_messages():
+    async def execute(function: raw.SearchChatMessages):
+        start = function.from_message_id or 7
+        ids = list(range(start, max(start - function.limit, 0), -1))
+        next_from = ids[-1] - 1 if ids[-1] > 1 else 0
+        return raw.FoundChatMessages(7, [raw.Message(id=i) for i in ids], next_from)
+
+    search = raw.SearchChatMessages(chat_id=1, query="q", limit=3)
+    messages = [m async for m in iter_search_chat_messages(execute, search)]
+    assert [m.id for m in messages] == list(range(7, 0, -1))
+
+
+async def test_iter_chats():
+    chat_ids = list(range(1, 26))
+
+    async def execute(function: raw.GetChats):
+        return raw.Chats(len(chat_ids), chat_ids[: function.limit])
+
+    assert [c async for c in iter_chats(execute, page_size=10)] == chat_ids
+    first = [c async for c in iter_chats(execute, page_size=10, limit=15)]
+    assert first == chat_ids[:15]
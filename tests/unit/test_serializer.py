@@ -8,15 +8,48 @@ from bygram.types import raw
 from bygram.types.base import ObjectBase, TlObject
 
 
+@pytest.fixture(params=serializer.available_codecs(), ids=lambda codec: codec.name)
+def codec(request: pytest.FixtureRequest) -> serializer.Codec:
+    return request.param
+
+
 @pytest.mark.parametrize(
     "obj,result",
     [
         (raw.TestCallEmpty(), {"@type": "testCallEmpty"}),
-        (raw.TestSquareInt(1), {"x": 1, "@type": "testSquareInt"}),
+        (raw.TestSquareInt(1), {"@type": "testSquareInt", "x": 1}),
+    ],
+)
+def test_serialize(codec: serializer.Codec, obj: ObjectBase, result: dict):
+    assert codec.serialize(obj) == json.dumps(result).encode()
+
+
+@pytest.mark.parametrize(
+    "obj,extra,result",
+    [
+        (
+            raw.TestCallBytes(b"\x00\x01"),
+            None,
+            b'{"@type": "testCallBytes", "x": "AAE="}',
+        ),
+        (
+            raw.TestCallVectorStringObject([raw.TestString("a"), raw.TestString("b")]),
+            None,
+            b'{"@type": "testCallVectorStringObject", "x": [{"@type": "testString", '
+            b'"value": "a"}, {"@type": "testString", "value": "b"}]}',
+        ),
+        (
+            raw.TestReturnError(raw.Error(400, 'Bad "_type"')),
+            1,
+            b'{"@type": "testReturnError", "error": {"@type": "error", "code": 400, '
+            b'"message": "Bad \\"_type\\""}, "@extra": 1}',
+        ),
     ],
 )
-def test_serialize(obj: ObjectBase, result: dict):
-    assert serializer.serialize_object(obj) == json.dumps(result).encode()
+def test_serialize_nested(
+    codec: serializer.Codec, obj: ObjectBase, extra: int | None, result: bytes
+):
+    assert codec.serialize(obj, extra) == result
 
 
 @pytest.mark.parametrize(
@@ -27,7 +60,110 @@ def test_serialize(obj: ObjectBase, result: dict):
             b'{"@type": "testCallEmpty", "@client_id": 1, "@extra": 1}',
             DeserializedObject(raw.TestCallEmpty(), 1, 1),
         ),
+        (
+            b'{"@type":"testVectorStringObject","value":[{"@type":"testString",'
+            b'"value":"a"}],"@client_id":2}',
+            DeserializedObject(raw.TestVectorStringObject([raw.TestString("a")]), 2),
+        ),
+        (
+            b'{"@type": "testString", "value": "\\ud800"}',
+            DeserializedObject(raw.TestString("\ud800")),
+        ),
+    ],
+)
+def test_deserialize(codec: serializer.Codec, obj: bytes, result: TlObject):
+    assert codec.deserialize(obj) == result
+
+
+def test_default_codec_is_stdlib():
+    # Even with orjson installed
+    assert isinstance(serializer.default_codec(), serializer.StdlibCodec)
+
+
+def test_deserialize_unknown_type(codec: serializer.Codec):
+    with pytest.raises(RuntimeError):
+        codec.deserialize(b'{"@type": "unknownTestType"}')
+
+
+@pytest.mark.parametrize(
+    "obj,client_id",
+    [
+        (b'{"@type":"ok","@client_id":12}', 12),
+        (b'{"@type": "ok", "@client_id": 3, "@extra": 1}', 3),
+        (b'{"@type":"testString","value":"\\"@client_id\\":5"}', None),
+    ],
+)
+def test_peek_client_id(obj: bytes, client_id: int | None):
+    assert serializer.peek_client_id(obj) == client_id
+
+
+@pytest.mark.parametrize(
+    "obj,type_",
+    [
+        (b'{"@type":"updateOption","name":"version"}', "updateOption"),
+        (b'{ "@type": "ok", "@client_id": 3}', "ok"),
+        (b'{"name":"version","@type":"updateOption"}', None),
+    ],
+)
+def test_peek_type(obj: bytes, type_: str | None):
+    assert serializer.peek_type(obj) == type_
+
+
+@pytest.mark.parametrize(
+    "obj,skipped",
+    [
+        (b'{"@type":"updateOption","name":"version","@client_id":1}', True),
+        (b'{"@type":"updateNewChat","@client_id":1}', False),
+        (b'{"@type":"updates","updates":[],"@extra":5,"@client_id":1}', False),
+        (b'{"@type":"ok","@client_id":1}', False),
     ],
 )
-def test_deserialize(obj: bytes, result: TlObject):
-    assert serializer.deserialize_object(obj) == result
+def test_decode_skips_unhandled_updates(obj: bytes, skipped: bool):
+    wrapper = serializer.SerializedWrapper(None)  # type: ignore
+    wrapper.set_handled_update_types(lambda: frozenset({"updateNewChat"}))
+    assert (wrapper.decode(obj) is None) == skipped
+
+
+def test_deserialize_lazy(codec: serializer.Codec):
+    data = (
+        b'{"@type":"messages","total_count":1,"messages":[{"@type":"message",'
+        b'"id":1,"chat_id":5,"content":{"@type":"messageText","text":'
+        b'{"@type":"formattedText","text":"hi","entities":[]}}}],'
+        b'"@extra":7,"@client_id":2}'
+    )
+    lazy = serializer.deserialize_object_lazy(data, codec.loads)
+    eager = codec.deserialize(data)
+
+    assert (lazy.client_id, lazy.extra) == (2, 7)
+    assert isinstance(lazy.obj, raw.Messages)
+    assert lazy.obj.messages is not None
+    message = lazy.obj.messages[0]
+    assert isinstance(message.content, raw.MessageText)
+    assert message.content.text is not None
+    assert message.content.text.text == "hi"
+    assert message.reply_markup is None
+    assert lazy == eager
+    with pytest.raises(AttributeError):
+        getattr(message, "unknown_field")
+
+
+def test_failed_lazy_load():
+    class Broken:
+        def load(self, obj):
+            raise KeyError("value")
+
+    obj = object.__new__(raw.TestString)
+    obj._lazy = Broken()
+    with pytest.raises(AttributeError, match="Can't load") as info:
+        obj.value
+    assert isinstance(info.value.__cause__, KeyError)
+    # The load isn't retried
+    with pytest.raises(AttributeError, match="no attribute"):
+        obj.value
+
+
+def test_deserialize_lazy_memoryview():
+    data = memoryview(b'{"@type":"testString","value":"a","@client_id":1}')
+    result = serializer.deserialize_object_lazy(data)
+    assert result.client_id == 1
+    assert result.obj == raw.TestString("a")
@@ -0,0 +1,143 @@
+import asyncio
+import json
+import multiprocessing
+import os
+import pickle
+import queue
+from unittest import mock
+
+import pytest
+
+from bygram import manager
+from bygram.routing import Dispatcher
+from bygram.sharding import ShardedLibraryManager, _Shard
+from bygram.types import raw
+
+# Names of options from UpdateOption handled in the shard process
+_handled: list[str] = []
+
+
+class EchoLibrary:
+    # testCallString sends UpdateOption before the response, getOption tells the
+    # handled options or the process id
+    def __init__(self) -> None:
+        self._clients = 0
+        self._events: queue.Queue[bytes] = queue.Queue()
+
+    def create_client(self) -> int:
+        self._clients += 1
+        return self._clients
+
+    def _put(self, obj: dict, client_id: int):
+        self._events.put(json.dumps({**obj, "@client_id": client_id}).encode())
+
+    def send(self, client_id: int, request: bytes):
+        data = json.loads(request)
+        type_ = data["@type"]
+        response: dict = {"@type": "ok"}
+        if type_ == "testCallString":
+            update = {"@type": "updateOption", "name": data["x"]}
+            self._put(update | {"value": {"@type": "optionValueEmpty"}}, client_id)
+            response = {"@type": "testString", "value": data["x"]}
+        elif type_ == "getOption":
+            value = ",".join(_handled) if data["name"] == "handled" else os.getpid()
+            response = {"@type": "optionValueString", "value": str(value)}
+        elif type_ == "close":
+            state = {"@type": "authorizationStateClosed"}
+            self._put(
+                {"@type": "updateAuthorizationState", "authorization_state": state},
+                client_id,
+            )
+        self._put(response | {"@extra": data["@extra"]}, client_id)
+
+    def receive(self, timeout: float) -> bytes | None:
+        try:
+            return self._events.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def execute(self, request: bytes) -> bytes:
+        return b'{"@type":"ok"}'
+
+    def close(self):
+        pass
+
+
+def create_echo_manager(path: str, loop=None, **options):
+    with mock.patch.object(manager, "load_library", lambda *_, **__: EchoLibrary()):
+        return manager.create_library_manager(path, loop=loop, **options)
+
+
+def setup_dispatcher() -> Dispatcher:
+    dp = Dispatcher()
+
+    @dp.register(raw.UpdateOption)
+    async def on_option(update: raw.UpdateOption):
+        _handled.append(update.name)
+
+    return dp
+
+
+async def test_sharded_library_manager():
+    sharded = ShardedLibraryManager(
+        "",
+        2,
+        setup=setup_dispatcher,
+        create_manager=create_echo_manager,
+        receive_timeout=0.1,
+    )
+    async with sharded:
+        clients = [await sharded.create_client() for _ in range(3)]
+        assert [c.shard for c in clients] == [0, 1, 0]
+        assert len({c.id for c in clients}) == 3
+
+        first, second, third = clients
+        # Updates are handled by the dispatcher of the shard before the response
+        assert await first.execute(raw.TestCallString("a")) == raw.TestString("a")
+        assert await third.execute(raw.TestCallString("b")) == raw.TestString("b")
+        handled = await first.execute(raw.GetOption("handled"))
+        assert handled == raw.OptionValueString("a,b")
+        handled = await second.execute(raw.GetOption("handled"))
+        assert handled == raw.OptionValueString("")
+
+        pids = await asyncio.gather(*(c.execute(raw.GetOption("pid")) for c in clients))
+        assert pids[0] == pids[2] != pids[1]
+
+        results = await second.execute_many([raw.TestCallString("c"), raw.Close()])
+        assert results == [raw.TestString("c"), raw.Ok()]
+        async with asyncio.timeout(5):
+            while not second.closed:
+                await asyncio.sleep(0.01)
+
+        # The shard of the closed client is the least loaded one again
+        assert (await sharded.create_client()).shard == 1
+
+
+class Unpicklable(Exception):
+    # Fails to unpickle, as __init__ requires two arguments
+    def __init__(self, a, b) -> None:
+        super().__init__(a)
+
+
+async def test_unreadable_message_fails_pending_calls():
+    connection, shard_connection = multiprocessing.Pipe()
+    shard = _Shard(0, None, connection, lambda *args: None)
+    shard.start_reading(asyncio.get_running_loop())
+
+    pending = shard.call(2)
+    shard_connection.recv_bytes()
+    shard_connection.send_bytes(pickle.dumps((2, 1, Unpicklable(1, 2))))
+    with pytest.raises(RuntimeError, match="Can't read a message"):
+        await asyncio.wait_for(pending, 5)
+
+    # The shard keeps working
+    call = shard.call(2)
+    shard_connection.recv_bytes()
+    shard_connection.send_bytes(pickle.dumps((1, 2, "result")))
+    assert await asyncio.wait_for(call, 5) == "result"
+
+    pending = shard.call(2)
+    shard_connection.close()
+    with pytest.raises(RuntimeError, match="stopped"):
+        await asyncio.wait_for(pending, 5)
+    connection.close()
@@ -0,0 +1,123 @@
+import asyncio
+from typing import Any, cast
+
+import pytest
+
+from bygram.core.listener import EventListener
+from bygram.core.types import DeserializedObject
+from bygram.executor import Executor
+from bygram.routing.dispatcher import Dispatcher
+from bygram.strategy import PENDING_UPDATES_FACTOR, EventsLoop, UpdatesScheduler
+from bygram.types import raw
+from bygram.types.base import Function, Update
+from bygram.types.raw import UpdateChatTitle, UpdateOption
+
+
+async def test_scheduler_keeps_chat_order():
+    processed = []
+
+    async def feed_update(update: Update, client_id: int):
+        assert isinstance(update, UpdateChatTitle)
+        await asyncio.sleep(0.01 if update.title == "first" else 0)
+        processed.append((update.chat_id, update.title))
+
+    scheduler = UpdatesScheduler(feed_update, max_concurrent=10)
+    scheduler.schedule(UpdateChatTitle(1, "first"), 1)
+    scheduler.schedule(UpdateChatTitle(1, "second"), 1)
+    scheduler.schedule(UpdateChatTitle(2, "first"), 1)
+    scheduler.schedule(UpdateChatTitle(3, "second"), 1)
+    async with asyncio.timeout(1):
+        while scheduler.pending:
+            await asyncio.sleep(0.01)
+
+    assert processed.index((1, "first")) < processed.index((1, "second"))
+    # Slow update of the first chat doesn't block other chats
+    assert processed[0] == (3, "second")
+
+
+async def test_scheduler_concurrency_limit():
+    running = 0
+    max_running = 0
+
+    async def feed_update(update: Update, client_id: int):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    scheduler = UpdatesScheduler(feed_update, max_concurrent=2)
+    for chat_id in range(6):
+        scheduler.schedule(UpdateChatTitle(chat_id, "title"), 1)
+    scheduler.schedule(UpdateOption("version"), 1)
+    async with asyncio.timeout(1):
+        while scheduler.pending:
+            await asyncio.sleep(0.01)
+
+    assert max_running == 2
+
+
+async def test_scheduler_continues_after_error():
+    processed = []
+
+    async def feed_update(update: Update, client_id: int):
+        assert isinstance(update, UpdateChatTitle)
+        if update.title == "bad":
+            raise ValueError(update.title)
+        processed.append(update.title)
+
+    scheduler = UpdatesScheduler(feed_update, max_concurrent=1, max_pending=3)
+    scheduler.schedule(UpdateChatTitle(1, "bad"), 1)
+    scheduler.schedule(UpdateChatTitle(1, "first"), 1)
+    scheduler.schedule(UpdateChatTitle(1, "second"), 1)
+    async with asyncio.timeout(1):
+        while scheduler.pending:
+            await asyncio.sleep(0.01)
+
+    assert processed == ["first", "second"]
+
+
+class QueueListener:
+    # Events of a fake TDLib, responses come after the updates received before
+    def __init__(self) -> None:
+        self.events: asyncio.Queue[DeserializedObject] = asyncio.Queue()
+
+    async def wait_for_event(self) -> DeserializedObject:
+        return await self.events.get()
+
+    def shutdown(self):
+        pass
+
+
+@pytest.mark.parametrize("max_concurrent_updates", [None, 1])
+async def test_handlers_at_capacity_can_execute(max_concurrent_updates: int | None):
+    listener = QueueListener()
+
+    def send(client_id: int, function: Function, extra: Any):
+        listener.events.put_nowait(DeserializedObject(raw.Ok(), client_id, extra))
+
+    executor = Executor(send, asyncio.get_running_loop())
+    dp = Dispatcher()
+    handled = 0
+
+    @dp.register(UpdateOption)
+    async def on_option(update: UpdateOption):
+        nonlocal handled
+        await executor.execute(1, raw.TestCallEmpty(), timeout=1)
+        handled += 1
+
+    # More updates than the scheduler runs before buffering. Handlers run one by
+    # one without max_concurrent_updates
+    updates = 2 * PENDING_UPDATES_FACTOR
+    for _ in range(updates):
+        listener.events.put_nowait(DeserializedObject(UpdateOption("version"), 1))
+    events_loop = EventsLoop(
+        cast(EventListener, listener), executor, dp, max_concurrent_updates
+    )
+    events_loop.start_listening()
+    try:
+        async with asyncio.timeout(5):
+            while handled < updates:
+                await asyncio.sleep(0.01)
+    finally:
+        await events_loop.shutdown()
@@ -0,0 +1,71 @@
+import ast
+import importlib
+import inspect
+import os
+import subprocess
+import sys
+import typing
+
+import pytest
+
+from bygram import types
+from bygram.types import raw
+
+
+def test_lazy_import():
+    from bygram.types.raw import TestString
+
+    assert raw.TestString is TestString
+    assert types.TestString is TestString
+    assert "TestString" in dir(raw)
+
+
+def test_import_loads_few_submodules():
+    # Only classes which are used at runtime on import, like Error, are loaded
+    code = (
+        "import sys, bygram; "
+        "print(sum(m.startswith('bygram.types.raw.') for m in sys.modules))"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert int(result.stdout) <= 3
+
+
+def test_unknown_type():
+    with pytest.raises(AttributeError):
+        getattr(raw, "UnknownTestType")
+
+    with pytest.raises(AttributeError):
+        getattr(types, "UnknownTestType")
+
+
+def test_star_import():
+    namespace: dict = {}
+    exec("from bygram.types import *", namespace)
+    assert namespace["UpdateOption"] is raw.UpdateOption
+    assert namespace["ObjectBase"] is types.ObjectBase
+
+
+@pytest.mark.parametrize("module_name", ["classes_06", "classes_24", "functions_00"])
+def test_annotations_are_imported_for_type_checkers(module_name: str):
+    # Classes of other submodules are imported under TYPE_CHECKING only
+    module = importlib.import_module(f"{raw.__name__}.{module_name}")
+    tree = ast.parse(inspect.getsource(module))
+    block = next(
+        node
+        for node in tree.body
+        if isinstance(node, ast.If) and ast.unparse(node.test) == "TYPE_CHECKING"
+    )
+    namespace = {"__package__": raw.__name__}
+    assert module.__file__ is not None
+    exec(compile(ast.Module(block.body, []), module.__file__, "exec"), namespace)
+
+    for value in vars(module).values():
+        if isinstance(value, type) and value.__module__ == module.__name__:
+            typing.get_type_hints(value, localns=namespace)
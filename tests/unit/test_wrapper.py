@@ -0,0 +1,29 @@
+import ctypes
+
+from bygram.core import serializer
+from bygram.core.wrapper import _memoryview_at
+from bygram.types import raw
+
+
+def test_memoryview_at():
+    buffer = ctypes.create_string_buffer(b'{"@type":"ok","@client_id":1}')
+    view = _memoryview_at(ctypes.addressof(buffer))
+
+    assert isinstance(view, memoryview)
+    assert view.readonly
+    assert view == buffer.value
+    assert _memoryview_at(None) is None
+
+
+def test_decode_memoryview():
+    buffer = ctypes.create_string_buffer(b'{"@type":"ok","@client_id":1}')
+    view = _memoryview_at(ctypes.addressof(buffer))
+    assert view is not None
+    assert serializer.peek_client_id(view) == 1
+    assert serializer.peek_type(view) == "ok"
+
+    for codec in serializer.available_codecs():
+        wrapper = serializer.SerializedWrapper(None, codec=codec)  # type: ignore
+        wrapper.set_handled_update_types(lambda: frozenset())
+        decoded = wrapper.decode(view)
+        assert decoded and decoded.obj == raw.Ok()
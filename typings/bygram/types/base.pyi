@@ -1,13 +1,15 @@
-from dataclasses import dataclass
-from typing import Generic, TypeVar
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
 
 T = TypeVar('T')
 
-@dataclass
+@dataclass(slots=True)
 class TlObject: ...
 @dataclass
-class ObjectBase(TlObject): ...
-@dataclass
+class ObjectBase(TlObject):
+    _lazy: Any = field(init=False, repr=False)
+    def _to_json_dict(self) -> dict: ...
+@dataclass(slots=True)
 class Update(ObjectBase): ...
-@dataclass
+@dataclass(slots=True)
 class Function(ObjectBase, Generic[T]): ...